@@ -1,6 +1,16 @@
 #!/usr/bin/env python3
 # Bully name hashing function reimplementations from the PS2 version
-# Written by Edness   v1.0   2022-06-20
+
+# Usage:
+#   BullyHash.py  rsm  "string to hash"
+#   BullyHash.py  str  "string to hash"
+# Optional:
+#   -f | --file     Treat the input as a path to a list of strings, one per line
+#     BullyHash.py  str  "X:\path\to\labels.txt"  -f
+
+# Written by Edness   v1.1   2022-06-20 - 2026-10-18
+
+from array import array
 
 def rstm_hash(str):
     # Reimplemented from the  zipHashFile::Hash  function at  0040CDF0  in PS2 PAL
@@ -26,6 +36,101 @@ def label_hash(str):
         hash = ord(chr) + hash * 0x83 & 0x7FFFFFFF
     return hash
 
+class RstmHash:
+    # Resumable rstm_hash and label_hash states, so that a shared prefix
+    # only has to be hashed once before appending each of the names, e.g.
+    #   state = RstmHash("sound/speech/");  state.copy().update("name.rsm").digest()
+    def __init__(self, str=""):
+        self.hash = 0x00000000
+        self.update(str)
+
+    def update(self, str):
+        if type(str) is bytes:
+            str = str.decode("latin-1")
+        hash = self.hash
+        for chr in str.lower().replace("\\", "/"):
+            hash = (hash + ord(chr)) * 0x401 & 0xFFFFFFFF
+            hash ^= hash >> 6
+        self.hash = hash
+        return self
+
+    def copy(self):
+        state = RstmHash()
+        state.hash = self.hash
+        return state
+
+    def digest(self):
+        hash = self.hash * 9 & 0xFFFFFFFF
+        return (hash ^ hash >> 11) * 0x8001 & 0xFFFFFFFF
+
+class LabelHash:
+    def __init__(self, str=""):
+        self.hash = 0x00000000
+        self.update(str)
+
+    def update(self, str):
+        if type(str) is bytes:
+            str = str.decode("latin-1")
+        hash = self.hash
+        for chr in str.upper():
+            hash = ord(chr) + hash * 0x83 & 0x7FFFFFFF
+        self.hash = hash
+        return self
+
+    def copy(self):
+        state = LabelHash()
+        state.hash = self.hash
+        return state
+
+    def digest(self):
+        return self.hash
+
+def _hash_columns(strs):
+    # yields the indices of each same length group and its character columns
+    import numpy as np
+
+    sizes = np.fromiter(map(len, strs), np.int64, len(strs))
+    offsets = np.cumsum(sizes) - sizes
+    # UTF-32 to keep it identical to ord() for any character
+    chars = np.frombuffer("".join(strs).encode("UTF-32-LE"), np.uint32)
+    for size in np.unique(sizes):
+        idxs = np.flatnonzero(sizes == size)
+        offs = offsets[idxs]
+        yield idxs, (chars[offs + col] for col in range(size))
+
+def rstm_hash_many(strs):
+    # Both _many variants hash a list in input order, one by one without NumPy
+    strs = [str.decode("latin-1") if type(str) is bytes else str for str in strs]
+    try:
+        import numpy as np
+    except ImportError:
+        return array("I", map(rstm_hash, strs))
+
+    hashes = np.zeros(len(strs), np.uint32)
+    for idxs, cols in _hash_columns("\x00".join(strs).lower().replace("\\", "/").split("\x00")):
+        hash = np.zeros(len(idxs), np.uint32)
+        for col in cols:
+            hash = (hash + col) * np.uint32(0x401)
+            hash ^= hash >> np.uint32(6)
+        hash *= np.uint32(9)
+        hashes[idxs] = (hash ^ hash >> np.uint32(11)) * np.uint32(0x8001)
+    return array("I", hashes.tobytes())
+
+def label_hash_many(strs):
+    strs = [str.decode("latin-1") if type(str) is bytes else str for str in strs]
+    try:
+        import numpy as np
+    except ImportError:
+        return array("I", map(label_hash, strs))
+
+    hashes = np.zeros(len(strs), np.uint32)
+    for idxs, cols in _hash_columns("\x00".join(strs).upper().split("\x00")):
+        hash = np.zeros(len(idxs), np.uint32)
+        for col in cols:
+            hash = col + hash * np.uint32(0x83) & np.uint32(0x7FFFFFFF)
+        hashes[idxs] = hash
+    return array("I", hashes.tobytes())
+
 if __name__ == "__main__":
     import argparse
 
@@ -33,12 +138,22 @@ if __name__ == "__main__":
     subparsers = parser.add_subparsers()
     rsm_parser = subparsers.add_parser("rsm", help="Hashes strings into their RSTM hashed names used by Bully.")
     rsm_parser.add_argument("string", type=str)
-    rsm_parser.set_defaults(func=rstm_hash)
+    rsm_parser.add_argument("-f", "--file", action="store_true", help="treat the input as a path to a list of names")
+    rsm_parser.set_defaults(func=rstm_hash, func_many=rstm_hash_many)
     str_parser = subparsers.add_parser("str", help="Hashes the string labels used for string lookups in Bully.")
     str_parser.add_argument("string", type=str)
-    str_parser.set_defaults(func=label_hash)
+    str_parser.add_argument("-f", "--file", action="store_true", help="treat the input as a path to a list of labels")
+    str_parser.set_defaults(func=label_hash, func_many=label_hash_many)
     args = parser.parse_args()
 
-    try: hash = args.func(args.string)
+    try: func, func_many = args.func, args.func_many
     except AttributeError: print("No arguments given. Use -h or --help to show valid arguments.")
-    else: print(f"Hashed string: 0x{hash:08X} ({hash})")
+    else:
+        if args.file:
+            with open(args.string, "r", encoding="UTF-8") as file:
+                strings = file.read().splitlines()
+            for hash, string in zip(func_many(strings), strings):
+                print(f"0x{hash:08X}  {string}")
+        else:
+            hash = func(args.string)
+            print(f"Hashed string: 0x{hash:08X} ({hash})")
@@ -4,21 +4,15 @@
 # Usage:
 #   lipfile_update.py  "X:\Stream\World.dir"  "X:\Audio\PlayList\Speech.bin"
 
-# Written by Edness   2023-11-08 - 2024-11-16   v1.2
+# Written by Edness   2023-11-08 - 2026-10-18   v1.3
 
-import glob, os
+import glob, os, struct
 
 endian = str()
 
 def read_int(file, bytes=0x4):
     return int.from_bytes(file.read(bytes), endian)
 
-def read_str(file):
-    return "".join(iter(lambda: file.read(0x1).decode("ASCII"), "\x00"))
-
-def write_int(file, int, bytes=0x4):
-    return file.write(int.to_bytes(bytes, endian))
-
 def update_lip(world_dir, speech_path):
     world_dir = os.path.abspath(world_dir)
     speech_path = os.path.abspath(speech_path)
@@ -39,6 +33,7 @@ def update_lip(world_dir, speech_path):
         header = bin.read(0x4)
         assert header in {b"Hash", b"hsaH"}, ERR_HASH
         endian = "little" if header == b"Hash" else "big"
+        byte_order = "<" if endian == "little" else ">"
         bin_entries = read_int(bin)
 
         # Bully SE Wii fix (unlikely for full support)
@@ -46,47 +41,44 @@ def update_lip(world_dir, speech_path):
         is_wii_fsb = not read_int(bin) | read_int(bin)
         bin.seek(0x8)
 
-        hash_list = list()
-        offs_list = list()
-        size_list = list()
-        for i in range(bin_entries):
-            hash_list.append(read_int(bin))
-            offs_list.append(read_int(bin))
-            size_list.append(read_int(bin))
-            if is_wii_fsb:
-                bin.seek(0x8, 1)
+        # hash -> (index, offset, size), keeping the first of any duplicates
+        entry_fmt = byte_order + ("III8x" if is_wii_fsb else "III")
+        bin_data = bin.read(bin_entries * struct.calcsize(entry_fmt))
+        bin_dict = dict()
+        for idx, (hash, offs, size) in enumerate(struct.iter_unpack(entry_fmt, bin_data)):
+            bin_dict.setdefault(hash, (idx, offs, size))
 
     print("Loading World.img...")
-    dir_entries = os.path.getsize(world_dir) // 0x20
-    with open(world_dir, "rb") as dir, open(world_img, "r+b") as img:
+    with open(world_dir, "rb") as dir:
+        dir_data = dir.read()
+    dir_data = dir_data[:len(dir_data) // 0x20 * 0x20]
+    with open(world_img, "r+b") as img:
         assert read_int(img) != 0x0FF512ED, ERR_XMEM
-        for idx in range(dir_entries):
-            dir.seek(idx * 0x20)
-            offs = read_int(dir) * 0x800
-            size = read_int(dir) * 0x800
-            name = read_str(dir)
+        for offs, size, name in struct.iter_unpack(byte_order + "II24s", dir_data):
+            name = name.split(b"\x00", 1)[0].decode("ASCII")
             if name.lower().endswith(".lip"):
                 print(f"Checking {name}...")
+                offs *= 0x800
                 img.seek(offs)
                 lip_entries = read_int(img, 0x2)
                 #lipsync_size = read_int(img, 0x2)
-                for idx in range(lip_entries):
-                    lip_offs = offs + 0x4 + idx * 0x18
-                    img.seek(lip_offs + 0x0)
-                    bin_idx = read_int(img, 0x2)
-                    img.seek(lip_offs + 0xC)
-                    bin_offs = read_int(img)
-                    bin_size = read_int(img)
-                    bin_hash = read_int(img)
-                    assert bin_hash in hash_list, ERR_ENTR.format(bin_hash)
-                    idx = hash_list.index(bin_hash)
-                    if idx != bin_idx:
-                        img.seek(lip_offs + 0x0)
-                        write_int(img, idx, 0x2)
-                    if (bin_offs, bin_size) != (offs_list[idx], size_list[idx]):
-                        img.seek(lip_offs + 0xC)
-                        write_int(img, offs_list[idx])
-                        write_int(img, size_list[idx])
+
+                # the whole entry table is read, updated and written back at once
+                img.seek(offs + 0x4)
+                lip_data = bytearray(img.read(lip_entries * 0x18))
+                updated = False
+                for lip_offs, (bin_idx, bin_offs, bin_size, bin_hash) in zip(range(0x0, len(lip_data), 0x18),
+                                                                           struct.iter_unpack(byte_order + "H10xIII", lip_data)):
+                    entry = bin_dict.get(bin_hash)
+                    assert entry is not None, ERR_ENTR.format(bin_hash)
+                    if entry != (bin_idx, bin_offs, bin_size):
+                        idx, bin_offs, bin_size = entry
+                        struct.pack_into(byte_order + "H", lip_data, lip_offs + 0x0, idx)
+                        struct.pack_into(byte_order + "II", lip_data, lip_offs + 0xC, bin_offs, bin_size)
+                        updated = True
+                if updated:
+                    img.seek(offs + 0x4)
+                    img.write(lip_data)
 
     print("\nDone! If there are more World.img copies, please replace them with a copy of:\n" + world_img)
 
@@ -15,9 +15,70 @@
 #       -be | --bigendian       Build in big endian (Wii, Xbox 360)
 #         string_bin.py  B  "/path/to/strings.json"  -o "/path/to/new.bin"  -be
 
-# Written by Edness   2024-06-20 - 2024-11-30   v1.2.1
-
-import json, os
+# Written by Edness   2024-06-20 - 2026-10-18   v1.4
+
+import array, bisect, json, mmap, os, struct, sys
+
+# The string label map in  string_bin_labels.py  is compiled into a memory-
+# mapped index file next to this script on first use (and rebuilt whenever
+# the map is newer than it), made of a sorted key array and an offset table
+# into a blob of labels.  Lookups are then a binary search over the mapped
+# file, and the map is only imported when (re)building it.
+INDEX_PATH = os.path.splitext(os.path.abspath(__file__))[0] + ".idx"
+DICT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "string_bin_labels.py")
+INDEX_MAGIC = b"HIDX" if sys.byteorder == "little" else b"XDIH"  # native order
+
+class HashIndex:
+    def __init__(self, path):
+        # an empty or cut off index (e.g. from an interrupted build) fails
+        # the assertions here, so that  load_index  just rebuilds it again
+        with open(path, "rb") as file:
+            assert os.fstat(file.fileno()).st_size >= 0x10, ERR_INDEX
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, key_size, entries = struct.unpack_from("<4sII", self.map)
+        assert magic == INDEX_MAGIC and key_size in {0x4, 0x8}, ERR_INDEX
+        keys_end = 0x10 + entries * key_size
+        offs_end = keys_end + (entries + 1) * 0x4
+        assert offs_end <= len(self.map), ERR_INDEX
+        view = memoryview(self.map)
+        self.keys = view[0x10:keys_end].cast("Q" if key_size == 0x8 else "I")
+        self.offs = view[keys_end:offs_end].cast("I")
+        self.names = view[offs_end:]
+        assert self.offs[-1] == len(self.names), ERR_INDEX
+
+    def get(self, hash, default=None):
+        idx = bisect.bisect_left(self.keys, hash)
+        if idx == len(self.keys) or self.keys[idx] != hash:
+            return default
+        return str(self.names[self.offs[idx]:self.offs[idx + 1]], "UTF-8")
+
+def build_index(path, hash_dict, key_size):
+    keys = array.array("Q" if key_size == 0x8 else "I")
+    offs = array.array("I", [0])
+    names = list()
+    for hash in sorted(hash_dict):
+        keys.append(hash)
+        names.append(hash_dict[hash].encode("UTF-8"))
+        offs.append(offs[-1] + len(names[-1]))
+    with open(path + ".tmp", "wb") as file:
+        file.write(struct.pack("<4sII4x", INDEX_MAGIC, key_size, len(keys)))
+        file.write(keys.tobytes())
+        file.write(offs.tobytes())
+        file.write(b"".join(names))
+    os.replace(path + ".tmp", path)
+
+def load_index():
+    try:
+        try:
+            assert os.path.getmtime(INDEX_PATH) >= os.path.getmtime(DICT_PATH), ERR_INDEX
+            return HashIndex(INDEX_PATH)
+        except (OSError, AssertionError):  # missing, outdated or damaged
+            from string_bin_labels import BULLY_STRING_MAP
+            build_index(INDEX_PATH, BULLY_STRING_MAP, 0x4)
+            return HashIndex(INDEX_PATH)
+    except (OSError, AssertionError):
+        from string_bin_labels import BULLY_STRING_MAP
+        return BULLY_STRING_MAP  # read-only folder or some other mishap
 
 def label_hash(str):
     # Reimplemented from the function at  002E5F00  in
@@ -28,12 +89,33 @@ def label_hash(str):
         hash = chr + hash * 0x83 & 0x7FFFFFFF
     return hash
 
-def parse_bin(path, outpath=str()):
-    def read_int():
-        return int.from_bytes(file.read(0x4), endian)
+# label_hash  of  S  followed by  x  zeroes, for the  S0 - S65535  subtitle labels
+SUB_LABEL_BASES = tuple((x, label_hash("S" + "0" * x)) for x in range(1, 6))
+
+def sub_label(hash):
+    # Inverse of  label_hash  for the subtitle labels.  Each digit only adds
+    # its value times a power of 0x83 onto the hash of the all-zero label of
+    # the same length, so what's left is the number written in base 0x83,
+    # which only overflows 31 bits with 5 digits, and only by one wrap
+    for digits, base in SUB_LABEL_BASES:
+        value = hash - base & 0x7FFFFFFF
+        while value < 9 * (0x83 ** digits - 1) // 0x82 + 1:
+            label = str()
+            rest = value
+            for i in range(digits):
+                rest, digit = divmod(rest, 0x83)
+                if digit > 9:
+                    break
+                label = str(digit) + label
+            else:
+                if not rest and (digits == 1 or label[0] != "0") and int(label) < 0x10000:
+                    return "S" + label
+            value += 0x80000000
+    return None
 
-    def read_str():
-        return b"".join(iter(lambda: file.read(0x1), b"\x00")).decode("UTF-8")
+def parse_bin(path, outpath=str()):
+    def read_int(offs):
+        return int.from_bytes(data[offs:offs + 0x4], endian)
 
     path = os.path.abspath(path)
     if not outpath:
@@ -48,48 +130,51 @@ def parse_bin(path, outpath=str()):
     #        unk += 1
     #print("!!! DEBUG CHECK DONE, COMMENT OUT!", f"{unk=}")
 
-    # generate all of the subtitle string labels on the spot,
-    # they are tied to Speech.bin and can change on any build
-    for i in range(0x10000):
-        label = f"S{i}"
-        hash = label_hash(label)
-        assert hash not in BULLY_STRING_MAP, ERR_COLL.format(hash, BULLY_STRING_MAP[hash], label)
-        BULLY_STRING_MAP[hash] = label
-
+    hash_names = load_index()
     output = dict()
     with open(path, "rb") as file:
-        header = file.read(0x4)
-        check = b"\xAB\xCD\x12\x34"  # 0xABCD1234
-        assert header in {check, check[::-1]}, ERR_HEADER
-        endian = "big" if header == check else "little"
-        assert read_int() == 0x1, ERR_HEADER  # version?
-        assert read_int() == 0x0, ERR_HEADER  # padding?
+        data = file.read()
 
-        text_size = read_int()
-        meta_size = read_int()
-        entries = read_int()
-        assert meta_size == entries * 0x8, ERR_HEADER
+    header = data[:0x4]
+    check = b"\xAB\xCD\x12\x34"  # 0xABCD1234
+    assert header in {check, check[::-1]}, ERR_HEADER
+    endian = "big" if header == check else "little"
+    assert read_int(0x4) == 0x1, ERR_HEADER  # version?
+    assert read_int(0x8) == 0x0, ERR_HEADER  # padding?
 
-        assert read_int() == 0x2, ERR_HEADER  # version?
-        assert read_int() == 0x0, ERR_HEADER  # padding?
-        assert file.read(0x8) == b"BD" + bytes(0x6), ERR_HEADER
+    text_size = read_int(0xC)
+    meta_size = read_int(0x10)
+    entries = read_int(0x14)
+    assert meta_size == entries * 0x8, ERR_HEADER
 
-        text_offs = 0x28
-        meta_offs = text_offs + text_size
+    assert read_int(0x18) == 0x2, ERR_HEADER  # version?
+    assert read_int(0x1C) == 0x0, ERR_HEADER  # padding?
+    assert data[0x20:0x28] == b"BD" + bytes(0x6), ERR_HEADER
 
-        for i in range(entries):
-            file.seek(meta_offs + i * 0x8)
-            str_hash = read_int()
-            str_offs = read_int() - 1
-            file.seek(text_offs + str_offs)
-            assert file.read(0x2) == b"\xFF\xFF", ERR_HEADER
-            string = read_str()
+    text_offs = 0x28
+    meta_offs = text_offs + text_size
+    assert meta_offs + meta_size <= len(data), ERR_HEADER
+
+    view = memoryview(data)
+    meta = struct.iter_unpack(">II" if endian == "big" else "<II", view[meta_offs:meta_offs + meta_size])
+    for str_hash, str_offs in meta:
+        str_offs += text_offs - 1
+        assert data[str_offs:str_offs + 0x2] == b"\xFF\xFF", ERR_HEADER
+        str_end = data.find(b"\x00", str_offs + 0x2)
+        assert str_end >= 0, ERR_HEADER
+        string = str(view[str_offs + 0x2:str_end], "UTF-8")
+        # the subtitle string labels are tied to Speech.bin and can change on
+        # any build, so they're worked out from the hash instead of listed
+        key = sub_label(str_hash)
+        if key is not None:
+            assert hash_names.get(str_hash) is None, ERR_COLL.format(str_hash, hash_names.get(str_hash), key)
+        else:
             #key = BULLY_STRING_MAP.get(str_hash, f"__hashed_0x{str_hash:08X}")
-            key = BULLY_STRING_MAP[str_hash] if str_hash in BULLY_STRING_MAP and BULLY_STRING_MAP[str_hash] else f"__hashed_0x{str_hash:08X}"
-            if key in output and output[key] != string:  # rare, but seen
-                print(WARN_COLL.format(str_hash, output[key], string))
-            else:
-                output[key] = string
+            key = hash_names.get(str_hash) or f"__hashed_0x{str_hash:08X}"
+        if key in output and output[key] != string:  # rare, but seen
+            print(WARN_COLL.format(str_hash, output[key], string))
+        else:
+            output[key] = string
 
     with open(outpath, "w", encoding="UTF-8") as file:
         json.dump(output, file, indent=0, sort_keys=True, ensure_ascii=False)
@@ -153,11857 +238,11 @@ def build_bin(path, outpath=str(), big_endian=False):
     print("Done! Output written to", outpath)
 
 ERR_HEADER = "Error! Invalid string container!"
+ERR_INDEX = "Error! Invalid hash index file."
 MSG_COLL = "A hash collision has occurred! The hash 0x{:08X} corresponds to the following labels\n- {}\n- {}"
 ERR_COLL = f"Error! {MSG_COLL}"
 WARN_COLL = f"Warning! {MSG_COLL}\nThe latter will be discarded!"
 
-BULLY_STRING_MAP = {
-    0x00002190: "AM",
-    0x00002486: "G1",
-    0x00002487: "G2",
-    0x00002488: "G3",
-    0x00002489: "G4",
-    0x0000248A: "G5",
-    0x00002839: "NO",
-    0x0000293D: "PM",
-    0x00002B4E: "TR",
-    0x00079C87: "SP_BRIEFS",
-    0x0012C0A0: "GP1",
-    0x0012C0A1: "GP2",
-    0x0012C0A2: "GP3",
-    0x0012C0A3: "GP4",
-    0x0012C0A4: "GP5",
-    0x001345CF: "INT",
-    0x00144F5E: "MIN",
-    0x0014D67B: "OKS",
-    0x0015156D: "PCT",
-    0x0015D323: "S-1",
-    0x001627A5: "TOD",
-    0x0016EBA0: "WEB",
-    0x001771C3: "YES",
-    0x0032E85B: "N_MRSMCRAE",
-    0x0047C8F2: "4_02_OPENDOOR",
-    0x0052E5FF: "ATTIC",
-    0x005423AF: "PUN_TIME",
-    0x006522EE: "B_BUCKET1",
-    0x006522EF: "B_BUCKET2",
-    0x006BA0FD: "TITLE21_NAME0",
-    0x006BA0FE: "TITLE21_NAME1",
-    0x006E36E6: "2-04.SUB0001",
-    0x006E36E7: "2-04.SUB0002",
-    0x006E36E8: "2-04.SUB0003",
-    0x006E36E9: "2-04.SUB0004",
-    0x006E36EA: "2-04.SUB0005",
-    0x006E36EB: "2-04.SUB0006",
-    0x006E36EC: "2-04.SUB0007",
-    0x006E36ED: "2-04.SUB0008",
-    0x006E36EE: "2-04.SUB0009",
-    0x006E3768: "2-04.SUB0010",
-    0x006E3769: "2-04.SUB0011",
-    0x006E376A: "2-04.SUB0012",
-    0x006E376B: "2-04.SUB0013",
-    0x006E376C: "2-04.SUB0014",
-    0x006E376D: "2-04.SUB0015",
-    0x006E376E: "2-04.SUB0016",
-    0x006E376F: "2-04.SUB0017",
-    0x006E3770: "2-04.SUB0018",
-    0x006E3771: "2-04.SUB0019",
-    0x006E37EB: "2-04.SUB0020",
-    0x006E37EC: "2-04.SUB0021",
-    0x006E37ED: "2-04.SUB0022",
-    0x006E37EE: "2-04.SUB0023",
-    0x006E37EF: "2-04.SUB0024",
-    0x006E37F0: "2-04.SUB0025",
-    0x006E37F1: "2-04.SUB0026",
-    0x00710629: "AUDOP",
-    0x00871CBF: "SOC_GEN_SHAKEHEAD",
-    0x008AD786: "MGGE_S_CAROLINA",
-    0x00A160C8: "AS_SB_FAILED",
-    0x00A24CB5: "S_SSLEEVES1",
-    0x00A24CB6: "S_SSLEEVES2",
-    0x00A24CB7: "S_SSLEEVES3",
-    0x00A24CB8: "S_SSLEEVES4",
-    0x00A24CB9: "S_SSLEEVES5",
-    0x00A24CBA: "S_SSLEEVES6",
-    0x00A24CBB: "S_SSLEEVES7",
-    0x00A24CBC: "S_SSLEEVES8",
-    0x00A50DB1: "MGGE_KENYA",
-    0x00B2F4BF: "RACE_AHEAD",
-    0x00B34C90: "MGGE_GUYANA",
-    0x00C1D77E: "5_07_TITLE",
-    0x00CEBD2D: "N_JERRY",
-    0x00DC428D: "MGGE_JAMAICA",
-    0x00DE5EFC: "N_BUMSANTA",
-    0x00DEB49B: "TUT_HDDN01",
-    0x00DF38F3: "AS_BR_GREET",
-    0x00E2CBEE: "4_04_DISABLELAST",
-    0x00E90149: "MGDA_GAMES",
-    0x00EABB0F: "2_07_UNLOCK",
-    0x00F1AC4A: "C2_JOCKKIRBY",
-    0x011924CC: "RARC_LEVEL1",
-    0x011924CD: "RARC_LEVEL2",
-    0x011924CE: "RARC_LEVEL3",
-    0x011C392F: "1-02B.SUB0001",
-    0x011C3930: "1-02B.SUB0002",
-    0x011C3931: "1-02B.SUB0003",
-    0x011C3932: "1-02B.SUB0004",
-    0x011C3933: "1-02B.SUB0005",
-    0x011C3934: "1-02B.SUB0006",
-    0x011C3935: "1-02B.SUB0007",
-    0x011C3936: "1-02B.SUB0008",
-    0x011C3937: "1-02B.SUB0009",
-    0x011C39B1: "1-02B.SUB0010",
-    0x011C39B2: "1-02B.SUB0011",
-    0x011C39B3: "1-02B.SUB0012",
-    0x011C39B4: "1-02B.SUB0013",
-    0x011C39B5: "1-02B.SUB0014",
-    0x011C39B6: "1-02B.SUB0015",
-    0x011C39B7: "1-02B.SUB0016",
-    0x011C39B8: "1-02B.SUB0017",
-    0x01236094: "W_DIGICAMERA",
-    0x01253F14: "TGOKART",
-    0x0126E42C: "MC_PERFECT",
-    0x01335A59: "LD_FAIL",
-    0x01483F0E: "CLT_UPPER",
-    0x015449BB: "TITLE13_NUMNAMES",
-    0x0156A1DD: "N_JIMMY",
-    0x015B6807: "MGCE_T3G01WORDS",
-    0x015D355A: "AS_CF_OBJECTIVE",
-    0x015D7C41: "KEEPUP_X",
-    0x015E5B71: "CHAPT2TRANS_RESPECTN",
-    0x015E5B73: "CHAPT2TRANS_RESPECTP",
-    0x016277A1: "TUT_WRST1",
-    0x0173210B: "AS_CB_RETURN",
-    0x0180BD18: "TITLE82_NAME0",
-    0x0180BD19: "TITLE82_NAME1",
-    0x0180BD1A: "TITLE82_NAME2",
-    0x0180BD1B: "TITLE82_NAME3",
-    0x0180BD1C: "TITLE82_NAME4",
-    0x0180BD1D: "TITLE82_NAME5",
-    0x0180BD1E: "TITLE82_NAME6",
-    0x0185AD00: "S_APOL_LOW_BULLY_01",
-    0x0185F146: "SP_BASSHAT",
-    0x01887D26: "SOC_GEN_SHOVEDSCARED",
-    0x0189B8CF: "TITLE64_NAME10",
-    0x0189B8D0: "TITLE64_NAME11",
-    0x0189B8D1: "TITLE64_NAME12",
-    0x0189B8D2: "TITLE64_NAME13",
-    0x0189B8D3: "TITLE64_NAME14",
-    0x0189B8D4: "TITLE64_NAME15",
-    0x0189B8D5: "TITLE64_NAME16",
-    0x0189B8D6: "TITLE64_NAME17",
-    0x0189B8D7: "TITLE64_NAME18",
-    0x0189B8D8: "TITLE64_NAME19",
-    0x0189B952: "TITLE64_NAME20",
-    0x0189B953: "TITLE64_NAME21",
-    0x0189B954: "TITLE64_NAME22",
-    0x0189B955: "TITLE64_NAME23",
-    0x0189B956: "TITLE64_NAME24",
-    0x0189B957: "TITLE64_NAME25",
-    0x0189B958: "TITLE64_NAME26",
-    0x0189B959: "TITLE64_NAME27",
-    0x0189B95A: "TITLE64_NAME28",
-    0x0189B95B: "TITLE64_NAME29",
-    0x0189B9D5: "TITLE64_NAME30",
-    0x0189B9D6: "TITLE64_NAME31",
-    0x0189B9D7: "TITLE64_NAME32",
-    0x0189B9D8: "TITLE64_NAME33",
-    0x0189B9D9: "TITLE64_NAME34",
-    0x0189B9DA: "TITLE64_NAME35",
-    0x0189B9DB: "TITLE64_NAME36",
-    0x0189B9DC: "TITLE64_NAME37",
-    0x0189B9DD: "TITLE64_NAME38",
-    0x0189B9DE: "TITLE64_NAME39",
-    0x0189BA58: "TITLE64_NAME40",
-    0x0189BA59: "TITLE64_NAME41",
-    0x0189BA5A: "TITLE64_NAME42",
-    0x0189BA5B: "TITLE64_NAME43",
-    0x0189BA5C: "TITLE64_NAME44",
-    0x0189BA5D: "TITLE64_NAME45",
-    0x0189BA5E: "TITLE64_NAME46",
-    0x0189BA5F: "TITLE64_NAME47",
-    0x0189BA60: "TITLE64_NAME48",
-    0x0189BA61: "TITLE64_NAME49",
-    0x0189BADB: "TITLE64_NAME50",
-    0x0189BADC: "TITLE64_NAME51",
-    0x0189BADD: "TITLE64_NAME52",
-    0x0189BADE: "TITLE64_NAME53",
-    0x0189BADF: "TITLE64_NAME54",
-    0x0189BAE0: "TITLE64_NAME55",
-    0x0189BAE1: "TITLE64_NAME56",
-    0x0189BAE2: "TITLE64_NAME57",
-    0x0189BAE3: "TITLE64_NAME58",
-    0x0189BAE4: "TITLE64_NAME59",
-    0x0189BB5E: "TITLE64_NAME60",
-    0x0189BB5F: "TITLE64_NAME61",
-    0x0189BB60: "TITLE64_NAME62",
-    0x0189BB61: "TITLE64_NAME63",
-    0x0189BB62: "TITLE64_NAME64",
-    0x0189BB63: "TITLE64_NAME65",
-    0x0189BB64: "TITLE64_NAME66",
-    0x0189BB65: "TITLE64_NAME67",
-    0x0189BB66: "TITLE64_NAME68",
-    0x0189BB67: "TITLE64_NAME69",
-    0x0189BBE1: "TITLE64_NAME70",
-    0x0189BBE2: "TITLE64_NAME71",
-    0x0189BBE3: "TITLE64_NAME72",
-    0x0189BBE4: "TITLE64_NAME73",
-    0x0189BBE5: "TITLE64_NAME74",
-    0x0189BBE6: "TITLE64_NAME75",
-    0x0189BBE7: "TITLE64_NAME76",
-    0x0189BBE8: "TITLE64_NAME77",
-    0x0189BBE9: "TITLE64_NAME78",
-    0x0189BBEA: "TITLE64_NAME79",
-    0x0189BC64: "TITLE64_NAME80",
-    0x0189BC65: "TITLE64_NAME81",
-    0x0189BC66: "TITLE64_NAME82",
-    0x0189BC67: "TITLE64_NAME83",
-    0x0189BC68: "TITLE64_NAME84",
-    0x0189BC69: "TITLE64_NAME85",
-    0x0189BC6A: "TITLE64_NAME86",
-    0x0189BC6B: "TITLE64_NAME87",
-    0x0189BC6C: "TITLE64_NAME88",
-    0x0189BC6D: "TITLE64_NAME89",
-    0x0189BCE7: "TITLE64_NAME90",
-    0x0189BCE8: "TITLE64_NAME91",
-    0x0189BCE9: "TITLE64_NAME92",
-    0x0189BCEA: "TITLE64_NAME93",
-    0x0189BCEB: "TITLE64_NAME94",
-    0x0189BCEC: "TITLE64_NAME95",
-    0x0189BCED: "TITLE64_NAME96",
-    0x0189BCEE: "TITLE64_NAME97",
-    0x0189BCEF: "TITLE64_NAME98",
-    0x0189BCF0: "TITLE64_NAME99",
-    0x018E9401: "3_01C_SCORE",
-    0x0196D0F9: "3_B_SEC_OBJA",
-    0x01A6F0DF: "SP_SWIMSUIT",
-    0x01ABC5AE: "BUT_ENTER",
-    0x01B1A9B4: "4_04_DISABLEREST",
-    0x01B1DBAF: "AS_FC_AMMO",
-    0x01B65DD1: "SP_80ROCKER_FT",
-    0x01CE097D: "6_03_TITLE",
-    0x01D89B61: "ERR_DELETE",
-    0x01E5FE2D: "2_08_AQUAOBJ",
-    0x01E8AE51: "NAND_07_WII",
-    0x01F9514A: "2_03_FAIL01",
-    0x01F967AF: "SOC_N_FLATTER",
-    0x01FA5084: "STAT_RATIO",
-    0x01FA755C: "1_G1_OSTAFF",
-    0x01FA9254: "MGGE_VIRGINIA",
-    0x01FBDDC4: "X_BIKE",
-    0x01FD17A7: "MGGE_KOREA",
-    0x0210756F: "AS_RA_RETURN",
-    0x021323C6: "MGMA_T5GROUPS",
-    0x0218165D: "2_01_OFINDITEMS",
-    0x021C4A87: "TUT_GKRTX1",
-    0x021EE70A: "CLT_WRS_OUTFIT",
-    0x0227B1F5: "MGA2_INSTRUCTIONS_CLEAR_DESC",
-    0x022B0E83: "C_CLOWNPANTS",
-    0x022FE0A4: "1_02B_EMPTY",
-    0x0232E116: "INV_CHANGE",
-    0x023E5E07: "TITLE9_NAME0",
-    0x023E5E08: "TITLE9_NAME1",
-    0x023E5E09: "TITLE9_NAME2",
-    0x023E5E0A: "TITLE9_NAME3",
-    0x023E5E0B: "TITLE9_NAME4",
-    0x023E5E0C: "TITLE9_NAME5",
-    0x023E5E0D: "TITLE9_NAME6",
-    0x023E5E0E: "TITLE9_NAME7",
-    0x023E5E0F: "TITLE9_NAME8",
-    0x023E5E10: "TITLE9_NAME9",
-    0x0241D7A5: "2_04_INSTRUC01",
-    0x0241D7A6: "2_04_INSTRUC02",
-    0x0241D7A7: "2_04_INSTRUC03",
-    0x0243FD24: "CLT_UNIFORM",
-    0x02483D49: "MGM2_TIERS",
-    0x0250ADB5: "4_04_FINDNERDS",
-    0x0284A9AE: "5_05_OMEETZOE",
-    0x0286A881: "X_FOOT",
-    0x028DC95B: "USE_BOXINPUT",
-    0x02946A1D: "MGC_HIGH_TITLE",
-    0x029D2981: "RACE_TOOFAR",
-    0x02A2959E: "3_XM_CASTLE",
-    0x02AB72C8: "HELP21",
-    0x02AB734C: "HELP32",
-    0x02AB734D: "HELP33",
-    0x02AB73D1: "HELP44",
-    0x02AB73D3: "HELP46",
-    0x02AB73D4: "HELP47",
-    0x02AB7450: "HELP50",
-    0x02AB7451: "HELP51",
-    0x02AB7452: "HELP52",
-    0x02AB7453: "HELP53",
-    0x02C461C6: "AS_EM_OBJCOUNT",
-    0x02C8FEE2: "N_JUSTIN",
-    0x02DF609A: "HS_XSTART",
-    0x02E6A3C9: "TPM_EXITTOURNEYC",
-    0x02F5EAB9: "TPM_QUITCURRENTGAMEC",
-    0x030B48BA: "RACE_LAPTIME",
-    0x030F5489: "MGGE_UK",
-    0x0316899A: "SOC_PR_REQUEST",
-    0x031CA9D4: "MGBI_EXIT",
-    0x032630F1: "FE_MULTI",
-    0x032E0F42: "AS_HE_COMPLETE",
-    0x03342E4A: "N_MRHUNTINGDON",
-    0x033B8A9F: "SOC_G_REQUEST",
-    0x03423A14: "CLT_UNDIES",
-    0x034A7B72: "N_ZACKOWENS",
-    0x0353871B: "FEPA_NOPICA",
-    0x0353872D: "FEPA_NOPICS",
-    0x035AE2E9: "GIFT_CRCOASTER",
-    0x036B9C81: "2_06_ALLEY",
-    0x03721F4B: "1_06_GARYHIT",
-    0x03727CE9: "",
-    0x037B3608: "TITLE63_NUMNAMES",
-    0x038E2442: "FE_NUM_GAMES_FE",
-    0x0392E193: "1_02_R1BUT",
-    0x03977FF1: "TITLE69_NAME0",
-    0x03977FF2: "TITLE69_NAME1",
-    0x03977FF3: "TITLE69_NAME2",
-    0x03A34058: "MGBI_INFO",
-    0x03ACBB92: "MGB2_PERCH_0",
-    0x03ACBB93: "MGB2_PERCH_1",
-    0x03ACBB94: "MGB2_PERCH_2",
-    0x03ACBB95: "MGB2_PERCH_3",
-    0x03ACBB96: "MGB2_PERCH_4",
-    0x03ACBB97: "MGB2_PERCH_5",
-    0x03ACBB98: "MGB2_PERCH_6",
-    0x03ACBB99: "MGB2_PERCH_7",
-    0x03ACBB9A: "MGB2_PERCH_8",
-    0x03ACBB9B: "MGB2_PERCH_9",
-    0x03AE30F3: "5-02B.SUB0001",
-    0x03AE30F4: "5-02B.SUB0002",
-    0x03AE30F5: "5-02B.SUB0003",
-    0x03AE30F6: "5-02B.SUB0004",
-    0x03AE30F7: "5-02B.SUB0005",
-    0x03AE30F8: "5-02B.SUB0006",
-    0x03AE30F9: "5-02B.SUB0007",
-    0x03AE30FA: "5-02B.SUB0008",
-    0x03AE30FB: "5-02B.SUB0009",
-    0x03AE3175: "5-02B.SUB0010",
-    0x03AE3176: "5-02B.SUB0011",
-    0x03AE3177: "5-02B.SUB0012",
-    0x03AE3178: "5-02B.SUB0013",
-    0x03AE3179: "5-02B.SUB0014",
-    0x03AE317A: "5-02B.SUB0015",
-    0x03AE317B: "5-02B.SUB0016",
-    0x03AE317C: "5-02B.SUB0017",
-    0x03AE317D: "5-02B.SUB0018",
-    0x03AE317E: "5-02B.SUB0019",
-    0x03AE31F8: "5-02B.SUB0020",
-    0x03AE31F9: "5-02B.SUB0021",
-    0x03AE31FA: "5-02B.SUB0022",
-    0x03AE31FB: "5-02B.SUB0023",
-    0x03AE31FC: "5-02B.SUB0024",
-    0x03AE31FD: "5-02B.SUB0025",
-    0x03AE31FE: "5-02B.SUB0026",
-    0x03CED552: "CLT_MANAGER_TITLE",
-    0x03D27CBA: "SOC_BUL_EXTORT",
-    0x03DA151D: "MGT_CONSUMO",
-    0x03EA6BF3: "STRERRORWRONGDISC",
-    0x03EE55D2: "TPM_QUITCURRENTGAME",
-    0x03F1DB27: "P_MH_SPIKE_01",
-    0x03F1DB28: "P_MH_SPIKE_02",
-    0x03F1DB29: "P_MH_SPIKE_03",
-    0x03F1DB2A: "P_MH_SPIKE_04",
-    0x03F39BCD: "3_06_PENTFLLW",
-    0x03F83112: "MRESPECT_NFRIEND",
-    0x03FD6A3D: "3_06_WARN02",
-    0x03FD743E: "3-01BB.SUB0001",
-    0x03FD743F: "3-01BB.SUB0002",
-    0x04009C67: "FEDS_RESTARTMSG",
-    0x04139C7D: "SP_MBAND_H",
-    0x04139C81: "SP_MBAND_L",
-    0x04139C89: "SP_MBAND_T",
-    0x0413CD35: "C_CANADAHAT",
-    0x041D8FE4: "MGCE_ENG0401",
-    0x041D8FE5: "MGCE_ENG0402",
-    0x041D8FE6: "MGCE_ENG0403",
-    0x041F2111: "DESC_10",
-    0x041F2112: "DESC_11",
-    0x041F2113: "DESC_12",
-    0x041F2114: "DESC_13",
-    0x041F2115: "DESC_14",
-    0x041F2116: "DESC_15",
-    0x041F2117: "DESC_16",
-    0x041F2118: "DESC_17",
-    0x041F2119: "DESC_18",
-    0x041F211A: "DESC_19",
-    0x041F2194: "DESC_20",
-    0x041F2195: "DESC_21",
-    0x041F2196: "DESC_22",
-    0x041F2197: "DESC_23",
-    0x041F2198: "DESC_24",
-    0x041F2199: "DESC_25",
-    0x041F219A: "DESC_26",
-    0x041F219B: "DESC_27",
-    0x041F219C: "DESC_28",
-    0x041F219D: "DESC_29",
-    0x041F2217: "DESC_30",
-    0x041F2218: "DESC_31",
-    0x041F2219: "DESC_32",
-    0x041F221A: "DESC_33",
-    0x041F221B: "DESC_34",
-    0x041F221C: "DESC_35",
-    0x041F22A3: "DESC_49",
-    0x041F231D: "DESC_50",
-    0x041F231E: "DESC_51",
-    0x041F231F: "DESC_52",
-    0x041F2320: "DESC_53",
-    0x041F2321: "DESC_54",
-    0x041F2322: "DESC_55",
-    0x041F2323: "DESC_56",
-    0x041F2324: "DESC_57",
-    0x041F2325: "DESC_58",
-    0x041F2326: "DESC_59",
-    0x041F23A0: "DESC_60",
-    0x041F23A1: "DESC_61",
-    0x041F23A2: "DESC_62",
-    0x041F23A3: "DESC_63",
-    0x041F23A4: "DESC_64",
-    0x041F23A5: "DESC_65",
-    0x041F23A6: "DESC_66",
-    0x041F23A7: "DESC_67",
-    0x041F23A8: "DESC_68",
-    0x041F23A9: "DESC_69",
-    0x041F2423: "DESC_70",
-    0x041F2424: "DESC_71",
-    0x041F2425: "DESC_72",
-    0x041F2426: "DESC_73",
-    0x041F2427: "DESC_74",
-    0x041F2428: "DESC_75",
-    0x041F2429: "DESC_76",
-    0x041F242A: "DESC_77",
-    0x041F242B: "DESC_78",
-    0x041F242C: "DESC_79",
-    0x041F24A6: "DESC_80",
-    0x041F24A7: "DESC_81",
-    0x041F24A8: "DESC_82",
-    0x041F24A9: "DESC_83",
-    0x041F24AA: "DESC_84",
-    0x041F24AB: "DESC_85",
-    0x041F24AD: "DESC_87",
-    0x041F24AE: "DESC_88",
-    0x041F24AF: "DESC_89",
-    0x041F2529: "DESC_90",
-    0x041F252A: "DESC_91",
-    0x041F252C: "DESC_93",
-    0x041F252D: "DESC_94",
-    0x041F252E: "DESC_95",
-    0x041F252F: "DESC_96",
-    0x041F2530: "DESC_97",
-    0x041F2531: "DESC_98",
-    0x041F2532: "DESC_99",
-    0x042C8CF2: "MGT_SHOOTING_FE",
-    0x0430773D: "C_BBRACELETS",
-    0x043081B1: "C3_MOVE01",
-    0x043081B2: "C3_MOVE02",
-    0x043081B4: "C3_MOVE04",
-    0x043081B5: "C3_MOVE05",
-    0x043081B6: "C3_MOVE06",
-    0x043081B7: "C3_MOVE07",
-    0x043081B8: "C3_MOVE08",
-    0x043081B9: "C3_MOVE09",
-    0x04308233: "C3_MOVE10",
-    0x04308234: "C3_MOVE11",
-    0x04335CAA: "TITLE14_NAME10",
-    0x04335CAB: "TITLE14_NAME11",
-    0x04342287: "TUT_EREND1",
-    0x043AF627: "MAP_TRANSISTORS",
-    0x043B942C: "AS_IP_COMPLETE",
-    0x04458014: "RACE_LAST_LAP",
-    0x04756538: "MGT_CHEM_FE",
-    0x047F10FF: "CRIME_DRESSCODE",
-    0x048C9BA9: "ITEM_1",
-    0x048C9BAD: "ITEM_5",
-    0x048C9BAE: "ITEM_6",
-    0x048C9BAF: "ITEM_7",
-    0x048C9BB0: "ITEM_8",
-    0x048C9BB1: "ITEM_9",
-    0x04A84D20: "4_S12_NECKLACE",
-    0x04A99E0F: "SKLBORD",
-    0x04B1263F: "AS_PL_COMPLETE",
-    0x04B4B4A9: "TITLE54_NAME0",
-    0x04B4B4AA: "TITLE54_NAME1",
-    0x04B5F882: "FEI_SEL_MISOBJ",
-    0x04BB131B: "MGGE_TAJIKISTAN",
-    0x04BC0F7B: "B_VARIOUS1",
-    0x04BC0F7C: "B_VARIOUS2",
-    0x04BC0F7D: "B_VARIOUS3",
-    0x04BC0F7E: "B_VARIOUS4",
-    0x04BC0F7F: "B_VARIOUS5",
-    0x04BD0AD6: "AS_TP_OBJCOUNT",
-    0x04C9BFDA: "1_06_OBJ04_LG",
-    0x04CB1FFE: "SKLCLMB",
-    0x04DF0ADF: "STITCHES",
-    0x04DF697C: "AS_FI_COMPLETE",
-    0x04E04426: "3_01_SEARCH",
-    0x04F51CAB: "MGE2_T6G01WORDS",
-    0x04F8C564: "AS_FC_OBJCOUNT1",
-    0x04FDFAAA: "C2_JOCKDAMON",
-    0x050323C7: "AS_MM_OBJECTIVE",
-    0x050ED6CD: "ARC_00",
-    0x050ED6CE: "ARC_01",
-    0x050ED6CF: "ARC_02",
-    0x050ED6D0: "ARC_03",
-    0x050ED6D1: "ARC_04",
-    0x050ED6D2: "ARC_05",
-    0x050ED6D3: "ARC_06",
-    0x050ED6D4: "ARC_07",
-    0x050ED6D5: "ARC_08",
-    0x050ED6D6: "ARC_09",
-    0x050ED750: "ARC_10",
-    0x050ED751: "ARC_11",
-    0x050ED752: "ARC_12",
-    0x050ED753: "ARC_13",
-    0x050ED754: "ARC_14",
-    0x050EDB27: "MGS2_RELOAD",
-    0x0518C041: "SP_SHORTS",
-    0x051B4A5F: "MGBI_TIME",
-    0x051E120D: "TUT_GOKART1",
-    0x052C9042: "TITLE47_NUMNAMES",
-    0x0532D47E: "SKLFORG",
-    0x05357EB8: "BUTTON_RANALOGD_D",
-    0x05379700: "BUTTON_RANALOGL_D",
-    0x05392936: "BUTTON_RANALOGR_D",
-    0x0539F251: "BUTTON_RANALOGU_D",
-    0x053DF355: "2_07_TITLE",
-    0x054093DB: "2_S06_FAIL_01",
-    0x054093DC: "2_S06_FAIL_02",
-    0x05498BCC: "TUT_PICK1",
-    0x05631B13: "AS_ES_BACK",
-    0x0565C6EC: "N_CASEY",
-    0x056A7D92: "USE_FILLWB",
-    0x056D7249: "TITLE8_NUMNAMES",
-    0x05833ECC: "AS_CB_COMPLETE",
-    0x058AB9C7: "MGGE_KENTUCKY",
-    0x058DB78C: "TRI_VEHICLE",
-    0x05906496: "R_GOODBOY",
-    0x059C5A0D: "STAT_TIME_D",
-    0x05AB0DF4: "AS_CP_OBJECTIVE",
-    0x05B3B790: "P_WRISTBAND1",
-    0x05B3B791: "P_WRISTBAND2",
-    0x05B3B792: "P_WRISTBAND3",
-    0x05B3B793: "P_WRISTBAND4",
-    0x05B3B794: "P_WRISTBAND5",
-    0x05B3B795: "P_WRISTBAND6",
-    0x05B3B796: "P_WRISTBAND7",
-    0x05B3B797: "P_WRISTBAND8",
-    0x05B56AAB: "3_B_TITLE",
-    0x05C564E3: "MGE2_T10G01W01",
-    0x05C564E4: "MGE2_T10G01W02",
-    0x05C564E5: "MGE2_T10G01W03",
-    0x05C564E6: "MGE2_T10G01W04",
-    0x05C564E7: "MGE2_T10G01W05",
-    0x05C564E8: "MGE2_T10G01W06",
-    0x05C564E9: "MGE2_T10G01W07",
-    0x05C564EA: "MGE2_T10G01W08",
-    0x05C564EB: "MGE2_T10G01W09",
-    0x05C56565: "MGE2_T10G01W10",
-    0x05C56566: "MGE2_T10G01W11",
-    0x05C56567: "MGE2_T10G01W12",
-    0x05C56568: "MGE2_T10G01W13",
-    0x05C56569: "MGE2_T10G01W14",
-    0x05C5656A: "MGE2_T10G01W15",
-    0x05C5656B: "MGE2_T10G01W16",
-    0x05C5656C: "MGE2_T10G01W17",
-    0x05C5656D: "MGE2_T10G01W18",
-    0x05C5656E: "MGE2_T10G01W19",
-    0x05C565E8: "MGE2_T10G01W20",
-    0x05C565E9: "MGE2_T10G01W21",
-    0x05C565EA: "MGE2_T10G01W22",
-    0x05C565EB: "MGE2_T10G01W23",
-    0x05C565EC: "MGE2_T10G01W24",
-    0x05C565ED: "MGE2_T10G01W25",
-    0x05C565EE: "MGE2_T10G01W26",
-    0x05C565EF: "MGE2_T10G01W27",
-    0x05C565F0: "MGE2_T10G01W28",
-    0x05C565F1: "MGE2_T10G01W29",
-    0x05C5666B: "MGE2_T10G01W30",
-    0x05C5666C: "MGE2_T10G01W31",
-    0x05C5666D: "MGE2_T10G01W32",
-    0x05C5666E: "MGE2_T10G01W33",
-    0x05C5666F: "MGE2_T10G01W34",
-    0x05C56670: "MGE2_T10G01W35",
-    0x05C56671: "MGE2_T10G01W36",
-    0x05C56672: "MGE2_T10G01W37",
-    0x05C56673: "MGE2_T10G01W38",
-    0x05C56674: "MGE2_T10G01W39",
-    0x05C566EE: "MGE2_T10G01W40",
-    0x05C566EF: "MGE2_T10G01W41",
-    0x05C566F0: "MGE2_T10G01W42",
-    0x05C566F1: "MGE2_T10G01W43",
-    0x05C566F2: "MGE2_T10G01W44",
-    0x05C566F3: "MGE2_T10G01W45",
-    0x05C566F4: "MGE2_T10G01W46",
-    0x05C566F5: "MGE2_T10G01W47",
-    0x05C566F6: "MGE2_T10G01W48",
-    0x05C566F7: "MGE2_T10G01W49",
-    0x05C56771: "MGE2_T10G01W50",
-    0x05CABD03: "MGBI_UNLOCK01",
-    0x05CABD04: "MGBI_UNLOCK02",
-    0x05CABD05: "MGBI_UNLOCK03",
-    0x05CABD06: "MGBI_UNLOCK04",
-    0x05CABD07: "MGBI_UNLOCK05",
-    0x05CABD08: "MGBI_UNLOCK06",
-    0x05D06592: "TITLE10_NUMNAMES",
-    0x05E868FD: "WINTER",
-    0x05F07552: "MG_READY",
-    0x060CEFA1: "STRERRORNODISC",
-    0x061E1A71: "3_XM_REWARD",
-    0x062586C0: "3-03.SUB0001",
-    0x062586C1: "3-03.SUB0002",
-    0x062586C2: "3-03.SUB0003",
-    0x062586C3: "3-03.SUB0004",
-    0x062586C4: "3-03.SUB0005",
-    0x062586C5: "3-03.SUB0006",
-    0x062586C6: "3-03.SUB0007",
-    0x062586C7: "3-03.SUB0008",
-    0x062586C8: "3-03.SUB0009",
-    0x06258742: "3-03.SUB0010",
-    0x06258743: "3-03.SUB0011",
-    0x06258744: "3-03.SUB0012",
-    0x06258745: "3-03.SUB0013",
-    0x06258746: "3-03.SUB0014",
-    0x06258747: "3-03.SUB0015",
-    0x06258748: "3-03.SUB0016",
-    0x06258749: "3-03.SUB0017",
-    0x0625874A: "3-03.SUB0018",
-    0x0628D200: "EVERYWHERE",
-    0x063237EE: "USE_PLANTCB",
-    0x063F316D: "TUT_PPXX1",
-    0x063F316E: "TUT_PPXX2",
-    0x063FD38D: "FR_FAIL",
-    0x064A2554: "3_03_TITLE",
-    0x064B8B88: "S_APOL_HIGH_BULLY_01",
-    0x06507BAD: "MGB2_FROG_10",
-    0x06507BAE: "MGB2_FROG_11",
-    0x06507BAF: "MGB2_FROG_12",
-    0x06566B27: "N_CHUCK",
-    0x06581353: "MGGE_CLASSINFO",
-    0x06667559: "MGMA_SCORE",
-    0x066F1DDF: "ROLL_ZOE_COUNTER",
-    0x06738C29: "3-0.SUB0001",
-    0x06738C2A: "3-0.SUB0002",
-    0x06738C2B: "3-0.SUB0003",
-    0x06738C2C: "3-0.SUB0004",
-    0x06738C2D: "3-0.SUB0005",
-    0x06738C2E: "3-0.SUB0006",
-    0x06738C2F: "3-0.SUB0007",
-    0x06738C30: "3-0.SUB0008",
-    0x06738C31: "3-0.SUB0009",
-    0x06738CAB: "3-0.SUB0010",
-    0x06738CAC: "3-0.SUB0011",
-    0x06738CAD: "3-0.SUB0012",
-    0x06738CAE: "3-0.SUB0013",
-    0x06738CAF: "3-0.SUB0014",
-    0x06738CB0: "3-0.SUB0015",
-    0x06738CB1: "3-0.SUB0016",
-    0x06738CB2: "3-0.SUB0017",
-    0x06738CB3: "3-0.SUB0018",
-    0x06738CB4: "3-0.SUB0019",
-    0x06738D2E: "3-0.SUB0020",
-    0x06738D2F: "3-0.SUB0021",
-    0x06738D30: "3-0.SUB0022",
-    0x06738D31: "3-0.SUB0023",
-    0x06738D32: "3-0.SUB0024",
-    0x06738D33: "3-0.SUB0025",
-    0x067E874A: "P_UNLOCK1",
-    0x067E874B: "P_UNLOCK2",
-    0x067E874C: "P_UNLOCK3",
-    0x067E874D: "P_UNLOCK4",
-    0x067E874E: "P_UNLOCK5",
-    0x068345E3: "CRIME_INTADULTS",
-    0x068B0CBA: "3_XM_STEREO",
-    0x069AFE7E: "6_03_OBJ01C",
-    0x069AFF01: "6_03_OBJ02C",
-    0x069AFF84: "6_03_OBJ03C",
-    0x069B0007: "6_03_OBJ04C",
-    0x06AA08A0: "ILPSTORE",
-    0x06B505ED: "USE_CANNON",
-    0x06C1301C: "GKART_SECOND",
-    0x06C7C5CC: "GA_CUST",
-    0x06CCDE60: "SKLRIDE",
-    0x06D247B7: "N_MSKOPKE",
-    0x06DDF312: "W_EGGS",
-    0x06E39E30: "WAKEUP_PUBLIC1",
-    0x06E39E31: "WAKEUP_PUBLIC2",
-    0x06E802A2: "TUT_PUN01",
-    0x06E802A4: "TUT_PUN03",
-    0x06E802A5: "TUT_PUN04",
-    0x06E95DA3: "MGB2_FINISHED",
-    0x06E98BA7: "1_09_BAR",
-    0x06EB9BE1: "MAP_THUMBNAIL",
-    0x06F2095D: "1_04_WATCHRUN",
-    0x06F2D910: "SKLSWIM",
-    0x06F7810C: "C_DEVILHORNS",
-    0x06F8A6C8: "AS_SW_ACTION",
-    0x07080446: "TUT_PVEN1",
-    0x070B1ABC: "3_XM_WARN_AREA",
-    0x070C1FC9: "DIBUTTON_1",
-    0x070C1FCA: "DIBUTTON_2",
-    0x070C1FCB: "DIBUTTON_3",
-    0x070C1FCC: "DIBUTTON_4",
-    0x070C1FCD: "DIBUTTON_5",
-    0x070C1FCE: "DIBUTTON_6",
-    0x070C1FCF: "DIBUTTON_7",
-    0x070C1FD0: "DIBUTTON_8",
-    0x070C1FD1: "DIBUTTON_9",
-    0x07113DC9: "SKLTHRW",
-    0x0712CA4B: "AS_SL_FAIL",
-    0x07270EE2: "MGGE_VENEZUELA",
-    0x072EAB00: "GA_FULL",
-    0x073F5AA1: "R2_VEHICLE",
-    0x0740AD21: "DARTS_TITLE",
-    0x0740CFAA: "1_03_INSTRUC02",
-    0x07430F62: "4_02_RESPECTJ",
-    0x07430F66: "4_02_RESPECTN",
-    0x076538A7: "2_04_FAILOWNER",
-    0x07659C3F: "N_NORTON",
-    0x0767BA0D: "MGPH_HILLSIDE",
-    0x07683346: "",
-    0x076F15AA: "GA_HELP",
-    0x076FAF0C: "GEN_01",
-    0x076FAF0D: "GEN_02",
-    0x077E00B2: "PER_TIRED",
-    0x0788D7AD: "RUSS_EGG",
-    0x0791E21D: "DPADR_BIKE",
-    0x079CE753: "SM_CHEM1",
-    0x079CE754: "SM_CHEM2",
-    0x079CE755: "SM_CHEM3",
-    0x079CE756: "SM_CHEM4",
-    0x079CE757: "SM_CHEM5",
-    0x079EC086: "MGE2_T1G01WORDS",
-    0x07AA0C73: "1_S01_TITLE",
-    0x07B56CA7: "SP_GNOME_H",
-    0x07B56CAB: "SP_GNOME_L",
-    0x07B56CB3: "SP_GNOME_T",
-    0x07B675E2: "SYS_SHADER_MODEL_ERROR",
-    0x07BA462B: "C2_GRSRVANCE",
-    0x07BBA946: "TATTLE",
-    0x07BDAFB9: "CHAPTER",
-    0x07BF7E90: "MGBI_CLASSINFO",
-    0x07C3590D: "BOXING_01",
-    0x07C3590E: "BOXING_02",
-    0x07C3590F: "BOXING_03",
-    0x07C35910: "BOXING_04",
-    0x07C35911: "BOXING_05",
-    0x07C35912: "BOXING_06",
-    0x07C35913: "BOXING_07",
-    0x07C35914: "BOXING_08",
-    0x07C35915: "BOXING_09",
-    0x07C3598F: "BOXING_10",
-    0x07CB3FEA: "W_SK8BOARD",
-    0x07D1493C: "MAC_INTRO",
-    0x07D646E0: "AS_BR_ACTION",
-    0x07E3516C: "2_01_GOTOBUS",
-    0x07E4E57A: "3_02_LUREOBJ",
-    0x07E8AC3A: "TITLE26_NAME0",
-    0x07E8AC3B: "TITLE26_NAME1",
-    0x07EE6A16: "FEM_OFF",
-    0x07EF007E: "OBSERVATORY",
-    0x07EF7937: "FEM_SL1",
-    0x07EF7938: "FEM_SL2",
-    0x07EF7939: "FEM_SL3",
-    0x07EF793A: "FEM_SL4",
-    0x07EF793B: "FEM_SL5",
-    0x07EF793C: "FEM_SL6",
-    0x07EF793D: "FEM_SL7",
-    0x07EF793E: "FEM_SL8",
-    0x07EF7D63: "FEM_STE",
-    0x07EFFB59: "FEM_UDY",
-    0x07F107FA: "FEM_YES",
-    0x07F751DF: "TITLE60_NUMNAMES",
-    0x080CF811: "FEO_MOUSESTEERFOOT",
-    0x081CACDA: "DPADR_FOOT",
-    0x08228BFD: "AS_CF_ACTION",
-    0x082BA1C3: "AS_SB_OBJCOUNT",
-    0x082CF8E3: "4_04_END04",
-    0x08300A03: "1_08_FATTYAGAIN",
-    0x0851B60A: "MGE2_EXIT",
-    0x0853FB16: "3_XM_TITLE",
-    0x08574FE0: "W_PGUN",
-    0x085C3CFD: "FE_TOURNAMENT",
-    0x08896CC6: "AS_SP_COMPLETE",
-    0x0893380E: "MGPH_LOCATION",
-    0x089A60A4: "DESC_JOCK_MED_01",
-    0x089B38BE: "PUNREMOVE_INPROP",
-    0x089C63C7: "TUT_WW1_DI",
-    0x08ABDA4C: "N_PARKER",
-    0x08B48C7A: "3_B_THIRD_OBJ",
-    0x08C65698: "6_02_RUSSHELP",
-    0x08CC1971: "AUDM",
-    0x08CC1977: "AUDS",
-    0x08D0A9EB: "4_05_RESPECT",
-    0x08D45D42: "FEPA_CHANGE_DEVICE",
-    0x08D78AD7: "C6_FOOTER",
-    0x08D84C8E: "MGE2_INFO",
-    0x08E1A57C: "1_09_UNLOCK",
-    0x08E21F14: "SP_ELF_FT",
-    0x08E76442: "GA_SAVE",
-    0x08E92F6D: "BAND",
-    0x08EA87D5: "MG_PHOTO_FE",
-    0x08F560EF: "1_02B_TITLE",
-    0x08FD1DBE: "MGC2P_SABOTAGE",
-    0x08FDC855: "TITLE87_NAME0",
-    0x08FDC856: "TITLE87_NAME1",
-    0x08FDC857: "TITLE87_NAME2",
-    0x08FDC858: "TITLE87_NAME3",
-    0x08FDC859: "TITLE87_NAME4",
-    0x08FDC85A: "TITLE87_NAME5",
-    0x08FDC85B: "TITLE87_NAME6",
-    0x08FDC85C: "TITLE87_NAME7",
-    0x08FDC85D: "TITLE87_NAME8",
-    0x08FDC85E: "TITLE87_NAME9",
-    0x08FE8C47: "MGGE_JORDAN",
-    0x0903A1A5: "AS_CP_RETURN",
-    0x09042855: "MGE2_T5G01W01",
-    0x09042856: "MGE2_T5G01W02",
-    0x09042857: "MGE2_T5G01W03",
-    0x09042858: "MGE2_T5G01W04",
-    0x09042859: "MGE2_T5G01W05",
-    0x0904285A: "MGE2_T5G01W06",
-    0x0904285B: "MGE2_T5G01W07",
-    0x0904285C: "MGE2_T5G01W08",
-    0x0904285D: "MGE2_T5G01W09",
-    0x090428D7: "MGE2_T5G01W10",
-    0x090428D8: "MGE2_T5G01W11",
-    0x090428D9: "MGE2_T5G01W12",
-    0x090428DA: "MGE2_T5G01W13",
-    0x090428DB: "MGE2_T5G01W14",
-    0x090428DC: "MGE2_T5G01W15",
-    0x090428DD: "MGE2_T5G01W16",
-    0x090428DE: "MGE2_T5G01W17",
-    0x090428DF: "MGE2_T5G01W18",
-    0x090428E0: "MGE2_T5G01W19",
-    0x0904295A: "MGE2_T5G01W20",
-    0x0904295B: "MGE2_T5G01W21",
-    0x0904295C: "MGE2_T5G01W22",
-    0x0904295D: "MGE2_T5G01W23",
-    0x0904295E: "MGE2_T5G01W24",
-    0x0904295F: "MGE2_T5G01W25",
-    0x09042960: "MGE2_T5G01W26",
-    0x09042961: "MGE2_T5G01W27",
-    0x09042962: "MGE2_T5G01W28",
-    0x09042963: "MGE2_T5G01W29",
-    0x090429DD: "MGE2_T5G01W30",
-    0x090429DE: "MGE2_T5G01W31",
-    0x090429DF: "MGE2_T5G01W32",
-    0x090429E0: "MGE2_T5G01W33",
-    0x090429E1: "MGE2_T5G01W34",
-    0x090429E2: "MGE2_T5G01W35",
-    0x090429E3: "MGE2_T5G01W36",
-    0x090429E4: "MGE2_T5G01W37",
-    0x090429E5: "MGE2_T5G01W38",
-    0x090429E6: "MGE2_T5G01W39",
-    0x09042A60: "MGE2_T5G01W40",
-    0x09042A61: "MGE2_T5G01W41",
-    0x09042A62: "MGE2_T5G01W42",
-    0x09042A63: "MGE2_T5G01W43",
-    0x09042A64: "MGE2_T5G01W44",
-    0x09042A65: "MGE2_T5G01W45",
-    0x09042A66: "MGE2_T5G01W46",
-    0x09042A67: "MGE2_T5G01W47",
-    0x09042A68: "MGE2_T5G01W48",
-    0x09042A69: "MGE2_T5G01W49",
-    0x09042AE3: "MGE2_T5G01W50",
-    0x0905E0F2: "TITLE11_NAME0",
-    0x0905E0F3: "TITLE11_NAME1",
-    0x0905E0F4: "TITLE11_NAME2",
-    0x0905E0F5: "TITLE11_NAME3",
-    0x0912E1A7: "R3_BIKE",
-    0x0919B824: "BK_FORKS01D",
-    0x0919B82E: "BK_FORKS01N",
-    0x0919B8A7: "BK_FORKS02D",
-    0x0919B8B1: "BK_FORKS02N",
-    0x09246CBE: "S_MOCK_01",
-    0x09269DD7: "ARCADE_JIM",
-    0x092D4216: "AS_PI_COMPLETE",
-    0x092ED020: "DEAD",
-    0x0934D824: "N_COURTNEY",
-    0x09511FCE: "EEEK",
-    0x095257E8: "MD_SAVE_SIGNIN",
-    0x09561B8E: "EXIT",
-    0x09605CAF: "FE_READY_FE",
-    0x09667E86: "TITLE76_NAME10",
-    0x09667E87: "TITLE76_NAME11",
-    0x09667E88: "TITLE76_NAME12",
-    0x09667E89: "TITLE76_NAME13",
-    0x09667E8A: "TITLE76_NAME14",
-    0x09667E8B: "TITLE76_NAME15",
-    0x09667E8C: "TITLE76_NAME16",
-    0x09667E8D: "TITLE76_NAME17",
-    0x09667E8E: "TITLE76_NAME18",
-    0x09667E8F: "TITLE76_NAME19",
-    0x09667F09: "TITLE76_NAME20",
-    0x09667F0A: "TITLE76_NAME21",
-    0x09667F0B: "TITLE76_NAME22",
-    0x09667F0C: "TITLE76_NAME23",
-    0x09667F0D: "TITLE76_NAME24",
-    0x09667F0E: "TITLE76_NAME25",
-    0x096967ED: "SP_VHELMET",
-    0x09715BC2: "MGGE_TIME_PEN",
-    0x097264DB: "FALL",
-    0x097480B4: "FISH",
-    0x09819583: "SP_PANDA_B",
-    0x09819589: "SP_PANDA_H",
-    0x09865DAC: "MGB2_PIGEON_0",
-    0x09865DAD: "MGB2_PIGEON_1",
-    0x09865DAE: "MGB2_PIGEON_2",
-    0x09865DAF: "MGB2_PIGEON_3",
-    0x09865DB0: "MGB2_PIGEON_4",
-    0x09865DB1: "MGB2_PIGEON_5",
-    0x09865DB2: "MGB2_PIGEON_6",
-    0x09865DB3: "MGB2_PIGEON_7",
-    0x09865DB4: "MGB2_PIGEON_8",
-    0x09865DB5: "MGB2_PIGEON_9",
-    0x09920FBD: "4_S12_GOTDRESS",
-    0x09990E7E: "DESC_PREP_SM_01",
-    0x099DAC64: "R3_FOOT",
-    0x09A2EC5D: "4_B1_RESPECT",
-    0x09A6547B: "P_SPIKY",
-    0x09A8AC19: "TITLE44_NUMNAMES",
-    0x09B2BF88: "H1-0",
-    0x09B2BF89: "H1-1",
-    0x09B2BF8A: "H1-2",
-    0x09B2BF8B: "H1-3",
-    0x09B2BF8C: "H1-4",
-    0x09B2BF8D: "H1-5",
-    0x09B2BF8E: "H1-6",
-    0x09B2BF8F: "H1-7",
-    0x09B2BF90: "H1-8",
-    0x09B2BF91: "H1-9",
-    0x09B30291: "H2-0",
-    0x09B30292: "H2-1",
-    0x09B30293: "H2-2",
-    0x09B3459A: "H3-0",
-    0x09B3459B: "H3-1",
-    0x09B3459C: "H3-2",
-    0x09B388A3: "H4-0",
-    0x09B388A4: "H4-1",
-    0x09B388A5: "H4-2",
-    0x09B388A6: "H4-3",
-    0x09B388A7: "H4-4",
-    0x09B388A8: "H4-5",
-    0x09B388A9: "H4-6",
-    0x09B3CBAC: "H5-0",
-    0x09B3CBAE: "H5-2",
-    0x09B3CBAF: "H5-3",
-    0x09B3CBB0: "H5-4",
-    0x09B3CBB1: "H5-5",
-    0x09B3CBB2: "H5-6",
-    0x09BAAF30: "HOUR",
-    0x09C599F2: "CLT_TOTCOST",
-    0x09CB444B: "2_06_PETEY",
-    0x09D80ACB: "MGSG_POSNUM",
-    0x09E98E20: "TITLE5_NUMNAMES",
-    0x09ED3B26: "AS_SC_RETURN",
-    0x09FA9262: "STO_TICKETS",
-    0x09FE7398: "DESC_GREAS_LG_01",
-    0x0A00970C: "3_05_GOTHAMR",
-    0x0A082621: "1_02B_FAIL_01",
-    0x0A082622: "1_02B_FAIL_02",
-    0x0A082623: "1_02B_FAIL_03",
-    0x0A082624: "1_02B_FAIL_04",
-    0x0A082625: "1_02B_FAIL_05",
-    0x0A17191C: "1_02B_LOGOBJ04",
-    0x0A17191D: "1_02B_LOGOBJ05",
-    0x0A1AFD0D: "TITLE72_NAME0",
-    0x0A1AFD0E: "TITLE72_NAME1",
-    0x0A1AFD0F: "TITLE72_NAME2",
-    0x0A1AFD10: "TITLE72_NAME3",
-    0x0A1AFD11: "TITLE72_NAME4",
-    0x0A1AFD12: "TITLE72_NAME5",
-    0x0A1AFD13: "TITLE72_NAME6",
-    0x0A1AFD14: "TITLE72_NAME7",
-    0x0A1AFD15: "TITLE72_NAME8",
-    0x0A1AFD16: "TITLE72_NAME9",
-    0x0A2236EC: "MGGE_COLORADO",
-    0x0A347F8E: "AS_TW_DROP",
-    0x0A37A2EC: "W_TBONE",
-    0x0A3B7C90: "RARC_TOCONT",
-    0x0A455BE3: "5_05_FAILHITZOE",
-    0x0A4DDFC4: "CRIME_TRESPASSING",
-    0x0A4F7E3D: "CLT_POORCLOTH_TITLE",
-    0x0A505695: "MGE2_TIME",
-    0x0A5B0394: "MEN_BUL",
-    0x0A6240A2: "CRIME_AUTHORITYKO",
-    0x0A64A258: "P_SNOW_CARS",
-    0x0A6D9AF8: "N_FENWICK",
-    0x0A709F55: "AS_EC_OBJECTIVE",
-    0x0A827088: "RARC_TOEXIT",
-    0x0A87BD66: "MGT_BIOLOGY_FE",
-    0x0A887D30: "NONE",
-    0x0A8CA7A6: "N_BO",
-    0x0A8CD12D: "ADULTCOPS",
-    0x0A90F5D3: "1_02B_TUT09",
-    0x0A91CB35: "1_01_STANDGROUND",
-    0x0A95ABA4: "4_B2_TITLE",
-    0x0A965FCE: "N_SHELDON",
-    0x0A9C13A8: "MGBI_SCORE",
-    0x0AB49564: "MGCS_CTRL",
-    0x0ACB8687: "P_SNOW_FAIL",
-    0x0ACD18F0: "POOL",
-    0x0ACE7B20: "TUT_SKIPPING1",
-    0x0ACE7B21: "TUT_SKIPPING2",
-    0x0AD33E54: "RATNG53",
-    0x0AD33E55: "RATNG54",
-    0x0AD33E56: "RATNG55",
-    0x0AD33E57: "RATNG56",
-    0x0AD33E58: "RATNG57",
-    0x0AD91913: "ARCADE_SCORE",
-    0x0ADBD382: "AD_FF_OBJCOUNT1",
-    0x0AE3BFAA: "MGCE_T3G01W01",
-    0x0AE3BFAB: "MGCE_T3G01W02",
-    0x0AE3BFAC: "MGCE_T3G01W03",
-    0x0AE3BFAD: "MGCE_T3G01W04",
-    0x0AE3BFAE: "MGCE_T3G01W05",
-    0x0AE3BFAF: "MGCE_T3G01W06",
-    0x0AE3BFB0: "MGCE_T3G01W07",
-    0x0AE3BFB1: "MGCE_T3G01W08",
-    0x0AE3BFB2: "MGCE_T3G01W09",
-    0x0AE3C02C: "MGCE_T3G01W10",
-    0x0AE3C02D: "MGCE_T3G01W11",
-    0x0AE3C02E: "MGCE_T3G01W12",
-    0x0AE3C02F: "MGCE_T3G01W13",
-    0x0AE3C030: "MGCE_T3G01W14",
-    0x0AE3C031: "MGCE_T3G01W15",
-    0x0AE3C032: "MGCE_T3G01W16",
-    0x0AE3C033: "MGCE_T3G01W17",
-    0x0AE3C034: "MGCE_T3G01W18",
-    0x0AE3C035: "MGCE_T3G01W19",
-    0x0AE3C0AF: "MGCE_T3G01W20",
-    0x0AE3C0B0: "MGCE_T3G01W21",
-    0x0AE3C0B1: "MGCE_T3G01W22",
-    0x0AE3C0B2: "MGCE_T3G01W23",
-    0x0AE3C0B3: "MGCE_T3G01W24",
-    0x0AE3C0B4: "MGCE_T3G01W25",
-    0x0AE3C0B5: "MGCE_T3G01W26",
-    0x0AE3C0B6: "MGCE_T3G01W27",
-    0x0AE3C0B7: "MGCE_T3G01W28",
-    0x0AE3C0B8: "MGCE_T3G01W29",
-    0x0AE3C132: "MGCE_T3G01W30",
-    0x0AE3C133: "MGCE_T3G01W31",
-    0x0AE3C134: "MGCE_T3G01W32",
-    0x0AE3C135: "MGCE_T3G01W33",
-    0x0AE3C136: "MGCE_T3G01W34",
-    0x0AE3C137: "MGCE_T3G01W35",
-    0x0AE3C138: "MGCE_T3G01W36",
-    0x0AE3C139: "MGCE_T3G01W37",
-    0x0AE3C13A: "MGCE_T3G01W38",
-    0x0AE3C13B: "MGCE_T3G01W39",
-    0x0AE3C1B5: "MGCE_T3G01W40",
-    0x0AE3C1B6: "MGCE_T3G01W41",
-    0x0AE3C1B7: "MGCE_T3G01W42",
-    0x0AE3C1B8: "MGCE_T3G01W43",
-    0x0AE3C1B9: "MGCE_T3G01W44",
-    0x0AE3C1BA: "MGCE_T3G01W45",
-    0x0AE3C1BB: "MGCE_T3G01W46",
-    0x0AE3C1BC: "MGCE_T3G01W47",
-    0x0AE3C1BD: "MGCE_T3G01W48",
-    0x0AE3C1BE: "MGCE_T3G01W49",
-    0x0AE3C238: "MGCE_T3G01W50",
-    0x0AE3C239: "MGCE_T3G01W51",
-    0x0AE3C23A: "MGCE_T3G01W52",
-    0x0AE3C23B: "MGCE_T3G01W53",
-    0x0AE3C23C: "MGCE_T3G01W54",
-    0x0AE3C23D: "MGCE_T3G01W55",
-    0x0AE3C23E: "MGCE_T3G01W56",
-    0x0AE3C23F: "MGCE_T3G01W57",
-    0x0AE3C240: "MGCE_T3G01W58",
-    0x0AE3C241: "MGCE_T3G01W59",
-    0x0AE3C2BB: "MGCE_T3G01W60",
-    0x0AE3C2BC: "MGCE_T3G01W61",
-    0x0AE3C2BD: "MGCE_T3G01W62",
-    0x0AE3C2BE: "MGCE_T3G01W63",
-    0x0AE3C2BF: "MGCE_T3G01W64",
-    0x0AE3C2C0: "MGCE_T3G01W65",
-    0x0AE3C2C1: "MGCE_T3G01W66",
-    0x0AE3C2C2: "MGCE_T3G01W67",
-    0x0AE3C2C3: "MGCE_T3G01W68",
-    0x0AE3C2C4: "MGCE_T3G01W69",
-    0x0AE3C33E: "MGCE_T3G01W70",
-    0x0AEC2F2F: "1_11XP_TITLE",
-    0x0AF04765: "AS_FIRE_CHIEF",
-    0x0AF6DFBF: "MGPH_PURPLEBEAKER",
-    0x0AFC4077: "RICH_CLOTH",
-    0x0B0B2BCA: "AS_EB_OBJ_01",
-    0x0B173A66: "5_03_TALK",
-    0x0B1BEA85: "AS_PI_RETURN",
-    0x0B225912: "TPM_RESTARTG",
-    0x0B2F412C: "C3_TAKEDOWN_WII",
-    0x0B322974: "SHIP",
-    0x0B3549CA: "STAR",
-    0x0B354A4E: "STBS",
-    0x0B355168: "STPC",
-    0x0B355179: "STPT",
-    0x0B35CEFC: "COL_RADIO",
-    0x0B3FEEFC: "FEI_NA",
-    0x0B436C6C: "CLT_GNOME",
-    0x0B52A354: "TALK",
-    0x0B594013: "5_09_FAILSPRAY",
-    0x0B5A0653: "TITLE28_NUMNAMES",
-    0x0B5FD07B: "USE_RAILSLIDE",
-    0x0B6128F6: "CRIME_TAUNTAUTHORITY",
-    0x0B6875F7: "N_ALFRED",
-    0x0B6D2123: "CLT_NINJABLK",
-    0x0B714E17: "CLT_NINJARED",
-    0x0B71A480: "1_G1_OENTER",
-    0x0B725057: "ARCADE_FENDSHOOT",
-    0x0B729EDD: "CLT_NINJAWHT",
-    0x0B768B1A: "C2_PREPJUSTIN",
-    0x0B774866: "MGPH_EMPTYBEAKER",
-    0x0B8DBDFC: "MGGE_NUNAVUT",
-    0x0B8E7ED8: "AS_SK_FAIL",
-    0x0B956984: "3_XM_FAIL_AREA",
-    0x0B98E2E6: "MRESPECT_BFRIEND",
-    0x0B9C6988: "HUD_MED",
-    0x0B9F65DC: "1_06_GRAPPLE",
-    0x0BA87A3E: "SP_PANTIES",
-    0x0BAAE129: "N_MISSPEABODY",
-    0x0BB1273C: "TUT_BCOPS1",
-    0x0BB1273D: "TUT_BCOPS2",
-    0x0BB7D425: "RACE_WINOBJ",
-    0x0BBC9974: "AS_EG_OBJCOUNT",
-    0x0BC7173A: "SOC_F_DISS",
-    0x0BC92576: "FEM_NO",
-    0x0BC925F8: "FEM_ON",
-    0x0BDADC37: "MGE2_FOOTER",
-    0x0BDCD69A: "4-02.SUB0001",
-    0x0BDCD69B: "4-02.SUB0002",
-    0x0BDCD69C: "4-02.SUB0003",
-    0x0BDCD69D: "4-02.SUB0004",
-    0x0BDCD69E: "4-02.SUB0005",
-    0x0BDCD69F: "4-02.SUB0006",
-    0x0BDCD6A0: "4-02.SUB0007",
-    0x0BDCD6A1: "4-02.SUB0008",
-    0x0BDCD6A2: "4-02.SUB0009",
-    0x0BDCD71C: "4-02.SUB0010",
-    0x0BDCD71D: "4-02.SUB0011",
-    0x0BDCD71E: "4-02.SUB0012",
-    0x0BDCD71F: "4-02.SUB0013",
-    0x0BDCD720: "4-02.SUB0014",
-    0x0BDCD721: "4-02.SUB0015",
-    0x0BDCD722: "4-02.SUB0016",
-    0x0BDCD723: "4-02.SUB0017",
-    0x0BDCD724: "4-02.SUB0018",
-    0x0BDCD725: "4-02.SUB0019",
-    0x0BDCD79F: "4-02.SUB0020",
-    0x0BDCD7A0: "4-02.SUB0021",
-    0x0BDCD7A1: "4-02.SUB0022",
-    0x0BDCD7A2: "4-02.SUB0023",
-    0x0BDCD7A3: "4-02.SUB0024",
-    0x0BDCD7A4: "4-02.SUB0025",
-    0x0BDCD7A5: "4-02.SUB0026",
-    0x0BDCD7A6: "4-02.SUB0027",
-    0x0BDCD7A7: "4-02.SUB0028",
-    0x0BDCD7A8: "4-02.SUB0029",
-    0x0BDCD822: "4-02.SUB0030",
-    0x0BDCD823: "4-02.SUB0031",
-    0x0BDCD824: "4-02.SUB0032",
-    0x0BDCD825: "4-02.SUB0033",
-    0x0BDCD826: "4-02.SUB0034",
-    0x0BE2D811: "FE_LOSER_FE",
-    0x0BE2DD1B: "FE_LOSER_P1",
-    0x0BE2DD1C: "FE_LOSER_P2",
-    0x0BFD5BC5: "AS_BH_OBJCOUNT1",
-    0x0C0A1EE0: "MGPH_GLOBE",
-    0x0C0BA51D: "MGGE_BOLIVIA",
-    0x0C0BF35B: "3_S08",
-    0x0C1435AF: "FE_GAME_PAUSED",
-    0x0C182034: "N_MISSDANVERS",
-    0x0C19ACE8: "AS_ARCADE_MASTER",
-    0x0C1F4CED: "RACING_SET",
-    0x0C2293BA: "P_SNOW_PASS",
-    0x0C26FE7A: "AS_LB_ACTION",
-    0x0C273BD6: "S_HELP_FEMALE_01",
-    0x0C31BFE6: "TITLE59_NAME0",
-    0x0C39FD57: "DB_UPGRADE",
-    0x0C41D53C: "2_S05_OGOTCANDY",
-    0x0C4EBFB7: "MGPH_GNOME",
-    0x0C60DAD2: "TUT_REDSTAR1",
-    0x0C60DAD3: "TUT_REDSTAR2",
-    0x0C687540: "PER_VTIRED",
-    0x0C7702DB: "MGSG_INFO",
-    0x0C770987: "MGSG_INST",
-    0x0C84553C: "GKART_YOURTIME",
-    0x0C9675A7: "2_S04_TITLE",
-    0x0C978BA2: "AS_EH_OBJECTIVE",
-    0x0C98C1A9: "AS_CF_OTHER",
-    0x0C9C9730: "AS_TW_BUTDISPL",
-    0x0C9F20D5: "2-09B.SUB0001",
-    0x0C9F20D6: "2-09B.SUB0002",
-    0x0C9F20D7: "2-09B.SUB0003",
-    0x0C9F20D8: "2-09B.SUB0004",
-    0x0C9F20D9: "2-09B.SUB0005",
-    0x0C9F20DA: "2-09B.SUB0006",
-    0x0C9F20DB: "2-09B.SUB0007",
-    0x0C9F20DC: "2-09B.SUB0008",
-    0x0C9F20DD: "2-09B.SUB0009",
-    0x0CA34D73: "AS_TW_COLLECT",
-    0x0CA4B49E: "TUT_CRAWL1",
-    0x0CA4B49F: "TUT_CRAWL2",
-    0x0CA4B4A0: "TUT_CRAWL3",
-    0x0CA92E7E: "RACING_READY",
-    0x0CAABAEF: "3_05_LIPSTICK",
-    0x0CAF2285: "AS_TF_OBJECTIVE",
-    0x0CB73677: "SOC_F_KISS",
-    0x0CBBDFDD: "ITBEG",
-    0x0CCE647B: "MGGE_SCORE",
-    0x0CE0C8CC: "CLT_JSHIRT",
-    0x0CE2649F: "AS_ALL_RUBBERBANDS",
-    0x0CE96380: "5_05_OSABPOT",
-    0x0D0968BC: "AS_HT_ACTION",
-    0x0D3BA44D: "CRIME_PEDATTACKSTUDENT",
-    0x0D427020: "MGE2_T15G01W01",
-    0x0D427021: "MGE2_T15G01W02",
-    0x0D427022: "MGE2_T15G01W03",
-    0x0D427023: "MGE2_T15G01W04",
-    0x0D427024: "MGE2_T15G01W05",
-    0x0D427025: "MGE2_T15G01W06",
-    0x0D427026: "MGE2_T15G01W07",
-    0x0D427027: "MGE2_T15G01W08",
-    0x0D427028: "MGE2_T15G01W09",
-    0x0D4270A2: "MGE2_T15G01W10",
-    0x0D4270A3: "MGE2_T15G01W11",
-    0x0D4270A4: "MGE2_T15G01W12",
-    0x0D4270A5: "MGE2_T15G01W13",
-    0x0D4270A6: "MGE2_T15G01W14",
-    0x0D4270A7: "MGE2_T15G01W15",
-    0x0D4270A8: "MGE2_T15G01W16",
-    0x0D4270A9: "MGE2_T15G01W17",
-    0x0D4270AA: "MGE2_T15G01W18",
-    0x0D4270AB: "MGE2_T15G01W19",
-    0x0D427125: "MGE2_T15G01W20",
-    0x0D427126: "MGE2_T15G01W21",
-    0x0D427127: "MGE2_T15G01W22",
-    0x0D427128: "MGE2_T15G01W23",
-    0x0D427129: "MGE2_T15G01W24",
-    0x0D42712A: "MGE2_T15G01W25",
-    0x0D42712B: "MGE2_T15G01W26",
-    0x0D42712C: "MGE2_T15G01W27",
-    0x0D42712D: "MGE2_T15G01W28",
-    0x0D42712E: "MGE2_T15G01W29",
-    0x0D4271A8: "MGE2_T15G01W30",
-    0x0D4271A9: "MGE2_T15G01W31",
-    0x0D4271AA: "MGE2_T15G01W32",
-    0x0D4271AB: "MGE2_T15G01W33",
-    0x0D4271AC: "MGE2_T15G01W34",
-    0x0D4271AD: "MGE2_T15G01W35",
-    0x0D4271AE: "MGE2_T15G01W36",
-    0x0D4271AF: "MGE2_T15G01W37",
-    0x0D4271B0: "MGE2_T15G01W38",
-    0x0D4271B1: "MGE2_T15G01W39",
-    0x0D42722B: "MGE2_T15G01W40",
-    0x0D42722C: "MGE2_T15G01W41",
-    0x0D42722D: "MGE2_T15G01W42",
-    0x0D42722E: "MGE2_T15G01W43",
-    0x0D42722F: "MGE2_T15G01W44",
-    0x0D427230: "MGE2_T15G01W45",
-    0x0D427231: "MGE2_T15G01W46",
-    0x0D427232: "MGE2_T15G01W47",
-    0x0D427233: "MGE2_T15G01W48",
-    0x0D427234: "MGE2_T15G01W49",
-    0x0D4272AE: "MGE2_T15G01W50",
-    0x0D4EF49E: "TITLE44_NAME0",
-    0x0D4F98A5: "TPM_EXITMULTI",
-    0x0D54CADD: "R_ILEAGUE_01",
-    0x0D54CADE: "R_ILEAGUE_02",
-    0x0D54CADF: "R_ILEAGUE_03",
-    0x0D54CAE0: "R_ILEAGUE_04",
-    0x0D5BA9F4: "C_STPDSHRT",
-    0x0D629237: "1_08_OBJ01",
-    0x0D629239: "1_08_OBJ03",
-    0x0D62923B: "1_08_OBJ05",
-    0x0D62923D: "1_08_OBJ07",
-    0x0D62923E: "1_08_OBJ08",
-    0x0D62923F: "1_08_OBJ09",
-    0x0D6292BD: "1_08_OBJ14",
-    0x0D6292BE: "1_08_OBJ15",
-    0x0D6292C0: "1_08_OBJ17",
-    0x0D6292C2: "1_08_OBJ19",
-    0x0D7547A5: "MGGE_VANUATU",
-    0x0D77A903: "2_R11_JUSTIN_NAME",
-    0x0D77B80F: "ENG_TUT1",
-    0x0D77B810: "ENG_TUT2",
-    0x0D77B811: "ENG_TUT3",
-    0x0D77B812: "ENG_TUT4",
-    0x0D77B813: "ENG_TUT5",
-    0x0D7A2806: "DB_UNLOCK01",
-    0x0D7A2807: "DB_UNLOCK02",
-    0x0D7A2808: "DB_UNLOCK03",
-    0x0D801B98: "GKART_SR1_1",
-    0x0D801B99: "GKART_SR1_2",
-    0x0D801B9A: "GKART_SR1_3",
-    0x0D805EA1: "GKART_SR2_1",
-    0x0D805EA2: "GKART_SR2_2",
-    0x0D805EA3: "GKART_SR2_3",
-    0x0D805EA4: "GKART_SR2_4",
-    0x0D80A1AA: "GKART_SR3_1",
-    0x0D80A1AB: "GKART_SR3_2",
-    0x0D80A1AC: "GKART_SR3_3",
-    0x0D80F2A0: "TITLE78_NUMNAMES",
-    0x0D852918: "AS_IP_FAILED",
-    0x0D86BC48: "AS_ST_OBJECTIVE",
-    0x0D8B7FA8: "SP_POPHAT",
-    0x0D8E2AA3: "3S10_AREAWARN",
-    0x0D8E4B8A: "4_02_ENTEROBS",
-    0x0D8E9634: "R2_BIKE",
-    0x0D9D6B22: "MGGE_SCORE1",
-    0x0DB2FD4F: "MGPH_SPACECRAFT",
-    0x0DBBD74E: "CLASS_CONTINUE",
-    0x0DC1B505: "N_RICKY",
-    0x0DC73091: "3_08_TITLE",
-    0x0DC85420: "TUT_BIKEPROJ2",
-    0x0DD0FCEC: "PHOTO_FULL",
-    0x0DD3F79D: "W_SSPUDGUN",
-    0x0DD7A12A: "AS_FC_COMPLETE",
-    0x0DF63139: "DBG_ROUND 1",
-    0x0DF6313A: "DBG_ROUND 2",
-    0x0DF6313B: "DBG_ROUND 3",
-    0x0E0400D1: "3_R08_BMXHELMET",
-    0x0E0A5594: "MGGE_PHILIPINES",
-    0x0E0F06C9: "GTITLE",
-    0x0E0F86E7: "4_01_FAIL_01",
-    0x0E0F86E8: "4_01_FAIL_02",
-    0x0E0F86E9: "4_01_FAIL_03",
-    0x0E1960F1: "R2_FOOT",
-    0x0E1A1D2A: "STO_OUTOFSTOCK",
-    0x0E1ED4D0: "3_XM_FAIL_TIME",
-    0x0E201679: "4_04_THADIED",
-    0x0E223F8D: "B_SHORTS1",
-    0x0E223F8E: "B_SHORTS2",
-    0x0E223F8F: "B_SHORTS3",
-    0x0E223F90: "B_SHORTS4",
-    0x0E223F91: "B_SHORTS5",
-    0x0E223F92: "B_SHORTS6",
-    0x0E223F93: "B_SHORTS7",
-    0x0E24C7F0: "TITLE41_NUMNAMES",
-    0x0E2CD79D: "FE_INV",
-    0x0E2DB666: "BUTTON_LANALOGD_D",
-    0x0E2DDD14: "FE_MAP",
-    0x0E2E6AD7: "FE_OPT",
-    0x0E2F7156: "FE_SEP",
-    0x0E2FCEAE: "BUTTON_LANALOGL_D",
-    0x0E3160E4: "BUTTON_LANALOGR_D",
-    0x0E3229FF: "BUTTON_LANALOGU_D",
-    0x0E3CA6FA: "WHATEVER",
-    0x0E3D966C: "MGGE_KANSAS",
-    0x0E5ABD7F: "MGC2P_GARYWIN",
-    0x0E65A9F7: "TITLE2_NUMNAMES",
-    0x0E68008C: "RACER1",
-    0x0E6E06A5: "3-G3.SUB0001",
-    0x0E6E06A6: "3-G3.SUB0002",
-    0x0E6E06A7: "3-G3.SUB0003",
-    0x0E6E06A8: "3-G3.SUB0004",
-    0x0E6E06A9: "3-G3.SUB0005",
-    0x0E6E06AA: "3-G3.SUB0006",
-    0x0E6E06AB: "3-G3.SUB0007",
-    0x0E6E06AC: "3-G3.SUB0008",
-    0x0E6E06AD: "3-G3.SUB0009",
-    0x0E6E0727: "3-G3.SUB0010",
-    0x0E6E0728: "3-G3.SUB0011",
-    0x0E6E0729: "3-G3.SUB0012",
-    0x0E6E072A: "3-G3.SUB0013",
-    0x0E6E072B: "3-G3.SUB0014",
-    0x0E6E072C: "3-G3.SUB0015",
-    0x0E6E072D: "3-G3.SUB0016",
-    0x0E6E072E: "3-G3.SUB0017",
-    0x0E6E072F: "3-G3.SUB0018",
-    0x0E6E0730: "3-G3.SUB0019",
-    0x0E6E07AA: "3-G3.SUB0020",
-    0x0E6E07AB: "3-G3.SUB0021",
-    0x0E6E07AC: "3-G3.SUB0022",
-    0x0E7D3448: "C2_GRSRNORTON",
-    0x0E860236: "CRIME_BULLYINGSMALL",
-    0x0E87F9C5: "5_04_RESPECT",
-    0x0E88A64A: "MGGE_SPAIN",
-    0x0E89B058: "MGGE_SPEED",
-    0x0E8B621D: "TUT_LMP_01",
-    0x0E8B621E: "TUT_LMP_02",
-    0x0E8B621F: "TUT_LMP_03",
-    0x0E8E5943: "BULLYTHANKS",
-    0x0E8FFE61: "2_01_OGOTMEAT",
-    0x0E97EF1F: "POOR_HAIR",
-    0x0E999FFD: "MGPH_COLAMACHINE",
-    0x0E9B9310: "TUT_BBKX1",
-    0x0E9B9311: "TUT_BBKX2",
-    0x0E9EA0FC: "5_B_CRAWL",
-    0x0EAB2749: "FAC_GREASERS",
-    0x0EB17A1D: "1_10_CRAWL",
-    0x0EBE77EF: "AS_EM_OBJECTIVE",
-    0x0EC133A8: "TUT_BCX01",
-    0x0EC133A9: "TUT_BCX02",
-    0x0EC2F85B: "MGPH_REDTRUCK",
-    0x0EC3A33F: "CLT_NOITEMS",
-    0x0ECBB06F: "AS_MA_OBJCOUNT1",
-    0x0ED1048D: "B_FLATTOP_01",
-    0x0ED1048E: "B_FLATTOP_02",
-    0x0ED1048F: "B_FLATTOP_03",
-    0x0ED36290: "4_04_TITLE",
-    0x0ED48E59: "SYS_APP_CREATE_ERROR",
-    0x0EE3442A: "COL_TOMBSTONE",
-    0x0EEA8299: "5-06.SUB0001",
-    0x0EEA829A: "5-06.SUB0002",
-    0x0EEA829B: "5-06.SUB0003",
-    0x0EEA829C: "5-06.SUB0004",
-    0x0EEA829D: "5-06.SUB0005",
-    0x0EEA829E: "5-06.SUB0006",
-    0x0EEA829F: "5-06.SUB0007",
-    0x0EEA82A0: "5-06.SUB0008",
-    0x0EEA82A1: "5-06.SUB0009",
-    0x0EEA831B: "5-06.SUB0010",
-    0x0EEA831C: "5-06.SUB0011",
-    0x0EEA831D: "5-06.SUB0012",
-    0x0EEA831E: "5-06.SUB0013",
-    0x0EEA831F: "5-06.SUB0014",
-    0x0EEA8320: "5-06.SUB0015",
-    0x0EEA8321: "5-06.SUB0016",
-    0x0EEA8322: "5-06.SUB0017",
-    0x0EEA8323: "5-06.SUB0018",
-    0x0EEA8324: "5-06.SUB0019",
-    0x0EEA839E: "5-06.SUB0020",
-    0x0EEA839F: "5-06.SUB0021",
-    0x0EEA83A0: "5-06.SUB0022",
-    0x0EEA83A1: "5-06.SUB0023",
-    0x0EEA83A2: "5-06.SUB0024",
-    0x0EEA83A3: "5-06.SUB0025",
-    0x0EEA83A4: "5-06.SUB0026",
-    0x0EEA83A5: "5-06.SUB0027",
-    0x0EEA83A6: "5-06.SUB0028",
-    0x0EEA83A7: "5-06.SUB0029",
-    0x0EEA8421: "5-06.SUB0030",
-    0x0EF11800: "3_05_ORETLOLA",
-    0x0EF4E871: "N_MISSABBY",
-    0x0EFBC12B: "RARC_STOSTART",
-    0x0F01A13A: "MGPH_PERSONALPARIOT",
-    0x0F058845: "START_NOC",
-    0x0F05884F: "START_NOM",
-    0x0F058855: "START_NOS",
-    0x0F10FF96: "STO_PURCHASED",
-    0x0F1BBA00: "1_09_TRIGGER",
-    0x0F1C8F75: "SWALLOW",
-    0x0F1EA520: "",
-    0x0F20B2CF: "PHO_FCLEAR",
-    0x0F274939: "2_08_OUTHAR",
-    0x0F34EF54: "MGGE_SUDAN",
-    0x0F397275: "C2_GRSRHAL",
-    0x0F3A14E8: "USE_REAPERS",
-    0x0F3C210B: "4_S12_RETURN_ITEMS",
-    0x0F4475AB: "TUT_BGAR1",
-    0x0F4475AC: "TUT_BGAR2",
-    0x0F45C5D0: "D_SANDW",
-    0x0F4AFE36: "AS_ALL_PUMPKINS",
-    0x0F4FAB17: "MGDT_INSTRUCT",
-    0x0F545038: "BARBS",
-    0x0F79FBEF: "BB_00",
-    0x0F79FBF0: "BB_01",
-    0x0F79FBF1: "BB_02",
-    0x0F79FBF2: "BB_03",
-    0x0F79FBF3: "BB_04",
-    0x0F79FBF4: "BB_05",
-    0x0F79FBF5: "BB_06",
-    0x0F79FBF6: "BB_07",
-    0x0F79FBF7: "BB_08",
-    0x0F79FBF8: "BB_09",
-    0x0F79FC72: "BB_10",
-    0x0F79FC73: "BB_11",
-    0x0F79FC74: "BB_12",
-    0x0F79FC75: "BB_13",
-    0x0F79FC76: "BB_14",
-    0x0F79FC77: "BB_15",
-    0x0F79FC78: "BB_16",
-    0x0F79FC79: "BB_17",
-    0x0F79FC7A: "BB_18",
-    0x0F79FC7B: "BB_19",
-    0x0F79FCF5: "BB_20",
-    0x0F79FCF6: "BB_21",
-    0x0F79FCF7: "BB_22",
-    0x0F79FCF8: "BB_23",
-    0x0F79FCF9: "BB_24",
-    0x0F79FCFA: "BB_25",
-    0x0F79FCFB: "BB_26",
-    0x0F79FCFC: "BB_27",
-    0x0F79FCFD: "BB_28",
-    0x0F79FCFE: "BB_29",
-    0x0F7AE37C: "MGGE_SWITZ",
-    0x0F807B8F: "S_TAUNT_GIRL_01",
-    0x0F82F1C0: "MGGE_NEWZEALAND",
-    0x0F83DA5F: "",
-    0x0F8BA894: "TUT_BIKE1",
-    0x0F8BA895: "TUT_BIKE2",
-    0x0F8BA896: "TUT_BIKE3",
-    0x0FAC7F6C: "DBG_SCORE00",
-    0x0FAC7F6D: "DBG_SCORE01",
-    0x0FAC7FEF: "DBG_SCORE10",
-    0x0FAC7FF0: "DBG_SCORE11",
-    0x0FB04FE1: "3_01B_TEXT_01",
-    0x0FB04FE2: "3_01B_TEXT_02",
-    0x0FC1D449: "MGGE_SYRIA",
-    0x0FC6AA2A: "TUT_ACLS01",
-    0x0FCFA8DB: "3_B_FIRST_OBJ",
-    0x0FD2A5C2: "TUT_BKTR1",
-    0x0FD2A5C3: "TUT_BKTR2",
-    0x0FD2A5C4: "TUT_BKTR3",
-    0x0FD6222A: "TITLE25_NUMNAMES",
-    0x0FD7B171: "",
-    0x0FDB30EB: "2_08_BEATBIF",
-    0x1001F99E: "FE_STARTTITLE",
-    0x101121D2: "MGGE_MALDIVES",
-    0x10183AB7: "N_GURNEY",
-    0x1019ACF4: "STAT_DISTANCE",
-    0x102C4032: "4-S12B.SUB0001",
-    0x102C4033: "4-S12B.SUB0002",
-    0x102C4034: "4-S12B.SUB0003",
-    0x102C4035: "4-S12B.SUB0004",
-    0x102C4036: "4-S12B.SUB0005",
-    0x102C4037: "4-S12B.SUB0006",
-    0x102C4038: "4-S12B.SUB0007",
-    0x102C4039: "4-S12B.SUB0008",
-    0x102C403A: "4-S12B.SUB0009",
-    0x102C40B4: "4-S12B.SUB0010",
-    0x102C40B5: "4-S12B.SUB0011",
-    0x102C40B6: "4-S12B.SUB0012",
-    0x102C40B7: "4-S12B.SUB0013",
-    0x102C40B8: "4-S12B.SUB0014",
-    0x102C40B9: "4-S12B.SUB0015",
-    0x102C40BA: "4-S12B.SUB0016",
-    0x102C40BB: "4-S12B.SUB0017",
-    0x102C40BC: "4-S12B.SUB0018",
-    0x102C40BD: "4-S12B.SUB0019",
-    0x102C4137: "4-S12B.SUB0020",
-    0x102C4138: "4-S12B.SUB0021",
-    0x102C4139: "4-S12B.SUB0022",
-    0x102C413A: "4-S12B.SUB0023",
-    0x102C413B: "4-S12B.SUB0024",
-    0x102C413C: "4-S12B.SUB0025",
-    0x102C413D: "4-S12B.SUB0026",
-    0x102C413E: "4-S12B.SUB0027",
-    0x102C413F: "4-S12B.SUB0028",
-    0x102C4140: "4-S12B.SUB0029",
-    0x102C41BA: "4-S12B.SUB0030",
-    0x102C41BB: "4-S12B.SUB0031",
-    0x102C41BC: "4-S12B.SUB0032",
-    0x102C5E22: "TUT_PEACEHUM",
-    0x102DE822: "TUT_PEACENEG",
-    0x1033FF47: "1_09_RESPECTM",
-    0x1033FF4A: "1_09_RESPECTP",
-    0x1037371F: "MGDA_DART",
-    0x1037924F: "L2_VEHICLE",
-    0x103C93CE: "ENABLE_XINPUT_YES",
-    0x103EE6E4: "UH_GEOGRAPHY",
-    0x104E468D: "5_01_01",
-    0x104E468E: "5_01_02",
-    0x105166AA: "4_S12_PERFUME",
-    0x106E0387: "2_S04_C01",
-    0x106E0388: "2_S04_C02",
-    0x106E0389: "2_S04_C03",
-    0x106E038A: "2_S04_C04",
-    0x106E038B: "2_S04_C05",
-    0x107094AA: "5_02_10",
-    0x107094AC: "5_02_12",
-    0x107094AD: "5_02_13",
-    0x107094AE: "5_02_14",
-    0x107094AF: "5_02_15",
-    0x107094B0: "5_02_16",
-    0x107094B1: "5_02_17",
-    0x107094B2: "5_02_18",
-    0x107094B3: "5_02_19",
-    0x1070952D: "5_02_20",
-    0x1070952E: "5_02_21",
-    0x1079FC4B: "TUT_BPDX1",
-    0x107E18E6: "FEI_NO_CLCTBLS",
-    0x1082EC2F: "TITLE16_NAME0",
-    0x1082EC30: "TITLE16_NAME1",
-    0x1092E352: "5_03_37",
-    0x1092E353: "5_03_38",
-    0x1092E354: "5_03_39",
-    0x1092E5DA: "5_03_80",
-    0x1092E661: "5_03_94",
-    0x10996E87: "D_SKATE",
-    0x109DDF1E: "3_05_BOSSNAME",
-    0x10AD3F9C: "MGGE_TRINIDAD",
-    0x10B2C698: "DISC_06_WII",
-    0x10B52F61: "5_04_04",
-    0x10B52F62: "5_04_05",
-    0x10B52F63: "5_04_06",
-    0x10B52F64: "5_04_07",
-    0x10B52FE1: "5_04_11",
-    0x10B52FE2: "5_04_12",
-    0x10B52FE3: "5_04_13",
-    0x10B530EB: "5_04_35",
-    0x10B530EC: "5_04_36",
-    0x10B530ED: "5_04_37",
-    0x10B53169: "5_04_40",
-    0x10B5316A: "5_04_41",
-    0x10B876CA: "R_JACKET1",
-    0x10B876CB: "R_JACKET2",
-    0x10B876CE: "R_JACKET5",
-    0x10BDD15A: "D_SLING",
-    0x10C3BFBD: "TUT_BRX01",
-    0x10C3BFBE: "TUT_BRX02",
-    0x10C932C3: "BLACK",
-    0x10CE224E: "FERRISWHEEL",
-    0x10D67354: "MGGE_NWT",
-    0x10D68C2E: "TUT_ACTIVE",
-    0x10D6F025: "MGGE_PEI",
-    0x10D77D82: "5_05_17",
-    0x10D7B943: "MGGE_SEL",
-    0x10E1CE61: "AS_BIKE_TREK",
-    0x10E8BEF3: "C4_UNLOCK01",
-    0x10E8BEF4: "C4_UNLOCK02",
-    0x10E8BEF5: "C4_UNLOCK03",
-    0x10E8BEF6: "C4_UNLOCK04",
-    0x10E8BEF7: "C4_UNLOCK05",
-    0x10F9CA94: "5_06_01",
-    0x10F9CA95: "5_06_02",
-    0x10F9CA96: "5_06_03",
-    0x10F9CA97: "5_06_04",
-    0x10F9CA98: "5_06_05",
-    0x10F9CA99: "5_06_06",
-    0x10F9CA9A: "5_06_07",
-    0x10F9CA9B: "5_06_08",
-    0x10F9CA9C: "5_06_09",
-    0x10FABBDB: "BUY_TRADE",
-    0x10FCFB1F: "AS_TP_OBJECTIVE",
-    0x110953EF: "MGCE_PREFAPOL01",
-    0x110953F0: "MGCE_PREFAPOL02",
-    0x110953F1: "MGCE_PREFAPOL03",
-    0x110AB56F: "AS_GS_OBJCOUNT1",
-    0x1119555F: "5_05_FAILPOT",
-    0x1119DE7D: "5_05_FAILRUN",
-    0x11279276: "TUT_BULL1",
-    0x1129119C: "ERR_OPTIONS",
-    0x112B3C74: "MGGE_IVORY COAST",
-    0x113F23DA: "S_TAUNT_NERD_01",
-    0x1145936C: "1_11X2_GHEALTH",
-    0x1145B50B: "D_SPDGN",
-    0x11515DD7: "CONT_06_WII",
-    0x11580C57: "TUT_SSLING01",
-    0x11596684: "C2_PREPPARKER",
-    0x115C1B18: "TITLE2_NAME0",
-    0x115C1B19: "TITLE2_NAME1",
-    0x115C1B1A: "TITLE2_NAME2",
-    0x115C1B1B: "TITLE2_NAME3",
-    0x115C1B1C: "TITLE2_NAME4",
-    0x115C1B1D: "TITLE2_NAME5",
-    0x115C1B1E: "TITLE2_NAME6",
-    0x115C1B1F: "TITLE2_NAME7",
-    0x115C1B20: "TITLE2_NAME8",
-    0x115C1B21: "TITLE2_NAME9",
-    0x117A4630: "AS_BB_ACTION",
-    0x117AE00F: "GOTO_RACEPOOR",
-    0x117BE571: "1_08_UNLOCK",
-    0x11942674: "5-01.SUB0001",
-    0x11942675: "5-01.SUB0002",
-    0x11942676: "5-01.SUB0003",
-    0x11942677: "5-01.SUB0004",
-    0x11942678: "5-01.SUB0005",
-    0x11942679: "5-01.SUB0006",
-    0x1194267A: "5-01.SUB0007",
-    0x1194267B: "5-01.SUB0008",
-    0x1194267C: "5-01.SUB0009",
-    0x119426F6: "5-01.SUB0010",
-    0x119426F7: "5-01.SUB0011",
-    0x119426F8: "5-01.SUB0012",
-    0x119426F9: "5-01.SUB0013",
-    0x119426FA: "5-01.SUB0014",
-    0x119426FB: "5-01.SUB0015",
-    0x119426FC: "5-01.SUB0016",
-    0x119426FD: "5-01.SUB0017",
-    0x119426FE: "5-01.SUB0018",
-    0x119426FF: "5-01.SUB0019",
-    0x119780F5: "5_09_OC_02",
-    0x119780F6: "5_09_OC_03",
-    0x119780F7: "5_09_OC_04",
-    0x1198084A: "TITLE77_NAME0",
-    0x11B910AC: "CARD_01_WII",
-    0x11BE7242: "ERR_FULL_P",
-    0x11C53D8C: "DESC_NERD_MED_01",
-    0x11C8128F: "TUT_PREPVEN1",
-    0x11CADDBE: "TEST_AREA",
-    0x11CB5577: "AS_PM_ACTION",
-    0x11CEDD91: "MGBI_PIGEON_0",
-    0x11CEDD92: "MGBI_PIGEON_1",
-    0x11CEDD93: "MGBI_PIGEON_2",
-    0x11CEDD94: "MGBI_PIGEON_3",
-    0x11CEDD95: "MGBI_PIGEON_4",
-    0x11CEDD96: "MGBI_PIGEON_5",
-    0x11CEDD97: "MGBI_PIGEON_6",
-    0x11CEDD98: "MGBI_PIGEON_7",
-    0x11CEDD99: "MGBI_PIGEON_8",
-    0x11CEDD9A: "MGBI_PIGEON_9",
-    0x11D015C5: "R_SWEATER1",
-    0x11D015C6: "R_SWEATER2",
-    0x11D015C7: "R_SWEATER3",
-    0x11D015C8: "R_SWEATER4",
-    0x11D015C9: "R_SWEATER5",
-    0x11D33660: "N_KAREN",
-    0x11E0F257: "S_ASSIST_01",
-    0x11E43E26: "MG_ART",
-    0x11E5C9B0: "MG_GEO",
-    0x11E74BD8: "W_WBALLOON",
-    0x11E8EE21: "MG_SET",
-    0x11FAF661: "3_R09_UPSTAIRS",
-    0x11FD0E77: "TITLE75_NUMNAMES",
-    0x1200BE7B: "TITLE75_NAME10",
-    0x1200BE7C: "TITLE75_NAME11",
-    0x1200BE7D: "TITLE75_NAME12",
-    0x1200BE7E: "TITLE75_NAME13",
-    0x1200BE7F: "TITLE75_NAME14",
-    0x1200BE80: "TITLE75_NAME15",
-    0x1200BE81: "TITLE75_NAME16",
-    0x1200BE82: "TITLE75_NAME17",
-    0x1200BE83: "TITLE75_NAME18",
-    0x1200BE84: "TITLE75_NAME19",
-    0x1200BEFE: "TITLE75_NAME20",
-    0x1200BEFF: "TITLE75_NAME21",
-    0x1200BF00: "TITLE75_NAME22",
-    0x1200BF01: "TITLE75_NAME23",
-    0x1200BF02: "TITLE75_NAME24",
-    0x1200BF03: "TITLE75_NAME25",
-    0x1200BF04: "TITLE75_NAME26",
-    0x1200BF05: "TITLE75_NAME27",
-    0x1200BF06: "TITLE75_NAME28",
-    0x1200BF07: "TITLE75_NAME29",
-    0x1200BF81: "TITLE75_NAME30",
-    0x1200BF82: "TITLE75_NAME31",
-    0x1200BF83: "TITLE75_NAME32",
-    0x1200BF84: "TITLE75_NAME33",
-    0x1200BF85: "TITLE75_NAME34",
-    0x1200BF86: "TITLE75_NAME35",
-    0x1200BF87: "TITLE75_NAME36",
-    0x1200BF88: "TITLE75_NAME37",
-    0x1200BF89: "TITLE75_NAME38",
-    0x1200BF8A: "TITLE75_NAME39",
-    0x1200C004: "TITLE75_NAME40",
-    0x1200C005: "TITLE75_NAME41",
-    0x1200C006: "TITLE75_NAME42",
-    0x1200C007: "TITLE75_NAME43",
-    0x1200C008: "TITLE75_NAME44",
-    0x1200C009: "TITLE75_NAME45",
-    0x1200C00A: "TITLE75_NAME46",
-    0x1200C00B: "TITLE75_NAME47",
-    0x1200C00C: "TITLE75_NAME48",
-    0x1200C00D: "TITLE75_NAME49",
-    0x1200C087: "TITLE75_NAME50",
-    0x1200C088: "TITLE75_NAME51",
-    0x1200C089: "TITLE75_NAME52",
-    0x1200C08A: "TITLE75_NAME53",
-    0x1200C08B: "TITLE75_NAME54",
-    0x1200C08C: "TITLE75_NAME55",
-    0x1200C08D: "TITLE75_NAME56",
-    0x1200C08E: "TITLE75_NAME57",
-    0x120A4AC1: "R1_BIKE",
-    0x121CADED: "SOC_P_GREET_F",
-    0x1223506E: "USE_DUNK",
-    0x1230E751: "USE_ALARM",
-    0x1234B6C6: "AS_FI_OBJECTIVE",
-    0x124BF1F5: "N_RUSSELL",
-    0x124C1657: "TAG_BIG",
-    0x1252647D: "MGE2_SHORTWORDS",
-    0x1252E452: "TUT_GLHT01",
-    0x12554529: "MGBT_XSTART",
-    0x126869C7: "SP_MUSICSHIRT",
-    0x126CE82D: "FEST_CONTROLS",
-    0x12735B67: "4_G4_SEARCH",
-    0x1287E17D: "USE_GLUE",
-    0x1295157E: "R1_FOOT",
-    0x12997163: "3-01DA.SUB0001",
-    0x12997164: "3-01DA.SUB0002",
-    0x12997165: "3-01DA.SUB0003",
-    0x12997166: "3-01DA.SUB0004",
-    0x12997167: "3-01DA.SUB0005",
-    0x12997168: "3-01DA.SUB0006",
-    0x12997169: "3-01DA.SUB0007",
-    0x1299716A: "3-01DA.SUB0008",
-    0x1299716B: "3-01DA.SUB0009",
-    0x129971E5: "3-01DA.SUB0010",
-    0x129971E6: "3-01DA.SUB0011",
-    0x129971E7: "3-01DA.SUB0012",
-    0x129971E8: "3-01DA.SUB0013",
-    0x129971E9: "3-01DA.SUB0014",
-    0x129971EA: "3-01DA.SUB0015",
-    0x129971EB: "3-01DA.SUB0016",
-    0x129D78A7: "TUT_YBLIP1",
-    0x129D78A8: "TUT_YBLIP2",
-    0x129D78A9: "TUT_YBLIP3",
-    0x12A3FAE8: "SP_GYMDISGUISE",
-    0x12A64AE1: "5_03_AREAFAIL",
-    0x12A746A9: "TUT_CLASS01",
-    0x12A746AA: "TUT_CLASS02",
-    0x12A746AB: "TUT_CLASS03",
-    0x12A95D4A: "USE_HIDE",
-    0x12B53D02: "TITLE62_NAME0",
-    0x12B53D03: "TITLE62_NAME1",
-    0x12B53D04: "TITLE62_NAME2",
-    0x12B53D05: "TITLE62_NAME3",
-    0x12B53D06: "TITLE62_NAME4",
-    0x12B53D07: "TITLE62_NAME5",
-    0x12B53D08: "TITLE62_NAME6",
-    0x12B53D09: "TITLE62_NAME7",
-    0x12B53D0A: "TITLE62_NAME8",
-    0x12B53D0B: "TITLE62_NAME9",
-    0x12B8D602: "MGGE_LIBYA",
-    0x12BBCC10: "MRESPECT_BM5",
-    0x12BD1B3D: "MRESPECT_GM5",
-    0x12BD1CC6: "MRESPECT_GP5",
-    0x12BDE458: "MRESPECT_JM5",
-    0x12BDE5E1: "MRESPECT_JP5",
-    0x12BE38B9: "TITLE62_NAME10",
-    0x12BE38BA: "TITLE62_NAME11",
-    0x12BE38BB: "TITLE62_NAME12",
-    0x12BE38BC: "TITLE62_NAME13",
-    0x12BE38BD: "TITLE62_NAME14",
-    0x12BE38BE: "TITLE62_NAME15",
-    0x12BE38BF: "TITLE62_NAME16",
-    0x12BE38C0: "TITLE62_NAME17",
-    0x12BE38C1: "TITLE62_NAME18",
-    0x12BE38C2: "TITLE62_NAME19",
-    0x12BE393C: "TITLE62_NAME20",
-    0x12BE393D: "TITLE62_NAME21",
-    0x12BE393E: "TITLE62_NAME22",
-    0x12BE393F: "TITLE62_NAME23",
-    0x12BE3940: "TITLE62_NAME24",
-    0x12BE3941: "TITLE62_NAME25",
-    0x12BE3942: "TITLE62_NAME26",
-    0x12BE3943: "TITLE62_NAME27",
-    0x12BE3944: "TITLE62_NAME28",
-    0x12BE3945: "TITLE62_NAME29",
-    0x12BE39BF: "TITLE62_NAME30",
-    0x12BEF07C: "MRESPECT_NM5",
-    0x12BEF205: "MRESPECT_NP5",
-    0x12BF768E: "MRESPECT_PM5",
-    0x12BF7817: "MRESPECT_PP5",
-    0x12BF7DE7: "2_S05_RETEDNA",
-    0x12C29081: "3_02_UNLOCK",
-    0x12C5F702: "5_09_RESPECTD",
-    0x12C5F705: "5_09_RESPECTG",
-    0x12C5F708: "5_09_RESPECTJ",
-    0x12C5F70C: "5_09_RESPECTN",
-    0x12C5F70E: "5_09_RESPECTP",
-    0x12E5A1BA: "N_KIRBY",
-    0x13094CC7: "MEM_RSTRT",
-    0x13103DBD: "MG_GRASS_FE",
-    0x1315EE23: "MRESPECT_GFRIEND",
-    0x131B5243: "MGC_BASEBALL_TITLE",
-    0x133294CB: "USE_LIFT",
-    0x1332E164: "1_02A_SODAMACH",
-    0x13342B93: "USE_LOOK",
-    0x13354126: "TIME12",
-    0x133541AB: "TIME24",
-    0x133D9101: "SPRING",
-    0x133FB024: "N_MISSPETERS",
-    0x134F7E67: "1_04_TITLE",
-    0x135F7239: "AS_EP_FAIL",
-    0x13653D78: "SOC_GEN_REACTDONTHURT",
-    0x137664A2: "NAND_08_WII",
-    0x13796A18: "3-S11.SUB0001",
-    0x13796A19: "3-S11.SUB0002",
-    0x13796A1A: "3-S11.SUB0003",
-    0x13796A1B: "3-S11.SUB0004",
-    0x13796A1C: "3-S11.SUB0005",
-    0x13796A1D: "3-S11.SUB0006",
-    0x13796A1E: "3-S11.SUB0007",
-    0x13796A1F: "3-S11.SUB0008",
-    0x13796A20: "3-S11.SUB0009",
-    0x13796A9A: "3-S11.SUB0010",
-    0x13796A9B: "3-S11.SUB0011",
-    0x13796A9C: "3-S11.SUB0012",
-    0x13796A9D: "3-S11.SUB0013",
-    0x13796A9E: "3-S11.SUB0014",
-    0x13796A9F: "3-S11.SUB0015",
-    0x13796AA0: "3-S11.SUB0016",
-    0x13796AA1: "3-S11.SUB0017",
-    0x13796AA2: "3-S11.SUB0018",
-    0x13796AA3: "3-S11.SUB0019",
-    0x13796B1D: "3-S11.SUB0020",
-    0x13796B1E: "3-S11.SUB0021",
-    0x13796B1F: "3-S11.SUB0022",
-    0x13796B20: "3-S11.SUB0023",
-    0x13796B21: "3-S11.SUB0024",
-    0x13796B22: "3-S11.SUB0025",
-    0x13796B23: "3-S11.SUB0026",
-    0x13796B24: "3-S11.SUB0027",
-    0x13796B25: "3-S11.SUB0028",
-    0x1379A61A: "AS_JB_INTRO",
-    0x139B5252: "USE_OPEN",
-    0x139F761E: "TUT_CKOBJ1",
-    0x13AAAD4A: "MGE2_T12G01WORDS",
-    0x13AE3BCC: "CLT_BUYOFIT",
-    0x13AE68B1: "TITLE59_NUMNAMES",
-    0x13AF03B0: "MC_FOOTER",
-    0x13BA9F5A: "4_06_OPA_01",
-    0x13BA9F5B: "4_06_OPA_02",
-    0x13BA9F5D: "4_06_OPA_04",
-    0x13BA9F5E: "4_06_OPA_05",
-    0x13BE2B1F: "USE_PROP",
-    0x13C17336: "AS_CN_OBJCOUNT1",
-    0x13C82CAD: "1-06.SUB0001",
-    0x13C82CAE: "1-06.SUB0002",
-    0x13C82CAF: "1-06.SUB0003",
-    0x13C82CB0: "1-06.SUB0004",
-    0x13C82CB1: "1-06.SUB0005",
-    0x13C82CB2: "1-06.SUB0006",
-    0x13C82CB3: "1-06.SUB0007",
-    0x13C82CB4: "1-06.SUB0008",
-    0x13C82CB5: "1-06.SUB0009",
-    0x13C82D2F: "1-06.SUB0010",
-    0x13C82D30: "1-06.SUB0011",
-    0x13C82D31: "1-06.SUB0012",
-    0x13C82D32: "1-06.SUB0013",
-    0x13C82D33: "1-06.SUB0014",
-    0x13C82D34: "1-06.SUB0015",
-    0x13C82D35: "1-06.SUB0016",
-    0x13C82D36: "1-06.SUB0017",
-    0x13C82D37: "1-06.SUB0018",
-    0x13C82D38: "1-06.SUB0019",
-    0x13C82DB2: "1-06.SUB0020",
-    0x13C82DB3: "1-06.SUB0021",
-    0x13C82DB4: "1-06.SUB0022",
-    0x13C82DB5: "1-06.SUB0023",
-    0x13C82DB6: "1-06.SUB0024",
-    0x13C82DB7: "1-06.SUB0025",
-    0x13D06B8B: "FEPA_NPHOTO",
-    0x13DEA843: "5_09_OT_05",
-    0x13DEA844: "5_09_OT_06",
-    0x13DEA845: "5_09_OT_07",
-    0x13DEA847: "5_09_OT_09",
-    0x13DEA8C1: "5_09_OT_10",
-    0x13E2B895: "AS_RK_OBJCOUNT",
-    0x13EB680F: "3_01C_TITLE",
-    0x13EF6271: "FEO_RESETDEF",
-    0x13FF3A90: "4_06_OPC_01",
-    0x13FF3A92: "4_06_OPC_03",
-    0x13FF3A93: "4_06_OPC_04",
-    0x13FF3A95: "4_06_OPC_06",
-    0x14006558: "USE_RIDE",
-    0x140832D6: "N_MRHATTRICK",
-    0x141872CB: "R_SSMART",
-    0x14273FDC: "TITLE0",
-    0x14273FDD: "TITLE1",
-    0x14273FDE: "TITLE2",
-    0x14273FDF: "TITLE3",
-    0x14273FE0: "TITLE4",
-    0x14273FE1: "TITLE5",
-    0x14273FE2: "TITLE6",
-    0x14273FE3: "TITLE7",
-    0x14273FE4: "TITLE8",
-    0x14273FE5: "TITLE9",
-    0x142B1954: "GOTO_RACERICH1",
-    0x142B1955: "GOTO_RACERICH2",
-    0x143A6524: "BIKESTORE_TUT",
-    0x1442EBDB: "USE_TAKE",
-    0x144A7FE0: "N_MRSVENSON",
-    0x144B034A: "AS_JB_DROPPED",
-    0x14523E01: "TITLE22_NUMNAMES",
-    0x1465C03B: "C3_UNLOCK11_WII",
-    0x14769460: "4_05_MPASS01",
-    0x14803AF4: "UP_CHEM1",
-    0x14803AF5: "UP_CHEM2",
-    0x14803AF6: "UP_CHEM3",
-    0x14803AF7: "UP_CHEM4",
-    0x14803AF8: "UP_CHEM5",
-    0x14841EDA: "2_02_KLEPTONAME",
-    0x1485E7F2: "AS_SI_FAIL",
-    0x148FA509: "TAG_PREP_COMBO",
-    0x14A3B734: "BK_FRAME01D",
-    0x14A3B73E: "BK_FRAME01N",
-    0x14A3B7B7: "BK_FRAME02D",
-    0x14A3B7C1: "BK_FRAME02N",
-    0x14C2E846: "5_03_OPENDOOR",
-    0x14CBFFDB: "TITLE49_NAME0",
-    0x14E1F59C: "GKART_GO",
-    0x14FB452F: "CHAPT2TRANS_TITLE",
-    0x14FBDC32: "TUT_TARGET01",
-    0x1506BFBB: "1_02_GROUNDKICKS",
-    0x150C5971: "CLT_DM",
-    0x150C5E83: "CLT_NA",
-    0x150C5F92: "CLT_PJ",
-    0x1514E46E: "AS_LK_REPEAT",
-    0x15295022: "STO_FREEINVENTORYFULL",
-    0x15390D90: "SP_GOLDSUIT_H",
-    0x15390D94: "SP_GOLDSUIT_L",
-    0x15390D9C: "SP_GOLDSUIT_T",
-    0x153DC013: "MGA2_INSTRUCTIONS_RETURN_TO_GAME_TEXT",
-    0x153ED0C8: "MGA2_INSTRUCTIONS_BODY",
-    0x154027A3: "AS_HT_GETOFF",
-    0x155132A3: "3_S08_PCOUNT",
-    0x155C7F2F: "",
-    0x155C8E4B: "DT_GENERAL_01",
-    0x15627F67: "3-BD.SUB0001",
-    0x15627F68: "3-BD.SUB0002",
-    0x15627F69: "3-BD.SUB0003",
-    0x15627F6A: "3-BD.SUB0004",
-    0x15627F6B: "3-BD.SUB0005",
-    0x15627F6C: "3-BD.SUB0006",
-    0x15627F6D: "3-BD.SUB0007",
-    0x15627F6E: "3-BD.SUB0008",
-    0x15627F6F: "3-BD.SUB0009",
-    0x15627FE9: "3-BD.SUB0010",
-    0x15627FEA: "3-BD.SUB0011",
-    0x1564BFB4: "GIFT_GKART",
-    0x1565EC8A: "2-S07.SUB0001",
-    0x1565EC8B: "2-S07.SUB0002",
-    0x1565EC8C: "2-S07.SUB0003",
-    0x1565EC8D: "2-S07.SUB0004",
-    0x1565EC8E: "2-S07.SUB0005",
-    0x1565EC8F: "2-S07.SUB0006",
-    0x1565EC90: "2-S07.SUB0007",
-    0x1565EC91: "2-S07.SUB0008",
-    0x1565EC92: "2-S07.SUB0009",
-    0x1565ED0C: "2-S07.SUB0010",
-    0x1565ED0D: "2-S07.SUB0011",
-    0x156CE9D6: "N_OSBOURNE",
-    0x1573EAFC: "FT_001",
-    0x1573EAFD: "FT_002",
-    0x1573EAFE: "FT_003",
-    0x1573EAFF: "FT_004",
-    0x1573EB00: "FT_005",
-    0x1573EB01: "FT_006",
-    0x1573EB02: "FT_007",
-    0x1573EB03: "FT_008",
-    0x1573EB04: "FT_009",
-    0x1573EB7E: "FT_010",
-    0x1573EB7F: "FT_011",
-    0x1573EB80: "FT_012",
-    0x1573EB81: "FT_013",
-    0x1573EB82: "FT_014",
-    0x1573EB83: "FT_015",
-    0x1573EB84: "FT_016",
-    0x1573EB85: "FT_017",
-    0x1573EB86: "FT_018",
-    0x1573EB87: "FT_019",
-    0x1573EC01: "FT_020",
-    0x1573EC02: "FT_021",
-    0x1573EC03: "FT_022",
-    0x1573EC04: "FT_023",
-    0x1573EC05: "FT_024",
-    0x1573EC06: "FT_025",
-    0x1573EC07: "FT_026",
-    0x1573EC08: "FT_027",
-    0x1573EC09: "FT_028",
-    0x1573EC0A: "FT_029",
-    0x1573EC84: "FT_030",
-    0x1573EC85: "FT_031",
-    0x1573EC86: "FT_032",
-    0x1573EC87: "FT_033",
-    0x1573EC88: "FT_034",
-    0x1573EC89: "FT_035",
-    0x1573EC8A: "FT_036",
-    0x1573EC8B: "FT_037",
-    0x1573EC8C: "FT_038",
-    0x1573EC8D: "FT_039",
-    0x1573ED07: "FT_040",
-    0x1573ED08: "FT_041",
-    0x1573ED09: "FT_042",
-    0x1573ED0A: "FT_043",
-    0x1573ED0B: "FT_044",
-    0x1573ED0C: "FT_045",
-    0x1573ED0D: "FT_046",
-    0x1573ED0E: "FT_047",
-    0x1573ED0F: "FT_048",
-    0x1573ED10: "FT_049",
-    0x1573ED8A: "FT_050",
-    0x1573ED8B: "FT_051",
-    0x1573ED8C: "FT_052",
-    0x1573ED8D: "FT_053",
-    0x1573ED8E: "FT_054",
-    0x1573ED8F: "FT_055",
-    0x1573ED90: "FT_056",
-    0x1573ED91: "FT_057",
-    0x1573ED92: "FT_058",
-    0x1573ED93: "FT_059",
-    0x1573EE0D: "FT_060",
-    0x1573EE0E: "FT_061",
-    0x1573EE0F: "FT_062",
-    0x1573EE10: "FT_063",
-    0x1573EE11: "FT_064",
-    0x1573EE12: "FT_065",
-    0x1573EE13: "FT_066",
-    0x1573EE14: "FT_067",
-    0x1573EE15: "FT_068",
-    0x1573EE16: "FT_069",
-    0x1573EE90: "FT_070",
-    0x1573EE91: "FT_071",
-    0x1573EE92: "FT_072",
-    0x1573EE93: "FT_073",
-    0x1573EE94: "FT_074",
-    0x1573EE95: "FT_075",
-    0x1573EE96: "FT_076",
-    0x1573EE97: "FT_077",
-    0x1573EE98: "FT_078",
-    0x1573EE99: "FT_079",
-    0x1573EF13: "FT_080",
-    0x1573EF14: "FT_081",
-    0x1573EF15: "FT_082",
-    0x1573EF16: "FT_083",
-    0x1573EF17: "FT_084",
-    0x1573EF18: "FT_085",
-    0x1573EF19: "FT_086",
-    0x1573EF1A: "FT_087",
-    0x1573EF1B: "FT_088",
-    0x1573EF1C: "FT_089",
-    0x1573EF96: "FT_090",
-    0x1573EF97: "FT_091",
-    0x1573EF98: "FT_092",
-    0x1573EF99: "FT_093",
-    0x1573EF9A: "FT_094",
-    0x1573EF9B: "FT_095",
-    0x1573EF9C: "FT_096",
-    0x1573EF9D: "FT_097",
-    0x1573EF9E: "FT_098",
-    0x1573EF9F: "FT_099",
-    0x15742E04: "FT_100",
-    0x15742E05: "FT_101",
-    0x15742E06: "FT_102",
-    0x15742E07: "FT_103",
-    0x15742E08: "FT_104",
-    0x15742E09: "FT_105",
-    0x15742E0A: "FT_106",
-    0x15742E0B: "FT_107",
-    0x15742E0C: "FT_108",
-    0x15742E0D: "FT_109",
-    0x15742E87: "FT_110",
-    0x15742E88: "FT_111",
-    0x15742E89: "FT_112",
-    0x15742E8A: "FT_113",
-    0x15742E8B: "FT_114",
-    0x15742E8C: "FT_115",
-    0x15742E8D: "FT_116",
-    0x15742E8E: "FT_117",
-    0x15742E8F: "FT_118",
-    0x15742E90: "FT_119",
-    0x157C7A62: "S_TAUNT_INIT_GIRL_01",
-    0x1585AF16: "3_R09_AROBJ",
-    0x158713CB: "DESC_1",
-    0x158713CC: "DESC_2",
-    0x158713CD: "DESC_3",
-    0x158713CE: "DESC_4",
-    0x158713CF: "DESC_5",
-    0x158713D0: "DESC_6",
-    0x158713D1: "DESC_7",
-    0x158713D2: "DESC_8",
-    0x158713D3: "DESC_9",
-    0x15882E38: "AS_LK_COMPLETE",
-    0x1593EFAD: "2-S05C.SUB0001",
-    0x1593EFAE: "2-S05C.SUB0002",
-    0x1593EFAF: "2-S05C.SUB0003",
-    0x1593EFB0: "2-S05C.SUB0004",
-    0x1593EFB1: "2-S05C.SUB0005",
-    0x15975883: "2-03B.SUB0001",
-    0x15975884: "2-03B.SUB0002",
-    0x15975885: "2-03B.SUB0003",
-    0x15975886: "2-03B.SUB0004",
-    0x15975887: "2-03B.SUB0005",
-    0x15975888: "2-03B.SUB0006",
-    0x15975889: "2-03B.SUB0007",
-    0x1597588A: "2-03B.SUB0008",
-    0x1597588B: "2-03B.SUB0009",
-    0x15975905: "2-03B.SUB0010",
-    0x15975906: "2-03B.SUB0011",
-    0x15975907: "2-03B.SUB0012",
-    0x15975908: "2-03B.SUB0013",
-    0x15975909: "2-03B.SUB0014",
-    0x1597590A: "2-03B.SUB0015",
-    0x1597590B: "2-03B.SUB0016",
-    0x1597590C: "2-03B.SUB0017",
-    0x1597590D: "2-03B.SUB0018",
-    0x1597590E: "2-03B.SUB0019",
-    0x15975988: "2-03B.SUB0020",
-    0x15975989: "2-03B.SUB0021",
-    0x1597598A: "2-03B.SUB0022",
-    0x1597598B: "2-03B.SUB0023",
-    0x1597598C: "2-03B.SUB0024",
-    0x1597598D: "2-03B.SUB0025",
-    0x15A25417: "AS_LK_RETURN",
-    0x15A7C3E2: "3_01D_PHOTO_01",
-    0x15A7C3E3: "3_01D_PHOTO_02",
-    0x15A7C3E4: "3_01D_PHOTO_03",
-    0x15A7C3E5: "3_01D_PHOTO_04",
-    0x15A7C3E6: "3_01D_PHOTO_05",
-    0x15A7C3E7: "3_01D_PHOTO_06",
-    0x15A7C3E8: "3_01D_PHOTO_07",
-    0x15AAF59D: "AS_GE_OBJECTIVE",
-    0x15B67175: "AS_BH_COMPLETE",
-    0x15BE9D5C: "",
-    0x15C4969B: "MG_ENGLISH_FE",
-    0x15C8F756: "MGB2_RAT_10",
-    0x15C8F757: "MGB2_RAT_11",
-    0x15C8F758: "MGB2_RAT_12",
-    0x15C8F759: "MGB2_RAT_13",
-    0x15C8F75A: "MGB2_RAT_14",
-    0x15C8F75B: "MGB2_RAT_15",
-    0x15C8F75C: "MGB2_RAT_16",
-    0x15D00442: "AS_PB_FAIL",
-    0x15E2ECDD: "TUT_SKATE01_DI",
-    0x15E93493: "TITLE34_NAME0",
-    0x15E93494: "TITLE34_NAME1",
-    0x15E93495: "TITLE34_NAME2",
-    0x15FADCFA: "1_05_FAIL_01",
-    0x15FADCFB: "1_05_FAIL_02",
-    0x15FADCFC: "1_05_FAIL_03",
-    0x16091345: "SP_MBAND_FT",
-    0x1610740A: "REVERSAL_SQUARE",
-    0x1615BB72: "N_CONSTANTINOS",
-    0x16196A54: "MRESPECT_BM10",
-    0x163511E0: "SOC_GEN_DISMISSSHRUG",
-    0x163F3266: "N_MASCOT",
-    0x1645AC10: "RPG_AS",
-    0x1645AC8B: "RPG_BK",
-    0x1645AC93: "RPG_BS",
-    0x1645AE90: "RPG_FD",
-    0x1645AEA0: "RPG_FT",
-    0x1645B22F: "RPG_MN",
-    0x1645B547: "RPG_ST",
-    0x1651112D: "FEYB_CONTROLS",
-    0x1651F090: "MGS2_NEGNUM",
-    0x16551B41: "N_LIGHTNING",
-    0x165E0612: "MRESPECT_DM25",
-    0x165ECF2D: "MRESPECT_DP25",
-    0x16661DBB: "MGPH_RUSSEL",
-    0x1668FDE9: "N_MRCARMICHAEL",
-    0x16698CD6: "MGT_MUSIC_FE",
-    0x16792A4E: "TITLE72_NUMNAMES",
-    0x16B583CC: "N_MRSLISBURN",
-    0x16C4EE5B: "MRESPECT_GM10",
-    0x16C4EEDE: "MRESPECT_GM20",
-    0x16C4EEE3: "MRESPECT_GM25",
-    0x16C4F172: "MRESPECT_GM75",
-    0x16C5B7FE: "MRESPECT_GP25",
-    0x16C5B982: "MRESPECT_GP50",
-    0x16C83B18: "DBH_BACK",
-    0x16F1F01A: "N_DAMON",
-    0x16F338AB: "N_DARBY",
-    0x16F4485E: "N_DAVIS",
-    0x16F78EA5: "CHAPT4TRANS_BLANK",
-    0x17044053: "CLT_OFITITEM_LA",
-    0x17044365: "CLT_OFITITEM_RA",
-    0x170444EF: "CLT_OFITITEM_UB",
-    0x17088771: "CHAPT3TRANS_NAME",
-    0x170B4535: "AS_TR_COMPLETE",
-    0x170E0C5A: "4_06_OP_F_HACK",
-    0x171001D8: "3_S08_SCENE_01",
-    0x171001D9: "3_S08_SCENE_02",
-    0x17158D3A: "3-01AA.SUB0001",
-    0x17158D3B: "3-01AA.SUB0002",
-    0x17158D3C: "3-01AA.SUB0003",
-    0x17158D3D: "3-01AA.SUB0004",
-    0x17158D3E: "3-01AA.SUB0005",
-    0x17158D3F: "3-01AA.SUB0006",
-    0x17158D40: "3-01AA.SUB0007",
-    0x17158D41: "3-01AA.SUB0008",
-    0x17158D42: "3-01AA.SUB0009",
-    0x17158DBC: "3-01AA.SUB0010",
-    0x17158DBD: "3-01AA.SUB0011",
-    0x17158DBE: "3-01AA.SUB0012",
-    0x17158DBF: "3-01AA.SUB0013",
-    0x17158DC0: "3-01AA.SUB0014",
-    0x17158DC1: "3-01AA.SUB0015",
-    0x17158DC2: "3-01AA.SUB0016",
-    0x17158DC3: "3-01AA.SUB0017",
-    0x17158DC4: "3-01AA.SUB0018",
-    0x17158DC5: "3-01AA.SUB0019",
-    0x17158E3F: "3-01AA.SUB0020",
-    0x17158E40: "3-01AA.SUB0021",
-    0x17158E41: "3-01AA.SUB0022",
-    0x17158E42: "3-01AA.SUB0023",
-    0x17158E43: "3-01AA.SUB0024",
-    0x17158E44: "3-01AA.SUB0025",
-    0x17158E45: "3-01AA.SUB0026",
-    0x17158E46: "3-01AA.SUB0027",
-    0x17158E47: "3-01AA.SUB0028",
-    0x17158E48: "3-01AA.SUB0029",
-    0x17158EC2: "3-01AA.SUB0030",
-    0x17158EC3: "3-01AA.SUB0031",
-    0x17158EC4: "3-01AA.SUB0032",
-    0x17158EC5: "3-01AA.SUB0033",
-    0x17158EC6: "3-01AA.SUB0034",
-    0x17158EC7: "3-01AA.SUB0035",
-    0x172BD72C: "MRESPECT_JM10",
-    0x172BD7AF: "MRESPECT_JM20",
-    0x172BDA43: "MRESPECT_JM75",
-    0x172CA047: "MRESPECT_JP10",
-    0x172CA04C: "MRESPECT_JP15",
-    0x172CA2D6: "MRESPECT_JP60",
-    0x173B22AD: "S_TAUNT_INIT_NERD_01",
-    0x173BFF07: "FUN_MTR_REAPER",
-    0x175241D6: "CLOTHING_MODEL",
-    0x17539CCD: "5-B.SUB0001",
-    0x17539CCE: "5-B.SUB0002",
-    0x17539CCF: "5-B.SUB0003",
-    0x17539CD0: "5-B.SUB0004",
-    0x17539CD1: "5-B.SUB0005",
-    0x17539CD2: "5-B.SUB0006",
-    0x17539CD3: "5-B.SUB0007",
-    0x17539CD4: "5-B.SUB0008",
-    0x17539CD5: "5-B.SUB0009",
-    0x17545FB5: "1_02_WII_FTUT1",
-    0x17545FB6: "1_02_WII_FTUT2",
-    0x17545FB7: "1_02_WII_FTUT3",
-    0x17545FB8: "1_02_WII_FTUT4",
-    0x17545FB9: "1_02_WII_FTUT5",
-    0x17545FBA: "1_02_WII_FTUT6",
-    0x17545FBB: "1_02_WII_FTUT7",
-    0x17545FBC: "1_02_WII_FTUT8",
-    0x17545FBD: "1_02_WII_FTUT9",
-    0x175C9FCC: "5_05_TITLE",
-    0x175E19D7: "MGA2_INSTRUCTIONS_FREEZE_DESC",
-    0x1762F552: "W_BSCHOOL",
-    0x1768C592: "5_09_OSPRAY",
-    0x177300CC: "MC2P_GETREADY",
-    0x177542F5: "N_MRSMITH",
-    0x177B6917: "N_DENNY",
-    0x17821D45: "MGGE_ARIZONA",
-    0x178D1E91: "P_SPIKY_01",
-    0x178D1E92: "P_SPIKY_02",
-    0x178D1E93: "P_SPIKY_03",
-    0x178D1E94: "P_SPIKY_04",
-    0x179A3FDC: "MGGE_EGYPT",
-    0x17A1187C: "1_06_GARY",
-    0x17AAE539: "AS_GJ_FAIL",
-    0x17AF4415: "ARCADE_HIGHSCORE",
-    0x17B3B856: "C2_JOCKBO",
-    0x17B4CA01: "4_B2_01",
-    0x17B510AF: "MRESPECT_NM75",
-    0x17B5D6B3: "MRESPECT_NP10",
-    0x17B5D6B8: "MRESPECT_NP15",
-    0x17B5D736: "MRESPECT_NP20",
-    0x17B5D8BF: "MRESPECT_NP50",
-    0x17B5D942: "MRESPECT_NP60",
-    0x17B6FF2D: "2_G2_GSTRING",
-    0x17C5DAE2: "3_R05B_FAIL_01",
-    0x17C5DAE3: "3_R05B_FAIL_02",
-    0x17CF8A6F: "SP_NASCAR_FT",
-    0x17D0C4BD: "AS_MA_BEENHIT",
-    0x17D1E1EA: "AS_GJ_OBJECTIVE",
-    0x17DFE9C7: "DBH_JUMP",
-    0x17E37A7D: "MGPH_SLAWTER",
-    0x17F440D7: "MGPH_MAILBOX",
-    0x17F47555: "BB_NMSGS",
-    0x17F9A8CE: "MRESPECT_PM10",
-    0x17F9A8D3: "MRESPECT_PM15",
-    0x17F9ABE5: "MRESPECT_PM75",
-    0x17FA71EE: "MRESPECT_PP15",
-    0x17FA7478: "MRESPECT_PP60",
-    0x17FBD3B7: "N_JOHNNY",
-    0x17FCFDBC: "MG_SHOOTING",
-    0x18010176: "4_04_FATTY",
-    0x18065BF7: "3_S10_TITLE",
-    0x180B6853: "AS_CT_FAIL",
-    0x180F9065: "2-S02.SUB0001",
-    0x180F9066: "2-S02.SUB0002",
-    0x180F9067: "2-S02.SUB0003",
-    0x180F9068: "2-S02.SUB0004",
-    0x180F9069: "2-S02.SUB0005",
-    0x180F906A: "2-S02.SUB0006",
-    0x180F906B: "2-S02.SUB0007",
-    0x180F906C: "2-S02.SUB0008",
-    0x180F906D: "2-S02.SUB0009",
-    0x180F90E7: "2-S02.SUB0010",
-    0x180F90E8: "2-S02.SUB0011",
-    0x180F90E9: "2-S02.SUB0012",
-    0x180F90EA: "2-S02.SUB0013",
-    0x180F90EB: "2-S02.SUB0014",
-    0x180F90EC: "2-S02.SUB0015",
-    0x180F90ED: "2-S02.SUB0016",
-    0x180F90EE: "2-S02.SUB0017",
-    0x180F90EF: "2-S02.SUB0018",
-    0x180F90F0: "2-S02.SUB0019",
-    0x180F916A: "2-S02.SUB0020",
-    0x180F916B: "2-S02.SUB0021",
-    0x180F916C: "2-S02.SUB0022",
-    0x180F916D: "2-S02.SUB0023",
-    0x180F916E: "2-S02.SUB0024",
-    0x180F916F: "2-S02.SUB0025",
-    0x180F9170: "2-S02.SUB0026",
-    0x180F9171: "2-S02.SUB0027",
-    0x18167159: "CRIME_OBSTRUCTING",
-    0x181B8566: "TITLE80_NAME0",
-    0x181B8567: "TITLE80_NAME1",
-    0x181B8DCA: "MGGE_MARTINIQUE",
-    0x1820431A: "1_04_BURTON_KO",
-    0x182938F3: "USE_LOCKERPLANT",
-    0x182A8488: "TITLE56_NUMNAMES",
-    0x182FEB50: "SP_PITHHELMET",
-    0x183D6A67: "2_GN_SCENE_01",
-    0x1844E09C: "S_ALLY",
-    0x184D7560: "D_CAMERA",
-    0x184DCA40: "DIBUTTON_JOYPOV_RIGHT",
-    0x1868D1CB: "6_01_TITLE",
-    0x186D34DF: "MGCE_T4GROUPS",
-    0x187FAEF9: "MGM2_T5GROUPS",
-    0x1883258F: "C2_PREPGORD",
-    0x18851D1E: "N_EUNICE",
-    0x188DCB5E: "MAP_GNOMES",
-    0x189162FA: "AS_LK_OBJECTIVE",
-    0x1891CF29: "MGGE_KAZAKSTAN",
-    0x1894E017: "1_06_NONE",
-    0x1896686B: "NAND_01_WII",
-    0x18A74A88: "MGPH_HELICOPTER",
-    0x18A881CA: "DBH_PASS",
-    0x18ADEC14: "MGMA_T3GROUPS",
-    0x18BF5F00: "MGMA_TIERS",
-    0x18D6E005: "1_06_PETE",
-    0x18D7023A: "3_05_OPERF",
-    0x18D92655: "TITLE7_NAME0",
-    0x18D92656: "TITLE7_NAME1",
-    0x18EA9D28: "MGGE_LOUISIANA",
-    0x1906789F: "MGC2P_INST01",
-    0x190678A0: "MGC2P_INST02",
-    0x190678A1: "MGC2P_INST03",
-    0x1908091A: "1_02_HEADBUTT",
-    0x1916164E: "P_LAWN_FAIL",
-    0x192D6D1C: "MGGE_ELSALVADOR",
-    0x1930462A: "S_TAUNT_INIT_GEN_01",
-    0x193350DD: "P_TAPER",
-    0x1936E60D: "AS_SF_ACTION",
-    0x1936F54B: "DBH_TUT1",
-    0x1936F54C: "DBH_TUT2",
-    0x1936F54D: "DBH_TUT3",
-    0x1936F54E: "DBH_TUT4",
-    0x1936F54F: "DBH_TUT5",
-    0x1941CBDD: "STATUS_PREPPIES",
-    0x1953BD30: "SCHOOL_HALLWAYS",
-    0x1960E708: "PARAM1",
-    0x1964BA6E: "CLT_OLY_OUTFIT",
-    0x1965B2CB: "5_G5_FAIL_01",
-    0x197C9CCA: "MGGE_BRITISHCOLUMBIA",
-    0x197DFB5F: "AS_YEARBK_REWARD",
-    0x197F7C87: "2-05.SUB0001",
-    0x197F7C88: "2-05.SUB0002",
-    0x197F7C89: "2-05.SUB0003",
-    0x197F7C8A: "2-05.SUB0004",
-    0x197F7C8B: "2-05.SUB0005",
-    0x197F7C8C: "2-05.SUB0006",
-    0x197F7C8D: "2-05.SUB0007",
-    0x197F7C8E: "2-05.SUB0008",
-    0x197F7C8F: "2-05.SUB0009",
-    0x197F7D09: "2-05.SUB0010",
-    0x197F7D0A: "2-05.SUB0011",
-    0x197F7D0B: "2-05.SUB0012",
-    0x197F7D0C: "2-05.SUB0013",
-    0x197F7D0D: "2-05.SUB0014",
-    0x197F7D0E: "2-05.SUB0015",
-    0x197F7D0F: "2-05.SUB0016",
-    0x197F7D10: "2-05.SUB0017",
-    0x197F7D11: "2-05.SUB0018",
-    0x197F7D12: "2-05.SUB0019",
-    0x197F7D8C: "2-05.SUB0020",
-    0x197F7D8D: "2-05.SUB0021",
-    0x197F7D8E: "2-05.SUB0022",
-    0x198A51D1: "ASYLUM",
-    0x199A9C93: "AS_IP_OBJCOUNT",
-    0x199CA99F: "SOUND_INIT_FAILED_CAPTION",
-    0x19A1941B: "SP_BANDSHIRT",
-    0x19AAB1E6: "AS_CN_REPEAT",
-    0x19C9A96F: "BC_BAN_BIKE",
-    0x19CDB70C: "R_SSLEEVES1",
-    0x19CDB70D: "R_SSLEEVES2",
-    0x19CDB70F: "R_SSLEEVES4",
-    0x19CDB710: "R_SSLEEVES5",
-    0x19CDB711: "R_SSLEEVES6",
-    0x19D98BA1: "RARC_COPR",
-    0x19DD8432: "TITLE87_NAME10",
-    0x19DFBAF6: "TUT_EUNSOC01",
-    0x19DFBAF8: "TUT_EUNSOC03",
-    0x19F0E5AB: "1_05_HEALTHBAR",
-    0x19F24603: "FE_TIME_SEC_FE",
-    0x1A0C0AC1: "C4_FOOTER",
-    0x1A162566: "1_07_UNLOCK",
-    0x1A1DDD88: "RARC_END0",
-    0x1A1DDD89: "RARC_END1",
-    0x1A1E1F6A: "AS_IP_OBJCOUNT1",
-    0x1A2D7ED0: "1-02C.SUB0001",
-    0x1A2D7ED1: "1-02C.SUB0002",
-    0x1A2D7ED2: "1-02C.SUB0003",
-    0x1A2D7ED3: "1-02C.SUB0004",
-    0x1A2D7ED4: "1-02C.SUB0005",
-    0x1A2D7ED5: "1-02C.SUB0006",
-    0x1A2D7ED6: "1-02C.SUB0007",
-    0x1A2D7ED7: "1-02C.SUB0008",
-    0x1A2D7ED8: "1-02C.SUB0009",
-    0x1A2D7F52: "1-02C.SUB0010",
-    0x1A2D7F53: "1-02C.SUB0011",
-    0x1A2D7F54: "1-02C.SUB0012",
-    0x1A2D7F55: "1-02C.SUB0013",
-    0x1A2D7F56: "1-02C.SUB0014",
-    0x1A2D7F57: "1-02C.SUB0015",
-    0x1A2D7F58: "1-02C.SUB0016",
-    0x1A2D7F59: "1-02C.SUB0017",
-    0x1A2F4F7E: "ACCEPT_STYLE",
-    0x1A32483F: "TITLE67_NAME0",
-    0x1A324840: "TITLE67_NAME1",
-    0x1A36A329: "1_08_STINKBOMBS",
-    0x1A38218F: "AS_CN_RETURN",
-    0x1A4900BE: "MGPH_GREMLINS",
-    0x1A4AF913: "1_02A_CLOTHOBJ",
-    0x1A4C3598: "MC_BEGIN",
-    0x1A622C26: "R_BOOTS2",
-    0x1A622C27: "R_BOOTS3",
-    0x1A65956C: "AS_PL_ACTION",
-    0x1A6CADA8: "MGCE_T4G01WORDS",
-    0x1A79DC22: "AS_SD_COMPLETE",
-    0x1A7D71AD: "CRIME_PROPBROKEN",
-    0x1A7E86E3: "TPM_QUITCURRENTC",
-    0x1A8AA84A: "MGGE_FOOTER",
-    0x1A8AF416: "RESET_DINPUT",
-    0x1A8D690E: "MGPH_BIOROOM",
-    0x1A9A0838: "1-1-1.SUB0001",
-    0x1A9A0839: "1-1-1.SUB0002",
-    0x1A9A083A: "1-1-1.SUB0003",
-    0x1A9A083B: "1-1-1.SUB0004",
-    0x1A9A083C: "1-1-1.SUB0005",
-    0x1A9A083D: "1-1-1.SUB0006",
-    0x1A9A083E: "1-1-1.SUB0007",
-    0x1A9A083F: "1-1-1.SUB0008",
-    0x1A9A0840: "1-1-1.SUB0009",
-    0x1A9A08BA: "1-1-1.SUB0010",
-    0x1A9A08BB: "1-1-1.SUB0011",
-    0x1A9A08BC: "1-1-1.SUB0012",
-    0x1A9A08BD: "1-1-1.SUB0013",
-    0x1A9A08BE: "1-1-1.SUB0014",
-    0x1A9A08BF: "1-1-1.SUB0015",
-    0x1A9A08C0: "1-1-1.SUB0016",
-    0x1A9A08C1: "1-1-1.SUB0017",
-    0x1A9A08C2: "1-1-1.SUB0018",
-    0x1A9A08C3: "1-1-1.SUB0019",
-    0x1A9A093D: "1-1-1.SUB0020",
-    0x1A9C16AD: "FEI_SEL_GIFTS",
-    0x1AAC3BE9: "AS_LK_FAIL",
-    0x1AB2B022: "MGB2_PIG_0",
-    0x1AB2B023: "MGB2_PIG_1",
-    0x1AB2B024: "MGB2_PIG_2",
-    0x1AB2B025: "MGB2_PIG_3",
-    0x1AB2B026: "MGB2_PIG_4",
-    0x1AB2B027: "MGB2_PIG_5",
-    0x1AB2B028: "MGB2_PIG_6",
-    0x1AB2B029: "MGB2_PIG_7",
-    0x1AB2B02A: "MGB2_PIG_8",
-    0x1AB2B02B: "MGB2_PIG_9",
-    0x1AB97AEE: "2_04_UNLOCK",
-    0x1ABEA0DA: "FE_STATUST",
-    0x1ABFE5FD: "MC2P_JIMMYWIN",
-    0x1ACC3E84: "6_B_MOBJ_01",
-    0x1ACC3E85: "6_B_MOBJ_02",
-    0x1ACC89A4: "1_09_TITLE",
-    0x1AD39666: "5_09_PHOTOHERE",
-    0x1ADC20CB: "TUT_NODRESS01",
-    0x1AE58C54: "FESZ_WR_S",
-    0x1AF6BA19: "UH_PHOTOGRAPHY",
-    0x1B0E4790: "RARC_LOSE",
-    0x1B1396E6: "DPADD_VEHICLE",
-    0x1B16E6BA: "ARCADE_FENDINST",
-    0x1B21BB10: "AS_SA_RETURN",
-    0x1B23085F: "STO_ACCEPTEXIT",
-    0x1B2C843B: "CLT_OUTFIT",
-    0x1B30B3FE: "MGT_CHEM",
-    0x1B34440B: "DIBUTTON_10",
-    0x1B34440C: "DIBUTTON_11",
-    0x1B34440D: "DIBUTTON_12",
-    0x1B34440E: "DIBUTTON_13",
-    0x1B34440F: "DIBUTTON_14",
-    0x1B344410: "DIBUTTON_15",
-    0x1B344411: "DIBUTTON_16",
-    0x1B344412: "DIBUTTON_17",
-    0x1B344413: "DIBUTTON_18",
-    0x1B344414: "DIBUTTON_19",
-    0x1B34448E: "DIBUTTON_20",
-    0x1B34448F: "DIBUTTON_21",
-    0x1B344490: "DIBUTTON_22",
-    0x1B344491: "DIBUTTON_23",
-    0x1B344492: "DIBUTTON_24",
-    0x1B344493: "DIBUTTON_25",
-    0x1B344494: "DIBUTTON_26",
-    0x1B344495: "DIBUTTON_27",
-    0x1B344496: "DIBUTTON_28",
-    0x1B344497: "DIBUTTON_29",
-    0x1B344511: "DIBUTTON_30",
-    0x1B344512: "DIBUTTON_31",
-    0x1B344513: "DIBUTTON_32",
-    0x1B344514: "DIBUTTON_33",
-    0x1B344515: "DIBUTTON_34",
-    0x1B344516: "DIBUTTON_35",
-    0x1B344517: "DIBUTTON_36",
-    0x1B344518: "DIBUTTON_37",
-    0x1B344519: "DIBUTTON_38",
-    0x1B34451A: "DIBUTTON_39",
-    0x1B344594: "DIBUTTON_40",
-    0x1B344595: "DIBUTTON_41",
-    0x1B344596: "DIBUTTON_42",
-    0x1B344597: "DIBUTTON_43",
-    0x1B344598: "DIBUTTON_44",
-    0x1B344599: "DIBUTTON_45",
-    0x1B34459A: "DIBUTTON_46",
-    0x1B34459B: "DIBUTTON_47",
-    0x1B34459C: "DIBUTTON_48",
-    0x1B34459D: "DIBUTTON_49",
-    0x1B344617: "DIBUTTON_50",
-    0x1B344618: "DIBUTTON_51",
-    0x1B344619: "DIBUTTON_52",
-    0x1B34461A: "DIBUTTON_53",
-    0x1B34461B: "DIBUTTON_54",
-    0x1B34461C: "DIBUTTON_55",
-    0x1B34461D: "DIBUTTON_56",
-    0x1B34461E: "DIBUTTON_57",
-    0x1B34461F: "DIBUTTON_58",
-    0x1B344620: "DIBUTTON_59",
-    0x1B34469A: "DIBUTTON_60",
-    0x1B34469B: "DIBUTTON_61",
-    0x1B34469C: "DIBUTTON_62",
-    0x1B34469D: "DIBUTTON_63",
-    0x1B34469E: "DIBUTTON_64",
-    0x1B34469F: "DIBUTTON_65",
-    0x1B3446A0: "DIBUTTON_66",
-    0x1B3446A1: "DIBUTTON_67",
-    0x1B3446A2: "DIBUTTON_68",
-    0x1B3446A3: "DIBUTTON_69",
-    0x1B34471D: "DIBUTTON_70",
-    0x1B34471E: "DIBUTTON_71",
-    0x1B34471F: "DIBUTTON_72",
-    0x1B344720: "DIBUTTON_73",
-    0x1B344721: "DIBUTTON_74",
-    0x1B344722: "DIBUTTON_75",
-    0x1B344723: "DIBUTTON_76",
-    0x1B344724: "DIBUTTON_77",
-    0x1B344725: "DIBUTTON_78",
-    0x1B344726: "DIBUTTON_79",
-    0x1B3447A0: "DIBUTTON_80",
-    0x1B3447A1: "DIBUTTON_81",
-    0x1B3447A2: "DIBUTTON_82",
-    0x1B3447A3: "DIBUTTON_83",
-    0x1B3447A4: "DIBUTTON_84",
-    0x1B3447A5: "DIBUTTON_85",
-    0x1B3447A6: "DIBUTTON_86",
-    0x1B3447A7: "DIBUTTON_87",
-    0x1B3447A8: "DIBUTTON_88",
-    0x1B3447A9: "DIBUTTON_89",
-    0x1B344823: "DIBUTTON_90",
-    0x1B344824: "DIBUTTON_91",
-    0x1B344825: "DIBUTTON_92",
-    0x1B344826: "DIBUTTON_93",
-    0x1B344827: "DIBUTTON_94",
-    0x1B344828: "DIBUTTON_95",
-    0x1B344829: "DIBUTTON_96",
-    0x1B34482A: "DIBUTTON_97",
-    0x1B34482B: "DIBUTTON_98",
-    0x1B34482C: "DIBUTTON_99",
-    0x1B36D3B8: "MGT_MUSIC",
-    0x1B3A5C8C: "TUT_PHOTO101",
-    0x1B3A5C8D: "TUT_PHOTO102",
-    0x1B3A9F95: "TUT_PHOTO201",
-    0x1B3A9F96: "TUT_PHOTO202",
-    0x1B3A9F97: "TUT_PHOTO203",
-    0x1B3A9F98: "TUT_PHOTO204",
-    0x1B3B9741: "INERDS",
-    0x1B401236: "AS_CP_COMPLETE",
-    0x1B4CEB0D: "3_02_OUTOFTIME",
-    0x1B4F7CF7: "TITLE52_NAME0",
-    0x1B4F7CF8: "TITLE52_NAME1",
-    0x1B52E349: "RARC_NOTE",
-    0x1B53E654: "MP_MGL2_OBJ",
-    0x1B5B063C: "5_09_OGETHALL",
-    0x1B5C8922: "MC2P_PERFECT",
-    0x1B60DC31: "FEI_CTL_NCHS",
-    0x1B676E7B: "BIKE_SHOP_RICH",
-    0x1B71C43C: "RARC_OBJ0",
-    0x1B71C43D: "RARC_OBJ1",
-    0x1B76FE83: "RARC_OVER",
-    0x1B8E08A5: "2_06_STEAL_BIKE",
-    0x1B9018FF: "SOC_GEN_ANGRYSHOVE",
-    0x1B9BD37F: "GRAF_ATTACK",
-    0x1BA5190E: "MC_BONUS",
-    0x1BB036E2: "FE_TIME_SEP_FE",
-    0x1BC78F82: "FEPA_CONTROLS_D",
-    0x1BC78F8C: "FEPA_CONTROLS_N",
-    0x1BC78F90: "FEPA_CONTROLS_R",
-    0x1BC9F6F7: "MGCE_SHORTW01",
-    0x1BC9F6F8: "MGCE_SHORTW02",
-    0x1BC9F6F9: "MGCE_SHORTW03",
-    0x1BC9F6FA: "MGCE_SHORTW04",
-    0x1BC9F6FB: "MGCE_SHORTW05",
-    0x1BC9F6FC: "MGCE_SHORTW06",
-    0x1BC9F6FD: "MGCE_SHORTW07",
-    0x1BC9F6FE: "MGCE_SHORTW08",
-    0x1BC9F6FF: "MGCE_SHORTW09",
-    0x1BC9F779: "MGCE_SHORTW10",
-    0x1BC9F77A: "MGCE_SHORTW11",
-    0x1BC9F77B: "MGCE_SHORTW12",
-    0x1BC9F77C: "MGCE_SHORTW13",
-    0x1BC9F77D: "MGCE_SHORTW14",
-    0x1BC9F77E: "MGCE_SHORTW15",
-    0x1BC9F77F: "MGCE_SHORTW16",
-    0x1BC9F780: "MGCE_SHORTW17",
-    0x1BC9F781: "MGCE_SHORTW18",
-    0x1BC9F782: "MGCE_SHORTW19",
-    0x1BC9F7FC: "MGCE_SHORTW20",
-    0x1BC9F7FD: "MGCE_SHORTW21",
-    0x1BC9F7FE: "MGCE_SHORTW22",
-    0x1BC9F7FF: "MGCE_SHORTW23",
-    0x1BC9F800: "MGCE_SHORTW24",
-    0x1BC9F801: "MGCE_SHORTW25",
-    0x1BC9F802: "MGCE_SHORTW26",
-    0x1BC9F803: "MGCE_SHORTW27",
-    0x1BC9F804: "MGCE_SHORTW28",
-    0x1BC9F805: "MGCE_SHORTW29",
-    0x1BC9F87F: "MGCE_SHORTW30",
-    0x1BD7A86E: "MGPH_TORSO_POSTER",
-    0x1BD8BBA3: "2_05_TITLE",
-    0x1BECF83D: "CHEMSET_FULL",
-    0x1BEDEBE3: "DESC_100",
-    0x1BEDEBE4: "DESC_101",
-    0x1BEDEBE5: "DESC_102",
-    0x1BEDEBE6: "DESC_103",
-    0x1BEDEBE8: "DESC_105",
-    0x1BEDEBE9: "DESC_106",
-    0x1BEDEBEA: "DESC_107",
-    0x1C0D3847: "N_CONST_SHORT",
-    0x1C1CCC43: "CONT_10_2_WII",
-    0x1C1DA491: "MGSP_BET",
-    0x1C20EAF7: "MGCA_INSTRUCTIONS_HEADING",
-    0x1C2F55DD: "1_06_PETEKO",
-    0x1C3FB757: "MGGE_CHAD",
-    0x1C597999: "AS_GE_COMPLETE",
-    0x1C5EE13C: "3_04_HEALTH_ALGIE",
-    0x1C60A9A5: "MGGE_SOMALIA",
-    0x1C85EE75: "MGT_MATH",
-    0x1C87280D: "TITLE37_NAME10",
-    0x1C87280E: "TITLE37_NAME11",
-    0x1C87280F: "TITLE37_NAME12",
-    0x1C872810: "TITLE37_NAME13",
-    0x1C872811: "TITLE37_NAME14",
-    0x1C879149: "PHO_QUICK",
-    0x1C888745: "MGGE_EXIT",
-    0x1C9EAA6A: "DBG_LOST",
-    0x1CA413B5: "MGPH_HEART",
-    0x1CA6A05F: "TITLE53_NUMNAMES",
-    0x1CA6E7D1: "MGGE_FIJI",
-    0x1CABA453: "P_LSLEEVES1",
-    0x1CABA454: "P_LSLEEVES2",
-    0x1CABA455: "P_LSLEEVES3",
-    0x1CABA456: "P_LSLEEVES4",
-    0x1CABA457: "P_LSLEEVES5",
-    0x1CABA458: "P_LSLEEVES6",
-    0x1CABA459: "P_LSLEEVES7",
-    0x1CABA45A: "P_LSLEEVES8",
-    0x1CABA45B: "P_LSLEEVES9",
-    0x1CB1722A: "STO_INVENTORYFULL",
-    0x1CB26278: "3_B_FAIL01",
-    0x1CD54D14: "TUT_FP2",
-    0x1CD656A8: "TUT_JK1",
-    0x1CD7EC73: "TUT_PR1",
-    0x1CD8B696: "TUT_ST3",
-    0x1CD8F791: "TUT_TP1",
-    0x1CD9C441: "TUT_WW1",
-    0x1CD9C443: "TUT_WW3",
-    0x1CD9C444: "TUT_WW4",
-    0x1CD9C445: "TUT_WW5",
-    0x1CDB61E6: "MGBI_PIGEON_10",
-    0x1CDB61E7: "MGBI_PIGEON_11",
-    0x1CDB61E8: "MGBI_PIGEON_12",
-    0x1CDB61E9: "MGBI_PIGEON_13",
-    0x1CDB61EA: "MGBI_PIGEON_14",
-    0x1CDB61EB: "MGBI_PIGEON_15",
-    0x1CDB61EC: "MGBI_PIGEON_16",
-    0x1CE0BBF2: "MGGE_HAWAII",
-    0x1CE4EDA2: "3_01_TITLE",
-    0x1CF16C70: "AS_AT_COMPLETE",
-    0x1CFF3E78: "N_DUNCAN",
-    0x1D04C777: "SP_FIREHAT",
-    0x1D0F1DC9: "MGGE_INFO",
-    0x1D0F6977: "MGGE_IOWA",
-    0x1D10275D: "MGGE_IRAN",
-    0x1D102760: "MGGE_IRAQ",
-    0x1D114EC4: "KO_TEXT",
-    0x1D1A7083: "STO_BOTHER",
-    0x1D21FF96: "MGGE_ZIMBABWE",
-    0x1D2313CC: "MGPH_BMX",
-    0x1D2350AD: "MGPH_CAT",
-    0x1D23E2F8: "MGPH_EYE",
-    0x1D2420F6: "MGPH_FOX",
-    0x1D246912: "MGPH_GYM",
-    0x1D273E34: "MGPH_RAT",
-    0x1D278341: "MGPH_SEL",
-    0x1D2809D9: "MGPH_UFO",
-    0x1D28C98D: "C6_GETREADY2",
-    0x1D28C98E: "C6_GETREADY3",
-    0x1D2F114F: "DESC_DO_LG_01",
-    0x1D312CA5: "2_S05_OPERFUME",
-    0x1D35ED21: "ARCADE_TITLE",
-    0x1D392817: "MGGE_FINLAND",
-    0x1D44AAAE: "R_HTHROB_01",
-    0x1D44AAAF: "R_HTHROB_02",
-    0x1D44AAB0: "R_HTHROB_03",
-    0x1D44AAB1: "R_HTHROB_04",
-    0x1D55019A: "SPEC_200",
-    0x1D5587AC: "SPEC_400",
-    0x1D5A29CA: "AS_P8_RETURN",
-    0x1D663FD0: "TITLE39_NAME0",
-    0x1D663FD1: "TITLE39_NAME1",
-    0x1D663FD2: "TITLE39_NAME2",
-    0x1D6A5E1F: "DIBUTTON_JOYPOV_UP",
-    0x1D7845F5: "3_S10_UNLOCK",
-    0x1D7F19CE: "AS_MM_RETURN",
-    0x1D97C381: "1_03_D10",
-    0x1D97C382: "1_03_D11",
-    0x1D97C383: "1_03_D12",
-    0x1D97C384: "1_03_D13",
-    0x1D9BF38F: "1_03_T01",
-    0x1D9BF390: "1_03_T02",
-    0x1D9BF391: "1_03_T03",
-    0x1DA0441F: "STATEND",
-    0x1DA0F7A3: "AS_BG_FAIL",
-    0x1DA3F1BD: "STATSTR",
-    0x1DA434C0: "STATTTL",
-    0x1DA47F6D: "MG_CONSUMO_FE",
-    0x1DA902D5: "N_MRLUNTZ",
-    0x1DADD6F3: "R_HAT1",
-    0x1DADD6F4: "R_HAT2",
-    0x1DADD6F5: "R_HAT3",
-    0x1DADD6F6: "R_HAT4",
-    0x1DADD6F7: "R_HAT5",
-    0x1DADD6F8: "R_HAT6",
-    0x1DB907A7: "COASTER_YES",
-    0x1DBC7A1E: "MGGE_NULL",
-    0x1DBF86BC: "FE_NUM_GAMES",
-    0x1DC40DD7: "AS_SW_OBJCOUNT1",
-    0x1DCF9EA1: "GKART_YOUWIN",
-    0x1DCFA1B3: "GKART_YOUWON",
-    0x1DD20776: "USE_FUNPAINTON",
-    0x1DDB5EBE: "MGGE_OHIO",
-    0x1DDCA9D2: "MGGE_OMAN",
-    0x1DDFC983: "2_07_MOBJ_01",
-    0x1DDFC984: "2_07_MOBJ_02",
-    0x1DE8752D: "AS_SP_OBJCOUNT",
-    0x1DFCE7DF: "MGGE_PERU",
-    0x1E06624C: "MGE2_T7G01WORDS",
-    0x1E0830D3: "ARCADE_FEND_I01",
-    0x1E0830D4: "ARCADE_FEND_I02",
-    0x1E0830D5: "ARCADE_FEND_I03",
-    0x1E0830D6: "ARCADE_FEND_I04",
-    0x1E0830D7: "ARCADE_FEND_I05",
-    0x1E0AD3D3: "AS_EI_COMPLETE",
-    0x1E14464C: "MGPH_DRAGON",
-    0x1E169A82: "4_06_GATENERD",
-    0x1E2494C4: "2_S05_OPROTDATE",
-    0x1E36BC8C: "MGCA_INSTRUCTIONS_EXPLODER_DESC",
-    0x1E446C1D: "MG_NUTSHOTS",
-    0x1E51D97C: "2_S07_FAIL_01",
-    0x1E5296CB: "MGGE_MONGOLIA",
-    0x1E53C039: "MGGE_ANGOLA",
-    0x1E57FA99: "TITLE37_NUMNAMES",
-    0x1E5F54B4: "MGGE_MISSOURI",
-    0x1E693AFF: "3_01A_FAIL_01",
-    0x1E693B00: "3_01A_FAIL_02",
-    0x1E693B01: "3_01A_FAIL_03",
-    0x1E7FF41E: "1_02B_EMPTY2",
-    0x1E837488: "TITLE24_NAME0",
-    0x1E837489: "TITLE24_NAME1",
-    0x1E83748A: "TITLE24_NAME2",
-    0x1E83748B: "TITLE24_NAME3",
-    0x1E8727D0: "MGGE_TIME",
-    0x1E8C4A7D: "AS_PI_OBJCOUNT",
-    0x1EA308AE: "MGGE_TEXAS",
-    0x1EAC50AD: "MGGE_UTAH",
-    0x1EAE0846: "FORKS_DESC1",
-    0x1EAE0847: "FORKS_DESC2",
-    0x1EAEA923: "AS_BB_COMPLETE",
-    0x1EB3C2F1: "AS_ALL_TOMBSTONES",
-    0x1EBA506D: "1-G1.SUB0001",
-    0x1EBA506E: "1-G1.SUB0002",
-    0x1EBA506F: "1-G1.SUB0003",
-    0x1EBA5070: "1-G1.SUB0004",
-    0x1EBA5071: "1-G1.SUB0005",
-    0x1EBA5072: "1-G1.SUB0006",
-    0x1EBA5073: "1-G1.SUB0007",
-    0x1EBA5074: "1-G1.SUB0008",
-    0x1EBA5075: "1-G1.SUB0009",
-    0x1EBA50EF: "1-G1.SUB0010",
-    0x1EBA50F0: "1-G1.SUB0011",
-    0x1EBA50F1: "1-G1.SUB0012",
-    0x1EBA50F2: "1-G1.SUB0013",
-    0x1EBA50F3: "1-G1.SUB0014",
-    0x1EBA50F4: "1-G1.SUB0015",
-    0x1EBA50F5: "1-G1.SUB0016",
-    0x1EBA50F6: "1-G1.SUB0017",
-    0x1EBA50F7: "1-G1.SUB0018",
-    0x1EBA50F8: "1-G1.SUB0019",
-    0x1EBA5172: "1-G1.SUB0020",
-    0x1EBA5173: "1-G1.SUB0021",
-    0x1EBA5174: "1-G1.SUB0022",
-    0x1EBA5175: "1-G1.SUB0023",
-    0x1EBA5176: "1-G1.SUB0024",
-    0x1EBA5177: "1-G1.SUB0025",
-    0x1EBA5178: "1-G1.SUB0026",
-    0x1EBA5179: "1-G1.SUB0027",
-    0x1EBA8DBA: "AS_FF_OBJCOUNT",
-    0x1EC79234: "2_04_FAIL_LOSE",
-    0x1EC8FEDA: "S_GREET_GEN_01",
-    0x1ECA4162: "FE_MULTIPLAYER",
-    0x1ECBE51F: "1_04_GARY_BUS",
-    0x1EE2D891: "C2_01",
-    0x1EE2D892: "C2_02",
-    0x1EE2D893: "C2_03",
-    0x1EE2D894: "C2_04",
-    0x1EE2D895: "C2_05",
-    0x1EE2D896: "C2_06",
-    0x1EE2D897: "C2_07",
-    0x1EE2D898: "C2_08",
-    0x1EE2D899: "C2_09",
-    0x1EE2D913: "C2_10",
-    0x1EE2D914: "C2_11",
-    0x1EE2D915: "C2_12",
-    0x1EE2D916: "C2_13",
-    0x1EE2D917: "C2_14",
-    0x1EE2D918: "C2_15",
-    0x1EE2D919: "C2_16",
-    0x1EE2D91A: "C2_17",
-    0x1EE2D91B: "C2_18",
-    0x1EE2D91C: "C2_19",
-    0x1EEB41EC: "5_B_01",
-    0x1F0FBFEA: "LOCKED",
-    0x1F3509F5: "FAC_BULLIES",
-    0x1F36999D: "R_SHORTS1",
-    0x1F36999E: "R_SHORTS2",
-    0x1F36999F: "R_SHORTS3",
-    0x1F3699A0: "R_SHORTS4",
-    0x1F3699A1: "R_SHORTS5",
-    0x1F36CC61: "3-04.SUB0001",
-    0x1F36CC62: "3-04.SUB0002",
-    0x1F36CC63: "3-04.SUB0003",
-    0x1F36CC64: "3-04.SUB0004",
-    0x1F36CC65: "3-04.SUB0005",
-    0x1F36CC66: "3-04.SUB0006",
-    0x1F36CC67: "3-04.SUB0007",
-    0x1F36CC68: "3-04.SUB0008",
-    0x1F36CC69: "3-04.SUB0009",
-    0x1F36CCE3: "3-04.SUB0010",
-    0x1F36CCE4: "3-04.SUB0011",
-    0x1F36CCE5: "3-04.SUB0012",
-    0x1F36CCE6: "3-04.SUB0013",
-    0x1F36CCE7: "3-04.SUB0014",
-    0x1F36CCE8: "3-04.SUB0015",
-    0x1F36CCE9: "3-04.SUB0016",
-    0x1F36CCEA: "3-04.SUB0017",
-    0x1F390EB8: "P_SNEAKERS10",
-    0x1F390EB9: "P_SNEAKERS11",
-    0x1F390EBA: "P_SNEAKERS12",
-    0x1F390EBB: "P_SNEAKERS13",
-    0x1F390EBC: "P_SNEAKERS14",
-    0x1F390EBD: "P_SNEAKERS15",
-    0x1F390EBE: "P_SNEAKERS16",
-    0x1F390EBF: "P_SNEAKERS17",
-    0x1F390EC0: "P_SNEAKERS18",
-    0x1F390EC1: "P_SNEAKERS19",
-    0x1F49C162: "C5_01",
-    0x1F49C163: "C5_02",
-    0x1F49C164: "C5_03",
-    0x1F49C165: "C5_04",
-    0x1F49C166: "C5_05",
-    0x1F49C167: "C5_06",
-    0x1F49C168: "C5_07",
-    0x1F49C169: "C5_08",
-    0x1F49C16A: "C5_09",
-    0x1F49C1E4: "C5_10",
-    0x1F49C1E5: "C5_11",
-    0x1F49C1E6: "C5_12",
-    0x1F49C1E7: "C5_13",
-    0x1F6B191B: "N_TREVOR",
-    0x1F6BA99F: "FELO_CONTROLS",
-    0x1F761B42: "1_04_FIELDOBJ",
-    0x1F841FF0: "4_04_ACTIVATEREPR",
-    0x1F883FD5: "TUT_HMIX01",
-    0x1F887390: "AS_HT_FAIL",
-    0x1F9295EC: "MGB2_ALIEN_10",
-    0x1F9295ED: "MGB2_ALIEN_11",
-    0x1F9295EE: "MGB2_ALIEN_12",
-    0x1F9295EF: "MGB2_ALIEN_13",
-    0x1F9295F0: "MGB2_ALIEN_14",
-    0x1F9295F1: "MGB2_ALIEN_15",
-    0x1F9295F2: "MGB2_ALIEN_16",
-    0x1F9295F3: "MGB2_ALIEN_17",
-    0x1F9295F4: "MGB2_ALIEN_18",
-    0x1F9295F5: "MGB2_ALIEN_19",
-    0x1F9890A3: "TITLE85_NAME0",
-    0x1F9890A4: "TITLE85_NAME1",
-    0x1F9890A5: "TITLE85_NAME2",
-    0x1F9890A6: "TITLE85_NAME3",
-    0x1F9890A7: "TITLE85_NAME4",
-    0x1F9890A8: "TITLE85_NAME5",
-    0x1F9890A9: "TITLE85_NAME6",
-    0x1F9890AA: "TITLE85_NAME7",
-    0x1F9890AB: "TITLE85_NAME8",
-    0x1F9EF0A3: "MGE2_T3G01W01",
-    0x1F9EF0A4: "MGE2_T3G01W02",
-    0x1F9EF0A5: "MGE2_T3G01W03",
-    0x1F9EF0A6: "MGE2_T3G01W04",
-    0x1F9EF0A7: "MGE2_T3G01W05",
-    0x1F9EF0A8: "MGE2_T3G01W06",
-    0x1F9EF0A9: "MGE2_T3G01W07",
-    0x1F9EF0AA: "MGE2_T3G01W08",
-    0x1F9EF0AB: "MGE2_T3G01W09",
-    0x1F9EF125: "MGE2_T3G01W10",
-    0x1F9EF126: "MGE2_T3G01W11",
-    0x1F9EF127: "MGE2_T3G01W12",
-    0x1F9EF128: "MGE2_T3G01W13",
-    0x1F9EF129: "MGE2_T3G01W14",
-    0x1F9EF12A: "MGE2_T3G01W15",
-    0x1F9EF12B: "MGE2_T3G01W16",
-    0x1F9EF12C: "MGE2_T3G01W17",
-    0x1F9EF12D: "MGE2_T3G01W18",
-    0x1F9EF12E: "MGE2_T3G01W19",
-    0x1F9EF1A8: "MGE2_T3G01W20",
-    0x1F9EF1A9: "MGE2_T3G01W21",
-    0x1F9EF1AA: "MGE2_T3G01W22",
-    0x1F9EF1AB: "MGE2_T3G01W23",
-    0x1F9EF1AC: "MGE2_T3G01W24",
-    0x1F9EF1AD: "MGE2_T3G01W25",
-    0x1F9EF1AE: "MGE2_T3G01W26",
-    0x1F9EF1AF: "MGE2_T3G01W27",
-    0x1F9EF1B0: "MGE2_T3G01W28",
-    0x1F9EF1B1: "MGE2_T3G01W29",
-    0x1F9EF22B: "MGE2_T3G01W30",
-    0x1F9EF22C: "MGE2_T3G01W31",
-    0x1F9EF22D: "MGE2_T3G01W32",
-    0x1F9EF22E: "MGE2_T3G01W33",
-    0x1F9EF22F: "MGE2_T3G01W34",
-    0x1F9EF230: "MGE2_T3G01W35",
-    0x1F9EF231: "MGE2_T3G01W36",
-    0x1F9EF232: "MGE2_T3G01W37",
-    0x1F9EF233: "MGE2_T3G01W38",
-    0x1F9EF234: "MGE2_T3G01W39",
-    0x1F9EF2AE: "MGE2_T3G01W40",
-    0x1F9EF2AF: "MGE2_T3G01W41",
-    0x1F9EF2B0: "MGE2_T3G01W42",
-    0x1F9EF2B1: "MGE2_T3G01W43",
-    0x1F9EF2B2: "MGE2_T3G01W44",
-    0x1F9EF2B3: "MGE2_T3G01W45",
-    0x1F9EF2B4: "MGE2_T3G01W46",
-    0x1F9EF2B5: "MGE2_T3G01W47",
-    0x1F9EF2B6: "MGE2_T3G01W48",
-    0x1F9EF2B7: "MGE2_T3G01W49",
-    0x1F9EF331: "MGE2_T3G01W50",
-    0x1F9EF680: "2-0.SUB0001",
-    0x1F9EF681: "2-0.SUB0002",
-    0x1F9EF682: "2-0.SUB0003",
-    0x1F9EF683: "2-0.SUB0004",
-    0x1F9EF684: "2-0.SUB0005",
-    0x1F9EF685: "2-0.SUB0006",
-    0x1F9EF686: "2-0.SUB0007",
-    0x1F9EF687: "2-0.SUB0008",
-    0x1F9EF688: "2-0.SUB0009",
-    0x1F9EF702: "2-0.SUB0010",
-    0x1F9EF703: "2-0.SUB0011",
-    0x1F9EF704: "2-0.SUB0012",
-    0x1F9EF705: "2-0.SUB0013",
-    0x1F9EF706: "2-0.SUB0014",
-    0x1F9EF707: "2-0.SUB0015",
-    0x1F9EF708: "2-0.SUB0016",
-    0x1F9EF709: "2-0.SUB0017",
-    0x1F9EF70A: "2-0.SUB0018",
-    0x1F9EF70B: "2-0.SUB0019",
-    0x1F9EF785: "2-0.SUB0020",
-    0x1F9EF786: "2-0.SUB0021",
-    0x1FC69DDD: "BWSCR_WII",
-    0x1FD8899A: "CLT_NUTCRACKER",
-    0x20092E9A: "INV_CHANGEX",
-    0x2009EC69: "AS_TW_ACTION",
-    0x20188979: "2_S05_OGOTDRUG2",
-    0x2018F298: "TUT_POSHUM",
-    0x201A7C98: "TUT_POSNEG",
-    0x202A3254: "AS_EM_AMMO",
-    0x203614B9: "UH_MUSIC",
-    0x20397809: "RACING_START",
-    0x203D61B8: "AS_SD_OBJECTIVE",
-    0x204631FD: "SP_PUMPKIN_HEAD",
-    0x2050A042: "R3_VEHICLE",
-    0x20609F2F: "TUT_POUT01",
-    0x20609F30: "TUT_POUT02",
-    0x20609F31: "TUT_POUT03",
-    0x20660C92: "2_04_PETER",
-    0x206C49A1: "LABEL_XINPUT",
-    0x20765760: "AS_EI_ACTION",
-    0x20786E39: "N_MARIATHERESA",
-    0x207AEC46: "SM_SHOP1",
-    0x207AEC47: "SM_SHOP2",
-    0x207AEC48: "SM_SHOP3",
-    0x207AEC49: "SM_SHOP4",
-    0x207AEC4A: "SM_SHOP5",
-    0x207EE6E6: "TITLE87_NUMNAMES",
-    0x20803649: "POCKET_MONEY_STR",
-    0x208E0EF9: "CLT_BARBER_TITLE",
-    0x20992D83: "C2_DROPJERRY",
-    0x20B00627: "MGE2_T2G01WORDS",
-    0x20B18B07: "4_06_OPC_SWITCH",
-    0x20B5C55B: "TITLE70_NAME0",
-    0x20B5C55C: "TITLE70_NAME1",
-    0x20C766A7: "AS_ST_ACTION",
-    0x20CDCCE2: "TAG_GREAS_COMBO",
-    0x20DF2AD6: "AS_TR_FAIL",
-    0x20E05A69: "4_03_JOCKTHRU",
-    0x20E2078F: "CARDS",
-    0x20F13CFE: "FE_SELECT_FE",
-    0x20FD6498: "AS_CT_OBJECTIVE",
-    0x2103F3E3: "STO_BUYEXIT",
-    0x210641D3: "USE_FUNBOOKON",
-    0x2113ABC4: "AS_TH_ACTION",
-    0x2114C337: "1_G1_DIAREAD",
-    0x211A0785: "1_G1_DIARYP1",
-    0x211A0786: "1_G1_DIARYP2",
-    0x2122BC36: "TITLE50_NUMNAMES",
-    0x2136821F: "GKART_7LAPS",
-    0x213C6B3C: "PER_EVEN",
-    0x214A5B97: "1_11X2_FIREWARN",
-    0x2152DB77: "GDORM_WARNING1",
-    0x2152DB78: "GDORM_WARNING2",
-    0x2152DB79: "GDORM_WARNING3",
-    0x2162EB5E: "SV_FAIL",
-    0x216789D1: "3_R09_TOURNAMENT",
-    0x21731409: "3_XM_BAR",
-    0x217575DE: "",
-    0x2175B675: "POOR_CLOTH",
-    0x217E87F8: "MGCE_T1G01W01",
-    0x217E87F9: "MGCE_T1G01W02",
-    0x217E87FA: "MGCE_T1G01W03",
-    0x217E87FB: "MGCE_T1G01W04",
-    0x217E87FC: "MGCE_T1G01W05",
-    0x217E87FD: "MGCE_T1G01W06",
-    0x217E87FE: "MGCE_T1G01W07",
-    0x217E87FF: "MGCE_T1G01W08",
-    0x217E8800: "MGCE_T1G01W09",
-    0x217E887A: "MGCE_T1G01W10",
-    0x217E887B: "MGCE_T1G01W11",
-    0x217E887C: "MGCE_T1G01W12",
-    0x217E887D: "MGCE_T1G01W13",
-    0x217E887E: "MGCE_T1G01W14",
-    0x217E887F: "MGCE_T1G01W15",
-    0x217E8880: "MGCE_T1G01W16",
-    0x217E8881: "MGCE_T1G01W17",
-    0x217E8882: "MGCE_T1G01W18",
-    0x217E8883: "MGCE_T1G01W19",
-    0x217E88FD: "MGCE_T1G01W20",
-    0x217E88FE: "MGCE_T1G01W21",
-    0x217E88FF: "MGCE_T1G01W22",
-    0x217E8900: "MGCE_T1G01W23",
-    0x217E8901: "MGCE_T1G01W24",
-    0x217E8902: "MGCE_T1G01W25",
-    0x217E8903: "MGCE_T1G01W26",
-    0x217E8904: "MGCE_T1G01W27",
-    0x217E8905: "MGCE_T1G01W28",
-    0x217E8906: "MGCE_T1G01W29",
-    0x217E8980: "MGCE_T1G01W30",
-    0x217E8981: "MGCE_T1G01W31",
-    0x217E8982: "MGCE_T1G01W32",
-    0x217E8983: "MGCE_T1G01W33",
-    0x217E8984: "MGCE_T1G01W34",
-    0x217E8985: "MGCE_T1G01W35",
-    0x217E8986: "MGCE_T1G01W36",
-    0x217E8987: "MGCE_T1G01W37",
-    0x217E8988: "MGCE_T1G01W38",
-    0x217E8989: "MGCE_T1G01W39",
-    0x217E8A03: "MGCE_T1G01W40",
-    0x217E8A04: "MGCE_T1G01W41",
-    0x217E8A05: "MGCE_T1G01W42",
-    0x217E8A06: "MGCE_T1G01W43",
-    0x217E8A07: "MGCE_T1G01W44",
-    0x217E8A08: "MGCE_T1G01W45",
-    0x217E8A09: "MGCE_T1G01W46",
-    0x217E8A0A: "MGCE_T1G01W47",
-    0x217E8A0B: "MGCE_T1G01W48",
-    0x217E8A0C: "MGCE_T1G01W49",
-    0x217E8A86: "MGCE_T1G01W50",
-    0x2193C6D0: "SP_NUTCRACK_H",
-    0x2193C6D4: "SP_NUTCRACK_L",
-    0x2193C6DC: "SP_NUTCRACK_T",
-    0x219FFC98: "TUT_CMAP1",
-    0x21A5F4F8: "MRESPECT_NM100",
-    0x21AAF50B: "CLT_ALIEN",
-    0x21BB9001: "CRIME_INTGIRLS",
-    0x21CA1E28: "AS_PI_OBJCOUNT1",
-    0x21CB66BF: "FEDS_HIGH",
-    0x21DB016C: "2_S04_FAIL01",
-    0x21E1EF8C: "4_06_RESPECT",
-    0x21EAF5F0: "USE_FRAFFY",
-    0x21F90599: "AS_SF_FAIL",
-    0x2203F231: "MGA2_CLEAR_NAME",
-    0x220CDDC9: "MRESPECT_NP100",
-    0x2211F1B8: "MAP_SCROLL",
-    0x22133D02: "AS_HH_TOFAR",
-    0x2219D61C: "IGRSRS",
-    0x22214682: "CLT_ROCKER",
-    0x2223A58A: "MGGE_FLORIDA",
-    0x22407CE9: "DISC_07_WII",
-    0x224D097C: "PER_MORN",
-    0x2250598B: "N_CORNELIUS",
-    0x22513305: "TUT_CRW01",
-    0x225ADF53: "1_04_TREE",
-    0x22612C63: "AS_ED_RETURN",
-    0x22644E05: "AS_SI_OBJECTIVE",
-    0x226AC28C: "3_R08_UNLOCK1",
-    0x226AC28D: "3_R08_UNLOCK2",
-    0x226AC28E: "3_R08_UNLOCK3",
-    0x226AC28F: "3_R08_UNLOCK4",
-    0x226AC290: "3_R08_UNLOCK5",
-    0x226AC291: "3_R08_UNLOCK6",
-    0x226E82DC: "MGPH_TIME_PEN",
-    0x22781D6B: "DPADL_BIKE",
-    0x2285CF9D: "1_11X1_EMPTY",
-    0x22984BFD: "PLANE_4",
-    0x22984C11: "PLANE_H",
-    0x2298BCC1: "BOX_SWEATER",
-    0x22A82BCD: "CONTC_WII",
-    0x22B0655B: "1_06_UNLOCK",
-    0x22B5C447: "MGPH_ALGIE",
-    0x22B64856: "MGPH_ALIEN",
-    0x22B9EA85: "SP_XMSSWEATER",
-    0x22BFB482: "MGGE_ALABAMA",
-    0x22C29DF0: "MGCE_DEL",
-    0x22C46FE9: "AS_F4_OBJECTIVE",
-    0x22C68B77: "MGCE_SEL",
-    0x22CC8834: "TITLE57_NAME0",
-    0x22CC8835: "TITLE57_NAME1",
-    0x22CC8836: "TITLE57_NAME2",
-    0x22CC8837: "TITLE57_NAME3",
-    0x22CC8838: "TITLE57_NAME4",
-    0x22CC8839: "TITLE57_NAME5",
-    0x22CC883A: "TITLE57_NAME6",
-    0x22CC883B: "TITLE57_NAME7",
-    0x22CC883C: "TITLE57_NAME8",
-    0x22CC883D: "TITLE57_NAME9",
-    0x22D41670: "TITLE34_NUMNAMES",
-    0x22D76CB8: "RACE_BEHIND",
-    0x22DF1428: "CONT_07_WII",
-    0x22EF7E57: "SOC_P_PIG",
-    0x22F9B04B: "TAG_DO_MED_01",
-    0x22FA5F7D: "MGPH_ANGIE",
-    0x22FC81BD: "AS_LB_COMPLETE",
-    0x22FE80C7: "AS_TC_RETURN",
-    0x2301D9CF: "AS_BB_OBJCOUNT1",
-    0x2302E828: "DPADL_FOOT",
-    0x23052923: "6_B_GARY",
-    0x230F184B: "FACTIONWARN1",
-    0x230F184C: "FACTIONWARN2",
-    0x2314AEAA: "1_04_TREE_FAIL",
-    0x2315035A: "FUN_MTR_SQ",
-    0x23196BC2: "1_02C_FAIL_01",
-    0x231AD995: "PER_SOON",
-    0x231BBF23: "GRAF_TAG_C",
-    0x232800EF: "SP_ANTLERS",
-    0x23313DF5: "2_S02_TITLE",
-    0x2335EF1D: "MGGE_MAINE",
-    0x2336A991: "AS_FC_OBJCOUNT",
-    0x233BEBAB: "N_CHRISTY",
-    0x234231AE: "SUCCES_DELETE",
-    0x23448E89: "PUNREMOVE_BUSTED",
-    0x2346C6FD: "CARD_02_WII",
-    0x23513C82: "M_FAIL_BUSTED",
-    0x2353BAE3: "2_03_UNLOCK",
-    0x235FDF7E: "N_LANCE",
-    0x23663157: "AS_PT_COMPLETE",
-    0x236A92F8: "3_05_GETITEMS",
-    0x23756352: "AS_BR_INTRO",
-    0x238360DB: "BUTTON_REVERSAL",
-    0x23836364: "CONT_10_WII",
-    0x2385A767: "TUT_JUMP01",
-    0x23890788: "4_06_OP_D_01",
-    0x2389078A: "4_06_OP_D_03",
-    0x2389078C: "4_06_OP_D_05",
-    0x238C8D6C: "RACE_GETONOBJ",
-    0x238CD360: "",
-    0x238D7EA0: "AS_PROJ_REWARD",
-    0x239C09AC: "AS_EB_OBJECTIVE",
-    0x23AAEB02: "DIBUTTON_JOYAXIS_NEG",
-    0x23AB5523: "4_06_OP_E_01",
-    0x23AB55A5: "4_06_OP_E_10",
-    0x23AB763E: "DIBUTTON_JOYAXIS_POS",
-    0x23AFACFC: "AS_MARATHON_BOY",
-    0x23CC0988: "N_MRSCARVIN",
-    0x23CCAE8F: "CHAPT4TRANS_JOCKS",
-    0x23CDA2BE: "4_06_OP_F_01",
-    0x23CDA2C3: "4_06_OP_F_06",
-    0x23D4FD95: "CWSSQ",
-    0x23D4FE9B: "CWSUQ",
-    0x23DC7452: "MGGE_N_DAKOTA",
-    0x23DD386E: "MGE2_T13G01W01",
-    0x23DD386F: "MGE2_T13G01W02",
-    0x23DD3870: "MGE2_T13G01W03",
-    0x23DD3871: "MGE2_T13G01W04",
-    0x23DD3872: "MGE2_T13G01W05",
-    0x23DD3873: "MGE2_T13G01W06",
-    0x23DD3874: "MGE2_T13G01W07",
-    0x23DD3875: "MGE2_T13G01W08",
-    0x23DD3876: "MGE2_T13G01W09",
-    0x23DD38F0: "MGE2_T13G01W10",
-    0x23DD38F1: "MGE2_T13G01W11",
-    0x23DD38F2: "MGE2_T13G01W12",
-    0x23DD38F3: "MGE2_T13G01W13",
-    0x23DD38F4: "MGE2_T13G01W14",
-    0x23DD38F5: "MGE2_T13G01W15",
-    0x23DD38F6: "MGE2_T13G01W16",
-    0x23DD38F7: "MGE2_T13G01W17",
-    0x23DD38F8: "MGE2_T13G01W18",
-    0x23DD38F9: "MGE2_T13G01W19",
-    0x23DD3973: "MGE2_T13G01W20",
-    0x23DD3974: "MGE2_T13G01W21",
-    0x23DD3975: "MGE2_T13G01W22",
-    0x23DD3976: "MGE2_T13G01W23",
-    0x23DD3977: "MGE2_T13G01W24",
-    0x23DD3978: "MGE2_T13G01W25",
-    0x23DD3979: "MGE2_T13G01W26",
-    0x23DD397A: "MGE2_T13G01W27",
-    0x23DD397B: "MGE2_T13G01W28",
-    0x23DD397C: "MGE2_T13G01W29",
-    0x23DD39F6: "MGE2_T13G01W30",
-    0x23DD39F7: "MGE2_T13G01W31",
-    0x23DD39F8: "MGE2_T13G01W32",
-    0x23DD39F9: "MGE2_T13G01W33",
-    0x23DD39FA: "MGE2_T13G01W34",
-    0x23DD39FB: "MGE2_T13G01W35",
-    0x23DD39FC: "MGE2_T13G01W36",
-    0x23DD39FD: "MGE2_T13G01W37",
-    0x23DD39FE: "MGE2_T13G01W38",
-    0x23DD39FF: "MGE2_T13G01W39",
-    0x23DD3A79: "MGE2_T13G01W40",
-    0x23DD3A7A: "MGE2_T13G01W41",
-    0x23DD3A7B: "MGE2_T13G01W42",
-    0x23DD3A7C: "MGE2_T13G01W43",
-    0x23DD3A7D: "MGE2_T13G01W44",
-    0x23DD3A7E: "MGE2_T13G01W45",
-    0x23DD3A7F: "MGE2_T13G01W46",
-    0x23DD3A80: "MGE2_T13G01W47",
-    0x23DD3A81: "MGE2_T13G01W48",
-    0x23DD3A82: "MGE2_T13G01W49",
-    0x23DD3AFC: "MGE2_T13G01W50",
-    0x23E3B251: "MGB2_BAT_0",
-    0x23E3B252: "MGB2_BAT_1",
-    0x23E3B253: "MGB2_BAT_2",
-    0x23E3B254: "MGB2_BAT_3",
-    0x23E3B255: "MGB2_BAT_4",
-    0x23E3B256: "MGB2_BAT_5",
-    0x23E3B257: "MGB2_BAT_6",
-    0x23E3B258: "MGB2_BAT_7",
-    0x23E3B259: "MGB2_BAT_8",
-    0x23E3B25A: "MGB2_BAT_9",
-    0x23E70669: "N_LEFTY",
-    0x23E8C8E7: "2_S07_EMPTY",
-    0x23E9BCEC: "TITLE42_NAME0",
-    0x23E9BCED: "TITLE42_NAME1",
-    0x23E9BCEE: "TITLE42_NAME2",
-    0x23E9BCEF: "TITLE42_NAME3",
-    0x23E9BCF0: "TITLE42_NAME4",
-    0x23E9BCF1: "TITLE42_NAME5",
-    0x23E9BCF2: "TITLE42_NAME6",
-    0x23E9BCF3: "TITLE42_NAME7",
-    0x23E9BCF4: "TITLE42_NAME8",
-    0x23F2B8A3: "TITLE60_NAME10",
-    0x23F2B8A4: "TITLE60_NAME11",
-    0x23F2B8A5: "TITLE60_NAME12",
-    0x23F2B8A6: "TITLE60_NAME13",
-    0x23F2B8A7: "TITLE60_NAME14",
-    0x23F2B8A8: "TITLE60_NAME15",
-    0x23F2B8A9: "TITLE60_NAME16",
-    0x23F2B8AA: "TITLE60_NAME17",
-    0x23F2B8AB: "TITLE60_NAME18",
-    0x23F2B8AC: "TITLE60_NAME19",
-    0x23F2B926: "TITLE60_NAME20",
-    0x23F2B927: "TITLE60_NAME21",
-    0x23F2B928: "TITLE60_NAME22",
-    0x23F2B929: "TITLE60_NAME23",
-    0x23F2B92A: "TITLE60_NAME24",
-    0x23F2B92B: "TITLE60_NAME25",
-    0x23F2B92C: "TITLE60_NAME26",
-    0x23F2B92D: "TITLE60_NAME27",
-    0x23F2B92E: "TITLE60_NAME28",
-    0x23F2B92F: "TITLE60_NAME29",
-    0x23F2B9A9: "TITLE60_NAME30",
-    0x23F2B9AA: "TITLE60_NAME31",
-    0x23F2B9AB: "TITLE60_NAME32",
-    0x23F2B9AC: "TITLE60_NAME33",
-    0x23F2B9AD: "TITLE60_NAME34",
-    0x23F2B9AE: "TITLE60_NAME35",
-    0x23F2B9AF: "TITLE60_NAME36",
-    0x23F2B9B0: "TITLE60_NAME37",
-    0x23F2B9B1: "TITLE60_NAME38",
-    0x23F2B9B2: "TITLE60_NAME39",
-    0x23F2BA2C: "TITLE60_NAME40",
-    0x23F2BA2D: "TITLE60_NAME41",
-    0x23F2BA2E: "TITLE60_NAME42",
-    0x23F2BA2F: "TITLE60_NAME43",
-    0x23F2BA30: "TITLE60_NAME44",
-    0x23F2BA31: "TITLE60_NAME45",
-    0x23F2BA32: "TITLE60_NAME46",
-    0x23F2BA33: "TITLE60_NAME47",
-    0x23F2BA34: "TITLE60_NAME48",
-    0x23F2BA35: "TITLE60_NAME49",
-    0x23F2BAAF: "TITLE60_NAME50",
-    0x23F2BAB0: "TITLE60_NAME51",
-    0x23F2BAB1: "TITLE60_NAME52",
-    0x23F2BAB2: "TITLE60_NAME53",
-    0x23F2BAB3: "TITLE60_NAME54",
-    0x23F2BAB4: "TITLE60_NAME55",
-    0x23F2BAB5: "TITLE60_NAME56",
-    0x23F2BAB6: "TITLE60_NAME57",
-    0x23F2BAB7: "TITLE60_NAME58",
-    0x23F2BAB8: "TITLE60_NAME59",
-    0x23F2BB32: "TITLE60_NAME60",
-    0x23F2BB33: "TITLE60_NAME61",
-    0x23F2BB34: "TITLE60_NAME62",
-    0x23F2BB35: "TITLE60_NAME63",
-    0x23F2BB36: "TITLE60_NAME64",
-    0x23F2BB37: "TITLE60_NAME65",
-    0x23F2BB38: "TITLE60_NAME66",
-    0x23F2BB39: "TITLE60_NAME67",
-    0x23F2BB3A: "TITLE60_NAME68",
-    0x23F2BB3B: "TITLE60_NAME69",
-    0x23F2BBB5: "TITLE60_NAME70",
-    0x23F2BBB6: "TITLE60_NAME71",
-    0x23F2BBB7: "TITLE60_NAME72",
-    0x23F2BBB8: "TITLE60_NAME73",
-    0x23F2BBB9: "TITLE60_NAME74",
-    0x23F2BBBA: "TITLE60_NAME75",
-    0x23F2BBBB: "TITLE60_NAME76",
-    0x23F2BBBC: "TITLE60_NAME77",
-    0x23F2BBBD: "TITLE60_NAME78",
-    0x23F2BBBE: "TITLE60_NAME79",
-    0x23F2BC38: "TITLE60_NAME80",
-    0x23F2BC39: "TITLE60_NAME81",
-    0x23F2BC3A: "TITLE60_NAME82",
-    0x23F2BC3B: "TITLE60_NAME83",
-    0x23F2BC3C: "TITLE60_NAME84",
-    0x23F2BC3D: "TITLE60_NAME85",
-    0x23F2BC3E: "TITLE60_NAME86",
-    0x23F2BC3F: "TITLE60_NAME87",
-    0x23F2BC40: "TITLE60_NAME88",
-    0x23F2BC41: "TITLE60_NAME89",
-    0x23F2BCBB: "TITLE60_NAME90",
-    0x23F2BCBC: "TITLE60_NAME91",
-    0x23F2BCBD: "TITLE60_NAME92",
-    0x23F2BCBE: "TITLE60_NAME93",
-    0x23F2BCBF: "TITLE60_NAME94",
-    0x23F2BCC0: "TITLE60_NAME95",
-    0x23F2BCC1: "TITLE60_NAME96",
-    0x23F2BCC2: "TITLE60_NAME97",
-    0x23F2BCC3: "TITLE60_NAME98",
-    0x23F2BCC4: "TITLE60_NAME99",
-    0x23F87F3A: "CRIME_BULLYINGADULTS",
-    0x23FD5A85: "1_06_OBJ01",
-    0x23FD5A86: "1_06_OBJ02",
-    0x23FD5A87: "1_06_OBJ03",
-    0x24062B75: "B_BOOTS1",
-    0x24062B76: "B_BOOTS2",
-    0x24062B77: "B_BOOTS3",
-    0x24062B78: "B_BOOTS4",
-    0x24062B79: "B_BOOTS5",
-    0x24063346: "S_TAUNT_SMALL_01",
-    0x24093E1C: "TUT_TIMER1",
-    0x24144F08: "TUT_SPRT01",
-    0x241B270E: "MGPH_BOOKSTACK",
-    0x242A2DE5: "MGT_PHOTO_FE",
-    0x2432433B: "MGGE_MICHIGAN",
-    0x243B67B6: "1_02B_GARYHEALTH",
-    0x243BE169: "MGGE_AUSTRALIA",
-    0x24442C5D: "AS_F4_COMPLETE",
-    0x24447319: "3_XM_SNOWMAN",
-    0x244D5600: "AS_AG_RETURN",
-    0x2456D456: "ARCADE_SSCORE",
-    0x2461F8DF: "3_06_TITLE",
-    0x246A7B03: "BC_MTN_BIKE",
-    0x248041A4: "2_S05_ODATE1",
-    0x248570AA: "TITLE18_NUMNAMES",
-    0x248B9367: "4_01_RESPECT",
-    0x24B20886: "5_05_SABOTAGE",
-    0x24B4345F: "KEEPUP_TRIANGLE",
-    0x24DC148B: "CMG_01",
-    0x24DC148C: "CMG_02",
-    0x24DC148D: "CMG_03",
-    0x24EE1C3B: "4-03.SUB0001",
-    0x24EE1C3C: "4-03.SUB0002",
-    0x24EE1C3D: "4-03.SUB0003",
-    0x24EE1C3E: "4-03.SUB0004",
-    0x24EE1C3F: "4-03.SUB0005",
-    0x24EE1C40: "4-03.SUB0006",
-    0x24EE1C41: "4-03.SUB0007",
-    0x24EE1C42: "4-03.SUB0008",
-    0x24EE1C43: "4-03.SUB0009",
-    0x24EE1CBD: "4-03.SUB0010",
-    0x24EE1CBE: "4-03.SUB0011",
-    0x24EE1CBF: "4-03.SUB0012",
-    0x24EE1CC0: "4-03.SUB0013",
-    0x24EE1CC1: "4-03.SUB0014",
-    0x24EE1CC2: "4-03.SUB0015",
-    0x24EE1CC3: "4-03.SUB0016",
-    0x24EE1CC4: "4-03.SUB0017",
-    0x24EE1CC5: "4-03.SUB0018",
-    0x24EE1CC6: "4-03.SUB0019",
-    0x24EE1D40: "4-03.SUB0020",
-    0x24EE1D41: "4-03.SUB0021",
-    0x24EE1D42: "4-03.SUB0022",
-    0x24EE1D43: "4-03.SUB0023",
-    0x24EE1D44: "4-03.SUB0024",
-    0x24EE1D45: "4-03.SUB0025",
-    0x24EE1D46: "4-03.SUB0026",
-    0x24EE1D47: "4-03.SUB0027",
-    0x24EE1D48: "4-03.SUB0028",
-    0x24EE1D49: "4-03.SUB0029",
-    0x24EE1DC3: "4-03.SUB0030",
-    0x24EE1DC4: "4-03.SUB0031",
-    0x24EE1DC5: "4-03.SUB0032",
-    0x24EE1DC6: "4-03.SUB0033",
-    0x24F6701D: "MGC2P_GETREADY",
-    0x24FB02BD: "TITLE84_NUMNAMES",
-    0x25012CD9: "FEPA_CONTROLS",
-    0x25075376: "UP_ART1",
-    0x25075377: "UP_ART2",
-    0x25075378: "UP_ART3",
-    0x25075379: "UP_ART4",
-    0x2507537A: "UP_ART5",
-    0x25115B85: "CRIME_PEDATTACKELDERLY",
-    0x25257210: "SP_PIRATEHAT",
-    0x25376A08: "MGPH_STOPSIGN",
-    0x25410CFC: "SOC_G_SHAKIN",
-    0x25481F3D: "MGG2_SPEED",
-    0x255B6E01: "DT_COMICS_01",
-    0x255BDA92: "1_04_TREE_WARN",
-    0x255D7CF6: "4_S12_GOTPERFUME",
-    0x2563C284: "GROCERYSTORE",
-    0x256E2ADE: "4_02_TITLE",
-    0x258007DF: "MGGE_OREGON",
-    0x2586C2CC: "MGA2_INITIAL_TEXT",
-    0x258A5757: "TICKETS",
-    0x259BF079: "GIFT_HACKY",
-    0x25A42A73: "MGM2_NUM_QTITLES",
-    0x25A844BD: "FEI_NO_MISOBJ",
-    0x25AEC92F: "1-BB.SUB0001",
-    0x25AEC930: "1-BB.SUB0002",
-    0x25AEC931: "1-BB.SUB0003",
-    0x25C1D338: "2_R03_TITLE1",
-    0x25C2F5F9: "AS_EG_OBJECTIVE",
-    0x25C60C17: "USE_ACTIVATE",
-    0x25CB3B4A: "AS_GNOMES_REWARD",
-    0x25CF2739: "SOC_GEN_F_PRAISE1",
-    0x25D4F6A1: "C_PINKWATCH",
-    0x25D6F0E0: "MGPH_BEATRICE",
-    0x25D6F6C2: "UP_GYM1",
-    0x25D6F6C3: "UP_GYM2",
-    0x25D6F6C4: "UP_GYM3",
-    0x25D6F6C5: "UP_GYM4",
-    0x25D6F6C6: "UP_GYM5",
-    0x25F0A9C4: "MGPH_GREENBEAKER",
-    0x25F48AFD: "D_MARBL",
-    0x26007FC5: "TITLE29_NAME0",
-    0x26007FC6: "TITLE29_NAME1",
-    0x26007FC7: "TITLE29_NAME2",
-    0x26007FC8: "TITLE29_NAME3",
-    0x26007FC9: "TITLE29_NAME4",
-    0x26007FCA: "TITLE29_NAME5",
-    0x26007FCB: "TITLE29_NAME6",
-    0x26007FCC: "TITLE29_NAME7",
-    0x260B1263: "N_LUCKY",
-    0x262A990C: "STAT0000",
-    0x262A990D: "STAT0001",
-    0x262A990E: "STAT0002",
-    0x262A990F: "STAT0003",
-    0x262A9910: "STAT0004",
-    0x262A9911: "STAT0005",
-    0x262A9912: "STAT0006",
-    0x262A9913: "STAT0007",
-    0x262A9914: "STAT0008",
-    0x262A9915: "STAT0009",
-    0x262A998F: "STAT0010",
-    0x262A9990: "STAT0011",
-    0x262A9991: "STAT0012",
-    0x262A9992: "STAT0013",
-    0x262A9993: "STAT0014",
-    0x262A9994: "STAT0015",
-    0x262A9995: "STAT0016",
-    0x262A9996: "STAT0017",
-    0x262A9997: "STAT0018",
-    0x262A9998: "STAT0019",
-    0x262A9A12: "STAT0020",
-    0x262A9A13: "STAT0021",
-    0x262A9A14: "STAT0022",
-    0x262A9A15: "STAT0023",
-    0x262A9A16: "STAT0024",
-    0x262A9A17: "STAT0025",
-    0x262A9A18: "STAT0026",
-    0x262A9A19: "STAT0027",
-    0x262A9A1A: "STAT0028",
-    0x262A9A1B: "STAT0029",
-    0x262A9A95: "STAT0030",
-    0x262A9A96: "STAT0031",
-    0x262A9A97: "STAT0032",
-    0x262A9A99: "STAT0034",
-    0x262A9A9A: "STAT0035",
-    0x262A9A9B: "STAT0036",
-    0x262A9A9C: "STAT0037",
-    0x262A9A9D: "STAT0038",
-    0x262A9B18: "STAT0040",
-    0x262A9B19: "STAT0041",
-    0x262A9B1A: "STAT0042",
-    0x262A9B1B: "STAT0043",
-    0x262A9B1C: "STAT0044",
-    0x262A9B1D: "STAT0045",
-    0x262A9B1E: "STAT0046",
-    0x262A9B1F: "STAT0047",
-    0x262A9B20: "STAT0048",
-    0x262A9B21: "STAT0049",
-    0x262A9B9B: "STAT0050",
-    0x262A9B9C: "STAT0051",
-    0x262A9B9D: "STAT0052",
-    0x262A9B9E: "STAT0053",
-    0x262A9B9F: "STAT0054",
-    0x262A9BA0: "STAT0055",
-    0x262A9BA1: "STAT0056",
-    0x262A9BA2: "STAT0057",
-    0x262A9BA3: "STAT0058",
-    0x262A9BA4: "STAT0059",
-    0x262A9C1E: "STAT0060",
-    0x262A9C1F: "STAT0061",
-    0x262A9C20: "STAT0062",
-    0x262A9C23: "STAT0065",
-    0x262A9C25: "STAT0067",
-    0x262A9C26: "STAT0068",
-    0x262A9C27: "STAT0069",
-    0x262A9CA1: "STAT0070",
-    0x262A9CA2: "STAT0071",
-    0x262A9CA3: "STAT0072",
-    0x262A9CA4: "STAT0073",
-    0x262A9CA5: "STAT0074",
-    0x262A9CA6: "STAT0075",
-    0x262A9CA7: "STAT0076",
-    0x262A9CA8: "STAT0077",
-    0x262A9CA9: "STAT0078",
-    0x262A9CAA: "STAT0079",
-    0x262A9D24: "STAT0080",
-    0x262A9D25: "STAT0081",
-    0x262A9D26: "STAT0082",
-    0x262A9D27: "STAT0083",
-    0x262A9D28: "STAT0084",
-    0x262A9D29: "STAT0085",
-    0x262A9D2A: "STAT0086",
-    0x262A9D2B: "STAT0087",
-    0x262A9D2C: "STAT0088",
-    0x262A9D2D: "STAT0089",
-    0x262A9DA7: "STAT0090",
-    0x262A9DA8: "STAT0091",
-    0x262A9DA9: "STAT0092",
-    0x262A9DAA: "STAT0093",
-    0x262A9DAB: "STAT0094",
-    0x262A9DAC: "STAT0095",
-    0x262A9DAD: "STAT0096",
-    0x262A9DAE: "STAT0097",
-    0x262A9DAF: "STAT0098",
-    0x262A9DB0: "STAT0099",
-    0x262ADC15: "STAT0100",
-    0x262ADC17: "STAT0102",
-    0x262ADC18: "STAT0103",
-    0x262ADC19: "STAT0104",
-    0x262ADC1A: "STAT0105",
-    0x262ADC1B: "STAT0106",
-    0x262ADC1C: "STAT0107",
-    0x262ADC1D: "STAT0108",
-    0x262ADC1E: "STAT0109",
-    0x262ADC98: "STAT0110",
-    0x262ADC99: "STAT0111",
-    0x262ADC9A: "STAT0112",
-    0x262ADC9B: "STAT0113",
-    0x262ADC9C: "STAT0114",
-    0x262ADC9D: "STAT0115",
-    0x262ADC9E: "STAT0116",
-    0x262ADC9F: "STAT0117",
-    0x262ADCA0: "STAT0118",
-    0x262ADCA1: "STAT0119",
-    0x262ADD1B: "STAT0120",
-    0x262ADD1C: "STAT0121",
-    0x262ADD1D: "STAT0122",
-    0x262ADD1E: "STAT0123",
-    0x262ADD1F: "STAT0124",
-    0x262ADD20: "STAT0125",
-    0x262ADD21: "STAT0126",
-    0x262ADD22: "STAT0127",
-    0x262ADD23: "STAT0128",
-    0x262ADD24: "STAT0129",
-    0x262ADD9F: "STAT0131",
-    0x262ADDA1: "STAT0133",
-    0x262ADDA2: "STAT0134",
-    0x262ADDA3: "STAT0135",
-    0x262ADDA4: "STAT0136",
-    0x262ADDA5: "STAT0137",
-    0x262ADDA6: "STAT0138",
-    0x262ADDA7: "STAT0139",
-    0x262ADE21: "STAT0140",
-    0x262ADE22: "STAT0141",
-    0x262ADE23: "STAT0142",
-    0x262ADE24: "STAT0143",
-    0x262ADE26: "STAT0145",
-    0x262ADE27: "STAT0146",
-    0x262ADE28: "STAT0147",
-    0x262ADE2A: "STAT0149",
-    0x262ADEA4: "STAT0150",
-    0x262ADEA5: "STAT0151",
-    0x262ADEA7: "STAT0153",
-    0x262ADEA8: "STAT0154",
-    0x262ADEA9: "STAT0155",
-    0x262ADEAA: "STAT0156",
-    0x262ADEAB: "STAT0157",
-    0x262ADEAC: "STAT0158",
-    0x262ADEAD: "STAT0159",
-    0x262ADF27: "STAT0160",
-    0x262ADF28: "STAT0161",
-    0x262ADF29: "STAT0162",
-    0x262ADF2A: "STAT0163",
-    0x262ADF2B: "STAT0164",
-    0x262ADF2C: "STAT0165",
-    0x262ADF2D: "STAT0166",
-    0x262ADF2E: "STAT0167",
-    0x262ADF2F: "STAT0168",
-    0x262ADF30: "STAT0169",
-    0x262ADFAA: "STAT0170",
-    0x262ADFAB: "STAT0171",
-    0x262ADFAC: "STAT0172",
-    0x262ADFAD: "STAT0173",
-    0x262ADFAE: "STAT0174",
-    0x262ADFAF: "STAT0175",
-    0x262ADFB0: "STAT0176",
-    0x262ADFB1: "STAT0177",
-    0x262ADFB2: "STAT0178",
-    0x262ADFB3: "STAT0179",
-    0x262AE02D: "STAT0180",
-    0x262AE02E: "STAT0181",
-    0x262AE02F: "STAT0182",
-    0x262AE030: "STAT0183",
-    0x262AE031: "STAT0184",
-    0x262AE033: "STAT0186",
-    0x262AE034: "STAT0187",
-    0x262AE035: "STAT0188",
-    0x262AE036: "STAT0189",
-    0x262AE0B0: "STAT0190",
-    0x262AE0B1: "STAT0191",
-    0x262AE0B2: "STAT0192",
-    0x262AE0B3: "STAT0193",
-    0x262AE0B4: "STAT0194",
-    0x262AE0B5: "STAT0195",
-    0x262AE0B6: "STAT0196",
-    0x262AE0B7: "STAT0197",
-    0x262AE0B8: "STAT0198",
-    0x262AE0B9: "STAT0199",
-    0x262B1F1E: "STAT0200",
-    0x262B1F1F: "STAT0201",
-    0x262B1F20: "STAT0202",
-    0x262B1F21: "STAT0203",
-    0x262B1F22: "STAT0204",
-    0x262B1F23: "STAT0205",
-    0x262B1F24: "STAT0206",
-    0x262B1F25: "STAT0207",
-    0x262B1F26: "STAT0208",
-    0x262B1F27: "STAT0209",
-    0x262B1FA1: "STAT0210",
-    0x262B1FA2: "STAT0211",
-    0x262B1FA3: "STAT0212",
-    0x262B1FA4: "STAT0213",
-    0x262B1FA5: "STAT0214",
-    0x262B1FA6: "STAT0215",
-    0x262B1FA7: "STAT0216",
-    0x262B1FA8: "STAT0217",
-    0x262B1FA9: "STAT0218",
-    0x262B1FAA: "STAT0219",
-    0x262B2024: "STAT0220",
-    0x262B2025: "STAT0221",
-    0x262B2026: "STAT0222",
-    0x262B2027: "STAT0223",
-    0x262B2028: "STAT0224",
-    0x262B2029: "STAT0225",
-    0x262B202A: "STAT0226",
-    0x262B202B: "STAT0227",
-    0x262B202C: "STAT0228",
-    0x262B202D: "STAT0229",
-    0x262B20A7: "STAT0230",
-    0x262B20A8: "STAT0231",
-    0x262B20A9: "STAT0232",
-    0x262B20AA: "STAT0233",
-    0x262B20AB: "STAT0234",
-    0x262B20AC: "STAT0235",
-    0x262B20AD: "STAT0236",
-    0x262B20AE: "STAT0237",
-    0x262B20AF: "STAT0238",
-    0x262B20B0: "STAT0239",
-    0x262B212A: "STAT0240",
-    0x262B212B: "STAT0241",
-    0x262B212C: "STAT0242",
-    0x262B212D: "STAT0243",
-    0x262B212E: "STAT0244",
-    0x262B212F: "STAT0245",
-    0x262B2130: "STAT0246",
-    0x262B2131: "STAT0247",
-    0x262B2132: "STAT0248",
-    0x262B2133: "STAT0249",
-    0x262B21AD: "STAT0250",
-    0x262B21AE: "STAT0251",
-    0x262B21AF: "STAT0252",
-    0x262B21B0: "STAT0253",
-    0x262B21B1: "STAT0254",
-    0x262B21B2: "STAT0255",
-    0x262B21B3: "STAT0256",
-    0x262B21B4: "STAT0257",
-    0x262B21B5: "STAT0258",
-    0x262B21B6: "STAT0259",
-    0x262B2230: "STAT0260",
-    0x262B2231: "STAT0261",
-    0x262B2232: "STAT0262",
-    0x262B2233: "STAT0263",
-    0x262B2234: "STAT0264",
-    0x262B2235: "STAT0265",
-    0x262B2236: "STAT0266",
-    0x262B2237: "STAT0267",
-    0x262B2238: "STAT0268",
-    0x262B2239: "STAT0269",
-    0x262B22B3: "STAT0270",
-    0x262B22B4: "STAT0271",
-    0x262B22B5: "STAT0272",
-    0x262B22B6: "STAT0273",
-    0x262B22B7: "STAT0274",
-    0x262B22B8: "STAT0275",
-    0x262B22B9: "STAT0276",
-    0x262B22BA: "STAT0277",
-    0x262B22BB: "STAT0278",
-    0x262B22BC: "STAT0279",
-    0x262B2336: "STAT0280",
-    0x262B2337: "STAT0281",
-    0x262B2338: "STAT0282",
-    0x262B2339: "STAT0283",
-    0x262B233A: "STAT0284",
-    0x262B233B: "STAT0285",
-    0x262B233C: "STAT0286",
-    0x262B233D: "STAT0287",
-    0x262B233E: "STAT0288",
-    0x262B233F: "STAT0289",
-    0x262B23B9: "STAT0290",
-    0x262B23BA: "STAT0291",
-    0x262B23BB: "STAT0292",
-    0x262B23BC: "STAT0293",
-    0x262B23BD: "STAT0294",
-    0x262B23BE: "STAT0295",
-    0x262B6228: "STAT0301",
-    0x262B6229: "STAT0302",
-    0x262B622A: "STAT0303",
-    0x262B622B: "STAT0304",
-    0x262B622C: "STAT0305",
-    0x262B622D: "STAT0306",
-    0x262B622F: "STAT0308",
-    0x262B6230: "STAT0309",
-    0x262B62AA: "STAT0310",
-    0x262B62AB: "STAT0311",
-    0x262B62AC: "STAT0312",
-    0x262B62AE: "STAT0314",
-    0x262B62AF: "STAT0315",
-    0x262B62B0: "STAT0316",
-    0x262B62B1: "STAT0317",
-    0x262B62B2: "STAT0318",
-    0x262B62B3: "STAT0319",
-    0x262B632D: "STAT0320",
-    0x262B632E: "STAT0321",
-    0x262B6332: "STAT0325",
-    0x262B6333: "STAT0326",
-    0x262B6334: "STAT0327",
-    0x262B6335: "STAT0328",
-    0x262B6336: "STAT0329",
-    0x262B6378: "TUT_DPADDOWN1",
-    0x262B63B0: "STAT0330",
-    0x262B63B1: "STAT0331",
-    0x262B63B2: "STAT0332",
-    0x262B63B3: "STAT0333",
-    0x262B63B4: "STAT0334",
-    0x262B63B5: "STAT0335",
-    0x262B63B6: "STAT0336",
-    0x262B63B7: "STAT0337",
-    0x262B63B8: "STAT0338",
-    0x262B63B9: "STAT0339",
-    0x262B6433: "STAT0340",
-    0x262B6434: "STAT0341",
-    0x262B6435: "STAT0342",
-    0x262B6436: "STAT0343",
-    0x262B6437: "STAT0344",
-    0x262B6438: "STAT0345",
-    0x262B6439: "STAT0346",
-    0x262B643A: "STAT0347",
-    0x262B643B: "STAT0348",
-    0x262B643C: "STAT0349",
-    0x262B64B6: "STAT0350",
-    0x262B64B7: "STAT0351",
-    0x262B64B8: "STAT0352",
-    0x262B64B9: "STAT0353",
-    0x262B64BA: "STAT0354",
-    0x262B64BB: "STAT0355",
-    0x262B64BC: "STAT0356",
-    0x262B64BD: "STAT0357",
-    0x262B64BE: "STAT0358",
-    0x262B64BF: "STAT0359",
-    0x262B6539: "STAT0360",
-    0x262B653A: "STAT0361",
-    0x262B653B: "STAT0362",
-    0x262B653C: "STAT0363",
-    0x262B653D: "STAT0364",
-    0x262B653E: "STAT0365",
-    0x262B653F: "STAT0366",
-    0x262B6540: "STAT0367",
-    0x262B6541: "STAT0368",
-    0x262B6542: "STAT0369",
-    0x262B65BC: "STAT0370",
-    0x262B65BD: "STAT0371",
-    0x262B65BE: "STAT0372",
-    0x262B65BF: "STAT0373",
-    0x262B65C0: "STAT0374",
-    0x262B65C1: "STAT0375",
-    0x262B65C2: "STAT0376",
-    0x262B65C3: "STAT0377",
-    0x262B65C4: "STAT0378",
-    0x262B65C5: "STAT0379",
-    0x262B663F: "STAT0380",
-    0x262B6640: "STAT0381",
-    0x262B6642: "STAT0383",
-    0x262B6643: "STAT0384",
-    0x262B6644: "STAT0385",
-    0x262B6645: "STAT0386",
-    0x262B6646: "STAT0387",
-    0x262B6647: "STAT0388",
-    0x262B6648: "STAT0389",
-    0x262B66C2: "STAT0390",
-    0x262B66C3: "STAT0391",
-    0x262B66C4: "STAT0392",
-    0x262B66C5: "STAT0393",
-    0x262B66C6: "STAT0394",
-    0x262B66C7: "STAT0395",
-    0x262B66C8: "STAT0396",
-    0x262B66C9: "STAT0397",
-    0x262B66CA: "STAT0398",
-    0x26445D86: "GKART_TIMELIMIT",
-    0x266AFBA8: "MD_RETURN",
-    0x266F190E: "MGPH_SOCCER",
-    0x266F3449: "STAT2007",
-    0x267D3137: "TPM_RESUME",
-    0x26911E8F: "MGE2_BADW01",
-    0x26911E90: "MGE2_BADW02",
-    0x26911E91: "MGE2_BADW03",
-    0x26911E92: "MGE2_BADW04",
-    0x26911E93: "MGE2_BADW05",
-    0x26911E94: "MGE2_BADW06",
-    0x2697418B: "MAP_GG",
-    0x269A53BE: "5_G5_ZOECOUNT",
-    0x269C5C7E: "TITLE10_NAME10",
-    0x269C5C7F: "TITLE10_NAME11",
-    0x269DECBA: "4_02_TRANS",
-    0x26AC5CF7: "TITLE68_NUMNAMES",
-    0x26B3AB54: "BOXING_KNOCK",
-    0x26C35B8A: "N_GORDON",
-    0x26D45D04: "RACING_L_GEN",
-    0x26F2C35C: "SP_EDNAMASK",
-    0x26F80A28: "4_G4_SPRAYBUY",
-    0x27030B81: "AS_EC_COMPLETE",
-    0x270EDE0C: "PHO_FSEPIA",
-    0x2719FDB8: "3_08_OBJ01A",
-    0x271BFBE0: "MGE2_T8G01W01",
-    0x271BFBE1: "MGE2_T8G01W02",
-    0x271BFBE2: "MGE2_T8G01W03",
-    0x271BFBE3: "MGE2_T8G01W04",
-    0x271BFBE4: "MGE2_T8G01W05",
-    0x271BFBE5: "MGE2_T8G01W06",
-    0x271BFBE6: "MGE2_T8G01W07",
-    0x271BFBE7: "MGE2_T8G01W08",
-    0x271BFBE8: "MGE2_T8G01W09",
-    0x271BFC62: "MGE2_T8G01W10",
-    0x271BFC63: "MGE2_T8G01W11",
-    0x271BFC64: "MGE2_T8G01W12",
-    0x271BFC65: "MGE2_T8G01W13",
-    0x271BFC66: "MGE2_T8G01W14",
-    0x271BFC67: "MGE2_T8G01W15",
-    0x271BFC68: "MGE2_T8G01W16",
-    0x271BFC69: "MGE2_T8G01W17",
-    0x271BFC6A: "MGE2_T8G01W18",
-    0x271BFC6B: "MGE2_T8G01W19",
-    0x271BFCE5: "MGE2_T8G01W20",
-    0x271BFCE6: "MGE2_T8G01W21",
-    0x271BFCE7: "MGE2_T8G01W22",
-    0x271BFCE8: "MGE2_T8G01W23",
-    0x271BFCE9: "MGE2_T8G01W24",
-    0x271BFCEA: "MGE2_T8G01W25",
-    0x271BFCEB: "MGE2_T8G01W26",
-    0x271BFCEC: "MGE2_T8G01W27",
-    0x271BFCED: "MGE2_T8G01W28",
-    0x271BFCEE: "MGE2_T8G01W29",
-    0x271BFD68: "MGE2_T8G01W30",
-    0x271BFD69: "MGE2_T8G01W31",
-    0x271BFD6A: "MGE2_T8G01W32",
-    0x271BFD6B: "MGE2_T8G01W33",
-    0x271BFD6C: "MGE2_T8G01W34",
-    0x271BFD6D: "MGE2_T8G01W35",
-    0x271BFD6E: "MGE2_T8G01W36",
-    0x271BFD6F: "MGE2_T8G01W37",
-    0x271BFD70: "MGE2_T8G01W38",
-    0x271BFD71: "MGE2_T8G01W39",
-    0x271BFDEB: "MGE2_T8G01W40",
-    0x271BFDEC: "MGE2_T8G01W41",
-    0x271BFDED: "MGE2_T8G01W42",
-    0x271BFDEE: "MGE2_T8G01W43",
-    0x271BFDEF: "MGE2_T8G01W44",
-    0x271BFDF0: "MGE2_T8G01W45",
-    0x271BFDF1: "MGE2_T8G01W46",
-    0x271BFDF2: "MGE2_T8G01W47",
-    0x271BFDF3: "MGE2_T8G01W48",
-    0x271BFDF4: "MGE2_T8G01W49",
-    0x271BFE6E: "MGE2_T8G01W50",
-    0x271DB47D: "TITLE14_NAME0",
-    0x271DB47E: "TITLE14_NAME1",
-    0x271DB47F: "TITLE14_NAME2",
-    0x271DB480: "TITLE14_NAME3",
-    0x271DB481: "TITLE14_NAME4",
-    0x271DB482: "TITLE14_NAME5",
-    0x271DB483: "TITLE14_NAME6",
-    0x271DB484: "TITLE14_NAME7",
-    0x271DB485: "TITLE14_NAME8",
-    0x271DB486: "TITLE14_NAME9",
-    0x272CE192: "MRESPECT_GP100",
-    0x2746BEBC: "GLB_EXIT",
-    0x27503247: "TITLE31_NUMNAMES",
-    0x275B4769: "MGB2_TURTLE_10",
-    0x275B476A: "MGB2_TURTLE_11",
-    0x275B476B: "MGB2_TURTLE_12",
-    0x275B476C: "MGB2_TURTLE_13",
-    0x275B476D: "MGB2_TURTLE_14",
-    0x275B476E: "MGB2_TURTLE_15",
-    0x275B476F: "MGB2_TURTLE_16",
-    0x275B4770: "MGB2_TURTLE_17",
-    0x275B4771: "MGB2_TURTLE_18",
-    0x275B4772: "MGB2_TURTLE_19",
-    0x275C3D1C: "MGMA_QUES_TIT01",
-    0x275C3D1D: "MGMA_QUES_TIT02",
-    0x275C3D1E: "MGMA_QUES_TIT03",
-    0x275C3D1F: "MGMA_QUES_TIT04",
-    0x275C3D20: "MGMA_QUES_TIT05",
-    0x275C3D21: "MGMA_QUES_TIT06",
-    0x275C3D22: "MGMA_QUES_TIT07",
-    0x275C3D23: "MGMA_QUES_TIT08",
-    0x275C3D24: "MGMA_QUES_TIT09",
-    0x275C3D9E: "MGMA_QUES_TIT10",
-    0x275C3D9F: "MGMA_QUES_TIT11",
-    0x275C3DA0: "MGMA_QUES_TIT12",
-    0x275C3DA1: "MGMA_QUES_TIT13",
-    0x275C3DA2: "MGMA_QUES_TIT14",
-    0x276C1B33: "4_06_NEXT_OP",
-    0x277B06DC: "P_LAWN_00",
-    0x277B06DF: "P_LAWN_03",
-    0x277B06E0: "P_LAWN_04",
-    0x277B06E1: "P_LAWN_05",
-    0x277B06E3: "P_LAWN_07",
-    0x277B075F: "P_LAWN_10",
-    0x277B0760: "P_LAWN_11",
-    0x277B0761: "P_LAWN_12",
-    0x277B0762: "P_LAWN_13",
-    0x277B0763: "P_LAWN_14",
-    0x277B0764: "P_LAWN_15",
-    0x277B0765: "P_LAWN_16",
-    0x277B173D: "P_LAWN_P1",
-    0x27809CBE: "CLT_PANDA",
-    0x2780A870: "FE_TIME_MIN",
-    0x2782388F: "FE_TIME_SEC",
-    0x2782389C: "FE_TIME_SEP",
-    0x2782F0AA: "4_06_OBJDANCE",
-    0x279D1FEB: "1_G1_OPENDOOR",
-    0x27CE6FD2: "FEDS_SHADOWS",
-    0x27D14644: "GRAF_INSTRUC01",
-    0x27D14645: "GRAF_INSTRUC02",
-    0x27D14646: "GRAF_INSTRUC03",
-    0x27D413F3: "1_11X1_MOBJ01",
-    0x27D413F4: "1_11X1_MOBJ02",
-    0x27E2AB06: "3_B_01",
-    0x27E9D2B0: "AS_SB_BEENHIT",
-    0x27F21571: "S_GIFT_BULLY_01",
-    0x27F614D5: "TAG_PREP_MED_01",
-    0x27F6E366: "TITLE0_NAME0",
-    0x27F8F276: "6_02_OBJ1",
-    0x27F8F277: "6_02_OBJ2",
-    0x27F8F278: "6_02_OBJ3",
-    0x27F8F279: "6_02_OBJ4",
-    0x27FBC83A: "5-07.SUB0001",
-    0x27FBC83B: "5-07.SUB0002",
-    0x27FBC83C: "5-07.SUB0003",
-    0x27FBC83D: "5-07.SUB0004",
-    0x27FBC83E: "5-07.SUB0005",
-    0x27FBC83F: "5-07.SUB0006",
-    0x27FBC840: "5-07.SUB0007",
-    0x27FBC841: "5-07.SUB0008",
-    0x27FBC842: "5-07.SUB0009",
-    0x27FBC8BC: "5-07.SUB0010",
-    0x27FF3581: "PLAWN_TITLE",
-    0x280DC2EE: "MG_CHEM",
-    0x2832D098: "TITLE75_NAME0",
-    0x2832D099: "TITLE75_NAME1",
-    0x2832D09A: "TITLE75_NAME2",
-    0x2832D09B: "TITLE75_NAME3",
-    0x2832D09C: "TITLE75_NAME4",
-    0x2832D09D: "TITLE75_NAME5",
-    0x2832D09E: "TITLE75_NAME6",
-    0x2832D09F: "TITLE75_NAME7",
-    0x2832D0A0: "TITLE75_NAME8",
-    0x2832D0A1: "TITLE75_NAME9",
-    0x2843554E: "MGC2P_JIMMYWIN",
-    0x284B1FFC: "SOC_F_GIFT_REQ",
-    0x284F9B1D: "AS_JM_FAIL",
-    0x28553877: "USE_DOOR_OPEN",
-    0x286CF5F2: "MGM2_SEL",
-    0x28732A4E: "B_CAESAR",
-    0x2880DA41: "O_WRESTLING",
-    0x28A455C4: "MGGE_ETHIOPIA",
-    0x28A58EB4: "AS_FASHION_VIC",
-    0x28A96356: "AS_JM_OBJECTIVE",
-    0x28B2FDEA: "R_GOODBOY_01",
-    0x28B2FDEB: "R_GOODBOY_02",
-    0x28B2FDEC: "R_GOODBOY_03",
-    0x28B2FDED: "R_GOODBOY_04",
-    0x28B465BB: "AS_CG_COMPLETE",
-    0x28B69BD6: "AS_RA_OBJCOUNT1",
-    0x28B83DA5: "1_E01_TITLE",
-    0x28BE0D66: "FESL_TL5",
-    0x28C19582: "3_01C_TEXT_01",
-    0x28C19583: "3_01C_TEXT_02",
-    0x28C19584: "3_01C_TEXT_03",
-    0x28C19585: "3_01C_TEXT_04",
-    0x28C94B99: "DBH_OFFENSE",
-    0x28CDCA3C: "SP_ORDERLY_B",
-    0x28CDCA4A: "SP_ORDERLY_P",
-    0x28CDCA4E: "SP_ORDERLY_T",
-    0x28D0C161: "CLT_CLOTHING_TITLE",
-    0x28D0FA3D: "CRIME_INTAUTHORITY",
-    0x28D1ED43: "2_G2_MOBJ_01",
-    0x28D1ED44: "2_G2_MOBJ_02",
-    0x28D1ED45: "2_G2_MOBJ_03",
-    0x28D1ED46: "2_G2_MOBJ_04",
-    0x28DFC720: "MC_CORRUPT",
-    0x28E159C0: "2_08_HARINGKEY",
-    0x28E4F5E0: "N_EDGAR",
-    0x28EAFE99: "4_G4_OBJ1",
-    0x28EAFE9A: "4_G4_OBJ2",
-    0x28EF3B81: "TUT_RMGL1",
-    0x28F19009: "MGA2_INSTRUCTIONS_CRAWLER_FASTCRAWLER_DESC",
-    0x28FA6E85: "1_02_TBUT1",
-    0x28FA6E86: "1_02_TBUT2",
-    0x28FBB491: "AS_TF_COMPLETE",
-    0x29018C81: "TITLE15_NUMNAMES",
-    0x29109755: "AS_EH_ACTION",
-    0x2913FD77: "MGCE_SCMSG1",
-    0x2913FD78: "MGCE_SCMSG2",
-    0x2913FD79: "MGCE_SCMSG3",
-    0x2916ADE8: "6_03_OBJ00",
-    0x2916ADE9: "6_03_OBJ01",
-    0x2916ADEA: "6_03_OBJ02",
-    0x2916ADEB: "6_03_OBJ03",
-    0x2916ADEC: "6_03_OBJ04",
-    0x2916ADED: "6_03_OBJ05",
-    0x2916B93F: "MGPH_PETER",
-    0x291A447A: "4_G4_MANDHIT",
-    0x291E2334: "BATHROOM_2ND_FLOOR",
-    0x292B3A72: "2_07_RESPECTM",
-    0x292D073B: "TPM_QUITCURRENT_HEAD",
-    0x293087E0: "3_02_TOOFAR",
-    0x293309A7: "MGPH_GLOVES",
-    0x293934D0: "AS_FC_OBJECTIVE",
-    0x293959B0: "4_S12_DROPPED_ITEM",
-    0x293A31B1: "ERR_FORMAT",
-    0x293D5BCC: "FUN_MTR_UNLOCK",
-    0x2948D7F0: "L3_VEHICLE",
-    0x294B4FE8: "1_11X1_TITLE",
-    0x294E6937: "4_05_MOBJ_01",
-    0x294E6938: "4_05_MOBJ_02",
-    0x294E6939: "4_05_MOBJ_03",
-    0x294E693A: "4_05_MOBJ_04",
-    0x29500550: "TITLE60_NAME0",
-    0x29500551: "TITLE60_NAME1",
-    0x29500552: "TITLE60_NAME2",
-    0x29500553: "TITLE60_NAME3",
-    0x29500554: "TITLE60_NAME4",
-    0x29500555: "TITLE60_NAME5",
-    0x29500556: "TITLE60_NAME6",
-    0x29500557: "TITLE60_NAME7",
-    0x29500558: "TITLE60_NAME8",
-    0x29500559: "TITLE60_NAME9",
-    0x2962FD65: "MG_MATH",
-    0x2966DF9C: "MGCA_FREEZE_NAME",
-    0x296E14C2: "MGPH_HELMET",
-    0x29702219: "MGB2_PIG_10",
-    0x2970221A: "MGB2_PIG_11",
-    0x2970221B: "MGB2_PIG_12",
-    0x2970221C: "MGB2_PIG_13",
-    0x2970221D: "MGB2_PIG_14",
-    0x2970221E: "MGB2_PIG_15",
-    0x2970221F: "MGB2_PIG_16",
-    0x29702220: "MGB2_PIG_17",
-    0x29702221: "MGB2_PIG_18",
-    0x29702222: "MGB2_PIG_19",
-    0x29771E94: "TITLE81_NUMNAMES",
-    0x29809766: "MGGE_PHILIPPINES",
-    0x2994EB89: "1_08_BEAKO",
-    0x299E65A3: "MGPH_PINUP",
-    0x299F7EBB: "SP_BIKEJERSEY",
-    0x29AC03B2: "3_G3_FAILHIT",
-    0x29C9BC6D: "S_JACKET3",
-    0x29C9BC6E: "S_JACKET4",
-    0x29D693F0: "AS_TP_FAIL",
-    0x29D6E660: "MGPH_SWEATER",
-    0x29DA75A3: "3_02_JOHNNYKO",
-    0x29E2467E: "TIRES_NAME1",
-    0x29E2467F: "TIRES_NAME2",
-    0x29E767FA: "CRIME_LATEFORCLASS",
-    0x29ED63F3: "N_NICKYCHARLES",
-    0x29FB38AF: "3_R05B",
-    0x2A035938: "MGPH_MRGALLOWAY",
-    0x2A037E1B: "TUT_RUNM1",
-    0x2A0BD40F: "DBG_EMPTY",
-    0x2A1277D7: "3-04B.SUB0001",
-    0x2A1277D8: "3-04B.SUB0002",
-    0x2A1277D9: "3-04B.SUB0003",
-    0x2A1277DA: "3-04B.SUB0004",
-    0x2A1277DB: "3-04B.SUB0005",
-    0x2A1277DC: "3-04B.SUB0006",
-    0x2A1277DD: "3-04B.SUB0007",
-    0x2A1277DE: "3-04B.SUB0008",
-    0x2A1277DF: "3-04B.SUB0009",
-    0x2A127859: "3-04B.SUB0010",
-    0x2A12785A: "3-04B.SUB0011",
-    0x2A12785B: "3-04B.SUB0012",
-    0x2A12785C: "3-04B.SUB0013",
-    0x2A12785D: "3-04B.SUB0014",
-    0x2A12785E: "3-04B.SUB0015",
-    0x2A12785F: "3-04B.SUB0016",
-    0x2A127860: "3-04B.SUB0017",
-    0x2A127861: "3-04B.SUB0018",
-    0x2A127862: "3-04B.SUB0019",
-    0x2A1278DC: "3-04B.SUB0020",
-    0x2A20ABA9: "4_B1_MOBJ_01",
-    0x2A241EBC: "NAND_02_WII",
-    0x2A2866A6: "CN_PHOTO",
-    0x2A2F6ECA: "RPG_L",
-    0x2A2FB882: "CLT_PURCH",
-    0x2A2FF652: "2_04_FAILPETE",
-    0x2A32FB22: "FEI_NO_WEAPONS",
-    0x2A33BD18: "MGGE_GERMANY",
-    0x2A5E5A61: "SOC_PR_DECLINE",
-    0x2A655C76: "4_B2_OBJ1",
-    0x2A655C77: "4_B2_OBJ2",
-    0x2A6B65F7: "AS_SD_ACTION",
-    0x2A6EF49D: "4_06_AGRSV",
-    0x2A6F2B19: "C3_UNLOCK02_WII",
-    0x2A738D81: "1_HALLOWEEN_GARY",
-    0x2A7B255A: "RACE_OFFTRACK",
-    0x2A86305D: "3_01A_TITLE",
-    0x2A94DE11: "BC_RACER_BIKE",
-    0x2A98B7E2: "1_11X1_FAIL_01",
-    0x2A98B7E3: "1_11X1_FAIL_02",
-    0x2A9ABC4A: "4_04_INSTRUC00",
-    0x2A9ABC4B: "4_04_INSTRUC01",
-    0x2A9ABC4C: "4_04_INSTRUC02",
-    0x2A9ABC4D: "4_04_INSTRUC03",
-    0x2A9ABC4E: "4_04_INSTRUC04",
-    0x2A9ABC4F: "4_04_INSTRUC05",
-    0x2A9ABC51: "4_04_INSTRUC07",
-    0x2AA0A00D: "AS_AG_OBJECTIVE",
-    0x2AA56C15: "5-02.SUB0001",
-    0x2AA56C16: "5-02.SUB0002",
-    0x2AA56C17: "5-02.SUB0003",
-    0x2AA56C18: "5-02.SUB0004",
-    0x2AA56C19: "5-02.SUB0005",
-    0x2AA56C1A: "5-02.SUB0006",
-    0x2AA56C1B: "5-02.SUB0007",
-    0x2AA56C1C: "5-02.SUB0008",
-    0x2AA56C1D: "5-02.SUB0009",
-    0x2AA56C97: "5-02.SUB0010",
-    0x2AA56C98: "5-02.SUB0011",
-    0x2AA56C99: "5-02.SUB0012",
-    0x2AA56C9A: "5-02.SUB0013",
-    0x2AA56C9B: "5-02.SUB0014",
-    0x2AA56C9C: "5-02.SUB0015",
-    0x2AA56C9D: "5-02.SUB0016",
-    0x2AA56C9E: "5-02.SUB0017",
-    0x2AA56C9F: "5-02.SUB0018",
-    0x2AA56CA0: "5-02.SUB0019",
-    0x2AA56D1A: "5-02.SUB0020",
-    0x2AA56D1B: "5-02.SUB0021",
-    0x2AA56D1C: "5-02.SUB0022",
-    0x2AA56D1D: "5-02.SUB0023",
-    0x2AA56D1E: "5-02.SUB0024",
-    0x2AA56D1F: "5-02.SUB0025",
-    0x2AA56D20: "5-02.SUB0026",
-    0x2AA56D21: "5-02.SUB0027",
-    0x2AA56D22: "5-02.SUB0028",
-    0x2AA99E8E: "AS_SUPERPRANK",
-    0x2AAE4932: "2_S07_TITLE",
-    0x2ABEF26C: "1_02_FIGHTMSG",
-    0x2AC0C8BE: "1_02_FIGHTTUT",
-    0x2AE37060: "CLT_SWITCH",
-    0x2AECE5E5: "MGPH_ROCKET",
-    0x2AF06EB3: "AS_SD_FAIL",
-    0x2AF41758: "MGPH_PSIGN",
-    0x2AFC1533: "CLASSROOM",
-    0x2B0633E5: "FEO_AUD",
-    0x2B06F6EB: "FEO_DIS",
-    0x2B09574A: "FEO_MSC",
-    0x2B0A1295: "N_ETHAN",
-    0x2B100E33: "N_SECURITYDOG",
-    0x2B118176: "STO_COST",
-    0x2B1579DC: "AS_BH_OBJCOUNT",
-    0x2B15DF46: "4_B2_TUT1",
-    0x2B226FC9: "2_R03_PASS01",
-    0x2B226FCA: "2_R03_PASS02",
-    0x2B226FCB: "2_R03_PASS03",
-    0x2B2878CE: "TITLE65_NUMNAMES",
-    0x2B2944AA: "CRANK_NAME1",
-    0x2B2944AB: "CRANK_NAME2",
-    0x2B2BD281: "1_02_SBUT",
-    0x2B373E26: "MGCE_UNLOCK1",
-    0x2B373E27: "MGCE_UNLOCK2",
-    0x2B373E28: "MGCE_UNLOCK3",
-    0x2B373E29: "MGCE_UNLOCK4",
-    0x2B373E2A: "MGCE_UNLOCK5",
-    0x2B3B67AF: "MC_CANCEL",
-    0x2B4C993F: "CLT_BOX_OUTFIT",
-    0x2B4F4F40: "N_MCINNIS",
-    0x2B5872DF: "STO_EXIT",
-    0x2B5F245C: "4_02_OBSDOOR",
-    0x2B66C829: "TITLE47_NAME0",
-    0x2B66C82A: "TITLE47_NAME1",
-    0x2B68A630: "1_02B_MP3TUT",
-    0x2B792C29: "STO_FREE",
-    0x2B813B67: "",
-    0x2B8ACC0D: "1_G1_FAILSPKR",
-    0x2B96AC0F: "P_BOOTS1",
-    0x2B96AC10: "P_BOOTS2",
-    0x2B96AC11: "P_BOOTS3",
-    0x2B96AC12: "P_BOOTS4",
-    0x2BA25A5E: "AS_BR_PICKUP",
-    0x2BA9550A: "1_HALLOWEEN_PETE",
-    0x2BAAB704: "3-01DB.SUB0001",
-    0x2BAAB705: "3-01DB.SUB0002",
-    0x2BAAB706: "3-01DB.SUB0003",
-    0x2BAAB707: "3-01DB.SUB0004",
-    0x2BAAB708: "3-01DB.SUB0005",
-    0x2BAAB709: "3-01DB.SUB0006",
-    0x2BAAB70A: "3-01DB.SUB0007",
-    0x2BAAB70B: "3-01DB.SUB0008",
-    0x2BAAB70C: "3-01DB.SUB0009",
-    0x2BAAB786: "3-01DB.SUB0010",
-    0x2BAAB787: "3-01DB.SUB0011",
-    0x2BAB4562: "1_G1_FAILTIME",
-    0x2BCF7E5A: "TITLE72_NAME10",
-    0x2BCF7E5B: "TITLE72_NAME11",
-    0x2BCF7E5C: "TITLE72_NAME12",
-    0x2BCF7E5D: "TITLE72_NAME13",
-    0x2BCF7E5E: "TITLE72_NAME14",
-    0x2BCF7E5F: "TITLE72_NAME15",
-    0x2BCF7E60: "TITLE72_NAME16",
-    0x2BCF7E61: "TITLE72_NAME17",
-    0x2BCF7E62: "TITLE72_NAME18",
-    0x2BCF7E63: "TITLE72_NAME19",
-    0x2BCF7EDD: "TITLE72_NAME20",
-    0x2BCF7EDE: "TITLE72_NAME21",
-    0x2BCF7EDF: "TITLE72_NAME22",
-    0x2BCF7EE0: "TITLE72_NAME23",
-    0x2BCF7EE1: "TITLE72_NAME24",
-    0x2BCF7EE2: "TITLE72_NAME25",
-    0x2BCF7EE3: "TITLE72_NAME26",
-    0x2BCF7EE4: "TITLE72_NAME27",
-    0x2BD430D4: "LANALOG_BIKE",
-    0x2BD516A9: "P_LSLEEVES10",
-    0x2BD75688: "1_02_XBUT",
-    0x2BFE49E7: "REPORT_CARD",
-    0x2C119E84: "FRAME_NAME1",
-    0x2C119E85: "FRAME_NAME2",
-    0x2C1262B9: "PHOTO_COR",
-    0x2C138E0D: "GRADE_A",
-    0x2C138E0E: "GRADE_B",
-    0x2C138E0F: "GRADE_C",
-    0x2C138E10: "GRADE_D",
-    0x2C138E12: "GRADE_F",
-    0x2C14574D: "2_07_FAIL",
-    0x2C146B31: "STAT_MONEY",
-    0x2C168C23: "PHOTO_SAV",
-    0x2C1E8FAF: "SP_NINJAR_FT",
-    0x2C2BE45F: "4_01_WARN_01",
-    0x2C468023: "S_TAUNT_BULLY_01",
-    0x2C4702C5: "3_09_PCOUNT",
-    0x2C50244B: "MGSG_XSTART",
-    0x2C51EB4C: "4_06_NEXT_OP3",
-    0x2C520395: "4_S12_RETRIVE_ITEM",
-    0x2C54D066: "SP_WRESTLING_FT",
-    0x2C5B2128: "SM_PHOTO1",
-    0x2C5B2129: "SM_PHOTO2",
-    0x2C5B212A: "SM_PHOTO3",
-    0x2C5B212B: "SM_PHOTO4",
-    0x2C5B212C: "SM_PHOTO5",
-    0x2C5E6015: "2_B_10",
-    0x2C5E6016: "2_B_11",
-    0x2C5EFB91: "LANALOG_FOOT",
-    0x2C60433C: "4_06_OUTOFBOUNDS",
-    0x2C66CD21: "2_08_DISGUISE",
-    0x2C6A4D9C: "AS_TR_OBJCOUNT",
-    0x2C74A703: "6_01_OBJ1",
-    0x2C76E2AB: "AS_LS_KIDFOUND",
-    0x2C7B2AFE: "AS_PT_RETURN",
-    0x2C7B3B42: "TUT_HUMI01",
-    0x2C7B3B43: "TUT_HUMI02",
-    0x2C7B3B44: "TUT_HUMI03",
-    0x2C7B3B45: "TUT_HUMI04",
-    0x2C7B3B46: "TUT_HUMI05",
-    0x2C7D73E0: "STAT_INT",
-    0x2C7F437E: "STAT_PCT",
-    0x2C83FCE1: "TITLE32_NAME0",
-    0x2C83FCE2: "TITLE32_NAME1",
-    0x2C83FCE3: "TITLE32_NAME2",
-    0x2C83FCE4: "TITLE32_NAME3",
-    0x2C845C7C: "B_SSLEEVES1",
-    0x2C845C7D: "B_SSLEEVES2",
-    0x2C845C7E: "B_SSLEEVES3",
-    0x2C8AD481: "STO_NONE",
-    0x2C8D6585: "PHO_BAD",
-    0x2C9224DF: "PHO_TRI",
-    0x2CAAEC39: "N_EARNEST",
-    0x2CAB8CEB: "1_B_BAR_RUSSELL",
-    0x2CB214B9: "5_B_OBJ1",
-    0x2CB214BA: "5_B_OBJ2",
-    0x2CB214BB: "5_B_OBJ3",
-    0x2CBBF2EB: "MGE2_T13G01WORDS",
-    0x2CCA13B6: "SP_NINJAW_FT",
-    0x2CD355BA: "MGGE_SRILLANKA",
-    0x2CD9724E: "1-07.SUB0001",
-    0x2CD9724F: "1-07.SUB0002",
-    0x2CD97250: "1-07.SUB0003",
-    0x2CD97251: "1-07.SUB0004",
-    0x2CD97252: "1-07.SUB0005",
-    0x2CD97253: "1-07.SUB0006",
-    0x2CD97254: "1-07.SUB0007",
-    0x2CD97255: "1-07.SUB0008",
-    0x2CD97256: "1-07.SUB0009",
-    0x2CD972D0: "1-07.SUB0010",
-    0x2CD972D1: "1-07.SUB0011",
-    0x2CD972D2: "1-07.SUB0012",
-    0x2CD972D3: "1-07.SUB0013",
-    0x2CD972D4: "1-07.SUB0014",
-    0x2CD972D5: "1-07.SUB0015",
-    0x2CD972D6: "1-07.SUB0016",
-    0x2CD972D7: "1-07.SUB0017",
-    0x2CD972D8: "1-07.SUB0018",
-    0x2CD972D9: "1-07.SUB0019",
-    0x2CD97353: "1-07.SUB0020",
-    0x2CD97354: "1-07.SUB0021",
-    0x2CD97355: "1-07.SUB0022",
-    0x2CD97356: "1-07.SUB0023",
-    0x2CD97357: "1-07.SUB0024",
-    0x2CD97358: "1-07.SUB0025",
-    0x2CD97359: "1-07.SUB0026",
-    0x2CD9735A: "1-07.SUB0027",
-    0x2CD9735B: "1-07.SUB0028",
-    0x2CD9735C: "1-07.SUB0029",
-    0x2CD973D6: "1-07.SUB0030",
-    0x2CD973D7: "1-07.SUB0031",
-    0x2CD973D8: "1-07.SUB0032",
-    0x2CD973D9: "1-07.SUB0033",
-    0x2CD973DA: "1-07.SUB0034",
-    0x2CD973DB: "1-07.SUB0035",
-    0x2CD973DC: "1-07.SUB0036",
-    0x2CD973DD: "1-07.SUB0037",
-    0x2CD973DE: "1-07.SUB0038",
-    0x2CD973DF: "1-07.SUB0039",
-    0x2CD9D308: "TITLE49_NUMNAMES",
-    0x2CF00467: "3B_BIKEWARN",
-    0x2D047470: "AS_RK_OBJCOUNT1",
-    0x2D094C69: "CRIME_LOCKPICKING",
-    0x2D09DDEC: "1_02B_WARNLEAVE",
-    0x2D1122ED: "ERR_FULL",
-    0x2D154B19: "AS_CONQUEROR",
-    0x2D2107A7: "SOC_PR_WARNING",
-    0x2D243513: "3_R08_TITLE",
-    0x2D2B1C31: "TAG_PREP_SM_01",
-    0x2D36DA1A: "BUTTON_LISTENING",
-    0x2D4D4010: "MGBT_45",
-    0x2D4D4011: "MGBT_46",
-    0x2D5B99E3: "LAWN1_01",
-    0x2D5B99E4: "LAWN1_02",
-    0x2D5B99E5: "LAWN1_03",
-    0x2D5E3FE7: "UP_SHOP1",
-    0x2D5E3FE8: "UP_SHOP2",
-    0x2D5E3FE9: "UP_SHOP3",
-    0x2D5E3FEA: "UP_SHOP4",
-    0x2D5E3FEB: "UP_SHOP5",
-    0x2D600EF5: "AS_SA2_OBJECTIVE",
-    0x2D629789: "5_B_TUT1",
-    0x2D62978A: "5_B_TUT2",
-    0x2D62978B: "5_B_TUT3",
-    0x2D714D0A: "N_JEZEBEL",
-    0x2D77D068: "AS_TC_COMPLETE",
-    0x2D7AAE35: "STO_UNIT",
-    0x2D7DA858: "TITLE12_NUMNAMES",
-    0x2D7DE77E: "LAWN2_01",
-    0x2D7DE77F: "LAWN2_02",
-    0x2D7DE780: "LAWN2_03",
-    0x2D84FC37: "TUT_KICK1",
-    0x2D84FC38: "TUT_KICK2",
-    0x2D918FB9: "AS_BALLOONS",
-    0x2DA75649: "2_04_RESPECTM",
-    0x2DBBA7F7: "TITLE35_NAME10",
-    0x2DBBA7F8: "TITLE35_NAME11",
-    0x2DBBA7F9: "TITLE35_NAME12",
-    0x2DBBA7FA: "TITLE35_NAME13",
-    0x2DBBA7FB: "TITLE35_NAME14",
-    0x2DBBA7FC: "TITLE35_NAME15",
-    0x2DBBA7FD: "TITLE35_NAME16",
-    0x2DBBA7FE: "TITLE35_NAME17",
-    0x2DBBA7FF: "TITLE35_NAME18",
-    0x2DBBA800: "TITLE35_NAME19",
-    0x2DBBA87A: "TITLE35_NAME20",
-    0x2DD28410: "AS_MA_ACTION",
-    0x2DD62D03: "CLASS_GRADES",
-    0x2DE47BF5: "MGSP_NUMBER",
-    0x2DE694D2: "MGM2_EXIT",
-    0x2DE82EDE: "LABEL_DIRECTINPUT",
-    0x2DEAADD3: "FUN_MTR_GHOST",
-    0x2DEB6893: "MEN_BLANK",
-    0x2DEB7E99: "4_06_NEXT_OP_1",
-    0x2DEB7E9A: "4_06_NEXT_OP_2",
-    0x2DF7681A: "5_03_TITLE",
-    0x2DFF96EA: "MC_GETREADY",
-    0x2E030AC8: "MGA2_INSTRUCTIONS_HEADING",
-    0x2E0ABDDB: "MC_YESNO",
-    0x2E448AA0: "ERR_OPEN",
-    0x2E459121: "1_11_X2_UNLKCSTM",
-    0x2E4FE3CD: "MGT_GRASS_FE",
-    0x2E53C6FA: "AS_SB_OBJCOUNT1",
-    0x2E5B6B8D: "START_CONF",
-    0x2E5B6B9B: "START_CONT",
-    0x2E6D2B56: "MGM2_INFO",
-    0x2E781759: "MSN_CONT",
-    0x2E85015A: "MGGE_MISSISSIPPI",
-    0x2E8AD939: "PHOTO_FULL_P",
-    0x2E9ABFBA: "TITLE19_NAME0",
-    0x2E9ABFBB: "TITLE19_NAME1",
-    0x2E9EBBBE: "SP_NUTCRACK_FT",
-    0x2EA3A4F3: "",
-    0x2EBF8D80: "4_04_FINDTHAD",
-    0x2EC5186E: "STO_ROTATE2",
-    0x2ECD6BD2: "STO_INVENTORYFULLT",
-    0x2ED65FF4: "AS_GD_OBJECTIVE",
-    0x2EE7A9BF: "FAC_NERDS",
-    0x2EF2F0B9: "N_CHAD",
-    0x2F0168DA: "3_S08_MOBJ_01",
-    0x2F0168DB: "3_S08_MOBJ_02",
-    0x2F0168DC: "3_S08_MOBJ_03",
-    0x2F0168DD: "3_S08_MOBJ_04",
-    0x2F07FD2D: "MGCE_T2GROUPS",
-    0x2F0CA57F: "BUT_CHEMSET",
-    0x2F0CEE22: "2_S07_SCENE_01",
-    0x2F0DEC37: "SOC_GEN_SHOVEDANGRY",
-    0x2F17DECD: "N_DREW",
-    0x2F1A7747: "MGM2_T3GROUPS",
-    0x2F25033E: "1_04_BOT",
-    0x2F278863: "GAME_PAUSED",
-    0x2F27A198: "1_04_LOT",
-    0x2F28FD08: "1_S01_REWARD",
-    0x2F28FE3B: "START_INVC",
-    0x2F365124: "2_01_FAILTIME",
-    0x2F36866F: "N_EDNA",
-    0x2F37644F: "MGCE_SCORE",
-    0x2F3824BF: "MGCE_SCRAM",
-    0x2F3EC371: "STATUS_NERDS",
-    0x2F48B462: "MGMA_T1GROUPS",
-    0x2F5BEBD9: "1_G1_TITLE",
-    0x2F6C2340: "AS_SC_FAIL",
-    0x2F70ABEB: "MON_CHANGE",
-    0x2F7114FB: "MGBI_FROG_0",
-    0x2F7114FC: "MGBI_FROG_1",
-    0x2F7114FD: "MGBI_FROG_2",
-    0x2F7114FE: "MGBI_FROG_3",
-    0x2F7114FF: "MGBI_FROG_4",
-    0x2F711500: "MGBI_FROG_5",
-    0x2F711501: "MGBI_FROG_6",
-    0x2F711502: "MGBI_FROG_7",
-    0x2F711503: "MGBI_FROG_8",
-    0x2F711504: "MGBI_FROG_9",
-    0x2F73EEA3: "TITLE5_NAME0",
-    0x2F73EEA4: "TITLE5_NAME1",
-    0x2F73EEA5: "TITLE5_NAME2",
-    0x2F73EEA6: "TITLE5_NAME3",
-    0x2F73EEA7: "TITLE5_NAME4",
-    0x2F73EEA8: "TITLE5_NAME5",
-    0x2F73EEA9: "TITLE5_NAME6",
-    0x2F73EEAA: "TITLE5_NAME7",
-    0x2F73EEAB: "TITLE5_NAME8",
-    0x2F73EEAC: "TITLE5_NAME9",
-    0x2F76B472: "3_R08S_TITLE",
-    0x2F79BC47: "RESCUE_START1",
-    0x2F79BC48: "RESCUE_START2",
-    0x2F7A5AAE: "N_GARY",
-    0x2F7C4A7F: "MGCA_INSTRUCTIONS_FLOATER_BOUNCER_DESC",
-    0x2F7E0517: "N_GORD",
-    0x2F808FDD: "3_05_KEY",
-    0x2F8C6DEF: "3_R09_LEFT",
-    0x2F91F1CD: "USE_TOILET",
-    0x2F9AEE6E: "GKART_1ST",
-    0x2F9B2ED8: "GKART_2ND",
-    0x2F9B73ED: "GKART_3RD",
-    0x2F9BB800: "GKART_4TH",
-    0x2F9BFB09: "GKART_5TH",
-    0x2F9C3E12: "GKART_6TH",
-    0x2FA0AF88: "GKART_GP1",
-    0x2FA0AF89: "GKART_GP2",
-    0x2FA0AF8A: "GKART_GP3",
-    0x2FA0AF8B: "GKART_GP4",
-    0x2FA0AF8C: "GKART_GP5",
-    0x2FA0AF8D: "GKART_GP6",
-    0x2FA0AF8E: "GKART_GP7",
-    0x2FA0AF8F: "GKART_GP8",
-    0x2FA0AF90: "GKART_GP9",
-    0x2FA494A5: "TITLE62_NUMNAMES",
-    0x2FB0CAA6: "MGPH_SKELETON",
-    0x2FBAA4B1: "MGMA_SEL",
-    0x2FBBBF13: "2_GN_FAIL_01",
-    0x2FC15C3F: "N_FREELEY",
-    0x2FC46CE3: "N_IVAN",
-    0x2FDB555F: "R_SSHAG_01",
-    0x2FDB5560: "R_SSHAG_02",
-    0x2FDB5561: "R_SSHAG_03",
-    0x2FDB5562: "R_SSHAG_04",
-    0x2FE5355D: "MGM2_TIME",
-    0x2FE68023: "N_JURI",
-    0x2FF7FAAB: "MGS2_NUMBER",
-    0x2FFFAC23: "MGCA_EXIT_TEXT",
-    0x3003910D: "N_KARL",
-    0x3005AB36: "FAC_TOWNIES",
-    0x3005B337: "2_06_CHOCOGIVE",
-    0x301E6E93: "MGB2_ALIEN_0",
-    0x301E6E94: "MGB2_ALIEN_1",
-    0x301E6E95: "MGB2_ALIEN_2",
-    0x301E6E96: "MGB2_ALIEN_3",
-    0x301E6E97: "MGB2_ALIEN_4",
-    0x301E6E98: "MGB2_ALIEN_5",
-    0x301E6E99: "MGB2_ALIEN_6",
-    0x301E6E9A: "MGB2_ALIEN_7",
-    0x301E6E9B: "MGB2_ALIEN_8",
-    0x301E6E9C: "MGB2_ALIEN_9",
-    0x3026D2DB: "3-01AB.SUB0001",
-    0x3026D2DC: "3-01AB.SUB0002",
-    0x3026D2DD: "3-01AB.SUB0003",
-    0x3026D2DE: "3-01AB.SUB0004",
-    0x3026D2DF: "3-01AB.SUB0005",
-    0x3026D2E0: "3-01AB.SUB0006",
-    0x3026D2E1: "3-01AB.SUB0007",
-    0x3026E945: "N_LEON",
-    0x3026FAB4: "FEH_DIS",
-    0x302951EA: "FEH_MAP",
-    0x30298609: "N_LOLA",
-    0x302B16C8: "N_LUIS",
-    0x30335B5A: "BATHROOM_1ST_FLOOR",
-    0x3033F1C8: "CHAPT2TRANS_NAME",
-    0x3036AF8C: "AS_SR_COMPLETE",
-    0x303DCB31: "AS_BH_OBJECTIVE",
-    0x303F7130: "AS_EG_COUNTER",
-    0x304C9E4F: "N_MROH",
-    0x30507DED: "2_06_GETBACK",
-    0x305125B8: "",
-    0x30557888: "MG_MUSIC",
-    0x306A7ADD: "N_NATE",
-    0x306B8167: "N_NEIL",
-    0x307C67D8: "3_06_FIGHTPEANUT",
-    0x308527F0: "MGE2_SHORTW01",
-    0x308527F1: "MGE2_SHORTW02",
-    0x308527F2: "MGE2_SHORTW03",
-    0x308527F3: "MGE2_SHORTW04",
-    0x308527F4: "MGE2_SHORTW05",
-    0x308527F5: "MGE2_SHORTW06",
-    0x308527F6: "MGE2_SHORTW07",
-    0x308527F7: "MGE2_SHORTW08",
-    0x308527F8: "MGE2_SHORTW09",
-    0x30852872: "MGE2_SHORTW10",
-    0x30852873: "MGE2_SHORTW11",
-    0x30852874: "MGE2_SHORTW12",
-    0x30852875: "MGE2_SHORTW13",
-    0x30852876: "MGE2_SHORTW14",
-    0x30852877: "MGE2_SHORTW15",
-    0x30852878: "MGE2_SHORTW16",
-    0x30852879: "MGE2_SHORTW17",
-    0x3085287A: "MGE2_SHORTW18",
-    0x3085287B: "MGE2_SHORTW19",
-    0x308528F5: "MGE2_SHORTW20",
-    0x308528F6: "MGE2_SHORTW21",
-    0x308528F7: "MGE2_SHORTW22",
-    0x308528F8: "MGE2_SHORTW23",
-    0x308528F9: "MGE2_SHORTW24",
-    0x308528FA: "MGE2_SHORTW25",
-    0x308528FB: "MGE2_SHORTW26",
-    0x308528FC: "MGE2_SHORTW27",
-    0x308528FD: "MGE2_SHORTW28",
-    0x308528FE: "MGE2_SHORTW29",
-    0x30852978: "MGE2_SHORTW30",
-    0x308FE338: "N_OMAR",
-    0x3091C22D: "N_OTTO",
-    0x309F1A9D: "AS_CP_OBJCOUNT",
-    0x30AA17AD: "FE_NOCLASSES",
-    0x30AF1DF0: "2_06_CHOCOLATE",
-    0x30B5F9E9: "CRIME_PEDATTACKAUTHORITY",
-    0x30BDB91F: "MGPH_VIKING",
-    0x30C0FA02: "FE_PAUSE_C",
-    0x30C8626C: "SOC_G_RELAX",
-    0x30CA4540: "5_G5_FINALSCORE01",
-    0x30CA4541: "5_G5_FINALSCORE02",
-    0x30CD108D: "TITLE65_NAME0",
-    0x30CD108E: "TITLE65_NAME1",
-    0x30CD108F: "TITLE65_NAME2",
-    0x30CD1090: "TITLE65_NAME3",
-    0x30CD1091: "TITLE65_NAME4",
-    0x30CD1092: "TITLE65_NAME5",
-    0x30CD1093: "TITLE65_NAME6",
-    0x30CD1094: "TITLE65_NAME7",
-    0x30CD1095: "TITLE65_NAME8",
-    0x30CDC721: "STAT_FLOAT",
-    0x30D2DDE4: "STO_UNITPRICE",
-    0x30E7676C: "DDMMYYYY",
-    0x30F418FB: "CHEM_LAB",
-    0x310A50F4: "1_10_FURNEXT",
-    0x31102A51: "",
-    0x31106A3E: "REPBAND",
-    0x3116A818: "CRIME_WEAPONVIOLENCE",
-    0x31170B0B: "N_SETH",
-    0x311AEEDF: "N_STAN",
-    0x311FA8CA: "2_G2_EMPTY",
-    0x3126ED50: "CHAPT2TRANS_ULCK",
-    0x312CFBD7: "AS_PT_OBJECTIVE",
-    0x312DC1AE: "MRESPECT_JFRIEND",
-    0x3134888C: "REPCHES",
-    0x31375856: "STO_NAVIGATE",
-    0x313A1804: "N_THAD",
-    0x313A1A1B: "N_THEO",
-    0x313CBD9D: "N_TROY",
-    0x313DAD4E: "2_06_KISS",
-    0x3155EEDF: "TITLE46_NUMNAMES",
-    0x3159726F: "REPDRAM",
-    0x3163380A: "FEO_CHGCTRL",
-    0x31673587: "MIDWAY",
-    0x316751F2: "1_07_TITLE",
-    0x316D3D75: "SOC_PR_DISMISS",
-    0x3177D94E: "PREP_HOUSE",
-    0x3178F38D: "MGT_GRASS",
-    0x3187F5B1: "AS_F4_GREET",
-    0x31931039: "1_07_COMMAND",
-    0x3196D0E6: "TITLE7_NUMNAMES",
-    0x319D4BBB: "REPFOOT",
-    0x319F2D20: "N_WADE",
-    0x31AAD74A: "AS_EG_ACTION",
-    0x31AB0CB5: "3_S03_MOBJ_01",
-    0x31AB0CB6: "3_S03_MOBJ_02",
-    0x31AB0CB7: "3_S03_MOBJ_03",
-    0x31AB0CB8: "3_S03_MOBJ_04",
-    0x31AB0CB9: "3_S03_MOBJ_05",
-    0x31AB0CBA: "3_S03_MOBJ_06",
-    0x31AB0CBB: "3_S03_MOBJ_07",
-    0x31AB0CBC: "3_S03_MOBJ_08",
-    0x31B208B9: "3_01A_MOBJ_END",
-    0x31B31251: "MGCA_INSTRUCTIONS_SPEEDBOOST_DESC",
-    0x31BD7D79: "REPGGHT",
-    0x31BEB23A: "XSTART",
-    0x31C4E45D: "LOVEAND",
-    0x31C783F8: "SP_BIKEHELMET",
-    0x31CB651F: "TAG_NOSPRAY",
-    0x31CC416F: "MGPH_CHEMISTRY",
-    0x31EA4545: "TITLE50_NAME0",
-    0x31EAC419: "TPM_RESTART",
-    0x31FBE691: "AS_SR_ACTION",
-    0x320725AA: "N_ZEKE",
-    0x32102F6C: "TPM_RESUMEG",
-    0x321263B0: "N_TRENT",
-    0x32164D03: "AS_GS_COMPLETE",
-    0x321C0C6B: "AS_CP_ACTION",
-    0x322697A6: "AS_FC_FAILED",
-    0x3232C60C: "1_07_BUCKYKO",
-    0x3233BE45: "BUTTON_CR_D",
-    0x3233BE59: "BUTTON_CR_X",
-    0x32482BAE: "AS_TF_ACTION",
-    0x32578ECA: "CRIME_ESCAPE",
-    0x326FBE63: "DARES",
-    0x327188C1: "DAY01",
-    0x327188C2: "DAY02",
-    0x327188C3: "DAY03",
-    0x327383F1: "2_03_TITLE",
-    0x3281D3E4: "SOC_PR_DEMAND",
-    0x328ACF25: "REPMETL",
-    0x3290C228: "2-06.SUB0001",
-    0x3290C229: "2-06.SUB0002",
-    0x3290C22A: "2-06.SUB0003",
-    0x3290C22B: "2-06.SUB0004",
-    0x3290C22C: "2-06.SUB0005",
-    0x3290C22D: "2-06.SUB0006",
-    0x3290C22E: "2-06.SUB0007",
-    0x3290C22F: "2-06.SUB0008",
-    0x3290C230: "2-06.SUB0009",
-    0x3290C2AA: "2-06.SUB0010",
-    0x3290C2AB: "2-06.SUB0011",
-    0x3290C2AC: "2-06.SUB0012",
-    0x3290C2AD: "2-06.SUB0013",
-    0x3290C2AE: "2-06.SUB0014",
-    0x3290C2AF: "2-06.SUB0015",
-    0x3290C2B0: "2-06.SUB0016",
-    0x3290C2B1: "2-06.SUB0017",
-    0x3290C2B2: "2-06.SUB0018",
-    0x3290C2B3: "2-06.SUB0019",
-    0x3290C32D: "2-06.SUB0020",
-    0x3290C32E: "2-06.SUB0021",
-    0x3290C32F: "2-06.SUB0022",
-    0x3290C330: "2-06.SUB0023",
-    0x3290C331: "2-06.SUB0024",
-    0x3290C332: "2-06.SUB0025",
-    0x3290C333: "2-06.SUB0026",
-    0x3290C334: "2-06.SUB0027",
-    0x3290C335: "2-06.SUB0028",
-    0x32956892: "DB_01",
-    0x32956893: "DB_02",
-    0x32956894: "DB_03",
-    0x32956895: "DB_04",
-    0x32956896: "DB_05",
-    0x32A19F94: "AS_SL_OBJCOUNT1",
-    0x32B5CE70: "3_R08_BWAC",
-    0x32B5D829: "3_R08_BWTC",
-    0x32B960CF: "AS_RO_ACTION",
-    0x32C16214: "AS_EI_FAIL",
-    0x32C33B9F: "AS_JIMMY_SLOW",
-    0x32D8633D: "BUT_CLOTHSTR",
-    0x32E66A1C: "R_HWOOD",
-    0x32E9150B: "AS_EB_COUNTER",
-    0x32F1A3A1: "AS_CN_FAIL",
-    0x32FB51F9: "1_04_WRONG_GUN",
-    0x33014E90: "CLT_SCHOOLS_TITLE",
-    0x3305A5EC: "AS_SC_ACTION",
-    0x330C1FDB: "AS_MA_OBJECTIVE",
-    0x330F8156: "2_S02_FAIL01",
-    0x330F8157: "2_S02_FAIL02",
-    0x330F8158: "2_S02_FAIL03",
-    0x330F8159: "2_S02_FAIL04",
-    0x33305701: "AS_F4_FAILED",
-    0x33336A6A: "BIKECOMBAT_TUT01",
-    0x333652A9: "REPRESL",
-    0x333CA3CC: "MGT_SHOOTING",
-    0x333D71A7: "AD_FF_UNLOCK",
-    0x333EC471: "1-02D.SUB0001",
-    0x333EC472: "1-02D.SUB0002",
-    0x333EC473: "1-02D.SUB0003",
-    0x333EC474: "1-02D.SUB0004",
-    0x333EC475: "1-02D.SUB0005",
-    0x333EC476: "1-02D.SUB0006",
-    0x333EC477: "1-02D.SUB0007",
-    0x333EC478: "1-02D.SUB0008",
-    0x333EC479: "1-02D.SUB0009",
-    0x333EC4F3: "1-02D.SUB0010",
-    0x333EC4F4: "1-02D.SUB0011",
-    0x333EC4F5: "1-02D.SUB0012",
-    0x333EC4F6: "1-02D.SUB0013",
-    0x333EC4F7: "1-02D.SUB0014",
-    0x333EC4F8: "1-02D.SUB0015",
-    0x333EC4F9: "1-02D.SUB0016",
-    0x333EC4FA: "1-02D.SUB0017",
-    0x333EC4FB: "1-02D.SUB0018",
-    0x333EC4FC: "1-02D.SUB0019",
-    0x333EC576: "1-02D.SUB0020",
-    0x333EC577: "1-02D.SUB0021",
-    0x333F7A41: "AS_SB_AMMO",
-    0x335D51C9: "REPSWIM",
-    0x335DF7A3: "AS_AE_COMPLETE",
-    0x335FD48F: "BUTTON_L1_D",
-    0x335FD4A3: "BUTTON_L1_X",
-    0x33601798: "BUTTON_L2_D",
-    0x336017AC: "BUTTON_L2_X",
-    0x33605AA1: "BUTTON_L3_D",
-    0x33605AB5: "BUTTON_L3_X",
-    0x336610AC: "BUTTON_LIFT",
-    0x3375CD80: "SP_PIESHIRT",
-    0x33779D2B: "MGT_ENGLISH_FE",
-    0x33783DF7: "BUT_TATTOO",
-    0x337AE4A0: "REPTEAC",
-    0x337DF349: "MGCE_T5G01WORDS",
-    0x337ED7CB: "REPTTLF",
-    0x338273D4: "DISPB",
-    0x338273DE: "DISPL",
-    0x3382C7FA: "TUT_WREST1",
-    0x338781CD: "CRIME_DEMERITADDED",
-    0x338C0CE8: "EXIT_HILITE",
-    0x338D8D79: "4_S11_TITLE",
-    0x33900807: "W_STINKBOMB",
-    0x33949596: "TUT_DPAD1",
-    0x33949597: "TUT_DPAD2",
-    0x33AB4DD9: "1-1-2.SUB0001",
-    0x33AB4DDA: "1-1-2.SUB0002",
-    0x33AB4DDB: "1-1-2.SUB0003",
-    0x33AB4DDC: "1-1-2.SUB0004",
-    0x33AB4DDD: "1-1-2.SUB0005",
-    0x33AB4DDE: "1-1-2.SUB0006",
-    0x33AB4DDF: "1-1-2.SUB0007",
-    0x33AB4DE0: "1-1-2.SUB0008",
-    0x33AB4DE1: "1-1-2.SUB0009",
-    0x33AB4E5B: "1-1-2.SUB0010",
-    0x33AB4E5C: "1-1-2.SUB0011",
-    0x33AB4E5D: "1-1-2.SUB0012",
-    0x33AB4E5E: "1-1-2.SUB0013",
-    0x33AB4E5F: "1-1-2.SUB0014",
-    0x33AB4E60: "1-1-2.SUB0015",
-    0x33AB4E61: "1-1-2.SUB0016",
-    0x33AB4E62: "1-1-2.SUB0017",
-    0x33AB4E63: "1-1-2.SUB0018",
-    0x33AB4E64: "1-1-2.SUB0019",
-    0x33AB4EDE: "1-1-2.SUB0020",
-    0x33AB4EDF: "1-1-2.SUB0021",
-    0x33AB4EE0: "1-1-2.SUB0022",
-    0x33AB4EE1: "1-1-2.SUB0023",
-    0x33AB4EE2: "1-1-2.SUB0024",
-    0x33AB4EE3: "1-1-2.SUB0025",
-    0x33AB4EE4: "1-1-2.SUB0026",
-    0x33AB4EE5: "1-1-2.SUB0027",
-    0x33AB4EE6: "1-1-2.SUB0028",
-    0x33AB4EE7: "1-1-2.SUB0029",
-    0x33AB4F61: "1-1-2.SUB0030",
-    0x33AB4F62: "1-1-2.SUB0031",
-    0x33AB4F63: "1-1-2.SUB0032",
-    0x33AB4F64: "1-1-2.SUB0033",
-    0x33AB4F65: "1-1-2.SUB0034",
-    0x33AB4F66: "1-1-2.SUB0035",
-    0x33AC4411: "TITLE84_NAME10",
-    0x33AC4412: "TITLE84_NAME11",
-    0x33AC4413: "TITLE84_NAME12",
-    0x33AC4414: "TITLE84_NAME13",
-    0x33AC4415: "TITLE84_NAME14",
-    0x33AC4416: "TITLE84_NAME15",
-    0x33AC4417: "TITLE84_NAME16",
-    0x33AC4418: "TITLE84_NAME17",
-    0x33AC4419: "TITLE84_NAME18",
-    0x33AC441A: "TITLE84_NAME19",
-    0x33AC4494: "TITLE84_NAME20",
-    0x33AC4495: "TITLE84_NAME21",
-    0x33AC4496: "TITLE84_NAME22",
-    0x33AC4497: "TITLE84_NAME23",
-    0x33AC7817: "N_DONALD",
-    0x33AF2560: "N_MRGALLOWAY",
-    0x33B44433: "CRIME_BREAK_AND_ENTER",
-    0x33C0A1D3: "S_SNEAKERS1",
-    0x33C0A1D4: "S_SNEAKERS2",
-    0x33C3DAAA: "CHAPT3TRANS_TITLE",
-    0x33CE333A: "DISC_08_WII",
-    0x33D3BCF8: "M_FAIL",
-    0x33D6B4EE: "DESC_NERD_SM_01",
-    0x33D9A892: "6_02_RUSSELL",
-    0x33E5BA3D: "GKART_TIMETRIAL",
-    0x33F0BF52: "MGCA_INSTRUCTIONS_RETURN_TO_GAME_TEXT",
-    0x33F2721F: "BUTTON_PUSH",
-    0x33F9993F: "S_TAUNT_INIT_SMALL_01",
-    0x33FCAA2B: "P_LAWN_OBJ",
-    0x3401081E: "TITLE37_NAME0",
-    0x3401081F: "TITLE37_NAME1",
-    0x34010820: "TITLE37_NAME2",
-    0x34010821: "TITLE37_NAME3",
-    0x34010822: "TITLE37_NAME4",
-    0x34010823: "TITLE37_NAME5",
-    0x34010824: "TITLE37_NAME6",
-    0x34010825: "TITLE37_NAME7",
-    0x34010826: "TITLE37_NAME8",
-    0x34010827: "TITLE37_NAME9",
-    0x34011ADF: "5_G5_TIMEUP",
-    0x340B7E64: "AS_BB_FAIL",
-    0x341344F7: "COASTER_MENU",
-    0x342DA631: "BUTTON_R1_D",
-    0x342DA645: "BUTTON_R1_X",
-    0x342DE93A: "BUTTON_R2_D",
-    0x342DE94E: "BUTTON_R2_X",
-    0x342E2C43: "BUTTON_R3_D",
-    0x342E2C57: "BUTTON_R3_X",
-    0x3433EE22: "BUTTON_STEALTH",
-    0x3434142A: "1_G1_OGETDIA",
-    0x3434554B: "AS_PI_ACTION",
-    0x343740E2: "3_04_EMPTY",
-    0x343A61A5: "N_DORSEY",
-    0x343D3950: "AS_LS_COMPLETE",
-    0x344F0260: "5_05_BROKEPOT",
-    0x345189EE: "4_02_KEYCODE",
-    0x345854EC: "BUTTON_SQ_D",
-    0x34585500: "BUTTON_SQ_X",
-    0x345E4ECE: "FEPA_HILITE",
-    0x345EF837: "SOC_GEN_REACTVOMIT",
-    0x3469BE4F: "TITLE71_NAME10",
-    0x3469BE50: "TITLE71_NAME11",
-    0x3469BE51: "TITLE71_NAME12",
-    0x3469BE52: "TITLE71_NAME13",
-    0x3469BE53: "TITLE71_NAME14",
-    0x3469BE54: "TITLE71_NAME15",
-    0x3469BE55: "TITLE71_NAME16",
-    0x3469BE56: "TITLE71_NAME17",
-    0x3469BE57: "TITLE71_NAME18",
-    0x3469BE58: "TITLE71_NAME19",
-    0x3469BED2: "TITLE71_NAME20",
-    0x3469BED3: "TITLE71_NAME21",
-    0x3469BED4: "TITLE71_NAME22",
-    0x3469BED5: "TITLE71_NAME23",
-    0x3469BED6: "TITLE71_NAME24",
-    0x3469BED7: "TITLE71_NAME25",
-    0x3469BED8: "TITLE71_NAME26",
-    0x3469BED9: "TITLE71_NAME27",
-    0x3469BEDA: "TITLE71_NAME28",
-    0x3469BEDB: "TITLE71_NAME29",
-    0x3469BF55: "TITLE71_NAME30",
-    0x3469BF56: "TITLE71_NAME31",
-    0x3469BF57: "TITLE71_NAME32",
-    0x3469BF58: "TITLE71_NAME33",
-    0x3469BF59: "TITLE71_NAME34",
-    0x3469BF5A: "TITLE71_NAME35",
-    0x3469BF5B: "TITLE71_NAME36",
-    0x3469BF5C: "TITLE71_NAME37",
-    0x3469BF5D: "TITLE71_NAME38",
-    0x3469BF5E: "TITLE71_NAME39",
-    0x3469BFD8: "TITLE71_NAME40",
-    0x3469BFD9: "TITLE71_NAME41",
-    0x3469BFDA: "TITLE71_NAME42",
-    0x3469BFDB: "TITLE71_NAME43",
-    0x3469BFDC: "TITLE71_NAME44",
-    0x3469BFDD: "TITLE71_NAME45",
-    0x3469BFDE: "TITLE71_NAME46",
-    0x3469BFDF: "TITLE71_NAME47",
-    0x3469BFE0: "TITLE71_NAME48",
-    0x3469BFE1: "TITLE71_NAME49",
-    0x3469C05B: "TITLE71_NAME50",
-    0x3469C05C: "TITLE71_NAME51",
-    0x3469C05D: "TITLE71_NAME52",
-    0x3469C05E: "TITLE71_NAME53",
-    0x3469C05F: "TITLE71_NAME54",
-    0x3469C060: "TITLE71_NAME55",
-    0x3469C061: "TITLE71_NAME56",
-    0x3469C062: "TITLE71_NAME57",
-    0x346CCA79: "CONT_08_WII",
-    0x348116B5: "FEI_SEL_CLCTBLS",
-    0x348BA3CB: "AS_BR_OBJECTIVE",
-    0x348C67D7: "AS_PETEY_ACTION",
-    0x3498AC53: "2_02_INSTRUC01",
-    0x3498AC55: "2_02_INSTRUC03",
-    0x3498AC56: "2_02_INSTRUC04",
-    0x34AE22D1: "USE_FORTUNEGET",
-    0x34B8CAD2: "MGGE_ALBERTA",
-    0x34BBC238: "CHAPT1NAME",
-    0x34C13457: "CRIME_FIGHT",
-    0x34C1534A: "MGE2_SCORE",
-    0x34C213BA: "MGE2_SCRAM",
-    0x34C2B04A: "CHAPT5MESSAGE",
-    0x34D47D4E: "CARD_03_WII",
-    0x34ED9666: "N_MANDY",
-    0x3505CCAC: "TUT_NOHELM01",
-    0x3505CCAD: "TUT_NOHELM02",
-    0x350FBA0D: "MGPH_BRAIN",
-    0x350FD4FD: "3_08_OBJ01",
-    0x35105492: "MGB2_TURTLE_0",
-    0x35105493: "MGB2_TURTLE_1",
-    0x35105494: "MGB2_TURTLE_2",
-    0x35105495: "MGB2_TURTLE_3",
-    0x35105496: "MGB2_TURTLE_4",
-    0x35105497: "MGB2_TURTLE_5",
-    0x35105498: "MGB2_TURTLE_6",
-    0x35105499: "MGB2_TURTLE_7",
-    0x3510549A: "MGB2_TURTLE_8",
-    0x3510549B: "MGB2_TURTLE_9",
-    0x351119B5: "CONT_11_WII",
-    0x351DEB0E: "CRIME_FIREALARM",
-    0x351E3CD6: "TITLE22_NAME0",
-    0x351E3CD7: "TITLE22_NAME1",
-    0x352ACA2B: "M_PASS",
-    0x352B605C: "MGPH_CHALKBOARD",
-    0x35325A07: "1_11X2_PICKUPPOOP",
-    0x353A6603: "2-01.SUB0001",
-    0x353A6604: "2-01.SUB0002",
-    0x353A6605: "2-01.SUB0003",
-    0x353A6606: "2-01.SUB0004",
-    0x353A6607: "2-01.SUB0005",
-    0x353A6608: "2-01.SUB0006",
-    0x353A6609: "2-01.SUB0007",
-    0x353A660A: "2-01.SUB0008",
-    0x353A660B: "2-01.SUB0009",
-    0x353A6685: "2-01.SUB0010",
-    0x353A6686: "2-01.SUB0011",
-    0x353A6687: "2-01.SUB0012",
-    0x353A6688: "2-01.SUB0013",
-    0x353A6689: "2-01.SUB0014",
-    0x353A668A: "2-01.SUB0015",
-    0x353A668B: "2-01.SUB0016",
-    0x353A668C: "2-01.SUB0017",
-    0x353A668D: "2-01.SUB0018",
-    0x353A668E: "2-01.SUB0019",
-    0x353A6708: "2-01.SUB0020",
-    0x353A6709: "2-01.SUB0021",
-    0x353A670A: "2-01.SUB0022",
-    0x353A670B: "2-01.SUB0023",
-    0x353A670C: "2-01.SUB0024",
-    0x353B6E04: "2_08_DESTROY",
-    0x3546C106: "FEA_CTD",
-    0x35470395: "FEA_DSM",
-    0x354D5765: "USE_CLEAN",
-    0x354E69A1: "USE_CLIMB",
-    0x354EAA79: "MGGE_NEPAL",
-    0x354FFEEC: "USE_CLOSE",
-    0x35711FE8: "TUT_APOLOGY1",
-    0x35772A01: "MGPH_BUCKY",
-    0x357F4E88: "3_S10_RESPECTM",
-    0x357F4E8B: "3_S10_RESPECTP",
-    0x35882486: "SP_BIKESHORTS",
-    0x35B65C8B: "USE_COMIC",
-    0x35C134D4: "MGGE_BOTSWANA",
-    0x35CF016C: "MGGE_SASKATCHEWAN",
-    0x35D20AB6: "TITLE43_NUMNAMES",
-    0x35D587A6: "MGGE_NIGER",
-    0x35D770A8: "SOC_G_DEPART",
-    0x35DFF6DC: "MGPH_REDMASK",
-    0x35E3C496: "SP_BOXING_G_L",
-    0x35E3C49C: "SP_BOXING_G_R",
-    0x35FA7603: "AS_MA_COMPLETE",
-    0x36000730: "4_S12_PEANUT_GOT",
-    0x3601E307: "ALBUM_FULL",
-    0x36040DA6: "ENABLE_XINPUT",
-    0x360437BA: "4_S12_PEANUT_WON",
-    0x36122C26: "FE_PHOTO",
-    0x3612ECBD: "TITLE4_NUMNAMES",
-    0x36236CDA: "GKART_LAST_PLACE",
-    0x36256BEC: "MGSG_FOOTER",
-    0x3629D660: "5_T1_OBJ01",
-    0x3629D661: "5_T1_OBJ02",
-    0x3629D662: "5_T1_OBJ03",
-    0x363358F1: "TITLE83_NAME0",
-    0x363358F2: "TITLE83_NAME1",
-    0x363358F3: "TITLE83_NAME2",
-    0x363358F4: "TITLE83_NAME3",
-    0x363358F5: "TITLE83_NAME4",
-    0x363358F6: "TITLE83_NAME5",
-    0x363358F7: "TITLE83_NAME6",
-    0x363358F8: "TITLE83_NAME7",
-    0x363358F9: "TITLE83_NAME8",
-    0x363358FA: "TITLE83_NAME9",
-    0x3639B8F1: "MGE2_T1G01W01",
-    0x3639B8F2: "MGE2_T1G01W02",
-    0x3639B8F3: "MGE2_T1G01W03",
-    0x3639B8F4: "MGE2_T1G01W04",
-    0x3639B8F5: "MGE2_T1G01W05",
-    0x3639B8F6: "MGE2_T1G01W06",
-    0x3639B8F7: "MGE2_T1G01W07",
-    0x3639B8F8: "MGE2_T1G01W08",
-    0x3639B8F9: "MGE2_T1G01W09",
-    0x3639B973: "MGE2_T1G01W10",
-    0x3639B974: "MGE2_T1G01W11",
-    0x3639B975: "MGE2_T1G01W12",
-    0x3639B976: "MGE2_T1G01W13",
-    0x3639B977: "MGE2_T1G01W14",
-    0x3639B978: "MGE2_T1G01W15",
-    0x3639B979: "MGE2_T1G01W16",
-    0x3639B97A: "MGE2_T1G01W17",
-    0x3639B97B: "MGE2_T1G01W18",
-    0x3639B97C: "MGE2_T1G01W19",
-    0x3639B9F6: "MGE2_T1G01W20",
-    0x3639B9F7: "MGE2_T1G01W21",
-    0x3639B9F8: "MGE2_T1G01W22",
-    0x3639B9F9: "MGE2_T1G01W23",
-    0x3639B9FA: "MGE2_T1G01W24",
-    0x3639B9FB: "MGE2_T1G01W25",
-    0x3639B9FC: "MGE2_T1G01W26",
-    0x3639B9FD: "MGE2_T1G01W27",
-    0x3639B9FE: "MGE2_T1G01W28",
-    0x3639B9FF: "MGE2_T1G01W29",
-    0x3639BA79: "MGE2_T1G01W30",
-    0x3639BA7A: "MGE2_T1G01W31",
-    0x3639BA7B: "MGE2_T1G01W32",
-    0x3639BA7C: "MGE2_T1G01W33",
-    0x3639BA7D: "MGE2_T1G01W34",
-    0x3639BA7E: "MGE2_T1G01W35",
-    0x3639BA7F: "MGE2_T1G01W36",
-    0x3639BA80: "MGE2_T1G01W37",
-    0x3639BA81: "MGE2_T1G01W38",
-    0x3639BA82: "MGE2_T1G01W39",
-    0x3639BAFC: "MGE2_T1G01W40",
-    0x3639BAFD: "MGE2_T1G01W41",
-    0x3639BAFE: "MGE2_T1G01W42",
-    0x3639BAFF: "MGE2_T1G01W43",
-    0x3639BB00: "MGE2_T1G01W44",
-    0x3639BB01: "MGE2_T1G01W45",
-    0x3639BB02: "MGE2_T1G01W46",
-    0x3639BB03: "MGE2_T1G01W47",
-    0x3639BB04: "MGE2_T1G01W48",
-    0x3639BB05: "MGE2_T1G01W49",
-    0x3639BB7F: "MGE2_T1G01W50",
-    0x3639D238: "SM_MATH1",
-    0x3639D239: "SM_MATH2",
-    0x3639D23A: "SM_MATH3",
-    0x3639D23B: "SM_MATH4",
-    0x3639D23C: "SM_MATH5",
-    0x364077B9: "1_02A_LOGOBJ04",
-    0x3640C276: "3_01C_GETREADY",
-    0x364591C6: "MGCE_FOOTER",
-    0x36751F28: "D_SPD",
-    0x368F1844: "MGGE_NEWGUINEA",
-    0x36A194EC: "1_G1_GETDIARY",
-    0x36AA3AA8: "3_01_ONOPIC",
-    0x36CB25F0: "TUT_KOUT01",
-    0x36CB25F1: "TUT_KOUT02",
-    0x36CB25F2: "TUT_KOUT03",
-    0x36D2A27D: "ARCADE_N_FAT",
-    0x36D2EE3E: "ARCADE_N_GRY",
-    0x36D37651: "ARCADE_N_IVN",
-    0x36D3B2B2: "ARCADE_N_JIM",
-    0x36D477AC: "ARCADE_N_MAD",
-    0x36D50782: "ARCADE_N_OTO",
-    0x36D54A81: "ARCADE_N_PTE",
-    0x36D64CEB: "ARCADE_N_TAD",
-    0x36D7E64C: "ARCADE_N_ZOE",
-    0x36D809B8: "4_03_LEFTOBS",
-    0x36DA9B34: "UP_MUSIC1",
-    0x36DA9B35: "UP_MUSIC2",
-    0x36DA9B36: "UP_MUSIC3",
-    0x36DA9B37: "UP_MUSIC4",
-    0x36DA9B38: "UP_MUSIC5",
-    0x36EB26E1: "MGDA_NUMBER",
-    0x36FC4088: "FUN_MTR_X",
-    0x370D4032: "SOC_GEN_REACTCRY",
-    0x3717A7ED: "MGE2_T8G01WORDS",
-    0x371A96C7: "MGPH_COWSKULL",
-    0x373200C7: "5_G5_WON",
-    0x373D16A1: "AS_EH_FAIL",
-    0x373DA40C: "R_HWOOD_01",
-    0x373DA40D: "R_HWOOD_02",
-    0x373DA40E: "R_HWOOD_03",
-    0x373DA40F: "R_HWOOD_04",
-    0x374654FA: "SQ_BIKE",
-    0x37513789: "N_DRBAMBILLO",
-    0x3759753B: "CHAPT4TRANS_J",
-    0x3759753F: "CHAPT4TRANS_N",
-    0x375CECD2: "STO_OUTOFSTOCKT",
-    0x375E4853: "BUSTED",
-    0x376530E2: "AS_BB_COUNTER",
-    0x376A99D7: "MGA2_FREEZE_NAME",
-    0x3771BA9A: "REVERSAL",
-    0x3772002F: "PGARB_TITLE",
-    0x377A80A0: "3_01B_FAIL_01",
-    0x377E210B: "MGC2P_FOOTER",
-    0x378364F0: "TITLE27_NUMNAMES",
-    0x37873707: "KEEPUP_CIRCLE",
-    0x37A8396D: "TUT_MARBX1",
-    0x37C0D729: "DL_FAIL",
-    0x37C48C0F: "C_CLOWNSHOES",
-    0x37D11E74: "3_09_FAIL_01",
-    0x37D11FB7: "SQ_FOOT",
-    0x37D7F5ED: "5_B_TITLE",
-    0x37E52915: "2_G2_TITLE",
-    0x37EACF0E: "1_10_TITLE",
-    0x37F2EF2C: "3_S03_EMPTY",
-    0x3801E2A2: "AS_CN_OBJECTIVE",
-    0x380B15D1: "AS_CN_COUNTER",
-    0x3817CAA6: "FEM_SAVE_HEADER",
-    0x381E94CF: "MGPH_RAYGUN",
-    0x38216250: "AS_RA_COMPLETE",
-    0x3828E715: "DESC_NERD_LG_01",
-    0x382A5DAA: "MGPH_PLASMASWORD",
-    0x382DD8E9: "M_RACEWIN",
-    0x38404873: "D_DIGICAMERA",
-    0x3842C4A4: "LOCKPICK",
-    0x3847DF3E: "S_SHORTS1",
-    0x3847DF41: "S_SHORTS4",
-    0x3847DF42: "S_SHORTS5",
-    0x3847DF43: "S_SHORTS6",
-    0x38481202: "3-05.SUB0001",
-    0x38481203: "3-05.SUB0002",
-    0x38481204: "3-05.SUB0003",
-    0x38481205: "3-05.SUB0004",
-    0x38481206: "3-05.SUB0005",
-    0x38481207: "3-05.SUB0006",
-    0x38481208: "3-05.SUB0007",
-    0x38481209: "3-05.SUB0008",
-    0x3848120A: "3-05.SUB0009",
-    0x38481284: "3-05.SUB0010",
-    0x38481285: "3-05.SUB0011",
-    0x38481286: "3-05.SUB0012",
-    0x38481287: "3-05.SUB0013",
-    0x38481288: "3-05.SUB0014",
-    0x38481289: "3-05.SUB0015",
-    0x3848128A: "3-05.SUB0016",
-    0x3848128B: "3-05.SUB0017",
-    0x38672DD0: "SAVE_PHOTO",
-    0x386D6BF6: "MGGE_RHODE ISLAND",
-    0x38717FE7: "FEU_CONTROLS",
-    0x38723606: "4_06_DOG",
-    0x38927705: "BUTTON_DUNKHIM",
-    0x389671D5: "TUT_HEALTH1",
-    0x389671D6: "TUT_HEALTH2",
-    0x3896B8F6: "TUT_HEALUP1",
-    0x389723C4: "MGGE_UNLOCK01",
-    0x389723C5: "MGGE_UNLOCK02",
-    0x389723C6: "MGGE_UNLOCK03",
-    0x389723C7: "MGGE_UNLOCK04",
-    0x389723C8: "MGGE_UNLOCK05",
-    0x389723C9: "MGGE_UNLOCK06",
-    0x3898C7A0: "USE_ARCADE",
-    0x38B6B506: "USE_BUSSTOP",
-    0x38B8FFB4: "TUT_JOBL01",
-    0x38B8FFB5: "TUT_JOBL02",
-    0x38BAD4F3: "TUT_JOBS01",
-    0x38BAD4F4: "TUT_JOBS02",
-    0x38BAD4F5: "TUT_JOBS03",
-    0x38BC2D3F: "3_R05B_PCOUNT",
-    0x38E53880: "TUT_SAVE1",
-    0x38E53881: "TUT_SAVE2",
-    0x38E53882: "TUT_SAVE3",
-    0x38EE3703: "DISC_01_WII",
-    0x39004190: "ERR_UNKNOWN",
-    0x3918CEE5: "2_04_FAILRACER",
-    0x391DFFD7: "MG_ENGLISH",
-    0x3925F137: "5_05_RETPARK",
-    0x392D9A6D: "AS_VD_DELIVER",
-    0x392DEF04: "",
-    0x392EE73A: "AS_SL_COMPLETE",
-    0x39304741: "AS_BC1_OBJECTIVE",
-    0x393A2B86: "S_APOL_HIGH_GIRL_01",
-    0x3940C1CA: "3_05_OLIPSTICK",
-    0x39462201: "GKART_HELMET",
-    0x394A1623: "2_G2_PINKYUNLCK",
-    0x395047A1: "2_R11_PARKER_NAME",
-    0x3964944F: "MGPH_GREENBOOK",
-    0x39675082: "TITLE55_NAME0",
-    0x39675083: "TITLE55_NAME1",
-    0x39675084: "TITLE55_NAME2",
-    0x39675085: "TITLE55_NAME3",
-    0x39675086: "TITLE55_NAME4",
-    0x39675087: "TITLE55_NAME5",
-    0x39675088: "TITLE55_NAME6",
-    0x39675089: "TITLE55_NAME7",
-    0x3967508A: "TITLE55_NAME8",
-    0x3967508B: "TITLE55_NAME9",
-    0x3968CC0F: "AS_SC_OBJECTIVE",
-    0x396F3AA7: "SOC_F_FLATTER",
-    0x39739645: "MGT_MATH_FE",
-    0x3974C982: "FUN_MTR_CAM1",
-    0x3974C983: "FUN_MTR_CAM2",
-    0x3976E46B: "FUN_MTR_CIRC",
-    0x397D080B: "STO_MONEY",
-    0x3984122D: "MGT_NUTSHOTS",
-    0x398671E2: "ERR_CHANGE",
-    0x39879D01: "AS_FI_ACTION",
-    0x398CCE42: "CONT_01_WII",
-    0x399947DF: "CN_ART",
-    0x39998648: "CN_BIO",
-    0x399A51EA: "CN_ENG",
-    0x399AD369: "CN_GEO",
-    0x399ADDA3: "CN_GYM",
-    0x399C6398: "CN_MAT",
-    0x399C6DD3: "CN_MUS",
-    0x399EFAE6: "BOYS_DORM",
-    0x39A284CD: "GIFT_NEG",
-    0x39A93B5E: "SP_GK_HELMET",
-    0x39AA513D: "TITLE77_NUMNAMES",
-    0x39B2BC85: "CRIME_PEDATTACKSMALL",
-    0x39BF689E: "FUN_MTR_EXIT",
-    0x39C14BC8: "MGE2_T3G01WORDS",
-    0x39C64D19: "ERR_WRITE",
-    0x39D155D2: "TUT_START1A",
-    0x39D155D3: "TUT_START1B",
-    0x39D15656: "TUT_START2B",
-    0x39D73600: "AUDSUR",
-    0x39DEDDAE: "CLT_POORBARB_TITLE",
-    0x39E264BC: "5-BC.SUB0001",
-    0x39E264BD: "5-BC.SUB0002",
-    0x39E264BE: "5-BC.SUB0003",
-    0x39E264BF: "5-BC.SUB0004",
-    0x39E264C0: "5-BC.SUB0005",
-    0x39E264C1: "5-BC.SUB0006",
-    0x39E264C2: "5-BC.SUB0007",
-    0x39E264C3: "5-BC.SUB0008",
-    0x39E264C4: "5-BC.SUB0009",
-    0x39E2653E: "5-BC.SUB0010",
-    0x39E2653F: "5-BC.SUB0011",
-    0x39E26540: "5-BC.SUB0012",
-    0x39E26541: "5-BC.SUB0013",
-    0x39E26542: "5-BC.SUB0014",
-    0x39E26543: "5-BC.SUB0015",
-    0x39F08F2E: "2_08_TITLE",
-    0x39F85397: "1_G1_FAILHUM",
-    0x3A054BE1: "MGGE_F_GUIANA",
-    0x3A086362: "DBH_CATCH",
-    0x3A0E2BC4: "AS_LD_FAIL",
-    0x3A0F3495: "N_FATTY",
-    0x3A174459: "STEALTH_SPOTTED",
-    0x3A196DF4: "3_R08_B1",
-    0x3A196DF5: "3_R08_B2",
-    0x3A196DF6: "3_R08_B3",
-    0x3A196DF7: "3_R08_B4",
-    0x3A19751E: "3_R08_P1",
-    0x3A19751F: "3_R08_P2",
-    0x3A197624: "3_R08_R1",
-    0x3A197625: "3_R08_R2",
-    0x3A197626: "3_R08_R3",
-    0x3A197627: "3_R08_R4",
-    0x3A197628: "3_R08_R5",
-    0x3A197629: "3_R08_R6",
-    0x3A19762A: "3_R08_R7",
-    0x3A1976A7: "3_R08_S1",
-    0x3A20DE96: "FEI_NO_GIFTS",
-    0x3A2C75A2: "6_03_FAILLEAVE",
-    0x3A3BB5EE: "3_R09_71",
-    0x3A3BB674: "3_R09_84",
-    0x3A3BB6FA: "3_R09_97",
-    0x3A3BBB90: "3_R09_B2",
-    0x3A3BBC17: "3_R09_C6",
-    0x3A3BBC18: "3_R09_C7",
-    0x3A3BBD1C: "3_R09_E5",
-    0x3A3BC55B: "3_R09_UD",
-    0x3A3BC55E: "3_R09_UG",
-    0x3A3BC561: "3_R09_UJ",
-    0x3A3BC565: "3_R09_UN",
-    0x3A3BC567: "3_R09_UP",
-    0x3A3C1C60: "SP_BMXHELMET",
-    0x3A3C6C24: "AS_TW_COMPLETE",
-    0x3A4E268D: "TITLE40_NUMNAMES",
-    0x3A5A1AAF: "TUT_SLEEP",
-    0x3A65B705: "AS_TR_OBJCOUNT1",
-    0x3A7800BC: "MGE2_T11G01W01",
-    0x3A7800BD: "MGE2_T11G01W02",
-    0x3A7800BE: "MGE2_T11G01W03",
-    0x3A7800BF: "MGE2_T11G01W04",
-    0x3A7800C0: "MGE2_T11G01W05",
-    0x3A7800C1: "MGE2_T11G01W06",
-    0x3A7800C2: "MGE2_T11G01W07",
-    0x3A7800C3: "MGE2_T11G01W08",
-    0x3A7800C4: "MGE2_T11G01W09",
-    0x3A78013E: "MGE2_T11G01W10",
-    0x3A78013F: "MGE2_T11G01W11",
-    0x3A780140: "MGE2_T11G01W12",
-    0x3A780141: "MGE2_T11G01W13",
-    0x3A780142: "MGE2_T11G01W14",
-    0x3A780143: "MGE2_T11G01W15",
-    0x3A780144: "MGE2_T11G01W16",
-    0x3A780145: "MGE2_T11G01W17",
-    0x3A780146: "MGE2_T11G01W18",
-    0x3A780147: "MGE2_T11G01W19",
-    0x3A7801C1: "MGE2_T11G01W20",
-    0x3A7801C2: "MGE2_T11G01W21",
-    0x3A7801C3: "MGE2_T11G01W22",
-    0x3A7801C4: "MGE2_T11G01W23",
-    0x3A7801C5: "MGE2_T11G01W24",
-    0x3A7801C6: "MGE2_T11G01W25",
-    0x3A7801C7: "MGE2_T11G01W26",
-    0x3A7801C8: "MGE2_T11G01W27",
-    0x3A7801C9: "MGE2_T11G01W28",
-    0x3A7801CA: "MGE2_T11G01W29",
-    0x3A780244: "MGE2_T11G01W30",
-    0x3A780245: "MGE2_T11G01W31",
-    0x3A780246: "MGE2_T11G01W32",
-    0x3A780247: "MGE2_T11G01W33",
-    0x3A780248: "MGE2_T11G01W34",
-    0x3A780249: "MGE2_T11G01W35",
-    0x3A78024A: "MGE2_T11G01W36",
-    0x3A78024B: "MGE2_T11G01W37",
-    0x3A78024C: "MGE2_T11G01W38",
-    0x3A78024D: "MGE2_T11G01W39",
-    0x3A7802C7: "MGE2_T11G01W40",
-    0x3A7802C8: "MGE2_T11G01W41",
-    0x3A7802C9: "MGE2_T11G01W42",
-    0x3A7802CA: "MGE2_T11G01W43",
-    0x3A7802CB: "MGE2_T11G01W44",
-    0x3A7802CC: "MGE2_T11G01W45",
-    0x3A7802CD: "MGE2_T11G01W46",
-    0x3A7802CE: "MGE2_T11G01W47",
-    0x3A7802CF: "MGE2_T11G01W48",
-    0x3A7802D0: "MGE2_T11G01W49",
-    0x3A78034A: "MGE2_T11G01W50",
-    0x3A7AC24F: "3_04_FAIL_01",
-    0x3A7AC250: "3_04_FAIL_02",
-    0x3A7AC251: "3_04_FAIL_03",
-    0x3A7AC252: "3_04_FAIL_04",
-    0x3A82EB32: "2_S05_OGOTPERF",
-    0x3A84853A: "TITLE40_NAME0",
-    0x3A87298B: "S_LAUGH_01",
-    0x3A87A5E2: "MC_GOOD",
-    0x3A8F0894: "TITLE1_NUMNAMES",
-    0x3A96BAB5: "TUT_TCLMB3",
-    0x3A9822D3: "1_04_OBJ01",
-    0x3A9822D4: "1_04_OBJ02",
-    0x3AA438C3: "PER_ANOON",
-    0x3AA914F9: "SKLAIM",
-    0x3AA95982: "SKLBLD",
-    0x3AAD296F: "FUN_MTR_LOCK",
-    0x3AAE1444: "SKLTTL",
-    0x3AC0BE4C: "TUT_SODA1",
-    0x3AC0BE4D: "TUT_SODA2",
-    0x3AC0BE4E: "TUT_SODA3",
-    0x3AC60745: "2_06_MAIN_OBJ",
-    0x3ACBF97F: "MC_INFO",
-    0x3ACEE296: "PER_DROWSY",
-    0x3AD0AD86: "SOC_N_RECEIVE",
-    0x3ADFB7BC: "GKART_GRAND",
-    0x3AE84FFF: "AS_HT_OBJECTIVE",
-    0x3AEA1527: "TUT_SP_01",
-    0x3AEA1528: "TUT_SP_02",
-    0x3AF14D24: "6-0.SUB0001",
-    0x3AF14D25: "6-0.SUB0002",
-    0x3AF14D26: "6-0.SUB0003",
-    0x3AF14D27: "6-0.SUB0004",
-    0x3AF14D28: "6-0.SUB0005",
-    0x3AF14D29: "6-0.SUB0006",
-    0x3AF14D2A: "6-0.SUB0007",
-    0x3AF14D2B: "6-0.SUB0008",
-    0x3AF14D2C: "6-0.SUB0009",
-    0x3AF14DA6: "6-0.SUB0010",
-    0x3AF14DA7: "6-0.SUB0011",
-    0x3AF14DA8: "6-0.SUB0012",
-    0x3AF14DA9: "6-0.SUB0013",
-    0x3AF14DAA: "6-0.SUB0014",
-    0x3AF14DAB: "6-0.SUB0015",
-    0x3AF14DAC: "6-0.SUB0016",
-    0x3AF14DAD: "6-0.SUB0017",
-    0x3AF14DAE: "6-0.SUB0018",
-    0x3AF14DAF: "6-0.SUB0019",
-    0x3AF14E29: "6-0.SUB0020",
-    0x3AF14E2A: "6-0.SUB0021",
-    0x3AF14E2B: "6-0.SUB0022",
-    0x3AF14E2C: "6-0.SUB0023",
-    0x3AF14E2D: "6-0.SUB0024",
-    0x3AF14E2E: "6-0.SUB0025",
-    0x3AF14E2F: "6-0.SUB0026",
-    0x3AF14E30: "6-0.SUB0027",
-    0x3AF14E31: "6-0.SUB0028",
-    0x3AF14E32: "6-0.SUB0029",
-    0x3AF14EAC: "6-0.SUB0030",
-    0x3AF14EAD: "6-0.SUB0031",
-    0x3AF14EAE: "6-0.SUB0032",
-    0x3AF14EAF: "6-0.SUB0033",
-    0x3AF14EB0: "6-0.SUB0034",
-    0x3AF14EB1: "6-0.SUB0035",
-    0x3AF14EB2: "6-0.SUB0036",
-    0x3AF14EB3: "6-0.SUB0037",
-    0x3AF14EB4: "6-0.SUB0038",
-    0x3AF14EB5: "6-0.SUB0039",
-    0x3AF14F2F: "6-0.SUB0040",
-    0x3AF14F30: "6-0.SUB0041",
-    0x3AF14F31: "6-0.SUB0042",
-    0x3AF14F32: "6-0.SUB0043",
-    0x3AF14F33: "6-0.SUB0044",
-    0x3AF14F34: "6-0.SUB0045",
-    0x3AF14F35: "6-0.SUB0046",
-    0x3AF14F36: "6-0.SUB0047",
-    0x3AF20A1D: "MGCE_ENTER",
-    0x3AFCC12D: "3_04_TITLE",
-    0x3AFE7A9A: "RARC_CTRL0",
-    0x3AFE7A9B: "RARC_CTRL1",
-    0x3AFE7A9C: "RARC_CTRL2",
-    0x3AFE7A9D: "RARC_CTRL3",
-    0x3AFE7A9E: "RARC_CTRL4",
-    0x3B00FB36: "2_08_RICHBARBOBJ",
-    0x3B01EBAC: "AS_RA_BEENHIT",
-    0x3B041C12: "3_R08_END",
-    0x3B0671C1: "3_R08_NCC",
-    0x3B145652: "FUN_MTR_OPEN",
-    0x3B1541D9: "SKULL",
-    0x3B1ACA5F: "D_BSCHOOL",
-    0x3B262CE7: "AS_EP_RETURN",
-    0x3B288E21: "3_02_FINDOBJ",
-    0x3B2B07EF: "SM_WREST1",
-    0x3B2B07F0: "SM_WREST2",
-    0x3B2B07F1: "SM_WREST3",
-    0x3B2B07F2: "SM_WREST4",
-    0x3B2B07F3: "SM_WREST5",
-    0x3B2D390A: "3_09_SCENE_01",
-    0x3B2D390B: "3_09_SCENE_02",
-    0x3B335B53: "SLEEP",
-    0x3B35D27C: "S_TAUNT_COM_01",
-    0x3B3C3F24: "MC2P_GOOD",
-    0x3B3D3716: "5_G5_MOBJ01",
-    0x3B3D3717: "5_G5_MOBJ02",
-    0x3B3D3718: "5_G5_MOBJ03",
-    0x3B5785FD: "MGT_CONSUMO_FE",
-    0x3B5CB39E: "CRIME_BULLYINGGIRLS",
-    0x3B76ED6C: "SNAKE",
-    0x3B8092C1: "MC2P_INFO",
-    0x3B873D8B: "N_FLOYD",
-    0x3B8FB85C: "AS_SH_OBJECTIVE",
-    0x3B903B1D: "RACE_FAR",
-    0x3B91CD51: "RACE_LAP",
-    0x3B922470: "4_02_NERDS",
-    0x3B92E0A2: "RACE_POS",
-    0x3B9FE5E1: "AS_SB_ACTION",
-    0x3BAE9377: "USE_RESET",
-    0x3BB1D50D: "NAND_03_WII",
-    0x3BB44C1F: "3_09_EMPTY",
-    0x3BB864EE: "N_OROURKE",
-    0x3BBE6D95: "SOC_GEN_BRINGITON",
-    0x3BCA41BD: "MGGE_TENNESSEE",
-    0x3BD2D264: "3_S11_SNEAK",
-    0x3BDE2D96: "MGCE_TUTORIAL01",
-    0x3BDE2D97: "MGCE_TUTORIAL02",
-    0x3BE311EA: "SQUID",
-    0x3BFF80C7: "TITLE24_NUMNAMES",
-    0x3C07BB20: "SP_DM_H",
-    0x3C07BB2C: "SP_DM_T",
-    0x3C1BDAE8: "SP_NERDWATCH",
-    0x3C2FEC42: "AS_EA_RETURN",
-    0x3C37D187: "FE_PRESS_FE",
-    0x3C39E61C: "S_TAUNT_INIT_BULLY_01",
-    0x3C3A5FA7: "2_S06_MOBJ_01",
-    0x3C3A5FA8: "2_S06_MOBJ_02",
-    0x3C3A5FA9: "2_S06_MOBJ_03",
-    0x3C3A5FAA: "2_S06_MOBJ_04",
-    0x3C3B4943: "C5_UNLK_1",
-    0x3C3B4944: "C5_UNLK_2",
-    0x3C3B4945: "C5_UNLK_3",
-    0x3C3B4946: "C5_UNLK_4",
-    0x3C3B4947: "C5_UNLK_5",
-    0x3C44C2B2: "START",
-    0x3C450193: "STBJD",
-    0x3C468406: "TITLE83_NAME10",
-    0x3C468407: "TITLE83_NAME11",
-    0x3C468408: "TITLE83_NAME12",
-    0x3C468409: "TITLE83_NAME13",
-    0x3C46840A: "TITLE83_NAME14",
-    0x3C46840B: "TITLE83_NAME15",
-    0x3C46840C: "TITLE83_NAME16",
-    0x3C46840D: "TITLE83_NAME17",
-    0x3C46840E: "TITLE83_NAME18",
-    0x3C46840F: "TITLE83_NAME19",
-    0x3C468489: "TITLE83_NAME20",
-    0x3C46848A: "TITLE83_NAME21",
-    0x3C46848B: "TITLE83_NAME22",
-    0x3C46848C: "TITLE83_NAME23",
-    0x3C46848D: "TITLE83_NAME24",
-    0x3C46848E: "TITLE83_NAME25",
-    0x3C46848F: "TITLE83_NAME26",
-    0x3C4979CB: "STSSH",
-    0x3C49B52F: "STTDP",
-    0x3C57633D: "TAG_JOCK_MED_01",
-    0x3C5E1B37: "HALL_PASS",
-    0x3C7FE521: "3_01A_WARNING",
-    0x3C843D46: "",
-    0x3C8CA352: "AS_TW_OBJCOUNT1",
-    0x3C9247DE: "5_G5_HINT",
-    0x3C9B4813: "TITLE27_NAME0",
-    0x3C9B4814: "TITLE27_NAME1",
-    0x3C9B4815: "TITLE27_NAME2",
-    0x3C9B4816: "TITLE27_NAME3",
-    0x3C9B4817: "TITLE27_NAME4",
-    0x3C9B4818: "TITLE27_NAME5",
-    0x3C9B4819: "TITLE27_NAME6",
-    0x3C9FC218: "2_01_OFINDBIKE",
-    0x3CB2B775: "TUT_RUSS01A",
-    0x3CB2B7FA: "TUT_RUSS02C",
-    0x3CB2B87B: "TUT_RUSS03A",
-    0x3CB2B87D: "TUT_RUSS03C",
-    0x3CB2B8FE: "TUT_RUSS04A",
-    0x3CB43A12: "ENABLE_XINPUT_NO",
-    0x3CBB0EC0: "SOC_F_GREET",
-    0x3CBF1761: "MGB2_RAT_0",
-    0x3CBF1762: "MGB2_RAT_1",
-    0x3CBF1763: "MGB2_RAT_2",
-    0x3CBF1764: "MGB2_RAT_3",
-    0x3CBF1765: "MGB2_RAT_4",
-    0x3CBF1766: "MGB2_RAT_5",
-    0x3CBF1767: "MGB2_RAT_6",
-    0x3CBF1768: "MGB2_RAT_7",
-    0x3CBF1769: "MGB2_RAT_8",
-    0x3CBF176A: "MGB2_RAT_9",
-    0x3CC01C84: "5_05_LASTPOTTY",
-    0x3CC07E1E: "4_05_EMPTY",
-    0x3CC77403: "AS_EA_OBJECTIVE",
-    0x3CD024B7: "USE_COOLERPISS",
-    0x3CE2A79C: "AS_SL_REWARD",
-    0x3CED9BBE: "FER_CONTROLS",
-    0x3CF0B8E2: "FE_WIN_TAUNT1",
-    0x3CF0B8E3: "FE_WIN_TAUNT2",
-    0x3D0182DD: "SP_HAZMAT",
-    0x3D081370: "MG_ART_FE",
-    0x3D121D90: "C3_UNLOCK01",
-    0x3D121D91: "C3_UNLOCK02",
-    0x3D121D93: "C3_UNLOCK04",
-    0x3D121D94: "C3_UNLOCK05",
-    0x3D121D95: "C3_UNLOCK06",
-    0x3D121D96: "C3_UNLOCK07",
-    0x3D121E12: "C3_UNLOCK10",
-    0x3D121E13: "C3_UNLOCK11",
-    0x3D121E14: "C3_UNLOCK12",
-    0x3D121E15: "C3_UNLOCK13",
-    0x3D1D130F: "5_G5_LOST",
-    0x3D28BC7E: "SP_WEEN_H",
-    0x3D28BC82: "SP_WEEN_L",
-    0x3D28BC8A: "SP_WEEN_T",
-    0x3D3664B8: "B_MFADE",
-    0x3D371698: "USE_BB",
-    0x3D371D4B: "USE_ON",
-    0x3D438EA6: "3_R05B_PACKAGE",
-    0x3D4411FE: "MG_GEO_FE",
-    0x3D54BF8F: "3_01D_PENDING",
-    0x3D5FC81B: "SYS_DEVICE_LOST",
-    0x3D6797C2: "5_07A_32",
-    0x3D6797C3: "5_07A_33",
-    0x3D6797C4: "5_07A_34",
-    0x3D6797C5: "5_07A_35",
-    0x3D6797C6: "5_07A_36",
-    0x3D6A1F8D: "2_S02_24",
-    0x3D6A1F8E: "2_S02_25",
-    0x3D6A1F90: "2_S02_27",
-    0x3D788CC1: "IGOKART",
-    0x3D83D730: "1_01_08",
-    0x3D86F513: "AS_JB_OBJECTIVE",
-    0x3D89E3D3: "5_07B_01",
-    0x3D89E3D4: "5_07B_02",
-    0x3D89E3D5: "5_07B_03",
-    0x3D89E3D6: "5_07B_04",
-    0x3D89E3D7: "5_07B_05",
-    0x3D89E3D8: "5_07B_06",
-    0x3D89E3D9: "5_07B_07",
-    0x3D89E3DA: "5_07B_08",
-    0x3D89E3DB: "5_07B_09",
-    0x3D89E455: "5_07B_10",
-    0x3D89E456: "5_07B_11",
-    0x3D89E457: "5_07B_12",
-    0x3D89E458: "5_07B_13",
-    0x3D89E459: "5_07B_14",
-    0x3D89E45A: "5_07B_15",
-    0x3D89E45B: "5_07B_16",
-    0x3D89E45C: "5_07B_17",
-    0x3D89E45D: "5_07B_18",
-    0x3D89E45E: "5_07B_19",
-    0x3D89E4D8: "5_07B_20",
-    0x3D89E4D9: "5_07B_21",
-    0x3D89E4DA: "5_07B_22",
-    0x3D89E4DB: "5_07B_23",
-    0x3D89E4DC: "5_07B_24",
-    0x3D89E4DD: "5_07B_25",
-    0x3D89E4DE: "5_07B_26",
-    0x3D89E4DF: "5_07B_27",
-    0x3D89E4E0: "5_07B_28",
-    0x3D8D3741: "STRERRORTRAY",
-    0x3D9B58BA: "SYS_INIT_FAILED",
-    0x3DA2954D: "SP_PJ_L",
-    0x3DA29555: "SP_PJ_T",
-    0x3DA7FCC8: "1_02C_TITLE",
-    0x3DAB0311: "AS_SI_COMPLETE",
-    0x3DAC316E: "5_07C_01",
-    0x3DAC316F: "5_07C_02",
-    0x3DAC3170: "5_07C_03",
-    0x3DAC3171: "5_07C_04",
-    0x3DAC3172: "5_07C_05",
-    0x3DAC3173: "5_07C_06",
-    0x3DAC3174: "5_07C_07",
-    0x3DAC3175: "5_07C_08",
-    0x3DAC3176: "5_07C_09",
-    0x3DAC31F0: "5_07C_10",
-    0x3DAC31F1: "5_07C_11",
-    0x3DAC31F2: "5_07C_12",
-    0x3DAC31F3: "5_07C_13",
-    0x3DAC31F4: "5_07C_14",
-    0x3DAC31F5: "5_07C_15",
-    0x3DAC31F6: "5_07C_16",
-    0x3DAC31F7: "5_07C_17",
-    0x3DAC31F8: "5_07C_18",
-    0x3DAC31F9: "5_07C_19",
-    0x3DAC3273: "5_07C_20",
-    0x3DAC3274: "5_07C_21",
-    0x3DAC3275: "5_07C_22",
-    0x3DAC3276: "5_07C_23",
-    0x3DB0642E: "TITLE88_NAME0",
-    0x3DB6C42E: "MGE2_T6G01W01",
-    0x3DB6C42F: "MGE2_T6G01W02",
-    0x3DB6C430: "MGE2_T6G01W03",
-    0x3DB6C431: "MGE2_T6G01W04",
-    0x3DB6C432: "MGE2_T6G01W05",
-    0x3DB6C433: "MGE2_T6G01W06",
-    0x3DB6C434: "MGE2_T6G01W07",
-    0x3DB6C435: "MGE2_T6G01W08",
-    0x3DB6C436: "MGE2_T6G01W09",
-    0x3DB6C4B0: "MGE2_T6G01W10",
-    0x3DB6C4B1: "MGE2_T6G01W11",
-    0x3DB6C4B2: "MGE2_T6G01W12",
-    0x3DB6C4B3: "MGE2_T6G01W13",
-    0x3DB6C4B4: "MGE2_T6G01W14",
-    0x3DB6C4B5: "MGE2_T6G01W15",
-    0x3DB6C4B6: "MGE2_T6G01W16",
-    0x3DB6C4B7: "MGE2_T6G01W17",
-    0x3DB6C4B8: "MGE2_T6G01W18",
-    0x3DB6C4B9: "MGE2_T6G01W19",
-    0x3DB6C533: "MGE2_T6G01W20",
-    0x3DB6C534: "MGE2_T6G01W21",
-    0x3DB6C535: "MGE2_T6G01W22",
-    0x3DB6C536: "MGE2_T6G01W23",
-    0x3DB6C537: "MGE2_T6G01W24",
-    0x3DB6C538: "MGE2_T6G01W25",
-    0x3DB6C539: "MGE2_T6G01W26",
-    0x3DB6C53A: "MGE2_T6G01W27",
-    0x3DB6C53B: "MGE2_T6G01W28",
-    0x3DB6C53C: "MGE2_T6G01W29",
-    0x3DB6C5B6: "MGE2_T6G01W30",
-    0x3DB6C5B7: "MGE2_T6G01W31",
-    0x3DB6C5B8: "MGE2_T6G01W32",
-    0x3DB6C5B9: "MGE2_T6G01W33",
-    0x3DB6C5BA: "MGE2_T6G01W34",
-    0x3DB6C5BB: "MGE2_T6G01W35",
-    0x3DB6C5BC: "MGE2_T6G01W36",
-    0x3DB6C5BD: "MGE2_T6G01W37",
-    0x3DB6C5BE: "MGE2_T6G01W38",
-    0x3DB6C5BF: "MGE2_T6G01W39",
-    0x3DB6C639: "MGE2_T6G01W40",
-    0x3DB6C63A: "MGE2_T6G01W41",
-    0x3DB6C63B: "MGE2_T6G01W42",
-    0x3DB6C63C: "MGE2_T6G01W43",
-    0x3DB6C63D: "MGE2_T6G01W44",
-    0x3DB6C63E: "MGE2_T6G01W45",
-    0x3DB6C63F: "MGE2_T6G01W46",
-    0x3DB6C640: "MGE2_T6G01W47",
-    0x3DB6C641: "MGE2_T6G01W48",
-    0x3DB6C642: "MGE2_T6G01W49",
-    0x3DB6C6BC: "MGE2_T6G01W50",
-    0x3DB87CCB: "TITLE12_NAME0",
-    0x3DB87CCC: "TITLE12_NAME1",
-    0x3DB87CCD: "TITLE12_NAME2",
-    0x3DB87CCE: "TITLE12_NAME3",
-    0x3DB87CCF: "TITLE12_NAME4",
-    0x3DB87CD0: "TITLE12_NAME5",
-    0x3DB87CD1: "TITLE12_NAME6",
-    0x3DB87CD2: "TITLE12_NAME7",
-    0x3DBB7631: "TAG_GREAS_LG_01",
-    0x3DC63806: "S_TAUNT_HUMIL_01",
-    0x3DD11732: "2_S05_O1",
-    0x3DD11733: "2_S05_O2",
-    0x3DD11734: "2_S05_O3",
-    0x3DD11735: "2_S05_O4",
-    0x3DD11736: "2_S05_O5",
-    0x3DD11737: "2_S05_O6",
-    0x3DD11738: "2_S05_O7",
-    0x3DDFF1B8: "MG_BIOLOGY",
-    0x3DFBEB7B: "MGPH_DRAGONWING",
-    0x3DFD6779: "MGG2_FOOTER",
-    0x3DFF61DC: "4-04.SUB0001",
-    0x3DFF61DD: "4-04.SUB0002",
-    0x3DFF61DE: "4-04.SUB0003",
-    0x3DFF61DF: "4-04.SUB0004",
-    0x3DFF61E0: "4-04.SUB0005",
-    0x3DFF61E1: "4-04.SUB0006",
-    0x3DFF61E2: "4-04.SUB0007",
-    0x3DFF61E3: "4-04.SUB0008",
-    0x3DFF61E4: "4-04.SUB0009",
-    0x3DFF625E: "4-04.SUB0010",
-    0x3DFF625F: "4-04.SUB0011",
-    0x3DFF6260: "4-04.SUB0012",
-    0x3DFF6261: "4-04.SUB0013",
-    0x3DFF6262: "4-04.SUB0014",
-    0x3DFF6263: "4-04.SUB0015",
-    0x3DFF6264: "4-04.SUB0016",
-    0x3DFF6265: "4-04.SUB0017",
-    0x3DFF6266: "4-04.SUB0018",
-    0x3DFF6267: "4-04.SUB0019",
-    0x3DFF62E1: "4-04.SUB0020",
-    0x3DFF62E2: "4-04.SUB0021",
-    0x3DFF62E3: "4-04.SUB0022",
-    0x3DFF62E4: "4-04.SUB0023",
-    0x3E136E22: "AS_CG_OBJCOUNT",
-    0x3E2488AE: "1_11X2_SKIP",
-    0x3E266D14: "TITLE74_NUMNAMES",
-    0x3E29198A: "CNFRM_DEL",
-    0x3E4BCD6B: "5_09_ORETURN",
-    0x3E4ED861: "AS_PB_COMPLETE",
-    0x3E51A94F: "1_07_12",
-    0x3E59CCD3: "1-S01.SUB0001",
-    0x3E59CCD4: "1-S01.SUB0002",
-    0x3E59CCD5: "1-S01.SUB0003",
-    0x3E59CCD6: "1-S01.SUB0004",
-    0x3E59CCD7: "1-S01.SUB0005",
-    0x3E59CCD8: "1-S01.SUB0006",
-    0x3E59CCD9: "1-S01.SUB0007",
-    0x3E59CCDA: "1-S01.SUB0008",
-    0x3E59CCDB: "1-S01.SUB0009",
-    0x3E59CD55: "1-S01.SUB0010",
-    0x3E59CD56: "1-S01.SUB0011",
-    0x3E59CD57: "1-S01.SUB0012",
-    0x3E59CD58: "1-S01.SUB0013",
-    0x3E59CD59: "1-S01.SUB0014",
-    0x3E59CD5A: "1-S01.SUB0015",
-    0x3E59CD5B: "1-S01.SUB0016",
-    0x3E59CD5C: "1-S01.SUB0017",
-    0x3E59CD5D: "1-S01.SUB0018",
-    0x3E59CD5E: "1-S01.SUB0019",
-    0x3E59CDD8: "1-S01.SUB0020",
-    0x3E59CDD9: "1-S01.SUB0021",
-    0x3E59CDDA: "1-S01.SUB0022",
-    0x3E59CDDB: "1-S01.SUB0023",
-    0x3E59CDDC: "1-S01.SUB0024",
-    0x3E59CDDD: "1-S01.SUB0025",
-    0x3E59CDDE: "1-S01.SUB0026",
-    0x3E59CDDF: "1-S01.SUB0027",
-    0x3E59CDE0: "1-S01.SUB0028",
-    0x3E59CDE1: "1-S01.SUB0029",
-    0x3E59CE5B: "1-S01.SUB0030",
-    0x3E59CE5C: "1-S01.SUB0031",
-    0x3E59CE5D: "1-S01.SUB0032",
-    0x3E59CE5E: "1-S01.SUB0033",
-    0x3E5ABCF8: "AS_TF_OBJCOUNT",
-    0x3E5E311F: "3_01_ORETCASH",
-    0x3E5E8ED6: "AS_IP_OBJECTIVE",
-    0x3E71B09D: "SOC_F_DEPART",
-    0x3E7F49E4: "MGS2_POSNUM",
-    0x3E818C1B: "CRIME_NOHELMET",
-    0x3E83E5D8: "CLT_CUS_OFIT",
-    0x3E924D59: "TUT_301A",
-    0x3E924D5A: "TUT_301B",
-    0x3E924D5B: "TUT_301C",
-    0x3E964408: "1_09_08",
-    0x3E964409: "1_09_09",
-    0x3E9B7CA2: "DESC_PUMPKIN",
-    0x3E9E2461: "FEPA_CANCEL",
-    0x3EA07599: "RACING_GO",
-    0x3EB86F77: "3_S03_TITLE",
-    0x3EBABEDD: "AS_LK_ACTION",
-    0x3EBADD8B: "N_KRAKAUER",
-    0x3EC00ED0: "1-BC.SUB0001",
-    0x3EC00ED1: "1-BC.SUB0002",
-    0x3EC00ED2: "1-BC.SUB0003",
-    0x3EC00ED3: "1-BC.SUB0004",
-    0x3EC00ED4: "1-BC.SUB0005",
-    0x3EC00ED5: "1-BC.SUB0006",
-    0x3EC00ED6: "1-BC.SUB0007",
-    0x3EC00ED7: "1-BC.SUB0008",
-    0x3EC00ED8: "1-BC.SUB0009",
-    0x3EC00F52: "1-BC.SUB0010",
-    0x3EC00F53: "1-BC.SUB0011",
-    0x3EC00F54: "1-BC.SUB0012",
-    0x3EC00F55: "1-BC.SUB0013",
-    0x3EC00F56: "1-BC.SUB0014",
-    0x3EC00F57: "1-BC.SUB0015",
-    0x3EC00F58: "1-BC.SUB0016",
-    0x3EC00F59: "1-BC.SUB0017",
-    0x3EC00F5A: "1-BC.SUB0018",
-    0x3EC00F5B: "1-BC.SUB0019",
-    0x3EC00FD5: "1-BC.SUB0020",
-    0x3EC00FD6: "1-BC.SUB0021",
-    0x3EC00FD7: "1-BC.SUB0022",
-    0x3EC2D000: "3-01CA.SUB0001",
-    0x3EC2D001: "3-01CA.SUB0002",
-    0x3EC2D002: "3-01CA.SUB0003",
-    0x3EC2D003: "3-01CA.SUB0004",
-    0x3EC2D004: "3-01CA.SUB0005",
-    0x3EC2D005: "3-01CA.SUB0006",
-    0x3EC2D006: "3-01CA.SUB0007",
-    0x3EC2D007: "3-01CA.SUB0008",
-    0x3EC2D008: "3-01CA.SUB0009",
-    0x3EC2D082: "3-01CA.SUB0010",
-    0x3EC2D083: "3-01CA.SUB0011",
-    0x3EC2D084: "3-01CA.SUB0012",
-    0x3EC2D085: "3-01CA.SUB0013",
-    0x3EC2D086: "3-01CA.SUB0014",
-    0x3EC2D087: "3-01CA.SUB0015",
-    0x3EC2D088: "3-01CA.SUB0016",
-    0x3EC2D089: "3-01CA.SUB0017",
-    0x3EC2D08A: "3-01CA.SUB0018",
-    0x3EC2D08B: "3-01CA.SUB0019",
-    0x3EC2D105: "3-01CA.SUB0020",
-    0x3EC2D106: "3-01CA.SUB0021",
-    0x3EC2D107: "3-01CA.SUB0022",
-    0x3EC2D108: "3-01CA.SUB0023",
-    0x3EC2D109: "3-01CA.SUB0024",
-    0x3EC2D10A: "3-01CA.SUB0025",
-    0x3EC2D10B: "3-01CA.SUB0026",
-    0x3EC2D10C: "3-01CA.SUB0027",
-    0x3EC2D10D: "3-01CA.SUB0028",
-    0x3EC2D10E: "3-01CA.SUB0029",
-    0x3EC2D188: "3-01CA.SUB0030",
-    0x3EC2D189: "3-01CA.SUB0031",
-    0x3EC2D18A: "3-01CA.SUB0032",
-    0x3EC2D18B: "3-01CA.SUB0033",
-    0x3EC2D18C: "3-01CA.SUB0034",
-    0x3EC2D18D: "3-01CA.SUB0035",
-    0x3EC2D18E: "3-01CA.SUB0036",
-    0x3EC2D18F: "3-01CA.SUB0037",
-    0x3EC2D190: "3-01CA.SUB0038",
-    0x3EC2D191: "3-01CA.SUB0039",
-    0x3EC2D20B: "3-01CA.SUB0040",
-    0x3EC2D20C: "3-01CA.SUB0041",
-    0x3EC2D20D: "3-01CA.SUB0042",
-    0x3EC2D20E: "3-01CA.SUB0043",
-    0x3EC2D20F: "3-01CA.SUB0044",
-    0x3EC2D210: "3-01CA.SUB0045",
-    0x3EC2D211: "3-01CA.SUB0046",
-    0x3ECD4B79: "TAG_NERD_COMBO",
-    0x3ECD98E6: "TITLE73_NAME0",
-    0x3ECD98E7: "TITLE73_NAME1",
-    0x3ED2942D: "2_R03_TITLE",
-    0x3EE34FB4: "SP_MORTARBHAT",
-    0x3EEF38FA: "ARCADE_SUMO_I01",
-    0x3EEF38FB: "ARCADE_SUMO_I02",
-    0x3EEF38FC: "ARCADE_SUMO_I03",
-    0x3EEF38FD: "ARCADE_SUMO_I04",
-    0x3EEF38FE: "ARCADE_SUMO_I05",
-    0x3F03B38B: "JLAWN_TITLE",
-    0x3F11523A: "5_02_FAIL01",
-    0x3F11523B: "5_02_FAIL02",
-    0x3F11523C: "5_02_FAIL03",
-    0x3F382767: "2_03_OBJ3",
-    0x3F38276A: "2_03_OBJ6",
-    0x3F403C58: "MGPH_FIREPLACE",
-    0x3F499D2F: "MGGE_CAMBODIA",
-    0x3F67D88F: "MAP_LEG",
-    0x3F6FFA69: "3_S08_EMPTY",
-    0x3F79E759: "TUT_SCOOT1",
-    0x3F7FB835: "SP_SOCKS",
-    0x3F8AA088: "AS_GJ_COMPLETE",
-    0x3F965B83: "MGCE_T4G01W01",
-    0x3F965B84: "MGCE_T4G01W02",
-    0x3F965B85: "MGCE_T4G01W03",
-    0x3F965B86: "MGCE_T4G01W04",
-    0x3F965B87: "MGCE_T4G01W05",
-    0x3F965B88: "MGCE_T4G01W06",
-    0x3F965B89: "MGCE_T4G01W07",
-    0x3F965B8A: "MGCE_T4G01W08",
-    0x3F965B8B: "MGCE_T4G01W09",
-    0x3F965C05: "MGCE_T4G01W10",
-    0x3F965C06: "MGCE_T4G01W11",
-    0x3F965C07: "MGCE_T4G01W12",
-    0x3F965C08: "MGCE_T4G01W13",
-    0x3F965C09: "MGCE_T4G01W14",
-    0x3F965C0A: "MGCE_T4G01W15",
-    0x3F965C0B: "MGCE_T4G01W16",
-    0x3F965C0C: "MGCE_T4G01W17",
-    0x3F965C0D: "MGCE_T4G01W18",
-    0x3F965C0E: "MGCE_T4G01W19",
-    0x3F965C88: "MGCE_T4G01W20",
-    0x3F965C89: "MGCE_T4G01W21",
-    0x3F965C8A: "MGCE_T4G01W22",
-    0x3F965C8B: "MGCE_T4G01W23",
-    0x3F965C8C: "MGCE_T4G01W24",
-    0x3F965C8D: "MGCE_T4G01W25",
-    0x3F965C8E: "MGCE_T4G01W26",
-    0x3F965C8F: "MGCE_T4G01W27",
-    0x3F965C90: "MGCE_T4G01W28",
-    0x3F965C91: "MGCE_T4G01W29",
-    0x3F965D0B: "MGCE_T4G01W30",
-    0x3F965D0C: "MGCE_T4G01W31",
-    0x3F965D0D: "MGCE_T4G01W32",
-    0x3F965D0E: "MGCE_T4G01W33",
-    0x3F965D0F: "MGCE_T4G01W34",
-    0x3F965D10: "MGCE_T4G01W35",
-    0x3F965D11: "MGCE_T4G01W36",
-    0x3F965D12: "MGCE_T4G01W37",
-    0x3F965D13: "MGCE_T4G01W38",
-    0x3F965D14: "MGCE_T4G01W39",
-    0x3F965D8E: "MGCE_T4G01W40",
-    0x3F965D8F: "MGCE_T4G01W41",
-    0x3F965D90: "MGCE_T4G01W42",
-    0x3F965D91: "MGCE_T4G01W43",
-    0x3F965D92: "MGCE_T4G01W44",
-    0x3F965D93: "MGCE_T4G01W45",
-    0x3F965D94: "MGCE_T4G01W46",
-    0x3F965D95: "MGCE_T4G01W47",
-    0x3F965D96: "MGCE_T4G01W48",
-    0x3F965D97: "MGCE_T4G01W49",
-    0x3F965E11: "MGCE_T4G01W50",
-    0x3F965E12: "MGCE_T4G01W51",
-    0x3F965E13: "MGCE_T4G01W52",
-    0x3F965E14: "MGCE_T4G01W53",
-    0x3F965E15: "MGCE_T4G01W54",
-    0x3F965E16: "MGCE_T4G01W55",
-    0x3F965E17: "MGCE_T4G01W56",
-    0x3F965E18: "MGCE_T4G01W57",
-    0x3F965E19: "MGCE_T4G01W58",
-    0x3F965E1A: "MGCE_T4G01W59",
-    0x3F965E94: "MGCE_T4G01W60",
-    0x3F965E95: "MGCE_T4G01W61",
-    0x3F965E96: "MGCE_T4G01W62",
-    0x3F965E97: "MGCE_T4G01W63",
-    0x3F965E98: "MGCE_T4G01W64",
-    0x3F965E99: "MGCE_T4G01W65",
-    0x3F965E9A: "MGCE_T4G01W66",
-    0x3F965E9B: "MGCE_T4G01W67",
-    0x3F965E9C: "MGCE_T4G01W68",
-    0x3F965E9D: "MGCE_T4G01W69",
-    0x3F965F17: "MGCE_T4G01W70",
-    0x3F99B496: "6-BB.SUB0001",
-    0x3F99B497: "6-BB.SUB0002",
-    0x3F99B498: "6-BB.SUB0003",
-    0x3F99B499: "6-BB.SUB0004",
-    0x3F99B49A: "6-BB.SUB0005",
-    0x3F99B49B: "6-BB.SUB0006",
-    0x3F99B49C: "6-BB.SUB0007",
-    0x3F99B49D: "6-BB.SUB0008",
-    0x3F99B49E: "6-BB.SUB0009",
-    0x3F99B518: "6-BB.SUB0010",
-    0x3F99B519: "6-BB.SUB0011",
-    0x3F99B51A: "6-BB.SUB0012",
-    0x3F99B51B: "6-BB.SUB0013",
-    0x3F99B51C: "6-BB.SUB0014",
-    0x3F99B51D: "6-BB.SUB0015",
-    0x3F99B51E: "6-BB.SUB0016",
-    0x3F99B51F: "6-BB.SUB0017",
-    0x3F99B520: "6-BB.SUB0018",
-    0x3F99B521: "6-BB.SUB0019",
-    0x3FA7B45A: "AS_KP_FAILED",
-    0x3FAD0496: "MC2P_INST01",
-    0x3FC5FA13: "AS_DT_OBJECTIVE",
-    0x3FC66BC4: "GKART_YOULOSE",
-    0x3FCF708E: "FE_YEARBOOK",
-    0x3FD499F4: "CR_VEHICLE",
-    0x3FD7C74E: "TITLE58_NUMNAMES",
-    0x3FDD90F6: "AS_SR_OBJECTIVE",
-    0x3FE28EA1: "TUT_LOK01",
-    0x3FE90C52: "B_CAESAR_01",
-    0x3FE90C53: "B_CAESAR_02",
-    0x3FE90C54: "B_CAESAR_03",
-    0x3FE90C55: "B_CAESAR_04",
-    0x3FF3B528: "CHAPT3TRANS_B",
-    0x3FF3B52D: "CHAPT3TRANS_G",
-    0x3FF3B534: "CHAPT3TRANS_N",
-    0x3FFEC537: "FE_BACK",
-    0x4009A69A: "",
-    0x40119371: "IPREPS",
-    0x401E4983: "C4_GETREADY",
-    0x4026142B: "FE_CTRL",
-    0x403EF83E: "TUT_OBRD01",
-    0x405B10D8: "MGPH_REGISTER",
-    0x4063026B: "MGPH_BRAINSUCKERS",
-    0x406E290A: "2_R03_TUT02",
-    0x406E290B: "2_R03_TUT03",
-    0x406E6651: "3_G3_TITLE",
-    0x4072DFA4: "CLT_NASCAR",
-    0x407953A0: "AS_IP_BEENHIT",
-    0x407B9C9E: "TITLE21_NUMNAMES",
-    0x407BF918: "MGE2_ENTER",
-    0x40850F03: "1_00_TITLE",
-    0x40887615: "5_05_OPUSH",
-    0x40999936: "TUT_BBC1",
-    0x409B7416: "TUT_BIN1",
-    0x409B7417: "TUT_BIN2",
-    0x409B7418: "TUT_BIN3",
-    0x409B7419: "TUT_BIN4",
-    0x409DC00D: "TUT_BR01",
-    0x409E9B11: "TUT_BUS1",
-    0x40A42F58: "3_B_JOHNNY_HEALTH",
-    0x40A70B54: "MGB2_FOOTER",
-    0x40AE8948: "MGGE_VERMONT",
-    0x40BB6CA0: "TUT_FALARM01",
-    0x40BBA8E6: "TUT_CAM1",
-    0x40BBA8E7: "TUT_CAM2",
-    0x40C021A3: "TUT_CRW7",
-    0x40CDFF06: "BK_CRANK01D",
-    0x40CDFF10: "BK_CRANK01N",
-    0x40CDFF89: "BK_CRANK02D",
-    0x40CDFF93: "BK_CRANK02N",
-    0x40DC7DD9: "COMIC_SHOP_RICH",
-    0x40DDD36C: "CRIME_DAMAGEVEHICLE",
-    0x40E0D912: "RESET_XINPUT",
-    0x40EA1301: "CRIME_INTSTUDENT",
-    0x40F2326F: "TUT_TREEC0",
-    0x40F23270: "TUT_TREEC1",
-    0x40F23271: "TUT_TREEC2",
-    0x40FFC58D: "AS_GD_PROMPT",
-    0x4101F1ED: "1_02B_MOBJ_01",
-    0x4101F1EE: "1_02B_MOBJ_02",
-    0x4101F1EF: "1_02B_MOBJ_03",
-    0x4101F1F0: "1_02B_MOBJ_04",
-    0x4104BA44: "TUT_ERR1",
-    0x4104BA45: "TUT_ERR2",
-    0x4104BA46: "TUT_ERR3",
-    0x4104BA47: "TUT_ERR4",
-    0x4104BA48: "TUT_ERR5",
-    0x4104BA49: "TUT_ERR6",
-    0x41158851: "1_10_FAIL1",
-    0x41158852: "1_10_FAIL2",
-    0x4116D566: "5_02_AREAWARN",
-    0x411CCE7A: "SOC_GEN_LAUGH",
-    0x413A721D: "3-S11C.SUB0001",
-    0x413A721E: "3-S11C.SUB0002",
-    0x413A721F: "3-S11C.SUB0003",
-    0x413A7220: "3-S11C.SUB0004",
-    0x413A7221: "3-S11C.SUB0005",
-    0x413A7222: "3-S11C.SUB0006",
-    0x413A7223: "3-S11C.SUB0007",
-    0x413A7224: "3-S11C.SUB0008",
-    0x413A7225: "3-S11C.SUB0009",
-    0x413A729F: "3-S11C.SUB0010",
-    0x413A72A0: "3-S11C.SUB0011",
-    0x413A72A1: "3-S11C.SUB0012",
-    0x413A72A2: "3-S11C.SUB0013",
-    0x413A72A3: "3-S11C.SUB0014",
-    0x413A72A4: "3-S11C.SUB0015",
-    0x413A72A5: "3-S11C.SUB0016",
-    0x413C99F5: "1_05_EMPTY",
-    0x41491180: "2_S05_TITLE",
-    0x414A8B4C: "ARACDE_N_PEA",
-    0x415976B6: "FE_LOAD",
-    0x41657732: "LMOW_SCORENUM",
-    0x41672C6A: "TUT_HAL1",
-    0x4169B795: "FEO_CONTROLS",
-    0x416E669A: "CLT_TATTOO_TITLE",
-    0x41766D7B: "5_03_GETBACK",
-    0x41782190: "FE_MAPT",
-    0x418A30B2: "RACE_UNLOCKGOKART",
-    0x41904DF6: "MGCE_TIERS",
-    0x419443CE: "SOUND_INIT_FAILED_MSG",
-    0x41983161: "TUT_GVFW01",
-    0x41A67FC5: "MGBT_INSTRUCT",
-    0x41B43093: "FEI_BTR",
-    0x41B43096: "FEI_BTU",
-    0x41B46D78: "FEI_CHR",
-    0x41B5C034: "FEI_HOL",
-    0x41B84F2A: "FEI_R1B",
-    0x41B89B79: "FEI_SCR",
-    0x41BA76D9: "FEI_ZOO",
-    0x41C9C08D: "3_R09_FAILED",
-    0x41D003AF: "1_11X2_MOBJ_01B",
-    0x41D004B5: "1_11X2_MOBJ_03B",
-    0x41D2DB23: "3_01D_TEXT_01",
-    0x41D2DB24: "3_01D_TEXT_02",
-    0x41D2DB25: "3_01D_TEXT_03",
-    0x41DFD012: "AS_BG_COMPLETE",
-    0x41E083E0: "SP_BOXING_FT",
-    0x41E93BF5: "MGC_DUNK_TITLE",
-    0x41F0978B: "TUT_LB01",
-    0x41F6E571: "FUNHOUSE",
-    0x41F8A823: "TAG_VANDAL_01",
-    0x42019077: "TITLE45_NAME0",
-    0x42019078: "TITLE45_NAME1",
-    0x42019079: "TITLE45_NAME2",
-    0x4201907A: "TITLE45_NAME3",
-    0x4203688D: "3_01D_SCENE1",
-    0x4203688E: "3_01D_SCENE2",
-    0x4203688F: "3_01D_SCENE3",
-    0x42047D43: "AS_SW_OBJECTIVE",
-    0x420820AD: "2_R03_02",
-    0x420820B0: "2_R03_05",
-    0x420D819D: "RESCUE_THX1",
-    0x420D819E: "RESCUE_THX2",
-    0x4222759D: "3_05_RESPECTM",
-    0x42271EE8: "AS_SF_COMPLETE",
-    0x4228C43F: "P_GRAF_COUNT",
-    0x42314E30: "FEDS_VSYNC",
-    0x4238ACA1: "TUT_NOT0",
-    0x4238ACA2: "TUT_NOT1",
-    0x4240F613: "MAINMAP",
-    0x4245F635: "FE_SAVE",
-    0x424AE530: "FE_STAT",
-    0x4278489A: "MGCA_INSTRUCTIONS_ENEMIES_HEADING",
-    0x4279CD90: "USE_FUNPAINTOFF",
-    0x4289B301: "FREAK_SHOW",
-    0x4291A675: "AS_PFAIL",
-    0x42A288EB: "TITLE71_NUMNAMES",
-    0x42A39A9D: "3_R05B_EMPTY",
-    0x42A3B7E1: "RARC_STOEXIT",
-    0x42A511C4: "AS_P8_FAIL",
-    0x42AC2710: "DBG_WON",
-    0x42C1DC69: "MGPH_ZARFSIGN",
-    0x42C36BE4: "C_CLOWNWIG",
-    0x42C3AF17: "TUT_RVB1",
-    0x42C3AF18: "TUT_RVB2",
-    0x42D54894: "TUT_TRSP01",
-    0x42E56E80: "TUT_ST2A",
-    0x42E56E82: "TUT_ST2C",
-    0x42F46117: "MGPH_WIZARDHAT",
-    0x43028D68: "MGGE_NEW MEXICO",
-    0x430594DE: "AS_LB_FAIL",
-    0x430748E8: "TUT_TRW1",
-    0x430E166E: "FE_TOURNEY_3",
-    0x430E1671: "FE_TOURNEY_6",
-    0x430E1674: "FE_TOURNEY_9",
-    0x430ED273: "AS_EM_FAILED",
-    0x431D25D9: "UP_MATH1",
-    0x431D25DA: "UP_MATH2",
-    0x431D25DB: "UP_MATH3",
-    0x431D25DC: "UP_MATH4",
-    0x431D25DD: "UP_MATH5",
-    0x431EC52F: "TITLE30_NAME0",
-    0x43314B22: "CRIME_STEALTH",
-    0x433C38EA: "AS_EP_OBJECTIVE",
-    0x43407514: "CHAPT4TRANS_ASYLUM",
-    0x43418D95: "ADULTWARN1",
-    0x43418D96: "ADULTWARN2",
-    0x43418D97: "ADULTWARN3",
-    0x4344E286: "R_WRISTBAND1",
-    0x4344E287: "R_WRISTBAND2",
-    0x4344E288: "R_WRISTBAND3",
-    0x4344E289: "R_WRISTBAND4",
-    0x43452C62: "GKART_TUTORIAL",
-    0x43508C55: "AS_CN_ACTION",
-    0x4352A0BF: "AS_SL_COUNTER",
-    0x43533140: "MGG2_SEL",
-    0x435428E2: "5_01_RESPECT",
-    0x436A6305: "MP_MGL2_TEXT1",
-    0x436A6306: "MP_MGL2_TEXT2",
-    0x436A6307: "MP_MGL2_TEXT3",
-    0x436A6308: "MP_MGL2_TEXT4",
-    0x436F6E07: "TUT_WW2A",
-    0x43793FB5: "MGA2_INSTRUCTIONS_EXPLODER_DESC",
-    0x437B235B: "3_01_SPOTTED",
-    0x437BDD00: "GA_OPN",
-    0x4385C8FA: "N_MRWIGGINS",
-    0x4385FE69: "4_05_TITLE",
-    0x438D336A: "PRP_01",
-    0x438D336B: "PRP_02",
-    0x438D4DDD: "ARCADE_FLNG_101",
-    0x438D4DDE: "ARCADE_FLNG_102",
-    0x438D4DDF: "ARCADE_FLNG_103",
-    0x438D4DE0: "ARCADE_FLNG_104",
-    0x438D4DE1: "ARCADE_FLNG_105",
-    0x43929FB9: "1_06_MOVEUNLK01",
-    0x43929FBA: "1_06_MOVEUNLK02",
-    0x43929FBB: "1_06_MOVEUNLK03",
-    0x43929FBC: "1_06_MOVEUNLK04",
-    0x43929FBD: "1_06_MOVEUNLK05",
-    0x43929FBE: "1_06_MOVEUNLK06",
-    0x43929FBF: "1_06_MOVEUNLK07",
-    0x43929FC0: "1_06_MOVEUNLK08",
-    0x43929FC1: "1_06_MOVEUNLK09",
-    0x439B2861: "SOC_GEN_REACTANGRY",
-    0x439D3E42: "GRAF_SETH01",
-    0x439D3E43: "GRAF_SETH02",
-    0x439D3E44: "GRAF_SETH03",
-    0x439D3E45: "GRAF_SETH04",
-    0x439D3E46: "GRAF_SETH05",
-    0x43A91008: "1_04_GARY_LEFT",
-    0x43A9FD83: "1_11X2_FAIL_01",
-    0x43A9FD84: "1_11X2_FAIL_02",
-    0x43AE56C7: "TUT_YAR1",
-    0x43B40ED4: "AS_GOKARTKING",
-    0x43B6B1B6: "5-03.SUB0001",
-    0x43B6B1B7: "5-03.SUB0002",
-    0x43B6B1B8: "5-03.SUB0003",
-    0x43B6B1B9: "5-03.SUB0004",
-    0x43B6B1BA: "5-03.SUB0005",
-    0x43B6B1BB: "5-03.SUB0006",
-    0x43B6B1BC: "5-03.SUB0007",
-    0x43B6B1BD: "5-03.SUB0008",
-    0x43B6B1BE: "5-03.SUB0009",
-    0x43B6B238: "5-03.SUB0010",
-    0x43B6B239: "5-03.SUB0011",
-    0x43B6B23A: "5-03.SUB0012",
-    0x43B6B23B: "5-03.SUB0013",
-    0x43B6B23C: "5-03.SUB0014",
-    0x43B6B23D: "5-03.SUB0015",
-    0x43B6B23E: "5-03.SUB0016",
-    0x43B6B23F: "5-03.SUB0017",
-    0x43B6B240: "5-03.SUB0018",
-    0x43B6B241: "5-03.SUB0019",
-    0x43B6B2BB: "5-03.SUB0020",
-    0x43B6B2BC: "5-03.SUB0021",
-    0x43B6B2BD: "5-03.SUB0022",
-    0x43DA39B8: "GOKART_01",
-    0x43DA39B9: "GOKART_02",
-    0x43DA39BA: "GOKART_03",
-    0x43E532FD: "MG_NUTSHOTS_FE",
-    0x43E978FB: "4_S12_OBJNECKLACE",
-    0x43EB11D0: "ITEM_PUMPKIN",
-    0x43ECD93A: "DESC_DO_MED_01",
-    0x43F05AAE: "S_APOL_LOW_GIRL_01",
-    0x43F15B97: "AS_CG_OBJCOUNT1",
-    0x43F8BC6C: "1_G1_BEAHIT",
-    0x43FECE11: "1_02B_MOBJ_04A",
-    0x43FECE12: "1_02B_MOBJ_04B",
-    0x43FECE13: "1_02B_MOBJ_04C",
-    0x4420A4D2: "CMN_STR_01",
-    0x4420A4D3: "CMN_STR_02",
-    0x4420A4D4: "CMN_STR_03",
-    0x4420A4D5: "CMN_STR_04",
-    0x4420A4D6: "CMN_STR_05",
-    0x4420A4D7: "CMN_STR_06",
-    0x4420A4D8: "CMN_STR_07",
-    0x4420A4D9: "CMN_STR_08",
-    0x4420A4DA: "CMN_STR_09",
-    0x4420A554: "CMN_STR_10",
-    0x4420A555: "CMN_STR_11",
-    0x4420A556: "CMN_STR_12",
-    0x4420A557: "CMN_STR_13",
-    0x4420A558: "CMN_STR_14",
-    0x4420A559: "CMN_STR_15",
-    0x4420A55A: "CMN_STR_16",
-    0x4420A55B: "CMN_STR_17",
-    0x4420A55C: "CMN_STR_18",
-    0x4420A55D: "CMN_STR_19",
-    0x4420A5D7: "CMN_STR_20",
-    0x4420A5D8: "CMN_STR_21",
-    0x4420A5D9: "CMN_STR_22",
-    0x4439FD09: "MGBI_PERCH_0",
-    0x4439FD0A: "MGBI_PERCH_1",
-    0x4439FD0B: "MGBI_PERCH_2",
-    0x4439FD0C: "MGBI_PERCH_3",
-    0x4439FD0D: "MGBI_PERCH_4",
-    0x4439FD0E: "MGBI_PERCH_5",
-    0x4439FD0F: "MGBI_PERCH_6",
-    0x4439FD10: "MGBI_PERCH_7",
-    0x4439FD11: "MGBI_PERCH_8",
-    0x4439FD12: "MGBI_PERCH_9",
-    0x443A25D6: "AS_SA_ACTION",
-    0x4452AEE4: "6-02B.SUB0001",
-    0x4452AEE5: "6-02B.SUB0002",
-    0x4452AEE6: "6-02B.SUB0003",
-    0x4452AEE7: "6-02B.SUB0004",
-    0x4452AEE8: "6-02B.SUB0005",
-    0x4452AEE9: "6-02B.SUB0006",
-    0x4452AEEA: "6-02B.SUB0007",
-    0x4452AEEB: "6-02B.SUB0008",
-    0x4452AEEC: "6-02B.SUB0009",
-    0x4452AF66: "6-02B.SUB0010",
-    0x4452AF67: "6-02B.SUB0011",
-    0x4452AF68: "6-02B.SUB0012",
-    0x4452AF69: "6-02B.SUB0013",
-    0x4452AF6A: "6-02B.SUB0014",
-    0x4452AF6B: "6-02B.SUB0015",
-    0x4452AF6C: "6-02B.SUB0016",
-    0x4452AF6D: "6-02B.SUB0017",
-    0x4452AF6E: "6-02B.SUB0018",
-    0x4453E325: "TITLE55_NUMNAMES",
-    0x44638901: "R_SSMART_01",
-    0x44638902: "R_SSMART_02",
-    0x44638903: "R_SSMART_03",
-    0x44638904: "R_SSMART_04",
-    0x446A4B62: "2_06_PINKYHURT",
-    0x4472D29D: "MC_SCORE",
-    0x44775EAA: "2-BB.SUB0001",
-    0x44775EAB: "2-BB.SUB0002",
-    0x44775EAC: "2-BB.SUB0003",
-    0x44775EAD: "2-BB.SUB0004",
-    0x44775EAE: "2-BB.SUB0005",
-    0x44775EAF: "2-BB.SUB0006",
-    0x44775EB0: "2-BB.SUB0007",
-    0x44775EB1: "2-BB.SUB0008",
-    0x44775EB2: "2-BB.SUB0009",
-    0x44775F2C: "2-BB.SUB0010",
-    0x4477C76A: "CLT_FASTFOOD",
-    0x4477D06B: "MGDT_XSTART",
-    0x44833392: "4_S12_OBJDRESS",
-    0x44923068: "5_01_TITLE",
-    0x44925EBA: "XBUTTON_0001",
-    0x44925EBB: "XBUTTON_0002",
-    0x44925EBD: "XBUTTON_0004",
-    0x44925EC1: "XBUTTON_0008",
-    0x44925F3C: "XBUTTON_0010",
-    0x44925FBF: "XBUTTON_0020",
-    0x449260C5: "XBUTTON_0040",
-    0x449262D1: "XBUTTON_0080",
-    0x4492A1C2: "XBUTTON_0100",
-    0x4492E4CB: "XBUTTON_0200",
-    0x44936ADD: "XBUTTON_0400",
-    0x44947701: "XBUTTON_0800",
-    0x449D1C57: "RANALOG_VEHICLE",
-    0x44B4AC54: "XBUTTON_1000",
-    0x44BBFCA5: "3-01DC.SUB0001",
-    0x44BBFCA6: "3-01DC.SUB0002",
-    0x44BBFCA7: "3-01DC.SUB0003",
-    0x44BBFCA8: "3-01DC.SUB0004",
-    0x44BBFCA9: "3-01DC.SUB0005",
-    0x44BBFCAA: "3-01DC.SUB0006",
-    0x44BBFCAB: "3-01DC.SUB0007",
-    0x44BBFCAC: "3-01DC.SUB0008",
-    0x44C293BA: "",
-    0x44C609F6: "2_02_WARN",
-    0x44CD3D76: "USE_BUYTICKET",
-    0x44D6F9EF: "XBUTTON_2000",
-    0x44ED10CB: "AS_RO_FAIL",
-    0x44EE9B5D: "CLT_MASCOT",
-    0x44F16FF2: "AS_F4_AMMO",
-    0x44F517EE: "SOC_AUTH_AP",
-    0x450952B3: "4_01_MOBJ_01",
-    0x450952B4: "4_01_MOBJ_02",
-    0x450952B5: "4_01_MOBJ_03",
-    0x451672B6: "MGCA_INSTRUCTIONS_FREEZE_DESC",
-    0x4518586A: "FEI_CLCTBLS",
-    0x451B9525: "XBUTTON_4000",
-    0x451D5258: "AS_PT_FAIL",
-    0x4521C790: "CLT_HAIRSALON_TITLE",
-    0x45264F97: "N_DRCRABBLESNITCH",
-    0x45284A6B: "MRESPECT_PP100",
-    0x452FF069: "CLT_COST2",
-    0x45358808: "TITLE17_NAME0",
-    0x45358809: "TITLE17_NAME1",
-    0x4535880A: "TITLE17_NAME2",
-    0x4539040E: "DIBUTTON_JOYBUTTON",
-    0x45393697: "DPADU_VEHICLE",
-    0x45513F19: "CLT_BMX",
-    0x45514332: "CLT_BUY",
-    0x45519482: "MGPH_LIBRARY",
-    0x4552079F: "CLT_ELF",
-    0x4552945F: "CLT_GYM",
-    0x4558CBB6: "RACE_OFFGKART",
-    0x455CD916: "1_02A_GARYHAR",
-    0x4564D154: "1_10_NEMESIS",
-    0x45652940: "USE_DARTS",
-    0x4566CC09: "3_01C_WARNING_01",
-    0x4566CC0A: "3_01C_WARNING_02",
-    0x4566CC0B: "3_01C_WARNING_03",
-    0x4566CC0C: "3_01C_WARNING_04",
-    0x45684B71: "4_B1_UNLOCK",
-    0x456E4093: "TM_TIRED5",
-    0x4573DC64: "AS_GS_OBJECTIVES",
-    0x4573DC6B: "AS_GS_OBJECTIVEZ",
-    0x457A1FE2: "N_MRGRANT",
-    0x45824025: "TAG_NERD_MED_01",
-    0x458E7C1B: "MGCE_BADWORDS",
-    0x459DAE56: "MGCA_INSTRUCTIONS_CRAWLER_FASTCRAWLER_DESC",
-    0x45A4CB91: "XBUTTON_8000",
-    0x45AA4ECC: "STAT_TIME",
-    0x45B53F95: "MGM2_T1GROUPS",
-    0x45B96705: "MGPH_WARRIOR",
-    0x45BBF4AE: "BUTTON_SELECT_D",
-    0x45BBF4C2: "BUTTON_SELECT_X",
-    0x45C72572: "STO_UNITS",
-    0x45CD388C: "MGE2_T14G01WORDS",
-    0x45DEA102: "N_JOHNSON",
-    0x45E02B42: "CRIME_SKIPPINGCLASS",
-    0x45E210DE: "1_S01_01",
-    0x45E210DF: "1_S01_02",
-    0x45E210E0: "1_S01_03",
-    0x45E210E1: "1_S01_04",
-    0x45E210E2: "1_S01_05",
-    0x45E212EB: "1_S01_42",
-    0x45E21372: "1_S01_56",
-    0x45E51247: "MGGE_DENMARK",
-    0x45EAB7EF: "1-08.SUB0001",
-    0x45EAB7F0: "1-08.SUB0002",
-    0x45EAB7F1: "1-08.SUB0003",
-    0x45EAB7F2: "1-08.SUB0004",
-    0x45EAB7F3: "1-08.SUB0005",
-    0x45EAB7F4: "1-08.SUB0006",
-    0x45EAB7F5: "1-08.SUB0007",
-    0x45EAB7F6: "1-08.SUB0008",
-    0x45EAB7F7: "1-08.SUB0009",
-    0x45EAB871: "1-08.SUB0010",
-    0x45EAB872: "1-08.SUB0011",
-    0x45EAB873: "1-08.SUB0012",
-    0x45EAB874: "1-08.SUB0013",
-    0x45EAB875: "1-08.SUB0014",
-    0x45EAB876: "1-08.SUB0015",
-    0x45EAB877: "1-08.SUB0016",
-    0x45EAB878: "1-08.SUB0017",
-    0x45EAB879: "1-08.SUB0018",
-    0x45EAB87A: "1-08.SUB0019",
-    0x45EAB8F4: "1-08.SUB0020",
-    0x45EAB8F5: "1-08.SUB0021",
-    0x45EAB8F6: "1-08.SUB0022",
-    0x45EAB8F7: "1-08.SUB0023",
-    0x45EAB8F8: "1-08.SUB0024",
-    0x45EAB8F9: "1-08.SUB0025",
-    0x45EAB8FA: "1-08.SUB0026",
-    0x45EAB8FB: "1-08.SUB0027",
-    0x45EAB8FC: "1-08.SUB0028",
-    0x45EAB8FD: "1-08.SUB0029",
-    0x45F50FCF: "RICH_FIRE_01",
-    0x45FA80CA: "CONT_09_WII",
-    0x46053D5F: "TITLE39_NUMNAMES",
-    0x460A8D94: "AS_PI_OBJECTIVE",
-    0x460EB6F1: "TITLE3_NAME0",
-    0x460EB6F2: "TITLE3_NAME1",
-    0x460EB6F3: "TITLE3_NAME2",
-    0x460EB6F4: "TITLE3_NAME3",
-    0x460EB6F5: "TITLE3_NAME4",
-    0x460EB6F6: "TITLE3_NAME5",
-    0x460EB6F7: "TITLE3_NAME6",
-    0x460EB6F8: "TITLE3_NAME7",
-    0x460EB6F9: "TITLE3_NAME8",
-    0x460EB6FA: "TITLE3_NAME9",
-    0x4618F9AA: "3_S10_01",
-    0x4618F9AB: "3_S10_02",
-    0x4618F9AC: "3_S10_03",
-    0x4618F9AD: "3_S10_04",
-    0x4618F9AE: "3_S10_05",
-    0x4618F9AF: "3_S10_06",
-    0x4618F9B0: "3_S10_07",
-    0x4618F9B1: "3_S10_08",
-    0x4618F9B2: "3_S10_09",
-    0x4618FA2C: "3_S10_10",
-    0x4618FA2E: "3_S10_12",
-    0x462654B4: "USE_FOUNTAIN",
-    0x4629B595: "MGMA_SCMSG1",
-    0x4629B596: "MGMA_SCMSG2",
-    0x4629B597: "MGMA_SCMSG3",
-    0x462EA23D: "HUD_PNSH_ADD",
-    0x463B4747: "3_S11_03",
-    0x463B47CD: "3_S11_16",
-    0x463B48D2: "3_S11_35",
-    0x463B4ADD: "3_S11_74",
-    0x463B4BE0: "3_S11_91",
-    0x463B4BE1: "3_S11_92",
-    0x463B4BE2: "3_S11_93",
-    0x463B4BE3: "3_S11_94",
-    0x4647E1C1: "4-G4.SUB0001",
-    0x4647E1C2: "4-G4.SUB0002",
-    0x4647E1C3: "4-G4.SUB0003",
-    0x4647E1C4: "4-G4.SUB0004",
-    0x4647E1C5: "4-G4.SUB0005",
-    0x4647E1C6: "4-G4.SUB0006",
-    0x4647E1C7: "4-G4.SUB0007",
-    0x4647E1C8: "4-G4.SUB0008",
-    0x4647E1C9: "4-G4.SUB0009",
-    0x4647E243: "4-G4.SUB0010",
-    0x4647E244: "4-G4.SUB0011",
-    0x4647E245: "4-G4.SUB0012",
-    0x4647E246: "4-G4.SUB0013",
-    0x4647E247: "4-G4.SUB0014",
-    0x4647E248: "4-G4.SUB0015",
-    0x4647E249: "4-G4.SUB0016",
-    0x4647E24A: "4-G4.SUB0017",
-    0x4647E24B: "4-G4.SUB0018",
-    0x4647E24C: "4-G4.SUB0019",
-    0x4647E2C6: "4-G4.SUB0020",
-    0x4647E2C7: "4-G4.SUB0021",
-    0x4647E2C8: "4-G4.SUB0022",
-    0x4647E2C9: "4-G4.SUB0023",
-    0x4647E2CA: "4-G4.SUB0024",
-    0x4647E2CB: "4-G4.SUB0025",
-    0x4647E2CC: "4-G4.SUB0026",
-    0x4647E2CD: "4-G4.SUB0027",
-    0x4647E2CE: "4-G4.SUB0028",
-    0x4647E2CF: "4-G4.SUB0029",
-    0x4647E349: "4-G4.SUB0030",
-    0x4647E34A: "4-G4.SUB0031",
-    0x4647E34B: "4-G4.SUB0032",
-    0x4647E34C: "4-G4.SUB0033",
-    0x4647E34D: "4-G4.SUB0034",
-    0x4647E34E: "4-G4.SUB0035",
-    0x464AA423: "TITLE78_NAME0",
-    0x464FC972: "BIO_LAB",
-    0x4654BCDE: "DESC_GNOME",
-    0x4655C1D3: "DPADD_BIKE",
-    0x4662339F: "CARD_04_WII",
-    0x466C6F2A: "TUT_PEACEFIST",
-    0x46729490: "AS_P8_ACTION",
-    0x4674D2B5: "UP_GEOGRAPHY1",
-    0x4674D2B6: "UP_GEOGRAPHY2",
-    0x4674D2B7: "UP_GEOGRAPHY3",
-    0x4674D2B8: "UP_GEOGRAPHY4",
-    0x4674D2B9: "UP_GEOGRAPHY5",
-    0x467684D5: "N_MSRUSHINSKI",
-    0x46886C8B: "SP_NASCAR_H",
-    0x46886C8F: "SP_NASCAR_L",
-    0x46886C97: "SP_NASCAR_T",
-    0x469093A5: "2_01_OGETREMAIN1",
-    0x46941292: "STO_FREEOUTOFSTOCK",
-    0x4697985D: "MG_GRASS",
-    0x469CFBF4: "5_05_UNLOCK",
-    0x469E9174: "3_02_RESPECTM",
-    0x469E9177: "3_02_RESPECTP",
-    0x469ED006: "CONT_12_WII",
-    0x46A33ABF: "AS_SC_COMPLETE",
-    0x46AE8456: "4_02_GCANNON",
-    0x46B3C680: "3_XM_FAIL_01",
-    0x46BFF0FC: "TUT_NINJABL",
-    0x46C1AC43: "N_BETHANYJONES",
-    0x46DDBD24: "MGBI_FROG_10",
-    0x46DDBD25: "MGBI_FROG_11",
-    0x46DDBD26: "MGBI_FROG_12",
-    0x46DDBD27: "MGBI_FROG_13",
-    0x46DDBD28: "MGBI_FROG_14",
-    0x46E08C90: "DPADD_FOOT",
-    0x46E612EE: "A1_UNLOCK1",
-    0x46E9A76F: "FUN_MTR_WITCH",
-    0x46F70B19: "SP_HIPSHIRT",
-    0x46FF20E9: "SOC_GEN_HUMILIATEATTACK",
-    0x47025C72: "MGGE_NIGERIA",
-    0x47083CA7: "4_04_FAIL01",
-    0x47083CA8: "4_04_FAIL02",
-    0x47083CA9: "4_04_FAIL03",
-    0x47083CAA: "4_04_FAIL04",
-    0x4710506D: "MG_CONSUMO",
-    0x47141640: "MC_DI_FOOTER",
-    0x471D204F: "1_04_KO_GARY",
-    0x47236EF3: "R_WATCH1",
-    0x47236EF4: "R_WATCH2",
-    0x47236EF5: "R_WATCH3",
-    0x47236EF6: "R_WATCH4",
-    0x4733BB42: "1_08_BEAHIT",
-    0x4742493B: "AS_BB_OBJECTIVE",
-    0x4753AA38: "AS_PB_RETURN",
-    0x475A5A84: "P_FAUHAWK",
-    0x4767D8DB: "TITLE63_NAME0",
-    0x4767D8DC: "TITLE63_NAME1",
-    0x4771F8D1: "AS_KM_OBJECTIVE",
-    0x4775556A: "AS_GS_OBJCOUNT",
-    0x47766432: "AS_PIRATE",
-    0x477F32FA: "N_PLAYER",
-    0x478AFF73: "MD_DISCONNECTED",
-    0x4791FF04: "NERD_FORTRESS",
-    0x47A5C531: "MGGE_ARKANSAS",
-    0x47ABA088: "MG_CHEM_FE",
-    0x47B95C2E: "MISTATUS",
-    0x47C5D01D: "CHAPT1TRANS_BIKE",
-    0x47E3B466: "AS_LD_RETURNDOG",
-    0x47E6090E: "CHAPT1TRANS_CARN",
-    0x47FAD8DF: "CHAPT3TRANS_FRIENDS",
-    0x48021A40: "1_05_TITLE",
-    0x480C3C3C: "4_S12_PEANUT_DROPPED",
-    0x480D7632: "AS_COMPLETE",
-    0x480F09B6: "MGGE_NEVADA",
-    0x481CCC3F: "ART_ROOM",
-    0x481F2843: "1_02_HUMILIATEHIM",
-    0x4820928C: "MMDDYYYY",
-    0x4821E5FD: "3_06_GETBACKRUMBLE",
-    0x482207B6: "P_MH_FLAT",
-    0x4826B317: "FAC_PREPPIES",
-    0x482DC482: "FELO_CONTROLS_N",
-    0x482DC486: "FELO_CONTROLS_R",
-    0x483AF25E: "2_S05_HITTEACH",
-    0x4842DC54: "MGPH_POTATOGUN",
-    0x487B4424: "GKART_TICKET",
-    0x4882D836: "AS_GD_COMPLETE",
-    0x4883AE31: "AS_IP_ACTION",
-    0x48945BCA: "1-03.SUB0001",
-    0x48945BCB: "1-03.SUB0002",
-    0x48945BCC: "1-03.SUB0003",
-    0x48945BCD: "1-03.SUB0004",
-    0x48945BCE: "1-03.SUB0005",
-    0x48945BCF: "1-03.SUB0006",
-    0x48945BD0: "1-03.SUB0007",
-    0x48945BD1: "1-03.SUB0008",
-    0x48945BD2: "1-03.SUB0009",
-    0x48945C4C: "1-03.SUB0010",
-    0x48945C4D: "1-03.SUB0011",
-    0x48945C4E: "1-03.SUB0012",
-    0x48945C4F: "1-03.SUB0013",
-    0x48945C50: "1-03.SUB0014",
-    0x48945C51: "1-03.SUB0015",
-    0x48945C52: "1-03.SUB0016",
-    0x48945C53: "1-03.SUB0017",
-    0x48945C54: "1-03.SUB0018",
-    0x48945C55: "1-03.SUB0019",
-    0x48945CCF: "1-03.SUB0020",
-    0x48945CD0: "1-03.SUB0021",
-    0x48945CD1: "1-03.SUB0022",
-    0x48945CD2: "1-03.SUB0023",
-    0x48945CD3: "1-03.SUB0024",
-    0x48945CD4: "1-03.SUB0025",
-    0x48945CD5: "1-03.SUB0026",
-    0x489E03E8: "3_01D_TITLE",
-    0x48C14B5B: "AS_LD_OBJECTIVE",
-    0x48C4A035: "AS_INCOG",
-    0x48C4BFE7: "3_05_OBRWALL",
-    0x48CF0298: "MGGE_TUNISIA",
-    0x48CFFEFC: "TITLE52_NUMNAMES",
-    0x48D3E8E8: "MGE2_GETINFO",
-    0x48DD4BDA: "3_01_PHOTHG",
-    0x48DD4BDE: "3_01_PHOTHK",
-    0x48DD4D63: "3_01_PHOTKG",
-    0x48F37D49: "MGGE_ONTARIO",
-    0x48F7A38D: "4_G4_TITLE",
-    0x48FB903B: "MGGE_UGANDA",
-    0x490278FC: "FEYB_PAGENUM",
-    0x490E4C3F: "2_01_TITLE",
-    0x490F8C83: "AS_OBJCOMPLETE",
-    0x4915396B: "SM_ART1",
-    0x4915396C: "SM_ART2",
-    0x4915396D: "SM_ART3",
-    0x4915396E: "SM_ART4",
-    0x4915396F: "SM_ART5",
-    0x49157D66: "1_G1_LOSEPF",
-    0x491C7BB4: "ERR_NOT_FOUND",
-    0x4920EF65: "5_07A_OBJ1",
-    0x4920EF66: "5_07A_OBJ2",
-    0x4920EF67: "5_07A_OBJ3",
-    0x4920EF68: "5_07A_OBJ4",
-    0x4920EF69: "5_07A_OBJ5",
-    0x4920EF6A: "5_07A_OBJ6",
-    0x4920EF6B: "5_07A_OBJ7",
-    0x4920EF6C: "5_07A_OBJ8",
-    0x4920EF6D: "5_07A_OBJ9",
-    0x4926ED29: "UH_CHEM",
-    0x493BEE11: "5_03_GETIN",
-    0x4949BE70: "SP_ZORROMASK",
-    0x4959AA42: "SP_ELF_H",
-    0x4959AA46: "SP_ELF_L",
-    0x4959AA4E: "SP_ELF_T",
-    0x495D2008: "MGGE_GREECE",
-    0x49644AF7: "MGCA_SPEEDBOOST_NAME",
-    0x49693588: "AS_BG_OBJECTIVE",
-    0x496BB742: "TENEMENT",
-    0x496E0190: "6-02.SUB0001",
-    0x496E0191: "6-02.SUB0002",
-    0x496E0192: "6-02.SUB0003",
-    0x496E0193: "6-02.SUB0004",
-    0x496E0194: "6-02.SUB0005",
-    0x496E0195: "6-02.SUB0006",
-    0x496E0196: "6-02.SUB0007",
-    0x496E0197: "6-02.SUB0008",
-    0x496E0198: "6-02.SUB0009",
-    0x496E0212: "6-02.SUB0010",
-    0x496E0213: "6-02.SUB0011",
-    0x496E0214: "6-02.SUB0012",
-    0x496E0215: "6-02.SUB0013",
-    0x496E0216: "6-02.SUB0014",
-    0x496E0217: "6-02.SUB0015",
-    0x496E0218: "6-02.SUB0016",
-    0x496E0219: "6-02.SUB0017",
-    0x496E021A: "6-02.SUB0018",
-    0x496E021B: "6-02.SUB0019",
-    0x496E0295: "6-02.SUB0020",
-    0x496E0296: "6-02.SUB0021",
-    0x496E9D73: "MD_LOAD_SIGNIN",
-    0x4979921D: "TITLE64_NAME100",
-    0x4979921E: "TITLE64_NAME101",
-    0x4979921F: "TITLE64_NAME102",
-    0x49799220: "TITLE64_NAME103",
-    0x49799221: "TITLE64_NAME104",
-    0x49799222: "TITLE64_NAME105",
-    0x49799223: "TITLE64_NAME106",
-    0x49799224: "TITLE64_NAME107",
-    0x49799225: "TITLE64_NAME108",
-    0x49799226: "TITLE64_NAME109",
-    0x497992A0: "TITLE64_NAME110",
-    0x497992A1: "TITLE64_NAME111",
-    0x497992A2: "TITLE64_NAME112",
-    0x497992A3: "TITLE64_NAME113",
-    0x497992A4: "TITLE64_NAME114",
-    0x497992A5: "TITLE64_NAME115",
-    0x497992A6: "TITLE64_NAME116",
-    0x497992A7: "TITLE64_NAME117",
-    0x497992A8: "TITLE64_NAME118",
-    0x497992A9: "TITLE64_NAME119",
-    0x49799323: "TITLE64_NAME120",
-    0x49799324: "TITLE64_NAME121",
-    0x49799325: "TITLE64_NAME122",
-    0x49799326: "TITLE64_NAME123",
-    0x49799327: "TITLE64_NAME124",
-    0x49799328: "TITLE64_NAME125",
-    0x49799329: "TITLE64_NAME126",
-    0x4979932A: "TITLE64_NAME127",
-    0x4979932B: "TITLE64_NAME128",
-    0x4979932C: "TITLE64_NAME129",
-    0x497993A6: "TITLE64_NAME130",
-    0x497993A7: "TITLE64_NAME131",
-    0x497993A8: "TITLE64_NAME132",
-    0x497993A9: "TITLE64_NAME133",
-    0x497993AA: "TITLE64_NAME134",
-    0x497993AB: "TITLE64_NAME135",
-    0x497993AC: "TITLE64_NAME136",
-    0x497993AD: "TITLE64_NAME137",
-    0x497993AE: "TITLE64_NAME138",
-    0x497993AF: "TITLE64_NAME139",
-    0x49799429: "TITLE64_NAME140",
-    0x4979942A: "TITLE64_NAME141",
-    0x4979942B: "TITLE64_NAME142",
-    0x4979942C: "TITLE64_NAME143",
-    0x4979942D: "TITLE64_NAME144",
-    0x4979942E: "TITLE64_NAME145",
-    0x4979942F: "TITLE64_NAME146",
-    0x49799430: "TITLE64_NAME147",
-    0x49799431: "TITLE64_NAME148",
-    0x49799432: "TITLE64_NAME149",
-    0x497994AC: "TITLE64_NAME150",
-    0x497994AD: "TITLE64_NAME151",
-    0x497994AE: "TITLE64_NAME152",
-    0x497994AF: "TITLE64_NAME153",
-    0x497994B0: "TITLE64_NAME154",
-    0x497994B1: "TITLE64_NAME155",
-    0x497994B2: "TITLE64_NAME156",
-    0x497994B3: "TITLE64_NAME157",
-    0x497994B4: "TITLE64_NAME158",
-    0x497994B5: "TITLE64_NAME159",
-    0x4979952F: "TITLE64_NAME160",
-    0x49799530: "TITLE64_NAME161",
-    0x49799531: "TITLE64_NAME162",
-    0x49799532: "TITLE64_NAME163",
-    0x49799533: "TITLE64_NAME164",
-    0x49799534: "TITLE64_NAME165",
-    0x49799535: "TITLE64_NAME166",
-    0x49799536: "TITLE64_NAME167",
-    0x49799537: "TITLE64_NAME168",
-    0x49799538: "TITLE64_NAME169",
-    0x497995B2: "TITLE64_NAME170",
-    0x497995B3: "TITLE64_NAME171",
-    0x497995B4: "TITLE64_NAME172",
-    0x497995B5: "TITLE64_NAME173",
-    0x497995B6: "TITLE64_NAME174",
-    0x497995B7: "TITLE64_NAME175",
-    0x497995B8: "TITLE64_NAME176",
-    0x497995B9: "TITLE64_NAME177",
-    0x497995BA: "TITLE64_NAME178",
-    0x497995BB: "TITLE64_NAME179",
-    0x49799635: "TITLE64_NAME180",
-    0x49799636: "TITLE64_NAME181",
-    0x49799637: "TITLE64_NAME182",
-    0x49799638: "TITLE64_NAME183",
-    0x49799639: "TITLE64_NAME184",
-    0x4979963A: "TITLE64_NAME185",
-    0x4979963B: "TITLE64_NAME186",
-    0x4979963C: "TITLE64_NAME187",
-    0x4979963D: "TITLE64_NAME188",
-    0x4979963E: "TITLE64_NAME189",
-    0x497996B8: "TITLE64_NAME190",
-    0x497996B9: "TITLE64_NAME191",
-    0x497996BA: "TITLE64_NAME192",
-    0x497996BB: "TITLE64_NAME193",
-    0x497996BC: "TITLE64_NAME194",
-    0x497996BD: "TITLE64_NAME195",
-    0x497996BE: "TITLE64_NAME196",
-    0x497996BF: "TITLE64_NAME197",
-    0x497996C0: "TITLE64_NAME198",
-    0x497996C1: "TITLE64_NAME199",
-    0x4979D526: "TITLE64_NAME200",
-    0x4979D527: "TITLE64_NAME201",
-    0x4979D528: "TITLE64_NAME202",
-    0x4979D529: "TITLE64_NAME203",
-    0x4979D52A: "TITLE64_NAME204",
-    0x4979D52B: "TITLE64_NAME205",
-    0x4979D52C: "TITLE64_NAME206",
-    0x4979D52D: "TITLE64_NAME207",
-    0x4979D52E: "TITLE64_NAME208",
-    0x4979D52F: "TITLE64_NAME209",
-    0x4979D5A9: "TITLE64_NAME210",
-    0x4979D5AA: "TITLE64_NAME211",
-    0x4979D5AB: "TITLE64_NAME212",
-    0x4979D5AC: "TITLE64_NAME213",
-    0x4979D5AD: "TITLE64_NAME214",
-    0x4979D5AE: "TITLE64_NAME215",
-    0x4979D5AF: "TITLE64_NAME216",
-    0x4979D5B0: "TITLE64_NAME217",
-    0x4979D5B1: "TITLE64_NAME218",
-    0x4979D5B2: "TITLE64_NAME219",
-    0x4979D62C: "TITLE64_NAME220",
-    0x4979D62D: "TITLE64_NAME221",
-    0x4979D62E: "TITLE64_NAME222",
-    0x4979D62F: "TITLE64_NAME223",
-    0x4979D630: "TITLE64_NAME224",
-    0x4979D631: "TITLE64_NAME225",
-    0x4979D632: "TITLE64_NAME226",
-    0x4979D633: "TITLE64_NAME227",
-    0x4979D634: "TITLE64_NAME228",
-    0x4979D635: "TITLE64_NAME229",
-    0x4979D6AF: "TITLE64_NAME230",
-    0x4979D6B0: "TITLE64_NAME231",
-    0x4979D6B1: "TITLE64_NAME232",
-    0x4979D6B2: "TITLE64_NAME233",
-    0x4979D6B3: "TITLE64_NAME234",
-    0x4979D6B4: "TITLE64_NAME235",
-    0x4979D6B5: "TITLE64_NAME236",
-    0x4979D6B6: "TITLE64_NAME237",
-    0x4979D6B7: "TITLE64_NAME238",
-    0x4979D6B8: "TITLE64_NAME239",
-    0x4979D732: "TITLE64_NAME240",
-    0x4979D733: "TITLE64_NAME241",
-    0x4979D734: "TITLE64_NAME242",
-    0x4979D735: "TITLE64_NAME243",
-    0x4979D736: "TITLE64_NAME244",
-    0x4979D737: "TITLE64_NAME245",
-    0x4979D738: "TITLE64_NAME246",
-    0x4979D739: "TITLE64_NAME247",
-    0x4979D73A: "TITLE64_NAME248",
-    0x4979D73B: "TITLE64_NAME249",
-    0x4979D7B5: "TITLE64_NAME250",
-    0x4979D7B6: "TITLE64_NAME251",
-    0x4979D7B7: "TITLE64_NAME252",
-    0x4979D7B8: "TITLE64_NAME253",
-    0x4979D7B9: "TITLE64_NAME254",
-    0x4979D7BA: "TITLE64_NAME255",
-    0x4979D7BB: "TITLE64_NAME256",
-    0x4979D7BC: "TITLE64_NAME257",
-    0x4979D7BD: "TITLE64_NAME258",
-    0x4979D7BE: "TITLE64_NAME259",
-    0x4979D838: "TITLE64_NAME260",
-    0x4979D839: "TITLE64_NAME261",
-    0x4979D83A: "TITLE64_NAME262",
-    0x4979D83B: "TITLE64_NAME263",
-    0x4979D83C: "TITLE64_NAME264",
-    0x4979D83D: "TITLE64_NAME265",
-    0x4979D83E: "TITLE64_NAME266",
-    0x4979D83F: "TITLE64_NAME267",
-    0x4979D840: "TITLE64_NAME268",
-    0x4979D841: "TITLE64_NAME269",
-    0x4979D8BB: "TITLE64_NAME270",
-    0x4979D8BC: "TITLE64_NAME271",
-    0x4979D8BD: "TITLE64_NAME272",
-    0x4979D8BE: "TITLE64_NAME273",
-    0x4979D8BF: "TITLE64_NAME274",
-    0x4979D8C0: "TITLE64_NAME275",
-    0x4979D8C1: "TITLE64_NAME276",
-    0x4979D8C2: "TITLE64_NAME277",
-    0x4979D8C3: "TITLE64_NAME278",
-    0x4979D8C4: "TITLE64_NAME279",
-    0x4979D93E: "TITLE64_NAME280",
-    0x4979D93F: "TITLE64_NAME281",
-    0x4979D940: "TITLE64_NAME282",
-    0x4979D941: "TITLE64_NAME283",
-    0x4979D942: "TITLE64_NAME284",
-    0x4979D943: "TITLE64_NAME285",
-    0x4979D944: "TITLE64_NAME286",
-    0x4979D945: "TITLE64_NAME287",
-    0x4979D946: "TITLE64_NAME288",
-    0x4979D947: "TITLE64_NAME289",
-    0x4979D9C1: "TITLE64_NAME290",
-    0x4979D9C2: "TITLE64_NAME291",
-    0x4979D9C3: "TITLE64_NAME292",
-    0x4979D9C4: "TITLE64_NAME293",
-    0x4979D9C5: "TITLE64_NAME294",
-    0x4979D9C6: "TITLE64_NAME295",
-    0x4979D9C7: "TITLE64_NAME296",
-    0x4979D9C8: "TITLE64_NAME297",
-    0x4979D9C9: "TITLE64_NAME298",
-    0x4979D9CA: "TITLE64_NAME299",
-    0x497A182F: "TITLE64_NAME300",
-    0x497A1830: "TITLE64_NAME301",
-    0x497A1831: "TITLE64_NAME302",
-    0x497A1832: "TITLE64_NAME303",
-    0x497A1833: "TITLE64_NAME304",
-    0x497A1834: "TITLE64_NAME305",
-    0x497A1835: "TITLE64_NAME306",
-    0x497A1836: "TITLE64_NAME307",
-    0x497A1837: "TITLE64_NAME308",
-    0x497A1838: "TITLE64_NAME309",
-    0x497A18B2: "TITLE64_NAME310",
-    0x497A18B3: "TITLE64_NAME311",
-    0x497A18B4: "TITLE64_NAME312",
-    0x497A18B5: "TITLE64_NAME313",
-    0x497A18B6: "TITLE64_NAME314",
-    0x497A18B7: "TITLE64_NAME315",
-    0x497A18B8: "TITLE64_NAME316",
-    0x497A18B9: "TITLE64_NAME317",
-    0x497A18BA: "TITLE64_NAME318",
-    0x497A18BB: "TITLE64_NAME319",
-    0x497A1935: "TITLE64_NAME320",
-    0x497A1936: "TITLE64_NAME321",
-    0x497A1937: "TITLE64_NAME322",
-    0x497A1938: "TITLE64_NAME323",
-    0x497A1939: "TITLE64_NAME324",
-    0x497A193A: "TITLE64_NAME325",
-    0x497A193B: "TITLE64_NAME326",
-    0x497A193C: "TITLE64_NAME327",
-    0x497A193D: "TITLE64_NAME328",
-    0x497A193E: "TITLE64_NAME329",
-    0x497A19B8: "TITLE64_NAME330",
-    0x497A19B9: "TITLE64_NAME331",
-    0x497A19BA: "TITLE64_NAME332",
-    0x497A19BB: "TITLE64_NAME333",
-    0x497A19BC: "TITLE64_NAME334",
-    0x497A19BD: "TITLE64_NAME335",
-    0x497A19BE: "TITLE64_NAME336",
-    0x497A19BF: "TITLE64_NAME337",
-    0x497A19C0: "TITLE64_NAME338",
-    0x497A19C1: "TITLE64_NAME339",
-    0x497A1A3B: "TITLE64_NAME340",
-    0x497A1A3C: "TITLE64_NAME341",
-    0x497A1A3D: "TITLE64_NAME342",
-    0x497A1A3E: "TITLE64_NAME343",
-    0x497A1A3F: "TITLE64_NAME344",
-    0x497A1A40: "TITLE64_NAME345",
-    0x497A1A41: "TITLE64_NAME346",
-    0x497A1A42: "TITLE64_NAME347",
-    0x497F99FE: "N_MRRAMIREZ",
-    0x49835EDB: "C_STRANGEHAT",
-    0x4989ACE1: "2_07_MOBJ_END",
-    0x4991D962: "SOC_GEN_CHITCHAT1",
-    0x499C44AF: "3_S11I_TITLE",
-    0x499D5D0C: "SM_ENG1",
-    0x499D5D0D: "SM_ENG2",
-    0x499D5D0E: "SM_ENG3",
-    0x499D5D0F: "SM_ENG4",
-    0x499D5D10: "SM_ENG5",
-    0x49A3B113: "DESC_TOMBSTONE",
-    0x49AA717B: "3-B.SUB0001",
-    0x49AA717C: "3-B.SUB0002",
-    0x49AA717D: "3-B.SUB0003",
-    0x49AA717E: "3-B.SUB0004",
-    0x49AA717F: "3-B.SUB0005",
-    0x49AA7180: "3-B.SUB0006",
-    0x49AA7181: "3-B.SUB0007",
-    0x49AA7182: "3-B.SUB0008",
-    0x49AA7183: "3-B.SUB0009",
-    0x49AA71FD: "3-B.SUB0010",
-    0x49AA71FE: "3-B.SUB0011",
-    0x49AA71FF: "3-B.SUB0012",
-    0x49B82F93: "MGPH_LIBRARIAN",
-    0x49BC8069: "FORMAT_Q",
-    0x49BE17E1: "MGCE_EXIT",
-    0x49C393F1: "1_G1_BEASPOT",
-    0x49D444E8: "UH_HOBO",
-    0x49D7B604: "4_S12_GOTNECKLACE",
-    0x49DA635A: "3_02_BRAWLOBJ",
-    0x49FA6C84: "AS_PCOMPLETE",
-    0x4A0DC1A4: "AS_KP_GREET",
-    0x4A0F4CAF: "AS_POP_FRENZY",
-    0x4A11FA8C: "DT_BIKE_01",
-    0x4A129054: "BUTTON_EXTRA_D",
-    0x4A1511CA: "MGPH_FLY_TRAP",
-    0x4A23BB43: "6_B_EMPTY",
-    0x4A2AA004: "",
-    0x4A30DD66: "CHAPT1TRANS_TOWN",
-    0x4A321BA7: "2-S04.SUB0001",
-    0x4A321BA8: "2-S04.SUB0002",
-    0x4A321BA9: "2-S04.SUB0003",
-    0x4A321BAA: "2-S04.SUB0004",
-    0x4A321BAB: "2-S04.SUB0005",
-    0x4A321BAC: "2-S04.SUB0006",
-    0x4A321BAD: "2-S04.SUB0007",
-    0x4A321BAE: "2-S04.SUB0008",
-    0x4A321BAF: "2-S04.SUB0009",
-    0x4A321C29: "2-S04.SUB0010",
-    0x4A321C2A: "2-S04.SUB0011",
-    0x4A321C2B: "2-S04.SUB0012",
-    0x4A321C2C: "2-S04.SUB0013",
-    0x4A321C2D: "2-S04.SUB0014",
-    0x4A321C2E: "2-S04.SUB0015",
-    0x4A321C2F: "2-S04.SUB0016",
-    0x4A321C30: "2-S04.SUB0017",
-    0x4A321C31: "2-S04.SUB0018",
-    0x4A321C32: "2-S04.SUB0019",
-    0x4A321CAC: "2-S04.SUB0020",
-    0x4A321CAD: "2-S04.SUB0021",
-    0x4A321CAE: "2-S04.SUB0022",
-    0x4A321CAF: "2-S04.SUB0023",
-    0x4A3992D5: "SUCCES_LOAD",
-    0x4A44AE65: "MGCE_INFO",
-    0x4A45CA01: "SP_80ROCKER_H",
-    0x4A45CA05: "SP_80ROCKER_L",
-    0x4A45CA0D: "SP_80ROCKER_T",
-    0x4A470325: "CRIME_OUTTOOLATE",
-    0x4A61EF43: "FEI_CONTROLS",
-    0x4A6EF68B: "TUT_TAG01",
-    0x4A6EF68C: "TUT_TAG02",
-    0x4A6EF68D: "TUT_TAG03",
-    0x4A6EF68E: "TUT_TAG04",
-    0x4A77AE25: "N_MRMARTIN",
-    0x4A79E260: "2_S02_OBJ00",
-    0x4A79E261: "2_S02_OBJ01",
-    0x4A79E262: "2_S02_OBJ02",
-    0x4A79E263: "2_S02_OBJ03",
-    0x4A79E264: "2_S02_OBJ04",
-    0x4A7BED54: "DISC_02_WII",
-    0x4A7C27A0: "UH_MATH",
-    0x4A815936: "TITLE36_NUMNAMES",
-    0x4A85D6EE: "FEI_ITEMINFO",
-    0x4A8927D9: "5_05_RETBOLTC",
-    0x4A8FF4F9: "TUT_TBB01",
-    0x4A8FF4FA: "TUT_TBB02",
-    0x4A9854CF: "MGGE_NEWCALEDONIA",
-    0x4A9BD06C: "TITLE35_NAME0",
-    0x4A9BD06D: "TITLE35_NAME1",
-    0x4A9BD06E: "TITLE35_NAME2",
-    0x4A9BD06F: "TITLE35_NAME3",
-    0x4A9BD070: "TITLE35_NAME4",
-    0x4A9BD071: "TITLE35_NAME5",
-    0x4A9BD072: "TITLE35_NAME6",
-    0x4A9BD073: "TITLE35_NAME7",
-    0x4A9BD074: "TITLE35_NAME8",
-    0x4A9BD075: "TITLE35_NAME9",
-    0x4A9E3A0A: "AS_ENTER_TENS",
-    0x4AA252FF: "SUCCES_OVER",
-    0x4AA3C7FE: "SUCCES_FORMAT",
-    0x4AA60C61: "MGB2_CLASSINFO",
-    0x4AB1A547: "SM_MUS1",
-    0x4AB1A548: "SM_MUS2",
-    0x4AB1A549: "SM_MUS3",
-    0x4AB1A54A: "SM_MUS4",
-    0x4AB1A54B: "SM_MUS5",
-    0x4AB59203: "3_G3_UNLOCK",
-    0x4ABB607E: "5_G5_EMPTY",
-    0x4AC3C9E1: "N_MSISAACS",
-    0x4ACD2FB6: "BUTTON_TOILET",
-    0x4AD744FB: "MGGE_ZAMBIA",
-    0x4AE23D4F: "C3_PICKUP_WII",
-    0x4AE77EF2: "FE_SELECT_BACK",
-    0x4AF10E70: "2_01_OGOTRAZOR",
-    0x4AF7B518: "P_LAWN_UNLOCK",
-    0x4AFB63F6: "TUT_TESTX",
-    0x4B0D2C32: "AS_TR_ACTION",
-    0x4B0D588C: "1_G1_OLOCKER",
-    0x4B19B267: "MGPH_PIGEON",
-    0x4B1A8493: "CONT_02_WII",
-    0x4B261254: "SUCCES_SAVE",
-    0x4B365994: "5_05_OGETBOLT",
-    0x4B3F7EF5: "2_05_RESPECT",
-    0x4B47D4D8: "JANITORS_ROOM",
-    0x4B4B698E: "TASKS",
-    0x4B4BCBFA: "UH_SHOP",
-    0x4B597E6A: "AS_MA_OBJCOUNT",
-    0x4B5A3D7C: "5_05_OGETCUTS",
-    0x4B799729: "AS_ED_ACTION",
-    0x4B7A2E25: "GRAF_OBJ01",
-    0x4B7A2E26: "GRAF_OBJ02",
-    0x4B7A2E27: "GRAF_OBJ03",
-    0x4B7A52C7: "3_R09_BOXING",
-    0x4B7D4A7D: "MGGE_VIETNAM",
-    0x4BA207C9: "2-07.SUB0001",
-    0x4BA207CA: "2-07.SUB0002",
-    0x4BA207CB: "2-07.SUB0003",
-    0x4BA207CC: "2-07.SUB0004",
-    0x4BA207CD: "2-07.SUB0005",
-    0x4BA207CE: "2-07.SUB0006",
-    0x4BA207CF: "2-07.SUB0007",
-    0x4BA207D0: "2-07.SUB0008",
-    0x4BA207D1: "2-07.SUB0009",
-    0x4BA2084B: "2-07.SUB0010",
-    0x4BA2084C: "2-07.SUB0011",
-    0x4BA2084D: "2-07.SUB0012",
-    0x4BA2084E: "2-07.SUB0013",
-    0x4BA2084F: "2-07.SUB0014",
-    0x4BA20850: "2-07.SUB0015",
-    0x4BA20851: "2-07.SUB0016",
-    0x4BA20852: "2-07.SUB0017",
-    0x4BA20853: "2-07.SUB0018",
-    0x4BA20854: "2-07.SUB0019",
-    0x4BA208CE: "2-07.SUB0020",
-    0x4BA208CF: "2-07.SUB0021",
-    0x4BA208D0: "2-07.SUB0022",
-    0x4BA208D1: "2-07.SUB0023",
-    0x4BA208D2: "2-07.SUB0024",
-    0x4BA208D3: "2-07.SUB0025",
-    0x4BA208D4: "2-07.SUB0026",
-    0x4BA208D5: "2-07.SUB0027",
-    0x4BA208D6: "2-07.SUB0028",
-    0x4BA208D7: "2-07.SUB0029",
-    0x4BAA9D4B: "3_06_OBJ01",
-    0x4BAA9D4F: "3_06_OBJ05",
-    0x4BACA318: "CLT_RIGHT",
-    0x4BAEEDA4: "FE_SCORE_FE",
-    0x4BB555AE: "RACING_L_NOBIKE",
-    0x4BB90524: "TITLE20_NAME0",
-    0x4BB90525: "TITLE20_NAME1",
-    0x4BBCB86C: "MGCE_TIME",
-    0x4BC42283: "1_02A_GARYKO",
-    0x4BD4A473: "TEST1",
-    0x4BD4A474: "TEST2",
-    0x4BD4A475: "TEST3",
-    0x4BD4A476: "TEST4",
-    0x4BD4A477: "TEST5",
-    0x4BD4A478: "TEST6",
-    0x4BD4A479: "TEST7",
-    0x4BD4A47A: "TEST8",
-    0x4BD4A47B: "TEST9",
-    0x4BDB6B90: "STAT_STRING",
-    0x4BEC701C: "MGPH_CARNIVALHAT",
-    0x4BF201FA: "CHEATOF",
-    0x4BF20202: "CHEATON",
-    0x4BFAA2E4: "1-09B.SUB0001",
-    0x4BFAA2E5: "1-09B.SUB0002",
-    0x4BFB20D5: "MGGE_TANZANIA",
-    0x4BFC4814: "PRINC_01",
-    0x4C0A2629: "TUT_TMET1",
-    0x4C0F3BA5: "5_06_TITLE",
-    0x4C0F9191: "MGPH_MRTHONGS",
-    0x4C16EB8D: "AS_TC_ACTION",
-    0x4C1C0F20: "3_06_LEFTTRIG",
-    0x4C248BBA: "P_SSLEEVES1",
-    0x4C248BBB: "P_SSLEEVES2",
-    0x4C248BBC: "P_SSLEEVES3",
-    0x4C248BBD: "P_SSLEEVES4",
-    0x4C248BBE: "P_SSLEEVES5",
-    0x4C248BBF: "P_SSLEEVES6",
-    0x4C248BC0: "P_SSLEEVES7",
-    0x4C248BC1: "P_SSLEEVES8",
-    0x4C248BC2: "P_SSLEEVES9",
-    0x4C407D50: "MGGE_WISCONSIN",
-    0x4C46ACD3: "MGE2_DEL",
-    0x4C4A9A5A: "MGE2_SEL",
-    0x4C500A12: "1-02E.SUB0001",
-    0x4C500A13: "1-02E.SUB0002",
-    0x4C500A14: "1-02E.SUB0003",
-    0x4C500A15: "1-02E.SUB0004",
-    0x4C500A16: "1-02E.SUB0005",
-    0x4C500A17: "1-02E.SUB0006",
-    0x4C500A18: "1-02E.SUB0007",
-    0x4C500A19: "1-02E.SUB0008",
-    0x4C500A1A: "1-02E.SUB0009",
-    0x4C500A94: "1-02E.SUB0010",
-    0x4C500A95: "1-02E.SUB0011",
-    0x4C500A96: "1-02E.SUB0012",
-    0x4C500A97: "1-02E.SUB0013",
-    0x4C500A98: "1-02E.SUB0014",
-    0x4C500A99: "1-02E.SUB0015",
-    0x4C500A9A: "1-02E.SUB0016",
-    0x4C500A9B: "1-02E.SUB0017",
-    0x4C500A9C: "1-02E.SUB0018",
-    0x4C500A9D: "1-02E.SUB0019",
-    0x4C500B17: "1-02E.SUB0020",
-    0x4C500B18: "1-02E.SUB0021",
-    0x4C500B19: "1-02E.SUB0022",
-    0x4C500B1A: "1-02E.SUB0023",
-    0x4C500B1B: "1-02E.SUB0024",
-    0x4C500B1C: "1-02E.SUB0025",
-    0x4C500B1D: "1-02E.SUB0026",
-    0x4C500B1E: "1-02E.SUB0027",
-    0x4C500B1F: "1-02E.SUB0028",
-    0x4C500B20: "1-02E.SUB0029",
-    0x4C5AF2D7: "PHO_BACK",
-    0x4C634905: "2_06_EUNICE",
-    0x4C747E37: "4_02_GO_OBS",
-    0x4C7A041F: "R_ILEAGUE",
-    0x4C86CC14: "AS_VD_RETURN",
-    0x4C8803C7: "AS_BG_OFFBIKE",
-    0x4C8C02C7: "FE_LOSER_P1_FE",
-    0x4C8FE710: "TUT_SKTC01",
-    0x4C90B641: "FEPA_CONFIRM",
-    0x4C9A45F9: "CRIME_BULLYING",
-    0x4C9C5D92: "N_PEANUT",
-    0x4CA11E18: "SLONNF",
-    0x4CA84583: "TITLE86_NUMNAMES",
-    0x4CA9D8E2: "MGC_SHOOTING_TITLE",
-    0x4CAE5062: "FE_LOSER_P2_FE",
-    0x4CB39FA1: "ISLAND_3",
-    0x4CB5A9AD: "TUT_TRES1",
-    0x4CB8F7D0: "3_S11_TITLE",
-    0x4CB9854B: "TUT_TRT01",
-    0x4CBE042C: "AS_DT_FAIL",
-    0x4CC1E685: "MGPH_OLDWHEEL",
-    0x4CC34C80: "B_MFADE_01",
-    0x4CC34C81: "B_MFADE_02",
-    0x4CC34C82: "B_MFADE_03",
-    0x4CC34C83: "B_MFADE_04",
-    0x4CC7E492: "PHO_EXIT",
-    0x4CCB211E: "CHEAT1",
-    0x4CCE213F: "TITLE81_NAME0",
-    0x4CCE2140: "TITLE81_NAME1",
-    0x4CCE2141: "TITLE81_NAME2",
-    0x4CCE2142: "TITLE81_NAME3",
-    0x4CCE2143: "TITLE81_NAME4",
-    0x4CCE2144: "TITLE81_NAME5",
-    0x4CCE2145: "TITLE81_NAME6",
-    0x4CCE2146: "TITLE81_NAME7",
-    0x4CCE2147: "TITLE81_NAME8",
-    0x4CE33A91: "L3_BIKE",
-    0x4CE45D81: "PHO_FB&W",
-    0x4CE529A0: "TML01",
-    0x4CE7D855: "PHO_FOLD",
-    0x4CE89DDB: "PHO_FRED",
-    0x4CEAEE33: "6_03_RUSSELL",
-    0x4CEC0C2A: "R_SNEAKERS1",
-    0x4CEC0C2B: "R_SNEAKERS2",
-    0x4CEC0C2C: "R_SNEAKERS3",
-    0x4CEC0C2D: "R_SNEAKERS4",
-    0x4CEC0C2E: "R_SNEAKERS5",
-    0x4CF4A8C5: "1_05_MOBJ_00",
-    0x4CF4A8C6: "1_05_MOBJ_01",
-    0x4CF4A8C7: "1_05_MOBJ_02",
-    0x4CF4A8C8: "1_05_MOBJ_03",
-    0x4CF4A8C9: "1_05_MOBJ_04",
-    0x4CF4A8CA: "1_05_MOBJ_05",
-    0x4CF70B42: "AS_RA_OBJECTIVE",
-    0x4D02EB48: "5_05_OPUSHPOT",
-    0x4D0A2779: "PHO_GOOD",
-    0x4D1B6DA4: "6_02_TITLE",
-    0x4D1FD0B8: "MGCE_T5GROUPS",
-    0x4D22044C: "AS_PB_COUNTER",
-    0x4D27B569: "TODAY",
-    0x4D2E5A1F: "4_04_INSTRUC00A",
-    0x4D2E5A20: "4_04_INSTRUC00B",
-    0x4D2E5BA8: "4_04_INSTRUC03A",
-    0x4D2E5C2B: "4_04_INSTRUC04A",
-    0x4D2E5CAE: "4_04_INSTRUC05A",
-    0x4D2E5CAF: "4_04_INSTRUC05B",
-    0x4D3F8B5E: "NAND_04_WII",
-    0x4D4A8156: "BARB_BUY",
-    0x4D51F97A: "MGGE_FRANCE",
-    0x4D5858EE: "3_01D_OBJ1_01",
-    0x4D5858EF: "3_01D_OBJ1_02",
-    0x4D5858F0: "3_01D_OBJ1_03",
-    0x4D59A9D9: "GKART_1",
-    0x4D59A9DA: "GKART_2",
-    0x4D59A9DB: "GKART_3",
-    0x4D5FFF49: "USE_LOCKERSPRAY",
-    0x4D6087ED: "MGMA_T4GROUPS",
-    0x4D61F673: "MGGE_MADAGASCAR",
-    0x4D6E054E: "L3_FOOT",
-    0x4D6F730E: "SM_GEOG1",
-    0x4D6F730F: "SM_GEOG2",
-    0x4D6F7310: "SM_GEOG3",
-    0x4D6F7311: "SM_GEOG4",
-    0x4D6F7312: "SM_GEOG5",
-    0x4D7229A6: "DBH_DODGE",
-    0x4D7AA689: "3_01D_OBJ2_01",
-    0x4D7AA68A: "3_01D_OBJ2_02",
-    0x4D7AF9B1: "ITEM_TOMBSTONE",
-    0x4D806AB7: "AS_RA_OBJCOUNT",
-    0x4D847C6D: "MGPH_ROBOT",
-    0x4D8A97BB: "C3_UNLOCK04_WII",
-    0x4D8BC22E: "TITLE8_NAME0",
-    0x4D8BC22F: "TITLE8_NAME1",
-    0x4D8BC230: "TITLE8_NAME2",
-    0x4D8BC231: "TITLE8_NAME3",
-    0x4D968A2F: "3_B_FOURTH_OBJ",
-    0x4DAC5FD4: "FORKS_NAME1",
-    0x4DAC5FD5: "FORKS_NAME2",
-    0x4DB46474: "MGPH_APESKULL",
-    0x4DB5963A: "DAGGER",
-    0x4DC301EB: "PGCLEAN_TITLE",
-    0x4DD5A14D: "AS_CH_RETURN",
-    0x4DDCE821: "MGDA_01",
-    0x4DDCE822: "MGDA_02",
-    0x4DDCE823: "MGDA_03",
-    0x4DDCE824: "MGDA_04",
-    0x4DDCE825: "MGDA_05",
-    0x4DDCE826: "MGDA_06",
-    0x4DDCE827: "MGDA_07",
-    0x4DDCE828: "MGDA_08",
-    0x4DDCE829: "MGDA_09",
-    0x4DDCE8A3: "MGDA_10",
-    0x4DDCE8A4: "MGDA_11",
-    0x4DDE35BA: "AS_RO_COMPLETE",
-    0x4DE0F12E: "M_FAIL_PASSOUT",
-    0x4DF53125: "P_ARMY1",
-    0x4DF53126: "P_ARMY2",
-    0x4DF53127: "P_ARMY3",
-    0x4E0F5E61: "1_G1_KISSBEA",
-    0x4E10FF5B: "MGCA_INSTRUCTIONS_REVERSAL_DESC",
-    0x4E20FF55: "MGT_PHOTO",
-    0x4E277E9D: "P_MH_SPIKE",
-    0x4E281EBD: "MERMAID",
-    0x4E2A9A76: "MGPH_CLOSEDBOOK",
-    0x4E326452: "MGGE_THAILAND",
-    0x4E35F8F1: "FEI_SEL_WEAPONS",
-    0x4E395729: "FE_STORY_FE",
-    0x4E3D49A2: "PHO_PICT",
-    0x4E3EBC90: "W_BBGUN",
-    0x4E446CF0: "AS_BH_ENTER",
-    0x4E4BABA4: "2-02.SUB0001",
-    0x4E4BABA5: "2-02.SUB0002",
-    0x4E4BABA6: "2-02.SUB0003",
-    0x4E4BABA7: "2-02.SUB0004",
-    0x4E4BABA8: "2-02.SUB0005",
-    0x4E4BABA9: "2-02.SUB0006",
-    0x4E4BABAA: "2-02.SUB0007",
-    0x4E4BABAB: "2-02.SUB0008",
-    0x4E4BABAC: "2-02.SUB0009",
-    0x4E546EFA: "FEI_GIFTS",
-    0x4E553ED6: "AS_EC_KISS",
-    0x4E5BE4B5: "RACE_TIMEH",
-    0x4E5BE4BF: "RACE_TIMER",
-    0x4E72B797: "AS_CT_COUNTER",
-    0x4E732DB4: "MGA2_REVERSAL_NAME",
-    0x4E85B99E: "AS_TH_LOST",
-    0x4E8C9AA8: "5-09B.SUB0001",
-    0x4E8C9AA9: "5-09B.SUB0002",
-    0x4E8C9AAA: "5-09B.SUB0003",
-    0x4E8C9AAB: "5-09B.SUB0004",
-    0x4E8C9AAC: "5-09B.SUB0005",
-    0x4E8C9AAD: "5-09B.SUB0006",
-    0x4E8C9AAE: "5-09B.SUB0007",
-    0x4E8C9AAF: "5-09B.SUB0008",
-    0x4E8C9AB0: "5-09B.SUB0009",
-    0x4E8C9B2A: "5-09B.SUB0010",
-    0x4E8C9B2B: "5-09B.SUB0011",
-    0x4E8C9B2C: "5-09B.SUB0012",
-    0x4E901329: "MGB2_SCORE",
-    0x4E951462: "MGGE_ILLINOIS",
-    0x4E9DC14B: "CLT_R_ARM",
-    0x4EA223D5: "PHO_SAVE",
-    0x4EA9B34F: "TITLE57_NAME10",
-    0x4EA9B350: "TITLE57_NAME11",
-    0x4EA9B351: "TITLE57_NAME12",
-    0x4EA9B352: "TITLE57_NAME13",
-    0x4EA9B353: "TITLE57_NAME14",
-    0x4EA9B354: "TITLE57_NAME15",
-    0x4EA9B355: "TITLE57_NAME16",
-    0x4EA9B356: "TITLE57_NAME17",
-    0x4EA9B357: "TITLE57_NAME18",
-    0x4EA9B358: "TITLE57_NAME19",
-    0x4EA9B3D2: "TITLE57_NAME20",
-    0x4EA9B3D3: "TITLE57_NAME21",
-    0x4EA9B3D4: "TITLE57_NAME22",
-    0x4EA9B3D5: "TITLE57_NAME23",
-    0x4EA9B3D6: "TITLE57_NAME24",
-    0x4EA9B3D7: "TITLE57_NAME25",
-    0x4EA9B3D8: "TITLE57_NAME26",
-    0x4EAA4E7C: "MGCE_TAUNT01",
-    0x4EAA4E7D: "MGCE_TAUNT02",
-    0x4EADD788: "PRIOFF_WEAPG01",
-    0x4EADD789: "PRIOFF_WEAPG02",
-    0x4EADD78A: "PRIOFF_WEAPG03",
-    0x4EADD78B: "PRIOFF_WEAPG04",
-    0x4EBA5D05: "BOX_01",
-    0x4EBFA6AE: "3_R05B_MOBJ_01",
-    0x4EBFA6AF: "3_R05B_MOBJ_02",
-    0x4EBFA6B0: "3_R05B_MOBJ_03",
-    0x4EDD4591: "D_SK8BOARD",
-    0x4EE07A44: "MGGE_NEWFOUNDLAND",
-    0x4EE4E418: "TITLE68_NAME0",
-    0x4EE4E419: "TITLE68_NAME1",
-    0x4EF79D1D: "AS_VD_COMPLETE",
-    0x4EFD750D: "TITLE33_NUMNAMES",
-    0x4F0006A2: "NOCONTE",
-    0x4F0416B4: "RECRE_P",
-    0x4F0416B5: "RECRE_Q",
-    0x4F0416B7: "RECRE_S",
-    0x4F0660AC: "AS_CH_OBJECTIVE",
-    0x4F177BC1: "M7_00",
-    0x4F177BC2: "M7_01",
-    0x4F177BC3: "M7_02",
-    0x4F177BC4: "M7_03",
-    0x4F177BC5: "M7_04",
-    0x4F177BC6: "M7_05",
-    0x4F177BC7: "M7_06",
-    0x4F177BC8: "M7_07",
-    0x4F177BC9: "M7_08",
-    0x4F177BCA: "M7_09",
-    0x4F177C44: "M7_10",
-    0x4F238AB2: "W_RLAUNCHER",
-    0x4F361042: "AS_LS_OBJECTIVE",
-    0x4F38DCC5: "MGCE_T1G01WORDS",
-    0x4F3F5C64: "USE_STUFF",
-    0x4F43F101: "NOCONTE_SCEA",
-    0x4F4EF4C8: "AS_KP_DROP",
-    0x4F545CD6: "3_05_OKEY",
-    0x4F6851FD: "MRESPECT_BP100",
-    0x4F751ECF: "3_05_PERF",
-    0x4F78D07A: "2_08_HATOBJ",
-    0x4F7F9E3B: "C4_GETREADY2",
-    0x4F7F9E3C: "C4_GETREADY3",
-    0x4F90D846: "TUT_MANA1",
-    0x4F90D847: "TUT_MANA2",
-    0x4F90D848: "TUT_MANA3",
-    0x4F961E29: "PHO_TIMER",
-    0x4F995985: "IMGRACEA",
-    0x4F995986: "IMGRACEB",
-    0x4F995987: "IMGRACEC",
-    0x4F9B748B: "AS_TW_OBJCOUNT",
-    0x4FAA78D7: "MGGE_NEW JERSEY",
-    0x4FB0CE7D: "FE_QUITGAME",
-    0x4FC191F8: "AS_CHILD_NIGHT",
-    0x4FDAEDEE: "3_XM_WARN_HELPERS",
-    0x4FDD369D: "3_R09_SFAIL",
-    0x4FE095F3: "3_B_COP_OBJ",
-    0x4FED3853: "MGBI_RAT_10",
-    0x4FED3854: "MGBI_RAT_11",
-    0x4FED3855: "MGBI_RAT_12",
-    0x4FED3856: "MGBI_RAT_13",
-    0x4FED3857: "MGBI_RAT_14",
-    0x4FED3858: "MGBI_RAT_15",
-    0x4FED3859: "MGBI_RAT_16",
-    0x4FED385A: "MGBI_RAT_17",
-    0x4FFB5FAB: "AS_TH_WAIT",
-    0x4FFE0D2E: "MGPH_EUNACE",
-    0x500218D0: "TITLE53_NAME0",
-    0x500218D1: "TITLE53_NAME1",
-    0x500218D2: "TITLE53_NAME2",
-    0x500218D3: "TITLE53_NAME3",
-    0x500218D4: "TITLE53_NAME4",
-    0x500218D5: "TITLE53_NAME5",
-    0x500218D6: "TITLE53_NAME6",
-    0x500218D7: "TITLE53_NAME7",
-    0x500218D8: "TITLE53_NAME8",
-    0x500218D9: "TITLE53_NAME9",
-    0x500798C3: "2_R11_TITLE1",
-    0x500798C4: "2_R11_TITLE2",
-    0x500798C5: "2_R11_TITLE3",
-    0x500798C6: "2_R11_TITLE4",
-    0x500798C7: "2_R11_TITLE5",
-    0x5010B33B: "GIFT_CRFERRIS",
-    0x5015AE47: "TITLE10",
-    0x5015AE48: "TITLE11",
-    0x5015AE49: "TITLE12",
-    0x5015AE4A: "TITLE13",
-    0x5015AE4B: "TITLE14",
-    0x5015AE4C: "TITLE15",
-    0x5015AE4D: "TITLE16",
-    0x5015AE4E: "TITLE17",
-    0x5015AE4F: "TITLE18",
-    0x5015AE50: "TITLE19",
-    0x5015AECA: "TITLE20",
-    0x5015AECB: "TITLE21",
-    0x5015AECC: "TITLE22",
-    0x5015AECD: "TITLE23",
-    0x5015AECE: "TITLE24",
-    0x5015AECF: "TITLE25",
-    0x5015AED0: "TITLE26",
-    0x5015AED1: "TITLE27",
-    0x5015AED2: "TITLE28",
-    0x5015AED3: "TITLE29",
-    0x5015AF4D: "TITLE30",
-    0x5015AF4E: "TITLE31",
-    0x5015AF4F: "TITLE32",
-    0x5015AF50: "TITLE33",
-    0x5015AF51: "TITLE34",
-    0x5015AF52: "TITLE35",
-    0x5015AF53: "TITLE36",
-    0x5015AF54: "TITLE37",
-    0x5015AF55: "TITLE38",
-    0x5015AF56: "TITLE39",
-    0x5015AFD0: "TITLE40",
-    0x5015AFD1: "TITLE41",
-    0x5015AFD2: "TITLE42",
-    0x5015AFD3: "TITLE43",
-    0x5015AFD4: "TITLE44",
-    0x5015AFD5: "TITLE45",
-    0x5015AFD6: "TITLE46",
-    0x5015AFD7: "TITLE47",
-    0x5015AFD8: "TITLE48",
-    0x5015AFD9: "TITLE49",
-    0x5015B053: "TITLE50",
-    0x5015B054: "TITLE51",
-    0x5015B055: "TITLE52",
-    0x5015B056: "TITLE53",
-    0x5015B057: "TITLE54",
-    0x5015B058: "TITLE55",
-    0x5015B059: "TITLE56",
-    0x5015B05A: "TITLE57",
-    0x5015B05B: "TITLE58",
-    0x5015B05C: "TITLE59",
-    0x5015B0D6: "TITLE60",
-    0x5015B0D7: "TITLE61",
-    0x5015B0D8: "TITLE62",
-    0x5015B0D9: "TITLE63",
-    0x5015B0DA: "TITLE64",
-    0x5015B0DB: "TITLE65",
-    0x5015B0DC: "TITLE66",
-    0x5015B0DD: "TITLE67",
-    0x5015B0DE: "TITLE68",
-    0x5015B0DF: "TITLE69",
-    0x5015B159: "TITLE70",
-    0x5015B15A: "TITLE71",
-    0x5015B15B: "TITLE72",
-    0x5015B15C: "TITLE73",
-    0x5015B15D: "TITLE74",
-    0x5015B15E: "TITLE75",
-    0x5015B15F: "TITLE76",
-    0x5015B160: "TITLE77",
-    0x5015B161: "TITLE78",
-    0x5015B162: "TITLE79",
-    0x5015B1DC: "TITLE80",
-    0x5015B1DD: "TITLE81",
-    0x5015B1DE: "TITLE82",
-    0x5015B1DF: "TITLE83",
-    0x5015B1E0: "TITLE84",
-    0x5015B1E1: "TITLE85",
-    0x5015B1E2: "TITLE86",
-    0x5015B1E3: "TITLE87",
-    0x5015B1E4: "TITLE88",
-    0x5028ED8E: "MGE2_T9G01WORDS",
-    0x50310790: "5_G5_JIMCOUNT",
-    0x50357A8B: "FE_TOURNEY_3A",
-    0x50357C14: "FE_TOURNEY_6A",
-    0x50357D9D: "FE_TOURNEY_9A",
-    0x504C3F00: "CLT_OFITITEM_F",
-    0x504C3F02: "CLT_OFITITEM_H",
-    0x504C3F06: "CLT_OFITITEM_L",
-    0x50569CE7: "PUNREMOVE_BED",
-    0x5059AC8A: "FE_TASK_TOG",
-    0x505CD6B6: "TUT_MGGE2",
-    0x505CD6B7: "TUT_MGGE3",
-    0x505CD6B8: "TUT_MGGE4",
-    0x505CD6B9: "TUT_MGGE5",
-    0x5068AAA2: "MGDT_01",
-    0x5068AAA3: "MGDT_02",
-    0x5068AAA4: "MGDT_03",
-    0x5068AAA5: "MGDT_04",
-    0x5068AAA6: "MGDT_05",
-    0x5068AAA7: "MGDT_06",
-    0x5068AAA8: "MGDT_07",
-    0x5068AAA9: "MGDT_08",
-    0x5068AAAA: "MGDT_09",
-    0x5068AB24: "MGDT_10",
-    0x5068AB25: "MGDT_11",
-    0x5068AB26: "MGDT_12",
-    0x5068AB27: "MGDT_13",
-    0x5068AB28: "MGDT_14",
-    0x5068AB29: "MGDT_15",
-    0x5068AB2A: "MGDT_16",
-    0x5068AB2B: "MGDT_17",
-    0x5068AB2C: "MGDT_18",
-    0x5068AB2D: "MGDT_19",
-    0x5068ABA7: "MGDT_20",
-    0x5068ABAA: "MGDT_23",
-    0x5076BEBB: "1-06B.SUB0001",
-    0x5076BEBC: "1-06B.SUB0002",
-    0x5076BEBD: "1-06B.SUB0003",
-    0x5076BEBE: "1-06B.SUB0004",
-    0x5076BEBF: "1-06B.SUB0005",
-    0x5076BEC0: "1-06B.SUB0006",
-    0x5076BEC1: "1-06B.SUB0007",
-    0x5076BEC2: "1-06B.SUB0008",
-    0x5076BEC3: "1-06B.SUB0009",
-    0x5076BF3D: "1-06B.SUB0010",
-    0x5076BF3E: "1-06B.SUB0011",
-    0x5076BF3F: "1-06B.SUB0012",
-    0x5076BF40: "1-06B.SUB0013",
-    0x5076BF41: "1-06B.SUB0014",
-    0x5076BF42: "1-06B.SUB0015",
-    0x5076BF43: "1-06B.SUB0016",
-    0x5076BF44: "1-06B.SUB0017",
-    0x5076BF45: "1-06B.SUB0018",
-    0x5076BF46: "1-06B.SUB0019",
-    0x5076BFC0: "1-06B.SUB0020",
-    0x5076BFC1: "1-06B.SUB0021",
-    0x5076BFC2: "1-06B.SUB0022",
-    0x5076BFC3: "1-06B.SUB0023",
-    0x5076BFC4: "1-06B.SUB0024",
-    0x5076BFC5: "1-06B.SUB0025",
-    0x5076BFC6: "1-06B.SUB0026",
-    0x5076BFC7: "1-06B.SUB0027",
-    0x5076BFC8: "1-06B.SUB0028",
-    0x5076BFC9: "1-06B.SUB0029",
-    0x5076C043: "1-06B.SUB0030",
-    0x5076C044: "1-06B.SUB0031",
-    0x5076C045: "1-06B.SUB0032",
-    0x5076C046: "1-06B.SUB0033",
-    0x5076C047: "1-06B.SUB0034",
-    0x50792EFC: "1_06_TITLE1",
-    0x50792EFD: "1_06_TITLE2",
-    0x50792EFE: "1_06_TITLE3",
-    0x50792EFF: "1_06_TITLE4",
-    0x50792F00: "1_06_TITLE5",
-    0x50836169: "",
-    0x50849AD7: "6_02_RUSSKO",
-    0x5086E675: "P_GRAF_01",
-    0x5086E676: "P_GRAF_02",
-    0x508B577C: "2_06_TITLE",
-    0x508BC641: "3_01C_FAIL_01",
-    0x508BC642: "3_01C_FAIL_02",
-    0x508BC643: "3_01C_FAIL_03",
-    0x508BC644: "3_01C_FAIL_04",
-    0x509777CF: "PHO_MYEARBK",
-    0x509B91F9: "BMXRAIN",
-    0x509CA52A: "BMXREW1",
-    0x509CA52B: "BMXREW2",
-    0x50A57F45: "RACE_AREAFAIL",
-    0x50A8F757: "AS_TH_COMPLETE",
-    0x50AECF47: "TITLE17_NUMNAMES",
-    0x50BA8538: "AS_SA2_RETURN",
-    0x50C76E43: "B_WATCH1",
-    0x50C76E44: "B_WATCH2",
-    0x50C76E45: "B_WATCH3",
-    0x50C76E46: "B_WATCH4",
-    0x50C76E47: "B_WATCH5",
-    0x50E93B8E: "6_B_TITLE",
-    0x50F7A481: "REVERSAL_CIRCLE",
-    0x50FBD41E: "MGCE_BADW01",
-    0x50FBD41F: "MGCE_BADW02",
-    0x51036848: "",
-    0x51037106: "SP_MASCOT_B",
-    0x5103710C: "SP_MASCOT_H",
-    0x511239AF: "MFAIL",
-    0x5119100F: "N_MISSWINSTON",
-    0x511DC948: "1_04_SPOTTED",
-    0x511F9695: "AUTHHELP",
-    0x5124615A: "TITLE83_NUMNAMES",
-    0x51283512: "CHAPT1TRANS_B",
-    0x5128351E: "CHAPT1TRANS_N",
-    0x51283520: "CHAPT1TRANS_P",
-    0x5129654E: "S_LSLEEVES1",
-    0x5129654F: "S_LSLEEVES2",
-    0x51296550: "S_LSLEEVES3",
-    0x51296551: "S_LSLEEVES4",
-    0x51306D62: "MGGE_QUEBEC",
-    0x51372C4A: "1-10.SUB0001",
-    0x51372C4B: "1-10.SUB0002",
-    0x51372C4C: "1-10.SUB0003",
-    0x51372C4D: "1-10.SUB0004",
-    0x51372C4E: "1-10.SUB0005",
-    0x51372C4F: "1-10.SUB0006",
-    0x51372C50: "1-10.SUB0007",
-    0x51372C51: "1-10.SUB0008",
-    0x51372C52: "1-10.SUB0009",
-    0x51372CCC: "1-10.SUB0010",
-    0x51372CCD: "1-10.SUB0011",
-    0x51372CCE: "1-10.SUB0012",
-    0x51372CCF: "1-10.SUB0013",
-    0x51372CD0: "1-10.SUB0014",
-    0x51372CD1: "1-10.SUB0015",
-    0x51372CD2: "1-10.SUB0016",
-    0x51372CD3: "1-10.SUB0017",
-    0x51372CD4: "1-10.SUB0018",
-    0x51372CD5: "1-10.SUB0019",
-    0x51372D4F: "1-10.SUB0020",
-    0x51372D50: "1-10.SUB0021",
-    0x51372D51: "1-10.SUB0022",
-    0x5137C021: "CAF_KITCHEN",
-    0x513C6155: "MG_GO",
-    0x5144E3DC: "AS_RK_OBJECTIVE",
-    0x514BDBC9: "3_S11_MEETP",
-    0x515957A3: "3-06.SUB0001",
-    0x515957A4: "3-06.SUB0002",
-    0x515957A5: "3-06.SUB0003",
-    0x515957A6: "3-06.SUB0004",
-    0x515957A7: "3-06.SUB0005",
-    0x515957A8: "3-06.SUB0006",
-    0x515957A9: "3-06.SUB0007",
-    0x515957AA: "3-06.SUB0008",
-    0x515957AB: "3-06.SUB0009",
-    0x51595825: "3-06.SUB0010",
-    0x51595826: "3-06.SUB0011",
-    0x51595827: "3-06.SUB0012",
-    0x51595828: "3-06.SUB0013",
-    0x51595829: "3-06.SUB0014",
-    0x515B8570: "3_02_MADOBJ",
-    0x515EEF1E: "L2_BIKE",
-    0x516F2D6B: "AS_DT_COMPLETE",
-    0x5170DA37: "2_06_VIOLENCE",
-    0x51742896: "SP_DUNCEHAT",
-    0x51763A00: "MEM_EXIT",
-    0x517D3A7A: "MGPH_FOOTBALL",
-    0x5180E0C9: "5_G5_TITLE",
-    0x518DCEAD: "AS_KP_RETURN",
-    0x51903142: "MG_SHOOTING_FE",
-    0x5197897B: "3_02_TITLE",
-    0x51B1A62F: "N_OFFICERMONSON",
-    0x51CD87AB: "MAP_CLASSES",
-    0x51D4FAD6: "4_06_FRISBEE_HELP",
-    0x51E408FA: "PUNREMOVE_DEMERIT",
-    0x51E4BF7E: "AS_KP_COMPLETE",
-    0x51E9B9DB: "L2_FOOT",
-    0x51ECCF94: "ARCADE_FLININST",
-    0x51FA0689: "AS_PB_OBJCOUNT1",
-    0x5201E5BF: "MGSP_COUNT",
-    0x52094FD2: "N_CASTILLO",
-    0x521001A0: "3_01_OALLEY",
-    0x52112E0B: "MGPH_RACER_ARCADE",
-    0x521C1EA4: "MGGE_NOVASCOTIA",
-    0x5238202E: "MGMA_UNLOCK01",
-    0x5238202F: "MGMA_UNLOCK02",
-    0x52382030: "MGMA_UNLOCK03",
-    0x52382031: "MGMA_UNLOCK04",
-    0x52382032: "MGMA_UNLOCK05",
-    0x52382033: "MGMA_UNLOCK06",
-    0x523DDDB6: "FE_COMP_TASKS",
-    0x52446C8D: "INFIRMARY",
-    0x524A5998: "MONEY",
-    0x524CBED1: "FEDS_ANTIALIAS",
-    0x525B5B32: "BMX_HOW",
-    0x525F8196: "RARC_SINST",
-    0x526946E2: "MPASS",
-    0x526E956A: "S_SUNVISOR1",
-    0x526E956B: "S_SUNVISOR2",
-    0x526E956C: "S_SUNVISOR3",
-    0x527BC86C: "1_11X1_PHEALTH",
-    0x528C7025: "CHAPT4TRANS_TITLE",
-    0x52913C15: "GKART_VENDOR1",
-    0x52913C16: "GKART_VENDOR2",
-    0x52913C17: "GKART_VENDOR3",
-    0x52913C18: "GKART_VENDOR4",
-    0x52913C19: "GKART_VENDOR5",
-    0x52913C1A: "GKART_VENDOR6",
-    0x52942309: "TUT_GARX01",
-    0x5294230A: "TUT_GARX02",
-    0x52943666: "AS_SB_OBJECTIVE",
-    0x52C90B1C: "UP_BIOLOGY1",
-    0x52C90B1D: "UP_BIOLOGY2",
-    0x52C90B1E: "UP_BIOLOGY3",
-    0x52C90B1F: "UP_BIOLOGY4",
-    0x52C90B20: "UP_BIOLOGY5",
-    0x52CFDE41: "GKART_RACEOVER",
-    0x52D10322: "FE_AVAIL_TASKS",
-    0x52D1D297: "ERR_UNFORM",
-    0x52D29169: "MGE2_T4G01WORDS",
-    0x52D35DC3: "MGPH_REDDRAGON",
-    0x52D45782: "2_06_GET_EUNICE",
-    0x52D5BB94: "TITLE67_NUMNAMES",
-    0x52DBA8E0: "MGGE_ARUBA",
-    0x52DC2693: "P_SNOW_06",
-    0x52DC31D0: "P_SNOW_F1",
-    0x52DC31D1: "P_SNOW_F2",
-    0x52DC31D2: "P_SNOW_F3",
-    0x52DC31D3: "P_SNOW_F4",
-    0x52DC31D4: "P_SNOW_F5",
-    0x52DC36EE: "P_SNOW_P1",
-    0x52E8FEA8: "N_VANCE",
-    0x53280BD3: "MGS2_23",
-    0x53280BD6: "MGS2_26",
-    0x53280BD7: "MGS2_27",
-    0x53280C54: "MGS2_31",
-    0x53280C55: "MGS2_32",
-    0x53280C56: "MGS2_33",
-    0x53280C58: "MGS2_35",
-    0x53280C59: "MGS2_36",
-    0x53280C5C: "MGS2_39",
-    0x532C6A1E: "AS_EB_COMPLETE",
-    0x53309195: "USE_BED",
-    0x5332B298: "AS_CARDS_REWARD",
-    0x5333F98F: "USE_OFF",
-    0x5335462E: "USE_TAG",
-    0x53361061: "TITLE25_NAME0",
-    0x53361062: "TITLE25_NAME1",
-    0x53595FB2: "4_S12_GET_ITEM",
-    0x535A26F1: "FEC_CONTROLS",
-    0x535B49E4: "MGMA_FOOTER",
-    0x53601862: "P_SNOW_COUNT",
-    0x5367D67B: "AS_SW_COMPLETE",
-    0x537990E4: "TITLE30_NUMNAMES",
-    0x53864C22: "COL_GNOMES",
-    0x53889C55: "STATUS_DROPOUTS",
-    0x538FA080: "BWSTR_WII",
-    0x5391FBB7: "C2_DROPLEON",
-    0x5392DF69: "1_B_TITLE",
-    0x539850A0: "B_TOQUE1",
-    0x539850A1: "B_TOQUE2",
-    0x53A65F2A: "TAG_DO_LG_01",
-    0x53AD8521: "AS_MM_GETPACK",
-    0x53ADE0C8: "AS_PB_OBJCOUNT",
-    0x53B2CF48: "USE_DEACTIVATE",
-    0x53B3F59B: "C2_GRSRPEANUT",
-    0x53C551DB: "4_01_MOBJ_01B",
-    0x53C551DC: "4_01_MOBJ_01C",
-    0x53D2B4F6: "MGDA_SCORE",
-    0x53D46125: "TRI_BIKE",
-    0x53D7FC0F: "ARCADE_BTNEXIT",
-    0x53D92600: "MGGE_PAKISTAN",
-    0x53DA4909: "2_S05_OEDNARICH",
-    0x53ED9C10: "TPM_QUITMULTI",
-    0x53F3A7AB: "ITEM_10",
-    0x53F3A7AC: "ITEM_11",
-    0x53F3A7AD: "ITEM_12",
-    0x53F3A7AE: "ITEM_13",
-    0x53F3A7AF: "ITEM_14",
-    0x53F3A7B0: "ITEM_15",
-    0x53F3A7B3: "ITEM_18",
-    0x53F3A7B4: "ITEM_19",
-    0x53F3A82E: "ITEM_20",
-    0x53F3A82F: "ITEM_21",
-    0x53F3A830: "ITEM_22",
-    0x53F3A834: "ITEM_26",
-    0x53F3A835: "ITEM_27",
-    0x53F3A8B5: "ITEM_34",
-    0x53F3A8B6: "ITEM_35",
-    0x53F3A8B7: "ITEM_36",
-    0x53F3A8B8: "ITEM_37",
-    0x53F3A8B9: "ITEM_38",
-    0x53F3A8BA: "ITEM_39",
-    0x53F3A934: "ITEM_40",
-    0x53F3A935: "ITEM_41",
-    0x53F3A936: "ITEM_42",
-    0x53F3A937: "ITEM_43",
-    0x53F3A938: "ITEM_44",
-    0x53F3A939: "ITEM_45",
-    0x53F3A93A: "ITEM_46",
-    0x53F3A93B: "ITEM_47",
-    0x53F3A93C: "ITEM_48",
-    0x53F3A93D: "ITEM_49",
-    0x53F3A9B7: "ITEM_50",
-    0x53F3A9B8: "ITEM_51",
-    0x53F3A9B9: "ITEM_52",
-    0x53F3A9BA: "ITEM_53",
-    0x53F3A9BB: "ITEM_54",
-    0x53F3A9BC: "ITEM_55",
-    0x53F3A9BD: "ITEM_56",
-    0x53F3A9BE: "ITEM_57",
-    0x53F3A9BF: "ITEM_58",
-    0x53F3A9C0: "ITEM_59",
-    0x53F3AA3A: "ITEM_60",
-    0x53F3AA3B: "ITEM_61",
-    0x53F3AA3C: "ITEM_62",
-    0x53F3AA3D: "ITEM_63",
-    0x53F3AA3E: "ITEM_64",
-    0x53F3AA3F: "ITEM_65",
-    0x53F3AA40: "ITEM_66",
-    0x53F3AA41: "ITEM_67",
-    0x53F3AA42: "ITEM_68",
-    0x53F3AA43: "ITEM_69",
-    0x53F3AABD: "ITEM_70",
-    0x53F3AABE: "ITEM_71",
-    0x53F3AABF: "ITEM_72",
-    0x53F3AAC0: "ITEM_73",
-    0x53F3AAC1: "ITEM_74",
-    0x53F3AAC2: "ITEM_75",
-    0x53F3AAC3: "ITEM_76",
-    0x53F3AAC4: "ITEM_77",
-    0x53F3AAC5: "ITEM_78",
-    0x53F3AAC6: "ITEM_79",
-    0x53F3AB40: "ITEM_80",
-    0x53F3AB41: "ITEM_81",
-    0x53F3AB42: "ITEM_82",
-    0x53F3AB43: "ITEM_83",
-    0x53F3AB44: "ITEM_84",
-    0x53F3AB46: "ITEM_86",
-    0x53F3AB47: "ITEM_87",
-    0x53F3AB48: "ITEM_88",
-    0x53F3AB49: "ITEM_89",
-    0x53F3ABC3: "ITEM_90",
-    0x53F3ABC4: "ITEM_91",
-    0x53F3ABC5: "ITEM_92",
-    0x53F3ABC6: "ITEM_93",
-    0x53F3ABC7: "ITEM_94",
-    0x53F3ABC8: "ITEM_95",
-    0x53F3ABC9: "ITEM_96",
-    0x53F3ABCA: "ITEM_97",
-    0x53F3ABCB: "ITEM_98",
-    0x53F3ABCC: "ITEM_99",
-    0x5402567B: "3_XM_SQUARE",
-    0x5402FB7E: "3-01.SUB0001",
-    0x5402FB7F: "3-01.SUB0002",
-    0x5402FB80: "3-01.SUB0003",
-    0x5402FB81: "3-01.SUB0004",
-    0x5402FB82: "3-01.SUB0005",
-    0x5402FB83: "3-01.SUB0006",
-    0x5402FB84: "3-01.SUB0007",
-    0x5402FB85: "3-01.SUB0008",
-    0x5402FB86: "3-01.SUB0009",
-    0x5402FC00: "3-01.SUB0010",
-    0x5402FC01: "3-01.SUB0011",
-    0x5402FC02: "3-01.SUB0012",
-    0x5402FC03: "3-01.SUB0013",
-    0x5402FC04: "3-01.SUB0014",
-    0x5402FC05: "3-01.SUB0015",
-    0x5402FC06: "3-01.SUB0016",
-    0x5402FC07: "3-01.SUB0017",
-    0x5402FC08: "3-01.SUB0018",
-    0x5402FC09: "3-01.SUB0019",
-    0x5402FC83: "3-01.SUB0020",
-    0x5402FC84: "3-01.SUB0021",
-    0x5402FC85: "3-01.SUB0022",
-    0x5402FC86: "3-01.SUB0023",
-    0x5413D71E: "AS_EC_ACTION",
-    0x541CB77B: "5-0.SUB0001",
-    0x541CB77C: "5-0.SUB0002",
-    0x541CB77D: "5-0.SUB0003",
-    0x541CB77E: "5-0.SUB0004",
-    0x541CB77F: "5-0.SUB0005",
-    0x541CB780: "5-0.SUB0006",
-    0x541CB781: "5-0.SUB0007",
-    0x541CB782: "5-0.SUB0008",
-    0x541CB783: "5-0.SUB0009",
-    0x541CB7FD: "5-0.SUB0010",
-    0x541CB7FE: "5-0.SUB0011",
-    0x541CB7FF: "5-0.SUB0012",
-    0x541CB800: "5-0.SUB0013",
-    0x541CB801: "5-0.SUB0014",
-    0x541CB802: "5-0.SUB0015",
-    0x541CB803: "5-0.SUB0016",
-    0x541CB804: "5-0.SUB0017",
-    0x541CB805: "5-0.SUB0018",
-    0x541CB806: "5-0.SUB0019",
-    0x541CB880: "5-0.SUB0020",
-    0x541CB881: "5-0.SUB0021",
-    0x541CB882: "5-0.SUB0022",
-    0x541CB883: "5-0.SUB0023",
-    0x541CB884: "5-0.SUB0024",
-    0x541CB885: "5-0.SUB0025",
-    0x541CB886: "5-0.SUB0026",
-    0x541CB887: "5-0.SUB0027",
-    0x541CB888: "5-0.SUB0028",
-    0x541CB889: "5-0.SUB0029",
-    0x541E2010: "AS_F4_INTRO",
-    0x54261981: "LANALOG_VEHICLE",
-    0x542EB281: "3_02_OUTOFRANGE",
-    0x54387E73: "4_S12_OBJPERFUME",
-    0x544911E6: "TIMER_D",
-    0x544A9D3D: "CAM_BUS1",
-    0x544A9D3E: "CAM_BUS2",
-    0x544A9D3F: "CAM_BUS3",
-    0x544A9D40: "CAM_BUS4",
-    0x544B2C7C: "TITLE86_NAME0",
-    0x544B2C7D: "TITLE86_NAME1",
-    0x544B2C7E: "TITLE86_NAME2",
-    0x544B2C7F: "TITLE86_NAME3",
-    0x54518C7C: "MGE2_T4G01W01",
-    0x54518C7D: "MGE2_T4G01W02",
-    0x54518C7E: "MGE2_T4G01W03",
-    0x54518C7F: "MGE2_T4G01W04",
-    0x54518C80: "MGE2_T4G01W05",
-    0x54518C81: "MGE2_T4G01W06",
-    0x54518C82: "MGE2_T4G01W07",
-    0x54518C83: "MGE2_T4G01W08",
-    0x54518C84: "MGE2_T4G01W09",
-    0x54518CFE: "MGE2_T4G01W10",
-    0x54518CFF: "MGE2_T4G01W11",
-    0x54518D00: "MGE2_T4G01W12",
-    0x54518D01: "MGE2_T4G01W13",
-    0x54518D02: "MGE2_T4G01W14",
-    0x54518D03: "MGE2_T4G01W15",
-    0x54518D04: "MGE2_T4G01W16",
-    0x54518D05: "MGE2_T4G01W17",
-    0x54518D06: "MGE2_T4G01W18",
-    0x54518D07: "MGE2_T4G01W19",
-    0x54518D81: "MGE2_T4G01W20",
-    0x54518D82: "MGE2_T4G01W21",
-    0x54518D83: "MGE2_T4G01W22",
-    0x54518D84: "MGE2_T4G01W23",
-    0x54518D85: "MGE2_T4G01W24",
-    0x54518D86: "MGE2_T4G01W25",
-    0x54518D87: "MGE2_T4G01W26",
-    0x54518D88: "MGE2_T4G01W27",
-    0x54518D89: "MGE2_T4G01W28",
-    0x54518D8A: "MGE2_T4G01W29",
-    0x54518E04: "MGE2_T4G01W30",
-    0x54518E05: "MGE2_T4G01W31",
-    0x54518E06: "MGE2_T4G01W32",
-    0x54518E07: "MGE2_T4G01W33",
-    0x54518E08: "MGE2_T4G01W34",
-    0x54518E09: "MGE2_T4G01W35",
-    0x54518E0A: "MGE2_T4G01W36",
-    0x54518E0B: "MGE2_T4G01W37",
-    0x54518E0C: "MGE2_T4G01W38",
-    0x54518E0D: "MGE2_T4G01W39",
-    0x54518E87: "MGE2_T4G01W40",
-    0x54518E88: "MGE2_T4G01W41",
-    0x54518E89: "MGE2_T4G01W42",
-    0x54518E8A: "MGE2_T4G01W43",
-    0x54518E8B: "MGE2_T4G01W44",
-    0x54518E8C: "MGE2_T4G01W45",
-    0x54518E8D: "MGE2_T4G01W46",
-    0x54518E8E: "MGE2_T4G01W47",
-    0x54518E8F: "MGE2_T4G01W48",
-    0x54518E90: "MGE2_T4G01W49",
-    0x54518F0A: "MGE2_T4G01W50",
-    0x54534519: "TITLE10_NAME0",
-    0x5453451A: "TITLE10_NAME1",
-    0x5453451B: "TITLE10_NAME2",
-    0x5453451C: "TITLE10_NAME3",
-    0x5453451D: "TITLE10_NAME4",
-    0x5453451E: "TITLE10_NAME5",
-    0x5453451F: "TITLE10_NAME6",
-    0x54534520: "TITLE10_NAME7",
-    0x54534521: "TITLE10_NAME8",
-    0x54534522: "TITLE10_NAME9",
-    0x545F2BE2: "TRI_FOOT",
-    0x5465093F: "MGM2_FOOTER",
-    0x5465FF96: "B_SWEATER2",
-    0x5465FF97: "B_SWEATER3",
-    0x5465FF98: "B_SWEATER4",
-    0x546C3336: "SP_NERD_FT",
-    0x54A625C7: "3_05_PRESST",
-    0x54AEE782: "3_R05B_ASSISTANT",
-    0x54AFB6B9: "C2_DROPGURNEY",
-    0x54B74C9C: "MGGE_NAMIBIA",
-    0x54DBCB65: "ROLL_JIMMY_COUNTER",
-    0x54DDC458: "AS_CF_COMPLETE",
-    0x54E9A8EF: "AS_GJ_OBJCOUNT",
-    0x54F549F7: "TUT_DOLHUM",
-    0x54F6D3F7: "TUT_DOLNEG",
-    0x552260A3: "AS_RK_ACTION",
-    0x552AEB1E: "TITLE14_NUMNAMES",
-    0x5536D077: "RARC_LIC",
-    0x5537D899: "RARC_PAY",
-    0x553A35F0: "RARC_YES",
-    0x553E7F2A: "SYS_ERROR",
-    0x55480EA0: "SOC_GEN_M_PRAISE1",
-    0x554BA548: "2_S07_MOBJ_01",
-    0x5553566B: "AS_JB_COMPLETE",
-    0x5554EA2C: "AS_HH_FAIL",
-    0x555D5A14: "STO_ROTATE",
-    0x556306CB: "3_01A_MOBJ_01",
-    0x5566FF98: "MGGE_CONNECTICUT",
-    0x55683AD3: "MGS2_MULTI",
-    0x55686134: "TITLE71_NAME0",
-    0x55686135: "TITLE71_NAME1",
-    0x55686136: "TITLE71_NAME2",
-    0x55686137: "TITLE71_NAME3",
-    0x55686138: "TITLE71_NAME4",
-    0x55686139: "TITLE71_NAME5",
-    0x5568613A: "TITLE71_NAME6",
-    0x5568613B: "TITLE71_NAME7",
-    0x5568613C: "TITLE71_NAME8",
-    0x5568613D: "TITLE71_NAME9",
-    0x5569A554: "3_R05B_SCENE_01",
-    0x5569A555: "3_R05B_SCENE_02",
-    0x557931D9: "CRIME_YELLFORHELP",
-    0x55802A99: "MGGE_AFGHANISTAN",
-    0x5588D366: "JUNKYARD",
-    0x55912AC2: "3_01B_WARNING",
-    0x559395C4: "AS_PT_ACTION",
-    0x55945CE4: "MC2P_GARYWIN",
-    0x55A07D31: "TITLE80_NUMNAMES",
-    0x55AC284D: "LABEL_VEHICLE",
-    0x55AE14DE: "ESRB_01_WII",
-    0x55B1D3A1: "P_SNOW_MOBJ_01",
-    0x55B73300: "ARCADE_BTNSTRT",
-    0x55BF6D83: "AS_CB_BULLY",
-    0x55C2083C: "AS_SW_FAIL",
-    0x55C6C52B: "4_G4_TIMEUP",
-    0x55CA54DE: "CRIME_PEDATTACKGIRL",
-    0x55CEC224: "MGGE_SOUTH AFRICA",
-    0x55D34675: "1_04_NEMESIS",
-    0x55D77BA4: "TUT_STARTOBJ1",
-    0x55DAA3AB: "L1_BIKE",
-    0x55E30FCB: "4_B1_TITLE",
-    0x55EB89C1: "COL_PUMPKIN",
-    0x55F8698A: "MGSG_23",
-    0x55F8698D: "MGSG_26",
-    0x55F8698E: "MGSG_27",
-    0x55F86A0B: "MGSG_31",
-    0x55F86A0C: "MGSG_32",
-    0x55F86A0D: "MGSG_33",
-    0x55F86A0E: "MGSG_34",
-    0x55F86A0F: "MGSG_35",
-    0x55F86A10: "MGSG_36",
-    0x55F86A13: "MGSG_39",
-    0x560651B2: "D_WEP10",
-    0x560651B3: "D_WEP11",
-    0x560651B4: "D_WEP12",
-    0x560651B5: "D_WEP13",
-    0x560651B6: "D_WEP14",
-    0x560651B7: "D_WEP15",
-    0x560651B8: "D_WEP16",
-    0x5617D113: "FE_UP",
-    0x5621FE4A: "MGPH_BNWPORTRAITS",
-    0x56255FBD: "PHO_FGREEN",
-    0x5625A2F0: "2_01_HITEDNA",
-    0x563123D1: "MGCE_T2G01W01",
-    0x563123D2: "MGCE_T2G01W02",
-    0x563123D3: "MGCE_T2G01W03",
-    0x563123D4: "MGCE_T2G01W04",
-    0x563123D5: "MGCE_T2G01W05",
-    0x563123D6: "MGCE_T2G01W06",
-    0x563123D7: "MGCE_T2G01W07",
-    0x563123D8: "MGCE_T2G01W08",
-    0x563123D9: "MGCE_T2G01W09",
-    0x56312453: "MGCE_T2G01W10",
-    0x56312454: "MGCE_T2G01W11",
-    0x56312455: "MGCE_T2G01W12",
-    0x56312456: "MGCE_T2G01W13",
-    0x56312457: "MGCE_T2G01W14",
-    0x56312458: "MGCE_T2G01W15",
-    0x56312459: "MGCE_T2G01W16",
-    0x5631245A: "MGCE_T2G01W17",
-    0x5631245B: "MGCE_T2G01W18",
-    0x5631245C: "MGCE_T2G01W19",
-    0x563124D6: "MGCE_T2G01W20",
-    0x563124D7: "MGCE_T2G01W21",
-    0x563124D8: "MGCE_T2G01W22",
-    0x563124D9: "MGCE_T2G01W23",
-    0x563124DA: "MGCE_T2G01W24",
-    0x563124DB: "MGCE_T2G01W25",
-    0x563124DC: "MGCE_T2G01W26",
-    0x563124DD: "MGCE_T2G01W27",
-    0x563124DE: "MGCE_T2G01W28",
-    0x563124DF: "MGCE_T2G01W29",
-    0x56312559: "MGCE_T2G01W30",
-    0x5631255A: "MGCE_T2G01W31",
-    0x5631255B: "MGCE_T2G01W32",
-    0x5631255C: "MGCE_T2G01W33",
-    0x5631255D: "MGCE_T2G01W34",
-    0x5631255E: "MGCE_T2G01W35",
-    0x5631255F: "MGCE_T2G01W36",
-    0x56312560: "MGCE_T2G01W37",
-    0x56312561: "MGCE_T2G01W38",
-    0x56312562: "MGCE_T2G01W39",
-    0x563125DC: "MGCE_T2G01W40",
-    0x563125DD: "MGCE_T2G01W41",
-    0x563125DE: "MGCE_T2G01W42",
-    0x563125DF: "MGCE_T2G01W43",
-    0x563125E0: "MGCE_T2G01W44",
-    0x563125E1: "MGCE_T2G01W45",
-    0x563125E2: "MGCE_T2G01W46",
-    0x563125E3: "MGCE_T2G01W47",
-    0x563125E4: "MGCE_T2G01W48",
-    0x563125E5: "MGCE_T2G01W49",
-    0x5631265F: "MGCE_T2G01W50",
-    0x5639012C: "CHAPT2TRANS_PREPFRIEND",
-    0x5647DF23: "AS_PL_OBJCOUNT1",
-    0x5649DF5D: "MGGE_PENNSYLVANIA",
-    0x564FBB68: "AS_SI_RETURN",
-    0x564FD922: "R_HTHROB",
-    0x5657DC19: "IJOCKS",
-    0x565C41AD: "REPCLS",
-    0x565C474C: "2_08_HARRINGOBJ",
-    0x5660B957: "REPTTL",
-    0x5660DB55: "AS_KM_COMPLETE",
-    0x56656E68: "L1_FOOT",
-    0x566FE142: "AS_CG_RETURN",
-    0x56747B27: "RACE_WRONG_WAY",
-    0x56763CA4: "4_05_HEALTHBAR",
-    0x567C6A69: "MGPH_MICROSCOPE",
-    0x56819F70: "MGSK_10",
-    0x56819F71: "MGSK_11",
-    0x56819F72: "MGSK_12",
-    0x56819F78: "MGSK_18",
-    0x56819F79: "MGSK_19",
-    0x56819FF3: "MGSK_20",
-    0x56819FF4: "MGSK_21",
-    0x568A7BB0: "3_01_PHOTG",
-    0x568A7BB1: "3_01_PHOTH",
-    0x568A7BB4: "3_01_PHOTK",
-    0x56942B89: "2-G2.SUB0001",
-    0x56942B8A: "2-G2.SUB0002",
-    0x56942B8B: "2-G2.SUB0003",
-    0x56942B8C: "2-G2.SUB0004",
-    0x56942B8D: "2-G2.SUB0005",
-    0x56942B8E: "2-G2.SUB0006",
-    0x56942B8F: "2-G2.SUB0007",
-    0x56942B90: "2-G2.SUB0008",
-    0x56942B91: "2-G2.SUB0009",
-    0x56942C0B: "2-G2.SUB0010",
-    0x56942C0C: "2-G2.SUB0011",
-    0x56942C0D: "2-G2.SUB0012",
-    0x56942C0E: "2-G2.SUB0013",
-    0x56942C0F: "2-G2.SUB0014",
-    0x56942C10: "2-G2.SUB0015",
-    0x56942C11: "2-G2.SUB0016",
-    0x56942C12: "2-G2.SUB0017",
-    0x56942C13: "2-G2.SUB0018",
-    0x56942C14: "2-G2.SUB0019",
-    0x56942C8E: "2-G2.SUB0020",
-    0x56942C8F: "2-G2.SUB0021",
-    0x56942C90: "2-G2.SUB0022",
-    0x56942C91: "2-G2.SUB0023",
-    0x56942C92: "2-G2.SUB0024",
-    0x56942C93: "2-G2.SUB0025",
-    0x56942C94: "2-G2.SUB0026",
-    0x56942C95: "2-G2.SUB0027",
-    0x56942C96: "2-G2.SUB0028",
-    0x56942C97: "2-G2.SUB0029",
-    0x569430A1: "MGCA_REVERSAL_NAME",
-    0x56987E74: "TITLE41_NAME100",
-    0x56987E75: "TITLE41_NAME101",
-    0x56987E76: "TITLE41_NAME102",
-    0x56987E77: "TITLE41_NAME103",
-    0x56987E78: "TITLE41_NAME104",
-    0x56987E79: "TITLE41_NAME105",
-    0x56987E7A: "TITLE41_NAME106",
-    0x56987E7B: "TITLE41_NAME107",
-    0x56987E7C: "TITLE41_NAME108",
-    0x56987E7D: "TITLE41_NAME109",
-    0x56987EF7: "TITLE41_NAME110",
-    0x56987EF8: "TITLE41_NAME111",
-    0x56987EF9: "TITLE41_NAME112",
-    0x56987EFA: "TITLE41_NAME113",
-    0x56987EFB: "TITLE41_NAME114",
-    0x56987EFC: "TITLE41_NAME115",
-    0x56987EFD: "TITLE41_NAME116",
-    0x56987EFE: "TITLE41_NAME117",
-    0x56987EFF: "TITLE41_NAME118",
-    0x56987F00: "TITLE41_NAME119",
-    0x56987F7A: "TITLE41_NAME120",
-    0x56987F7B: "TITLE41_NAME121",
-    0x56987F7C: "TITLE41_NAME122",
-    0x56987F7D: "TITLE41_NAME123",
-    0x56987F7E: "TITLE41_NAME124",
-    0x56987F7F: "TITLE41_NAME125",
-    0x56987F80: "TITLE41_NAME126",
-    0x56987F81: "TITLE41_NAME127",
-    0x56987F82: "TITLE41_NAME128",
-    0x56987F83: "TITLE41_NAME129",
-    0x56987FFD: "TITLE41_NAME130",
-    0x56987FFE: "TITLE41_NAME131",
-    0x56987FFF: "TITLE41_NAME132",
-    0x56988000: "TITLE41_NAME133",
-    0x56988001: "TITLE41_NAME134",
-    0x56988002: "TITLE41_NAME135",
-    0x56988003: "TITLE41_NAME136",
-    0x56988004: "TITLE41_NAME137",
-    0x56988005: "TITLE41_NAME138",
-    0x56988006: "TITLE41_NAME139",
-    0x56988080: "TITLE41_NAME140",
-    0x56988081: "TITLE41_NAME141",
-    0x56988082: "TITLE41_NAME142",
-    0x56988083: "TITLE41_NAME143",
-    0x56988084: "TITLE41_NAME144",
-    0x56988085: "TITLE41_NAME145",
-    0x56988086: "TITLE41_NAME146",
-    0x56988087: "TITLE41_NAME147",
-    0x56988088: "TITLE41_NAME148",
-    0x56988089: "TITLE41_NAME149",
-    0x56988103: "TITLE41_NAME150",
-    0x56988104: "TITLE41_NAME151",
-    0x56988105: "TITLE41_NAME152",
-    0x56988106: "TITLE41_NAME153",
-    0x56988107: "TITLE41_NAME154",
-    0x56988108: "TITLE41_NAME155",
-    0x56988109: "TITLE41_NAME156",
-    0x5698810A: "TITLE41_NAME157",
-    0x5698810B: "TITLE41_NAME158",
-    0x5698810C: "TITLE41_NAME159",
-    0x56988186: "TITLE41_NAME160",
-    0x56988187: "TITLE41_NAME161",
-    0x56988188: "TITLE41_NAME162",
-    0x56988189: "TITLE41_NAME163",
-    0x5698818A: "TITLE41_NAME164",
-    0x5698818B: "TITLE41_NAME165",
-    0x5698818C: "TITLE41_NAME166",
-    0x5698818D: "TITLE41_NAME167",
-    0x5698818E: "TITLE41_NAME168",
-    0x5698818F: "TITLE41_NAME169",
-    0x56988209: "TITLE41_NAME170",
-    0x5698820A: "TITLE41_NAME171",
-    0x5698820B: "TITLE41_NAME172",
-    0x5698820C: "TITLE41_NAME173",
-    0x5698820D: "TITLE41_NAME174",
-    0x5698820E: "TITLE41_NAME175",
-    0x5698820F: "TITLE41_NAME176",
-    0x56988210: "TITLE41_NAME177",
-    0x56988211: "TITLE41_NAME178",
-    0x56988212: "TITLE41_NAME179",
-    0x5698828C: "TITLE41_NAME180",
-    0x5698828D: "TITLE41_NAME181",
-    0x5698828E: "TITLE41_NAME182",
-    0x5698828F: "TITLE41_NAME183",
-    0x56988290: "TITLE41_NAME184",
-    0x56988291: "TITLE41_NAME185",
-    0x56988292: "TITLE41_NAME186",
-    0x56988293: "TITLE41_NAME187",
-    0x56988294: "TITLE41_NAME188",
-    0x56988295: "TITLE41_NAME189",
-    0x5698830F: "TITLE41_NAME190",
-    0x56988310: "TITLE41_NAME191",
-    0x56988311: "TITLE41_NAME192",
-    0x56988312: "TITLE41_NAME193",
-    0x56988313: "TITLE41_NAME194",
-    0x56988314: "TITLE41_NAME195",
-    0x56988315: "TITLE41_NAME196",
-    0x56988316: "TITLE41_NAME197",
-    0x56988317: "TITLE41_NAME198",
-    0x56988318: "TITLE41_NAME199",
-    0x5698C17D: "TITLE41_NAME200",
-    0x5698C17E: "TITLE41_NAME201",
-    0x5698C17F: "TITLE41_NAME202",
-    0x5698C180: "TITLE41_NAME203",
-    0x5698C181: "TITLE41_NAME204",
-    0x5698C182: "TITLE41_NAME205",
-    0x5698C183: "TITLE41_NAME206",
-    0x5698C184: "TITLE41_NAME207",
-    0x5698C185: "TITLE41_NAME208",
-    0x5698C186: "TITLE41_NAME209",
-    0x5698C200: "TITLE41_NAME210",
-    0x5698C201: "TITLE41_NAME211",
-    0x5698C202: "TITLE41_NAME212",
-    0x5698C203: "TITLE41_NAME213",
-    0x5698C204: "TITLE41_NAME214",
-    0x5698C205: "TITLE41_NAME215",
-    0x5698C206: "TITLE41_NAME216",
-    0x5698C207: "TITLE41_NAME217",
-    0x5698C208: "TITLE41_NAME218",
-    0x5698C209: "TITLE41_NAME219",
-    0x5698C283: "TITLE41_NAME220",
-    0x5698C284: "TITLE41_NAME221",
-    0x5698C285: "TITLE41_NAME222",
-    0x5698C286: "TITLE41_NAME223",
-    0x5698C287: "TITLE41_NAME224",
-    0x5698C288: "TITLE41_NAME225",
-    0x5698C289: "TITLE41_NAME226",
-    0x5698C28A: "TITLE41_NAME227",
-    0x5698C28B: "TITLE41_NAME228",
-    0x5698C28C: "TITLE41_NAME229",
-    0x5698C306: "TITLE41_NAME230",
-    0x5698C307: "TITLE41_NAME231",
-    0x5698C308: "TITLE41_NAME232",
-    0x5698C309: "TITLE41_NAME233",
-    0x5698C30A: "TITLE41_NAME234",
-    0x5698C30B: "TITLE41_NAME235",
-    0x5698C30C: "TITLE41_NAME236",
-    0x5698C30D: "TITLE41_NAME237",
-    0x5698C30E: "TITLE41_NAME238",
-    0x5698C30F: "TITLE41_NAME239",
-    0x5698C389: "TITLE41_NAME240",
-    0x5698C38A: "TITLE41_NAME241",
-    0x5698C38B: "TITLE41_NAME242",
-    0x5698C38C: "TITLE41_NAME243",
-    0x5698C38D: "TITLE41_NAME244",
-    0x5698C38E: "TITLE41_NAME245",
-    0x5698C38F: "TITLE41_NAME246",
-    0x5698C390: "TITLE41_NAME247",
-    0x5698C391: "TITLE41_NAME248",
-    0x5698C392: "TITLE41_NAME249",
-    0x5698C40C: "TITLE41_NAME250",
-    0x5698C40D: "TITLE41_NAME251",
-    0x5698C40E: "TITLE41_NAME252",
-    0x5698C40F: "TITLE41_NAME253",
-    0x5698C410: "TITLE41_NAME254",
-    0x5698C411: "TITLE41_NAME255",
-    0x5698C412: "TITLE41_NAME256",
-    0x5698C413: "TITLE41_NAME257",
-    0x5698C414: "TITLE41_NAME258",
-    0x5698C415: "TITLE41_NAME259",
-    0x5698C48F: "TITLE41_NAME260",
-    0x5698C490: "TITLE41_NAME261",
-    0x5698C491: "TITLE41_NAME262",
-    0x5698C492: "TITLE41_NAME263",
-    0x5698C493: "TITLE41_NAME264",
-    0x5698C494: "TITLE41_NAME265",
-    0x5698C495: "TITLE41_NAME266",
-    0x5698C496: "TITLE41_NAME267",
-    0x5698C497: "TITLE41_NAME268",
-    0x5698C498: "TITLE41_NAME269",
-    0x5698C512: "TITLE41_NAME270",
-    0x5698C513: "TITLE41_NAME271",
-    0x5698C514: "TITLE41_NAME272",
-    0x5698C515: "TITLE41_NAME273",
-    0x5698C516: "TITLE41_NAME274",
-    0x5698C517: "TITLE41_NAME275",
-    0x5698C518: "TITLE41_NAME276",
-    0x5698C519: "TITLE41_NAME277",
-    0x5698C51A: "TITLE41_NAME278",
-    0x5698C51B: "TITLE41_NAME279",
-    0x5698C595: "TITLE41_NAME280",
-    0x5698C596: "TITLE41_NAME281",
-    0x5698C597: "TITLE41_NAME282",
-    0x5698C598: "TITLE41_NAME283",
-    0x5698C599: "TITLE41_NAME284",
-    0x5698C59A: "TITLE41_NAME285",
-    0x5698C59B: "TITLE41_NAME286",
-    0x5698C59C: "TITLE41_NAME287",
-    0x569E8BF9: "N_ALGERNON",
-    0x569E9FFE: "2_R03_FAIL01",
-    0x569E9FFF: "2_R03_FAIL02",
-    0x569EA000: "2_R03_FAIL03",
-    0x569EA001: "2_R03_FAIL04",
-    0x569EA002: "2_R03_FAIL05",
-    0x569F067C: "AS_EA_FAIL",
-    0x56ABA172: "AS_TF_FAIL",
-    0x56AE1EA9: "4_03_RESPECT",
-    0x56B2F65A: "SP_FRIES_H",
-    0x56B2F65E: "SP_FRIES_L",
-    0x56B2F666: "SP_FRIES_T",
-    0x56BB8AD6: "B_WRISTBAND1",
-    0x56BB8AD7: "B_WRISTBAND2",
-    0x56BB8AD8: "B_WRISTBAND3",
-    0x56BB8AD9: "B_WRISTBAND4",
-    0x56BB8ADA: "B_WRISTBAND5",
-    0x56BEB0A1: "MGBI_PIG_0",
-    0x56BEB0A2: "MGBI_PIG_1",
-    0x56BEB0A3: "MGBI_PIG_2",
-    0x56BEB0A4: "MGBI_PIG_3",
-    0x56BEB0A5: "MGBI_PIG_4",
-    0x56BEB0A6: "MGBI_PIG_5",
-    0x56BEB0A7: "MGBI_PIG_6",
-    0x56BEB0A8: "MGBI_PIG_7",
-    0x56BEB0A9: "MGBI_PIG_8",
-    0x56BEB0AA: "MGBI_PIG_9",
-    0x56CF0171: "3_05_DIARY",
-    0x56CF4809: "AS_CF_FAIL",
-    0x56DBE2FF: "AS_RK_FAIL",
-    0x56E0C40B: "C2_YOUWON",
-    0x56E20F00: "AS_SL_OBJECTIVE",
-    0x56E9586E: "2_01_CNTRITEMS",
-    0x56EBB70F: "CRIME_TATTLER",
-    0x5700DED3: "MGPH_CORNELIUS",
-    0x570F3082: "1_G1_OEXIT",
-    0x571009C7: "FE_NOOBJECTIVES",
-    0x57109EAA: "AS_SW_COUNTER",
-    0x5710A77D: "4-05.SUB0001",
-    0x5710A77E: "4-05.SUB0002",
-    0x5710A77F: "4-05.SUB0003",
-    0x5710A780: "4-05.SUB0004",
-    0x5710A781: "4-05.SUB0005",
-    0x5710A782: "4-05.SUB0006",
-    0x5710A783: "4-05.SUB0007",
-    0x5710A784: "4-05.SUB0008",
-    0x5710A785: "4-05.SUB0009",
-    0x5710A7FF: "4-05.SUB0010",
-    0x5710A800: "4-05.SUB0011",
-    0x5710A801: "4-05.SUB0012",
-    0x5710A802: "4-05.SUB0013",
-    0x5710A803: "4-05.SUB0014",
-    0x5710A804: "4-05.SUB0015",
-    0x5710A805: "4-05.SUB0016",
-    0x5710A806: "4-05.SUB0017",
-    0x5710A807: "4-05.SUB0018",
-    0x5710A808: "4-05.SUB0019",
-    0x5710A882: "4-05.SUB0020",
-    0x5710A883: "4-05.SUB0021",
-    0x5710A884: "4-05.SUB0022",
-    0x5710A885: "4-05.SUB0023",
-    0x5710A886: "4-05.SUB0024",
-    0x5710A887: "4-05.SUB0025",
-    0x572BB01E: "CHAPT1MESSAGE",
-    0x572D22F5: "MGSP_01",
-    0x572D22F6: "MGSP_02",
-    0x572D22F7: "MGSP_03",
-    0x572D22F8: "MGSP_04",
-    0x572D2E37: "MGSP_F1",
-    0x572D36EA: "MGSP_W1",
-    0x572D36EB: "MGSP_W2",
-    0x573021D8: "STATIQ",
-    0x57386B76: "1_11X2_EMPTY",
-    0x573D32B7: "STRERROR",
-    0x5743F344: "TITLE56_NAME10",
-    0x5743F345: "TITLE56_NAME11",
-    0x5743F346: "TITLE56_NAME12",
-    0x5743F347: "TITLE56_NAME13",
-    0x5743F348: "TITLE56_NAME14",
-    0x574D75C9: "STBAIR",
-    0x5751D76B: "TITLE64_NUMNAMES",
-    0x5764B623: "AUDITORIUM",
-    0x5767F6FC: "3_01C_BEGIN",
-    0x5768C2A1: "TAG_NERD_SM_01",
-    0x576E4381: "SP_80BRACER",
-    0x57769799: "BUT_LAUNCH",
-    0x577F240D: "TITLE58_NAME0",
-    0x577F240E: "TITLE58_NAME1",
-    0x578EA506: "3_G3_RESPECTM",
-    0x5793C53D: "MGGE_PORTUGAL",
-    0x57A066E8: "SP_MATHSHIRT",
-    0x57D415A1: "3-01CB.SUB0001",
-    0x57D415A2: "3-01CB.SUB0002",
-    0x57D415A3: "3-01CB.SUB0003",
-    0x57D415A4: "3-01CB.SUB0004",
-    0x57D415A5: "3-01CB.SUB0005",
-    0x57D415A6: "3-01CB.SUB0006",
-    0x57D7A2AC: "PSNOW_TITLE",
-    0x57DB1109: "4_02_SECDOOR",
-    0x57DBF1FF: "S_TAUNT_DEAD_01",
-    0x57DFD494: "MGGE_PALAU",
-    0x57E2E9EF: "4-B1.SUB0001",
-    0x57E2E9F0: "4-B1.SUB0002",
-    0x57E2E9F1: "4-B1.SUB0003",
-    0x57E2E9F2: "4-B1.SUB0004",
-    0x57E2E9F3: "4-B1.SUB0005",
-    0x57E2E9F4: "4-B1.SUB0006",
-    0x57E2E9F5: "4-B1.SUB0007",
-    0x57E2E9F6: "4-B1.SUB0008",
-    0x57E2E9F7: "4-B1.SUB0009",
-    0x57E2EA71: "4-B1.SUB0010",
-    0x57E3F252: "AS_ST_COMPLETE",
-    0x58016D82: "TITLE43_NAME10",
-    0x58016D83: "TITLE43_NAME11",
-    0x58016D84: "TITLE43_NAME12",
-    0x58016D85: "TITLE43_NAME13",
-    0x58016D86: "TITLE43_NAME14",
-    0x58016D87: "TITLE43_NAME15",
-    0x58016D88: "TITLE43_NAME16",
-    0x58016D89: "TITLE43_NAME17",
-    0x58016D8A: "TITLE43_NAME18",
-    0x58016D8B: "TITLE43_NAME19",
-    0x58016E05: "TITLE43_NAME20",
-    0x58016E06: "TITLE43_NAME21",
-    0x58016E07: "TITLE43_NAME22",
-    0x58016E08: "TITLE43_NAME23",
-    0x58016E09: "TITLE43_NAME24",
-    0x58016E0A: "TITLE43_NAME25",
-    0x58016E0B: "TITLE43_NAME26",
-    0x58016E0C: "TITLE43_NAME27",
-    0x58016E0D: "TITLE43_NAME28",
-    0x58016E0E: "TITLE43_NAME29",
-    0x58016E88: "TITLE43_NAME30",
-    0x5804A47A: "MGPH_ENGINEBLOCK",
-    0x5816413B: "5_01_OBJ",
-    0x581B9D20: "1_G1_OMATH",
-    0x582505D0: "BARBER",
-    0x5831618A: "AS_TC_OBJECTIVE",
-    0x5837FE5B: "DEMERITS",
-    0x5857EEDD: "P_WATCH1",
-    0x58619E6E: "FEC_ABR",
-    0x5863BBD7: "FEC_ILU",
-    0x586721B0: "FEC_VIB",
-    0x58809847: "TUT_JOCKVEN1",
-    0x5887C7A2: "AS_PM_COMPLETE",
-    0x588FD447: "MGE2_T14G01W01",
-    0x588FD448: "MGE2_T14G01W02",
-    0x588FD449: "MGE2_T14G01W03",
-    0x588FD44A: "MGE2_T14G01W04",
-    0x588FD44B: "MGE2_T14G01W05",
-    0x588FD44C: "MGE2_T14G01W06",
-    0x588FD44D: "MGE2_T14G01W07",
-    0x588FD44E: "MGE2_T14G01W08",
-    0x588FD44F: "MGE2_T14G01W09",
-    0x588FD4C9: "MGE2_T14G01W10",
-    0x588FD4CA: "MGE2_T14G01W11",
-    0x588FD4CB: "MGE2_T14G01W12",
-    0x588FD4CC: "MGE2_T14G01W13",
-    0x588FD4CD: "MGE2_T14G01W14",
-    0x588FD4CE: "MGE2_T14G01W15",
-    0x588FD4CF: "MGE2_T14G01W16",
-    0x588FD4D0: "MGE2_T14G01W17",
-    0x588FD4D1: "MGE2_T14G01W18",
-    0x588FD4D2: "MGE2_T14G01W19",
-    0x588FD54C: "MGE2_T14G01W20",
-    0x588FD54D: "MGE2_T14G01W21",
-    0x588FD54E: "MGE2_T14G01W22",
-    0x588FD54F: "MGE2_T14G01W23",
-    0x588FD550: "MGE2_T14G01W24",
-    0x588FD551: "MGE2_T14G01W25",
-    0x588FD552: "MGE2_T14G01W26",
-    0x588FD553: "MGE2_T14G01W27",
-    0x588FD554: "MGE2_T14G01W28",
-    0x588FD555: "MGE2_T14G01W29",
-    0x588FD5CF: "MGE2_T14G01W30",
-    0x588FD5D0: "MGE2_T14G01W31",
-    0x588FD5D1: "MGE2_T14G01W32",
-    0x588FD5D2: "MGE2_T14G01W33",
-    0x588FD5D3: "MGE2_T14G01W34",
-    0x588FD5D4: "MGE2_T14G01W35",
-    0x588FD5D5: "MGE2_T14G01W36",
-    0x588FD5D6: "MGE2_T14G01W37",
-    0x588FD5D7: "MGE2_T14G01W38",
-    0x588FD5D8: "MGE2_T14G01W39",
-    0x588FD652: "MGE2_T14G01W40",
-    0x588FD653: "MGE2_T14G01W41",
-    0x588FD654: "MGE2_T14G01W42",
-    0x588FD655: "MGE2_T14G01W43",
-    0x588FD656: "MGE2_T14G01W44",
-    0x588FD657: "MGE2_T14G01W45",
-    0x588FD658: "MGE2_T14G01W46",
-    0x588FD659: "MGE2_T14G01W47",
-    0x588FD65A: "MGE2_T14G01W48",
-    0x588FD65B: "MGE2_T14G01W49",
-    0x588FD6D5: "MGE2_T14G01W50",
-    0x589C58C5: "TITLE43_NAME0",
-    0x589C58C6: "TITLE43_NAME1",
-    0x589C58C7: "TITLE43_NAME2",
-    0x589C58C8: "TITLE43_NAME3",
-    0x589C58C9: "TITLE43_NAME4",
-    0x589C58CA: "TITLE43_NAME5",
-    0x589C58CB: "TITLE43_NAME6",
-    0x589C58CC: "TITLE43_NAME7",
-    0x589C58CD: "TITLE43_NAME8",
-    0x589C58CE: "TITLE43_NAME9",
-    0x58A5270E: "",
-    0x58AAFA37: "6-BC.SUB0001",
-    0x58AAFA38: "6-BC.SUB0002",
-    0x58AAFA39: "6-BC.SUB0003",
-    0x58AAFA3A: "6-BC.SUB0004",
-    0x58AAFA3B: "6-BC.SUB0005",
-    0x58AAFA3C: "6-BC.SUB0006",
-    0x58AAFA3D: "6-BC.SUB0007",
-    0x58AAFA3E: "6-BC.SUB0008",
-    0x58AAFA3F: "6-BC.SUB0009",
-    0x58AAFAB9: "6-BC.SUB0010",
-    0x58AAFABA: "6-BC.SUB0011",
-    0x58AAFABB: "6-BC.SUB0012",
-    0x58AAFABC: "6-BC.SUB0013",
-    0x58AAFABD: "6-BC.SUB0014",
-    0x58AAFABE: "6-BC.SUB0015",
-    0x58AAFABF: "6-BC.SUB0016",
-    0x58AAFAC0: "6-BC.SUB0017",
-    0x58AAFAC1: "6-BC.SUB0018",
-    0x58AAFAC2: "6-BC.SUB0019",
-    0x58AAFB3C: "6-BC.SUB0020",
-    0x58AAFB3D: "6-BC.SUB0021",
-    0x58AAFB3E: "6-BC.SUB0022",
-    0x58AAFB3F: "6-BC.SUB0023",
-    0x58AAFB40: "6-BC.SUB0024",
-    0x58AAFB41: "6-BC.SUB0025",
-    0x58AAFB42: "6-BC.SUB0026",
-    0x58BE71BC: "2_S05_FAILEDNA",
-    0x58C053A9: "S_GIFT_GIRL_01",
-    0x58C0DA72: "3_01C_BONUS",
-    0x58C62B69: "CRIME_BIKESTOLEN",
-    0x58CD5985: "N_OFFICERWILLIAMS",
-    0x58D54143: "3-R05A.SUB0001",
-    0x58D54144: "3-R05A.SUB0002",
-    0x58D54145: "3-R05A.SUB0003",
-    0x58D54146: "3-R05A.SUB0004",
-    0x58D54147: "3-R05A.SUB0005",
-    0x58D54148: "3-R05A.SUB0006",
-    0x58D54149: "3-R05A.SUB0007",
-    0x58D5414A: "3-R05A.SUB0008",
-    0x58D5414B: "3-R05A.SUB0009",
-    0x58D541C5: "3-R05A.SUB0010",
-    0x58D541C6: "3-R05A.SUB0011",
-    0x58D541C7: "3-R05A.SUB0012",
-    0x58D541C8: "3-R05A.SUB0013",
-    0x58D541C9: "3-R05A.SUB0014",
-    0x58D541CA: "3-R05A.SUB0015",
-    0x58D541CB: "3-R05A.SUB0016",
-    0x58D541CC: "3-R05A.SUB0017",
-    0x58D541CD: "3-R05A.SUB0018",
-    0x58D541CE: "3-R05A.SUB0019",
-    0x58D54248: "3-R05A.SUB0020",
-    0x58D7C0AA: "2_R03_BIKEWARN",
-    0x58E5CB98: "PHO_FBLUE",
-    0x58EB2CA0: "TPM_EXIT",
-    0x58F9517F: "D_WBALLOON",
-    0x590331A5: "TITLE48_NUMNAMES",
-    0x59132491: "MGGE_SINGAPORE",
-    0x594413AC: "TITLE9_NUMNAMES",
-    0x5956CD46: "4_04_USEPROP",
-    0x596663AF: "CHAPT2TRANS_BLANK",
-    0x59677EDB: "JPAPER_TITLE",
-    0x5969A811: "CONT_01_2_WII",
-    0x59701FF5: "1_06_MOVE01",
-    0x59701FF6: "1_06_MOVE02",
-    0x59701FF7: "1_06_MOVE03",
-    0x59701FF8: "1_06_MOVE04",
-    0x59701FF9: "1_06_MOVE05",
-    0x59701FFA: "1_06_MOVE06",
-    0x59701FFB: "1_06_MOVE07",
-    0x59701FFC: "1_06_MOVE08",
-    0x59701FFD: "1_06_MOVE09",
-    0x597AAD76: "MGCA_KISS01",
-    0x597AAD77: "MGCA_KISS02",
-    0x597AAD78: "MGCA_KISS03",
-    0x597EEDD4: "FESA_CONTROLS",
-    0x59879E06: "TITLE3_NAME10",
-    0x5992405C: "SP_COWBOYHAT",
-    0x5995BAF7: "MGGE_NEWBRUNSWICK",
-    0x599B7AE7: "MGM2_QUES_TIT01",
-    0x599B7AE8: "MGM2_QUES_TIT02",
-    0x599B7AE9: "MGM2_QUES_TIT03",
-    0x599B7AEA: "MGM2_QUES_TIT04",
-    0x599B7AEB: "MGM2_QUES_TIT05",
-    0x599B7AEC: "MGM2_QUES_TIT06",
-    0x599B7AED: "MGM2_QUES_TIT07",
-    0x599B7AEE: "MGM2_QUES_TIT08",
-    0x599B7AEF: "MGM2_QUES_TIT09",
-    0x599B7B69: "MGM2_QUES_TIT10",
-    0x599B7B6A: "MGM2_QUES_TIT11",
-    0x599B7B6B: "MGM2_QUES_TIT12",
-    0x599B7B6C: "MGM2_QUES_TIT13",
-    0x599B7B6D: "MGM2_QUES_TIT14",
-    0x59A6242F: "B_FLATTOP",
-    0x59A706F5: "TITLE11_NUMNAMES",
-    0x59A95BA1: "GOTO_RACEBUSINESS",
-    0x59BC28F1: "2_03_OBJ1B",
-    0x59BC28F2: "2_03_OBJ1C",
-    0x59BDB801: "MGB2_SEL",
-    0x59BDF966: "MGB2_TB1",
-    0x59BDF967: "MGB2_TB2",
-    0x59C5EAC6: "FE_PLAYER1_FE",
-    0x59C9EB40: "S_TAUNT_FLEE_GEN_01",
-    0x59D0B4E6: "2_03_RESPECTM",
-    0x59D2C41B: "TRAILER",
-    0x59D5D2C5: "FEM_EXIT_HEADER",
-    0x59DA5ECF: "6_03_FAILWARN",
-    0x59DB9373: "C4_BEGIN",
-    0x59E83861: "FE_PLAYER2_FE",
-    0x59EC80BC: "MGCE_SHORTWORDS",
-    0x59F15F76: "N_MRMORATTI",
-    0x59FA338E: "TUT_MCLS01",
-    0x5A047338: "AS_JB_ACTION",
-    0x5A1C7FB5: "S_WUP_GEN_01",
-    0x5A1E537C: "5-09.SUB0001",
-    0x5A1E537D: "5-09.SUB0002",
-    0x5A1E537E: "5-09.SUB0003",
-    0x5A1E537F: "5-09.SUB0004",
-    0x5A1E5380: "5-09.SUB0005",
-    0x5A1E5381: "5-09.SUB0006",
-    0x5A1E5382: "5-09.SUB0007",
-    0x5A1E5383: "5-09.SUB0008",
-    0x5A1E5384: "5-09.SUB0009",
-    0x5A1E53FE: "5-09.SUB0010",
-    0x5A1E53FF: "5-09.SUB0011",
-    0x5A1E5400: "5-09.SUB0012",
-    0x5A1E5401: "5-09.SUB0013",
-    0x5A1E5402: "5-09.SUB0014",
-    0x5A1E5403: "5-09.SUB0015",
-    0x5A1E5404: "5-09.SUB0016",
-    0x5A1E5405: "5-09.SUB0017",
-    0x5A1E5406: "5-09.SUB0018",
-    0x5A1E5407: "5-09.SUB0019",
-    0x5A1E5481: "5-09.SUB0020",
-    0x5A1E5482: "5-09.SUB0021",
-    0x5A1E5483: "5-09.SUB0022",
-    0x5A1E5484: "5-09.SUB0023",
-    0x5A20C6B7: "4_03_TITLE",
-    0x5A264E89: "3_05_HITLOLA",
-    0x5A49AD14: "MGE2_BADWORDS",
-    0x5A584DD7: "AS_TH_OBJECTIVE",
-    0x5A61145E: "SAVE_FTABLE",
-    0x5A615F68: "TUT_MCOT01",
-    0x5A63D2FE: "1_11X2_DROPPOOP",
-    0x5A6B5E35: "CLT_HALLOW",
-    0x5A733ABF: "SOC_GEN_INSULT1",
-    0x5A733AC0: "SOC_GEN_INSULT2",
-    0x5A733AC1: "SOC_GEN_INSULT3",
-    0x5A7453BF: "AS_LC_RETURN",
-    0x5A838403: "FE_SCOREOUTOF",
-    0x5A8CB79B: "BC_SCOOTER",
-    0x5A9C68CE: "SP_MUSICPJ_L",
-    0x5A9C68D6: "SP_MUSICPJ_T",
-    0x5AA18566: "2_06_GORDKO",
-    0x5AAE0566: "BUTTON_STRUGGLE",
-    0x5AC24C7F: "2_S05_FAILTIME",
-    0x5ACB6285: "TUT_ARTKISS",
-    0x5ADAB19A: "N_MRBURTON",
-    0x5ADDC3FF: "BUTTON_TRI_D",
-    0x5ADDC413: "BUTTON_TRI_X",
-    0x5AFFA8DB: "GKART_3LAPS",
-    0x5B0B3A69: "AS_AG_COMPLETE",
-    0x5B1150A1: "3_R09_EMPTY",
-    0x5B19B463: "N_MRGORDON",
-    0x5B1AF574: "6_01_EXPELLED",
-    0x5B28D13A: "P_TOQUE1",
-    0x5B28D13B: "P_TOQUE2",
-    0x5B28D13C: "P_TOQUE3",
-    0x5B3BDA02: "USE_FRAFFY2",
-    0x5B3D99AE: "3_01C_GOOD",
-    0x5B54717B: "FE_TASKTITLE",
-    0x5B5AC9F0: "MGGE_NICARAGUA",
-    0x5B5F22C5: "1_02B_GARB_01",
-    0x5B63B180: "2_G2_RSTRING",
-    0x5B72EA60: "BUT_BETS",
-    0x5B73F1DB: "BUT_BIKE",
-    0x5B760F90: "B_CREWCUT_01",
-    0x5B760F91: "B_CREWCUT_02",
-    0x5B760F92: "B_CREWCUT_03",
-    0x5B760F93: "B_CREWCUT_04",
-    0x5B890B3D: "N_MELODY",
-    0x5B8AE300: "N_MELVIN",
-    0x5B8D361B: "MGPH_BRAINSTICK",
-    0x5B90097E: "AS_FA_OBJECTIVE",
-    0x5B97CB42: "PHO_YEARBK",
-    0x5BA4E793: "D_BEAR",
-    0x5BB6D7A3: "REVERSAL_CROSS",
-    0x5BBAF4C8: "TAG_NERD_LG_01",
-    0x5BBE22DF: "DISDEF",
-    0x5BC1454B: "DISPAR",
-    0x5BC14E83: "DISPST",
-    0x5BCB1A97: "MGPH_FRISBEE",
-    0x5BCDF342: "TITLE61_NUMNAMES",
-    0x5BCE97B9: "MGE2_T9G01W01",
-    0x5BCE97BA: "MGE2_T9G01W02",
-    0x5BCE97BB: "MGE2_T9G01W03",
-    0x5BCE97BC: "MGE2_T9G01W04",
-    0x5BCE97BD: "MGE2_T9G01W05",
-    0x5BCE97BE: "MGE2_T9G01W06",
-    0x5BCE97BF: "MGE2_T9G01W07",
-    0x5BCE97C0: "MGE2_T9G01W08",
-    0x5BCE97C1: "MGE2_T9G01W09",
-    0x5BCE983B: "MGE2_T9G01W10",
-    0x5BCE983C: "MGE2_T9G01W11",
-    0x5BCE983D: "MGE2_T9G01W12",
-    0x5BCE983E: "MGE2_T9G01W13",
-    0x5BCE983F: "MGE2_T9G01W14",
-    0x5BCE9840: "MGE2_T9G01W15",
-    0x5BCE9841: "MGE2_T9G01W16",
-    0x5BCE9842: "MGE2_T9G01W17",
-    0x5BCE9843: "MGE2_T9G01W18",
-    0x5BCE9844: "MGE2_T9G01W19",
-    0x5BCE98BE: "MGE2_T9G01W20",
-    0x5BCE98BF: "MGE2_T9G01W21",
-    0x5BCE98C0: "MGE2_T9G01W22",
-    0x5BCE98C1: "MGE2_T9G01W23",
-    0x5BCE98C2: "MGE2_T9G01W24",
-    0x5BCE98C3: "MGE2_T9G01W25",
-    0x5BCE98C4: "MGE2_T9G01W26",
-    0x5BCE98C5: "MGE2_T9G01W27",
-    0x5BCE98C6: "MGE2_T9G01W28",
-    0x5BCE98C7: "MGE2_T9G01W29",
-    0x5BCE9941: "MGE2_T9G01W30",
-    0x5BCE9942: "MGE2_T9G01W31",
-    0x5BCE9943: "MGE2_T9G01W32",
-    0x5BCE9944: "MGE2_T9G01W33",
-    0x5BCE9945: "MGE2_T9G01W34",
-    0x5BCE9946: "MGE2_T9G01W35",
-    0x5BCE9947: "MGE2_T9G01W36",
-    0x5BCE9948: "MGE2_T9G01W37",
-    0x5BCE9949: "MGE2_T9G01W38",
-    0x5BCE994A: "MGE2_T9G01W39",
-    0x5BCE99C4: "MGE2_T9G01W40",
-    0x5BCE99C5: "MGE2_T9G01W41",
-    0x5BCE99C6: "MGE2_T9G01W42",
-    0x5BCE99C7: "MGE2_T9G01W43",
-    0x5BCE99C8: "MGE2_T9G01W44",
-    0x5BCE99C9: "MGE2_T9G01W45",
-    0x5BCE99CA: "MGE2_T9G01W46",
-    0x5BCE99CB: "MGE2_T9G01W47",
-    0x5BCE99CC: "MGE2_T9G01W48",
-    0x5BCE99CD: "MGE2_T9G01W49",
-    0x5BCE9A47: "MGE2_T9G01W50",
-    0x5BD05056: "TITLE15_NAME0",
-    0x5BD05057: "TITLE15_NAME1",
-    0x5BD05058: "TITLE15_NAME2",
-    0x5BD05059: "TITLE15_NAME3",
-    0x5BD60485: "MRESPECT_JP100",
-    0x5BD629F5: "TM_GYM",
-    0x5BE045EA: "4_03_01",
-    0x5BE045F0: "4_03_07",
-    0x5BE045F2: "4_03_09",
-    0x5BE0466E: "4_03_12",
-    0x5BE04670: "4_03_14",
-    0x5BE04671: "4_03_15",
-    0x5BE04672: "4_03_16",
-    0x5BE046F0: "4_03_21",
-    0x5BE046F1: "4_03_22",
-    0x5BE046F2: "4_03_23",
-    0x5BE046F3: "4_03_24",
-    0x5BE046F4: "4_03_25",
-    0x5BE2D029: "SOC_G_FOLLOW",
-    0x5BEC647D: "SOC_VND1",
-    0x5BEC647E: "SOC_VND2",
-    0x5BEC647F: "SOC_VND3",
-    0x5BEC6480: "SOC_VND4",
-    0x5BEC6481: "SOC_VND5",
-    0x5BF1B99E: "1_02_GRAPPLEPUNCH",
-    0x5BF702A7: "RUSS_LIFT",
-    0x5C024326: "AS_SC_OBJCOUNT",
-    0x5C09A3A5: "DISC_03_WII",
-    0x5C0B8081: "TAG_JOCK_COMBO",
-    0x5C135A63: "N_MRWATTS",
-    0x5C14CA12: "6_03_RUSSDIED",
-    0x5C18BF53: "AS_BR_COMPLETE",
-    0x5C20172B: "GLB_001",
-    0x5C20172C: "GLB_002",
-    0x5C20172D: "GLB_003",
-    0x5C20172E: "GLB_004",
-    0x5C20172F: "GLB_005",
-    0x5C201730: "GLB_006",
-    0x5C201731: "GLB_007",
-    0x5C201732: "GLB_008",
-    0x5C201733: "GLB_009",
-    0x5C2017AD: "GLB_010",
-    0x5C2017AE: "GLB_011",
-    0x5C2017AF: "GLB_012",
-    0x5C2017B0: "GLB_013",
-    0x5C2017B1: "GLB_014",
-    0x5C2017B2: "GLB_015",
-    0x5C31EFFE: "SP_GOLDSUIT_FT",
-    0x5C3FAA3C: "BUT_HAIR",
-    0x5C41AC1C: "AS_TP_ACTION",
-    0x5C4822C3: "4-B1D.SUB0001",
-    0x5C4822C4: "4-B1D.SUB0002",
-    0x5C4822C5: "4-B1D.SUB0003",
-    0x5C4822C6: "4-B1D.SUB0004",
-    0x5C4822C7: "4-B1D.SUB0005",
-    0x5C4822C8: "4-B1D.SUB0006",
-    0x5C4822C9: "4-B1D.SUB0007",
-    0x5C4822CA: "4-B1D.SUB0008",
-    0x5C4822CB: "4-B1D.SUB0009",
-    0x5C56522A: "GOTO_PRINCIPAL",
-    0x5C59D96A: "AS_KM_AMMO",
-    0x5C625AF8: "TUT_UDBX1",
-    0x5C656E83: "5_02_RESPECT",
-    0x5C7729A2: "MGA2_SPEEDBOOST_NAME",
-    0x5C82FDE7: "SOCPEN_TITLE",
-    0x5C881377: "3_S11_VOILENCE",
-    0x5CA77BC2: "MGC2P_INFO",
-    0x5CA83AE4: "CONT_03_WII",
-    0x5CA97F3F: "TITLE1_NAME0",
-    0x5CA97F40: "TITLE1_NAME1",
-    0x5CA97F41: "TITLE1_NAME2",
-    0x5CA97F42: "TITLE1_NAME3",
-    0x5CA97F43: "TITLE1_NAME4",
-    0x5CA97F44: "TITLE1_NAME5",
-    0x5CA97F45: "TITLE1_NAME6",
-    0x5CA97F46: "TITLE1_NAME7",
-    0x5CA97F47: "TITLE1_NAME8",
-    0x5CA97F48: "TITLE1_NAME9",
-    0x5CABC6E8: "3_R08_REWARD",
-    0x5CAE1713: "AS_EB_ACTION",
-    0x5CC7F757: "5-04.SUB0001",
-    0x5CC7F758: "5-04.SUB0002",
-    0x5CC7F759: "5-04.SUB0003",
-    0x5CC7F75A: "5-04.SUB0004",
-    0x5CC7F75B: "5-04.SUB0005",
-    0x5CC7F75C: "5-04.SUB0006",
-    0x5CC7F75D: "5-04.SUB0007",
-    0x5CC7F75E: "5-04.SUB0008",
-    0x5CC7F75F: "5-04.SUB0009",
-    0x5CC7F7D9: "5-04.SUB0010",
-    0x5CC7F7DA: "5-04.SUB0011",
-    0x5CC7F7DB: "5-04.SUB0012",
-    0x5CC7F7DC: "5-04.SUB0013",
-    0x5CC7F7DD: "5-04.SUB0014",
-    0x5CC7F7DE: "5-04.SUB0015",
-    0x5CC7F7DF: "5-04.SUB0016",
-    0x5CC7F7E0: "5-04.SUB0017",
-    0x5CC7F7E1: "5-04.SUB0018",
-    0x5CC7F7E2: "5-04.SUB0019",
-    0x5CC7F85C: "5-04.SUB0020",
-    0x5CC7F85D: "5-04.SUB0021",
-    0x5CC7F85E: "5-04.SUB0022",
-    0x5CC7F85F: "5-04.SUB0023",
-    0x5CC7F860: "5-04.SUB0024",
-    0x5CC7F861: "5-04.SUB0025",
-    0x5CC7F862: "5-04.SUB0026",
-    0x5CC7F863: "5-04.SUB0027",
-    0x5CCF7B76: "TAG_AREA",
-    0x5CD6028C: "4_04_GRAVE_JOCKESCAPE",
-    0x5CE56C71: "TITLE76_NAME0",
-    0x5CE56C72: "TITLE76_NAME1",
-    0x5CE56C73: "TITLE76_NAME2",
-    0x5CE56C74: "TITLE76_NAME3",
-    0x5CE56C75: "TITLE76_NAME4",
-    0x5CE56C76: "TITLE76_NAME5",
-    0x5CE56C77: "TITLE76_NAME6",
-    0x5CE56C78: "TITLE76_NAME7",
-    0x5CE56C79: "TITLE76_NAME8",
-    0x5CE56C7A: "TITLE76_NAME9",
-    0x5CF59777: "TUT_RSPX02",
-    0x5CF59778: "TUT_RSPX03",
-    0x5CF5C233: "3_R08_DIRECT01",
-    0x5CF5C234: "3_R08_DIRECT02",
-    0x5CF5C235: "3_R08_DIRECT03",
-    0x5CF5C236: "3_R08_DIRECT04",
-    0x5CF774BB: "AS_AE_OBJECTIVE",
-    0x5CFD79BE: "3_R08_INSTRUC01",
-    0x5CFD79BF: "3_R08_INSTRUC02",
-    0x5CFD79C0: "3_R08_INSTRUC03",
-    0x5CFD79C1: "3_R08_INSTRUC04",
-    0x5CFD79C2: "3_R08_INSTRUC05",
-    0x5CFD79C3: "3_R08_INSTRUC06",
-    0x5D0D309D: "NEW_REC",
-    0x5D125635: "DIBUTTON_CAMERA",
-    0x5D15DA27: "3_XM_CANDYCANES",
-    0x5D182E96: "DIBUTTON_JOYPOV_DOWN",
-    0x5D21C671: "S_PANTS1",
-    0x5D21C673: "S_PANTS3",
-    0x5D282E72: "TM_WARN6",
-    0x5D2906D1: "N_HANDY",
-    0x5D407863: "MGGE_WASHINGTON",
-    0x5D45089D: "FIRE_WORKS",
-    0x5D4ED238: "3_09_PACKAGE",
-    0x5D5867A7: "MGGE_WEST VIRGINIA",
-    0x5D59B097: "MGGE_N_CAROLINA",
-    0x5D5A4637: "TAG_EXIT",
-    0x5D63E35A: "MGGE_IDAHO",
-    0x5D79F869: "MGPH_SCORE",
-    0x5D7F4D7C: "TITLE45_NUMNAMES",
-    0x5D844026: "MGB2_BAT_10",
-    0x5D844027: "MGB2_BAT_11",
-    0x5D844028: "MGB2_BAT_12",
-    0x5D844029: "MGB2_BAT_13",
-    0x5D85B657: "D_PGUN",
-    0x5D8C116E: "MGGE_MALAYSIA",
-    0x5D96AF2B: "BUT_RACE",
-    0x5DA89D87: "3_05_ONORTON",
-    0x5DAEB28D: "MGCA_TUT1",
-    0x5DAEB28E: "MGCA_TUT2",
-    0x5DAEB28F: "MGCA_TUT3",
-    0x5DAEB290: "MGCA_TUT4",
-    0x5DAEB291: "MGCA_TUT5",
-    0x5DB24467: "N_HENRY",
-    0x5DB41B2D: "1_03_SLINGSHOT",
-    0x5DB5095F: "FESA_CONTROLS_N",
-    0x5DB50963: "FESA_CONTROLS_R",
-    0x5DB6F5CB: "AS_FF_OBJECTIVE",
-    0x5DB9067F: "BUT_SAVE",
-    0x5DBBC4BA: "HELP2A2",
-    0x5DBBD423: "HELP2_A",
-    0x5DBDA962: "HELP9_A",
-    0x5DC02F83: "TITLE6_NUMNAMES",
-    0x5DDCC672: "AS_BH_ACTION",
-    0x5DE03C02: "AS_SW_RETURN",
-    0x5DED5D99: "CRIME_WEAPONFIRED",
-    0x5DFDEBC1: "1_11X2_TITLE",
-    0x5E02A129: "TITLE61_NAME0",
-    0x5E02A12A: "TITLE61_NAME1",
-    0x5E02A12B: "TITLE61_NAME2",
-    0x5E02A12C: "TITLE61_NAME3",
-    0x5E02A12D: "TITLE61_NAME4",
-    0x5E02A12E: "TITLE61_NAME5",
-    0x5E02A12F: "TITLE61_NAME6",
-    0x5E02A130: "TITLE61_NAME7",
-    0x5E02A131: "TITLE61_NAME8",
-    0x5E0D9110: "FE_SELECT_C",
-    0x5E0D9127: "FE_SELECT_Z",
-    0x5E128D7F: "D_TUBE",
-    0x5E172379: "AS_HT_GETBIKE",
-    0x5E24AD02: "MC2P_FOOTER",
-    0x5E27F467: "DIBUTTON_JOYPOV_LEFT",
-    0x5E28B86D: "P_BHAT1",
-    0x5E28B86E: "P_BHAT2",
-    0x5E28B86F: "P_BHAT3",
-    0x5E28B870: "P_BHAT4",
-    0x5E28B871: "P_BHAT5",
-    0x5E28B872: "P_BHAT6",
-    0x5E46CB56: "BUT_CLASS",
-    0x5E4A764C: "BUT_CLOTH",
-    0x5E754CDC: "D_WEP7",
-    0x5E754CDD: "D_WEP8",
-    0x5E754CDE: "D_WEP9",
-    0x5E78BDB5: "2_S05_OBRANCH",
-    0x5E8DF46C: "MGPH_SKULL",
-    0x5E95EB88: "P_JACKET1",
-    0x5E95EB89: "P_JACKET2",
-    0x5E95EB8A: "P_JACKET3",
-    0x5E95EB8B: "P_JACKET4",
-    0x5E95EB8C: "P_JACKET5",
-    0x5E95EB8D: "P_JACKET6",
-    0x5E97DCEA: "CRIME_BULLYINGAUTHORITY",
-    0x5E9CE28E: "1_03_TITLE",
-    0x5EA4224E: "AS_POP_JUNKY",
-    0x5EA62671: "AS_TR_OBJECTIVE",
-    0x5EADB428: "BUT_COAST",
-    0x5EB221FA: "CLT_START",
-    0x5EB437FD: "4_04_PROPTUTORIAL",
-    0x5EB8DD01: "D_YARD",
-    0x5EBBB4F8: "MGGE_INDIA",
-    0x5ECD3AA6: "FEI_WEAPONS",
-    0x5ECD41AF: "NAND_05_WII",
-    0x5ED383B2: "MGC2P_SABOTAGE_ICON",
-    0x5EDE7E2D: "MGE2_T15G01WORDS",
-    0x5EE71658: "MGCA_KILLED_TEXT",
-    0x5EE9B02A: "",
-    0x5EF75C46: "GKART_EXIT",
-    0x5EFBFD90: "1-09.SUB0001",
-    0x5EFBFD91: "1-09.SUB0002",
-    0x5EFBFD92: "1-09.SUB0003",
-    0x5EFBFD93: "1-09.SUB0004",
-    0x5EFBFD94: "1-09.SUB0005",
-    0x5EFBFD95: "1-09.SUB0006",
-    0x5EFBFD96: "1-09.SUB0007",
-    0x5EFBFD97: "1-09.SUB0008",
-    0x5EFBFD98: "1-09.SUB0009",
-    0x5EFBFE12: "1-09.SUB0010",
-    0x5EFBFE13: "1-09.SUB0011",
-    0x5EFBFE14: "1-09.SUB0012",
-    0x5EFBFE15: "1-09.SUB0013",
-    0x5EFBFE16: "1-09.SUB0014",
-    0x5EFBFE17: "1-09.SUB0015",
-    0x5EFBFE18: "1-09.SUB0016",
-    0x5EFBFE19: "1-09.SUB0017",
-    0x5EFBFE1A: "1-09.SUB0018",
-    0x5EFBFE1B: "1-09.SUB0019",
-    0x5EFBFE95: "1-09.SUB0020",
-    0x5EFBFE96: "1-09.SUB0021",
-    0x5EFBFE97: "1-09.SUB0022",
-    0x5EFBFE98: "1-09.SUB0023",
-    0x5EFBFE99: "1-09.SUB0024",
-    0x5EFBFE9A: "1-09.SUB0025",
-    0x5EFBFE9B: "1-09.SUB0026",
-    0x5EFBFE9C: "1-09.SUB0027",
-    0x5EFBFE9D: "1-09.SUB0028",
-    0x5EFBFE9E: "1-09.SUB0029",
-    0x5EFBFF18: "1-09.SUB0030",
-    0x5EFBFF19: "1-09.SUB0031",
-    0x5EFEBB61: "TUT_GIRLD1",
-    0x5F0A2137: "AS_CF_RETURN",
-    0x5F27D8D7: "RACING_TUTORIAL",
-    0x5F2EA086: "PRINCIPAL",
-    0x5F30A7B6: "TITLE29_NUMNAMES",
-    0x5F337379: "1_10_OBJ00",
-    0x5F33737A: "1_10_OBJ01",
-    0x5F33737B: "1_10_OBJ02",
-    0x5F33737C: "1_10_OBJ03",
-    0x5F33737D: "1_10_OBJ04",
-    0x5F354446: "MGPH_SPEED",
-    0x5F39D2C8: "GKART_GP10",
-    0x5F43F333: "MGGE_BRAZIL",
-    0x5F62F169: "AS_LK_COUNTER",
-    0x5F88BF20: "MGGE_ITALY",
-    0x5F8C086F: "MGMA_GETINFO",
-    0x5F8EE45D: "CWSSQ_WII",
-    0x5F936DD7: "AS_EM_GREET",
-    0x5FA2B19A: "B_SNEAKERS1",
-    0x5FA2B19B: "B_SNEAKERS2",
-    0x5FA2B19C: "B_SNEAKERS3",
-    0x5FA2B19D: "B_SNEAKERS4",
-    0x5FA2B19E: "B_SNEAKERS5",
-    0x5FA2B19F: "B_SNEAKERS6",
-    0x5FA2B1A1: "B_SNEAKERS8",
-    0x5FA2B1A2: "B_SNEAKERS9",
-    0x5FA42653: "C2_JOCKJURI",
-    0x5FA7A5FA: "USE_RAILBALANCE",
-    0x5FBFE431: "USE_URINAL",
-    0x5FC1EFB7: "MGB2_PIGEON_10",
-    0x5FC1EFB8: "MGB2_PIGEON_11",
-    0x5FC1EFB9: "MGB2_PIGEON_12",
-    0x5FC1EFBA: "MGB2_PIGEON_13",
-    0x5FC1EFBB: "MGB2_PIGEON_14",
-    0x5FC1EFBC: "MGB2_PIGEON_15",
-    0x5FC5F013: "CHAPT0MESSAGE",
-    0x5FC6400F: "STATUS_GREASERS",
-    0x5FCE8705: "W_CBOMB",
-    0x5FD55E2A: "FEO_MOUSESTEERVEH",
-    0x5FD8C4A4: "C2_ALGIE",
-    0x5FDE3339: "TITLE55_NAME10",
-    0x5FDE333A: "TITLE55_NAME11",
-    0x5FDE333B: "TITLE55_NAME12",
-    0x5FDE333C: "TITLE55_NAME13",
-    0x5FDE333D: "TITLE55_NAME14",
-    0x5FDE333E: "TITLE55_NAME15",
-    0x5FDE333F: "TITLE55_NAME16",
-    0x5FDE3340: "TITLE55_NAME17",
-    0x5FDE3341: "TITLE55_NAME18",
-    0x5FDE3342: "TITLE55_NAME19",
-    0x5FDE33BC: "TITLE55_NAME20",
-    0x5FDE33BD: "TITLE55_NAME21",
-    0x5FDE33BE: "TITLE55_NAME22",
-    0x5FDE33BF: "TITLE55_NAME23",
-    0x5FDE33C0: "TITLE55_NAME24",
-    0x5FDE33C1: "TITLE55_NAME25",
-    0x5FDE33C2: "TITLE55_NAME26",
-    0x5FDE33C3: "TITLE55_NAME27",
-    0x5FDE33C4: "TITLE55_NAME28",
-    0x5FEFE5E8: "",
-    0x6007EC01: "AS_EG_OBJ_01",
-    0x60097D1E: "1_06_TRANSTUT",
-    0x60196402: "TITLE48_NAME0",
-    0x601DF274: "W_SPUDGUN",
-    0x602E75B2: "FEM_RESTART_HEADER",
-    0x6032FE0B: "PLAYERBEG",
-    0x60370574: "USE_DUFFEL",
-    0x60506286: "1_04_CLIMBTREE",
-    0x6055C71C: "MGGE_MANITOBA",
-    0x606E3A39: "CRIME_CURFEW",
-    0x608DA207: "MGPH_FLOWERS",
-    0x6091C193: "CLT_PRISON",
-    0x609B1DAD: "FE_TOURNEY_SELECT",
-    0x60A19CC8: "CLT_OLY_DESC",
-    0x60CD12BE: "AS_TW_OBJECTIVE",
-    0x60CE8C5D: "MGPH_DEATHROBO",
-    0x60CF1A85: "STO_TICKET",
-    0x60E769DB: "TUT_REDBLIP1",
-    0x60E9F7F8: "MGSP_GREEKBOY",
-    0x60F76364: "MGS2_XSTART",
-    0x60FC0EB7: "RESET_MAPPING_CONFIRM",
-    0x610509B7: "2_B_LOWER",
-    0x610A272B: "MC_CONFIRM",
-    0x612F474E: "3_XM_PRESENTS",
-    0x613074D0: "SOC_GEN_FOLLOW",
-    0x61325E17: "1_05_MOBJ_02B",
-    0x61369778: "3_04_HEALTH_CHAD",
-    0x613698BA: "TITLE33_NAME0",
-    0x613698BB: "TITLE33_NAME1",
-    0x613698BC: "TITLE33_NAME2",
-    0x613698BD: "TITLE33_NAME3",
-    0x613698BE: "TITLE33_NAME4",
-    0x613698BF: "TITLE33_NAME5",
-    0x613698C0: "TITLE33_NAME6",
-    0x613698C1: "TITLE33_NAME7",
-    0x61387574: "3_04_HEALTH_CORN",
-    0x61450444: "3_01_ORET",
-    0x61579403: "TITLE79_NUMNAMES",
-    0x615CE438: "AS_PM_OBJECTIVE",
-    0x6163FC69: "MGB2_PERCH_10",
-    0x6163FC6A: "MGB2_PERCH_11",
-    0x6163FC6B: "MGB2_PERCH_12",
-    0x6163FC6C: "MGB2_PERCH_13",
-    0x6164B8A3: "3_01_PHOT",
-    0x616C0B83: "CONFC_WII",
-    0x61882208: "MGE2_T10G01WORDS",
-    0x6188A382: "BC_OLAD_BIKE",
-    0x6196BA7A: "C2_DROPDUNCAN",
-    0x619B0C73: "AS_SP_ENTER",
-    0x61A5A16B: "1-04.SUB0001",
-    0x61A5A16C: "1-04.SUB0002",
-    0x61A5A16D: "1-04.SUB0003",
-    0x61A5A16E: "1-04.SUB0004",
-    0x61A5A16F: "1-04.SUB0005",
-    0x61A5A170: "1-04.SUB0006",
-    0x61A5A171: "1-04.SUB0007",
-    0x61A5A172: "1-04.SUB0008",
-    0x61A5A173: "1-04.SUB0009",
-    0x61A5A1ED: "1-04.SUB0010",
-    0x61A5A1EE: "1-04.SUB0011",
-    0x61A5A1EF: "1-04.SUB0012",
-    0x61A5A1F0: "1-04.SUB0013",
-    0x61A5A1F1: "1-04.SUB0014",
-    0x61A5A1F2: "1-04.SUB0015",
-    0x61A5A1F3: "1-04.SUB0016",
-    0x61A5A1F4: "1-04.SUB0017",
-    0x61A5A1F5: "1-04.SUB0018",
-    0x61A5A1F6: "1-04.SUB0019",
-    0x61A5A270: "1-04.SUB0020",
-    0x61A5A271: "1-04.SUB0021",
-    0x61A5A272: "1-04.SUB0022",
-    0x61A5A273: "1-04.SUB0023",
-    0x61A5A274: "1-04.SUB0024",
-    0x61A5A275: "1-04.SUB0025",
-    0x61A5A276: "1-04.SUB0026",
-    0x61A5A277: "1-04.SUB0027",
-    0x61A5A278: "1-04.SUB0028",
-    0x61A5A279: "1-04.SUB0029",
-    0x61A5A2F3: "1-04.SUB0030",
-    0x61A5A2F4: "1-04.SUB0031",
-    0x61A5A2F5: "1-04.SUB0032",
-    0x61A5A2F6: "1-04.SUB0033",
-    0x61A5A2F7: "1-04.SUB0034",
-    0x61A5A2F8: "1-04.SUB0035",
-    0x61A5A2F9: "1-04.SUB0036",
-    0x61A5A2FA: "1-04.SUB0037",
-    0x61A5A2FB: "1-04.SUB0038",
-    0x61A5A2FC: "1-04.SUB0039",
-    0x61A5A376: "1-04.SUB0040",
-    0x61A5A377: "1-04.SUB0041",
-    0x61A5A378: "1-04.SUB0042",
-    0x61AA2C19: "TUT_NEWX1",
-    0x61AAB177: "MGSG_NEGNUM",
-    0x61B72E16: "AS_SC_COUNTER",
-    0x61BF02F5: "BARB_STYLE",
-    0x61D0BF63: "GKART_PBTIME",
-    0x61DC6CC1: "CLASS_EXIT",
-    0x61DECC7F: "MGGE_CALIFORNIA",
-    0x61E42C9D: "USE_LOCKERPICK",
-    0x61ECB5B2: "AS_LC_OBJECTIVE",
-    0x61EFBE0D: "COASTER_01",
-    0x61EFCD85: "COASTER_NO",
-    0x61F8B485: "CLASS_FAIL",
-    0x61FB6953: "TITLE42_NUMNAMES",
-    0x6206F9E1: "2_S06_WARN",
-    0x620D7801: "S_WRISTBAND1",
-    0x620D7802: "S_WRISTBAND2",
-    0x620D7803: "S_WRISTBAND3",
-    0x620D7804: "S_WRISTBAND4",
-    0x620D7805: "S_WRISTBAND5",
-    0x620D7806: "S_WRISTBAND6",
-    0x6221DDFB: "TITLE2_NAME10",
-    0x6221DDFC: "TITLE2_NAME11",
-    0x6221DDFD: "TITLE2_NAME12",
-    0x6221DDFE: "TITLE2_NAME13",
-    0x6221DDFF: "TITLE2_NAME14",
-    0x622F81B4: "3_05_LAUND",
-    0x623C4B5A: "TITLE3_NUMNAMES",
-    0x624C6A80: "4_06_CD01",
-    0x624C6A81: "4_06_CD02",
-    0x624C6A82: "4_06_CD03",
-    0x624C6A83: "4_06_CD04",
-    0x624C6A84: "4_06_CD05",
-    0x624C6A85: "4_06_CD06",
-    0x624C6A86: "4_06_CD07",
-    0x624FED88: "SOC_N_GREET",
-    0x6256ED94: "MGPH_LAUGH",
-    0x62575B14: "MGPH_FOOTER",
-    0x626B5BE3: "TUT_SKATE01",
-    0x626B5BE4: "TUT_SKATE02",
-    0x626C76DA: "5_G5_ZOEUNLCK",
-    0x62759922: "MGGE_MYANMAR",
-    0x629E4E60: "SOC_GEN_NOD",
-    0x62AA03F3: "5_04_TITLE",
-    0x62AEE0FB: "MAP_SAVES",
-    0x62B8EBE4: "TUT_NMIS1",
-    0x62BB35F9: "2_S05_OITEMS2",
-    0x62BDFADE: "GIRLS_DORM",
-    0x62C11CD6: "MONEY_STR",
-    0x62CE315B: "CAM_BUS_CLS",
-    0x62CEA5F5: "CHEM_PLANT",
-    0x62D294D9: "1_04_HFTREE",
-    0x62D5DBD2: "2-B.SUB0001",
-    0x62D5DBD3: "2-B.SUB0002",
-    0x62D5DBD4: "2-B.SUB0003",
-    0x62D5DBD5: "2-B.SUB0004",
-    0x62D5DBD6: "2-B.SUB0005",
-    0x62D5DBD7: "2-B.SUB0006",
-    0x62D5DBD8: "2-B.SUB0007",
-    0x62D5DBD9: "2-B.SUB0008",
-    0x62D5DBDA: "2-B.SUB0009",
-    0x62D5DC54: "2-B.SUB0010",
-    0x62D5DC55: "2-B.SUB0011",
-    0x62D5DC56: "2-B.SUB0012",
-    0x62D5DC57: "2-B.SUB0013",
-    0x62D5DC58: "2-B.SUB0014",
-    0x62D5DC59: "2-B.SUB0015",
-    0x62D5DC5A: "2-B.SUB0016",
-    0x62D5DC5B: "2-B.SUB0017",
-    0x62D5DC5C: "2-B.SUB0018",
-    0x62D5DC5D: "2-B.SUB0019",
-    0x62D5DCD7: "2-B.SUB0020",
-    0x62EBD112: "DESC_VANDAL_01",
-    0x62F100A0: "MGPH_RATSTICK",
-    0x63011FAF: "TUT_NOW01",
-    0x630E93B4: "AS_LB_RETURN",
-    0x63127581: "SP_UNDERWEAR",
-    0x63241F54: "3_R09_UNLOCK",
-    0x6326AFC3: "2_S05_EDNA_ITEMS",
-    0x632F2491: "MGSP_BTUT",
-    0x633D3E21: "AS_RO_OBJCOUNT",
-    0x633FA425: "MG_PHOTO",
-    0x63436148: "2-S05.SUB0001",
-    0x63436149: "2-S05.SUB0002",
-    0x6343614A: "2-S05.SUB0003",
-    0x6343614B: "2-S05.SUB0004",
-    0x6343614C: "2-S05.SUB0005",
-    0x6343614D: "2-S05.SUB0006",
-    0x6343614E: "2-S05.SUB0007",
-    0x6343614F: "2-S05.SUB0008",
-    0x63436150: "2-S05.SUB0009",
-    0x634361CA: "2-S05.SUB0010",
-    0x634361CB: "2-S05.SUB0011",
-    0x634361CC: "2-S05.SUB0012",
-    0x634361CD: "2-S05.SUB0013",
-    0x634361CE: "2-S05.SUB0014",
-    0x634361CF: "2-S05.SUB0015",
-    0x634361D0: "2-S05.SUB0016",
-    0x634361D1: "2-S05.SUB0017",
-    0x634361D2: "2-S05.SUB0018",
-    0x634361D3: "2-S05.SUB0019",
-    0x6343624D: "2-S05.SUB0020",
-    0x6343624E: "2-S05.SUB0021",
-    0x6343624F: "2-S05.SUB0022",
-    0x63456595: "MGGE_INDONESIA",
-    0x634FC1B8: "CLASS_PASS",
-    0x636C39A2: "AS_AT_OBJECTIVE",
-    0x63817361: "4_06_LEFT",
-    0x6382E3BB: "AS_TRY_AGAIN",
-    0x63894D98: "RETMENU_WII",
-    0x638A44F9: "UP_ENGLISH1",
-    0x638A44FA: "UP_ENGLISH2",
-    0x638A44FB: "UP_ENGLISH3",
-    0x638A44FC: "UP_ENGLISH4",
-    0x638A44FD: "UP_ENGLISH5",
-    0x63946316: "MGBI_PIG_10",
-    0x63946317: "MGBI_PIG_11",
-    0x63946318: "MGBI_PIG_12",
-    0x63946319: "MGBI_PIG_13",
-    0x6394631A: "MGBI_PIG_14",
-    0x6394631B: "MGBI_PIG_15",
-    0x6394631C: "MGBI_PIG_16",
-    0x6394631D: "MGBI_PIG_17",
-    0x6394631E: "MGBI_PIG_18",
-    0x6394631F: "MGBI_PIG_19",
-    0x63946399: "MGBI_PIG_20",
-    0x6394639A: "MGBI_PIG_21",
-    0x6394639B: "MGBI_PIG_22",
-    0x6394639C: "MGBI_PIG_23",
-    0x63952838: "2_09_OBJECTIVE",
-    0x63971362: "MGSP_EXIT",
-    0x639D309A: "MAP_SHOPS",
-    0x639DC3EE: "DPADL_VEHICLE",
-    0x63A6F256: "TUT_NTAR1",
-    0x63ACC38D: "TITLE26_NUMNAMES",
-    0x63AD1EE8: "3_B_SEC_OBJ",
-    0x63BA9906: "MGCE_T3GROUPS",
-    0x63CD1320: "MGM2_T4GROUPS",
-    0x63D272B8: "6_B_FAIL_01",
-    0x63D272B9: "6_B_FAIL_02",
-    0x63D272BA: "6_B_FAIL_03",
-    0x63DF1AE3: "3_02_GORDKO",
-    0x63E57177: "SP_COLUM_FT",
-    0x63E66132: "3_05_ODIARY",
-    0x63E74B02: "",
-    0x63EEC679: "RARC_TITLE",
-    0x63EF4115: "MGGE_STKITTS",
-    0x63F0A486: "SOC_F_GIFT_HAPPY",
-    0x63FB503B: "MGMA_T2GROUPS",
-    0x640528B5: "N_ANGIE",
-    0x6414B5CC: "2_08_GETBYBIF",
-    0x641DB092: "MGSP_INST",
-    0x641EBF19: "AS_TC_FAIL",
-    0x64268A7C: "TITLE6_NAME0",
-    0x64268A7D: "TITLE6_NAME1",
-    0x64268A7E: "TITLE6_NAME2",
-    0x64268A7F: "TITLE6_NAME3",
-    0x642AC08A: "SP_BOXING_L",
-    0x642AC092: "SP_BOXING_T",
-    0x642D6A83: "SQ_VEHICLE",
-    0x642F6184: "3_01D_WARNING_01",
-    0x642F6185: "3_01D_WARNING_02",
-    0x642F6186: "3_01D_WARNING_03",
-    0x642F6187: "3_01D_WARNING_04",
-    0x643E97AD: "AS_EP_ACTION",
-    0x6450C496: "2_06_RESPECT",
-    0x645BCE43: "EXIT_MISSION",
-    0x6460F462: "MGSP_KICK",
-    0x646649E7: "MGPH_SWORDBIN",
-    0x64666DD5: "MGGE_MOZAMBIQUE",
-    0x6466AF49: "INV_MAX_CAP",
-    0x646D21B1: "AS_ES_COMPLETE",
-    0x6470B5E1: "MGPH_BIKEWHEEL",
-    0x647D89F8: "TUT_CARCX1",
-    0x647F4233: "AS_PM_FAIL",
-    0x6487B1B6: "RANALOG_BIKE",
-    0x6490F7C8: "MGG2_CLASSINFO",
-    0x649B4A1C: "B_BALD",
-    0x64A08E10: "B_BUZZ",
-    0x64A34559: "4_04_MANUALCTRL",
-    0x64A4E058: "BUT_RECRD",
-    0x64B34D6A: "2-08.SUB0001",
-    0x64B34D6B: "2-08.SUB0002",
-    0x64B34D6C: "2-08.SUB0003",
-    0x64B34D6D: "2-08.SUB0004",
-    0x64B34D6E: "2-08.SUB0005",
-    0x64B34D6F: "2-08.SUB0006",
-    0x64B34D70: "2-08.SUB0007",
-    0x64B34D71: "2-08.SUB0008",
-    0x64B34D72: "2-08.SUB0009",
-    0x64B34DEC: "2-08.SUB0010",
-    0x64B34DED: "2-08.SUB0011",
-    0x64B34DEE: "2-08.SUB0012",
-    0x64B34DEF: "2-08.SUB0013",
-    0x64B34DF0: "2-08.SUB0014",
-    0x64B34DF1: "2-08.SUB0015",
-    0x64B34DF2: "2-08.SUB0016",
-    0x64B34DF3: "2-08.SUB0017",
-    0x64B34DF4: "2-08.SUB0018",
-    0x64B34DF5: "2-08.SUB0019",
-    0x64B34E6F: "2-08.SUB0020",
-    0x64B34E70: "2-08.SUB0021",
-    0x64B34E71: "2-08.SUB0022",
-    0x64B34E72: "2-08.SUB0023",
-    0x64B34E73: "2-08.SUB0024",
-    0x64B34E74: "2-08.SUB0025",
-    0x64B96310: "N_GREGORY",
-    0x64C42AA9: "S_HELP_MALE_01",
-    0x64ED6475: "GOTO_RACESCHOOL",
-    0x64F0A134: "1_02C_OBJ01",
-    0x64F32359: "FE_MULTI_FE",
-    0x64F5E3F0: "MGPH_KNEE_POSTER",
-    0x64FB94A2: "D_BBALL",
-    0x64FBC9EF: "DBH_TEXT1",
-    0x64FC28BA: "BMXTRACK",
-    0x650254F1: "MIF_BET01",
-    0x650254F2: "MIF_BET02",
-    0x650254F3: "MIF_BET03",
-    0x650254F4: "MIF_BET04",
-    0x6503E96A: "1_07_OBJECTIVE1",
-    0x6503E96B: "1_07_OBJECTIVE2",
-    0x6503E96C: "1_07_OBJECTIVE3",
-    0x6503E96D: "1_07_OBJECTIVE4",
-    0x65088C03: "TUT_DPAD1A",
-    0x65088C86: "TUT_DPAD2A",
-    0x650FFED1: "X_VEHICLE",
-    0x65127C73: "RANALOG_FOOT",
-    0x6514F082: "6_03_OBJLAST",
-    0x65347B99: "TITLE60_NAME100",
-    0x65347B9A: "TITLE60_NAME101",
-    0x65347B9B: "TITLE60_NAME102",
-    0x65347B9C: "TITLE60_NAME103",
-    0x65347B9D: "TITLE60_NAME104",
-    0x65347B9E: "TITLE60_NAME105",
-    0x65347B9F: "TITLE60_NAME106",
-    0x65347BA0: "TITLE60_NAME107",
-    0x65347BA1: "TITLE60_NAME108",
-    0x65347BA2: "TITLE60_NAME109",
-    0x65347C1C: "TITLE60_NAME110",
-    0x65347C1D: "TITLE60_NAME111",
-    0x65347C1E: "TITLE60_NAME112",
-    0x65347C1F: "TITLE60_NAME113",
-    0x65347C20: "TITLE60_NAME114",
-    0x65347C21: "TITLE60_NAME115",
-    0x65347C22: "TITLE60_NAME116",
-    0x65347C23: "TITLE60_NAME117",
-    0x65347C24: "TITLE60_NAME118",
-    0x65347C25: "TITLE60_NAME119",
-    0x65347C9F: "TITLE60_NAME120",
-    0x65347CA0: "TITLE60_NAME121",
-    0x65347CA1: "TITLE60_NAME122",
-    0x65347CA2: "TITLE60_NAME123",
-    0x65347CA3: "TITLE60_NAME124",
-    0x65347CA4: "TITLE60_NAME125",
-    0x65347CA5: "TITLE60_NAME126",
-    0x65347CA6: "TITLE60_NAME127",
-    0x65347CA7: "TITLE60_NAME128",
-    0x65347CA8: "TITLE60_NAME129",
-    0x65347D22: "TITLE60_NAME130",
-    0x65347D23: "TITLE60_NAME131",
-    0x65347D24: "TITLE60_NAME132",
-    0x65347D25: "TITLE60_NAME133",
-    0x65347D26: "TITLE60_NAME134",
-    0x65347D27: "TITLE60_NAME135",
-    0x65347D28: "TITLE60_NAME136",
-    0x65347D29: "TITLE60_NAME137",
-    0x65347D2A: "TITLE60_NAME138",
-    0x65347D2B: "TITLE60_NAME139",
-    0x65347DA5: "TITLE60_NAME140",
-    0x65347DA6: "TITLE60_NAME141",
-    0x65347DA7: "TITLE60_NAME142",
-    0x65347DA8: "TITLE60_NAME143",
-    0x65347DA9: "TITLE60_NAME144",
-    0x65347DAA: "TITLE60_NAME145",
-    0x65347DAB: "TITLE60_NAME146",
-    0x65347DAC: "TITLE60_NAME147",
-    0x65347DAD: "TITLE60_NAME148",
-    0x65347DAE: "TITLE60_NAME149",
-    0x65347E28: "TITLE60_NAME150",
-    0x65347E29: "TITLE60_NAME151",
-    0x65347E2A: "TITLE60_NAME152",
-    0x65347E2B: "TITLE60_NAME153",
-    0x65347E2C: "TITLE60_NAME154",
-    0x65347E2D: "TITLE60_NAME155",
-    0x65347E2E: "TITLE60_NAME156",
-    0x65347E2F: "TITLE60_NAME157",
-    0x65347E30: "TITLE60_NAME158",
-    0x65347E31: "TITLE60_NAME159",
-    0x65347EAB: "TITLE60_NAME160",
-    0x65347EAC: "TITLE60_NAME161",
-    0x65347EAD: "TITLE60_NAME162",
-    0x65347EAE: "TITLE60_NAME163",
-    0x65347EAF: "TITLE60_NAME164",
-    0x65347EB0: "TITLE60_NAME165",
-    0x65347EB1: "TITLE60_NAME166",
-    0x65347EB2: "TITLE60_NAME167",
-    0x65347EB3: "TITLE60_NAME168",
-    0x65347EB4: "TITLE60_NAME169",
-    0x65347F2E: "TITLE60_NAME170",
-    0x65347F2F: "TITLE60_NAME171",
-    0x65347F30: "TITLE60_NAME172",
-    0x65347F31: "TITLE60_NAME173",
-    0x6539C58F: "MGGE_TAIWAN",
-    0x653D2DBF: "FE_RESTART",
-    0x65485708: "AS_EA_ACTION",
-    0x654B7B65: "CLT_L_ARM",
-    0x6551544E: "FE_WARN_RELOAD",
-    0x655845D7: "AS_SK_COMPLETE",
-    0x655FE6ED: "TUT_PSLIDE",
-    0x65611E21: "DBH_THROW",
-    0x657D7EC7: "CRIME_PRANK",
-    0x657FAC66: "TITLE66_NAME0",
-    0x657FAC67: "TITLE66_NAME1",
-    0x657FAC68: "TITLE66_NAME2",
-    0x657FAC69: "TITLE66_NAME3",
-    0x657FAC6A: "TITLE66_NAME4",
-    0x657FAC6B: "TITLE66_NAME5",
-    0x657FAC6C: "TITLE66_NAME6",
-    0x657FAC6D: "TITLE66_NAME7",
-    0x657FAC6E: "TITLE66_NAME8",
-    0x657FAC6F: "TITLE66_NAME9",
-    0x65818411: "AS_IP_AMMO",
-    0x6583F033: "DBH_TITLE",
-    0x6595B3ED: "MGSP_TIME",
-    0x6599664F: "AS_SL_ACTION",
-    0x6599FBC4: "TUT_REDX01",
-    0x65A6B728: "S_SWEATER1",
-    0x65A6B729: "S_SWEATER2",
-    0x65A6B72C: "S_SWEATER5",
-    0x65A78CED: "RPG_CHL",
-    0x65A7CE6E: "RPG_DEM",
-    0x65A8999E: "RPG_GIV",
-    0x65AABCD2: "AS_PW_OBJECTIVE",
-    0x65ABC39B: "RPG_STF",
-    0x65ABC52C: "RPG_SWN",
-    0x65AFBF6E: "C6_FAIL",
-    0x65BC0666: "R_PANTS1",
-    0x65BC0667: "R_PANTS2",
-    0x65BC0668: "R_PANTS3",
-    0x65BC0669: "R_PANTS4",
-    0x65BC066A: "R_PANTS5",
-    0x65BD104F: "STO_SAVE_OFIT",
-    0x65BE6DB8: "MGA2_INSTRUCTIONS_POWERUPS_HEADING",
-    0x65C3FFDC: "AS_SI_UNLOCK",
-    0x65D3AFDA: "TITLE76_NUMNAMES",
-    0x65D72B64: "RACE_NOLAP",
-    0x65D83EB5: "RACE_NOPOS",
-    0x65EF1CD4: "D_BINOC",
-    0x65F9C726: "N_BIF",
-    0x65F9CA34: "N_BOB",
-    0x65FA4928: "N_DAN",
-    0x65FB554A: "N_HAL",
-    0x65FB9855: "N_IAN",
-    0x65FCA483: "N_MAX",
-    0x65FDF3AC: "N_RAT",
-    0x65FDF3B1: "N_RAY",
-    0x65FE79AE: "N_TAD",
-    0x65FE7BBA: "N_TED",
-    0x65FE80E1: "N_TOM",
-    0x65FEAEF0: "AS_F4_DROPPED",
-    0x6600130F: "N_ZOE",
-    0x660A3C93: "2_01_OBACKEDNA",
-    0x660ADEB6: "AS_CB_OBJECTIVE",
-    0x6616EAF3: "AS_FF_GREET",
-    0x6619EDCB: "1_08_TITLE",
-    0x661A0E2E: "C6_INFO",
-    0x661B3899: "2_R03_OBJ01",
-    0x661B389A: "2_R03_OBJ02",
-    0x661B389B: "2_R03_OBJ03",
-    0x661B389C: "2_R03_OBJ04",
-    0x662A5E64: "AS_FA_COMPLETE",
-    0x662C48C9: "MGGE_MARYLAND",
-    0x6633AB27: "USE_FUNBOOKOFF",
-    0x6637871E: "MGBI_CLASSINFOEXIT",
-    0x664413AE: "3_05_GETSLEDGE",
-    0x6644D1C8: "RARC_NO",
-    0x665F9775: "TUT_GBIN1",
-    0x666655A6: "MD_SIGNIN",
-    0x66770667: "AS_BG_ACTION",
-    0x668A51BE: "C3_01_03",
-    0x668A52C5: "C3_01_24",
-    0x668A52C6: "C3_01_25",
-    0x668A52C7: "C3_01_26",
-    0x668A52C8: "C3_01_27",
-    0x668A52C9: "C3_01_28",
-    0x668A52CA: "C3_01_29",
-    0x668A5344: "C3_01_30",
-    0x668A5345: "C3_01_31",
-    0x668F7B04: "P_FAUHAWK_01",
-    0x668F7B05: "P_FAUHAWK_02",
-    0x668F7B06: "P_FAUHAWK_03",
-    0x668F7B07: "P_FAUHAWK_04",
-    0x669AA1D1: "AS_CT_RETURN",
-    0x669CE11E: "TITLE51_NAME0",
-    0x669CE11F: "TITLE51_NAME1",
-    0x66B22B71: "HOUSEOFMIRRORS",
-    0x66B30C34: "BACKC_WII",
-    0x66B58ADF: "2_GN_MOBJ_01",
-    0x66B86731: "TITLE0_NUMNAMES",
-    0x66DB8743: "FEDS_LOW",
-    0x66DBC51B: "FEDS_MED",
-    0x66DC789C: "TUT_FBEL01",
-    0x66DD0C80: "SOC_GEN_REACTCOWER",
-    0x66F11219: "GRAF_FAIL",
-    0x6706CCA1: "C6_PASS",
-    0x670C54E7: "MGGE_WYOMING",
-    0x6713F038: "FE_BULLY_CREST_FE",
-    0x67261FCA: "2_04_TITLE",
-    0x673D67F8: "SP_NERD_H",
-    0x673D67FC: "SP_NERD_L",
-    0x673D6804: "SP_NERD_T",
-    0x673DD180: "4_S12_MAINOBJ",
-    0x673F38D6: "TUT_TAKETHEBUS",
-    0x674166E8: "B_CREWCUT",
-    0x6757B001: "TPM_EXITTOURNEY_HEAD",
-    0x675CF145: "2-03.SUB0001",
-    0x675CF146: "2-03.SUB0002",
-    0x675CF147: "2-03.SUB0003",
-    0x675CF148: "2-03.SUB0004",
-    0x675CF149: "2-03.SUB0005",
-    0x675CF14A: "2-03.SUB0006",
-    0x675CF14B: "2-03.SUB0007",
-    0x675CF14C: "2-03.SUB0008",
-    0x675CF14D: "2-03.SUB0009",
-    0x675CF1C7: "2-03.SUB0010",
-    0x675CF1C8: "2-03.SUB0011",
-    0x675CF1C9: "2-03.SUB0012",
-    0x675CF1CA: "2-03.SUB0013",
-    0x675CF1CB: "2-03.SUB0014",
-    0x675CF1CC: "2-03.SUB0015",
-    0x675CF1CD: "2-03.SUB0016",
-    0x675CF1CE: "2-03.SUB0017",
-    0x675CF1CF: "2-03.SUB0018",
-    0x675CF1D0: "2-03.SUB0019",
-    0x675CF24A: "2-03.SUB0020",
-    0x675CF24B: "2-03.SUB0021",
-    0x675CF24C: "2-03.SUB0022",
-    0x676B780B: "FEDL_WR",
-    0x6773FDED: "AS_FI_FAIL",
-    0x6788F400: "MGM2_GETINFO",
-    0x6792F361: "TUT_GKD01",
-    0x679AD23E: "RESPECT",
-    0x67A0E2DD: "CR_BIKE",
-    0x67A2A601: "GETUP",
-    0x67A77FA2: "C5_3_01",
-    0x67A77FA3: "C5_3_02",
-    0x67A77FA4: "C5_3_03",
-    0x67A77FA5: "C5_3_04",
-    0x67A77FA6: "C5_3_05",
-    0x67A77FA7: "C5_3_06",
-    0x67A77FA8: "C5_3_07",
-    0x67A77FA9: "C5_3_08",
-    0x67ACE91F: "N_MRMATTHEWS",
-    0x67AE93DE: "MGGE_ROMANIA",
-    0x67C7AA62: "CLT_OUTFIT1",
-    0x67C7AA63: "CLT_OUTFIT2",
-    0x67C7AA64: "CLT_OUTFIT3",
-    0x67C7AA65: "CLT_OUTFIT4",
-    0x67D2BB3E: "AW_BOTH",
-    0x67E40A9D: "FE_TOURNAMENT_FE",
-    0x67EB327F: "RACING_W_GEN",
-    0x67FAF730: "CHAPT1SUC",
-    0x680926DC: "4_G4_FAILLEFT",
-    0x681F1672: "TUT_GOOF1",
-    0x68230433: "RESTART",
-    0x6827FE6F: "N_MRDOOLIN",
-    0x6828DF64: "TITLE23_NUMNAMES",
-    0x682BAD9A: "CR_FOOT",
-    0x6831CB03: "AS_CG_OBJECTIVE",
-    0x683306D2: "HEAL_100",
-    0x68338CE4: "HEAL_300",
-    0x683D0AEC: "FUN_MTR_CLOSE",
-    0x68402952: "4_S12_TITLE",
-    0x6845CABC: "BUT_DBX",
-    0x68481F4C: "GRAF_PASS",
-    0x6849BD59: "BUT_SLP",
-    0x684A2266: "MGCE_T2G01WORDS",
-    0x684BCE57: "2_S04_C01B",
-    0x684BCEDA: "2_S04_C02B",
-    0x684BCF5D: "2_S04_C03B",
-    0x684BCFE0: "2_S04_C04B",
-    0x684BD063: "2_S04_C05B",
-    0x68558C6E: "1_G1_DIARY_BACK",
-    0x68588422: "GKART_INTRO_1",
-    0x68588423: "GKART_INTRO_2",
-    0x68588424: "GKART_INTRO_3",
-    0x68588425: "GKART_INTRO_4",
-    0x68588426: "GKART_INTRO_5",
-    0x685F66D4: "GIFT_CRSQUID",
-    0x68825BEF: "TUT_GRAT1",
-    0x6884607F: "TPM_SUDDENDEATH",
-    0x68853C4C: "TUT_GRLR1",
-    0x6886BC81: "1_07_RESPECTM",
-    0x6886BC84: "1_07_RESPECTP",
-    0x688B7285: "AS_EB_OBJCOUNT",
-    0x688F5653: "P_GRAF_T1_01",
-    0x688F5654: "P_GRAF_T1_02",
-    0x68AC43D2: "GOKART2",
-    0x68B1A3EE: "P_GRAF_T2_01",
-    0x68B1A3EF: "P_GRAF_T2_02",
-    0x68B3A3F7: "TITLE38_NAME0",
-    0x68B3A3F8: "TITLE38_NAME1",
-    0x68B3A3F9: "TITLE38_NAME2",
-    0x68BC58E4: "SOC_GEN_STOPHAND",
-    0x68C2A8AF: "COASTER",
-    0x68C57AB0: "FE_SELECT",
-    0x68D262A6: "GNAME",
-    0x68D3F189: "P_GRAF_T3_01",
-    0x68D3F18A: "P_GRAF_T3_02",
-    0x68D87C6F: "2_S05_ODRUG",
-    0x68E93D88: "AS_EP_COMPLETE",
-    0x68EEDAE6: "4_05_SKIP",
-    0x68F14C13: "AS_HH_OBJECTIVE",
-    0x68F28E1C: "ITEM_GNOME",
-    0x68F4FB96: "W_SSLING",
-    0x68F9F7CA: "2_06_BIKE_FAR_ENOUGH",
-    0x68FAF6C0: "AS_PL_FAIL",
-    0x6932BEEE: "4_S12_SEXYDRESS",
-    0x6935ED6C: "TITLE41_NAME10",
-    0x6935ED6D: "TITLE41_NAME11",
-    0x6935ED6E: "TITLE41_NAME12",
-    0x6935ED6F: "TITLE41_NAME13",
-    0x6935ED70: "TITLE41_NAME14",
-    0x6935ED71: "TITLE41_NAME15",
-    0x6935ED72: "TITLE41_NAME16",
-    0x6935ED73: "TITLE41_NAME17",
-    0x6935ED74: "TITLE41_NAME18",
-    0x6935ED75: "TITLE41_NAME19",
-    0x6935EDEF: "TITLE41_NAME20",
-    0x6935EDF0: "TITLE41_NAME21",
-    0x6935EDF1: "TITLE41_NAME22",
-    0x6935EDF2: "TITLE41_NAME23",
-    0x6935EDF3: "TITLE41_NAME24",
-    0x6935EDF4: "TITLE41_NAME25",
-    0x6935EDF5: "TITLE41_NAME26",
-    0x6935EDF6: "TITLE41_NAME27",
-    0x6935EDF7: "TITLE41_NAME28",
-    0x6935EDF8: "TITLE41_NAME29",
-    0x6935EE72: "TITLE41_NAME30",
-    0x6935EE73: "TITLE41_NAME31",
-    0x6935EE74: "TITLE41_NAME32",
-    0x6935EE75: "TITLE41_NAME33",
-    0x6935EE76: "TITLE41_NAME34",
-    0x6935EE77: "TITLE41_NAME35",
-    0x6935EE78: "TITLE41_NAME36",
-    0x6935EE79: "TITLE41_NAME37",
-    0x6935EE7A: "TITLE41_NAME38",
-    0x6935EE7B: "TITLE41_NAME39",
-    0x6935EEF5: "TITLE41_NAME40",
-    0x6935EEF6: "TITLE41_NAME41",
-    0x6935EEF7: "TITLE41_NAME42",
-    0x6935EEF8: "TITLE41_NAME43",
-    0x6935EEF9: "TITLE41_NAME44",
-    0x6935EEFA: "TITLE41_NAME45",
-    0x6935EEFB: "TITLE41_NAME46",
-    0x6935EEFC: "TITLE41_NAME47",
-    0x6935EEFD: "TITLE41_NAME48",
-    0x6935EEFE: "TITLE41_NAME49",
-    0x6935EF78: "TITLE41_NAME50",
-    0x6935EF79: "TITLE41_NAME51",
-    0x6935EF7A: "TITLE41_NAME52",
-    0x6935EF7B: "TITLE41_NAME53",
-    0x6935EF7C: "TITLE41_NAME54",
-    0x6935EF7D: "TITLE41_NAME55",
-    0x6935EF7E: "TITLE41_NAME56",
-    0x6935EF7F: "TITLE41_NAME57",
-    0x6935EF80: "TITLE41_NAME58",
-    0x6935EF81: "TITLE41_NAME59",
-    0x6935EFFB: "TITLE41_NAME60",
-    0x6935EFFC: "TITLE41_NAME61",
-    0x6935EFFD: "TITLE41_NAME62",
-    0x6935EFFE: "TITLE41_NAME63",
-    0x6935EFFF: "TITLE41_NAME64",
-    0x6935F000: "TITLE41_NAME65",
-    0x6935F001: "TITLE41_NAME66",
-    0x6935F002: "TITLE41_NAME67",
-    0x6935F003: "TITLE41_NAME68",
-    0x6935F004: "TITLE41_NAME69",
-    0x6935F07E: "TITLE41_NAME70",
-    0x6935F07F: "TITLE41_NAME71",
-    0x6935F080: "TITLE41_NAME72",
-    0x6935F081: "TITLE41_NAME73",
-    0x6935F082: "TITLE41_NAME74",
-    0x6935F083: "TITLE41_NAME75",
-    0x6935F084: "TITLE41_NAME76",
-    0x6935F085: "TITLE41_NAME77",
-    0x6935F086: "TITLE41_NAME78",
-    0x6935F087: "TITLE41_NAME79",
-    0x6935F101: "TITLE41_NAME80",
-    0x6935F102: "TITLE41_NAME81",
-    0x6935F103: "TITLE41_NAME82",
-    0x6935F104: "TITLE41_NAME83",
-    0x6935F105: "TITLE41_NAME84",
-    0x6935F106: "TITLE41_NAME85",
-    0x6935F107: "TITLE41_NAME86",
-    0x6935F108: "TITLE41_NAME87",
-    0x6935F109: "TITLE41_NAME88",
-    0x6935F10A: "TITLE41_NAME89",
-    0x6935F184: "TITLE41_NAME90",
-    0x6935F185: "TITLE41_NAME91",
-    0x6935F186: "TITLE41_NAME92",
-    0x6935F187: "TITLE41_NAME93",
-    0x6935F188: "TITLE41_NAME94",
-    0x6935F189: "TITLE41_NAME95",
-    0x6935F18A: "TITLE41_NAME96",
-    0x6935F18B: "TITLE41_NAME97",
-    0x6935F18C: "TITLE41_NAME98",
-    0x6935F18D: "TITLE41_NAME99",
-    0x693E937F: "2_S05_OGODT",
-    0x694FF5D5: "BUTTON_OPENDOOR",
-    0x69594375: "AS_MM_FINALPACK",
-    0x695A185A: "CLT_80ROCKER",
-    0x695CA12D: "GREET",
-    0x695CE43F: "MGPH_EXIT",
-    0x695D69C2: "MGA2_INSTRUCTIONS_SPEEDBOOST_DESC",
-    0x696FA32A: "MGGE_QATAR",
-    0x69757791: "4_05_WARN",
-    0x697B4965: "MGPH_FISH",
-    0x697DA2A9: "MGPH_FROG",
-    0x698DDF6A: "BOXING_INST",
-    0x698FA192: "2_02_FAIL_01",
-    0x698FA193: "2_02_FAIL_02",
-    0x6993AEE5: "MGCA_INSTRUCTIONS_POWERUPS_HEADING",
-    0x6997C806: "N_PARIS",
-    0x69984DD3: "DBH_DEFENSE",
-    0x699A3E22: "N_MRSULLIVAN",
-    0x699D0BE2: "3_01D_FAIL_01",
-    0x699D0BE3: "3_01D_FAIL_02",
-    0x699D0BE4: "3_01D_FAIL_03",
-    0x699D0BE5: "3_01D_FAIL_04",
-    0x69A1E42E: "FIGHTING",
-    0x69AC7C4E: "MGBI_PERCH_10",
-    0x69AC7C4F: "MGBI_PERCH_11",
-    0x69AC7C50: "MGBI_PERCH_12",
-    0x69AC7C51: "MGBI_PERCH_13",
-    0x69AC7C52: "MGBI_PERCH_14",
-    0x69AE4A65: "MGPH_WHITERAT",
-    0x69B336AA: "BUTTON_OPENGATE",
-    0x69B5502C: "CRIME_GIRLSDORM",
-    0x69BBB2A5: "MGPH_GAMEINFO",
-    0x69BDC9C0: "MGPH_HAND",
-    0x69BECF3D: "MGPH_HEAD",
-    0x69D0440A: "S_APOL_HIGH_AUTH_01",
-    0x69D0D8AF: "TITLE23_NAME0",
-    0x69D461AE: "AS_SH_COMPLETE",
-    0x69D99B81: "BUTTON_DPADD_D",
-    0x69D99B95: "BUTTON_DPADD_X",
-    0x69DBB3C9: "BUTTON_DPADL_D",
-    0x69DBB3DD: "BUTTON_DPADL_X",
-    0x69DD45FF: "BUTTON_DPADR_D",
-    0x69DD4613: "BUTTON_DPADR_X",
-    0x69DE0F1A: "BUTTON_DPADU_D",
-    0x69DE0F2E: "BUTTON_DPADU_X",
-    0x69E37AC3: "MGPH_INFO",
-    0x69E42AFF: "2_G2_NOFLOWER",
-    0x69E75607: "MGGE_MINNESOTA",
-    0x69EC34F7: "2_S04_OBJ1",
-    0x69EC34F8: "2_S04_OBJ2",
-    0x69F133A9: "FED_HUD",
-    0x69F3C94E: "FED_RDB",
-    0x69F3C959: "FED_RDM",
-    0x69F3C95E: "FED_RDR",
-    0x69F60EBA: "4_01_EMPTY",
-    0x69F64306: "TUT_CHEM1C1",
-    0x69F70C21: "TUT_CHEM4C1",
-    0x69F74F2A: "TUT_CHEM5C1",
-    0x69FC863E: "BC_COP_BIKE",
-    0x6A03EE97: "FAC_JOCKS",
-    0x6A06A37B: "MGGE_SAUDIARABIA",
-    0x6A0FCA02: "FE_SCORE",
-    0x6A1AD73E: "SP_ALIEN_H",
-    0x6A1AD742: "SP_ALIEN_L",
-    0x6A1AD74A: "SP_ALIEN_T",
-    0x6A1D588B: "N_PEDRO",
-    0x6A1F764E: "BUT_CLASS_ART",
-    0x6A1FB4B7: "BUT_CLASS_BIO",
-    0x6A1FF733: "BUT_CLASS_CHE",
-    0x6A2033CC: "YYYYMMDD",
-    0x6A208059: "BUT_CLASS_ENG",
-    0x6A2101D8: "BUT_CLASS_GEO",
-    0x6A210C12: "BUT_CLASS_GYM",
-    0x6A218277: "N_PETER",
-    0x6A229207: "BUT_CLASS_MAT",
-    0x6A229C42: "BUT_CLASS_MUS",
-    0x6A22D2FF: "P_SWEATER1",
-    0x6A22D300: "P_SWEATER2",
-    0x6A22D301: "P_SWEATER3",
-    0x6A22D302: "P_SWEATER4",
-    0x6A22D303: "P_SWEATER5",
-    0x6A22D304: "P_SWEATER6",
-    0x6A22D305: "P_SWEATER7",
-    0x6A22D306: "P_SWEATER8",
-    0x6A235EB2: "BUT_CLASS_PHO",
-    0x6A2427CD: "BUT_CLASS_SHO",
-    0x6A270F30: "5_09_TITLE",
-    0x6A2E8FBF: "SOC_GEN_VENDOR",
-    0x6A39E27F: "MGB2_EXIT",
-    0x6A46FFB5: "MGPH_LAMP",
-    0x6A4871EB: "1-11.SUB0001",
-    0x6A4871EC: "1-11.SUB0002",
-    0x6A4871ED: "1-11.SUB0003",
-    0x6A4871EE: "1-11.SUB0004",
-    0x6A4871EF: "1-11.SUB0005",
-    0x6A4871F0: "1-11.SUB0006",
-    0x6A4871F1: "1-11.SUB0007",
-    0x6A4871F2: "1-11.SUB0008",
-    0x6A4871F3: "1-11.SUB0009",
-    0x6A48726D: "1-11.SUB0010",
-    0x6A48726E: "1-11.SUB0011",
-    0x6A48726F: "1-11.SUB0012",
-    0x6A487270: "1-11.SUB0013",
-    0x6A487271: "1-11.SUB0014",
-    0x6A487272: "1-11.SUB0015",
-    0x6A487273: "1-11.SUB0016",
-    0x6A487274: "1-11.SUB0017",
-    0x6A487275: "1-11.SUB0018",
-    0x6A4FCBB1: "TITLE73_NUMNAMES",
-    0x6A54CFA5: "R_LSLEEVES1",
-    0x6A54CFA6: "R_LSLEEVES2",
-    0x6A54CFA7: "R_LSLEEVES3",
-    0x6A54CFA8: "R_LSLEEVES4",
-    0x6A54CFA9: "R_LSLEEVES5",
-    0x6A57A423: "SUMMER",
-    0x6A5B0849: "STATUS_JOCKS",
-    0x6A5FE26B: "C6_INST01",
-    0x6A69505D: "MGPH_MASK",
-    0x6A7E0883: "AS_EM_OBJCOUNT1",
-    0x6A8325C6: "N_MRBRECKINDALE",
-    0x6A85116F: "C6_INT_07",
-    0x6A851170: "C6_INT_08",
-    0x6A851171: "C6_INT_09",
-    0x6A8511EB: "C6_INT_10",
-    0x6A90D718: "MGPH_NULL",
-    0x6A9A97C2: "AS_CT_COMPLETE",
-    0x6A9CD26C: "MGS2_INFO",
-    0x6A9CD918: "MGS2_INST",
-    0x6AA7008F: "MGMA_EXIT",
-    0x6AA929C6: "N_PINKY",
-    0x6AB59BD6: "MGT_ART",
-    0x6AB72760: "MGT_GEO",
-    0x6ABC1DF0: "TITLE1_NAME10",
-    0x6ABC1DF1: "TITLE1_NAME11",
-    0x6ABC1DF2: "TITLE1_NAME12",
-    0x6ABC1DF3: "TITLE1_NAME13",
-    0x6ABC1DF4: "TITLE1_NAME14",
-    0x6ABC1DF5: "TITLE1_NAME15",
-    0x6ABC1DF6: "TITLE1_NAME16",
-    0x6ABC1DF7: "TITLE1_NAME17",
-    0x6ABC1DF8: "TITLE1_NAME18",
-    0x6ABC1DF9: "TITLE1_NAME19",
-    0x6ABC1E73: "TITLE1_NAME20",
-    0x6ABC1E74: "TITLE1_NAME21",
-    0x6ABC1E75: "TITLE1_NAME22",
-    0x6ABC1E76: "TITLE1_NAME23",
-    0x6ABC1E77: "TITLE1_NAME24",
-    0x6ABC1E78: "TITLE1_NAME25",
-    0x6ABC1E79: "TITLE1_NAME26",
-    0x6ABC1E7A: "TITLE1_NAME27",
-    0x6ABC1E7B: "TITLE1_NAME28",
-    0x6ABC1E7C: "TITLE1_NAME29",
-    0x6ABC1EF6: "TITLE1_NAME30",
-    0x6ABC1EF7: "TITLE1_NAME31",
-    0x6ABC1EF8: "TITLE1_NAME32",
-    0x6ABC1EF9: "TITLE1_NAME33",
-    0x6ABC1EFA: "TITLE1_NAME34",
-    0x6ABC1EFB: "TITLE1_NAME35",
-    0x6ABC1EFC: "TITLE1_NAME36",
-    0x6ABC1EFD: "TITLE1_NAME37",
-    0x6ABC1EFE: "TITLE1_NAME38",
-    0x6ABC1EFF: "TITLE1_NAME39",
-    0x6ABDDCB0: "3_01C_PERFECT",
-    0x6AC07903: "MGB2_INFO",
-    0x6AC8287D: "GKART_NBTIME",
-    0x6ACCAB05: "MGS2_FOOTER",
-    0x6AE16B57: "MAP_RECENTER",
-    0x6AE5F4CA: "TITLE84_NAME0",
-    0x6AE5F4CB: "TITLE84_NAME1",
-    0x6AE5F4CC: "TITLE84_NAME2",
-    0x6AE5F4CD: "TITLE84_NAME3",
-    0x6AE5F4CE: "TITLE84_NAME4",
-    0x6AE5F4CF: "TITLE84_NAME5",
-    0x6AE5F4D0: "TITLE84_NAME6",
-    0x6AE5F4D1: "TITLE84_NAME7",
-    0x6AE5F4D2: "TITLE84_NAME8",
-    0x6AE5F4D3: "TITLE84_NAME9",
-    0x6AEC2E9D: "3-01BA.SUB0001",
-    0x6AEC2E9E: "3-01BA.SUB0002",
-    0x6AEC2E9F: "3-01BA.SUB0003",
-    0x6AEC2EA0: "3-01BA.SUB0004",
-    0x6AEC2EA1: "3-01BA.SUB0005",
-    0x6AEC2EA2: "3-01BA.SUB0006",
-    0x6AEC2EA3: "3-01BA.SUB0007",
-    0x6AEC2EA4: "3-01BA.SUB0008",
-    0x6AEC2EA5: "3-01BA.SUB0009",
-    0x6AEC2F1F: "3-01BA.SUB0010",
-    0x6AEC2F20: "3-01BA.SUB0011",
-    0x6AEC2F21: "3-01BA.SUB0012",
-    0x6AEC2F22: "3-01BA.SUB0013",
-    0x6AEC2F23: "3-01BA.SUB0014",
-    0x6AEC2F24: "3-01BA.SUB0015",
-    0x6AEC2F25: "3-01BA.SUB0016",
-    0x6AEC2F26: "3-01BA.SUB0017",
-    0x6AEC2F27: "3-01BA.SUB0018",
-    0x6AEC2F28: "3-01BA.SUB0019",
-    0x6AEC2FA2: "3-01BA.SUB0020",
-    0x6AEC2FA3: "3-01BA.SUB0021",
-    0x6AEC2FA4: "3-01BA.SUB0022",
-    0x6AEC2FA5: "3-01BA.SUB0023",
-    0x6AEC2FA6: "3-01BA.SUB0024",
-    0x6AEC2FA7: "3-01BA.SUB0025",
-    0x6AEC2FA8: "3-01BA.SUB0026",
-    0x6AEC2FA9: "3-01BA.SUB0027",
-    0x6AEC2FAA: "3-01BA.SUB0028",
-    0x6AEC54CA: "MGE2_T2G01W01",
-    0x6AEC54CB: "MGE2_T2G01W02",
-    0x6AEC54CC: "MGE2_T2G01W03",
-    0x6AEC54CD: "MGE2_T2G01W04",
-    0x6AEC54CE: "MGE2_T2G01W05",
-    0x6AEC54CF: "MGE2_T2G01W06",
-    0x6AEC54D0: "MGE2_T2G01W07",
-    0x6AEC54D1: "MGE2_T2G01W08",
-    0x6AEC54D2: "MGE2_T2G01W09",
-    0x6AEC554C: "MGE2_T2G01W10",
-    0x6AEC554D: "MGE2_T2G01W11",
-    0x6AEC554E: "MGE2_T2G01W12",
-    0x6AEC554F: "MGE2_T2G01W13",
-    0x6AEC5550: "MGE2_T2G01W14",
-    0x6AEC5551: "MGE2_T2G01W15",
-    0x6AEC5552: "MGE2_T2G01W16",
-    0x6AEC5553: "MGE2_T2G01W17",
-    0x6AEC5554: "MGE2_T2G01W18",
-    0x6AEC5555: "MGE2_T2G01W19",
-    0x6AEC55CF: "MGE2_T2G01W20",
-    0x6AEC55D0: "MGE2_T2G01W21",
-    0x6AEC55D1: "MGE2_T2G01W22",
-    0x6AEC55D2: "MGE2_T2G01W23",
-    0x6AEC55D3: "MGE2_T2G01W24",
-    0x6AEC55D4: "MGE2_T2G01W25",
-    0x6AEC55D5: "MGE2_T2G01W26",
-    0x6AEC55D6: "MGE2_T2G01W27",
-    0x6AEC55D7: "MGE2_T2G01W28",
-    0x6AEC55D8: "MGE2_T2G01W29",
-    0x6AEC5652: "MGE2_T2G01W30",
-    0x6AEC5653: "MGE2_T2G01W31",
-    0x6AEC5654: "MGE2_T2G01W32",
-    0x6AEC5655: "MGE2_T2G01W33",
-    0x6AEC5656: "MGE2_T2G01W34",
-    0x6AEC5657: "MGE2_T2G01W35",
-    0x6AEC5658: "MGE2_T2G01W36",
-    0x6AEC5659: "MGE2_T2G01W37",
-    0x6AEC565A: "MGE2_T2G01W38",
-    0x6AEC565B: "MGE2_T2G01W39",
-    0x6AEC56D5: "MGE2_T2G01W40",
-    0x6AEC56D6: "MGE2_T2G01W41",
-    0x6AEC56D7: "MGE2_T2G01W42",
-    0x6AEC56D8: "MGE2_T2G01W43",
-    0x6AEC56D9: "MGE2_T2G01W44",
-    0x6AEC56DA: "MGE2_T2G01W45",
-    0x6AEC56DB: "MGE2_T2G01W46",
-    0x6AEC56DC: "MGE2_T2G01W47",
-    0x6AEC56DD: "MGE2_T2G01W48",
-    0x6AEC56DE: "MGE2_T2G01W49",
-    0x6AEC5758: "MGE2_T2G01W50",
-    0x6AF7251F: "SOUVENIR",
-    0x6AFB917E: "ERR_ACCESS",
-    0x6B284BC2: "BK_TIRES01D",
-    0x6B284BCC: "BK_TIRES01N",
-    0x6B284C45: "BK_TIRES02D",
-    0x6B284C4F: "BK_TIRES02N",
-    0x6B2A4B5D: "1_G1_OBJ1",
-    0x6B2A4B5E: "1_G1_OBJ2",
-    0x6B2A4B5F: "1_G1_OBJ3",
-    0x6B2A4B60: "1_G1_OBJ4",
-    0x6B2A4B61: "1_G1_OBJ5",
-    0x6B2D9713: "MGMA_INFO",
-    0x6B44CDBF: "3_R08_MENU_A01",
-    0x6B4510C8: "3_R08_MENU_B01",
-    0x6B4510C9: "3_R08_MENU_B02",
-    0x6B4510CA: "3_R08_MENU_B03",
-    0x6B4510CB: "3_R08_MENU_B04",
-    0x6B4858F5: "DBH_SWITCH",
-    0x6B54F5F2: "2_03_OBJ_07",
-    0x6B54F707: "MGGE_SWEDEN",
-    0x6B57C691: "SP_EINSTEIN",
-    0x6B5B84CA: "MGPH_TIME",
-    0x6B5C8E8C: "AS_KM_RETURN",
-    0x6B67C298: "C6_UNLK_01",
-    0x6B67C299: "C6_UNLK_02",
-    0x6B67C29A: "C6_UNLK_03",
-    0x6B67C29B: "C6_UNLK_04",
-    0x6B67C29C: "C6_UNLK_05",
-    0x6BAA027E: "1_11_XP_UNLOCK",
-    0x6BBC99D6: "AS_COWBOY",
-    0x6BBED1D1: "DIBUTTON_100",
-    0x6BBED1D2: "DIBUTTON_101",
-    0x6BBED1D3: "DIBUTTON_102",
-    0x6BBED1D4: "DIBUTTON_103",
-    0x6BBED1D5: "DIBUTTON_104",
-    0x6BBED1D6: "DIBUTTON_105",
-    0x6BBED1D7: "DIBUTTON_106",
-    0x6BBED1D8: "DIBUTTON_107",
-    0x6BBED1D9: "DIBUTTON_108",
-    0x6BBED1DA: "DIBUTTON_109",
-    0x6BBED254: "DIBUTTON_110",
-    0x6BBED255: "DIBUTTON_111",
-    0x6BBED256: "DIBUTTON_112",
-    0x6BBED257: "DIBUTTON_113",
-    0x6BBED258: "DIBUTTON_114",
-    0x6BBED259: "DIBUTTON_115",
-    0x6BBED25A: "DIBUTTON_116",
-    0x6BBED25B: "DIBUTTON_117",
-    0x6BBED25C: "DIBUTTON_118",
-    0x6BBED25D: "DIBUTTON_119",
-    0x6BBED2D7: "DIBUTTON_120",
-    0x6BBED2D8: "DIBUTTON_121",
-    0x6BBED2D9: "DIBUTTON_122",
-    0x6BBED2DA: "DIBUTTON_123",
-    0x6BBED2DB: "DIBUTTON_124",
-    0x6BBED2DC: "DIBUTTON_125",
-    0x6BBED2DD: "DIBUTTON_126",
-    0x6BBED2DE: "DIBUTTON_127",
-    0x6BBED2DF: "DIBUTTON_128",
-    0x6BBED2E0: "DIBUTTON_129",
-    0x6BBED35A: "DIBUTTON_130",
-    0x6BBED35B: "DIBUTTON_131",
-    0x6BBED35C: "DIBUTTON_132",
-    0x6BBED35D: "DIBUTTON_133",
-    0x6BBED35E: "DIBUTTON_134",
-    0x6BBED35F: "DIBUTTON_135",
-    0x6BBED360: "DIBUTTON_136",
-    0x6BBED361: "DIBUTTON_137",
-    0x6BBED362: "DIBUTTON_138",
-    0x6BBED363: "DIBUTTON_139",
-    0x6BBED3DD: "DIBUTTON_140",
-    0x6BBED3DE: "DIBUTTON_141",
-    0x6BBED3DF: "DIBUTTON_142",
-    0x6BBED3E0: "DIBUTTON_143",
-    0x6BBED3E1: "DIBUTTON_144",
-    0x6BBED3E2: "DIBUTTON_145",
-    0x6BBED3E3: "DIBUTTON_146",
-    0x6BBED3E4: "DIBUTTON_147",
-    0x6BBED3E5: "DIBUTTON_148",
-    0x6BBED3E6: "DIBUTTON_149",
-    0x6BBED460: "DIBUTTON_150",
-    0x6BBED461: "DIBUTTON_151",
-    0x6BBED462: "DIBUTTON_152",
-    0x6BBED463: "DIBUTTON_153",
-    0x6BBED464: "DIBUTTON_154",
-    0x6BBED465: "DIBUTTON_155",
-    0x6BBED466: "DIBUTTON_156",
-    0x6BBED467: "DIBUTTON_157",
-    0x6BBED468: "DIBUTTON_158",
-    0x6BBED469: "DIBUTTON_159",
-    0x6BBED4E3: "DIBUTTON_160",
-    0x6BBED4E4: "DIBUTTON_161",
-    0x6BBED4E5: "DIBUTTON_162",
-    0x6BBED4E6: "DIBUTTON_163",
-    0x6BBED4E7: "DIBUTTON_164",
-    0x6BBED4E8: "DIBUTTON_165",
-    0x6BBED4E9: "DIBUTTON_166",
-    0x6BBED4EA: "DIBUTTON_167",
-    0x6BBED4EB: "DIBUTTON_168",
-    0x6BBED4EC: "DIBUTTON_169",
-    0x6BBED566: "DIBUTTON_170",
-    0x6BBED567: "DIBUTTON_171",
-    0x6BBED568: "DIBUTTON_172",
-    0x6BBED569: "DIBUTTON_173",
-    0x6BBED56A: "DIBUTTON_174",
-    0x6BBED56B: "DIBUTTON_175",
-    0x6BBED56C: "DIBUTTON_176",
-    0x6BBED56D: "DIBUTTON_177",
-    0x6BBED56E: "DIBUTTON_178",
-    0x6BBED56F: "DIBUTTON_179",
-    0x6BBED5E9: "DIBUTTON_180",
-    0x6BBED5EA: "DIBUTTON_181",
-    0x6BBED5EB: "DIBUTTON_182",
-    0x6BBED5EC: "DIBUTTON_183",
-    0x6BBED5ED: "DIBUTTON_184",
-    0x6BBED5EE: "DIBUTTON_185",
-    0x6BBED5EF: "DIBUTTON_186",
-    0x6BBED5F0: "DIBUTTON_187",
-    0x6BBED5F1: "DIBUTTON_188",
-    0x6BBED5F2: "DIBUTTON_189",
-    0x6BBED66C: "DIBUTTON_190",
-    0x6BBED66D: "DIBUTTON_191",
-    0x6BBED66E: "DIBUTTON_192",
-    0x6BBED66F: "DIBUTTON_193",
-    0x6BBED670: "DIBUTTON_194",
-    0x6BBED671: "DIBUTTON_195",
-    0x6BBED672: "DIBUTTON_196",
-    0x6BBED673: "DIBUTTON_197",
-    0x6BBED674: "DIBUTTON_198",
-    0x6BBED675: "DIBUTTON_199",
-    0x6BBF14DA: "DIBUTTON_200",
-    0x6BBF14DB: "DIBUTTON_201",
-    0x6BBF14DC: "DIBUTTON_202",
-    0x6BBF14DD: "DIBUTTON_203",
-    0x6BBF14DE: "DIBUTTON_204",
-    0x6BBF14DF: "DIBUTTON_205",
-    0x6BBF14E0: "DIBUTTON_206",
-    0x6BBF14E1: "DIBUTTON_207",
-    0x6BBF14E2: "DIBUTTON_208",
-    0x6BBF14E3: "DIBUTTON_209",
-    0x6BBF155D: "DIBUTTON_210",
-    0x6BBF155E: "DIBUTTON_211",
-    0x6BBF155F: "DIBUTTON_212",
-    0x6BBF1560: "DIBUTTON_213",
-    0x6BBF1561: "DIBUTTON_214",
-    0x6BBF1562: "DIBUTTON_215",
-    0x6BBF1563: "DIBUTTON_216",
-    0x6BBF1564: "DIBUTTON_217",
-    0x6BBF1565: "DIBUTTON_218",
-    0x6BBF1566: "DIBUTTON_219",
-    0x6BBF15E0: "DIBUTTON_220",
-    0x6BBF15E1: "DIBUTTON_221",
-    0x6BBF15E2: "DIBUTTON_222",
-    0x6BBF15E3: "DIBUTTON_223",
-    0x6BBF15E4: "DIBUTTON_224",
-    0x6BBF15E5: "DIBUTTON_225",
-    0x6BBF15E6: "DIBUTTON_226",
-    0x6BBF15E7: "DIBUTTON_227",
-    0x6BBF15E8: "DIBUTTON_228",
-    0x6BBF15E9: "DIBUTTON_229",
-    0x6BBF1663: "DIBUTTON_230",
-    0x6BBF1664: "DIBUTTON_231",
-    0x6BBF1665: "DIBUTTON_232",
-    0x6BBF1666: "DIBUTTON_233",
-    0x6BBF1667: "DIBUTTON_234",
-    0x6BBF1668: "DIBUTTON_235",
-    0x6BBF1669: "DIBUTTON_236",
-    0x6BBF166A: "DIBUTTON_237",
-    0x6BBF166B: "DIBUTTON_238",
-    0x6BBF166C: "DIBUTTON_239",
-    0x6BBF16E6: "DIBUTTON_240",
-    0x6BBF16E7: "DIBUTTON_241",
-    0x6BBF16E8: "DIBUTTON_242",
-    0x6BBF16E9: "DIBUTTON_243",
-    0x6BBF16EA: "DIBUTTON_244",
-    0x6BBF16EB: "DIBUTTON_245",
-    0x6BBF16EC: "DIBUTTON_246",
-    0x6BBF16ED: "DIBUTTON_247",
-    0x6BBF16EE: "DIBUTTON_248",
-    0x6BBF16EF: "DIBUTTON_249",
-    0x6BBF1769: "DIBUTTON_250",
-    0x6BBF176A: "DIBUTTON_251",
-    0x6BBF176B: "DIBUTTON_252",
-    0x6BBF176C: "DIBUTTON_253",
-    0x6BBF176D: "DIBUTTON_254",
-    0x6BBF176E: "DIBUTTON_255",
-    0x6BBF176F: "DIBUTTON_256",
-    0x6BBF1770: "DIBUTTON_257",
-    0x6BBF1771: "DIBUTTON_258",
-    0x6BBF1772: "DIBUTTON_259",
-    0x6BBF17EC: "DIBUTTON_260",
-    0x6BBF17ED: "DIBUTTON_261",
-    0x6BBF17EE: "DIBUTTON_262",
-    0x6BBF17EF: "DIBUTTON_263",
-    0x6BBF17F0: "DIBUTTON_264",
-    0x6BBF17F1: "DIBUTTON_265",
-    0x6BBFA0BD: "AS_SA_OBJECTIVE",
-    0x6BC478E0: "TAG_GREAS_MED_01",
-    0x6BDA80DF: "5_07A_OBJ10",
-    0x6BE2BE74: "BUTTON_X_D",
-    0x6BE2BE88: "BUTTON_X_X",
-    0x6BE3D70A: "MGE2_T5G01WORDS",
-    0x6BED7446: "CRIME_MISCONDUCT",
-    0x6BF8A93C: "SP_PIGMASK",
-    0x6BF9BC46: "MGA2_EXIT_TEXT",
-    0x6C0125EB: "TITLE57_NUMNAMES",
-    0x6C09C457: "4_G4_RESPECTJ",
-    0x6C09C45B: "4_G4_RESPECTN",
-    0x6C116910: "C3_GRAPPLE",
-    0x6C2740B4: "MGPH_ZARF",
-    0x6C2AA05E: "2_S05_FAILMAD",
-    0x6C2C0B56: "MGPH_FALCON",
-    0x6C2C8EFD: "AS_SR_FAIL",
-    0x6C38243E: "1_06_PETEHIT",
-    0x6C3EB03A: "AS_VD_NOEUNICE",
-    0x6C44C43E: "BMXRUMBLE",
-    0x6C503594: "AS_BR_FAIL",
-    0x6C56F161: "FE_STORY",
-    0x6C7C678C: "TUT_POSFIST",
-    0x6C897E9F: "MEN_ES",
-    0x6C96EBA9: "AS_BR_HINT",
-    0x6C973A80: "AS_RO_OBJECTIVE",
-    0x6C9D6AE7: "1_11_TITLE",
-    0x6CA3EC03: "AS_KP_INTRO",
-    0x6CA4250A: "2_B_TITLE",
-    0x6CA4FB3B: "TITLE20_NUMNAMES",
-    0x6CA5A11A: "MGMA_TIME",
-    0x6CA6EF81: "C_ANGELHALO",
-    0x6CACE919: "AS_LD_FINDDOG",
-    0x6CB22E4D: "CLT_BOX_NG",
-    0x6CBC8BB3: "AS_TP_OBJCOUNT1",
-    0x6CC16717: "S_GIFT_GEN_01",
-    0x6CC1840F: "AS_HT_COMPLETE",
-    0x6CD4B6D6: "MG_BIOLOGY_FE",
-    0x6CDB5460: "2_R11_CHAD_NAME",
-    0x6CEAD093: "MGA2_KILLED_TEXT",
-    0x6CED80A8: "2_G2_TUT_01",
-    0x6CF49034: "B_JERSEY10",
-    0x6CF897E8: "KICK_PROP",
-    0x6CFC2F7E: "3_S08_MAILBOXES",
-    0x6D042CAE: "S_TAUNT_COM_SHOVE_01",
-    0x6D08F518: "1_B_PLAYERKO",
-    0x6D140E5B: "P_SHORTS1",
-    0x6D140E5C: "P_SHORTS2",
-    0x6D140E5D: "P_SHORTS3",
-    0x6D140E5E: "P_SHORTS4",
-    0x6D14411F: "3-02.SUB0001",
-    0x6D144120: "3-02.SUB0002",
-    0x6D144121: "3-02.SUB0003",
-    0x6D144122: "3-02.SUB0004",
-    0x6D144123: "3-02.SUB0005",
-    0x6D144124: "3-02.SUB0006",
-    0x6D144125: "3-02.SUB0007",
-    0x6D144126: "3-02.SUB0008",
-    0x6D144127: "3-02.SUB0009",
-    0x6D1441A1: "3-02.SUB0010",
-    0x6D1441A2: "3-02.SUB0011",
-    0x6D1441A3: "3-02.SUB0012",
-    0x6D1441A4: "3-02.SUB0013",
-    0x6D1441A5: "3-02.SUB0014",
-    0x6D1441A6: "3-02.SUB0015",
-    0x6D1441A7: "3-02.SUB0016",
-    0x6D1441A8: "3-02.SUB0017",
-    0x6D1441A9: "3-02.SUB0018",
-    0x6D1441AA: "3-02.SUB0019",
-    0x6D21E8C2: "SOC_BUL_WARNING",
-    0x6D251CBF: "AS_FC_ACTION",
-    0x6D2F2DAA: "4-S12.SUB0001",
-    0x6D2F2DAB: "4-S12.SUB0002",
-    0x6D2F2DAC: "4-S12.SUB0003",
-    0x6D2F2DAD: "4-S12.SUB0004",
-    0x6D2F2DAE: "4-S12.SUB0005",
-    0x6D2F2DAF: "4-S12.SUB0006",
-    0x6D2F2DB0: "4-S12.SUB0007",
-    0x6D2F2DB1: "4-S12.SUB0008",
-    0x6D2F2DB2: "4-S12.SUB0009",
-    0x6D2F2E2C: "4-S12.SUB0010",
-    0x6D2F2E2D: "4-S12.SUB0011",
-    0x6D2F2E2E: "4-S12.SUB0012",
-    0x6D2F2E2F: "4-S12.SUB0013",
-    0x6D2F2E30: "4-S12.SUB0014",
-    0x6D2F2E31: "4-S12.SUB0015",
-    0x6D2F2E32: "4-S12.SUB0016",
-    0x6D2F2E33: "4-S12.SUB0017",
-    0x6D2F2E34: "4-S12.SUB0018",
-    0x6D2F2E35: "4-S12.SUB0019",
-    0x6D2F2EAF: "4-S12.SUB0020",
-    0x6D2F42E3: "1_06_HOBOKO",
-    0x6D3421B1: "UP_HOBO1",
-    0x6D3421B2: "UP_HOBO2",
-    0x6D3421B3: "UP_HOBO3",
-    0x6D3421B4: "UP_HOBO4",
-    0x6D3421B5: "UP_HOBO5",
-    0x6D3421B6: "UP_HOBO6",
-    0x6D355BB6: "BULLYEXTORT",
-    0x6D4821D2: "4-0.SUB0001",
-    0x6D4821D3: "4-0.SUB0002",
-    0x6D4821D4: "4-0.SUB0003",
-    0x6D4821D5: "4-0.SUB0004",
-    0x6D4821D6: "4-0.SUB0005",
-    0x6D4821D7: "4-0.SUB0006",
-    0x6D4821D8: "4-0.SUB0007",
-    0x6D4821D9: "4-0.SUB0008",
-    0x6D4821DA: "4-0.SUB0009",
-    0x6D482254: "4-0.SUB0010",
-    0x6D482255: "4-0.SUB0011",
-    0x6D482256: "4-0.SUB0012",
-    0x6D482257: "4-0.SUB0013",
-    0x6D482258: "4-0.SUB0014",
-    0x6D482259: "4-0.SUB0015",
-    0x6D48225A: "4-0.SUB0016",
-    0x6D48225B: "4-0.SUB0017",
-    0x6D48225C: "4-0.SUB0018",
-    0x6D48225D: "4-0.SUB0019",
-    0x6D4822D7: "4-0.SUB0020",
-    0x6D4822D8: "4-0.SUB0021",
-    0x6D4822D9: "4-0.SUB0022",
-    0x6D4822DA: "4-0.SUB0023",
-    0x6D4822DB: "4-0.SUB0024",
-    0x6D4822DC: "4-0.SUB0025",
-    0x6D4822DD: "4-0.SUB0026",
-    0x6D4822DE: "4-0.SUB0027",
-    0x6D4822DF: "4-0.SUB0028",
-    0x6D4822E0: "4-0.SUB0029",
-    0x6D48235A: "4-0.SUB0030",
-    0x6D48235B: "4-0.SUB0031",
-    0x6D48235C: "4-0.SUB0032",
-    0x6D48235D: "4-0.SUB0033",
-    0x6D48235E: "4-0.SUB0034",
-    0x6D48235F: "4-0.SUB0035",
-    0x6D482360: "4-0.SUB0036",
-    0x6D482361: "4-0.SUB0037",
-    0x6D487F10: "FUN_MTR_ATTACK",
-    0x6D49BCD9: "MGGE_POLAND",
-    0x6D56AD83: "M_MONEY_NEG",
-    0x6D5738BF: "M_MONEY_POS",
-    0x6D5D68C4: "MRESPECT_PFRIEND",
-    0x6D5DEA3A: "ITEM_PACKAGE",
-    0x6D65595F: "AS_EM_COMPLETE",
-    0x6D6FA5FF: "IDROPS",
-    0x6D791948: "MGBI_SEL",
-    0x6D82C176: "AS_TW_GRAVE",
-    0x6D8C0FCF: "4_04_THAD",
-    0x6D9759F6: "DISC_04_WII",
-    0x6D9FDDE1: "MGC2P_BEGIN",
-    0x6DA4CD94: "UP_PHOTOGRAPHY1",
-    0x6DA4CD95: "UP_PHOTOGRAPHY2",
-    0x6DA4CD96: "UP_PHOTOGRAPHY3",
-    0x6DA4CD97: "UP_PHOTOGRAPHY4",
-    0x6DA4CD98: "UP_PHOTOGRAPHY5",
-    0x6DC4955D: "SYS_RENDER_FAIL",
-    0x6DD8E44C: "USE_SKITCH",
-    0x6DE68D0A: "AS_SF_OBJECTIVE",
-    0x6DFB329B: "MGPH_FILM_CAMERA",
-    0x6DFDF075: "N_PITBULL",
-    0x6DFE8737: "STATUS_BULLIES",
-    0x6E0465E1: "NTD_00",
-    0x6E16CE75: "TUT_VESPA",
-    0x6E19EC5B: "TITLE56_NAME0",
-    0x6E19EC5C: "TITLE56_NAME1",
-    0x6E19EC5D: "TITLE56_NAME2",
-    0x6E19EC5E: "TITLE56_NAME3",
-    0x6E19EC5F: "TITLE56_NAME4",
-    0x6E19EC60: "TITLE56_NAME5",
-    0x6E19EC61: "TITLE56_NAME6",
-    0x6E19EC62: "TITLE56_NAME7",
-    0x6E19EC63: "TITLE56_NAME8",
-    0x6E19EC64: "TITLE56_NAME9",
-    0x6E1CB57F: "N_MRBUBAS",
-    0x6E2E1500: "R1_VEHICLE",
-    0x6E2EDC1A: "AS_F4_ACTION",
-    0x6E35F135: "CONT_04_WII",
-    0x6E37FDFC: "4_G4_ALGIECLEAN",
-    0x6E4BD43A: "3_04_RESPECTM",
-    0x6E4BD43D: "3_04_RESPECTP",
-    0x6E59BD00: "MGT_ART_FE",
-    0x6E5FA01A: "BUT_DARTS",
-    0x6E805FEC: "MAP_BUSSTOPS",
-    0x6E8E9ACB: "MGGE_JAPAN",
-    0x6E95BB8E: "MGT_GEO_FE",
-    0x6E9DCA82: "FE_STATUS",
-    0x6EA0F9AE: "AS_SR_GREET",
-    0x6EA32B07: "2_09_TITLE",
-    0x6EA3BD09: "CONF_WM_WII",
-    0x6EB91C05: "FESL_BL",
-    0x6EB91C0B: "FESL_BR",
-    0x6EB9253B: "FESL_TL",
-    0x6EB92541: "FESL_TR",
-    0x6EBF5AFF: "MAP_TOGGLE",
-    0x6EC75293: "3_01_FAILLEFT",
-    0x6ECAEA40: "3_09_MOBJ_01",
-    0x6ECAEA41: "3_09_MOBJ_02",
-    0x6ECAEA42: "3_09_MOBJ_03",
-    0x6ECBE788: "TITLE70_NUMNAMES",
-    0x6ECDA010: "HAIR_SALON",
-    0x6ED767E7: "P_TAPER_01",
-    0x6ED767E8: "P_TAPER_02",
-    0x6ED767E9: "P_TAPER_03",
-    0x6ED767EA: "P_TAPER_04",
-    0x6EE6FBD3: "DB_TUT_HOLDBALL",
-    0x6F117748: "C4_INFO",
-    0x6F1BB01C: "3-S08.SUB0001",
-    0x6F1BB01D: "3-S08.SUB0002",
-    0x6F1BB01E: "3-S08.SUB0003",
-    0x6F1BB01F: "3-S08.SUB0004",
-    0x6F1BB020: "3-S08.SUB0005",
-    0x6F1BB021: "3-S08.SUB0006",
-    0x6F1BB022: "3-S08.SUB0007",
-    0x6F1BB023: "3-S08.SUB0008",
-    0x6F1BB024: "3-S08.SUB0009",
-    0x6F1BB09E: "3-S08.SUB0010",
-    0x6F1BB09F: "3-S08.SUB0011",
-    0x6F1BB0A0: "3-S08.SUB0012",
-    0x6F1BB0A1: "3-S08.SUB0013",
-    0x6F1BB0A2: "3-S08.SUB0014",
-    0x6F1BB0A3: "3-S08.SUB0015",
-    0x6F1BB0A4: "3-S08.SUB0016",
-    0x6F1BB0A5: "3-S08.SUB0017",
-    0x6F1BB0A6: "3-S08.SUB0018",
-    0x6F1BB0A7: "3-S08.SUB0019",
-    0x6F1BB121: "3-S08.SUB0020",
-    0x6F1BB122: "3-S08.SUB0021",
-    0x6F1BB123: "3-S08.SUB0022",
-    0x6F1BB124: "3-S08.SUB0023",
-    0x6F1BB125: "3-S08.SUB0024",
-    0x6F1BB126: "3-S08.SUB0025",
-    0x6F1BB127: "3-S08.SUB0026",
-    0x6F2A9C95: "MGE2_T12G01W01",
-    0x6F2A9C96: "MGE2_T12G01W02",
-    0x6F2A9C97: "MGE2_T12G01W03",
-    0x6F2A9C98: "MGE2_T12G01W04",
-    0x6F2A9C99: "MGE2_T12G01W05",
-    0x6F2A9C9A: "MGE2_T12G01W06",
-    0x6F2A9C9B: "MGE2_T12G01W07",
-    0x6F2A9C9C: "MGE2_T12G01W08",
-    0x6F2A9C9D: "MGE2_T12G01W09",
-    0x6F2A9D17: "MGE2_T12G01W10",
-    0x6F2A9D18: "MGE2_T12G01W11",
-    0x6F2A9D19: "MGE2_T12G01W12",
-    0x6F2A9D1A: "MGE2_T12G01W13",
-    0x6F2A9D1B: "MGE2_T12G01W14",
-    0x6F2A9D1C: "MGE2_T12G01W15",
-    0x6F2A9D1D: "MGE2_T12G01W16",
-    0x6F2A9D1E: "MGE2_T12G01W17",
-    0x6F2A9D1F: "MGE2_T12G01W18",
-    0x6F2A9D20: "MGE2_T12G01W19",
-    0x6F2A9D9A: "MGE2_T12G01W20",
-    0x6F2A9D9B: "MGE2_T12G01W21",
-    0x6F2A9D9C: "MGE2_T12G01W22",
-    0x6F2A9D9D: "MGE2_T12G01W23",
-    0x6F2A9D9E: "MGE2_T12G01W24",
-    0x6F2A9D9F: "MGE2_T12G01W25",
-    0x6F2A9DA0: "MGE2_T12G01W26",
-    0x6F2A9DA1: "MGE2_T12G01W27",
-    0x6F2A9DA2: "MGE2_T12G01W28",
-    0x6F2A9DA3: "MGE2_T12G01W29",
-    0x6F2A9E1D: "MGE2_T12G01W30",
-    0x6F2A9E1E: "MGE2_T12G01W31",
-    0x6F2A9E1F: "MGE2_T12G01W32",
-    0x6F2A9E20: "MGE2_T12G01W33",
-    0x6F2A9E21: "MGE2_T12G01W34",
-    0x6F2A9E22: "MGE2_T12G01W35",
-    0x6F2A9E23: "MGE2_T12G01W36",
-    0x6F2A9E24: "MGE2_T12G01W37",
-    0x6F2A9E25: "MGE2_T12G01W38",
-    0x6F2A9E26: "MGE2_T12G01W39",
-    0x6F2A9EA0: "MGE2_T12G01W40",
-    0x6F2A9EA1: "MGE2_T12G01W41",
-    0x6F2A9EA2: "MGE2_T12G01W42",
-    0x6F2A9EA3: "MGE2_T12G01W43",
-    0x6F2A9EA4: "MGE2_T12G01W44",
-    0x6F2A9EA5: "MGE2_T12G01W45",
-    0x6F2A9EA6: "MGE2_T12G01W46",
-    0x6F2A9EA7: "MGE2_T12G01W47",
-    0x6F2A9EA8: "MGE2_T12G01W48",
-    0x6F2A9EA9: "MGE2_T12G01W49",
-    0x6F2A9F23: "MGE2_T12G01W50",
-    0x6F31624A: "P_MH_FLAT_01",
-    0x6F31624B: "P_MH_FLAT_02",
-    0x6F31624C: "P_MH_FLAT_03",
-    0x6F31624D: "P_MH_FLAT_04",
-    0x6F35D4D2: "3-R07.SUB0001",
-    0x6F35D4D3: "3-R07.SUB0002",
-    0x6F35D4D4: "3-R07.SUB0003",
-    0x6F35D4D5: "3-R07.SUB0004",
-    0x6F35D4D6: "3-R07.SUB0005",
-    0x6F35D4D7: "3-R07.SUB0006",
-    0x6F35D4D8: "3-R07.SUB0007",
-    0x6F35D4D9: "3-R07.SUB0008",
-    0x6F35D4DA: "3-R07.SUB0009",
-    0x6F35D554: "3-R07.SUB0010",
-    0x6F35D555: "3-R07.SUB0011",
-    0x6F35D556: "3-R07.SUB0012",
-    0x6F35D557: "3-R07.SUB0013",
-    0x6F35D558: "3-R07.SUB0014",
-    0x6F35D559: "3-R07.SUB0015",
-    0x6F35D55A: "3-R07.SUB0016",
-    0x6F35D55B: "3-R07.SUB0017",
-    0x6F35D55C: "3-R07.SUB0018",
-    0x6F35D55D: "3-R07.SUB0019",
-    0x6F35D5D7: "3-R07.SUB0020",
-    0x6F35D5D8: "3-R07.SUB0021",
-    0x6F362D0E: "2_S06_EMPTY",
-    0x6F372113: "TITLE41_NAME0",
-    0x6F372114: "TITLE41_NAME1",
-    0x6F372115: "TITLE41_NAME2",
-    0x6F372116: "TITLE41_NAME3",
-    0x6F372117: "TITLE41_NAME4",
-    0x6F372118: "TITLE41_NAME5",
-    0x6F372119: "TITLE41_NAME6",
-    0x6F37211A: "TITLE41_NAME7",
-    0x6F37211B: "TITLE41_NAME8",
-    0x6F37211C: "TITLE41_NAME9",
-    0x6F46E175: "3_05_OLAUND",
-    0x6F478B92: "MGMA_NUM_QTITLES",
-    0x6F4EAB94: "N_EDWARD",
-    0x6F518C44: "AS_GS_FAIL",
-    0x6F56D457: "LIBRARY",
-    0x6F5E026F: "AS_TP_COMPLETE",
-    0x6F6005B6: "B_PANTS1",
-    0x6F6005B7: "B_PANTS2",
-    0x6F6005B8: "B_PANTS3",
-    0x6F6005B9: "B_PANTS4",
-    0x6F6005BB: "B_PANTS6",
-    0x6F6005BC: "B_PANTS7",
-    0x6F6005BD: "B_PANTS8",
-    0x6F602FCA: "FE_TOURNEY_SELECTC",
-    0x6F6BFA8D: "TUT_VOLC1",
-    0x6F6BFA8E: "TUT_VOLC2",
-    0x6F787C98: "MGGE_UKRAINE",
-    0x6F89E458: "AS_PETEY_OBJECTIVE",
-    0x6F8C45AC: "AS_JM_COMPLETE",
-    0x6F9276B7: "N_BRANDY",
-    0x6F97BEA7: "TITLE79_NAME10",
-    0x6F97BEA8: "TITLE79_NAME11",
-    0x6F97BEA9: "TITLE79_NAME12",
-    0x6F97BEAA: "TITLE79_NAME13",
-    0x6F97BEAB: "TITLE79_NAME14",
-    0x6F97BEAC: "TITLE79_NAME15",
-    0x6F97BEAD: "TITLE79_NAME16",
-    0x6F97BEAE: "TITLE79_NAME17",
-    0x6F97BEAF: "TITLE79_NAME18",
-    0x6F97BEB0: "TITLE79_NAME19",
-    0x6F97BF2A: "TITLE79_NAME20",
-    0x6F97BF2B: "TITLE79_NAME21",
-    0x6F97BF2C: "TITLE79_NAME22",
-    0x6F97BF2D: "TITLE79_NAME23",
-    0x6F97BF2E: "TITLE79_NAME24",
-    0x6F97BF2F: "TITLE79_NAME25",
-    0x6F97BF30: "TITLE79_NAME26",
-    0x6FAF5D06: "3_05_TITLE",
-    0x6FBDF557: "4_G4_19",
-    0x6FBDF5D1: "4_G4_20",
-    0x6FBE0114: "4_G4_H1",
-    0x6FBF644A: "4_04_RESPECT",
-    0x6FCADF46: "3_05_OLEAVE",
-    0x6FD65A46: "HUD_DISP",
-    0x6FEF53A2: "MGM2_SCORE",
-    0x700D7957: "AS_SK_OBJECTIVE",
-    0x701E164F: "HUD_FULL",
-    0x7021ED1E: "4-06.SUB0001",
-    0x7021ED1F: "4-06.SUB0002",
-    0x7021ED20: "4-06.SUB0003",
-    0x7021ED21: "4-06.SUB0004",
-    0x7021ED22: "4-06.SUB0005",
-    0x7021ED23: "4-06.SUB0006",
-    0x7021ED24: "4-06.SUB0007",
-    0x7021ED25: "4-06.SUB0008",
-    0x7021ED26: "4-06.SUB0009",
-    0x7021EDA0: "4-06.SUB0010",
-    0x7021EDA1: "4-06.SUB0011",
-    0x7021EDA2: "4-06.SUB0012",
-    0x7021EDA3: "4-06.SUB0013",
-    0x7021EDA4: "4-06.SUB0014",
-    0x7021EDA5: "4-06.SUB0015",
-    0x7021EDA6: "4-06.SUB0016",
-    0x7021EDA7: "4-06.SUB0017",
-    0x7021EDA8: "4-06.SUB0018",
-    0x7021EDA9: "4-06.SUB0019",
-    0x7021EE23: "4-06.SUB0020",
-    0x7021EE24: "4-06.SUB0021",
-    0x7021EE25: "4-06.SUB0022",
-    0x7021EE26: "4-06.SUB0023",
-    0x7021EE27: "4-06.SUB0024",
-    0x702CF9CF: "1_02_WII_FTUT10",
-    0x702CF9D0: "1_02_WII_FTUT11",
-    0x702CFA63: "1_02_WII_FTUT2A",
-    0x702CFC6F: "1_02_WII_FTUT6A",
-    0x702CFCF2: "1_02_WII_FTUT7A",
-    0x7040E1FE: "B_SNEAKERS10",
-    0x7040E1FF: "B_SNEAKERS11",
-    0x7040E200: "B_SNEAKERS12",
-    0x7040E201: "B_SNEAKERS13",
-    0x70465A0E: "BUTTON_START_D",
-    0x70465A22: "BUTTON_START_X",
-    0x705538E5: "TITLE66_NAME10",
-    0x705538E6: "TITLE66_NAME11",
-    0x705538E7: "TITLE66_NAME12",
-    0x705538E8: "TITLE66_NAME13",
-    0x705538E9: "TITLE66_NAME14",
-    0x705538EA: "TITLE66_NAME15",
-    0x705538EB: "TITLE66_NAME16",
-    0x705538EC: "TITLE66_NAME17",
-    0x705538ED: "TITLE66_NAME18",
-    0x705538EE: "TITLE66_NAME19",
-    0x70553968: "TITLE66_NAME20",
-    0x70553969: "TITLE66_NAME21",
-    0x7055396A: "TITLE66_NAME22",
-    0x7055396B: "TITLE66_NAME23",
-    0x7055396C: "TITLE66_NAME24",
-    0x7055396D: "TITLE66_NAME25",
-    0x7055396E: "TITLE66_NAME26",
-    0x7055396F: "TITLE66_NAME27",
-    0x70553970: "TITLE66_NAME28",
-    0x70553971: "TITLE66_NAME29",
-    0x705539EB: "TITLE66_NAME30",
-    0x7059598B: "MGGE_REPUBLIC OF THE CONGO",
-    0x705AF800: "NAND_06_WII",
-    0x706C14FE: "AS_PB_ACTION",
-    0x707D41C2: "TITLE54_NUMNAMES",
-    0x708F18BA: "UNLOCALIZED_HACK",
-    0x7095EFF7: "BUT_TAGGING",
-    0x70996224: "FESZ_QD",
-    0x7099622C: "FESZ_QL",
-    0x7099622F: "FESZ_QO",
-    0x70996233: "FESZ_QS",
-    0x70996544: "FESZ_WR",
-    0x70A41BA6: "MGPH_TORSO",
-    0x70B46F08: "SP_WRESTLING_H",
-    0x70B46F0C: "SP_WRESTLING_L",
-    0x70B46F14: "SP_WRESTLING_T",
-    0x70BB8F05: "4_01_TITLE",
-    0x70C02C52: "N_HECTOR",
-    0x70C4D160: "2_05_FAIL01",
-    0x70C4D161: "2_05_FAIL02",
-    0x70CC7699: "FE_LOSER",
-    0x70E45090: "UH_ENGLISH",
-    0x70EA916A: "MGCA_INSTRUCTIONS_CLEAR_DESC",
-    0x70F42F90: "4-B2.SUB0001",
-    0x70F42F91: "4-B2.SUB0002",
-    0x70F42F92: "4-B2.SUB0003",
-    0x70F42F93: "4-B2.SUB0004",
-    0x70F42F94: "4-B2.SUB0005",
-    0x70F42F95: "4-B2.SUB0006",
-    0x70F42F96: "4-B2.SUB0007",
-    0x70F42F97: "4-B2.SUB0008",
-    0x70FABF88: "CRIME_TAGGING",
-    0x710DB048: "MGCA_CLEAR_NAME",
-    0x7112B323: "TITLE53_NAME10",
-    0x7112B324: "TITLE53_NAME11",
-    0x7112B325: "TITLE53_NAME12",
-    0x7112B326: "TITLE53_NAME13",
-    0x7112B327: "TITLE53_NAME14",
-    0x7112B328: "TITLE53_NAME15",
-    0x7112B329: "TITLE53_NAME16",
-    0x7112B32A: "TITLE53_NAME17",
-    0x7112B32B: "TITLE53_NAME18",
-    0x7112B32C: "TITLE53_NAME19",
-    0x7112B3A6: "TITLE53_NAME20",
-    0x7112B3A7: "TITLE53_NAME21",
-    0x7112B3A8: "TITLE53_NAME22",
-    0x7112B3A9: "TITLE53_NAME23",
-    0x7112B3AA: "TITLE53_NAME24",
-    0x7112B3AB: "TITLE53_NAME25",
-    0x712C7E9B: "EXIT_QUESTION",
-    0x7138ACF5: "MAP_EXIT",
-    0x713D8B97: "FES_CFM",
-    0x7140718B: "FES_NOC",
-    0x714534FE: "AS_ED_OBJECTIVE",
-    0x714DE3EC: "TITLE28_NAME0",
-    0x714DE3ED: "TITLE28_NAME1",
-    0x7151DC33: "N_DOBERMAN",
-    0x715D0A66: "PUNWARN1",
-    0x715D0A67: "PUNWARN2",
-    0x715D0A68: "PUNWARN3",
-    0x716DAA99: "SOC_G_GREET",
-    0x71734CAF: "HUD_PNSH",
-    0x71748E1B: "3_04_MOBJ_01",
-    0x71748E1C: "3_04_MOBJ_02",
-    0x71748E1D: "3_04_MOBJ_03",
-    0x71748E1E: "3_04_MOBJ_04",
-    0x71748E1F: "3_04_MOBJ_05",
-    0x71B6EDBC: "MGG2_EXIT",
-    0x71B6F725: "N_GLORIA",
-    0x71BC3FD8: "6-BD.SUB0001",
-    0x71BC3FD9: "6-BD.SUB0002",
-    0x71BC3FDA: "6-BD.SUB0003",
-    0x71BC3FDB: "6-BD.SUB0004",
-    0x71BC3FDC: "6-BD.SUB0005",
-    0x71BC3FDD: "6-BD.SUB0006",
-    0x71BC3FDE: "6-BD.SUB0007",
-    0x71BC3FDF: "6-BD.SUB0008",
-    0x71BC3FE0: "6-BD.SUB0009",
-    0x71BC405A: "6-BD.SUB0010",
-    0x71BC405B: "6-BD.SUB0011",
-    0x71BC405C: "6-BD.SUB0012",
-    0x71BC405D: "6-BD.SUB0013",
-    0x71BC405E: "6-BD.SUB0014",
-    0x71BC405F: "6-BD.SUB0015",
-    0x71BC4060: "6-BD.SUB0016",
-    0x71BC4061: "6-BD.SUB0017",
-    0x71BC4062: "6-BD.SUB0018",
-    0x71BC4063: "6-BD.SUB0019",
-    0x71BC40DD: "6-BD.SUB0020",
-    0x71BC40DE: "6-BD.SUB0021",
-    0x71BC40DF: "6-BD.SUB0022",
-    0x71BC40E0: "6-BD.SUB0023",
-    0x71BC40E1: "6-BD.SUB0024",
-    0x71BC40E2: "6-BD.SUB0025",
-    0x71BC40E3: "6-BD.SUB0026",
-    0x71C553F7: "3-S03.SUB0001",
-    0x71C553F8: "3-S03.SUB0002",
-    0x71C553F9: "3-S03.SUB0003",
-    0x71C553FA: "3-S03.SUB0004",
-    0x71C553FB: "3-S03.SUB0005",
-    0x71C553FC: "3-S03.SUB0006",
-    0x71C553FD: "3-S03.SUB0007",
-    0x71C553FE: "3-S03.SUB0008",
-    0x71C553FF: "3-S03.SUB0009",
-    0x71C55479: "3-S03.SUB0010",
-    0x71C5547A: "3-S03.SUB0011",
-    0x71C5547B: "3-S03.SUB0012",
-    0x71C5547C: "3-S03.SUB0013",
-    0x71C5547D: "3-S03.SUB0014",
-    0x71C5547E: "3-S03.SUB0015",
-    0x71D34D44: "GKART_NEXTTIME",
-    0x71D698C3: "SP_GNOME_FT",
-    0x71D82177: "2_G2_FAIL_01",
-    0x71D82178: "2_G2_FAIL_02",
-    0x71D82179: "2_G2_FAIL_03",
-    0x71D8217A: "2_G2_FAIL_04",
-    0x71D8217B: "2_G2_FAIL_05",
-    0x71E1D215: "MAP_JOBS",
-    0x71E63BC8: "AUTH_WARN1",
-    0x71E63BC9: "AUTH_WARN2",
-    0x71E63BCA: "AUTH_WARN3",
-    0x71E688EE: "P_DETAILS1",
-    0x71E688EF: "P_DETAILS2",
-    0x71E6D68E: "3_R08_MENU_A",
-    0x71E6D68F: "3_R08_MENU_B",
-    0x71E76E3C: "CLT_COLUMBUS",
-    0x71EC9D5B: "AS_P8_OBJECTIVE",
-    0x72052B4A: "",
-    0x72052B4B: "",
-    0x72052B4C: "",
-    0x72052B4D: "",
-    0x72052B4E: "",
-    0x72052B4F: "",
-    0x72052B50: "",
-    0x72052B51: "",
-    0x720C2495: "DESC_GREAS_MED_01",
-    0x722E1D0F: "MGPH_YELLOWBEAKER",
-    0x722E9BFC: "TITLE38_NUMNAMES",
-    0x72329D3B: "",
-    0x723465A4: "AS_SP_OBJECTIVE",
-    0x723682DF: "2_01_O1",
-    0x723682E0: "2_01_O2",
-    0x723682E1: "2_01_O3",
-    0x723682E2: "2_01_O4",
-    0x723682E3: "2_01_O5",
-    0x723D8440: "MGG2_INFO",
-    0x7245CAA5: "RARC_LOADING",
-    0x724622B2: "MAP_MENU",
-    0x72549D6B: "4_05_FAIL_01",
-    0x72549D6C: "4_05_FAIL_02",
-    0x72628152: "CLT_SWITCH2",
-    0x72696007: "MGE2_T7G01W01",
-    0x72696008: "MGE2_T7G01W02",
-    0x72696009: "MGE2_T7G01W03",
-    0x7269600A: "MGE2_T7G01W04",
-    0x7269600B: "MGE2_T7G01W05",
-    0x7269600C: "MGE2_T7G01W06",
-    0x7269600D: "MGE2_T7G01W07",
-    0x7269600E: "MGE2_T7G01W08",
-    0x7269600F: "MGE2_T7G01W09",
-    0x72696089: "MGE2_T7G01W10",
-    0x7269608A: "MGE2_T7G01W11",
-    0x7269608B: "MGE2_T7G01W12",
-    0x7269608C: "MGE2_T7G01W13",
-    0x7269608D: "MGE2_T7G01W14",
-    0x7269608E: "MGE2_T7G01W15",
-    0x7269608F: "MGE2_T7G01W16",
-    0x72696090: "MGE2_T7G01W17",
-    0x72696091: "MGE2_T7G01W18",
-    0x72696092: "MGE2_T7G01W19",
-    0x7269610C: "MGE2_T7G01W20",
-    0x7269610D: "MGE2_T7G01W21",
-    0x7269610E: "MGE2_T7G01W22",
-    0x7269610F: "MGE2_T7G01W23",
-    0x72696110: "MGE2_T7G01W24",
-    0x72696111: "MGE2_T7G01W25",
-    0x72696112: "MGE2_T7G01W26",
-    0x72696113: "MGE2_T7G01W27",
-    0x72696114: "MGE2_T7G01W28",
-    0x72696115: "MGE2_T7G01W29",
-    0x7269618F: "MGE2_T7G01W30",
-    0x72696190: "MGE2_T7G01W31",
-    0x72696191: "MGE2_T7G01W32",
-    0x72696192: "MGE2_T7G01W33",
-    0x72696193: "MGE2_T7G01W34",
-    0x72696194: "MGE2_T7G01W35",
-    0x72696195: "MGE2_T7G01W36",
-    0x72696196: "MGE2_T7G01W37",
-    0x72696197: "MGE2_T7G01W38",
-    0x72696198: "MGE2_T7G01W39",
-    0x72696212: "MGE2_T7G01W40",
-    0x72696213: "MGE2_T7G01W41",
-    0x72696214: "MGE2_T7G01W42",
-    0x72696215: "MGE2_T7G01W43",
-    0x72696216: "MGE2_T7G01W44",
-    0x72696217: "MGE2_T7G01W45",
-    0x72696218: "MGE2_T7G01W46",
-    0x72696219: "MGE2_T7G01W47",
-    0x7269621A: "MGE2_T7G01W48",
-    0x7269621B: "MGE2_T7G01W49",
-    0x72696295: "MGE2_T7G01W50",
-    0x726B18A4: "TITLE13_NAME0",
-    0x726B18A5: "TITLE13_NAME1",
-    0x726B18A6: "TITLE13_NAME2",
-    0x726B2C6A: "RACE_NOTIMER",
-    0x727B0EBB: "2_03_11",
-    0x727B0F3F: "2_03_22",
-    0x727B0F41: "2_03_24",
-    0x727B0F42: "2_03_25",
-    0x7283BE9F: "MRESPECT_DP100",
-    0x728E194D: "GIFT_GKART1",
-    0x728E194E: "GIFT_GKART2",
-    0x728E194F: "GIFT_GKART3",
-    0x728E1950: "GIFT_GKART4",
-    0x728E1951: "GIFT_GKART5",
-    0x729A2A5E: "C2_BUCKY",
-    0x729E1BB1: "N_CRYSTAL",
-    0x72A2FC72: "S_GREET_GIRL_01",
-    0x72AE364C: "MGPH_FRONTTIRE",
-    0x72AF7ABF: "AVOID_TEXT",
-    0x72B7462A: "AS_AE_LOST",
-    0x72BFA96F: "2_05_02",
-    0x72BFA976: "2_05_09",
-    0x72BFAA7C: "2_05_29",
-    0x72BFABFC: "2_05_50",
-    0x72BFAC02: "2_05_56",
-    0x72BFAC80: "2_05_61",
-    0x72BFAC81: "2_05_62",
-    0x72BFAC82: "2_05_63",
-    0x72BFAC83: "2_05_64",
-    0x72C6B37C: "FELD_CO",
-    0x72C6B912: "FELD_ND",
-    0x72C6BDBB: "FELD_WR",
-    0x72C7F014: "3_01_RESPECTP",
-    0x72C93E55: "MGGE_COLUMBIA",
-    0x72CB90F9: "4-01.SUB0001",
-    0x72CB90FA: "4-01.SUB0002",
-    0x72CB90FB: "4-01.SUB0003",
-    0x72CB90FC: "4-01.SUB0004",
-    0x72CB90FD: "4-01.SUB0005",
-    0x72CB90FE: "4-01.SUB0006",
-    0x72CB90FF: "4-01.SUB0007",
-    0x72CB9100: "4-01.SUB0008",
-    0x72CB9101: "4-01.SUB0009",
-    0x72CB917B: "4-01.SUB0010",
-    0x72CB917C: "4-01.SUB0011",
-    0x72CB917D: "4-01.SUB0012",
-    0x72CB917E: "4-01.SUB0013",
-    0x72CB917F: "4-01.SUB0014",
-    0x72CB9180: "4-01.SUB0015",
-    0x72CB9181: "4-01.SUB0016",
-    0x72CB9182: "4-01.SUB0017",
-    0x72CB9183: "4-01.SUB0018",
-    0x72CB9184: "4-01.SUB0019",
-    0x72CB91FE: "4-01.SUB0020",
-    0x72CB91FF: "4-01.SUB0021",
-    0x72CC995C: "AS_SB_COMPLETE",
-    0x72D3FEF7: "AS_MA_FAILED",
-    0x72F66512: "CLT_MBAND",
-    0x72F81D58: "BARB_COLOUR",
-    0x730E27EB: "3_R08_BWVLC",
-    0x731603A7: "MGA2_X_TO_RESPAWN",
-    0x7348DFDA: "2_09_01",
-    0x734E5D0D: "FES_INVC",
-    0x73538284: "MGA2_INSTRUCTIONS_REVERSAL_DESC",
-    0x736C214B: "AS_EI_OBJECTIVE",
-    0x736FFA16: "VOLMSC",
-    0x737185BA: "VOLSFX",
-    0x73722CC5: "R_SSHAG",
-    0x737B6F50: "USE_DSBL_MNRS",
-    0x737F7DD6: "C2_PREPTAD",
-    0x738034BF: "TITLE74_NAME0",
-    0x738034C0: "TITLE74_NAME1",
-    0x738AFECC: "C2_YOULOSE",
-    0x7392CF70: "AS_CN_COMPLETE",
-    0x73987C06: "FE_CURR_TASK",
-    0x73A3D18C: "FESA_CONTROLS_YN",
-    0x73B58E47: "MGG2_TIME",
-    0x73D61C7C: "2_01_OGETREMAIN",
-    0x73E67634: "DISPASP",
-    0x73EE4A9E: "DISP_FS",
-    0x73EE5351: "DISP_WS",
-    0x7404FA2E: "AS_NO_TIME",
-    0x7406B266: "MAP_ZOOM",
-    0x741BA625: "2_08_PLANT",
-    0x742CEC37: "AS_AE_WAIT",
-    0x7439123C: "DESC_PREP_MED_01",
-    0x743BD143: "MAP_TASKS",
-    0x743E2867: "4_02_CODE",
-    0x74479C8D: "MGGE_MONTANA",
-    0x7448F75C: "MGCE_T5G01W01",
-    0x7448F75D: "MGCE_T5G01W02",
-    0x7448F75E: "MGCE_T5G01W03",
-    0x7448F75F: "MGCE_T5G01W04",
-    0x7448F760: "MGCE_T5G01W05",
-    0x7448F761: "MGCE_T5G01W06",
-    0x7448F762: "MGCE_T5G01W07",
-    0x7448F763: "MGCE_T5G01W08",
-    0x7448F764: "MGCE_T5G01W09",
-    0x7448F7DE: "MGCE_T5G01W10",
-    0x7448F7DF: "MGCE_T5G01W11",
-    0x7448F7E0: "MGCE_T5G01W12",
-    0x7448F7E1: "MGCE_T5G01W13",
-    0x7448F7E2: "MGCE_T5G01W14",
-    0x7448F7E3: "MGCE_T5G01W15",
-    0x7448F7E4: "MGCE_T5G01W16",
-    0x7448F7E5: "MGCE_T5G01W17",
-    0x7448F7E6: "MGCE_T5G01W18",
-    0x7448F7E7: "MGCE_T5G01W19",
-    0x7448F861: "MGCE_T5G01W20",
-    0x7448F862: "MGCE_T5G01W21",
-    0x7448F863: "MGCE_T5G01W22",
-    0x7448F864: "MGCE_T5G01W23",
-    0x7448F865: "MGCE_T5G01W24",
-    0x7448F866: "MGCE_T5G01W25",
-    0x7448F867: "MGCE_T5G01W26",
-    0x7448F868: "MGCE_T5G01W27",
-    0x7448F869: "MGCE_T5G01W28",
-    0x7448F86A: "MGCE_T5G01W29",
-    0x7448F8E4: "MGCE_T5G01W30",
-    0x7448F8E5: "MGCE_T5G01W31",
-    0x7448F8E6: "MGCE_T5G01W32",
-    0x7448F8E7: "MGCE_T5G01W33",
-    0x7448F8E8: "MGCE_T5G01W34",
-    0x7448F8E9: "MGCE_T5G01W35",
-    0x7448F8EA: "MGCE_T5G01W36",
-    0x7448F8EB: "MGCE_T5G01W37",
-    0x7448F8EC: "MGCE_T5G01W38",
-    0x7448F8ED: "MGCE_T5G01W39",
-    0x7448F967: "MGCE_T5G01W40",
-    0x7448F968: "MGCE_T5G01W41",
-    0x7448F969: "MGCE_T5G01W42",
-    0x7448F96A: "MGCE_T5G01W43",
-    0x7448F96B: "MGCE_T5G01W44",
-    0x7448F96C: "MGCE_T5G01W45",
-    0x7448F96D: "MGCE_T5G01W46",
-    0x7448F96E: "MGCE_T5G01W47",
-    0x7448F96F: "MGCE_T5G01W48",
-    0x7448F970: "MGCE_T5G01W49",
-    0x7448F9EA: "MGCE_T5G01W50",
-    0x7450F38E: "AS_LK_OBJCOUNT1",
-    0x74558849: "TITLE88_NUMNAMES",
-    0x74562822: "PER_CURFEW",
-    0x745C89DD: "CRIME_WEAPONCARRIED",
-    0x746191BD: "N_BETTY",
-    0x7479DF5C: "MGGE_NEWYORK",
-    0x74867332: "S_APOL_LOW_AUTH_01",
-    0x7493EDED: "ERR_OVERWRITE",
-    0x749CEF2C: "MGGE_CHINA",
-    0x749E35E0: "COL_GG_CARD",
-    0x74A457B5: "FE_NOTASKS",
-    0x74A81A8E: "FEO_MOUSE",
-    0x74A8B486: "2_GN_EMPTY",
-    0x74B7B8E0: "CLT_MONEY",
-    0x74C824D3: "AS_CANCEL",
-    0x74DAB631: "W_CAMERA",
-    0x74E4DE99: "CRIME_INTSMALL",
-    0x74EF448F: "DIBUTTON_MOVEMENT",
-    0x74F06D54: "BUTTON_GETUP",
-    0x74F66CE3: "MGGE_INDIANA",
-    0x74F95D99: "TITLE51_NUMNAMES",
-    0x74FC39D4: "MGGE_IRELAND",
-    0x74FE1A98: "MRESPECT_DFRIEND",
-    0x7506C8A3: "UNDERWATER",
-    0x75200397: "M_FAIL_DEAD",
-    0x7523F817: "AS_SP_FAIL",
-    0x7535B713: "3_01_HITGORD",
-    0x75375B44: "MC_INST01",
-    0x7537AADC: "1_01_TITLE",
-    0x753F27F4: "USE_FORTUNEHINT",
-    0x75426FF8: "LABEL_BIKE",
-    0x754CD3FE: "MGB2_FROG_0",
-    0x754CD3FF: "MGB2_FROG_1",
-    0x754CD400: "MGB2_FROG_2",
-    0x754CD401: "MGB2_FROG_3",
-    0x754CD402: "MGB2_FROG_4",
-    0x754CD403: "MGB2_FROG_5",
-    0x754CD404: "MGB2_FROG_6",
-    0x754CD405: "MGB2_FROG_7",
-    0x754CD406: "MGB2_FROG_8",
-    0x754CD407: "MGB2_FROG_9",
-    0x755394DA: "2_09_OBJECTIVE2",
-    0x755A5309: "4_04_FINDFATTY",
-    0x75724015: "3_01A_WARNING2",
-    0x7576B424: "5_03_RESPECT",
-    0x758018BE: "5_09_OTAGCITY",
-    0x759C9AD0: "3_01_HITJOHN",
-    0x75A64271: "UH_BIOLOGY",
-    0x75AECCB1: "ITEM_100",
-    0x75AECCB2: "ITEM_101",
-    0x75AECCB3: "ITEM_102",
-    0x75AECCB4: "ITEM_103",
-    0x75AECCB5: "ITEM_104",
-    0x75AECCB6: "ITEM_105",
-    0x75AECCB7: "ITEM_106",
-    0x75AECCB8: "ITEM_107",
-    0x75C39A4F: "TUT_BULLY01",
-    0x75CD3AB5: "LABEL_FOOT",
-    0x75CE26CF: "FE_CONTINUE",
-    0x75D93CF8: "5-05.SUB0001",
-    0x75D93CF9: "5-05.SUB0002",
-    0x75D93CFA: "5-05.SUB0003",
-    0x75D93CFB: "5-05.SUB0004",
-    0x75D93CFC: "5-05.SUB0005",
-    0x75D93CFD: "5-05.SUB0006",
-    0x75D93CFE: "5-05.SUB0007",
-    0x75D93CFF: "5-05.SUB0008",
-    0x75D93D00: "5-05.SUB0009",
-    0x75D93D7A: "5-05.SUB0010",
-    0x75D93D7B: "5-05.SUB0011",
-    0x75D93D7C: "5-05.SUB0012",
-    0x75D93D7D: "5-05.SUB0013",
-    0x75D93D7E: "5-05.SUB0014",
-    0x75D93D7F: "5-05.SUB0015",
-    0x75D93D80: "5-05.SUB0016",
-    0x75D93D81: "5-05.SUB0017",
-    0x75D93D82: "5-05.SUB0018",
-    0x75E13805: "3_01_HITLOLA",
-    0x75E7C487: "MGT_ENGLISH",
-    0x75FBAD59: "2_S06_TITLE",
-    0x76107328: "SOC_GEN_GIVE",
-    0x7610EBDC: "CHAPTER1",
-    0x7610EBDD: "CHAPTER2",
-    0x7610EBDE: "CHAPTER3",
-    0x7610EBDF: "CHAPTER4",
-    0x7610EBE0: "CHAPTER5",
-    0x7610EBE1: "CHAPTER6",
-    0x7610EBE2: "CHAPTER7",
-    0x761568AC: "B_JERSEY1",
-    0x761568AE: "B_JERSEY3",
-    0x761568AF: "B_JERSEY4",
-    0x761568B0: "B_JERSEY5",
-    0x761568B1: "B_JERSEY6",
-    0x761568B2: "B_JERSEY7",
-    0x761568B3: "B_JERSEY8",
-    0x761568B4: "B_JERSEY9",
-    0x7620C902: "N_BRYCE",
-    0x76248E87: "3_05_OENTER",
-    0x76341C74: "SM_BIOL1",
-    0x76341C75: "SM_BIOL2",
-    0x76341C76: "SM_BIOL3",
-    0x76341C77: "SM_BIOL4",
-    0x76341C78: "SM_BIOL5",
-    0x7635834E: "CLASSES",
-    0x7637ADBB: "MGGE_GEORGIA",
-    0x763A75F5: "AS_PB_OBJECTIVE",
-    0x763CE49D: "5_05_MEETZOE2",
-    0x76404B82: "TPM_EXITTOURNEY",
-    0x764EFBA9: "REVERSAL_TRIANGLE",
-    0x764F794F: "DT_CARNIE_01",
-    0x764F7950: "DT_CARNIE_02",
-    0x764F7951: "DT_CARNIE_03",
-    0x765D910D: "AS_EG_COMPLETE",
-    0x765E1984: "FEL_ENG",
-    0x765E1AEE: "S_APOL_LOW_GEN_01",
-    0x765E5E97: "FEL_FRE",
-    0x765E9B06: "FEL_GER",
-    0x765F28B4: "FEL_ITA",
-    0x7660F858: "FEL_PIG",
-    0x7661C502: "FEL_SPA",
-    0x7664B8E7: "MGGE_YEMEN",
-    0x766E1467: "AS_PI_FAIL",
-    0x766F95FD: "SP_WEREWOLF",
-    0x7678034B: "H1-10",
-    0x76818EAD: "MGT_NUTSHOTS_FE",
-    0x7681F339: "N_BUCKY",
-    0x76882961: "4_02_KILLDOORS",
-    0x768CF5EA: "D_CBOMB",
-    0x769507AF: "CHAPT1TRANS_BFRIENDS",
-    0x769671A7: "MGGE_MASSACHUSETTS",
-    0x769F0A40: "3_01A_TEXT_01",
-    0x769F0A41: "3_01A_TEXT_02",
-    0x769F0A42: "3_01A_TEXT_03",
-    0x769F0A43: "3_01A_TEXT_04",
-    0x76AAB7D3: "TITLE35_NUMNAMES",
-    0x76AFD644: "MSN_RESTART",
-    0x76B3805E: "P_SSLEEVES10",
-    0x76B3805F: "P_SSLEEVES11",
-    0x76B38060: "P_SSLEEVES12",
-    0x76B38061: "P_SSLEEVES13",
-    0x76B38062: "P_SSLEEVES14",
-    0x76B42C50: "TITLE46_NAME0",
-    0x76B42C51: "TITLE46_NAME1",
-    0x76B6A25E: "MC2P_BEGIN",
-    0x76C289B6: "STAFF_ROOM",
-    0x76D32320: "AS_LC_COMPLETE",
-    0x76DCAF7E: "SOC_G_BACKUP",
-    0x76E6C227: "LMOW_SCORENAME",
-    0x76EE0C13: "AS_CH_ACTION",
-    0x76F08650: "P_PANTS1",
-    0x76F08651: "P_PANTS2",
-    0x76F08652: "P_PANTS3",
-    0x76F08653: "P_PANTS4",
-    0x76F08654: "P_PANTS5",
-    0x76F08655: "P_PANTS6",
-    0x76F08656: "P_PANTS7",
-    0x76F32FEA: "TUT_TRANX01",
-    0x76F32FEB: "TUT_TRANX02",
-    0x76FB67CD: "2_02_EMPTY",
-    0x7706CE4E: "5_T1_FAIL_01",
-    0x7706CE4F: "5_T1_FAIL_02",
-    0x7706CE50: "5_T1_FAIL_03",
-    0x7714B3C9: "MGGE_NORWAY",
-    0x77264CAE: "L1_VEHICLE",
-    0x7731921D: "GKART_WINRACE",
-    0x773D4E93: "MGPH_GARGOYLE",
-    0x773F3BC7: "BOXINGRING",
-    0x77887DE3: "4_S12_PHILIPS_HURT",
-    0x77998BCA: "MGPH_REDBEAKER",
-    0x77AABA5D: "1_08_RESPECT",
-    0x77AEFBE1: "AS_ST_RETURN",
-    0x77B9F9E5: "AS_ES_OBJECTIVE",
-    0x77BC7CD8: "FE_DISPLAY_SETTINGS",
-    0x77CE5F1B: "MGGE_PANAMA",
-    0x77D16108: "TITLE31_NAME0",
-    0x77D16109: "TITLE31_NAME1",
-    0x77D1610A: "TITLE31_NAME2",
-    0x77D1610B: "TITLE31_NAME3",
-    0x77D1610C: "TITLE31_NAME4",
-    0x77D1610D: "TITLE31_NAME5",
-    0x77D1610E: "TITLE31_NAME6",
-    0x77E012F5: "FE_ATTRACT_TIP",
-    0x77EC8A83: "AS_P8_COMPLETE",
-    0x77F1BB27: "PUN_01",
-    0x77F1BB28: "PUN_02",
-    0x77F1BB29: "PUN_03",
-    0x77F1BB2A: "PUN_04",
-    0x78079D0E: "3_S08_FAIL_01",
-    0x7807E42F: "4_G4_RESPECT",
-    0x780F85D4: "MC2P_BONUS",
-    0x781126B4: "SOC_GRL_DISMISS",
-    0x7815C5FB: "GREETHOPKINS",
-    0x7818A708: "3_R09_NFAIL",
-    0x782EF92A: "CHAPT3TRANS_BLANK",
-    0x78333490: "SOC_GEN_WAVE",
-    0x78341031: "FEM_LOAD_HEADER",
-    0x78344DCB: "1_11X1_GHEALTH",
-    0x783723BF: "FUN_MTR_GOBLIN",
-    0x7838472B: "BUT_STORE",
-    0x78389A42: "4_06_TITLE",
-    0x785C120D: "TITLE19_NUMNAMES",
-    0x7871993A: "3_R07_TITLE",
-    0x788911A3: "MGGE_YUKON",
-    0x789DEBB9: "2_R11_BRYCE_NAME",
-    0x78B61B3D: "CLT_COST",
-    0x78CB17E0: "MGBI_RAT_0",
-    0x78CB17E1: "MGBI_RAT_1",
-    0x78CB17E2: "MGBI_RAT_2",
-    0x78CB17E3: "MGBI_RAT_3",
-    0x78CB17E4: "MGBI_RAT_4",
-    0x78CB17E5: "MGBI_RAT_5",
-    0x78CB17E6: "MGBI_RAT_6",
-    0x78CB17E7: "MGBI_RAT_7",
-    0x78CB17E8: "MGBI_RAT_8",
-    0x78CB17E9: "MGBI_RAT_9",
-    0x78D1A420: "TITLE85_NUMNAMES",
-    0x78D5372F: "1_02B_RUSSELL_01",
-    0x78D53730: "1_02B_RUSSELL_02",
-    0x78D53731: "1_02B_RUSSELL_03",
-    0x78D93489: "MGGE_S_DAKOTA",
-    0x78E60DAE: "TPM_QUIT2MAIN",
-    0x78E67518: "MGGE_NEW HAMPSHIRE",
-    0x78EC058B: "STO_BSAME",
-    0x78FD0CA6: "CLT_EXIT",
-    0x78FE34F2: "FEM_NOT_PRESENT",
-    0x78FF7887: "BOXING_R01",
-    0x78FF7888: "BOXING_R02",
-    0x78FF7889: "BOXING_R03",
-    0x78FF788A: "BOXING_R04",
-    0x78FF788B: "BOXING_R05",
-    0x78FF788C: "BOXING_R06",
-    0x78FF788D: "BOXING_R07",
-    0x78FF788E: "BOXING_R08",
-    0x78FF788F: "BOXING_R09",
-    0x78FF7909: "BOXING_R10",
-    0x78FF790A: "BOXING_R11",
-    0x78FF790B: "BOXING_R12",
-    0x7900C439: "5_05_LEFTPARK",
-    0x790926C7: "SP_MUSCLESHIRT",
-    0x791A5E8A: "CLT_FEET",
-    0x7932520E: "2_06_TALK_TO_PINKY",
-    0x793C6299: "MGPH_GOGGLES",
-    0x793D1D29: "TUT_DOLFIST",
-    0x7944CC41: "5_02_TITLE",
-    0x794E3BC5: "MGCA_INSTRUCTIONS_BODY",
-    0x7956527D: "MGLOCK_INST1",
-    0x795EF7A4: "CLT_HEAD",
-    0x7962B1CE: "AUTO_SHOP",
-    0x796E5B29: "SP_OPO_H",
-    0x79726ECA: "RETRY_Q",
-    0x7980A13B: "C2_THAD",
-    0x7982354D: "",
-    0x798DA246: "MGPH_FETUS",
-    0x799E769B: "MGCA_INITIAL_TEXT",
-    0x79AFE772: "GKART_RACES",
-    0x79B1BC99: "CN_CHEM",
-    0x79C1FE26: "MGPH_CAMERA",
-    0x79CC9819: "2_G2_FLOWERTUT",
-    0x79D2EFFE: "AS_SA2_ACTION",
-    0x79DEA8B4: "START_NOM_P",
-    0x79E02B96: "START_NOSAV",
-    0x79E02EB9: "S_TAUNT_GEN_01",
-    0x79E2F9FC: "CLT_L1R1",
-    0x79E3AD42: "MGA2_INSTRUCTIONS_FLOATER_BOUNCER_DESC",
-    0x79E74508: "FEO_FPINV",
-    0x79E823E1: "TITLE18_NAME0",
-    0x79E823E2: "TITLE18_NAME1",
-    0x79E823E3: "TITLE18_NAME2",
-    0x79E830AF: "CLT_LEFT",
-    0x79E83131: "CLT_LEGS",
-    0x79EACC6A: "CLT_LOAD",
-    0x79FF6275: "W_SLING",
-    0x7A0565B4: "DPADR_VEHICLE",
-    0x7A07DB33: "",
-    0x7A161414: "2_08_PESTICIDE",
-    0x7A1AFFE0: "3_XM_SLEIGH",
-    0x7A1EC476: "DPADU_BIKE",
-    0x7A1ED3DB: "RACE_WINNOTIFY",
-    0x7A22A00B: "MGA2_INSTRUCTIONS_ENEMIES_HEADING",
-    0x7A2CD1F9: "CLT_NERD",
-    0x7A31A977: "FUN_MTR_DOOR1",
-    0x7A31A978: "FUN_MTR_DOOR2",
-    0x7A31A979: "FUN_MTR_DOOR3",
-    0x7A31A97A: "FUN_MTR_DOOR4",
-    0x7A31A97B: "FUN_MTR_DOOR5",
-    0x7A31A97C: "FUN_MTR_DOOR6",
-    0x7A31A97D: "FUN_MTR_DOOR7",
-    0x7A31A97E: "FUN_MTR_DOOR8",
-    0x7A3B1E10: "TUT_PUNISH1",
-    0x7A3B1E11: "TUT_PUNISH2",
-    0x7A41C449: "WRESTLING_GYM",
-    0x7A4713C3: "AS_FAIL",
-    0x7A556154: "MGCE_T1GROUPS",
-    0x7A5E9565: "3_01_PHOTFLOW",
-    0x7A67DB6E: "MGM2_T2GROUPS",
-    0x7A682477: "3-S10.SUB0001",
-    0x7A682478: "3-S10.SUB0002",
-    0x7A682479: "3-S10.SUB0003",
-    0x7A68247A: "3-S10.SUB0004",
-    0x7A68247B: "3-S10.SUB0005",
-    0x7A68247C: "3-S10.SUB0006",
-    0x7A68247D: "3-S10.SUB0007",
-    0x7A68247E: "3-S10.SUB0008",
-    0x7A68247F: "3-S10.SUB0009",
-    0x7A6824F9: "3-S10.SUB0010",
-    0x7A6824FA: "3-S10.SUB0011",
-    0x7A6824FB: "3-S10.SUB0012",
-    0x7A6824FC: "3-S10.SUB0013",
-    0x7A6824FD: "3-S10.SUB0014",
-    0x7A6824FE: "3-S10.SUB0015",
-    0x7A6824FF: "3-S10.SUB0016",
-    0x7A682500: "3-S10.SUB0017",
-    0x7A6B8D96: "MGGE_ALASKA",
-    0x7A82FE5A: "TITLE69_NUMNAMES",
-    0x7A884E8F: "AS_PL_OBJECTIVE",
-    0x7A8AED9D: "W_SPRAY",
-    0x7A93BA41: "MGPH_CASTLE",
-    0x7A96A799: "4_03_LEAVINGOBS",
-    0x7A9967A9: "MGE2_T11G01WORDS",
-    0x7AA04EA2: "3_01_PHOTHAND",
-    0x7AA38A30: "C2_IDPLAYER",
-    0x7AA3C94F: "1_11X2_MOBJ_01",
-    0x7AA3C950: "1_11X2_MOBJ_02",
-    0x7AA3C951: "1_11X2_MOBJ_03",
-    0x7AA63973: "AS_KP_ACTION",
-    0x7AA98F33: "DPADU_FOOT",
-    0x7AA9B668: "MGT_BIOLOGY",
-    0x7AB140E9: "3_S03_FAIL_01",
-    0x7AB140EA: "3_S03_FAIL_02",
-    0x7AB140EB: "3_S03_FAIL_03",
-    0x7AB6E70C: "1-05.SUB0001",
-    0x7AB6E70D: "1-05.SUB0002",
-    0x7AB6E70E: "1-05.SUB0003",
-    0x7AB6E70F: "1-05.SUB0004",
-    0x7AB6E710: "1-05.SUB0005",
-    0x7AB6E711: "1-05.SUB0006",
-    0x7AB6E712: "1-05.SUB0007",
-    0x7AB6E713: "1-05.SUB0008",
-    0x7AB6E714: "1-05.SUB0009",
-    0x7AB6E78E: "1-05.SUB0010",
-    0x7AB6E78F: "1-05.SUB0011",
-    0x7AB6E790: "1-05.SUB0012",
-    0x7AB6E791: "1-05.SUB0013",
-    0x7AB6E792: "1-05.SUB0014",
-    0x7AB6E793: "1-05.SUB0015",
-    0x7AB6E794: "1-05.SUB0016",
-    0x7AB6E795: "1-05.SUB0017",
-    0x7AB6E796: "1-05.SUB0018",
-    0x7AB6E797: "1-05.SUB0019",
-    0x7AB6E811: "1-05.SUB0020",
-    0x7AB87A45: "VOLSPEECH",
-    0x7AC152CA: "TITLE4_NAME0",
-    0x7AC152CB: "TITLE4_NAME1",
-    0x7ACB4C51: "MGBI_FOOTER",
-    0x7AD74BE9: "CLT_SAVE",
-    0x7AD9ACE4: "AS_ED_COMPLETE",
-    0x7AE3EEF0: "TIRES_DESC1",
-    0x7AE3EEF1: "TIRES_DESC2",
-    0x7AEDA56E: "N_MIHAILOVICH",
-    0x7AF27E90: "AS_LD_ACTION",
-    0x7AF29B7C: "CHAPT5NAME",
-    0x7AF4007E: "3_R09_DODGEBALL",
-    0x7AFD3FFC: "TITLE79_NAME0",
-    0x7AFD3FFD: "TITLE79_NAME1",
-    0x7AFD3FFE: "TITLE79_NAME2",
-    0x7AFD3FFF: "TITLE79_NAME3",
-    0x7AFD4000: "TITLE79_NAME4",
-    0x7AFD4001: "TITLE79_NAME5",
-    0x7AFD4002: "TITLE79_NAME6",
-    0x7AFD4003: "TITLE79_NAME7",
-    0x7AFD4004: "TITLE79_NAME8",
-    0x7AFD4005: "TITLE79_NAME9",
-    0x7B055DD3: "FE_CHOOSE_STORAGE",
-    0x7B095259: "3_01_PHOTKISS",
-    0x7B146535: "BB_EXIT",
-    0x7B182009: "AS_LB_OBJECTIVE",
-    0x7B242E09: "MP_MGL2_INFO",
-    0x7B25CD2C: "4_03_FAILREACH",
-    0x7B26D3AA: "TITLE32_NUMNAMES",
-    0x7B298780: "5_03_024",
-    0x7B298781: "5_03_025",
-    0x7B298784: "5_03_028",
-    0x7B298801: "5_03_032",
-    0x7B298808: "5_03_039",
-    0x7B298882: "5_03_040",
-    0x7B29E6C6: "MG_MUSIC_FE",
-    0x7B361323: "CLT_RICHCLOTH_TITLE",
-    0x7B4EED33: "MAP_RUBBERBANDS",
-    0x7B50BB92: "MGSG_NUMBER",
-    0x7B60590B: "ERR_CORRUPT",
-    0x7B63B3B1: "AS_JM_ACTION",
-    0x7B86CF7D: "USE_GLOBE",
-    0x7B8B87B8: "AS_MA_AMMO",
-    0x7B8F1CCC: "3_R09_D",
-    0x7B8F1CCF: "3_R09_G",
-    0x7B8F1CD2: "3_R09_J",
-    0x7B8F1CD6: "3_R09_N",
-    0x7B8F1CD8: "3_R09_P",
-    0x7B946255: "C4_INST01",
-    0x7B9C10BB: "RACE_LAPH",
-    0x7BABEF79: "N_TOBIASMASON",
-    0x7BC3243E: "MGGE_NEBRASKA",
-    0x7BD69B6A: "CN_SHOP",
-    0x7BDEAE09: "3_06_PEANUTRAN",
-    0x7BEFB9CC: "AS_KP_OBJECTIVE",
-    0x7BF94BF3: "USE_PICKFLOWERS",
-    0x7C014629: "1-B.SUB0001",
-    0x7C01462A: "1-B.SUB0002",
-    0x7C01462B: "1-B.SUB0003",
-    0x7C01462C: "1-B.SUB0004",
-    0x7C01462D: "1-B.SUB0005",
-    0x7C01462E: "1-B.SUB0006",
-    0x7C01462F: "1-B.SUB0007",
-    0x7C014630: "1-B.SUB0008",
-    0x7C014631: "1-B.SUB0009",
-    0x7C0146AB: "1-B.SUB0010",
-    0x7C0146AC: "1-B.SUB0011",
-    0x7C0146AD: "1-B.SUB0012",
-    0x7C0146AE: "1-B.SUB0013",
-    0x7C0146AF: "1-B.SUB0014",
-    0x7C0146B0: "1-B.SUB0015",
-    0x7C0146B1: "1-B.SUB0016",
-    0x7C0146B2: "1-B.SUB0017",
-    0x7C0146B3: "1-B.SUB0018",
-    0x7C0146B4: "1-B.SUB0019",
-    0x7C01472E: "1-B.SUB0020",
-    0x7C01472F: "1-B.SUB0021",
-    0x7C014730: "1-B.SUB0022",
-    0x7C0B27E9: "FEI_MISOBJ",
-    0x7C0D803C: "N_DELILAH",
-    0x7C1A545B: "WAREHOUSE",
-    0x7C1A74B4: "TITLE64_NAME0",
-    0x7C1A74B5: "TITLE64_NAME1",
-    0x7C1A74B6: "TITLE64_NAME2",
-    0x7C1A74B7: "TITLE64_NAME3",
-    0x7C1A74B8: "TITLE64_NAME4",
-    0x7C1A74B9: "TITLE64_NAME5",
-    0x7C1A74BA: "TITLE64_NAME6",
-    0x7C1A74BB: "TITLE64_NAME7",
-    0x7C1A74BC: "TITLE64_NAME8",
-    0x7C1A74BD: "TITLE64_NAME9",
-    0x7C1DAC80: "N_MRSLAWTER",
-    0x7C1DDC5C: "3_S10_FAIL01",
-    0x7C1DDC5D: "3_S10_FAIL02",
-    0x7C25FF36: "S_APOL_HIGH_GEN_01",
-    0x7C28F32E: "RACE_POSH",
-    0x7C2AED1C: "CRANK_DESC1",
-    0x7C2AED1D: "CRANK_DESC2",
-    0x7C400FB6: "SP_EIFFELHAT",
-    0x7C408BF8: "S_BHAT1",
-    0x7C408BF9: "S_BHAT2",
-    0x7C408BFA: "S_BHAT3",
-    0x7C4A0A58: "MGPH_OPENBOOK",
-    0x7C54A6E9: "2-S06.SUB0001",
-    0x7C54A6EA: "2-S06.SUB0002",
-    0x7C54A6EB: "2-S06.SUB0003",
-    0x7C54A6EC: "2-S06.SUB0004",
-    0x7C54A6ED: "2-S06.SUB0005",
-    0x7C54A6EE: "2-S06.SUB0006",
-    0x7C54A6EF: "2-S06.SUB0007",
-    0x7C54A6F0: "2-S06.SUB0008",
-    0x7C54A6F1: "2-S06.SUB0009",
-    0x7C54A76B: "2-S06.SUB0010",
-    0x7C54A76C: "2-S06.SUB0011",
-    0x7C54A76D: "2-S06.SUB0012",
-    0x7C54A76E: "2-S06.SUB0013",
-    0x7C54A76F: "2-S06.SUB0014",
-    0x7C54A770: "2-S06.SUB0015",
-    0x7C54A771: "2-S06.SUB0016",
-    0x7C54A772: "2-S06.SUB0017",
-    0x7C54A773: "2-S06.SUB0018",
-    0x7C54A774: "2-S06.SUB0019",
-    0x7C54A7EE: "2-S06.SUB0020",
-    0x7C54A7EF: "2-S06.SUB0021",
-    0x7C54A7F0: "2-S06.SUB0022",
-    0x7C54A7F1: "2-S06.SUB0023",
-    0x7C54A7F2: "2-S06.SUB0024",
-    0x7C54A7F3: "2-S06.SUB0025",
-    0x7C54A7F4: "2-S06.SUB0026",
-    0x7C54A7F5: "2-S06.SUB0027",
-    0x7C54A7F6: "2-S06.SUB0028",
-    0x7C54A7F7: "2-S06.SUB0029",
-    0x7C54A871: "2-S06.SUB0030",
-    0x7C54A872: "2-S06.SUB0031",
-    0x7C54A873: "2-S06.SUB0032",
-    0x7C54A874: "2-S06.SUB0033",
-    0x7C54A875: "2-S06.SUB0034",
-    0x7C54A876: "2-S06.SUB0035",
-    0x7C54A877: "2-S06.SUB0036",
-    0x7C54A878: "2-S06.SUB0037",
-    0x7C54A879: "2-S06.SUB0038",
-    0x7C54A87A: "2-S06.SUB0039",
-    0x7C5711A9: "COL_RUBBAND",
-    0x7C64328F: "B_BHAT1",
-    0x7C643290: "B_BHAT2",
-    0x7C643291: "B_BHAT3",
-    0x7C643292: "B_BHAT4",
-    0x7C643293: "B_BHAT5",
-    0x7C643294: "B_BHAT6",
-    0x7C6AB768: "MGSP_TOTAL",
-    0x7C82AA0C: "2-S05B.SUB0001",
-    0x7C82AA0D: "2-S05B.SUB0002",
-    0x7C82AA0E: "2-S05B.SUB0003",
-    0x7C82AA0F: "2-S05B.SUB0004",
-    0x7C82AA10: "2-S05B.SUB0005",
-    0x7C82AA11: "2-S05B.SUB0006",
-    0x7C82AA12: "2-S05B.SUB0007",
-    0x7C82AA13: "2-S05B.SUB0008",
-    0x7C82AA14: "2-S05B.SUB0009",
-    0x7C82AA8E: "2-S05B.SUB0010",
-    0x7C82AA8F: "2-S05B.SUB0011",
-    0x7C82AA90: "2-S05B.SUB0012",
-    0x7C82AA91: "2-S05B.SUB0013",
-    0x7C82AA92: "2-S05B.SUB0014",
-    0x7C82AA93: "2-S05B.SUB0015",
-    0x7C82AA94: "2-S05B.SUB0016",
-    0x7C82AA95: "2-S05B.SUB0017",
-    0x7C82AA96: "2-S05B.SUB0018",
-    0x7C82AA97: "2-S05B.SUB0019",
-    0x7C82AB11: "2-S05B.SUB0020",
-    0x7C82AB12: "2-S05B.SUB0021",
-    0x7C82AB13: "2-S05B.SUB0022",
-    0x7C82AB14: "2-S05B.SUB0023",
-    0x7C82AB15: "2-S05B.SUB0024",
-    0x7C82AB16: "2-S05B.SUB0025",
-    0x7C82AB17: "2-S05B.SUB0026",
-    0x7C88B03E: "FE_TIME_MIN_FE",
-    0x7C8938A6: "4_04_FATTYDIED",
-    0x7C8B071E: "AS_CH_COMPLETE",
-    0x7C8C6D1C: "CRIME_PEDATTACKADULT",
-    0x7C926310: "AS_GS_ACTION",
-    0x7C943AF8: "EXIT_BUTTONS",
-    0x7C972229: "AS_VD_OBJECTIVE",
-    0x7C979C5E: "FEI_UNLIMITEDAMMO",
-    0x7C9AEBB3: "AS_PI_COUNTER",
-    0x7CA00690: "KEEPUP_SQUARE",
-    0x7CA9D195: "MG_MATH_FE",
-    0x7CAAE448: "PER_LUNCH",
-    0x7CB4B619: "1_06_TITLE",
-    0x7CBCF52C: "AS_CT_OBJCOUNT1",
-    0x7CBFEAF6: "SP_PRISON_L",
-    0x7CBFEAFE: "SP_PRISON_T",
-    0x7CC1A614: "MDETENTION_CLEARED",
-    0x7CD228C2: "1_11_XP_COUNTER",
-    0x7CD437C6: "MGGE_ECUADOR",
-    0x7CD82DE4: "TITLE16_NUMNAMES",
-    0x7CDAAAE3: "SP_COLUM_H",
-    0x7CDAAAE7: "SP_COLUM_L",
-    0x7CDAAAEF: "SP_COLUM_T",
-    0x7CDCAD4E: "",
-    0x7D001D47: "",
-    0x7D0B7516: "B_LSLEEVES2",
-    0x7D0B7517: "B_LSLEEVES3",
-    0x7D0B7518: "B_LSLEEVES4",
-    0x7D0C8B11: "SP_NINJA_H",
-    0x7D0C8B15: "SP_NINJA_L",
-    0x7D0C8B1D: "SP_NINJA_T",
-    0x7D1346F6: "FRAME_DESC1",
-    0x7D1346F7: "FRAME_DESC2",
-    0x7D1EDDDC: "AS_GET_AMMO",
-    0x7D265081: "SAVE_FULL",
-    0x7D296085: "RETMEN2_WII",
-    0x7D2C22AF: "FT_EXIT",
-    0x7D3F0052: "N_MSPHILLIPS",
-    0x7D4361E4: "SAVE_GAME",
-    0x7D455CE0: "TPM_QUITCURRENT",
-    0x7D4DBFF7: "TITLE82_NUMNAMES",
-    0x7D67CE4B: "SP_NINJAR_H",
-    0x7D67CE4F: "SP_NINJAR_L",
-    0x7D67CE57: "SP_NINJAR_T",
-    0x7D691D78: "SP_NINJAW_H",
-    0x7D691D7C: "SP_NINJAW_L",
-    0x7D691D84: "SP_NINJAW_T",
-    0x7D6B2901: "SP_NINJA_FT",
-    0x7D6ED115: "MGCE_GETINFO",
-    0x7D797336: "MGGE_DELAWARE",
-    0x7D797732: "P_DETAILS1_01",
-    0x7D797733: "P_DETAILS1_02",
-    0x7D797734: "P_DETAILS1_03",
-    0x7D797735: "P_DETAILS1_04",
-    0x7D9BC4CD: "P_DETAILS2_01",
-    0x7D9BC4CE: "P_DETAILS2_02",
-    0x7D9BC4CF: "P_DETAILS2_03",
-    0x7D9BC4D0: "P_DETAILS2_04",
-    0x7D9C226B: "AS_GD_ACTION",
-    0x7DA6EFD6: "HACKYSACK",
-    0x7DBB1B18: "CRIME_GLASSBROKEN",
-    0x7DC0E818: "2_02_TITLE",
-    0x7DC4930B: "2-09.SUB0001",
-    0x7DC4930C: "2-09.SUB0002",
-    0x7DC4930D: "2-09.SUB0003",
-    0x7DC4930E: "2-09.SUB0004",
-    0x7DC4930F: "2-09.SUB0005",
-    0x7DC49310: "2-09.SUB0006",
-    0x7DC49311: "2-09.SUB0007",
-    0x7DC49312: "2-09.SUB0008",
-    0x7DC49313: "2-09.SUB0009",
-    0x7DC4938D: "2-09.SUB0010",
-    0x7DC4938E: "2-09.SUB0011",
-    0x7DC4938F: "2-09.SUB0012",
-    0x7DC49390: "2-09.SUB0013",
-    0x7DC49391: "2-09.SUB0014",
-    0x7DC49392: "2-09.SUB0015",
-    0x7DC49393: "2-09.SUB0016",
-    0x7DC49394: "2-09.SUB0017",
-    0x7DD2ACDF: "CAM_BUS_DP",
-    0x7DD4C88D: "AS_SL_NOSNOW",
-    0x7DDD1D1A: "CHAPT4TRANS_NAME",
-    0x7DE05ACA: "2_01_OGOTPANTIES",
-    0x7DFC38E4: "4-B2B.SUB0001",
-    0x7DFC38E5: "4-B2B.SUB0002",
-    0x7DFC38E6: "4-B2B.SUB0003",
-    0x7DFC38E7: "4-B2B.SUB0004",
-    0x7DFC38E8: "4-B2B.SUB0005",
-    0x7DFC38E9: "4-B2B.SUB0006",
-    0x7DFC38EA: "4-B2B.SUB0007",
-    0x7DFD308F: "CLT_TADSHIRT",
-    0x7E082B23: "GIFT_MGBT",
-    0x7E082BA5: "GIFT_MGCS",
-    0x7E082C29: "GIFT_MGDT",
-    0x7E0833C9: "GIFT_MGSG",
-    0x7E0D578C: "AS_EM_ACTION",
-    0x7E12770C: "1_06_GARYKO",
-    0x7E1B157D: "GKART_5LAPS",
-    0x7E21BCDD: "5-G5.SUB0001",
-    0x7E21BCDE: "5-G5.SUB0002",
-    0x7E21BCDF: "5-G5.SUB0003",
-    0x7E21BCE0: "5-G5.SUB0004",
-    0x7E21BCE1: "5-G5.SUB0005",
-    0x7E21BCE2: "5-G5.SUB0006",
-    0x7E21BCE3: "5-G5.SUB0007",
-    0x7E21BCE4: "5-G5.SUB0008",
-    0x7E21BCE5: "5-G5.SUB0009",
-    0x7E21BD5F: "5-G5.SUB0010",
-    0x7E21BD60: "5-G5.SUB0011",
-    0x7E21BD61: "5-G5.SUB0012",
-    0x7E21BD62: "5-G5.SUB0013",
-    0x7E22830B: "GRADE_APLUS",
-    0x7E283276: "6-B.SUB0001",
-    0x7E283277: "6-B.SUB0002",
-    0x7E283278: "6-B.SUB0003",
-    0x7E283279: "6-B.SUB0004",
-    0x7E28327A: "6-B.SUB0005",
-    0x7E28327B: "6-B.SUB0006",
-    0x7E28327C: "6-B.SUB0007",
-    0x7E28327D: "6-B.SUB0008",
-    0x7E28327E: "6-B.SUB0009",
-    0x7E2832F8: "6-B.SUB0010",
-    0x7E2832F9: "6-B.SUB0011",
-    0x7E2832FA: "6-B.SUB0012",
-    0x7E2D9E63: "TUT_SSLING1",
-    0x7E446185: "MGPH_SKATEBOARD",
-    0x7E71CAE8: "PUN_FAIL",
-    0x7E7726D0: "2_S05B_TITLE",
-    0x7E83B02E: "AS_RK_COMPLETE",
-    0x7EA615F8: "3_S11_SECRET",
-    0x7EB1F36B: "AS_HH_COMPLETE",
-    0x7ECA0C5A: "MC_UNLOCK01",
-    0x7ECA0C5B: "MC_UNLOCK02",
-    0x7ECA0C5C: "MC_UNLOCK03",
-    0x7ECA0C5D: "MC_UNLOCK04",
-    0x7ECA0C5E: "MC_UNLOCK05",
-    0x7ECA0C5F: "MC_UNLOCK06",
-    0x7ECE07B9: "P_BANDANA1",
-    0x7ECE07BA: "P_BANDANA2",
-    0x7ECE07BB: "P_BANDANA3",
-    0x7ED1E409: "FE_TITLE_CONTROLS",
-    0x7ED64671: "GIFT_SHOP",
-    0x7EE058EC: "B_HUNTER1",
-    0x7EE058ED: "B_HUNTER2",
-    0x7EE058EE: "B_HUNTER3",
-    0x7EF8FBBD: "1_11_XP_OBJ",
-    0x7EFA12E8: "5_03_JOHNNYKO",
-    0x7EFF1A31: "TITLE66_NUMNAMES",
-    0x7F04F69E: "2_08_DESTROYPLNT",
-    0x7F12FB69: "TUT_AQUA1",
-    0x7F14E64A: "AS_FC_BEENHIT",
-    0x7F1B051D: "TUT_WARD1",
-    0x7F251047: "DISC_05_WII",
-    0x7F32151C: "5-05B.SUB0001",
-    0x7F32151D: "5-05B.SUB0002",
-    0x7F32151E: "5-05B.SUB0003",
-    0x7F32151F: "5-05B.SUB0004",
-    0x7F321520: "5-05B.SUB0005",
-    0x7F321521: "5-05B.SUB0006",
-    0x7F42E0D8: "P_SNEAKERS1",
-    0x7F42E0D9: "P_SNEAKERS2",
-    0x7F42E0DA: "P_SNEAKERS3",
-    0x7F42E0DB: "P_SNEAKERS4",
-    0x7F42E0DC: "P_SNEAKERS5",
-    0x7F42E0DD: "P_SNEAKERS6",
-    0x7F42E0DE: "P_SNEAKERS7",
-    0x7F42E0DF: "P_SNEAKERS8",
-    0x7F42E0E0: "P_SNEAKERS9",
-    0x7F4926E8: "3_XM_CANDLES",
-    0x7F4E6C45: "TITLE36_NAME0",
-    0x7F4E6C46: "TITLE36_NAME1",
-    0x7F4E6C47: "TITLE36_NAME2",
-    0x7F4E6C48: "TITLE36_NAME3",
-    0x7F549DC8: "N_BEATRICE",
-    0x7F55C8BB: "AS_EA_COMPLETE",
-    0x7F5A0D53: "CHAPT0REWARD",
-    0x7F6BABAF: "AS_BOY_GENIUS",
-    0x7F7CF3BB: "FE_WIN_TAUNT",
-    0x7F803F58: "RACING_1",
-    0x7F803F59: "RACING_2",
-    0x7F803F5A: "RACING_3",
-    0x7F884C08: "AS_CG_ACTION",
-    0x7F921FB1: "FESA_HILITE",
-    0x7F94500F: "UH_ART",
-    0x7F95E5D3: "UH_GYM",
-    0x7FA07374: "1_B_OBJ",
-    0x7FA41CBA: "B_JACKET1",
-    0x7FA41CBB: "B_JACKET2",
-    0x7FA41CBC: "B_JACKET3",
-    0x7FA41CBF: "B_JACKET6",
-    0x7FABE772: "AS_DT_RETURN",
-    0x7FC3A786: "CONT_05_WII",
-    0x7FC81439: "3_R09_GYOBJ",
-    0x7FC8D81B: "PUN_PASS",
-    0x7FD2B8B7: "MGGE_SOLOMANS",
-    0x7FDAE3E5: "FEDS_RESOLUTION",
-    0x7FDB9C9F: "TUT_AWAY1",
-    0x7FF9A029: "AS_CT_OBJCOUNT"
-}
 
 if __name__ == "__main__":
     import argparse
@@ -5,8 +5,17 @@
 # hash has to be signed before shifting right 8 bits and then become an
 # unsigned integer after it as the final output.
 
-# Written by Edness    v1.1
-# 2022-03-24  -  2022-06-20
+# Usage:
+#   GtHash.py  "string to hash"
+# Optional:
+#   -f | --file     Treat the input as a path to a list of strings, one per line
+#     GtHash.py  "X:\path\to\strings.txt"  -f
+
+# Written by Edness    v1.3
+# 2022-03-24  -  2026-10-18
+
+import struct
+from array import array
 
 _hash_table = (
     0x00000000, 0x77073096, 0xEE0E612C, 0x990951BA, 0x076DC419, 0x706AF48F, 0xE963A535, 0x9E6495A3,
@@ -43,20 +52,118 @@ _hash_table = (
     0xB3667A2E, 0xC4614AB8, 0x5D681B02, 0x2A6F2B94, 0xB40BBE37, 0xC30C8EA1, 0x5A05DF1B, 0x2D02EF8D
 )
 
+def _gthash_step(gt_hash, char):
+    return gt_hash - ((gt_hash & 0x80000000) << 1) >> 8 & 0xFFFFFFFF ^ _hash_table[char ^ gt_hash & 0xFF]
+
+def _get_slice_table(shift):
+    # The signed shift is still linear (the top bit is just copied), so a
+    # slice-by-4 variant works: each table holds what a byte at the given
+    # position of the hash becomes after four byte steps.  Unlike regular
+    # CRC-32 though, a string byte only matches the hash byte under it for
+    # the lower 3 bytes of a word, as the top one would get sign extended,
+    # so the last string byte of a word is looked up in  _hash_table  as-is.
+    table = list()
+    for byte in range(256):
+        gt_hash = byte << shift
+        for i in range(4):
+            gt_hash = _gthash_step(gt_hash, 0x00)
+        table.append(gt_hash)
+    return tuple(table)
+
+_slice_tables = tuple(_get_slice_table(shift) for shift in (0, 8, 16, 24))
+
+def _gthash_update(gt_hash, string):
+    t0, t1, t2, t3 = _slice_tables
+    words = len(string) & ~0x3
+    for word, in struct.iter_unpack("<I", string[:words]):
+        mix = word ^ gt_hash
+        gt_hash = t0[mix & 0xFF] ^ t1[mix >> 8 & 0xFF] ^ t2[mix >> 16 & 0xFF] ^ t3[gt_hash >> 24] ^ _hash_table[word >> 24]
+    for char in string[words:]:
+        gt_hash = gt_hash - ((gt_hash & 0x80000000) << 1) >> 8 & 0xFFFFFFFF ^ _hash_table[char ^ gt_hash & 0xFF]
+    return gt_hash
+
 def calc_gthash(string: bytes):
     if type(string) is str:
         string = string.encode("UTF-8")
-    gt_hash = 0xFFFFFFFF
-    for char in string:
-        gt_hash = gt_hash - ((gt_hash & 0x80000000) << 1) >> 8 & 0xFFFFFFFF ^ _hash_table[char ^ gt_hash & 0xFF]
-    return gt_hash
+    return _gthash_update(0xFFFFFFFF, string)
+
+def calc_gthash_bulk(buffer: bytes):
+    # Hashes a buffer of NULL separated strings (e.g. a whole string list
+    # read with  file.read().replace(b"\n", b"\x00") ) in one pass, and
+    # returns an array of the hashes in the same order as in the buffer
+    t0, t1, t2, t3 = _slice_tables
+    iter_unpack = struct.iter_unpack
+    hashes = array("I")
+    for string in buffer.split(b"\x00"):
+        gt_hash = 0xFFFFFFFF
+        words = len(string) & ~0x3
+        for word, in iter_unpack("<I", string[:words]):
+            mix = word ^ gt_hash
+            gt_hash = t0[mix & 0xFF] ^ t1[mix >> 8 & 0xFF] ^ t2[mix >> 16 & 0xFF] ^ t3[gt_hash >> 24] ^ _hash_table[word >> 24]
+        for char in string[words:]:
+            gt_hash = gt_hash - ((gt_hash & 0x80000000) << 1) >> 8 & 0xFFFFFFFF ^ _hash_table[char ^ gt_hash & 0xFF]
+        hashes.append(gt_hash)
+    return hashes
+
+class GtHash:
+    # Resumable calc_gthash state, so that a shared string prefix only has
+    # to be hashed once before appending each of the string endings, e.g.
+    #   state = GtHash(b"prefix_");  state.copy().update(b"name").digest()
+    def __init__(self, string: bytes = b""):
+        self.gt_hash = 0xFFFFFFFF
+        self.update(string)
+
+    def update(self, string: bytes):
+        if type(string) is str:
+            string = string.encode("UTF-8")
+        self.gt_hash = _gthash_update(self.gt_hash, string)
+        return self
+
+    def copy(self):
+        state = GtHash()
+        state.gt_hash = self.gt_hash
+        return state
+
+    def digest(self):
+        return self.gt_hash
+
+def calc_gthash_many(strings):
+    # Hashes a list of strings at once, byte column by column if NumPy exists
+    strings = [string.encode("UTF-8") if type(string) is str else string for string in strings]
+    try:
+        import numpy as np
+    except ImportError:
+        return array("I", map(calc_gthash, strings))
+
+    sizes = np.fromiter(map(len, strings), np.int64, len(strings))
+    offsets = np.cumsum(sizes) - sizes
+    chars = np.frombuffer(b"".join(strings), np.uint8).astype(np.uint32)
+    hash_table = np.array(_hash_table, np.uint32)
+
+    hashes = np.zeros(len(strings), np.uint32)
+    for size in np.unique(sizes):
+        idxs = np.flatnonzero(sizes == size)
+        offs = offsets[idxs]
+        gt_hash = np.full(len(idxs), 0xFFFFFFFF, np.uint32)
+        for col in range(size):  # signed shift right
+            lookup = hash_table[(chars[offs + col] ^ gt_hash) & np.uint32(0xFF)]
+            gt_hash = (gt_hash.view(np.int32) >> np.int32(8)).view(np.uint32) ^ lookup
+        hashes[idxs] = gt_hash
+    return array("I", hashes.tobytes())
 
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Hashes strings into their GtHash values used by Burnout games.")
     parser.add_argument("string", type=str)
+    parser.add_argument("-f", "--file", action="store_true", help="treat the input as a path to a list of strings")
     args = parser.parse_args()
 
-    hash = calc_gthash(args.string)
-    print(f"Hashed string: 0x{hash:08X} ({hash})")
+    if args.file:
+        with open(args.string, "r", encoding="UTF-8") as file:
+            strings = file.read().splitlines()
+        for hash, string in zip(calc_gthash_many(strings), strings):
+            print(f"0x{hash:08X}  {string}")
+    else:
+        hash = calc_gthash(args.string)
+        print(f"Hashed string: 0x{hash:08X} ({hash})")
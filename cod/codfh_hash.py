@@ -3,7 +3,15 @@
 # from the function at  001429B8  in the PS2 PAL  SPS.BIN  executable.
 # There is a secondary loop break condition, if the character is a ;
 
-# Written by Edness   v1.0   2022-10-10
+# Usage:
+#   codfh_hash.py  "LEVELS\L_1_5\SECTIONS\s_24.rws"
+# Optional:
+#   -f | --file     Treat the input as a path to a list of names, one per line
+#     codfh_hash.py  "X:\path\to\names.txt"  -f
+
+# Written by Edness   v1.1   2022-10-10 - 2026-10-18
+
+from array import array
 
 def spark_hash(str):
     hash = 0x84222325CBF29CE4
@@ -12,12 +20,75 @@ def spark_hash(str):
         hash = ord(chr) ^ (hash << 40) + hash * 0x1B3 & 0xFFFFFFFFFFFFFFFF
     return hash
 
+class SparkHash:
+    # Resumable spark_hash state, so that a shared path prefix only has to
+    # be hashed once before appending each of the names, for example
+    #   state = SparkHash("LEVELS\\L_1_5\\")
+    #   state.copy().update("SECTIONS\\s_24.rws").digest()
+    def __init__(self, str=""):
+        self.hash = 0x84222325CBF29CE4
+        self.ended = False
+        self.update(str)
+
+    def update(self, str):
+        if type(str) is bytes:
+            str = str.decode("latin-1")
+        if not self.ended:
+            str, end, _ = str.upper().replace("/", "\\").partition(";")
+            hash = self.hash
+            for chr in str:
+                hash = ord(chr) ^ (hash << 40) + hash * 0x1B3 & 0xFFFFFFFFFFFFFFFF
+            self.hash = hash
+            self.ended = bool(end)
+        return self
+
+    def copy(self):
+        state = SparkHash()
+        state.hash = self.hash
+        state.ended = self.ended
+        return state
+
+    def digest(self):
+        return self.hash
+
+def spark_hash_many(strs):
+    # spark_hash over a whole name list, per name length with NumPy if installed
+    strs = [str.decode("latin-1") if type(str) is bytes else str for str in strs]
+    try:
+        import numpy as np
+    except ImportError:
+        return array("Q", map(spark_hash, strs))
+
+    strs = "\x00".join(strs).upper().replace("/", "\\").split("\x00")
+    strs = [str.partition(";")[0] for str in strs]
+    sizes = np.fromiter(map(len, strs), np.int64, len(strs))
+    offsets = np.cumsum(sizes) - sizes
+    # UTF-32 to keep it identical to ord() for any character
+    chars = np.frombuffer("".join(strs).encode("UTF-32-LE"), np.uint32).astype(np.uint64)
+
+    hashes = np.zeros(len(strs), np.uint64)
+    for size in np.unique(sizes):
+        idxs = np.flatnonzero(sizes == size)
+        offs = offsets[idxs]
+        hash = np.full(len(idxs), 0x84222325CBF29CE4, np.uint64)
+        for col in range(size):  # (hash << 40) + hash * 0x1B3
+            hash = chars[offs + col] ^ hash * np.uint64(0x100000001B3)
+        hashes[idxs] = hash
+    return array("Q", hashes.tobytes())
+
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Hashes filenames into their hashed values used by Call of Duty: Finest Hour.")
     parser.add_argument("str", type=str)
+    parser.add_argument("-f", "--file", action="store_true", help="treat the input as a path to a list of names")
     args = parser.parse_args()
 
-    hash = spark_hash(args.str)
-    print(f"Hashed string: 0x{hash:016X} ({hash})")
+    if args.file:
+        with open(args.str, "r", encoding="UTF-8") as file:
+            names = file.read().splitlines()
+        for hash, name in zip(spark_hash_many(names), names):
+            print(f"0x{hash:016X}  {name}")
+    else:
+        hash = spark_hash(args.str)
+        print(f"Hashed string: 0x{hash:016X} ({hash})")
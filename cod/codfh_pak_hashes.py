@@ -0,0 +1,10197 @@
+# Call of Duty: Finest Hour .PAK filename hashes, see codfh_pak_filenames.py
+
+# There are still several filenames left to go.  See this spreadsheet for hashes not yet reversed:
+# https://docs.google.com/spreadsheets/d/1QEDncvs6EH_KhAWjfUEabVK3r2VhDJDIWftD2pYOkho/edit#gid=0
+
+HASH_DICT = {
+    0x0007E8B6067B7F4F: r"LEVELS\L_1_5\SECTIONS\s_24.rws",
+    0x000DCBE63948F7D3: r"SB_AWD\120_149\ENGLISH\PS2_0128.awd",
+    0x000EABC50868118E: r"ANIMGRPS\Lvl_25\Lvl_25K.ads",
+    0x001182BCA7DEB037: r"SB_AGD\240_269\GERMAN\PS2_0247.agd",
+    0x00171BADDE3D8B76: r"SB_AGD\90_119\FRENCH\XBX_0103.agd",
+    0x00311BD80D696CA9: r"AUDIO\ENGLISH\NGC_2s3.rws",
+    0x00316B4AAF469EA1: r"SB_AWD\240_269\SPANISH\XBX_0257.awd",
+    0x00320F3ACF8328DF: r"SB_AGD\30_59\ENGLISH\XBX_0044.agd",
+    0x00412F3877F30A0D: r"SB_AGD\0_29\SPANISH\NGC_0020.agd",
+    0x005073FE21183054: r"SB_AGD\120_149\GERMAN\NGC_0120.agd",
+    0x0055F145F08583BC: r"ANIMGRPS\Lvl_14\Lvl_14Y.ads",
+    0x00594ADC858200D4: r"SB_AGD\0_29\GERMAN\PS2_0022.agd",
+    0x005A1B7AAD0D763E: r"SB_AWD\90_119\ITALIAN\XBX_0109.awd",
+    0x005D455D8FAF2CC7: r"SB_AWD\210_239\ENGLISH\NGC_0239.awd",
+    0x005E3C1B6C9FAD73: r"SB_AWD\30_59\GERMAN\PS2_0034.awd",
+    0x00659B72E5B39CFF: r"SB_AWD\240_269\ITALIAN\PS2_0256.awd",
+    0x006B4868DB1D3CE1: r"SB_AGD\210_239\GERMAN\NGC_0231.agd",
+    0x006E86D639880276: r"LOC\SP\EULA.LOC",
+    0x008117218A9F5FEB: r"LEVELS\L_3_3\SECTIONS\s_11.rws",
+    0x0082331C4D265050: r"SB_AGD\150_179\ENGLISH\NGC_0162.agd",
+    0x008A0C005A980652: r"SB_AWD\60_89\FRENCH\XBX_0061.awd",
+    0x008C5FACB4209715: r"SB_AGD\240_269\SPANISH\XBX_0253.agd",
+    0x008C95BA6E8AD32D: r"SB_AWD\120_149\FRENCH\NGC_0138.awd",
+    0x008DDEDAE5E3C24E: r"SB_AWD\180_209\ENGLISH\PS2_0188.awd",
+    0x00949DF9B4837AA5: r"SB_AGD\0_29\ENGLISH\PS2_0025.agd",
+    0x00994A79076399DD: r"SB_AGD\120_149\FRENCH\PS2_0144.agd",
+    0x009D8E60A8B7036C: r"SB_AWD\90_119\GERMAN\NGC_0112.awd",
+    0x00A2E7A37EA7E71E: r"SB_AGD\120_149\ITALIAN\NGC_0128.agd",
+    0x00A364087BAB9CA6: r"SB_AGD\210_239\FRENCH\PS2_0231.agd",
+    0x00A73D0AE672D09B: r"SB_AWD\150_179\ENGLISH\XBX_0152.awd",
+    0x00A7E620EAADE6B9: r"SB_AGD\60_89\FRENCH\XBX_0084.agd",
+    0x00AA168204E8D9CE: r"SB_AGD\240_269\SPANISH\NGC_0252.agd",
+    0x00B43917D1848194: r"SB_AWD\60_89\ITALIAN\PS2_0064.awd",
+    0x00C1721712688CA1: r"SB_AWD\240_269\SPANISH\PS2_0247.awd",
+    0x00C68F94859B0443: r"SB_AWD\90_119\FRENCH\XBX_0119.awd",
+    0x00D4CEB5C1E1521E: r"SB_AGD\240_269\ENGLISH\XBX_0243.agd",
+    0x00DFD12DCE637BDD: r"SB_AWD\180_209\SPANISH\PS2_0183.awd",
+    0x00DFE56751DBF832: r"SB_AGD\90_119\ITALIAN\XBX_0097.agd",
+    0x00E0BB5C59603733: r"SB_AWD\240_269\SPANISH\XBX_0259.awd",
+    0x00ED0B082A1F64A2: r"SB_AGD\180_209\GERMAN\PS2_0184.agd",
+    0x00EE1571FED4FA3A: r"SB_AGD\180_209\SPANISH\NGC_0206.agd",
+    0x00EED6D7CDD4AA11: r"SB_AWD\150_179\ITALIAN\PS2_0157.awd",
+    0x00F2E5588B7375EE: r"SB_AWD\180_209\ENGLISH\XBX_0204.awd",
+    0x00F71152B9A7414C: r"LEVELS\L_3_1_B\CLUMPS\cbank_01.bin",
+    0x00F8B0C22F5ADC95: r"SHELL\FEND\INSTANCE\gcn\profile.txd",
+    0x00FAE7128A56CF47: r"SB_AWD\0_29\GERMAN\NGC_0028.awd",
+    0x00FC6983176583B8: r"SB_AGD\0_29\FRENCH\NGC_0003.agd",
+    0x01107F60E022D509: r"LEVELS\L_1_2\global.dff",
+    0x011A94A691D03960: r"SB_AWD\0_29\ENGLISH\XBX_0001.awd",
+    0x011F689F6D5C472D: r"SB_AWD\30_59\SPANISH\PS2_0041.awd",
+    0x0120A545AF4A7F8A: r"SB_AWD\90_119\GERMAN\XBX_0116.awd",
+    0x012B884F469A9E66: r"SB_AWD\60_89\SPANISH\NGC_0067.awd",
+    0x0130931F14D82220: r"SB_AWD\240_269\FRENCH\PS2_0251.awd",
+    0x013DA276591F9D89: r"SB_AWD\210_239\SPANISH\PS2_0236.awd",
+    0x01440C02BDC46738: r"SB_AGD\210_239\FRENCH\XBX_0212.agd",
+    0x014F4BE672DB5BEC: r"SHELL\MOVIES\FRENCH\Act_2.bik",
+    0x0157CDBAC27EC177: r"SB_AGD\90_119\FRENCH\XBX_0115.agd",
+    0x015BA72E0086BE8B: r"SB_AWD\30_59\ITALIAN\NGC_0046.awd",
+    0x01691E29150D16FD: r"SB_AWD\120_149\GERMAN\PS2_0146.awd",
+    0x016C328DBEFC9C0C: r"SB_AWD\60_89\ITALIAN\XBX_0085.awd",
+    0x016CDE9BF78FBFB4: r"SB_AWD\210_239\SPANISH\NGC_0221.awd",
+    0x016F576061483027: r"LEVELS\MP_6\level.rws",
+    0x0170C228BC822533: r"SB_AWD\240_269\SPANISH\PS2_0249.awd",
+    0x0170DE9BA52DAF3D: r"codfontsymbols.dds",
+    0x017B16320ED106B4: r"SB_AGD\240_269\ITALIAN\XBX_0256.agd",
+    0x018051652D9E1A00: r"SB_AGD\90_119\ITALIAN\PS2_0113.agd",
+    0x0183A4062FD6D7A8: r"SB_AWD\210_239\ENGLISH\PS2_0219.awd",
+    0x0187DE6C6BE9D07B: r"SB_AWD\240_269\ENGLISH\PS2_0249.awd",
+    0x018D361A360DEAC1: r"SB_AGD\60_89\ENGLISH\XBX_0075.agd",
+    0x019286C92B7846AF: r"LEVELS\L_3_1\SECTIONS\s_26.rws",
+    0x019A196E5E7E857A: r"SB_AGD\180_209\SPANISH\PS2_0207.agd",
+    0x019D4340DE4E5A5E: r"SB_AGD\60_89\ITALIAN\PS2_0088.agd",
+    0x019D6583A8EE9354: r"SB_AGD\180_209\SPANISH\NGC_0204.agd",
+    0x019D66BE9889B0DE: r"SB_AGD\150_179\SPANISH\NGC_0159.agd",
+    0x01A473D040E6E5A9: r"SB_AGD\210_239\ITALIAN\PS2_0221.agd",
+    0x01A534348F6F3460: r"SB_AWD\0_29\GERMAN\PS2_0000.awd",
+    0x01A650E1FBCFE8BF: r"SB_AWD\120_149\SPANISH\XBX_0123.awd",
+    0x01A6BD9BA55B068A: r"codfontsymbols.tga",
+    0x01A6CA9BA55B1CA6: r"codfontsymbols.txd",
+    0x01A7744F956318D0: r"SB_AWD\0_29\GERMAN\PS2_0017.awd",
+    0x01A8DCDCD26889BD: r"SB_AGD\120_149\GERMAN\PS2_0133.agd",
+    0x01AAC7333520F7F5: r"LEVELS\L_3_3\SECTIONS\s_13.rws",
+    0x01ACDF02EBF9BC1F: r"SB_AGD\120_149\ITALIAN\XBX_0141.agd",
+    0x01B6FFFD4FECCF10: r"SB_AGD\30_59\ENGLISH\PS2_0040.agd",
+    0x01B9201855E07D20: r"SB_AGD\30_59\ENGLISH\PS2_0057.agd",
+    0x01BA0860618795F7: r"LEVELS\MP_6\level.dff",
+    0x01BD780086B442DD: r"SB_AGD\240_269\ITALIAN\PS2_0265.agd",
+    0x01BE75F6CF4C7E6D: r"SB_AWD\180_209\GERMAN\PS2_0208.awd",
+    0x01C2751A4F009917: r"SB_AWD\240_269\FRENCH\PS2_0245.awd",
+    0x01C28CE18610EAB6: r"SB_AGD\120_149\FRENCH\XBX_0126.agd",
+    0x01C30CEA21F0B0AF: r"ANIMGRPS\Lvl_35\Lvl_35L.ads",
+    0x01C627F2B75AF660: r"LEVELS\L_2_2_B\SECTIONS\s_2.rws",
+    0x01D6D479D400069B: r"SB_AWD\120_149\GERMAN\XBX_0147.awd",
+    0x01D7066F1E02F039: r"LEVELS\MP_2\SECTIONS\s_4.rws",
+    0x01DAD860F0B436F0: r"SB_AWD\60_89\SPANISH\NGC_0065.awd",
+    0x01DAD917F8E2803D: r"LEVELS\L_1_5\SECTIONS\s_13.rws",
+    0x01EC620745BCD73D: r"LEVELS\L_3_1\SECTIONS\s_8.rws",
+    0x01EEC8C32C004B38: r"SB_AWD\240_269\ENGLISH\PS2_0264.awd",
+    0x01F42BF665A96A36: r"SB_AGD\150_179\SPANISH\XBX_0171.agd",
+    0x01FBF33F75CE3680: r"SB_AWD\210_239\GERMAN\NGC_0234.awd",
+    0x020A773FAA9F7DA5: r"SB_AWD\30_59\ITALIAN\NGC_0044.awd",
+    0x020C3A65E5570191: r"SB_AGD\240_269\FRENCH\PS2_0247.agd",
+    0x020CE1702DE37BD9: r"SB_AWD\180_209\ENGLISH\XBX_0180.awd",
+    0x0217EE3ABF25D58F: r"SB_AWD\120_149\GERMAN\PS2_0140.awd",
+    0x0219E7132972B212: r"AUDIO\GERMAN\XBX_2m2.rws",
+    0x022A5AB74FFF9F0C: r"w_sessionpreview.txd",
+    0x0231A3ACC3774842: r"SB_AWD\210_239\SPANISH\XBX_0232.awd",
+    0x0239EBEA7169CCB0: r"SB_AWD\240_269\GERMAN\NGC_0241.awd",
+    0x023FD78BC2DC289B: r"SB_AWD\90_119\GERMAN\NGC_0098.awd",
+    0x0241B8E5655C7C27: r"AUDIO\ITALIAN\NGC_4s3.rws",
+    0x025428C8BAB01811: r"SB_AWD\30_59\SPANISH\NGC_0031.awd",
+    0x025590F3A5E96619: r"SB_AWD\120_149\SPANISH\XBX_0121.awd",
+    0x025FB69D0C4EF5DE: r"SB_AGD\240_269\SPANISH\NGC_0245.agd",
+    0x0260A6B7502DAF8F: r"w_sessionpreview.dds",
+    0x0266224117FBA4EA: r"SB_AGD\0_29\ITALIAN\PS2_0004.agd",
+    0x0267E8FC4EEC294D: r"LEVELS\L_1_1\GodData.dff",
+    0x0269B50132D293DA: r"SB_AWD\30_59\GERMAN\NGC_0038.awd",
+    0x026A9E8D52212879: r"SB_AWD\0_29\ENGLISH\NGC_0019.awd",
+    0x026C3A5C2ADBD467: r"SB_AWD\60_89\SPANISH\NGC_0071.awd",
+    0x026D2738FD6EE167: r"SB_AGD\30_59\GERMAN\PS2_0038.agd",
+    0x0271DCF3302A83C0: r"SB_AGD\120_149\FRENCH\XBX_0124.agd",
+    0x027260FBCC0A5009: r"ANIMGRPS\Lvl_35\Lvl_35B.ads",
+    0x0273E097E009755E: r"SB_AGD\180_209\SPANISH\NGC_0181.agd",
+    0x027B583820EE8B8F: r"SB_AWD\180_209\SPANISH\XBX_0199.awd",
+    0x02825F17110C51ED: r"SB_AWD\150_179\GERMAN\PS2_0173.awd",
+    0x0283404650ED5FED: r"SB_AGD\0_29\ITALIAN\PS2_0025.agd",
+    0x02857AFA36E3E016: r"SB_AWD\30_59\ENGLISH\PS2_0055.awd",
+    0x0287305E0098811D: r"SB_AGD\180_209\GERMAN\NGC_0209.agd",
+    0x0293EF4C7B0D9719: r"SB_AGD\30_59\ENGLISH\XBX_0046.agd",
+    0x02968E24A6E30CB3: r"SHELL\LOAD\L_3_3_B.txd",
+    0x029BCB45E226515C: r"SB_AWD\90_119\FRENCH\PS2_0102.awd",
+    0x02A08722B3DB3B80: r"SB_AWD\30_59\ITALIAN\XBX_0054.awd",
+    0x02A37C080FC30340: r"SB_AGD\150_179\SPANISH\XBX_0173.agd",
+    0x02A53F554115468B: r"SB_AGD\90_119\FRENCH\PS2_0105.agd",
+    0x02A5DEAB68BE650A: r"SB_AWD\120_149\ENGLISH\XBX_0122.awd",
+    0x02AEBA01BE009504: r"AUDIO\FRENCH\PS2_4m1.rws",
+    0x02B300725F532793: r"SB_AGD\240_269\ENGLISH\XBX_0268.agd",
+    0x02B9390586506393: r"SB_AWD\90_119\ENGLISH\PS2_0110.awd",
+    0x02C2EE70C96FA5C1: r"SB_AWD\90_119\GERMAN\XBX_0098.awd",
+    0x02C4D7BF21DEB80D: r"SB_AGD\120_149\GERMAN\XBX_0127.agd",
+    0x02C63A6672471DFA: r"SB_AWD\90_119\SPANISH\XBX_0112.awd",
+    0x02D4B8BEA9FAE6D1: r"SB_AWD\210_239\FRENCH\PS2_0229.awd",
+    0x02D50CBCF1E0625D: r"SB_AGD\0_29\SPANISH\PS2_0025.agd",
+    0x02D5A560B6AF8BBA: r"SB_AWD\90_119\GERMAN\XBX_0101.awd",
+    0x02E9BEFE1278CCFD: r"SB_AGD\0_29\GERMAN\XBX_0020.agd",
+    0x02EB1C2299ECA808: r"SB_AWD\90_119\ENGLISH\NGC_0109.awd",
+    0x02F0BB75E9996B39: r"SB_AGD\30_59\GERMAN\PS2_0047.agd",
+    0x02F685F33F87C8A5: r"ANIMGRPS\Lvl_14\Lvl_14L.ads",
+    0x03061E534561180B: r"SB_AWD\90_119\FRENCH\NGC_0096.awd",
+    0x030A0D1C91FED735: r"SB_AWD\150_179\ENGLISH\XBX_0150.awd",
+    0x030E86AEB667B4E8: r"SB_AGD\240_269\SPANISH\NGC_0247.agd",
+    0x031A6BE3883413A9: r"SB_AWD\180_209\ITALIAN\NGC_0205.awd",
+    0x0322B0A98A223468: r"SB_AGD\180_209\SPANISH\NGC_0183.agd",
+    0x032992120B074B59: r"AUDIO\FRENCH\NGC_2m1.rws",
+    0x0335FBE73B6DC1DA: r"SB_AGD\90_119\ITALIAN\NGC_0107.agd",
+    0x0336CAEE79683F5A: r"ANIMGRPS\Lvl_36\Lvl_36W.ads",
+    0x033AD827FB32408E: r"ANIMGRPS\Lvl_16\Lvl_16G.ads",
+    0x034D68846F408A47: r"SB_AWD\60_89\ITALIAN\XBX_0068.awd",
+    0x03528DDEDA7854F1: r"SB_AWD\150_179\FRENCH\XBX_0169.awd",
+    0x03664D4C1A654C43: r"SB_AWD\120_149\GERMAN\NGC_0138.awd",
+    0x036B68F70FDE1431: r"AUDIO\ITALIAN\NGC_4s1.rws",
+    0x036C099D9AC07533: r"SB_AGD\210_239\FRENCH\XBX_0228.agd",
+    0x036F299D86E46C73: r"SB_AWD\180_209\ITALIAN\PS2_0192.awd",
+    0x036F7F9CF53DB129: r"ANIMGRPS\Lvl_33\Lvl_33B.ads",
+    0x0371B8CD9C90AB0C: r"SB_AGD\0_29\GERMAN\NGC_0001.agd",
+    0x03752A781C601374: r"SB_AWD\90_119\SPANISH\XBX_0110.awd",
+    0x037B547E7DE0A40F: r"SB_AGD\240_269\FRENCH\NGC_0257.agd",
+    0x0387A524B39508D9: r"LEVELS\L_2_1\SECTIONS\s_10.rws",
+    0x0390EA7B0B469D14: r"NetworkDisconnectWarning.layout",
+    0x039A36306753C837: r"SB_AGD\210_239\FRENCH\PS2_0234.agd",
+    0x03A7BCFC6C1A942A: r"SB_AGD\150_179\FRENCH\PS2_0172.agd",
+    0x03AA11F6B50101AA: r"SB_AGD\120_149\SPANISH\NGC_0124.agd",
+    0x03ABAFF8ED37E0D5: r"ANIMGRPS\Lvl_24\Lvl_24N.ads",
+    0x03B4EE64EF79D725: r"SB_AWD\90_119\FRENCH\NGC_0094.awd",
+    0x03C76DE275957A79: r"SB_AGD\90_119\ITALIAN\NGC_0117.agd",
+    0x03CE73E34A0FB939: r"SB_AWD\30_59\GERMAN\XBX_0044.awd",
+    0x03CFA91C24D5F4F3: r"SB_AGD\90_119\ITALIAN\PS2_0095.agd",
+    0x03D09504DDA3B755: r"SB_AWD\180_209\ENGLISH\NGC_0201.awd",
+    0x03D9CE5D7F220945: r"SB_AGD\150_179\ITALIAN\PS2_0153.agd",
+    0x03DE54850A91D8DA: r"SB_AWD\150_179\SPANISH\PS2_0172.awd",
+    0x03E57FF0BE32185E: r"AUDIO\SPANISH\XBX_1m3.rws",
+    0x03EB533755FEDA60: r"SB_AGD\150_179\ENGLISH\NGC_0171.agd",
+    0x03EEF7DAF856FFAC: r"SB_AWD\60_89\FRENCH\PS2_0073.awd",
+    0x03FB8E9645B337F9: r"SHELL\LOAD\MP_7_SD.txd",
+    0x04015DF084911383: r"SB_AWD\150_179\FRENCH\XBX_0167.awd",
+    0x0408713C8EF0955B: r"SB_AGD\150_179\ENGLISH\NGC_0158.agd",
+    0x0409653CC4E9AD9D: r"SB_AGD\120_149\ITALIAN\PS2_0144.agd",
+    0x0409A46140EE0F02: r"SB_AWD\0_29\GERMAN\PS2_0011.awd",
+    0x040DD12AB0832EB3: r"LEVELS\L_1_5_B\SECTIONS\s_1.rws",
+    0x040FBF149785DE59: r"SB_AGD\120_149\ITALIAN\XBX_0143.agd",
+    0x0417C7CAFA329A0F: r"SB_AGD\210_239\FRENCH\NGC_0239.agd",
+    0x041B702A016BAA32: r"SB_AGD\30_59\ENGLISH\PS2_0051.agd",
+    0x0424B0B30111696A: r"SB_AGD\60_89\ENGLISH\NGC_0070.agd",
+    0x0426132D1B1C6BCB: r"SB_AWD\120_149\ITALIAN\PS2_0128.awd",
+    0x042840BF8C823593: r"SB_AWD\30_59\ENGLISH\NGC_0037.awd",
+    0x042AB49027FA5849: r"SB_AGD\240_269\FRENCH\NGC_0255.agd",
+    0x042BB66BC6594721: r"SB_AGD\30_59\ITALIAN\PS2_0034.agd",
+    0x042C6BBF8B3A4C80: r"SB_AGD\90_119\FRENCH\XBX_0101.agd",
+    0x042CFE1EEA644DBD: r"SB_AWD\60_89\FRENCH\XBX_0079.awd",
+    0x043681C01F6AD9B9: r"WPNBANK\26_50\wbank_38.bin",
+    0x0439A48B7F8C0D35: r"SB_AWD\120_149\GERMAN\XBX_0145.awd",
+    0x04568D0E163353C4: r"SB_AGD\150_179\FRENCH\PS2_0170.agd",
+    0x0458E2085F19C144: r"SB_AGD\120_149\SPANISH\NGC_0126.agd",
+    0x045D362F0FD18AC3: r"SB_AWD\120_149\GERMAN\PS2_0131.awd",
+    0x046D6FE91B1639C4: r"SB_AGD\0_29\ENGLISH\NGC_0018.agd",
+    0x046DE4CDF4398428: r"LEVELS\L_3_1\SECTIONS\s_14.rws",
+    0x047ADB8492B04359: r"SB_AWD\240_269\ITALIAN\PS2_0254.awd",
+    0x047EDA2EBE50C3D6: r"LEVELS\L_1_1_B\CLUMPS\cbank_01.bin",
+    0x04878AA82D0111F8: r"SHELL\HUD\INSTANCE\XBOX\HUD_MP.TXD",
+    0x04889E6F293AC857: r"SB_AGD\150_179\ITALIAN\PS2_0155.agd",
+    0x0491960EBE350FC5: r"SB_AGD\0_29\ITALIAN\NGC_0028.agd",
+    0x0492B57D58A83961: r"SB_AGD\120_149\ENGLISH\XBX_0129.agd",
+    0x04970AB108CF799C: r"SB_AGD\240_269\SPANISH\PS2_0255.agd",
+    0x0499D33A1DB0E290: r"SB_AWD\240_269\FRENCH\PS2_0264.awd",
+    0x049C1D28BF977B69: r"SB_AGD\90_119\GERMAN\XBX_0102.agd",
+    0x049F873C55DB4A72: r"SB_AGD\60_89\ITALIAN\PS2_0079.agd",
+    0x04A12FBE611C7F27: r"SB_AGD\240_269\SPANISH\XBX_0255.agd",
+    0x04A14B28647BB71D: r"SB_AGD\0_29\SPANISH\NGC_0015.agd",
+    0x04ADCDBEA4A555DA: r"LEVELS\L_2_1_B\CLUMPS\cbank_02.bin",
+    0x04AE9A8AB4605B6F: r"SB_AGD\120_149\FRENCH\PS2_0142.agd",
+    0x04B4D51860D3D024: r"SB_AWD\120_149\SPANISH\PS2_0149.awd",
+    0x04B5B7AC3C38FDCD: r"SB_AGD\30_59\SPANISH\NGC_0044.agd",
+    0x04B8B54E6F03462F: r"SB_AGD\120_149\ITALIAN\PS2_0142.agd",
+    0x04C1BC0E45111D8A: r"SB_AWD\180_209\GERMAN\XBX_0190.awd",
+    0x04C36014AD1CB0AC: r"SB_AWD\30_59\FRENCH\NGC_0030.awd",
+    0x04C9312855069D2C: r"SB_AWD\60_89\ENGLISH\PS2_0064.awd",
+    0x04CAF4CA5D461947: r"IngameControlsSelect.layout",
+    0x04E14AC5C590FAC5: r"SB_AWD\180_209\SPANISH\PS2_0208.awd",
+    0x04E25908F5CA1026: r"SB_AWD\0_29\SPANISH\PS2_0008.awd",
+    0x04E74B0BE26E33A0: r"SB_AWD\30_59\ENGLISH\PS2_0057.awd",
+    0x04E7DECCC4F6CA08: r"SB_AWD\0_29\FRENCH\XBX_0009.awd",
+    0x04E86D66EB13B2C5: r"SB_AWD\150_179\FRENCH\NGC_0178.awd",
+    0x04EA9EC76EDEED28: r"SB_AGD\240_269\ENGLISH\XBX_0241.agd",
+    0x04ECD652737B3FDD: r"SB_AWD\60_89\SPANISH\XBX_0088.awd",
+    0x04F17F07A960EB5E: r"SB_AWD\120_149\ITALIAN\XBX_0131.awd",
+    0x04F4BB1C43D6396B: r"SB_AGD\0_29\FRENCH\NGC_0017.agd",
+    0x05070F66EC9F9A25: r"SB_AGD\90_119\FRENCH\PS2_0107.agd",
+    0x0508D56A38714758: r"SB_AWD\180_209\ENGLISH\XBX_0206.awd",
+    0x0527FCAC42F658B3: r"SB_AGD\240_269\SPANISH\PS2_0249.agd",
+    0x0529218736BD65B6: r"SB_AWD\210_239\ITALIAN\XBX_0218.awd",
+    0x053B8BDE64D6AD1D: r"SB_AWD\30_59\ITALIAN\NGC_0035.awd",
+    0x053F2C921ADC98DA: r"SB_AWD\0_29\ENGLISH\NGC_0005.awd",
+    0x05400D1DBAEC5F4D: r"SB_AWD\180_209\SPANISH\PS2_0190.awd",
+    0x05408F6654054303: r"SB_AGD\240_269\GERMAN\XBX_0240.agd",
+    0x05410B3C6624AFA9: r"SB_AGD\30_59\ENGLISH\XBX_0033.agd",
+    0x05459A4A564D6745: r"SB_AWD\180_209\GERMAN\PS2_0183.awd",
+    0x0545FB4F63A821E3: r"SB_AWD\90_119\ENGLISH\XBX_0092.awd",
+    0x05509B3A0E954FAF: r"SB_AGD\0_29\SPANISH\NGC_0013.agd",
+    0x055C98731BBDCAC6: r"SB_AGD\60_89\ITALIAN\NGC_0074.agd",
+    0x0561C8A2BAFA3D01: r"ANIMGRPS\Lvl_34\Lvl_34T.ads",
+    0x05671963456537A6: r"ANIMGRPS\Lvl_12\Lvl_12O.ads",
+    0x0575D929A5775D87: r"LEVELS\L_1_5\SECTIONS\s_15.rws",
+    0x05792D071C96AA97: r"SB_AWD\30_59\ENGLISH\PS2_0047.awd",
+    0x057D9DCEF8666C8A: r"SB_AGD\0_29\ITALIAN\XBX_0014.agd",
+    0x05854145F2651CDA: r"SB_AWD\90_119\GERMAN\PS2_0106.awd",
+    0x058569B51F8808C0: r"w_border_highlight.dds",
+    0x058F95DAED1BB6AC: r"SB_AWD\120_149\ENGLISH\PS2_0141.awd",
+    0x059331C6E964DDAB: r"SB_AWD\180_209\SPANISH\XBX_0205.awd",
+    0x059D1E8EBB1E2CB8: r"LEVELS\L_3_4\SECTIONS\s_2.rws",
+    0x059D43E8F5914D73: r"SB_AGD\150_179\GERMAN\PS2_0171.agd",
+    0x059D8DE8EE1FB048: r"LEVELS\L_1_1\SECTIONS\s_7.rws",
+    0x05A3E34056963BAC: r"SB_AGD\90_119\SPANISH\PS2_0108.agd",
+    0x05AED1E090F14C91: r"SB_AGD\0_29\FRENCH\PS2_0014.agd",
+    0x05AF69800B7B4694: r"SB_AGD\180_209\SPANISH\PS2_0205.agd",
+    0x05B6881D579D9A91: r"ANIMGRPS\Lvl_34\Lvl_34D.ads",
+    0x05BAA33712D0E93B: r"SB_AGD\90_119\ENGLISH\NGC_0094.agd",
+    0x05BAECFD3ED50BF1: r"LEVELS\MP_7\global.dff",
+    0x05BC45B51FB70D93: r"w_border_highlight.txd",
+    0x05C14788EB4346A9: r"SB_AWD\120_149\FRENCH\PS2_0140.awd",
+    0x05C5497AB254DB9A: r"SB_AGD\30_59\GERMAN\PS2_0057.agd",
+    0x05CA84D4966E628C: r"SB_AGD\30_59\FRENCH\NGC_0030.agd",
+    0x05D131B09E76BE50: r"SB_AWD\210_239\ITALIAN\PS2_0233.awd",
+    0x05D207D9D87B17DC: r"SB_AWD\150_179\ITALIAN\XBX_0155.awd",
+    0x05D2C81233B1046F: r"SB_AGD\240_269\ITALIAN\PS2_0263.agd",
+    0x05DE00842C59965C: r"SB_AWD\180_209\FRENCH\NGC_0196.awd",
+    0x05ECBCD2999B4D24: r"SB_AGD\120_149\ITALIAN\XBX_0128.agd",
+    0x05EE67F20061A64B: r"SB_AGD\90_119\ENGLISH\XBX_0108.agd",
+    0x05EF5D2F6505F7DF: r"SB_AWD\180_209\SPANISH\PS2_0196.awd",
+    0x05F57E0749393A2C: r"SB_AWD\0_29\ITALIAN\NGC_0007.awd",
+    0x05F80F21EEE48E24: r"SB_AWD\60_89\ITALIAN\NGC_0069.awd",
+    0x05FB10488CA3E80C: r"SB_AWD\240_269\SPANISH\PS2_0260.awd",
+    0x060A798661FD00A6: r"SB_AGD\240_269\SPANISH\XBX_0243.agd",
+    0x061094B46512F5CB: r"ANIMGRPS\Lvl_34\Lvl_34V.ads",
+    0x0610A647D9C83416: r"SB_AWD\0_29\ENGLISH\PS2_0013.awd",
+    0x0611E35122CC0872: r"SB_AWD\210_239\GERMAN\NGC_0232.awd",
+    0x061D1967D5D40FB7: r"LEVELS\L_3_5_C\SECTIONS\s_19.rws",
+    0x06218A779253C323: r"SB_AGD\240_269\FRENCH\PS2_0249.agd",
+    0x062FBE553824C32A: r"SB_AGD\60_89\FRENCH\PS2_0079.agd",
+    0x0630885DF00738DF: r"ANIMGRPS\Lvl_15\Lvl_15P.ads",
+    0x0638A65F608D2E87: r"SB_AGD\210_239\ITALIAN\XBX_0224.agd",
+    0x064DA349018A0772: r"SB_AGD\150_179\ENGLISH\NGC_0177.agd",
+    0x0654C3584982BCA2: r"SB_AWD\210_239\GERMAN\PS2_0220.awd",
+    0x0676BC294C7629BA: r"SB_AWD\180_209\GERMAN\XBX_0183.awd",
+    0x067BF252C4F93F84: r"SB_AGD\0_29\ITALIAN\PS2_0006.agd",
+    0x06813480E241FB41: r"ANIMGRPS\Lvl_23\Lvl_23H.ads",
+    0x068F195AE4355A3D: r"SB_AGD\60_89\ITALIAN\PS2_0061.agd",
+    0x06991057FDEAFAFF: r"SB_AGD\0_29\ITALIAN\PS2_0023.agd",
+    0x06992518AE88F9D7: r"LEVELS\L_1_3_B\SECTIONS\s_10.rws",
+    0x069DF082C30905FD: r"SB_AGD\180_209\ITALIAN\NGC_0182.agd",
+    0x06A926A4683AE32E: r"SB_AGD\180_209\GERMAN\XBX_0194.agd",
+    0x06AA703EFE4F254B: r"LEVELS\MP_2\level.dff",
+    0x06AB1EA06587D242: r"LEVELS\L_3_4\SECTIONS\s_4.rws",
+    0x06B5453B71E4CF53: r"SB_AWD\150_179\SPANISH\XBX_0178.awd",
+    0x06B6773460D90D72: r"SB_AWD\30_59\ITALIAN\XBX_0052.awd",
+    0x06C092F0E238C36E: r"SB_AWD\150_179\ENGLISH\NGC_0151.awd",
+    0x06C1C337EAE4B49B: r"SB_AGD\0_29\ENGLISH\XBX_0002.agd",
+    0x06C1F82946C7E0C8: r"w_networkloginBKG.dds",
+    0x06D34F6CD49FB953: r"SB_AWD\210_239\FRENCH\XBX_0211.awd",
+    0x06D6F3FB7EE70BD1: r"ANIMGRPS\Lvl_23\Lvl_23X.ads",
+    0x06DE31B6CE531F58: r"SB_AGD\210_239\ENGLISH\NGC_0236.agd",
+    0x06E36DBBC65D5D3B: r"SB_AWD\90_119\ENGLISH\NGC_0111.awd",
+    0x06E81F3EFE83FCDB: r"LEVELS\MP_2\level.rws",
+    0x06EA5CCE9EDD23EF: r"SB_AGD\0_29\SPANISH\PS2_0023.agd",
+    0x06EB957263AD5D34: r"SB_AWD\90_119\GERMAN\XBX_0103.awd",
+    0x06F5100BA8673091: r"SB_AGD\150_179\GERMAN\XBX_0170.agd",
+    0x06F7E42946F54E4B: r"w_networkloginBKG.txd",
+    0x06FC034BC93BD9C2: r"SB_AWD\240_269\FRENCH\PS2_0262.awd",
+    0x06FFB4BD888ED3B8: r"LEVELS\L_3_4\SECTIONS\s_11.rws",
+    0x071110092E38C1E9: r"SB_AWD\120_149\SPANISH\NGC_0145.awd",
+    0x071D0A8041944C59: r"SB_AWD\180_209\SPANISH\NGC_0199.awd",
+    0x0724F3AF0E67651D: r"SB_AGD\120_149\GERMAN\XBX_0134.agd",
+    0x072E0A8C660D4A39: r"SB_AGD\150_179\ENGLISH\PS2_0179.agd",
+    0x0745B8975F92269C: r"SB_AGD\240_269\FRENCH\PS2_0260.agd",
+    0x075BD64D1157C86C: r"SHELL\MOVIES\ITALIAN\1_2_Mon.bik",
+    0x0761F8FF75F71D51: r"SB_AWD\0_29\SPANISH\NGC_0019.awd",
+    0x077284FBCFABEE0B: r"SB_AWD\210_239\ENGLISH\XBX_0211.awd",
+    0x0780E1B788D67045: r"SB_AGD\30_59\FRENCH\PS2_0049.agd",
+    0x07858DFA9942F952: r"LEVELS\L_1_1\SECTIONS\s_1.rws",
+    0x078A9846146DF574: r"SB_AGD\90_119\FRENCH\NGC_0099.agd",
+    0x079B51CB1CD3A9EC: r"SHELL\FONTS\mlta30.png",
+    0x079E8DC46C709E1A: r"AUDIO\SPANISH\PS2_1m2.rws",
+    0x07A0067E1E6EA789: r"SB_AGD\210_239\ENGLISH\XBX_0239.agd",
+    0x07A60BD990A6C6FA: r"w_betagamespy.txd",
+    0x07BE6884C7481E50: r"SB_AGD\60_89\ITALIAN\NGC_0076.agd",
+    0x07C6B6B6D271DE04: r"SB_AWD\30_59\SPANISH\PS2_0044.awd",
+    0x07CAAFC543ED5279: r"SB_AWD\240_269\GERMAN\XBX_0259.awd",
+    0x07CAE140CCB73E15: r"SB_AWD\60_89\FRENCH\NGC_0082.awd",
+    0x07CD6D3600353F88: r"SB_AGD\240_269\GERMAN\XBX_0269.agd",
+    0x07D38777228FD969: r"SB_AGD\30_59\SPANISH\NGC_0039.agd",
+    0x07D443C0B880FDAF: r"SB_AGD\120_149\GERMAN\XBX_0132.agd",
+    0x07D49B3E9E5A8E5B: r"SB_AWD\120_149\ITALIAN\NGC_0143.awd",
+    0x07DBF7D990D43461: r"w_betagamespy.dds",
+    0x07E685168AA188C7: r"SB_AWD\180_209\ENGLISH\NGC_0207.awd",
+    0x07FA6C190B8BA868: r"AUDIO\ITALIAN\XBX_4s2.rws",
+    0x07FBF1827E1834E4: r"SB_AGD\180_209\FRENCH\XBX_0198.agd",
+    0x08018271B54FAD71: r"SB_AWD\30_59\FRENCH\NGC_0048.awd",
+    0x0806029187494AEC: r"SB_AGD\210_239\ITALIAN\NGC_0221.agd",
+    0x0806B74809A4AA50: r"LEVELS\MP_6\SECTIONS\s_5.rws",
+    0x0819542F03299ADB: r"ANIMGRPS\Lvl_34\Lvl_34F.ads",
+    0x081F9A069A331336: r"ANIMGRPS\Lvl_31\Lvl_31I.ads",
+    0x0821550D79C4AD25: r"SB_AWD\210_239\ENGLISH\XBX_0213.awd",
+    0x08297F104925A9E6: r"SB_AGD\0_29\SPANISH\XBX_0021.agd",
+    0x082BB8DC1B18C775: r"WPNBANK\0_25\wbank_21.bin",
+    0x083361C24A01B482: r"SB_AWD\210_239\ITALIAN\PS2_0235.awd",
+    0x083A80C4AE0F0404: r"SB_AGD\60_89\ENGLISH\NGC_0072.agd",
+    0x083B6931B7AFA3CC: r"SB_AWD\120_149\SPANISH\PS2_0138.awd",
+    0x083F2D762897F0D6: r"SB_AGD\60_89\GERMAN\XBX_0089.agd",
+    0x0846D864D5525E59: r"SB_AWD\180_209\SPANISH\XBX_0188.awd",
+    0x084A04A425D114A6: r"SB_AGD\90_119\ITALIAN\XBX_0101.agd",
+    0x085DEC29818CA63B: r"SB_AGD\210_239\GERMAN\NGC_0211.agd",
+    0x086527F538B8742C: r"SB_AWD\90_119\ITALIAN\PS2_0117.awd",
+    0x086BA109A9AFD59A: r"SB_AWD\150_179\ENGLISH\PS2_0165.awd",
+    0x086D1031928A1EE0: r"LEVELS\L_1_1_B\SECTIONS\s_6.rws",
+    0x08727659855287A0: r"SB_AWD\0_29\ENGLISH\PS2_0011.awd",
+    0x0874FCB05A9BD053: r"SB_AWD\30_59\SPANISH\PS2_0032.awd",
+    0x0879D15276D03387: r"SB_AWD\60_89\FRENCH\NGC_0084.awd",
+    0x087B3B5954D7BF44: r"SB_AWD\0_29\GERMAN\XBX_0010.awd",
+    0x089BD52A59C28261: r"LEVELS\L_1_3_B\SECTIONS\s_12.rws",
+    0x08A1C16433A0E4A3: r"SB_AGD\150_179\GERMAN\NGC_0152.agd",
+    0x08A8A614C65760E9: r"SB_AWD\60_89\FRENCH\NGC_0073.awd",
+    0x08B052835F686C03: r"SB_AWD\30_59\FRENCH\NGC_0046.awd",
+    0x08B4EE8FA2DFCC8B: r"SB_AGD\180_209\SPANISH\XBX_0195.agd",
+    0x08BBF35EDB93A43B: r"SB_AWD\210_239\ITALIAN\XBX_0220.awd",
+    0x08D4D8974130EA78: r"SB_AWD\30_59\ENGLISH\XBX_0043.awd",
+    0x08D5B6F1D48E36AD: r"SB_AWD\0_29\ENGLISH\XBX_0008.awd",
+    0x08D6F18A33F462A7: r"SB_AWD\210_239\GERMAN\PS2_0218.awd",
+    0x08E03065F1677F3B: r"SB_AWD\0_29\FRENCH\XBX_0011.awd",
+    0x08EA575EFEA51DA7: r"LEVELS\L_1_5\SECTIONS\s_4.rws",
+    0x08EBB56A5796206D: r"SB_AWD\240_269\FRENCH\PS2_0258.awd",
+    0x08FD1304E3D78E39: r"SB_AWD\150_179\ENGLISH\PS2_0179.awd",
+    0x09014BAE4DA52C37: r"SB_AGD\240_269\SPANISH\XBX_0246.agd",
+    0x09045854BF7AFE97: r"SB_AWD\0_29\ENGLISH\PS2_0005.awd",
+    0x09062F19565C9C88: r"SB_AWD\120_149\ITALIAN\XBX_0133.awd",
+    0x091AE68BC0C72682: r"SHELL\FEND\INSTANCE\SKY\FEND.TXD",
+    0x091AF0D16F6EF492: r"SB_AWD\210_239\FRENCH\NGC_0223.awd",
+    0x092435DF876F4046: r"SB_AGD\60_89\ENGLISH\PS2_0075.agd",
+    0x09360AB545D2EBCC: r"SB_AGD\60_89\GERMAN\NGC_0067.agd",
+    0x0938C00D2A71581B: r"ANIMGRPS\Lvl_23\Lvl_23Z.ads",
+    0x09411CCA5AB87FB6: r"SB_AGD\90_119\FRENCH\NGC_0112.agd",
+    0x09515527E6BF4AAE: r"SB_AGD\90_119\ENGLISH\PS2_0111.agd",
+    0x095868AD749C7EE9: r"SB_AGD\60_89\SPANISH\NGC_0086.agd",
+    0x095868E8E66E3496: r"LEVELS\MP_4\SECTIONS\s_5.rws",
+    0x095A4A5C034918F7: r"SB_AWD\180_209\GERMAN\PS2_0185.awd",
+    0x095CF9051F5634F4: r"SB_AGD\90_119\GERMAN\NGC_0109.agd",
+    0x0960567FD22D31AD: r"SB_AWD\0_29\GERMAN\PS2_0009.awd",
+    0x0972024892AA96FD: r"SB_AGD\30_59\ENGLISH\PS2_0049.agd",
+    0x097C86D60F1156A8: r"SB_AWD\210_239\FRENCH\PS2_0224.awd",
+    0x097D5A8BFF0070A6: r"ANIMGRPS\Lvl_31\Lvl_31Y.ads",
+    0x09842AD9DC4AD2F9: r"SB_AGD\30_59\GERMAN\XBX_0044.agd",
+    0x09912D15778E99B4: r"SB_AGD\0_29\GERMAN\XBX_0025.agd",
+    0x09A4532D33369CDD: r"SB_AWD\240_269\ENGLISH\XBX_0240.awd",
+    0x09A877006CF84014: r"SB_AWD\0_29\FRENCH\NGC_0018.awd",
+    0x09AA2A3D32F23579: r"SB_AGD\180_209\ENGLISH\XBX_0180.agd",
+    0x09AD1A14462A4956: r"SB_AGD\60_89\GERMAN\PS2_0073.agd",
+    0x09BA6C7394AD7B9C: r"SB_AGD\240_269\GERMAN\NGC_0245.agd",
+    0x09CE0B333C8D3EC2: r"AUDIO\FRENCH\PS2_2m1.rws",
+    0x09D31CF66E1AE5FB: r"ANIMGRPS\MPA_00\MPA_00D.ads",
+    0x09D48FF77989BE31: r"SB_AWD\210_239\SPANISH\NGC_0215.awd",
+    0x09DBDB746E6080F8: r"LOC\SP\GLOBAL.LOC",
+    0x09DD0A7863AE65EA: r"SB_AGD\30_59\ITALIAN\NGC_0058.agd",
+    0x09E4EAC6EFEBC58E: r"SB_AGD\60_89\GERMAN\NGC_0069.agd",
+    0x09E81024D8667A17: r"SHELL\FONTS\mtw28.png",
+    0x09E9A856718EC115: r"EULA.layout",
+    0x09F06CDC04D218C0: r"SB_AGD\90_119\FRENCH\NGC_0110.agd",
+    0x09F40095D95782FE: r"SB_AWD\180_209\FRENCH\NGC_0198.awd",
+    0x09F80E4B9EC761BF: r"SB_AWD\60_89\FRENCH\XBX_0068.awd",
+    0x09F9E7E2C120C403: r"SB_AGD\60_89\SPANISH\XBX_0064.agd",
+    0x09FA1C9E51E86895: r"SB_AGD\0_29\FRENCH\XBX_0013.agd",
+    0x09FB3123178293C4: r"LEVELS\L_2_1\SECTIONS\s_2.rws",
+    0x09FDB06ED4C866E3: r"SB_AWD\180_209\ENGLISH\NGC_0197.awd",
+    0x0A0298912EC8BA9A: r"SB_AGD\150_179\ENGLISH\PS2_0165.agd",
+    0x0A0A3E18F635070E: r"SB_AWD\0_29\ITALIAN\NGC_0009.awd",
+    0x0A140770A926B5B1: r"LEVELS\L_1_5\SECTIONS\s_6.rws",
+    0x0A2294EEAADF8331: r"SB_AGD\90_119\SPANISH\XBX_0119.agd",
+    0x0A366B5049E4E1F5: r"SB_AWD\120_149\ITALIAN\NGC_0141.awd",
+    0x0A39DF71AECE7BE9: r"SB_AWD\90_119\SPANISH\NGC_0104.awd",
+    0x0A3EFC0F8052C045: r"SB_AGD\60_89\GERMAN\PS2_0063.agd",
+    0x0A4B5E6ECED45AB3: r"SB_AGD\240_269\GERMAN\NGC_0259.agd",
+    0x0A56E17F3B062733: r"SB_AGD\150_179\GERMAN\NGC_0167.agd",
+    0x0A62855899D4A80C: r"LEVELS\L_3_5\SECTIONS\s_21.rws",
+    0x0A6BEB6F74057ECA: r"SB_AGD\30_59\FRENCH\XBX_0038.agd",
+    0x0A6FBF601A0DB91B: r"StartMenu.layout",
+    0x0A70213E85A7E4B0: r"w_sessionpreview.index",
+    0x0A74F569736AC53A: r"SB_AWD\210_239\ITALIAN\NGC_0238.awd",
+    0x0A8CAC3AF973FB34: r"SB_AWD\180_209\GERMAN\XBX_0181.awd",
+    0x0A92136EAC5C803D: r"SB_AWD\210_239\ITALIAN\NGC_0211.awd",
+    0x0A9700928F3F8F0B: r"ANIMGRPS\Lvl_23\Lvl_23J.ads",
+    0x0A9F3DCA0CA8C2DA: r"SB_AWD\240_269\GERMAN\XBX_0245.awd",
+    0x0A9FE39082E22968: r"SB_AWD\150_179\SPANISH\XBX_0151.awd",
+    0x0ABDF6B61536CB38: r"SB_AGD\180_209\GERMAN\XBX_0196.agd",
+    0x0AC3942404299A76: r"SB_AWD\180_209\GERMAN\PS2_0193.awd",
+    0x0AD3A4832B6FEE58: r"SB_AGD\30_59\ITALIAN\PS2_0039.agd",
+    0x0AD683028F3694D8: r"SB_AWD\150_179\ENGLISH\NGC_0153.awd",
+    0x0AD7934997E24FB5: r"SB_AGD\0_29\ENGLISH\XBX_0000.agd",
+    0x0AEDCC212A6B7F57: r"SB_AGD\60_89\GERMAN\PS2_0065.agd",
+    0x0AF4B47717BA22B1: r"SB_AWD\210_239\GERMAN\XBX_0237.awd",
+    0x0B16BEA14E6A2025: r"SB_AGD\180_209\SPANISH\XBX_0197.agd",
+    0x0B1CDAFE1C36295F: r"SB_AGD\210_239\ITALIAN\XBX_0215.agd",
+    0x0B1D7F437C4FE38C: r"SB_AWD\150_179\GERMAN\XBX_0162.awd",
+    0x0B1F513834CC2277: r"SB_AGD\0_29\SPANISH\XBX_0024.agd",
+    0x0B27889FD020A860: r"SB_AGD\60_89\ITALIAN\NGC_0065.agd",
+    0x0B2CA01BAAB50338: r"SB_AWD\240_269\ENGLISH\NGC_0258.awd",
+    0x0B3EED66B346541B: r"SHELL\LOAD\L_2_2_B.txd",
+    0x0B40D6CC11794037: r"SB_AGD\90_119\ITALIAN\XBX_0104.agd",
+    0x0B4425433DC02E5D: r"SB_AWD\210_239\ENGLISH\NGC_0219.awd",
+    0x0B45EACFDEE5BCC7: r"SB_AGD\210_239\SPANISH\NGC_0239.agd",
+    0x0B495096ACA9184C: r"LEVELS\L_3_1_B\SECTIONS\s_4.rws",
+    0x0B495632966E8230: r"SB_AGD\240_269\SPANISH\NGC_0265.agd",
+    0x0B61ED5524F247FC: r"SB_AGD\90_119\FRENCH\PS2_0094.agd",
+    0x0B69C4EB89FAF2EB: r"SB_AWD\150_179\SPANISH\NGC_0150.awd",
+    0x0B6EA1D729DE08CE: r"SB_AWD\120_149\SPANISH\NGC_0120.awd",
+    0x0B6EB2A57E95B335: r"AUDIO\ENGLISH\PS2_4s2.rws",
+    0x0B7D34198F12D14A: r"SB_AWD\60_89\FRENCH\NGC_0063.awd",
+    0x0B7ED052BFDA6DBC: r"SB_AWD\0_29\ENGLISH\NGC_0025.awd",
+    0x0B8605F132F993D0: r"SB_AGD\60_89\ENGLISH\PS2_0077.agd",
+    0x0B97D4D4E1B8C15A: r"SB_AWD\0_29\GERMAN\PS2_0020.awd",
+    0x0B9C2933A8EC0622: r"SB_AGD\0_29\FRENCH\NGC_0012.agd",
+    0x0BA5928FE93A101C: r"SB_AGD\120_149\FRENCH\NGC_0126.agd",
+    0x0BB2A30683C316D1: r"SB_AGD\30_59\FRENCH\NGC_0048.agd",
+    0x0BB64AF43A618074: r"SB_AGD\120_149\GERMAN\PS2_0136.agd",
+    0x0BB66F7B37B33329: r"SB_AGD\180_209\ITALIAN\PS2_0187.agd",
+    0x0BC2AC53293DE29C: r"SB_AWD\90_119\FRENCH\NGC_0103.awd",
+    0x0BC8AF92130743DA: r"SB_AGD\120_149\SPANISH\XBX_0148.agd",
+    0x0BDBB6748E2B4810: r"SB_AWD\0_29\ENGLISH\PS2_0024.awd",
+    0x0BED51479201DCFA: r"SB_AWD\150_179\ITALIAN\NGC_0155.awd",
+    0x0BF0B98D31AC2FE1: r"SB_AGD\30_59\GERMAN\NGC_0059.agd",
+    0x0BFB5169651FF556: r"SB_AGD\0_29\ENGLISH\XBX_0029.agd",
+    0x0C037541D512E139: r"LEVELS\MP_7\SECTIONS\s_7.rws",
+    0x0C06E0BBCE1DA70B: r"SB_AWD\180_209\ENGLISH\PS2_0192.awd",
+    0x0C0C0E4C89154DEE: r"SB_AWD\210_239\SPANISH\NGC_0234.awd",
+    0x0C14E2EEE38EAA30: r"SB_AGD\180_209\ITALIAN\NGC_0208.agd",
+    0x0C17E7EC6D220AC7: r"SB_AGD\60_89\ENGLISH\PS2_0067.agd",
+    0x0C1EA559A5F63151: r"SB_AGD\120_149\GERMAN\NGC_0136.agd",
+    0x0C232A65BB0FB612: r"SB_AGD\60_89\ITALIAN\XBX_0087.agd",
+    0x0C25157834D8F72C: r"SHELL\DNAS_SCEA.REL",
+    0x0C399DAD3BC1C387: r"w_sessionlist.dds",
+    0x0C48F4920F469396: r"SB_AWD\180_209\ITALIAN\NGC_0196.awd",
+    0x0C4EA4EDC8211C73: r"WPNBANK\0_25\wbank_23.bin",
+    0x0C4F07E9DCCA7460: r"AUDIO\FRENCH\PS2_2s1.rws",
+    0x0C544136F1838C96: r"SB_AGD\120_149\ENGLISH\PS2_0121.agd",
+    0x0C5519618872782C: r"SB_AWD\210_239\FRENCH\XBX_0238.awd",
+    0x0C5870C28AD65D98: r"SB_AWD\180_209\FRENCH\NGC_0189.awd",
+    0x0C5C124A78051B0A: r"SB_AWD\30_59\GERMAN\PS2_0044.awd",
+    0x0C61F3182DDCAF63: r"SB_AGD\30_59\FRENCH\NGC_0046.agd",
+    0x0C6F81AD3BEF23F4: r"w_sessionlist.txd",
+    0x0C78D6AC69774E0C: r"ANIMGRPS\Lvl_13\Lvl_13W.ads",
+    0x0C79E806E5B4410E: r"SB_AWD\90_119\ITALIAN\PS2_0119.awd",
+    0x0C7C1DBB208CFCE9: r"SB_AWD\240_269\ITALIAN\NGC_0260.awd",
+    0x0C8FAD2E790511C4: r"SB_AWD\150_179\GERMAN\PS2_0176.awd",
+    0x0C9BAEF0711FD2D6: r"SB_AGD\240_269\ENGLISH\NGC_0252.agd",
+    0x0C9C41593C1AD274: r"SB_AWD\150_179\ITALIAN\NGC_0157.awd",
+    0x0CA4D739BD97ABBF: r"ANIMGRPS\Lvl_36\Lvl_36N.ads",
+    0x0CA525537F20DF93: r"LEVELS\MP_7\SECTIONS\s_9.rws",
+    0x0CA57E373D7EF098: r"SB_AGD\180_209\ENGLISH\XBX_0206.agd",
+    0x0CAC132D49E72EC6: r"SB_AWD\210_239\ENGLISH\XBX_0236.awd",
+    0x0CACC120BF6A3423: r"SB_AWD\180_209\ENGLISH\XBX_0195.awd",
+    0x0CB4822243278E84: r"SB_AWD\0_29\FRENCH\PS2_0028.awd",
+    0x0CB4C2751161459C: r"SB_AWD\30_59\ITALIAN\PS2_0053.awd",
+    0x0CB5B0CD78366625: r"SB_AWD\180_209\ENGLISH\PS2_0190.awd",
+    0x0CC650533B0B3F0B: r"SB_AWD\90_119\GERMAN\NGC_0106.awd",
+    0x0CCB999610FC0815: r"SB_AGD\120_149\ITALIAN\NGC_0130.agd",
+    0x0CCDF56B500FC9E3: r"SB_AGD\120_149\GERMAN\NGC_0138.agd",
+    0x0CDBDB0A63D6D4D3: r"SB_AWD\60_89\ITALIAN\PS2_0074.awd",
+    0x0CDC8EA51064877C: r"ANIMGRPS\Lvl_22\Lvl_22W.ads",
+    0x0CED1D969E5EFE23: r"w_borderlarge.txd",
+    0x0CF0B7D118A6FD19: r"AUDIO\ENGLISH\NGC_2m1.rws",
+    0x0CFE80B282CD51BB: r"SB_AWD\120_149\ITALIAN\XBX_0127.awd",
+    0x0D0994B1C4594C2C: r"SB_AWD\30_59\GERMAN\NGC_0047.awd",
+    0x0D22E1969E8C27B0: r"w_borderlarge.dds",
+    0x0D282492649B0D3A: r"SHELL\MOVIES\fend.bik",
+    0x0D3434663E9B90DD: r"SB_AWD\210_239\ITALIAN\PS2_0225.awd",
+    0x0D455E9A281ED2B4: r"SB_AGD\180_209\ITALIAN\NGC_0187.agd",
+    0x0D54B980ADCF4A05: r"SB_AGD\180_209\FRENCH\NGC_0193.agd",
+    0x0D66253993BB32B8: r"SB_AGD\90_119\ENGLISH\PS2_0113.agd",
+    0x0D666B0942E58078: r"SB_AWD\120_149\ITALIAN\XBX_0146.awd",
+    0x0D6C96B0510D85F3: r"LEVELS\L_2_1_B\SECTIONS\s_11.rws",
+    0x0D6CB301A953FB8F: r"SB_AWD\210_239\FRENCH\NGC_0239.awd",
+    0x0D72C276A304A596: r"SB_AWD\180_209\ITALIAN\XBX_0187.awd",
+    0x0D752064E523FE25: r"SB_AWD\90_119\GERMAN\NGC_0104.awd",
+    0x0D7BD37DEEBD4A88: r"SB_AGD\90_119\GERMAN\PS2_0100.agd",
+    0x0D7BE3984D4C2A4A: r"SB_AWD\210_239\ENGLISH\NGC_0230.awd",
+    0x0D7EBB0FC7C09799: r"SB_AGD\210_239\ITALIAN\XBX_0217.agd",
+    0x0D89D8B17BABD572: r"SB_AGD\60_89\ITALIAN\NGC_0063.agd",
+    0x0D8AFBD32B736152: r"SB_AWD\90_119\ENGLISH\NGC_0114.awd",
+    0x0D90A515080B8664: r"SB_AWD\120_149\FRENCH\XBX_0128.awd",
+    0x0D9778BA64221769: r"SB_AWD\60_89\ITALIAN\XBX_0075.awd",
+    0x0DA14340998681A0: r"SB_AWD\150_179\SPANISH\NGC_0179.awd",
+    0x0DBA864BEFD1FC67: r"SB_AWD\180_209\GERMAN\PS2_0196.awd",
+    0x0DBD5F37BBC59CB2: r"SB_AWD\30_59\FRENCH\PS2_0059.awd",
+    0x0DDCC28C3358C8C2: r"SB_AGD\120_149\GERMAN\PS2_0149.agd",
+    0x0DE8F1081B1887D5: r"ANIMGRPS\MPA_00\MPA_00B.ads",
+    0x0DF2B264CF1123F1: r"SB_AGD\30_59\ITALIAN\PS2_0052.agd",
+    0x0DFBD4A6E128D7DF: r"SHELL\MOVIES\ITALIAN\3_3_Mon.bik",
+    0x0E052AAFF5E17761: r"SB_AGD\90_119\GERMAN\NGC_0113.agd",
+    0x0E070ADDB12B78F1: r"SB_AGD\210_239\GERMAN\XBX_0211.agd",
+    0x0E09C716DB0D8D28: r"SB_AWD\0_29\SPANISH\NGC_0014.awd",
+    0x0E0EECAFFEE450A7: r"SB_AGD\0_29\FRENCH\XBX_0015.agd",
+    0x0E0F5E7D6D0D2EEF: r"SB_AWD\240_269\GERMAN\NGC_0264.awd",
+    0x0E1112657F6A273A: r"SB_AWD\30_59\GERMAN\PS2_0057.awd",
+    0x0E19854D47F3CCCA: r"SB_AWD\0_29\GERMAN\NGC_0021.awd",
+    0x0E2307599863365F: r"SB_AGD\30_59\SPANISH\XBX_0053.agd",
+    0x0E269585F7B37D52: r"SB_AGD\30_59\ITALIAN\XBX_0038.agd",
+    0x0E27868E24BF9FA2: r"SB_AGD\90_119\ITALIAN\NGC_0099.agd",
+    0x0E39671E2D567447: r"LEVELS\MP_9\global.dff",
+    0x0E3AED49DFDD1246: r"SB_AWD\90_119\FRENCH\XBX_0110.awd",
+    0x0E3DE68639B63F42: r"SB_AWD\0_29\ENGLISH\PS2_0022.awd",
+    0x0E46D9B0E2C0D256: r"SB_AWD\180_209\FRENCH\PS2_0205.awd",
+    0x0E4EED036A50328A: r"SB_AWD\90_119\SPANISH\PS2_0102.awd",
+    0x0E5085D6EF03884F: r"SB_AGD\0_29\SPANISH\XBX_0015.agd",
+    0x0E559911B3A31EB6: r"SB_AWD\240_269\SPANISH\XBX_0250.awd",
+    0x0E6750E79D7443B1: r"SB_AGD\150_179\SPANISH\PS2_0179.agd",
+    0x0E7A96BADF20DD16: r"SB_AWD\90_119\ENGLISH\PS2_0119.awd",
+    0x0E7F33AE345C8578: r"SB_AGD\120_149\ITALIAN\NGC_0148.agd",
+    0x0E8AFD80006EA38A: r"SB_AGD\180_209\ITALIAN\PS2_0197.agd",
+    0x0E9141F21CFBDE3A: r"LOC\SP\MULTILVL.LOC",
+    0x0E9FA394C0A05598: r"SB_AGD\120_149\ENGLISH\XBX_0124.agd",
+    0x0EA7E380595A1BCF: r"SB_AWD\210_239\ITALIAN\NGC_0217.awd",
+    0x0EAAC4A3BAD0E720: r"SB_AWD\180_209\ITALIAN\NGC_0194.awd",
+    0x0EAD6DFADEDBA3B0: r"SB_AGD\60_89\SPANISH\NGC_0065.agd",
+    0x0EB6D5816671069D: r"SB_AWD\30_59\FRENCH\PS2_0041.awd",
+    0x0EC93FBDDCEC1BF9: r"SB_AWD\90_119\ITALIAN\PS2_0093.awd",
+    0x0ECC82814C8649A1: r"SB_AGD\240_269\FRENCH\XBX_0244.agd",
+    0x0ED55776A569B07F: r"SB_AWD\240_269\SPANISH\NGC_0257.awd",
+    0x0EDFBBEFF33201B6: r"ANIMGRPS\Lvl_15\Lvl_15M.ads",
+    0x0EE40041FB0852EE: r"SB_AWD\240_269\FRENCH\XBX_0261.awd",
+    0x0EE59FDE16C50CB6: r"SB_AWD\240_269\SPANISH\PS2_0240.awd",
+    0x0EFE00BFC0A2A2FD: r"SB_AWD\120_149\ENGLISH\NGC_0130.awd",
+    0x0F037A5215B15312: r"SB_AWD\240_269\FRENCH\NGC_0249.awd",
+    0x0F06231E5650A3CC: r"SHELL\MOVIES\ITALIAN\EndGame.bik",
+    0x0F0A8488C4B7BE43: r"SB_AWD\210_239\GERMAN\XBX_0239.awd",
+    0x0F18C1859B28D8FC: r"SB_AGD\210_239\ITALIAN\PS2_0228.agd",
+    0x0F1ABB352436FBA3: r"SB_AWD\240_269\ITALIAN\PS2_0241.awd",
+    0x0F1E12A601BF78C8: r"SB_AGD\180_209\GERMAN\XBX_0185.agd",
+    0x0F23401897B5C8C1: r"SB_AWD\120_149\ENGLISH\XBX_0136.awd",
+    0x0F26039D475DAC30: r"KickedScoreBoardTeam.layout",
+    0x0F27C92BBAB5122B: r"SB_AGD\210_239\ENGLISH\PS2_0212.agd",
+    0x0F2DC3170C3A0A81: r"SB_AWD\240_269\GERMAN\PS2_0252.awd",
+    0x0F31E3B354B2E97A: r"SB_AWD\210_239\ENGLISH\NGC_0223.awd",
+    0x0F32D8F2BEE771CA: r"SB_AGD\180_209\FRENCH\PS2_0209.agd",
+    0x0F35299B94FC9A56: r"SB_AWD\120_149\ENGLISH\PS2_0121.awd",
+    0x0F3F3B5238B884ED: r"SB_AGD\0_29\FRENCH\NGC_0028.agd",
+    0x0F41357CAD0D5951: r"SB_AWD\120_149\FRENCH\NGC_0127.awd",
+    0x0F43DBD3A13EEDF1: r"SB_AWD\90_119\SPANISH\XBX_0106.awd",
+    0x0F45E5300F70FF54: r"SB_AWD\120_149\FRENCH\XBX_0137.awd",
+    0x0F48BC3C74E7D331: r"SB_AWD\180_209\GERMAN\NGC_0205.awd",
+    0x0F56A886FF64142B: r"SHELL\HUD\INSTANCE\XBOX\F_HUD.TXD",
+    0x0F5F2644436C1DC2: r"SB_AGD\240_269\SPANISH\NGC_0263.agd",
+    0x0F63817640A9A852: r"SB_AWD\210_239\ITALIAN\XBX_0225.awd",
+    0x0F672C215A2A5330: r"SB_AGD\120_149\ENGLISH\NGC_0148.agd",
+    0x0F783677FFC4D226: r"SB_AGD\0_29\FRENCH\XBX_0003.agd",
+    0x0F7E23525F687F65: r"ANIMGRPS\Lvl_22\Lvl_22B.ads",
+    0x0F80CF258824CB0C: r"SB_AWD\180_209\ENGLISH\XBX_0189.awd",
+    0x0F821E03CB13A3DD: r"SB_AGD\210_239\SPANISH\PS2_0232.agd",
+    0x0F87BE7D567D8352: r"SB_AWD\0_29\FRENCH\XBX_0014.awd",
+    0x0F8AD896E878D1EA: r"SB_AWD\60_89\SPANISH\NGC_0078.awd",
+    0x0F8E93827ACB5708: r"SB_AGD\210_239\ENGLISH\PS2_0233.agd",
+    0x0F96D5E8B05BC1CE: r"SB_AGD\150_179\ENGLISH\XBX_0171.agd",
+    0x0FACD0D16ABB618F: r"SB_AWD\120_149\ENGLISH\NGC_0136.awd",
+    0x0FB063E13A68B7D6: r"SB_AGD\60_89\ENGLISH\XBX_0072.agd",
+    0x0FBB7BA1AE6447AE: r"SB_AGD\210_239\SPANISH\XBX_0221.agd",
+    0x0FCA7EA9002C694C: r"SB_AWD\120_149\SPANISH\XBX_0128.awd",
+    0x0FD362CCFC0CB675: r"ANIMGRPS\Lvl_22\Lvl_22R.ads",
+    0x0FD492884E8EF920: r"SB_AWD\180_209\ITALIAN\XBX_0185.awd",
+    0x0FD6A880E70C5FF5: r"SB_AWD\210_239\FRENCH\PS2_0218.awd",
+    0x0FDA5601FE749C51: r"SB_AGD\210_239\ENGLISH\XBX_0217.agd",
+    0x0FDF0C42AC63512C: r"SB_AWD\0_29\ENGLISH\NGC_0010.awd",
+    0x0FE0D3C4FECBDEF4: r"SB_AWD\210_239\ENGLISH\NGC_0221.awd",
+    0x0FE4089BB340E7BC: r"SB_AGD\210_239\GERMAN\XBX_0236.agd",
+    0x0FE73CB1264D343C: r"ANIMGRPS\Lvl_35\Lvl_35K.ads",
+    0x0FF2ABE54B57AC83: r"SB_AWD\90_119\SPANISH\XBX_0108.awd",
+    0x0FF7F644FB08F24A: r"LEVELS\L_1_2\SECTIONS\s_17.rws",
+    0x0FF99BC851B7CE50: r"SB_AWD\60_89\FRENCH\PS2_0060.awd",
+    0x0FFD2E911F6265AE: r"SB_AGD\150_179\ITALIAN\NGC_0168.agd",
+    0x100AD92CBB0897A6: r"SB_AWD\240_269\SPANISH\XBX_0243.awd",
+    0x1013F031815173EB: r"SB_AWD\30_59\ENGLISH\NGC_0055.awd",
+    0x1016B9CD8AA9894B: r"SB_AWD\60_89\FRENCH\PS2_0089.awd",
+    0x101A89C4A2D9BC7A: r"SB_AGD\120_149\SPANISH\NGC_0146.agd",
+    0x1021FE5E36131F58: r"SB_AWD\210_239\SPANISH\NGC_0236.awd",
+    0x10241C27B1AD3AAA: r"ANIMGRPS\Lvl_25\Lvl_25G.ads",
+    0x10253E699B122E41: r"SB_AGD\150_179\FRENCH\PS2_0166.agd",
+    0x1026E6EB461B5E70: r"SB_AGD\180_209\ITALIAN\PS2_0209.agd",
+    0x102757284144E31E: r"SB_AWD\60_89\ENGLISH\XBX_0083.awd",
+    0x10275E27B9953596: r"SB_AGD\240_269\ENGLISH\XBX_0261.agd",
+    0x1029D785768BAF16: r"SB_AGD\180_209\FRENCH\NGC_0183.agd",
+    0x102D98A4C81085ED: r"SB_AWD\0_29\ENGLISH\PS2_0018.awd",
+    0x1039FF72593BC2C0: r"SHELL\FONTS\mfb24.png",
+    0x105248ADB260CE95: r"AUDIO\ENGLISH\XBX_2s1.rws",
+    0x1053343622A9E61E: r"LEVELS\MP_2\SECTIONS\s_3.rws",
+    0x105B75F23988CF51: r"SB_AWD\150_179\SPANISH\PS2_0166.awd",
+    0x1064FDD97F70BF40: r"SB_AWD\30_59\FRENCH\XBX_0036.awd",
+    0x1066748388B77017: r"SB_AWD\180_209\ITALIAN\XBX_0191.awd",
+    0x1069D973356E450E: r"SB_AWD\210_239\FRENCH\XBX_0236.awd",
+    0x106B61A899CAAD58: r"ANIMGRPS\Lvl_14\Lvl_14U.ads",
+    0x106C06BF2CDD87CA: r"SB_AWD\60_89\ITALIAN\XBX_0061.awd",
+    0x106DE4AD841B673B: r"SB_AGD\90_119\SPANISH\PS2_0110.agd",
+    0x10725E8F18998689: r"SB_AWD\240_269\GERMAN\NGC_0266.awd",
+    0x1072E0D37AD511A4: r"SHELL\LOAD\MP_6_TDM.txd",
+    0x107AFE9320CDFABE: r"SB_AGD\210_239\ITALIAN\NGC_0212.agd",
+    0x1084D68757F7268A: r"AUDIO\SPANISH\NGC_1m1.rws",
+    0x1084E76B43EDA499: r"SB_AGD\30_59\SPANISH\XBX_0051.agd",
+    0x1089A613A88E34E3: r"SB_AGD\210_239\ENGLISH\XBX_0219.agd",
+    0x108CDF6EEC52EDCB: r"SHELL\MOVIES\FRENCH\1_3_Mon.bik",
+    0x1093E8AD5D5B757E: r"SB_AGD\210_239\GERMAN\XBX_0238.agd",
+    0x10997F3EBC326A3D: r"AUDIO\FRENCH\XBX_2m3.rws",
+    0x109ADFF91E2A85A6: r"SB_AWD\240_269\SPANISH\PS2_0253.awd",
+    0x109C87724C2E50F4: r"SB_AGD\60_89\ITALIAN\PS2_0064.agd",
+    0x10A73CA3A337D7CE: r"SB_AGD\150_179\FRENCH\PS2_0150.agd",
+    0x10A8F0735D457EA9: r"SB_AWD\180_209\FRENCH\XBX_0186.awd",
+    0x10A9A9C28E4CD8E0: r"SB_AWD\180_209\FRENCH\PS2_0207.awd",
+    0x10BB33DB6701AB08: r"SB_AGD\120_149\GERMAN\NGC_0124.agd",
+    0x10BECCA39B2202BB: r"SB_AGD\240_269\SPANISH\PS2_0267.agd",
+    0x10C40AB9CB6B7B88: r"SB_AGD\0_29\GERMAN\PS2_0026.agd",
+    0x10C52B57F2F779E2: r"SB_AWD\90_119\ITALIAN\XBX_0105.awd",
+    0x10C90BF8B28943E7: r"SB_AWD\30_59\GERMAN\PS2_0038.awd",
+    0x10CA4C33AAD4DAF8: r"ANIMGRPS\Lvl_24\Lvl_24G.ads",
+    0x10D3DB5E61D26BBB: r"SHELL\FEND\INSTANCE\XBOX\F_FEND.TXD",
+    0x10D40E7B452AED53: r"SB_AGD\150_179\FRENCH\PS2_0168.agd",
+    0x10D70739EB5F1F48: r"SB_AWD\60_89\ENGLISH\XBX_0081.awd",
+    0x10D880339F1B4131: r"SB_AWD\120_149\ENGLISH\XBX_0143.awd",
+    0x10DAAB0174A75A46: r"SB_AWD\120_149\GERMAN\NGC_0131.awd",
+    0x10DEE18AB1A697BC: r"SB_AWD\240_269\GERMAN\XBX_0265.awd",
+    0x10E069A7BDF7F027: r"SB_AGD\120_149\ITALIAN\NGC_0136.agd",
+    0x10E0E752F5035CB6: r"SB_AGD\210_239\FRENCH\XBX_0221.agd",
+    0x10F0B6C58A48AB13: r"SB_AWD\150_179\ENGLISH\PS2_0159.awd",
+    0x10F0F31AE75926CB: r"SB_AWD\60_89\ENGLISH\PS2_0074.awd",
+    0x10F42EB749A4403E: r"SB_AGD\150_179\SPANISH\PS2_0150.agd",
+    0x1102133DC4903A1A: r"SHELL\LOAD\MP_6_DM.txd",
+    0x11067A5280A6B330: r"SB_AWD\120_149\ENGLISH\NGC_0148.awd",
+    0x1113EDEB2989B432: r"SB_AWD\30_59\FRENCH\XBX_0030.awd",
+    0x111E54C37155190E: r"SB_AWD\30_59\GERMAN\NGC_0049.awd",
+    0x1128705A1E8BDFD2: r"SB_AGD\180_209\SPANISH\NGC_0192.agd",
+    0x1138F0B1CFDBBAA6: r"SB_AGD\210_239\GERMAN\PS2_0224.agd",
+    0x113D99AA8C8EE0BE: r"SB_AWD\180_209\ITALIAN\NGC_0202.awd",
+    0x114671F3DEBCD708: r"ANIMGRPS\Lvl_26\Lvl_26S.ads",
+    0x114B8B399F49CDA7: r"SB_AWD\240_269\SPANISH\XBX_0255.awd",
+    0x114C4936845F528E: r"SHELL\FONTS\mfbld22.png",
+    0x115B3F2767F61E53: r"SB_AGD\0_29\SPANISH\NGC_0022.agd",
+    0x115E76D2C02BE86B: r"SB_AGD\90_119\ENGLISH\PS2_0107.agd",
+    0x1160FA69849B26DC: r"SB_AGD\0_29\GERMAN\PS2_0013.agd",
+    0x116A89925ACCE517: r"SB_AGD\180_209\FRENCH\NGC_0195.agd",
+    0x116E48C7C4D3A797: r"SB_AWD\90_119\ENGLISH\PS2_0103.awd",
+    0x1178B4A611DA6099: r"LEVELS\L_3_5\SECTIONS\s_8.rws",
+    0x1179E71E1E5EB80C: r"SessionList.layout",
+    0x118AC522F532EB6E: r"SB_AWD\90_119\GERMAN\XBX_0112.awd",
+    0x119037649F1CF5C0: r"SB_AGD\210_239\FRENCH\XBX_0223.agd",
+    0x1193CB6EBBD6362B: r"SB_AWD\240_269\SPANISH\XBX_0268.awd",
+    0x1197F9AD4088A0E0: r"SB_AWD\120_149\ENGLISH\PS2_0123.awd",
+    0x119D6ECF152F2FFF: r"SB_AWD\240_269\ENGLISH\PS2_0245.awd",
+    0x119F750E8849232B: r"SB_AGD\150_179\ITALIAN\XBX_0178.agd",
+    0x11AD6F862EB144DF: r"SB_AGD\120_149\FRENCH\XBX_0141.agd",
+    0x11B9E5CDEA52D915: r"SB_AGD\0_29\FRENCH\PS2_0003.agd",
+    0x11CA27A48780D49D: r"SB_AGD\30_59\ITALIAN\XBX_0042.agd",
+    0x11CC2379432E0C9B: r"bigfile.bds",
+    0x11D193E46A1398C6: r"SB_AWD\120_149\GERMAN\PS2_0138.awd",
+    0x11DB9206026BBBA7: r"SB_AWD\240_269\SPANISH\PS2_0245.awd",
+    0x11DE6BFF8D138513: r"SB_AGD\240_269\ITALIAN\PS2_0252.agd",
+    0x11E1A9162AF70727: r"w_map02.dds",
+    0x11EA9BA979F0470E: r"SB_AGD\90_119\ITALIAN\NGC_0110.agd",
+    0x11F048C399F95F94: r"SB_AWD\60_89\SPANISH\NGC_0069.awd",
+    0x11F2A1AA4E6C39CE: r"SB_AWD\30_59\GERMAN\XBX_0043.awd",
+    0x11F700A63F706933: r"SHELL\HUD\INSTANCE\SKY\F_HUD.TXD",
+    0x11FA011CBE66C583: r"SB_AWD\180_209\SPANISH\PS2_0181.awd",
+    0x12077DA118FB6215: r"SB_AWD\150_179\FRENCH\XBX_0158.awd",
+    0x12082560EED80E08: r"SB_AGD\180_209\SPANISH\NGC_0200.agd",
+    0x12157EC52BEF89C3: r"SB_AGD\120_149\ITALIAN\XBX_0130.agd",
+    0x12188D162B261A14: r"w_map02.txd",
+    0x121AF117190967C6: r"SB_AGD\210_239\ENGLISH\NGC_0212.agd",
+    0x121FF7A253E4C269: r"SB_AWD\30_59\ITALIAN\NGC_0048.awd",
+    0x1226D88FDB140A30: r"SB_AGD\0_29\GERMAN\NGC_0016.agd",
+    0x122702772C67F8B4: r"SB_AWD\30_59\GERMAN\PS2_0055.awd",
+    0x122C803C577A666D: r"GameSpyFailed.layout",
+    0x123213E7F1ED904E: r"SB_AGD\60_89\FRENCH\XBX_0083.agd",
+    0x123BF591FE8F1A1C: r"SB_AGD\210_239\FRENCH\NGC_0232.agd",
+    0x124A5D70B3E0F21F: r"WPNBANK\26_50\wbank_47.bin",
+    0x124B5B8D6E4B240E: r"LOC\EN\EULA.LOC",
+    0x125BCBD9FD42C482: r"SB_AWD\60_89\FRENCH\PS2_0066.awd",
+    0x125D1E5C5F3A53E9: r"SB_AGD\0_29\ENGLISH\PS2_0029.agd",
+    0x125E5DDCBF6FB540: r"SB_AWD\150_179\GERMAN\NGC_0173.awd",
+    0x1260045B25EC7F5A: r"SB_AGD\0_29\ITALIAN\NGC_0027.agd",
+    0x1265E5E89C006489: r"SB_AGD\0_29\SPANISH\XBX_0017.agd",
+    0x126F089FEB6CFDB7: r"SB_AGD\0_29\FRENCH\XBX_0006.agd",
+    0x126F0B1FE77B0CBD: r"SB_AGD\210_239\SPANISH\NGC_0224.agd",
+    0x127900B338CA5EEA: r"SB_AWD\0_29\SPANISH\XBX_0007.awd",
+    0x127977B6319A6D2F: r"SB_AGD\30_59\ITALIAN\XBX_0044.agd",
+    0x12834E18051060A3: r"SB_AWD\120_149\GERMAN\PS2_0144.awd",
+    0x12874D55D96FACE4: r"SB_AGD\120_149\FRENCH\XBX_0128.agd",
+    0x1292B66002E9445A: r"i_common_components.layout",
+    0x1296DB5250F150DC: r"ANIMGRPS\Lvl_33\Lvl_33K.ads",
+    0x129C24EE275FBD79: r"SB_AWD\120_149\GERMAN\XBX_0149.awd",
+    0x129CDA619D394036: r"SB_AGD\240_269\SPANISH\PS2_0240.agd",
+    0x12A66C70A57D9B7D: r"SB_AWD\240_269\FRENCH\NGC_0251.awd",
+    0x12A6B2FD4E522B8C: r"AUDIO\ITALIAN\PS2_2m3.rws",
+    0x12A6E8E96407F5B9: r"w_PlayOnlineBKG.index",
+    0x12B4332470D2CCB0: r"SB_AGD\180_209\ENGLISH\PS2_0201.agd",
+    0x12B5093B39FF3E9E: r"SB_AWD\0_29\ITALIAN\XBX_0003.awd",
+    0x12BF32B58D783F47: r"IngameControls.layout",
+    0x12C04AEFC3F3FB7E: r"SB_AGD\90_119\GERMAN\XBX_0105.agd",
+    0x12C33E0C8BD93F42: r"SB_AGD\60_89\SPANISH\NGC_0063.agd",
+    0x12C36FE72E3D63AA: r"font_stringNormal.tga",
+    0x12D6F58D9055C711: r"SB_AWD\210_239\SPANISH\XBX_0217.awd",
+    0x12DD10D911F3B035: r"ANIMGRPS\Lvl_35\Lvl_35N.ads",
+    0x12E3552343EA57DD: r"SB_AWD\120_149\GERMAN\XBX_0134.awd",
+    0x12EA9788526656D9: r"SB_AWD\240_269\SPANISH\NGC_0255.awd",
+    0x12EC19825DEF0545: r"WPNBANK\26_50\wbank_49.bin",
+    0x12EF10CCD742B036: r"SB_AGD\210_239\GERMAN\PS2_0237.agd",
+    0x12F2E078C2964BD0: r"w_findsesh.txd",
+    0x12F600BBF83FA493: r"SB_AGD\0_29\SPANISH\PS2_0012.agd",
+    0x12F76E7A78875C91: r"SB_AGD\60_89\ENGLISH\NGC_0068.agd",
+    0x12F9F053A8062458: r"SB_AWD\240_269\FRENCH\XBX_0263.awd",
+    0x130023F901C8BD15: r"SB_AGD\150_179\GERMAN\XBX_0167.agd",
+    0x130065047B93208A: r"SB_AGD\210_239\ITALIAN\XBX_0232.agd",
+    0x13052800163BDF79: r"SB_AWD\90_119\GERMAN\NGC_0096.awd",
+    0x130D4DEE6988AA32: r"SB_AWD\150_179\GERMAN\NGC_0175.awd",
+    0x130F3BF3186F11C8: r"ANIMGRPS\Lvl_11\Lvl_11K.ads",
+    0x130FFE88AEA6D0EE: r"SB_AWD\120_149\ENGLISH\XBX_0126.awd",
+    0x1311219E4FD281F6: r"SB_AGD\150_179\GERMAN\PS2_0178.agd",
+    0x131132866F3D2C40: r"SB_AWD\150_179\ENGLISH\NGC_0171.awd",
+    0x1316117152F8370D: r"SB_AWD\30_59\FRENCH\PS2_0056.awd",
+    0x1321C30E6E7615F4: r"LEVELS\L_3_5_B\level.dff",
+    0x13228FAB599998E8: r"SB_AGD\0_29\ENGLISH\NGC_0029.agd",
+    0x132746BB0F94FA21: r"SB_AWD\0_29\ITALIAN\XBX_0026.awd",
+    0x132830C4E2E3C0A4: r"SB_AWD\0_29\SPANISH\XBX_0005.awd",
+    0x13292478C2C44EC3: r"w_findsesh.dds",
+    0x132B1FCFD68EDB63: r"SB_AGD\120_149\SPANISH\NGC_0132.agd",
+    0x132DA1974824DBBE: r"SB_AGD\210_239\ITALIAN\PS2_0226.agd",
+    0x133574C5CA8B629D: r"SB_AGD\120_149\GERMAN\PS2_0146.agd",
+    0x1335753E4585031C: r"SB_AWD\120_149\FRENCH\PS2_0149.awd",
+    0x1338332E5DB7CE59: r"SB_AWD\210_239\FRENCH\NGC_0228.awd",
+    0x133FADB0928B53E3: r"SB_AGD\0_29\ENGLISH\NGC_0000.agd",
+    0x1345BCC6825DC453: r"SB_AWD\0_29\GERMAN\XBX_0008.awd",
+    0x134C2A734752D940: r"SB_AGD\240_269\SPANISH\PS2_0242.agd",
+    0x134FD65E0E562BAF: r"LEVELS\MP_2\SECTIONS\s_6.rws",
+    0x1350488AA47769AA: r"ANIMGRPS\Lvl_16\Lvl_16K.ads",
+    0x13553C824F965A0F: r"SB_AWD\240_269\FRENCH\NGC_0257.awd",
+    0x1364B94CE4197AC8: r"SB_AWD\0_29\ITALIAN\XBX_0001.awd",
+    0x136A29166804A1F0: r"SB_AWD\90_119\ENGLISH\XBX_0099.awd",
+    0x136CCC7D830A494B: r"SB_AWD\60_89\ENGLISH\NGC_0080.awd",
+    0x136D140E6EB68A9C: r"LEVELS\L_3_5_B\level.rws",
+    0x13781ED4EFC8E377: r"SB_AWD\180_209\GERMAN\XBX_0209.awd",
+    0x137A7ACA2730766D: r"SB_AGD\150_179\ITALIAN\PS2_0162.agd",
+    0x138C93A6345E6F4C: r"OnlineSettingsAdvanced.layout",
+    0x1395682CEC94F7A6: r"SB_AGD\240_269\FRENCH\PS2_0240.agd",
+    0x13976E157810656F: r"SB_AGD\210_239\SPANISH\PS2_0234.agd",
+    0x139BCEE00C8E943E: r"LEVELS\L_1_5_B\SECTIONS\s_8.rws",
+    0x139E60DE815C4940: r"SB_AGD\210_239\GERMAN\PS2_0235.agd",
+    0x13A03BC48156631E: r"SB_AGD\90_119\ITALIAN\NGC_0103.agd",
+    0x13A04924CA353BAD: r"SB_AGD\150_179\SPANISH\NGC_0170.agd",
+    0x13A60EC9E7E355D2: r"SB_AWD\120_149\ITALIAN\XBX_0122.awd",
+    0x13C0229819562132: r"SB_AWD\150_179\ENGLISH\NGC_0177.awd",
+    0x13CA6EC798BF1BE9: r"SB_AWD\90_119\FRENCH\NGC_0098.awd",
+    0x13D04BB35B602FB8: r"SB_AGD\210_239\SPANISH\XBX_0223.agd",
+    0x13D696CCB9AE92B3: r"SB_AWD\0_29\ITALIAN\XBX_0028.awd",
+    0x13DEE7AE11E1CC53: r"SB_AGD\120_149\GERMAN\XBX_0125.agd",
+    0x13E4754FEF9E13BE: r"SB_AWD\120_149\FRENCH\PS2_0147.awd",
+    0x13E4C4D774A4FB2F: r"SB_AGD\120_149\GERMAN\PS2_0140.agd",
+    0x13F50229913762EF: r"SB_AWD\180_209\SPANISH\XBX_0209.awd",
+    0x13F59F2892888707: r"SB_AGD\240_269\GERMAN\XBX_0253.agd",
+    0x13FDFCEE77DDC101: r"ANIMGRPS\Lvl_21\Lvl_21H.ads",
+    0x14069C7668AA4399: r"SB_AGD\90_119\ENGLISH\XBX_0119.agd",
+    0x140F4F97DA3BB319: r"SB_AGD\120_149\FRENCH\XBX_0143.agd",
+    0x14127DFBE61EE73D: r"SB_AWD\90_119\ITALIAN\XBX_0115.awd",
+    0x141524762D51C1EA: r"SB_AGD\0_29\ITALIAN\NGC_0012.agd",
+    0x1416A5309D2263F4: r"LEVELS\L_3_1\SECTIONS\s_18.rws",
+    0x1420293E68055930: r"SB_AWD\240_269\SPANISH\XBX_0241.awd",
+    0x142257FFEEB49BF9: r"SB_AGD\240_269\ENGLISH\PS2_0261.agd",
+    0x1423B375106ABD83: r"SB_AGD\180_209\FRENCH\XBX_0180.agd",
+    0x142FC2D9BB83E637: r"SB_AGD\210_239\GERMAN\PS2_0221.agd",
+    0x142FD9D64FD67D94: r"SB_AGD\120_149\SPANISH\NGC_0144.agd",
+    0x143EFE14491C9655: r"SB_AGD\30_59\ENGLISH\NGC_0044.agd",
+    0x144F1936744DFABF: r"SB_AGD\150_179\SPANISH\NGC_0176.agd",
+    0x1452BC6914811E91: r"ANIMGRPS\Lvl_21\Lvl_21X.ads",
+    0x1463E8C1B3089675: r"SB_AWD\0_29\SPANISH\NGC_0028.awd",
+    0x1467BF79FBC8E487: r"CodBack_MainScreen.index",
+    0x1467ED1BAFB8E586: r"SB_AGD\240_269\GERMAN\XBX_0249.agd",
+    0x1467F996AB129C17: r"SHELL\FONTS\t10.met",
+    0x14751BABC83136C7: r"SB_AGD\90_119\SPANISH\XBX_0096.agd",
+    0x147AE93CF0D914CE: r"SB_AGD\30_59\GERMAN\PS2_0040.agd",
+    0x147CC128C493BB50: r"SB_AGD\210_239\ENGLISH\NGC_0210.agd",
+    0x1480B5BA46C7753A: r"ANIMGRPS\Lvl_14\Lvl_14W.ads",
+    0x148DC1F6DED8AA5D: r"SHELL\LOAD\MP_7_CTF.txd",
+    0x1490F8359BD59B8C: r"SB_AWD\180_209\SPANISH\NGC_0190.awd",
+    0x14A25841C04F3D0C: r"SB_AGD\150_179\ENGLISH\PS2_0170.agd",
+    0x14ACC90021F679CB: r"ANIMGRPS\Lvl_21\Lvl_21J.ads",
+    0x14B0300ACB274730: r"SB_AWD\240_269\SPANISH\PS2_0251.awd",
+    0x14B8CA9EE6A706FB: r"SB_AWD\120_149\SPANISH\PS2_0120.awd",
+    0x14C1D3CD1C947DD1: r"SB_AWD\0_29\FRENCH\PS2_0014.awd",
+    0x14CCC1B0E24E9839: r"SB_AGD\150_179\ENGLISH\NGC_0156.agd",
+    0x14CD1BAD9E6A33EF: r"SB_AWD\0_29\SPANISH\PS2_0023.awd",
+    0x14D555F098F89D79: r"SB_AWD\150_179\FRENCH\PS2_0171.awd",
+    0x14D6F0DD1C2169DC: r"SB_AWD\150_179\ITALIAN\NGC_0175.awd",
+    0x14EECE25F3370867: r"SB_AGD\30_59\ENGLISH\NGC_0042.agd",
+    0x14F9AF63FC7D5DBE: r"ANIMGRPS\Lvl_33\Lvl_33I.ads",
+    0x14FCEA89D383FB17: r"SB_AWD\30_59\ENGLISH\XBX_0039.awd",
+    0x1506C32C9456C1E5: r"SB_AWD\60_89\ENGLISH\PS2_0076.awd",
+    0x150B7C9D56FD867F: r"SB_AWD\240_269\FRENCH\NGC_0240.awd",
+    0x1513D43378AFC15C: r"SB_AGD\210_239\ENGLISH\XBX_0230.agd",
+    0x151D5DD0F9EA4145: r"SHELL\LOAD\MP_10_DM.txd",
+    0x151FF78982219F01: r"SB_AGD\30_59\SPANISH\NGC_0048.agd",
+    0x152BDBEB8AF9896E: r"SB_AWD\180_209\GERMAN\XBX_0194.awd",
+    0x152C4193F30B0ABC: r"SB_AGD\240_269\ITALIAN\XBX_0267.agd",
+    0x15397C91EC66DA11: r"SB_AGD\180_209\ITALIAN\XBX_0193.agd",
+    0x153BEA79D54E65EF: r"CreateSessionAdvancedBase.layout",
+    0x153EB1E9E002C52A: r"SB_AWD\210_239\ITALIAN\XBX_0214.awd",
+    0x153F1D7A9E2F7B2C: r"SB_AWD\240_269\GERMAN\XBX_0250.awd",
+    0x1547D52C7CD1CBBC: r"SB_AGD\30_59\SPANISH\NGC_0030.agd",
+    0x154B8847F3FBED36: r"SB_AGD\240_269\FRENCH\PS2_0253.agd",
+    0x154E301A3C6E59A3: r"SB_AGD\0_29\ITALIAN\PS2_0012.agd",
+    0x154F5003F08DDFDA: r"SB_AGD\30_59\FRENCH\PS2_0046.agd",
+    0x15529045018B8B21: r"SB_AGD\180_209\ITALIAN\NGC_0191.agd",
+    0x1558362FB965CAF1: r"SB_AWD\60_89\SPANISH\XBX_0084.awd",
+    0x155C658BDC447FED: r"SB_AWD\150_179\SPANISH\NGC_0170.awd",
+    0x1563F1CC011BBCA7: r"AUDIO\GERMAN\NGC_4m3.rws",
+    0x15735A25244F4EB7: r"LEVELS\L_3_5_B\CLUMPS\cbank_02.bin",
+    0x15747098B19CF0D8: r"SB_AGD\240_269\FRENCH\XBX_0249.agd",
+    0x1575A7A66C0C313F: r"SB_AWD\180_209\GERMAN\NGC_0193.awd",
+    0x157799081BD9287B: r"SB_AGD\150_179\FRENCH\NGC_0169.agd",
+    0x1583653A27BEDF9D: r"SB_AGD\180_209\ITALIAN\NGC_0201.agd",
+    0x1593AE2920C0E1E8: r"SB_AGD\60_89\FRENCH\PS2_0068.agd",
+    0x15A0B534A230BCD8: r"SB_AWD\90_119\GERMAN\XBX_0110.awd",
+    0x15A5EBBBAABF8531: r"SB_AWD\30_59\ITALIAN\NGC_0039.awd",
+    0x15B0CC2E59B29CE3: r"SB_AGD\60_89\FRENCH\PS2_0081.agd",
+    0x15B2AEE0C22BD659: r"SB_AWD\240_269\ENGLISH\PS2_0247.awd",
+    0x15B98B9097351649: r"SB_AGD\0_29\FRENCH\NGC_0019.agd",
+    0x15BAC61A2F93AD8C: r"SB_AWD\180_209\SPANISH\XBX_0181.awd",
+    0x15BBE5648432A1DB: r"LEVELS\L_1_3_A\SECTIONS\s_13.rws",
+    0x15BF795D0BF91E01: r"SB_AWD\210_239\GERMAN\NGC_0217.awd",
+    0x15CEB5DF974EC127: r"SB_AGD\0_29\FRENCH\PS2_0005.agd",
+    0x15D018F2FF4A9353: r"SB_AWD\0_29\FRENCH\NGC_0000.awd",
+    0x15DC21A59D25987E: r"SB_AGD\240_269\ITALIAN\XBX_0269.agd",
+    0x15DCA2F0CD9871D6: r"SB_AWD\150_179\SPANISH\XBX_0171.awd",
+    0x15E53CC30CB6FEC3: r"SB_AGD\150_179\ITALIAN\NGC_0150.agd",
+    0x15F68FC4F193132A: r"SB_AWD\210_239\GERMAN\PS2_0211.awd",
+    0x15F9866027DAFACB: r"AUDIO\SPANISH\XBX_2s3.rws",
+    0x15FA22A4EB26263A: r"SB_AWD\30_59\FRENCH\XBX_0052.awd",
+    0x15FA6B8CCD497328: r"SB_AWD\150_179\GERMAN\XBX_0157.awd",
+    0x15FAAD2230535BD6: r"SB_AWD\210_239\FRENCH\XBX_0218.awd",
+    0x15FAD8599E158640: r"SB_AGD\240_269\FRENCH\PS2_0251.agd",
+    0x15FDA7A499A44C18: r"SB_AGD\30_59\GERMAN\NGC_0054.agd",
+    0x160BD2421BB31106: r"SB_AGD\210_239\ITALIAN\NGC_0234.agd",
+    0x1614BAFE8D615DE7: r"SB_AGD\0_29\GERMAN\NGC_0028.agd",
+    0x161A295D5164C248: r"SB_AGD\180_209\SPANISH\PS2_0201.agd",
+    0x1624E7B81625AE99: r"SB_AWD\180_209\GERMAN\NGC_0191.awd",
+    0x162615170E5839B7: r"ANIMGRPS\Lvl_34\Lvl_34Z.ads",
+    0x16266C216F4AA51B: r"SB_AWD\30_59\ENGLISH\NGC_0046.awd",
+    0x162E69368766B7DD: r"SB_AGD\180_209\ITALIAN\PS2_0200.agd",
+    0x16308957F83F30DE: r"SB_AGD\30_59\GERMAN\PS2_0053.agd",
+    0x1632B54BD1D8782F: r"SB_AGD\180_209\ITALIAN\NGC_0207.agd",
+    0x163CA8A18811A5C2: r"SB_AGD\0_29\GERMAN\NGC_0010.agd",
+    0x163DD1A79756DCEB: r"SB_AWD\240_269\ITALIAN\XBX_0259.awd",
+    0x16581AC48AF66BED: r"SB_AGD\180_209\ENGLISH\NGC_0209.agd",
+    0x167180BA3E19B7EC: r"SB_AWD\150_179\ENGLISH\PS2_0170.awd",
+    0x1673509A060654EF: r"SB_AWD\90_119\ITALIAN\NGC_0106.awd",
+    0x167BD491AAFD4A07: r"ANIMGRPS\Lvl_34\Lvl_34J.ads",
+    0x16887648CC31DD9D: r"SB_AWD\210_239\ENGLISH\PS2_0232.awd",
+    0x168C3A54D83D2337: r"SB_AGD\240_269\FRENCH\PS2_0245.agd",
+    0x168DA1DDAB9D54B1: r"AUDIO\GERMAN\NGC_4m1.rws",
+    0x1693974D96ED56CD: r"SB_AWD\60_89\GERMAN\NGC_0084.awd",
+    0x16B3B86653C15C29: r"SB_AGD\90_119\ENGLISH\XBX_0106.agd",
+    0x16B5887AC00D1EDB: r"ANIMGRPS\Lvl_21\Lvl_21Z.ads",
+    0x16B6EDBEBF8961C6: r"SB_AGD\180_209\FRENCH\PS2_0186.agd",
+    0x16B89CB9BFD270D8: r"LEVELS\MP_9\level.rws",
+    0x16CA03361DD06842: r"SB_AGD\180_209\ENGLISH\PS2_0207.agd",
+    0x16CA39036D62A5BE: r"SB_AGD\30_59\ENGLISH\XBX_0034.agd",
+    0x16DF5969A257EFE8: r"SB_AGD\30_59\GERMAN\PS2_0051.agd",
+    0x16E3970F0511D762: r"MainMenu.layout",
+    0x16F5DBB9C00689F0: r"LEVELS\MP_9\level.dff",
+    0x170034061AC9474E: r"LEVELS\L_3_5_B\SECTIONS\s_15.rws",
+    0x1703503543D39C33: r"SB_AGD\0_29\ITALIAN\PS2_0027.agd",
+    0x1704701EF7F3226A: r"SB_AGD\30_59\FRENCH\PS2_0051.agd",
+    0x170CBE8C25841E23: r"SB_AGD\60_89\ENGLISH\NGC_0066.agd",
+    0x1714F40AAEC4A527: r"SB_AGD\150_179\GERMAN\XBX_0161.agd",
+    0x171BDB34D50C8DA2: r"SB_AWD\90_119\FRENCH\PS2_0100.awd",
+    0x171DB5E7E165357E: r"SHELL\MOVIES\spark.bik",
+    0x171E77F28D34284C: r"SB_AGD\180_209\ENGLISH\XBX_0189.agd",
+    0x171E8E88F361CE6C: r"SB_AGD\120_149\FRENCH\NGC_0144.agd",
+    0x17240D3C6D94025A: r"SB_AWD\180_209\SPANISH\NGC_0206.awd",
+    0x1725EE9A5BA4A258: r"SB_AWD\120_149\ENGLISH\XBX_0124.awd",
+    0x172B6182FFF4F89F: r"SB_AWD\30_59\FRENCH\PS2_0050.awd",
+    0x17301BBF49F68B89: r"SB_AWD\0_29\SPANISH\PS2_0021.awd",
+    0x17305B1B935B1E68: r"SB_AWD\0_29\GERMAN\XBX_0021.awd",
+    0x1735DA19E884000C: r"SHELL\LOAD\MP_4_SD.txd",
+    0x1737FFA7982F42A6: r"SB_AGD\0_29\FRENCH\PS2_0013.agd",
+    0x1742E75F4106EF5F: r"SB_AWD\60_89\GERMAN\NGC_0082.awd",
+    0x174641360EA41FAB: r"SB_AWD\150_179\GERMAN\XBX_0176.awd",
+    0x1754B20E3D0814D7: r"SB_AWD\240_269\ENGLISH\NGC_0240.awd",
+    0x175D0AE6108A2FFB: r"SB_AWD\0_29\ITALIAN\XBX_0019.awd",
+    0x1761C5511372940F: r"SB_AWD\30_59\SPANISH\XBX_0039.awd",
+    0x176562459DEBB007: r"SB_AWD\30_59\FRENCH\NGC_0059.awd",
+    0x1767175BD5665CAE: r"SB_AGD\120_149\SPANISH\PS2_0136.agd",
+    0x17737476EC866CA8: r"AUDIO\SPANISH\XBX_4s2.rws",
+    0x177784D998BABE08: r"ANIMGRPS\Lvl_32\Lvl_32M.ads",
+    0x177C967478F8FEFE: r"SB_AGD\60_89\SPANISH\NGC_0081.agd",
+    0x17829C8F3007E465: r"SB_AWD\60_89\ENGLISH\NGC_0082.awd",
+    0x17839399BD8880DF: r"SB_AGD\90_119\ENGLISH\NGC_0098.agd",
+    0x178A56B41310BCD1: r"SB_AWD\0_29\ENGLISH\XBX_0017.awd",
+    0x178B5040ECC13D03: r"SB_AGD\60_89\GERMAN\PS2_0083.agd",
+    0x17904ADBD42E117F: r"SB_AGD\150_179\ITALIAN\PS2_0164.agd",
+    0x1790C307F4C584EA: r"SB_AGD\180_209\GERMAN\NGC_0192.agd",
+    0x179588D968EEFB8F: r"SB_AGD\90_119\ITALIAN\NGC_0090.agd",
+    0x179673C9BC30ACA5: r"SB_AWD\120_149\SPANISH\NGC_0138.awd",
+    0x1797E63ED025389D: r"SB_AWD\0_29\ITALIAN\PS2_0010.awd",
+    0x179B33F8123B09A1: r"SB_AGD\90_119\ITALIAN\PS2_0109.agd",
+    0x17A1552C961A5891: r"SB_AWD\240_269\FRENCH\PS2_0247.awd",
+    0x17A758A0E0A59F8E: r"SB_AGD\30_59\GERMAN\XBX_0043.agd",
+    0x17ACF8433F7A6997: r"SB_AWD\210_239\FRENCH\PS2_0234.awd",
+    0x17AE175CD6A49475: r"LEVELS\L_3_5\SECTIONS\s_19.rws",
+    0x17B60BD62E53FE28: r"SB_AGD\90_119\ITALIAN\NGC_0101.agd",
+    0x17C03C2429174236: r"SB_AGD\240_269\GERMAN\NGC_0250.agd",
+    0x17C89D4C87D0E56B: r"SB_AGD\210_239\SPANISH\XBX_0237.agd",
+    0x17CD54827B8C993B: r"SB_AGD\120_149\FRENCH\NGC_0132.agd",
+    0x17CD5804374D020E: r"SB_AGD\180_209\ENGLISH\XBX_0187.agd",
+    0x17CDD407FD9846AF: r"SB_AWD\180_209\FRENCH\XBX_0207.awd",
+    0x17CF16B15C0B0D79: r"SHELL\FEND\INSTANCE\XBOX\LANGUAGE.TXD",
+    0x17DBC1527E565229: r"SHELL\MOVIES\FRENCH\3_3_Mon.bik",
+    0x17E365D71B076A33: r"LEVELS\L_1_2\SECTIONS\s_1.rws",
+    0x17F1C8BC8F76E852: r"SB_AGD\0_29\GERMAN\NGC_0003.agd",
+    0x17F382A82B251C3A: r"SB_AWD\150_179\GERMAN\NGC_0157.awd",
+    0x1805E4EA2541B522: r"SB_AGD\90_119\ENGLISH\PS2_0102.agd",
+    0x1808E200FE3E894F: r"AUDIO\FRENCH\NGC_2m3.rws",
+    0x181C3C12A323E24C: r"SB_AWD\60_89\FRENCH\XBX_0063.awd",
+    0x18284E0D931C82CF: r"SB_AWD\90_119\ITALIAN\XBX_0113.awd",
+    0x182AF487DA4F5C84: r"SB_AGD\0_29\ITALIAN\NGC_0010.agd",
+    0x183F730279247860: r"SB_AWD\150_179\SPANISH\XBX_0173.awd",
+    0x1843771BBB489C2B: r"SB_AGD\60_89\GERMAN\XBX_0075.agd",
+    0x1844E8EB1308AFC9: r"SB_AGD\90_119\ITALIAN\NGC_0092.agd",
+    0x185163A1715F4AA9: r"SB_AWD\120_149\ITALIAN\PS2_0126.awd",
+    0x18549DD8D1DD19EA: r"SB_AGD\60_89\GERMAN\XBX_0085.agd",
+    0x185D16C2AB7AC5B8: r"SB_AWD\0_29\FRENCH\NGC_0029.awd",
+    0x18638C14D66E7531: r"font_symbols_xbox.tga",
+    0x186D8705873F1567: r"SB_AGD\30_59\FRENCH\NGC_0059.agd",
+    0x186EA253C73F1790: r"SB_AGD\210_239\ITALIAN\NGC_0236.agd",
+    0x186F8C35D330DB40: r"SB_AGD\240_269\GERMAN\NGC_0252.agd",
+    0x1870C26ECD32C5A0: r"SB_AGD\210_239\ITALIAN\NGC_0225.agd",
+    0x1870D7F8276269E5: r"SHELL\MOVIES\Eating.bik",
+    0x1871AB20086F29BC: r"SB_AGD\30_59\FRENCH\XBX_0047.agd",
+    0x18721A92B8E6FB48: r"SB_AGD\150_179\ITALIAN\NGC_0179.agd",
+    0x18730F779B097876: r"SHELL\FONTS\mcn14.png",
+    0x187E3DD2AFA526A6: r"SB_AGD\150_179\GERMAN\XBX_0177.agd",
+    0x187F3B1A72AB409C: r"SB_AGD\180_209\GERMAN\PS2_0186.agd",
+    0x18893C331AD6ABB5: r"SB_AWD\30_59\ENGLISH\NGC_0044.awd",
+    0x18978917CD692EED: r"SB_AWD\90_119\ENGLISH\PS2_0112.awd",
+    0x189B3DD035786AFE: r"SB_AWD\120_149\SPANISH\NGC_0142.awd",
+    0x18AFC83FDB245911: r"SB_AGD\30_59\ITALIAN\NGC_0040.agd",
+    0x18BE5E9AF45FF2E1: r"SB_AGD\150_179\SPANISH\XBX_0169.agd",
+    0x18C279579EB61912: r"LEVELS\L_3_5\SECTIONS\s_30.rws",
+    0x18D27ACEB769DBDB: r"SB_AWD\210_239\FRENCH\XBX_0220.awd",
+    0x18D5AE6C9E5A889D: r"SB_AGD\120_149\ENGLISH\NGC_0141.agd",
+    0x18D650ABB192AC89: r"SB_AWD\90_119\ITALIAN\NGC_0104.awd",
+    0x18E33C876F41A3AC: r"SB_AGD\0_29\GERMAN\XBX_0007.agd",
+    0x18EA339478E4F7EA: r"SB_AWD\30_59\SPANISH\XBX_0052.awd",
+    0x18EE1FC29F963836: r"SB_AGD\0_29\FRENCH\PS2_0026.agd",
+    0x18F50DFBEDC9AA5B: r"SB_AGD\120_149\FRENCH\PS2_0137.agd",
+    0x18FE28BFA86AE21B: r"SB_AGD\120_149\ITALIAN\PS2_0137.agd",
+    0x1907060B34C9A747: r"SB_AGD\60_89\SPANISH\PS2_0085.agd",
+    0x19081175B5C4FF41: r"SB_AWD\120_149\FRENCH\NGC_0145.awd",
+    0x190D197D4C0BFB54: r"SB_AWD\0_29\SPANISH\PS2_0006.awd",
+    0x1918BDD06B13B550: r"SB_AGD\180_209\FRENCH\PS2_0184.agd",
+    0x1918D4D1B088BB8D: r"SB_AWD\150_179\ENGLISH\NGC_0178.awd",
+    0x1920BCAF03FA2CD9: r"SB_AWD\240_269\FRENCH\NGC_0242.awd",
+    0x1920C07B521B8B8B: r"SHELL\FONTS\mt14.png",
+    0x19218B31B289B77E: r"SB_AGD\30_59\FRENCH\XBX_0049.agd",
+    0x192D0344E0E382EB: r"SB_AGD\180_209\SPANISH\XBX_0205.agd",
+    0x193156A456ABD5CB: r"SB_AWD\30_59\GERMAN\NGC_0035.awd",
+    0x1935374322AE08E2: r"SB_AGD\210_239\ENGLISH\PS2_0217.agd",
+    0x1935C79B2F1F3A13: r"SB_AGD\30_59\SPANISH\NGC_0046.agd",
+    0x1941CBFD37F75AD8: r"SB_AWD\180_209\GERMAN\XBX_0196.awd",
+    0x1947B330EAE0B961: r"SB_AWD\210_239\ITALIAN\NGC_0220.awd",
+    0x194A4804FFDA79CA: r"LEVELS\L_2_2_B\SECTIONS\s_4.rws",
+    0x1953E1FB8CFF50E4: r"SB_AWD\210_239\ITALIAN\XBX_0216.awd",
+    0x196324AA42BEDB5D: r"SB_AWD\0_29\ITALIAN\NGC_0020.awd",
+    0x196A1501EE263F87: r"SB_AGD\120_149\ENGLISH\XBX_0134.agd",
+    0x196CC231DE0DA58B: r"SB_AGD\240_269\FRENCH\XBX_0251.agd",
+    0x1974F1C13E9C9E3A: r"SB_AWD\120_149\ITALIAN\PS2_0143.awd",
+    0x1984FE7E4874212F: r"SB_AGD\120_149\ENGLISH\NGC_0147.agd",
+    0x199963A622FE59A4: r"SB_AWD\30_59\SPANISH\XBX_0050.awd",
+    0x199D6FD449AFD140: r"SB_AGD\0_29\FRENCH\PS2_0024.agd",
+    0x19A3DE0D97E26975: r"SB_AGD\120_149\FRENCH\PS2_0135.agd",
+    0x19A4057081109207: r"SB_AGD\90_119\GERMAN\PS2_0118.agd",
+    0x19B9845D60B8B1FB: r"SB_AGD\60_89\FRENCH\NGC_0080.agd",
+    0x19BBBBCD57BD20C3: r"SB_AWD\30_59\ITALIAN\NGC_0037.awd",
+    0x19C74D19C4DAA6B9: r"AUDIO\SPANISH\PS2_2m2.rws",
+    0x19CD1A2627D2FF8A: r"AUDIO\ITALIAN\XBX_1s1.rws",
+    0x19CDA2C79DC0C3CB: r"SB_AWD\240_269\GERMAN\PS2_0243.awd",
+    0x19CE6F42A770EF4C: r"SB_AGD\120_149\SPANISH\XBX_0137.agd",
+    0x19D821D61D1008F1: r"SB_AGD\210_239\SPANISH\PS2_0214.agd",
+    0x19D8CAADE3403FA4: r"LOC\DE\GLOBAL.LOC",
+    0x19DC62F50B569E06: r"SB_AGD\120_149\ENGLISH\XBX_0144.agd",
+    0x19E9FBCF0CC97117: r"MultiplayerMenu.layout",
+    0x19EA09DFCE23478B: r"SB_AWD\90_119\FRENCH\XBX_0094.awd",
+    0x19EEAACC5E5ADDF5: r"AUDIO\FRENCH\PS2_4s2.rws",
+    0x19F04B707ACEB95C: r"SB_AWD\240_269\ITALIAN\NGC_0269.awd",
+    0x19F941005D0FC4B0: r"LEVELS\L_2_1\SECTIONS\s_6.rws",
+    0x19FF2A7761DB7960: r"SB_AWD\30_59\SPANISH\PS2_0039.awd",
+    0x1A0353CB1F0CF56F: r"ANIMGRPS\Lvl_16\Lvl_16R.ads",
+    0x1A0690D1D39B00ED: r"SB_AWD\30_59\ENGLISH\NGC_0035.awd",
+    0x1A0BBFD69E8F9EE4: r"SB_AWD\210_239\GERMAN\PS2_0213.awd",
+    0x1A0E0B7E4A60223F: r"SHELL\LOAD\L_1_1_B.txd",
+    0x1A1012B69823F7B4: r"SB_AWD\30_59\FRENCH\XBX_0050.awd",
+    0x1A15E17E310DEC69: r"SB_AWD\60_89\ENGLISH\NGC_0060.awd",
+    0x1A160CA51EFE3BC6: r"KujuSplash.layout",
+    0x1A1A2E87E875B32D: r"SB_AGD\30_59\ENGLISH\NGC_0035.agd",
+    0x1A2C31A63F8ED8AD: r"SB_AGD\180_209\SPANISH\PS2_0190.agd",
+    0x1A2ED1CF83D76E37: r"SB_AGD\0_29\FRENCH\PS2_0016.agd",
+    0x1A2FD419A922EC49: r"SB_AWD\180_209\FRENCH\XBX_0205.awd",
+    0x1A32D3DBCD9709FE: r"SB_AWD\60_89\FRENCH\NGC_0074.awd",
+    0x1A36159941E16A30: r"SB_AGD\150_179\ENGLISH\XBX_0164.agd",
+    0x1A42D320AA52B166: r"SB_AGD\120_149\GERMAN\NGC_0131.agd",
+    0x1A43B9483463796F: r"SB_AGD\180_209\ITALIAN\PS2_0206.agd",
+    0x1A47FBFC23AD4A0E: r"SHELL\MOVIES\FRENCH\2_1_Mon.bik",
+    0x1A4852A543E8E42E: r"AUDIO\GERMAN\XBX_1s3.rws",
+    0x1A4A94C389549FD2: r"SB_AGD\30_59\FRENCH\NGC_0032.agd",
+    0x1A501AA435D5FF12: r"SB_AGD\60_89\GERMAN\NGC_0065.agd",
+    0x1A50C21D05AB70C3: r"SB_AGD\0_29\ENGLISH\PS2_0009.agd",
+    0x1A5217C8CB615422: r"SB_AWD\150_179\ITALIAN\XBX_0157.awd",
+    0x1A5E10731F3FD2A2: r"SB_AWD\180_209\FRENCH\NGC_0194.awd",
+    0x1A6A5087820823FB: r"SHELL\FONTS\mtw24.png",
+    0x1A6DD86E74B30FDE: r"SB_AGD\150_179\ENGLISH\PS2_0161.agd",
+    0x1A77CC1567C14240: r"SB_AWD\90_119\FRENCH\NGC_0110.awd",
+    0x1A7D4F545189C90E: r"SB_AGD\120_149\SPANISH\XBX_0139.agd",
+    0x1A81F0366DB9101F: r"SB_AWD\30_59\FRENCH\XBX_0039.awd",
+    0x1A81FEA724CE0EA4: r"AUDIO\ITALIAN\NGC_4m2.rws",
+    0x1A860509B279BAA5: r"SB_AGD\150_179\FRENCH\NGC_0178.agd",
+    0x1A9832BCE979C842: r"WPNBANK\0_25\wbank_08.bin",
+    0x1A98D9F1783C06A5: r"SB_AWD\90_119\FRENCH\XBX_0096.awd",
+    0x1AA634CB46B68B31: r"SB_AGD\90_119\ENGLISH\NGC_0104.agd",
+    0x1AA73075FAFC2740: r"SB_AWD\60_89\GERMAN\NGC_0063.awd",
+    0x1AABE6545DD47F19: r"SHELL\LOAD\MP_10_CTF.txd",
+    0x1AAC70992BC49899: r"SHELL\FONTS\mtw26.png",
+    0x1AAC80F53884D3F7: r"ANIMGRPS\Lvl_23\Lvl_23F.ads",
+    0x1AACD40D78F869C8: r"SB_AGD\240_269\ITALIAN\NGC_0258.agd",
+    0x1ABE831C2339E683: r"SB_AWD\240_269\ENGLISH\XBX_0242.awd",
+    0x1AC80700C1F27C0C: r"ANIMGRPS\Lvl_36\Lvl_36I.ads",
+    0x1AC8FE99928E723F: r"SB_AGD\30_59\ENGLISH\NGC_0033.agd",
+    0x1ACC4E7099479641: r"SB_AWD\90_119\SPANISH\PS2_0116.awd",
+    0x1AD3128078BDF2B2: r"SB_AGD\210_239\ITALIAN\NGC_0223.agd",
+    0x1AD82938E236B51C: r"AUDIO\GERMAN\PS2_4m3.rws",
+    0x1ADB01B7E9A797BF: r"SB_AGD\180_209\SPANISH\PS2_0196.agd",
+    0x1AEC7B79D93F8EC9: r"ANIMGRPS\Lvl_25\Lvl_25P.ads",
+    0x1B01406FD5283147: r"ANIMGRPS\Lvl_23\Lvl_23V.ads",
+    0x1B049FDC46598C16: r"SB_AWD\210_239\SPANISH\PS2_0226.awd",
+    0x1B1A4030A4F0BD04: r"SB_AGD\30_59\FRENCH\PS2_0053.agd",
+    0x1B1C53B10E0483E6: r"LEVELS\L_2_2\SECTIONS\s_1.rws",
+    0x1B1CA8801ECBCEE8: r"SB_AGD\150_179\ENGLISH\PS2_0163.agd",
+    0x1B22FE9728F0A1D8: r"SB_AGD\60_89\ITALIAN\XBX_0067.agd",
+    0x1B236572F489A6A0: r"SB_AGD\210_239\ITALIAN\PS2_0219.agd",
+    0x1B26BC2711DA3732: r"SB_AWD\90_119\FRENCH\NGC_0116.awd",
+    0x1B344AE062F42F75: r"SB_AWD\210_239\FRENCH\XBX_0222.awd",
+    0x1B349FD7880CBBC0: r"SB_AWD\240_269\FRENCH\XBX_0241.awd",
+    0x1B562087A5151C32: r"SB_AWD\60_89\GERMAN\NGC_0065.awd",
+    0x1B580D1963B06A11: r"SB_AWD\30_59\ENGLISH\PS2_0045.awd",
+    0x1B5EBDBE80C967C6: r"SB_AWD\210_239\SPANISH\NGC_0212.awd",
+    0x1B63B4D5F389721C: r"SB_AWD\60_89\ITALIAN\PS2_0086.awd",
+    0x1B69A1E481AAEDA8: r"SB_AWD\0_29\FRENCH\PS2_0019.awd",
+    0x1B69E2374FE4A540: r"SB_AWD\30_59\ITALIAN\PS2_0040.awd",
+    0x1B6E8722A1C50493: r"SB_AWD\120_149\FRENCH\XBX_0145.awd",
+    0x1B725021CCF54C2C: r"SB_AGD\0_29\ENGLISH\PS2_0015.agd",
+    0x1B750FFA9B4D5237: r"SB_AGD\150_179\GERMAN\XBX_0172.agd",
+    0x1B7BE76D826244B8: r"SB_AGD\120_149\SPANISH\PS2_0134.agd",
+    0x1B8D41F124754B01: r"SB_AGD\210_239\SPANISH\PS2_0221.agd",
+    0x1B9642F2CA20720B: r"SB_AGD\210_239\ITALIAN\PS2_0230.agd",
+    0x1BA3EA3BF0A9C57D: r"SB_AWD\90_119\SPANISH\NGC_0096.awd",
+    0x1BA69319A1C31F84: r"SB_AGD\180_209\GERMAN\NGC_0190.agd",
+    0x1BAF852083AAB971: r"SB_AWD\210_239\ENGLISH\NGC_0215.awd",
+    0x1BB58CF0EBBFC0A4: r"LOC\FR\PAUSED.LOC",
+    0x1BC40D38B60E24FE: r"SB_AWD\90_119\SPANISH\NGC_0103.awd",
+    0x1BC6BEFD5748DA93: r"AUDIO\SPANISH\XBX_2m1.rws",
+    0x1BC7D8378D113B99: r"LEVELS\L_1_2\SECTIONS\s_29.rws",
+    0x1BCE0D2D183FD001: r"SB_AWD\240_269\ITALIAN\NGC_0242.awd",
+    0x1BCE92438997F925: r"SB_AGD\240_269\FRENCH\XBX_0253.agd",
+    0x1BDEFB30219562B3: r"SHELL\LOAD\MP_9_TDM.txd",
+    0x1BE38FE93225B0B2: r"SB_AWD\240_269\FRENCH\XBX_0247.awd",
+    0x1BE4CF9A385AC87B: r"SB_AGD\90_119\ENGLISH\PS2_0095.agd",
+    0x1BE853F6D4FCEF2E: r"SB_AWD\60_89\FRENCH\NGC_0067.awd",
+    0x1BE9B03005C41FD0: r"SB_AWD\0_29\ENGLISH\NGC_0021.awd",
+    0x1BF4CA5614F96D4B: r"SB_AGD\240_269\GERMAN\NGC_0268.agd",
+    0x1BF7222EBCAC690D: r"SB_AWD\0_29\ITALIAN\PS2_0025.awd",
+    0x1BF7F33BB1B7F3F6: r"SB_AGD\120_149\GERMAN\NGC_0144.agd",
+    0x1BF87215637ACF5B: r"SB_AGD\30_59\ITALIAN\PS2_0043.agd",
+    0x1C00CA1A1621C476: r"SB_AGD\0_29\GERMAN\PS2_0002.agd",
+    0x1C0672DF499F27FB: r"SB_AGD\60_89\ITALIAN\NGC_0088.agd",
+    0x1C06CE353EB5DACB: r"SB_AWD\0_29\ENGLISH\NGC_0008.awd",
+    0x1C0972B9D822EDB4: r"SB_AWD\150_179\GERMAN\NGC_0155.awd",
+    0x1C0CCA8E4595245B: r"SB_AGD\210_239\GERMAN\XBX_0222.agd",
+    0x1C10C1CC0E651E6A: r"SB_AGD\0_29\ENGLISH\XBX_0025.agd",
+    0x1C12B4E79DA282BE: r"SB_AWD\60_89\ITALIAN\PS2_0088.awd",
+    0x1C18D248F9FD9A32: r"SB_AWD\30_59\ITALIAN\PS2_0046.awd",
+    0x1C19B731F1E8999B: r"SB_AGD\120_149\GERMAN\XBX_0147.agd",
+    0x1C226A1CD7DCA1B8: r"LEVELS\MP_7\SECTIONS\s_11.rws",
+    0x1C22B56FB503021D: r"SB_AGD\180_209\ENGLISH\PS2_0208.agd",
+    0x1C37C3740751823D: r"SB_AGD\210_239\ENGLISH\NGC_0219.agd",
+    0x1C3A38840B76A017: r"SB_AWD\0_29\SPANISH\NGC_0004.awd",
+    0x1C3B42058984741F: r"ANIMGRPS\Lvl_14\Lvl_14N.ads",
+    0x1C3B7796B27F8611: r"AUDIO\SPANISH\PS2_1s3.rws",
+    0x1C3F3306B6E2A490: r"SB_AGD\120_149\ENGLISH\XBX_0146.agd",
+    0x1C44AAECC95DD82F: r"SB_AGD\0_29\GERMAN\NGC_0019.agd",
+    0x1C451F721C3F781B: r"SB_AGD\0_29\ITALIAN\XBX_0019.agd",
+    0x1C4553C2B884F0C0: r"LEVELS\L_2_2\SECTIONS\s_3.rws",
+    0x1C4635209CBE036C: r"SB_AGD\30_59\SPANISH\XBX_0058.agd",
+    0x1C47E0162F23CC7B: r"SB_AWD\120_149\SPANISH\XBX_0130.awd",
+    0x1C4AC23667073CCF: r"CodBack_MainScreen.txd",
+    0x1C52BA4D9AC2840F: r"SB_AWD\90_119\SPANISH\NGC_0090.awd",
+    0x1C5B0CB26847BC06: r"SB_AGD\30_59\ENGLISH\XBX_0056.agd",
+    0x1C5EEC34A2960AE3: r"ANIMGRPS\Lvl_33\Lvl_33P.ads",
+    0x1C6382D459ADBDD5: r"codFontS.dds",
+    0x1C6A4BD459B37EF1: r"codfonts.bin",
+    0x1C6A63F33D415141: r"AUDIO\ITALIAN\NGC_1m2.rws",
+    0x1C6A6DEA7EDAB484: r"SB_AGD\60_89\GERMAN\XBX_0087.agd",
+    0x1C7C79374F740374: r"SB_AGD\210_239\SPANISH\NGC_0221.agd",
+    0x1C7EE23E1EF9CC46: r"SB_AWD\210_239\GERMAN\XBX_0230.awd",
+    0x1C80AE366734A9AC: r"CodBack_MainScreen.dds",
+    0x1C8E98EA7E783026: r"SB_AWD\240_269\ITALIAN\PS2_0248.awd",
+    0x1C9744087F15E498: r"SB_AWD\60_89\FRENCH\NGC_0065.awd",
+    0x1C995ED459DB0F8E: r"codFontS.txd",
+    0x1C9961D459DB14A2: r"codFontS.tga",
+    0x1CA742270D938E75: r"SB_AGD\30_59\ITALIAN\PS2_0041.agd",
+    0x1CAEF25F7E83A2FB: r"LEVELS\L_2_1_B\SECTIONS\s_8.rws",
+    0x1CB2147AE3192496: r"SB_AWD\150_179\ENGLISH\PS2_0150.awd",
+    0x1CBB9A9FEFADE375: r"SB_AGD\210_239\GERMAN\XBX_0220.agd",
+    0x1CC63227BDED86EE: r"SB_AWD\30_59\GERMAN\PS2_0040.awd",
+    0x1CC7F9B13F680753: r"SB_AWD\150_179\FRENCH\PS2_0151.awd",
+    0x1CDCBC421940F6E2: r"SB_AWD\90_119\FRENCH\NGC_0101.awd",
+    0x1CF945758DF10D48: r"ANIMGRPS\Lvl_12\Lvl_12I.ads",
+    0x1D13F8D155687D35: r"SB_AGD\120_149\ITALIAN\PS2_0135.agd",
+    0x1D165C7AE14F37F5: r"NetworkWarningContext.layout",
+    0x1D306A2E82464742: r"LEVELS\MP_7\SECTIONS\s_17.rws",
+    0x1D38A54895F929F7: r"SB_AGD\120_149\GERMAN\NGC_0134.agd",
+    0x1D3F9D423EF1293E: r"SB_AGD\180_209\ITALIAN\PS2_0180.agd",
+    0x1D4726B603A970E5: r"SB_AWD\30_59\GERMAN\NGC_0037.awd",
+    0x1D4B320B347DAC2D: r"LEVELS\L_1_1\GodData.dff.org",
+    0x1D666FEDF1E3DFA0: r"SB_AWD\210_239\SPANISH\PS2_0224.awd",
+    0x1D67099AA599BA86: r"SB_AWD\90_119\SPANISH\XBX_0101.awd",
+    0x1D7053A19D4516F4: r"SB_AWD\210_239\ENGLISH\XBX_0238.awd",
+    0x1D7C4530C5661CAF: r"LEVELS\MP_7\SECTIONS\s_5.rws",
+    0x1D8AA0C78E6942E9: r"SB_AWD\90_119\GERMAN\NGC_0108.awd",
+    0x1D8AE1D2EB9A6FB4: r"SB_AWD\120_149\ITALIAN\PS2_0141.awd",
+    0x1D94FE7EB12003C8: r"SB_AWD\180_209\ENGLISH\PS2_0209.awd",
+    0x1D9D6D4828FD6D6D: r"SB_AGD\60_89\GERMAN\NGC_0075.agd",
+    0x1D9F944384861BF1: r"SB_AWD\210_239\ITALIAN\PS2_0229.awd",
+    0x1DA1531963C34FFA: r"ANIMGRPS\Lvl_22\Lvl_22Y.ads",
+    0x1DC35126D62C2E99: r"SB_AWD\120_149\ITALIAN\XBX_0129.awd",
+    0x1DC3609A2F47BECD: r"SB_AWD\0_29\ITALIAN\NGC_0015.awd",
+    0x1DC6B7B6EDFFAFE0: r"SB_AGD\30_59\SPANISH\PS2_0039.agd",
+    0x1DCD013CFAE7FBDD: r"LEVELS\L_1_5_B\SECTIONS\s_3.rws",
+    0x1DCED264016459E2: r"SB_AWD\30_59\ITALIAN\PS2_0051.awd",
+    0x1DD54B91E0E27CC1: r"SB_AGD\30_59\ITALIAN\XBX_0051.agd",
+    0x1DD6DC7A84C00346: r"SB_AGD\120_149\ITALIAN\XBX_0139.agd",
+    0x1DE372D94ABE5EE5: r"SB_AWD\240_269\GERMAN\PS2_0241.awd",
+    0x1DE703759336482E: r"SB_AWD\210_239\ENGLISH\NGC_0234.awd",
+    0x1DE7AA337026416A: r"SB_AWD\30_59\GERMAN\PS2_0031.awd",
+    0x1DEFD0D8158B2A4A: r"SB_AWD\60_89\GERMAN\XBX_0085.awd",
+    0x1DF8130475AAC5A5: r"SB_AGD\210_239\ITALIAN\PS2_0232.agd",
+    0x1DF851E92C0C5697: r"SB_AWD\210_239\SPANISH\PS2_0216.awd",
+    0x1DFB8E03CC8068A1: r"SB_AWD\60_89\GERMAN\PS2_0074.awd",
+    0x1DFE83C902D11C66: r"SB_AGD\210_239\ENGLISH\XBX_0210.agd",
+    0x1E00394C63310CDF: r"SB_AGD\60_89\FRENCH\NGC_0062.agd",
+    0x1E064B8227CCA5FE: r"SB_AWD\240_269\ITALIAN\NGC_0267.awd",
+    0x1E1C0ECB733BEF60: r"SB_AGD\90_119\GERMAN\XBX_0118.agd",
+    0x1E43220F7751B0D8: r"SB_AGD\90_119\ITALIAN\PS2_0104.agd",
+    0x1E486C309F6CFB56: r"SB_AGD\150_179\FRENCH\PS2_0161.agd",
+    0x1E4A30E6557EC188: r"SB_AGD\240_269\GERMAN\PS2_0248.agd",
+    0x1E4BE041B14F1602: r"SB_AWD\0_29\ENGLISH\NGC_0027.awd",
+    0x1E4BE5AAEEDF05C2: r"SB_AGD\150_179\ENGLISH\XBX_0162.agd",
+    0x1E4E64552E9EDA83: r"SB_AWD\210_239\ITALIAN\PS2_0227.awd",
+    0x1E5CE24214F9AA05: r"SB_AGD\30_59\ITALIAN\PS2_0056.agd",
+    0x1E61F093A93EC0B3: r"SB_AWD\120_149\ENGLISH\NGC_0121.awd",
+    0x1E63B78490E1A33B: r"SB_AGD\210_239\FRENCH\NGC_0226.agd",
+    0x1E6A07C008FB120F: r"AUDIO\ENGLISH\NGC_2m3.rws",
+    0x1E6B3763462D85DC: r"WPNBANK\26_50\wbank_35.bin",
+    0x1E6F61C916DD484A: r"SB_AGD\210_239\ENGLISH\NGC_0230.agd",
+    0x1E700B63ECE6B222: r"SB_AGD\210_239\SPANISH\XBX_0232.agd",
+    0x1E713ABAF713FF05: r"SB_AGD\210_239\GERMAN\XBX_0215.agd",
+    0x1E72B0ABD961575F: r"SB_AWD\0_29\ITALIAN\NGC_0013.awd",
+    0x1E7F03E85F918090: r"SB_AWD\60_89\GERMAN\PS2_0088.awd",
+    0x1E8424A0922C061E: r"SB_AWD\0_29\SPANISH\XBX_0010.awd",
+    0x1E84A52A8DDDEAAE: r"SB_AWD\0_29\GERMAN\NGC_0025.awd",
+    0x1E85BF789E02B3FD: r"SB_AGD\240_269\GERMAN\XBX_0242.agd",
+    0x1E923480FDC15D5F: r"AUDIO\GERMAN\NGC_2m1.rws",
+    0x1E95F3873D4F3D98: r"SB_AWD\210_239\ENGLISH\NGC_0236.awd",
+    0x1E96DA451A3FA324: r"SB_AWD\30_59\GERMAN\PS2_0033.awd",
+    0x1E9B718C41D347D5: r"SB_AGD\0_29\ENGLISH\NGC_0015.agd",
+    0x1EAEE0E5516BCD30: r"SB_AGD\90_119\ENGLISH\XBX_0099.agd",
+    0x1EAF0F486BC23583: r"SB_AGD\120_149\FRENCH\XBX_0130.agd",
+    0x1EB31DA930DC14B5: r"SB_AWD\240_269\ITALIAN\XBX_0248.awd",
+    0x1EB90CE0B0389E6E: r"SB_AWD\90_119\SPANISH\PS2_0106.awd",
+    0x1EBDDCC413D3C290: r"SB_AGD\30_59\ENGLISH\XBX_0054.agd",
+    0x1EC658B64EA03312: r"SB_AWD\120_149\SPANISH\PS2_0125.awd",
+    0x1ECC1E3A61A04BBE: r"SB_AWD\180_209\FRENCH\XBX_0181.awd",
+    0x1EE0FB349414B02C: r"SB_AWD\150_179\ENGLISH\XBX_0155.awd",
+    0x1EE338670694BE11: r"SB_AWD\0_29\ENGLISH\PS2_0007.awd",
+    0x1EE4E3DDF4AF58FC: r"AUDIO\SPANISH\NGC_2s2.rws",
+    0x1EFC11ECAF4FF328: r"SB_AGD\60_89\SPANISH\XBX_0089.agd",
+    0x1F12435D9F42F3E3: r"SB_AWD\210_239\ITALIAN\NGC_0213.awd",
+    0x1F13E48C8EA37820: r"SB_AWD\150_179\ENGLISH\PS2_0152.awd",
+    0x1F1CF10CA1E1CD7A: r"AUDIO\SPANISH\NGC_4s2.rws",
+    0x1F1FF8CDB7847741: r"SB_AWD\180_209\FRENCH\NGC_0207.awd",
+    0x1F21A6816B61C07E: r"SB_AWD\60_89\ITALIAN\XBX_0072.awd",
+    0x1F283374F052CC8A: r"WPNBANK\26_50\wbank_37.bin",
+    0x1F2D754B38A1D9FC: r"LEVELS\L_3_3\SECTIONS\s_16.rws",
+    0x1F33953C37F6E018: r"SB_AWD\0_29\GERMAN\NGC_0027.awd",
+    0x1F33D4B23C464248: r"SB_AWD\0_29\SPANISH\XBX_0012.awd",
+    0x1F3B773C7C6C7273: r"w_betaborder.dds",
+    0x1F447BF49988F28D: r"SB_AGD\150_179\ENGLISH\XBX_0158.agd",
+    0x1F4B419DEBEDB9E7: r"SB_AGD\0_29\ENGLISH\NGC_0013.agd",
+    0x1F506ABDCC011F07: r"w_SessionListBKG.dds",
+    0x1F61F37DAE1BA35B: r"SB_AWD\0_29\FRENCH\PS2_0001.awd",
+    0x1F690297B6EB52EC: r"gui_map10_death.txd",
+    0x1F69B3A3443D3FC4: r"SB_AWD\150_179\SPANISH\NGC_0175.awd",
+    0x1F6E5ED218A8D386: r"SB_AWD\180_209\SPANISH\PS2_0188.awd",
+    0x1F71533C7C99C420: r"w_betaborder.txd",
+    0x1F7D6671AA89E0A1: r"SB_AGD\210_239\ITALIAN\XBX_0226.agd",
+    0x1F864EBDCC2E7F74: r"w_SessionListBKG.txd",
+    0x1F8D6FF5DD9E4F55: r"SB_AWD\120_149\ENGLISH\XBX_0132.awd",
+    0x1F93AA36065BB8BB: r"SB_AWD\60_89\GERMAN\XBX_0066.awd",
+    0x1F942557AE267EDC: r"SB_AWD\30_59\ITALIAN\NGC_0041.awd",
+    0x1F98F2F452244415: r"SB_AWD\240_269\GERMAN\PS2_0256.awd",
+    0x1F9FCE97B71A3CEF: r"gui_map10_death.dds",
+    0x1FA551F616A6EAB6: r"SB_AGD\240_269\FRENCH\NGC_0267.agd",
+    0x1FC2737BEC25AF22: r"LEVELS\L_1_3_A\SECTIONS\s_16.rws",
+    0x1FC7EA2BC17AA26C: r"SB_AGD\90_119\ENGLISH\XBX_0110.agd",
+    0x1FD16C11B97C463C: r"SB_AGD\0_29\ENGLISH\PS2_0020.agd",
+    0x1FD4715C45F94FA2: r"SB_AGD\180_209\SPANISH\XBX_0200.agd",
+    0x1FD60BED80B3080A: r"SB_AWD\150_179\FRENCH\XBX_0157.awd",
+    0x1FE8BF10279103EB: r"SB_AGD\180_209\ENGLISH\PS2_0192.agd",
+    0x1FEF140EDB9DF806: r"SB_AGD\30_59\ENGLISH\PS2_0033.agd",
+    0x1FF59BD163A8BB6F: r"SB_AWD\240_269\SPANISH\XBX_0264.awd",
+    0x1FF7055100F6332E: r"SB_AGD\30_59\GERMAN\PS2_0035.agd",
+    0x1FFCAD13CF925DD8: r"ANIMGRPS\Lvl_35\Lvl_35G.ads",
+    0x200C724069A92A9F: r"SB_AWD\0_29\ITALIAN\PS2_0023.awd",
+    0x200D434D5EB4B500: r"SB_AGD\120_149\GERMAN\NGC_0146.agd",
+    0x201092A381A1E62C: r"SB_AWD\120_149\GERMAN\XBX_0140.awd",
+    0x20161A2BC31E8580: r"SB_AGD\0_29\GERMAN\PS2_0000.agd",
+    0x201830AEB0A5ECA3: r"SB_AWD\120_149\ENGLISH\NGC_0132.awd",
+    0x20189F7F1E9D5FAD: r"SB_AWD\210_239\FRENCH\XBX_0213.awd",
+    0x201B112E5A4A2472: r"SB_AWD\240_269\GERMAN\PS2_0268.awd",
+    0x20204F5F61A9CBA9: r"SHELL\MOVIES\FRENCH\Intro.bik",
+    0x202691DDBB62B904: r"SB_AGD\0_29\ENGLISH\XBX_0027.agd",
+    0x2029B03E1E61B8DD: r"HostEndGameOptions.layout",
+    0x202F87439EE634B5: r"SB_AGD\120_149\GERMAN\XBX_0145.agd",
+    0x20330A881EC6F8CD: r"SB_AWD\90_119\ITALIAN\PS2_0105.awd",
+    0x2033E0A9F6C244FB: r"AUDIO\FRENCH\NGC_1s2.rws",
+    0x203CF6CD6EDCEC79: r"SHELL\FEND\INSTANCE\XBOX\artwork.txd",
+    0x2047E305FC3D3987: r"SB_AWD\240_269\GERMAN\PS2_0250.awd",
+    0x20526D84E42A118E: r"SB_AWD\90_119\ITALIAN\PS2_0094.awd",
+    0x2054A207C0C083C0: r"SB_AGD\240_269\FRENCH\NGC_0265.agd",
+    0x205A95CAC11A4B26: r"SB_AWD\180_209\SPANISH\XBX_0194.awd",
+    0x2062195E0EBB7B19: r"SB_AGD\60_89\FRENCH\NGC_0060.agd",
+    0x2062B2FAC33BF9E5: r"SB_AWD\90_119\GERMAN\PS2_0109.awd",
+    0x206C42F167EBA23D: r"SB_AWD\60_89\SPANISH\NGC_0082.awd",
+    0x207335066587A544: r"SB_AWD\180_209\ITALIAN\NGC_0198.awd",
+    0x2078A9EE20C4E651: r"SB_AGD\60_89\ENGLISH\NGC_0086.agd",
+    0x207F6E60A90CD18D: r"SB_AWD\90_119\FRENCH\NGC_0119.awd",
+    0x2092A5E35C495B01: r"SB_AGD\0_29\ITALIAN\NGC_0006.agd",
+    0x20A41B20BFBA190A: r"ANIMGRPS\Lvl_13\Lvl_13Y.ads",
+    0x20AC20E3B7F91D8C: r"SB_AWD\210_239\FRENCH\NGC_0221.awd",
+    0x20B48B65ECCE3B66: r"SB_AGD\0_29\ENGLISH\NGC_0009.agd",
+    0x20B9BA282E29D7AB: r"SB_AWD\180_209\SPANISH\NGC_0188.awd",
+    0x20C81911C72A3607: r"SB_AGD\30_59\GERMAN\NGC_0044.agd",
+    0x20CA8E876A72CDC7: r"SB_AGD\120_149\ITALIAN\XBX_0123.agd",
+    0x20D2EA037C277CC6: r"SB_AWD\180_209\GERMAN\NGC_0202.awd",
+    0x20D7269C72C7A5AE: r"SB_AWD\60_89\ITALIAN\XBX_0065.awd",
+    0x20DC22396AEB5858: r"SB_AWD\30_59\GERMAN\PS2_0042.awd",
+    0x20DFCC96541A1EA4: r"ANIMGRPS\Lvl_24\Lvl_24S.ads",
+    0x20E0736C926EEF6D: r"SB_AGD\180_209\GERMAN\PS2_0208.agd",
+    0x20E25A99C8E0915F: r"SB_AWD\90_119\ITALIAN\PS2_0103.awd",
+    0x20F455F0EE7794F7: r"SB_AGD\210_239\ENGLISH\XBX_0215.agd",
+    0x20F897B58A6B006A: r"SB_AWD\180_209\ITALIAN\PS2_0197.awd",
+    0x210C900A08FA90D5: r"SB_AGD\60_89\FRENCH\PS2_0076.agd",
+    0x210DB6E8579B7F9A: r"SB_AWD\210_239\FRENCH\PS2_0222.awd",
+    0x211BEAB529EBDCD4: r"SB_AWD\120_149\ENGLISH\NGC_0144.awd",
+    0x2127F9FFCADE7EE3: r"SB_AGD\60_89\ENGLISH\NGC_0088.agd",
+    0x21358C10F0BF2F34: r"ANIMGRPS\Lvl_24\Lvl_24C.ads",
+    0x2136E4935412E005: r"codFontL.tga",
+    0x2136EB935412EC6D: r"codFontL.txd",
+    0x213A6704E45A9486: r"SB_AGD\30_59\GERMAN\NGC_0034.agd",
+    0x213C4222C9584B0D: r"SB_AWD\240_269\FRENCH\XBX_0248.awd",
+    0x213C96260B03FD7B: r"SB_AGD\210_239\ENGLISH\XBX_0228.agd",
+    0x213E9C7CF300D85C: r"SB_AWD\90_119\FRENCH\NGC_0091.awd",
+    0x2147E2AE8F529679: r"SB_AWD\240_269\ENGLISH\NGC_0260.awd",
+    0x2149C167F79049D0: r"SB_AWD\240_269\GERMAN\XBX_0261.awd",
+    0x214B748213F17A36: r"SB_AWD\0_29\ITALIAN\XBX_0021.awd",
+    0x214E61147920E3BA: r"SB_AGD\210_239\GERMAN\PS2_0228.agd",
+    0x21559A816A7FC9EE: r"AUDIO\GERMAN\NGC_1s1.rws",
+    0x2156817F7A2EA757: r"SHELL\FONTS\mlta28.png",
+    0x215B0C32E40020A1: r"SB_AWD\240_269\FRENCH\NGC_0260.awd",
+    0x215BF24D19428623: r"SB_AWD\0_29\SPANISH\XBX_0028.awd",
+    0x2165C922BF0304DD: r"SB_AWD\30_59\SPANISH\NGC_0057.awd",
+    0x2166DF6D308204CB: r"SB_AWD\240_269\GERMAN\XBX_0248.awd",
+    0x216DC7935441F13E: r"codFontL.dds",
+    0x217184829130348D: r"SB_AWD\30_59\ITALIAN\PS2_0049.awd",
+    0x217D204200EBAA25: r"SB_AGD\60_89\ITALIAN\XBX_0079.agd",
+    0x21819E9354525482: r"codfontl.bin",
+    0x218616AE1CE09B18: r"SB_AWD\60_89\ITALIAN\XBX_0067.awd",
+    0x218B0C088818143A: r"SB_AWD\150_179\FRENCH\XBX_0162.awd",
+    0x218FA0A7FE349786: r"ANIMGRPS\Lvl_24\Lvl_24Q.ads",
+    0x2196A5B548F68ECC: r"SB_AGD\240_269\ENGLISH\PS2_0268.agd",
+    0x219D02EAF945B744: r"SB_AWD\180_209\ITALIAN\XBX_0189.awd",
+    0x219F28E391C33839: r"SB_AWD\210_239\FRENCH\PS2_0214.awd",
+    0x21A69A7865877846: r"SB_AGD\150_179\ITALIAN\NGC_0159.agd",
+    0x21A7C7C734846224: r"SB_AWD\180_209\ITALIAN\PS2_0195.awd",
+    0x21B33D59D5FB087F: r"SB_AGD\60_89\GERMAN\NGC_0073.agd",
+    0x21B4153F4420B429: r"Defect.layout",
+    0x21B4E571318E4CCF: r"SB_AGD\150_179\ITALIAN\XBX_0174.agd",
+    0x21BA4CC2A49976AD: r"SB_AWD\30_59\SPANISH\PS2_0030.awd",
+    0x21BC601BB31502E7: r"SB_AGD\60_89\FRENCH\PS2_0070.agd",
+    0x21C3C38F59A5F6F5: r"SB_AWD\0_29\FRENCH\PS2_0003.awd",
+    0x21C847273482F477: r"SB_AWD\90_119\GERMAN\XBX_0108.awd",
+    0x21D126A860E7F2B9: r"NetworkDisconnected.layout",
+    0x21DC8763ACE4BEED: r"SB_AGD\90_119\GERMAN\NGC_0092.agd",
+    0x21DCC0942C08D42F: r"SB_AWD\30_59\ENGLISH\NGC_0059.awd",
+    0x21E460229AD7F516: r"ANIMGRPS\Lvl_24\Lvl_24A.ads",
+    0x21E6E44713588B7A: r"SB_AWD\120_149\GERMAN\PS2_0134.awd",
+    0x21F6A7FEB43B93E1: r"SB_AGD\60_89\ENGLISH\PS2_0065.agd",
+    0x21F774BB39A1427E: r"LEVELS\MP_9\SECTIONS\s_2.rws",
+    0x22108F9ED0A32FC5: r"SB_AGD\0_29\ITALIAN\XBX_0008.agd",
+    0x22127C872CC21A1E: r"SB_AGD\150_179\ITALIAN\PS2_0158.agd",
+    0x22234747138AC549: r"SB_AGD\90_119\ENGLISH\PS2_0109.agd",
+    0x222B0DD664A3D1EE: r"SB_AGD\240_269\SPANISH\XBX_0258.agd",
+    0x22301A8C65B4AE91: r"SB_AGD\150_179\ITALIAN\PS2_0171.agd",
+    0x2231B4F370CA3C58: r"w_map06.txd",
+    0x223213A2CB6E055A: r"SB_AWD\150_179\SPANISH\XBX_0157.awd",
+    0x224585C6F30F688E: r"SB_AGD\240_269\ENGLISH\PS2_0266.agd",
+    0x2249C3A5F33AC62C: r"SB_AWD\150_179\FRENCH\PS2_0178.awd",
+    0x224AB0EB7D3719AB: r"SB_AWD\180_209\FRENCH\PS2_0187.awd",
+    0x2250E533234192E2: r"SB_AGD\60_89\GERMAN\XBX_0070.agd",
+    0x2251E4208729FE90: r"SB_AGD\30_59\ENGLISH\PS2_0031.agd",
+    0x22589BE30F351309: r"SB_AWD\240_269\SPANISH\XBX_0266.awd",
+    0x225C54CC0AE7C547: r"SB_AGD\150_179\FRENCH\NGC_0154.agd",
+    0x2262ADFAA65AEAC6: r"SB_AWD\120_149\ENGLISH\XBX_0144.awd",
+    0x226788F370F7809B: r"w_map06.dds",
+    0x226D1A7BDE1166D6: r"SB_AWD\0_29\GERMAN\XBX_0001.awd",
+    0x2272B253C1F74517: r"SB_AGD\30_59\ITALIAN\PS2_0050.agd",
+    0x2277C4121A1DF631: r"SB_AWD\30_59\FRENCH\XBX_0046.awd",
+    0x2278F19481126710: r"InitialWeaponSelect.layout",
+    0x22870ACCA4119A17: r"SB_AGD\210_239\GERMAN\XBX_0213.agd",
+    0x22940AC2D885ADE3: r"SB_AGD\180_209\GERMAN\XBX_0205.agd",
+    0x2295D458BD7180F4: r"SB_AWD\120_149\GERMAN\PS2_0136.awd",
+    0x229A42ACD06DF38B: r"SB_AWD\150_179\ENGLISH\PS2_0168.awd",
+    0x229E1C68198B3D3D: r"LEVELS\MP_7\SECTIONS\s_18.rws",
+    0x22A4D72F3561EEC4: r"SB_AWD\90_119\ENGLISH\PS2_0117.awd",
+    0x22B29010FCE2257E: r"SHELL\FONTS\fb20.met",
+    0x22C7232774BAD487: r"SB_AWD\90_119\GERMAN\PS2_0118.awd",
+    0x22CA44386BD5209E: r"SB_AGD\0_29\ITALIAN\NGC_0023.agd",
+    0x22CB4CB25C580F18: r"SB_AGD\150_179\SPANISH\XBX_0164.agd",
+    0x22CEFCF25D366FD8: r"SB_AWD\90_119\SPANISH\PS2_0104.awd",
+    0x22D3D72BB31CFC28: r"CurrentVotePlayer.layout",
+    0x22D8C3374EEE0187: r"SB_AGD\180_209\FRENCH\XBX_0193.agd",
+    0x22D9F3717FE30A5F: r"SB_AGD\210_239\GERMAN\PS2_0210.agd",
+    0x22E3361CEE9B2566: r"ANIMGRPS\Lvl_14\Lvl_14C.ads",
+    0x22F1F2310F93F1CB: r"SB_AWD\90_119\FRENCH\PS2_0093.awd",
+    0x22FC0442F872DB1F: r"SB_AGD\150_179\GERMAN\PS2_0153.agd",
+    0x230438F8B2D15A63: r"SB_AGD\150_179\SPANISH\NGC_0161.agd",
+    0x231752797EE4D127: r"SB_AGD\60_89\ENGLISH\NGC_0079.agd",
+    0x23226D6B86654357: r"SB_AWD\240_269\ITALIAN\XBX_0264.awd",
+    0x2325A9E3B3F58466: r"SB_AGD\60_89\FRENCH\PS2_0088.agd",
+    0x232E5945F177E21C: r"SB_AGD\0_29\FRENCH\NGC_0010.agd",
+    0x232EA91AB9AE078F: r"SB_AWD\60_89\ENGLISH\XBX_0068.awd",
+    0x2337057059577A43: r"SB_AWD\30_59\FRENCH\PS2_0043.awd",
+    0x233F17F50B1E34FD: r"SB_AGD\60_89\SPANISH\XBX_0066.agd",
+    0x234B112A6C1E6006: r"SB_AGD\180_209\FRENCH\XBX_0189.agd",
+    0x234EB50089D4E2F1: r"SB_AWD\120_149\GERMAN\XBX_0138.awd",
+    0x235C1FC6A450F2DA: r"ANIMGRPS\Lvl_33\Lvl_33E.ads",
+    0x237953F93480CDFF: r"SHELL\FEND\INSTANCE\gcn\fend.txd",
+    0x237B63F6BDC09786: r"SB_AWD\60_89\SPANISH\XBX_0083.awd",
+    0x237F99791149CA94: r"SB_AWD\90_119\ENGLISH\XBX_0095.awd",
+    0x2388A6FA759D668E: r"LEVELS\L_3_5_C\SECTIONS\s_14.rws",
+    0x238C109F5AA4C880: r"SB_AWD\150_179\ITALIAN\NGC_0162.awd",
+    0x2392FB5BD8CCC19D: r"SB_AWD\120_149\FRENCH\PS2_0122.awd",
+    0x239310A228CD7238: r"SB_AWD\0_29\SPANISH\XBX_0001.awd",
+    0x2399D56D7068B1CC: r"SB_AWD\180_209\GERMAN\NGC_0198.awd",
+    0x239A68CC689A36B2: r"ANIMGRPS\Lvl_34\Lvl_34S.ads",
+    0x239D37168FE69B10: r"SB_AGD\30_59\GERMAN\NGC_0036.agd",
+    0x23A360078A9C20C7: r"SB_AWD\120_149\ENGLISH\XBX_0134.awd",
+    0x23ABF179A31B4002: r"SB_AWD\240_269\GERMAN\XBX_0267.awd",
+    0x23AE91CDF49D41F9: r"gui_map5_death.dds",
+    0x23B3D1412AA17264: r"SB_AGD\210_239\GERMAN\PS2_0239.agd",
+    0x23BF07CDFDDDEE5C: r"SHELL\MOVIES\SPANISH\1_2_Mon.bik",
+    0x23C09C5F9580E523: r"SB_AWD\240_269\FRENCH\NGC_0253.awd",
+    0x23C3FF183F3EDC1A: r"w_whitepaperBKG.dds",
+    0x23C93CE0E070185C: r"SHELL\MOVIES\kuju.bik",
+    0x23D9896AC3ABE31F: r"SB_AGD\150_179\FRENCH\NGC_0165.agd",
+    0x23D9933EE593282F: r"w_common.index",
+    0x23E488C9045DDB15: r"SB_AGD\120_149\SPANISH\PS2_0122.agd",
+    0x23E555CDF4CC1E62: r"gui_map5_death.txd",
+    0x23F02847053F4702: r"ANIMGRPS\Lvl_34\Lvl_34C.ads",
+    0x23FAFB183F6E17A9: r"w_whitepaperBKG.txd",
+    0x23FD851233EDA183: r"SB_AWD\120_149\GERMAN\XBX_0136.awd",
+    0x23FF114728F9D571: r"SB_AGD\180_209\ITALIAN\XBX_0203.agd",
+    0x2403CD8383472CAD: r"LEVELS\MP_10\SECTIONS\s_9.rws",
+    0x240BD562ADF21B38: r"SB_AGD\30_59\GERMAN\PS2_0037.agd",
+    0x240E447523BD1E01: r"SB_AGD\180_209\GERMAN\NGC_0186.agd",
+    0x241201257C8F25BA: r"ANIMGRPS\Lvl_35\Lvl_35E.ads",
+    0x2413DEE93B93C0C4: r"SB_AWD\30_59\ENGLISH\NGC_0030.awd",
+    0x242714337C6D8141: r"SB_AGD\60_89\SPANISH\NGC_0073.agd",
+    0x2437AE49860ACC8A: r"SB_AGD\180_209\ENGLISH\XBX_0200.agd",
+    0x244166A9FF982927: r"SB_AWD\0_29\ITALIAN\XBX_0024.awd",
+    0x24420A41E0EC6829: r"SB_AWD\60_89\FRENCH\PS2_0087.awd",
+    0x2443DD7EF19865BC: r"SB_AGD\90_119\FRENCH\PS2_0102.agd",
+    0x244718591F2D0B84: r"SHELL\FONTS\f20.met",
+    0x2457DA612746642F: r"SB_AWD\60_89\SPANISH\XBX_0060.awd",
+    0x2460B321BEB07A4D: r"SB_AWD\150_179\ITALIAN\PS2_0162.awd",
+    0x2461AC9A79F2FB4A: r"SB_AWD\90_119\GERMAN\XBX_0093.awd",
+    0x2462278C3A3BED63: r"InstantActionDetails.layout",
+    0x24690EB0E8FA2674: r"LEVELS\MP_5\level.dff",
+    0x246D8F545FF7E024: r"LEVELS\L_1_5_B\SECTIONS\s_6.rws",
+    0x246FE5DC6E170CB0: r"SB_AWD\180_209\SPANISH\XBX_0196.awd",
+    0x2482130314E93DCF: r"SB_AWD\60_89\SPANISH\NGC_0084.awd",
+    0x248500805B8A608A: r"SB_AWD\30_59\FRENCH\NGC_0050.awd",
+    0x248528B53DCDD757: r"SB_AWD\0_29\FRENCH\NGC_0013.awd",
+    0x248AD19403744D0A: r"SB_AWD\60_89\ENGLISH\PS2_0084.awd",
+    0x248E55C71D79D50E: r"SB_AWD\90_119\GERMAN\NGC_0091.awd",
+    0x248EA11D14C3E61F: r"SB_AGD\150_179\FRENCH\XBX_0156.agd",
+    0x249A6D129AC3665B: r"SB_AGD\30_59\FRENCH\XBX_0035.agd",
+    0x249A99B395BFF948: r"SB_AGD\120_149\SPANISH\NGC_0140.agd",
+    0x24A6FD0D04FDC9BB: r"SB_AGD\180_209\GERMAN\PS2_0192.agd",
+    0x24A875F50946F613: r"SB_AGD\0_29\ITALIAN\NGC_0008.agd",
+    0x24AD1C084F154103: r"SB_AGD\240_269\SPANISH\XBX_0260.agd",
+    0x24B45FB0E93A9B1C: r"LEVELS\MP_5\level.rws",
+    0x24BA5913BA384FF3: r"SB_AGD\150_179\SPANISH\NGC_0172.agd",
+    0x24BADC2D3485E595: r"SB_AGD\30_59\ITALIAN\NGC_0057.agd",
+    0x24C24962CB3BBDB7: r"ANIMGRPS\Lvl_21\Lvl_21F.ads",
+    0x24CFEA8D899D6D60: r"SB_AWD\0_29\GERMAN\XBX_0003.awd",
+    0x24D77744AA67D0CD: r"SB_AWD\30_59\GERMAN\NGC_0055.awd",
+    0x24E99D17F1640899: r"SB_AGD\240_269\SPANISH\PS2_0269.agd",
+    0x24EB75978CB0F0F6: r"ANIMGRPS\Lvl_14\Lvl_14S.ads",
+    0x24EDE86B90663341: r"AUDIO\GERMAN\XBX_4s1.rws",
+    0x24F72CDB684D22DB: r"SB_AWD\180_209\FRENCH\PS2_0198.awd",
+    0x24F776A85AFE35D6: r"SB_AWD\0_29\FRENCH\NGC_0009.awd",
+    0x2510033368CA12DF: r"SB_AWD\150_179\ITALIAN\PS2_0164.awd",
+    0x251808DD67E0CE07: r"ANIMGRPS\Lvl_21\Lvl_21V.ads",
+    0x251D2BE573FF3D4C: r"SB_AWD\90_119\ENGLISH\NGC_0116.awd",
+    0x2523F8BF09EA6331: r"SB_AWD\150_179\ENGLISH\NGC_0167.awd",
+    0x25263F614C7D6F82: r"SHELL\FONTS\mfb26.png",
+    0x252D2D90031880B4: r"SB_AGD\240_269\GERMAN\XBX_0247.agd",
+    0x25350836E9AF6C4D: r"SB_AGD\240_269\ITALIAN\XBX_0240.agd",
+    0x2535BB6FDE600093: r"SB_AWD\0_29\SPANISH\PS2_0012.awd",
+    0x253BD3832B6D7899: r"SB_AGD\210_239\GERMAN\PS2_0212.agd",
+    0x253D960B0AB53D41: r"SB_AWD\210_239\ENGLISH\PS2_0221.awd",
+    0x253FBC1BDA8C68A5: r"AUDIO\GERMAN\PS2_2s2.rws",
+    0x2545F47BD83D0D9B: r"SB_AGD\90_119\ENGLISH\NGC_0111.agd",
+    0x25493D2444DC2575: r"SB_AGD\30_59\FRENCH\XBX_0037.agd",
+    0x2552E71E44427C45: r"SB_AWD\210_239\ITALIAN\NGC_0237.awd",
+    0x255EE454A3FEFD59: r"SB_AGD\150_179\GERMAN\PS2_0151.agd",
+    0x2564DB30CBA850E8: r"SB_AWD\30_59\ENGLISH\PS2_0048.awd",
+    0x25679501A7DC5AA1: r"SB_AWD\30_59\SPANISH\XBX_0046.awd",
+    0x256C6E4EF955A2FD: r"LOC\US\INGAME.LOC",
+    0x256E4745D55913A4: r"SB_AGD\90_119\ITALIAN\PS2_0092.agd",
+    0x2573C367F17CBECD: r"SB_AWD\240_269\GERMAN\PS2_0267.awd",
+    0x257F2FF098770BFC: r"SB_AWD\180_209\SPANISH\XBX_0202.awd",
+    0x25813A574BE73893: r"gui_map4_death.index",
+    0x2586B7B9B5143247: r"AUDIO\ITALIAN\PS2_1m3.rws",
+    0x2586C7565481695F: r"SB_AWD\30_59\GERMAN\NGC_0053.awd",
+    0x259AF7292397B61A: r"SB_AWD\0_29\SPANISH\NGC_0012.awd",
+    0x25A0FC1A3515E5B4: r"SB_AWD\150_179\FRENCH\XBX_0160.awd",
+    0x25A6C160C1E34DEC: r"SB_AGD\90_119\ENGLISH\NGC_0093.agd",
+    0x25AB03257D4BAE5C: r"SB_AWD\210_239\ENGLISH\XBX_0216.awd",
+    0x25ADE275D102790F: r"SB_AGD\60_89\ENGLISH\XBX_0086.agd",
+    0x25B98FE13676811E: r"SB_AGD\30_59\FRENCH\PS2_0042.agd",
+    0x25C30371EA81B4AB: r"SB_AWD\120_149\ITALIAN\NGC_0121.awd",
+    0x25C60512AB8BE84D: r"SB_AWD\30_59\SPANISH\NGC_0044.awd",
+    0x25CA4582DE8B2909: r"SB_AGD\150_179\ITALIAN\XBX_0176.agd",
+    0x25ED0DFF01D9F45B: r"SB_AWD\60_89\SPANISH\PS2_0081.awd",
+    0x25F2577559E259FF: r"SB_AGD\90_119\GERMAN\NGC_0094.agd",
+    0x26038F6A7A574FEE: r"SB_AWD\60_89\FRENCH\NGC_0089.awd",
+    0x26041CB8E4AE0DF2: r"SB_AGD\120_149\ITALIAN\XBX_0148.agd",
+    0x26121FD25E7BEA46: r"SB_AGD\0_29\ENGLISH\PS2_0000.agd",
+    0x2614112A53D3DA17: r"SB_AWD\30_59\ENGLISH\PS2_0036.awd",
+    0x2616E51351F5F333: r"SB_AWD\30_59\SPANISH\XBX_0048.awd",
+    0x261F334038419998: r"SB_AWD\180_209\ENGLISH\NGC_0208.awd",
+    0x26212B1CADD47B2D: r"SB_AWD\60_89\ITALIAN\PS2_0076.awd",
+    0x26220BC3378DA8E6: r"SB_AWD\60_89\FRENCH\XBX_0072.awd",
+    0x262313799B96575F: r"SB_AWD\240_269\GERMAN\PS2_0261.awd",
+    0x262AA93A51E35795: r"SB_AWD\210_239\GERMAN\NGC_0213.awd",
+    0x262B0F7C3727423A: r"SB_AGD\150_179\GERMAN\NGC_0157.agd",
+    0x262C69245DBF6EB9: r"SB_AWD\0_29\SPANISH\NGC_0024.awd",
+    0x2631D3A7092C318A: r"SB_AGD\120_149\ENGLISH\XBX_0122.agd",
+    0x263A009B62EF6CBA: r"SB_AWD\30_59\FRENCH\NGC_0043.awd",
+    0x263B384D6B71BCD2: r"SB_AWD\60_89\GERMAN\XBX_0063.awd",
+    0x263C697C6F380559: r"SB_AGD\150_179\FRENCH\NGC_0167.agd",
+    0x26455495CFD12F91: r"SB_AWD\180_209\ITALIAN\XBX_0193.awd",
+    0x26556E2D971CF892: r"SB_AWD\120_149\SPANISH\XBX_0135.awd",
+    0x2656EF77E98E41CE: r"SB_AGD\150_179\ENGLISH\NGC_0151.agd",
+    0x26574974A5A9DCFC: r"SB_AWD\0_29\SPANISH\PS2_0028.awd",
+    0x265D42877B1C2D49: r"SB_AGD\60_89\ENGLISH\XBX_0084.agd",
+    0x265E83B7A036930E: r"SB_AWD\150_179\FRENCH\PS2_0176.awd",
+    0x266DECDDA9C6894B: r"SB_AWD\240_269\ITALIAN\NGC_0253.awd",
+    0x266F69E4AAF0D9DE: r"AUDIO\ENGLISH\NGC_1s3.rws",
+    0x2674916875BA17BE: r"SB_AWD\120_149\ITALIAN\PS2_0121.awd",
+    0x2675552455A580DF: r"SB_AWD\30_59\SPANISH\NGC_0042.awd",
+    0x267FF8EF7614349E: r"SB_AWD\180_209\SPANISH\PS2_0203.awd",
+    0x268267C675D04602: r"SB_AGD\180_209\ENGLISH\XBX_0198.agd",
+    0x26871B909B96EC9E: r"SB_AWD\150_179\FRENCH\NGC_0173.awd",
+    0x268D9423C71B91C3: r"SB_AWD\30_59\FRENCH\XBX_0048.awd",
+    0x26902D278CA6D0A2: r"SB_AGD\180_209\ENGLISH\PS2_0197.agd",
+    0x26B9DA72D2D109C9: r"SB_AWD\60_89\SPANISH\XBX_0062.awd",
+    0x26BFED9683B2F684: r"SB_AWD\210_239\FRENCH\XBX_0216.awd",
+    0x26C2AA58F3A4D026: r"SB_AGD\180_209\ITALIAN\XBX_0194.agd",
+    0x26C6406FA29B1061: r"SB_AWD\150_179\GERMAN\NGC_0169.awd",
+    0x26D15BD4E1A74170: r"SB_AWD\60_89\FRENCH\XBX_0070.awd",
+    0x26D506000B4BB147: r"SB_AGD\240_269\ITALIAN\NGC_0240.agd",
+    0x26D923862A671265: r"SB_AGD\210_239\FRENCH\NGC_0219.agd",
+    0x26D9994BFBFC4D07: r"SB_AWD\210_239\GERMAN\NGC_0215.awd",
+    0x26DA5F8DE140DB54: r"SB_AGD\150_179\GERMAN\NGC_0155.agd",
+    0x26DBF05C45FC2193: r"SB_AWD\90_119\ITALIAN\NGC_0111.awd",
+    0x26E0144A18D2BBA8: r"SB_AGD\0_29\ITALIAN\NGC_0021.agd",
+    0x26E4487406D0A11E: r"SB_AWD\180_209\GERMAN\PS2_0188.awd",
+    0x26E4F9D4FE085C78: r"AUDIO\ITALIAN\NGC_1s1.rws",
+    0x26EBBC95C2AA5BF9: r"SB_AWD\30_59\ENGLISH\NGC_0048.awd",
+    0x26F1812EC0500859: r"SB_AGD\150_179\FRENCH\XBX_0154.agd",
+    0x26F5B1888935844C: r"SB_AWD\210_239\ITALIAN\XBX_0227.awd",
+    0x26F95910712CA821: r"SB_AWD\150_179\FRENCH\NGC_0156.awd",
+    0x26FF16C27D31A75B: r"LEVELS\L_3_1_C\SECTIONS\s_8.rws",
+    0x2707C242BC918CE5: r"SB_AWD\90_119\FRENCH\PS2_0091.awd",
+    0x27161D3119FF5A38: r"w_SessionListBKG.index",
+    0x271672CEA3F74CD2: r"LEVELS\L_1_3_B\SECTIONS\s_19.rws",
+    0x2719EE8F9F095F4C: r"SB_AWD\0_29\FRENCH\XBX_0016.awd",
+    0x272FA901202E70C8: r"SB_AWD\180_209\SPANISH\PS2_0201.awd",
+    0x2731C40926B8CF13: r"SB_AWD\210_239\ITALIAN\XBX_0237.awd",
+    0x2736CBA245B128C8: r"SB_AWD\150_179\FRENCH\NGC_0171.awd",
+    0x2739F9D7FB453D88: r"SB_AGD\240_269\SPANISH\XBX_0249.agd",
+    0x273BE212A6146C24: r"SB_AGD\150_179\GERMAN\PS2_0176.agd",
+    0x274D28DA0BED6711: r"SB_AWD\90_119\ENGLISH\PS2_0101.awd",
+    0x2756D7BF7F8D7301: r"LEVELS\L_3_5\SECTIONS\s_15.rws",
+    0x275FAFA9A97BEC9A: r"LEVELS\L_1_3_A\CLUMPS\cbank_00.bin",
+    0x276E44C017FD7780: r"SB_AWD\0_29\GERMAN\NGC_0005.awd",
+    0x2771638C7712CFBE: r"LEVELS\L_1_2\SECTIONS\s_8.rws",
+    0x27729B48B9CF8F7F: r"SB_AWD\0_29\ITALIAN\XBX_0015.awd",
+    0x27894E66394B4920: r"SB_AGD\120_149\FRENCH\NGC_0140.agd",
+    0x278A0F338B4FA8DC: r"SB_AWD\60_89\ENGLISH\NGC_0069.awd",
+    0x27A200B107A29A72: r"SB_AWD\150_179\ITALIAN\NGC_0164.awd",
+    0x27A8A9221B4640B3: r"SB_AWD\150_179\FRENCH\NGC_0158.awd",
+    0x27A8C815F09EA4F4: r"AUDIO\SPANISH\XBX_1s3.rws",
+    0x27AB19F783B9E561: r"SB_AGD\210_239\FRENCH\XBX_0239.agd",
+    0x27ABF42C6575F169: r"SB_AWD\120_149\SPANISH\NGC_0134.awd",
+    0x27B25C402524B681: r"SB_AWD\120_149\ENGLISH\PS2_0139.awd",
+    0x27EAC26E32A914FD: r"SB_AWD\60_89\SPANISH\PS2_0076.awd",
+    0x27EAD75D6DA27E17: r"SB_AGD\30_59\SPANISH\NGC_0059.agd",
+    0x27F3AED773081DBD: r"SB_AGD\120_149\ITALIAN\XBX_0132.agd",
+    0x27F958DAB159C327: r"SB_AGD\120_149\SPANISH\PS2_0124.agd",
+    0x27FA8AB91A16B2B3: r"SB_AGD\150_179\ITALIAN\PS2_0160.agd",
+    0x2800F83902FC037D: r"SHELL\FONTS\tw20.met",
+    0x28050458B23B4394: r"ANIMGRPS\Lvl_34\Lvl_34M.ads",
+    0x2806A20A420E3D2F: r"SB_AWD\240_269\ITALIAN\XBX_0255.awd",
+    0x280B11AA6202FC89: r"SB_AWD\150_179\GERMAN\XBX_0178.awd",
+    0x2818670C230242A8: r"LEVELS\L_3_5_C\SECTIONS\s_16.rws",
+    0x281BC5DAC0139FC5: r"SB_AGD\30_59\FRENCH\PS2_0038.agd",
+    0x281D6330959C029D: r"SB_AGD\90_119\ENGLISH\XBX_0090.agd",
+    0x281F809F4E6965F8: r"LEVELS\L_2_1\CLUMPS\cbank_03.bin",
+    0x2820D4AA92C6D0F2: r"ANIMGRPS\Lvl_23\Lvl_23O.ads",
+    0x28241486D0BAB913: r"SB_AGD\180_209\GERMAN\NGC_0188.agd",
+    0x282988DF7638A312: r"DNAS.layout",
+    0x28374E98826A0F94: r"SB_AWD\180_209\ENGLISH\NGC_0190.awd",
+    0x283CE62D5AFF523E: r"SB_AGD\90_119\ENGLISH\XBX_0101.agd",
+    0x284982A42F16304A: r"SHELL\FEND\profile.csv",
+    0x284A0A53309F0AEC: r"SB_AGD\210_239\GERMAN\NGC_0216.agd",
+    0x284EDE10AD6447F5: r"SB_AWD\60_89\SPANISH\PS2_0083.awd",
+    0x285037A42F1BCF14: r"SHELL\FEND\profile.anm",
+    0x2854B7A8D7CD2CEF: r"SB_AWD\180_209\ITALIAN\PS2_0206.awd",
+    0x28587EF6314CEE51: r"LEVELS\L_2_1_B\GodData.dff",
+    0x2858E77E648DC5CF: r"SB_AGD\60_89\GERMAN\XBX_0079.agd",
+    0x285C331858812CDA: r"SB_AGD\90_119\SPANISH\XBX_0112.agd",
+    0x2860572F3380BFFC: r"ANIMGRPS\Lvl_25\Lvl_25Y.ads",
+    0x286161619B69874C: r"SB_AGD\0_29\ENGLISH\XBX_0005.agd",
+    0x28619ADA09AF0D84: r"SB_AWD\30_59\SPANISH\PS2_0035.awd",
+    0x286F7F61D597BDDB: r"SB_AWD\120_149\ITALIAN\NGC_0132.awd",
+    0x2873EFE40A063DD0: r"SB_AGD\0_29\ENGLISH\PS2_0002.agd",
+    0x2877AA392DF2D11E: r"SB_AGD\60_89\GERMAN\PS2_0068.agd",
+    0x2878CA73FB0BC5B6: r"SB_AGD\180_209\ITALIAN\XBX_0187.agd",
+    0x288D6DC0DB2FC249: r"SB_AGD\210_239\SPANISH\XBX_0239.agd",
+    0x28907FA8E8A7D0E4: r"SB_AGD\150_179\GERMAN\NGC_0160.agd",
+    0x2892ADEAD9055AE3: r"SB_AWD\90_119\ITALIAN\XBX_0117.awd",
+    0x2893B18624147E7D: r"CommonComponents.layout",
+    0x2899927FDCC1D38F: r"SB_AWD\60_89\SPANISH\PS2_0070.awd",
+    0x28CCB3423FB59B2F: r"SB_AGD\90_119\ENGLISH\XBX_0096.agd",
+    0x28CFAC3EE181CDA7: r"SB_AGD\30_59\ITALIAN\NGC_0051.agd",
+    0x28CFB0BC3CDFA444: r"ANIMGRPS\Lvl_23\Lvl_23A.ads",
+    0x28E80D859DF8DF89: r"SHELL\FONTS\t12.met",
+    0x28EF041A5041DE45: r"SB_AWD\30_59\GERMAN\PS2_0058.awd",
+    0x28F5393EAFBEF773: r"SB_AWD\60_89\ITALIAN\NGC_0080.awd",
+    0x29157E07F400E610: r"SB_AGD\60_89\GERMAN\PS2_0088.agd",
+    0x29226830B3357A52: r"SB_AGD\150_179\ENGLISH\PS2_0172.agd",
+    0x29257036D984B4D4: r"ANIMGRPS\Lvl_23\Lvl_23Q.ads",
+    0x29266E5D3454CB65: r"SB_AGD\150_179\SPANISH\XBX_0158.agd",
+    0x29281A85A5255EC0: r"SB_AGD\180_209\ITALIAN\XBX_0185.agd",
+    0x2928C5BBA2CFD1EA: r"SHELL\PAD\PADSHELL.TXD",
+    0x292ADA821625F6D5: r"SB_AGD\180_209\FRENCH\NGC_0203.agd",
+    0x2939C8D0B6E7FEC3: r"SB_AWD\150_179\ENGLISH\NGC_0169.awd",
+    0x294273A78A28AB8F: r"SB_AGD\180_209\SPANISH\XBX_0209.agd",
+    0x2942FE470303E8D4: r"SB_AGD\150_179\GERMAN\XBX_0179.agd",
+    0x294D4A7F27FD19EE: r"WPNBANK\0_25\wbank_17.bin",
+    0x294DFC64B52B1F60: r"SB_AGD\0_29\GERMAN\XBX_0003.agd",
+    0x294FE873FFC7EDF0: r"SB_AGD\0_29\SPANISH\NGC_0003.agd",
+    0x295510AEBEFBB454: r"gui_map8_death.dds",
+    0x295700CC0F07A622: r"SB_AWD\150_179\ITALIAN\NGC_0177.awd",
+    0x295BC48D853AA8B5: r"SB_AGD\90_119\ENGLISH\NGC_0113.agd",
+    0x29615A95E5A5595B: r"SB_AGD\180_209\FRENCH\PS2_0204.agd",
+    0x2967972FF13E2DF7: r"SB_AWD\210_239\ITALIAN\NGC_0231.awd",
+    0x29684F34D1454A35: r"SB_AGD\180_209\ITALIAN\PS2_0198.agd",
+    0x296BB62E9874D230: r"SB_AGD\90_119\SPANISH\NGC_0109.agd",
+    0x29724152FBAD85D5: r"SB_AWD\120_149\FRENCH\NGC_0141.awd",
+    0x297359684EDDE3EC: r"SB_AWD\120_149\ITALIAN\NGC_0144.awd",
+    0x298AF4AEBF2913A7: r"gui_map8_death.txd",
+    0x2990217A282AF763: r"SB_AGD\180_209\SPANISH\PS2_0181.agd",
+    0x29B2E036F2F4FA64: r"SB_AGD\0_29\FRENCH\PS2_0028.agd",
+    0x29B95E704127AD39: r"SB_AGD\120_149\FRENCH\PS2_0139.agd",
+    0x29B97C80DF4CFBB7: r"SB_AGD\180_209\ITALIAN\XBX_0191.agd",
+    0x29BE5D53EB8C0E00: r"SB_AWD\30_59\GERMAN\XBX_0038.awd",
+    0x29BEC1D8D2E90278: r"SB_AWD\210_239\ITALIAN\XBX_0212.awd",
+    0x29C103372A499AFE: r"SB_AWD\210_239\ENGLISH\XBX_0218.awd",
+    0x29CF5FF2E3741C28: r"SB_AGD\30_59\FRENCH\PS2_0040.agd",
+    0x29D2B2E788058606: r"SB_AWD\210_239\ENGLISH\NGC_0212.awd",
+    0x29D6BF963C4820C1: r"ANIMGRPS\Lvl_11\Lvl_11F.ads",
+    0x29DAAA93C04068E7: r"SB_AGD\180_209\FRENCH\NGC_0205.agd",
+    0x29E04A03E9DD82DA: r"LEVELS\L_3_4\level.rws",
+    0x29E6860C703401B4: r"SB_AGD\60_89\SPANISH\XBX_0063.agd",
+    0x29EB9E77E4D67632: r"SB_AGD\120_149\FRENCH\NGC_0146.agd",
+    0x29EC41303164BFFA: r"SB_AGD\30_59\FRENCH\NGC_0043.agd",
+    0x29F8405898616C6F: r"SHELL\FONTS\mt10.png",
+    0x29FEB885A9E0AC82: r"SB_AGD\0_29\SPANISH\NGC_0005.agd",
+    0x2A04438368E80B38: r"SB_AWD\30_59\SPANISH\XBX_0054.awd",
+    0x2A06C1F125E22B85: r"SB_AWD\60_89\GERMAN\PS2_0063.awd",
+    0x2A0CE66BC9E7C67D: r"SB_AGD\30_59\ENGLISH\PS2_0038.agd",
+    0x2A0EB55D246121BB: r"SB_AWD\210_239\GERMAN\PS2_0236.awd",
+    0x2A0F4903EA04F1DE: r"LEVELS\L_3_4\level.dff",
+    0x2A102AA78FBE1875: r"SB_AGD\180_209\FRENCH\PS2_0206.agd",
+    0x2A2A27C38BF9FD00: r"DebugMenu.layout",
+    0x2A2C7F10D8ED3151: r"ANIMGRPS\Lvl_11\Lvl_11V.ads",
+    0x2A357E6316B6A1D7: r"SHELL\LOAD\MP_9_CTF.txd",
+    0x2A38F606E2624F26: r"SB_AGD\30_59\ITALIAN\NGC_0047.agd",
+    0x2A3F5EE57BBD675C: r"SB_AWD\180_209\ENGLISH\PS2_0195.awd",
+    0x2A4251B362F88F05: r"SB_AGD\210_239\SPANISH\PS2_0210.agd",
+    0x2A46BFFCE02D831F: r"SB_AGD\90_119\ENGLISH\PS2_0099.agd",
+    0x2A4FF0AD0FED3E34: r"SB_AWD\30_59\FRENCH\NGC_0041.awd",
+    0x2A538CB95362EBBC: r"SB_AGD\180_209\SPANISH\XBX_0192.agd",
+    0x2A53DBBE0F4ABFE1: r"SB_AGD\90_119\SPANISH\XBX_0094.agd",
+    0x2A686341F171E29F: r"SB_AGD\60_89\ITALIAN\NGC_0084.agd",
+    0x2A68A21BED98E2C9: r"SB_AWD\240_269\ITALIAN\XBX_0257.awd",
+    0x2A7262D8E7D20907: r"SB_AGD\240_269\GERMAN\PS2_0250.agd",
+    0x2A769FB3E4795078: r"SB_AWD\210_239\GERMAN\PS2_0217.awd",
+    0x2A77368DCD280AFB: r"SB_AGD\30_59\SPANISH\XBX_0040.agd",
+    0x2A7942DB4DF7F6CD: r"SB_AGD\240_269\FRENCH\XBX_0262.agd",
+    0x2A7D549932C22503: r"SB_AWD\0_29\ITALIAN\NGC_0022.awd",
+    0x2A83BCEF56C42465: r"SB_AWD\240_269\ITALIAN\NGC_0251.awd",
+    0x2A9823BBA9318471: r"SB_AGD\210_239\ENGLISH\NGC_0228.agd",
+    0x2A9CE3B9137F59A2: r"SB_AWD\60_89\FRENCH\NGC_0078.awd",
+    0x2AA3A5CF1CA2D45A: r"AUDIO\ENGLISH\PS2_1m2.rws",
+    0x2AB4DC3FBF923189: r"w_findSessionBKG.index",
+    0x2AB67202CFFC6737: r"SB_AWD\60_89\GERMAN\PS2_0065.awd",
+    0x2AB7B7BA83598489: r"SB_AWD\180_209\ITALIAN\PS2_0204.awd",
+    0x2AC911E13CA704EE: r"SB_AGD\120_149\ENGLISH\PS2_0136.agd",
+    0x2AD0E0F7F21EAF76: r"SB_AWD\210_239\ITALIAN\NGC_0227.awd",
+    0x2AD14F7381221175: r"SB_AWD\120_149\ITALIAN\NGC_0130.awd",
+    0x2ADB90814F97D1F3: r"SB_AWD\150_179\GERMAN\NGC_0167.awd",
+    0x2ADD77636B37A528: r"ANIMGRPS\Lvl_36\Lvl_36E.ads",
+    0x2AE12E3315CA72F4: r"SB_AGD\180_209\FRENCH\PS2_0188.agd",
+    0x2AE87F3197740292: r"SB_AGD\120_149\SPANISH\XBX_0135.agd",
+    0x2AE936EB52D7A647: r"SHELL\MOVIES\FRENCH\3_1_Mon.bik",
+    0x2AE9A7F9CBF0E4B5: r"LEVELS\L_1_2\SECTIONS\s_18.rws",
+    0x2AF977A913708686: r"AUDIO\SPANISH\PS2_2s3.rws",
+    0x2AFE54EE3E2E43A6: r"SB_AWD\240_269\SPANISH\NGC_0267.awd",
+    0x2AFECE7CE8AAFF5C: r"SB_AWD\90_119\GERMAN\NGC_0101.awd",
+    0x2B01D90EA041FD83: r"SB_AGD\60_89\FRENCH\NGC_0075.agd",
+    0x2B01EBDC8284B7E5: r"ANIMGRPS\Lvl_25\Lvl_25L.ads",
+    0x2B08A637BF185143: r"SB_AWD\210_239\ENGLISH\PS2_0230.awd",
+    0x2B08BD27266739CB: r"SB_AWD\150_179\ENGLISH\XBX_0167.awd",
+    0x2B10546814C10779: r"LEVELS\L_3_5_B\SECTIONS\s_1.rws",
+    0x2B1164A88CA0C545: r"SB_AGD\90_119\ENGLISH\NGC_0100.agd",
+    0x2B117F9ABC44FD2E: r"SB_AGD\240_269\ENGLISH\NGC_0267.agd",
+    0x2B18C2BDB9A13A36: r"SB_AGD\120_149\SPANISH\PS2_0147.agd",
+    0x2B2F1D3B7221DDFB: r"SB_AWD\150_179\FRENCH\NGC_0169.awd",
+    0x2B3198F98DF76218: r"SB_AGD\210_239\SPANISH\NGC_0236.agd",
+    0x2B343E76D878C773: r"SB_AGD\30_59\ENGLISH\NGC_0037.agd",
+    0x2B367E4DDF301CD5: r"SB_AWD\90_119\SPANISH\PS2_0112.awd",
+    0x2B383EDC306F31CC: r"SB_AWD\120_149\ITALIAN\XBX_0120.awd",
+    0x2B4641952F91ECF3: r"SB_AGD\180_209\SPANISH\PS2_0192.agd",
+    0x2B4BF094497FBB26: r"SB_AWD\210_239\FRENCH\NGC_0234.awd",
+    0x2B55C315390D203C: r"SB_AWD\150_179\SPANISH\NGC_0157.awd",
+    0x2B78E1F2E6C176F8: r"SB_AGD\120_149\ENGLISH\PS2_0134.agd",
+    0x2B80A8BBAD50431D: r"SB_AWD\30_59\SPANISH\PS2_0056.awd",
+    0x2B83DD1A91DAEF11: r"SB_AGD\240_269\ENGLISH\NGC_0242.agd",
+    0x2B8434D1C4FB4972: r"SB_AWD\0_29\GERMAN\NGC_0003.awd",
+    0x2B843C496F56967D: r"w_createsesh.index",
+    0x2B87DB5A66CC35D9: r"SB_AWD\0_29\ITALIAN\XBX_0017.awd",
+    0x2B8C8392264AEEFC: r"ANIMGRPS\Lvl_16\Lvl_16U.ads",
+    0x2B9226EDEDB15BD7: r"SHELL\LOAD\L_3_4.txd",
+    0x2B98CAC8026BA36E: r"SB_AGD\0_29\FRENCH\XBX_0018.agd",
+    0x2BA00F45384D957E: r"SB_AWD\60_89\ENGLISH\NGC_0067.awd",
+    0x2BB04C7660B64C72: r"SB_AGD\0_29\GERMAN\XBX_0005.agd",
+    0x2BB51A9CB65B7E5D: r"SB_AGD\30_59\GERMAN\XBX_0053.agd",
+    0x2BC034BA36B98457: r"SB_AGD\90_119\ENGLISH\NGC_0106.agd",
+    0x2BC36CD553CF92BD: r"SB_AGD\150_179\ITALIAN\NGC_0152.agd",
+    0x2BC812CF63BAD340: r"SB_AGD\120_149\SPANISH\PS2_0145.agd",
+    0x2BC9B511A21E1F91: r"ANIMGRPS\Lvl_26\Lvl_26N.ads",
+    0x2BD6CE490381A836: r"SB_AWD\120_149\ENGLISH\NGC_0128.awd",
+    0x2BDB1A000D02E0DD: r"SB_AGD\180_209\ENGLISH\XBX_0197.agd",
+    0x2BDD0FFF12DEC7E0: r"SB_AGD\0_29\ENGLISH\PS2_0011.agd",
+    0x2BEF57669B1BA9D6: r"SB_AWD\150_179\FRENCH\PS2_0158.awd",
+    0x2BF334759D720D38: r"SB_AWD\180_209\GERMAN\PS2_0199.awd",
+    0x2BF87958E53D49D6: r"SB_AGD\30_59\ITALIAN\XBX_0056.agd",
+    0x2BFA33957D72A441: r"CoDSplash.txd",
+    0x2C0396161C33B018: r"SB_AGD\60_89\ENGLISH\PS2_0068.agd",
+    0x2C10D3CB057D9E10: r"QuitScoreBoardTeam.layout",
+    0x2C18162DC30BAC43: r"SB_AWD\0_29\ITALIAN\PS2_0012.awd",
+    0x2C1BD696D6025DD0: r"ScoreBoardDeath.layout",
+    0x2C1FBBCAD0DCE8B6: r"SB_AWD\60_89\GERMAN\PS2_0073.awd",
+    0x2C236713678BD9EC: r"SB_AGD\60_89\FRENCH\NGC_0069.agd",
+    0x2C2CE1141F349A6D: r"SHELL\LOAD\L_3_1_B.txd",
+    0x2C3027957DA01F42: r"CoDSplash.dds",
+    0x2C393D0A5E2A0995: r"SB_AWD\240_269\ITALIAN\NGC_0246.awd",
+    0x2C42716914B9FA33: r"SB_AWD\210_239\ENGLISH\XBX_0220.awd",
+    0x2C4E856C5D3093E9: r"SB_AGD\150_179\FRENCH\NGC_0174.agd",
+    0x2C548405C3092915: r"SB_AWD\210_239\ITALIAN\PS2_0218.awd",
+    0x2C73937CA7BAC3C7: r"SB_AGD\90_119\ITALIAN\PS2_0114.agd",
+    0x2C795B8F271853EF: r"SB_AWD\240_269\ITALIAN\PS2_0263.awd",
+    0x2C7DC4C4E38C8662: r"SB_AWD\60_89\ITALIAN\PS2_0084.awd",
+    0x2C8DEC7509E31D9A: r"SB_AGD\120_149\FRENCH\PS2_0125.agd",
+    0x2C8E4B2284777D9B: r"ANIMGRPS\Lvl_11\Lvl_11T.ads",
+    0x2C980738C486095A: r"SB_AGD\120_149\ITALIAN\PS2_0125.agd",
+    0x2CA0EF114B15ED5A: r"SB_AGD\150_179\SPANISH\PS2_0172.agd",
+    0x2CB94A06CEFBA335: r"SB_AWD\60_89\FRENCH\XBX_0088.awd",
+    0x2CBA1ACA68592329: r"SB_AGD\240_269\GERMAN\NGC_0266.agd",
+    0x2CBE1A2AE0AD0F23: r"SB_AWD\90_119\SPANISH\NGC_0094.awd",
+    0x2CC8793412EA1204: r"SB_AWD\60_89\ITALIAN\PS2_0073.awd",
+    0x2CCB43539CFE04D9: r"SB_AGD\60_89\ITALIAN\NGC_0086.agd",
+    0x2CCCFA786ACEF6D7: r"SB_AWD\60_89\SPANISH\NGC_0062.awd",
+    0x2CD23DEAF60A9AC0: r"SB_AWD\180_209\FRENCH\XBX_0194.awd",
+    0x2CD2C3EBAFD16174: r"SHELL\FONTS\lta30.met",
+    0x2CD98DB2EB9A855D: r"SB_AGD\30_59\FRENCH\XBX_0055.agd",
+    0x2CE82D1C0842FF07: r"SB_AWD\240_269\ITALIAN\NGC_0240.awd",
+    0x2D01814B803F75FD: r"AUDIO\ENGLISH\XBX_2m3.rws",
+    0x2D039D1EAE4896E9: r"SB_AGD\150_179\FRENCH\XBX_0161.agd",
+    0x2D03BBA2E3CCA79E: r"SB_AWD\180_209\ITALIAN\PS2_0180.awd",
+    0x2D159E0BD8AFC4F9: r"SB_AWD\240_269\ITALIAN\XBX_0244.awd",
+    0x2D176FB82BB4F416: r"SB_AGD\210_239\SPANISH\PS2_0226.agd",
+    0x2D204D26BBA75734: r"SB_AGD\30_59\ENGLISH\XBX_0058.agd",
+    0x2D21FB7400964521: r"SB_AWD\90_119\FRENCH\XBX_0104.awd",
+    0x2D23D27DB83E498B: r"SB_AGD\30_59\SPANISH\XBX_0035.agd",
+    0x2D297933FEADC1F9: r"SB_AGD\120_149\ITALIAN\PS2_0139.agd",
+    0x2D2A5927D3428492: r"AUDIO\GERMAN\PS2_4m1.rws",
+    0x2D2D0E01EB863F97: r"SB_AWD\240_269\GERMAN\NGC_0246.awd",
+    0x2D2FC82ECE0A7AB7: r"SB_AGD\30_59\ITALIAN\NGC_0042.agd",
+    0x2D367124A39F73F0: r"SB_AWD\210_239\ITALIAN\NGC_0218.awd",
+    0x2D3A5F3ADC853921: r"SB_AGD\240_269\GERMAN\XBX_0251.agd",
+    0x2D47661022B9F2B1: r"SB_AWD\240_269\FRENCH\XBX_0257.awd",
+    0x2D4B1F1A526CFF4D: r"SB_AGD\0_29\GERMAN\XBX_0015.agd",
+    0x2D551690D4EE70C4: r"WPNBANK\0_25\wbank_19.bin",
+    0x2D641F0AAA457987: r"SB_AGD\120_149\FRENCH\XBX_0123.agd",
+    0x2D678140B9DBEA0A: r"SB_AWD\240_269\GERMAN\PS2_0259.awd",
+    0x2D68E3875A682E7D: r"SB_AGD\180_209\FRENCH\XBX_0182.agd",
+    0x2D69A30D619EC741: r"SB_AWD\90_119\SPANISH\XBX_0094.awd",
+    0x2D6DD3EFED6B100A: r"LEVELS\MP_1\SECTIONS\s_6.rws",
+    0x2D79002392992519: r"ANIMGRPS\Lvl_33\Lvl_33R.ads",
+    0x2D812DFCA0238FB2: r"SB_AWD\180_209\FRENCH\XBX_0192.awd",
+    0x2D8162D3D1EE1991: r"LEVELS\L_2_1_B\SECTIONS\s_6.rws",
+    0x2D883164A8AB5747: r"SB_AWD\120_149\FRENCH\NGC_0147.awd",
+    0x2D8B9B9F15D39C1A: r"SB_AWD\150_179\GERMAN\XBX_0151.awd",
+    0x2D8BD85586942911: r"SB_AWD\210_239\FRENCH\PS2_0236.awd",
+    0x2D8FD7B6E230280A: r"SB_AGD\30_59\GERMAN\NGC_0052.agd",
+    0x2D95BE1F89DDF907: r"SB_AGD\150_179\SPANISH\XBX_0174.agd",
+    0x2DA0E06A4501E38D: r"SHELL\FONTS\mt12.png",
+    0x2DA4378DC08D4F24: r"AUDIO\GERMAN\NGC_4s2.rws",
+    0x2DB219FC8933C69A: r"SB_AGD\240_269\ITALIAN\PS2_0244.agd",
+    0x2DB36BB48DE6E3C8: r"SB_AWD\180_209\ITALIAN\PS2_0182.awd",
+    0x2DC7D31FDDC71167: r"SB_AWD\210_239\ITALIAN\NGC_0222.awd",
+    0x2DD609BC63DE7F7B: r"SHELL\LOAD\MP_9_SD.txd",
+    0x2DD66CFDC775D806: r"SB_AGD\120_149\FRENCH\XBX_0139.agd",
+    0x2DEC8BA7E945B48B: r"ANIMGRPS\Lvl_11\Lvl_11D.ads",
+    0x2DF04466A4010445: r"LEVELS\MP_4\GodData.dff",
+    0x2DF3FA7DA83B9FCF: r"SB_AWD\60_89\GERMAN\XBX_0079.awd",
+    0x2E019141DE618114: r"SB_AGD\30_59\FRENCH\NGC_0041.agd",
+    0x2E049506BE911DD1: r"SB_AGD\150_179\ITALIAN\XBX_0154.agd",
+    0x2E07EA4A977F6322: r"SHELL\FONTS\t12e.met",
+    0x2E08AD75B70FE431: r"SB_AWD\150_179\FRENCH\XBX_0176.awd",
+    0x2E08E209F4267B62: r"LEVELS\L_3_3\SECTIONS\s_5.rws",
+    0x2E1063552A271EE3: r"SB_AGD\90_119\SPANISH\NGC_0094.agd",
+    0x2E1AD8F9ECDD1283: r"SB_AGD\0_29\FRENCH\XBX_0020.agd",
+    0x2E1ED36582C09EE8: r"SB_AWD\150_179\SPANISH\NGC_0162.awd",
+    0x2E2C81234DAA1FDB: r"ANIMGRPS\Lvl_26\Lvl_26L.ads",
+    0x2E35D1D58A9B70ED: r"SB_AGD\120_149\SPANISH\XBX_0125.agd",
+    0x2E3B4280093D1700: r"SB_AWD\90_119\ITALIAN\XBX_0091.awd",
+    0x2E3F6010BE69F4F2: r"SB_AGD\0_29\ENGLISH\PS2_0017.agd",
+    0x2E494519ECA9DD80: r"SB_AWD\30_59\ITALIAN\NGC_0056.awd",
+    0x2E4B5F4A6FED53D4: r"SB_AWD\180_209\ENGLISH\XBX_0192.awd",
+    0x2E4C7F9688D52BC2: r"SB_AGD\30_59\SPANISH\PS2_0059.agd",
+    0x2E4DCC6FC4B46A92: r"gui_map1_destroy.txd",
+    0x2E5821C50FF62A17: r"SB_AGD\210_239\SPANISH\PS2_0216.agd",
+    0x2E59D5955DC08E01: r"SB_AWD\150_179\SPANISH\XBX_0169.awd",
+    0x2E5AF0B55B75482E: r"SB_AWD\60_89\GERMAN\XBX_0081.awd",
+    0x2E7A1C89F01C5A8D: r"SB_AGD\90_119\SPANISH\NGC_0113.agd",
+    0x2E8357BA11F31DF5: r"ANIMGRPS\Lvl_16\Lvl_16P.ads",
+    0x2E84286FC4E296C9: r"gui_map1_destroy.dds",
+    0x2E98920B5B23D411: r"SB_AGD\60_89\ENGLISH\XBX_0062.agd",
+    0x2E9CD7B525216666: r"SB_AGD\60_89\ENGLISH\NGC_0081.agd",
+    0x2EBC5063E994BF2C: r"SB_AWD\240_269\ENGLISH\NGC_0269.awd",
+    0x2EC28B2DDBE6FA5A: r"SB_AWD\0_29\GERMAN\XBX_0027.awd",
+    0x2EC72513223229DB: r"SB_AWD\150_179\FRENCH\PS2_0160.awd",
+    0x2EC9AEB8F45FE61A: r"SB_AGD\0_29\SPANISH\PS2_0004.agd",
+    0x2ECD8B69409DC20E: r"LOC\DE\INGAME.LOC",
+    0x2ECFD0027383BAA6: r"SB_AWD\0_29\SPANISH\XBX_0021.awd",
+    0x2ED1469C84ADF9A9: r"SB_AWD\150_179\SPANISH\PS2_0171.awd",
+    0x2EDC5BA0D2A4AB89: r"SB_AWD\240_269\ITALIAN\PS2_0261.awd",
+    0x2EE50D3F6B7D556A: r"SB_AGD\0_29\SPANISH\NGC_0027.agd",
+    0x2EE5C61D7BE33061: r"SB_AGD\60_89\SPANISH\PS2_0087.agd",
+    0x2EED06E56DF3069F: r"LEVELS\L_3_1\SECTIONS\s_13.rws",
+    0x2EF34B751835470A: r"ANIMGRPS\Lvl_36\Lvl_36G.ads",
+    0x2EF3AD8C8C60C7AC: r"LEVELS\L_3_5_B\GodData.dff",
+    0x2EF467AA5E5437DE: r"SB_AGD\180_209\FRENCH\NGC_0198.agd",
+    0x2F01BA22602954B8: r"SB_AWD\30_59\GERMAN\PS2_0037.awd",
+    0x2F09E0C7058E3D98: r"SB_AWD\60_89\GERMAN\XBX_0083.awd",
+    0x2F0F1308DE278261: r"SB_AWD\60_89\GERMAN\NGC_0079.awd",
+    0x2F13A4FFEB2B0530: r"SB_AWD\240_269\SPANISH\NGC_0265.awd",
+    0x2F156905494839AD: r"SB_AWD\0_29\FRENCH\NGC_0002.awd",
+    0x2F15ADF2BC8397A7: r"SB_AWD\60_89\GERMAN\PS2_0076.awd",
+    0x2F1A17D16B99B4F8: r"SB_AGD\120_149\ITALIAN\NGC_0139.agd",
+    0x2F1B8A8AD5FC5CEF: r"SB_AWD\180_209\SPANISH\NGC_0184.awd",
+    0x2F1E8D38D364D4E5: r"SB_AWD\150_179\ENGLISH\XBX_0165.awd",
+    0x2F1FADD70556F647: r"SB_AGD\90_119\FRENCH\XBX_0106.agd",
+    0x2F264FAC6940E538: r"SB_AGD\240_269\ENGLISH\NGC_0265.agd",
+    0x2F2EE0509C9A9DC4: r"SB_AWD\210_239\SPANISH\PS2_0228.awd",
+    0x2F33B20EC1A07BC9: r"CoDSplash.layout",
+    0x2F3497FD5B5BBB2A: r"SHELL\FONTS\lta32.met",
+    0x2F424E2E8651436B: r"AUDIO\ENGLISH\XBX_4s1.rws",
+    0x2F4515E0337F188D: r"SB_AGD\30_59\SPANISH\PS2_0041.agd",
+    0x2F45F5404C9631CD: r"SB_AGD\90_119\SPANISH\PS2_0097.agd",
+    0x2F4C6E5F8C2DEE47: r"SB_AWD\90_119\SPANISH\PS2_0114.awd",
+    0x2F4F7BABBFCAD19E: r"SB_AWD\120_149\GERMAN\NGC_0126.awd",
+    0x2F51B9A49DAE361D: r"SB_AWD\30_59\FRENCH\PS2_0030.awd",
+    0x2F52261D738F8D69: r"SB_AGD\180_209\ENGLISH\NGC_0191.agd",
+    0x2F561B3883CA6B3B: r"SB_AGD\0_29\FRENCH\NGC_0008.agd",
+    0x2F5640C3D2AE25AF: r"SB_AWD\90_119\ITALIAN\NGC_0090.awd",
+    0x2F569777A37B03DF: r"SB_AGD\240_269\GERMAN\PS2_0261.agd",
+    0x2F6140A5F67C7CB0: r"SB_AWD\210_239\FRENCH\NGC_0236.awd",
+    0x2F683A17909ABC2A: r"SB_AGD\240_269\ITALIAN\PS2_0257.agd",
+    0x2F69D37C0E7A2826: r"ANIMGRPS\Lvl_22\Lvl_22M.ads",
+    0x2F703CF9153FE50D: r"SB_AGD\120_149\GERMAN\PS2_0120.agd",
+    0x2F7F39F9E85CA0B6: r"SB_AWD\240_269\FRENCH\NGC_0267.awd",
+    0x2F7F3D5ECC67F3A8: r"LOC\EN\HUD.LOC",
+    0x2F83AF34C1EDC63A: r"SB_AWD\180_209\SPANISH\PS2_0184.awd",
+    0x2F85A28F63C89D25: r"SB_AGD\30_59\SPANISH\XBX_0037.agd",
+    0x2F8A28AAFD6CFDD5: r"SB_AWD\180_209\FRENCH\NGC_0203.awd",
+    0x2F90349ABF4744DF: r"SB_AGD\240_269\FRENCH\NGC_0240.agd",
+    0x2F91508E7F94429A: r"SB_AGD\30_59\ITALIAN\PS2_0059.agd",
+    0x2F9814FC6DCD911C: r"SB_AGD\90_119\ENGLISH\PS2_0100.agd",
+    0x2F9D92CFBF6A1AFA: r"LEVELS\L_3_5\SECTIONS\s_3.rws",
+    0x2F9DBDB82A294EBB: r"SB_AGD\210_239\FRENCH\XBX_0219.agd",
+    0x2F9E8688B2D6B81F: r"SB_AGD\210_239\ENGLISH\XBX_0224.agd",
+    0x2FA448D9A6656F8A: r"SB_AGD\90_119\GERMAN\NGC_0118.agd",
+    0x2FAFBBD1DF7347C1: r"SB_AGD\150_179\ENGLISH\XBX_0154.agd",
+    0x2FC1B92B95608D21: r"SB_AWD\120_149\GERMAN\NGC_0143.awd",
+    0x2FC356AA961FB8CE: r"SB_AWD\210_239\FRENCH\PS2_0213.awd",
+    0x2FCA6AAE63583FEF: r"SB_AGD\30_59\GERMAN\XBX_0055.agd",
+    0x2FD1CF348BC4034D: r"SB_AWD\90_119\SPANISH\NGC_0113.awd",
+    0x2FD3E2DB606B273C: r"SHELL\MOVIES\1_2_Mon.bik",
+    0x2FDEFDEB385A9F5A: r"SB_AGD\0_29\ITALIAN\XBX_0007.agd",
+    0x2FE6C1623259850A: r"SB_AWD\90_119\GERMAN\PS2_0111.awd",
+    0x2FF06A11B9FFA26F: r"SB_AGD\180_209\ENGLISH\XBX_0191.agd",
+    0x2FFF2BBD69E50DC8: r"SB_AWD\120_149\GERMAN\NGC_0124.awd",
+    0x2FFFEE5B3063A13C: r"SB_AWD\30_59\ENGLISH\NGC_0052.awd",
+    0x30021044916782B0: r"SB_AGD\120_149\ENGLISH\NGC_0139.agd",
+    0x30170A293AB37BC4: r"SB_AGD\240_269\ITALIAN\PS2_0255.agd",
+    0x301736DA9F6014FB: r"SB_AWD\180_209\GERMAN\NGC_0180.awd",
+    0x30236EEDE358B366: r"LOC\EN\GUI.LOC",
+    0x30321EA994F8B9A9: r"SB_AWD\0_29\ENGLISH\NGC_0006.awd",
+    0x3032AA0907641D20: r"SB_AGD\90_119\ENGLISH\XBX_0114.agd",
+    0x303B76D2A6FAF5E4: r"KujuSplash.txd",
+    0x30402BCAC69B73EE: r"SB_AWD\150_179\FRENCH\XBX_0153.awd",
+    0x3044626856EB1B2D: r"gui_map9_ctf.index",
+    0x304507A6482B7979: r"SB_AGD\120_149\GERMAN\XBX_0149.agd",
+    0x30499F3353E376DD: r"SB_AWD\150_179\GERMAN\PS2_0160.awd",
+    0x304BC5778779EDF0: r"SB_AGD\240_269\ENGLISH\PS2_0259.agd",
+    0x30512DE241384A77: r"gui_map4_destroy.txd",
+    0x30587AAA59BA9599: r"SB_AWD\60_89\GERMAN\XBX_0068.awd",
+    0x305A02D7332DCBEC: r"SB_AGD\90_119\SPANISH\PS2_0117.agd",
+    0x305FFCCD88402D8F: r"SB_AGD\30_59\ITALIAN\NGC_0033.agd",
+    0x306A126A6A05ACE4: r"SB_AGD\240_269\FRENCH\NGC_0269.agd",
+    0x306BD70F181221F1: r"SB_AWD\150_179\ITALIAN\PS2_0171.awd",
+    0x306BFE4030D2DB75: r"AUDIO\ENGLISH\XBX_4s3.rws",
+    0x306C9F7183ECA25B: r"SB_AGD\90_119\FRENCH\PS2_0116.agd",
+    0x30706FE6728257F9: r"SB_AGD\0_29\ITALIAN\XBX_0017.agd",
+    0x307172D2A7287E17: r"KujuSplash.dds",
+    0x3075726DF88BDEF4: r"SHELL\LOAD\L_1_3_C.txd",
+    0x3078335D6C813DA9: r"SB_AWD\90_119\GERMAN\PS2_0105.awd",
+    0x307916AE0D1441E6: r"SB_AGD\150_179\SPANISH\NGC_0168.agd",
+    0x307FCED3FBC6DBAA: r"SB_AGD\0_29\SPANISH\PS2_0017.agd",
+    0x30811F4635DD9BDF: r"SB_AWD\90_119\SPANISH\NGC_0115.awd",
+    0x308829E241678584: r"gui_map4_destroy.dds",
+    0x3094D9B6199E2031: r"SB_AGD\60_89\FRENCH\XBX_0075.agd",
+    0x3097D7A2230F174D: r"SB_AGD\90_119\ITALIAN\XBX_0098.agd",
+    0x309992208704FD51: r"SB_AWD\240_269\ENGLISH\NGC_0242.awd",
+    0x30A7B6C9990D0F08: r"SB_AGD\0_29\FRENCH\XBX_0009.agd",
+    0x30AAEACD4A34676C: r"SB_AGD\240_269\SPANISH\PS2_0260.agd",
+    0x30B56DE7DA16EBFA: r"SB_AGD\120_149\SPANISH\NGC_0137.agd",
+    0x30B64374897725D2: r"SB_AWD\210_239\GERMAN\PS2_0233.awd",
+    0x30B9595ED4BA1B54: r"SB_AWD\240_269\ITALIAN\PS2_0246.awd",
+    0x30C667556B3831DC: r"SB_AGD\210_239\ENGLISH\PS2_0215.agd",
+    0x30C736A05D947FE9: r"SB_AGD\240_269\ITALIAN\NGC_0260.agd",
+    0x30C8BD44BB376911: r"SB_AGD\210_239\SPANISH\XBX_0217.agd",
+    0x30C9FBC89613647A: r"SB_AGD\0_29\ENGLISH\NGC_0005.agd",
+    0x30CC387B624557E1: r"SB_AWD\90_119\ENGLISH\NGC_0092.awd",
+    0x30D0805336BEADFD: r"SB_AGD\60_89\GERMAN\PS2_0081.agd",
+    0x30DDAACD3BFE6267: r"AUDIO\SPANISH\NGC_4m1.rws",
+    0x30EEDDC4989746EF: r"SB_AGD\30_59\FRENCH\XBX_0053.agd",
+    0x31021CECF3506B9E: r"SB_AWD\180_209\GERMAN\XBX_0204.awd",
+    0x310F5CDF3259E1C9: r"SB_AGD\30_59\ITALIAN\NGC_0031.agd",
+    0x311B6F832E056175: r"SB_AGD\90_119\FRENCH\PS2_0114.agd",
+    0x3128F524CDBC7D75: r"SB_AWD\150_179\FRENCH\PS2_0162.awd",
+    0x312A5D55A823A787: r"gui_map10_destroy.dds",
+    0x312E9EE5A5DF9B44: r"SB_AGD\0_29\SPANISH\PS2_0015.agd",
+    0x313428F685E1A8B6: r"SB_AGD\0_29\FRENCH\NGC_0023.agd",
+    0x313478CB4E17CE21: r"SB_AWD\60_89\ENGLISH\XBX_0075.awd",
+    0x3144EDD80651C66B: r"SB_AWD\90_119\ENGLISH\NGC_0102.awd",
+    0x314CD734E8DDCFED: r"SB_AWD\120_149\FRENCH\XBX_0147.awd",
+    0x31597A23645755D3: r"SB_AWD\60_89\SPANISH\XBX_0073.awd",
+    0x315D3621CFB78E43: r"SB_AWD\240_269\FRENCH\XBX_0259.awd",
+    0x31604155A85107F4: r"gui_map10_destroy.txd",
+    0x3167F22034E66433: r"SB_AWD\120_149\GERMAN\PS2_0122.awd",
+    0x3168B5C61569036A: r"SB_AGD\120_149\GERMAN\XBX_0120.agd",
+    0x317E8A9C8188B489: r"SB_AWD\180_209\SPANISH\NGC_0186.awd",
+    0x31824565D4DCEE8F: r"gui_map4_destroy.index",
+    0x3192A9DD10C7DEF7: r"SB_AGD\60_89\ENGLISH\NGC_0084.agd",
+    0x31A15E75B7E3E2B0: r"SB_AWD\120_149\ENGLISH\NGC_0139.awd",
+    0x31A295E9656C375D: r"LEVELS\L_1_2\SECTIONS\s_3.rws",
+    0x31A9AA42E46FD266: r"LEVELS\MP_10\SECTIONS\s_11.rws",
+    0x31ACF648DA1F30E0: r"LOC\IT\GUI.LOC",
+    0x31B1CCFE9D6AA7C8: r"SB_AWD\180_209\GERMAN\XBX_0206.awd",
+    0x31B8080EEBB20198: r"SB_AGD\210_239\FRENCH\XBX_0234.agd",
+    0x31B840D57E38CB49: r"SB_AWD\90_119\ITALIAN\NGC_0092.awd",
+    0x31B877894F057219: r"SB_AGD\240_269\GERMAN\PS2_0263.agd",
+    0x31CCC0A5893393FD: r"CodBack.index",
+    0x31D2E1A1841B37C1: r"SB_AWD\90_119\ENGLISH\PS2_0093.awd",
+    0x31D8C1E223D0503B: r"SHELL\FONTS\mlta24.png",
+    0x31E379082FFB41C0: r"SB_AGD\0_29\FRENCH\NGC_0021.agd",
+    0x31F214AC6AD1B319: r"SB_AGD\240_269\FRENCH\NGC_0242.agd",
+    0x31F42BD2DC3E4D4D: r"SB_AGD\240_269\ENGLISH\PS2_0243.agd",
+    0x31FAC7F75C1C0691: r"ANIMGRPS\Lvl_32\Lvl_32P.ads",
+    0x32011CEEDB011474: r"SB_AGD\120_149\ITALIAN\XBX_0137.agd",
+    0x3201669A5E62DA59: r"SB_AGD\210_239\ENGLISH\XBX_0226.agd",
+    0x32017EF13E6ADF65: r"SB_AWD\180_209\SPANISH\NGC_0209.awd",
+    0x3212A7A47A6E13B8: r"SB_AWD\180_209\ITALIAN\PS2_0191.awd",
+    0x3219189652905F91: r"SB_AWD\0_29\SPANISH\NGC_0006.awd",
+    0x321CD3AA63890416: r"SB_AGD\0_29\ITALIAN\NGC_0001.agd",
+    0x321D7D371BE3A9B3: r"SB_AGD\60_89\GERMAN\NGC_0077.agd",
+    0x321E7D87640D7FC3: r"SB_AWD\150_179\FRENCH\XBX_0178.awd",
+    0x32369D18257DBAB2: r"ANIMGRPS\Lvl_21\Lvl_21O.ads",
+    0x32481B1E17502141: r"SB_AWD\120_149\FRENCH\PS2_0131.awd",
+    0x324A41FA80C84E56: r"SB_AGD\60_89\SPANISH\NGC_0074.agd",
+    0x324AF9D121051641: r"SB_AGD\60_89\FRENCH\XBX_0062.agd",
+    0x324BA1E737990BFF: r"SB_AGD\120_149\SPANISH\XBX_0123.agd",
+    0x32513291B63AE8F2: r"SB_AWD\90_119\ITALIAN\XBX_0097.awd",
+    0x3254D48E699161CB: r"ANIMGRPS\Lvl_32\Lvl_32B.ads",
+    0x325F352B99A7AF72: r"SB_AWD\30_59\ITALIAN\NGC_0050.awd",
+    0x32653808E547353E: r"SB_AWD\60_89\FRENCH\PS2_0080.awd",
+    0x327481882462D5E6: r"ANIMGRPS\Lvl_35\Lvl_35Q.ads",
+    0x32752C21D4034FA7: r"SB_AWD\240_269\FRENCH\NGC_0262.awd",
+    0x3277FE5D4F9FDD7A: r"SB_AWD\120_149\ENGLISH\XBX_0148.awd",
+    0x327FF911AF064E83: r"SB_AWD\30_59\SPANISH\NGC_0055.awd",
+    0x3287D3824444FE3C: r"codFontN.dds",
+    0x328E22824449F014: r"codfontn.bin",
+    0x328E87F8E723A919: r"SB_AGD\210_239\FRENCH\NGC_0228.agd",
+    0x3290714497DDC21C: r"SB_AWD\60_89\ENGLISH\PS2_0073.awd",
+    0x3294FA1AB2EF4A32: r"SB_AGD\90_119\ENGLISH\XBX_0112.agd",
+    0x329D4E119ECC9B16: r"SB_AWD\90_119\ITALIAN\NGC_0118.awd",
+    0x329DAD3C2480B9B2: r"SB_AGD\120_149\FRENCH\XBX_0148.agd",
+    0x32A34B90D459C3AE: r"SB_AGD\90_119\GERMAN\XBX_0097.agd",
+    0x32AED5143822F1A1: r"SB_AGD\120_149\ENGLISH\XBX_0136.agd",
+    0x32B294D47270E587: r"SB_AWD\120_149\GERMAN\XBX_0129.awd",
+    0x32B30C68BB0B8040: r"SB_AWD\240_269\ENGLISH\XBX_0263.awd",
+    0x32B42EA9717ACACA: r"SB_AGD\60_89\ITALIAN\XBX_0061.agd",
+    0x32BB70754EB3EAFD: r"SB_AWD\90_119\ENGLISH\XBX_0102.awd",
+    0x32BDB48244725973: r"codFontN.tga",
+    0x32BDC7824472793F: r"codFontN.txd",
+    0x32CCF76BA8328252: r"SB_AWD\30_59\ITALIAN\XBX_0038.awd",
+    0x32CE6E5CC10D24EB: r"SB_AWD\30_59\ENGLISH\XBX_0057.awd",
+    0x32D1107596908C0E: r"SB_AWD\240_269\ENGLISH\NGC_0267.awd",
+    0x32D1745CFBFCD345: r"SB_AWD\150_179\GERMAN\NGC_0158.awd",
+    0x32D77E323FF4B73A: r"SB_AGD\0_29\ITALIAN\PS2_0017.agd",
+    0x32DA3879DCA5079D: r"SB_AGD\90_119\SPANISH\NGC_0100.agd",
+    0x32DF4AEB62F01BDF: r"SB_AGD\210_239\FRENCH\PS2_0216.agd",
+    0x32DFD5F37AEDD2B0: r"SB_AGD\180_209\FRENCH\XBX_0208.agd",
+    0x32E5201420807C30: r"SB_AWD\0_29\SPANISH\XBX_0023.awd",
+    0x32FADD51187AF004: r"SB_AGD\0_29\SPANISH\NGC_0025.agd",
+    0x32FEBAA01E6F0DF7: r"SB_AGD\180_209\GERMAN\XBX_0209.agd",
+    0x330F815FD095F689: r"SB_AWD\180_209\FRENCH\PS2_0189.awd",
+    0x33124D5FAE1A4EF3: r"gui_map7_destroy.dds",
+    0x3312696A980A69AB: r"SB_AGD\120_149\ITALIAN\NGC_0121.agd",
+    0x3324631A8B2443F3: r"SB_AWD\60_89\GERMAN\NGC_0077.awd",
+    0x332CFF9F2FBC7A4D: r"SB_AWD\30_59\GERMAN\XBX_0031.awd",
+    0x332D9B4931CA7ED3: r"SB_AWD\120_149\SPANISH\PS2_0137.awd",
+    0x3333A53A2B20F0F2: r"LEVELS\L_3_3\SECTIONS\s_14.rws",
+    0x333B1A465D3AAD7A: r"SB_AGD\60_89\FRENCH\PS2_0084.agd",
+    0x3341B082315BE86B: r"SB_AWD\0_29\FRENCH\XBX_0002.awd",
+    0x334375BB9F1F1E8B: r"SB_AWD\210_239\ENGLISH\PS2_0212.awd",
+    0x3345A0A4ABA28369: r"SB_AGD\60_89\ITALIAN\XBX_0075.agd",
+    0x3348295FAE47A0A0: r"gui_map7_destroy.txd",
+    0x33519CC6CB05BFD1: r"newfont_string.tga",
+    0x335893F79AD613EE: r"SB_AGD\0_29\FRENCH\PS2_0008.agd",
+    0x3358E936E2BACDA0: r"SB_AWD\0_29\SPANISH\PS2_0019.awd",
+    0x335E932123CBF769: r"SB_AWD\150_179\ENGLISH\PS2_0166.awd",
+    0x3361FC7A65247532: r"SB_AWD\240_269\ENGLISH\XBX_0265.awd",
+    0x3364A4053868A8C3: r"SB_AGD\150_179\GERMAN\PS2_0162.agd",
+    0x336A4086F8CCA98F: r"SB_AWD\90_119\ENGLISH\XBX_0104.awd",
+    0x33785C551B6D2CEB: r"SB_AGD\90_119\FRENCH\XBX_0094.agd",
+    0x3386CE43EA0E5054: r"SB_AGD\0_29\ITALIAN\PS2_0015.agd",
+    0x3389888B86BEA02F: r"SB_AGD\90_119\SPANISH\NGC_0106.agd",
+    0x338BC2C8AC38DAB6: r"SB_AWD\30_59\SPANISH\XBX_0041.awd",
+    0x33917045F4861518: r"EndRoundHostSettings.layout",
+    0x33999F466EEB97B4: r"SB_AWD\180_209\SPANISH\PS2_0186.awd",
+    0x339B248EF5AFD0F3: r"SB_AWD\90_119\GERMAN\PS2_0091.awd",
+    0x339E991690E8AFAE: r"SB_AGD\0_29\GERMAN\NGC_0025.agd",
+    0x33A018BCAA6ACF47: r"SB_AWD\180_209\FRENCH\NGC_0205.awd",
+    0x33A531D02007C59D: r"SB_AGD\30_59\SPANISH\PS2_0056.agd",
+    0x33AB99A0D763647B: r"LEVELS\MP_6\GodData.dff",
+    0x33B948536CF2A4A6: r"SB_AGD\150_179\ITALIAN\PS2_0176.agd",
+    0x33C0C918B1CA1C41: r"ANIMGRPS\Lvl_12\Lvl_12D.ads",
+    0x33CC9BFFECE53278: r"SHELL\FONTS\fb22.met",
+    0x33D479BDAAC8E386: r"SB_AGD\240_269\SPANISH\XBX_0269.agd",
+    0x33D60BCE433C9424: r"AUDIO\GERMAN\NGC_1m1.rws",
+    0x33D731FB73261611: r"SB_AWD\210_239\SPANISH\PS2_0214.awd",
+    0x33DC4FB0D9D612DF: r"SB_AWD\30_59\GERMAN\XBX_0037.awd",
+    0x33F245CD4937DDA5: r"SB_AWD\210_239\ENGLISH\PS2_0210.awd",
+    0x33F4D492272681DA: r"LegalSplash.layout",
+    0x3401F1D9215D9FC6: r"SB_AWD\30_59\FRENCH\XBX_0041.awd",
+    0x340BC507F7AF29EB: r"SB_AGD\60_89\ITALIAN\PS2_0081.agd",
+    0x340BE885B1EA806B: r"SB_AGD\150_179\SPANISH\NGC_0150.agd",
+    0x3410519EBF7DFB34: r"SB_AGD\180_209\FRENCH\XBX_0187.agd",
+    0x34143546A10CBB22: r"SB_AWD\30_59\ITALIAN\NGC_0043.awd",
+    0x341688934E6F2CD1: r"ANIMGRPS\Lvl_12\Lvl_12T.ads",
+    0x3421EC41B5938054: r"SB_AWD\120_149\GERMAN\PS2_0143.awd",
+    0x34221B2717F077CA: r"w_scoreboard.index",
+    0x345096EB621BEF4E: r"SB_AWD\0_29\SPANISH\NGC_0023.awd",
+    0x345481E1CA215E2F: r"SB_AGD\30_59\SPANISH\PS2_0050.agd",
+    0x34561BDC73994558: r"SB_AWD\150_179\FRENCH\XBX_0151.awd",
+    0x34567977270CB58D: r"SB_AGD\60_89\ITALIAN\PS2_0076.agd",
+    0x345B27CF90176A78: r"LEVELS\MP_5\SECTIONS\s_4.rws",
+    0x345D940907A806DB: r"ANIMGRPS\Lvl_32\Lvl_32R.ads",
+    0x34602A4B1CEC84AC: r"SB_AWD\30_59\ENGLISH\NGC_0041.awd",
+    0x3460C9D57742DC18: r"SB_AGD\90_119\SPANISH\XBX_0099.agd",
+    0x346941246EE25B85: r"SB_AGD\180_209\ITALIAN\XBX_0207.agd",
+    0x347AB1190A2466C0: r"SB_AWD\120_149\ITALIAN\PS2_0134.awd",
+    0x347CC102C278A176: r"ANIMGRPS\Lvl_35\Lvl_35A.ads",
+    0x347D18720A9E1532: r"AUDIO\GERMAN\PS2_1s2.rws",
+    0x34863209FFB2842C: r"SB_AGD\150_179\GERMAN\PS2_0158.agd",
+    0x34898487BE846670: r"LEVELS\MP_2\SECTIONS\s_9.rws",
+    0x34960CA4290A7BBA: r"SB_AGD\60_89\ENGLISH\NGC_0063.agd",
+    0x34A05C2BC046F215: r"SB_AGD\60_89\GERMAN\PS2_0070.agd",
+    0x34A9DB23406C5A4D: r"SB_AWD\150_179\GERMAN\PS2_0155.awd",
+    0x34B4D005B161A923: r"SB_AWD\180_209\ENGLISH\NGC_0188.awd",
+    0x34CABDF98713AD14: r"SB_AGD\120_149\SPANISH\NGC_0135.agd",
+    0x34CB474B31A471CF: r"LOC\EN\PAUSED.LOC",
+    0x34CCCC77BFDD192E: r"SB_AWD\90_119\GERMAN\XBX_0097.awd",
+    0x34D9B4858778C671: r"SB_AGD\90_119\SPANISH\XBX_0106.agd",
+    0x34DE0D5668342AA3: r"SB_AGD\210_239\SPANISH\XBX_0219.agd",
+    0x34DF4BDA43102594: r"SB_AGD\0_29\ENGLISH\NGC_0007.agd",
+    0x34E2625EF96A44EB: r"SB_AGD\180_209\SPANISH\NGC_0188.agd",
+    0x34E2AEF37EED0E87: r"SB_AGD\90_119\FRENCH\NGC_0117.agd",
+    0x34E898B38295A168: r"SB_AWD\30_59\ENGLISH\XBX_0036.awd",
+    0x34EC72E05AD215E3: r"SB_AWD\60_89\SPANISH\NGC_0080.awd",
+    0x34EF205DA172CC6E: r"SB_AWD\30_59\FRENCH\NGC_0054.awd",
+    0x34F4F171495CB8EE: r"SB_AWD\60_89\ENGLISH\PS2_0080.awd",
+    0x350975982B3F7B9A: r"SB_AGD\30_59\SPANISH\NGC_0050.agd",
+    0x350C4AA7338EE49C: r"SB_AWD\60_89\ENGLISH\NGC_0087.awd",
+    0x350E0116179F6A73: r"SB_AGD\150_179\GERMAN\NGC_0178.agd",
+    0x3510769FE90F0B0D: r"SB_AGD\120_149\ENGLISH\NGC_0123.agd",
+    0x351D86D775892836: r"SB_AWD\150_179\FRENCH\NGC_0151.awd",
+    0x3527A4D0DE6DB287: r"SHELL\HUD\INSTANCE\gcn\hud.txd",
+    0x3529A12AB43D5BB2: r"SB_AWD\120_149\ITALIAN\PS2_0132.awd",
+    0x353BA3E8D23AC1A9: r"SB_AGD\210_239\FRENCH\NGC_0215.agd",
+    0x353CEE5EF17545E4: r"SB_AGD\0_29\ITALIAN\PS2_0020.agd",
+    0x354102E3B39E53A6: r"SB_AWD\30_59\SPANISH\XBX_0034.awd",
+    0x35412AFD0E7A8A19: r"SB_AGD\210_239\FRENCH\PS2_0214.agd",
+    0x35455CB5D32414D4: r"SB_AGD\60_89\ENGLISH\NGC_0061.agd",
+    0x3549CA269CBEDB30: r"SB_AWD\240_269\FRENCH\NGC_0258.awd",
+    0x3554FCE69C1D6D06: r"SB_AGD\90_119\FRENCH\NGC_0105.agd",
+    0x35592B34EA85F2DF: r"SB_AWD\150_179\GERMAN\PS2_0153.awd",
+    0x355BDAD8F2E464E8: r"SB_AWD\0_29\FRENCH\XBX_0023.awd",
+    0x356990224E27C55E: r"AUDIO\FRENCH\XBX_1m3.rws",
+    0x356C76041EBA4573: r"AUDIO\ITALIAN\XBX_4m3.rws",
+    0x356D5ADEE9632371: r"AUDIO\SPANISH\NGC_4m3.rws",
+    0x356F686E74599A36: r"SB_AGD\150_179\ITALIAN\PS2_0169.agd",
+    0x357BBC8969F60E98: r"SB_AWD\90_119\GERMAN\XBX_0095.awd",
+    0x357E85D7C2669E04: r"SB_AGD\120_149\GERMAN\XBX_0122.agd",
+    0x3581E1F3D071A1D9: r"SHELL\FONTS\mlta26.png",
+    0x35922FE186C4E3A9: r"SB_AWD\240_269\GERMAN\XBX_0246.awd",
+    0x3598723C2AFCC716: r"SB_AGD\180_209\GERMAN\NGC_0181.agd",
+    0x35A7C5E8509DC3D5: r"SB_AWD\210_239\ENGLISH\PS2_0225.awd",
+    0x35BAC32E76B138F4: r"SHELL\MOVIES\capcom.bik",
+    0x35BB4AB8DDA7F53E: r"SB_AWD\60_89\ENGLISH\NGC_0089.awd",
+    0x35BCB71CAE5DD084: r"SB_AWD\0_29\FRENCH\NGC_0007.awd",
+    0x35BEAC6BE5E714A2: r"SB_AWD\90_119\FRENCH\NGC_0093.awd",
+    0x35CB55A6F9F1C4BD: r"SB_AWD\210_239\GERMAN\NGC_0222.awd",
+    0x35D0DAECBBC88974: r"SB_AGD\150_179\ITALIAN\NGC_0157.agd",
+    0x35D45221BFDBD9CA: r"SB_AGD\90_119\ITALIAN\PS2_0102.agd",
+    0x35EA0FCDDE60BD10: r"SB_AWD\180_209\SPANISH\XBX_0206.awd",
+    0x35EA342727CB0F5A: r"SB_AGD\30_59\FRENCH\PS2_0037.agd",
+    0x35F711E575C68A27: r"SB_AGD\30_59\FRENCH\PS2_0058.agd",
+    0x35F7651D8AC6672E: r"SB_AGD\30_59\FRENCH\NGC_0054.agd",
+    0x35FF0822CCD352DE: r"SB_AWD\150_179\ITALIAN\XBX_0171.awd",
+    0x36023B7635728E1C: r"SB_AGD\210_239\SPANISH\XBX_0230.agd",
+    0x36049583D2BB728D: r"SB_AGD\150_179\ENGLISH\NGC_0178.agd",
+    0x360D49C38965ADAD: r"SB_AWD\150_179\FRENCH\PS2_0153.awd",
+    0x3611813E07CCC8A0: r"SB_AGD\90_119\ENGLISH\NGC_0097.agd",
+    0x363C4D42A7830CA6: r"LEVELS\L_1_3_B\SECTIONS\s_6.rws",
+    0x364386DAC1764580: r"SB_AGD\150_179\SPANISH\NGC_0179.agd",
+    0x3648D1D78131974D: r"SB_AWD\210_239\SPANISH\XBX_0222.awd",
+    0x364C7929D27B6A04: r"ANIMGRPS\Lvl_21\Lvl_21A.ads",
+    0x365347C2C8C5475D: r"SB_AGD\240_269\ENGLISH\PS2_0250.agd",
+    0x365788C8972A5C0C: r"SB_AWD\120_149\SPANISH\PS2_0127.awd",
+    0x365BE1AC47DCC5D0: r"SB_AWD\180_209\FRENCH\XBX_0208.awd",
+    0x365C97529FCAFB33: r"SB_AGD\90_119\GERMAN\NGC_0090.agd",
+    0x366916F40A002BF6: r"SB_AWD\60_89\ITALIAN\NGC_0089.awd",
+    0x366E5859D8ADAA86: r"SB_AGD\210_239\SPANISH\NGC_0212.agd",
+    0x366FE98A37FEC9BD: r"SB_AWD\30_59\ITALIAN\XBX_0042.awd",
+    0x367854A4F9F9791B: r"ANIMGRPS\Lvl_12\Lvl_12V.ads",
+    0x3678AE10A61704B1: r"LEVELS\L_2_2\level.dff",
+    0x367C4EABE5B7285B: r"SB_AGD\180_209\SPANISH\XBX_0186.agd",
+    0x3681B4F097DF89A7: r"SB_AWD\30_59\SPANISH\XBX_0044.awd",
+    0x368AC6EC5BD4E229: r"SB_AWD\0_29\GERMAN\PS2_0023.awd",
+    0x369331191F5BDB0A: r"SB_AWD\240_269\ENGLISH\XBX_0254.awd",
+    0x3697E4A763552183: r"SB_AGD\120_149\FRENCH\NGC_0129.agd",
+    0x36A138A46F1EC794: r"ANIMGRPS\Lvl_21\Lvl_21Q.ads",
+    0x36A7D725261A8667: r"LEVELS\L_3_1_C\SECTIONS\s_4.rws",
+    0x36A94E99B18C56E1: r"SB_AGD\120_149\ITALIAN\XBX_0121.agd",
+    0x36AE2686112A0CC6: r"SB_AWD\150_179\ENGLISH\NGC_0160.awd",
+    0x36B01A7B589AD037: r"SB_AGD\150_179\ITALIAN\PS2_0173.agd",
+    0x36B81BA28155ABB8: r"SB_AGD\90_119\GERMAN\XBX_0095.agd",
+    0x36BF95B332A6712A: r"SB_AGD\30_59\SPANISH\NGC_0043.agd",
+    0x36C37D10A6569D7D: r"LEVELS\L_2_2\level.rws",
+    0x36D5C01A5375C1DA: r"SHELL\FEND\INSTANCE\XBOX\slideshw.txd",
+    0x36D81ABB9CE9F93A: r"SB_AGD\180_209\ITALIAN\XBX_0198.agd",
+    0x36F4838E345F0D2C: r"LEVELS\L_1_3_A\SECTIONS\s_14.rws",
+    0x36F821E92B4B2FDF: r"SB_AWD\210_239\SPANISH\XBX_0224.awd",
+    0x3704FF2F826DDEE6: r"SB_AGD\180_209\SPANISH\PS2_0188.agd",
+    0x37168123D9ECE670: r"SB_AGD\0_29\ENGLISH\XBX_0012.agd",
+    0x3720E0549CBD6703: r"SB_AGD\150_179\GERMAN\XBX_0154.agd",
+    0x372B1EBD8FCFE775: r"SB_AGD\180_209\SPANISH\XBX_0184.agd",
+    0x372DAC259B69A00C: r"SB_AGD\120_149\FRENCH\PS2_0130.agd",
+    0x37323F5FBDB64DFC: r"SB_AWD\150_179\GERMAN\XBX_0171.awd",
+    0x37451F6B272A5608: r"SB_AGD\150_179\GERMAN\NGC_0151.agd",
+    0x374569E55B44217A: r"SB_AWD\30_59\ITALIAN\NGC_0032.awd",
+    0x3746834E6B9E8355: r"SB_AGD\120_149\ENGLISH\PS2_0122.agd",
+    0x374EB2421B4532B3: r"SB_AWD\60_89\SPANISH\PS2_0063.awd",
+    0x37506A580A376E94: r"SB_AGD\60_89\FRENCH\PS2_0086.agd",
+    0x376000CEC2C1BAEB: r"SB_AWD\120_149\ITALIAN\XBX_0138.awd",
+    0x3766A16E8E852B9C: r"SB_AGD\180_209\SPANISH\XBX_0202.agd",
+    0x376C16C3E393F46B: r"ANIMGRPS\Lvl_13\Lvl_13T.ads",
+    0x376E65C4DCBF30C4: r"SB_AGD\30_59\SPANISH\NGC_0041.agd",
+    0x3777EE6A9BD47AB4: r"SB_AGD\60_89\GERMAN\PS2_0084.agd",
+    0x3788EEBFDC287AA9: r"SB_AGD\150_179\SPANISH\XBX_0154.agd",
+    0x378EF107EB3C7B95: r"SB_AGD\240_269\ENGLISH\NGC_0251.agd",
+    0x379632FE0109630D: r"SB_AWD\0_29\ENGLISH\XBX_0022.awd",
+    0x379DC3E98526322E: r"LOC\EN\GLOBAL.TXT",
+    0x379E5544C4022485: r"SB_AWD\210_239\ENGLISH\XBX_0235.awd",
+    0x37A9E4CB4D6D834D: r"SB_AWD\90_119\ITALIAN\XBX_0098.awd",
+    0x37B369283DE497B8: r"SB_AGD\0_29\GERMAN\NGC_0027.agd",
+    0x37B7CCF847A97390: r"SB_AGD\90_119\FRENCH\NGC_0107.agd",
+    0x37B972AC2A9EFDEC: r"SB_AGD\120_149\FRENCH\NGC_0135.agd",
+    0x37C0D63E803751FB: r"ANIMGRPS\Lvl_13\Lvl_13D.ads",
+    0x37C551358405A502: r"SB_AGD\0_29\ENGLISH\XBX_0014.agd",
+    0x37D6952A5EC7B00B: r"ANIMGRPS\Lvl_12\Lvl_12F.ads",
+    0x37D70A416B655541: r"ANIMGRPS\Lvl_31\Lvl_31R.ads",
+    0x37DA9EEB6E0C950B: r"SB_AGD\240_269\GERMAN\XBX_0262.agd",
+    0x37DFA81EAE6B7B22: r"SB_AGD\60_89\SPANISH\PS2_0079.agd",
+    0x37EE46ECF991A2A9: r"SB_AGD\210_239\FRENCH\PS2_0221.agd",
+    0x37EFAEE9856C18B0: r"LOC\EN\GLOBAL.LOC",
+    0x37F43F5AB5BFA67D: r"SB_AGD\120_149\FRENCH\XBX_0132.agd",
+    0x37F459F7055D16F4: r"SB_AWD\30_59\ITALIAN\NGC_0030.awd",
+    0x37F6536015B8F567: r"SB_AGD\120_149\ENGLISH\PS2_0124.agd",
+    0x37FECA6E509B6AD2: r"CodBack_ServerList.dds",
+    0x380E4E5C92B3FCDB: r"SHELL\FEND\INSTANCE\XBOX\mc.csv",
+    0x3810176352124381: r"SHELL\FEND\INSTANCE\XBOX\LDBANNER.TXD",
+    0x38132B4ACBB33543: r"SB_AWD\120_149\FRENCH\PS2_0120.awd",
+    0x381378FF612FD727: r"SB_AWD\150_179\FRENCH\NGC_0154.awd",
+    0x381A74BB5B806CB0: r"ANIMGRPS\Lvl_34\Lvl_34Q.ads",
+    0x3820C25A91E9A396: r"SB_AWD\60_89\ITALIAN\XBX_0083.awd",
+    0x382288097BC307DC: r"SB_AWD\90_119\FRENCH\XBX_0093.awd",
+    0x382CC9BC080A65D1: r"ANIMGRPS\Lvl_31\Lvl_31B.ads",
+    0x3834B66E50C8D7B1: r"CodBack_ServerList.txd",
+    0x383B14DE52014E61: r"SB_AGD\150_179\FRENCH\NGC_0156.agd",
+    0x38432400CA7C1BA4: r"LEVELS\L_1_2\SECTIONS\s_6.rws",
+    0x3848313426C0E73A: r"SB_AWD\240_269\ENGLISH\XBX_0247.awd",
+    0x384A2A13BD6C4E79: r"SHELL\MOVIES\SPANISH\Act_1.bik",
+    0x384C3FDF89EBB442: r"SB_AWD\180_209\SPANISH\XBX_0200.awd",
+    0x384D0868D81F8FB6: r"SB_AGD\180_209\ENGLISH\NGC_0202.agd",
+    0x384E05566E1C6037: r"SB_AWD\210_239\ENGLISH\XBX_0233.awd",
+    0x38516493482629E9: r"AUDIO\GERMAN\NGC_2m3.rws",
+    0x38673776DAF3E25F: r"SB_AWD\30_59\ITALIAN\NGC_0059.awd",
+    0x38677FF931777F88: r"SB_AGD\0_29\FRENCH\PS2_0019.agd",
+    0x38685E3E532FAF10: r"SB_AWD\90_119\ITALIAN\NGC_0109.awd",
+    0x386F05A4C64108CF: r"SB_AWD\210_239\GERMAN\PS2_0229.awd",
+    0x3873D14FB357F5B2: r"SB_AGD\90_119\ENGLISH\NGC_0091.agd",
+    0x3875C791DCC5E898: r"ANIMGRPS\Lvl_25\Lvl_25U.ads",
+    0x387CD25C82C87755: r"SHELL\LOAD\MP_10_SD.txd",
+    0x387D03ED195A5F46: r"SB_AWD\210_239\ENGLISH\PS2_0239.awd",
+    0x387F11361BDFF697: r"SB_AGD\180_209\ITALIAN\XBX_0201.agd",
+    0x389BA5CEAEB76158: r"SB_AGD\60_89\SPANISH\XBX_0070.agd",
+    0x38B4CA30768885A0: r"SB_AGD\210_239\GERMAN\NGC_0212.agd",
+    0x38B52C3D6D42DA27: r"SB_AGD\60_89\GERMAN\PS2_0076.agd",
+    0x38B7B55FE933A113: r"LEVELS\L_3_5_C\SECTIONS\s_4.rws",
+    0x38C672F59E69CE1E: r"SB_AGD\90_119\SPANISH\XBX_0116.agd",
+    0x38C955591DEE9E2F: r"LEVELS\L_3_1\GodData.dff",
+    0x38CBC58686BA53C6: r"LEVELS\L_3_5\SECTIONS\s_12.rws",
+    0x38D027E13D65EB02: r"LEVELS\MP_5\SECTIONS\s_2.rws",
+    0x38D11E3C9C6479C1: r"SB_AGD\150_179\ENGLISH\PS2_0157.agd",
+    0x38D1286B8439B110: r"SB_AGD\210_239\SPANISH\NGC_0210.agd",
+    0x38D1E835AF7A409B: r"SB_AGD\210_239\GERMAN\NGC_0237.agd",
+    0x38E0EA4CAF06561B: r"SB_AWD\30_59\ENGLISH\XBX_0048.awd",
+    0x38E21695C1F6832D: r"SB_AGD\30_59\GERMAN\XBX_0031.agd",
+    0x38F47EA7BA40C600: r"SB_AWD\180_209\ENGLISH\PS2_0182.awd",
+    0x38FC587A823928C0: r"SB_AGD\180_209\ENGLISH\NGC_0200.agd",
+    0x3904F25D22AC5EA3: r"SB_AWD\60_89\SPANISH\PS2_0074.awd",
+    0x3905106F4E709DD8: r"SB_AWD\30_59\FRENCH\NGC_0056.awd",
+    0x390AE182F65A8A58: r"SB_AWD\60_89\ENGLISH\PS2_0082.awd",
+    0x391E707E7A0D86F1: r"SB_AGD\150_179\SPANISH\PS2_0166.agd",
+    0x39217D4FBE8E4EB9: r"SB_AWD\180_209\FRENCH\PS2_0196.awd",
+    0x39229DF5FC664B1A: r"AUDIO\FRENCH\PS2_1m2.rws",
+    0x39251BA386DF887A: r"ANIMGRPS\Lvl_25\Lvl_25W.ads",
+    0x392D2F6159F80805: r"SB_AWD\90_119\FRENCH\XBX_0113.awd",
+    0x393014B7FB9B45FB: r"SB_AWD\150_179\ENGLISH\NGC_0158.awd",
+    0x393621F36CB59A7E: r"SB_AWD\120_149\SPANISH\NGC_0133.awd",
+    0x393AE09982C9DDF0: r"ANIMGRPS\Lvl_23\Lvl_23M.ads",
+    0x393D8AE84E6A87E4: r"SB_AGD\180_209\ITALIAN\XBX_0189.agd",
+    0x395576A4A231AECB: r"SB_AWD\150_179\ITALIAN\PS2_0151.awd",
+    0x395652F5609B1530: r"SB_AWD\30_59\SPANISH\XBX_0036.awd",
+    0x39656524722800F9: r"AUDIO\ENGLISH\PS2_2m2.rws",
+    0x3970928FD597B81D: r"SB_AGD\120_149\ENGLISH\NGC_0130.agd",
+    0x3971FE87418B9B71: r"SB_AWD\180_209\ITALIAN\XBX_0203.awd",
+    0x397B71508B6C9A92: r"SB_AGD\0_29\ENGLISH\XBX_0007.agd",
+    0x397DCF977A8A8EF9: r"SB_AGD\180_209\ITALIAN\PS2_0194.agd",
+    0x397FEE4E467D38D3: r"SB_AGD\150_179\ENGLISH\PS2_0159.agd",
+    0x3990B39A3023EB58: r"SB_AGD\90_119\GERMAN\PS2_0117.agd",
+    0x3990E6A76C0F423F: r"SB_AGD\30_59\GERMAN\XBX_0037.agd",
+    0x39A2F598ED022EC1: r"SB_AWD\120_149\FRENCH\NGC_0134.awd",
+    0x39A5A2870FCB15AC: r"SB_AGD\60_89\FRENCH\NGC_0087.agd",
+    0x39B3EE3F272E5E00: r"SB_AWD\90_119\GERMAN\NGC_0116.awd",
+    0x39B51825DC95A893: r"SB_AGD\240_269\ITALIAN\XBX_0242.agd",
+    0x39B74F1E6EFCE1B6: r"SB_AWD\210_239\ENGLISH\XBX_0229.awd",
+    0x39BDB5F9FD9B9547: r"SB_AWD\210_239\ENGLISH\PS2_0223.awd",
+    0x39C1F6775526836E: r"AUDIO\ITALIAN\XBX_2s2.rws",
+    0x39D38E68CBECDF1E: r"SB_AWD\210_239\SPANISH\NGC_0227.awd",
+    0x39DCDF73041243B7: r"SB_AWD\90_119\FRENCH\XBX_0115.awd",
+    0x39E125B8A6EF604F: r"SB_AWD\210_239\GERMAN\NGC_0224.awd",
+    0x39E215456BCBBBDC: r"SB_AGD\60_89\GERMAN\XBX_0072.agd",
+    0x39ECB6613AA0F5FA: r"LEVELS\L_1_2\SECTIONS\s_22.rws",
+    0x39F9AA0D2DCFB931: r"SB_AGD\90_119\FRENCH\NGC_0090.agd",
+    0x3A07CB56C5E1AF8A: r"SB_AWD\240_269\ITALIAN\NGC_0249.awd",
+    0x3A0C352F37C24F38: r"SB_AGD\30_59\FRENCH\NGC_0056.agd",
+    0x3A0CD9241126E821: r"SB_AGD\30_59\GERMAN\NGC_0046.agd",
+    0x3A13B83479CF0408: r"SB_AWD\150_179\ITALIAN\XBX_0173.awd",
+    0x3A1FCA6C8082F9A2: r"SB_AGD\90_119\FRENCH\XBX_0091.agd",
+    0x3A1FE2A17FB150AF: r"SB_AGD\120_149\ENGLISH\NGC_0136.agd",
+    0x3A2312522AC0CF0A: r"SB_AWD\210_239\ITALIAN\PS2_0217.awd",
+    0x3A24C4F207594112: r"SB_AWD\180_209\GERMAN\NGC_0185.awd",
+    0x3A2B13147031EAA2: r"SB_AWD\210_239\ENGLISH\XBX_0214.awd",
+    0x3A31103F111AC50C: r"SB_AGD\30_59\ITALIAN\PS2_0044.agd",
+    0x3A3C6EFD1996E8A5: r"SB_AGD\240_269\GERMAN\XBX_0260.agd",
+    0x3A4568B7F3351A0C: r"SB_AGD\210_239\GERMAN\XBX_0225.agd",
+    0x3A551F0776D0D972: r"SB_AWD\60_89\ENGLISH\NGC_0078.awd",
+    0x3A5D7CC4A4E3EB0A: r"SB_AGD\150_179\SPANISH\XBX_0162.agd",
+    0x3A6465F33068751F: r"SB_AGD\0_29\SPANISH\XBX_0006.agd",
+    0x3A6897D475C208EF: r"SB_AGD\240_269\ENGLISH\PS2_0256.agd",
+    0x3A7138F867ED316C: r"SB_AWD\210_239\FRENCH\XBX_0227.awd",
+    0x3A72B333618D13FE: r"SB_AGD\150_179\FRENCH\NGC_0173.agd",
+    0x3A74013D02415913: r"SB_AWD\180_209\ENGLISH\XBX_0186.awd",
+    0x3A74622F37254708: r"ANIMGRPS\Lvl_14\Lvl_14E.ads",
+    0x3A77EAD4088A893C: r"SB_AGD\150_179\FRENCH\XBX_0168.agd",
+    0x3A82926C3D73F720: r"SB_AWD\60_89\ITALIAN\XBX_0081.awd",
+    0x3A833E7A76071B48: r"SB_AWD\210_239\SPANISH\NGC_0225.awd",
+    0x3A85B99BE4FC654F: r"SB_AWD\30_59\ITALIAN\XBX_0044.awd",
+    0x3A85CDE8D02AF7EB: r"SB_AGD\30_59\ENGLISH\NGC_0055.agd",
+    0x3A87542AC7B344ED: r"gui_map2_destroy.txd",
+    0x3A92685C74D9C441: r"LEVELS\L_1_2\SECTIONS\s_14.rws",
+    0x3A9DC6E958EFB4CC: r"SB_AGD\120_149\ITALIAN\PS2_0130.agd",
+    0x3AA3A5F8B4856095: r"SB_AGD\60_89\ENGLISH\XBX_0071.agd",
+    0x3AB3331F5CC4F6A2: r"SB_AGD\60_89\ITALIAN\PS2_0084.agd",
+    0x3AB3569D17004D22: r"SB_AGD\150_179\SPANISH\NGC_0155.agd",
+    0x3ABAC8958F0D1CCB: r"SB_AWD\30_59\SPANISH\NGC_0037.awd",
+    0x3ABCB0C07A474453: r"SB_AWD\120_149\SPANISH\XBX_0127.awd",
+    0x3ABE302AC7E249BE: r"gui_map2_destroy.dds",
+    0x3AC298462F2A9D4D: r"WPNBANK\0_25\wbank_10.bin",
+    0x3AC562DBCE80B5D3: r"w_NetworkConfigBKG.dds",
+    0x3ACC4D5454E85580: r"LEVELS\L_1_3_B\SECTIONS\s_4.rws",
+    0x3AD0D4CE0730711C: r"SB_AWD\30_59\GERMAN\NGC_0032.awd",
+    0x3AD385D177BFFE99: r"SB_AWD\210_239\GERMAN\PS2_0238.awd",
+    0x3AD5CD39AFEAF2BB: r"SB_AWD\90_119\FRENCH\PS2_0116.awd",
+    0x3AE91792E6CE676F: r"SB_AWD\240_269\SPANISH\NGC_0240.awd",
+    0x3AEA4D206E398301: r"SB_AWD\0_29\GERMAN\XBX_0019.awd",
+    0x3AFBBEDBCEAEE100: r"w_NetworkConfigBKG.txd",
+    0x3AFDB67B35C11154: r"SB_AGD\30_59\ITALIAN\NGC_0049.agd",
+    0x3B0B605B8E90C4BC: r"SB_AGD\240_269\FRENCH\XBX_0256.agd",
+    0x3B140B822578CBED: r"SB_AWD\0_29\SPANISH\PS2_0010.awd",
+    0x3B14BD431DFEB976: r"SB_AGD\120_149\ENGLISH\PS2_0147.agd",
+    0x3B171A422213B2B2: r"SB_AGD\210_239\GERMAN\NGC_0214.agd",
+    0x3B19A03F33B02C55: r"SB_AGD\240_269\ENGLISH\XBX_0262.agd",
+    0x3B1BCA6976CF5379: r"SB_AWD\60_89\FRENCH\XBX_0084.awd",
+    0x3B1C199CF0A6A5D5: r"SB_AGD\180_209\FRENCH\NGC_0180.agd",
+    0x3B1F489ED1C7F881: r"AUDIO\SPANISH\NGC_1m2.rws",
+    0x3B20F90A1207884E: r"SB_AWD\210_239\FRENCH\XBX_0229.awd",
+    0x3B27CAE5B2A516FE: r"SB_AGD\150_179\FRENCH\XBX_0166.agd",
+    0x3B36B338F21FDEEF: r"SB_AWD\210_239\FRENCH\NGC_0217.awd",
+    0x3B378736D37F4771: r"LEVELS\L_3_1_C\SECTIONS\s_6.rws",
+    0x3B39B1D1188C22DB: r"SB_AWD\240_269\ENGLISH\NGC_0253.awd",
+    0x3B44AD9E1B673D7F: r"SB_AWD\150_179\FRENCH\NGC_0165.awd",
+    0x3B46293B04F2C536: r"SB_AWD\90_119\FRENCH\XBX_0103.awd",
+    0x3B5A254C50D68FC4: r"SB_AWD\120_149\FRENCH\XBX_0142.awd",
+    0x3B65F0683FB2FF21: r"SB_AWD\210_239\GERMAN\XBX_0224.awd",
+    0x3B6D20F14E455F1C: r"SB_AWD\240_269\GERMAN\PS2_0244.awd",
+    0x3B75A67B8AC59222: r"SB_AGD\240_269\SPANISH\NGC_0249.agd",
+    0x3B7D98F6516D7128: r"SB_AWD\60_89\ITALIAN\PS2_0060.awd",
+    0x3B80EAD5908FE345: r"ANIMGRPS\Lvl_13\Lvl_13R.ads",
+    0x3B82BA3D3E37F9ED: r"SB_AGD\60_89\SPANISH\PS2_0061.agd",
+    0x3B95A16C457D70A4: r"SB_AWD\210_239\ITALIAN\NGC_0229.awd",
+    0x3B9DB03C7F101291: r"SB_AGD\180_209\GERMAN\NGC_0205.agd",
+    0x3BA1F3F4CF901798: r"ANIMGRPS\Lvl_16\Lvl_16Y.ads",
+    0x3BA3C119983863A7: r"SB_AGD\240_269\ENGLISH\NGC_0257.agd",
+    0x3BA5AD7578293D52: r"SHELL\LOAD\MP_2_SD.txd",
+    0x3BAB830FAE06249F: r"SB_AWD\0_29\ENGLISH\XBX_0024.awd",
+    0x3BBB406D38AB527E: r"SB_AGD\240_269\FRENCH\XBX_0258.agd",
+    0x3BBFD6EF00201A3B: r"SB_AGD\90_119\ENGLISH\PS2_0118.agd",
+    0x3BC0A2F27EF6D250: r"SB_AWD\150_179\SPANISH\NGC_0153.awd",
+    0x3BC97050DDCA9E67: r"SB_AGD\240_269\ENGLISH\XBX_0264.agd",
+    0x3BCBE9AE9AC117E7: r"SB_AGD\180_209\FRENCH\NGC_0186.agd",
+    0x3BCC0ACC38B7F8B1: r"SB_AGD\90_119\GERMAN\NGC_0100.agd",
+    0x3BCCED18EEC25005: r"SB_AWD\120_149\GERMAN\NGC_0132.awd",
+    0x3BD0EDC3E76D2C2C: r"SB_AGD\90_119\ENGLISH\PS2_0092.agd",
+    0x3BD6AA502D34F3D5: r"ANIMGRPS\Lvl_13\Lvl_13B.ads",
+    0x3BD8126D3225DB3A: r"SB_AWD\210_239\ITALIAN\PS2_0222.awd",
+    0x3BDCDA44F0BEE5DE: r"SB_AWD\90_119\SPANISH\XBX_0116.awd",
+    0x3BDD83320CFFFC64: r"SB_AGD\120_149\SPANISH\PS2_0149.agd",
+    0x3BEC5EABACC707AA: r"SB_AWD\120_149\ENGLISH\NGC_0124.awd",
+    0x3BECD6531862E90B: r"ANIMGRPS\Lvl_31\Lvl_31P.ads",
+    0x3BF2F13C9AED9991: r"SB_AWD\30_59\ENGLISH\PS2_0034.awd",
+    0x3C04C65A8721D4C0: r"SB_AWD\30_59\ITALIAN\PS2_0031.awd",
+    0x3C1D834998EAB3A1: r"SB_AGD\180_209\FRENCH\XBX_0191.agd",
+    0x3C28C2CDC2ED9DE6: r"SB_AGD\150_179\ITALIAN\XBX_0153.agd",
+    0x3C2B07C0C7742DED: r"SB_AGD\30_59\ITALIAN\XBX_0037.agd",
+    0x3C359F9AA225C908: r"LOC\IT\EULA.LOC",
+    0x3C39420B58D8BEB7: r"ANIMGRPS\Lvl_26\Lvl_26P.ads",
+    0x3C3AF9B6EC61DDBF: r"SB_AWD\30_59\ITALIAN\XBX_0031.awd",
+    0x3C457451DEEFB61C: r"SB_AWD\150_179\SPANISH\PS2_0178.awd",
+    0x3C4E583EBF1E081D: r"SB_AGD\180_209\FRENCH\XBX_0201.agd",
+    0x3C5DE5F7987D9340: r"LOC\SP\HUD.LOC",
+    0x3C5E2145D3BEB8B4: r"SB_AWD\240_269\ENGLISH\XBX_0245.awd",
+    0x3C674D7DD0622BD1: r"SB_AWD\240_269\ITALIAN\XBX_0266.awd",
+    0x3C6A45A0B8313251: r"LEVELS\L_3_5_C\SECTIONS\s_22.rws",
+    0x3C77B861368FDFDD: r"WPNBANK\0_25\wbank_03.bin",
+    0x3C7C9D2A98DC8BB7: r"SB_AWD\120_149\GERMAN\NGC_0134.awd",
+    0x3C82797C1937EB87: r"SB_AGD\210_239\FRENCH\XBX_0224.agd",
+    0x3C8686B6C46BEFF8: r"w_gamespy.txd",
+    0x3C91D45CFC583583: r"SB_AGD\240_269\FRENCH\NGC_0253.agd",
+    0x3C9356389AB7FEDB: r"SB_AGD\30_59\ITALIAN\PS2_0032.agd",
+    0x3CABBD8CF3D524EF: r"WPNBANK\26_50\wbank_32.bin",
+    0x3CAFA0155F90EF96: r"SB_AWD\240_269\SPANISH\PS2_0266.awd",
+    0x3CB3B66C313AC9B2: r"SB_AWD\30_59\ITALIAN\PS2_0037.awd",
+    0x3CB3C61252653A61: r"SB_AGD\240_269\ITALIAN\NGC_0242.agd",
+    0x3CB497DAEE7B4484: r"SB_AWD\150_179\FRENCH\PS2_0156.awd",
+    0x3CBA406E8D14ECED: r"SB_AWD\90_119\ITALIAN\NGC_0113.awd",
+    0x3CBCDAB6C49A0DBB: r"w_gamespy.dds",
+    0x3CBE3CDAEA9225AE: r"SB_AGD\150_179\FRENCH\PS2_0176.agd",
+    0x3CC091D53378932E: r"SB_AGD\120_149\SPANISH\NGC_0120.agd",
+    0x3CC673D2CDD17FBC: r"SB_AGD\180_209\ENGLISH\NGC_0198.agd",
+    0x3CC74604DBF49759: r"SB_AGD\0_29\SPANISH\XBX_0004.agd",
+    0x3CCF6F5C36CFE280: r"SB_AGD\180_209\SPANISH\PS2_0199.agd",
+    0x3CDC43074B676928: r"SB_AGD\90_119\SPANISH\XBX_0114.agd",
+    0x3CE1FB51670E2093: r"SB_AWD\240_269\ITALIAN\PS2_0252.awd",
+    0x3CE7B8475C77DBB5: r"SB_AGD\210_239\GERMAN\NGC_0235.agd",
+    0x3CE80AF8B58F8B71: r"SB_AWD\0_29\GERMAN\NGC_0013.awd",
+    0x3CEA39C8967B5B19: r"SB_AWD\30_59\ITALIAN\XBX_0033.awd",
+    0x3CEF2947FD8C6DFB: r"SB_AGD\210_239\ENGLISH\PS2_0227.agd",
+    0x3CF2822F1C4B265E: r"LEVELS\L_3_5_B\SECTIONS\s_6.rws",
+    0x3CF474638908C6BE: r"SB_AWD\150_179\SPANISH\PS2_0176.awd",
+    0x3CF92C524FCD72DE: r"SB_AGD\120_149\FRENCH\PS2_0121.agd",
+    0x3CFDA8506937A0AF: r"SB_AGD\180_209\FRENCH\XBX_0207.agd",
+    0x3D0247160A6EAA9E: r"SB_AGD\120_149\ITALIAN\PS2_0121.agd",
+    0x3D0A6EB9673E97F2: r"SB_AWD\180_209\ENGLISH\PS2_0184.awd",
+    0x3D0B2EEE90FE8E9E: r"SB_AGD\150_179\SPANISH\PS2_0176.agd",
+    0x3D0D0AE19918E526: r"SB_AGD\240_269\ENGLISH\NGC_0245.agd",
+    0x3D0F85579C44E265: r"SB_AWD\150_179\SPANISH\XBX_0158.awd",
+    0x3D10141B6DD19A6D: r"SB_AWD\210_239\ITALIAN\XBX_0235.awd",
+    0x3D15CA5788BE5451: r"SB_AGD\120_149\FRENCH\PS2_0148.agd",
+    0x3D1DAFC5F040C7E2: r"AUDIO\SPANISH\NGC_2m2.rws",
+    0x3D1FD78200036062: r"SB_AGD\120_149\ITALIAN\NGC_0124.agd",
+    0x3D1FE51B43613F11: r"SB_AGD\120_149\ITALIAN\PS2_0148.agd",
+    0x3D34A472E0B50BDB: r"WPNBANK\0_25\wbank_01.bin",
+    0x3D34E11C7AA3913C: r"SB_AGD\210_239\ITALIAN\PS2_0237.agd",
+    0x3D42264A44D0BDF5: r"SB_AGD\30_59\ITALIAN\PS2_0030.agd",
+    0x3D4236AF4890B506: r"SB_AGD\0_29\FRENCH\XBX_0029.agd",
+    0x3D4BE1874CE49C94: r"SB_AWD\210_239\ITALIAN\NGC_0214.awd",
+    0x3D4C17A4925ABF09: r"SB_AWD\240_269\SPANISH\NGC_0242.awd",
+    0x3D6B46B64F2F49E5: r"SB_AWD\150_179\ITALIAN\PS2_0153.awd",
+    0x3D6FF5370CCF2492: r"SB_AWD\180_209\ENGLISH\XBX_0208.awd",
+    0x3D7653E477EC0D7E: r"SB_AGD\180_209\ENGLISH\NGC_0196.agd",
+    0x3D8D9CA08DB38FAD: r"SB_AGD\60_89\ITALIAN\XBX_0088.agd",
+    0x3D99B34A9DAC3689: r"SB_AWD\210_239\FRENCH\NGC_0215.awd",
+    0x3D9B81E2C4167675: r"SB_AWD\240_269\ENGLISH\NGC_0251.awd",
+    0x3DA7FC63F9E631E8: r"SB_AGD\120_149\FRENCH\PS2_0123.agd",
+    0x3DACDB1563FD7B4D: r"SB_AGD\90_119\GERMAN\PS2_0093.agd",
+    0x3DB12EEB5693E6EF: r"SB_AWD\240_269\ENGLISH\PS2_0256.awd",
+    0x3DB55EF79855A081: r"SB_AGD\0_29\GERMAN\XBX_0019.agd",
+    0x3DB7CB06E2F34891: r"SB_AGD\0_29\SPANISH\NGC_0019.agd",
+    0x3DB9555BA26D6C4C: r"SB_AGD\120_149\GERMAN\XBX_0140.agd",
+    0x3DBF4E6E1AD704E0: r"WPNBANK\0_25\wbank_15.bin",
+    0x3DC51A6932D7ECE3: r"SB_AGD\120_149\FRENCH\PS2_0146.agd",
+    0x3DC9DE50D42C2FF2: r"SB_AWD\90_119\GERMAN\NGC_0110.awd",
+    0x3DCA08C787CABFD1: r"SB_AWD\0_29\FRENCH\NGC_0011.awd",
+    0x3DCD685FB3FD98CC: r"SB_AWD\60_89\GERMAN\XBX_0061.awd",
+    0x3DD2E998E3CE14D6: r"SB_AGD\150_179\ENGLISH\XBX_0153.agd",
+    0x3DD3D2EAA7874DD5: r"SB_AWD\90_119\SPANISH\XBX_0090.awd",
+    0x3DD7B2CE80A7F60D: r"LOC\IT\PAUSED.LOC",
+    0x3DDBB02C7F12DCC4: r"SB_AGD\210_239\SPANISH\PS2_0228.agd",
+    0x3DDDE2E8CA52E076: r"SB_AGD\150_179\ITALIAN\XBX_0166.agd",
+    0x3DE40012DB1DFCE8: r"SB_AWD\210_239\SPANISH\PS2_0219.awd",
+    0x3DE4C12E24BE1EFE: r"SB_AGD\210_239\ITALIAN\PS2_0239.agd",
+    0x3DE5E6F299BD0D36: r"SB_AWD\120_149\GERMAN\NGC_0144.awd",
+    0x3DE69E3FDFA7218C: r"SB_AWD\120_149\SPANISH\XBX_0137.awd",
+    0x3DF24C1A9912B1FD: r"SB_AGD\240_269\SPANISH\XBX_0262.agd",
+    0x3DF3371BF5AF0BF9: r"SB_AGD\210_239\ITALIAN\XBX_0231.agd",
+    0x3DFC01E5C6BAF639: r"LEVELS\L_3_1\SECTIONS\s_4.rws",
+    0x3E020C0A928AF977: r"ANIMGRPS\Lvl_11\Lvl_11H.ads",
+    0x3E0389562E57FCFC: r"SB_AWD\240_269\ITALIAN\PS2_0268.awd",
+    0x3E0C09CDA63FB93B: r"SB_AWD\150_179\ITALIAN\XBX_0167.awd",
+    0x3E119F736EB77B01: r"SB_AGD\0_29\ITALIAN\XBX_0026.agd",
+    0x3E180277FA1E37BB: r"SB_AWD\180_209\FRENCH\NGC_0182.awd",
+    0x3E1D59D9CF1E1BDE: r"SB_AGD\240_269\ITALIAN\PS2_0240.agd",
+    0x3E225D39D532AC9C: r"SB_AGD\180_209\ENGLISH\PS2_0195.agd",
+    0x3E22D3042A81C882: r"SB_AWD\150_179\SPANISH\NGC_0155.awd",
+    0x3E38516B603A9CED: r"SB_AGD\60_89\GERMAN\NGC_0084.agd",
+    0x3E39F7DF080EFD51: r"SB_AGD\240_269\ITALIAN\PS2_0269.agd",
+    0x3E3AD5D550A70201: r"SB_AWD\180_209\GERMAN\PS2_0204.awd",
+    0x3E3B8455B7D6723C: r"SB_AGD\240_269\ITALIAN\NGC_0269.agd",
+    0x3E3C1B62F0997427: r"SB_AWD\90_119\FRENCH\XBX_0106.awd",
+    0x3E3E6C8AC16DCF07: r"SB_AGD\240_269\SPANISH\PS2_0245.agd",
+    0x3E4348916F97193E: r"SB_AGD\240_269\GERMAN\NGC_0261.agd",
+    0x3E4FD5AE3FF407EC: r"SB_AGD\210_239\FRENCH\NGC_0221.agd",
+    0x3E554C70995386BE: r"SB_AWD\0_29\ENGLISH\NGC_0001.awd",
+    0x3E56CB852F2E56C7: r"ANIMGRPS\Lvl_11\Lvl_11X.ads",
+    0x3E6C511F244AFCC8: r"SB_AGD\30_59\FRENCH\NGC_0045.agd",
+    0x3E7B133270107EF7: r"SB_AGD\90_119\SPANISH\NGC_0098.agd",
+    0x3E842A948C9CAD9C: r"SB_AGD\30_59\ITALIAN\NGC_0038.agd",
+    0x3E8C290823EE9D93: r"LEVELS\L_1_5\SECTIONS\s_11.rws",
+    0x3E8F04D61C6CEE86: r"SB_AWD\150_179\ITALIAN\PS2_0176.awd",
+    0x3E90A2F5FB773F07: r"SB_AGD\210_239\GERMAN\PS2_0232.agd",
+    0x3E939DAD76DD248E: r"SB_AGD\0_29\ITALIAN\XBX_0010.agd",
+    0x3E972C2AC46443C1: r"ANIMGRPS\Lvl_15\Lvl_15V.ads",
+    0x3E9B612470DC0ABE: r"SB_AWD\90_119\GERMAN\PS2_0102.awd",
+    0x3E9BAD721AD57334: r"SB_AGD\120_149\FRENCH\XBX_0137.agd",
+    0x3E9ECBD2DFEDBA8E: r"SB_AWD\240_269\ITALIAN\XBX_0243.awd",
+    0x3EA29BA04282600A: r"SB_AWD\150_179\ENGLISH\XBX_0175.awd",
+    0x3EB0BA7DDE9E2D86: r"SB_AGD\240_269\SPANISH\PS2_0253.agd",
+    0x3EB34F350F598BB3: r"SB_AGD\180_209\ENGLISH\PS2_0189.agd",
+    0x3EB8760A618148A7: r"SB_AGD\60_89\ENGLISH\XBX_0077.agd",
+    0x3EBAFBA6E336251F: r"AUDIO\ITALIAN\NGC_2s1.rws",
+    0x3EBF6ED46EA3A3A2: r"SB_AWD\180_209\ENGLISH\PS2_0197.awd",
+    0x3EC3D96A178EB15A: r"SHELL\FEND\INSTANCE\XBOX\LDBAN_MP.TXD",
+    0x3ECC29EB7936DAE8: r"SB_AGD\240_269\ITALIAN\PS2_0242.agd",
+    0x3ED098A73C0AB7E5: r"SB_AWD\30_59\SPANISH\NGC_0035.awd",
+    0x3ED193D729F99C46: r"SB_AWD\240_269\FRENCH\XBX_0250.awd",
+    0x3EE2A21F99565F6E: r"SB_AGD\0_29\ITALIAN\PS2_0000.agd",
+    0x3EE947F0B22895E3: r"SB_AGD\240_269\ITALIAN\PS2_0267.agd",
+    0x3EEB646761F0FFFE: r"SB_AGD\240_269\ITALIAN\NGC_0267.agd",
+    0x3EECEBA561095451: r"ANIMGRPS\Lvl_15\Lvl_15F.ads",
+    0x3EF6909AD91B6696: r"LEVELS\L_2_1_B\SECTIONS\s_1.rws",
+    0x3EF952CA40DE3313: r"SB_AGD\240_269\FRENCH\XBX_0260.agd",
+    0x3F1170270B1B4320: r"SB_AWD\240_269\SPANISH\PS2_0264.awd",
+    0x3F134B55E221CC17: r"SB_AWD\240_269\SPANISH\XBX_0246.awd",
+    0x3F18B89A1A9210ED: r"SB_AGD\240_269\SPANISH\NGC_0251.agd",
+    0x3F1E94F5AE941677: r"SB_AGD\150_179\ITALIAN\XBX_0156.agd",
+    0x3F2393E95C895341: r"SB_AWD\0_29\FRENCH\PS2_0021.awd",
+    0x3F29156294702ED4: r"SB_AWD\240_269\SPANISH\NGC_0269.awd",
+    0x3F2A0D54CAFB7A80: r"SB_AGD\120_149\ENGLISH\PS2_0145.agd",
+    0x3F340D9B7CAA18A9: r"SB_AWD\150_179\ENGLISH\XBX_0169.awd",
+    0x3F34EE963A4A3B5E: r"SB_AGD\0_29\SPANISH\PS2_0000.agd",
+    0x3F398412DDDFF38D: r"LEVELS\L_1_5\CLUMPS\cbank_01.bin",
+    0x3F408FA162B1BC51: r"AUDIO\ENGLISH\PS2_1s3.rws",
+    0x3F518C9B733B1CD1: r"SB_AGD\0_29\SPANISH\PS2_0029.agd",
+    0x3F52453F380A7C9E: r"SB_AWD\90_119\GERMAN\XBX_0105.awd",
+    0x3F58A69252744E36: r"SB_AWD\60_89\ENGLISH\XBX_0072.awd",
+    0x3F59EDAFC863E3D9: r"SB_AWD\150_179\FRENCH\NGC_0167.awd",
+    0x3F79FD7B75F75944: r"AUDIO\ITALIAN\PS2_1s2.rws",
+    0x3F7EDE6BDB913BA2: r"SB_AWD\90_119\GERMAN\NGC_0103.awd",
+    0x3F9272314370D178: r"SB_AGD\0_29\ITALIAN\PS2_0002.agd",
+    0x3F92DB3CBE4F8DC6: r"SB_AWD\150_179\FRENCH\XBX_0171.awd",
+    0x3F942C78E01F6ED3: r"SB_AGD\90_119\SPANISH\NGC_0111.agd",
+    0x3F94E788A3B71AA9: r"SB_AGD\90_119\ITALIAN\XBX_0111.agd",
+    0x3F988A4EEB3594FF: r"SB_AGD\60_89\SPANISH\PS2_0067.agd",
+    0x3F9BC537E8A2AC8B: r"SB_AGD\210_239\ENGLISH\PS2_0238.agd",
+    0x3FA352224543BA17: r"SB_AWD\240_269\SPANISH\PS2_0256.awd",
+    0x3FADD1410E0373CD: r"SB_AWD\60_89\ENGLISH\NGC_0077.awd",
+    0x3FADE4A2BBC25506: r"SHELL\FONTS\cn12.met",
+    0x3FD2330F300F960A: r"SB_AWD\120_149\GERMAN\XBX_0120.awd",
+    0x3FDAE26E3A16C0E5: r"LEVELS\L_1_3_A\SECTIONS\s_4.rws",
+    0x3FE3BEA7E462FA68: r"SB_AGD\0_29\SPANISH\PS2_0002.agd",
+    0x3FEAD545081EF3A5: r"SB_AGD\90_119\GERMAN\PS2_0109.agd",
+    0x3FEE027EDF23ACB4: r"SB_AWD\210_239\ITALIAN\PS2_0220.awd",
+    0x3FF0245707F91EEF: r"LEVELS\L_3_5_B\SECTIONS\s_3.rws",
+    0x3FF18A569DBA9708: r"SB_AWD\90_119\SPANISH\XBX_0114.awd",
+    0x3FF4F89ECABAFAF9: r"VotePlayer.layout",
+    0x4000D8AAA036B6C3: r"SB_AWD\30_59\SPANISH\PS2_0054.awd",
+    0x4000DCAD1D54B563: r"SB_AGD\0_29\SPANISH\PS2_0027.agd",
+    0x40018EBD59C39364: r"SB_AWD\120_149\ENGLISH\NGC_0126.awd",
+    0x4001F550E224B8C8: r"SB_AWD\90_119\GERMAN\XBX_0107.awd",
+    0x4003DD0984C110B7: r"SB_AGD\240_269\ENGLISH\NGC_0240.agd",
+    0x40142EFD02203E89: r"SB_AWD\240_269\ENGLISH\PS2_0254.awd",
+    0x401E58DADC0DBE7A: r"SB_AGD\180_209\GERMAN\XBX_0200.agd",
+    0x4021BFD26261CA26: r"SB_AGD\60_89\ENGLISH\XBX_0065.agd",
+    0x4023B9CD3B800D84: r"SB_AGD\30_59\ITALIAN\XBX_0058.agd",
+    0x403B738D8CDEF691: r"SB_AGD\120_149\GERMAN\XBX_0138.agd",
+    0x403EE563A3A495FB: r"SB_AGD\120_149\ITALIAN\NGC_0143.agd",
+    0x4040D7D27471C8FF: r"SB_AGD\30_59\ITALIAN\XBX_0031.agd",
+    0x40493DC87E43409E: r"SB_AGD\0_29\ITALIAN\XBX_0003.agd",
+    0x404C18FAA6309447: r"SB_AGD\90_119\ITALIAN\PS2_0099.agd",
+    0x4050E13F7841F0EE: r"SB_AWD\90_119\GERMAN\PS2_0115.awd",
+    0x405D2152B81D0C5F: r"SB_AWD\60_89\ENGLISH\NGC_0071.awd",
+    0x405F25CF23822CD3: r"SB_AGD\30_59\SPANISH\PS2_0043.agd",
+    0x406ACE38764D5350: r"SB_AWD\30_59\ENGLISH\NGC_0056.awd",
+    0x406B57B979B18440: r"SB_AWD\60_89\FRENCH\PS2_0077.awd",
+    0x406E2798255FE356: r"SB_AGD\60_89\FRENCH\XBX_0065.agd",
+    0x407572AD05B09E76: r"LEVELS\L_3_5\SECTIONS\s_7.rws",
+    0x407844A94F410BE6: r"w_findSessionBKG.dds",
+    0x408A4CE80542F953: r"SB_AGD\120_149\GERMAN\PS2_0122.agd",
+    0x408C2AB6C6F778FD: r"SB_AGD\210_239\SPANISH\NGC_0219.agd",
+    0x408E8710B6596AFA: r"SB_AGD\150_179\SPANISH\NGC_0164.agd",
+    0x4090118B5FF9931F: r"SHELL\MOVIES\ITALIAN\Act_3.bik",
+    0x40A13091826C23EE: r"SB_AGD\60_89\ENGLISH\NGC_0074.agd",
+    0x40AE38A94F6E8685: r"w_findSessionBKG.txd",
+    0x40B3544E811E54DF: r"LEVELS\L_1_5_B\CLUMPS\cbank_04.bin",
+    0x40C0B3885CDE7AFA: r"SB_AWD\30_59\FRENCH\PS2_0046.awd",
+    0x40C4C2B4791746A0: r"SB_AGD\90_119\SPANISH\PS2_0113.agd",
+    0x40D30CEC978E0DB8: r"SB_AGD\150_179\FRENCH\PS2_0174.agd",
+    0x40D561E6E0747B38: r"SB_AGD\120_149\SPANISH\NGC_0122.agd",
+    0x40DBD91A8563BC27: r"SB_AWD\120_149\GERMAN\NGC_0141.awd",
+    0x40E0A7EEC99E3A5F: r"ANIMGRPS\Lvl_25\Lvl_25N.ads",
+    0x40E8E27FE480658F: r"LEVELS\L_1_3_A\SECTIONS\s_2.rws",
+    0x40ED1A7118307C07: r"SB_AGD\240_269\FRENCH\PS2_0256.agd",
+    0x40F4D0B2D309492D: r"SB_AGD\240_269\ENGLISH\XBX_0253.agd",
+    0x40F8DD7777A705D8: r"SHELL\FONTS\mAdler22.png",
+    0x410009935F885A45: r"SB_AGD\60_89\FRENCH\XBX_0071.agd",
+    0x4100B1A75E9EF8EC: r"SB_AWD\0_29\FRENCH\PS2_0006.awd",
+    0x4102177F68F7B881: r"SB_AGD\90_119\ITALIAN\XBX_0094.agd",
+    0x41086858B88EB60D: r"SB_AGD\60_89\ENGLISH\PS2_0083.agd",
+    0x410DE6AD59D9C726: r"SB_AWD\60_89\ENGLISH\XBX_0065.awd",
+    0x410F02444FF10576: r"SB_AWD\90_119\GERMAN\PS2_0098.awd",
+    0x41138A8F8A2A3410: r"SB_AGD\240_269\SPANISH\PS2_0251.agd",
+    0x4115AAAA901DE220: r"SB_AGD\240_269\SPANISH\PS2_0264.agd",
+    0x41181727B76C45A8: r"SB_AGD\120_149\ITALIAN\PS2_0123.agd",
+    0x411A47CB23CA7932: r"SB_AWD\60_89\FRENCH\PS2_0071.awd",
+    0x411F0B9B2E8202DF: r"SB_AGD\0_29\FRENCH\NGC_0004.agd",
+    0x4120FF003DFC29A8: r"SB_AGD\150_179\SPANISH\PS2_0174.agd",
+    0x412D1E1F8E233C2E: r"SB_AWD\120_149\ENGLISH\XBX_0139.awd",
+    0x412D3C003540C4A2: r"SB_AGD\30_59\ENGLISH\NGC_0050.agd",
+    0x4130EFE5D74AA539: r"SB_AGD\90_119\FRENCH\PS2_0118.agd",
+    0x4135352CF05E00A3: r"SB_AGD\120_149\ITALIAN\PS2_0146.agd",
+    0x413FBFF32E773540: r"SB_AWD\30_59\FRENCH\NGC_0034.awd",
+    0x41459106D66121C0: r"SB_AWD\60_89\ENGLISH\PS2_0060.awd",
+    0x4145B44B4CF8AE2B: r"SHELL\FONTS\tw22.met",
+    0x414DAA69F29AD70F: r"SB_AGD\60_89\SPANISH\PS2_0070.agd",
+    0x414EB7B70C93A09B: r"ANIMGRPS\Lvl_15\Lvl_15D.ads",
+    0x415100A32C8695F8: r"SB_AGD\60_89\ENGLISH\NGC_0076.agd",
+    0x41538209146AD57B: r"SB_AWD\240_269\FRENCH\XBX_0268.awd",
+    0x415F68643560DA86: r"SB_AGD\240_269\FRENCH\PS2_0266.agd",
+    0x4163CF2243E6C083: r"SB_AWD\150_179\GERMAN\PS2_0162.awd",
+    0x4166AE1AD4E0E65F: r"SB_AGD\210_239\FRENCH\XBX_0215.agd",
+    0x4169CE6BAFFF037E: r"SB_AGD\60_89\ITALIAN\XBX_0072.agd",
+    0x416FA39A06F77074: r"SB_AWD\30_59\FRENCH\PS2_0044.awd",
+    0x417010378D367021: r"SB_AWD\90_119\ENGLISH\XBX_0111.awd",
+    0x417D5B511500F6D2: r"SB_AWD\90_119\FRENCH\PS2_0113.awd",
+    0x417F7E61FCD1E0B3: r"AUDIO\SPANISH\XBX_4m3.rws",
+    0x4187332A3774A23A: r"SB_AWD\120_149\GERMAN\XBX_0133.awd",
+    0x4187D1CC3CC375D0: r"SB_AGD\150_179\GERMAN\PS2_0169.agd",
+    0x41A3A0C47D22083F: r"SB_AGD\240_269\ENGLISH\XBX_0255.agd",
+    0x41AB008C50809159: r"AUDIO\GERMAN\NGC_2s1.rws",
+    0x41AED9A509A11957: r"SB_AGD\60_89\FRENCH\XBX_0077.agd",
+    0x41B071B908B94FCE: r"SB_AWD\0_29\FRENCH\PS2_0008.awd",
+    0x41B6CED861290C54: r"SB_AWD\120_149\ENGLISH\NGC_0135.awd",
+    0x41CB2F0945533B93: r"SB_AGD\0_29\GERMAN\XBX_0017.agd",
+    0x41CD1B188FF00A23: r"SB_AGD\0_29\SPANISH\NGC_0017.agd",
+    0x41D20F104F3CEB16: r"SB_AWD\150_179\GERMAN\XBX_0164.awd",
+    0x41D71B72251B868D: r"CodBack_ServerList.index",
+    0x41E9C2FC54851F47: r"SB_AWD\90_119\SPANISH\XBX_0096.awd",
+    0x41EC16D053059241: r"SB_AWD\0_29\ENGLISH\XBX_0004.awd",
+    0x41EEB004D8902A32: r"SB_AWD\30_59\FRENCH\NGC_0032.awd",
+    0x41F332FA774FA180: r"SB_AGD\150_179\ITALIAN\XBX_0164.agd",
+    0x41F48118807A16B2: r"SB_AWD\60_89\ENGLISH\PS2_0066.awd",
+    0x41FD0A7B9CB48B49: r"SB_AGD\60_89\SPANISH\PS2_0072.agd",
+    0x4208E6B8E7ECD38A: r"AUDIO\FRENCH\NGC_1m1.rws",
+    0x420BF5B96E763B40: r"SB_AWD\120_149\ENGLISH\PS2_0145.awd",
+    0x420C68A5C86D640D: r"SB_AWD\30_59\ITALIAN\PS2_0038.awd",
+    0x4213BE14CE75E31D: r"SB_AWD\60_89\FRENCH\PS2_0069.awd",
+    0x4216FF53E7B02329: r"SB_AWD\180_209\SPANISH\NGC_0205.awd",
+    0x42276F851BB51613: r"SB_AGD\0_29\ITALIAN\XBX_0028.agd",
+    0x4228ADBB0BA2DDA6: r"SB_AWD\180_209\ENGLISH\NGC_0181.awd",
+    0x4229FD68C7C5173B: r"SB_AGD\210_239\SPANISH\XBX_0228.agd",
+    0x4236AF152C4947FC: r"SB_AWD\180_209\FRENCH\PS2_0180.awd",
+    0x423D117ECA03BE55: r"SB_AWD\90_119\ENGLISH\PS2_0097.awd",
+    0x423DB4B78031F56D: r"SB_AWD\60_89\ITALIAN\XBX_0088.awd",
+    0x424E217D0D3837FF: r"SB_AGD\60_89\GERMAN\NGC_0082.agd",
+    0x424E98BA3E1AFD27: r"SB_AWD\60_89\ENGLISH\XBX_0077.awd",
+    0x4251EB0BC2755F26: r"SB_AGD\210_239\SPANISH\XBX_0210.agd",
+    0x4252538EEED44CE1: r"SB_AGD\90_119\ITALIAN\PS2_0116.agd",
+    0x4253F5C4DA933EF1: r"SB_AWD\210_239\SPANISH\XBX_0231.awd",
+    0x4255664269834DF6: r"SB_AWD\90_119\ENGLISH\NGC_0095.awd",
+    0x425FB25D2A0D776A: r"SB_AGD\60_89\SPANISH\NGC_0078.agd",
+    0x42615095B514FD66: r"SB_AWD\60_89\SPANISH\NGC_0089.awd",
+    0x426A54F112D6A5B7: r"ANIMGRPS\Lvl_32\Lvl_32N.ads",
+    0x426BB05838C3353B: r"SB_AGD\150_179\ITALIAN\NGC_0161.agd",
+    0x426BBD0DE6607BF3: r"SB_AWD\180_209\SPANISH\PS2_0192.awd",
+    0x426D29572C5B6226: r"LEVELS\L_2_1\level.rws",
+    0x426ED8C764E5AB42: r"LEVELS\MP_4\SECTIONS\s_9.rws",
+    0x4271DDE5CA93BEC0: r"SB_AWD\0_29\ITALIAN\NGC_0003.awd",
+    0x4276B65E50A48D41: r"SB_AWD\0_29\GERMAN\PS2_0005.awd",
+    0x4281DECB71E09EF6: r"SB_AGD\150_179\GERMAN\NGC_0171.agd",
+    0x4288822711222871: r"SB_AGD\30_59\ENGLISH\PS2_0045.agd",
+    0x42A9162F3F047CDF: r"LEVELS\L_3_5_B\SECTIONS\s_10.rws",
+    0x42ACEF5C2A610A12: r"LEVELS\L_1_2\level.rws",
+    0x42ACF83C7161D78B: r"ANIMGRPS\Lvl_15\Lvl_15T.ads",
+    0x42B24AFB5D38A7D5: r"SB_AWD\120_149\FRENCH\PS2_0135.awd",
+    0x42B5E1C47D81AD33: r"SB_AGD\120_149\SPANISH\XBX_0127.agd",
+    0x42B7D8572C9AC40A: r"LEVELS\L_2_1\level.dff",
+    0x42BAE5CB188F3032: r"SB_AWD\120_149\ENGLISH\PS2_0143.awd",
+    0x42BD392B40FC2389: r"AUDIO\GERMAN\XBX_2m1.rws",
+    0x42C3C90BD6833E0A: r"SB_AGD\210_239\SPANISH\NGC_0230.agd",
+    0x42CCFE4A21D84982: r"SB_AWD\30_59\ENGLISH\NGC_0050.awd",
+    0x42D30B3C48635C0C: r"SB_AGD\30_59\FRENCH\XBX_0032.agd",
+    0x42D56110DF981336: r"SB_AGD\180_209\GERMAN\PS2_0203.agd",
+    0x42DCEE5C2A8A2C16: r"LEVELS\L_1_2\level.dff",
+    0x42E3A7EA6B96FEE0: r"SB_AWD\60_89\SPANISH\XBX_0078.awd",
+    0x42F35C07CDD11A9E: r"SB_AWD\180_209\GERMAN\XBX_0187.awd",
+    0x430BEE14329FFF11: r"SB_AWD\240_269\GERMAN\NGC_0244.awd",
+    0x431714B760C33ED6: r"LEVELS\L_3_1_C\SECTIONS\s_10.rws",
+    0x431891FA4E09F5B7: r"SB_AGD\60_89\ENGLISH\XBX_0060.agd",
+    0x4320CDF774ACB3B2: r"SB_AWD\0_29\ITALIAN\NGC_0005.awd",
+    0x4324F3DD8AA3BEC7: r"SB_AWD\90_119\SPANISH\PS2_0099.awd",
+    0x432712C624A273B2: r"SB_AGD\90_119\SPANISH\PS2_0115.agd",
+    0x432E88ABC78FABFF: r"SB_AGD\240_269\SPANISH\NGC_0257.agd",
+    0x4359C0DF8488FE4F: r"SB_AGD\240_269\ENGLISH\XBX_0246.agd",
+    0x4361CE4D4D4BD107: r"SB_AGD\240_269\GERMAN\NGC_0255.agd",
+    0x436FCC9A89096EA2: r"gui_map2_ctf.index",
+    0x43718D31ECC65203: r"SB_AGD\180_209\GERMAN\PS2_0189.agd",
+    0x4377F7824E1B57FF: r"SB_AWD\180_209\ENGLISH\XBX_0201.awd",
+    0x4377FABC3BA90F32: r"SB_AGD\240_269\SPANISH\PS2_0262.agd",
+    0x4378F537184C1EF8: r"LEVELS\L_3_5\SECTIONS\s_25.rws",
+    0x4380EBACDA0C7119: r"SB_AGD\0_29\FRENCH\NGC_0006.agd",
+    0x4384B12289B1AC40: r"SB_AGD\180_209\GERMAN\PS2_0201.agd",
+    0x438DCCB7C4B2558F: r"SB_AGD\90_119\FRENCH\XBX_0098.agd",
+    0x43985BAC0814BE9F: r"LEVELS\L_1_3_B\CLUMPS\cbank_02.bin",
+    0x43A30C1977EB56C8: r"SB_AWD\180_209\GERMAN\XBX_0185.awd",
+    0x43A9FA6E3E9E8BE4: r"SB_AWD\240_269\FRENCH\NGC_0269.awd",
+    0x43AA813387E0D662: r"SB_AWD\60_89\ENGLISH\PS2_0071.awd",
+    0x43B55DA88B1FB0BE: r"SB_AWD\240_269\GERMAN\XBX_0241.awd",
+    0x43B722EB31CEBB21: r"SB_AGD\240_269\GERMAN\PS2_0252.agd",
+    0x43C23875E0ECE110: r"SB_AGD\240_269\FRENCH\PS2_0264.agd",
+    0x43C384C4B78F562B: r"SB_AWD\60_89\ITALIAN\NGC_0075.awd",
+    0x43C6052F3F7C6E13: r"SB_AGD\90_119\SPANISH\PS2_0095.agd",
+    0x43C88E2C806B5499: r"SB_AGD\210_239\FRENCH\XBX_0217.agd",
+    0x43CA312775B27F32: r"SB_AGD\210_239\GERMAN\PS2_0219.agd",
+    0x43D17507FA0DE2B6: r"SB_AGD\90_119\GERMAN\NGC_0099.agd",
+    0x43D1E09C157862DF: r"SB_AWD\90_119\GERMAN\NGC_0119.awd",
+    0x43D1E9939094A9C3: r"SB_AWD\30_59\FRENCH\PS2_0032.awd",
+    0x43D23715AEB05844: r"font_stringtw22.tga",
+    0x43D41C406A7C2F86: r"SB_AGD\240_269\GERMAN\NGC_0243.agd",
+    0x43D5A0643EB734A3: r"SB_AWD\90_119\ENGLISH\XBX_0100.awd",
+    0x43E4BA1C79AB4BC1: r"LEVELS\L_2_2_B\SECTIONS\s_7.rws",
+    0x43F18E212FF7CB08: r"SB_AGD\0_29\ITALIAN\PS2_0011.agd",
+    0x440CD451BC68695F: r"ANIMGRPS\Lvl_16\Lvl_16B.ads",
+    0x442BB2BEB25CB050: r"LEVELS\L_3_5\SECTIONS\s_5.rws",
+    0x442BF679580A05B1: r"SB_AWD\0_29\GERMAN\PS2_0012.awd",
+    0x442D270B40660A5D: r"SB_AWD\180_209\ITALIAN\NGC_0182.awd",
+    0x4433A8EC890A7F94: r"SB_AGD\180_209\GERMAN\XBX_0202.agd",
+    0x4433DF21FAC73EA0: r"SB_AWD\150_179\GERMAN\XBX_0166.awd",
+    0x4435D6E904D6523E: r"PlayerSetup.layout",
+    0x443DA24218876A81: r"SB_AGD\30_59\ENGLISH\PS2_0052.agd",
+    0x444066245F45BA1C: r"font_stringSmall.tga",
+    0x44470920EA3F6E7D: r"SB_AGD\60_89\FRENCH\NGC_0077.agd",
+    0x4450C39F39DBB823: r"SB_AGD\120_149\GERMAN\XBX_0136.agd",
+    0x445AD1BB47EC55AE: r"SHELL\FONTS\mlta32.png",
+    0x445F0DDA2B40DBA8: r"SB_AGD\0_29\ITALIAN\XBX_0001.agd",
+    0x44635763FF83696E: r"SB_AWD\210_239\GERMAN\NGC_0218.awd",
+    0x4466D151253FC258: r"SB_AWD\90_119\GERMAN\PS2_0117.awd",
+    0x44678C3DA1A3D181: r"AUDIO\ITALIAN\XBX_1s2.rws",
+    0x447727280839B725: r"SB_AGD\180_209\SPANISH\NGC_0209.agd",
+    0x447E08C7C05166D4: r"SB_AGD\150_179\ITALIAN\PS2_0178.agd",
+    0x4480F5693875FDE1: r"SB_AWD\210_239\GERMAN\NGC_0231.awd",
+    0x4482C1AA4E26165A: r"AUDIO\ITALIAN\PS2_4m3.rws",
+    0x448FB1EBC3CAC707: r"SB_AGD\0_29\FRENCH\PS2_0023.agd",
+    0x4491705AC0188D1C: r"SB_AWD\90_119\FRENCH\PS2_0094.awd",
+    0x44931B36B4102E6C: r"SB_AGD\180_209\GERMAN\PS2_0195.agd",
+    0x4499BA31FE287EB4: r"SB_AGD\240_269\SPANISH\XBX_0267.agd",
+    0x449E51BC059CBB0E: r"LEVELS\MP_1\SECTIONS\s_11.rws",
+    0x44A3D72263562C14: r"SB_AGD\150_179\SPANISH\NGC_0166.agd",
+    0x44A94F9C4108600F: r"ExpandedChat.layout",
+    0x44ADF4B3602FAF3E: r"SB_AWD\0_29\GERMAN\PS2_0024.awd",
+    0x44B2937DB0A2214A: r"LEVELS\MP_7\GodData.dff",
+    0x44B397E50B55BD52: r"SB_AWD\150_179\ITALIAN\XBX_0162.awd",
+    0x44B9B546113ED1B1: r"SB_AGD\150_179\ENGLISH\NGC_0167.agd",
+    0x44BF908F5F343BD2: r"SB_AWD\180_209\FRENCH\NGC_0187.awd",
+    0x44E187D3BA12F8C0: r"SB_AWD\90_119\ITALIAN\PS2_0113.awd",
+    0x44E24160C8E1A96B: r"SB_AGD\0_29\ENGLISH\NGC_0022.agd",
+    0x44E3A8C6CEF4EE0F: r"SB_AGD\240_269\SPANISH\NGC_0240.agd",
+    0x44E8C0E82B0BA07E: r"SB_AWD\150_179\ENGLISH\PS2_0161.awd",
+    0x44F7D2C1A2AF6D8F: r"SB_AGD\180_209\SPANISH\NGC_0184.agd",
+    0x44FE6DE94C707F61: r"SB_AGD\90_119\FRENCH\XBX_0104.agd",
+    0x4503F1261079A4DE: r"SB_AWD\150_179\ITALIAN\NGC_0151.awd",
+    0x451EDE7AE5BB5CE2: r"CreateSessionAdvanced.layout",
+    0x452159998D718BC4: r"SB_AWD\0_29\SPANISH\PS2_0015.awd",
+    0x452336BF06D688B0: r"SB_AWD\60_89\ENGLISH\XBX_0067.awd",
+    0x4525894C768302E1: r"SB_AWD\30_59\ITALIAN\XBX_0051.awd",
+    0x452CC6AB1494A15B: r"SB_AWD\120_149\SPANISH\PS2_0146.awd",
+    0x45357DD6CCFD28C8: r"SB_AGD\120_149\SPANISH\NGC_0131.agd",
+    0x453BF21C3C618C6C: r"LEVELS\L_3_3\SECTIONS\s_7.rws",
+    0x4543E462CD614C85: r"SB_AGD\90_119\SPANISH\XBX_0102.agd",
+    0x454636F7B574AA29: r"LEVELS\L_3_1\SECTIONS\s_11.rws",
+    0x454818171D15D982: r"SB_AWD\60_89\SPANISH\XBX_0069.awd",
+    0x4548BD33AE1D8AB7: r"SB_AGD\210_239\SPANISH\XBX_0215.agd",
+    0x454A0BB788F9A148: r"SB_AGD\0_29\ENGLISH\NGC_0003.agd",
+    0x454C586A552BAFE7: r"SB_AWD\90_119\ENGLISH\NGC_0090.awd",
+    0x455F3A89460404D4: r"SB_AWD\240_269\FRENCH\NGC_0254.awd",
+    0x456294A253D395FC: r"SB_AGD\210_239\FRENCH\PS2_0228.agd",
+    0x45681548D8F0A401: r"SB_AWD\240_269\FRENCH\PS2_0254.awd",
+    0x45708966170FC9D3: r"SB_AGD\60_89\ITALIAN\PS2_0074.agd",
+    0x4574B5757129D0DE: r"SB_AGD\30_59\SPANISH\NGC_0054.agd",
+    0x458336F2B4E115EE: r"SB_AGD\120_149\SPANISH\PS2_0129.agd",
+    0x4587890025F54346: r"SB_AWD\120_149\FRENCH\PS2_0129.awd",
+    0x459077E5642BEDB2: r"SB_AWD\90_119\ITALIAN\PS2_0115.awd",
+    0x459308D8790EA249: r"SB_AGD\240_269\SPANISH\NGC_0242.agd",
+    0x459D233BE47273B4: r"SB_AWD\120_149\GERMAN\XBX_0131.awd",
+    0x459DAF70D97CF41A: r"SB_AGD\180_209\ITALIAN\XBX_0208.agd",
+    0x45A732D34CC921C9: r"SB_AGD\180_209\SPANISH\NGC_0186.agd",
+    0x45ABD1BBF8A69E44: r"AUDIO\ITALIAN\PS2_4m1.rws",
+    0x45AF019B9993E2FC: r"SB_AWD\120_149\ITALIAN\NGC_0126.awd",
+    0x45B01C93190D8F88: r"SB_AGD\60_89\ENGLISH\NGC_0065.agd",
+    0x45B10377CB4C7ADA: r"SB_AWD\150_179\SPANISH\NGC_0164.awd",
+    0x45BB47183C0F226B: r"ANIMGRPS\Lvl_36\Lvl_36J.ads",
+    0x45BF425CBF08C406: r"SB_AGD\120_149\FRENCH\NGC_0120.agd",
+    0x45E45B27D05F054E: r"LEVELS\MP_10\SECTIONS\s_2.rws",
+    0x45EC1A69D2C6960A: r"SB_AWD\120_149\ENGLISH\PS2_0132.awd",
+    0x45EDE8716F0549A0: r"gui_map8_ctf.index",
+    0x45FFBF5402E58068: r"SB_AWD\30_59\ENGLISH\PS2_0039.awd",
+    0x460AD737FE1FF7FB: r"SB_AGD\60_89\GERMAN\XBX_0066.agd",
+    0x46100692D8B27FFB: r"ANIMGRPS\Lvl_36\Lvl_36Z.ads",
+    0x4611DA8AB4CBDF51: r"SB_AWD\60_89\SPANISH\NGC_0060.awd",
+    0x462385871B428FE8: r"SB_AGD\30_59\SPANISH\NGC_0056.agd",
+    0x46262AECF01896B9: r"SB_AWD\240_269\ENGLISH\PS2_0261.awd",
+    0x46265A962391F8E2: r"SB_AWD\60_89\ENGLISH\NGC_0085.awd",
+    0x462A868ED9121F53: r"SB_AGD\120_149\ENGLISH\NGC_0121.agd",
+    0x463428E2C7B85C64: r"SB_AGD\150_179\ITALIAN\PS2_0167.agd",
+    0x4634E46005A157BB: r"LEVELS\L_1_3_B\SECTIONS\s_25.rws",
+    0x4636EC5216083610: r"SB_AGD\240_269\GERMAN\NGC_0241.agd",
+    0x463DFDCCB89F9F30: r"SB_AWD\180_209\ENGLISH\NGC_0183.awd",
+    0x4650FFD5FAE45D85: r"SB_AWD\210_239\SPANISH\NGC_0211.awd",
+    0x4653019077018FC7: r"SB_AWD\90_119\ENGLISH\PS2_0091.awd",
+    0x465474046DB3B09E: r"SB_AGD\30_59\FRENCH\PS2_0033.agd",
+    0x4658F73D6ABB6EA4: r"SB_AGD\150_179\SPANISH\NGC_0175.agd",
+    0x466BCA7CCA3E7B1B: r"SB_AGD\90_119\GERMAN\NGC_0115.agd",
+    0x466F19601F4908E7: r"LEVELS\MP_6\SECTIONS\s_2.rws",
+    0x466FD56118A5C7C1: r"SB_AGD\150_179\ENGLISH\NGC_0174.agd",
+    0x467000B4A2A55F5B: r"SB_AWD\60_89\ITALIAN\NGC_0066.awd",
+    0x46743BC1CF248993: r"SB_AGD\240_269\ENGLISH\PS2_0241.agd",
+    0x467EA756B3458B6A: r"SB_AWD\60_89\ITALIAN\NGC_0085.awd",
+    0x46838EC161ED0AE0: r"SB_AGD\150_179\FRENCH\XBX_0159.agd",
+    0x468464AE4177D417: r"AUDIO\GERMAN\PS2_2m2.rws",
+    0x46972EDD1EDD6000: r"SB_AGD\150_179\GERMAN\NGC_0173.agd",
+    0x46998E74B03803CE: r"SHELL\LOAD\MP_6_SD.txd",
+    0x46A8DF1CF4422BA1: r"SB_AGD\120_149\FRENCH\XBX_0121.agd",
+    0x46B6A9071863F0B0: r"ANIMGRPS\Lvl_21\Lvl_21M.ads",
+    0x46C4D1AFD978B7BE: r"SB_AGD\210_239\FRENCH\NGC_0212.agd",
+    0x46C78E85F50DACC4: r"SB_AWD\90_119\ITALIAN\NGC_0116.awd",
+    0x46C83B0D0A367947: r"SB_AWD\120_149\FRENCH\PS2_0133.awd",
+    0x46CC4C1486A70394: r"SB_AWD\90_119\ITALIAN\XBX_0110.awd",
+    0x46DA7E31D3DAAB21: r"SB_AGD\150_179\SPANISH\XBX_0176.agd",
+    0x46E592A588C1E04C: r"SB_AGD\90_119\ENGLISH\NGC_0116.agd",
+    0x46F44C03A0BF46D6: r"SB_AGD\150_179\ENGLISH\PS2_0150.agd",
+    0x46F55534EA525980: r"gui_map7_ctf.dds",
+    0x46F56C413782234B: r"SB_AGD\150_179\FRENCH\XBX_0170.agd",
+    0x46F93ED1174F2AC9: r"SB_AWD\30_59\ENGLISH\XBX_0059.awd",
+    0x46FBFF8E5705FDC8: r"ANIMGRPS\Lvl_22\Lvl_22K.ads",
+    0x46FD50F6654446EE: r"SB_AWD\240_269\ENGLISH\XBX_0250.awd",
+    0x4700AFE7A4FE9937: r"SB_AWD\210_239\SPANISH\NGC_0217.awd",
+    0x471A6F922BB307FA: r"SB_AGD\180_209\SPANISH\PS2_0184.agd",
+    0x471D6232D5CA5A44: r"SB_AWD\210_239\ITALIAN\XBX_0230.awd",
+    0x471E5563E057D071: r"SB_AWD\240_269\FRENCH\PS2_0261.awd",
+    0x472B3134EA7FAC53: r"gui_map7_ctf.txd",
+    0x472DD7685D5EED24: r"SB_AWD\60_89\ITALIAN\NGC_0087.awd",
+    0x4734224E20E5015B: r"SB_AGD\240_269\FRENCH\XBX_0242.agd",
+    0x47409F2039152B39: r"SB_AGD\180_209\SPANISH\XBX_0188.agd",
+    0x4745AB16C2EACF4E: r"SB_AWD\180_209\FRENCH\PS2_0191.awd",
+    0x474D335217ACB10D: r"SB_AWD\60_89\ENGLISH\PS2_0069.awd",
+    0x47535FDE9008F26B: r"SB_AGD\60_89\FRENCH\PS2_0063.agd",
+    0x4760090C36DA837D: r"SB_AGD\0_29\FRENCH\XBX_0022.agd",
+    0x476488ABC3C7BAAE: r"SB_AGD\180_209\FRENCH\NGC_0208.agd",
+    0x476F20F13185DA89: r"SB_AGD\240_269\ENGLISH\XBX_0244.agd",
+    0x477124559914C205: r"SB_AWD\210_239\GERMAN\XBX_0233.awd",
+    0x477D9691B7D0A7CB: r"AUDIO\FRENCH\XBX_2s3.rws",
+    0x478BCC28B25D49EC: r"SB_AWD\60_89\SPANISH\PS2_0086.awd",
+    0x478D3793FB17FE59: r"SB_AWD\180_209\ENGLISH\XBX_0203.awd",
+    0x478E96BCC01EF4F5: r"SB_AWD\120_149\SPANISH\PS2_0144.awd",
+    0x479472B732DABA0E: r"SB_AGD\90_119\ENGLISH\NGC_0118.agd",
+    0x47952C4E45E66806: r"SB_AWD\180_209\ITALIAN\XBX_0204.awd",
+    0x4799F8BF93454F0C: r"SB_AGD\180_209\FRENCH\PS2_0203.agd",
+    0x479D1F3D039FFF10: r"SB_AWD\150_179\GERMAN\XBX_0175.awd",
+    0x47A0FD5E7EE55B8E: r"SB_AGD\180_209\ITALIAN\PS2_0193.agd",
+    0x47A8D549816C100B: r"SB_AWD\120_149\FRENCH\NGC_0121.awd",
+    0x47BB2A355020EA48: r"SB_AGD\60_89\FRENCH\PS2_0082.agd",
+    0x47DC8B00FC2AA13D: r"LEVELS\MP_4\SECTIONS\s_6.rws",
+    0x47DE6D33A64D0270: r"SB_AGD\90_119\FRENCH\PS2_0090.agd",
+    0x47E2F25FCAFDC075: r"SB_AGD\240_269\FRENCH\XBX_0240.agd",
+    0x47E452BF8054F25A: r"SB_AWD\180_209\ITALIAN\XBX_0198.awd",
+    0x47EBC42ABF2BEDCA: r"SB_AWD\0_29\ITALIAN\PS2_0004.awd",
+    0x47EC158D080CF4F7: r"ANIMGRPS\Lvl_12\Lvl_12J.ads",
+    0x47EDF548C59A9F82: r"LEVELS\L_3_5\SECTIONS\s_23.rws",
+    0x4801D14F6252764E: r"VoteGame.layout",
+    0x480702B1364925BA: r"SB_AWD\0_29\ITALIAN\NGC_0027.awd",
+    0x480D6B075A4B249C: r"SB_AWD\240_269\ITALIAN\NGC_0254.awd",
+    0x4815AA36578864C6: r"SB_AGD\0_29\GERMAN\PS2_0015.agd",
+    0x4820D467432EFDB7: r"SB_AWD\210_239\GERMAN\XBX_0235.awd",
+    0x4822126E6A94CA90: r"SB_AGD\120_149\FRENCH\NGC_0122.agd",
+    0x48243289708878A0: r"SB_AGD\120_149\FRENCH\NGC_0131.agd",
+    0x4827E56A193C4F8D: r"SB_AGD\90_119\SPANISH\PS2_0105.agd",
+    0x482870B87DCAE739: r"LEVELS\L_3_4\SECTIONS\s_7.rws",
+    0x4828E012B0CC6AC9: r"LEVELS\L_1_1\SECTIONS\s_2.rws",
+    0x483B8C3A5C77A0CE: r"SB_AWD\60_89\SPANISH\PS2_0088.awd",
+    0x4840701AD383F05E: r"SB_AWD\60_89\GERMAN\PS2_0068.awd",
+    0x4840D507A4B05247: r"ANIMGRPS\Lvl_12\Lvl_12Z.ads",
+    0x48487386D20301CC: r"SB_AWD\210_239\GERMAN\PS2_0231.awd",
+    0x48488391D32AB15E: r"SB_AWD\210_239\ENGLISH\NGC_0227.awd",
+    0x4855B3DA611DAB31: r"SB_AWD\210_239\ITALIAN\PS2_0236.awd",
+    0x48568A039B2204BD: r"SB_AWD\150_179\ITALIAN\XBX_0158.awd",
+    0x4857A55B2B84CF25: r"SB_AWD\120_149\FRENCH\NGC_0123.awd",
+    0x485A4BB21FB66445: r"SB_AWD\90_119\SPANISH\XBX_0102.awd",
+    0x485F85A4BE530375: r"LEVELS\MP_1\SECTIONS\s_9.rws",
+    0x4864FE99531E65EA: r"SB_AWD\150_179\GERMAN\NGC_0162.awd",
+    0x486A28781951E55B: r"SB_AWD\0_29\FRENCH\NGC_0022.awd",
+    0x487E4C4826BC9DCB: r"SB_AGD\150_179\ITALIAN\NGC_0172.agd",
+    0x48891E2B0A70FC92: r"SB_AWD\210_239\SPANISH\NGC_0238.awd",
+    0x48892B246AC66B65: r"SB_AGD\180_209\SPANISH\PS2_0208.agd",
+    0x488D3D455065C102: r"SB_AGD\90_119\FRENCH\PS2_0096.agd",
+    0x4892544FC29F51FA: r"SB_AWD\210_239\ENGLISH\PS2_0235.awd",
+    0x48A2562379252E06: r"LEVELS\L_1_2\SECTIONS\s_13.rws",
+    0x48C315BF0DE7860B: r"SB_AWD\150_179\SPANISH\PS2_0160.awd",
+    0x48CA20CA27D8E593: r"LEVELS\L_3_4\SECTIONS\s_9.rws",
+    0x48CE8CDACCE7FBFD: r"SB_AGD\240_269\SPANISH\PS2_0258.agd",
+    0x48D126CA23EC43FD: r"gui_map6_ctf.dds",
+    0x48D1D0C64E2FB2F5: r"SB_AWD\60_89\ITALIAN\NGC_0064.awd",
+    0x48D3C086D86D5CC2: r"LEVELS\L_3_1_B\SECTIONS\s_6.rws",
+    0x48E29E5FF52CB270: r"SB_AGD\210_239\ITALIAN\NGC_0218.agd",
+    0x48F5468AEAD1EDF8: r"ANIMGRPS\Lvl_13\Lvl_13K.ads",
+    0x48F784A87C7C19A8: r"AUDIO\FRENCH\XBX_4s2.rws",
+    0x48FA887A31B87930: r"SB_AGD\210_239\GERMAN\XBX_0232.agd",
+    0x48FFDE8095722CB8: r"AUDIO\SPANISH\NGC_1s1.rws",
+    0x4902E4A2ECDD987E: r"Options.layout",
+    0x490812CA241B6466: r"gui_map6_ctf.txd",
+    0x49121C86E36670BE: r"SB_AGD\150_179\SPANISH\XBX_0153.agd",
+    0x49142EAAFD37C7A4: r"SB_AWD\150_179\GERMAN\NGC_0160.awd",
+    0x4918A137BD755608: r"SB_AWD\150_179\ITALIAN\NGC_0153.awd",
+    0x491ECD35A686B581: r"SB_AWD\30_59\ENGLISH\PS2_0052.awd",
+    0x4928D1316D791B2F: r"SB_AWD\120_149\ITALIAN\XBX_0134.awd",
+    0x492910FF40C49D17: r"SB_AWD\180_209\ENGLISH\XBX_0199.awd",
+    0x49361D8151CAD9CF: r"SB_AWD\90_119\FRENCH\PS2_0109.awd",
+    0x493BAE481989A415: r"SB_AGD\150_179\FRENCH\PS2_0162.agd",
+    0x494144616CB84774: r"SB_AWD\210_239\ENGLISH\PS2_0237.awd",
+    0x4942D4177F813CBD: r"SB_AGD\150_179\GERMAN\PS2_0160.agd",
+    0x4943F53FFCC919CB: r"SB_AGD\180_209\ENGLISH\NGC_0180.agd",
+    0x4945A51AA4E0A57F: r"SB_AWD\150_179\ENGLISH\NGC_0154.awd",
+    0x494A3821343DDD8A: r"SB_AGD\210_239\FRENCH\XBX_0232.agd",
+    0x49583C52E30E29E5: r"SB_AGD\150_179\FRENCH\XBX_0172.agd",
+    0x4959B4747A5EE797: r"SB_AGD\90_119\SPANISH\XBX_0104.agd",
+    0x496233E090F932B9: r"SB_AGD\210_239\ENGLISH\NGC_0233.agd",
+    0x4971E5D0B8004525: r"SB_AWD\150_179\SPANISH\PS2_0162.awd",
+    0x497774B400CF98BE: r"SB_AGD\210_239\FRENCH\PS2_0226.agd",
+    0x4985F49045B3D0C0: r"SB_AWD\30_59\GERMAN\NGC_0043.awd",
+    0x4988A05BBFF60D05: r"SB_AGD\150_179\SPANISH\PS2_0162.agd",
+    0x498A1E2F440F7F36: r"SB_AWD\210_239\GERMAN\XBX_0223.awd",
+    0x498B06E74B3B8E39: r"LEVELS\L_3_4\SECTIONS\s_14.rws",
+    0x498ED53D2F78DE2F: r"LEVELS\L_3_5_C\SECTIONS\s_8.rws",
+    0x498FDB80CCC90336: r"ANIMGRPS\Lvl_25\Lvl_25S.ads",
+    0x499FFCE2ACBDD765: r"SB_AWD\0_29\GERMAN\XBX_0028.awd",
+    0x49A1C445C692ACFA: r"SB_AWD\0_29\ITALIAN\PS2_0017.awd",
+    0x49A63AC102660CF9: r"SB_AWD\30_59\ENGLISH\XBX_0046.awd",
+    0x49AD95C0B31ABBB2: r"ANIMGRPS\Lvl_26\Lvl_26Y.ads",
+    0x49C2DEF43C54D515: r"SB_AGD\0_29\SPANISH\NGC_0028.agd",
+    0x49CCDF811842412A: r"SB_AWD\210_239\ENGLISH\XBX_0225.awd",
+    0x49D01B29E90B1145: r"ANIMGRPS\Lvl_36\Lvl_36L.ads",
+    0x49D6A890EB0642A8: r"LEVELS\MP_10\GodData.dff",
+    0x49FC2684B1F99773: r"SB_AGD\30_59\GERMAN\XBX_0033.agd",
+    0x49FF4F4EAF2AF642: r"SB_AWD\150_179\GERMAN\XBX_0173.awd",
+    0x4A03553B4FBFCC02: r"ANIMGRPS\Lvl_26\Lvl_26I.ads",
+    0x4A05AD9A6CECF788: r"ANIMGRPS\Lvl_35\Lvl_35W.ads",
+    0x4A0D257632EAB555: r"SB_AWD\120_149\FRENCH\NGC_0130.awd",
+    0x4A0E3D8B861B136C: r"SB_AWD\120_149\ITALIAN\NGC_0135.awd",
+    0x4A0F450E8F59EEE8: r"SB_AWD\120_149\FRENCH\XBX_0133.awd",
+    0x4A0F603271FB5DAB: r"SB_AWD\120_149\SPANISH\XBX_0145.awd",
+    0x4A10626455B49160: r"SB_AGD\60_89\FRENCH\NGC_0083.agd",
+    0x4A32B209DD5D6674: r"AUDIO\ENGLISH\NGC_1m3.rws",
+    0x4A34E4A1EFCCC5B2: r"SB_AWD\30_59\GERMAN\NGC_0045.awd",
+    0x4A450BCC617089D5: r"SB_AGD\240_269\ITALIAN\PS2_0258.agd",
+    0x4A49C54D24F68710: r"SB_AWD\180_209\ITALIAN\PS2_0209.awd",
+    0x4A4B8595ECD83863: r"SB_AWD\210_239\GERMAN\NGC_0220.awd",
+    0x4A50B45770ABA274: r"SB_AWD\0_29\ITALIAN\PS2_0015.awd",
+    0x4A59417722C93D80: r"SB_AWD\30_59\GERMAN\XBX_0049.awd",
+    0x4A6354B77C3A6EAC: r"SB_AGD\30_59\SPANISH\XBX_0047.agd",
+    0x4A64D9EA73B9F345: r"SB_AGD\90_119\FRENCH\NGC_0094.agd",
+    0x4A6A44161AB14BA8: r"SB_AGD\30_59\FRENCH\PS2_0031.agd",
+    0x4A777A480312B850: r"SB_AGD\0_29\GERMAN\PS2_0017.agd",
+    0x4A797367BC7B5656: r"LEVELS\L_3_5_C\SECTIONS\s_25.rws",
+    0x4A819A8E773C1635: r"SB_AGD\90_119\GERMAN\NGC_0117.agd",
+    0x4A86829B1C13A5B2: r"SB_AGD\120_149\FRENCH\NGC_0137.agd",
+    0x4A884A1667F9D51F: r"SB_AWD\60_89\FRENCH\PS2_0078.awd",
+    0x4A8BA25B54DA7441: r"LEVELS\L_1_1_B\SECTIONS\s_3.rws",
+    0x4A8D322F70A93AEE: r"SB_AWD\210_239\ITALIAN\PS2_0213.awd",
+    0x4A8DB24400C5181E: r"SB_AWD\30_59\GERMAN\PS2_0053.awd",
+    0x4A9B3E4B7970208F: r"SB_AGD\30_59\ENGLISH\NGC_0059.agd",
+    0x4A9ECA35AE54FC2D: r"SB_AWD\60_89\SPANISH\XBX_0071.awd",
+    0x4A9FF85B31BC2955: r"SB_AWD\30_59\SPANISH\PS2_0049.awd",
+    0x4AB905C2E6CE0C4B: r"SB_AGD\240_269\ITALIAN\NGC_0253.agd",
+    0x4AB9208F4A7AC9DB: r"w_paleborderlarge.index",
+    0x4AC4963E80E77976: r"LEVELS\L_1_2\SECTIONS\s_26.rws",
+    0x4ACBF889C4DC38F5: r"SB_AWD\0_29\FRENCH\NGC_0020.awd",
+    0x4ACD05B5705E42C3: r"SB_AGD\0_29\SPANISH\XBX_0011.agd",
+    0x4AE098CE2C534A5F: r"SB_AGD\180_209\GERMAN\XBX_0191.agd",
+    0x4AE11C59D248A465: r"SB_AGD\150_179\ITALIAN\NGC_0170.agd",
+    0x4AED9C06319660A6: r"ANIMGRPS\Lvl_25\Lvl_25C.ads",
+    0x4AEE77384F553B34: r"SB_AGD\60_89\FRENCH\NGC_0072.agd",
+    0x4AF019792AE53D63: r"SB_AWD\30_59\ITALIAN\XBX_0040.awd",
+    0x4B008564D8D15EC7: r"SB_AGD\120_149\GERMAN\NGC_0141.agd",
+    0x4B02CC3B962058A8: r"ANIMGRPS\Lvl_33\Lvl_33W.ads",
+    0x4B0529186B68EDA0: r"SB_AWD\240_269\ITALIAN\PS2_0259.awd",
+    0x4B095C433D3B2F47: r"SB_AGD\0_29\GERMAN\PS2_0007.agd",
+    0x4B0B38BFB9EA5806: r"SB_AWD\0_29\GERMAN\NGC_0014.awd",
+    0x4B13410812421858: r"SB_AWD\240_269\ENGLISH\XBX_0252.awd",
+    0x4B13A9FC1DD2B257: r"SB_AGD\90_119\FRENCH\NGC_0092.agd",
+    0x4B2FBFA3D8AFC914: r"SB_AGD\180_209\SPANISH\PS2_0186.agd",
+    0x4B3D6255AADF5448: r"SB_AWD\30_59\GERMAN\PS2_0051.awd",
+    0x4B3D955A64B2CBCB: r"SB_AWD\210_239\SPANISH\XBX_0211.awd",
+    0x4B3F5E4A4B74F826: r"SB_AWD\210_239\GERMAN\XBX_0216.awd",
+    0x4B4588026EC2A316: r"SB_AWD\180_209\SPANISH\NGC_0196.awd",
+    0x4B46E41F3ADB7987: r"SB_AGD\240_269\FRENCH\NGC_0262.agd",
+    0x4B4B5D4B54D053B9: r"AUDIO\FRENCH\PS2_2m2.rws",
+    0x4B51B75526C43413: r"SB_AWD\240_269\SPANISH\NGC_0253.awd",
+    0x4B5CA088CC9CA955: r"SB_AGD\0_29\SPANISH\PS2_0018.agd",
+    0x4B60C54F32585B4B: r"WPNBANK\26_50\wbank_43.bin",
+    0x4B61AAD51BDE7AC7: r"ChatFont.layout",
+    0x4B6784D14FF0FECC: r"SB_AGD\210_239\ITALIAN\XBX_0238.agd",
+    0x4B765FBFECCCF672: r"ANIMGRPS\Lvl_11\Lvl_11A.ads",
+    0x4B89AF782DF77622: r"SB_AGD\0_29\ENGLISH\NGC_0027.agd",
+    0x4B8AD1431903C0C9: r"SB_AWD\120_149\ITALIAN\XBX_0136.awd",
+    0x4B9A9DAE0349CF99: r"SB_AWD\90_119\FRENCH\PS2_0118.awd",
+    0x4B9AB16D2DAF2F7A: r"SB_AGD\90_119\SPANISH\NGC_0091.agd",
+    0x4B9B260DB8D726FB: r"SHELL\FONTS\mfblds22.png",
+    0x4BA6C551A8552065: r"SB_AGD\180_209\ENGLISH\NGC_0182.agd",
+    0x4BADBC148E4FDD52: r"SB_AGD\120_149\FRENCH\PS2_0132.agd",
+    0x4BB7D6D848F2C812: r"SB_AGD\120_149\ITALIAN\PS2_0132.agd",
+    0x4BC0DF8E564B6818: r"SB_AWD\120_149\FRENCH\NGC_0148.awd",
+    0x4BC51299C881BB27: r"SparkSplash.dds",
+    0x4BC52C1AF6427285: r"SB_AWD\180_209\GERMAN\NGC_0201.awd",
+    0x4BC5A616663BE89D: r"AUDIO\ITALIAN\XBX_4m1.rws",
+    0x4BC884004B9CFF46: r"SB_AGD\210_239\ENGLISH\XBX_0236.agd",
+    0x4BCB1F3A897053C2: r"ANIMGRPS\Lvl_11\Lvl_11Q.ads",
+    0x4BD3381048675F66: r"SB_AWD\60_89\GERMAN\XBX_0074.awd",
+    0x4BE4D3179D1B647C: r"SHELL\LOAD\L_3_3.txd",
+    0x4BEAE4BCF7338562: r"SB_AWD\30_59\GERMAN\NGC_0030.awd",
+    0x4BF5EAAE8B609FB1: r"SB_AGD\60_89\ITALIAN\NGC_0073.agd",
+    0x4BF7253227B2DBEB: r"SHELL\MOVIES\1_1_Mon.bik",
+    0x4BFBF699C8B0CE14: r"SparkSplash.txd",
+    0x4C00A8FFD1B7A169: r"SB_AWD\210_239\FRENCH\PS2_0221.awd",
+    0x4C114B75D710F7F2: r"w_blank.txd",
+    0x4C1664E2FA09D88E: r"SB_AGD\210_239\ITALIAN\XBX_0236.agd",
+    0x4C199A5414D70EBA: r"SHELL\MOVIES\Making2.bik",
+    0x4C1CF2C2E346F734: r"SB_AWD\0_29\ITALIAN\NGC_0025.awd",
+    0x4C253BD196E5C9C4: r"ANIMGRPS\Lvl_11\Lvl_11O.ads",
+    0x4C282CEA699C7336: r"SB_AGD\180_209\ENGLISH\PS2_0180.agd",
+    0x4C36C1E559B4A31A: r"SB_AGD\210_239\ENGLISH\NGC_0223.agd",
+    0x4C373AA97EA232C5: r"SB_AGD\90_119\GERMAN\NGC_0104.agd",
+    0x4C3BADA12D56A7E0: r"SB_AGD\90_119\ENGLISH\PS2_0096.agd",
+    0x4C472775D73E49A9: r"w_blank.dds",
+    0x4C55A55ED45DCE06: r"SB_AGD\210_239\FRENCH\NGC_0234.agd",
+    0x4C5716305E4B8B47: r"ANIMGRPS\Lvl_31\Lvl_31L.ads",
+    0x4C5B6C212DBDD5C0: r"SB_AWD\0_29\ENGLISH\NGC_0014.awd",
+    0x4C5D33A380266288: r"SB_AWD\210_239\ENGLISH\NGC_0225.awd",
+    0x4C66A6BD7E87951E: r"LEVELS\L_1_5\SECTIONS\s_18.rws",
+    0x4C69EF05DF36E6E8: r"WPNBANK\0_25\wbank_24.bin",
+    0x4C6A6EB9D6D8E485: r"SB_AGD\0_29\GERMAN\XBX_0028.agd",
+    0x4C6B83EC0E1B46C3: r"SB_AWD\210_239\ITALIAN\PS2_0238.awd",
+    0x4C6BC6AECB9567DA: r"SB_AGD\210_239\GERMAN\NGC_0225.agd",
+    0x4C6DB07F9B204116: r"SB_AGD\240_269\FRENCH\XBX_0269.agd",
+    0x4C6EFBC3CCB215F7: r"SB_AWD\90_119\SPANISH\XBX_0104.awd",
+    0x4C6F55E70280B516: r"SB_AWD\180_209\SPANISH\XBX_0187.awd",
+    0x4C72B276013FBE72: r"SB_AGD\60_89\FRENCH\NGC_0085.agd",
+    0x4C72EB5B7BC8252D: r"SB_AWD\120_149\SPANISH\PS2_0135.awd",
+    0x4C74DC2CA05CAE37: r"SB_AWD\180_209\GERMAN\NGC_0207.awd",
+    0x4C782FACCB61EC1E: r"LEVELS\L_3_1\SECTIONS\s_3.rws",
+    0x4C7AC8C5CB217D5A: r"SB_AWD\30_59\ENGLISH\XBX_0030.awd",
+    0x4C8010572FB62E27: r"SB_AWD\210_239\GERMAN\XBX_0226.awd",
+    0x4C828821F280F7F0: r"SB_AWD\60_89\GERMAN\XBX_0076.awd",
+    0x4C8730E03E487362: r"SB_AWD\240_269\GERMAN\PS2_0246.awd",
+    0x4C90CFEEBD963BE8: r"SB_AGD\210_239\SPANISH\PS2_0219.agd",
+    0x4C9393BF0B626D8A: r"SB_AWD\150_179\SPANISH\XBX_0162.awd",
+    0x4C9E39D6961AAFCF: r"i_chat_window.layout",
+    0x4CA297F86EA94422: r"SB_AWD\90_119\FRENCH\XBX_0091.awd",
+    0x4CA2FA6F7237749D: r"SB_AWD\150_179\SPANISH\PS2_0153.awd",
+    0x4CA4F8307E0D490E: r"SB_AWD\60_89\FRENCH\XBX_0083.awd",
+    0x4CA83B50D6EBD51C: r"SB_AWD\150_179\ENGLISH\XBX_0160.awd",
+    0x4CA9F883496B0981: r"SB_AWD\0_29\ENGLISH\PS2_0014.awd",
+    0x4CADEDF3F687F6E3: r"SB_AGD\210_239\SPANISH\PS2_0230.agd",
+    0x4CC8FC98E5087115: r"AUDIO\GERMAN\NGC_1s2.rws",
+    0x4CD2DCA088FBE624: r"SB_AGD\30_59\ENGLISH\NGC_0030.agd",
+    0x4CD62C778FB509AE: r"SB_AWD\90_119\SPANISH\PS2_0119.awd",
+    0x4CD77CFC13B60C40: r"SB_AGD\180_209\ENGLISH\PS2_0182.agd",
+    0x4CD787E2AA7E6B6C: r"i_gamespy.layout",
+    0x4CDC5A358E13DF6B: r"SB_AGD\150_179\ENGLISH\PS2_0168.agd",
+    0x4CE4DFBEE0150BA4: r"SB_AGD\180_209\SPANISH\PS2_0195.agd",
+    0x4CE60ABB28BAF1D7: r"SB_AGD\90_119\GERMAN\NGC_0102.agd",
+    0x4CEE0AEB3B7040DA: r"SB_AWD\0_29\FRENCH\XBX_0025.awd",
+    0x4CFD38AA05BD2079: r"SB_AGD\210_239\GERMAN\NGC_0239.agd",
+    0x4D088A2E3A617CD6: r"SB_AGD\90_119\SPANISH\NGC_0118.agd",
+    0x4D09353DFDF90DFC: r"SB_AGD\90_119\ITALIAN\XBX_0118.agd",
+    0x4D0A5C32D7D6CAB2: r"SB_AWD\0_29\ENGLISH\NGC_0012.awd",
+    0x4D10588BDEB614C2: r"SB_AGD\210_239\GERMAN\XBX_0234.agd",
+    0x4D18BC2B9A97E5E8: r"SB_AWD\240_269\GERMAN\NGC_0249.awd",
+    0x4D1BD5D4925A12E5: r"SB_AGD\240_269\ITALIAN\NGC_0251.agd",
+    0x4D227B44425E0E3A: r"SB_AGD\240_269\ENGLISH\NGC_0249.agd",
+    0x4D2505BA458A2629: r"SB_AWD\150_179\SPANISH\XBX_0154.awd",
+    0x4D26DE03864E08A6: r"SB_AGD\180_209\GERMAN\NGC_0202.agd",
+    0x4D297399F0F3348B: r"SB_AWD\0_29\FRENCH\PS2_0012.awd",
+    0x4D3DA7BF7147F2CD: r"SB_AGD\210_239\ITALIAN\PS2_0210.agd",
+    0x4D4278DFD7DDB899: r"SB_AGD\180_209\GERMAN\XBX_0193.agd",
+    0x4D43E3EF426B78CD: r"SB_AWD\120_149\SPANISH\NGC_0123.awd",
+    0x4D4ACF2EE73E8793: r"AUDIO\FRENCH\XBX_2m1.rws",
+    0x4D507E59C6858C27: r"SB_AGD\150_179\FRENCH\PS2_0164.agd",
+    0x4D54F0122075E085: r"SB_AWD\120_149\ENGLISH\XBX_0147.awd",
+    0x4D55C3A21BB4DAAB: r"SB_AGD\60_89\SPANISH\XBX_0082.agd",
+    0x4D5AE52C51DD4BD9: r"SB_AWD\150_179\ENGLISH\NGC_0156.awd",
+    0x4D5FE2E3E73E7128: r"SB_AGD\90_119\ENGLISH\NGC_0109.agd",
+    0x4D830621195E4ADD: r"LEVELS\L_1_3_A\SECTIONS\s_24.rws",
+    0x4D88C751AAD7B1DF: r"SB_AGD\90_119\ENGLISH\PS2_0114.agd",
+    0x4D9E706D6CF3A817: r"SB_AGD\150_179\SPANISH\PS2_0164.agd",
+    0x4DA758141A4CF6A0: r"SB_AWD\180_209\SPANISH\NGC_0194.awd",
+    0x4DAB1F8F0937D95D: r"SHELL\MOVIES\1_3_Mon.bik",
+    0x4DAC0AC992C795C1: r"SB_AGD\60_89\ITALIAN\NGC_0060.agd",
+    0x4DAF65F8FE430E6D: r"EndRoundScoreBoardDeath.layout",
+    0x4DB3F9BC50EB4AD9: r"SB_AGD\210_239\ENGLISH\PS2_0229.agd",
+    0x4DBA3011D5EA42DB: r"SB_AGD\180_209\ITALIAN\NGC_0197.agd",
+    0x4DBF87C842753311: r"AUDIO\FRENCH\PS2_1s3.rws",
+    0x4DC371D260186B04: r"ANIMGRPS\Lvl_26\Lvl_26W.ads",
+    0x4DC4C2A36FB54BC4: r"LEVELS\L_3_5_B\SECTIONS\s_8.rws",
+    0x4DCE585C59164911: r"SB_AGD\240_269\SPANISH\NGC_0260.agd",
+    0x4DD78D044DBC5270: r"AUDIO\SPANISH\XBX_2m2.rws",
+    0x4DD843AB9B0BF3A5: r"SB_AWD\0_29\FRENCH\PS2_0010.awd",
+    0x4DE20F92C53ECCE4: r"SB_AWD\210_239\ENGLISH\XBX_0227.awd",
+    0x4DE5EF7EE7985BDD: r"SB_AGD\90_119\FRENCH\PS2_0099.agd",
+    0x4DF1EE9D58C5FDFD: r"SB_AGD\240_269\GERMAN\NGC_0248.agd",
+    0x4DF33400EC85115F: r"SB_AWD\120_149\SPANISH\NGC_0125.awd",
+    0x4DFACDF5F51EBF22: r"SB_AGD\60_89\FRENCH\PS2_0066.agd",
+    0x4DFB775543026CAA: r"SB_AWD\120_149\GERMAN\NGC_0148.awd",
+    0x4DFD8FB3C3A109C6: r"AUDIO\ENGLISH\PS2_2s3.rws",
+    0x4E03D27C8282349D: r"SB_AWD\0_29\ENGLISH\NGC_0028.awd",
+    0x4E04A023CA901C37: r"SB_AWD\120_149\ENGLISH\XBX_0141.awd",
+    0x4E057800C604F8ED: r"SB_AGD\150_179\ENGLISH\XBX_0172.agd",
+    0x4E0777239BF05034: r"SB_AGD\0_29\FRENCH\XBX_0027.agd",
+    0x4E0796A7BBCAA39B: r"SB_AWD\120_149\FRENCH\XBX_0127.awd",
+    0x4E18314CFCBBC894: r"ANIMGRPS\Lvl_26\Lvl_26G.ads",
+    0x4E19C86924608FA6: r"ANIMGRPS\Lvl_16\Lvl_16O.ads",
+    0x4E19CEAD9689B393: r"SB_AWD\240_269\ENGLISH\PS2_0241.awd",
+    0x4E1C02240397DE90: r"SB_AGD\240_269\FRENCH\NGC_0258.agd",
+    0x4E231587DFE886C7: r"SB_AWD\120_149\FRENCH\NGC_0136.awd",
+    0x4E276F05C8E9C0A1: r"SB_AGD\90_119\FRENCH\NGC_0115.agd",
+    0x4E2A5411F72752D0: r"SB_AGD\210_239\ENGLISH\XBX_0234.agd",
+    0x4E37CD33041AA2F9: r"SB_AWD\120_149\ITALIAN\XBX_0143.awd",
+    0x4E42C17271829C30: r"SB_AGD\240_269\ITALIAN\XBX_0263.agd",
+    0x4E57629BC356170B: r"SB_AGD\240_269\GERMAN\PS2_0243.agd",
+    0x4E5CB85491302ED4: r"SB_AWD\90_119\SPANISH\NGC_0093.awd",
+    0x4E5E550AFB495D30: r"SB_AGD\30_59\SPANISH\NGC_0034.agd",
+    0x4E60389E50D235F1: r"SB_AWD\0_29\ENGLISH\PS2_0021.awd",
+    0x4E690023800301F5: r"SB_AGD\180_209\ITALIAN\NGC_0195.agd",
+    0x4E6C922F0F535A1E: r"AUDIO\ENGLISH\XBX_1m3.rws",
+    0x4E6EA60E37DD4145: r"SB_AWD\60_89\SPANISH\XBX_0080.awd",
+    0x4E7AD6502D938B50: r"LEVELS\L_1_2\SECTIONS\s_24.rws",
+    0x4E8C0784EA838CD3: r"SB_AWD\180_209\GERMAN\NGC_0197.awd",
+    0x4E9120764BBD2FFF: r"SB_AWD\210_239\SPANISH\NGC_0231.awd",
+    0x4E9B2037F0A8D78D: r"SB_AGD\180_209\FRENCH\PS2_0192.agd",
+    0x4E9DFDB2D8E1D4F2: r"SB_AGD\90_119\ENGLISH\PS2_0090.agd",
+    0x4EA27136725267AB: r"SB_AGD\120_149\SPANISH\XBX_0145.agd",
+    0x4EA322411DA70C58: r"SB_AWD\210_239\ITALIAN\PS2_0211.awd",
+    0x4EA53D9B318C980C: r"SB_AGD\90_119\FRENCH\PS2_0111.agd",
+    0x4EA605B296913B95: r"SB_AWD\180_209\GERMAN\PS2_0200.awd",
+    0x4EB1202E04010252: r"SB_AGD\30_59\ITALIAN\PS2_0046.agd",
+    0x4EB875707FE9D490: r"SB_AGD\210_239\FRENCH\NGC_0236.agd",
+    0x4EBA958B85DD82A0: r"SB_AGD\210_239\FRENCH\NGC_0225.agd",
+    0x4EC270A768C168BC: r"SB_AGD\30_59\SPANISH\XBX_0032.agd",
+    0x4EC578A6E61B5752: r"SB_AGD\210_239\GERMAN\XBX_0227.agd",
+    0x4ED0DA41F99E9619: r"SB_AWD\150_179\ITALIAN\XBX_0169.awd",
+    0x4ED125F8AE0B08A0: r"SB_AWD\180_209\SPANISH\XBX_0185.awd",
+    0x4ED2904A34A5961A: r"SB_AWD\240_269\ENGLISH\NGC_0249.awd",
+    0x4ED3654A92707F92: r"SB_AGD\120_149\GERMAN\XBX_0142.agd",
+    0x4ED91B8B4B188C0D: r"SB_AWD\210_239\FRENCH\XBX_0235.awd",
+    0x4EE61909E54FFBA9: r"SB_AWD\30_59\SPANISH\NGC_0039.awd",
+    0x4EEA20AB36780BDD: r"SB_AGD\210_239\ITALIAN\NGC_0211.agd",
+    0x4EEB8AFE68D5C731: r"SB_AGD\210_239\SPANISH\NGC_0228.agd",
+    0x4EEC737AA0753D58: r"w_map02.index",
+    0x4EF26038386EAB2A: r"SB_AWD\120_149\GERMAN\PS2_0127.awd",
+    0x4EF5F794B2F527A3: r"SB_AGD\30_59\ITALIAN\XBX_0040.agd",
+    0x4EF5FE8E95FD8F0F: r"SB_AWD\90_119\FRENCH\NGC_0108.awd",
+    0x4EFF9DF6866AC997: r"SB_AWD\120_149\GERMAN\PS2_0148.awd",
+    0x4F0593E8EA9CD24A: r"AUDIO\ITALIAN\ASLocate.agd",
+    0x4F0B5C00B4689B98: r"SB_AGD\90_119\FRENCH\XBX_0109.agd",
+    0x4F0CBB7D886ACBEE: r"SB_AWD\150_179\ENGLISH\XBX_0171.awd",
+    0x4F15DEBBB8E10EED: r"SB_AGD\150_179\FRENCH\PS2_0153.agd",
+    0x4F18A04D431DFA8A: r"ANIMGRPS\Lvl_33\Lvl_33U.ads",
+    0x4F2053BDD78EC02D: r"InitialTeamSelect.layout",
+    0x4F2A80610026B7F9: r"SB_AGD\180_209\ENGLISH\XBX_0203.agd",
+    0x4F35B3EED750097B: r"SB_AWD\30_59\GERMAN\PS2_0049.awd",
+    0x4F3CBACE454E9AC2: r"SB_AGD\90_119\GERMAN\XBX_0109.agd",
+    0x4F3F7DB77440A3A4: r"SB_AGD\120_149\ENGLISH\PS2_0149.agd",
+    0x4F4D1FA417722FA0: r"AUDIO\ITALIAN\PS2_2s1.rws",
+    0x4F53656C11B066E5: r"SB_AWD\210_239\SPANISH\XBX_0213.awd",
+    0x4F54AE5BF871B9B0: r"SB_AWD\210_239\GERMAN\XBX_0214.awd",
+    0x4F54D03420684A2B: r"SB_AWD\180_209\ENGLISH\PS2_0202.awd",
+    0x4F54F5C440AA3107: r"SB_AWD\180_209\GERMAN\PS2_0206.awd",
+    0x4F6307F3E8337F97: r"SB_AWD\180_209\SPANISH\XBX_0191.awd",
+    0x4F6350CF5F4E515D: r"SB_AGD\150_179\SPANISH\PS2_0153.agd",
+    0x4F67A7D27A70C65D: r"SB_AWD\30_59\GERMAN\XBX_0053.awd",
+    0x4F688160DF4996F1: r"WPNBANK\26_50\wbank_45.bin",
+    0x4F74D1D4B70E31AF: r"LEVELS\L_3_1\SECTIONS\s_6.rws",
+    0x4F87E098BC911280: r"SB_AWD\150_179\ENGLISH\PS2_0174.awd",
+    0x4F8DC3C6A271D9D5: r"SB_AWD\0_29\FRENCH\PS2_0025.awd",
+    0x4F943DFE9192F036: r"SB_AWD\90_119\ENGLISH\XBX_0116.awd",
+    0x4F9BCD3A75F72416: r"SB_AGD\0_29\ITALIAN\XBX_0021.agd",
+    0x4FA9F72C1564B1E1: r"SB_AWD\60_89\GERMAN\NGC_0088.awd",
+    0x4FB0017EDAABF094: r"SB_AGD\90_119\SPANISH\NGC_0093.agd",
+    0x4FBD881AF7121531: r"SB_AGD\60_89\ENGLISH\PS2_0072.agd",
+    0x4FC9C3A50D7C3DE4: r"LiveOptions.layout",
+    0x4FDEA8A66D18A2B2: r"ANIMGRPS\Lvl_32\Lvl_32G.ads",
+    0x4FDFFA036ABC480D: r"SB_AGD\30_59\SPANISH\PS2_0030.agd",
+    0x4FE0A8E1EBDA1C02: r"SB_AGD\30_59\ENGLISH\XBX_0038.agd",
+    0x4FE814B07E20F20F: r"SB_AWD\30_59\ITALIAN\PS2_0058.awd",
+    0x4FEAA76356622019: r"SB_AGD\90_119\ENGLISH\PS2_0116.agd",
+    0x4FEF94CFC2F4D129: r"SB_AGD\180_209\GERMAN\XBX_0180.agd",
+    0x4FF1F680E76F738B: r"SB_AWD\0_29\ENGLISH\XBX_0011.awd",
+    0x4FFE5D94C739EFC9: r"LEVELS\L_3_3\level.dff",
+    0x500038952363859B: r"LEVELS\L_1_5\SECTIONS\s_20.rws",
+    0x5002CA2C311E3633: r"SB_AGD\60_89\SPANISH\PS2_0063.agd",
+    0x5007F4F96A775D4B: r"SB_AWD\240_269\FRENCH\PS2_0241.awd",
+    0x5009A729B28D4F3A: r"SB_AWD\30_59\SPANISH\NGC_0050.awd",
+    0x500F5DFCEE1A1853: r"SB_AWD\90_119\ENGLISH\NGC_0119.awd",
+    0x501DB02B71F63437: r"SB_AGD\180_209\GERMAN\NGC_0207.agd",
+    0x502CD5E0F7418A4A: r"SB_AGD\60_89\SPANISH\XBX_0076.agd",
+    0x503222ED7A182302: r"AUDIO\ITALIAN\PS2_2m1.rws",
+    0x5034682109BDB302: r"ANIMGRPS\Lvl_32\Lvl_32W.ads",
+    0x50355117EFF8878D: r"SB_AGD\90_119\GERMAN\XBX_0111.agd",
+    0x503730350BA6F33A: r"SB_AGD\60_89\ENGLISH\XBX_0069.agd",
+    0x503A2D1AEC0AF03E: r"SB_AWD\180_209\SPANISH\NGC_0202.awd",
+    0x503C52EC75F801EE: r"SB_AWD\120_149\GERMAN\XBX_0124.awd",
+    0x5041C1617E6C53B3: r"SB_AWD\30_59\FRENCH\PS2_0054.awd",
+    0x504392184840BC4A: r"SB_AWD\90_119\SPANISH\PS2_0090.awd",
+    0x50467E79C87D9B02: r"SB_AWD\90_119\ITALIAN\NGC_0099.awd",
+    0x5046D52D994A78B2: r"SB_AGD\240_269\GERMAN\PS2_0268.agd",
+    0x50490C94C7795135: r"LEVELS\L_3_3\level.rws",
+    0x5052514F495A246D: r"SB_AWD\180_209\ENGLISH\XBX_0184.awd",
+    0x50571B60C9855364: r"SB_AGD\60_89\GERMAN\NGC_0070.agd",
+    0x505B578C933C6B27: r"SB_AGD\120_149\GERMAN\XBX_0129.agd",
+    0x506144B5F5FFB5A3: r"SB_AGD\120_149\GERMAN\PS2_0144.agd",
+    0x5065E33CD2B57F6C: r"SB_AWD\150_179\FRENCH\PS2_0167.awd",
+    0x50661066E6BAD7FD: r"SB_AGD\150_179\GERMAN\XBX_0156.agd",
+    0x5068F40F84A505FC: r"AUDIO\FRENCH\NGC_2s2.rws",
+    0x506A66B96756AA35: r"SB_AWD\120_149\FRENCH\XBX_0125.awd",
+    0x506C6E9A9FAD44F8: r"SB_AWD\120_149\ENGLISH\NGC_0122.awd",
+    0x5077238BDEEE0B86: r"SB_AWD\210_239\SPANISH\XBX_0236.awd",
+    0x50807250B516B9B2: r"SB_AGD\240_269\FRENCH\NGC_0249.agd",
+    0x508397FACEA50C6A: r"SB_AGD\60_89\FRENCH\XBX_0069.agd",
+    0x508DE9409DB3D7E9: r"SB_AWD\0_29\SPANISH\NGC_0011.awd",
+    0x5091A454AEAC7C6E: r"SB_AGD\0_29\ITALIAN\NGC_0016.agd",
+    0x50982634DC4DE35D: r"SB_AWD\60_89\GERMAN\PS2_0081.awd",
+    0x50A0B6000796C76D: r"SB_AGD\60_89\FRENCH\XBX_0080.agd",
+    0x50A0C692918832A5: r"SB_AWD\0_29\ENGLISH\XBX_0013.awd",
+    0x50A1013E31D77A7A: r"AUDIO\FRENCH\NGC_4s2.rws",
+    0x50A534459A82691F: r"LEVELS\L_1_3_A\level.dff",
+    0x50AB17AFBA5A6A33: r"SB_AGD\30_59\ITALIAN\XBX_0035.agd",
+    0x50AC08B7E7668D03: r"SB_AGD\90_119\ITALIAN\NGC_0094.agd",
+    0x50ADD1328EAAD7EA: r"SB_AWD\60_89\GERMAN\NGC_0072.awd",
+    0x50B1FA3B465304DB: r"SB_AWD\60_89\SPANISH\NGC_0075.awd",
+    0x50B37E64105F538C: r"AUDIO\GERMAN\XBX_2s2.rws",
+    0x50B55C1C6D088578: r"SB_AWD\60_89\GERMAN\PS2_0079.awd",
+    0x50B932AD6EE06AA5: r"SB_AGD\240_269\GERMAN\PS2_0241.agd",
+    0x50C743459A9F696F: r"LEVELS\L_1_3_A\level.rws",
+    0x50D9E089B5D20144: r"SB_AWD\240_269\SPANISH\PS2_0268.awd",
+    0x50DA3F2B9685BCCD: r"SB_AGD\30_59\ENGLISH\XBX_0042.agd",
+    0x50F3A667AB8E88AB: r"SB_AWD\0_29\SPANISH\XBX_0019.awd",
+    0x50F8A9520279EAEF: r"SB_AWD\60_89\ENGLISH\XBX_0086.awd",
+    0x51110DC4C7089A9B: r"SB_AWD\240_269\GERMAN\NGC_0251.awd",
+    0x5115A34E7CCFD64E: r"SB_AWD\150_179\FRENCH\PS2_0169.awd",
+    0x511CE59D3168AFB2: r"SB_AGD\210_239\FRENCH\NGC_0223.agd",
+    0x511E154FAAF510BE: r"SB_AGD\90_119\ITALIAN\XBX_0116.agd",
+    0x511E217BE6AFB281: r"WPNBANK\26_50\wbank_30.bin",
+    0x512153FA6BF28BDD: r"JoinFailed.layout",
+    0x5121E3AC78AE144A: r"SB_AGD\90_119\GERMAN\PS2_0111.agd",
+    0x512492A6F93664EA: r"SB_AWD\90_119\GERMAN\PS2_0094.awd",
+    0x5124A5BE83481CF9: r"SB_AGD\120_149\ENGLISH\XBX_0121.agd",
+    0x5129D6D4ADF1EAAE: r"SB_AWD\180_209\FRENCH\NGC_0208.awd",
+    0x5130EC01B563F3BC: r"SB_AWD\90_119\ENGLISH\NGC_0105.awd",
+    0x51327024A1836A91: r"SB_AGD\60_89\SPANISH\NGC_0060.agd",
+    0x5141746658C6EE78: r"SB_AGD\0_29\ITALIAN\NGC_0014.agd",
+    0x5146184D136A9304: r"SB_AWD\60_89\SPANISH\XBX_0074.awd",
+    0x51497E1998F86926: r"SB_AWD\90_119\ENGLISH\XBX_0109.awd",
+    0x515D014438C439A4: r"SB_AWD\60_89\GERMAN\NGC_0070.awd",
+    0x5169126BBDB034FF: r"SB_AWD\240_269\FRENCH\XBX_0264.awd",
+    0x516D388FAD3463A0: r"SB_AGD\210_239\FRENCH\PS2_0219.agd",
+    0x517B2BEC4F8231C1: r"SB_AWD\180_209\FRENCH\PS2_0202.awd",
+    0x517BF3E54CBEDEDC: r"SB_AWD\210_239\ENGLISH\PS2_0215.awd",
+    0x5187DC7BD8580A13: r"SB_AWD\240_269\FRENCH\NGC_0244.awd",
+    0x51882AFE86E6BB30: r"SB_AGD\30_59\FRENCH\XBX_0043.agd",
+    0x518EA4F2D927C33E: r"LEVELS\L_1_5\SECTIONS\s_9.rws",
+    0x519CC3AF5DCEECDD: r"SB_AGD\210_239\ITALIAN\PS2_0225.agd",
+    0x51A8EBCA0C553812: r"SB_AWD\180_209\GERMAN\XBX_0198.awd",
+    0x51B1FA7EC90ED59C: r"SB_AGD\90_119\FRENCH\XBX_0093.agd",
+    0x51B355A7B2D5CCE9: r"SB_AGD\90_119\GERMAN\PS2_0105.agd",
+    0x51B5F5044FE36A0C: r"SB_AWD\180_209\GERMAN\NGC_0187.awd",
+    0x51BB7D591F89FFC0: r"SB_AWD\240_269\GERMAN\XBX_0254.awd",
+    0x51BF0257937E8C0D: r"CreateSessionBase.layout",
+    0x51C37DEC5BC20157: r"SB_AWD\60_89\FRENCH\XBX_0077.awd",
+    0x51D3C2B8A34FC6A4: r"SB_AWD\90_119\GERMAN\PS2_0096.awd",
+    0x51E0160F82CB2F0B: r"SB_AGD\210_239\FRENCH\PS2_0230.agd",
+    0x51E7E3A003505F53: r"SB_AWD\210_239\ITALIAN\XBX_0228.awd",
+    0x5208A35D2094CAA4: r"SB_AGD\150_179\ITALIAN\XBX_0168.agd",
+    0x520C20A719243A53: r"SB_AWD\0_29\FRENCH\XBX_0019.awd",
+    0x520EE0A1C30C5D73: r"SB_AGD\240_269\ENGLISH\XBX_0251.agd",
+    0x5211D56EBC484AF1: r"AUDIO\GERMAN\XBX_1m2.rws",
+    0x521B4812730293FF: r"SB_AGD\150_179\ENGLISH\XBX_0174.agd",
+    0x52227847A891CA53: r"SB_AGD\60_89\ENGLISH\PS2_0081.agd",
+    0x5224A8D888C075B4: r"SB_AGD\240_269\FRENCH\PS2_0268.agd",
+    0x522555275F61DB6F: r"SB_AWD\60_89\ITALIAN\NGC_0079.awd",
+    0x522CEB0456E3B793: r"SB_AGD\90_119\GERMAN\PS2_0091.agd",
+    0x5235CBDF78F25FD6: r"SB_AWD\60_89\FRENCH\XBX_0065.awd",
+    0x52456331A550D29C: r"SB_AGD\60_89\ITALIAN\PS2_0086.agd",
+    0x524586AF5F8C291C: r"SB_AGD\150_179\SPANISH\NGC_0157.agd",
+    0x5248221F654E05B8: r"AUDIO\ITALIAN\XBX_1m1.rws",
+    0x524FF0DCD802828F: r"w_InstantActionBKG.index",
+    0x525646AD98EE18D5: r"SB_AWD\0_29\ENGLISH\XBX_0000.awd",
+    0x525891841E8037C2: r"SB_AGD\240_269\ITALIAN\XBX_0265.agd",
+    0x526497429312636D: r"LEVELS\L_1_5_B\SECTIONS\s_10.rws",
+    0x52697BD701BDF9C1: r"SB_AWD\120_149\ENGLISH\PS2_0126.awd",
+    0x526A6D6AC9A2F4B2: r"SB_AWD\240_269\GERMAN\XBX_0252.awd",
+    0x526AF6A512C8AD6A: r"SB_AWD\90_119\ENGLISH\NGC_0099.awd",
+    0x5274251CA846F8C2: r"SB_AGD\30_59\SPANISH\NGC_0032.agd",
+    0x5276C2836C81171E: r"SB_AWD\30_59\FRENCH\XBX_0056.awd",
+    0x527E1DF2145EBB31: r"SB_AWD\60_89\FRENCH\PS2_0065.awd",
+    0x5283561FE4D8F2F7: r"SB_AWD\60_89\SPANISH\XBX_0086.awd",
+    0x528A30267D399F27: r"SB_AWD\90_119\ENGLISH\XBX_0113.awd",
+    0x528C454670376196: r"SB_AGD\90_119\ITALIAN\XBX_0093.agd",
+    0x52924E860BEC59CC: r"SHELL\LOAD\L_1_2_B.txd",
+    0x529789239CBBC51F: r"LEVELS\L_3_5_C\SECTIONS\s_11.rws",
+    0x5298EAE74879F486: r"SB_AGD\180_209\GERMAN\PS2_0180.agd",
+    0x52A18EF27232F910: r"SB_AWD\180_209\FRENCH\PS2_0184.awd",
+    0x52A66087F8B9D659: r"SB_AWD\210_239\SPANISH\NGC_0233.awd",
+    0x52AF352A533332A3: r"SB_AGD\180_209\ITALIAN\NGC_0203.agd",
+    0x52B8615A5320D933: r"SB_AGD\60_89\GERMAN\NGC_0086.agd",
+    0x52BA454A72AFB2B4: r"SB_AWD\150_179\ITALIAN\PS2_0178.awd",
+    0x52BA6C86701F523C: r"SB_AWD\30_59\ENGLISH\XBX_0050.awd",
+    0x52C04B63AE26EBED: r"SB_AWD\240_269\ITALIAN\PS2_0250.awd",
+    0x52C2789F1AA71C77: r"ANIMGRPS\Lvl_15\Lvl_15X.ads",
+    0x52CD6B565735BF0C: r"ActivisionSplash.layout",
+    0x52E0E63B968D13D5: r"SB_AWD\0_29\GERMAN\PS2_0001.awd",
+    0x52E246CD7EE96901: r"SB_AWD\180_209\ITALIAN\NGC_0191.awd",
+    0x52E8D255777902DD: r"SB_AWD\210_239\SPANISH\PS2_0232.awd",
+    0x52E900034216D2A1: r"SB_AWD\30_59\FRENCH\XBX_0033.awd",
+    0x52E98B5506824BED: r"SB_AGD\30_59\GERMAN\PS2_0043.agd",
+    0x52EE6B9CF8154D9F: r"SB_AWD\210_239\FRENCH\XBX_0233.awd",
+    0x52F2B204570AAE85: r"SB_AGD\30_59\ENGLISH\PS2_0041.agd",
+    0x52FF70BCE374CD6F: r"SB_AGD\210_239\ITALIAN\NGC_0217.agd",
+    0x5303AD99E0D9514B: r"SB_AGD\90_119\FRENCH\XBX_0111.agd",
+    0x53079049E56B36E4: r"SB_AWD\120_149\GERMAN\PS2_0125.awd",
+    0x530EC90899F79A1A: r"SB_AWD\60_89\ITALIAN\PS2_0066.awd",
+    0x531019F16EFD41F1: r"LEVELS\L_3_4\global.dff",
+    0x53131BC2A51CBDFD: r"SB_AWD\180_209\ITALIAN\NGC_0201.awd",
+    0x53139066002276DF: r"SHELL\FONTS\mtw20.png",
+    0x5313CA4CF1DD5875: r"SB_AWD\60_89\SPANISH\NGC_0077.awd",
+    0x53173819B74A79C7: r"ANIMGRPS\Lvl_15\Lvl_15H.ads",
+    0x531A3972E0DDBC04: r"SB_AWD\120_149\SPANISH\PS2_0130.awd",
+    0x5322AB8F35689D58: r"SB_AWD\150_179\ENGLISH\XBX_0173.awd",
+    0x5326110A0873BE94: r"SB_AWD\60_89\SPANISH\NGC_0087.awd",
+    0x532622E8F7989E45: r"SB_AWD\240_269\ENGLISH\XBX_0248.awd",
+    0x53267295169B5348: r"SB_AWD\30_59\FRENCH\XBX_0054.awd",
+    0x532BAECD65DEA9FF: r"SB_AGD\150_179\FRENCH\PS2_0155.agd",
+    0x532D076690C892B4: r"LEVELS\L_1_5\global.dff",
+    0x532DAEABE06E15BC: r"SB_AWD\0_29\FRENCH\XBX_0005.awd",
+    0x533E56A849D2BBFB: r"LEVELS\L_3_1\SECTIONS\s_22.rws",
+    0x5348472AE4F69C19: r"SHELL\MOVIES\Act_1.bik",
+    0x5349CD81B59E9D23: r"SB_AWD\90_119\ITALIAN\XBX_0108.awd",
+    0x534F505D6D7CA4A1: r"ANIMGRPS\Lvl_24\Lvl_24Z.ads",
+    0x5350422EE77A3374: r"SB_AGD\150_179\GERMAN\PS2_0165.agd",
+    0x535073E81F1644D8: r"Multiplayer.layout",
+    0x535A3926B2DB0AE3: r"SB_AGD\180_209\ITALIAN\PS2_0202.agd",
+    0x535BA963AE064289: r"SB_AWD\60_89\ENGLISH\XBX_0084.awd",
+    0x5363E3B4744E5E9D: r"SB_AWD\240_269\GERMAN\XBX_0268.awd",
+    0x53719FCB349E8D4A: r"SB_AWD\90_119\ENGLISH\PS2_0098.awd",
+    0x5373DDD67294A135: r"SB_AWD\240_269\GERMAN\NGC_0253.awd",
+    0x5376C916AB7A4EC5: r"SB_AGD\60_89\ITALIAN\PS2_0069.agd",
+    0x5378A0E10C4B12EF: r"SB_AGD\150_179\SPANISH\PS2_0155.agd",
+    0x5380EFFD794DDCEE: r"SB_AGD\30_59\FRENCH\PS2_0055.agd",
+    0x53865B64FB34466F: r"SB_AWD\0_29\ITALIAN\XBX_0006.awd",
+    0x5398C8890D784D33: r"SB_AGD\240_269\SPANISH\NGC_0253.agd",
+    0x539A98A24A5AC06C: r"SB_AWD\240_269\ENGLISH\PS2_0268.awd",
+    0x539DD0AA698EE472: r"SB_AWD\150_179\ENGLISH\PS2_0172.awd",
+    0x539EE44433542D56: r"SB_AGD\120_149\ENGLISH\NGC_0128.agd",
+    0x53A3B3D84F6FAB47: r"SB_AWD\0_29\FRENCH\PS2_0023.awd",
+    0x53A40FD80A200231: r"ANIMGRPS\Lvl_24\Lvl_24J.ads",
+    0x53BEACE6380D6ECB: r"SB_AWD\30_59\ENGLISH\PS2_0043.awd",
+    0x53BF473DC2617373: r"SB_AWD\60_89\GERMAN\NGC_0086.awd",
+    0x53C03DC1927E5A2D: r"SB_AGD\90_119\ITALIAN\NGC_0113.agd",
+    0x53C1EBD44F357C8F: r"SB_AWD\180_209\ITALIAN\NGC_0207.awd",
+    0x53C615AC3EE3D969: r"SB_AGD\210_239\ENGLISH\PS2_0236.agd",
+    0x53C7E3C266F9A9CD: r"SB_AWD\30_59\GERMAN\XBX_0040.awd",
+    0x53C96219E71210E1: r"LEVELS\L_1_2_B\level.rws",
+    0x53D6795BCBF4EAE8: r"SB_AWD\0_29\SPANISH\PS2_0002.awd",
+    0x53E8997729669796: r"SB_AGD\240_269\ENGLISH\PS2_0248.agd",
+    0x53F2EDCB727CAEDF: r"SB_AGD\210_239\SPANISH\XBX_0224.agd",
+    0x53F484B81A165204: r"ANIMGRPS\Lvl_32\Lvl_32I.ads",
+    0x540200D2C444EAAD: r"SB_AWD\120_149\SPANISH\XBX_0125.awd",
+    0x54069319E7461255: r"LEVELS\L_1_2_B\level.dff",
+    0x540C14B212A77B01: r"SB_AWD\180_209\ITALIAN\XBX_0180.awd",
+    0x540D42E676203F6E: r"SB_AGD\180_209\GERMAN\NGC_0196.agd",
+    0x540FD74CB7DACD7F: r"SB_AWD\90_119\GERMAN\XBX_0117.awd",
+    0x541A5C9D1F405487: r"SB_AGD\180_209\ITALIAN\XBX_0182.agd",
+    0x541DC50B1774F865: r"SB_AWD\240_269\FRENCH\PS2_0243.awd",
+    0x541F973B5F8B20B4: r"SB_AWD\30_59\SPANISH\NGC_0052.awd",
+    0x542394387E6E2F24: r"LEVELS\L_1_3_A\SECTIONS\s_21.rws",
+    0x5430C00F23684EF8: r"SB_AGD\30_59\FRENCH\PS2_0057.agd",
+    0x5431F5F8C46FAE99: r"AUDIO\GERMAN\PS2_1m3.rws",
+    0x5441E6212E5582A5: r"SB_AGD\210_239\FRENCH\PS2_0232.agd",
+    0x54494432B6B9AF94: r"ANIMGRPS\Lvl_32\Lvl_32Y.ads",
+    0x544A58B3F475174E: r"SB_AWD\240_269\ENGLISH\PS2_0266.awd",
+    0x545242FE22F5D358: r"SB_AWD\120_149\GERMAN\XBX_0126.awd",
+    0x545B7DC5EA886488: r"SHELL\MOVIES\SPANISH\2_1_Mon.bik",
+    0x546F0DD33C97193F: r"SB_AGD\90_119\ITALIAN\NGC_0115.agd",
+    0x54702286AC800D1E: r"SB_AWD\150_179\GERMAN\NGC_0153.awd",
+    0x547733D41113425F: r"SB_AWD\30_59\GERMAN\XBX_0046.awd",
+    0x5481FE4E46249CAB: r"SB_AGD\150_179\ITALIAN\PS2_0151.agd",
+    0x548E4C3C2B61CFC3: r"i_background1.layout",
+    0x549303281D0094D6: r"SB_AGD\150_179\ENGLISH\NGC_0173.agd",
+    0x54956D07DC81349D: r"SB_AGD\90_119\GERMAN\XBX_0106.agd",
+    0x5496357C4D6CA4E4: r"SB_AGD\90_119\GERMAN\NGC_0097.agd",
+    0x54989BF1247E6660: r"SB_AWD\60_89\FRENCH\XBX_0067.awd",
+    0x549A8F9D7E06547B: r"SB_AGD\240_269\SPANISH\XBX_0251.agd",
+    0x549E68C9CEF3FB48: r"SB_AGD\180_209\GERMAN\XBX_0206.agd",
+    0x54A2E5D25DE33201: r"ANIMGRPS\Lvl_14\Lvl_14H.ads",
+    0x54ABDAB99DBBD111: r"SB_AGD\0_29\GERMAN\NGC_0013.agd",
+    0x54B10794488D895C: r"SB_AGD\120_149\ITALIAN\NGC_0126.agd",
+    0x54B4ECD593571E0C: r"SB_AGD\180_209\SPANISH\XBX_0181.agd",
+    0x54B68611B494627F: r"SB_AGD\60_89\FRENCH\XBX_0086.agd",
+    0x54BD12F8203AB178: r"SB_AGD\180_209\GERMAN\NGC_0194.agd",
+    0x54C5EB4475F66E56: r"LEVELS\MP_6\global.dff",
+    0x54C5F4FF02222FC5: r"SB_AWD\210_239\ENGLISH\NGC_0211.awd",
+    0x54CE03C4C4AB34AA: r"gui_map5_death.index",
+    0x54CF5D1D2E0067D8: r"SB_AGD\90_119\FRENCH\NGC_0118.agd",
+    0x54D11DB75337D46E: r"SB_AGD\60_89\GERMAN\XBX_0081.agd",
+    0x54D9205A1ECD79AA: r"SB_AWD\60_89\SPANISH\PS2_0066.awd",
+    0x54E260068215C8A1: r"SB_AWD\150_179\GERMAN\NGC_0176.awd",
+    0x54F22B68293B8B91: r"SB_AWD\240_269\SPANISH\XBX_0244.awd",
+    0x54F2B6052B1A2D69: r"SB_AGD\120_149\GERMAN\NGC_0121.agd",
+    0x54F7A54CFA868F91: r"ANIMGRPS\Lvl_14\Lvl_14X.ads",
+    0x54FB8CE38F83FDE9: r"SB_AGD\0_29\GERMAN\PS2_0023.agd",
+    0x54FBBAF8F405FB10: r"SB_AGD\180_209\GERMAN\PS2_0182.agd",
+    0x54FDDB13F9F9A920: r"SB_AGD\180_209\GERMAN\PS2_0191.agd",
+    0x5503BF041DBDF042: r"SB_AWD\180_209\FRENCH\PS2_0182.awd",
+    0x550E96FFA93FA7C8: r"SB_AGD\150_179\SPANISH\NGC_0162.agd",
+    0x55142BB92AB7C8A9: r"AUDIO\ITALIAN\NGC_2s3.rws",
+    0x55190490A619B2E2: r"SB_AWD\0_29\GERMAN\PS2_0028.awd",
+    0x551FD298569A4948: r"SB_AWD\150_179\GERMAN\NGC_0151.awd",
+    0x5524E52357290BC5: r"SB_AGD\150_179\ENGLISH\NGC_0163.agd",
+    0x5528F1F7C5575C3B: r"AUDIO\SPANISH\XBX_1m2.rws",
+    0x5539354E337A9391: r"SB_AGD\180_209\ENGLISH\PS2_0204.agd",
+    0x55395B1B830CB6DD: r"SB_AGD\30_59\ENGLISH\XBX_0037.agd",
+    0x5541832AE4B29D06: r"SB_AWD\240_269\FRENCH\PS2_0266.awd",
+    0x554206B9F50DF705: r"LEVELS\L_3_1\SECTIONS\s_20.rws",
+    0x5544BD19869ACD2F: r"SB_AGD\90_119\GERMAN\XBX_0100.agd",
+    0x554756FA30695403: r"SB_AWD\180_209\ITALIAN\NGC_0180.awd",
+    0x5551B1E407FBEACB: r"ANIMGRPS\Lvl_14\Lvl_14J.ads",
+    0x55606942624EF1F2: r"ANIMGRPS\Lvl_12\Lvl_12C.ads",
+    0x55667DAB8C6557E5: r"SB_AGD\90_119\FRENCH\XBX_0113.agd",
+    0x557E527D6AACDB59: r"SB_AWD\240_269\FRENCH\XBX_0266.awd",
+    0x558031781940472E: r"SB_AGD\120_149\ENGLISH\PS2_0129.agd",
+    0x5580EDC8FD524678: r"SB_AGD\60_89\GERMAN\XBX_0083.agd",
+    0x558232348C5D7991: r"SB_AWD\240_269\SPANISH\PS2_0254.awd",
+    0x5588C622D8B5EA1A: r"SB_AGD\240_269\ITALIAN\XBX_0254.agd",
+    0x5591B0182C2F6133: r"SB_AWD\150_179\GERMAN\NGC_0178.awd",
+    0x559510B2714EB2FF: r"SB_AWD\120_149\ENGLISH\XBX_0123.awd",
+    0x559534B031E33FA1: r"SB_AWD\150_179\ENGLISH\NGC_0174.awd",
+    0x559CD962CF3A35FA: r"SB_AWD\120_149\FRENCH\PS2_0125.awd",
+    0x559DFB1033E456C2: r"SB_AGD\30_59\FRENCH\XBX_0045.agd",
+    0x55AB8049B01BA162: r"SB_AWD\90_119\FRENCH\PS2_0096.awd",
+    0x55B213C10ACBAE6F: r"SB_AGD\210_239\ITALIAN\PS2_0223.agd",
+    0x55B528BCFEF24F42: r"ANIMGRPS\Lvl_12\Lvl_12S.ads",
+    0x55B624405F49AF46: r"SB_AWD\0_29\GERMAN\PS2_0015.awd",
+    0x55B9F768082BF0FD: r"SB_AWD\120_149\FRENCH\PS2_0144.awd",
+    0x55BB0EF3B5DF790D: r"SB_AGD\120_149\ITALIAN\XBX_0147.agd",
+    0x55C7398E63349DA1: r"SB_AGD\210_239\FRENCH\XBX_0226.agd",
+    0x55C7D0091FC71396: r"SB_AGD\30_59\ENGLISH\PS2_0055.agd",
+    0x55CB2B8DBDB2ACCF: r"ANIMGRPS\Lvl_33\Lvl_33L.ads",
+    0x55D345261EDADD95: r"SB_AWD\240_269\FRENCH\PS2_0250.awd",
+    0x55D3B5350141CAD7: r"SB_AGD\150_179\ENGLISH\NGC_0165.agd",
+    0x55D7046F4655A67D: r"SB_AGD\240_269\FRENCH\NGC_0251.agd",
+    0x55E95B76A6C09E09: r"SB_AWD\0_29\ITALIAN\XBX_0004.awd",
+    0x55EFC608DACBB53F: r"gui_map8_ctf.dds",
+    0x55F1919FBFF78F1E: r"SB_AWD\120_149\ITALIAN\PS2_0147.awd",
+    0x56017E5CC9CEDBA3: r"SB_AGD\120_149\ENGLISH\NGC_0143.agd",
+    0x5601F269422EE575: r"SB_AWD\0_29\SPANISH\XBX_0008.awd",
+    0x560A23303FB3F3F6: r"SB_AWD\210_239\GERMAN\NGC_0236.awd",
+    0x560F45540C67C544: r"ANIMGRPS\Lvl_12\Lvl_12M.ads",
+    0x5619E178DF7D9410: r"SB_AWD\120_149\ITALIAN\NGC_0122.awd",
+    0x56252DEE43FE0F4F: r"SB_AGD\90_119\ITALIAN\NGC_0106.agd",
+    0x56259A08DAF8FA5C: r"gui_map8_ctf.txd",
+    0x563A6377ECB4831A: r"LEVELS\L_3_5_C\SECTIONS\s_1.rws",
+    0x563FA78AB2F09069: r"SB_AGD\180_209\SPANISH\NGC_0205.agd",
+    0x564BC97479532B74: r"SB_AWD\120_149\FRENCH\PS2_0127.awd",
+    0x564E4337666CC866: r"SB_AWD\210_239\GERMAN\PS2_0224.awd",
+    0x5654CDDD1E071D19: r"SB_AGD\210_239\SPANISH\XBX_0226.agd",
+    0x565532E49920C9E9: r"LEVELS\MP_5\CLUMPS\cbank_00.bin",
+    0x56563A4718AF01EE: r"SB_AWD\120_149\ENGLISH\PS2_0136.awd",
+    0x5668C779B244AF8F: r"SB_AWD\120_149\FRENCH\PS2_0142.awd",
+    0x566C36BF45EBEA47: r"SB_AWD\0_29\ENGLISH\XBX_0006.awd",
+    0x56823537C8F3D307: r"SB_AWD\240_269\FRENCH\PS2_0256.awd",
+    0x5682F0B054F58481: r"SB_AWD\30_59\ENGLISH\NGC_0039.awd",
+    0x568A507B43B7CF4F: r"AUDIO\GERMAN\NGC_2s3.rws",
+    0x568E636AC92EBC46: r"SB_AGD\0_29\SPANISH\XBX_0018.agd",
+    0x56A141B16A11CB48: r"SB_AWD\120_149\ITALIAN\PS2_0145.awd",
+    0x56AEB7137DC0F8F6: r"SB_AWD\30_59\ITALIAN\XBX_0056.awd",
+    0x56B5B5FF27090923: r"SHELL\MOVIES\FRENCH\Act_1.bik",
+    0x56BA54E6DDD5C907: r"SB_AGD\120_149\SPANISH\PS2_0142.agd",
+    0x56CFA7AC517ED4D9: r"SB_AGD\60_89\GERMAN\XBX_0068.agd",
+    0x56D9C078ADBF19E1: r"SB_AWD\0_29\ITALIAN\NGC_0019.awd",
+    0x56E1A5097539CD8D: r"LEVELS\L_1_3_B\SECTIONS\s_16.rws",
+    0x56EBAB87129A1AA9: r"SB_AGD\180_209\SPANISH\PS2_0204.agd",
+    0x56EBBB705F59F295: r"SB_AGD\30_59\ITALIAN\XBX_0055.agd",
+    0x56EEDA671AE49EF8: r"SB_AGD\60_89\GERMAN\PS2_0079.agd",
+    0x56F6D64D438AE547: r"SB_AWD\0_29\GERMAN\PS2_0007.awd",
+    0x56FD135411AD1BD2: r"SB_AWD\210_239\ENGLISH\NGC_0238.awd",
+    0x56FD9349108660F0: r"SB_AWD\210_239\GERMAN\PS2_0226.awd",
+    0x56FF5B66B37FE6FF: r"SB_AGD\30_59\GERMAN\PS2_0045.agd",
+    0x5708821604084997: r"SB_AGD\30_59\ENGLISH\PS2_0047.agd",
+    0x57099B7AAF21A265: r"SB_AGD\120_149\SPANISH\NGC_0149.agd",
+    0x5709BFE84B216B3D: r"SB_AWD\120_149\SPANISH\NGC_0141.awd",
+    0x570D7E7E4BD0A4B4: r"SB_AGD\150_179\GERMAN\XBX_0153.agd",
+    0x573EE63DE01CDFAA: r"SB_AGD\240_269\ITALIAN\XBX_0247.agd",
+    0x574476DF434D1BF8: r"ANIMGRPS\Lvl_36\Lvl_36U.ads",
+    0x57472B8D691C930B: r"SB_AGD\240_269\SPANISH\XBX_0242.agd",
+    0x5749D833DAF1C2CB: r"SB_AWD\0_29\ENGLISH\PS2_0001.awd",
+    0x57531B2B3B499952: r"SB_AGD\30_59\FRENCH\XBX_0030.agd",
+    0x575A715EA6128FDB: r"ANIMGRPS\Lvl_14\Lvl_14Z.ads",
+    0x575B7306DEC856BD: r"SB_AWD\150_179\ITALIAN\NGC_0178.awd",
+    0x57602B25A584D632: r"SB_AGD\180_209\GERMAN\PS2_0197.agd",
+    0x5760B0B08AE62516: r"SB_AWD\210_239\FRENCH\NGC_0227.awd",
+    0x576331B983ADD162: r"SB_AGD\60_89\SPANISH\XBX_0087.agd",
+    0x5766DD8B0799CCDE: r"SB_AWD\90_119\FRENCH\XBX_0118.awd",
+    0x576B433C91FF0CCF: r"SHELL\MOVIES\Act_3.bik",
+    0x57707EFEEBE71D3F: r"CurrentVoteGame.layout",
+    0x57832C9D0B6A8121: r"SB_AGD\240_269\SPANISH\PS2_0247.agd",
+    0x5795B077AD7BB83D: r"SHELL\FONTS\mtw22.png",
+    0x5798B745A3489EB8: r"SB_AWD\60_89\ITALIAN\NGC_0083.awd",
+    0x579AB5090C54BE52: r"SB_AWD\0_29\GERMAN\NGC_0029.awd",
+    0x57AA7CB0EF2B5ABA: r"SB_AWD\180_209\ITALIAN\XBX_0208.awd",
+    0x57B0EE154DA16B7F: r"SB_AWD\180_209\GERMAN\XBX_0191.awd",
+    0x57C0634B471B1FE6: r"SB_AWD\210_239\GERMAN\NGC_0229.awd",
+    0x57D47CF7E50B09E5: r"SB_AWD\30_59\ENGLISH\PS2_0041.awd",
+    0x57D4AEA9CE4F708E: r"LEVELS\L_1_1\CLUMPS\cbank_02.bin",
+    0x57D563084573F121: r"SB_AGD\210_239\GERMAN\PS2_0230.agd",
+    0x57DEC4F5A78973BB: r"SB_AWD\180_209\ENGLISH\NGC_0203.awd",
+    0x57E5063E7EE8985B: r"SB_AGD\210_239\ITALIAN\XBX_0220.agd",
+    0x57EDB64F8A359F44: r"SB_AGD\240_269\ITALIAN\XBX_0245.agd",
+    0x57F5D954F3722197: r"w_common.txd",
+    0x57FFA29478C4F392: r"SB_AGD\90_119\ENGLISH\NGC_0114.agd",
+    0x580734AE4FE2841E: r"LEVELS\L_3_4\SECTIONS\s_13.rws",
+    0x58084607673BE201: r"LEVELS\MP_1\SECTIONS\s_5.rws",
+    0x5809B1CFA5CFEAD5: r"SB_AGD\210_239\SPANISH\PS2_0225.agd",
+    0x5816568327002A07: r"Message.layout",
+    0x5825175E64D773D9: r"SB_AWD\90_119\GERMAN\XBX_0115.awd",
+    0x582BD554F39FAA24: r"w_common.dds",
+    0x584D73CE5D79BF40: r"SHELL\FEND\ldBanner.png",
+    0x5856E40805160BAE: r"SB_AWD\0_29\ITALIAN\PS2_0000.awd",
+    0x5864F72E852824E6: r"SB_AWD\30_59\ITALIAN\XBX_0049.awd",
+    0x5871309519CDE2EF: r"SB_AWD\120_149\SPANISH\XBX_0149.awd",
+    0x5873113193B9D27B: r"SB_AWD\60_89\FRENCH\NGC_0080.awd",
+    0x5873820D3E06ED21: r"SB_AWD\0_29\ITALIAN\PS2_0029.awd",
+    0x587C118A8B088B42: r"SB_AWD\120_149\ITALIAN\NGC_0124.awd",
+    0x587E8DB68FEFBDE9: r"SB_AWD\150_179\GERMAN\XBX_0152.awd",
+    0x5882A9CE5C4C1379: r"SB_AGD\30_59\GERMAN\NGC_0051.agd",
+    0x588D41AA8FBFD8EE: r"SB_AGD\0_29\ENGLISH\XBX_0021.agd",
+    0x589325475F26A4C1: r"SB_AGD\90_119\SPANISH\PS2_0109.agd",
+    0x5893D65029015775: r"SB_AGD\210_239\ITALIAN\XBX_0222.agd",
+    0x589A581C8BDEEEE1: r"KickedScoreBoardDeath.layout",
+    0x589B90225925DE06: r"LEVELS\L_1_1_B\SECTIONS\s_4.rws",
+    0x58A155F3E3400A3D: r"SB_AWD\60_89\FRENCH\NGC_0077.awd",
+    0x58AFDF4DDA4B5E62: r"SB_AGD\120_149\SPANISH\XBX_0140.agd",
+    0x58B4435288AC3CB1: r"SB_AGD\210_239\ENGLISH\NGC_0215.agd",
+    0x58B47B81BAE5290F: r"SB_AGD\30_59\GERMAN\PS2_0056.agd",
+    0x58B981E14FEA5CE7: r"SB_AGD\210_239\SPANISH\PS2_0223.agd",
+    0x58BF6C127DCCA09C: r"SB_AGD\30_59\ENGLISH\NGC_0052.agd",
+    0x58DAA510AF1DE177: r"SB_AWD\210_239\ENGLISH\NGC_0217.awd",
+    0x58E7EBF037F3D7B0: r"SB_AGD\0_29\ENGLISH\PS2_0024.agd",
+    0x58EE506BCBCA0564: r"SB_AWD\60_89\SPANISH\PS2_0064.awd",
+    0x590115582B5C55E7: r"SB_AWD\210_239\GERMAN\NGC_0233.awd",
+    0x5905D419AF2F0118: r"SB_AWD\0_29\ITALIAN\PS2_0002.awd",
+    0x590CC11340080658: r"SHELL\HUD\INSTANCE\XBOX\HUD.TXD",
+    0x590F8B635D8CD2CC: r"SB_AWD\90_119\FRENCH\PS2_0111.awd",
+    0x5910F52C3A59D141: r"SB_AWD\150_179\SPANISH\XBX_0176.awd",
+    0x5922D21EE82085B3: r"SB_AWD\0_29\ITALIAN\PS2_0027.awd",
+    0x59240B4A1BDB628A: r"SB_AWD\0_29\GERMAN\XBX_0012.awd",
+    0x59277AF64A4E38E2: r"SB_AWD\240_269\ITALIAN\NGC_0256.awd",
+    0x592CD847809451F4: r"AUDIO\FRENCH\XBX_1s3.rws",
+    0x5930CDD9B79C78AE: r"LEVELS\L_1_1\SECTIONS\s_5.rws",
+    0x593D11BC39DA4AF8: r"SB_AGD\0_29\ENGLISH\XBX_0023.agd",
+    0x5940247D887470F1: r"SB_AGD\210_239\ITALIAN\NGC_0233.agd",
+    0x5941F559093F63D3: r"SB_AGD\90_119\SPANISH\PS2_0107.agd",
+    0x59496A669D3E53E1: r"SB_AWD\90_119\ITALIAN\PS2_0109.awd",
+    0x594EAB2D3009786F: r"SB_AGD\30_59\ENGLISH\XBX_0031.agd",
+    0x5951B88C9186381D: r"SB_AGD\60_89\SPANISH\NGC_0082.agd",
+    0x59534E68E151F02E: r"SB_AGD\240_269\ENGLISH\XBX_0269.agd",
+    0x5953CA3B203323AB: r"SB_AWD\180_209\GERMAN\PS2_0181.awd",
+    0x5957171F6AD5CD39: r"SB_AWD\120_149\SPANISH\PS2_0148.awd",
+    0x5960866830BC4234: r"ANIMGRPS\Lvl_13\Lvl_13O.ads",
+    0x5963DB9364FEDD49: r"SB_AGD\30_59\GERMAN\PS2_0054.agd",
+    0x5968FD6362A1BE32: r"SB_AWD\90_119\ITALIAN\PS2_0098.awd",
+    0x5974D6B52BF95DDC: r"SB_AWD\210_239\FRENCH\PS2_0228.awd",
+    0x5974E51C2B1F0120: r"SB_AWD\240_269\SPANISH\NGC_0258.awd",
+    0x5976AA6B1BEA2AF2: r"ANIMGRPS\Lvl_31\Lvl_31U.ads",
+    0x59793D151E8FB43C: r"SB_AGD\240_269\GERMAN\XBX_0265.agd",
+    0x597CFAB8F933B2AD: r"SB_AGD\30_59\GERMAN\XBX_0040.agd",
+    0x597F0E8843217938: r"SB_AWD\150_179\GERMAN\NGC_0164.awd",
+    0x5986B6AB2CF0A70B: r"SB_AGD\90_119\ITALIAN\XBX_0100.agd",
+    0x5989FD12EC70EF15: r"SB_AWD\30_59\ENGLISH\PS2_0056.awd",
+    0x59A140A76E1E22AF: r"LEVELS\L_3_4\SECTIONS\s_5.rws",
+    0x59A2FA1C4FDB152D: r"SB_AGD\180_209\ENGLISH\XBX_0184.agd",
+    0x59A390B2B609954D: r"SB_AGD\120_149\FRENCH\NGC_0149.agd",
+    0x59A5A93B69695AE7: r"SB_AWD\30_59\ITALIAN\XBX_0053.awd",
+    0x59A8FB9F14A6E6A5: r"SB_AGD\240_269\SPANISH\XBX_0240.agd",
+    0x59AA50C41E4B5959: r"SB_AWD\120_149\ENGLISH\XBX_0121.awd",
+    0x59B57D4556031B29: r"SB_AWD\0_29\GERMAN\XBX_0024.awd",
+    0x59C280C2367078A0: r"SB_AWD\210_239\FRENCH\NGC_0225.awd",
+    0x59CAD38E40BE6E1B: r"SB_AWD\210_239\ITALIAN\XBX_0219.awd",
+    0x59CB69E5B88D8842: r"ANIMGRPS\Lvl_31\Lvl_31E.ads",
+    0x59DB2C62EF5A2D16: r"SB_AWD\240_269\ENGLISH\PS2_0248.awd",
+    0x59DD6F4345DA2878: r"SB_AGD\240_269\ENGLISH\NGC_0258.agd",
+    0x59DFE1A1685D54C6: r"SB_AWD\210_239\ITALIAN\PS2_0231.awd",
+    0x59ED367AF13E7952: r"SB_AWD\60_89\ITALIAN\XBX_0069.awd",
+    0x5A01089E3B9FD0AF: r"SB_AGD\60_89\SPANISH\NGC_0084.agd",
+    0x5A069B429C6414DE: r"SB_AWD\120_149\GERMAN\NGC_0139.awd",
+    0x5A06C71765477817: r"SB_AWD\240_269\SPANISH\NGC_0262.awd",
+    0x5A0B0AA2B3EB4F3A: r"LEVELS\L_1_1\SECTIONS\s_10.rws",
+    0x5A0F5A79DAD50816: r"ANIMGRPS\Lvl_13\Lvl_13M.ads",
+    0x5A22CBA950CADE66: r"SB_AGD\210_239\SPANISH\PS2_0239.agd",
+    0x5A2BCACAA34C71BF: r"SB_AGD\30_59\GERMAN\XBX_0046.agd",
+    0x5A2D2213B6779C4A: r"LOC\EN\INGAME.LOC",
+    0x5A3119CE92466ABC: r"AUDIO\ENGLISH\NGC_2s2.rws",
+    0x5A31DA83622D2E21: r"SB_AGD\240_269\FRENCH\PS2_0254.agd",
+    0x5A328F50CBB7253D: r"SB_AWD\90_119\SPANISH\NGC_0100.awd",
+    0x5A38ED249689E487: r"SB_AWD\30_59\ENGLISH\PS2_0050.awd",
+    0x5A3A8DFFF0FAEB89: r"SB_AGD\90_119\ITALIAN\NGC_0104.agd",
+    0x5A4B7BEF6F35CC60: r"ANIMGRPS\Lvl_24\Lvl_24O.ads",
+    0x5A51CA2DF9F3D43F: r"SB_AGD\180_209\ENGLISH\XBX_0182.agd",
+    0x5A5462BD7098EF97: r"SB_AWD\210_239\FRENCH\NGC_0231.awd",
+    0x5A55367245F317E0: r"SHELL\HUD\XboxStrings.csv",
+    0x5A5D47CB8898979B: r"SB_AGD\60_89\ENGLISH\PS2_0063.agd",
+    0x5A5F9F66B152E444: r"SB_AWD\180_209\ENGLISH\XBX_0181.awd",
+    0x5A670E673F926EF7: r"SHELL\MOVIES\SPANISH\2_2_Mon.bik",
+    0x5A68EC5704C27829: r"LEVELS\MP_2\SECTIONS\s_11.rws",
+    0x5A6926FD3F78DF3A: r"AUDIO\ENGLISH\NGC_4s2.rws",
+    0x5A6C2A58C5ACD358: r"SB_AWD\120_149\ENGLISH\PS2_0134.awd",
+    0x5A71865F5FFF134C: r"SB_AGD\210_239\GERMAN\NGC_0230.agd",
+    0x5A7B45F762A80ED4: r"ANIMGRPS\Lvl_31\Lvl_31K.ads",
+    0x5A9A5128F8E68B39: r"SB_AWD\60_89\ITALIAN\NGC_0068.awd",
+    0x5AA39086D32F7E54: r"SB_AWD\60_89\SPANISH\PS2_0073.awd",
+    0x5AA94EEA295A8184: r"SB_AWD\120_149\SPANISH\XBX_0120.awd",
+    0x5AC1985F094BD252: r"XboxSysLinkCreateSession.layout",
+    0x5AC307B21696D251: r"SHELL\FONTS\cn8.met",
+    0x5ACA73899A19E704: r"LEVELS\L_3_5_C\SECTIONS\s_3.rws",
+    0x5ACBF4624857F48C: r"SB_AGD\30_59\ITALIAN\PS2_0035.agd",
+    0x5ACE1494C223EA60: r"SB_AGD\30_59\SPANISH\XBX_0043.agd",
+    0x5AE72C00475553AB: r"SB_AGD\60_89\GERMAN\PS2_0061.agd",
+    0x5AEC61A79838DC4E: r"SB_AGD\210_239\ENGLISH\NGC_0234.agd",
+    0x5AEF108A5ABBDB73: r"SB_AWD\0_29\ITALIAN\NGC_0017.awd",
+    0x5AF4F4CE52B64A1C: r"SB_AWD\150_179\ITALIAN\PS2_0156.awd",
+    0x5AF544988FD9B301: r"SB_AGD\210_239\ITALIAN\NGC_0220.agd",
+    0x5AFD842591D0535E: r"SB_AWD\120_149\GERMAN\PS2_0130.awd",
+    0x5B008B820C55DAA7: r"SB_AGD\30_59\ITALIAN\XBX_0053.agd",
+    0x5B1F8FF9F81F06CF: r"SB_AWD\120_149\SPANISH\NGC_0147.awd",
+    0x5B208922632F4ABA: r"SB_AWD\0_29\GERMAN\NGC_0018.awd",
+    0x5B293ED9DFCEC6E3: r"SHELL\MOVIES\atvi.bik",
+    0x5B2F688809A4028E: r"SB_AWD\30_59\ENGLISH\XBX_0041.awd",
+    0x5B3EAE744736ADDD: r"AUDIO\SPANISH\XBX_4m1.rws",
+    0x5B48338149E4F33E: r"SB_AWD\150_179\SPANISH\XBX_0153.awd",
+    0x5B4F6881365FFD7A: r"SB_AGD\120_149\FRENCH\PS2_0143.agd",
+    0x5B5D5B13156F34C0: r"SB_AWD\150_179\ENGLISH\XBX_0151.awd",
+    0x5B5FA84587EF5DE5: r"SB_AWD\0_29\ENGLISH\PS2_0003.awd",
+    0x5B85544BB9378D00: r"SB_AGD\30_59\GERMAN\XBX_0038.agd",
+    0x5B9A7F811E9944C8: r"SB_AGD\180_209\SPANISH\PS2_0182.agd",
+    0x5B9DA53D2DB47E05: r"SB_AWD\30_59\FRENCH\PS2_0049.awd",
+    0x5B9E8985997EC3DF: r"SB_AGD\120_149\SPANISH\PS2_0133.agd",
+    0x5BA3F4DFFCCF5ABE: r"SB_AWD\150_179\ITALIAN\PS2_0158.awd",
+    0x5BAEBF5A549B3A5D: r"SB_AGD\180_209\ITALIAN\PS2_0183.agd",
+    0x5BB2FF5AE8A7BE8B: r"LEVELS\L_3_1_B\CLUMPS\cbank_02.bin",
+    0x5BBFD74FC7812ADD: r"LEVELS\L_1_5\SECTIONS\s_2.rws",
+    0x5BC50AEEE338BD4D: r"SB_AGD\210_239\ITALIAN\XBX_0213.agd",
+    0x5BC62E26FA9E11D9: r"SB_AWD\180_209\GERMAN\XBX_0193.awd",
+    0x5BCF3890972262D6: r"SB_AGD\60_89\ITALIAN\NGC_0067.agd",
+    0x5BD486A79C56F84A: r"SB_AWD\30_59\SPANISH\PS2_0046.awd",
+    0x5BE54A93A9D4CC68: r"SB_AWD\120_149\ENGLISH\NGC_0140.awd",
+    0x5BE886BCD87AFAA5: r"SB_AGD\90_119\ITALIAN\XBX_0102.agd",
+    0x5C00462B0B492CDB: r"SB_AWD\180_209\GERMAN\PS2_0192.awd",
+    0x5C0C4B24BF8829B2: r"SB_AWD\150_179\ENGLISH\XBX_0157.awd",
+    0x5C0ED720276F7F9A: r"LEVELS\L_1_5\SECTIONS\s_14.rws",
+    0x5C106096057D1847: r"w_weaponsUS.index",
+    0x5C1125CDC608257B: r"SHELL\LOAD\L_2_1.txd",
+    0x5C1A08AE862B8C52: r"SB_AGD\180_209\FRENCH\PS2_0201.agd",
+    0x5C1B8A44D7F7D876: r"SB_AGD\60_89\ITALIAN\XBX_0083.agd",
+    0x5C45C7F753E1994C: r"SB_AWD\150_179\ITALIAN\XBX_0160.awd",
+    0x5C51C0A1A7C017CC: r"SB_AWD\180_209\FRENCH\NGC_0185.awd",
+    0x5C58E05F9D3C8F51: r"SB_AWD\180_209\ENGLISH\NGC_0199.awd",
+    0x5C5953977D9199E0: r"SB_AGD\0_29\SPANISH\XBX_0009.agd",
+    0x5C5A46BF3F91B81C: r"SB_AWD\30_59\SPANISH\NGC_0030.awd",
+    0x5C5EFAE50164EDDA: r"SB_AGD\120_149\GERMAN\PS2_0134.agd",
+    0x5C60B5DACF9AE397: r"LEVELS\L_2_2\SECTIONS\s_4.rws",
+    0x5C611A8BD14AD9C5: r"SB_AGD\60_89\ITALIAN\NGC_0077.agd",
+    0x5C68464189694969: r"LEVELS\L_3_5_B\SECTIONS\s_12.rws",
+    0x5C69D54A0D365C26: r"SB_AGD\30_59\ITALIAN\XBX_0049.agd",
+    0x5C739608B5B0A67A: r"SB_AGD\240_269\ITALIAN\PS2_0262.agd",
+    0x5C74CD9A3D75A63D: r"SB_AWD\240_269\ITALIAN\NGC_0264.awd",
+    0x5C78A51AEF25BCCB: r"SB_AWD\150_179\SPANISH\NGC_0169.awd",
+    0x5C7D87DAA3663386: r"AUDIO\FRENCH\PS2_2s3.rws",
+    0x5C7E7286AB6B7334: r"SB_AGD\240_269\FRENCH\NGC_0254.agd",
+    0x5C8320E244656A2A: r"SB_AGD\240_269\FRENCH\XBX_0265.agd",
+    0x5C836665552D0286: r"SB_AWD\0_29\ENGLISH\PS2_0026.awd",
+    0x5C8CF28202FC6AC0: r"SB_AWD\120_149\GERMAN\XBX_0144.awd",
+    0x5C906BAEDCD00370: r"ANIMGRPS\Lvl_11\Lvl_11C.ads",
+    0x5CA201C29F9EF85E: r"SB_AGD\210_239\ENGLISH\NGC_0227.agd",
+    0x5CA68E5F97488321: r"SB_AGD\240_269\GERMAN\NGC_0257.agd",
+    0x5CB21170037A4FA1: r"SB_AGD\150_179\GERMAN\NGC_0169.agd",
+    0x5CB72605903DA5CF: r"SB_AWD\60_89\FRENCH\NGC_0071.awd",
+    0x5CBB17C304893111: r"SB_AGD\150_179\ENGLISH\XBX_0161.agd",
+    0x5CCB31175326B24B: r"SB_AGD\0_29\SPANISH\XBX_0020.agd",
+    0x5CCD997B161FABC4: r"SB_AWD\240_269\ITALIAN\PS2_0255.awd",
+    0x5CD49CCDF87CECF3: r"SB_AGD\60_89\GERMAN\NGC_0068.agd",
+    0x5CD5BB1FAA163787: r"SB_AGD\0_29\FRENCH\NGC_0026.agd",
+    0x5CD6068C117E091E: r"SB_AGD\210_239\GERMAN\NGC_0221.agd",
+    0x5CD86FFAC90F786C: r"SB_AWD\240_269\ENGLISH\NGC_0254.awd",
+    0x5CDB4151D23B7B98: r"w_session.txd",
+    0x5CDB4771AC9ED1AC: r"SB_AGD\210_239\ENGLISH\PS2_0220.agd",
+    0x5CE2B29CE1E6F6E3: r"SB_AWD\180_209\FRENCH\NGC_0199.awd",
+    0x5CF1CA983759080F: r"SB_AGD\150_179\ENGLISH\PS2_0164.agd",
+    0x5CF224340F230D78: r"SB_AGD\60_89\ENGLISH\XBX_0078.agd",
+    0x5CF6CCA7FEEA34FA: r"w_borderpale.txd",
+    0x5CFBCE3F2A6755A1: r"SB_AWD\90_119\FRENCH\NGC_0115.awd",
+    0x5CFDB39C514AD96E: r"SB_AWD\150_179\SPANISH\XBX_0166.awd",
+    0x5CFDBC01E4F17342: r"SB_AGD\0_29\ENGLISH\PS2_0022.agd",
+    0x5D0F15C1DDA3FAD5: r"SB_AGD\0_29\ITALIAN\NGC_0002.agd",
+    0x5D0FEA9D7B6398D7: r"SB_AGD\60_89\ITALIAN\NGC_0071.agd",
+    0x5D10B5307817FDF1: r"SB_AGD\120_149\ENGLISH\XBX_0143.agd",
+    0x5D121551D26A73DB: r"w_session.dds",
+    0x5D1528608F554315: r"SB_AWD\0_29\ENGLISH\PS2_0010.awd",
+    0x5D1D33A77D0DD3E3: r"LEVELS\L_1_2_B\SECTIONS\s_4.rws",
+    0x5D1DFA90E3A6A5EA: r"SB_AGD\90_119\SPANISH\NGC_0114.agd",
+    0x5D2B329FBDA23AA1: r"SB_AWD\60_89\GERMAN\NGC_0066.awd",
+    0x5D2BC0DD3F493910: r"SB_AWD\210_239\FRENCH\NGC_0218.awd",
+    0x5D2CB8A7FF17A261: r"w_borderpale.dds",
+    0x5D3064A66DAF1772: r"SB_AGD\30_59\SPANISH\XBX_0045.agd",
+    0x5D31F0F3EE7E29C4: r"SB_AGD\240_269\FRENCH\XBX_0267.agd",
+    0x5D387D1F4008B50A: r"SB_AWD\150_179\GERMAN\PS2_0174.awd",
+    0x5D3BE293AD155FB2: r"SB_AWD\120_149\GERMAN\XBX_0142.awd",
+    0x5D3D8411FAE4F715: r"SB_AGD\60_89\SPANISH\NGC_0077.agd",
+    0x5D480912C7469606: r"SB_AGD\0_29\FRENCH\NGC_0016.agd",
+    0x5D4DAE280481848E: r"SB_AGD\180_209\ENGLISH\XBX_0204.agd",
+    0x5D503FFA2F2C36B1: r"SB_AGD\180_209\FRENCH\PS2_0181.agd",
+    0x5D50D1D449B7B768: r"SB_AGD\210_239\ENGLISH\NGC_0225.agd",
+    0x5D5A5D5D700FF730: r"SB_AGD\90_119\FRENCH\PS2_0106.agd",
+    0x5D5EBA784A3B1573: r"SB_AWD\90_119\ITALIAN\PS2_0107.awd",
+    0x5D63E2851D36C47C: r"SB_AGD\180_209\GERMAN\XBX_0189.agd",
+    0x5D6A97D84B4451B8: r"SB_AGD\180_209\FRENCH\NGC_0189.agd",
+    0x5D713FDD20F9E511: r"AUDIO\SPANISH\PS2_1m1.rws",
+    0x5D8A86C2A3BDB77A: r"SB_AWD\30_59\SPANISH\PS2_0051.awd",
+    0x5D8AD6C6D8F74A7E: r"SB_AWD\210_239\FRENCH\PS2_0226.awd",
+    0x5D8B2AC520DCC5FA: r"SB_AGD\0_29\SPANISH\PS2_0022.agd",
+    0x5D902899810AC0BD: r"SB_AWD\60_89\ITALIAN\XBX_0071.awd",
+    0x5D9EDD0641737D1A: r"SB_AGD\0_29\GERMAN\XBX_0027.agd",
+    0x5DA12AA9E172BC49: r"SB_AGD\150_179\ENGLISH\PS2_0166.agd",
+    0x5DA700C0EB96B539: r"SB_AGD\60_89\ITALIAN\XBX_0062.agd",
+    0x5DB8A2014AB2CF21: r"SB_AWD\240_269\FRENCH\XBX_0244.awd",
+    0x5DBEE5D387BE6CE7: r"SB_AGD\0_29\ITALIAN\NGC_0004.agd",
+    0x5DC24B3FC6EEE962: r"SB_AWD\150_179\ENGLISH\XBX_0162.awd",
+    0x5DC383317ADF0CC1: r"ANIMGRPS\Lvl_22\Lvl_22F.ads",
+    0x5DC41872396E3887: r"SB_AWD\0_29\ENGLISH\PS2_0016.awd",
+    0x5DD471FE0DC77921: r"SB_AGD\0_29\FRENCH\PS2_0021.agd",
+    0x5DD8422B9A9CEF17: r"SB_AWD\0_29\SPANISH\XBX_0024.awd",
+    0x5DDA82B167BBD333: r"SB_AWD\60_89\GERMAN\NGC_0068.awd",
+    0x5DE8F3E7270963EA: r"SB_AGD\30_59\SPANISH\PS2_0046.agd",
+    0x5DEDD72328DF2BE1: r"SB_AWD\30_59\GERMAN\NGC_0059.awd",
+    0x5DEDE461128AB8A1: r"SB_AWD\30_59\ITALIAN\PS2_0045.awd",
+    0x5DF6524B8F9B600D: r"SB_AGD\0_29\ENGLISH\PS2_0018.agd",
+    0x5E00699745093219: r"SB_AGD\120_149\SPANISH\PS2_0131.agd",
+    0x5E0216F5F7F5945C: r"SB_AWD\0_29\SPANISH\NGC_0018.awd",
+    0x5E07ABE70973051E: r"SB_AWD\150_179\FRENCH\XBX_0166.awd",
+    0x5E084C8F1BCE25FB: r"SB_AGD\0_29\FRENCH\XBX_0011.agd",
+    0x5E141B0008CA306A: r"SB_AGD\120_149\GERMAN\PS2_0127.agd",
+    0x5E1942AC17841D51: r"ANIMGRPS\Lvl_22\Lvl_22V.ads",
+    0x5E26F7F3357AB6C0: r"SB_AGD\60_89\SPANISH\PS2_0068.agd",
+    0x5E31654FB2E90743: r"SB_AGD\150_179\ITALIAN\XBX_0170.agd",
+    0x5E3976D44DD6ACF4: r"SB_AWD\30_59\SPANISH\PS2_0053.awd",
+    0x5E44BF068E32FD3E: r"SHELL\LOAD\L_3_1.txd",
+    0x5E485F6278B4C0CF: r"SB_AWD\90_119\SPANISH\NGC_0106.awd",
+    0x5E48F9579132BA28: r"SB_AWD\90_119\ENGLISH\XBX_0091.awd",
+    0x5E4CEF700B287E78: r"SB_AWD\210_239\ENGLISH\XBX_0223.awd",
+    0x5E52E43C02E9328A: r"SB_AGD\240_269\ITALIAN\NGC_0249.agd",
+    0x5E62163CB6D38075: r"SB_AWD\180_209\GERMAN\PS2_0190.awd",
+    0x5E6465EC7AD61F21: r"LEVELS\L_2_2\SECTIONS\s_6.rws",
+    0x5E6C662097A31E3F: r"SB_AWD\60_89\FRENCH\NGC_0062.awd",
+    0x5E6D35CE7DB834BF: r"gui_map3_death.dds",
+    0x5E6E3259C86B0CB1: r"SB_AWD\0_29\ENGLISH\NGC_0024.awd",
+    0x5E7317DD359632B5: r"SB_AGD\60_89\ENGLISH\PS2_0061.agd",
+    0x5E7E8086294845B9: r"SB_AGD\180_209\ITALIAN\NGC_0199.agd",
+    0x5E86530D0C9F77D2: r"SB_AWD\180_209\ENGLISH\NGC_0206.awd",
+    0x5E8F6C65AE1D9362: r"SB_AGD\150_179\ITALIAN\PS2_0154.agd",
+    0x5E98F373DD8A0FCC: r"SB_AGD\120_149\ENGLISH\XBX_0128.agd",
+    0x5EA229C01A3D5350: r"SHELL\PAD\PAD.TXD",
+    0x5EA309CE7DE579DC: r"gui_map3_death.txd",
+    0x5EA4D32A218B52D1: r"LEVELS\L_2_1\SECTIONS\s_3.rws",
+    0x5EABF462A42E344B: r"SB_AWD\180_209\ITALIAN\XBX_0195.awd",
+    0x5EADBC469A895C39: r"LEVELS\MP_7\SECTIONS\s_14.rws",
+    0x5EB75BF8B38D4148: r"SB_AWD\150_179\FRENCH\XBX_0164.awd",
+    0x5EB7E1991B97914F: r"SB_AGD\120_149\SPANISH\XBX_0149.agd",
+    0x5EBE8344F3E45E3A: r"SB_AGD\120_149\ITALIAN\PS2_0143.agd",
+    0x5EC1AF9CF9D4588D: r"SB_AWD\90_119\ITALIAN\PS2_0097.awd",
+    0x5EC462544F7A0A83: r"SB_AGD\60_89\ENGLISH\XBX_0082.agd",
+    0x5ECB374A5F65CA4D: r"SB_AGD\30_59\SPANISH\XBX_0055.agd",
+    0x5ECCE71C0F2A5A79: r"SB_AWD\120_149\FRENCH\XBX_0129.awd",
+    0x5EDC64F12A034361: r"SB_AWD\30_59\SPANISH\NGC_0048.awd",
+    0x5EE4228310DC8D5B: r"w_networkloginBKG.index",
+    0x5EED7D3A476DC13A: r"SB_AWD\150_179\GERMAN\PS2_0167.awd",
+    0x5EF433F09B789585: r"SB_AWD\30_59\FRENCH\XBX_0042.awd",
+    0x5EFEF97F91337268: r"SB_AWD\240_269\SPANISH\XBX_0249.awd",
+    0x5F1234373ECC0488: r"SB_AWD\120_149\GERMAN\PS2_0132.awd",
+    0x5F1BA63241BC9B99: r"SB_AWD\60_89\FRENCH\NGC_0060.awd",
+    0x5F2A0261928096CB: r"LOC\FR\GUI.LOC",
+    0x5F2E0128FEB2B8E5: r"SB_AGD\0_29\SPANISH\XBX_0022.agd",
+    0x5F36BBB249CDBAD6: r"SB_AWD\90_119\ENGLISH\NGC_0110.awd",
+    0x5F405548DF82B8C2: r"SB_AWD\240_269\SPANISH\NGC_0249.awd",
+    0x5F47D38587A2E98E: r"SB_AGD\120_149\ENGLISH\XBX_0126.agd",
+    0x5F4B4451809568FF: r"SB_AWD\30_59\GERMAN\PS2_0045.awd",
+    0x5F54FD2148DA72AA: r"SB_AGD\0_29\GERMAN\XBX_0012.agd",
+    0x5F5576CA53610DEF: r"SB_AWD\0_29\SPANISH\XBX_0015.awd",
+    0x5F566930937667BA: r"SB_AGD\0_29\SPANISH\NGC_0012.agd",
+    0x5F57862360543F26: r"SB_AGD\240_269\SPANISH\NGC_0267.agd",
+    0x5F64B892E35CBE94: r"SB_AGD\120_149\FRENCH\PS2_0141.agd",
+    0x5F6A1EBEA1B6E354: r"SB_AWD\210_239\GERMAN\XBX_0218.awd",
+    0x5F6DD3569DFDF754: r"SB_AGD\120_149\ITALIAN\PS2_0141.agd",
+    0x5F6FC876C503B4C4: r"SB_AWD\180_209\SPANISH\NGC_0198.awd",
+    0x5F733D69FD2F2A2B: r"SB_AWD\180_209\ITALIAN\PS2_0189.awd",
+    0x5F82BE571D4D91F6: r"SB_AGD\240_269\ENGLISH\XBX_0258.agd",
+    0x5F8F004BF4556068: r"SB_AWD\240_269\SPANISH\PS2_0259.awd",
+    0x5F8F5EEDD5091BF1: r"SB_AGD\30_59\ENGLISH\XBX_0051.agd",
+    0x5F96D5FD02D3D856: r"SB_AGD\60_89\ENGLISH\PS2_0088.agd",
+    0x5FA148B9B125C596: r"SB_AGD\90_119\GERMAN\PS2_0098.agd",
+    0x5FA3E4024592D137: r"SB_AWD\30_59\FRENCH\XBX_0044.awd",
+    0x5FA63C8FA3BD4110: r"SB_AWD\240_269\ENGLISH\PS2_0259.awd",
+    0x5FAAD92472D29C90: r"SB_AGD\0_29\FRENCH\NGC_0014.agd",
+    0x5FB3C8A6E04A6BCB: r"SB_AWD\90_119\ENGLISH\PS2_0107.awd",
+    0x5FB53026E0ABEBD3: r"SB_AGD\180_209\FRENCH\PS2_0190.agd",
+    0x5FC0FAFA0B58988E: r"SB_AWD\120_149\ITALIAN\XBX_0144.awd",
+    0x5FC40F6C0197FBEF: r"SB_AGD\180_209\ITALIAN\PS2_0185.agd",
+    0x5FD7836EB7324CFE: r"SB_AGD\90_119\GERMAN\PS2_0102.agd",
+    0x5FDBC98CA11E61F8: r"SB_AWD\90_119\FRENCH\XBX_0109.awd",
+    0x5FF2C474A1DE1074: r"SB_AGD\210_239\ENGLISH\XBX_0238.agd",
+    0x5FF52B25E9E70FEA: r"SB_AWD\180_209\SPANISH\PS2_0197.awd",
+    0x6003CD32F2F33244: r"SB_AGD\0_29\GERMAN\XBX_0010.agd",
+    0x6005B9423D9000D4: r"SB_AGD\0_29\SPANISH\NGC_0010.agd",
+    0x601AC15C20956C48: r"SB_AGD\90_119\SPANISH\NGC_0097.agd",
+    0x6022712602253018: r"SB_AWD\90_119\SPANISH\XBX_0099.awd",
+    0x6028B7F83CFC4F45: r"SB_AGD\60_89\ENGLISH\PS2_0076.agd",
+    0x602B038D52B6F9AC: r"SB_AGD\120_149\ITALIAN\NGC_0144.agd",
+    0x6030DA5684F49980: r"SB_AGD\60_89\ITALIAN\XBX_0081.agd",
+    0x6036CC5474E91972: r"ANIMGRPS\Lvl_15\Lvl_15Q.ads",
+    0x6037C72455423998: r"SB_AGD\90_119\ITALIAN\PS2_0096.agd",
+    0x6051C2869BE40F35: r"AUDIO\ITALIAN\PS2_4s2.rws",
+    0x606B159F55DC773F: r"SB_AWD\210_239\ENGLISH\NGC_0231.awd",
+    0x606CA825869A019E: r"ANIMGRPS\Lvl_34\Lvl_34G.ads",
+    0x607B0EBDC30E699B: r"ANIMGRPS\Lvl_22\Lvl_22T.ads",
+    0x6081D7C16A741003: r"SB_AWD\30_59\GERMAN\XBX_0051.awd",
+    0x6088E61A62AD6794: r"SB_AGD\240_269\ITALIAN\PS2_0260.agd",
+    0x608A9DABEA7341CF: r"SB_AWD\240_269\ITALIAN\NGC_0262.awd",
+    0x608AB453A517BDD5: r"SB_AGD\180_209\GERMAN\NGC_0182.agd",
+    0x608B8BCF118C76C2: r"ANIMGRPS\Lvl_15\Lvl_15A.ads",
+    0x6099965B58C1C6C4: r"SB_AWD\180_209\SPANISH\XBX_0189.awd",
+    0x609EE731D4D4E384: r"LEVELS\L_1_5\SECTIONS\s_16.rws",
+    0x60A1A0527A2E28FD: r"SB_AWD\180_209\FRENCH\XBX_0182.awd",
+    0x60A45B37940071A4: r"SB_AWD\180_209\SPANISH\PS2_0195.awd",
+    0x60AB35C7B776D6BD: r"SB_AGD\0_29\SPANISH\XBX_0013.agd",
+    0x60AC913EC455EA27: r"SB_AWD\30_59\FRENCH\PS2_0058.awd",
+    0x60AEB1F58E2ADA2E: r"SB_AWD\90_119\SPANISH\PS2_0094.awd",
+    0x60B4E87F06E4648B: r"SB_AGD\0_29\FRENCH\XBX_0002.agd",
+    0x60BDAB370FDFD1A6: r"SB_AWD\90_119\ITALIAN\XBX_0101.awd",
+    0x60BE431F5F1903C8: r"SB_AGD\150_179\ITALIAN\XBX_0159.agd",
+    0x60C7243939F7C439: r"SB_AGD\90_119\ITALIAN\PS2_0101.agd",
+    0x60C9727C74D617BB: r"SB_AWD\60_89\GERMAN\XBX_0088.awd",
+    0x60CBF4933BE915B7: r"SB_AGD\120_149\GERMAN\PS2_0148.agd",
+    0x60D78809E7150E57: r"SB_AGD\60_89\ENGLISH\PS2_0070.agd",
+    0x60D9C89AC743D558: r"SB_AGD\240_269\FRENCH\PS2_0259.agd",
+    0x60D9C986DAE1C57B: r"SB_AGD\120_149\ITALIAN\NGC_0132.agd",
+    0x60DF45771FEAE7E1: r"SB_AGD\120_149\GERMAN\NGC_0143.agd",
+    0x60E81C558454B861: r"SB_AGD\0_29\GERMAN\PS2_0005.agd",
+    0x60EBD69DBE7BA428: r"SB_AGD\210_239\GERMAN\NGC_0223.agd",
+    0x60EF7FEE2B2356E4: r"SB_AGD\120_149\SPANISH\XBX_0120.agd",
+    0x60FA09F25ABF5C53: r"SB_AGD\30_59\SPANISH\PS2_0032.agd",
+    0x6108B754508419BF: r"SB_AWD\0_29\GERMAN\NGC_0020.awd",
+    0x610D2DCA467352B6: r"SB_AWD\30_59\FRENCH\XBX_0034.awd",
+    0x610F41555F0401D6: r"SB_AWD\210_239\ITALIAN\XBX_0221.awd",
+    0x6113A3ADFE48AAD8: r"SB_AWD\150_179\SPANISH\XBX_0164.awd",
+    0x611A55B0FFF5F499: r"SB_AWD\210_239\ENGLISH\NGC_0233.awd",
+    0x611B743730B2BA40: r"ANIMGRPS\Lvl_34\Lvl_34A.ads",
+    0x6121D0393B75B436: r"SB_AGD\180_209\SPANISH\NGC_0196.agd",
+    0x61232A5E651DE843: r"SB_AWD\150_179\SPANISH\PS2_0151.awd",
+    0x613007676DDCFF6D: r"SB_AWD\240_269\SPANISH\NGC_0251.awd",
+    0x61337E5C74D7DCD6: r"SB_AWD\0_29\FRENCH\XBX_0010.awd",
+    0x6133CAA290A44084: r"SB_AGD\90_119\SPANISH\NGC_0116.agd",
+    0x61365664DDF7899B: r"SHELL\FONTS\lta28.met",
+    0x613A84654F322FE7: r"SB_AGD\180_209\GERMAN\NGC_0184.agd",
+    0x613B67E0BBA6FD54: r"ANIMGRPS\Lvl_15\Lvl_15O.ads",
+    0x613E1F0A72E0807F: r"SB_AWD\90_119\SPANISH\PS2_0103.awd",
+    0x614537631331BE5A: r"SB_AGD\60_89\ITALIAN\PS2_0066.agd",
+    0x614ABAE01146EA13: r"SB_AWD\120_149\SPANISH\PS2_0128.awd",
+    0x614F6106DFFB9BD3: r"SB_AGD\90_119\GERMAN\XBX_0113.agd",
+    0x614FD3474303A52A: r"SB_AGD\90_119\SPANISH\PS2_0090.agd",
+    0x615070642446E78F: r"SB_AWD\180_209\FRENCH\XBX_0184.awd",
+    0x61525423A7E0DF27: r"SB_AGD\60_89\SPANISH\NGC_0071.agd",
+    0x61530E8AF203B61A: r"SB_AGD\180_209\ITALIAN\NGC_0185.agd",
+    0x615762756F66286E: r"i_ps2buttons.layout",
+    0x615B97AB941BAA7A: r"SB_AWD\30_59\FRENCH\PS2_0037.awd",
+    0x615DA2073843CF98: r"SB_AWD\90_119\SPANISH\PS2_0096.awd",
+    0x6162E97177B5076B: r"SB_AGD\180_209\FRENCH\NGC_0191.agd",
+    0x6164FD5E56BAC40D: r"SB_AWD\150_179\ENGLISH\XBX_0158.awd",
+    0x61702D6F1D0D92C2: r"SB_AGD\90_119\FRENCH\PS2_0100.agd",
+    0x6178C296CA32C73E: r"SB_AGD\180_209\GERMAN\XBX_0187.agd",
+    0x618C6311EA2496F3: r"SB_AWD\150_179\ITALIAN\PS2_0160.awd",
+    0x61998BC3F559C160: r"SB_AWD\90_119\ENGLISH\NGC_0112.awd",
+    0x619BCBDEFB4DA5D0: r"SB_AWD\90_119\ENGLISH\NGC_0101.awd",
+    0x619DF217B5FC6181: r"SB_AWD\210_239\SPANISH\PS2_0221.awd",
+    0x61A0689D8B450285: r"SB_AWD\150_179\ENGLISH\NGC_0163.awd",
+    0x61A07AD6CDD98714: r"SB_AGD\0_29\SPANISH\PS2_0020.agd",
+    0x61A17520D7E5CADA: r"SB_AWD\120_149\FRENCH\XBX_0135.awd",
+    0x61A5F8AB2E085C4F: r"SB_AWD\60_89\ITALIAN\XBX_0077.awd",
+    0x61B140C0154F605D: r"ANIMGRPS\Lvl_24\Lvl_24V.ads",
+    0x61B25623CC512D03: r"SB_AWD\60_89\GERMAN\PS2_0083.awd",
+    0x61B7F765FA9D9719: r"SB_AWD\0_29\GERMAN\NGC_0022.awd",
+    0x61B876DBFEED6589: r"SB_AWD\0_29\SPANISH\XBX_0017.awd",
+    0x61BCF65011D4CDC0: r"SB_AGD\240_269\SPANISH\NGC_0258.agd",
+    0x61BDB7AE642E2F13: r"SB_AGD\210_239\ITALIAN\PS2_0212.agd",
+    0x61C7E1217EADEB38: r"SB_AWD\60_89\GERMAN\NGC_0074.awd",
+    0x61D1204AE58F4D40: r"SB_AGD\180_209\SPANISH\NGC_0194.agd",
+    0x61D3C7B235F55919: r"AUDIO\ITALIAN\NGC_2m1.rws",
+    0x61D94F4327DCA08B: r"ANIMGRPS\Lvl_22\Lvl_22D.ads",
+    0x61DA11B73D6215BA: r"SB_AGD\120_149\GERMAN\XBX_0133.agd",
+    0x61E55BC9956AB855: r"SB_AWD\180_209\FRENCH\PS2_0206.awd",
+    0x61EA43734340597E: r"SB_AGD\210_239\ENGLISH\PS2_0231.agd",
+    0x61EE741ABDC10FF6: r"AUDIO\ENGLISH\XBX_4m2.rws",
+    0x61F04114DF6F8B4A: r"SB_AGD\240_269\GERMAN\PS2_0259.agd",
+    0x61FEA358ED1C64C4: r"SB_AGD\90_119\SPANISH\PS2_0092.agd",
+    0x61FEC3F8D406FE84: r"SB_AGD\30_59\SPANISH\PS2_0044.agd",
+    0x62032734D5DBED73: r"SB_AWD\30_59\GERMAN\NGC_0057.awd",
+    0x620561F125FD9218: r"SB_AGD\150_179\GERMAN\PS2_0172.agd",
+    0x620A87BD3E349FF4: r"SB_AWD\30_59\FRENCH\PS2_0035.awd",
+    0x62181707A4F380FE: r"SB_AWD\0_29\SPANISH\NGC_0016.awd",
+    0x621D8E6E36F2EBDD: r"SB_AWD\240_269\GERMAN\NGC_0262.awd",
+    0x621DAB40BFF2D7DC: r"LEVELS\L_1_3_B\level.dff",
+    0x6229EB11B5C7CB04: r"SB_AGD\120_149\GERMAN\PS2_0125.agd",
+    0x623EA295E9397838: r"SB_AWD\90_119\GERMAN\PS2_0092.awd",
+    0x6243F547A3893D15: r"SB_AWD\150_179\SPANISH\NGC_0178.awd",
+    0x624E584B4BFC6AB7: r"SB_AGD\240_269\SPANISH\NGC_0262.agd",
+    0x625018AF355F3E37: r"SB_AWD\150_179\ENGLISH\NGC_0165.awd",
+    0x62559F76F5B3D8CD: r"SB_AGD\120_149\FRENCH\XBX_0147.agd",
+    0x6257CE81E7D599EC: r"SB_AGD\150_179\ITALIAN\NGC_0166.agd",
+    0x626065672C910F24: r"LEVELS\L_1_5\SECTIONS\s_7.rws",
+    0x6261BAFECBF40F67: r"AUDIO\FRENCH\NGC_4m1.rws",
+    0x626703BA855C1FBC: r"SB_AGD\120_149\GERMAN\NGC_0128.agd",
+    0x62685C40C0323C84: r"LEVELS\L_1_3_B\level.rws",
+    0x6275A2B8D6FB4D0B: r"SB_AGD\210_239\GERMAN\PS2_0225.agd",
+    0x627FC8187A223648: r"ANIMGRPS\Lvl_25\Lvl_25E.ads",
+    0x62809F48FBB2FE92: r"SB_AWD\60_89\FRENCH\NGC_0085.awd",
+    0x628587EFB8EB3533: r"SB_AGD\150_179\ENGLISH\XBX_0170.agd",
+    0x628961C8E77BAED4: r"SB_AGD\120_149\GERMAN\XBX_0131.agd",
+    0x6289B946CD553E80: r"SB_AWD\120_149\ITALIAN\NGC_0140.awd",
+    0x629F73581CF0DB73: r"SB_AWD\240_269\GERMAN\PS2_0265.awd",
+    0x62B6A079E44A5D9E: r"SB_AWD\30_59\FRENCH\NGC_0047.awd",
+    0x62BA7B8AE3A7C39B: r"SB_AGD\90_119\SPANISH\XBX_0092.agd",
+    0x62BB9DEBA8C160A6: r"SB_AGD\60_89\SPANISH\NGC_0067.agd",
+    0x62BBB4AF8AAB6206: r"SB_AWD\180_209\ITALIAN\NGC_0189.awd",
+    0x62C1C474512BCF65: r"SB_AWD\180_209\ITALIAN\XBX_0197.awd",
+    0x62C33272D175C2DF: r"w_createSessionBKG.dds",
+    0x62C93D2D4FCE2208: r"KujuSplash.index",
+    0x62D1B75978734378: r"PopupBackground.txd",
+    0x62D3ABB447A68055: r"SB_AWD\120_149\ENGLISH\PS2_0122.awd",
+    0x62D6FFAEA6D11A1F: r"SB_AWD\90_119\ITALIAN\PS2_0091.awd",
+    0x62E4F4660720DCC5: r"SB_AWD\0_29\ITALIAN\NGC_0028.awd",
+    0x62F1B502D70004F3: r"SB_AWD\30_59\SPANISH\NGC_0046.awd",
+    0x62F74B18BDA4271B: r"SB_AWD\240_269\SPANISH\XBX_0251.awd",
+    0x62F98672D1A3E0FC: r"w_createSessionBKG.txd",
+    0x62FA577E1A9700EA: r"SB_AGD\60_89\ITALIAN\PS2_0071.agd",
+    0x62FD97DF33241C0D: r"SB_AWD\90_119\GERMAN\NGC_0092.awd",
+    0x6300AE770252FF28: r"SB_AWD\180_209\ENGLISH\NGC_0194.awd",
+    0x63036D4BF46B92B4: r"SB_AWD\150_179\GERMAN\PS2_0165.awd",
+    0x63068DCD867248B6: r"SB_AWD\150_179\GERMAN\NGC_0171.awd",
+    0x63080B5978A1613B: r"PopupBackground.dds",
+    0x631004A3B6AF09FD: r"LEVELS\L_1_1\level.dff",
+    0x6316B890B26EB825: r"SB_AGD\0_29\FRENCH\XBX_0000.agd",
+    0x6316E3CC2F76AD7E: r"SB_AGD\120_149\GERMAN\NGC_0126.agd",
+    0x631BDF8A7683521C: r"SB_AGD\0_29\ENGLISH\NGC_0025.agd",
+    0x631FBAAA93E07DFE: r"SB_AGD\0_29\GERMAN\PS2_0024.agd",
+    0x6323664A485F57F1: r"SB_AGD\30_59\ENGLISH\PS2_0034.agd",
+    0x63254C63B6090450: r"SB_AWD\30_59\ENGLISH\XBX_0054.awd",
+    0x63254D8A2472D552: r"SB_AGD\90_119\FRENCH\PS2_0113.agd",
+    0x633F33A3B6D6CA09: r"LEVELS\L_1_1\level.rws",
+    0x634B66B652BBFA01: r"SB_AWD\150_179\ENGLISH\PS2_0157.awd",
+    0x634D76AAC4D3A295: r"SB_AWD\180_209\ITALIAN\NGC_0195.awd",
+    0x634E87CEBA260628: r"SB_AGD\60_89\FRENCH\XBX_0078.agd",
+    0x6359FF876890F6D8: r"SB_AGD\150_179\GERMAN\NGC_0164.agd",
+    0x635B38C6356DD4BF: r"SB_AWD\60_89\ITALIAN\XBX_0060.awd",
+    0x635D32A8CBD58926: r"w_MainScreenBKG.dds",
+    0x636084632D920F59: r"SB_AWD\30_59\GERMAN\PS2_0047.awd",
+    0x6366508B8E6499C8: r"SB_AWD\30_59\FRENCH\NGC_0045.awd",
+    0x636A0C97D1DA7D30: r"SB_AGD\180_209\SPANISH\XBX_0196.agd",
+    0x636C8A2B89A8ECA3: r"font_string.tga",
+    0x637211670A900860: r"SB_AWD\210_239\ITALIAN\XBX_0223.awd",
+    0x637270272B54E878: r"SB_AWD\120_149\GERMAN\PS2_0121.awd",
+    0x638220058FDA6747: r"CodBack_FindSession.index",
+    0x638751E520C6151B: r"SB_AWD\240_269\SPANISH\PS2_0241.awd",
+    0x639426A8CC04B7C5: r"w_MainScreenBKG.txd",
+    0x6395EEAAABC74B33: r"SB_AGD\150_179\FRENCH\PS2_0151.agd",
+    0x63964E6E2063E360: r"SB_AWD\0_29\FRENCH\XBX_0012.awd",
+    0x63988E892657C7D0: r"SB_AWD\0_29\FRENCH\XBX_0001.awd",
+    0x63AF82EE66A1847C: r"SB_AWD\60_89\ITALIAN\NGC_0072.awd",
+    0x63B454A6DC99566A: r"SB_AGD\120_149\ENGLISH\NGC_0124.agd",
+    0x63B5AC8E5F4982CB: r"SB_AWD\0_29\FRENCH\XBX_0028.awd",
+    0x63B96277363FBFB6: r"SB_AWD\150_179\ENGLISH\NGC_0173.awd",
+    0x63B9803AB3652B2D: r"ANIMGRPS\Lvl_24\Lvl_24F.ads",
+    0x63BEFE72E7D4DB64: r"SB_AWD\90_119\ENGLISH\XBX_0118.awd",
+    0x63C1C412ACC1613A: r"w_flagsRU.index",
+    0x63C998B88D4806E5: r"SB_AWD\90_119\ENGLISH\PS2_0105.awd",
+    0x63CE4391BA3736B1: r"SB_AWD\240_269\GERMAN\XBX_0264.awd",
+    0x63E6989E7BDF658B: r"AUDIO\ENGLISH\XBX_2s3.rws",
+    0x63EE46E3EE9FEAF8: r"SB_AWD\60_89\ENGLISH\XBX_0078.awd",
+    0x63EE9A91FC541E87: r"SB_AGD\180_209\ENGLISH\NGC_0207.agd",
+    0x63EEFB273B2A1313: r"SB_AWD\0_29\ITALIAN\XBX_0011.awd",
+    0x63F81EBFDDA27EED: r"SB_AWD\240_269\ENGLISH\PS2_0243.awd",
+    0x63FA7DBE5AE3B478: r"w_weaponsRU.index",
+    0x63FC66BC6EEC9807: r"SB_AWD\180_209\ITALIAN\NGC_0193.awd",
+    0x63FDFBF0A6D89C02: r"SB_AWD\90_119\ENGLISH\NGC_0107.awd",
+    0x63FE09D9D2ABC0AA: r"SB_AGD\240_269\ENGLISH\PS2_0244.agd",
+    0x64030244677C4C83: r"SB_AWD\210_239\SPANISH\PS2_0230.awd",
+    0x64031FF2321A01A7: r"SB_AWD\30_59\FRENCH\XBX_0031.awd",
+    0x64084BB91B9E64C6: r"SB_AWD\60_89\FRENCH\PS2_0062.awd",
+    0x640A78D7DF875219: r"SB_AWD\60_89\ITALIAN\XBX_0062.awd",
+    0x64110F9F6B5093B6: r"SHELL\FEND\INSTANCE\SKY\SLIDESHW.txd",
+    0x64141CD1C0DB7B57: r"ANIMGRPS\Lvl_24\Lvl_24T.ads",
+    0x641B27DF0B9D7BAD: r"SB_AGD\240_269\ENGLISH\PS2_0265.agd",
+    0x642D4BB1952007A3: r"SB_AWD\180_209\ITALIAN\NGC_0203.awd",
+    0x642E777AC50E9A5F: r"SB_AGD\30_59\GERMAN\PS2_0030.agd",
+    0x6434313D93AAE281: r"ANIMGRPS\Lvl_35\Lvl_35Z.ads",
+    0x6449750CDAB78817: r"SB_AWD\30_59\SPANISH\XBX_0031.awd",
+    0x645EB4955FFED8B0: r"ANIMGRPS\Lvl_32\Lvl_32E.ads",
+    0x6463D551B74D107E: r"SB_AGD\180_209\SPANISH\NGC_0202.agd",
+    0x6468DC4C5D7ED827: r"ANIMGRPS\Lvl_24\Lvl_24D.ads",
+    0x646EB940511BF471: r"SB_AGD\30_59\GERMAN\NGC_0033.agd",
+    0x6477448F5891B495: r"SB_AWD\180_209\ITALIAN\XBX_0184.awd",
+    0x647EB5FA9768B005: r"SB_AWD\0_29\ITALIAN\PS2_0018.awd",
+    0x6481896B93CF86F5: r"SB_AWD\180_209\ITALIAN\PS2_0198.awd",
+    0x648260F0E9BDDEA2: r"w_weaponsDE.index",
+    0x6488BCFE9D167360: r"ANIMGRPS\MPA_00\MPA_00C.ads",
+    0x6488F0B8304E4011: r"ANIMGRPS\Lvl_35\Lvl_35J.ads",
+    0x648BA43184D82BA1: r"SB_AGD\240_269\FRENCH\NGC_0260.agd",
+    0x648C3A8B9A6818A4: r"LEVELS\L_2_2\global.dff",
+    0x648F3E45087D9EA7: r"SHELL\LOAD\L_1_2.txd",
+    0x64A264003530CFB4: r"SB_AWD\210_239\SPANISH\XBX_0238.awd",
+    0x64ACD9EB7CC48044: r"SB_AGD\240_269\ENGLISH\PS2_0246.agd",
+    0x64C2D604C2587352: r"CancelWarningScreen.layout",
+    0x64C5918FFF3778ED: r"SB_AGD\150_179\ENGLISH\NGC_0152.agd",
+    0x64C9F7F0B5B63ABF: r"SB_AGD\240_269\ENGLISH\PS2_0263.agd",
+    0x64CDC5CFB5E0DA0D: r"SB_AWD\150_179\FRENCH\PS2_0175.awd",
+    0x64D21A33F3B48A0B: r"SB_AGD\240_269\FRENCH\PS2_0241.agd",
+    0x64D2FB48BCDC9330: r"SB_AWD\90_119\ITALIAN\XBX_0103.awd",
+    0x64D772CA8285A0A5: r"SB_AGD\210_239\GERMAN\PS2_0227.agd",
+    0x64DA4DB082816E73: r"SB_AGD\90_119\ITALIAN\NGC_0111.agd",
+    0x64E2FD4F3DC39B4B: r"ANIMGRPS\Lvl_35\Lvl_35X.ads",
+    0x64E72E05101F29BB: r"SB_AGD\30_59\ENGLISH\NGC_0046.agd",
+    0x64F49A17AF4E4A62: r"SB_AGD\60_89\GERMAN\PS2_0064.agd",
+    0x64FBA63D2CB0A0FB: r"LEVELS\MP_2\SECTIONS\s_2.rws",
+    0x6520C5EEFA7D03B3: r"SB_AGD\60_89\FRENCH\XBX_0082.agd",
+    0x652634A102AAAA07: r"SB_AWD\180_209\ITALIAN\XBX_0182.awd",
+    0x652F0A6AE523CC7C: r"SB_AGD\150_179\FRENCH\XBX_0177.agd",
+    0x6535588ECFAF2A95: r"AUDIO\ITALIAN\XBX_2s1.rws",
+    0x653D43D206E67F8A: r"VoteMap.layout",
+    0x6541E8062F4D3F11: r"SB_AWD\180_209\SPANISH\XBX_0193.awd",
+    0x65493320C11055A3: r"SB_AGD\90_119\ENGLISH\XBX_0092.agd",
+    0x654F36622E7CCCCF: r"SB_AGD\0_29\ITALIAN\NGC_0026.agd",
+    0x65504EDC1EFFD679: r"SB_AGD\150_179\SPANISH\XBX_0161.agd",
+    0x6551CEA9063DAF56: r"SB_AWD\120_149\ITALIAN\XBX_0126.awd",
+    0x65535F1C1FDD26D9: r"SB_AWD\90_119\SPANISH\PS2_0101.awd",
+    0x655A1B2A69302DB5: r"SB_AWD\240_269\SPANISH\XBX_0253.awd",
+    0x655A4F1A896BF913: r"SB_AGD\30_59\ENGLISH\XBX_0040.agd",
+    0x65673246B1412EB7: r"ANIMGRPS\Lvl_14\Lvl_14F.ads",
+    0x656C1BDD56F551A9: r"SB_AGD\120_149\SPANISH\NGC_0145.agd",
+    0x656CC077CE84F70C: r"SB_AGD\240_269\FRENCH\XBX_0245.agd",
+    0x65743E8DEF3A5454: r"SB_AWD\90_119\ENGLISH\XBX_0107.awd",
+    0x65877C756193FA82: r"SB_AWD\30_59\ENGLISH\XBX_0052.awd",
+    0x658CFE083DAA9B1C: r"SB_AGD\60_89\FRENCH\PS2_0064.agd",
+    0x65A16CB74AD2C641: r"SB_AWD\0_29\GERMAN\XBX_0006.awd",
+    0x65A1FF07B0E3F0DB: r"SB_AGD\240_269\GERMAN\XBX_0257.agd",
+    0x65AAD27F46B686DE: r"SB_AWD\210_239\GERMAN\XBX_0238.awd",
+    0x65AB45E7B4C3C38F: r"AUDIO\GERMAN\PS2_1m1.rws",
+    0x65ABF47B6CEC6548: r"ANIMGRPS\Lvl_16\Lvl_16I.ads",
+    0x65B2701394698C37: r"SB_AGD\60_89\SPANISH\NGC_0062.agd",
+    0x65BCF1C14DE63F07: r"ANIMGRPS\Lvl_14\Lvl_14V.ads",
+    0x65C815BEB438967B: r"SB_AGD\0_29\FRENCH\PS2_0001.agd",
+    0x65CB74A3088EA1FA: r"SB_AWD\0_29\GERMAN\PS2_0019.awd",
+    0x65DD406BC90C3CAA: r"SB_AGD\30_59\ENGLISH\PS2_0059.agd",
+    0x65E09BF066F7D5EB: r"ANIMGRPS\Lvl_33\Lvl_33X.ads",
+    0x65E153732F0BD05C: r"SB_AWD\120_149\FRENCH\NGC_0126.awd",
+    0x65EA21F6CC521BB5: r"SB_AWD\240_269\SPANISH\PS2_0243.awd",
+    0x65F278225AF12DCB: r"SB_AWD\210_239\FRENCH\PS2_0230.awd",
+    0x65F406001EA03F5E: r"SB_AGD\240_269\ITALIAN\XBX_0250.agd",
+    0x65F6F561AD325BAC: r"SB_AGD\60_89\GERMAN\XBX_0061.agd",
+    0x65F6F783B68E064C: r"SB_AGD\30_59\GERMAN\NGC_0058.agd",
+    0x65FABE9AD1E2BE02: r"SB_AWD\0_29\FRENCH\XBX_0007.awd",
+    0x65FB4BDB426889C7: r"SB_AWD\180_209\FRENCH\PS2_0200.awd",
+    0x65FC03D43FA51B22: r"SB_AWD\210_239\ENGLISH\PS2_0217.awd",
+    0x65FC7FF57218F7A7: r"SB_AWD\150_179\GERMAN\NGC_0174.awd",
+    0x661112C91D4C8FE1: r"SB_AWD\150_179\ITALIAN\NGC_0167.awd",
+    0x66350880A4F9C726: r"SB_AGD\0_29\GERMAN\NGC_0014.agd",
+    0x66355B6B039B337B: r"ANIMGRPS\Lvl_33\Lvl_33H.ads",
+    0x6650CF195AFCAFF5: r"SB_AGD\240_269\GERMAN\XBX_0255.agd",
+    0x66742470C7E55153: r"ANIMGRPS\Lvl_34\Lvl_34N.ads",
+    0x667A75315251FEF0: r"ANIMGRPS\Lvl_12\Lvl_12A.ads",
+    0x6690578C70990899: r"SB_AGD\30_59\GERMAN\PS2_0032.agd",
+    0x669ADAAFD51D9F1A: r"SHELL\FEND\fend.csv",
+    0x669FA9587A531072: r"SB_AWD\120_149\ITALIAN\NGC_0146.awd",
+    0x66A22FAFD5244E24: r"SHELL\FEND\fend.anm",
+    0x66A2D611C8B8FE68: r"SB_AGD\240_269\ITALIAN\XBX_0252.agd",
+    0x66A5D11D3515BE9A: r"w_map03.dds",
+    0x66A5D79560A6E00E: r"SB_AGD\30_59\GERMAN\NGC_0056.agd",
+    0x66AC084570A9635D: r"SB_AGD\90_119\ENGLISH\XBX_0102.agd",
+    0x66AF549F21E66EA7: r"SB_AWD\150_179\ENGLISH\NGC_0176.awd",
+    0x66B7EA71D45E46FC: r"SB_AGD\150_179\ITALIAN\NGC_0175.agd",
+    0x66C263153AB889A6: r"SB_AGD\180_209\ENGLISH\PS2_0203.agd",
+    0x66CB84D4C517F6EC: r"SB_AWD\120_149\SPANISH\PS2_0141.awd",
+    0x66CEE3A49312B524: r"SB_AWD\210_239\GERMAN\NGC_0238.awd",
+    0x66D04B9C90A55EB5: r"SB_AGD\90_119\SPANISH\XBX_0090.agd",
+    0x66D42756F82F3AA3: r"SB_AWD\120_149\FRENCH\PS2_0146.awd",
+    0x66D51EE2A5E28D53: r"SB_AGD\120_149\ITALIAN\XBX_0145.agd",
+    0x66DB4B645A8D221F: r"LEVELS\L_3_1\CLUMPS\cbank_01.bin",
+    0x66DCCD1D3544FA29: r"w_map03.txd",
+    0x66E3928C7DE63A5E: r"SB_AGD\90_119\SPANISH\XBX_0109.agd",
+    0x66E99BC5F4A451C7: r"SB_AWD\120_149\ENGLISH\PS2_0124.awd",
+    0x66EBBCC9DBDA405B: r"ANIMGRPS\Lvl_35\Lvl_35H.ads",
+    0x66F16B107958D071: r"AUDIO\FRENCH\NGC_4m3.rws",
+    0x66FB93E8BB87465C: r"SB_AWD\150_179\SPANISH\PS2_0167.awd",
+    0x670E53E9CBAE7A7B: r"SB_AGD\150_179\GERMAN\XBX_0165.agd",
+    0x6710278FC7949B84: r"SB_AGD\60_89\ITALIAN\PS2_0073.agd",
+    0x6712E7F0E020DD9F: r"SB_AWD\90_119\GERMAN\NGC_0094.awd",
+    0x67155B13F1F69966: r"SB_AWD\90_119\FRENCH\PS2_0104.awd",
+    0x671E3E79788CA88C: r"SB_AWD\120_149\ENGLISH\XBX_0128.awd",
+    0x6733EA459F3EDDA5: r"SB_AGD\240_269\FRENCH\PS2_0243.agd",
+    0x674C65EA5040341B: r"SB_AGD\60_89\SPANISH\PS2_0081.agd",
+    0x67514B1937493C6F: r"SB_AWD\180_209\SPANISH\PS2_0206.awd",
+    0x67586DBA5CCBF46F: r"SB_AWD\150_179\FRENCH\NGC_0176.awd",
+    0x67588B5F5428950A: r"SB_AWD\30_59\ENGLISH\PS2_0059.awd",
+    0x6759F741EC925FA4: r"ANIMGRPS\Lvl_36\Lvl_36A.ads",
+    0x6764733862BF3B7B: r"SB_AWD\60_89\ENGLISH\PS2_0089.awd",
+    0x67662C8E1F70D56D: r"SB_AWD\240_269\FRENCH\NGC_0246.awd",
+    0x67699B43F9688833: r"SB_AGD\30_59\GERMAN\PS2_0041.agd",
+    0x676D8289B5CDC38C: r"LEVELS\L_1_3_B\SECTIONS\s_22.rws",
+    0x67737787D11FBA24: r"SB_AWD\30_59\ITALIAN\XBX_0058.awd",
+    0x67782FBA5E59C52F: r"SB_AGD\90_119\FRENCH\PS2_0109.agd",
+    0x677B17223E256FC6: r"SB_AGD\210_239\ENGLISH\PS2_0213.agd",
+    0x677D9369AA6AC2FC: r"SB_AGD\180_209\ENGLISH\NGC_0187.agd",
+    0x677FDCA97ED818C2: r"SB_AGD\180_209\SPANISH\XBX_0190.agd",
+    0x67AFB6BC89377034: r"ANIMGRPS\Lvl_36\Lvl_36Q.ads",
+    0x67B49EBAB1C9B5E0: r"SB_AWD\120_149\ITALIAN\XBX_0124.awd",
+    0x67C4AB259C1031F0: r"SB_AWD\90_119\FRENCH\PS2_0106.awd",
+    0x67CA24B88996F104: r"SB_AGD\120_149\ENGLISH\NGC_0126.agd",
+    0x67CA72CBECE5BDB9: r"SB_AWD\0_29\SPANISH\XBX_0004.awd",
+    0x67D157973481332D: r"SB_AWD\180_209\GERMAN\NGC_0195.awd",
+    0x67D8AB0C5A5DE83E: r"SB_AWD\0_29\GERMAN\XBX_0023.awd",
+    0x67EB289BAC60BCB6: r"SB_AGD\0_29\GERMAN\NGC_0007.agd",
+    0x6809CB5396ACD886: r"ANIMGRPS\Lvl_36\Lvl_36C.ads",
+    0x680A5788DCCAD422: r"SB_AGD\180_209\FRENCH\NGC_0194.agd",
+    0x680B68A67AC34DCC: r"SB_AGD\90_119\GERMAN\NGC_0112.agd",
+    0x680EBEDE5328B4EC: r"SB_AWD\60_89\ITALIAN\NGC_0061.awd",
+    0x681183047ACEB4CD: r"ANIMGRPS\MPA_00\MPA_00Ger.ads",
+    0x6820AE8A5ACB36B0: r"WPNBANK\0_25\wbank_06.bin",
+    0x6829F6776A7CBC80: r"SB_AWD\210_239\FRENCH\PS2_0219.awd",
+    0x6838C6F6A8F9A199: r"LEVELS\MP_9\SECTIONS\s_5.rws",
+    0x683E820AF91E2D4F: r"SB_AGD\30_59\FRENCH\PS2_0047.agd",
+    0x684A13808E47F4FD: r"SB_AWD\120_149\ITALIAN\PS2_0122.awd",
+    0x685E8ACE33503616: r"ANIMGRPS\Lvl_36\Lvl_36S.ads",
+    0x686D89E9E634226B: r"SB_AWD\150_179\ITALIAN\XBX_0178.awd",
+    0x6874B1AE9F4ED50B: r"SB_AGD\0_29\FRENCH\PS2_0012.agd",
+    0x6874D94E19D810BE: r"SB_AGD\180_209\SPANISH\PS2_0203.agd",
+    0x687603F8C49ADA9D: r"SB_AWD\180_209\FRENCH\XBX_0201.awd",
+    0x687EB9F60F124DAE: r"SB_AGD\240_269\ITALIAN\PS2_0253.agd",
+    0x688523BF9A79E114: r"SB_AWD\210_239\GERMAN\NGC_0227.awd",
+    0x68918326280C50F6: r"SHELL\FEND\INSTANCE\gcn\ldEnglish.txd",
+    0x689A78AD567A55C0: r"SB_AGD\0_29\GERMAN\NGC_0005.agd",
+    0x689F5E115581D388: r"SB_AWD\210_239\SPANISH\NGC_0218.awd",
+    0x68A8581AB26ED47E: r"SHELL\MOVIES\SPANISH\Act_2.bik",
+    0x68BA2B105E192BB3: r"AUDIO\GERMAN\PS2_4s2.rws",
+    0x68C62BB05DEABD95: r"SB_AGD\150_179\ENGLISH\XBX_0150.agd",
+    0x68D9D05759C3AF93: r"SB_AWD\120_149\SPANISH\XBX_0138.awd",
+    0x68DB4B9E684FF0DD: r"SB_AWD\0_29\SPANISH\PS2_0025.awd",
+    0x68DB61A1AC3513FF: r"SB_AGD\150_179\ENGLISH\NGC_0154.agd",
+    0x68E0EA8CE1CFD163: r"SB_AGD\30_59\GERMAN\XBX_0051.agd",
+    0x68E13298BE470C00: r"LEVELS\L_1_1\CLUMPS\cbank_00.bin",
+    0x68E315E162DD9B9F: r"SB_AWD\150_179\FRENCH\PS2_0173.awd",
+    0x68F0B935E43D68A9: r"LEVELS\L_3_5_C\SECTIONS\s_13.rws",
+    0x68F2A3EC946FB57C: r"SB_AGD\240_269\ITALIAN\NGC_0254.agd",
+    0x68F8E3923860B38F: r"SB_AWD\120_149\ITALIAN\PS2_0124.awd",
+    0x690131ED5B63B40B: r"SB_AWD\240_269\ENGLISH\NGC_0244.awd",
+    0x6906E9F0387733E3: r"SB_AGD\180_209\ENGLISH\XBX_0195.agd",
+    0x6914BF28EFD64368: r"SB_AWD\180_209\ENGLISH\XBX_0196.awd",
+    0x691F732FCE9676C5: r"SB_AGD\210_239\ENGLISH\NGC_0211.agd",
+    0x6929B7A2D886E614: r"SB_AWD\30_59\ITALIAN\XBX_0047.awd",
+    0x692BDAA890A1F2B7: r"SB_AGD\0_29\GERMAN\NGC_0011.agd",
+    0x6934FCC4863D5B52: r"SB_AGD\180_209\SPANISH\XBX_0183.agd",
+    0x693A6A0962077817: r"SB_AWD\90_119\SPANISH\NGC_0098.awd",
+    0x6943EA7C921FCF3E: r"SB_AGD\150_179\FRENCH\XBX_0179.agd",
+    0x69560D916CF53FD1: r"SB_AGD\30_59\FRENCH\XBX_0059.agd",
+    0x6959304911B3B6F8: r"SB_AWD\60_89\SPANISH\PS2_0060.awd",
+    0x695E80260C47C4A1: r"SB_AGD\0_29\ITALIAN\PS2_0029.agd",
+    0x69649673DB79A909: r"SB_AGD\0_29\ITALIAN\NGC_0024.agd",
+    0x696CC39F3AF56134: r"SB_AWD\240_269\FRENCH\PS2_0268.awd",
+    0x69767CAC06B7BF03: r"SB_AGD\30_59\ITALIAN\NGC_0037.agd",
+    0x697B2509804257D5: r"SB_AWD\150_179\SPANISH\XBX_0172.awd",
+    0x697D33CE6E68C2C6: r"LEVELS\MP_1\SECTIONS\s_2.rws",
+    0x698246ED96899845: r"SB_AWD\150_179\ITALIAN\PS2_0175.awd",
+    0x698C5B5EC6CF8436: r"w_PlayerSetupBKG.txd",
+    0x698E2B2761C3CE6E: r"SB_AWD\0_29\GERMAN\XBX_0016.awd",
+    0x6993359D13F82ED9: r"LEVELS\L_2_2_B\global.dff",
+    0x69964EB27A3E6D2E: r"SB_AGD\0_29\SPANISH\PS2_0013.agd",
+    0x69AA545ACE5CF705: r"SB_AGD\210_239\ITALIAN\NGC_0237.agd",
+    0x69B001FF057C7325: r"SB_AWD\240_269\ENGLISH\NGC_0246.awd",
+    0x69B1C4C9439C4506: r"SB_AGD\90_119\ENGLISH\PS2_0106.agd",
+    0x69B2D13BAB4B9353: r"AUDIO\ENGLISH\XBX_2m1.rws",
+    0x69B37E3C613EE0EA: r"LEVELS\L_1_1\SECTIONS\s_9.rws",
+    0x69B42132408BFF25: r"SB_AGD\150_179\GERMAN\NGC_0158.agd",
+    0x69B44B2AE2D59409: r"SB_AWD\180_209\SPANISH\PS2_0204.awd",
+    0x69B9353D2660B537: r"SB_AGD\180_209\ENGLISH\PS2_0206.agd",
+    0x69BAEFD9B6C4B90B: r"SB_AGD\150_179\GERMAN\XBX_0176.agd",
+    0x69BB6DCC08584C09: r"SB_AWD\150_179\FRENCH\NGC_0174.awd",
+    0x69C1B74C9DD990EC: r"SB_AGD\120_149\SPANISH\PS2_0138.agd",
+    0x69C24F5EC6FCFF2D: r"w_PlayerSetupBKG.dds",
+    0x69C3D5EEA4149205: r"SB_AWD\240_269\FRENCH\XBX_0253.awd",
+    0x69CE434178AF35D7: r"SB_AGD\210_239\ENGLISH\NGC_0217.agd",
+    0x69DCE733E9AFC350: r"SB_AGD\210_239\ENGLISH\PS2_0211.agd",
+    0x69EC3880E14DEECE: r"AUDIO\SPANISH\PS2_4s1.rws",
+    0x69F138CA3163FDFD: r"SB_AGD\90_119\ITALIAN\NGC_0096.agd",
+    0x69F2C3050BB980C6: r"SB_AGD\150_179\ITALIAN\XBX_0179.agd",
+    0x69F346E9DAA53EE1: r"SB_AWD\0_29\GERMAN\NGC_0000.awd",
+    0x69F75384DC09BCFE: r"SB_AWD\120_149\FRENCH\NGC_0128.awd",
+    0x69F8F9DBD0399E1E: r"SB_AWD\90_119\SPANISH\XBX_0109.awd",
+    0x69FB5E5C210D8BFC: r"SB_AWD\120_149\SPANISH\XBX_0142.awd",
+    0x6A055DA3170ED863: r"SB_AGD\30_59\FRENCH\XBX_0057.agd",
+    0x6A08483407EEC8E5: r"SB_AWD\210_239\FRENCH\PS2_0232.awd",
+    0x6A08BB7D972F66FE: r"SB_AWD\150_179\GERMAN\XBX_0155.awd",
+    0x6A08E6A1C9D53AEC: r"SB_AWD\0_29\FRENCH\NGC_0025.awd",
+    0x6A0DD08FFBF23681: r"SB_AGD\120_149\FRENCH\NGC_0145.agd",
+    0x6A0E915D4DF695BD: r"SB_AWD\60_89\ENGLISH\NGC_0064.awd",
+    0x6A1D4F6C45182447: r"SB_AGD\120_149\ENGLISH\PS2_0142.agd",
+    0x6A2662DACA495173: r"SB_AWD\150_179\ITALIAN\NGC_0169.awd",
+    0x6A2F88D83902495A: r"SB_AGD\60_89\ITALIAN\NGC_0078.agd",
+    0x6A34B907D83EBBBD: r"ANIMGRPS\Lvl_34\Lvl_34X.ads",
+    0x6A383C0BFA10077A: r"SB_AGD\210_239\SPANISH\PS2_0235.agd",
+    0x6A43F4A2A63E7436: r"SB_AGD\30_59\FRENCH\NGC_0036.agd",
+    0x6A487A8352BE2176: r"SB_AGD\60_89\GERMAN\NGC_0061.agd",
+    0x6A4B2F7CB098D555: r"ANIMGRPS\Lvl_33\Lvl_33N.ads",
+    0x6A4B97A7E84B5FE6: r"SB_AWD\150_179\ITALIAN\XBX_0153.awd",
+    0x6A52FCDA6991C170: r"SHELL\HUD\INSTANCE\SKY\HUD.TXD",
+    0x6A5790523C29DE66: r"SB_AWD\180_209\FRENCH\NGC_0190.awd",
+    0x6A7386004E2ECDB7: r"SB_AWD\240_269\FRENCH\XBX_0255.awd",
+    0x6A7FB86326ED644B: r"SB_AWD\0_29\SPANISH\NGC_0000.awd",
+    0x6A81808ACFEC11DD: r"SB_AWD\90_119\ITALIAN\NGC_0100.awd",
+    0x6A851D54386A8385: r"SB_AWD\150_179\FRENCH\XBX_0172.awd",
+    0x6A89788274E2190D: r"ANIMGRPS\Lvl_34\Lvl_34H.ads",
+    0x6A902402941E24F9: r"SB_AWD\210_239\ITALIAN\XBX_0217.awd",
+    0x6A90B65A0BED37F0: r"ANIMGRPS\Lvl_31\Lvl_31W.ads",
+    0x6A970AA7E936C6F3: r"SB_AGD\30_59\GERMAN\XBX_0042.agd",
+    0x6AA550D4556DB383: r"ANIMGRPS\Lvl_23\Lvl_23B.ads",
+    0x6AB8A3DF1F6FCD74: r"SB_AGD\0_29\SPANISH\XBX_0016.agd",
+    0x6ABD0A0B3FDE2973: r"SB_AGD\180_209\ENGLISH\XBX_0186.agd",
+    0x6AC158571DA624EF: r"SB_AGD\90_119\ENGLISH\XBX_0104.agd",
+    0x6AC5261135517A7A: r"LEVELS\MP_2\global.dff",
+    0x6AC88366DFA718F0: r"LEVELS\L_3_5_C\SECTIONS\s_7.rws",
+    0x6AD681C04AD928A5: r"SB_AGD\0_29\FRENCH\PS2_0010.agd",
+    0x6ADA5C71CA0CDEEE: r"SB_AGD\150_179\FRENCH\PS2_0169.agd",
+    0x6AE5E38B5E10742D: r"SB_AGD\0_29\ENGLISH\XBX_0008.agd",
+    0x6AF344B450580D40: r"SB_AGD\30_59\FRENCH\NGC_0034.agd",
+    0x6AF50A6CEC4CD498: r"SB_AGD\0_29\GERMAN\PS2_0008.agd",
+    0x6AFA904EF211EA93: r"ANIMGRPS\Lvl_23\Lvl_23R.ads",
+    0x6AFAE7B99264F870: r"SB_AWD\150_179\ITALIAN\XBX_0151.awd",
+    0x6B05A5AECEF55521: r"w_map07.index",
+    0x6B06E063E64376F0: r"SB_AWD\180_209\FRENCH\NGC_0192.awd",
+    0x6B085DFEA5BEE9D1: r"SB_AWD\60_89\FRENCH\XBX_0075.awd",
+    0x6B0A2795C81830F5: r"SB_AGD\60_89\SPANISH\XBX_0079.agd",
+    0x6B1193FA688532FE: r"SB_AWD\150_179\SPANISH\PS2_0169.awd",
+    0x6B15F8928BCFA1E8: r"AUDIO\SPANISH\PS2_4s3.rws",
+    0x6B1674E10C81A95B: r"SB_AGD\120_149\ENGLISH\XBX_0130.agd",
+    0x6B1FFC062EC3D5B6: r"SB_AWD\90_119\FRENCH\NGC_0112.awd",
+    0x6B284E85707AFADE: r"SB_AGD\150_179\SPANISH\PS2_0169.agd",
+    0x6B28D401C0E9687F: r"NewPlayer.layout",
+    0x6B34CD65E284BF37: r"SB_AWD\150_179\FRENCH\XBX_0174.awd",
+    0x6B3ADC7E68F958D5: r"SB_AWD\30_59\SPANISH\PS2_0038.awd",
+    0x6B3D557ED5D5BF44: r"SB_AWD\240_269\SPANISH\NGC_0254.awd",
+    0x6B4801DDA5AE72F9: r"SB_AWD\210_239\GERMAN\PS2_0212.awd",
+    0x6B4F6066C1FEBAB6: r"SB_AWD\60_89\GERMAN\NGC_0061.awd",
+    0x6B50093268BEC83E: r"w_dnas.txd",
+    0x6B5424E5FF8679FD: r"ANIMGRPS\Lvl_23\Lvl_23D.ads",
+    0x6B569184DE2162D2: r"SB_AGD\210_239\ENGLISH\NGC_0238.agd",
+    0x6B6169AF9F7C8C15: r"SB_AGD\60_89\FRENCH\XBX_0066.agd",
+    0x6B618D1DECD80FEE: r"SB_AGD\0_29\SPANISH\NGC_0023.agd",
+    0x6B61F1C39E92F4DC: r"SB_AWD\0_29\FRENCH\PS2_0015.awd",
+    0x6B6235FBFD3DCF35: r"SB_AGD\60_89\SPANISH\PS2_0083.agd",
+    0x6B68A96E1480C6DA: r"SB_AWD\0_29\SPANISH\PS2_0004.awd",
+    0x6B82B93D54A30AE8: r"SB_AWD\240_269\ITALIAN\PS2_0242.awd",
+    0x6B864D3268ECCB25: r"w_dnas.dds",
+    0x6B89EFD73E07DEE3: r"SB_AWD\120_149\SPANISH\NGC_0143.awd",
+    0x6B8AF124E12736C4: r"SB_AWD\210_239\FRENCH\NGC_0229.awd",
+    0x6B8B964E50022692: r"SB_AGD\210_239\GERMAN\NGC_0232.agd",
+    0x6B92737B5766C5BE: r"SB_AGD\180_209\ENGLISH\NGC_0189.agd",
+    0x6B9A840AFDDC421F: r"SB_AGD\120_149\ENGLISH\PS2_0133.agd",
+    0x6B9AC4AE627CB624: r"SB_AGD\30_59\GERMAN\XBX_0034.agd",
+    0x6BA637B85E6AE71A: r"ANIMGRPS\MPA_00\MPA_00Brit.ads",
+    0x6BA9E4609C2B8A4D: r"ANIMGRPS\Lvl_23\Lvl_23T.ads",
+    0x6BC174F86871E523: r"LEVELS\L_1_3_B\SECTIONS\s_14.rws",
+    0x6BC544F2B69A6875: r"SB_AGD\120_149\ENGLISH\XBX_0132.agd",
+    0x6BD0D6842222BF32: r"SB_AGD\180_209\GERMAN\XBX_0198.agd",
+    0x6BD27E8E77D20CC1: r"SB_AGD\0_29\GERMAN\XBX_0006.agd",
+    0x6BD3EA9DC26E01D1: r"SB_AGD\0_29\SPANISH\NGC_0006.agd",
+    0x6BDCCFC84F0F4F36: r"SB_AWD\240_269\FRENCH\XBX_0243.awd",
+    0x6BF2CE3B838A388C: r"SB_AGD\180_209\ITALIAN\NGC_0190.agd",
+    0x6BF85B921185AACD: r"SB_AWD\120_149\ITALIAN\NGC_0149.awd",
+    0x6C004F134348B71E: r"SB_AWD\180_209\SPANISH\PS2_0180.awd",
+    0x6C0F04BD42B95E62: r"SB_AWD\150_179\ITALIAN\PS2_0154.awd",
+    0x6C115D2F96F281F8: r"SB_AGD\0_29\SPANISH\NGC_0021.agd",
+    0x6C12122816E738B6: r"SB_AWD\30_59\ITALIAN\PS2_0042.awd",
+    0x6C1494DAEF284B90: r"SB_AGD\90_119\ENGLISH\PS2_0104.agd",
+    0x6C1CBFEB624F0CA5: r"SB_AGD\150_179\GERMAN\XBX_0174.agd",
+    0x6C28E0BDD993C127: r"AUDIO\ENGLISH\NGC_4m1.rws",
+    0x6C3DD1C847831ACB: r"SB_AWD\210_239\SPANISH\PS2_0212.awd",
+    0x6C3FA684E241162E: r"SB_AWD\30_59\SPANISH\PS2_0042.awd",
+    0x6C4154D1696C832C: r"SB_AWD\120_149\FRENCH\XBX_0120.awd",
+    0x6C440EC9154135AC: r"w_weaponsGB.txd",
+    0x6C53E21CA61B0989: r"SB_AGD\30_59\FRENCH\PS2_0045.agd",
+    0x6C5BC3B18D889798: r"SB_AWD\120_149\FRENCH\NGC_0139.awd",
+    0x6C77325EDE5A8EA9: r"EndGameScoreBoard.layout",
+    0x6C79DAC9156E6CAF: r"w_weaponsGB.dds",
+    0x6C7A02F0F4DD6A19: r"codFontFBO22.dds",
+    0x6C7F45ACB67B853A: r"SB_AGD\30_59\ITALIAN\XBX_0045.agd",
+    0x6C7F725F97195C16: r"SB_AGD\210_239\ITALIAN\NGC_0227.agd",
+    0x6C814EA021EACBD3: r"SB_AGD\0_29\GERMAN\XBX_0008.agd",
+    0x6C833AAF6C879A63: r"SB_AGD\0_29\SPANISH\NGC_0008.agd",
+    0x6C9093E79BFF9ECC: r"SB_AWD\60_89\FRENCH\NGC_0069.awd",
+    0x6C938A07BC0E35B8: r"SB_AGD\240_269\ITALIAN\PS2_0251.agd",
+    0x6CA358D061BDA581: r"AUDIO\FRENCH\NGC_1m2.rws",
+    0x6CAB720DCE1EBF31: r"SB_AGD\0_29\ENGLISH\PS2_0007.agd",
+    0x6CAFFF24ED62F348: r"SB_AWD\180_209\SPANISH\PS2_0182.awd",
+    0x6CB046F0F50B6D02: r"codFontFBO22.txd",
+    0x6CB061F0F50B9B66: r"codFontFBO22.tga",
+    0x6CB400F125D576D6: r"LEVELS\L_2_1\SECTIONS\s_4.rws",
+    0x6CB736B83678F300: r"SB_AWD\0_29\SPANISH\NGC_0029.awd",
+    0x6CC3E10F3E64543D: r"SB_AWD\180_209\ENGLISH\PS2_0198.awd",
+    0x6CC93AC2474D8F1E: r"SB_AGD\120_149\GERMAN\PS2_0130.agd",
+    0x6CD53C2136294EA6: r"SB_AWD\90_119\FRENCH\NGC_0105.awd",
+    0x6CDAFBC20AE6A5A7: r"SB_AGD\150_179\ENGLISH\XBX_0156.agd",
+    0x6CDD13841537671C: r"SB_AWD\210_239\SPANISH\XBX_0216.awd",
+    0x6CE67511F16C4B47: r"SB_AGD\150_179\ITALIAN\XBX_0163.agd",
+    0x6CEE96968C5A0B98: r"SB_AWD\30_59\SPANISH\PS2_0040.awd",
+    0x6CF23D185FD825E5: r"SelectPlayer.layout",
+    0x6CFD7F24B7381FF3: r"SB_AWD\90_119\SPANISH\NGC_0111.awd",
+    0x6D0C18956A176396: r"SB_AWD\120_149\SPANISH\PS2_0121.awd",
+    0x6D2185E2D6267DE3: r"SB_AWD\60_89\FRENCH\NGC_0075.awd",
+    0x6D252928167770DA: r"SB_AGD\210_239\SPANISH\NGC_0223.agd",
+    0x6D298DDC3AEDF9D6: r"SB_AGD\180_209\FRENCH\PS2_0199.agd",
+    0x6D29EA0D9F30521E: r"LEVELS\MP_7\SECTIONS\s_13.rws",
+    0x6D2E95BE60951E54: r"SB_AGD\30_59\ITALIAN\XBX_0047.agd",
+    0x6D46074EF2884D60: r"SB_AGD\210_239\ENGLISH\PS2_0224.agd",
+    0x6D5290CF84155931: r"AUDIO\ENGLISH\NGC_4m3.rws",
+    0x6D5F1CAF693D06A1: r"SB_AGD\180_209\ITALIAN\XBX_0180.agd",
+    0x6D6D015B5A1AF073: r"SB_AGD\120_149\SPANISH\XBX_0138.agd",
+    0x6D7456AE2F94CC62: r"SB_AWD\30_59\SPANISH\NGC_0032.awd",
+    0x6D7AE50DBE008405: r"SB_AGD\120_149\ENGLISH\XBX_0147.agd",
+    0x6D87DEF4C0244B2F: r"SB_AGD\180_209\SPANISH\XBX_0199.agd",
+    0x6D8C1395BF5077BE: r"SB_AWD\210_239\SPANISH\XBX_0218.awd",
+    0x6D91151B2D402947: r"SB_AWD\150_179\SPANISH\XBX_0174.awd",
+    0x6D96F6FF438549F7: r"SB_AWD\150_179\ITALIAN\PS2_0173.awd",
+    0x6D97E5C07F545D15: r"EndRoundScoreBoard.layout",
+    0x6DA29CFC85F120EE: r"SB_AWD\150_179\GERMAN\PS2_0170.awd",
+    0x6DA41B390EC19FD8: r"SB_AWD\0_29\GERMAN\XBX_0014.awd",
+    0x6DA7495641481158: r"SparkSplash.index",
+    0x6DAB1EC4273A5538: r"SB_AGD\0_29\SPANISH\PS2_0011.agd",
+    0x6DB69B23509F2979: r"SB_AGD\210_239\SPANISH\NGC_0233.agd",
+    0x6DB8DE054A6BBE12: r"SB_AGD\180_209\ENGLISH\XBX_0208.agd",
+    0x6DBB6FD7751670C5: r"SB_AGD\180_209\FRENCH\PS2_0185.agd",
+    0x6DC0246C7B5A9217: r"SB_AGD\210_239\ITALIAN\NGC_0231.agd",
+    0x6DC03B01BEE3B561: r"SB_AWD\150_179\GERMAN\PS2_0159.awd",
+    0x6DC752431E4CB1A6: r"SB_AWD\30_59\ITALIAN\PS2_0055.awd",
+    0x6DCC2F7981F49AAA: r"SB_AWD\30_59\FRENCH\PS2_0051.awd",
+    0x6DCDAB3FEACBF609: r"AUDIO\GERMAN\PS2_4m2.rws",
+    0x6DD50DCCA501AF6F: r"SB_AWD\180_209\ITALIAN\PS2_0185.awd",
+    0x6DE535A496C3BDEE: r"SB_AGD\120_149\GERMAN\XBX_0124.agd",
+    0x6DE901C0A4CF7F1F: r"SHELL\FONTS\mlta20.png",
+    0x6DEA92CDF986133A: r"SB_AGD\120_149\GERMAN\PS2_0141.agd",
+    0x6DEC3ABD6ACE7725: r"SB_AWD\60_89\ITALIAN\PS2_0069.awd",
+    0x6DF63576C4B61E06: r"SB_AWD\30_59\GERMAN\XBX_0058.awd",
+    0x6DF72644A4B3BEDA: r"SB_AGD\60_89\ENGLISH\PS2_0079.agd",
+    0x6DFD641CA9686459: r"SB_AGD\120_149\ENGLISH\PS2_0131.agd",
+    0x6E056CD7459B3EC4: r"SB_AWD\240_269\ENGLISH\PS2_0246.awd",
+    0x6E07F35B079C737E: r"LEVELS\L_1_3_A\SECTIONS\s_12.rws",
+    0x6E0A1CE3875DD25E: r"SB_AGD\0_29\GERMAN\XBX_0023.agd",
+    0x6E0D49871AA63134: r"SB_AGD\0_29\FRENCH\NGC_0018.agd",
+    0x6E138A5650DFE888: r"SB_AWD\180_209\GERMAN\NGC_0208.awd",
+    0x6E15EE2E1A6A84A7: r"SB_AWD\90_119\FRENCH\NGC_0117.awd",
+    0x6E1CFEF046F5AE58: r"DebugPauseMenu.layout",
+    0x6E1FBE80E03B1BF8: r"SB_AWD\210_239\GERMAN\XBX_0229.awd",
+    0x6E24616EFAF4314F: r"SB_AWD\60_89\ENGLISH\NGC_0062.awd",
+    0x6E2A74AA950F33DC: r"SB_AWD\0_29\ENGLISH\XBX_0016.awd",
+    0x6E3B71EE9439B70C: r"SB_AGD\90_119\ITALIAN\PS2_0108.agd",
+    0x6E3BA5AD2D0056B9: r"SB_AWD\30_59\SPANISH\XBX_0051.awd",
+    0x6E3C6855DEBFDFE4: r"SB_AGD\60_89\SPANISH\PS2_0064.agd",
+    0x6E44458A0BC72726: r"SB_AGD\150_179\ENGLISH\XBX_0166.agd",
+    0x6E45528EADA569A7: r"SB_AWD\60_89\GERMAN\NGC_0064.awd",
+    0x6E4D8C1DA70CC894: r"SB_AGD\210_239\SPANISH\PS2_0237.agd",
+    0x6E565E551F964588: r"SB_AGD\180_209\GERMAN\NGC_0208.agd",
+    0x6E5DCA94FFBAE280: r"SB_AGD\60_89\GERMAN\NGC_0063.agd",
+    0x6E619228D585B541: r"SB_AGD\0_29\ENGLISH\PS2_0014.agd",
+    0x6E6A3FE91F2F2FD7: r"SB_AGD\180_209\FRENCH\PS2_0183.agd",
+    0x6E76F33A03CCA207: r"SB_AGD\180_209\GERMAN\PS2_0206.agd",
+    0x6E78A5AE9996CA04: r"SB_AWD\180_209\GERMAN\NGC_0190.awd",
+    0x6E9505B640DE2FF8: r"SB_AGD\120_149\GERMAN\XBX_0126.agd",
+    0x6E958874D3EAFF65: r"SB_AWD\0_29\SPANISH\NGC_0002.awd",
+    0x6E978813BF5FF646: r"SB_AWD\150_179\SPANISH\PS2_0158.awd",
+    0x6E99E2DFA39FAC54: r"SB_AGD\120_149\GERMAN\PS2_0143.agd",
+    0x6E9A88E762F2B011: r"EndGameScoreBoardDeath.layout",
+    0x6EA1BFF7803674E2: r"AUDIO\FRENCH\NGC_2m2.rws",
+    0x6EA22E48D0082227: r"LEVELS\L_3_5\level.rws",
+    0x6EA5F202A03A6358: r"codFontFBO20.tga",
+    0x6EA60B02A03A8DD0: r"codFontFBO20.txd",
+    0x6EA8693D2A33A0CD: r"SB_AGD\60_89\FRENCH\NGC_0064.agd",
+    0x6EB2BF3FBE9D98E3: r"SB_AWD\90_119\SPANISH\NGC_0102.awd",
+    0x6EB8ECF531769168: r"SB_AGD\0_29\GERMAN\XBX_0021.agd",
+    0x6EC533BFB9E5DC0D: r"w_instantaction.txd",
+    0x6ED2C1F03AB5FE27: r"SB_AWD\240_269\FRENCH\XBX_0246.awd",
+    0x6ED60002A0639EEB: r"codfontfbo20.bin",
+    0x6EDC4F02A06890C3: r"codFontFBO20.dds",
+    0x6EE48527B453B9CB: r"SB_AGD\120_149\GERMAN\NGC_0130.agd",
+    0x6EE4B5D967FC13E4: r"SB_AGD\30_59\ITALIAN\XBX_0032.agd",
+    0x6EEB4C20357C6FE8: r"SB_AWD\120_149\GERMAN\PS2_0147.awd",
+    0x6EECDF48D04787F7: r"LEVELS\L_3_5\level.dff",
+    0x6EF461CBCC37FA5C: r"SB_AGD\60_89\SPANISH\XBX_0085.agd",
+    0x6EFB8FBFBA14085E: r"w_instantaction.dds",
+    0x6EFC48F03060B7F7: r"SB_AWD\30_59\SPANISH\NGC_0059.awd",
+    0x6F0040C74465CB76: r"SB_AWD\150_179\ITALIAN\PS2_0169.awd",
+    0x6F0266EEA633A9A3: r"SB_AWD\60_89\ITALIAN\PS2_0089.awd",
+    0x6F0521D24F45987D: r"SHELL\FONTS\mlta22.png",
+    0x6F080450028DE7A7: r"SB_AWD\30_59\ITALIAN\PS2_0047.awd",
+    0x6F0FEE6685E95A9B: r"SB_AGD\120_149\ITALIAN\XBX_0127.agd",
+    0x6F28150FE3C091FB: r"LEVELS\MP_7\SECTIONS\s_1.rws",
+    0x6F2F139C4CD962BB: r"SB_AGD\120_149\SPANISH\NGC_0129.agd",
+    0x6F312E87F2D65ECE: r"SB_AGD\60_89\ITALIAN\XBX_0065.agd",
+    0x6F357727A54E6B81: r"SB_AGD\30_59\SPANISH\XBX_0059.agd",
+    0x6F40CE5DCF7A787C: r"SB_AWD\180_209\ENGLISH\PS2_0205.awd",
+    0x6F43A17D08D5DB3B: r"SB_AGD\0_29\ENGLISH\NGC_0017.agd",
+    0x6F47CF4A4765A04E: r"LOC\DE\MULTILVL.LOC",
+    0x6F48F1C4805D645F: r"SB_AGD\240_269\ENGLISH\NGC_0262.agd",
+    0x6F4ACBEE74AA7A2C: r"SB_AWD\240_269\GERMAN\NGC_0256.awd",
+    0x6F4C04513B3E31D2: r"SB_AGD\30_59\ITALIAN\PS2_0037.agd",
+    0x6F564014B8B0AE21: r"SB_AWD\180_209\FRENCH\XBX_0191.awd",
+    0x6F67AE19692E426B: r"SB_AGD\120_149\FRENCH\PS2_0128.agd",
+    0x6F6DE8A715A1B720: r"SB_AWD\120_149\SPANISH\PS2_0123.awd",
+    0x6F71C8DD23D12D2B: r"SB_AGD\120_149\ITALIAN\PS2_0128.agd",
+    0x6F7639C14C787427: r"SB_AGD\60_89\FRENCH\XBX_0060.agd",
+    0x6F8B38B2ABF16C71: r"w_instantaction.index",
+    0x6FA857609E137A72: r"SB_AGD\210_239\ENGLISH\PS2_0222.agd",
+    0x6FA91A9E912A6B10: r"SHELL\HUD\INSTANCE\gcn\f_hud.txd",
+    0x6FAC465FAC19016A: r"SB_AGD\60_89\ENGLISH\PS2_0084.agd",
+    0x6FB058DC93FA8C96: r"SB_AWD\0_29\ITALIAN\XBX_0018.awd",
+    0x6FB6B91C5A6AEEAA: r"SB_AGD\90_119\GERMAN\PS2_0094.agd",
+    0x6FCF787029463A48: r"SB_AGD\120_149\FRENCH\PS2_0145.agd",
+    0x6FCFC7877BFE1D07: r"AUDIO\SPANISH\PS2_1s1.rws",
+    0x6FD61591B11E02AE: r"SB_AGD\30_59\SPANISH\NGC_0047.agd",
+    0x6FD89333E3E77208: r"SB_AGD\120_149\ITALIAN\PS2_0145.agd",
+    0x6FE5A729AC613791: r"SB_AWD\240_269\SPANISH\NGC_0260.awd",
+    0x6FED5EFE00D41BC4: r"SHELL\LOAD\L_3_5_C.txd",
+    0x6FF600C573D9363C: r"SB_AGD\240_269\GERMAN\PS2_0244.agd",
+    0x6FF86020CFAAB646: r"SB_AWD\0_29\ENGLISH\NGC_0023.awd",
+    0x6FF98ECB1AF1A205: r"SB_AGD\30_59\ENGLISH\XBX_0055.agd",
+    0x6FFA65A5132E1CB6: r"SB_AGD\150_179\ENGLISH\XBX_0179.agd",
+    0x6FFA7904ED652684: r"SB_AGD\60_89\ITALIAN\NGC_0069.agd",
+    0x6FFF14F927D27B21: r"SB_AGD\120_149\SPANISH\PS2_0140.agd",
+    0x7001B0615EEBC981: r"QuitScoreBoardDeath.layout",
+    0x7006086A08195AA3: r"SB_AGD\90_119\SPANISH\NGC_0102.agd",
+    0x70066E3D715E6BD8: r"SB_AGD\0_29\ITALIAN\PS2_0024.agd",
+    0x700AF36CB2D68398: r"LEVELS\L_1_3_A\SECTIONS\s_10.rws",
+    0x7010B0D6C6BCFC29: r"SHELL\FONTS\mcn8.png",
+    0x701283940B40E30A: r"SB_AWD\150_179\SPANISH\NGC_0177.awd",
+    0x701658D680F2FB97: r"SB_AWD\60_89\ENGLISH\XBX_0060.awd",
+    0x701BEB430B414206: r"SB_AGD\210_239\SPANISH\XBX_0236.agd",
+    0x701C4697B3B30154: r"SB_AGD\240_269\SPANISH\NGC_0269.agd",
+    0x7020CDD580FFD96F: r"SB_AWD\120_149\GERMAN\NGC_0123.awd",
+    0x70268C358ADC97AF: r"LEVELS\MP_7\SECTIONS\s_16.rws",
+    0x70276433B676B533: r"LEVELS\L_3_3\SECTIONS\s_8.rws",
+    0x703342CFB7B2AF11: r"SB_AWD\210_239\FRENCH\NGC_0233.awd",
+    0x70380DDE508E0709: r"SB_AWD\180_209\ITALIAN\PS2_0187.awd",
+    0x7038834256B9903A: r"SB_AGD\180_209\ITALIAN\NGC_0206.agd",
+    0x70410F6022D5875C: r"SB_AGD\120_149\SPANISH\XBX_0142.agd",
+    0x704122E51926D87B: r"SB_AWD\240_269\GERMAN\PS2_0254.awd",
+    0x70451ADDD61EF993: r"SB_AGD\210_239\ITALIAN\XBX_0211.agd",
+    0x704E901B56B9B390: r"SB_AGD\60_89\ENGLISH\XBX_0089.agd",
+    0x7053A1D9F480B5E5: r"SB_AWD\210_239\SPANISH\PS2_0210.awd",
+    0x7058AF8F5B3096F3: r"SB_AWD\30_59\GERMAN\XBX_0033.awd",
+    0x705C09C3D9BBE95E: r"SB_AWD\30_59\ITALIAN\NGC_0036.awd",
+    0x7065892E0483AE44: r"SB_AGD\90_119\GERMAN\PS2_0096.agd",
+    0x7070791F83797B88: r"SB_AGD\0_29\SPANISH\NGC_0014.agd",
+    0x708BDBA0E87EEB6B: r"SB_AGD\240_269\ITALIAN\PS2_0249.agd",
+    0x7095C36A98A07560: r"SB_AGD\120_149\ITALIAN\NGC_0140.agd",
+    0x7096C5123EB8F9C6: r"SB_AGD\60_89\GERMAN\XBX_0074.agd",
+    0x7098A6E19679CAB4: r"SB_AGD\90_119\ITALIAN\NGC_0093.agd",
+    0x709CF70F1A621570: r"LEVELS\L_1_5\SECTIONS\s_12.rws",
+    0x70A1B4AB265E521B: r"SB_AGD\150_179\FRENCH\NGC_0150.agd",
+    0x70A3F58F45689BA9: r"SB_AWD\150_179\SPANISH\NGC_0167.awd",
+    0x70AE7FFE673C6C70: r"LEVELS\L_3_1\SECTIONS\s_9.rws",
+    0x70AEA6D9AB6FC6B4: r"SB_AWD\0_29\ENGLISH\PS2_0028.awd",
+    0x70BD0449927AB748: r"SB_AWD\60_89\SPANISH\XBX_0089.awd",
+    0x70C044A9CBE4DE61: r"SB_AWD\90_119\ITALIAN\XBX_0094.awd",
+    0x70CE4743AF51A4E1: r"SB_AWD\30_59\ITALIAN\NGC_0053.awd",
+    0x70D101C04B7C18A3: r"SB_AGD\30_59\SPANISH\PS2_0054.agd",
+    0x70D597C27C7BE797: r"SB_AGD\60_89\SPANISH\XBX_0068.agd",
+    0x70DC8A299E470940: r"SB_AWD\30_59\ENGLISH\NGC_0045.awd",
+    0x70DF02DF1E1B773F: r"SB_AWD\60_89\GERMAN\XBX_0084.awd",
+    0x70DF0AD3F44B2A28: r"SB_AGD\120_149\GERMAN\PS2_0132.agd",
+    0x70E4873EB6631B7A: r"SB_AGD\180_209\ITALIAN\PS2_0207.agd",
+    0x70E7D35400D32954: r"SB_AGD\180_209\ITALIAN\NGC_0204.agd",
+    0x70EA8C32E3261030: r"SB_AWD\90_119\FRENCH\NGC_0107.awd",
+    0x70F1FF8400C282E4: r"SB_AGD\60_89\GERMAN\NGC_0081.agd",
+    0x70F3A5F7A896E348: r"SB_AGD\240_269\ITALIAN\PS2_0264.agd",
+    0x70F4A3EDF12F1ED8: r"SB_AWD\180_209\GERMAN\PS2_0209.awd",
+    0x70F4FD89305C19E3: r"SB_AWD\240_269\ITALIAN\NGC_0266.awd",
+    0x710ACC60060A32B6: r"SB_AGD\150_179\FRENCH\PS2_0158.agd",
+    0x710F3B14D9EA2338: r"SB_AWD\180_209\SPANISH\PS2_0191.awd",
+    0x7111F4D1F71DB1CC: r"LEVELS\L_3_1\SECTIONS\s_25.rws",
+    0x7122BE2CEFB8B22A: r"SB_AWD\30_59\FRENCH\XBX_0038.awd",
+    0x712BC5218EFBCD05: r"LEVELS\MP_7\SECTIONS\s_3.rws",
+    0x71311FE432BC1217: r"SB_AWD\180_209\ENGLISH\NGC_0184.awd",
+    0x7133D16D2C47401E: r"SHELL\FONTS\mlta18.png",
+    0x713B17B1F76F52B7: r"SB_AGD\150_179\ENGLISH\XBX_0163.agd",
+    0x713D4BC38E7AFA7C: r"SB_AGD\90_119\FRENCH\XBX_0116.agd",
+    0x7140528DAC3AD30D: r"SB_AWD\240_269\ENGLISH\NGC_0264.awd",
+    0x714755395FDFC065: r"SB_AGD\120_149\GERMAN\NGC_0132.agd",
+    0x7148B555C5E8076A: r"SB_AWD\60_89\GERMAN\NGC_0083.awd",
+    0x7150D84364EC2670: r"ANIMGRPS\Lvl_15\Lvl_15S.ads",
+    0x715223E6B2B8E1FB: r"SB_AGD\0_29\ITALIAN\PS2_0009.agd",
+    0x716C303C22CE7B12: r"SB_AWD\30_59\FRENCH\NGC_0058.awd",
+    0x71737AA587699544: r"SB_AWD\240_269\FRENCH\NGC_0243.awd",
+    0x71775FF9C1BE5A86: r"SB_AWD\210_239\SPANISH\PS2_0239.awd",
+    0x7180513B6453DF86: r"SB_AGD\180_209\SPANISH\XBX_0204.agd",
+    0x718A70F498FA09C7: r"SB_AGD\150_179\GERMAN\NGC_0174.agd",
+    0x718B7A3B485FFE32: r"SB_AWD\30_59\ENGLISH\NGC_0043.awd",
+    0x718D3D50F49A3ADF: r"LEVELS\MP_10\SECTIONS\s_7.rws",
+    0x718E42F0C834F499: r"SB_AWD\60_89\GERMAN\XBX_0086.awd",
+    0x7190B51F6AFE1F17: r"SB_AGD\120_149\ENGLISH\XBX_0141.agd",
+    0x7197E97F2C6D8A3D: r"SB_AGD\210_239\ENGLISH\PS2_0218.agd",
+    0x719898C2AEAD28CD: r"SB_AWD\210_239\FRENCH\PS2_0210.awd",
+    0x71A3705D53AB0AEB: r"SB_AGD\0_29\SPANISH\PS2_0009.agd",
+    0x71A773231AFBF89C: r"SB_AWD\240_269\FRENCH\PS2_0246.awd",
+    0x71AAD1D62BE7D299: r"SB_AGD\240_269\ENGLISH\NGC_0260.agd",
+    0x71ABD451AED817BF: r"SHELL\LOAD\MP_1_DM.txd",
+    0x71AF7740591A5F9E: r"SB_AGD\60_89\ITALIAN\PS2_0062.agd",
+    0x71B02C160AD559A8: r"SB_AWD\60_89\FRENCH\XBX_0078.awd",
+    0x71B4BFFACFFD243B: r"SB_AGD\60_89\FRENCH\PS2_0074.agd",
+    0x71B88D0E32EEF258: r"SB_AWD\150_179\GERMAN\PS2_0172.awd",
+    0x71BBD0416A3172A3: r"SB_AWD\180_209\FRENCH\XBX_0180.awd",
+    0x71BE4E6837EE0B5E: r"SB_AGD\180_209\ITALIAN\NGC_0181.agd",
+    0x71D266B2BB19F6E4: r"SB_AGD\240_269\SPANISH\NGC_0254.agd",
+    0x71D36F16B485736F: r"SB_AWD\180_209\GERMAN\XBX_0201.awd",
+    0x71D58B136BE076F3: r"SB_AWD\150_179\GERMAN\PS2_0157.awd",
+    0x71DCA254CB497330: r"SB_AWD\30_59\ITALIAN\PS2_0057.awd",
+    0x71DDB001B7C1AEA2: r"ANIMGRPS\Lvl_24\Lvl_24M.ads",
+    0x71E15F8B2EF12664: r"SB_AWD\30_59\FRENCH\PS2_0053.awd",
+    0x71E690AD8ED47664: r"SB_AGD\180_209\SPANISH\NGC_0198.agd",
+    0x71E78E1B1ADBEF95: r"SB_AGD\150_179\ENGLISH\PS2_0153.agd",
+    0x71EECFA5D121E577: r"ANIMGRPS\Lvl_22\Lvl_22H.ads",
+    0x71F2164224255C67: r"SHELL\FONTS\lta24.met",
+    0x71F7E56770016924: r"SB_AWD\60_89\GERMAN\NGC_0081.awd",
+    0x71F8894611183A1F: r"SHELL\MOVIES\SPANISH\1_5_Mon.bik",
+    0x720921F4FBE69B15: r"SB_AWD\210_239\SPANISH\PS2_0225.awd",
+    0x720B3AB413C302C8: r"SB_AGD\0_29\SPANISH\PS2_0024.agd",
+    0x7210588873F13463: r"SB_AWD\60_89\ITALIAN\XBX_0073.awd",
+    0x72137313AA78C167: r"AUDIO\SPANISH\NGC_4s3.rws",
+    0x721BB7F2B0F2AD55: r"SB_AGD\240_269\ITALIAN\XBX_0248.agd",
+    0x722FDA5441BFE6B4: r"AUDIO\ENGLISH\XBX_1s3.rws",
+    0x7230A064136F321D: r"LOC\FR\MULTILVL.LOC",
+    0x724074BC420D207E: r"SB_AWD\0_29\ENGLISH\XBX_0018.awd",
+    0x72438F206DC542C7: r"ANIMGRPS\Lvl_22\Lvl_22X.ads",
+    0x7247E8D458C6C15F: r"SB_AWD\210_239\FRENCH\PS2_0216.awd",
+    0x724E2B65DCC2A2F6: r"SB_AGD\90_119\ITALIAN\NGC_0118.agd",
+    0x7250B864F6D65A6C: r"SB_AWD\60_89\SPANISH\NGC_0072.awd",
+    0x7251520041376DCE: r"SB_AGD\90_119\ITALIAN\PS2_0106.agd",
+    0x72567334C515093E: r"SB_AWD\240_269\FRENCH\PS2_0248.awd",
+    0x726B1232DEDF676B: r"SB_AGD\30_59\ITALIAN\PS2_0054.agd",
+    0x726D1E79E206CA68: r"SB_AGD\180_209\ITALIAN\NGC_0183.agd",
+    0x727478F0E5859FDB: r"SB_AGD\30_59\GERMAN\NGC_0040.agd",
+    0x727EBB54B6CD4890: r"SB_AGD\210_239\SPANISH\XBX_0234.agd",
+    0x727F6AABC0F9BC6B: r"SB_AGD\210_239\GERMAN\XBX_0217.agd",
+    0x7283CDE72C8C3109: r"SB_AWD\120_149\GERMAN\NGC_0121.awd",
+    0x72886E65C00311C5: r"SB_AWD\180_209\ITALIAN\XBX_0207.awd",
+    0x729DA43BBEEE19DE: r"SHELL\FEND\INSTANCE\SKY\LDBAN_MP.TXD",
+    0x72A035D00CD224CB: r"SB_AGD\210_239\ENGLISH\XBX_0211.agd",
+    0x72B72C32CA0B0A81: r"SB_AGD\90_119\ENGLISH\XBX_0111.agd",
+    0x72B81206A5FF9087: r"SB_AWD\210_239\SPANISH\PS2_0223.awd",
+    0x72C28E5F2DBF14A0: r"SB_AGD\150_179\ITALIAN\NGC_0162.agd",
+    0x72C49C917941C94C: r"SB_AGD\150_179\SPANISH\XBX_0168.agd",
+    0x72C53DF4894355FF: r"SB_AWD\150_179\FRENCH\XBX_0156.awd",
+    0x72C74CD17A1E760C: r"SB_AWD\90_119\SPANISH\PS2_0108.awd",
+    0x72CEACCFE3AE0716: r"SB_AGD\30_59\ENGLISH\XBX_0049.agd",
+    0x72D1051233F054BA: r"SB_AWD\180_209\ITALIAN\NGC_0185.awd",
+    0x72D9530035EA17B0: r"SB_AGD\150_179\FRENCH\NGC_0179.agd",
+    0x72DB85FC0B832BB2: r"ANIMGRPS\Lvl_14\Lvl_14O.ads",
+    0x72EDB6F64FA34510: r"SB_AWD\60_89\ENGLISH\XBX_0089.awd",
+    0x72F421A62D652988: r"SB_AGD\120_149\GERMAN\XBX_0135.agd",
+    0x72F8137C442BA272: r"SB_AGD\120_149\ITALIAN\NGC_0146.agd",
+    0x72F89523EA434D50: r"SB_AGD\60_89\GERMAN\XBX_0076.agd",
+    0x73038E938CC78DB3: r"AUDIO\FRENCH\XBX_4m3.rws",
+    0x730A433562DA71E7: r"SB_AWD\240_269\GERMAN\PS2_0269.awd",
+    0x7319EA160005874A: r"SB_AWD\180_209\FRENCH\PS2_0209.awd",
+    0x732349028F9E5EF5: r"SB_AGD\30_59\GERMAN\NGC_0042.agd",
+    0x7325BE7832E6F5B5: r"SB_AGD\120_149\ITALIAN\XBX_0125.agd",
+    0x7337BE5D26F63583: r"SB_AWD\240_269\GERMAN\NGC_0260.awd",
+    0x73391C4C2441A039: r"SB_AWD\30_59\GERMAN\PS2_0032.awd",
+    0x7344F3B5FED98440: r"SB_AGD\60_89\FRENCH\XBX_0089.agd",
+    0x734B4739524C0693: r"SB_AGD\30_59\SPANISH\XBX_0057.agd",
+    0x734D17A126496E0F: r"AUDIO\ITALIAN\NGC_2m3.rws",
+    0x734DA71FFC65920A: r"SB_AWD\90_119\ENGLISH\PS2_0115.awd",
+    0x735D934D04C91C9E: r"SB_AGD\150_179\ENGLISH\NGC_0168.agd",
+    0x735F8C0021A6470E: r"SB_AWD\240_269\GERMAN\NGC_0258.awd",
+    0x736C9F4067F5B066: r"SHELL\FONTS\mfb22.png",
+    0x73737CA3235AA30E: r"SB_AGD\150_179\SPANISH\XBX_0166.agd",
+    0x737481C7ACA5B3F3: r"SB_AWD\210_239\SPANISH\XBX_0220.awd",
+    0x73777AA5F260A85A: r"SB_AWD\120_149\ENGLISH\NGC_0146.awd",
+    0x737EB439334E4E3C: r"SB_AGD\210_239\FRENCH\PS2_0237.agd",
+    0x737F17B2F4399A63: r"SB_AGD\240_269\ENGLISH\PS2_0252.agd",
+    0x73805E5FFC2022D4: r"SB_AGD\60_89\SPANISH\NGC_0069.agd",
+    0x7382236246E59E4D: r"SB_AGD\210_239\GERMAN\PS2_0216.agd",
+    0x738798D6E6648C00: r"SB_AWD\210_239\FRENCH\XBX_0223.awd",
+    0x738ACC74CD55393A: r"SB_AGD\120_149\ENGLISH\NGC_0146.agd",
+    0x738D96278E47DE05: r"SB_AGD\30_59\ENGLISH\PS2_0030.agd",
+    0x739B9FE6A7840BBB: r"SB_AWD\120_149\ENGLISH\XBX_0130.awd",
+    0x73AD7ECB738F7C24: r"SB_AGD\240_269\ENGLISH\XBX_0256.agd",
+    0x73B6969398A63395: r"SB_AWD\150_179\ENGLISH\PS2_0153.awd",
+    0x73B7223DE1B6AE91: r"SB_AWD\0_29\SPANISH\XBX_0026.awd",
+    0x73B7AAEA1F322EC7: r"SB_AWD\60_89\ITALIAN\PS2_0078.awd",
+    0x73C2167159169C04: r"SB_AGD\60_89\ENGLISH\PS2_0086.agd",
+    0x73D71F83D7407296: r"w_PlayerSetupBKG.index",
+    0x73DD47276D0F174B: r"LEVELS\L_3_1\level.dff",
+    0x73DF191B368D4AA9: r"SB_AWD\90_119\ENGLISH\PS2_0109.awd",
+    0x73E3214D0FDFE610: r"SB_AGD\180_209\SPANISH\XBX_0206.agd",
+    0x73EAE5A35E19EAB8: r"SB_AGD\30_59\SPANISH\NGC_0045.agd",
+    0x7403CBC22D8E785D: r"SB_AWD\240_269\SPANISH\XBX_0262.awd",
+    0x740F5EDCC7EF3D17: r"SB_AGD\30_59\ENGLISH\XBX_0053.agd",
+    0x740F9561FA019B3D: r"SB_AGD\150_179\ITALIAN\XBX_0172.agd",
+    0x7412290492BCDB04: r"SHELL\FONTS\mfbld28.png",
+    0x741A62CBAC8B3590: r"SB_AWD\60_89\ITALIAN\NGC_0076.awd",
+    0x741AF6276D43EEDB: r"LEVELS\L_3_1\level.rws",
+    0x7421E03A0D085630: r"SB_AGD\240_269\FRENCH\XBX_0252.agd",
+    0x742E944ADD68DBFE: r"SB_AGD\210_239\FRENCH\PS2_0239.agd",
+    0x743042F357E3927F: r"SHELL\MOVIES\1_5_Mon.bik",
+    0x74366F286011CB09: r"SB_AWD\180_209\GERMAN\XBX_0203.awd",
+    0x743A1C86776ED254: r"SB_AGD\120_149\ENGLISH\NGC_0144.agd",
+    0x743ABA20FDD5127D: r"SB_AWD\60_89\FRENCH\PS2_0083.awd",
+    0x743D0A38AE59C8F9: r"SB_AGD\210_239\FRENCH\XBX_0231.agd",
+    0x745991096F4A9E4B: r"SB_AWD\30_59\ENGLISH\PS2_0032.awd",
+    0x746586A542BF2907: r"SB_AWD\150_179\ENGLISH\PS2_0155.awd",
+    0x7470B9D586B79A88: r"SB_AWD\30_59\ITALIAN\NGC_0034.awd",
+    0x748523166D496B5B: r"SB_AGD\180_209\FRENCH\XBX_0197.agd",
+    0x7486ADC72D18B82C: r"SB_AGD\240_269\SPANISH\XBX_0256.agd",
+    0x749B2E0CB2942916: r"SB_AWD\120_149\SPANISH\XBX_0131.awd",
+    0x74A4E4E8F38BFB18: r"SB_AWD\0_29\ENGLISH\XBX_0009.awd",
+    0x74A5CBE74567715D: r"LOC\US\HUD.LOC",
+    0x74B784BCD35BED35: r"SB_AGD\150_179\FRENCH\NGC_0152.agd",
+    0x74BB1941E8249E43: r"ANIMGRPS\Lvl_21\Lvl_21B.ads",
+    0x74BCAEDA0297640A: r"SB_AWD\30_59\ENGLISH\NGC_0032.awd",
+    0x74C1E2EE2C7D7FB3: r"SB_AWD\0_29\ENGLISH\XBX_0020.awd",
+    0x74C33CE4396C89D1: r"w_map04.dds",
+    0x74C4D112A81BD81E: r"SB_AWD\240_269\ENGLISH\XBX_0243.awd",
+    0x74CEED4AA4C0E28B: r"SB_AWD\240_269\ITALIAN\XBX_0260.awd",
+    0x74D8E91D97047A85: r"SB_AGD\30_59\GERMAN\NGC_0037.agd",
+    0x74DE78F953AB6FB6: r"SB_AGD\30_59\GERMAN\PS2_0048.agd",
+    0x74DED780C193D0EC: r"WPNBANK\26_50\wbank_26.bin",
+    0x74E2CCDA9433CE57: r"AUDIO\GERMAN\XBX_4m1.rws",
+    0x74E98A32A7EDD10F: r"SB_AWD\60_89\FRENCH\PS2_0085.awd",
+    0x74F87DB1E708DF37: r"ANIMGRPS\Lvl_35\Lvl_35T.ads",
+    0x74F930E4399A04CA: r"w_map04.txd",
+    0x74F954693AF43520: r"gui_map3_death.index",
+    0x74F9D750635FDC94: r"SB_AGD\180_209\ITALIAN\PS2_0205.agd",
+    0x75000A51EE48F81D: r"SB_AWD\60_89\SPANISH\XBX_0066.awd",
+    0x750305E1B85E2B65: r"SB_AGD\210_239\ENGLISH\XBX_0213.agd",
+    0x751058BC84C8D553: r"ANIMGRPS\Lvl_21\Lvl_21R.ads",
+    0x751A65DF26C23E1B: r"SB_AGD\240_269\ITALIAN\NGC_0244.agd",
+    0x7524DE70D94A41B2: r"SB_AGD\150_179\ITALIAN\NGC_0164.agd",
+    0x752F8476F12AF618: r"SB_AWD\0_29\GERMAN\PS2_0008.awd",
+    0x7533F32817622A75: r"SB_AGD\180_209\FRENCH\XBX_0195.agd",
+    0x753537CDFBA08FF3: r"SB_AGD\240_269\ENGLISH\PS2_0267.agd",
+    0x75370E927DB193A1: r"SB_AWD\240_269\ENGLISH\XBX_0266.awd",
+    0x7541303FB1A85B68: r"SB_AGD\30_59\ENGLISH\PS2_0048.agd",
+    0x754E3D2C83ADEF87: r"ANIMGRPS\Lvl_35\Lvl_35D.ads",
+    0x755159956AD93953: r"SB_AWD\30_59\ITALIAN\XBX_0035.awd",
+    0x75522BD53B76FD3E: r"SB_AGD\90_119\FRENCH\XBX_0118.agd",
+    0x7555A29F5937949F: r"SB_AWD\240_269\ENGLISH\NGC_0262.awd",
+    0x75563D6CF6CF43CB: r"SB_AGD\0_29\ENGLISH\NGC_0008.agd",
+    0x75587158C176E046: r"SB_AWD\240_269\GERMAN\XBX_0263.awd",
+    0x755E2B0FE8920A1C: r"SB_AWD\30_59\ENGLISH\PS2_0044.awd",
+    0x75619F5213238324: r"SHELL\FONTS\mfb20.png",
+    0x7570444C7381351F: r"SB_AGD\150_179\GERMAN\XBX_0169.agd",
+    0x7574812452361448: r"SB_AWD\240_269\ENGLISH\XBX_0241.awd",
+    0x757B6909485DA090: r"SB_AWD\0_29\ITALIAN\XBX_0009.awd",
+    0x757DBD5C4ED9A1A5: r"SB_AWD\240_269\ITALIAN\XBX_0262.awd",
+    0x7581423BA406C797: r"SB_AWD\60_89\SPANISH\PS2_0078.awd",
+    0x75B679789C5DFDB0: r"SB_AWD\180_209\ITALIAN\NGC_0208.awd",
+    0x75BE8706CA449095: r"LEVELS\L_1_2_B\GodData.dff",
+    0x75C3C380049D6E8F: r"SB_AWD\60_89\ENGLISH\PS2_0078.awd",
+    0x75C547520617FAA8: r"SB_AGD\60_89\ITALIAN\PS2_0060.agd",
+    0x75DA2969D9BCE31A: r"SB_AWD\90_119\ENGLISH\XBX_0097.awd",
+    0x75E3A98E6FFD74F6: r"LOC\IT\HUD.LOC",
+    0x75E65EA427CB2C33: r"SB_AWD\240_269\ENGLISH\XBX_0268.awd",
+    0x75ED26891DF2829B: r"SB_AWD\0_29\ITALIAN\XBX_0020.awd",
+    0x75EEA092F1423E4E: r"SB_AWD\0_29\SPANISH\XBX_0003.awd",
+    0x75F5385C57B991B7: r"AUDIO\GERMAN\XBX_4s3.rws",
+    0x75FC5E2CC7D7D7A7: r"SB_AGD\150_179\ENGLISH\PS2_0155.agd",
+    0x75FE7AD7340701C5: r"SB_AWD\0_29\GERMAN\NGC_0017.awd",
+    0x76019BC7FEAD6207: r"AUDIO\SPANISH\PS2_4m2.rws",
+    0x76082B9A63A4A7E8: r"SHELL\MOVIES\FRENCH\fend.bik",
+    0x760B9C9490BB4CD5: r"SB_AWD\0_29\GERMAN\XBX_0002.awd",
+    0x76170F1D599D4A04: r"SB_AWD\120_149\ITALIAN\XBX_0128.awd",
+    0x7618831F552B53CC: r"SB_AWD\180_209\ENGLISH\NGC_0204.awd",
+    0x761A7B31F412E9A1: r"SB_AGD\0_29\FRENCH\NGC_0024.agd",
+    0x761DA4682C888E0C: r"SB_AGD\210_239\ITALIAN\XBX_0227.agd",
+    0x76209C77F6A7BC5C: r"SB_AGD\150_179\ITALIAN\PS2_0156.agd",
+    0x7625D9037AA95F4D: r"SB_AWD\0_29\SPANISH\NGC_0020.awd",
+    0x7631A8945C29768B: r"SB_AWD\0_29\FRENCH\NGC_0017.awd",
+    0x764A09CE3E865F39: r"SB_AWD\180_209\ITALIAN\PS2_0194.awd",
+    0x764A78E34E3EF03A: r"SB_AGD\0_29\GERMAN\NGC_0018.agd",
+    0x764B60FAF91B22B0: r"SB_AGD\210_239\ITALIAN\PS2_0233.agd",
+    0x7655C8423C12B8E6: r"SB_AGD\30_59\GERMAN\XBX_0058.agd",
+    0x76608FE849597425: r"SB_AGD\0_29\ITALIAN\PS2_0018.agd",
+    0x7661B53EF31BD760: r"SB_AGD\60_89\GERMAN\XBX_0065.agd",
+    0x76664F7C0441F3B9: r"SB_AGD\240_269\GERMAN\XBX_0259.agd",
+    0x767C92DD58162CC2: r"SB_AWD\60_89\ITALIAN\NGC_0070.awd",
+    0x769C6280010C0B23: r"SB_AGD\120_149\ENGLISH\NGC_0132.agd",
+    0x769D1E776CFEC377: r"SB_AWD\180_209\ITALIAN\XBX_0201.awd",
+    0x76A0E35A6D0F3840: r"LEVELS\MP_10\level.dff",
+    0x76A3232557DD8271: r"AUDIO\SPANISH\NGC_4s1.rws",
+    0x76AD4036EBA8CCAA: r"SB_AWD\0_29\ITALIAN\PS2_0022.awd",
+    0x76CBC3710CC69AEA: r"SB_AGD\90_119\SPANISH\PS2_0102.agd",
+    0x76D0045A6D36E088: r"LEVELS\MP_10\level.rws",
+    0x76D2D92B18E5EBFB: r"SB_AWD\210_239\GERMAN\NGC_0211.awd",
+    0x76D5291524C2F7DF: r"SB_AWD\0_29\SPANISH\NGC_0026.awd",
+    0x76D5AF65E89A1513: r"SB_AGD\120_149\FRENCH\XBX_0145.agd",
+    0x76DA7E06363FFC59: r"SB_AWD\150_179\FRENCH\XBX_0154.awd",
+    0x76DABDBA98722ADF: r"SB_AGD\90_119\GERMAN\XBX_0092.agd",
+    0x76E078A6064235A5: r"SB_AWD\0_29\FRENCH\NGC_0015.awd",
+    0x76E57CEC3F6D56E1: r"AUDIO\GERMAN\XBX_4m3.rws",
+    0x76E679F952C424F9: r"LEVELS\MP_5\SECTIONS\s_1.rws",
+    0x76E6F523E0EE2634: r"SB_AWD\180_209\ITALIAN\NGC_0187.awd",
+    0x76F1620DB880DB04: r"ANIMGRPS\Lvl_14\Lvl_14A.ads",
+    0x76F549A45E3347BE: r"SB_AGD\120_149\SPANISH\NGC_0142.agd",
+    0x76FCFE1E5E1E7CA0: r"SB_AWD\120_149\SPANISH\XBX_0133.awd",
+    0x76FEB342CCCA7A21: r"SB_AWD\120_149\ITALIAN\PS2_0131.awd",
+    0x77066B9FB44C7240: r"SB_AWD\240_269\ITALIAN\XBX_0249.awd",
+    0x770A3433C258980D: r"SB_AGD\150_179\GERMAN\PS2_0155.agd",
+    0x7712AD64B9591215: r"SHELL\FONTS\t16.met",
+    0x7714533A5CBFA5C8: r"SB_AWD\210_239\ENGLISH\NGC_0218.awd",
+    0x7746218855243894: r"ANIMGRPS\Lvl_14\Lvl_14Q.ads",
+    0x774F279E9C7579AD: r"LEVELS\L_3_5\SECTIONS\s_11.rws",
+    0x7750DEA18283483F: r"SB_AWD\90_119\GERMAN\XBX_0092.awd",
+    0x7769CBB76E35CF78: r"ANIMGRPS\Lvl_33\Lvl_33G.ads",
+    0x776DBADD453D9E29: r"SB_AWD\30_59\ENGLISH\XBX_0033.awd",
+    0x777272ED29DA746B: r"SB_AWD\150_179\ITALIAN\NGC_0158.awd",
+    0x77743287641AAE7F: r"SB_AWD\30_59\FRENCH\NGC_0051.awd",
+    0x7774AA396C9BB7D7: r"SB_AWD\60_89\GERMAN\XBX_0071.awd",
+    0x777A039B0C049AFF: r"SB_AWD\60_89\ENGLISH\PS2_0085.awd",
+    0x778ACC067ABDF8FB: r"SHELL\MOVIES\ITALIAN\Intro.bik",
+    0x779A4090248A85F6: r"SB_AWD\150_179\ITALIAN\NGC_0160.awd",
+    0x779D88E893625DF2: r"SB_AWD\210_239\FRENCH\XBX_0225.awd",
+    0x77A366393B457917: r"SB_AGD\30_59\ENGLISH\PS2_0036.agd",
+    0x77A47F9DE65ED1E5: r"SB_AGD\120_149\SPANISH\NGC_0138.agd",
+    0x77A4A40B825E9ABD: r"SB_AWD\120_149\SPANISH\NGC_0130.awd",
+    0x77B2DBEBB2161DBB: r"AUDIO\ENGLISH\NGC_1s2.rws",
+    0x77C10D7C9CC1C113: r"SB_AWD\150_179\FRENCH\NGC_0161.awd",
+    0x77C6047E8AFA39D0: r"w_weaponsGB.index",
+    0x77C75BEABDF68CCB: r"SB_AGD\60_89\FRENCH\PS2_0089.agd",
+    0x77C9BF138DD10207: r"SB_AGD\180_209\ENGLISH\PS2_0185.agd",
+    0x77C9F7369DCE158A: r"SB_AGD\90_119\ITALIAN\PS2_0090.agd",
+    0x77D60B40550116DF: r"SB_AGD\0_29\GERMAN\NGC_0020.agd",
+    0x77E0FD02B58C61A9: r"SB_AWD\0_29\FRENCH\XBX_0026.awd",
+    0x77E6F82C89CC1656: r"SB_AWD\60_89\GERMAN\XBX_0067.awd",
+    0x77E7B95B8D91A00D: r"SB_AGD\150_179\FRENCH\NGC_0163.agd",
+    0x77EB33C95E386E82: r"XboxSysLinkSessionList.layout",
+    0x77F2B8B9CE43987B: r"SB_AGD\120_149\SPANISH\PS2_0120.agd",
+    0x77FF5C5FFAC4628B: r"SB_AGD\180_209\ITALIAN\XBX_0195.agd",
+    0x78001EB32C9CC599: r"SB_AWD\90_119\GERMAN\XBX_0090.awd",
+    0x7801FF452976ADBA: r"LEVELS\L_1_5_B\SECTIONS\s_4.rws",
+    0x7809926699777B7D: r"SB_AGD\60_89\ENGLISH\XBX_0080.agd",
+    0x78154165CCCD8C28: r"SB_AWD\210_239\ITALIAN\NGC_0210.awd",
+    0x7821E3617978C0D8: r"SB_AWD\240_269\FRENCH\PS2_0259.awd",
+    0x7837B04BBA05F1C2: r"SB_AGD\240_269\FRENCH\XBX_0254.agd",
+    0x783A25B7F5F78D1D: r"LEVELS\L_1_3_A\SECTIONS\s_19.rws",
+    0x783C0D06AB016086: r"SB_AGD\180_209\ENGLISH\PS2_0193.agd",
+    0x784FF69AC97E8935: r"SB_AWD\0_29\ITALIAN\XBX_0022.awd",
+    0x7854B24BB380CC1E: r"SB_AWD\210_239\ITALIAN\PS2_0226.awd",
+    0x7866106F90649ECC: r"SHELL\FONTS\cn14.met",
+    0x786916C3FBBF0CCB: r"SB_AWD\120_149\FRENCH\XBX_0138.awd",
+    0x7869E5B68DD7D9A2: r"AUDIO\ENGLISH\NGC_2m2.rws",
+    0x786E91F7A107AAF1: r"SB_AWD\180_209\SPANISH\XBX_0203.awd",
+    0x786F611B1C483965: r"SB_AWD\30_59\ENGLISH\PS2_0030.awd",
+    0x78787EA25E426F6A: r"SB_AWD\0_29\ITALIAN\NGC_0012.awd",
+    0x78894F2208DECCF1: r"SB_AGD\90_119\FRENCH\NGC_0102.agd",
+    0x78960367CA73B601: r"SB_AGD\90_119\ENGLISH\NGC_0092.agd",
+    0x789CD10DDEA9A30D: r"SB_AGD\150_179\FRENCH\XBX_0150.agd",
+    0x78A416D3EEE411E5: r"LEVELS\MP_9\SECTIONS\s_1.rws",
+    0x78AED1FB0910D11D: r"SB_AWD\240_269\ITALIAN\XBX_0253.awd",
+    0x78AFE90FFFBF7EE4: r"SB_AGD\0_29\GERMAN\NGC_0009.agd",
+    0x78C405509EA70472: r"SB_AGD\60_89\GERMAN\XBX_0063.agd",
+    0x78C6C59BF7E0E395: r"SB_AGD\30_59\SPANISH\PS2_0049.agd",
+    0x78C90C1DFE6BA2FB: r"SB_AGD\30_59\ITALIAN\NGC_0055.agd",
+    0x78D0ED5395223FBD: r"ANIMGRPS\Lvl_21\Lvl_21D.ads",
+    0x78E0828DB485020B: r"w_map01.index",
+    0x78E5C9B7199FB23C: r"SB_AGD\240_269\SPANISH\XBX_0245.agd",
+    0x78E9565D8B765E1C: r"SB_AWD\0_29\ENGLISH\PS2_0006.awd",
+    0x78EEB92F44021597: r"SB_AGD\30_59\GERMAN\NGC_0031.agd",
+    0x78F1ECB4D9A1B015: r"SB_AGD\120_149\GERMAN\PS2_0128.agd",
+    0x7904625D5D9B0848: r"SB_AWD\210_239\ITALIAN\PS2_0224.awd",
+    0x7911FE7966612F99: r"SB_AGD\30_59\ENGLISH\NGC_0048.agd",
+    0x7912804A43F53422: r"SB_AGD\30_59\ITALIAN\PS2_0051.agd",
+    0x791564813A7E3DA2: r"SHELL\FONTS\cn16.met",
+    0x791728891EADF637: r"SB_AWD\30_59\SPANISH\PS2_0058.awd",
+    0x791BC80FD01F4EB6: r"SB_AGD\150_179\ENGLISH\PS2_0176.agd",
+    0x792578956AC66112: r"SB_AGD\90_119\GERMAN\NGC_0110.agd",
+    0x7925ACCE31C59D0D: r"ANIMGRPS\Lvl_21\Lvl_21T.ads",
+    0x7926D8C3260F8922: r"SB_AGD\210_239\GERMAN\XBX_0212.agd",
+    0x7927AEB4085BD124: r"SB_AWD\0_29\ITALIAN\NGC_0010.awd",
+    0x793035F0D3BFD935: r"SB_AGD\240_269\ITALIAN\NGC_0246.agd",
+    0x793ADD80CCFD641A: r"SB_AGD\240_269\GERMAN\XBX_0245.agd",
+    0x793C9DCC43FC9919: r"SB_AGD\90_119\GERMAN\XBX_0090.agd",
+    0x793FC864CF4551FC: r"SB_AWD\180_209\GERMAN\PS2_0186.awd",
+    0x7945A17EF21DB533: r"SB_AGD\150_179\ENGLISH\NGC_0150.agd",
+    0x7946AB7BAE3A7BF1: r"SB_AWD\0_29\SPANISH\PS2_0029.awd",
+    0x79474BBB9DFB4541: r"ANIMGRPS\Lvl_25\Lvl_25H.ads",
+    0x795080AB2BF1B1E6: r"SB_AWD\150_179\ITALIAN\NGC_0173.awd",
+    0x7961170F0E2838AB: r"SB_AWD\210_239\ITALIAN\NGC_0235.awd",
+    0x7964436F7E4B3EA3: r"SB_AWD\120_149\ITALIAN\PS2_0120.awd",
+    0x796CD2BD7EA6C97B: r"SB_AWD\240_269\ENGLISH\XBX_0259.awd",
+    0x797199CD7E6093F7: r"SB_AGD\180_209\ENGLISH\XBX_0199.agd",
+    0x7975897664E52D63: r"SHELL\FONTS\t14.met",
+    0x797A282EEA925B23: r"SB_AGD\180_209\FRENCH\XBX_0203.agd",
+    0x798C73F9EF2C1E01: r"SB_AWD\210_239\ITALIAN\XBX_0239.awd",
+    0x799792036E896E0A: r"SB_AGD\150_179\GERMAN\PS2_0174.agd",
+    0x7998566F358F6EBE: r"SB_AWD\0_29\ENGLISH\PS2_0008.awd",
+    0x799A834D9C92FA51: r"SB_AGD\0_29\ENGLISH\XBX_0017.agd",
+    0x799D0B363AA055D1: r"ANIMGRPS\Lvl_25\Lvl_25X.ads",
+    0x79A2AA95456F0A71: r"SB_AGD\210_239\SPANISH\NGC_0215.agd",
+    0x79AE1D9E42645EF0: r"SB_AWD\120_149\SPANISH\NGC_0148.awd",
+    0x79CB18217A38E7C0: r"SB_AGD\150_179\ENGLISH\PS2_0174.agd",
+    0x79CB6EEF18457845: r"SB_AWD\150_179\GERMAN\PS2_0168.awd",
+    0x79CD4B398242DE6D: r"SB_AWD\0_29\ITALIAN\XBX_0013.awd",
+    0x79D06E38845C0730: r"SB_AGD\60_89\ITALIAN\XBX_0078.agd",
+    0x79D30A72DD288A3B: r"SB_AGD\180_209\FRENCH\NGC_0201.agd",
+    0x79D75366DB5642DE: r"SB_AWD\30_59\FRENCH\PS2_0042.awd",
+    0x79ECD066C16B3452: r"SB_AGD\240_269\FRENCH\XBX_0247.agd",
+    0x79F57B8D58533A83: r"SB_AWD\0_29\SPANISH\PS2_0027.awd",
+    0x79F59AF6F8D01BB4: r"gui_map10_ctf.dds",
+    0x79F5AC557C2CD9D6: r"SB_AGD\0_29\GERMAN\XBX_0001.agd",
+    0x79F81864C6CA81E6: r"SB_AGD\0_29\SPANISH\NGC_0001.agd",
+    0x79FFD0BCD60B4A70: r"SB_AWD\150_179\ITALIAN\NGC_0171.awd",
+    0x7A11CF5B443D278C: r"SB_AWD\60_89\FRENCH\NGC_0087.awd",
+    0x7A132AE8E102B377: r"SB_AWD\0_29\GERMAN\NGC_0011.awd",
+    0x7A171185DD165380: r"SB_AWD\0_29\FRENCH\PS2_0002.awd",
+    0x7A218CA63DB91E47: r"SB_AWD\0_29\GERMAN\XBX_0004.awd",
+    0x7A28551F21D14791: r"SB_AWD\30_59\SPANISH\XBX_0033.awd",
+    0x7A2B7EF6F8FD7B87: r"gui_map10_ctf.txd",
+    0x7A2ED7474EDECE5F: r"SB_AGD\30_59\FRENCH\NGC_0051.agd",
+    0x7A338479D98644CE: r"SB_AGD\210_239\ITALIAN\XBX_0229.agd",
+    0x7A365A4C90EB82AF: r"SB_AWD\150_179\ITALIAN\XBX_0174.awd",
+    0x7A37EB52008B8519: r"SB_AGD\0_29\GERMAN\NGC_0022.agd",
+    0x7A3E74D5ED46C4CD: r"SB_AGD\120_149\FRENCH\NGC_0138.agd",
+    0x7A432DFE0C9A0FD2: r"SB_AWD\120_149\ENGLISH\XBX_0135.awd",
+    0x7A47D073728E2C97: r"SB_AWD\210_239\GERMAN\XBX_0213.awd",
+    0x7A49C83E35581CE0: r"SB_AWD\60_89\GERMAN\XBX_0065.awd",
+    0x7A49D35F46AC92E3: r"SB_AGD\0_29\ENGLISH\XBX_0019.agd",
+    0x7A4D94EEA47B1FD3: r"SHELL\MOVIES\FRENCH\3_5_Mon.bik",
+    0x7A4EB0FC81200492: r"SB_AWD\240_269\GERMAN\PS2_0251.awd",
+    0x7A51300EFB1EC585: r"SB_AGD\60_89\GERMAN\PS2_0089.agd",
+    0x7A612C71A64EB625: r"SB_AGD\180_209\ITALIAN\XBX_0197.agd",
+    0x7A61310CA618BE42: r"SB_AGD\210_239\ITALIAN\PS2_0235.agd",
+    0x7A61636221F20CA2: r"SB_AWD\120_149\FRENCH\NGC_0124.awd",
+    0x7A62F806B96361CA: r"AUDIO\SPANISH\XBX_1s1.rws",
+    0x7A642A4871126883: r"SB_AGD\60_89\SPANISH\PS2_0074.agd",
+    0x7A663E3966F73D10: r"SB_AWD\120_149\SPANISH\XBX_0146.awd",
+    0x7A6A70D94FF6B3CF: r"gui_map3_ctf.index",
+    0x7A715CDA11795476: r"SB_AWD\90_119\SPANISH\NGC_0118.awd",
+    0x7A72CB5ADD17B6A2: r"SB_AWD\150_179\GERMAN\XBX_0159.awd",
+    0x7A77053D96FBE034: r"SB_AGD\90_119\ENGLISH\PS2_0108.agd",
+    0x7A83EEB22567D9B8: r"AUDIO\FRENCH\NGC_1s1.rws",
+    0x7A8E0F51F0121AD5: r"SB_AGD\0_29\ITALIAN\XBX_0022.agd",
+    0x7A9132B81032E7E7: r"SB_AWD\150_179\ITALIAN\NGC_0165.awd",
+    0x7A91DE894ADD281A: r"SB_AWD\180_209\ENGLISH\NGC_0192.awd",
+    0x7A9EDD18568D6710: r"SB_AGD\180_209\ENGLISH\PS2_0191.agd",
+    0x7AA021BF808F222A: r"LEVELS\L_1_2_B\SECTIONS\s_1.rws",
+    0x7AA4E0928D21E6EF: r"SB_AWD\210_239\SPANISH\NGC_0222.awd",
+    0x7AA65F0C7D5EF392: r"w_flagsRU.txd",
+    0x7AAEF1E1ECE4BFEB: r"SB_AWD\60_89\GERMAN\PS2_0061.awd",
+    0x7AB7DDEB3CB6322F: r"GameSettings.layout",
+    0x7AB8F35BC331509B: r"SB_AGD\90_119\ITALIAN\PS2_0110.agd",
+    0x7AC2704898A55864: r"SB_AWD\0_29\ITALIAN\PS2_0020.awd",
+    0x7AC6F4EE7DDF63CE: r"i_frame1_default.layout",
+    0x7ACDBD874D9810CA: r"SB_AWD\210_239\FRENCH\XBX_0214.awd",
+    0x7ADCBB0C7D8D1FC9: r"w_flagsRU.dds",
+    0x7ADEC2A738F78F9A: r"SB_AGD\210_239\ITALIAN\NGC_0238.agd",
+    0x7AE0DF10B45C24F6: r"SB_AGD\120_149\SPANISH\XBX_0131.agd",
+    0x7AE19382B9C43584: r"SB_AGD\90_119\SPANISH\PS2_0100.agd",
+    0x7AE7AF6C6BFE4957: r"LEVELS\L_1_3_B\SECTIONS\s_3.rws",
+    0x7AE828904DC1A96A: r"SB_AWD\90_119\ITALIAN\PS2_0102.awd",
+    0x7AEB2F99B11B1FCA: r"SB_AGD\150_179\GERMAN\NGC_0162.agd",
+    0x7AEDDDDBA1798351: r"SB_AWD\90_119\ITALIAN\XBX_0119.awd",
+    0x7B04CF4100C85B7C: r"SB_AGD\0_29\SPANISH\XBX_0027.agd",
+    0x7B08B516F99D3664: r"SB_AGD\30_59\FRENCH\NGC_0038.agd",
+    0x7B0DC6E2820F4666: r"font_stringtw24.tga",
+    0x7B1FA7F8715D74B9: r"SB_AGD\60_89\SPANISH\XBX_0075.agd",
+    0x7B20747F17DFD46C: r"w_betaborder.index",
+    0x7B2554D4DD73C63C: r"SB_AGD\90_119\ITALIAN\XBX_0107.agd",
+    0x7B394C5A392F7301: r"SB_AGD\210_239\GERMAN\NGC_0217.agd",
+    0x7B3DDF639A2C8CE7: r"SB_AGD\0_29\ITALIAN\XBX_0024.agd",
+    0x7B48C3EB8B45BEAE: r"SB_AGD\0_29\ITALIAN\NGC_0009.agd",
+    0x7B4B651F61117A4F: r"SB_AGD\90_119\SPANISH\XBX_0113.agd",
+    0x7B5279C5C83F35DE: r"AUDIO\ITALIAN\NGC_1s3.rws",
+    0x7B6A65A3590AB545: r"SB_AWD\210_239\SPANISH\XBX_0235.awd",
+    0x7B728DE106FD03CB: r"SB_AWD\240_269\GERMAN\NGC_0242.awd",
+    0x7B75A80DE981E18B: r"SB_AGD\30_59\ITALIAN\NGC_0046.agd",
+    0x7B7980D17CE88D61: r"SB_AWD\180_209\ENGLISH\PS2_0187.awd",
+    0x7B7BA3D7AE6D82A2: r"SB_AWD\150_179\SPANISH\PS2_0165.awd",
+    0x7B7C74B0E1E334F6: r"SB_AWD\0_29\GERMAN\NGC_0007.awd",
+    0x7B7CA194EB42D869: r"SB_AGD\150_179\GERMAN\NGC_0154.agd",
+    0x7B897299111754D9: r"SB_AWD\30_59\FRENCH\NGC_0053.awd",
+    0x7B8F43ACB9014159: r"SB_AWD\60_89\ENGLISH\PS2_0087.awd",
+    0x7B9758A1F7DB0B24: r"SB_AWD\90_119\ITALIAN\PS2_0100.awd",
+    0x7B97FE570331DF96: r"SB_AGD\120_149\FRENCH\NGC_0142.agd",
+    0x7B9BB079BFEF5B83: r"SB_AWD\90_119\ITALIAN\NGC_0102.awd",
+    0x7BB013628742806C: r"SB_AWD\30_59\SPANISH\XBX_0058.awd",
+    0x7BB9949953A358AB: r"SB_AGD\90_119\ENGLISH\NGC_0102.agd",
+    0x7BBA741D2F5C364F: r"SB_AWD\120_149\SPANISH\NGC_0136.awd",
+    0x7BC427B049C3FB77: r"LEVELS\L_3_5\SECTIONS\s_17.rws",
+    0x7BD534E6878E53FE: r"SB_AGD\90_119\ITALIAN\XBX_0109.agd",
+    0x7BD9C8EA54F9F60E: r"SB_AGD\210_239\SPANISH\NGC_0234.agd",
+    0x7BFCE5F5391D6A4C: r"SB_AGD\60_89\ENGLISH\PS2_0064.agd",
+    0x7BFED747E62AA21B: r"ANIMGRPS\Lvl_25\Lvl_25Z.ads",
+    0x7C0D92FEF93E41DB: r"SB_AWD\210_239\ITALIAN\NGC_0226.awd",
+    0x7C14B5C3F2C9FEB9: r"SB_AGD\90_119\GERMAN\PS2_0112.agd",
+    0x7C14E84B26EDB1C6: r"SHELL\LOAD\MP_2_DM.txd",
+    0x7C1951C99B5C1A8E: r"SB_AWD\210_239\ITALIAN\XBX_0210.awd",
+    0x7C1AF110E5A255A2: r"ANIMGRPS\MPA_00\MPA_00A.ads",
+    0x7C1EC2B8062D72DB: r"SB_AGD\240_269\GERMAN\PS2_0254.agd",
+    0x7C20386EF074BC80: r"SB_AGD\30_59\GERMAN\XBX_0049.agd",
+    0x7C38896064F1AD85: r"SB_AWD\30_59\FRENCH\PS2_0038.awd",
+    0x7C38F068E9D62561: r"SB_AWD\90_119\GERMAN\NGC_0113.awd",
+    0x7C47D54B7A1A4D1D: r"SB_AGD\150_179\FRENCH\NGC_0170.agd",
+    0x7C5FD374315CD74E: r"SB_AWD\30_59\SPANISH\XBX_0056.awd",
+    0x7C62E799A1B2E9DD: r"SB_AWD\180_209\ITALIAN\PS2_0200.awd",
+    0x7C6F6ACAD39427CA: r"SB_AWD\30_59\SPANISH\PS2_0037.awd",
+    0x7C73781E90C57441: r"ANIMGRPS\Lvl_16\Lvl_16D.ads",
+    0x7C7644A40074DE26: r"SB_AWD\60_89\ITALIAN\PS2_0080.awd",
+    0x7C802EB6E111FBE8: r"SB_AWD\120_149\ENGLISH\NGC_0131.awd",
+    0x7C84BFEFD9E08256: r"SB_AGD\0_29\ENGLISH\PS2_0013.agd",
+    0x7C85CA29F7D8735C: r"SB_AGD\60_89\GERMAN\PS2_0066.agd",
+    0x7C90B758FA693C99: r"SB_AGD\30_59\FRENCH\NGC_0053.agd",
+    0x7C985A5E3C762849: r"SB_AWD\150_179\ITALIAN\XBX_0176.awd",
+    0x7CA9271BC9FFF813: r"SB_AWD\180_209\GERMAN\NGC_0188.awd",
+    0x7CAFB53E32D90EE3: r"SB_AWD\210_239\ENGLISH\XBX_0219.awd",
+    0x7CB26AA985412A5D: r"SB_AGD\240_269\GERMAN\NGC_0262.agd",
+    0x7CB59268D3C1B2ED: r"SB_AGD\30_59\ITALIAN\PS2_0049.agd",
+    0x7CC26949592990D8: r"SB_AGD\0_29\FRENCH\NGC_0029.agd",
+    0x7CC86E4B12823442: r"SB_AWD\120_149\SPANISH\XBX_0140.awd",
+    0x7CC937992D6A84D1: r"ANIMGRPS\Lvl_16\Lvl_16T.ads",
+    0x7CC9EAE1B5DC07ED: r"SB_AGD\210_239\GERMAN\XBX_0228.agd",
+    0x7CCD92C9B04631F5: r"SB_AGD\240_269\GERMAN\PS2_0256.agd",
+    0x7CCDF11DF99D9F92: r"SB_AWD\90_119\GERMAN\PS2_0119.awd",
+    0x7CD12FA4ACEC688E: r"SB_AWD\210_239\GERMAN\PS2_0215.awd",
+    0x7CD6ED06C2FA18F0: r"SB_AWD\90_119\SPANISH\NGC_0109.awd",
+    0x7CD9813139779073: r"SB_AWD\60_89\ENGLISH\NGC_0075.awd",
+    0x7CDC750DBDF3E4E7: r"SB_AGD\90_119\SPANISH\PS2_0099.agd",
+    0x7CE16CFB252C9DFB: r"SB_AWD\240_269\ITALIAN\NGC_0244.awd",
+    0x7CE8F00DC7F5E170: r"w_flagsAuto.txd",
+    0x7CEA5F7E1737D1E1: r"LEVELS\L_1_3_B\SECTIONS\s_1.rws",
+    0x7CEDEA8CB270FA77: r"SB_AGD\0_29\SPANISH\NGC_0004.agd",
+    0x7CF633E7B7814E43: r"SB_AWD\180_209\FRENCH\XBX_0203.awd",
+    0x7CF7255D2433E5AF: r"SB_AGD\150_179\FRENCH\NGC_0176.agd",
+    0x7CF8AA7F3D217BA5: r"w_map03.index",
+    0x7CFCECFDCB32501D: r"SB_AGD\150_179\FRENCH\XBX_0165.agd",
+    0x7D07E0A438AE3E89: r"SB_AWD\210_239\SPANISH\NGC_0220.awd",
+    0x7D0E0DEAF598018D: r"SB_AWD\240_269\ITALIAN\XBX_0240.awd",
+    0x7D16A1EB1408F945: r"SB_AGD\0_29\ENGLISH\PS2_0003.agd",
+    0x7D1EB40DC8230AE3: r"w_flagsAuto.dds",
+    0x7D24B1D2051BEB2C: r"SB_AGD\120_149\ENGLISH\PS2_0138.agd",
+    0x7D2DE21A491A5A5E: r"SB_AWD\30_59\FRENCH\XBX_0049.awd",
+    0x7D32D6C4896A522B: r"LEVELS\L_3_1\SECTIONS\s_17.rws",
+    0x7D335AA44650D0A1: r"SB_AGD\180_209\ENGLISH\NGC_0205.agd",
+    0x7D37B5491F6BE403: r"SB_AGD\60_89\ITALIAN\PS2_0089.agd",
+    0x7D37D8C6D9A73A83: r"SB_AGD\150_179\SPANISH\NGC_0158.agd",
+    0x7D3EFE3EE43322EA: r"SB_AGD\180_209\FRENCH\PS2_0195.agd",
+    0x7D43773F6997BE77: r"w_InstantActionBKG.txd",
+    0x7D43B2D3EA7744C4: r"SB_AGD\210_239\ITALIAN\NGC_0229.agd",
+    0x7D5D17CD4AF8D90B: r"ANIMGRPS\Lvl_25\Lvl_25J.ads",
+    0x7D5DAA3754998191: r"DisconnectScoreBoardTeam.layout",
+    0x7D650DB620CD831B: r"SB_AGD\90_119\FRENCH\XBX_0102.agd",
+    0x7D6C1F8B84B8316C: r"SB_AGD\240_269\ENGLISH\NGC_0269.agd",
+    0x7D74CD647D80454C: r"LOC\IT\INGAME.LOC",
+    0x7D7A6DDBBD0D2E36: r"SB_AWD\180_209\FRENCH\XBX_0196.awd",
+    0x7D7A733F69C6F984: r"w_InstantActionBKG.dds",
+    0x7D7AB2B2EED7D33D: r"LEVELS\L_2_1_B\SECTIONS\s_2.rws",
+    0x7D7E875DEA525855: r"SB_AGD\90_119\ITALIAN\XBX_0090.agd",
+    0x7D807143C593423B: r"SB_AWD\120_149\FRENCH\NGC_0143.awd",
+    0x7D8F69055C60121E: r"SB_AGD\210_239\SPANISH\NGC_0227.agd",
+    0x7D8F6E67A0ECEFE1: r"SB_AGD\30_59\ENGLISH\NGC_0039.agd",
+    0x7D99559BA67E9908: r"SB_AGD\30_59\ITALIAN\XBX_0043.agd",
+    0x7D9F0454BBCC826C: r"SB_AWD\180_209\GERMAN\PS2_0195.awd",
+    0x7DAC3D0F754BE8AF: r"SB_AGD\150_179\FRENCH\XBX_0163.agd",
+    0x7DB9789330610796: r"SB_AGD\210_239\ITALIAN\XBX_0218.agd",
+    0x7DC571FCBE21B857: r"SB_AGD\0_29\ENGLISH\PS2_0005.agd",
+    0x7DD1783EAC86F8B1: r"LEVELS\L_1_5_B\CLUMPS\cbank_06.bin",
+    0x7DD7781F950C3525: r"SB_AGD\30_59\ITALIAN\NGC_0044.agd",
+    0x7DE5404E0D05E5E9: r"SB_AGD\150_179\GERMAN\XBX_0178.agd",
+    0x7DEC03788851F408: r"SB_AWD\30_59\FRENCH\PS2_0040.awd",
+    0x7DF1A31B10EC4CFD: r"SB_AWD\240_269\GERMAN\PS2_0249.awd",
+    0x7DF435FD3A18E51A: r"SB_AGD\60_89\SPANISH\XBX_0061.agd",
+    0x7DF46AB8CAE089AC: r"SB_AGD\0_29\FRENCH\XBX_0016.agd",
+    0x7DF72373053A7B62: r"SB_AWD\210_239\SPANISH\XBX_0214.awd",
+    0x7DFA28A54D6C7F83: r"SB_AGD\240_269\SPANISH\NGC_0244.agd",
+    0x7E01BB201413BBE9: r"SB_AWD\60_89\ITALIAN\PS2_0065.awd",
+    0x7E03D308B8CF931E: r"SB_AWD\120_149\GERMAN\XBX_0137.awd",
+    0x7E04270973F01D8F: r"SB_AWD\30_59\GERMAN\NGC_0039.awd",
+    0x7E0B85D96DFB10BA: r"SB_AWD\30_59\GERMAN\XBX_0054.awd",
+    0x7E0E52A02126FF03: r"SB_AGD\180_209\SPANISH\NGC_0180.agd",
+    0x7E1D037961FA91F4: r"SB_AGD\150_179\ITALIAN\XBX_0177.agd",
+    0x7E2D01978A142572: r"SB_AWD\0_29\FRENCH\PS2_0004.awd",
+    0x7E2E576F946CCA67: r"SB_AGD\90_119\ITALIAN\XBX_0096.agd",
+    0x7E45251C419DBF31: r"SB_AWD\150_179\SPANISH\NGC_0156.awd",
+    0x7E5081A42CDE4C6B: r"SB_AGD\210_239\SPANISH\PS2_0212.agd",
+    0x7E56F1D12D3C2954: r"LEVELS\L_1_2_B\SECTIONS\s_3.rws",
+    0x7E5C29B01C62EB03: r"AUDIO\SPANISH\PS2_2s2.rws",
+    0x7E6F6310A4C89575: r"SB_AWD\210_239\ITALIAN\NGC_0224.awd",
+    0x7E7366D8CD8B96E7: r"SB_AWD\0_29\GERMAN\NGC_0002.awd",
+    0x7E769332BB579F8D: r"SB_AGD\60_89\ITALIAN\NGC_0082.agd",
+    0x7E797A57892A960B: r"SB_AWD\60_89\SPANISH\NGC_0066.awd",
+    0x7E83D80A5E46936A: r"SB_AGD\30_59\SPANISH\PS2_0037.agd",
+    0x7E88C88449C7E821: r"SB_AWD\30_59\ITALIAN\PS2_0034.awd",
+    0x7E8AA1F7D749BEC4: r"w_gamespy.index",
+    0x7E8AA553EFA06D22: r"SB_AGD\30_59\SPANISH\NGC_0058.agd",
+    0x7E8EC14C40DD0963: r"SB_AWD\60_89\ENGLISH\NGC_0066.awd",
+    0x7EACD87668A4E8FA: r"SB_AWD\150_179\SPANISH\PS2_0154.awd",
+    0x7EAF535A289B1C9A: r"SB_AGD\120_149\ENGLISH\XBX_0148.agd",
+    0x7EB1007DFE8D4834: r"SB_AGD\60_89\ENGLISH\XBX_0085.agd",
+    0x7EB3831A62E9CF48: r"SB_AWD\120_149\GERMAN\XBX_0135.awd",
+    0x7EB84BFAECF64448: r"SB_AGD\210_239\SPANISH\PS2_0233.agd",
+    0x7EB89295D061A9E9: r"LEVELS\L_2_1\CLUMPS\cbank_02.bin",
+    0x7EBA1496018C7901: r"SB_AWD\60_89\ITALIAN\XBX_0084.awd",
+    0x7EBCDA44EB67904F: r"SB_AWD\90_119\FRENCH\XBX_0098.awd",
+    0x7EC4627D52B981AE: r"SB_AGD\180_209\GERMAN\NGC_0189.agd",
+    0x7EC7235649C368BE: r"SB_AWD\150_179\SPANISH\NGC_0160.awd",
+    0x7EC9F67BA196A3FD: r"SB_AWD\150_179\SPANISH\PS2_0175.awd",
+    0x7ECEC36D702EEBB5: r"SB_AGD\90_119\ITALIAN\PS2_0112.agd",
+    0x7ED1C98388EA5808: r"ScoreBoardQuitOption.layout",
+    0x7ED92F1EE382D2EA: r"SB_AGD\90_119\GERMAN\XBX_0116.agd",
+    0x7EE357025A3B8287: r"SB_AWD\120_149\FRENCH\XBX_0149.awd",
+    0x7EF62F226158E600: r"SB_AGD\120_149\SPANISH\XBX_0133.agd",
+    0x7EFF86EA3A0B93F3: r"gui_map4_ctf.dds",
+    0x7F04A2BCE9892708: r"SB_AGD\120_149\GERMAN\PS2_0147.agd",
+    0x7F0905FE5F25E954: r"SB_AGD\150_179\ENGLISH\XBX_0168.agd",
+    0x7F107EE9C8A0E35B: r"SB_AGD\120_149\FRENCH\XBX_0127.agd",
+    0x7F12A91A701C4201: r"SB_AGD\60_89\FRENCH\NGC_0068.agd",
+    0x7F15D129EDAB2AEA: r"SB_AWD\150_179\ITALIAN\PS2_0165.awd",
+    0x7F19AF52ADC45E3E: r"SB_AGD\0_29\SPANISH\XBX_0029.agd",
+    0x7F284A6933435525: r"SB_AWD\60_89\SPANISH\NGC_0064.awd",
+    0x7F2B03AAD8F4D11B: r"ANIMGRPS\Lvl_16\Lvl_16V.ads",
+    0x7F2C717CADD76F70: r"SB_AGD\210_239\FRENCH\NGC_0218.agd",
+    0x7F2FADF6C472A726: r"SB_AWD\180_209\FRENCH\XBX_0189.awd",
+    0x7F3562EA3A38E5A0: r"gui_map4_ctf.txd",
+    0x7F3C043BCFD82DBA: r"SB_AWD\60_89\GERMAN\PS2_0086.awd",
+    0x7F3DD348E5805529: r"SB_AGD\30_59\FRENCH\NGC_0040.agd",
+    0x7F421DFEA83962DB: r"SB_AGD\150_179\SPANISH\XBX_0170.agd",
+    0x7F44AE3EA915D93B: r"SB_AWD\90_119\SPANISH\PS2_0110.awd",
+    0x7F4785C667B5662A: r"SB_AGD\210_239\ITALIAN\PS2_0217.agd",
+    0x7F4B24B9009B78FE: r"LEVELS\L_3_1_C\SECTIONS\s_9.rws",
+    0x7F4B75FC9079469D: r"SB_AGD\180_209\ENGLISH\NGC_0195.agd",
+    0x7F4F1C6BE62D0E13: r"SB_AGD\210_239\GERMAN\NGC_0219.agd",
+    0x7F5B9D35DDB1FF70: r"AUDIO\FRENCH\XBX_2m2.rws",
+    0x7F5BC88812BDDE74: r"SB_AWD\150_179\SPANISH\PS2_0156.awd",
+    0x7F60C5310E0E5689: r"SB_AGD\90_119\SPANISH\XBX_0111.agd",
+    0x7F63235B2B63E272: r"ANIMGRPS\Lvl_22\Lvl_22A.ads",
+    0x7F63C69BE9F32658: r"SB_AWD\0_29\ENGLISH\PS2_0019.awd",
+    0x7F6E891B6C08417F: r"AUDIO\GERMAN\XBX_2m3.rws",
+    0x7F78C68D4BAF628F: r"SB_AWD\150_179\SPANISH\PS2_0173.awd",
+    0x7F7D1E7C12736B0F: r"SB_AGD\120_149\FRENCH\PS2_0124.agd",
+    0x7F7F15B5060666F7: r"SB_AWD\210_239\SPANISH\XBX_0233.awd",
+    0x7F860A6371F9B3F1: r"LiveOptionsInGame.layout",
+    0x7F86453F971D3D95: r"SB_AGD\150_179\ENGLISH\NGC_0170.agd",
+    0x7F86B5B039F1305A: r"AUDIO\ITALIAN\PS2_1m2.rws",
+    0x7F87393FCD1656CF: r"SB_AGD\120_149\ITALIAN\PS2_0124.agd",
+    0x7F885DF2B3FA9EE5: r"SB_AWD\240_269\GERMAN\NGC_0240.awd",
+    0x7F8C954CD962816A: r"SB_AWD\30_59\GERMAN\NGC_0052.awd",
+    0x7F8ED0E329E54EF3: r"SB_AWD\180_209\ENGLISH\PS2_0189.awd",
+    0x7F90211853A63ACF: r"SB_AGD\150_179\SPANISH\PS2_0173.agd",
+    0x7F9B5E6538BEE552: r"SB_AGD\60_89\ITALIAN\XBX_0069.agd",
+    0x7F9C879B2556B01C: r"SB_AGD\180_209\FRENCH\NGC_0196.agd",
+    0x7FA459ABC2AA4DC3: r"SB_AGD\120_149\ITALIAN\NGC_0129.agd",
+    0x7FABAE3B15642990: r"SB_AWD\180_209\ENGLISH\PS2_0201.awd",
+    0x7FB414495A8B9C9F: r"SB_AGD\0_29\ITALIAN\PS2_0005.agd",
+    0x7FB561E912821ABE: r"LEVELS\L_3_3\SECTIONS\s_1.rws",
+    0x7FB7E2D5C8073FC2: r"ANIMGRPS\Lvl_22\Lvl_22Q.ads",
+    0x7FBF4EFB72B9A275: r"SB_AGD\120_149\FRENCH\XBX_0125.agd",
+    0x7FC5013B97C48CA4: r"SB_AWD\150_179\ITALIAN\PS2_0167.awd",
+    0x7FD640BE05E3B8C3: r"SB_AGD\240_269\ENGLISH\XBX_0242.agd",
+    0x7FDA16C738E6C75E: r"SB_AWD\150_179\ENGLISH\NGC_0168.awd",
+    0x7FE201B291793122: r"SB_AWD\0_29\FRENCH\PS2_0017.awd",
+    0x7FE26DC360957F87: r"SHELL\LOAD\MP_9_DM.txd",
+    0x7FF0EE10525221F5: r"SB_AGD\150_179\SPANISH\XBX_0172.agd",
+    0x7FF45760CF75DB93: r"SB_AWD\180_209\ENGLISH\XBX_0205.awd",
+    0x7FF655D811CE25C4: r"SB_AGD\210_239\ITALIAN\PS2_0215.agd",
+    0x7FFAC60E3A92DF2F: r"SB_AGD\180_209\ENGLISH\NGC_0193.agd",
+    0x7FFC0F7E8C31AD61: r"SB_AGD\120_149\ENGLISH\PS2_0140.agd",
+    0x7FFE70B499B0B99D: r"SB_AWD\90_119\ITALIAN\NGC_0096.awd",
+    0x7FFEC7686A7D97CD: r"SB_AGD\240_269\GERMAN\PS2_0267.agd",
+    0x8011FF6CD57CB5C4: r"ANIMGRPS\Lvl_22\Lvl_22O.ads",
+    0x80142C6EB4D715AF: r"SB_AWD\90_119\SPANISH\XBX_0113.awd",
+    0x801764DC4E52D69E: r"gui_map5_destroy.txd",
+    0x80239768F93F846F: r"SB_AWD\90_119\GERMAN\XBX_0100.awd",
+    0x80289A67C5ECF468: r"SB_AWD\240_269\FRENCH\NGC_0250.awd",
+    0x8028E17020776F6A: r"SB_AWD\240_269\GERMAN\PS2_0260.awd",
+    0x802ACE88B1E163FD: r"SB_AWD\0_29\ENGLISH\NGC_0002.awd",
+    0x802C7E8DBC8D1F49: r"SB_AGD\120_149\FRENCH\PS2_0126.agd",
+    0x8034864F784DB470: r"SB_AWD\60_89\ITALIAN\XBX_0078.awd",
+    0x8034C5425ECF46C5: r"SB_AWD\240_269\FRENCH\PS2_0265.awd",
+    0x8038648B8649D8CD: r"SB_AGD\240_269\FRENCH\NGC_0246.agd",
+    0x803BC55E837BE324: r"SB_AWD\30_59\GERMAN\NGC_0050.awd",
+    0x804B728C54B2CF9C: r"SB_AWD\180_209\ITALIAN\XBX_0192.awd",
+    0x804E28DC4E81B305: r"gui_map5_destroy.dds",
+    0x8056B347C26C37FF: r"SB_AWD\240_269\GERMAN\PS2_0258.awd",
+    0x80693FC58F6B37AD: r"SB_AGD\0_29\ITALIAN\XBX_0013.agd",
+    0x80706003A8B3DD27: r"SB_AWD\180_209\FRENCH\XBX_0193.awd",
+    0x8070E33C8969E7FD: r"SB_AWD\90_119\GERMAN\PS2_0101.awd",
+    0x8072DE2A767075D2: r"SB_AGD\180_209\ITALIAN\NGC_0192.agd",
+    0x807657E7D12C1B51: r"AUDIO\ENGLISH\PS2_1m1.rws",
+    0x807880500D82B09B: r"SB_AWD\120_149\ENGLISH\NGC_0129.awd",
+    0x807B231ADA8698EA: r"SB_AWD\30_59\SPANISH\NGC_0043.awd",
+    0x807CA37151294EEE: r"SB_AWD\150_179\SPANISH\NGC_0173.awd",
+    0x80878B7FF0FE10DD: r"SB_AWD\240_269\ITALIAN\PS2_0265.awd",
+    0x808944303DC3080B: r"ANIMGRPS\Lvl_16\Lvl_16F.ads",
+    0x808B94B5AD719FB0: r"SB_AWD\60_89\ITALIAN\PS2_0082.awd",
+    0x80A09792F6E7BC71: r"LEVELS\L_1_5\GodData.dff",
+    0x80A14C0391C4140F: r"SB_AGD\240_269\ITALIAN\PS2_0245.agd",
+    0x80A22C0730D4A480: r"SB_AWD\60_89\SPANISH\PS2_0082.awd",
+    0x80A6EF3B38621F5A: r"SB_AWD\180_209\ENGLISH\XBX_0190.awd",
+    0x80A86657D964A505: r"SB_AWD\0_29\GERMAN\PS2_0016.awd",
+    0x80AC1C1281384386: r"SB_AWD\240_269\GERMAN\NGC_0269.awd",
+    0x80BA122099E20A55: r"SB_AGD\30_59\ENGLISH\PS2_0056.agd",
+    0x80BF2619668CDEE4: r"SB_AGD\150_179\ENGLISH\XBX_0177.agd",
+    0x80C0867F7A7E391D: r"SB_AGD\240_269\ITALIAN\NGC_0264.agd",
+    0x80C16DD1DADDF11B: r"SB_AWD\60_89\GERMAN\PS2_0072.awd",
+    0x80C5E7B089F4292C: r"SB_AGD\120_149\ITALIAN\NGC_0135.agd",
+    0x80C7BABB323DEBEF: r"SB_AGD\240_269\GERMAN\NGC_0264.agd",
+    0x80C9B93BF3BE0C53: r"VotePlayerConfirm.layout",
+    0x80D64924DCCF2C4A: r"SB_AWD\60_89\ITALIAN\PS2_0071.awd",
+    0x80D81181CA90D124: r"SB_AWD\240_269\GERMAN\PS2_0262.awd",
+    0x80D99E9A5BFA228F: r"SB_AWD\0_29\ENGLISH\NGC_0004.awd",
+    0x80E0674280DF1812: r"SB_AWD\210_239\GERMAN\NGC_0214.awd",
+    0x80E12BB75EA0DD34: r"SB_AGD\210_239\SPANISH\XBX_0238.agd",
+    0x80E85F7D06E6E876: r"SB_AWD\210_239\SPANISH\XBX_0229.awd",
+    0x80F5AF04AEAA8CDF: r"SB_AGD\150_179\FRENCH\PS2_0173.agd",
+    0x80F803FEF790FA5F: r"SB_AGD\120_149\SPANISH\NGC_0125.agd",
+    0x80FDA8C147A18258: r"SB_AGD\150_179\ITALIAN\PS2_0163.agd",
+    0x8115B2C49B6CB087: r"LEVELS\L_2_1_B\SECTIONS\s_4.rws",
+    0x81180FD73983F6BF: r"SB_AGD\0_29\ITALIAN\XBX_0015.agd",
+    0x811FB34E3382A68F: r"SB_AWD\90_119\GERMAN\PS2_0107.awd",
+    0x8122771BEAA49498: r"SB_AGD\150_179\SPANISH\NGC_0171.agd",
+    0x81235DFCA294C31F: r"SB_AWD\240_269\ITALIAN\XBX_0246.awd",
+    0x812A532C849FFAA4: r"SB_AWD\30_59\SPANISH\NGC_0041.awd",
+    0x813109426B4606AC: r"SB_AWD\240_269\SPANISH\XBX_0256.awd",
+    0x813BB19D916578B7: r"SB_AGD\30_59\SPANISH\PS2_0058.agd",
+    0x8150AC153BDDC849: r"SB_AGD\240_269\ITALIAN\PS2_0247.agd",
+    0x8152933146BCA408: r"SB_AGD\180_209\ITALIAN\NGC_0200.agd",
+    0x815346D090CF071C: r"SB_AWD\90_119\ENGLISH\PS2_0100.awd",
+    0x8154CE509130BD84: r"SB_AGD\180_209\FRENCH\PS2_0197.agd",
+    0x81581669837EE0B7: r"SB_AWD\0_29\GERMAN\PS2_0010.awd",
+    0x815D4A13289E20CE: r"SB_AWD\30_59\GERMAN\PS2_0035.awd",
+    0x8169E23243FC7C67: r"SB_AGD\30_59\ENGLISH\PS2_0050.agd",
+    0x816FD6912497D1AF: r"SB_AGD\240_269\ITALIAN\NGC_0262.agd",
+    0x8172A2BB43A1611F: r"SB_AGD\60_89\ENGLISH\NGC_0071.agd",
+    0x8172EA9CA4D3467E: r"WPNBANK\0_25\wbank_04.bin",
+    0x8179BC53B7C52870: r"SB_AGD\150_179\SPANISH\XBX_0159.agd",
+    0x817ADDC7CDCB1E35: r"SB_AGD\90_119\FRENCH\XBX_0100.agd",
+    0x817C3D44A1CD4E7B: r"SB_AWD\150_179\ENGLISH\XBX_0178.awd",
+    0x81837ED4AE3E05E0: r"SessionPreview.layout",
+    0x818CB05C6B034D3A: r"SB_AWD\210_239\SPANISH\PS2_0235.awd",
+    0x8195ABF3068FF328: r"SB_AWD\90_119\ITALIAN\XBX_0114.awd",
+    0x81A53917095DAD28: r"SB_AGD\210_239\SPANISH\NGC_0225.agd",
+    0x81A8F42E411719DE: r"SB_AWD\210_239\ENGLISH\PS2_0231.awd",
+    0x81AAFB9C883F827C: r"SB_AWD\120_149\GERMAN\NGC_0128.awd",
+    0x81B157EE089BBBCC: r"SB_AGD\210_239\FRENCH\XBX_0238.agd",
+    0x81B861FABDBC2BD8: r"LEVELS\L_3_3\SECTIONS\s_3.rws",
+    0x81B8E0BFFCF0338F: r"SB_AGD\0_29\SPANISH\PS2_0005.agd",
+    0x81C1100ECE67F4AC: r"SB_AWD\240_269\SPANISH\PS2_0246.awd",
+    0x81C286D636CF1335: r"LEVELS\L_3_1\SECTIONS\s_15.rws",
+    0x81CF8CD45968F4E4: r"SB_AGD\150_179\FRENCH\PS2_0156.agd",
+    0x81E4912C9D8DD1FD: r"AUDIO\ITALIAN\XBX_2m3.rws",
+    0x81E50CB94B5F8D71: r"SB_AGD\240_269\SPANISH\PS2_0254.agd",
+    0x81ECF944986A68A7: r"SB_AGD\60_89\ITALIAN\PS2_0078.agd",
+    0x81EFB5608AA120D7: r"SB_AWD\210_239\GERMAN\PS2_0221.awd",
+    0x820DDE4CC0EF20C2: r"SB_AWD\180_209\ENGLISH\PS2_0207.awd",
+    0x8216F45B0617BED9: r"SB_AGD\0_29\ITALIAN\PS2_0007.agd",
+    0x822175EB1AF8E234: r"SB_AWD\30_59\GERMAN\XBX_0056.awd",
+    0x8222EF46F2075E15: r"w_PlayOnlineBKG.txd",
+    0x82304B11385A08CB: r"SB_AWD\0_29\SPANISH\PS2_0009.awd",
+    0x8236C0A386C06736: r"SB_AWD\0_29\ENGLISH\XBX_0029.awd",
+    0x82497270D322D476: r"SB_AWD\90_119\ITALIAN\XBX_0093.awd",
+    0x824C3F6874DAD7F8: r"SB_AWD\30_59\FRENCH\PS2_0057.awd",
+    0x825386A8B76783BC: r"SB_AGD\0_29\FRENCH\XBX_0005.agd",
+    0x8257750AB68F9AF6: r"SB_AWD\30_59\ITALIAN\NGC_0054.awd",
+    0x8258DB46F234CB96: r"w_PlayOnlineBKG.dds",
+    0x8259DF63994B2EFD: r"SB_AGD\180_209\ENGLISH\PS2_0198.agd",
+    0x825AF52DEE9B5AC3: r"SB_AWD\150_179\SPANISH\NGC_0158.awd",
+    0x825F16CDD4B794CF: r"SHELL\MOVIES\SPANISH\3_3_Mon.bik",
+    0x826037FFB2B4958E: r"SB_AGD\210_239\FRENCH\XBX_0236.agd",
+    0x82620353A7D17F56: r"SB_AWD\210_239\GERMAN\PS2_0237.awd",
+    0x8262C544B5EB1AB8: r"SB_AWD\60_89\GERMAN\NGC_0085.awd",
+    0x826840D1A709E7C9: r"SB_AGD\0_29\SPANISH\PS2_0007.agd",
+    0x82762C806061BB49: r"SB_AWD\90_119\SPANISH\XBX_0111.awd",
+    0x827E63A0D06EE00A: r"SB_AGD\120_149\GERMAN\NGC_0148.agd",
+    0x828082958824900F: r"SB_AGD\30_59\ITALIAN\PS2_0058.agd",
+    0x8286977AA4CBDC09: r"SB_AWD\90_119\GERMAN\XBX_0102.awd",
+    0x829414D6C8010EE7: r"LEVELS\L_3_5\SECTIONS\s_2.rws",
+    0x8299A81C0B442E04: r"SB_AGD\30_59\SPANISH\PS2_0035.agd",
+    0x82A9CCDFA20481DA: r"SB_AGD\120_149\ITALIAN\XBX_0135.agd",
+    0x82AA849987F57022: r"SB_AWD\0_29\ENGLISH\XBX_0014.awd",
+    0x82B86424450A74DE: r"SB_AWD\0_29\ITALIAN\PS2_0013.awd",
+    0x82BBACBE50B52FFD: r"SB_AGD\30_59\ITALIAN\NGC_0035.agd",
+    0x82C183120AFF0CE2: r"SB_AWD\240_269\FRENCH\PS2_0244.awd",
+    0x82C290E1DDEFEC82: r"ANIMGRPS\Lvl_35\Lvl_35M.ads",
+    0x82C535243885D461: r"SB_AGD\150_179\ITALIAN\XBX_0161.agd",
+    0x82CE2FF240EAECCF: r"SB_AGD\0_29\ITALIAN\XBX_0006.agd",
+    0x82CF4466D9FB96CC: r"LEVELS\MP_2\SECTIONS\s_5.rws",
+    0x82D28138C496B33A: r"SB_AGD\90_119\ENGLISH\XBX_0097.agd",
+    0x82D5F3693AE9D2FF: r"SB_AWD\90_119\GERMAN\PS2_0110.awd",
+    0x82E41D328CF3302A: r"SB_AGD\30_59\ENGLISH\XBX_0045.agd",
+    0x82EEFF3090806D84: r"SB_AGD\90_119\GERMAN\XBX_0114.agd",
+    0x82EF506238F44031: r"SB_AWD\30_59\ENGLISH\NGC_0053.awd",
+    0x82EF59E33C5797A1: r"SB_AWD\60_89\FRENCH\PS2_0072.awd",
+    0x82F766DE7BF20B7C: r"SHELL\LOAD\MP_2_CTF.txd",
+    0x8314E94F9D2EE6DA: r"SB_AWD\240_269\ITALIAN\PS2_0244.awd",
+    0x83234B32A2D1F265: r"HostEndRoundOptions.layout",
+    0x83243DE38669F7B5: r"SB_AWD\60_89\GERMAN\PS2_0070.awd",
+    0x83249D6A04926E00: r"SB_AWD\120_149\ITALIAN\NGC_0131.awd",
+    0x8328792C1D19DD13: r"SB_AGD\60_89\FRENCH\NGC_0066.agd",
+    0x8329BA7B9FE219DD: r"SB_AWD\180_209\SPANISH\NGC_0182.awd",
+    0x832C65194809B5CE: r"LEVELS\L_3_3\SECTIONS\s_10.rws",
+    0x8333A1C56E41FB08: r"SHELL\LOAD\L_2_1_B.txd",
+    0x833B3EDADC2C3A79: r"SB_AGD\120_149\ITALIAN\XBX_0129.agd",
+    0x833DF769654CB9BD: r"SHELL\FONTS\fblds28.met",
+    0x833E2FC863721188: r"WPNBANK\26_50\wbank_39.bin",
+    0x833E89BC2F226ECB: r"SB_AGD\60_89\ENGLISH\NGC_0080.agd",
+    0x833EF083C88C3C9D: r"SB_AGD\60_89\ITALIAN\XBX_0071.agd",
+    0x83443B2014589949: r"SB_AGD\210_239\GERMAN\XBX_0219.agd",
+    0x8348F250CF33C501: r"SB_AWD\240_269\SPANISH\PS2_0261.awd",
+    0x834944DE3BBE3401: r"SB_AGD\90_119\SPANISH\PS2_0116.agd",
+    0x8351F44D7CD5FF34: r"SB_AWD\60_89\GERMAN\PS2_0084.awd",
+    0x8357430040B4A0BD: r"SB_AWD\150_179\ENGLISH\PS2_0162.awd",
+    0x83578F165A34FB19: r"SB_AGD\150_179\FRENCH\PS2_0171.agd",
+    0x8359E410A31B6899: r"SB_AGD\120_149\SPANISH\NGC_0127.agd",
+    0x835A6418A81EAD64: r"SB_AGD\60_89\FRENCH\XBX_0085.agd",
+    0x835B3C59820E13B6: r"SB_AWD\240_269\ENGLISH\XBX_0261.awd",
+    0x836E71F15F17E119: r"SB_AGD\0_29\ENGLISH\NGC_0019.agd",
+    0x837DB05D7AB4BBDF: r"SB_AGD\60_89\FRENCH\PS2_0078.agd",
+    0x8381D14A6EB04C54: r"SB_AGD\90_119\ENGLISH\XBX_0095.agd",
+    0x83826B31F5923A96: r"SB_AWD\150_179\FRENCH\NGC_0168.awd",
+    0x83877ADC29F2AFCD: r"SB_AGD\210_239\FRENCH\PS2_0210.agd",
+    0x8392ED44370BEFC4: r"SB_AGD\30_59\ENGLISH\XBX_0047.agd",
+    0x8398589BC752BA3B: r"SB_AWD\180_209\FRENCH\NGC_0201.awd",
+    0x839A2CD452C4CF81: r"SB_AGD\240_269\SPANISH\PS2_0261.agd",
+    0x839B1551441925A7: r"SB_AGD\150_179\ENGLISH\NGC_0176.agd",
+    0x839C99517A133309: r"SB_AGD\120_149\ITALIAN\PS2_0126.agd",
+    0x83A5812A00A31709: r"SB_AGD\150_179\SPANISH\PS2_0171.agd",
+    0x83A63064627887EE: r"ANIMGRPS\Lvl_24\Lvl_24Y.ads",
+    0x83AA3BDF09B6F944: r"SHELL\FONTS\fb26.met",
+    0x83ACB6797CBC750D: r"SB_AGD\210_239\ENGLISH\XBX_0222.agd",
+    0x83B7C6FD424DFDEE: r"SB_AWD\90_119\ENGLISH\PS2_0111.awd",
+    0x83C3C21CF11D48A1: r"SB_AWD\30_59\FRENCH\NGC_0031.awd",
+    0x83C4AE318F06226F: r"SB_AWD\180_209\GERMAN\XBX_0182.awd",
+    0x83C9933099073521: r"SB_AWD\60_89\ENGLISH\PS2_0065.awd",
+    0x83D582CCEF2D8359: r"SB_AGD\60_89\ENGLISH\NGC_0073.agd",
+    0x83DA9950EA3B9E44: r"SB_AWD\0_29\ITALIAN\XBX_0016.awd",
+    0x83DA9D315E83E68C: r"SB_AGD\240_269\GERMAN\XBX_0250.agd",
+    0x83DB48BBAB6777D8: r"SB_AGD\180_209\ENGLISH\NGC_0208.agd",
+    0x83E09950894AFFC8: r"LEVELS\L_1_2_B\global.dff",
+    0x83EE409572A5D52F: r"SB_AGD\60_89\ITALIAN\XBX_0077.agd",
+    0x840DB525BDF6C6E6: r"SB_AWD\30_59\ITALIAN\NGC_0047.awd",
+    0x841254148AD724CB: r"LOC\DE\PAUSED.LOC",
+    0x841440E2877E6C3C: r"SB_AGD\210_239\GERMAN\PS2_0222.agd",
+    0x84173E5EC215D296: r"SHELL\LOAD\L_1_3_A.txd",
+    0x8420EC00F25DA91B: r"SB_AWD\240_269\FRENCH\NGC_0266.awd",
+    0x84255E0FA39F9F6B: r"AUDIO\ITALIAN\XBX_4s1.rws",
+    0x8427FF5B2AA94652: r"SB_AWD\120_149\FRENCH\NGC_0146.awd",
+    0x844159F9D14AB396: r"SB_AGD\90_119\ENGLISH\XBX_0116.agd",
+    0x844465EC36F179DF: r"SHELL\FONTS\mfblds26.png",
+    0x844975540BCAF877: r"SB_AWD\240_269\FRENCH\PS2_0263.awd",
+    0x8456252AF28B68E8: r"LEVELS\L_3_3\SECTIONS\s_12.rws",
+    0x845A19B4942C964C: r"SB_AGD\90_119\SPANISH\XBX_0095.agd",
+    0x845EECFAA969C46A: r"SB_AGD\120_149\ITALIAN\XBX_0140.agd",
+    0x846E379542E2DFCE: r"SB_AWD\180_209\ITALIAN\PS2_0193.awd",
+    0x847359DDF82B6D2E: r"SB_AWD\120_149\ENGLISH\PS2_0129.awd",
+    0x8478AD27E457D221: r"SB_AGD\60_89\GERMAN\NGC_0079.agd",
+    0x8483A28FB7A4169E: r"SB_AWD\0_29\ITALIAN\NGC_0023.awd",
+    0x848DDAF12736BE93: r"LEVELS\MP_4\SECTIONS\s_4.rws",
+    0x848FF7E3311C4EA1: r"SB_AWD\120_149\ENGLISH\PS2_0140.awd",
+    0x84929382FE272058: r"SB_AWD\150_179\SPANISH\NGC_0171.awd",
+    0x8493BA9FA2223A71: r"SB_AGD\240_269\FRENCH\PS2_0261.agd",
+    0x8497675B503E634E: r"SHELL\FEND\INSTANCE\gcn\ldFrench.txd",
+    0x84A4DC63BD584D08: r"SB_AGD\120_149\ENGLISH\NGC_0140.agd",
+    0x84A52FF13226D3D5: r"LEVELS\L_1_1\SECTIONS\s_6.rws",
+    0x84B81C18DDD27672: r"SB_AWD\60_89\SPANISH\PS2_0084.awd",
+    0x84BD053768105F70: r"SB_AWD\30_59\ITALIAN\NGC_0045.awd",
+    0x84C2FDB1D815F33D: r"CoDSplash.index",
+    0x84C4D365535D85E0: r"SB_AWD\210_239\GERMAN\PS2_0235.awd",
+    0x84D223B8E2784A85: r"SB_AWD\210_239\ITALIAN\PS2_0232.awd",
+    0x84D34C2EBF318E6C: r"SB_AGD\30_59\ENGLISH\NGC_0041.agd",
+    0x84E19F1907E7E55E: r"ANIMGRPS\Lvl_11\Lvl_11U.ads",
+    0x84F16DA4730233E0: r"SB_AGD\240_269\SPANISH\XBX_0252.agd",
+    0x84F5E00F8D39D221: r"SB_AWD\0_29\ITALIAN\NGC_0006.awd",
+    0x84F5FA5A7412370B: r"SB_AGD\150_179\ITALIAN\PS2_0177.agd",
+    0x84F7EFBB91F41922: r"SB_AGD\210_239\SPANISH\PS2_0217.agd",
+    0x84FDEB819CCCF7EC: r"SB_AGD\90_119\GERMAN\XBX_0099.agd",
+    0x850036CF7961217D: r"LEVELS\L_3_1_C\SECTIONS\s_13.rws",
+    0x850C97FD526C00C0: r"SB_AWD\60_89\FRENCH\XBX_0089.awd",
+    0x851AC8B517154A4B: r"SB_AGD\150_179\SPANISH\NGC_0169.agd",
+    0x851DFBB11D91C203: r"SB_AWD\240_269\SPANISH\XBX_0260.awd",
+    0x851EB530BADE0F32: r"SB_AGD\30_59\GERMAN\PS2_0039.agd",
+    0x8522E109D126FA36: r"SB_AWD\120_149\ITALIAN\PS2_0136.awd",
+    0x8526CEB7487FCFEE: r"SB_AWD\30_59\ENGLISH\NGC_0036.awd",
+    0x853352A161BE52C8: r"SB_AWD\0_29\ITALIAN\NGC_0021.awd",
+    0x8533F3C7EF22C8DD: r"SB_AGD\210_239\FRENCH\NGC_0211.agd",
+    0x85406498BECB3667: r"SB_AWD\90_119\ITALIAN\XBX_0096.awd",
+    0x8545C9541841D38E: r"SB_AWD\240_269\SPANISH\XBX_0258.awd",
+    0x8549738AC0A76E39: r"SB_AGD\180_209\FRENCH\XBX_0199.agd",
+    0x854E6732A237FCE7: r"SB_AWD\30_59\ITALIAN\NGC_0051.awd",
+    0x854F0E214E213775: r"AUDIO\ITALIAN\XBX_4s3.rws",
+    0x8554EA0FEDD85C23: r"SB_AWD\60_89\FRENCH\PS2_0081.awd",
+    0x8564972DA9495848: r"SB_AGD\180_209\ITALIAN\PS2_0201.agd",
+    0x85750C6886DFC8CC: r"SB_AWD\90_119\GERMAN\XBX_0099.awd",
+    0x857C9E1D7303A437: r"WPNBANK\26_50\wbank_50.bin",
+    0x8581D3CA8C928637: r"SB_AWD\210_239\ITALIAN\PS2_0234.awd",
+    0x85894B39FA3F80C1: r"SB_AWD\120_149\SPANISH\PS2_0139.awd",
+    0x858ADFC0A3AD8DFD: r"SB_AWD\240_269\GERMAN\XBX_0242.awd",
+    0x8590E8A449986B3E: r"SB_AWD\30_59\ENGLISH\XBX_0034.awd",
+    0x85A159CDDAAE7565: r"SB_AGD\60_89\ENGLISH\NGC_0082.agd",
+    0x85A2A06E18011EB4: r"SB_AWD\210_239\SPANISH\PS2_0237.awd",
+    0x85A3396DA70A31E4: r"SB_AGD\30_59\GERMAN\PS2_0046.agd",
+    0x85A5302137536AB3: r"SB_AWD\0_29\ITALIAN\NGC_0008.awd",
+    0x85B14BF514FE4EC6: r"WPNBANK\26_50\wbank_28.bin",
+    0x85B433E8634AFA2C: r"SB_AGD\0_29\FRENCH\PS2_0006.agd",
+    0x85B82C4B02D12066: r"SB_AWD\90_119\FRENCH\NGC_0097.awd",
+    0x85BAEA6EB89F980C: r"SHELL\LOAD\L_1_5.txd",
+    0x85BDA43FEE12CB08: r"SB_AWD\210_239\ENGLISH\PS2_0233.awd",
+    0x85C204F9263B2913: r"SB_AWD\150_179\ENGLISH\NGC_0150.awd",
+    0x85C702B0BB9C4F62: r"SB_AGD\90_119\ENGLISH\NGC_0107.agd",
+    0x85CBE9DB45A32754: r"SB_AWD\180_209\ITALIAN\NGC_0204.awd",
+    0x85D5D0207B63C18E: r"SB_AWD\240_269\SPANISH\PS2_0248.awd",
+    0x85EC3C560E2BDD52: r"SB_AWD\90_119\SPANISH\PS2_0115.awd",
+    0x85F538E8C80CBB11: r"SB_AWD\60_89\ENGLISH\XBX_0062.awd",
+    0x85FC0F505153EB7B: r"InstantAction.layout",
+    0x86042AC9B9E72EBE: r"SB_AWD\0_29\FRENCH\XBX_0021.awd",
+    0x86044760DAF8D979: r"LEVELS\L_3_5\SECTIONS\s_20.rws",
+    0x860700008E328129: r"SB_AGD\120_149\SPANISH\NGC_0134.agd",
+    0x860D576A019F131A: r"SB_AGD\30_59\GERMAN\NGC_0038.agd",
+    0x861B8DE14A2EF9A9: r"SB_AGD\0_29\ENGLISH\NGC_0006.agd",
+    0x8627AE433A927A09: r"SB_AWD\180_209\GERMAN\XBX_0180.awd",
+    0x862D57FB0B90B6B8: r"gui_map10_destroy.index",
+    0x862E49BD3C45E475: r"PauseMenu.layout",
+    0x8639AFD24DC64C8F: r"SB_AWD\240_269\GERMAN\XBX_0244.awd",
+    0x86512E816DB4C2A7: r"SB_AWD\240_269\ENGLISH\XBX_0264.awd",
+    0x86677C5CACEAB8F0: r"SB_AWD\90_119\FRENCH\NGC_0095.awd",
+    0x866B38A4E557E1FA: r"SB_AGD\30_59\GERMAN\XBX_0054.agd",
+    0x866E5AB9FA8D6C2B: r"CodBack_CreateSession.dds",
+    0x8670B85DA437A93C: r"SB_AGD\240_269\FRENCH\PS2_0246.agd",
+    0x86783AFED8951E62: r"SB_AWD\30_59\ENGLISH\PS2_0046.awd",
+    0x8678EBDA33048D24: r"SB_AGD\90_119\ITALIAN\NGC_0116.agd",
+    0x86798ADD82CBF6DA: r"SB_AGD\150_179\ITALIAN\NGC_0155.agd",
+    0x867D7C327E084BDA: r"SB_AWD\120_149\GERMAN\PS2_0141.awd",
+    0x867FD519D11A869E: r"ANIMGRPS\Lvl_26\Lvl_26M.ads",
+    0x8682AD78EE488B84: r"ANIMGRPS\Lvl_35\Lvl_35S.ads",
+    0x868376CB78BD8C7D: r"SB_AWD\0_29\GERMAN\PS2_0027.awd",
+    0x8683BC129DE9AFB5: r"SB_AWD\240_269\FRENCH\NGC_0264.awd",
+    0x868F0ED29D48785B: r"SB_AGD\90_119\FRENCH\NGC_0113.agd",
+    0x869138083BFF447A: r"SB_AGD\180_209\ENGLISH\XBX_0190.agd",
+    0x8691BFBEA5627786: r"SB_AWD\180_209\SPANISH\XBX_0204.awd",
+    0x86A526B9FABC56C8: r"CodBack_CreateSession.txd",
+    0x86AD0229554D093B: r"AUDIO\FRENCH\XBX_1m2.rws",
+    0x86BA7F344C609CB6: r"SB_AGD\150_179\ENGLISH\NGC_0159.agd",
+    0x86C27AA8113F0B95: r"SB_AGD\60_89\ITALIAN\NGC_0064.agd",
+    0x86CD1435F2062608: r"SB_AWD\0_29\ITALIAN\PS2_0011.awd",
+    0x86D76CF38AEBE914: r"ANIMGRPS\Lvl_35\Lvl_35C.ads",
+    0x86D82124D88C7326: r"SB_AWD\120_149\ITALIAN\PS2_0129.awd",
+    0x86E0E62FDFD101DA: r"SB_AWD\180_209\SPANISH\XBX_0198.awd",
+    0x86E39003EDE7C909: r"SB_AGD\0_29\ITALIAN\XBX_0004.agd",
+    0x86EB337AE7E67959: r"SB_AWD\90_119\GERMAN\PS2_0112.awd",
+    0x86EEFB128D25CA12: r"SB_AWD\240_269\ITALIAN\NGC_0241.awd",
+    0x86F5E3463DD5F502: r"LEVELS\L_3_5_C\SECTIONS\s_29.rws",
+    0x86F5F908AF877A69: r"SB_AWD\0_29\FRENCH\NGC_0019.awd",
+    0x86FA72137AC0DE2C: r"SB_AGD\150_179\GERMAN\XBX_0162.agd",
+    0x87086E7BD73D8F71: r"SB_AGD\240_269\GERMAN\NGC_0244.agd",
+    0x870FFFF679D5D191: r"SB_AWD\180_209\ENGLISH\NGC_0186.awd",
+    0x8715F28482BF7AFD: r"SB_AWD\90_119\FRENCH\PS2_0099.awd",
+    0x87181D6076B7F54D: r"SB_AGD\180_209\GERMAN\PS2_0198.agd",
+    0x8720986F4E5236FE: r"SB_AGD\240_269\FRENCH\PS2_0248.agd",
+    0x872AFC80A63E5D9F: r"SB_AGD\30_59\ITALIAN\NGC_0059.agd",
+    0x872EA12B7B333F40: r"ANIMGRPS\Lvl_26\Lvl_26K.ads",
+    0x8731EB6EFD04DBEC: r"HostOptions.layout",
+    0x873246DD22D64B0F: r"SB_AWD\0_29\GERMAN\PS2_0021.awd",
+    0x8739B0170903745C: r"SB_AWD\240_269\ENGLISH\NGC_0243.awd",
+    0x873A8D7BB1903FF2: r"SB_AWD\120_149\ITALIAN\NGC_0137.awd",
+    0x873DDEE447613775: r"SB_AGD\90_119\FRENCH\NGC_0111.agd",
+    0x87409F7E6C9A56FB: r"SB_AGD\60_89\GERMAN\XBX_0088.agd",
+    0x8753BDB61E8D60F2: r"SB_AGD\240_269\SPANISH\XBX_0254.agd",
+    0x8757CA6C1F9C8AA5: r"SB_AGD\150_179\ITALIAN\PS2_0175.agd",
+    0x875B91EAFE6961B0: r"ANIMGRPS\Lvl_14\Lvl_14M.ads",
+    0x875F14EFE8BBCF13: r"SB_AGD\90_119\SPANISH\PS2_0118.agd",
+    0x876589FD7CB90C21: r"SB_AWD\90_119\ITALIAN\PS2_0116.awd",
+    0x87693106E01392E1: r"SB_AGD\150_179\GERMAN\NGC_0176.agd",
+    0x876A7BBF0CBB61BA: r"AUDIO\GERMAN\NGC_1m3.rws",
+    0x876D1311EDB23C4F: r"SB_AWD\150_179\ENGLISH\PS2_0164.awd",
+    0x877574110842ED41: r"SB_AGD\150_179\GERMAN\PS2_0159.agd",
+    0x8776A87CCF49AC45: r"SB_AWD\0_29\ENGLISH\PS2_0025.awd",
+    0x877F4C1A177B1324: r"ANIMGRPS\Lvl_33\Lvl_33S.ads",
+    0x87813E9EF91081DD: r"SB_AGD\150_179\SPANISH\XBX_0150.agd",
+    0x878FABBB1A96E8FA: r"SB_AGD\30_59\FRENCH\XBX_0052.agd",
+    0x8791F64C0B75C91C: r"SB_AWD\210_239\FRENCH\PS2_0237.awd",
+    0x87979E4FB9E894CA: r"SB_AGD\0_29\ITALIAN\PS2_0022.agd",
+    0x879C5C7F08E50C18: r"SB_AGD\30_59\ENGLISH\NGC_0034.agd",
+    0x87A5C8FB111FBE5B: r"SB_AWD\60_89\ITALIAN\NGC_0088.awd",
+    0x87AE5F9D5FFE3198: r"SB_AGD\180_209\SPANISH\PS2_0191.agd",
+    0x87BBB34C4DC95421: r"SB_AGD\180_209\GERMAN\PS2_0204.agd",
+    0x87BEB114A0EF7A66: r"SB_AGD\0_29\ENGLISH\XBX_0010.agd",
+    0x87C00FF0B6B49ABA: r"SHELL\FONTS\fb24.met",
+    0x87C2E771B5FABDEF: r"SB_AWD\210_239\ITALIAN\NGC_0239.awd",
+    0x87C638F6D1EC205A: r"SHELL\FONTS\fbld24.met",
+    0x87CDB70EEF4BCF58: r"SB_AWD\90_119\ENGLISH\PS2_0113.awd",
+    0x87D50B94B42023B4: r"ANIMGRPS\Lvl_33\Lvl_33C.ads",
+    0x87D8F085E738FA30: r"SB_AGD\30_59\SPANISH\XBX_0036.agd",
+    0x87E696CC1679A9DD: r"SB_AGD\210_239\FRENCH\PS2_0225.agd",
+    0x87EEB33F32A116BB: r"SB_AGD\120_149\ENGLISH\PS2_0120.agd",
+    0x87F1E366D400C688: r"SB_AGD\180_209\ENGLISH\PS2_0209.agd",
+    0x87F8A79F33CFC90F: r"SB_AGD\30_59\SPANISH\NGC_0051.agd",
+    0x87FB9B3DECBD8915: r"SB_AWD\0_29\SPANISH\PS2_0018.awd",
+    0x87FD841851B656DE: r"SB_AWD\240_269\FRENCH\XBX_0258.awd",
+    0x8802335139CBDA93: r"SB_AGD\210_239\GERMAN\PS2_0214.agd",
+    0x8813A4B409E37593: r"WPNBANK\0_25\wbank_09.bin",
+    0x8813D49A786A41EC: r"ANIMGRPS\Lvl_34\Lvl_34U.ads",
+    0x8814DA0F26D2A4B3: r"SB_AWD\90_119\ITALIAN\PS2_0118.awd",
+    0x8818D331BCCDA927: r"SB_AWD\120_149\ITALIAN\PS2_0133.awd",
+    0x881E018F8962DE9A: r"SB_AGD\180_209\FRENCH\XBX_0185.agd",
+    0x88244422B25BAC53: r"SB_AGD\150_179\GERMAN\PS2_0157.agd",
+    0x8829104AF4104D69: r"SB_AGD\0_29\ITALIAN\PS2_0014.agd",
+    0x882D74CFB639E31B: r"SB_AWD\30_59\SPANISH\XBX_0040.awd",
+    0x882F202BC1958C06: r"ANIMGRPS\Lvl_33\Lvl_33Q.ads",
+    0x8831452FBA46A156: r"LOC\IT\GLOBAL.LOC",
+    0x8840F65DB58ED9BE: r"SB_AWD\210_239\FRENCH\PS2_0239.awd",
+    0x884685358B04B8EB: r"SB_AWD\210_239\ENGLISH\XBX_0237.awd",
+    0x884F02C8D26B5C78: r"SB_AWD\150_179\ENGLISH\NGC_0179.awd",
+    0x886A84D122D07196: r"SB_AWD\180_209\GERMAN\NGC_0181.awd",
+    0x886B614BBEDFC081: r"SB_AWD\150_179\GERMAN\XBX_0163.awd",
+    0x8872C580A8B25A54: r"SB_AWD\120_149\FRENCH\PS2_0141.awd",
+    0x8874BD0C56675F04: r"SB_AGD\120_149\ITALIAN\XBX_0142.agd",
+    0x8877711538C818EB: r"SB_AGD\180_209\ITALIAN\XBX_0205.agd",
+    0x8883DFA65E38E996: r"ANIMGRPS\Lvl_33\Lvl_33A.ads",
+    0x888CAC5F115642A9: r"SB_AGD\60_89\FRENCH\PS2_0087.agd",
+    0x88A807B0DDE97D49: r"SB_AGD\30_59\SPANISH\NGC_0053.agd",
+    0x88AAFCBFE6391C23: r"SB_AWD\60_89\ENGLISH\NGC_0088.awd",
+    0x88AC38A0DD2BB104: r"SB_AWD\60_89\GERMAN\XBX_0069.awd",
+    0x88AE8C1C8A2CAF7B: r"SB_AGD\60_89\GERMAN\PS2_0072.agd",
+    0x88BECB7DE60C485E: r"SB_AWD\150_179\FRENCH\XBX_0179.awd",
+    0x88C328AC2283E14E: r"ANIMGRPS\Lvl_34\Lvl_34W.ads",
+    0x88C685FDE44ABB3D: r"SHELL\FONTS\mfblds24.png",
+    0x88D9662E305B5CCF: r"SB_AGD\30_59\FRENCH\PS2_0036.agd",
+    0x88EC041400C506CC: r"SB_AGD\60_89\SPANISH\PS2_0086.agd",
+    0x88F37EFF4EC75305: r"SB_AGD\90_119\FRENCH\NGC_0106.agd",
+    0x88F394982BCA23F1: r"SB_AGD\120_149\FRENCH\NGC_0127.agd",
+    0x88F76B2AB4E57900: r"ANIMGRPS\Lvl_11\Lvl_11S.ads",
+    0x8901C94A7D94B453: r"SB_AGD\150_179\FRENCH\NGC_0161.agd",
+    0x8911CD33705F19DC: r"LEVELS\L_1_3_B\SECTIONS\s_8.rws",
+    0x891AED2EDB783F4D: r"SB_AWD\180_209\FRENCH\PS2_0192.awd",
+    0x8926183311191E68: r"SB_AWD\90_119\SPANISH\NGC_0097.awd",
+    0x89291F3419846710: r"LEVELS\L_1_5_B\SECTIONS\s_2.rws",
+    0x893340789FB1FF2C: r"ANIMGRPS\Lvl_23\Lvl_23I.ads",
+    0x893B434FD491D4AF: r"SB_AWD\150_179\ITALIAN\NGC_0154.awd",
+    0x893CBEC8F57DA158: r"SB_AWD\30_59\ENGLISH\NGC_0034.awd",
+    0x894463106BF3346A: r"LEVELS\L_1_3_B\SECTIONS\s_11.rws",
+    0x894658BD84729690: r"SB_AWD\180_209\SPANISH\PS2_0209.awd",
+    0x894943D99C1F8A6F: r"SB_AGD\210_239\FRENCH\NGC_0217.agd",
+    0x894D7B5EA9F54E90: r"SB_AWD\150_179\FRENCH\NGC_0179.awd",
+    0x894F130ABA219F0C: r"SB_AGD\120_149\ENGLISH\XBX_0137.agd",
+    0x89631AD5B5CAFCB4: r"SB_AGD\30_59\ITALIAN\NGC_0030.agd",
+    0x896D5D77B807E4FF: r"SB_AGD\30_59\FRENCH\XBX_0039.agd",
+    0x8973D12FA854BCF6: r"SB_AGD\0_29\ENGLISH\XBX_0003.agd",
+    0x89769F7697736EAD: r"SB_AGD\180_209\ITALIAN\PS2_0190.agd",
+    0x897C431B512CDA00: r"SB_AWD\150_179\FRENCH\PS2_0163.awd",
+    0x897D5715EEF6929D: r"LEVELS\L_3_1_C\SECTIONS\s_2.rws",
+    0x89803A40E12F6BC3: r"SB_AWD\60_89\SPANISH\XBX_0064.awd",
+    0x8982632027EC28FF: r"SB_AWD\240_269\ENGLISH\XBX_0255.awd",
+    0x898A508B8E9B480E: r"AUDIO\ENGLISH\PS2_4s1.rws",
+    0x89903296D3FD0E3B: r"SHELL\FEND\INSTANCE\gcn\slideshw.txd",
+    0x89928E914E4582B8: r"SB_AWD\0_29\ITALIAN\NGC_0014.awd",
+    0x8994332215BB5E94: r"LEVELS\L_1_3_B\SECTIONS\s_13.rws",
+    0x899AE425AADDE08E: r"SB_AGD\60_89\SPANISH\PS2_0088.agd",
+    0x89A0CF5BEF9F587E: r"SB_AGD\150_179\GERMAN\NGC_0153.agd",
+    0x89A61D5E12E7B95E: r"SB_AGD\240_269\GERMAN\XBX_0241.agd",
+    0x89AAA842152F0310: r"SB_AWD\180_209\GERMAN\PS2_0182.awd",
+    0x89B5F5D91A83803B: r"SB_AWD\210_239\ENGLISH\PS2_0227.awd",
+    0x89B6E0FCCEACB753: r"SB_AGD\150_179\FRENCH\XBX_0152.agd",
+    0x89BF38DE7F8A309B: r"SB_AWD\150_179\FRENCH\NGC_0150.awd",
+    0x89C1878E38D1E087: r"SB_AGD\30_59\ITALIAN\XBX_0039.agd",
+    0x89C38E00EBA98794: r"SB_AWD\120_149\SPANISH\NGC_0144.awd",
+    0x89CA3D408591D7DF: r"SB_AWD\180_209\FRENCH\PS2_0194.awd",
+    0x89CA870D7842EACA: r"SB_AWD\0_29\FRENCH\NGC_0005.awd",
+    0x89D55F5220FA9C6B: r"SB_AWD\90_119\FRENCH\XBX_0111.awd",
+    0x89E08884237E10E4: r"SB_AGD\150_179\ENGLISH\PS2_0178.agd",
+    0x89E79EBCDD2611E9: r"SB_AGD\60_89\ENGLISH\NGC_0060.agd",
+    0x8A002A5E38348812: r"ActivisionSplash.txd",
+    0x8A03664C7B797262: r"SB_AWD\0_29\ENGLISH\PS2_0004.awd",
+    0x8A0CDA728B579085: r"SB_AGD\210_239\SPANISH\NGC_0211.agd",
+    0x8A134FD84FD1F43C: r"SB_AGD\0_29\FRENCH\PS2_0015.agd",
+    0x8A20312ED1B35F16: r"SB_AGD\90_119\ENGLISH\NGC_0095.agd",
+    0x8A21A166C646ECF1: r"SB_AWD\150_179\GERMAN\XBX_0170.awd",
+    0x8A2492F38D1BF666: r"SB_AWD\210_239\ENGLISH\XBX_0210.awd",
+    0x8A256F88418C2DBF: r"SB_AGD\180_209\ITALIAN\PS2_0196.agd",
+    0x8A341A537D32C7F2: r"LEVELS\L_1_2\GodData.dff",
+    0x8A36865E3862B449: r"ActivisionSplash.dds",
+    0x8A3FE6B32C68BE52: r"SB_AWD\180_209\FRENCH\NGC_0204.awd",
+    0x8A43C5087D8E7A98: r"SHELL\FONTS\fbld22.met",
+    0x8A51129EF0B071B9: r"LEVELS\L_3_1_B\SECTIONS\s_5.rws",
+    0x8A54ED6FBD007868: r"SB_AGD\240_269\GERMAN\XBX_0243.agd",
+    0x8A626F5D68F31651: r"SB_AGD\90_119\FRENCH\PS2_0095.agd",
+    0x8A6F93DF6DDF9573: r"SB_AWD\120_149\SPANISH\NGC_0121.awd",
+    0x8A7B575F94AFDF4A: r"LEVELS\L_3_5_C\SECTIONS\s_18.rws",
+    0x8A8088B69254A314: r"SB_AGD\30_59\GERMAN\XBX_0056.agd",
+    0x8A86ED3CBABEB3EA: r"SB_AWD\90_119\SPANISH\NGC_0114.awd",
+    0x8A8BB83B91C37DED: r"LEVELS\L_1_2\SECTIONS\s_10.rws",
+    0x8A9044E161C5E9B5: r"SB_AWD\30_59\SPANISH\XBX_0042.awd",
+    0x8A91ED311CF2127D: r"SB_AWD\240_269\ITALIAN\NGC_0259.awd",
+    0x8A9DB4571F6ECB52: r"SB_AGD\210_239\ITALIAN\XBX_0225.agd",
+    0x8AA68819E8FC0594: r"SB_AGD\180_209\ENGLISH\XBX_0192.agd",
+    0x8AA8B4B3332F6601: r"SB_AGD\120_149\FRENCH\NGC_0134.agd",
+    0x8AABEEC3557E3CDE: r"w_betabackground.index",
+    0x8AB4833C8C95F2F7: r"SB_AGD\0_29\ENGLISH\XBX_0015.agd",
+    0x8AC565CF1E76DB3B: r"SB_AWD\0_29\ITALIAN\PS2_0009.awd",
+    0x8ACC54E2CE5AC520: r"SB_AWD\180_209\GERMAN\NGC_0183.awd",
+    0x8AD3E30537358EF0: r"SB_AWD\210_239\ENGLISH\XBX_0212.awd",
+    0x8AD74AB9BE3AF3A7: r"SB_AGD\60_89\ITALIAN\NGC_0062.agd",
+    0x8AFCC371A9225B7B: r"SB_AGD\0_29\ENGLISH\XBX_0028.agd",
+    0x8B0D8054CD17B393: r"SB_AWD\210_239\SPANISH\NGC_0235.awd",
+    0x8B143A4893B7900D: r"SB_AWD\60_89\FRENCH\XBX_0080.awd",
+    0x8B14A9EBB8886A78: r"SB_AGD\150_179\ENGLISH\XBX_0159.agd",
+    0x8B1AD33330C744AE: r"SB_AWD\150_179\SPANISH\XBX_0179.awd",
+    0x8B209B3F496E7958: r"SB_AGD\60_89\GERMAN\NGC_0074.agd",
+    0x8B241C6DFF114347: r"SB_AGD\60_89\ITALIAN\XBX_0086.agd",
+    0x8B2D5025DE8F09F8: r"SB_AWD\0_29\ITALIAN\PS2_0024.awd",
+    0x8B361D4E64D815A4: r"SB_AWD\90_119\SPANISH\NGC_0116.awd",
+    0x8B38DD6493822EAE: r"SB_AWD\210_239\FRENCH\XBX_0210.awd",
+    0x8B4C6D633EFF0769: r"LEVELS\MP_10\SECTIONS\s_5.rws",
+    0x8B557B69CC731021: r"SB_AWD\210_239\FRENCH\XBX_0239.awd",
+    0x8B598E036747D83C: r"SB_AGD\150_179\GERMAN\XBX_0171.agd",
+    0x8B5B240C83C82694: r"SB_AWD\60_89\FRENCH\NGC_0072.awd",
+    0x8B5F046DC1FA1FEF: r"SB_AWD\30_59\GERMAN\PS2_0056.awd",
+    0x8B65B7611B7AC746: r"SB_AGD\120_149\ITALIAN\NGC_0120.agd",
+    0x8B6DF16B293422A8: r"SB_AGD\210_239\ENGLISH\NGC_0218.agd",
+    0x8B7A4AB4AD79B7A1: r"ANIMGRPS\Lvl_13\Lvl_13V.ads",
+    0x8B7F8AA3F4604011: r"SB_AGD\210_239\GERMAN\XBX_0237.agd",
+    0x8B859E5B65B95E1A: r"SB_AGD\60_89\GERMAN\PS2_0086.agd",
+    0x8B8B588E7C455DF7: r"SB_AWD\0_29\ENGLISH\PS2_0023.awd",
+    0x8B968EB0A60D436F: r"SB_AGD\150_179\SPANISH\XBX_0156.agd",
+    0x8B99B84D3C2D22B7: r"LEVELS\L_1_2\SECTIONS\s_16.rws",
+    0x8B9D20F8B52238FB: r"SB_AGD\240_269\ENGLISH\NGC_0253.agd",
+    0x8B9D4361801C7A49: r"SB_AWD\150_179\ITALIAN\NGC_0156.awd",
+    0x8BA4FBCCC793AA14: r"SB_AGD\30_59\FRENCH\XBX_0050.agd",
+    0x8BA6B1368C6EE74B: r"SB_AGD\180_209\SPANISH\PS2_0189.agd",
+    0x8BBB2FA85308AA50: r"SHELL\FONTS\mcn12.png",
+    0x8BC1D02FFAB2BFBB: r"SB_AGD\240_269\ENGLISH\XBX_0260.agd",
+    0x8BC4498DB7A9393B: r"SB_AGD\180_209\FRENCH\NGC_0182.agd",
+    0x8BC649E845FC3C6F: r"LEVELS\MP_5\SECTIONS\s_3.rws",
+    0x8BCBAA4B9EDD8986: r"SB_AGD\90_119\FRENCH\XBX_0095.agd",
+    0x8BCF0A2F4A1D1531: r"ANIMGRPS\Lvl_13\Lvl_13F.ads",
+    0x8BD459F22CCD1138: r"SHELL\LOAD\MP_6_CTF.txd",
+    0x8BD793F193FAE93A: r"LEVELS\L_1_2\SECTIONS\s_4.rws",
+    0x8BE7CD763D9B2418: r"SB_AWD\210_239\FRENCH\XBX_0212.awd",
+    0x8BEEC097943695C2: r"SB_AGD\30_59\SPANISH\XBX_0030.agd",
+    0x8BFBE6DDC3766B6F: r"SB_AGD\210_239\FRENCH\PS2_0223.agd",
+    0x8C02387F3DC4BCB8: r"SB_AWD\90_119\ITALIAN\PS2_0104.awd",
+    0x8C02F53D17DA330A: r"SB_AWD\120_149\FRENCH\XBX_0140.awd",
+    0x8C04CB7B768CA8B3: r"SB_AWD\210_239\FRENCH\XBX_0237.awd",
+    0x8C05164D364E428C: r"WPNBANK\0_25\wbank_11.bin",
+    0x8C09F6BA0859E421: r"SB_AWD\30_59\GERMAN\NGC_0046.awd",
+    0x8C0CD853C0B9FA42: r"SB_AWD\180_209\GERMAN\PS2_0184.awd",
+    0x8C15F09B61EC5EE3: r"SB_AGD\210_239\ITALIAN\NGC_0213.agd",
+    0x8C1EF21B5FEC3591: r"gui_map9_destroy.dds",
+    0x8C1F368CD771FF9C: r"SB_AWD\0_29\SPANISH\NGC_0007.awd",
+    0x8C2208F02B163735: r"SB_AWD\150_179\FRENCH\NGC_0152.awd",
+    0x8C24D3FA75450E63: r"SB_AWD\120_149\SPANISH\NGC_0132.awd",
+    0x8C2E778D8FACB843: r"LEVELS\L_3_5\SECTIONS\s_13.rws",
+    0x8C2F0E5994618FFC: r"SB_AWD\210_239\SPANISH\NGC_0229.awd",
+    0x8C3211EA75C19F43: r"ANIMGRPS\Lvl_26\Lvl_26T.ads",
+    0x8C35A8D199B9E5A4: r"SB_AGD\30_59\GERMAN\XBX_0045.agd",
+    0x8C3D1E8DD0F0BE0D: r"LEVELS\L_2_1_B\level.rws",
+    0x8C4135253541F624: r"SB_AWD\0_29\GERMAN\NGC_0009.awd",
+    0x8C44F8C79AE42F92: r"SB_AGD\210_239\SPANISH\NGC_0238.agd",
+    0x8C4CAC1F6D1D016D: r"gui_map2_death.txd",
+    0x8C55E61B601B638A: r"gui_map9_destroy.txd",
+    0x8C5BA834F0614824: r"SB_AGD\180_209\ENGLISH\XBX_0181.agd",
+    0x8C5F12FE7B1F8686: r"SB_AGD\60_89\ITALIAN\PS2_0080.agd",
+    0x8C5F2F8DD10DC1E1: r"LEVELS\L_2_1_B\level.dff",
+    0x8C5F367C355ADD06: r"SB_AGD\150_179\SPANISH\NGC_0151.agd",
+    0x8C62957FD51938FD: r"LEVELS\L_3_5_C\SECTIONS\s_26.rws",
+    0x8C751D09B5C4E46B: r"SB_AWD\120_149\GERMAN\NGC_0130.awd",
+    0x8C7FD5BB9742E12F: r"SB_AWD\210_239\ENGLISH\NGC_0222.awd",
+    0x8C83881F6D4C063E: r"gui_map2_death.dds",
+    0x8C86470833E8401E: r"SB_AWD\30_59\SPANISH\NGC_0054.awd",
+    0x8C8751651265D653: r"ANIMGRPS\Lvl_26\Lvl_26D.ads",
+    0x8C8F20BF8AC2A463: r"SB_AGD\150_179\SPANISH\PS2_0151.agd",
+    0x8C933FB548C2DA4D: r"SB_AWD\120_149\ITALIAN\NGC_0138.awd",
+    0x8C9467385201EBA9: r"SB_AWD\120_149\FRENCH\XBX_0136.awd",
+    0x8C94E48E185B7EC1: r"SB_AGD\60_89\FRENCH\NGC_0086.agd",
+    0x8C9795917ECAED47: r"LEVELS\L_3_5_C\SECTIONS\s_20.rws",
+    0x8CA9D5BF789D1E4E: r"SB_AGD\60_89\SPANISH\XBX_0072.agd",
+    0x8CACF64B4E246836: r"SB_AWD\30_59\ITALIAN\PS2_0033.awd",
+    0x8CB0E7FF8B186D9E: r"ANIMGRPS\Lvl_32\Lvl_32S.ads",
+    0x8CB220FE3FC2487C: r"SB_AGD\30_59\FRENCH\NGC_0049.agd",
+    0x8CB946CBB2737CB3: r"SB_AWD\30_59\GERMAN\NGC_0048.awd",
+    0x8CB962CAF753B092: r"SB_AWD\120_149\GERMAN\XBX_0128.awd",
+    0x8CC2BEA5D72C5ADD: r"AUDIO\FRENCH\XBX_4m1.rws",
+    0x8CC362625FAA4307: r"SB_AGD\180_209\SPANISH\NGC_0193.agd",
+    0x8CC37A21406F1C16: r"SB_AGD\210_239\GERMAN\NGC_0210.agd",
+    0x8CCE369E818B103E: r"SB_AWD\0_29\SPANISH\NGC_0009.awd",
+    0x8CCEB12DCAB4A801: r"SB_AWD\180_209\ENGLISH\XBX_0188.awd",
+    0x8CD492E6684F705C: r"SB_AGD\90_119\SPANISH\XBX_0118.agd",
+    0x8CDA8AA8197E45AE: r"SB_AWD\30_59\SPANISH\PS2_0033.awd",
+    0x8CE338684337E9E7: r"LEVELS\L_1_2\SECTIONS\s_23.rws",
+    0x8CEC5D696C3F4194: r"SB_AWD\90_119\SPANISH\NGC_0105.awd",
+    0x8CEEC63FDD583909: r"SB_AGD\30_59\FRENCH\PS2_0034.agd",
+    0x8CF6FD5DCE71FD7F: r"SB_AWD\240_269\ITALIAN\NGC_0248.awd",
+    0x8CFBB339910B87CC: r"LEVELS\MP_7\SECTIONS\s_6.rws",
+    0x8D02AE9884268376: r"SB_AWD\180_209\ENGLISH\PS2_0180.awd",
+    0x8D094F10FBC4EE17: r"SB_AGD\90_119\FRENCH\NGC_0100.agd",
+    0x8D12445933511CFF: r"SB_AWD\210_239\ITALIAN\PS2_0216.awd",
+    0x8D16F5E429207D92: r"SB_AGD\60_89\ENGLISH\PS2_0066.agd",
+    0x8D1860B142BC4641: r"SB_AWD\120_149\SPANISH\XBX_0129.awd",
+    0x8D1E235161F562FC: r"SB_AGD\120_149\GERMAN\NGC_0137.agd",
+    0x8D2F01E9FBF744C3: r"SB_AWD\240_269\ITALIAN\XBX_0251.awd",
+    0x8D35B0557CDAA186: r"SB_AGD\180_209\SPANISH\NGC_0189.agd",
+    0x8D35F719DE027C48: r"SB_AWD\30_59\SPANISH\NGC_0056.awd",
+    0x8D43B49FC2743DD3: r"SB_AGD\60_89\FRENCH\NGC_0088.agd",
+    0x8D44510E7F6126E7: r"SB_AWD\60_89\ENGLISH\NGC_0079.awd",
+    0x8D48948A4CAEC78E: r"ANIMGRPS\Lvl_23\Lvl_23K.ads",
+    0x8D58CB34FD98904B: r"SB_AWD\240_269\SPANISH\XBX_0242.awd",
+    0x8D5FB41135312640: r"ANIMGRPS\Lvl_32\Lvl_32U.ads",
+    0x8D64F31C671F55CE: r"SB_AGD\120_149\ENGLISH\XBX_0139.agd",
+    0x8D6C05ECAB3122EB: r"SB_AWD\120_149\GERMAN\PS2_0139.awd",
+    0x8D72982FF43E1DF7: r"ANIMGRPS\Lvl_25\Lvl_25F.ads",
+    0x8D7D178891B63383: r"SB_AWD\180_209\ITALIAN\PS2_0202.awd",
+    0x8D89214155517E00: r"SB_AGD\0_29\ENGLISH\XBX_0001.agd",
+    0x8D897AB9C3973B18: r"SB_AWD\30_59\SPANISH\PS2_0031.awd",
+    0x8D8F56820B9FB83A: r"SB_AGD\90_119\SPANISH\NGC_0107.agd",
+    0x8D92332CFE2AABF2: r"SB_AWD\150_179\FRENCH\PS2_0165.awd",
+    0x8D97A331D4E8CF59: r"SB_AWD\240_269\ENGLISH\XBX_0257.awd",
+    0x8D9EE38AFA09A84E: r"SB_AGD\90_119\GERMAN\PS2_0115.agd",
+    0x8D9F5D8EE3DA8C6D: r"SB_AWD\150_179\FRENCH\NGC_0163.awd",
+    0x8DB9B8D56CCD7CE4: r"AUDIO\SPANISH\NGC_4m2.rws",
+    0x8DC2047F6D867789: r"SB_AWD\30_59\GERMAN\PS2_0054.awd",
+    0x8DC21E2FF1141B76: r"SB_AWD\90_119\GERMAN\NGC_0114.awd",
+    0x8DC757AA90E17B47: r"ANIMGRPS\Lvl_25\Lvl_25V.ads",
+    0x8DC78772C7051AD0: r"SB_AGD\120_149\ITALIAN\NGC_0122.agd",
+    0x8DCEE8F5D9A630AA: r"SB_AGD\210_239\ITALIAN\XBX_0214.agd",
+    0x8DD6DAF8A39A904C: r"w_NetworkConfigBKG.index",
+    0x8DDD4FF1F807B61C: r"SB_AWD\210_239\SPANISH\PS2_0215.awd",
+    0x8DE21DA75EB72AEA: r"SB_AWD\30_59\GERMAN\XBX_0036.awd",
+    0x8DE5724A3F0AB893: r"SB_AWD\240_269\FRENCH\XBX_0260.awd",
+    0x8DE8D20160BA7E4B: r"SB_AWD\240_269\SPANISH\PS2_0252.awd",
+    0x8DEC06FB1297EBAD: r"SB_AGD\210_239\ITALIAN\XBX_0235.agd",
+    0x8DEC0B78F505016E: r"WPNBANK\26_50\wbank_46.bin",
+    0x8DEF70E8885CAE28: r"SB_AWD\60_89\SPANISH\NGC_0083.awd",
+    0x8DF96E850A3E85D0: r"SB_AGD\240_269\ENGLISH\XBX_0249.agd",
+    0x8DFADBE9AF73D903: r"ANIMGRPS\Lvl_11\Lvl_11L.ads",
+    0x8E19438DDF29A751: r"SB_AGD\210_239\ITALIAN\PS2_0229.agd",
+    0x8E1A109D3C002428: r"AUDIO\ENGLISH\PS2_4s3.rws",
+    0x8E22AA8438552B97: r"SB_AGD\210_239\SPANISH\NGC_0217.agd",
+    0x8E2E7A5D4A699010: r"SB_AGD\90_119\FRENCH\XBX_0097.agd",
+    0x8E2ED95B3793555B: r"SB_AGD\210_239\FRENCH\XBX_0220.agd",
+    0x8E344AFB02E9D7FF: r"SB_AGD\180_209\FRENCH\PS2_0208.agd",
+    0x8E35F43623706A3B: r"LEVELS\L_3_5_B\SECTIONS\s_7.rws",
+    0x8E375A35B931E2BC: r"SB_AWD\90_119\SPANISH\XBX_0118.awd",
+    0x8E3EA693B5B95154: r"SB_AGD\90_119\SPANISH\NGC_0105.agd",
+    0x8E4875058F765CF9: r"AUDIO\ITALIAN\PS2_2m2.rws",
+    0x8E49BCE8A038778B: r"SB_AGD\240_269\ENGLISH\NGC_0244.agd",
+    0x8E54EC5AC3378565: r"SB_AWD\120_149\ENGLISH\NGC_0149.awd",
+    0x8E59012578FDEA1B: r"SB_AWD\210_239\ENGLISH\XBX_0228.awd",
+    0x8E5985356F9480CB: r"SHELL\MOVIES\Intro.bik",
+    0x8E5A4FD84F02763A: r"SB_AGD\30_59\SPANISH\PS2_0051.agd",
+    0x8E5AE876D424C440: r"w_createSessionBKG.index",
+    0x8E5F2A9610CA0560: r"SB_AGD\0_29\FRENCH\XBX_0012.agd",
+    0x8E5F75DA80033A5E: r"SB_AGD\60_89\SPANISH\XBX_0065.agd",
+    0x8E63A163B2DFFB58: r"SB_AGD\180_209\GERMAN\PS2_0209.agd",
+    0x8E7295E3FA4E320D: r"SB_AGD\0_29\SPANISH\XBX_0000.agd",
+    0x8E75125EE1E51E3A: r"WPNBANK\0_25\wbank_13.bin",
+    0x8E7DB90783BEF044: r"SB_AGD\210_239\ITALIAN\XBX_0216.agd",
+    0x8E914DB908D08CA4: r"SB_AWD\30_59\GERMAN\XBX_0034.awd",
+    0x8E96A9A7B4D6DFAD: r"SB_AWD\30_59\ITALIAN\XBX_0037.awd",
+    0x8E9AD70CBCB0AABF: r"SB_AGD\210_239\ITALIAN\XBX_0233.agd",
+    0x8EA9AFFB598C9F7D: r"ANIMGRPS\Lvl_11\Lvl_11J.ads",
+    0x8EAEFC71C72B39B1: r"SB_AGD\0_29\GERMAN\PS2_0012.agd",
+    0x8EB1D5E97E6B1DFB: r"SB_AGD\60_89\ENGLISH\XBX_0073.agd",
+    0x8EB22C448C71D152: r"NoSessionsFound.layout",
+    0x8EB379414DB1FDDE: r"SB_AWD\120_149\FRENCH\PS2_0121.awd",
+    0x8EB8EEB38B8DAF66: r"SB_AWD\180_209\ENGLISH\PS2_0193.awd",
+    0x8EC02FCAEFFD9541: r"SB_AGD\90_119\ENGLISH\PS2_0093.agd",
+    0x8EC1E31026AB8D10: r"SB_AGD\60_89\ITALIAN\PS2_0082.agd",
+    0x8EC2068DE0E6E390: r"SB_AGD\150_179\SPANISH\NGC_0153.agd",
+    0x8EC8939F89433FE3: r"SB_AGD\210_239\ITALIAN\PS2_0227.agd",
+    0x8ECBA89B7D69E0DE: r"ANIMGRPS\Lvl_12\Lvl_12W.ads",
+    0x8ED1A4A80D62AC76: r"LEVELS\L_2_1_B\SECTIONS\s_10.rws",
+    0x8EDDA96CE1AC1475: r"SB_AGD\210_239\FRENCH\XBX_0222.agd",
+    0x8EDF6E4AF063E921: r"SB_AWD\0_29\ENGLISH\NGC_0011.awd",
+    0x8EE1D5CD42CD86C9: r"SB_AWD\210_239\ENGLISH\NGC_0220.awd",
+    0x8EEA6289CA1E4BFC: r"AUDIO\GERMAN\NGC_2m2.rws",
+    0x8EF5500EB0EF9211: r"AUDIO\FRENCH\PS2_1m1.rws",
+    0x8EF74783B0B4245D: r"SB_AWD\240_269\SPANISH\NGC_0246.awd",
+    0x8EFA8DD095B95A85: r"SB_AWD\60_89\FRENCH\PS2_0061.awd",
+    0x8EFF6F75F631AFCD: r"ANIMGRPS\Lvl_11\Lvl_11Z.ads",
+    0x8F099FE9F91C0F54: r"SB_AGD\30_59\SPANISH\PS2_0053.agd",
+    0x8F0E45EC2A1BF968: r"SB_AGD\60_89\SPANISH\XBX_0067.agd",
+    0x8F18DCCBB30559EC: r"SB_AGD\150_179\FRENCH\PS2_0178.agd",
+    0x8F1EDF2C9DDDE5A2: r"SB_AGD\180_209\ITALIAN\XBX_0200.agd",
+    0x8F2536F8F4143D52: r"w_background2.index",
+    0x8F2544734776B295: r"SB_AWD\60_89\ITALIAN\XBX_0080.awd",
+    0x8F298A5A40B4519F: r"SB_AWD\60_89\FRENCH\XBX_0086.awd",
+    0x8F2E9BB2DDFDC294: r"SB_AWD\240_269\ITALIAN\NGC_0261.awd",
+    0x8F2FBFA6B7E83FEC: r"SB_AGD\0_29\ENGLISH\NGC_0010.agd",
+    0x8F3C0127C67CC685: r"gui_map6_destroy.index",
+    0x8F3DCACBDC8899E9: r"SB_AWD\60_89\SPANISH\NGC_0068.awd",
+    0x8F44E329BC059BDD: r"SB_AWD\210_239\FRENCH\NGC_0211.awd",
+    0x8F4588532AE08BAB: r"SB_AGD\210_239\GERMAN\NGC_0228.agd",
+    0x8F48F76B50C0BD89: r"LEVELS\L_1_5_B\global.dff",
+    0x8F5EF92B6F670AEA: r"SB_AWD\150_179\GERMAN\PS2_0152.awd",
+    0x8F5FB55ACD55CAD8: r"SB_AGD\90_119\GERMAN\NGC_0093.agd",
+    0x8F683EC535A747F0: r"SB_AWD\180_209\ENGLISH\PS2_0191.awd",
+    0x8F6DDF92294B7747: r"AUDIO\ENGLISH\PS2_1s1.rws",
+    0x8F77D9B1704236CC: r"VoteConfirm.layout",
+    0x8F785E4AF87B4766: r"SB_AWD\90_119\GERMAN\NGC_0107.awd",
+    0x8F80FEDEEB73A01A: r"w_blank.index",
+    0x8F89F79A411F2DF1: r"SB_AGD\210_239\FRENCH\NGC_0233.agd",
+    0x8F8BE8E71B5364FE: r"SB_AWD\60_89\ITALIAN\PS2_0062.awd",
+    0x8F8D3767C09F21DD: r"SB_AGD\90_119\ITALIAN\XBX_0115.agd",
+    0x8F90A321AB5AB3D3: r"SB_AGD\60_89\ITALIAN\NGC_0080.agd",
+    0x8F94DAB5A15D01A3: r"SB_AGD\210_239\GERMAN\XBX_0239.agd",
+    0x8F9BE78B8DFD025B: r"ANIMGRPS\s11_Moveable_MountedGun.ads",
+    0x8F9FF8823FC30E69: r"SB_AGD\30_59\ITALIAN\NGC_0048.agd",
+    0x8FA2E87339CB1727: r"SB_AWD\30_59\ITALIAN\PS2_0036.awd",
+    0x8FA671781557B51A: r"SB_AWD\210_239\ITALIAN\NGC_0216.awd",
+    0x8FAA3DE23FD39637: r"SB_AWD\60_89\FRENCH\PS2_0067.awd",
+    0x8FB59C57CAEF7278: r"SB_AWD\90_119\FRENCH\NGC_0118.awd",
+    0x8FB9E6CCF2236F91: r"w_background2.dds",
+    0x8FC61D6036F90617: r"SB_AWD\90_119\ITALIAN\XBX_0104.awd",
+    0x8FCF52E348DD68C6: r"SB_AWD\150_179\SPANISH\NGC_0151.awd",
+    0x8FD43484F18FA807: r"SB_AWD\60_89\ITALIAN\XBX_0086.awd",
+    0x8FD4CF5E1BFEE639: r"SB_AGD\120_149\FRENCH\XBX_0129.agd",
+    0x8FE4266A9199EDA3: r"SB_AWD\150_179\SPANISH\PS2_0177.awd",
+    0x8FE7DB420EF3CD9B: r"SB_AWD\90_119\FRENCH\XBX_0102.awd",
+    0x8FEACC69DFC938DB: r"SB_AGD\240_269\SPANISH\PS2_0241.agd",
+    0x8FF0DACCF2529D8A: r"w_background2.txd",
+    0x8FF9A0C06FCEE567: r"SB_AWD\180_209\ENGLISH\PS2_0185.awd",
+    0x900E293D19806CA4: r"SB_AWD\150_179\GERMAN\PS2_0150.awd",
+    0x9026B085B9A7EC11: r"SB_AWD\210_239\GERMAN\XBX_0211.awd",
+    0x9027AE5CA294DFF0: r"SB_AWD\90_119\GERMAN\NGC_0105.awd",
+    0x902FE118DDAE3E38: r"SB_AWD\150_179\ITALIAN\PS2_0163.awd",
+    0x9037E3734F7F6DB9: r"SB_AWD\210_239\ITALIAN\NGC_0228.awd",
+    0x9038666D81B73AAB: r"AUDIO\SPANISH\XBX_4s1.rws",
+    0x9038A447CEA9F345: r"LEVELS\L_3_5_B\SECTIONS\s_5.rws",
+    0x903D02D519D2A8DB: r"SB_AGD\210_239\GERMAN\PS2_0236.agd",
+    0x9047E5FC22BF40BD: r"ANIMGRPS\Lvl_26\Lvl_26R.ads",
+    0x9049F6B22192DD14: r"SB_AWD\60_89\ITALIAN\XBX_0074.awd",
+    0x9055661C5E94712E: r"SB_AGD\240_269\ITALIAN\XBX_0243.agd",
+    0x905D83F07F998452: r"SB_AWD\210_239\ENGLISH\PS2_0222.awd",
+    0x905F13A69262799B: r"SB_AGD\150_179\GERMAN\PS2_0179.agd",
+    0x90727019EB3AEBF8: r"SB_AWD\240_269\FRENCH\XBX_0249.awd",
+    0x907D2F4A1B66EF70: r"ANIMGRPS\Lvl_22\Lvl_22C.ads",
+    0x908C372B39355113: r"SB_AWD\90_119\GERMAN\XBX_0113.awd",
+    0x90999C7B89E1F7F5: r"SB_AGD\240_269\SPANISH\PS2_0243.agd",
+    0x909CA576BF629E0D: r"ANIMGRPS\Lvl_26\Lvl_26B.ads",
+    0x909EC492E7084CF7: r"ANIMGRPS\Lvl_16\Lvl_16J.ads",
+    0x90A4B05C8C81101C: r"SB_AGD\30_59\ITALIAN\PS2_0053.agd",
+    0x90A6A53BC96594B8: r"SB_AWD\30_59\GERMAN\NGC_0054.awd",
+    0x90A7B279B312D578: r"SB_AWD\30_59\ITALIAN\PS2_0048.awd",
+    0x90AB8CFA4BC2CB25: r"SB_AGD\240_269\ENGLISH\NGC_0246.agd",
+    0x90AD171A9325958C: r"SB_AGD\30_59\GERMAN\NGC_0047.agd",
+    0x90AF8C90366E2D4C: r"SB_AGD\120_149\ITALIAN\XBX_0120.agd",
+    0x90B79B1EAA93C025: r"SB_AWD\90_119\ENGLISH\XBX_0098.awd",
+    0x90B908D56E9B651C: r"SB_AGD\210_239\GERMAN\XBX_0210.agd",
+    0x90B91057DCBC7D67: r"SB_AWD\90_119\GERMAN\NGC_0111.awd",
+    0x90B98A4BB698A051: r"SB_AWD\60_89\GERMAN\XBX_0073.awd",
+    0x90C16C752A7D363A: r"SB_AWD\240_269\GERMAN\NGC_0265.awd",
+    0x90C17AA7BC553272: r"SB_AGD\0_29\FRENCH\XBX_0014.agd",
+    0x90C267CBB8605ECA: r"SB_AWD\150_179\FRENCH\PS2_0154.awd",
+    0x90C7010FECBE4B3E: r"SB_AGD\30_59\FRENCH\NGC_0047.agd",
+    0x90C7C39C342A6311: r"SB_AGD\240_269\ITALIAN\XBX_0266.agd",
+    0x90CA74D4CCEEA64B: r"SB_AGD\150_179\ITALIAN\XBX_0152.agd",
+    0x90D5155155D33DAA: r"SB_AGD\30_59\SPANISH\XBX_0052.agd",
+    0x90D9D3F9BA73CDFC: r"SB_AGD\210_239\ENGLISH\XBX_0216.agd",
+    0x90E2325F016A1FDB: r"LEVELS\L_1_3_A\SECTIONS\s_6.rws",
+    0x90E35734BDF12411: r"SB_AGD\30_59\SPANISH\NGC_0031.agd",
+    0x90EBD2E6C3EB67F5: r"SB_AGD\210_239\GERMAN\PS2_0234.agd",
+    0x90F2EB5D36E89BF1: r"SB_AWD\240_269\ITALIAN\PS2_0269.awd",
+    0x90F3840D83ABAA47: r"ANIMGRPS\Lvl_16\Lvl_16Z.ads",
+    0x90F393B2926DC673: r"SB_AWD\30_59\GERMAN\XBX_0042.awd",
+    0x90F8B529DC4F4C72: r"SHELL\FEND\INSTANCE\XBOX\LEGAL.TXD",
+    0x90FDEFDFB02C47EA: r"SB_AWD\210_239\SPANISH\XBX_0225.awd",
+    0x910965CAF7C1AAFA: r"SB_AGD\240_269\ENGLISH\PS2_0257.agd",
+    0x910A169B36114C78: r"NetworkError.layout",
+    0x910E7F25D7CDB421: r"SB_AGD\180_209\ENGLISH\PS2_0187.agd",
+    0x911387AA40B417B6: r"SB_AWD\60_89\FRENCH\PS2_0075.awd",
+    0x91194EDF5AE430DC: r"SB_AGD\150_179\SPANISH\PS2_0178.agd",
+    0x9127846AE04DC359: r"SB_AWD\210_239\ITALIAN\PS2_0214.awd",
+    0x9130A78DCFDDA4E0: r"SB_AGD\120_149\ITALIAN\NGC_0131.agd",
+    0x913303630EF165BE: r"SB_AGD\120_149\GERMAN\NGC_0139.agd",
+    0x913DD0C460E26779: r"SB_AWD\120_149\ENGLISH\NGC_0127.awd",
+    0x913F17B548847001: r"SB_AGD\210_239\FRENCH\NGC_0220.agd",
+    0x9141690222B94A2E: r"SB_AWD\60_89\ITALIAN\PS2_0075.awd",
+    0x9142F15F107A82B8: r"SB_AWD\240_269\GERMAN\PS2_0266.awd",
+    0x9144FE77A1E4ADA3: r"SB_AWD\0_29\ENGLISH\NGC_0000.awd",
+    0x915E71D969815C8B: r"SB_AGD\60_89\ENGLISH\XBX_0064.agd",
+    0x9163167E6FE1B99F: r"SB_AGD\0_29\ITALIAN\NGC_0013.agd",
+    0x9165827B44B5E3E2: r"SB_AWD\180_209\ITALIAN\XBX_0190.awd",
+    0x916B4738DFB7F2C1: r"LEVELS\L_3_1\SECTIONS\s_19.rws",
+    0x916E9B46AA962B65: r"SB_AWD\240_269\SPANISH\XBX_0240.awd",
+    0x916FB34B3E585596: r"LEVELS\MP_7\SECTIONS\s_8.rws",
+    0x9172E879F09CAAF1: r"LEVELS\L_1_2\SECTIONS\s_21.rws",
+    0x917511465F37E5D0: r"gui_map7_death.txd",
+    0x91834FB47F6E4BF3: r"SB_AGD\0_29\ITALIAN\XBX_0011.agd",
+    0x918362AE7F0BA296: r"SB_AWD\150_179\ENGLISH\NGC_0159.awd",
+    0x9183E562FFEBFD44: r"SB_AGD\30_59\SPANISH\XBX_0050.agd",
+    0x918B132B796D31A3: r"SB_AWD\90_119\GERMAN\PS2_0103.awd",
+    0x9191CDA74B12ADFF: r"SB_AWD\150_179\ENGLISH\XBX_0174.awd",
+    0x91953309CA89AC38: r"SB_AWD\30_59\SPANISH\NGC_0045.awd",
+    0x91A0DE247F0F88EC: r"SB_AGD\60_89\FRENCH\PS2_0073.agd",
+    0x91A1BB6EE1015A83: r"SB_AWD\240_269\ITALIAN\PS2_0267.awd",
+    0x91A52E50134F1964: r"SB_AWD\180_209\FRENCH\XBX_0198.awd",
+    0x91A83984268AEDAB: r"SB_AGD\60_89\FRENCH\XBX_0073.agd",
+    0x91AB55465F65E8C3: r"gui_map7_death.dds",
+    0x91AD1FF15A45A9A4: r"SB_AWD\210_239\SPANISH\XBX_0227.awd",
+    0x91B6C40025FEE6B0: r"SHELL\FEND\INSTANCE\gcn\ldGerman.txd",
+    0x91BF5EDC2079A3DD: r"SB_AWD\240_269\ENGLISH\PS2_0250.awd",
+    0x91C13CF807F587A3: r"SB_AGD\90_119\GERMAN\XBX_0104.agd",
+    0x91C73B8BF58496CD: r"SB_AGD\0_29\FRENCH\NGC_0002.agd",
+    0x91CAFB60395CBA83: r"SB_AGD\30_59\GERMAN\PS2_0052.agd",
+    0x91D240F9683671DA: r"SB_AWD\210_239\FRENCH\NGC_0238.awd",
+    0x91D55E105525EBCC: r"SB_AWD\120_149\ENGLISH\XBX_0137.awd",
+    0x91DD2D951841F41A: r"SHELL\FEND\INSTANCE\SKY\LDBANNGC.TXD",
+    0x91DD88EE5B9D2117: r"SB_AGD\60_89\FRENCH\NGC_0079.agd",
+    0x91DEDA3DDE657881: r"SB_AWD\180_209\SPANISH\NGC_0191.awd",
+    0x91DFE10EC9AA2D8C: r"SB_AWD\240_269\GERMAN\PS2_0253.awd",
+    0x91E202DB716D0A3B: r"SB_AWD\90_119\SPANISH\XBX_0092.awd",
+    0x91E7EFE3F579C8B6: r"SB_AWD\30_59\FRENCH\NGC_0036.awd",
+    0x91ECEB7AA40ED0A0: r"LEVELS\MP_10\SECTIONS\s_8.rws",
+    0x91EDC0F79D63B536: r"SB_AWD\60_89\ENGLISH\PS2_0062.awd",
+    0x91EF44BD4646456E: r"SB_AWD\150_179\ENGLISH\PS2_0158.awd",
+    0x91F05913CCD23F98: r"SB_AWD\60_89\ITALIAN\PS2_0077.awd",
+    0x91F16F41364E7F24: r"w_map06.index",
+    0x91F3D78AA1F65844: r"WPNBANK\26_50\wbank_48.bin",
+    0x91F6C2E2D582C82F: r"SB_AGD\30_59\SPANISH\XBX_0039.agd",
+    0x91FEA2130DB81965: r"SB_AWD\240_269\SPANISH\PS2_0250.awd",
+    0x920CE2C27F38D9E1: r"SB_AWD\150_179\ENGLISH\PS2_0171.awd",
+    0x920EDE0B9BE37A4D: r"SB_AGD\210_239\FRENCH\XBX_0213.agd",
+    0x920FAF330498CD7D: r"SB_AWD\180_209\SPANISH\NGC_0201.awd",
+    0x92117090F2A93693: r"SB_AWD\120_149\ENGLISH\XBX_0127.awd",
+    0x924152D4D6E324CC: r"SB_AGD\150_179\FRENCH\NGC_0157.agd",
+    0x924AAB53BA7FD435: r"SB_AWD\90_119\FRENCH\XBX_0100.awd",
+    0x924BB44B571097DB: r"SB_AWD\90_119\GERMAN\PS2_0099.awd",
+    0x924C51063005C6AA: r"SB_AWD\0_29\ENGLISH\XBX_0025.awd",
+    0x924F3C9691481385: r"SB_AGD\240_269\SPANISH\PS2_0250.agd",
+    0x9261D63BBB3FD431: r"SB_AGD\210_239\ENGLISH\XBX_0231.agd",
+    0x926324D02FBF8643: r"ANIMGRPS\Lvl_32\Lvl_32J.ads",
+    0x92652B0BAE8109E3: r"SB_AGD\30_59\ENGLISH\XBX_0035.agd",
+    0x926D056D5FD4FA6A: r"SB_AWD\30_59\ITALIAN\NGC_0058.awd",
+    0x926D56BF80D21B62: r"SB_AWD\90_119\ENGLISH\PS2_0102.awd",
+    0x92767646AF32DF60: r"ANIMGRPS\Lvl_13\Lvl_13C.ads",
+    0x928798F9A3BE159B: r"SB_AWD\120_149\GERMAN\NGC_0145.awd",
+    0x9287E4B9BA0EBE50: r"LEVELS\L_2_1_B\SECTIONS\s_12.rws",
+    0x928FBCF39D0745B0: r"SB_AGD\240_269\GERMAN\XBX_0261.agd",
+    0x9292596677D3D006: r"SB_AWD\240_269\SPANISH\XBX_0269.awd",
+    0x92997A50368BE5DB: r"SB_AGD\240_269\FRENCH\PS2_0252.agd",
+    0x92A1ADCCC558C9C3: r"SB_AGD\90_119\ITALIAN\NGC_0102.agd",
+    0x92A95D62E4BA569A: r"SB_AGD\120_149\FRENCH\XBX_0135.agd",
+    0x92B425AA3578CEB6: r"SB_AWD\120_149\ENGLISH\PS2_0147.awd",
+    0x92B6CD3D162AF1D7: r"SB_AWD\90_119\FRENCH\PS2_0101.awd",
+    0x92B8644ACC63BD53: r"ANIMGRPS\Lvl_32\Lvl_32Z.ads",
+    0x92BDC1401AE9610C: r"SB_AGD\180_209\FRENCH\XBX_0190.agd",
+    0x92BE7F44AEB18C0F: r"SB_AWD\180_209\SPANISH\NGC_0207.awd",
+    0x92C16516389FE3FF: r"SB_AWD\120_149\GERMAN\XBX_0121.awd",
+    0x92C7D23D6728EC2C: r"LEVELS\MP_5\GodData.dff",
+    0x92C82952FAADAF08: r"SB_AWD\120_149\FRENCH\PS2_0123.awd",
+    0x92C8C7C5481990A6: r"SB_AWD\60_89\FRENCH\PS2_0088.awd",
+    0x92D91BDF539B5486: r"SB_AGD\30_59\ENGLISH\NGC_0054.agd",
+    0x92E174AD2A677480: r"ANIMGRPS\Lvl_12\Lvl_12Q.ads",
+    0x92E1E9C4370519DE: r"ANIMGRPS\Lvl_31\Lvl_31A.ads",
+    0x92F032E680FBFE8E: r"SB_AGD\150_179\FRENCH\NGC_0159.agd",
+    0x93076B745260A2DC: r"SB_AWD\240_269\ITALIAN\XBX_0267.awd",
+    0x9308A82272238A81: r"SB_AWD\180_209\SPANISH\XBX_0180.awd",
+    0x930DD35BDF96FC12: r"LOC\DE\GUI.LOC",
+    0x93140CBCE7ED231E: r"SB_AGD\120_149\ITALIAN\XBX_0131.agd",
+    0x931A0DD691965236: r"SB_AWD\0_29\ITALIAN\NGC_0001.awd",
+    0x932743C7FB311A04: r"SB_AWD\210_239\GERMAN\PS2_0239.awd",
+    0x932852387148C7FC: r"w_findsesh.index",
+    0x93291B30335B5056: r"SB_AWD\90_119\FRENCH\PS2_0117.awd",
+    0x932D44E6787AACE5: r"SB_AGD\150_179\ITALIAN\XBX_0150.agd",
+    0x934814AD2DB61EEF: r"SB_AWD\30_59\FRENCH\XBX_0053.awd",
+    0x93484A61E0A4A4F5: r"SB_AGD\240_269\FRENCH\PS2_0250.agd",
+    0x935A6E6B1AB49254: r"SB_AWD\180_209\FRENCH\XBX_0187.awd",
+    0x9383E52D56E9A0E4: r"LEVELS\L_3_1_C\SECTIONS\s_7.rws",
+    0x93863C44CB5F2A6E: r"SB_AGD\150_179\ENGLISH\PS2_0158.agd",
+    0x938CBAC4D0954B87: r"SB_AGD\0_29\GERMAN\NGC_0002.agd",
+    0x938E9D12C994F18B: r"SB_AGD\210_239\SPANISH\XBX_0211.agd",
+    0x9392184970A2E05B: r"SB_AWD\90_119\ENGLISH\NGC_0094.awd",
+    0x9392F79F7B68D1F2: r"SB_AGD\120_149\ITALIAN\NGC_0137.agd",
+    0x93951838AD8A9103: r"w_playonline.index",
+    0x93A287796D9BE36F: r"SB_AGD\90_119\ITALIAN\XBX_0113.agd",
+    0x93A30112A4C92E26: r"SB_AWD\60_89\ENGLISH\PS2_0075.awd",
+    0x93A95A5ABB0FD97D: r"SB_AGD\60_89\SPANISH\PS2_0076.agd",
+    0x93B4222E151DFE95: r"SB_AWD\240_269\SPANISH\PS2_0265.awd",
+    0x93B5EE2B780BBA9D: r"SB_AWD\90_119\ENGLISH\NGC_0108.awd",
+    0x93C019B7D2809E44: r"PopupBackground.index",
+    0x93C041EB150BB025: r"SB_AGD\60_89\ENGLISH\XBX_0066.agd",
+    0x93C5F6901B6DDBD9: r"SB_AGD\0_29\ITALIAN\NGC_0011.agd",
+    0x93DE09FB9695056D: r"LEVELS\L_2_2_B\SECTIONS\s_3.rws",
+    0x93E30219E7E875CC: r"LEVELS\L_1_5\CLUMPS\cbank_00.bin",
+    0x93E5B19ABDC89F9A: r"GenericTwoPromptIngameScreen.layout",
+    0x93EC9127B499C708: r"SB_AGD\90_119\ENGLISH\XBX_0091.agd",
+    0x93FA58995C75569B: r"SB_AWD\60_89\ENGLISH\XBX_0073.awd",
+    0x9400760F0F65CBBD: r"SB_AWD\210_239\ENGLISH\PS2_0218.awd",
+    0x940979D22C5AC6A7: r"SB_AWD\60_89\FRENCH\PS2_0070.awd",
+    0x940D2D28498E8211: r"SB_AGD\30_59\FRENCH\XBX_0046.agd",
+    0x94125EC9299DD7DA: r"SB_AWD\120_149\ENGLISH\NGC_0137.awd",
+    0x941F59F172B4DE55: r"SB_AWD\60_89\SPANISH\XBX_0079.awd",
+    0x94239F8280001851: r"AUDIO\ITALIAN\PS2_1s3.rws",
+    0x9423F29DCF449B2C: r"LEVELS\L_3_5\SECTIONS\s_9.rws",
+    0x9425B098049268BA: r"SB_AGD\120_149\ENGLISH\NGC_0137.agd",
+    0x9426E4B2CB94622C: r"SB_AWD\0_29\ITALIAN\XBX_0027.awd",
+    0x942D4DF3CEFBEF13: r"SB_AWD\180_209\GERMAN\XBX_0195.awd",
+    0x943F7F82E2301321: r"SB_AWD\240_269\GERMAN\XBX_0251.awd",
+    0x9443EA6A8FE56383: r"SB_AWD\180_209\SPANISH\NGC_0180.awd",
+    0x945262273A831A1F: r"SB_AGD\30_59\FRENCH\PS2_0050.agd",
+    0x9454E60E5D5EF16B: r"LEVELS\L_3_5_B\SECTIONS\s_14.rws",
+    0x945F7D7DEC214C2A: r"SB_AGD\120_149\FRENCH\XBX_0140.agd",
+    0x9463123FBF36F407: r"SB_AWD\240_269\SPANISH\PS2_0263.awd",
+    0x946A26BE09C936DC: r"SB_AWD\0_29\FRENCH\NGC_0010.awd",
+    0x946A362E0B905938: r"SB_AGD\240_269\ITALIAN\XBX_0241.agd",
+    0x94797E294033E9C6: r"SB_AWD\30_59\ENGLISH\NGC_0054.awd",
+    0x947EA0A38C972D43: r"SB_AWD\90_119\ITALIAN\NGC_0094.awd",
+    0x947ED7575D63D413: r"SB_AGD\240_269\GERMAN\PS2_0265.agd",
+    0x9490957C29D3A1E9: r"SHELL\MOVIES\ITALIAN\Act_1.bik",
+    0x94AD9E33D4147102: r"SessionDetails.layout",
+    0x94B8747A79301513: r"SB_AGD\240_269\FRENCH\NGC_0244.agd",
+    0x94C2F72C40234C4E: r"SB_AGD\30_59\GERMAN\NGC_0049.agd",
+    0x94C6C6686CBF8953: r"SB_AGD\210_239\ENGLISH\XBX_0220.agd",
+    0x94C8167F2F1BFBB5: r"AUDIO\SPANISH\XBX_4s3.rws",
+    0x94C8D75DDC67B6F6: r"w_OptionsBKG.index",
+    0x94D2759A11558814: r"SB_AWD\30_59\ITALIAN\NGC_0049.awd",
+    0x94D2D3A420F41A4F: r"LEVELS\MP_1\global.dff",
+    0x94D372A542FDDD16: r"SB_AGD\90_119\SPANISH\PS2_0111.agd",
+    0x94D500A9AEAC01D4: r"SB_AGD\120_149\ENGLISH\NGC_0135.agd",
+    0x94D75C86D77B07B4: r"SB_AWD\240_269\GERMAN\NGC_0267.awd",
+    0x94DD13ADE12724A3: r"SB_AGD\240_269\ITALIAN\XBX_0268.agd",
+    0x94DDE20BE12077A7: r"SB_AWD\30_59\FRENCH\NGC_0033.awd",
+    0x94DEB51037557C9F: r"SB_AGD\180_209\GERMAN\NGC_0193.agd",
+    0x94E3B31F890A6427: r"SB_AWD\60_89\ENGLISH\PS2_0067.awd",
+    0x94E63C7545BD5FF9: r"SB_AWD\240_269\FRENCH\NGC_0268.awd",
+    0x94EA690B4F4A1C35: r"SB_AWD\120_149\GERMAN\NGC_0147.awd",
+    0x94EC0A0D40FEAA37: r"LEVELS\L_2_2_B\SECTIONS\s_5.rws",
+    0x94EEB40B676FD0BE: r"SB_AGD\210_239\ENGLISH\XBX_0218.agd",
+    0x94FDEA7CE80AC085: r"SB_AGD\240_269\FRENCH\PS2_0265.agd",
+    0x95059A6E24A89C44: r"SB_AGD\90_119\ENGLISH\XBX_0118.agd",
+    0x950E2E2C6BA73ADB: r"SB_AGD\240_269\GERMAN\NGC_0251.agd",
+    0x950E4D8F963A0BC4: r"SB_AGD\120_149\FRENCH\XBX_0142.agd",
+    0x951111B545F5D5A1: r"SB_AGD\120_149\SPANISH\XBX_0129.agd",
+    0x951EB5DCA4BE6C14: r"SB_AGD\240_269\ENGLISH\PS2_0255.agd",
+    0x95245A9B5A047896: r"SB_AGD\240_269\SPANISH\PS2_0266.agd",
+    0x9526111C34D9E6F1: r"SB_AWD\180_209\FRENCH\PS2_0181.awd",
+    0x953BEBF0FF275B10: r"SB_AGD\30_59\ENGLISH\NGC_0056.agd",
+    0x953DF7BF19EC7684: r"SB_AWD\30_59\ITALIAN\XBX_0032.awd",
+    0x953E0C0C051B0920: r"SB_AGD\30_59\ENGLISH\NGC_0045.agd",
+    0x954174B06DB514EF: r"SB_AWD\150_179\GERMAN\NGC_0156.awd",
+    0x954EDBF89645CB7C: r"SB_AWD\180_209\GERMAN\XBX_0189.awd",
+    0x9564FACE6D7BFBAF: r"LEVELS\MP_4\SECTIONS\s_8.rws",
+    0x956A1E1AE5B3BF41: r"SB_AWD\60_89\FRENCH\XBX_0062.awd",
+    0x956CF06553186DE8: r"SB_AWD\60_89\SPANISH\PS2_0077.awd",
+    0x956FEAF3902953A9: r"SB_AGD\180_209\GERMAN\XBX_0203.agd",
+    0x957429A3842FA992: r"SB_AGD\90_119\SPANISH\XBX_0097.agd",
+    0x957E962007E08975: r"LEVELS\L_3_5_B\SECTIONS\s_16.rws",
+    0x9589B7C481158C36: r"SB_AWD\90_119\ITALIAN\PS2_0111.awd",
+    0x958B41B917C325E3: r"SHELL\LOAD\L_1_5_B.txd",
+    0x958BEB41DEE756E0: r"SB_AWD\90_119\FRENCH\PS2_0115.awd",
+    0x9599A0C0C2DCFBAE: r"SB_AGD\240_269\FRENCH\XBX_0261.agd",
+    0x959FB3D2ABFABC47: r"AUDIO\ENGLISH\PS2_4m2.rws",
+    0x95A28FE1146D119F: r"SB_AGD\60_89\GERMAN\XBX_0084.agd",
+    0x95A70DB8F80F5459: r"SB_AWD\150_179\ENGLISH\XBX_0176.awd",
+    0x95AA17D2211F7DA7: r"SB_AWD\120_149\ENGLISH\PS2_0142.awd",
+    0x95AB14BED9427689: r"SB_AWD\30_59\FRENCH\XBX_0051.awd",
+    0x95B2B0D5A315DC9D: r"SB_AWD\0_29\FRENCH\XBX_0008.awd",
+    0x95B470D04CFC4CBD: r"SB_AGD\240_269\ENGLISH\XBX_0240.agd",
+    0x95BCFE3E15BFF9F5: r"SB_AGD\240_269\GERMAN\NGC_0253.agd",
+    0x95CA298A54752F0A: r"SB_AWD\0_29\SPANISH\PS2_0017.awd",
+    0x95CD3D22B53B5471: r"SB_AGD\180_209\GERMAN\PS2_0187.agd",
+    0x95D2A773168EA6ED: r"SB_AWD\180_209\ENGLISH\XBX_0207.awd",
+    0x95DBFA7D5F466306: r"w_betabackgroundEULA.dds",
+    0x95DC1462E8E58AE8: r"SB_AGD\30_59\ENGLISH\PS2_0039.agd",
+    0x95E019296A750029: r"SB_AGD\150_179\SPANISH\NGC_0167.agd",
+    0x95E151EE44B65AB5: r"SB_AWD\120_149\GERMAN\PS2_0128.awd",
+    0x95E586CBCA730307: r"SB_AGD\30_59\FRENCH\NGC_0033.agd",
+    0x95E5FFC68552CE9A: r"SHELL\MOVIES\SPANISH\fend.bik",
+    0x95EA04AD850CFA4B: r"AUDIO\GERMAN\XBX_1s2.rws",
+    0x95ED09D10C7FB857: r"SB_AWD\150_179\ITALIAN\XBX_0156.awd",
+    0x95EECFD94786D300: r"SB_AWD\240_269\ENGLISH\NGC_0250.awd",
+    0x95F06D24751F4525: r"SB_AGD\210_239\SPANISH\XBX_0213.agd",
+    0x95F3E85B1C2D33F5: r"SB_AWD\90_119\ENGLISH\NGC_0096.awd",
+    0x95F9027B605E36D7: r"SB_AWD\180_209\FRENCH\NGC_0195.awd",
+    0x95F90F331FCF399C: r"SB_AWD\30_59\ENGLISH\PS2_0035.awd",
+    0x95FBF8818F826EE2: r"SB_AWD\30_59\ENGLISH\XBX_0038.awd",
+    0x96084A76B5D09983: r"SB_AGD\150_179\ENGLISH\PS2_0160.agd",
+    0x960FFFFE7D3D0127: r"SB_AWD\0_29\ITALIAN\NGC_0004.awd",
+    0x9611EE7D5F73DE25: r"w_betabackgroundEULA.txd",
+    0x961EDA75407A50A6: r"SB_AWD\60_89\ENGLISH\NGC_0081.awd",
+    0x961EF3C5A93475E0: r"SB_AGD\0_29\FRENCH\PS2_0002.agd",
+    0x961F9ACC0D02874D: r"SB_AWD\240_269\ENGLISH\PS2_0265.awd",
+    0x962A83D346C63145: r"SB_AGD\150_179\GERMAN\PS2_0168.agd",
+    0x962AACCCAD39C4C2: r"SB_AWD\180_209\GERMAN\XBX_0208.awd",
+    0x963C11CAE22630DB: r"SB_AGD\0_29\FRENCH\PS2_0027.agd",
+    0x964B416F93E97ABB: r"SB_AWD\90_119\ENGLISH\PS2_0095.awd",
+    0x964D3E11F86CCD7E: r"SB_AGD\0_29\ITALIAN\PS2_0013.agd",
+    0x965B9B858E9CE7A9: r"SB_AWD\0_29\SPANISH\PS2_0007.awd",
+    0x965D28AB08015D35: r"SB_AWD\60_89\ENGLISH\XBX_0071.awd",
+    0x965F57C429B016D6: r"SB_AWD\150_179\ITALIAN\XBX_0166.awd",
+    0x96618117DD025264: r"SB_AWD\0_29\ENGLISH\XBX_0027.awd",
+    0x96650CA83E45AE97: r"SB_AGD\240_269\SPANISH\PS2_0256.agd",
+    0x966B506E7D8E9556: r"SB_AWD\180_209\FRENCH\NGC_0183.awd",
+    0x967626FFD7D6C256: r"SB_AGD\150_179\FRENCH\NGC_0168.agd",
+    0x9678F8E1DCBD27BD: r"ANIMGRPS\Lvl_32\Lvl_32L.ads",
+    0x967CECBF562FE194: r"SB_AWD\90_119\FRENCH\NGC_0099.awd",
+    0x967D887CBCFA8B23: r"SB_AGD\60_89\SPANISH\NGC_0080.agd",
+    0x96A126A122357F5E: r"SB_AWD\30_59\SPANISH\PS2_0055.awd",
+    0x96A281B4D410B1EC: r"gui_map4_ctf.index",
+    0x96A50FAF93B0D7A3: r"SB_AWD\240_269\GERMAN\XBX_0240.awd",
+    0x96A58D054A04E142: r"SB_AGD\240_269\GERMAN\XBX_0267.agd",
+    0x96A710214EA76A3A: r"SB_AWD\180_209\SPANISH\XBX_0208.awd",
+    0x96B008E6354DC5EC: r"ANIMGRPS\Lvl_21\Lvl_21I.ads",
+    0x96B54238E60F3C59: r"SB_AGD\30_59\FRENCH\PS2_0052.agd",
+    0x96BA0408D74710CC: r"SB_AGD\240_269\ITALIAN\NGC_0243.agd",
+    0x96C07AEC271E643B: r"SB_AWD\120_149\FRENCH\PS2_0137.awd",
+    0x96C2E3C9812C96EF: r"SB_AWD\120_149\ITALIAN\PS2_0142.awd",
+    0x96CEEADDB71C1FDF: r"SB_AWD\240_269\ENGLISH\PS2_0263.awd",
+    0x96D3D5F7AC23AEA4: r"SB_AGD\240_269\ENGLISH\PS2_0260.agd",
+    0x96D6A527E59C8A59: r"SB_AWD\120_149\GERMAN\XBX_0123.awd",
+    0x96E3CABAC8B4981E: r"SB_AGD\150_179\ITALIAN\NGC_0151.agd",
+    0x96EAE1DC8C3EEFF5: r"SB_AGD\0_29\FRENCH\PS2_0025.agd",
+    0x96F7B5D5E402AD80: r"ANIMGRPS\Lvl_31\Lvl_31G.ads",
+    0x96F92FC6C1E6F1EB: r"SB_AWD\210_239\SPANISH\NGC_0213.awd",
+    0x97037646EE18B8BA: r"SB_AGD\180_209\FRENCH\XBX_0206.agd",
+    0x971D6B85FF5E8F7E: r"SB_AWD\240_269\ITALIAN\XBX_0269.awd",
+    0x9729DCCE94EABE28: r"SB_AGD\120_149\ITALIAN\XBX_0133.agd",
+    0x973F58B79769F07D: r"SB_AGD\240_269\SPANISH\NGC_0246.agd",
+    0x97419521E2E19ED9: r"SB_AGD\180_209\GERMAN\NGC_0191.agd",
+    0x975382B26B246FFD: r"SB_AGD\180_209\SPANISH\NGC_0182.agd",
+    0x975BEC723768043C: r"SB_AGD\60_89\ENGLISH\NGC_0069.agd",
+    0x975F5CF7DF67654E: r"ANIMGRPS\Lvl_21\Lvl_21K.ads",
+    0x976531F0C0AA59E0: r"SB_AGD\150_179\GERMAN\XBX_0166.agd",
+    0x97705E76BC11500A: r"SB_AWD\90_119\ITALIAN\NGC_0114.awd",
+    0x9771B477113452D5: r"SB_AGD\210_239\ITALIAN\NGC_0224.agd",
+    0x97729E591D261585: r"SB_AGD\240_269\GERMAN\NGC_0240.agd",
+    0x977F29A55BDA3B3A: r"SB_AWD\0_29\SPANISH\PS2_0022.awd",
+    0x977F3FA89FBF5EE4: r"SB_AGD\150_179\ENGLISH\NGC_0157.agd",
+    0x97816447819B6EB4: r"LOC\DE\HUD.LOC",
+    0x97825D3DBCA09681: r"SB_AGD\180_209\GERMAN\PS2_0194.agd",
+    0x9782C5FF161A79D3: r"SB_AWD\60_89\FRENCH\NGC_0066.awd",
+    0x978B32F362634A66: r"SHELL\FEND\INSTANCE\gcn\ldItalian.txd",
+    0x97902DC79570773E: r"SB_AGD\120_149\SPANISH\NGC_0133.agd",
+    0x979DA6BA68C0D623: r"SB_AWD\0_29\GERMAN\PS2_0025.awd",
+    0x97A05C1DB0A63632: r"SB_AGD\30_59\ENGLISH\NGC_0043.agd",
+    0x97A474C219416C89: r"SB_AWD\150_179\GERMAN\NGC_0154.awd",
+    0x97A4BBA8516CEFBE: r"SB_AGD\0_29\ENGLISH\NGC_0001.agd",
+    0x97AB4ABE414039AE: r"SB_AWD\0_29\GERMAN\XBX_0009.awd",
+    0x97ACABA64BD34C44: r"SB_AWD\150_179\FRENCH\NGC_0166.awd",
+    0x97B2C658983251D4: r"SB_AGD\180_209\FRENCH\XBX_0204.agd",
+    0x97B8512451C5EFB0: r"SB_AWD\60_89\ENGLISH\PS2_0077.awd",
+    0x97BA60535FE2C5A6: r"SHELL\FONTS\fb28.met",
+    0x97BACA7A0E78D05A: r"SB_AWD\240_269\FRENCH\NGC_0256.awd",
+    0x97C632239CCDFD8A: r"SB_AWD\210_239\ITALIAN\XBX_0232.awd",
+    0x97D772EF339B1463: r"SB_AWD\150_179\ENGLISH\PS2_0160.awd",
+    0x97DED6E37D55FC2C: r"SB_AGD\120_149\SPANISH\PS2_0127.agd",
+    0x97E37194C820C9F6: r"SB_AWD\120_149\SPANISH\NGC_0128.awd",
+    0x97E4E56C24F5D483: r"ANIMGRPS\Lvl_12\Lvl_12N.ads",
+    0x97E67527E282F85E: r"LEVELS\L_3_5\SECTIONS\s_27.rws",
+    0x98056FF2BFF933D9: r"SB_AGD\60_89\GERMAN\XBX_0086.agd",
+    0x98078ACB1CD8EC13: r"SB_AGD\210_239\FRENCH\PS2_0212.agd",
+    0x980BAF91E51B6505: r"SHELL\FEND\INSTANCE\SKY\ARTWORK.TXD",
+    0x980BCC83E18291FE: r"SB_AGD\60_89\ENGLISH\NGC_0067.agd",
+    0x981954466017566B: r"SB_AWD\210_239\GERMAN\XBX_0231.awd",
+    0x98218488BB4EC4E7: r"SB_AGD\210_239\ITALIAN\NGC_0222.agd",
+    0x98227D39F68B43A3: r"SB_AGD\30_59\FRENCH\XBX_0048.agd",
+    0x983BA4C478902F0E: r"SB_AWD\0_29\ITALIAN\XBX_0029.awd",
+    0x983E233B8B8F50B0: r"SB_AGD\90_119\GERMAN\PS2_0108.agd",
+    0x9844CF2DCAA1B986: r"SB_AWD\150_179\GERMAN\XBX_0177.awd",
+    0x985AAD20516A23D2: r"SB_AGD\240_269\GERMAN\XBX_0252.agd",
+    0x985D9F429EDBE130: r"AUDIO\ENGLISH\XBX_2m2.rws",
+    0x986287C738010EEB: r"SB_AGD\240_269\ITALIAN\XBX_0259.agd",
+    0x986B7CFFC752042E: r"SB_AGD\0_29\GERMAN\XBX_0016.agd",
+    0x98719754C969410C: r"SB_AWD\210_239\GERMAN\NGC_0216.awd",
+    0x987FA9EC6CBC3B27: r"SB_AWD\90_119\ITALIAN\PS2_0114.awd",
+    0x988143D754BFA2F2: r"SB_AGD\0_29\FRENCH\PS2_0004.agd",
+    0x98869D246D4F9666: r"SB_AGD\90_119\FRENCH\PS2_0092.agd",
+    0x9889416CCF4D33DE: r"SB_AGD\180_209\FRENCH\XBX_0181.agd",
+    0x988990F2D6830E52: r"SB_AWD\90_119\SPANISH\XBX_0097.awd",
+    0x988CE177E20D418F: r"SB_AGD\180_209\ITALIAN\XBX_0209.agd",
+    0x988D249DE745DF5E: r"SHELL\FEND\INSTANCE\gcn\ldSpanish.txd",
+    0x988ED8D3902BAB4A: r"SB_AGD\150_179\ITALIAN\PS2_0165.agd",
+    0x9893B97DCF0E9AFD: r"ANIMGRPS\Lvl_12\Lvl_12H.ads",
+    0x989E63A2A22481F1: r"SB_AWD\120_149\ITALIAN\NGC_0127.awd",
+    0x98A76A22C80D621A: r"SB_AGD\240_269\SPANISH\XBX_0265.agd",
+    0x98AC063AFB78DD62: r"SB_AWD\210_239\FRENCH\PS2_0235.awd",
+    0x98B4A72E3330708A: r"SB_AGD\150_179\SPANISH\NGC_0177.agd",
+    0x98B52A47AD7E06AC: r"SB_AGD\30_59\ITALIAN\NGC_0052.agd",
+    0x98C227D5D53C1D60: r"SB_AWD\150_179\ITALIAN\XBX_0164.awd",
+    0x98C648F64AD08BB2: r"SB_AGD\0_29\GERMAN\NGC_0029.agd",
+    0x98C7BD7B9DB3DEAE: r"SB_AGD\0_29\ITALIAN\XBX_0029.agd",
+    0x98CD4065F557679E: r"LEVELS\L_3_1_B\SECTIONS\s_2.rws",
+    0x98CE2080291A9BE0: r"SB_AWD\180_209\FRENCH\NGC_0181.awd",
+    0x98D6912904C9FA15: r"SB_AWD\150_179\GERMAN\XBX_0167.awd",
+    0x98D78AD889D04532: r"SB_AWD\120_149\ITALIAN\XBX_0148.awd",
+    0x98DA8F4A800F8D63: r"SB_AGD\180_209\ITALIAN\PS2_0181.agd",
+    0x98DB4C70DB56E3FF: r"SB_AWD\120_149\ENGLISH\PS2_0133.awd",
+    0x98E390817A2271DD: r"ANIMGRPS\MPA_00\MPA_00Rus.ads",
+    0x98E978F86BB3AB4D: r"ANIMGRPS\Lvl_12\Lvl_12X.ads",
+    0x990D0B996EBEEE20: r"Joining.layout",
+    0x9913BA8E95085B97: r"SB_AGD\240_269\FRENCH\PS2_0263.agd",
+    0x99204ACECA5363E9: r"SB_AGD\150_179\ITALIAN\PS2_0179.agd",
+    0x99255E91C3765C3A: r"SB_AWD\90_119\ITALIAN\NGC_0107.awd",
+    0x9925E3DB2CB8EE89: r"SB_AWD\120_149\ITALIAN\PS2_0140.awd",
+    0x9926DC054F1A1C1A: r"SB_AWD\90_119\ITALIAN\XBX_0112.awd",
+    0x9938117E7965F2E8: r"SB_AGD\180_209\FRENCH\XBX_0183.agd",
+    0x99449950E825151D: r"LEVELS\MP_6\SECTIONS\s_4.rws",
+    0x9945E543F447EB9B: r"SB_AGD\120_149\GERMAN\NGC_0145.agd",
+    0x994D1538BD3A66FC: r"SB_AWD\210_239\ITALIAN\NGC_0232.awd",
+    0x994D33B44C3D4083: r"SB_AWD\120_149\ITALIAN\NGC_0129.awd",
+    0x994DA17E2768E564: r"SB_AWD\120_149\ITALIAN\PS2_0138.awd",
+    0x994EBC2258B1BC1B: r"SB_AGD\0_29\GERMAN\PS2_0003.agd",
+    0x99510CAC79D78C47: r"SB_AGD\60_89\GERMAN\NGC_0064.agd",
+    0x99521453974709EB: r"SB_AGD\90_119\SPANISH\XBX_0100.agd",
+    0x995B03BFADE2136D: r"SB_AGD\210_239\ENGLISH\NGC_0237.agd",
+    0x995DC47571B2AA05: r"SB_AGD\120_149\FRENCH\NGC_0123.agd",
+    0x995EB3D450F5161F: r"SB_AGD\0_29\ENGLISH\XBX_0024.agd",
+    0x9961A9BF2F1E1315: r"SB_AGD\30_59\SPANISH\PS2_0038.agd",
+    0x9981757DD453D2D3: r"SB_AWD\210_239\ENGLISH\NGC_0235.awd",
+    0x9985813AAEE2EF87: r"SB_AWD\150_179\GERMAN\XBX_0161.awd",
+    0x999A7A6F6501606E: r"SB_AGD\90_119\SPANISH\NGC_0110.agd",
+    0x999DFA89AB4781BC: r"SB_AGD\180_209\ITALIAN\XBX_0192.agd",
+    0x999EAAA01F4E498D: r"SB_AWD\30_59\ENGLISH\XBX_0042.awd",
+    0x99A20BAD9004085E: r"ANIMGRPS\Lvl_15\Lvl_15E.ads",
+    0x99A6CFFF97DB3216: r"SB_AWD\240_269\FRENCH\XBX_0269.awd",
+    0x99AE70D26FD8E3B8: r"SB_AGD\240_269\FRENCH\XBX_0263.agd",
+    0x99B700D3B45A5295: r"SB_AGD\90_119\GERMAN\XBX_0119.agd",
+    0x99BF289C8C3AEEEC: r"SB_AGD\180_209\FRENCH\NGC_0206.agd",
+    0x99C4C1D40CA1ADD2: r"SB_AWD\90_119\SPANISH\PS2_0098.awd",
+    0x99C782026C3586F2: r"SB_AGD\150_179\GERMAN\XBX_0160.agd",
+    0x99C97B0905F4E5A1: r"ANIMGRPS\Lvl_36\Lvl_36H.ads",
+    0x99D10122347BAF1D: r"SB_AWD\120_149\ITALIAN\XBX_0132.awd",
+    0x99DC3B17554C735D: r"ANIMGRPS\Lvl_13\Lvl_13Z.ads",
+    0x99DC8AF2C10828CB: r"SB_AWD\240_269\ITALIAN\PS2_0249.awd",
+    0x99E080FA5898F526: r"w_flagsUS.dds",
+    0x99FA8D4966C35110: r"gui_map10_death.index",
+    0x9A03FE74E5058BE6: r"SB_AGD\150_179\SPANISH\PS2_0158.agd",
+    0x9A04BFEAF484A4F2: r"SB_AWD\240_269\ENGLISH\NGC_0256.awd",
+    0x9A061402F0C81A12: r"SB_AGD\60_89\SPANISH\PS2_0084.agd",
+    0x9A075E715CC5DD1E: r"AUDIO\SPANISH\NGC_1s3.rws",
+    0x9A15DA26189438BE: r"SB_AGD\60_89\FRENCH\PS2_0080.agd",
+    0x9A1774FA58C823C5: r"w_flagsUS.txd",
+    0x9A19F5F0A0AFE4C5: r"SB_AWD\60_89\GERMAN\PS2_0089.awd",
+    0x9A1E3A83A2984331: r"ANIMGRPS\Lvl_36\Lvl_36X.ads",
+    0x9A1F1732CEFB7553: r"SB_AWD\0_29\GERMAN\NGC_0024.awd",
+    0x9A24577B388B33D5: r"SB_AGD\210_239\ITALIAN\PS2_0218.agd",
+    0x9A27ED4BB961EB9A: r"SB_AGD\90_119\FRENCH\NGC_0109.agd",
+    0x9A2E24810CB66436: r"SB_AWD\30_59\GERMAN\NGC_0041.awd",
+    0x9A31110B40132428: r"SHELL\LOAD\L_3_1_C.txd",
+    0x9A342A86ED771230: r"SB_AWD\60_89\ENGLISH\NGC_0083.awd",
+    0x9A35A1917AF8882A: r"SB_AGD\90_119\ENGLISH\NGC_0099.agd",
+    0x9A35A6EABE2D08AE: r"SB_AWD\0_29\FRENCH\NGC_0001.awd",
+    0x9A4901C179A18E70: r"SB_AWD\120_149\SPANISH\NGC_0139.awd",
+    0x9A4A4A810F1BD278: r"SB_AGD\90_119\SPANISH\NGC_0112.agd",
+    0x9A50C8722025A634: r"SB_AGD\60_89\SPANISH\PS2_0073.agd",
+    0x9A5760E1B3CD688C: r"SB_AGD\240_269\GERMAN\PS2_0253.agd",
+    0x9A57D457E6B6E4AE: r"AUDIO\SPANISH\XBX_2s2.rws",
+    0x9A597554940F0568: r"LEVELS\L_3_5\SECTIONS\s_18.rws",
+    0x9A59BCEF3AA5B229: r"KickPlayerConfirm.layout",
+    0x9A62EF493CFE246A: r"SB_AWD\60_89\ENGLISH\NGC_0070.awd",
+    0x9A6573C5A8641E6E: r"SB_AGD\30_59\SPANISH\PS2_0042.agd",
+    0x9A665325C17B36AE: r"SB_AGD\90_119\SPANISH\PS2_0094.agd",
+    0x9A72378A1293725E: r"SB_AWD\30_59\FRENCH\PS2_0033.awd",
+    0x9A7AC64D6DE25D19: r"SB_AWD\210_239\ENGLISH\PS2_0229.awd",
+    0x9A7FE1FFBB084EFA: r"SB_AWD\180_209\FRENCH\XBX_0206.awd",
+    0x9A8424BE3B6BE173: r"SB_AGD\90_119\ENGLISH\NGC_0119.agd",
+    0x9A84F23A71C42DED: r"LEVELS\L_1_1_B\SECTIONS\s_7.rws",
+    0x9A909ADE8A24EAEE: r"SB_AGD\120_149\GERMAN\PS2_0123.agd",
+    0x9A90AF65877682F3: r"SB_AGD\180_209\ITALIAN\PS2_0192.agd",
+    0x9A9AF00B9BF6ED3C: r"SB_AWD\60_89\GERMAN\PS2_0066.awd",
+    0x9AA303829B9DAE3C: r"SB_AWD\210_239\ENGLISH\NGC_0229.awd",
+    0x9AA35F9F563952C6: r"SB_AWD\240_269\ITALIAN\XBX_0258.awd",
+    0x9AB5D6B2CF313088: r"SB_AWD\30_59\SPANISH\PS2_0057.awd",
+    0x9AB794FF565CB8BE: r"SB_AWD\120_149\FRENCH\XBX_0131.awd",
+    0x9AB812551CB64BD6: r"SB_AGD\60_89\FRENCH\NGC_0081.agd",
+    0x9ABF8B1180D34D4C: r"AUDIO\SPANISH\PS2_2m3.rws",
+    0x9ADAF631C7BC3ABF: r"SB_AWD\0_29\ITALIAN\PS2_0005.awd",
+    0x9AE4174FCE30F0EF: r"LEVELS\L_3_5\SECTIONS\s_22.rws",
+    0x9AE496FC6845FE18: r"SB_AWD\0_29\FRENCH\NGC_0003.awd",
+    0x9AE6EBE54E801AF2: r"ANIMGRPS\Lvl_25\Lvl_25O.ads",
+    0x9AE8C076695D2D22: r"LEVELS\L_1_3_A\SECTIONS\s_3.rws",
+    0x9AEAA23849C5AC05: r"SB_AWD\0_29\ENGLISH\NGC_0020.awd",
+    0x9AEB4893D83E1EC8: r"SB_AGD\30_59\GERMAN\XBX_0052.agd",
+    0x9AF99ACC75B23328: r"SB_AGD\150_179\ITALIAN\NGC_0153.agd",
+    0x9B02E1992ECE5E54: r"SB_AWD\120_149\ITALIAN\PS2_0127.awd",
+    0x9B0D09DB3ABC86AB: r"SB_AGD\90_119\FRENCH\NGC_0096.agd",
+    0x9B105D8CDB64F98A: r"SHELL\MOVIES\ITALIAN\fend.bik",
+    0x9B1147F72EE58148: r"SB_AGD\180_209\ENGLISH\XBX_0196.agd",
+    0x9B121F5AE7178624: r"SB_AWD\60_89\ENGLISH\NGC_0072.awd",
+    0x9B1543D7527E9078: r"SB_AGD\30_59\SPANISH\PS2_0040.agd",
+    0x9B1F14FD44AE4332: r"SB_AGD\30_59\FRENCH\NGC_0058.agd",
+    0x9B2ED21165214474: r"SB_AWD\180_209\FRENCH\XBX_0204.awd",
+    0x9B349572D49E0951: r"SB_AWD\210_239\GERMAN\PS2_0223.awd",
+    0x9B406AF0343F5CF8: r"SB_AGD\120_149\GERMAN\PS2_0121.agd",
+    0x9B4F5014C1A90A1E: r"SB_AGD\0_29\ENGLISH\PS2_0008.agd",
+    0x9B55414CFD9999A6: r"LEVELS\L_2_2_B\level.dff",
+    0x9B6A1D18C8C8B21E: r"SB_AWD\150_179\GERMAN\PS2_0163.awd",
+    0x9B6CEE19FA9B9E91: r"SB_AGD\0_29\ENGLISH\PS2_0021.agd",
+    0x9B7048B271439BCE: r"AUDIO\FRENCH\PS2_4s1.rws",
+    0x9B7C6F4C58F60EF7: r"SB_AGD\90_119\FRENCH\PS2_0097.agd",
+    0x9B886E6ACA23B097: r"SB_AGD\240_269\GERMAN\NGC_0246.agd",
+    0x9B88C8BEF355DE4D: r"SB_AGD\180_209\GERMAN\XBX_0197.agd",
+    0x9B8A364371D5B819: r"SB_AWD\0_29\ITALIAN\PS2_0007.awd",
+    0x9B92624CFDCD8042: r"LEVELS\L_2_2_B\level.rws",
+    0x9B92F24C1C2DD2B7: r"LEVELS\L_1_1_B\SECTIONS\s_1.rws",
+    0x9B9519B708D80CB4: r"SB_AWD\0_29\SPANISH\PS2_0020.awd",
+    0x9B95C7F6F898EE44: r"ANIMGRPS\Lvl_25\Lvl_25A.ads",
+    0x9B9A5249F3DFE7B7: r"SB_AWD\0_29\ENGLISH\NGC_0026.awd",
+    0x9BA0550B6D53F46D: r"SB_AWD\150_179\ENGLISH\NGC_0152.awd",
+    0x9BA0FD2BAAC1C738: r"SB_AWD\90_119\SPANISH\NGC_0112.awd",
+    0x9BA2BE1E82A74DCD: r"LEVELS\L_3_1_C\CLUMPS\cbank_01.bin",
+    0x9BA71BF3AB39B1B6: r"SB_AGD\120_149\FRENCH\PS2_0136.agd",
+    0x9BB036B765DAEA76: r"SB_AGD\120_149\ITALIAN\PS2_0136.agd",
+    0x9BB5A79B8E83E462: r"SB_AGD\60_89\FRENCH\XBX_0076.agd",
+    0x9BB8FFCCAB0C7CD8: r"SB_AGD\120_149\SPANISH\XBX_0124.agd",
+    0x9BB9C005FBE9B0A2: r"SB_AWD\240_269\ENGLISH\NGC_0241.awd",
+    0x9BBA2F6D7335224C: r"SB_AWD\120_149\FRENCH\NGC_0144.awd",
+    0x9BC193E5FC813859: r"SB_AGD\0_29\ENGLISH\XBX_0026.agd",
+    0x9BC75348D2550A5A: r"SB_AWD\30_59\SPANISH\XBX_0038.awd",
+    0x9BC7A43001EFEC93: r"SB_AWD\30_59\GERMAN\PS2_0041.awd",
+    0x9BC812102B152935: r"SB_AWD\60_89\SPANISH\PS2_0069.awd",
+    0x9BC9E28DE103AD2F: r"LEVELS\L_3_1_B\SECTIONS\s_7.rws",
+    0x9BD0196F6760EA39: r"SB_AWD\60_89\ITALIAN\NGC_0086.awd",
+    0x9BDDAE4A5D428317: r"SB_AWD\90_119\FRENCH\NGC_0100.awd",
+    0x9BE3649C141BDD26: r"SB_AWD\30_59\GERMAN\NGC_0034.awd",
+    0x9BE47A91F3623E2D: r"ANIMGRPS\Lvl_13\Lvl_13J.ads",
+    0x9BEB8771953DFED4: r"ANIMGRPS\Lvl_25\Lvl_25Q.ads",
+    0x9BED5F8D25487533: r"SB_AWD\90_119\ITALIAN\PS2_0095.awd",
+    0x9BF0DE38ABA3B35E: r"SB_AGD\60_89\GERMAN\PS2_0082.agd",
+    0x9BF958DEEEA04ABD: r"SB_AWD\210_239\FRENCH\PS2_0225.awd",
+    0x9BFB2694DE910D83: r"ANIMGRPS\Lvl_31\Lvl_31X.ads",
+    0x9BFE3F3EE1377B1D: r"SB_AGD\240_269\GERMAN\XBX_0268.agd",
+    0x9C05082A82179283: r"LEVELS\L_1_2\SECTIONS\s_12.rws",
+    0x9C0FBBAA0D7D25C8: r"SB_AGD\30_59\FRENCH\XBX_0054.agd",
+    0x9C19CD2A72E2EE48: r"SB_AWD\150_179\GERMAN\PS2_0161.awd",
+    0x9C32E27A3A6F0F16: r"SB_AGD\120_149\FRENCH\NGC_0133.agd",
+    0x9C3AFE644B06B6BD: r"SHELL\MOVIES\ITALIAN\3_5_Mon.bik",
+    0x9C3F172900D88E57: r"ANIMGRPS\Lvl_13\Lvl_13X.ads",
+    0x9C50660F7B354493: r"ANIMGRPS\Lvl_31\Lvl_31H.ads",
+    0x9C566C0555534AC0: r"SB_AGD\120_149\FRENCH\PS2_0134.agd",
+    0x9C58918573B6234C: r"SB_AGD\90_119\ITALIAN\PS2_0117.agd",
+    0x9C687BA2E99C20AB: r"SB_AWD\90_119\SPANISH\XBX_0100.awd",
+    0x9C6C01AADFCE9D29: r"SB_AGD\180_209\SPANISH\PS2_0187.agd",
+    0x9C6D151A5DC29EEE: r"SB_AWD\120_149\FRENCH\XBX_0144.awd",
+    0x9C6D5C0BBD4506EB: r"SB_AWD\180_209\GERMAN\NGC_0203.awd",
+    0x9C7155A9E146BEC9: r"SB_AWD\210_239\ENGLISH\XBX_0239.awd",
+    0x9C7198A4B3E53053: r"SB_AWD\60_89\ITALIAN\XBX_0064.awd",
+    0x9C7FB0BF5B30CB26: r"SB_AWD\240_269\GERMAN\PS2_0242.awd",
+    0x9C804D11744DEC38: r"SB_AGD\0_29\GERMAN\XBX_0014.agd",
+    0x9C8A1FCDDA7FF51C: r"SB_AGD\210_239\SPANISH\PS2_0215.agd",
+    0x9C93D6A39D7BEB27: r"ANIMGRPS\Lvl_13\Lvl_13H.ads",
+    0x9C9A08C41BC54EE8: r"AUDIO\FRENCH\PS2_4s3.rws",
+    0x9C9C17D78B934FE6: r"SB_AWD\90_119\FRENCH\XBX_0095.awd",
+    0x9C9FAE4A55BC7268: r"SB_AGD\60_89\GERMAN\PS2_0080.agd",
+    0x9CB1F88136CA565C: r"SB_AWD\60_89\SPANISH\NGC_0061.awd",
+    0x9CC85F75EE7EB214: r"SB_AWD\60_89\ENGLISH\NGC_0061.awd",
+    0x9CCA751E8BAA1430: r"SB_AGD\180_209\SPANISH\NGC_0208.agd",
+    0x9CCF4BA67207C3DE: r"w_betabackground.txd",
+    0x9CCFC46C4565E617: r"SB_AWD\30_59\ITALIAN\PS2_0050.awd",
+    0x9CD0001931DCBCA9: r"ANIMGRPS\Lvl_24\Lvl_24B.ads",
+    0x9CDF6A9A45A4C62B: r"SB_AGD\90_119\GERMAN\NGC_0106.agd",
+    0x9CE35D91F4586256: r"SB_AGD\90_119\ENGLISH\PS2_0094.agd",
+    0x9CECE1FAA622234A: r"AUDIO\ENGLISH\NGC_1m1.rws",
+    0x9CF08C8288538A59: r"SB_AWD\120_149\ENGLISH\PS2_0131.awd",
+    0x9CF2CF86F8FF7ED2: r"SB_AWD\90_119\ENGLISH\PS2_0090.awd",
+    0x9CF343FE5936E35B: r"SB_AGD\240_269\FRENCH\NGC_0266.agd",
+    0x9CF36CDBD3FFA046: r"SHELL\MOVIES\FRENCH\EndGame.bik",
+    0x9CF8337B62AC2E92: r"w_map04.index",
+    0x9CFEB3E08408A290: r"LEVELS\L_1_2\SECTIONS\s_2.rws",
+    0x9CFFBA21254EE44D: r"ANIMGRPS\Lvl_31\Lvl_31N.ads",
+    0x9D039C11F4C06936: r"SB_AWD\0_29\ENGLISH\NGC_0016.awd",
+    0x9D0500D7059CC1D6: r"SB_AGD\60_89\ITALIAN\NGC_0089.agd",
+    0x9D050FA67234ED45: r"w_betabackground.dds",
+    0x9D0771971DCEFD0E: r"SB_AGD\90_119\ITALIAN\PS2_0119.agd",
+    0x9D08B86AFB9E3626: r"SB_AGD\210_239\GERMAN\XBX_0230.agd",
+    0x9D120C0AB7819F1C: r"SB_AWD\240_269\GERMAN\NGC_0245.awd",
+    0x9D1446379A0500BC: r"SB_AGD\30_59\ITALIAN\NGC_0041.agd",
+    0x9D1489B85123522E: r"SB_AGD\240_269\ENGLISH\PS2_0240.agd",
+    0x9D1DB5996272D07D: r"SB_AWD\150_179\SPANISH\XBX_0150.awd",
+    0x9D1FB2F6A6450022: r"WPNBANK\0_25\wbank_22.bin",
+    0x9D2416A8F85D1327: r"SB_AWD\30_59\GERMAN\NGC_0044.awd",
+    0x9D358F574C520606: r"SB_AGD\0_29\ENGLISH\NGC_0023.agd",
+    0x9D39467BC77513E2: r"SB_AWD\0_29\SPANISH\NGC_0005.awd",
+    0x9D3B4EA370742DB4: r"SB_AWD\90_119\ITALIAN\NGC_0105.awd",
+    0x9D429259ED616606: r"gui_map5_ctf.dds",
+    0x9D491D137640D90C: r"SB_AGD\120_149\FRENCH\XBX_0120.agd",
+    0x9D49DE38E36F617B: r"SB_AGD\150_179\FRENCH\PS2_0160.agd",
+    0x9D4B67E935ACE870: r"SB_AWD\90_119\FRENCH\XBX_0097.awd",
+    0x9D50768C0AFEE26D: r"SB_AGD\30_59\ITALIAN\PS2_0038.agd",
+    0x9D5296BE84CAD7C1: r"SB_AGD\30_59\SPANISH\XBX_0046.agd",
+    0x9D5832C30426785C: r"SB_AGD\90_119\ENGLISH\NGC_0105.agd",
+    0x9D5BB555A14586B5: r"SB_AGD\120_149\GERMAN\NGC_0147.agd",
+    0x9D5E04ECF5F3F0AA: r"ANIMGRPS\Lvl_23\Lvl_23G.ads",
+    0x9D648C3405AF5735: r"SB_AGD\0_29\GERMAN\PS2_0001.agd",
+    0x9D6809038C346852: r"SB_AWD\120_149\FRENCH\PS2_0132.awd",
+    0x9D70D3D15ADFAE7F: r"SB_AGD\210_239\ENGLISH\NGC_0231.agd",
+    0x9D7394871EB04517: r"SB_AGD\120_149\FRENCH\NGC_0125.agd",
+    0x9D788659ED8EE125: r"gui_map5_ctf.txd",
+    0x9D7ABC2855D9588C: r"SB_AGD\150_179\SPANISH\XBX_0177.agd",
+    0x9D7E6C6856B7B94C: r"SB_AWD\90_119\SPANISH\PS2_0117.awd",
+    0x9D96D04C89DBCA6B: r"SB_AGD\150_179\SPANISH\PS2_0160.agd",
+    0x9DA21410034FA275: r"SB_AGD\240_269\FRENCH\NGC_0264.agd",
+    0x9DA887D303AA43CB: r"SB_AWD\180_209\SPANISH\XBX_0195.awd",
+    0x9DAC5128A9C1976C: r"SB_AWD\210_239\ITALIAN\NGC_0221.awd",
+    0x9DAEE722014F715B: r"SHELL\MOVIES\ITALIAN\1_1_Mon.bik",
+    0x9DB3FAB1CC4B0B1F: r"SB_AWD\30_59\ENGLISH\XBX_0044.awd",
+    0x9DB670B20739C4B9: r"SB_AWD\150_179\GERMAN\NGC_0161.awd",
+    0x9DB7D7BF3D019C00: r"ANIMGRPS\Lvl_15\Lvl_15C.ads",
+    0x9DBA7EE8F43B0413: r"SB_AWD\90_119\SPANISH\PS2_0107.awd",
+    0x9DCC85AB0C8B8F0F: r"SB_AWD\150_179\SPANISH\XBX_0156.awd",
+    0x9DCF22F9AD07DC52: r"SB_AGD\120_149\ENGLISH\XBX_0135.agd",
+    0x9DD7AE929A597AEA: r"SB_AWD\90_119\GERMAN\NGC_0118.awd",
+    0x9DE15D3CD8154821: r"SB_AWD\150_179\ENGLISH\XBX_0154.awd",
+    0x9DE6C6CEFC7FBD34: r"SB_AGD\240_269\SPANISH\NGC_0243.agd",
+    0x9DFA02EBFA88FA81: r"SB_AWD\210_239\FRENCH\NGC_0220.awd",
+    0x9DFAF0C9D03A3CB4: r"SB_AGD\180_209\SPANISH\NGC_0187.agd",
+    0x9DFC903458188A97: r"SB_AGD\150_179\GERMAN\XBX_0158.agd",
+    0x9DFD2002E77874EB: r"SB_AWD\120_149\ENGLISH\XBX_0145.awd",
+    0x9E0166D02EE396D3: r"SB_AGD\30_59\SPANISH\XBX_0048.agd",
+    0x9E0913683FF22ED2: r"SB_AGD\90_119\GERMAN\PS2_0119.agd",
+    0x9E131848414A49F2: r"ANIMGRPS\Lvl_16\Lvl_16C.ads",
+    0x9E1B5566FCD071BB: r"SB_AWD\120_149\FRENCH\NGC_0132.awd",
+    0x9E2BD0364E10879B: r"SB_AWD\210_239\GERMAN\XBX_0222.awd",
+    0x9E303D122102DF8D: r"SB_AWD\120_149\ITALIAN\XBX_0147.awd",
+    0x9E30F74271DA45CD: r"SB_AGD\90_119\ENGLISH\PS2_0112.agd",
+    0x9E63900A8D6D9B0B: r"SB_AGD\180_209\GERMAN\NGC_0203.agd",
+    0x9E67D7C2DDEDA742: r"ANIMGRPS\Lvl_16\Lvl_16S.ads",
+    0x9E6A6CBD6C7CC929: r"SB_AWD\120_149\ENGLISH\NGC_0145.awd",
+    0x9E6FD0DA5CAB39AB: r"SB_AWD\180_209\SPANISH\PS2_0189.awd",
+    0x9E73162F4A7B762C: r"LEVELS\L_1_2\SECTIONS\s_28.rws",
+    0x9E7B23376E771EB8: r"SB_AGD\90_119\SPANISH\PS2_0096.agd",
+    0x9E802B24D5AFF30C: r"SB_AWD\240_269\ITALIAN\NGC_0243.awd",
+    0x9E86E79BBF8F2388: r"SB_AWD\30_59\FRENCH\PS2_0031.awd",
+    0x9E8D900CBB7D00FA: r"w_weaponsDE.txd",
+    0x9EA96670FBA2CC08: r"SB_AGD\90_119\SPANISH\NGC_0101.agd",
+    0x9EAA800D20EAD6B6: r"SB_AGD\30_59\ITALIAN\PS2_0042.agd",
+    0x9EAF64F23D901E20: r"SB_AWD\90_119\GERMAN\XBX_0118.awd",
+    0x9EB8DC2CFC25E226: r"SB_AWD\0_29\ENGLISH\NGC_0009.awd",
+    0x9EBED88603052BB6: r"SB_AGD\210_239\GERMAN\XBX_0223.agd",
+    0x9EC1F459EB631D44: r"ANIMGRPS\Lvl_16\Lvl_16M.ads",
+    0x9EC37C0CBBAA6E61: r"w_weaponsDE.dds",
+    0x9ECBC529AF58A1F6: r"SB_AGD\120_149\GERMAN\XBX_0146.agd",
+    0x9ED8FE10CAA80CEF: r"SB_AWD\150_179\FRENCH\XBX_0163.awd",
+    0x9EE3303BC77C2FC1: r"SHELL\MOVIES\ITALIAN\3_1_Mon.bik",
+    0x9EF6131EA5C8AF91: r"SHELL\LOAD\L_3_2.txd",
+    0x9EF72D69D9AF8076: r"SB_AGD\0_29\ITALIAN\XBX_0018.agd",
+    0x9EF75FE0E80ACA62: r"SB_AWD\210_239\SPANISH\PS2_0217.awd",
+    0x9EFB2BFB887FD0AC: r"SB_AWD\60_89\GERMAN\PS2_0075.awd",
+    0x9EFC2729193A1E9A: r"SB_AGD\60_89\FRENCH\NGC_0070.agd",
+    0x9EFC2D964EBA3E38: r"SB_AWD\30_59\GERMAN\XBX_0030.awd",
+    0x9F04ABDFD15255CC: r"SB_AGD\90_119\FRENCH\XBX_0105.agd",
+    0x9F0616EA029AFFF3: r"SB_AGD\210_239\ITALIAN\XBX_0237.agd",
+    0x9F10F4ABC5A27E21: r"SB_AWD\120_149\GERMAN\XBX_0141.awd",
+    0x9F14EFD89F76F3B9: r"ANIMGRPS\Lvl_11\Lvl_11N.ads",
+    0x9F15C1EAFAABC274: r"AUDIO\ITALIAN\NGC_1m3.rws",
+    0x9F1A2C4F0D1573C5: r"SB_AGD\0_29\GERMAN\PS2_0016.agd",
+    0x9F1E5199CC5DA0F9: r"SB_AWD\210_239\ENGLISH\XBX_0226.awd",
+    0x9F2350401D0F97AD: r"SB_AGD\180_209\ENGLISH\XBX_0207.agd",
+    0x9F25F3EC6244F08F: r"SB_AGD\210_239\ENGLISH\NGC_0222.agd",
+    0x9F2E8C915170E80A: r"SB_AGD\30_59\ENGLISH\NGC_0032.agd",
+    0x9F34D64F55E8832F: r"SB_AWD\120_149\GERMAN\PS2_0135.awd",
+    0x9F38BC8960B011AB: r"SB_AGD\120_149\GERMAN\PS2_0139.agd",
+    0x9F408FAFA88A0D8A: r"SB_AGD\180_209\SPANISH\PS2_0197.agd",
+    0x9F4634EE3A51A83C: r"LEVELS\L_3_1\SECTIONS\s_10.rws",
+    0x9F4E35A35D93CFFB: r"SB_AWD\180_209\GERMAN\PS2_0202.awd",
+    0x9F57B42B0AB5BE05: r"SB_AGD\240_269\FRENCH\NGC_0259.agd",
+    0x9F59D01ECB046FC0: r"SB_AGD\30_59\ITALIAN\PS2_0040.agd",
+    0x9F5AF8B5D425B54F: r"SB_AGD\210_239\GERMAN\NGC_0224.agd",
+    0x9F5D72248BB73F4D: r"SB_AWD\240_269\ENGLISH\NGC_0259.awd",
+    0x9F61593FFC3284CD: r"WPNBANK\26_50\wbank_41.bin",
+    0x9F6E2897AD1EC4C0: r"SB_AGD\210_239\GERMAN\XBX_0221.agd",
+    0x9F745FC73F058A08: r"SB_AGD\30_59\SPANISH\PS2_0057.agd",
+    0x9F76D75C9BF1BB6E: r"SB_AGD\60_89\ITALIAN\PS2_0075.agd",
+    0x9F7C88FD06FA0A15: r"LOC\FR\INGAME.LOC",
+    0x9F82C5C613F2BB7F: r"SB_AWD\150_179\SPANISH\XBX_0163.awd",
+    0x9F8CA5D2EA514653: r"SB_AGD\0_29\SPANISH\XBX_0002.agd",
+    0x9F985F68F7DE0C90: r"SB_AGD\0_29\ENGLISH\NGC_0021.agd",
+    0x9F9A7F83FDD1BAA0: r"SB_AGD\0_29\ENGLISH\NGC_0014.agd",
+    0x9F9C2A89153B1D42: r"SB_AGD\0_29\GERMAN\PS2_0028.agd",
+    0x9FA6ADD513794F06: r"SB_AGD\60_89\FRENCH\PS2_0062.agd",
+    0x9FA7DB1F756BA915: r"SB_AWD\240_269\ITALIAN\PS2_0258.awd",
+    0x9FC1DEE7B4F54374: r"SB_AGD\240_269\ENGLISH\XBX_0245.agd",
+    0x9FC586C912D7AB80: r"SB_AGD\120_149\ITALIAN\PS2_0134.agd",
+    0x9FC8FC60B72E32D7: r"SB_AGD\0_29\GERMAN\PS2_0010.agd",
+    0x9FCAB6088DDFB525: r"w_whitepaperBKG.index",
+    0x9FCD059944F00438: r"SB_AGD\90_119\ITALIAN\XBX_0099.agd",
+    0x9FD22051C72856BF: r"SB_AGD\180_209\ENGLISH\XBX_0201.agd",
+    0x9FD553FE0C5EA4C9: r"SB_AGD\210_239\ENGLISH\NGC_0220.agd",
+    0x9FDF5F8732B7BE11: r"SB_AGD\90_119\FRENCH\PS2_0103.agd",
+    0x9FDFF58A7E8766C4: r"SB_AWD\180_209\ENGLISH\XBX_0202.awd",
+    0x9FE1E4B3438F5180: r"SB_AWD\120_149\SPANISH\PS2_0145.awd",
+    0x9FE7E4AEDFDCD85D: r"SB_AGD\180_209\GERMAN\XBX_0184.agd",
+    0x9FF427778707B405: r"SB_AGD\210_239\FRENCH\NGC_0237.agd",
+    0x9FF8B4ADC1189EB0: r"SB_AWD\30_59\GERMAN\NGC_0036.awd",
+    0x9FF9826AFC5CD6A2: r"SB_AGD\90_119\SPANISH\XBX_0105.agd",
+    0x9FF98E39E0671827: r"SB_AWD\0_29\ENGLISH\NGC_0013.awd",
+    0x9FFF8A92E74661B7: r"SB_AGD\210_239\GERMAN\XBX_0235.agd",
+    0xA00F28F09B9DE64F: r"SB_AWD\210_239\FRENCH\PS2_0223.awd",
+    0xA0117772A0B76E03: r"SB_AWD\240_269\SPANISH\NGC_0244.awd",
+    0xA0121EC39F53A37B: r"SB_AWD\150_179\GERMAN\PS2_0179.awd",
+    0xA026A76E460C2D78: r"SB_AGD\60_89\ITALIAN\PS2_0077.agd",
+    0xA02947CF5E9838B3: r"SB_AWD\90_119\GERMAN\NGC_0090.awd",
+    0xA030D4855DF410EE: r"SB_AGD\120_149\ENGLISH\NGC_0120.agd",
+    0xA03D1EBF4BDA0894: r"SB_AWD\90_119\GERMAN\NGC_0109.awd",
+    0xA03D9E6C6F2343E8: r"SB_AWD\90_119\ENGLISH\XBX_0103.awd",
+    0xA04AB3703B91D605: r"SB_AWD\240_269\GERMAN\XBX_0260.awd",
+    0xA0539AF430A73F4D: r"LEVELS\L_1_1_B\global.dff",
+    0xA05F1318AC08E583: r"SB_AWD\210_239\FRENCH\NGC_0213.awd",
+    0xA079091A5F6A1E38: r"SB_AWD\150_179\GERMAN\PS2_0154.awd",
+    0xA07C5B4E3407F5F1: r"SB_AGD\0_29\FRENCH\NGC_0011.agd",
+    0xA083052C0AC07058: r"SB_AWD\120_149\FRENCH\XBX_0146.awd",
+    0xA086991FBA9C813D: r"SB_AWD\0_29\SPANISH\NGC_0015.awd",
+    0xA08942CB6BD8992D: r"SB_AWD\180_209\FRENCH\NGC_0188.awd",
+    0xA08EA047F99C8E35: r"SB_AWD\210_239\GERMAN\XBX_0220.awd",
+    0xA09500D1082D8CB0: r"SB_AWD\240_269\GERMAN\PS2_0240.awd",
+    0xA0A48A41AC6BE9B0: r"SHELL\FONTS\Adler22.met",
+    0xA0B225D968A7E2F9: r"ANIMGRPS\Lvl_26\Lvl_26V.ads",
+    0xA0B2474420A1142A: r"SB_AGD\60_89\FRENCH\NGC_0063.agd",
+    0xA0B8484559A4FA5A: r"SB_AWD\90_119\SPANISH\NGC_0091.awd",
+    0xA0C4DB93C9B396D0: r"SB_AGD\90_119\ITALIAN\NGC_0109.agd",
+    0xA0C5601C38F7EEA5: r"SB_AGD\180_209\GERMAN\NGC_0201.agd",
+    0xA0CD1B8153D904E9: r"SB_AWD\90_119\ENGLISH\XBX_0094.awd",
+    0xA0DC791AEE36C870: r"SB_AGD\180_209\SPANISH\PS2_0209.agd",
+    0xA0DD5902B83310AB: r"LEVELS\L_3_5_C\SECTIONS\s_15.rws",
+    0xA0E0A497080E82F8: r"SB_AGD\120_149\ENGLISH\NGC_0122.agd",
+    0xA0E7B775B2F88EC1: r"SB_AWD\180_209\GERMAN\NGC_0199.awd",
+    0xA0EBD06714307EED: r"SB_AWD\210_239\SPANISH\NGC_0237.awd",
+    0xA0EC4385E1CAC4A9: r"SB_AGD\90_119\SPANISH\NGC_0092.agd",
+    0xA0FA6381E5AC11B7: r"SB_AWD\240_269\GERMAN\XBX_0266.awd",
+    0xA10153496D30ABB9: r"SB_AGD\210_239\GERMAN\PS2_0238.agd",
+    0xA102DC80462ACC61: r"SB_AGD\60_89\ITALIAN\XBX_0084.agd",
+    0xA10F18C4888E4FFB: r"LEVELS\L_1_5\SECTIONS\s_19.rws",
+    0xA1100F5771D57FB5: r"SHELL\FONTS\mfb32.png",
+    0xA113EE8F70C480C3: r"SB_AGD\150_179\ITALIAN\PS2_0159.agd",
+    0xA116795B0397C75D: r"WPNBANK\26_50\wbank_34.bin",
+    0xA11D759DA030FCAD: r"SB_AGD\120_149\ENGLISH\XBX_0125.agd",
+    0xA120A1B3D568A6FB: r"LEVELS\L_3_1\SECTIONS\s_2.rws",
+    0xA1251EBCD1A00F80: r"SB_AWD\60_89\ITALIAN\NGC_0065.awd",
+    0xA129180CE9F9772A: r"SB_AWD\60_89\FRENCH\PS2_0079.awd",
+    0xA12959C9FE1F3A38: r"SB_AGD\240_269\ENGLISH\PS2_0242.agd",
+    0xA12D87A8FE4A7CAE: r"SB_AWD\150_179\FRENCH\PS2_0150.awd",
+    0xA13BFE2276346489: r"SB_AWD\150_179\FRENCH\XBX_0161.awd",
+    0xA14A25AE373B5E21: r"SB_AWD\150_179\FRENCH\PS2_0179.awd",
+    0xA152A63BBDA04AF6: r"SparkSplash.layout",
+    0xA153D7B90BF3CA07: r"AUDIO\FRENCH\PS2_1s1.rws",
+    0xA16041BACC936E43: r"AUDIO\ENGLISH\PS2_2s2.rws",
+    0xA1611755CAB9D3C4: r"SB_AGD\60_89\FRENCH\NGC_0061.agd",
+    0xA17827E5DCC417FC: r"SB_AGD\60_89\ENGLISH\NGC_0087.agd",
+    0xA1909C3A02D70F4E: r"SB_AGD\150_179\SPANISH\XBX_0179.agd",
+    0xA196D661017328C9: r"SB_AWD\120_149\GERMAN\PS2_0137.awd",
+    0xA1AB8A49667E86F0: r"SB_AGD\150_179\FRENCH\XBX_0173.agd",
+    0xA1ACA586CFBF861D: r"SB_AGD\90_119\GERMAN\PS2_0101.agd",
+    0xA1B8481FEA277186: r"SB_AWD\180_209\SPANISH\NGC_0189.awd",
+    0xA1BE57E4B0A7DEE5: r"SB_AWD\180_209\SPANISH\XBX_0197.awd",
+    0xA1C99C7F26714092: r"SB_AGD\120_149\ITALIAN\XBX_0122.agd",
+    0xA1CBB640AFD78743: r"SB_AGD\0_29\ITALIAN\NGC_0022.agd",
+    0xA1CC45AF4A49BBBF: r"SB_AGD\120_149\ENGLISH\XBX_0123.agd",
+    0xA1D216C574F49A4C: r"SB_AWD\180_209\FRENCH\NGC_0206.awd",
+    0xA1D3656CADBCF35B: r"WPNBANK\26_50\wbank_36.bin",
+    0xA1D4C37AF1BAEA78: r"SB_AGD\150_179\ENGLISH\NGC_0179.agd",
+    0xA1DC77BAA8637218: r"SB_AWD\150_179\FRENCH\PS2_0152.awd",
+    0xA1F975BFE154F6B3: r"SB_AWD\150_179\FRENCH\PS2_0177.awd",
+    0xA1FCCF95A95CE7B2: r"SB_AGD\0_29\ENGLISH\NGC_0012.agd",
+    0xA2097DE6BF055590: r"SB_AGD\60_89\FRENCH\PS2_0060.agd",
+    0xA20B9E01C4F903A0: r"SB_AGD\60_89\FRENCH\PS2_0077.agd",
+    0xA21089092AB7A09A: r"LEVELS\MP_4\SECTIONS\s_1.rws",
+    0xA215271465D5339A: r"SB_AGD\0_29\FRENCH\XBX_0025.agd",
+    0xA217FFCEA02F5B38: r"SB_AWD\210_239\SPANISH\XBX_0223.awd",
+    0xA21B1838A61EA456: r"LEVELS\L_3_5\global.dff",
+    0xA2296F9C8002C072: r"w_maps.dds",
+    0xA22BECD54DDEE7B7: r"SB_AGD\90_119\GERMAN\XBX_0108.agd",
+    0xA23B241DC7019756: r"SB_AGD\210_239\ENGLISH\XBX_0229.agd",
+    0xA2458D23CDFFA11F: r"SB_AWD\120_149\ITALIAN\XBX_0141.awd",
+    0xA24A0A1B244FB215: r"SB_AWD\180_209\SPANISH\NGC_0195.awd",
+    0xA250F1633B685926: r"SB_AGD\240_269\ITALIAN\XBX_0261.agd",
+    0xA25A5A5B10974582: r"SB_AGD\150_179\FRENCH\XBX_0175.agd",
+    0xA25AAA2A9FFF88AC: r"SB_AWD\240_269\FRENCH\NGC_0261.awd",
+    0xA25BF59879D91EAF: r"SB_AGD\90_119\GERMAN\PS2_0107.agd",
+    0xA25E0F67E7DEEC60: r"WPNBANK\26_50\wbank_44.bin",
+    0xA25F5B9C80302DD1: r"w_maps.txd",
+    0xA263AD49E68C9336: r"SB_AWD\240_269\GERMAN\XBX_0256.awd",
+    0xA2697E33219415D0: r"LEVELS\MP_1\GodData.dff",
+    0xA26B0DEDB68F1A41: r"SB_AWD\90_119\ENGLISH\NGC_0117.awd",
+    0xA26C84FBC52F1A26: r"SB_AGD\30_59\SPANISH\NGC_0036.agd",
+    0xA26E64AA79BE0AD1: r"LEVELS\L_3_5_B\SECTIONS\s_9.rws",
+    0xA27CD5FF01C2FDAB: r"SB_AWD\60_89\SPANISH\XBX_0082.awd",
+    0xA2A7A9C92118C2BA: r"SB_AWD\240_269\SPANISH\XBX_0265.awd",
+    0xA2AF05B7155D0D8D: r"SB_AGD\120_149\ITALIAN\NGC_0149.agd",
+    0xA2B1CB5191F8A24A: r"SB_AGD\60_89\GERMAN\NGC_0072.agd",
+    0xA2BCC94E17EA00F9: r"SB_AGD\90_119\ITALIAN\PS2_0093.agd",
+    0xA2C6FE8B68205D0E: r"SB_AWD\120_149\ENGLISH\NGC_0120.awd",
+    0xA2C9457C4FC41916: r"SB_AGD\210_239\FRENCH\NGC_0227.agd",
+    0xA2CD0619012A0E45: r"SB_AGD\210_239\ENGLISH\XBX_0235.agd",
+    0xA2CFDAE8F46A69F7: r"SB_AGD\30_59\ENGLISH\XBX_0039.agd",
+    0xA2D98ECB107CED83: r"SB_AWD\240_269\ENGLISH\PS2_0252.awd",
+    0xA2E09F94E0EF65C6: r"AUDIO\ITALIAN\PS2_2s3.rws",
+    0xA2E1153B5C556300: r"SB_AGD\120_149\GERMAN\XBX_0144.agd",
+    0xA2ED4445772162AC: r"SB_AGD\0_29\ITALIAN\NGC_0018.agd",
+    0xA2F0A44F49400B2F: r"ANIMGRPS\Lvl_34\Lvl_34B.ads",
+    0xA2F8FA2CCE68A787: r"SB_AWD\180_209\SPANISH\NGC_0193.awd",
+    0xA30BD1E2901A0F5E: r"SB_AWD\210_239\ITALIAN\PS2_0239.awd",
+    0xA31087F8D4343313: r"ANIMGRPS\Lvl_15\Lvl_15L.ads",
+    0xA31440F280AB27B0: r"SB_AWD\90_119\GERMAN\PS2_0108.awd",
+    0xA3149D402AA4ABDE: r"SB_AGD\120_149\FRENCH\XBX_0131.agd",
+    0xA3150436195A14FB: r"AUDIO\ENGLISH\XBX_1m2.rws",
+    0xA31F4680484C9580: r"SB_AWD\0_29\FRENCH\NGC_0021.awd",
+    0xA329DF21F49C1723: r"SB_AWD\180_209\SPANISH\NGC_0203.awd",
+    0xA332C41F50D1093F: r"SB_AWD\90_119\SPANISH\PS2_0091.awd",
+    0xA3346A5055B90170: r"SB_AGD\150_179\ITALIAN\NGC_0171.agd",
+    0xA342DE61687F33ED: r"SHELL\MOVIES\SPANISH\3_5_Mon.bik",
+    0xA3493EE33934B386: r"SB_AWD\180_209\FRENCH\PS2_0186.awd",
+    0xA34B276850182364: r"LEVELS\MP_6\SECTIONS\s_1.rws",
+    0xA34E839E1A62D0A8: r"SB_AWD\210_239\GERMAN\NGC_0223.awd",
+    0xA34FA2102CA1B61E: r"AUDIO\ITALIAN\XBX_1m3.rws",
+    0xA3518EC1273D2C27: r"SB_AGD\120_149\ITALIAN\XBX_0149.agd",
+    0xA3552927409C6390: r"SB_AGD\30_59\GERMAN\PS2_0059.agd",
+    0xA35B62C3C6E63812: r"SB_AGD\150_179\FRENCH\NGC_0155.agd",
+    0xA36A1C8FE1A8C27D: r"ANIMGRPS\Lvl_15\Lvl_15Z.ads",
+    0xA36FFDCB7A1DA08B: r"SB_AWD\60_89\FRENCH\XBX_0073.awd",
+    0xA37058C781229189: r"SB_AGD\210_239\GERMAN\NGC_0226.agd",
+    0xA373D7FFB80DC415: r"SB_AWD\180_209\SPANISH\XBX_0184.awd",
+    0xA37912C26C6B4738: r"SB_AWD\90_119\ITALIAN\XBX_0099.awd",
+    0xA37BD62AAB42CD57: r"SB_AGD\210_239\ENGLISH\XBX_0233.agd",
+    0xA37E1CDBF34B9675: r"SB_AWD\180_209\SPANISH\PS2_0198.awd",
+    0xA387F2A3A57F656F: r"SB_AWD\30_59\FRENCH\NGC_0042.awd",
+    0xA39610898676CFF6: r"SB_AWD\150_179\ENGLISH\PS2_0176.awd",
+    0xA39783453A6E6E67: r"AUDIO\FRENCH\NGC_4s3.rws",
+    0xA39805D7C0EF61D9: r"SB_AWD\150_179\SPANISH\XBX_0161.awd",
+    0xA39BF3B76C57963B: r"SB_AWD\0_29\FRENCH\PS2_0027.awd",
+    0xA39FF860F359AA89: r"ANIMGRPS\Lvl_34\Lvl_34L.ads",
+    0xA3BF658B5BCD929D: r"SB_AGD\210_239\ENGLISH\PS2_0232.agd",
+    0xA3BFDC0A7E4DD2CD: r"ANIMGRPS\Lvl_15\Lvl_15J.ads",
+    0xA3C36D51D4BD6AE8: r"SB_AGD\120_149\FRENCH\XBX_0133.agd",
+    0xA3C3C25C862383ED: r"SB_AWD\240_269\FRENCH\XBX_0262.awd",
+    0xA3D7D8359C1DB663: r"SB_AGD\90_119\ENGLISH\XBX_0100.agd",
+    0xA3DEE9E6CC7B1933: r"w_borderlarge.index",
+    0xA3E20430FAEA8699: r"SB_AWD\90_119\SPANISH\PS2_0093.awd",
+    0xA3E29245F2360D3D: r"SHELL\FONTS\fb30.met",
+    0xA3E33A61FFD1C002: r"SB_AGD\150_179\ITALIAN\NGC_0177.agd",
+    0xA3EAD46C78AC13F1: r"SHELL\MOVIES\FRENCH\2_2_Mon.bik",
+    0xA3EE3E71AB06DE60: r"NetworkConfig.layout",
+    0xA3EE5BA486BAEB04: r"SB_AWD\90_119\FRENCH\PS2_0119.awd",
+    0xA3F16632173BBFA6: r"SB_AGD\60_89\SPANISH\NGC_0089.agd",
+    0xA3F31781586FD5A8: r"SB_AWD\30_59\ITALIAN\XBX_0043.awd",
+    0xA3F7D4C4F08D2372: r"SB_AWD\120_149\SPANISH\PS2_0143.awd",
+    0xA3F8F21FAE7DA0DA: r"SB_AGD\150_179\GERMAN\PS2_0167.agd",
+    0xA3FA13482BC57D70: r"SB_AGD\180_209\ENGLISH\NGC_0183.agd",
+    0xA3FD34C08CD999EF: r"SB_AGD\180_209\GERMAN\XBX_0182.agd",
+    0xA409F78934054F17: r"SB_AGD\210_239\FRENCH\NGC_0231.agd",
+    0xA418ED64EDF20C26: r"SB_AWD\240_269\GERMAN\XBX_0249.awd",
+    0xA41ECDDD24365FA5: r"SB_AWD\60_89\FRENCH\XBX_0071.awd",
+    0xA4204E08BDF492B1: r"SB_AWD\90_119\ENGLISH\NGC_0104.awd",
+    0xA422C8116226B987: r"SB_AWD\180_209\SPANISH\XBX_0182.awd",
+    0xA42CD02F514EDAEB: r"SB_AGD\180_209\ITALIAN\NGC_0188.agd",
+    0xA435F0059B93F89B: r"SB_AWD\90_119\ENGLISH\XBX_0117.awd",
+    0xA43E19BA11728EF8: r"LEVELS\L_3_1_B\GodData.dff",
+    0xA43E3E63EEF19722: r"SB_AGD\150_179\SPANISH\PS2_0165.agd",
+    0xA4439390CBC56141: r"SB_AWD\210_239\ITALIAN\XBX_0226.awd",
+    0xA443D250EC8A0AF9: r"SB_AWD\120_149\GERMAN\PS2_0124.awd",
+    0xA4486EEAD8479C96: r"w_OptionsBKG.txd",
+    0xA463FDC0D31AE62A: r"SHELL\LOAD\MP_4_TDM.txd",
+    0xA467D097E1993C41: r"SB_AWD\0_29\FRENCH\XBX_0017.awd",
+    0xA46B14D6E68CDB3F: r"LEVELS\L_1_3_B\SECTIONS\s_18.rws",
+    0xA46DEE13708430B2: r"SB_AGD\60_89\FRENCH\PS2_0071.agd",
+    0xA46EB59D05E72B2F: r"SB_AGD\210_239\ENGLISH\PS2_0234.agd",
+    0xA4729939744953BB: r"SHELL\MOVIES\WARN.BIK",
+    0xA47AD51EF1F3D5C2: r"SB_AWD\90_119\GERMAN\XBX_0109.awd",
+    0xA47E62EAD875178D: r"w_OptionsBKG.dds",
+    0xA47EC94C92F7B4BE: r"SB_AWD\0_29\SPANISH\PS2_0000.awd",
+    0xA48A641AE8A55979: r"SB_AGD\150_179\GERMAN\PS2_0177.agd",
+    0xA48ECE8BE978DC7A: r"SB_AWD\30_59\ENGLISH\NGC_0058.awd",
+    0xA49B1DBC397F42CD: r"SB_AGD\210_239\SPANISH\XBX_0222.agd",
+    0xA49C6931679A1CCF: r"SB_AWD\0_29\SPANISH\NGC_0013.awd",
+    0xA4A8E359D5DE3C02: r"SB_AGD\180_209\ENGLISH\NGC_0185.agd",
+    0xA4BB01E97A78E7C3: r"SB_AGD\30_59\FRENCH\PS2_0043.agd",
+    0xA4BD5A38F453DD87: r"SB_AGD\150_179\ENGLISH\PS2_0173.agd",
+    0xA4C2E37E61E675D2: r"SB_AWD\120_149\FRENCH\NGC_0137.awd",
+    0xA4C7ACFC4AE86E0C: r"SB_AGD\90_119\FRENCH\NGC_0114.agd",
+    0xA4D2427434F5C7FC: r"SB_AWD\30_59\FRENCH\XBX_0058.awd",
+    0xA4E8EE6CF6498295: r"SB_AGD\0_29\GERMAN\XBX_0002.agd",
+    0xA4EC05E44803E69D: r"SB_AGD\120_149\GERMAN\NGC_0125.agd",
+    0xA4F1F2D450260A57: r"SB_AWD\150_179\ITALIAN\NGC_0176.awd",
+    0xA4F4DCC2AC6DB71D: r"SB_AGD\0_29\GERMAN\PS2_0027.agd",
+    0xA4F8F279E193BB02: r"LEVELS\L_1_3_B\SECTIONS\s_20.rws",
+    0xA4FD6A1E333433C1: r"AUDIO\SPANISH\XBX_1s2.rws",
+    0xA5050172BE59B593: r"SB_AWD\60_89\FRENCH\NGC_0088.awd",
+    0xA506D942CC5FA7DD: r"SB_AWD\60_89\ENGLISH\XBX_0080.awd",
+    0xA50EBB708FFD05E1: r"SB_AWD\120_149\ITALIAN\NGC_0145.awd",
+    0xA513914B1B9501A1: r"SB_AGD\60_89\GERMAN\NGC_0088.agd",
+    0xA51419B9FB3F8BE8: r"SHELL\MOVIES\2_1_Mon.bik",
+    0xA51A77F2A2B57D62: r"SB_AGD\90_119\FRENCH\NGC_0093.agd",
+    0xA51AA2D357B7BFF1: r"LEVELS\L_1_3_A\SECTIONS\s_8.rws",
+    0xA52D2709860BD2D2: r"SB_AGD\30_59\GERMAN\NGC_0045.agd",
+    0xA52FA82C11843C06: r"SB_AGD\150_179\ENGLISH\PS2_0169.agd",
+    0xA53B0ECE7E9DE172: r"SB_AWD\60_89\ITALIAN\NGC_0063.awd",
+    0xA53FC086F4957C88: r"SB_AGD\120_149\ENGLISH\NGC_0131.agd",
+    0xA547C38B271084B7: r"SB_AGD\240_269\ITALIAN\XBX_0264.agd",
+    0xA54C50A48DDDFBE6: r"SB_AWD\150_179\ENGLISH\PS2_0169.awd",
+    0xA553E83DDD4FAD4A: r"SB_AWD\60_89\SPANISH\XBX_0076.awd",
+    0xA55759EA86E91A03: r"LEVELS\L_2_2_B\SECTIONS\s_1.rws",
+    0xA5599F71D2334227: r"SB_AWD\240_269\GERMAN\XBX_0253.awd",
+    0xA5635723B0D745B7: r"SB_AGD\30_59\SPANISH\NGC_0033.agd",
+    0xA56D09146597D1B5: r"LEVELS\L_3_5_C\SECTIONS\s_17.rws",
+    0xA56F23CB15CA6FF0: r"SB_AGD\240_269\ITALIAN\NGC_0250.agd",
+    0xA580A0FAD0E6D71A: r"SB_AWD\60_89\SPANISH\NGC_0085.awd",
+    0xA584D0A0C4F949E9: r"SB_AWD\180_209\ENGLISH\NGC_0191.awd",
+    0xA58975B9EAA7E7C8: r"SB_AGD\240_269\ENGLISH\PS2_0251.agd",
+    0xA58C01693D5311AA: r"SB_AGD\210_239\GERMAN\PS2_0211.agd",
+    0xA58D07F789C01ABE: r"SB_AGD\60_89\ENGLISH\NGC_0089.agd",
+    0xA5965AEF50CC7826: r"SB_AGD\30_59\FRENCH\XBX_0041.agd",
+    0xA59B55F5F21D7F2F: r"SB_AGD\120_149\GERMAN\NGC_0123.agd",
+    0xA59BA289B0119A1E: r"ScoreBoardContinueOption.layout",
+    0xA5A07833786049D6: r"SHELL\FEND\INSTANCE\SKY\LEGAL.TXD",
+    0xA5A40028CD03F926: r"SB_AWD\90_119\FRENCH\PS2_0092.awd",
+    0xA5A42CD456874FAF: r"SB_AGD\0_29\GERMAN\PS2_0021.agd",
+    0xA5A4FD727E12C591: r"SB_AWD\90_119\ITALIAN\XBX_0106.awd",
+    0xA5A911989F253846: r"SB_AGD\60_89\SPANISH\XBX_0083.agd",
+    0xA5A9CE8D78AFF131: r"SB_AWD\30_59\ENGLISH\XBX_0051.awd",
+    0xA5ADA322D54CB444: r"SB_AWD\150_179\ENGLISH\NGC_0157.awd",
+    0xA5AE123AB5E2E36A: r"SB_AGD\150_179\GERMAN\PS2_0152.agd",
+    0xA5C6BC7C3D9BBE5B: r"SB_AGD\180_209\ITALIAN\XBX_0186.agd",
+    0xA5C9E0713C55B2F2: r"SB_AGD\60_89\ENGLISH\NGC_0078.agd",
+    0xA5CD15141E2B9F2B: r"SB_AGD\150_179\ENGLISH\NGC_0161.agd",
+    0xA5D44DF82B9C45D5: r"SB_AWD\60_89\FRENCH\XBX_0066.awd",
+    0xA5DE01B12B370A39: r"SB_AGD\150_179\GERMAN\NGC_0161.agd",
+    0xA5E89B0FAD626144: r"SB_AGD\240_269\SPANISH\PS2_0268.agd",
+    0xA5EAF2B5510BBD09: r"SB_AWD\30_59\FRENCH\NGC_0040.awd",
+    0xA5EF0EC194824411: r"SB_AGD\180_209\SPANISH\XBX_0193.agd",
+    0xA5FF434B42C636B9: r"SB_AWD\60_89\GERMAN\NGC_0071.awd",
+    0xA6082274A9A6F521: r"SB_AGD\180_209\SPANISH\NGC_0191.agd",
+    0xA612B0584BBBB3E4: r"SB_AWD\30_59\FRENCH\NGC_0038.awd",
+    0xA61D10B2E8FEB4B1: r"SB_AWD\0_29\FRENCH\XBX_0004.awd",
+    0xA61DF3DCBFE32E82: r"SB_AGD\240_269\ITALIAN\NGC_0256.agd",
+    0xA63449679A5D9AEE: r"SB_AWD\0_29\SPANISH\PS2_0013.awd",
+    0xA6376CFFFB23DA85: r"SB_AGD\180_209\GERMAN\PS2_0183.agd",
+    0xA637D5C1549DBDD7: r"SB_AWD\60_89\FRENCH\NGC_0079.awd",
+    0xA638F769CFDA499D: r"SB_AGD\180_209\SPANISH\NGC_0201.agd",
+    0xA63AD17AE76BD144: r"SB_AGD\210_239\GERMAN\PS2_0213.agd",
+    0xA6474B7AE86AD313: r"SB_AGD\0_29\FRENCH\NGC_0000.agd",
+    0xA64F6CFFDA5274E6: r"SB_AGD\180_209\ITALIAN\PS2_0188.agd",
+    0xA660D1D23D2EDA3F: r"SB_AWD\90_119\ENGLISH\PS2_0099.awd",
+    0xA664448CE265DC18: r"SB_AGD\30_59\GERMAN\XBX_0030.agd",
+    0xA664769E62D3D53B: r"SB_AWD\0_29\ENGLISH\XBX_0002.awd",
+    0xA66732F963DBC2AC: r"SB_AWD\30_59\SPANISH\XBX_0047.awd",
+    0xA668E2D73E9525AC: r"SB_AGD\180_209\GERMAN\NGC_0198.agd",
+    0xA66A873D804E1C6D: r"SB_AWD\90_119\GERMAN\XBX_0111.awd",
+    0xA6758C8DE7B47D75: r"SB_AGD\180_209\ITALIAN\XBX_0184.agd",
+    0xA67604BFAD51C3B9: r"SB_AWD\90_119\GERMAN\PS2_0097.awd",
+    0xA67B7516E5DD71FB: r"SB_AWD\240_269\FRENCH\PS2_0252.awd",
+    0xA68A406E7D4CD655: r"SB_AGD\120_149\FRENCH\NGC_0141.agd",
+    0xA68B9762811BEB6A: r"SB_AGD\150_179\FRENCH\NGC_0164.agd",
+    0xA68D02B1721F31E7: r"SB_AWD\150_179\ENGLISH\PS2_0173.awd",
+    0xA68EEDFA8EC9B693: r"SB_AGD\210_239\FRENCH\XBX_0211.agd",
+    0xA69498842495563C: r"SB_AGD\150_179\ITALIAN\PS2_0170.agd",
+    0xA698C017471FFF35: r"SB_AWD\90_119\ENGLISH\XBX_0115.awd",
+    0xA6A0991AD81D0484: r"LEVELS\MP_4\SECTIONS\s_3.rws",
+    0xA6A51F756C81A00A: r"SB_AWD\150_179\GERMAN\XBX_0168.awd",
+    0xA6B10F3EE669C19C: r"SB_AGD\180_209\ITALIAN\XBX_0202.agd",
+    0xA6BD99DACE169434: r"SB_AWD\240_269\SPANISH\XBX_0267.awd",
+    0xA6C19169A67F4E86: r"SB_AWD\120_149\ITALIAN\NGC_0120.awd",
+    0xA6CC60F522EC03F8: r"SB_AWD\0_29\ENGLISH\XBX_0023.awd",
+    0xA6DEE61E8BBAB9E4: r"SB_AWD\120_149\ENGLISH\PS2_0149.awd",
+    0xA6E338BF22A5C9F9: r"ANIMGRPS\Lvl_32\Lvl_32H.ads",
+    0xA6E3FB662F8221DD: r"SB_AGD\180_209\SPANISH\PS2_0200.agd",
+    0xA6E8477B79F3E22F: r"SB_AGD\180_209\SPANISH\NGC_0207.agd",
+    0xA6ECD8B1AD9DBCE2: r"SB_AGD\90_119\GERMAN\NGC_0103.agd",
+    0xA6EF162C6072D03B: r"SB_AWD\0_29\GERMAN\PS2_0003.awd",
+    0xA6F0E56D15DFF3CA: r"SB_AGD\90_119\GERMAN\NGC_0095.agd",
+    0xA6F388399E5B7BD4: r"SB_AWD\60_89\FRENCH\PS2_0086.awd",
+    0xA6F5BF2CF5C2C546: r"SB_AGD\120_149\SPANISH\XBX_0144.agd",
+    0xA6F918BA976749BE: r"SB_AGD\180_209\GERMAN\XBX_0204.agd",
+    0xA700623F358433B9: r"SB_AGD\0_29\FRENCH\PS2_0029.agd",
+    0xA700E1F520F06BEB: r"SB_AGD\30_59\ENGLISH\PS2_0043.agd",
+    0xA709E858E4B66C7A: r"SB_AWD\60_89\SPANISH\XBX_0061.awd",
+    0xA7131F220FD24DE2: r"SB_AWD\30_59\ENGLISH\PS2_0037.awd",
+    0xA72498387D0FB184: r"SB_AWD\150_179\ITALIAN\XBX_0168.awd",
+    0xA7280963AAC2D64A: r"SB_AWD\120_149\SPANISH\PS2_0132.awd",
+    0xA7353691F54A6772: r"SB_AWD\0_29\FRENCH\NGC_0027.awd",
+    0xA73A108027674867: r"SB_AGD\120_149\FRENCH\NGC_0147.agd",
+    0xA73DD12F0DCF9E52: r"SB_AGD\180_209\FRENCH\XBX_0192.agd",
+    0xA740AF14D233EE6A: r"SB_AGD\150_179\FRENCH\XBX_0157.agd",
+    0xA746D53746D3865B: r"SB_AWD\210_239\GERMAN\NGC_0237.awd",
+    0xA74C7B0A58336DB6: r"SB_AGD\30_59\FRENCH\XBX_0034.agd",
+    0xA75361B43A9BD47D: r"SB_AGD\0_29\ENGLISH\NGC_0028.agd",
+    0xA76946F071B2F63E: r"SB_AGD\150_179\SPANISH\NGC_0160.agd",
+    0xA774CD5A88AC8E6A: r"ANIMGRPS\Lvl_21\Lvl_21G.ads",
+    0xA778020753FD2B15: r"SB_AGD\0_29\ENGLISH\PS2_0010.agd",
+    0xA7791C4171F537C3: r"SB_AGD\60_89\GERMAN\PS2_0069.agd",
+    0xA7854B607A7D4119: r"SB_AWD\120_149\FRENCH\PS2_0139.awd",
+    0xA785ABF98EA30F07: r"AUDIO\FRENCH\PS2_4m2.rws",
+    0xA7877B634546DF22: r"SB_AWD\240_269\ITALIAN\XBX_0265.awd",
+    0xA78901E55AC06616: r"SB_AWD\30_59\GERMAN\PS2_0048.awd",
+    0xA794371278907DDA: r"SB_AWD\60_89\ENGLISH\XBX_0069.awd",
+    0xA7948B55C51A035D: r"SB_AWD\0_29\ITALIAN\XBX_0000.awd",
+    0xA7B8042947ECFCBA: r"LEVELS\L_1_3_A\SECTIONS\s_23.rws",
+    0xA7B8D86A8ECF61F4: r"SB_AWD\60_89\SPANISH\XBX_0063.awd",
+    0xA7D413F7C74A2412: r"SB_AGD\240_269\ITALIAN\NGC_0241.agd",
+    0xA7DA7E5401F9BBEE: r"SB_AWD\90_119\ITALIAN\NGC_0110.awd",
+    0xA7DAD168E1B37B6C: r"SB_AGD\120_149\ENGLISH\PS2_0127.agd",
+    0xA7EB691A84E08B5B: r"SB_AWD\30_59\ITALIAN\XBX_0057.awd",
+    0xA7EFB402C825604C: r"SB_AWD\210_239\ENGLISH\PS2_0220.awd",
+    0xA7EFC0A339C201ED: r"SB_AWD\120_149\ENGLISH\XBX_0125.awd",
+    0xA7F142A1912BE4ED: r"SB_AGD\240_269\FRENCH\XBX_0248.agd",
+    0xA7F8027395AD15F6: r"SB_AGD\90_119\ENGLISH\NGC_0110.agd",
+    0xA7F8F7082D2C102C: r"SB_AWD\150_179\FRENCH\NGC_0157.awd",
+    0xA7F901F77166296A: r"SB_AWD\120_149\SPANISH\NGC_0124.awd",
+    0xA7FBCB1C024D06C0: r"SB_AGD\30_59\FRENCH\XBX_0036.agd",
+    0xA80095E68423E8AD: r"LEVELS\MP_1\SECTIONS\s_1.rws",
+    0xA80AE1AA4AAF8BD0: r"SB_AGD\60_89\SPANISH\XBX_0081.agd",
+    0xA81D8635DE1BCC88: r"SB_AGD\180_209\FRENCH\XBX_0200.agd",
+    0xA826643F1D8644C9: r"ANIMGRPS\Lvl_23\Lvl_23P.ads",
+    0xA8273356E7D32F71: r"AUDIO\FRENCH\NGC_4s1.rws",
+    0xA82B6B6BADC7A15D: r"ANIMGRPS\Lvl_36\Lvl_36D.ads",
+    0xA8305200E2B6696E: r"SB_AWD\210_239\ITALIAN\XBX_0236.awd",
+    0xA832835F3A16E63C: r"SB_AWD\210_239\ENGLISH\XBX_0230.awd",
+    0xA84996C0C33F77E0: r"SB_AGD\120_149\SPANISH\PS2_0123.agd",
+    0xA84C46F680BE3C4B: r"SB_AWD\240_269\SPANISH\NGC_0266.awd",
+    0xA84D1190886C3FFC: r"SB_AWD\120_149\ITALIAN\PS2_0149.awd",
+    0xA84D468BA6CF0A3E: r"LEVELS\L_1_5\SECTIONS\s_21.rws",
+    0xA866B4C5FC3132DB: r"SB_AGD\120_149\SPANISH\PS2_0146.agd",
+    0xA8773D95ACD8673D: r"SB_AWD\150_179\GERMAN\XBX_0156.awd",
+    0xA877F829E146378F: r"SB_AGD\240_269\ITALIAN\XBX_0255.agd",
+    0xA87B79AD7934F32D: r"SB_AGD\30_59\GERMAN\NGC_0055.agd",
+    0xA87FDDDF0C715DBD: r"SB_AGD\90_119\ITALIAN\NGC_0100.agd",
+    0xA88620E472FF0EC1: r"SB_AWD\120_149\ITALIAN\XBX_0121.awd",
+    0xA88D2D173C74A3B7: r"SB_AGD\30_59\FRENCH\XBX_0044.agd",
+    0xA899E29C8C0FB3CB: r"SB_AWD\210_239\FRENCH\NGC_0235.awd",
+    0xA89AAA46393F132C: r"SB_AGD\60_89\GERMAN\PS2_0075.agd",
+    0xA8A832091B7F8B24: r"SB_AWD\120_149\SPANISH\NGC_0126.awd",
+    0xA8B1E1C06CD27E3B: r"SB_AGD\210_239\SPANISH\PS2_0227.agd",
+    0xA8B8B59C35ED1DC4: r"LEVELS\L_3_5\SECTIONS\s_29.rws",
+    0xA8BDB4AFEAC707C0: r"SB_AWD\120_149\FRENCH\XBX_0124.awd",
+    0xA8CD38FAD8E2802E: r"SB_AGD\90_119\GERMAN\PS2_0090.agd",
+    0xA8D424EFCC07EC2B: r"SB_AWD\210_239\ENGLISH\NGC_0213.awd",
+    0xA8D7F26B499ADC2F: r"LEVELS\MP_2\GodData.dff",
+    0xA8E247DD0EE96EF8: r"LEVELS\MP_4\global.dff",
+    0xA8EA36ACFCAF7322: r"SB_AWD\0_29\FRENCH\NGC_0012.awd",
+    0xA8FDBE7EA3456AA7: r"SB_AGD\0_29\GERMAN\XBX_0004.agd",
+    0xA8FEF95B14F8EF39: r"ANIMGRPS\Lvl_12\Lvl_12L.ads",
+    0xA905E8345EA905D8: r"SB_AGD\60_89\SPANISH\PS2_0060.agd",
+    0xA90C80A3F250C7B0: r"SB_AGD\240_269\GERMAN\PS2_0240.agd",
+    0xA90C8B04C3E03F96: r"SB_AGD\180_209\GERMAN\PS2_0193.agd",
+    0xA912AA000DF7B75E: r"SB_AGD\240_269\SPANISH\XBX_0261.agd",
+    0xA91584D7A649F1F5: r"SB_AGD\120_149\SPANISH\PS2_0144.agd",
+    0xA91FEA24F3678260: r"SB_AGD\30_59\ITALIAN\NGC_0056.agd",
+    0xA91FFAD5673690A6: r"SB_AWD\240_269\ITALIAN\NGC_0252.awd",
+    0xA925FBC0913F08C7: r"LOC\SP\PAUSED.LOC",
+    0xA927583B8B5FEBC9: r"SB_AGD\240_269\ITALIAN\XBX_0257.agd",
+    0xA92A49BF234DB23F: r"SB_AGD\30_59\GERMAN\NGC_0053.agd",
+    0xA92BD8C28443CCB4: r"WeaponSelect.layout",
+    0xA93070CFA7301582: r"LEVELS\L_2_1\SECTIONS\s_8.rws",
+    0xA93BEC9B97045ADD: r"SB_AGD\150_179\ITALIAN\NGC_0178.agd",
+    0xA9578F3EA14D18D0: r"SB_AGD\120_149\SPANISH\XBX_0146.agd",
+    0xA95BC3BAC58CFC12: r"SB_AWD\180_209\GERMAN\PS2_0207.awd",
+    0xA96CA4C194DFFCB2: r"SB_AWD\120_149\FRENCH\XBX_0122.awd",
+    0xA98F39937A14EFAA: r"SB_AWD\210_239\FRENCH\XBX_0232.awd",
+    0xA9A03EB365746F7A: r"SB_AGD\210_239\ITALIAN\NGC_0216.agd",
+    0xA9A8A548F25DD9F5: r"SB_AWD\210_239\GERMAN\NGC_0235.awd",
+    0xA9AE2D2472EBC57D: r"SB_AWD\0_29\GERMAN\XBX_0020.awd",
+    0xA9AE35B7E7E539D8: r"SB_AGD\30_59\ITALIAN\XBX_0036.agd",
+    0xA9B7F51603241810: r"SB_AWD\210_239\ITALIAN\NGC_0236.awd",
+    0xA9B9503A7A00BAB0: r"SB_AWD\90_119\FRENCH\PS2_0090.awd",
+    0xA9C15D7BD00CC9BC: r"SB_AWD\90_119\FRENCH\XBX_0116.awd",
+    0xA9C17A11B8107668: r"SB_AGD\240_269\SPANISH\XBX_0263.agd",
+    0xA9C3E24C62E07E04: r"SB_AGD\150_179\GERMAN\PS2_0150.agd",
+    0xA9C4803201C31D7D: r"SB_AGD\60_89\FRENCH\PS2_0069.agd",
+    0xA9E97139DB758FC7: r"SB_AGD\120_149\SPANISH\XBX_0134.agd",
+    0xA9EA3E09D89A1747: r"SB_AWD\60_89\FRENCH\XBX_0060.awd",
+    0xA9F447366BBD6ACE: r"SB_AWD\60_89\ITALIAN\NGC_0081.awd",
+    0xA9F562BD9C92D2D3: r"SB_AWD\60_89\GERMAN\XBX_0080.awd",
+    0xAA0235B73CF7E434: r"LEVELS\L_3_5\SECTIONS\s_14.rws",
+    0xAA08AA58F7BEC1A2: r"ANIMGRPS\Lvl_13\Lvl_13A.ads",
+    0xAA0B9E061614BA6D: r"SB_AWD\180_209\GERMAN\XBX_0197.awd",
+    0xAA196ED78E4AB4FA: r"SB_AGD\150_179\SPANISH\PS2_0154.agd",
+    0xAA29E879D22469A0: r"SB_AGD\180_209\FRENCH\NGC_0202.agd",
+    0xAA2A9272D2E8D979: r"SB_AWD\60_89\SPANISH\PS2_0065.awd",
+    0xAA322D03B373837B: r"SB_AWD\30_59\ENGLISH\PS2_0054.awd",
+    0xAA33AAE64BDD6C2D: r"ANIMGRPS\Lvl_36\Lvl_36T.ads",
+    0xAA4381CED16D9A52: r"SB_AWD\0_29\FRENCH\PS2_0022.awd",
+    0xAA4A3979475B6C58: r"SB_AWD\0_29\SPANISH\PS2_0011.awd",
+    0xAA4D392C306ADEF5: r"SB_AWD\30_59\ITALIAN\XBX_0055.awd",
+    0xAA4D3D11A8217597: r"SB_AGD\180_209\GERMAN\PS2_0185.agd",
+    0xAA50469D52091B58: r"LEVELS\L_1_5\SECTIONS\s_23.rws",
+    0xAA5CFD361D04840F: r"SB_AWD\0_29\GERMAN\XBX_0026.awd",
+    0xAA5E33653FB2A464: r"AUDIO\GERMAN\XBX_1m3.rws",
+    0xAA5E722422E6B714: r"SB_AWD\120_149\SPANISH\NGC_0135.awd",
+    0xAA647A37E294D98C: r"SB_AWD\120_149\ENGLISH\PS2_0138.awd",
+    0xAA7BF30B10D78F8E: r"SB_AWD\30_59\SPANISH\XBX_0049.awd",
+    0xAA83E32CE62E9225: r"SB_AWD\210_239\ITALIAN\NGC_0219.awd",
+    0xAA8E477D5953BC57: r"ANIMGRPS\Lvl_36\Lvl_36F.ads",
+    0xAA8ED9B29F71C183: r"SB_AGD\180_209\FRENCH\NGC_0199.agd",
+    0xAAA167742E198604: r"SB_AGD\150_179\FRENCH\NGC_0166.agd",
+    0xAAABE6D26ECAA4F2: r"SB_AGD\120_149\SPANISH\PS2_0125.agd",
+    0xAAB639EFF0E317FD: r"SHELL\MOVIES\FRENCH\Act_3.bik",
+    0xAAB8B001FF7E457A: r"SB_AWD\240_269\ITALIAN\XBX_0254.awd",
+    0xAAE306F7F5F71927: r"ANIMGRPS\Lvl_36\Lvl_36V.ads",
+    0xAAF597EA1AFFD457: r"SHELL\FEND\INSTANCE\SKY\F_FEND.TXD",
+    0xAAF91E7E7C293EC4: r"SB_AWD\210_239\SPANISH\NGC_0232.awd",
+    0xAAF94B77DC7EE36F: r"SB_AGD\180_209\SPANISH\PS2_0206.agd",
+    0xAAF9EB61293FAFFB: r"SB_AGD\30_59\ITALIAN\XBX_0057.agd",
+    0xAB05CFE8E1E09F50: r"SB_AWD\60_89\GERMAN\PS2_0062.awd",
+    0xAB06C5A0953D343A: r"SB_AWD\180_209\ITALIAN\PS2_0207.awd",
+    0xAB086F577856878A: r"SB_AWD\180_209\ENGLISH\XBX_0183.awd",
+    0xAB0FCA97AE22E898: r"SB_AGD\60_89\ITALIAN\XBX_0089.agd",
+    0xAB102B72835A2B7D: r"SB_AGD\30_59\GERMAN\PS2_0050.agd",
+    0xAB1B2E6F15B5881A: r"SB_AGD\150_179\GERMAN\XBX_0151.agd",
+    0xAB2ADE67617BEE6C: r"SB_AWD\150_179\GERMAN\NGC_0168.awd",
+    0xAB3EBAE1E782F9BF: r"SB_AGD\90_119\GERMAN\NGC_0119.agd",
+    0xAB4D10868C7897FB: r"LEVELS\L_3_4\SECTIONS\s_1.rws",
+    0xAB567F267F318904: r"SB_AGD\150_179\FRENCH\XBX_0155.agd",
+    0xAB666ADE5C8C1FD2: r"ANIMGRPS\Lvl_13\Lvl_13Q.ads",
+    0xAB671843754DB500: r"SB_AWD\60_89\SPANISH\NGC_0076.awd",
+    0xAB67A013A9973AF4: r"SB_AWD\240_269\ITALIAN\XBX_0256.awd",
+    0xAB75C4858925A4D6: r"SB_AGD\30_59\SPANISH\XBX_0041.agd",
+    0xAB76A6165715C95D: r"SB_AGD\240_269\ITALIAN\NGC_0259.agd",
+    0xAB78AD6FE68EBD37: r"codfontsymbolslarge.txd",
+    0xAB78CA6FE68EEEFB: r"codfontsymbolslarge.tga",
+    0xAB7CFF382D0137B8: r"SB_AWD\60_89\ENGLISH\NGC_0076.awd",
+    0xAB7EB6CD278E1297: r"SB_AWD\60_89\ITALIAN\PS2_0085.awd",
+    0xAB823A369EF2AF72: r"SB_AGD\30_59\ITALIAN\NGC_0050.agd",
+    0xAB893F2264349CAC: r"SB_AGD\240_269\ENGLISH\NGC_0254.agd",
+    0xAB8CD21900F91327: r"SB_AGD\0_29\ENGLISH\PS2_0016.agd",
+    0xAB99E152B27E4029: r"SB_AWD\180_209\ENGLISH\XBX_0193.awd",
+    0xABADEE59A9C5246C: r"SB_AGD\240_269\ENGLISH\XBX_0267.agd",
+    0xABAEA96FE6BC4644: r"codfontsymbolslarge.dds",
+    0xABB067B766BB9DEC: r"SB_AGD\180_209\FRENCH\NGC_0185.agd",
+    0xABBB7F6280ABA8D8: r"SB_AGD\60_89\GERMAN\NGC_0085.agd",
+    0xABC72BCCF604FEC0: r"SB_AWD\240_269\GERMAN\NGC_0252.awd",
+    0xABDA9E790B96454E: r"SB_AWD\150_179\GERMAN\NGC_0166.awd",
+    0xABE7083849590ECA: r"AUDIO\FRENCH\XBX_1s1.rws",
+    0xABF06E65AEF78D58: r"SB_AWD\90_119\ITALIAN\NGC_0112.awd",
+    0xABF75BCE8D905C5C: r"ANIMGRPS\Lvl_24\Lvl_24K.ads",
+    0xABFBAD4F6027DA51: r"SB_AWD\90_119\FRENCH\PS2_0103.awd",
+    0xABFE422962184283: r"LEVELS\L_1_1_B\SECTIONS\s_5.rws",
+    0xAC00F7D43E8327F0: r"ANIMGRPS\Lvl_25\Lvl_25M.ads",
+    0xAC058B03DC71C836: r"SB_AWD\150_179\ENGLISH\XBX_0153.awd",
+    0xAC0D1590A13DCA11: r"LEVELS\L_3_5_C\SECTIONS\s_2.rws",
+    0xAC0D528542A9D700: r"SB_AGD\90_119\ENGLISH\NGC_0112.agd",
+    0xAC0DB719DA27DD0E: r"SB_AWD\150_179\FRENCH\NGC_0159.awd",
+    0xAC133D51246BB07F: r"SB_AWD\0_29\GERMAN\XBX_0013.awd",
+    0xAC13688DA31560B6: r"SB_AGD\180_209\FRENCH\PS2_0205.agd",
+    0xAC19DD2C8EB47880: r"SB_AGD\180_209\ITALIAN\PS2_0199.agd",
+    0xAC1A2527AEAF0F42: r"SB_AWD\210_239\ITALIAN\NGC_0230.awd",
+    0xAC1DC20AB613B34B: r"SB_AWD\0_29\SPANISH\XBX_0020.awd",
+    0xAC28C63E2D73BBEE: r"SB_AGD\60_89\ENGLISH\PS2_0080.agd",
+    0xAC32FF47AE0D4D1F: r"SB_AGD\0_29\SPANISH\NGC_0026.agd",
+    0xAC4642128FB43AD8: r"SB_AWD\210_239\ITALIAN\XBX_0234.awd",
+    0xAC46B976608157CD: r"SB_AGD\120_149\SPANISH\PS2_0135.agd",
+    0xAC52E1B78CCB507A: r"SB_AGD\210_239\ITALIAN\PS2_0222.agd",
+    0xAC582F6A6B320BA7: r"SB_AWD\90_119\ITALIAN\PS2_0099.awd",
+    0xAC5B58ADE5F53D68: r"SB_AGD\210_239\SPANISH\NGC_0218.agd",
+    0xAC611B3364D711BC: r"SB_AWD\120_149\GERMAN\NGC_0137.awd",
+    0xAC6217082DBBD765: r"SB_AWD\240_269\SPANISH\NGC_0264.awd",
+    0xAC677784E5334B0C: r"SB_AGD\210_239\FRENCH\XBX_0227.agd",
+    0xAC6BDC67FE9873E4: r"SB_AGD\120_149\FRENCH\PS2_0138.agd",
+    0xAC700FA220E47DB4: r"SB_AWD\150_179\GERMAN\XBX_0179.awd",
+    0xAC7595F831726A77: r"LEVELS\MP_1\SECTIONS\s_7.rws",
+    0xAC761BDEA01DF3B2: r"SB_AWD\240_269\GERMAN\NGC_0254.awd",
+    0xAC88CB8DF9B824AC: r"ANIMGRPS\Lvl_11\Lvl_11G.ads",
+    0xAC8C388B7DAF96B2: r"SB_AGD\180_209\FRENCH\NGC_0204.agd",
+    0xAC8D0DA759D602CF: r"SB_AWD\150_179\GERMAN\XBX_0150.awd",
+    0xAC8D9A8470D7963E: r"SB_AWD\120_149\ENGLISH\NGC_0142.awd",
+    0xAC8DE8CB8C7D01CD: r"SB_AWD\0_29\FRENCH\NGC_0028.awd",
+    0xAC953417B1C5DFB0: r"SB_AGD\210_239\FRENCH\PS2_0233.agd",
+    0xAC9BE6913B031CD8: r"SB_AGD\240_269\SPANISH\NGC_0250.agd",
+    0xACAFA6B559E93EFB: r"LEVELS\L_3_4\SECTIONS\s_12.rws",
+    0xACAFB2AE390D4EE5: r"SB_AWD\210_239\FRENCH\NGC_0237.awd",
+    0xACB62C1FD32AB4DF: r"SB_AGD\240_269\ITALIAN\PS2_0256.agd",
+    0xACC2B89F4D2EF9C0: r"SB_AGD\180_209\FRENCH\PS2_0207.agd",
+    0xACD17AD71A91FDA1: r"SB_AGD\0_29\GERMAN\NGC_0000.agd",
+    0xACD1A13D047DBEEF: r"SB_AWD\180_209\SPANISH\PS2_0185.awd",
+    0xACD54C44C994FA46: r"SB_AGD\150_179\ITALIAN\PS2_0150.agd",
+    0xACD8964FD78E2DF8: r"SB_AGD\60_89\ENGLISH\PS2_0082.agd",
+    0xACE2090C85DE6838: r"SB_AGD\90_119\GERMAN\PS2_0092.agd",
+    0xACE61704B05DA4F1: r"SB_AGD\90_119\ENGLISH\PS2_0101.agd",
+    0xACE89A9B74CCE35A: r"SB_AGD\0_29\GERMAN\PS2_0019.agd",
+    0xACF61BE101D994A6: r"SB_AGD\0_29\ENGLISH\PS2_0026.agd",
+    0xACF8CDF49D9D8B6A: r"SB_AGD\90_119\ENGLISH\PS2_0098.agd",
+    0xACFF20779BA449DA: r"SB_AWD\60_89\SPANISH\PS2_0071.awd",
+    0xAD094A7C984D6D2B: r"SB_AGD\60_89\ITALIAN\NGC_0075.agd",
+    0xAD0C04B5C7E9D952: r"SB_AWD\0_29\ENGLISH\XBX_0007.awd",
+    0xAD153A83CE942839: r"ANIMGRPS\Lvl_31\Lvl_31Z.ads",
+    0xAD1A7139AEE1EAEA: r"SB_AGD\60_89\ITALIAN\NGC_0085.agd",
+    0xAD2250B59F4E6342: r"SB_AGD\240_269\GERMAN\PS2_0246.agd",
+    0xAD232E71C5AFBAE2: r"AUDIO\GERMAN\NGC_2s2.rws",
+    0xAD352272C9FEFE36: r"SB_AWD\120_149\GERMAN\XBX_0146.awd",
+    0xAD354AE714335230: r"SB_AWD\240_269\ITALIAN\NGC_0250.awd",
+    0xAD4A21B366A1709C: r"SB_AGD\210_239\ENGLISH\NGC_0229.agd",
+    0xAD50C09837B3D305: r"LEVELS\L_3_4\SECTIONS\s_3.rws",
+    0xAD5412120F237A10: r"SB_AWD\30_59\GERMAN\PS2_0059.awd",
+    0xAD5EA904480E2027: r"AUDIO\ENGLISH\NGC_4s3.rws",
+    0xAD67FFFA8D6B9582: r"SB_AWD\60_89\GERMAN\PS2_0064.awd",
+    0xAD72A17463B93692: r"SB_AGD\90_119\ITALIAN\PS2_0115.agd",
+    0xAD76696BDD234F0A: r"SB_AWD\240_269\ITALIAN\PS2_0257.awd",
+    0xAD8E64B0787850B8: r"LEVELS\L_3_1\SECTIONS\s_21.rws",
+    0xAD9505F1895B55A8: r"LEVELS\L_1_2\SECTIONS\s_19.rws",
+    0xAD9553A5EF07AB6D: r"LEVELS\L_2_1_B\CLUMPS\cbank_01.bin",
+    0xAD96A443C588D452: r"SB_AWD\0_29\GERMAN\PS2_0006.awd",
+    0xAD9E2584B8DB2036: r"SB_AWD\90_119\GERMAN\NGC_0099.awd",
+    0xAD9FD0A0087F95ED: r"SB_AGD\60_89\ITALIAN\XBX_0066.agd",
+    0xADA469A527117B64: r"SB_AWD\210_239\FRENCH\XBX_0230.awd",
+    0xADA687511455EE8B: r"SB_AGD\30_59\ITALIAN\XBX_0048.agd",
+    0xADA8500C860638A2: r"SB_AGD\30_59\ENGLISH\PS2_0046.agd",
+    0xADAB9C76E6D90A9F: r"WPNBANK\0_25\wbank_16.bin",
+    0xADB58EC512713094: r"SB_AGD\210_239\ITALIAN\NGC_0214.agd",
+    0xADB745B2A4A68E3B: r"SB_AGD\0_29\ITALIAN\NGC_0000.agd",
+    0xADB79472AC94E639: r"SB_AGD\240_269\FRENCH\NGC_0268.agd",
+    0xADB9CBA20FD5B4F0: r"SB_AGD\90_119\FRENCH\XBX_0112.agd",
+    0xADBACB1EE3D74126: r"SB_AWD\150_179\ENGLISH\XBX_0166.awd",
+    0xADBCB26C2D955721: r"SB_AWD\240_269\ENGLISH\NGC_0268.awd",
+    0xADBD58515657D77B: r"SB_AWD\0_29\ENGLISH\PS2_0012.awd",
+    0xADCDC0DC3E56D45F: r"SB_AGD\0_29\SPANISH\PS2_0016.agd",
+    0xADD11073EE1C43C4: r"SB_AWD\240_269\FRENCH\XBX_0267.awd",
+    0xADDB13AEA0C84FB3: r"SB_AGD\210_239\ENGLISH\NGC_0235.agd",
+    0xADE673ED6139E1BD: r"SB_AWD\0_29\FRENCH\PS2_0018.awd",
+    0xADF52F71E70C933E: r"SB_AGD\180_209\SPANISH\PS2_0180.agd",
+    0xAE07DB67174B07A9: r"SB_AWD\240_269\ITALIAN\PS2_0247.awd",
+    0xAE14695DADC844B1: r"SB_AGD\210_239\ENGLISH\PS2_0214.agd",
+    0xAE1797233521BC95: r"SB_AWD\240_269\SPANISH\NGC_0259.awd",
+    0xAE21996BBC95AD2C: r"SB_AWD\90_119\FRENCH\XBX_0105.awd",
+    0xAE236A938D692E8C: r"SB_AGD\240_269\SPANISH\PS2_0246.agd",
+    0xAE2C1BF9A784B362: r"SB_AWD\240_269\GERMAN\NGC_0247.awd",
+    0xAE2EBEE93B477614: r"SB_AGD\150_179\SPANISH\PS2_0156.agd",
+    0xAE37E58852761A23: r"SB_AWD\150_179\SPANISH\XBX_0152.awd",
+    0xAE4D588890E71DC5: r"WPNBANK\0_25\wbank_18.bin",
+    0xAE513111276222C3: r"SB_AWD\120_149\ITALIAN\XBX_0130.awd",
+    0xAE53E620A569D6B3: r"SHELL\FONTS\lta20.met",
+    0xAE55405FC59F4200: r"SB_AWD\0_29\SPANISH\XBX_0009.awd",
+    0xAE5A2FE0391C693E: r"ANIMGRPS\Lvl_24\Lvl_24I.ads",
+    0xAE6532C940733415: r"SB_AWD\210_239\FRENCH\NGC_0224.awd",
+    0xAE689BB3B9EE7382: r"SB_AGD\90_119\FRENCH\XBX_0114.agd",
+    0xAE6C027DD7AEEFB3: r"SB_AWD\240_269\ENGLISH\NGC_0266.awd",
+    0xAE75A0FEC7729E8C: r"SB_AGD\210_239\GERMAN\PS2_0231.agd",
+    0xAE76FEA9F378A218: r"SB_AGD\240_269\ENGLISH\XBX_0252.agd",
+    0xAE7D01CA95F45A6A: r"SB_AWD\30_59\GERMAN\XBX_0047.awd",
+    0xAE821AFEC871A15B: r"SB_AGD\0_29\FRENCH\NGC_0022.agd",
+    0xAE885915F28FB831: r"AUDIO\ENGLISH\NGC_4s1.rws",
+    0xAE8CB5D528526A5F: r"AUDIO\SPANISH\NGC_2s1.rws",
+    0xAE91B767F291849F: r"SHELL\FEND\language.anm",
+    0xAE93A6E7056081A3: r"SB_AWD\150_179\ITALIAN\PS2_0159.awd",
+    0xAE95DF5959996F59: r"SB_AGD\0_29\SPANISH\NGC_0024.agd",
+    0xAE9C64C222E1F642: r"LEVELS\L_3_1\SECTIONS\s_27.rws",
+    0xAE9D23093E73597D: r"LEVELS\L_2_1\SECTIONS\s_7.rws",
+    0xAE9DF4132D7D81AC: r"SB_AGD\60_89\ENGLISH\XBX_0074.agd",
+    0xAEB356C705247A05: r"LEVELS\L_3_4\SECTIONS\s_10.rws",
+    0xAEB6A7CE57F8FB1F: r"SB_AGD\120_149\GERMAN\XBX_0121.agd",
+    0xAEB71EDAF33F9BCA: r"SB_AWD\120_149\SPANISH\XBX_0122.awd",
+    0xAEC3B8AEA4E7453F: r"SB_AWD\30_59\SPANISH\PS2_0047.awd",
+    0xAEC448B2DA214573: r"SB_AWD\210_239\FRENCH\PS2_0212.awd",
+    0xAEC47DB05ACBE6CB: r"SB_AGD\210_239\SPANISH\PS2_0238.agd",
+    0xAED2231AE8250DC7: r"LEVELS\L_2_1\SECTIONS\s_1.rws",
+    0xAED547426C44EB5F: r"LEVELS\L_3_3\SECTIONS\s_15.rws",
+    0xAED770D0A6B3A5D2: r"SB_AGD\240_269\GERMAN\PS2_0251.agd",
+    0xAEEFD07DFA74B4E5: r"SB_AWD\120_149\ENGLISH\NGC_0138.awd",
+    0xAEF288756439391A: r"SB_AWD\60_89\GERMAN\XBX_0078.awd",
+    0xAEF8495EAE1D2B9C: r"SB_AWD\240_269\SPANISH\XBX_0245.awd",
+    0xAEFB7D2BC8187727: r"SB_AWD\150_179\ENGLISH\XBX_0156.awd",
+    0xAF0412FE7A904F7C: r"SB_AGD\150_179\ITALIAN\XBX_0155.agd",
+    0xAF1422DAEA8C2987: r"SB_AWD\210_239\FRENCH\NGC_0222.awd",
+    0xAF1429AFAF94C6BC: r"AUDIO\ITALIAN\NGC_2s2.rws",
+    0xAF180C317EB52319: r"SB_AGD\240_269\ITALIAN\PS2_0254.agd",
+    0xAF1CB5B2423B05B4: r"SB_AWD\180_209\ITALIAN\PS2_0205.awd",
+    0xAF1DEA324F99B659: r"SHELL\FONTS\lta26.met",
+    0xAF2A46DE146FB521: r"SB_AGD\30_59\FRENCH\NGC_0031.agd",
+    0xAF2B6986E4885B3A: r"SB_AWD\240_269\ITALIAN\PS2_0262.awd",
+    0xAF2C31DC400DBC24: r"SB_AWD\30_59\GERMAN\XBX_0045.awd",
+    0xAF2D2437314D56F0: r"ANIMGRPS\Lvl_16\Lvl_16A.ads",
+    0xAF2FCCBEC0F11561: r"SB_AGD\60_89\GERMAN\NGC_0066.agd",
+    0xAF30EB10728A6075: r"SB_AGD\0_29\FRENCH\NGC_0020.agd",
+    0xAF31E9E3567CA0D1: r"SB_AWD\150_179\ITALIAN\XBX_0154.awd",
+    0xAF339C114B65AA55: r"SB_AGD\90_119\ENGLISH\XBX_0115.agd",
+    0xAF34A14EB00A1689: r"SB_AWD\180_209\SPANISH\PS2_0187.awd",
+    0xAF371C56751F4DD0: r"SB_AGD\150_179\ITALIAN\PS2_0152.agd",
+    0xAF37DA4F90FE8C89: r"SB_AGD\90_119\FRENCH\NGC_0098.agd",
+    0xAF3DE28DAA5B1F51: r"SB_AWD\180_209\FRENCH\NGC_0197.awd",
+    0xAF419DD30A9DD993: r"SB_AWD\150_179\FRENCH\XBX_0152.awd",
+    0xAF4A8B100B7BE53A: r"SB_AGD\90_119\GERMAN\XBX_0101.agd",
+    0xAF4C36DE5CC73B3A: r"AUDIO\ITALIAN\NGC_4s2.rws",
+    0xAF4D7A88FFCE0A7D: r"SB_AGD\150_179\ENGLISH\PS2_0162.agd",
+    0xAF4DA4F0B54B459E: r"SB_AWD\180_209\ITALIAN\NGC_0181.awd",
+    0xAF4E2CEC09F53B4F: r"SB_AGD\120_149\GERMAN\PS2_0135.agd",
+    0xAF5CE9713291FF70: r"SB_AGD\120_149\SPANISH\NGC_0148.agd",
+    0xAF61E10685878AA7: r"LEVELS\L_3_1_B\global.dff",
+    0xAF6767065F2473DE: r"SB_AGD\60_89\FRENCH\NGC_0074.agd",
+    0xAF72F8C04F00C299: r"SB_AWD\30_59\SPANISH\PS2_0045.awd",
+    0xAF77FFFFF3FB3EF8: r"AUDIO\SPANISH\XBX_1m1.rws",
+    0xAF7D0855224B86F2: r"SB_AWD\60_89\SPANISH\NGC_0070.awd",
+    0xAF88502B113F199C: r"SB_AWD\240_269\SPANISH\PS2_0255.awd",
+    0xAF9C63E1627B29EB: r"SB_AWD\30_59\FRENCH\XBX_0040.awd",
+    0xAFA4504DF40C4948: r"w_paleborderlarge.dds",
+    0xAFAF274EE22B1F57: r"SB_AWD\30_59\ITALIAN\NGC_0042.awd",
+    0xAFC5E3F58D6D52BD: r"SB_AGD\60_89\SPANISH\XBX_0088.agd",
+    0xAFC5F065922FD52F: r"SB_AWD\120_149\ENGLISH\XBX_0149.awd",
+    0xAFCA8978B52F3AC1: r"SB_AGD\210_239\ENGLISH\PS2_0221.agd",
+    0xAFDA3C4DF439B6CB: r"w_paleborderlarge.txd",
+    0xAFDA832B862495E2: r"SB_AGD\150_179\ENGLISH\NGC_0164.agd",
+    0xAFDAF72BBC1CD4A4: r"SB_AGD\120_149\ITALIAN\PS2_0138.agd",
+    0xAFE039E1AC589803: r"AUDIO\FRENCH\PS2_2s2.rws",
+    0xAFE36C22F5801C67: r"SB_AGD\90_119\ENGLISH\XBX_0113.agd",
+    0xAFE564DD29EBE332: r"LEVELS\L_3_1\SECTIONS\s_12.rws",
+    0xAFE85B1250BB96BC: r"SB_AGD\240_269\ENGLISH\NGC_0243.agd",
+    0xAFEC1F4467118BE7: r"SB_AGD\120_149\FRENCH\XBX_0149.agd",
+    0xAFECEE08ED81C037: r"SB_AGD\0_29\ENGLISH\PS2_0023.agd",
+    0xAFEEE407B4325450: r"SB_AGD\0_29\ITALIAN\NGC_0029.agd",
+    0xAFEF7923B2091A7A: r"SB_AGD\30_59\ENGLISH\XBX_0030.agd",
+    0xAFF9DB21B5957E54: r"SB_AGD\90_119\GERMAN\XBX_0103.agd",
+    0xAFFD55025F6581C8: r"SB_AWD\180_209\ITALIAN\NGC_0183.awd",
+    0xB0053FB79A9E6BEB: r"LEVELS\L_2_1_B\CLUMPS\cbank_03.bin",
+    0xB008D8ADE63C1A93: r"SB_AGD\180_209\GERMAN\XBX_0195.agd",
+    0xB00B588AF03DA4EC: r"gui_map7_destroy.index",
+    0xB00C36E5ACA55712: r"SHELL\LOAD\L_3_5.txd",
+    0xB01035CB9930944D: r"LEVELS\L_2_2\SECTIONS\s_2.rws",
+    0xB0163718093D32E8: r"SB_AGD\60_89\FRENCH\NGC_0076.agd",
+    0xB01BC1051F0EEA4C: r"SB_AWD\90_119\SPANISH\XBX_0095.awd",
+    0xB01EBBCEC1556912: r"SB_AGD\90_119\FRENCH\XBX_0107.agd",
+    0xB027AF26489902FF: r"SB_AWD\150_179\GERMAN\PS2_0175.awd",
+    0xB0287D62D16856D9: r"SB_AWD\0_29\GERMAN\XBX_0011.awd",
+    0xB02B149AB5A5AD27: r"SB_AWD\120_149\GERMAN\XBX_0143.awd",
+    0xB02FA0EDE9E14299: r"SB_AGD\0_29\SPANISH\PS2_0014.agd",
+    0xB03212EC2AF9D156: r"SB_AWD\180_209\ENGLISH\NGC_0202.awd",
+    0xB033921C63114E65: r"SB_AWD\0_29\SPANISH\XBX_0022.awd",
+    0xB03D602F0D12ABF3: r"SB_AGD\180_209\ENGLISH\XBX_0205.agd",
+    0xB0632BD7D1E7B5FC: r"SB_AWD\150_179\FRENCH\XBX_0168.awd",
+    0xB06411448961CD7D: r"w_playersetup.dds",
+    0xB0673E8000FAA3D3: r"SB_AWD\90_119\GERMAN\XBX_0096.awd",
+    0xB06831C939C81194: r"SB_AGD\210_239\ITALIAN\PS2_0220.agd",
+    0xB077D554E846DC44: r"SB_AWD\90_119\GERMAN\XBX_0114.awd",
+    0xB07988CDE186BE63: r"SB_AWD\210_239\FRENCH\PS2_0227.awd",
+    0xB07D5796923101CE: r"SB_AGD\210_239\FRENCH\XBX_0229.agd",
+    0xB089032E4DD69E12: r"SB_AWD\240_269\FRENCH\PS2_0257.awd",
+    0xB08C22777550569A: r"SB_AGD\240_269\FRENCH\NGC_0256.agd",
+    0xB08E0F0D4A03CA8F: r"SB_AGD\0_29\GERMAN\XBX_0026.agd",
+    0xB094382A6773D18B: r"SB_AGD\240_269\SPANISH\NGC_0266.agd",
+    0xB09AFD448990EDE6: r"w_playersetup.txd",
+    0xB09E1F9FA6B4ED0E: r"ANIMGRPS\Lvl_11\Lvl_11E.ads",
+    0xB0A0FA99EA7B92A9: r"SB_AGD\120_149\FRENCH\PS2_0140.agd",
+    0xB0A77F60D39B968E: r"SB_AWD\210_239\ENGLISH\XBX_0221.awd",
+    0xB0AB04295EC37B42: r"SB_AGD\210_239\FRENCH\PS2_0235.agd",
+    0xB0BFF41856E0A4ED: r"SB_AGD\90_119\ITALIAN\PS2_0105.agd",
+    0xB0C15723515FF52C: r"SB_AWD\120_149\GERMAN\NGC_0142.awd",
+    0xB0C65F28172A2F16: r"SB_AWD\60_89\FRENCH\NGC_0081.awd",
+    0xB0C816116018202D: r"SB_AWD\60_89\FRENCH\NGC_0064.awd",
+    0xB0D0E7E903FEE2AB: r"SB_AGD\60_89\ENGLISH\PS2_0074.agd",
+    0xB0D21879E42BDB8C: r"SB_AGD\240_269\FRENCH\PS2_0255.agd",
+    0xB0DFF7151C44CD8E: r"SB_AGD\90_119\ITALIAN\PS2_0094.agd",
+    0xB0E68B2B79F07C05: r"SB_AGD\0_29\FRENCH\NGC_0015.agd",
+    0xB0F68F7AAAB4CAE6: r"SearchingForGames.layout",
+    0xB1058FCDEA787C07: r"AUDIO\SPANISH\PS2_1m3.rws",
+    0xB1093F993A83C49C: r"w_flagsAuto.index",
+    0xB10A3B0E9BE6CC09: r"SB_AGD\90_119\GERMAN\NGC_0108.agd",
+    0xB10BF38D1B30B10C: r"SB_AWD\150_179\SPANISH\XBX_0168.awd",
+    0xB10E9C5A615622A5: r"LOC\FR\EULA.LOC",
+    0xB114D4164D9C8EBC: r"ANIMGRPS\Lvl_34\Lvl_34E.ads",
+    0xB11987E003851D59: r"SB_AGD\120_149\GERMAN\XBX_0123.agd",
+    0xB1247CC2BAB00FD5: r"w_map08.dds",
+    0xB12895C3F1A24C9A: r"SB_AGD\210_239\FRENCH\NGC_0238.agd",
+    0xB12E5C864B025464: r"SB_AWD\0_29\ENGLISH\NGC_0018.awd",
+    0xB130414B5BDF8584: r"SB_AGD\60_89\ITALIAN\NGC_0087.agd",
+    0xB132087029B092A2: r"SB_AWD\60_89\SPANISH\NGC_0063.awd",
+    0xB132E4446C1A513B: r"SB_AGD\180_209\GERMAN\NGC_0180.agd",
+    0xB13D6F1EF41D7EC9: r"SB_AGD\0_29\GERMAN\XBX_0024.agd",
+    0xB142969CEA5004F8: r"SB_AWD\30_59\ITALIAN\PS2_0039.awd",
+    0xB148EC0BF056D088: r"SB_AWD\60_89\FRENCH\PS2_0068.awd",
+    0xB14BB402C4CAB47B: r"SB_AGD\60_89\SPANISH\NGC_0075.agd",
+    0xB14CB5EAF6609DE6: r"SB_AGD\90_119\ENGLISH\XBX_0109.agd",
+    0xB1599E74270578D7: r"SB_AWD\90_119\FRENCH\NGC_0092.awd",
+    0xB15A58C2BADD618E: r"w_map08.txd",
+    0xB1688D4E39F5B426: r"SB_AGD\90_119\FRENCH\PS2_0104.agd",
+    0xB1706E49F8246CA9: r"SB_AWD\120_149\GERMAN\PS2_0142.awd",
+    0xB173E2AEA21495D8: r"SB_AWD\60_89\ITALIAN\XBX_0089.awd",
+    0xB182C494421D0D54: r"SB_AWD\150_179\SPANISH\PS2_0170.awd",
+    0xB18432DAF2793BE5: r"SHELL\FEND\INSTANCE\SKY\LANGUAGE.TXD",
+    0xB18501D61F7F2145: r"SB_AWD\180_209\SPANISH\XBX_0207.awd",
+    0xB191B6E5991EEB34: r"WPNBANK\0_25\wbank_20.bin",
+    0xB19A230AE3388A81: r"w_createsesh.txd",
+    0xB1A5F4424908B7ED: r"SB_AWD\30_59\GERMAN\PS2_0043.awd",
+    0xB1B5A0B1B57D30FF: r"SB_AGD\60_89\ITALIAN\XBX_0060.agd",
+    0xB1B79989E86FF834: r"SB_AGD\30_59\GERMAN\PS2_0055.agd",
+    0xB1BC8E5CA45C4291: r"SB_AWD\90_119\FRENCH\NGC_0102.awd",
+    0xB1C4D08792208C5D: r"SB_AWD\180_209\ENGLISH\PS2_0208.awd",
+    0xB1C5282169CC3BA9: r"SB_AGD\240_269\ITALIAN\PS2_0261.agd",
+    0xB1C92D0269271652: r"SB_AGD\120_149\FRENCH\XBX_0122.agd",
+    0xB1CD9882936C643A: r"SB_AWD\180_209\SPANISH\NGC_0185.awd",
+    0xB1D01B3090D402B0: r"SB_AWD\150_179\ENGLISH\XBX_0164.awd",
+    0xB1D1170AE367B882: r"w_createsesh.dds",
+    0xB1E18938DBF8C691: r"LEVELS\L_1_5\SECTIONS\s_17.rws",
+    0xB1FACC1748BF95D2: r"SB_AGD\150_179\SPANISH\XBX_0175.agd",
+    0xB1FC4995981743B0: r"SB_AGD\240_269\SPANISH\XBX_0241.agd",
+    0xB1FD0EBAA1BAC1C4: r"SB_AWD\120_149\ENGLISH\XBX_0120.awd",
+    0xB2084EBB901E2DFA: r"SB_AWD\90_119\ITALIAN\NGC_0091.awd",
+    0xB208A56F60EB0B2A: r"SB_AGD\240_269\GERMAN\PS2_0260.agd",
+    0xB21AD088B1968B2C: r"LEVELS\L_1_3_A\SECTIONS\s_1.rws",
+    0xB23064B946BFEA9E: r"LEVELS\L_1_3_A\global.dff",
+    0xB23416C30A17362C: r"SB_AWD\60_89\ENGLISH\XBX_0074.awd",
+    0xB237858C903410F3: r"SB_AGD\120_149\ENGLISH\XBX_0127.agd",
+    0xB2394AA53A66E54E: r"SB_AGD\240_269\SPANISH\PS2_0248.agd",
+    0xB23C2CACB03D2E89: r"ANIMGRPS\Lvl_21\Lvl_21P.ads",
+    0xB24242927CB74C2A: r"SB_AGD\240_269\FRENCH\NGC_0241.agd",
+    0xB248988E524796EB: r"SB_AWD\150_179\ENGLISH\NGC_0161.awd",
+    0xB25094807046C06A: r"SB_AGD\210_239\ENGLISH\XBX_0225.agd",
+    0xB25749485B18ADFE: r"SB_AWD\90_119\ENGLISH\XBX_0093.awd",
+    0xB26237B7B5C08998: r"SHELL\MOVIES\ITALIAN\2_1_Mon.bik",
+    0xB275714CE908BABE: r"SB_AGD\90_119\SPANISH\NGC_0095.agd",
+    0xB27B02EF3680FD1D: r"SB_AGD\240_269\GERMAN\PS2_0249.agd",
+    0xB28066F1ABBF88DE: r"SB_AGD\0_29\FRENCH\XBX_0021.agd",
+    0xB28A706734047F39: r"SB_AGD\0_29\ITALIAN\PS2_0021.agd",
+    0xB28D4BF6746A5474: r"SB_AGD\90_119\ITALIAN\NGC_0105.agd",
+    0xB28EF4EBF62E4C4B: r"SB_AWD\30_59\SPANISH\XBX_0035.awd",
+    0xB294E2FDD685D7E0: r"SB_AWD\180_209\ENGLISH\NGC_0200.awd",
+    0xB2983C2EDF4FAD65: r"SB_AWD\240_269\FRENCH\NGC_0259.awd",
+    0xB2AD91E1ED00260E: r"SB_AGD\150_179\GERMAN\PS2_0170.agd",
+    0xB2AEA47E8C7FA591: r"SB_AWD\30_59\ITALIAN\PS2_0052.awd",
+    0xB2B1073164C08213: r"SB_AGD\90_119\ENGLISH\PS2_0110.agd",
+    0xB2B73ECD3A372374: r"SB_AWD\90_119\ITALIAN\NGC_0093.awd",
+    0xB2B775810B03CAC4: r"SB_AGD\240_269\GERMAN\PS2_0262.agd",
+    0xB2BD5A76B6E992DB: r"SB_AGD\150_179\ITALIAN\PS2_0168.agd",
+    0xB2C6C5901E51792D: r"SB_AWD\210_239\ENGLISH\NGC_0237.awd",
+    0xB2D53DCAFC77A0D5: r"SB_AWD\90_119\ENGLISH\NGC_0113.awd",
+    0xB2DCBCDDD4F85B29: r"SB_AGD\0_29\SPANISH\PS2_0021.agd",
+    0xB2DE2FB07ED3B4D0: r"SB_AGD\30_59\FRENCH\PS2_0048.agd",
+    0xB2E39CA15267CD54: r"SB_AWD\0_29\ENGLISH\NGC_0007.awd",
+    0xB2F112A426D00BC4: r"SB_AGD\240_269\FRENCH\NGC_0243.agd",
+    0xB2F6083C12FE2525: r"SB_AGD\240_269\SPANISH\NGC_0264.agd",
+    0xB2F6859E059A8C24: r"SB_AGD\120_149\GERMAN\XBX_0148.agd",
+    0xB2F8FE561F3B065C: r"SB_AWD\180_209\ENGLISH\NGC_0198.awd",
+    0xB2FD10031A047BBC: r"SB_AGD\60_89\ENGLISH\XBX_0063.agd",
+    0xB30144380B616B7C: r"LEVELS\L_3_5_B\SECTIONS\s_13.rws",
+    0xB3175C37EE3D4C68: r"AUDIO\ENGLISH\XBX_4s2.rws",
+    0xB31A45945B4762C1: r"SB_AGD\120_149\ITALIAN\NGC_0145.agd",
+    0xB31EAD69415CA9B6: r"SB_AGD\90_119\FRENCH\PS2_0117.agd",
+    0xB321EDDE2FF16AA4: r"SB_AGD\0_29\ITALIAN\XBX_0016.agd",
+    0xB3282F39C2B482A0: r"SB_AWD\60_89\FRENCH\NGC_0083.awd",
+    0xB329B15529F05154: r"SB_AWD\90_119\GERMAN\PS2_0104.awd",
+    0xB32F370355D847E8: r"SB_AGD\0_29\FRENCH\XBX_0023.agd",
+    0xB3314570188DDC54: r"SB_AGD\30_59\SPANISH\NGC_0038.agd",
+    0xB33A79F6CAC5B146: r"SB_AGD\60_89\GERMAN\PS2_0060.agd",
+    0xB341599891862CB4: r"SB_AWD\240_269\ITALIAN\PS2_0260.awd",
+    0xB346CC561947308C: r"SB_AGD\240_269\GERMAN\NGC_0256.agd",
+    0xB346D7ADD70E0D5C: r"SB_AGD\60_89\FRENCH\XBX_0074.agd",
+    0xB348434F8E21556E: r"SB_AGD\90_119\SPANISH\PS2_0106.agd",
+    0xB34A2FDEF396A5CA: r"SB_AGD\120_149\SPANISH\XBX_0122.agd",
+    0xB3503D7E7802A1F1: r"SB_AGD\210_239\SPANISH\XBX_0231.agd",
+    0xB35188F3A61D7BF3: r"SB_AWD\0_29\SPANISH\NGC_0022.awd",
+    0xB3524F668578FD0C: r"SB_AGD\150_179\GERMAN\NGC_0168.agd",
+    0xB35C308507F8A699: r"codFontFutB26.dds",
+    0xB3608C5360ED1CA1: r"SB_AWD\30_59\ENGLISH\NGC_0040.awd",
+    0xB3638CFDB6F21789: r"SB_AGD\120_149\GERMAN\PS2_0137.agd",
+    0xB363A6BB1D46CADD: r"SB_AWD\0_29\SPANISH\XBX_0013.awd",
+    0xB364674518F91BAD: r"SB_AWD\0_29\GERMAN\NGC_0026.awd",
+    0xB373B1009D08606C: r"SB_AWD\60_89\GERMAN\NGC_0078.awd",
+    0xB384BA7A4EA5389F: r"AUDIO\GERMAN\PS2_1s3.rws",
+    0xB38BD06F2C5D953D: r"ANIMGRPS\s311_IntroCutsceneSign.ads",
+    0xB38D85F0A32201C4: r"SB_AGD\210_239\FRENCH\NGC_0229.agd",
+    0xB391F8E304071735: r"SB_AGD\150_179\SPANISH\NGC_0178.agd",
+    0xB39274850826A982: r"codFontFutB26.txd",
+    0xB3928F850826D7E6: r"codFontFutB26.tga",
+    0xB398CEFB3B53CF6D: r"SB_AWD\90_119\SPANISH\PS2_0105.awd",
+    0xB39AC8E1386B6B1E: r"SHELL\FEND\INSTANCE\gcn\f_fend.txd",
+    0xB3A56AD0D9BA3901: r"SB_AWD\120_149\SPANISH\PS2_0126.awd",
+    0xB3B41E972C553061: r"SHELL\MOVIES\warning.bik",
+    0xB3B568C39C9ED3A5: r"ANIMGRPS\Lvl_34\Lvl_34P.ads",
+    0xB3BBA93042ACE116: r"SB_AGD\0_29\FRENCH\NGC_0009.agd",
+    0xB3C194F8601E4D25: r"SB_AGD\180_209\ITALIAN\NGC_0209.agd",
+    0xB3CDFD7AEB7642C0: r"SB_AGD\90_119\FRENCH\PS2_0115.agd",
+    0xB3F09265E5753213: r"SB_AWD\30_59\FRENCH\NGC_0055.awd",
+    0xB3F5A69B8BD636FB: r"SB_AWD\180_209\ITALIAN\NGC_0197.awd",
+    0xB3F663798D5F1E93: r"SB_AWD\60_89\ENGLISH\PS2_0081.awd",
+    0xB3F81361383BC778: r"SB_AGD\90_119\SPANISH\PS2_0104.agd",
+    0xB3F84FF2AFE0F30B: r"SB_AGD\60_89\SPANISH\NGC_0066.agd",
+    0xB4034BAFE90BC496: r"SB_AGD\210_239\FRENCH\XBX_0218.agd",
+    0xB4035046944E1345: r"SB_AWD\90_119\ITALIAN\NGC_0108.awd",
+    0xB404C9355F05DB94: r"SB_AGD\30_59\ENGLISH\XBX_0032.agd",
+    0xB406D694C080E8BA: r"SB_AGD\60_89\SPANISH\NGC_0085.agd",
+    0xB40D87BB753669DF: r"SB_AGD\30_59\SPANISH\NGC_0042.agd",
+    0xB40EE91ED1505EE1: r"LEVELS\L_2_2\GodData.dff",
+    0xB410155DA7FFF469: r"SB_AGD\120_149\ITALIAN\PS2_0140.agd",
+    0xB41775F55A77E96B: r"SB_AWD\210_239\ENGLISH\PS2_0238.awd",
+    0xB418EC1D7E0D7A44: r"SB_AWD\180_209\GERMAN\XBX_0192.awd",
+    0xB42371124722B74E: r"SB_AWD\60_89\GERMAN\NGC_0076.awd",
+    0xB434696A1BC20BCF: r"SB_AGD\60_89\ITALIAN\PS2_0067.agd",
+    0xB43BD4B35BEB57B0: r"SB_AGD\90_119\ITALIAN\XBX_0103.agd",
+    0xB43CEF37F595A959: r"SB_AWD\150_179\GERMAN\PS2_0177.awd",
+    0xB43FBB1B1B6CAF92: r"SB_AWD\30_59\ENGLISH\PS2_0051.awd",
+    0xB4424091FA94038F: r"SB_AGD\180_209\ITALIAN\NGC_0184.agd",
+    0xB449459676F4D299: r"LEVELS\L_1_3_A\SECTIONS\s_15.rws",
+    0xB45814747CE8ADEC: r"ANIMGRPS\Lvl_32\Lvl_32A.ads",
+    0xB45AD0FDD9D59124: r"SB_AWD\150_179\ENGLISH\PS2_0178.awd",
+    0xB45F5F76259DDFB7: r"SB_AGD\90_119\FRENCH\PS2_0101.agd",
+    0xB460C42BBFB67319: r"SB_AWD\0_29\FRENCH\PS2_0029.awd",
+    0xB46331FCF466421E: r"SB_AGD\150_179\GERMAN\PS2_0163.agd",
+    0xB468EA4D899F763C: r"LEVELS\MP_2\SECTIONS\s_10.rws",
+    0xB474AFF48FC6268C: r"SB_AGD\0_29\FRENCH\PS2_0020.agd",
+    0xB484FF99418B5ACC: r"SB_AWD\90_119\ENGLISH\PS2_0092.awd",
+    0xB4935BED9DD4192F: r"SB_AWD\30_59\ITALIAN\NGC_0033.awd",
+    0xB49A3286B1AE444E: r"SB_AWD\90_119\GERMAN\PS2_0090.awd",
+    0xB49DBAD1EBE5C068: r"SB_AGD\240_269\SPANISH\PS2_0259.agd",
+    0xB4A7FB494791FDE9: r"SB_AGD\0_29\SPANISH\NGC_0011.agd",
+    0xB4ADC36E11ADE7D5: r"SB_AWD\210_239\ITALIAN\XBX_0222.awd",
+    0xB4B30CE8FBDA0D30: r"SB_AWD\180_209\SPANISH\NGC_0208.awd",
+    0xB4B4A376D1153F71: r"SB_AGD\180_209\SPANISH\XBX_0203.agd",
+    0xB4B626A66A9A81D4: r"SB_AGD\60_89\SPANISH\NGC_0087.agd",
+    0xB4D200752781C2D5: r"SB_AWD\0_29\FRENCH\XBX_0013.awd",
+    0xB4D5C42A03DE3FFF: r"SB_AGD\90_119\ITALIAN\PS2_0103.agd",
+    0xB4D6A76B8C112E4D: r"SB_AGD\30_59\GERMAN\PS2_0036.agd",
+    0xB4F1A0A3A4ADB7C9: r"SB_AGD\180_209\ITALIAN\NGC_0186.agd",
+    0xB4FA3915D4C0444C: r"SB_AWD\120_149\FRENCH\PS2_0130.awd",
+    0xB4FB4079EEF3AF79: r"SB_AWD\90_119\ENGLISH\XBX_0119.awd",
+    0xB4FC5B3D26EE1717: r"SB_AGD\0_29\FRENCH\NGC_0013.agd",
+    0xB4FCAC5B90CE8807: r"SB_AWD\240_269\FRENCH\NGC_0248.awd",
+    0xB506C90EAD82F4E3: r"SB_AWD\0_29\SPANISH\NGC_0017.awd",
+    0xB507688627024D4E: r"ANIMGRPS\Lvl_32\Lvl_32C.ads",
+    0xB512206AACBF0E7C: r"SB_AWD\30_59\FRENCH\NGC_0049.awd",
+    0xB51273464BCE55D5: r"SB_AGD\90_119\ENGLISH\NGC_0096.agd",
+    0xB51F74801F9448FB: r"SB_AWD\180_209\ITALIAN\XBX_0186.awd",
+    0xB52D3B3C7A1810BC: r"SB_AGD\210_239\SPANISH\XBX_0216.agd",
+    0xB530D673212635EC: r"SB_AWD\90_119\ENGLISH\NGC_0093.awd",
+    0xB5469D3E9E026EB9: r"SB_AWD\180_209\SPANISH\PS2_0194.awd",
+    0xB5471088F0660201: r"SB_AGD\150_179\ITALIAN\NGC_0167.agd",
+    0xB5491EBB3BE8B62D: r"SB_AGD\150_179\SPANISH\XBX_0165.agd",
+    0xB55CD3B48BDE5205: r"SB_AWD\180_209\FRENCH\XBX_0209.awd",
+    0xB55E29D5F3D100F4: r"SHELL\LOAD\L_2_2.txd",
+    0xB5600225CE2A0F43: r"ANIMGRPS\Lvl_14\Lvl_14B.ads",
+    0xB5646BBC73DD58DD: r"SB_AGD\120_149\SPANISH\NGC_0141.agd",
+    0xB5850AA06397B9DF: r"SB_AWD\60_89\SPANISH\NGC_0079.awd",
+    0xB59158E32060232A: r"SB_AGD\210_239\FRENCH\PS2_0217.agd",
+    0xB596233C6950DFEF: r"SB_AWD\240_269\ENGLISH\XBX_0246.awd",
+    0xB599B1E7CC7AD2F7: r"SB_AWD\180_209\SPANISH\XBX_0201.awd",
+    0xB59A3FF477C775FC: r"ANIMGRPS\Lvl_23\Lvl_23Y.ads",
+    0xB59AFA711AAF885B: r"SB_AGD\180_209\ENGLISH\NGC_0203.agd",
+    0xB59C4A08765004D0: r"SB_AGD\60_89\GERMAN\PS2_0062.agd",
+    0xB5AA7BCFC5343C46: r"SB_AWD\90_119\ENGLISH\NGC_0103.awd",
+    0xB5AEDFD150745B1B: r"SB_AWD\30_59\FRENCH\XBX_0035.awd",
+    0xB5B541A06ACE4653: r"ANIMGRPS\Lvl_14\Lvl_14R.ads",
+    0xB5B6E8B6FDE2D6AD: r"SB_AWD\60_89\ITALIAN\XBX_0066.awd",
+    0xB5BF081B2339CB2E: r"SB_AWD\60_89\SPANISH\XBX_0072.awd",
+    0xB5BF6CB0DF351663: r"ANIMGRPS\Lvl_24\Lvl_24P.ads",
+    0xB5C24357F5E8C7E7: r"SB_AGD\90_119\ENGLISH\NGC_0090.agd",
+    0xB5C6051CB1504ED7: r"SB_AWD\210_239\ENGLISH\XBX_0215.awd",
+    0xB5CD0017F3C8008E: r"SB_AWD\120_149\GERMAN\PS2_0123.awd",
+    0xB5D9B7FABB9310A8: r"SB_AWD\150_179\ITALIAN\XBX_0159.awd",
+    0xB5DD1B4E24329E7E: r"SB_AGD\210_239\SPANISH\XBX_0218.agd",
+    0xB5E38894406A35B4: r"SB_AWD\180_209\SPANISH\NGC_0187.awd",
+    0xB5E7BF832B641532: r"SB_AWD\210_239\GERMAN\PS2_0219.awd",
+    0xB5F38BBA5F5074BB: r"SB_AWD\180_209\FRENCH\PS2_0204.awd",
+    0xB5F4D557F60FDCBA: r"LEVELS\L_1_5\SECTIONS\s_5.rws",
+    0xB5F4E8A064E3D734: r"SB_AGD\150_179\ENGLISH\PS2_0167.agd",
+    0xB5F583B35C8F26E6: r"SB_AWD\210_239\ENGLISH\PS2_0213.awd",
+    0xB5F7EECCE601753F: r"SB_AGD\150_179\SPANISH\XBX_0163.agd",
+    0xB60C9B00A90C5361: r"SB_AWD\210_239\FRENCH\XBX_0226.awd",
+    0xB6111118E13CBD14: r"SB_AWD\150_179\ENGLISH\PS2_0167.awd",
+    0xB61219A74514DF42: r"SB_AGD\240_269\SPANISH\XBX_0247.agd",
+    0xB6136CDC49A9E191: r"SB_AGD\150_179\FRENCH\XBX_0169.agd",
+    0xB6210931BC62F183: r"SB_AWD\60_89\ENGLISH\XBX_0082.awd",
+    0xB62748C45BB0807B: r"SB_AWD\90_119\ENGLISH\PS2_0118.awd",
+    0xB64028F4CA78E2C4: r"SB_AGD\210_239\FRENCH\PS2_0215.agd",
+    0xB6417957B27E3E99: r"SessionListBase.layout",
+    0xB649CA82C4C84775: r"SB_AGD\180_209\ENGLISH\NGC_0201.agd",
+    0xB65A20045B6B46A5: r"SB_AGD\60_89\SPANISH\NGC_0064.agd",
+    0xB664DD6283979DFA: r"SB_AGD\180_209\ITALIAN\PS2_0184.agd",
+    0xB66664921D445B04: r"SB_AGD\210_239\ENGLISH\XBX_0227.agd",
+    0xB66DF82CCD52C098: r"SB_AWD\60_89\SPANISH\XBX_0070.awd",
+    0xB66F67CD20C0D819: r"SB_AGD\30_59\SPANISH\NGC_0040.agd",
+    0xB672D5106F3A202C: r"ANIMGRPS\Lvl_12\Lvl_12E.ads",
+    0xB6836149398F51F8: r"SB_AWD\60_89\ENGLISH\PS2_0068.awd",
+    0xB68380FC51E7A08E: r"w_map07.dds",
+    0xB68B0CF090F9C139: r"SB_AGD\180_209\ITALIAN\XBX_0188.agd",
+    0xB68E6DBE3CCE7E64: r"SB_AWD\240_269\GERMAN\XBX_0258.awd",
+    0xB697E937973AFBF6: r"SB_AWD\120_149\ITALIAN\NGC_0142.awd",
+    0xB69EA8F81DAA3670: r"LEVELS\MP_4\SECTIONS\s_7.rws",
+    0xB69EE4F56F322371: r"SB_AWD\60_89\ITALIAN\NGC_0073.awd",
+    0xB6A4C4FDA32BE765: r"SB_AWD\30_59\SPANISH\XBX_0037.awd",
+    0xB6A4D3C506A8BF70: r"SB_AWD\210_239\ENGLISH\PS2_0211.awd",
+    0xB6A6E263CFB01D11: r"SB_AGD\240_269\FRENCH\XBX_0257.agd",
+    0xB6A8411C9FA9E03B: r"SHELL\LOAD\MP_1_TDM.txd",
+    0xB6B0819E018E87E6: r"LEVELS\L_1_2_B\SECTIONS\s_5.rws",
+    0xB6B0FFBE5B8B38CA: r"i_frame1_borderlarge.layout",
+    0xB6B564333A43DD00: r"SB_AWD\180_209\GERMAN\PS2_0191.awd",
+    0xB6BA44FC52167D1D: r"w_map07.txd",
+    0xB6D183FBDB0F6BF6: r"AUDIO\ITALIAN\XBX_4m2.rws",
+    0xB6E1DBA5118C3CBB: r"SB_AWD\120_149\ENGLISH\PS2_0120.awd",
+    0xB6E52DF070F91F3C: r"SB_AWD\210_239\SPANISH\NGC_0214.awd",
+    0xB6EB2DDCA9757247: r"SB_AWD\90_119\ENGLISH\NGC_0115.awd",
+    0xB6F55BFF495EBEC9: r"SB_AWD\30_59\ITALIAN\NGC_0031.awd",
+    0xB708DC44963714CA: r"SB_AWD\60_89\FRENCH\XBX_0069.awd",
+    0xB70EFE67CC38F2FE: r"SB_AWD\180_209\ENGLISH\NGC_0196.awd",
+    0xB713DE2AD6B9F625: r"SB_AGD\120_149\ENGLISH\NGC_0149.agd",
+    0xB716B894004663E2: r"SB_AGD\60_89\ITALIAN\NGC_0070.agd",
+    0xB717890DFBE9F71B: r"w_map01.txd",
+    0xB719AE89C4BBB1B7: r"gui_map3_ctf.txd",
+    0xB72BA3CFF17DABE9: r"SB_AGD\120_149\GERMAN\XBX_0130.agd",
+    0xB730174DAE5BCEB1: r"SB_AGD\60_89\GERMAN\XBX_0073.agd",
+    0xB733FC547FEF9AC6: r"SB_AWD\30_59\ENGLISH\XBX_0056.awd",
+    0xB7368254BADE6F10: r"SB_AWD\150_179\GERMAN\NGC_0159.awd",
+    0xB74E7D0DFC192538: r"w_map01.dds",
+    0xB74FAA89C4E93AC4: r"gui_map3_ctf.dds",
+    0xB75CAC67C644E74E: r"SB_AGD\240_269\GERMAN\NGC_0258.agd",
+    0xB7682F783276B3CE: r"SB_AGD\150_179\GERMAN\NGC_0166.agd",
+    0xB76F6428C52DB704: r"SB_AWD\60_89\FRENCH\NGC_0061.awd",
+    0xB771BA87AC19598B: r"SB_AGD\0_29\GERMAN\NGC_0015.agd",
+    0xB7747F578F7777B4: r"SB_AWD\180_209\FRENCH\PS2_0188.awd",
+    0xB7783C889BC03A26: r"SB_AGD\180_209\SPANISH\XBX_0194.agd",
+    0xB7814F1F822315F0: r"SB_AGD\0_29\SPANISH\XBX_0023.agd",
+    0xB787B897A2C1B097: r"SB_AGD\90_119\ITALIAN\NGC_0098.agd",
+    0xB78BB27D44E8B29C: r"SB_AGD\90_119\SPANISH\XBX_0107.agd",
+    0xB7932940F0ACF42E: r"SB_AWD\120_149\SPANISH\PS2_0136.awd",
+    0xB7A73E79F03E5E46: r"SB_AWD\0_29\FRENCH\XBX_0003.awd",
+    0xB7A83FD49073511B: r"SB_AWD\150_179\GERMAN\NGC_0170.awd",
+    0xB7A9E652F6F01B3D: r"SB_AGD\0_29\ITALIAN\NGC_0020.agd",
+    0xB7B5BC38BA8A12D5: r"SB_AGD\210_239\GERMAN\NGC_0213.agd",
+    0xB7C37854E71CB0DE: r"SB_AWD\150_179\SPANISH\PS2_0150.awd",
+    0xB7C3E2AB09CFAE4D: r"SB_AWD\0_29\SPANISH\XBX_0000.awd",
+    0xB7C7E4FDE26C34C3: r"SB_AGD\90_119\SPANISH\XBX_0117.agd",
+    0xB7CAE668BE510392: r"SB_AWD\0_29\ENGLISH\PS2_0017.awd",
+    0xB7CFCE7EB7AF1FDA: r"SB_AWD\90_119\ENGLISH\XBX_0105.awd",
+    0xB7D398F4C2AB0165: r"SB_AGD\180_209\ITALIAN\PS2_0208.agd",
+    0xB7E2AD39AB38F7FD: r"SB_AWD\30_59\ENGLISH\PS2_0049.awd",
+    0xB7F9234E14DD3789: r"SB_AWD\240_269\ENGLISH\XBX_0244.awd",
+    0xB7FF151C41D81C0B: r"SB_AGD\180_209\ENGLISH\PS2_0202.agd",
+    0xB80552700F2983BC: r"SB_AWD\210_239\GERMAN\XBX_0236.awd",
+    0xB811AFE2FC0061B5: r"SB_AWD\30_59\FRENCH\XBX_0037.awd",
+    0xB81A53056579B07A: r"LEVELS\L_3_1\global.dff",
+    0xB8301F312C3BD482: r"SB_AGD\0_29\SPANISH\XBX_0025.agd",
+    0xB83BD4A1C6CB6DE5: r"ANIMGRPS\Lvl_23\Lvl_23L.ads",
+    0xB84219529AC5E998: r"SB_AWD\120_149\SPANISH\PS2_0134.awd",
+    0xB843ADD94433F754: r"SB_AWD\240_269\GERMAN\XBX_0247.awd",
+    0xB8459146279CF620: r"SB_AGD\120_149\ENGLISH\PS2_0123.agd",
+    0xB849C97BC8BEE809: r"SB_AGD\60_89\ITALIAN\PS2_0065.agd",
+    0xB851A4C508E8F342: r"SB_AGD\90_119\ITALIAN\XBX_0105.agd",
+    0xB85B147E4040C81B: r"SB_AWD\150_179\ENGLISH\NGC_0172.awd",
+    0xB85E05A4E62CF7AE: r"SB_AGD\210_239\ITALIAN\PS2_0213.agd",
+    0xB861F5DB0EF0D811: r"SB_AGD\180_209\ENGLISH\NGC_0199.agd",
+    0xB862AF4B608EB11B: r"SB_AGD\120_149\ENGLISH\PS2_0146.agd",
+    0xB8658C4A64A484E7: r"SB_AGD\210_239\GERMAN\NGC_0215.agd",
+    0xB87332BCB3E946DF: r"SB_AWD\0_29\SPANISH\XBX_0006.awd",
+    0xB879020EA163DD28: r"SB_AGD\150_179\GERMAN\PS2_0161.agd",
+    0xB87C6358CF6E27C7: r"SB_AGD\0_29\ENGLISH\XBX_0006.agd",
+    0xB8939E5A90EAFC83: r"SB_AGD\120_149\FRENCH\PS2_0120.agd",
+    0xB89770EF66FD103E: r"ANIMGRPS\MPA_00\MPA_00E.ads",
+    0xB89D633C80009850: r"SB_AWD\210_239\ENGLISH\XBX_0234.awd",
+    0xB8A99FDD33376BF2: r"SB_AGD\30_59\FRENCH\PS2_0059.agd",
+    0xB8AEBB44B51D4D03: r"SB_AWD\0_29\ITALIAN\XBX_0002.awd",
+    0xB8C3B37FBEABB947: r"SB_AWD\210_239\ITALIAN\XBX_0224.awd",
+    0xB8C9A87F992DC18B: r"AUDIO\ITALIAN\XBX_2s3.rws",
+    0xB8CE62B4467ED15E: r"ANIMGRPS\Lvl_22\Lvl_22U.ads",
+    0xB8D06324BBC2E991: r"SB_AGD\210_239\ITALIAN\PS2_0236.agd",
+    0xB8DF241837FAB610: r"LEVELS\L_1_3_A\SECTIONS\s_25.rws",
+    0xB8E63768B5C2C4C1: r"SB_AGD\60_89\GERMAN\XBX_0060.agd",
+    0xB8E7F086D47F9447: r"SB_AWD\0_29\FRENCH\XBX_0015.awd",
+    0xB8F050C1B8E79555: r"SB_AWD\120_149\ITALIAN\XBX_0125.awd",
+    0xB9056A237F288EE0: r"SB_AGD\60_89\GERMAN\PS2_0071.agd",
+    0xB91311E661693CB8: r"SB_AWD\120_149\SPANISH\NGC_0122.awd",
+    0xB91B2DAB2C657F13: r"SB_AGD\210_239\SPANISH\XBX_0220.agd",
+    0xB91CC072F8467556: r"SB_AWD\60_89\GERMAN\XBX_0089.awd",
+    0xB926047574B5D3EF: r"SB_AWD\210_239\ITALIAN\PS2_0223.awd",
+    0xB92B053A4F8F35B9: r"SB_AGD\120_149\SPANISH\PS2_0148.agd",
+    0xB92E5CA3A3272FB6: r"SB_AGD\180_209\SPANISH\XBX_0187.agd",
+    0xB92F5747C0A36311: r"SB_AWD\120_149\FRENCH\PS2_0148.awd",
+    0xB93C44E41943F5D4: r"SB_AWD\0_29\GERMAN\PS2_0022.awd",
+    0xB947BCEB3DCEAB52: r"SB_AGD\90_119\FRENCH\NGC_0116.agd",
+    0xB9584B9F0665464A: r"SHELL\MOVIES\FRENCH\1_2_Mon.bik",
+    0xB95CE09A9D639D13: r"SB_AGD\150_179\ITALIAN\NGC_0169.agd",
+    0xB96D939C823EA21A: r"SB_AWD\210_239\GERMAN\PS2_0228.awd",
+    0xB96E13A783671004: r"SB_AWD\210_239\ENGLISH\NGC_0232.awd",
+    0xB973A53BA58EA023: r"SB_AGD\150_179\FRENCH\NGC_0172.agd",
+    0xB975D6377B27B0BD: r"ANIMGRPS\Lvl_14\Lvl_14D.ads",
+    0xB977CDA528D0BC2A: r"SB_AWD\90_119\ITALIAN\PS2_0090.awd",
+    0xB979BBCE20DA1A6F: r"SB_AGD\120_149\SPANISH\NGC_0147.agd",
+    0xB98EDB5F82E35DE7: r"SB_AWD\120_149\ITALIAN\NGC_0147.awd",
+    0xB995899C69380773: r"SB_AGD\30_59\GERMAN\NGC_0057.agd",
+    0xB99F111FDD7F2119: r"w_scoreboard.dds",
+    0xB9A3C2E228735BBC: r"LEVELS\L_3_3\global.dff",
+    0xB9B59B32B5074DD2: r"ANIMGRPS\Lvl_36\Lvl_36O.ads",
+    0xB9B63767FB256406: r"SB_AGD\180_209\FRENCH\NGC_0190.agd",
+    0xB9B7CBE2103BA583: r"SB_AGD\240_269\ITALIAN\PS2_0241.agd",
+    0xB9BB7E1D658DDD6E: r"SB_AGD\180_209\FRENCH\PS2_0191.agd",
+    0xB9BD0F19B6D90D3E: r"SB_AWD\180_209\ENGLISH\XBX_0194.awd",
+    0xB9C11C9477C3C268: r"SB_AGD\240_269\GERMAN\NGC_0249.agd",
+    0xB9C14E58394F8FEB: r"SHELL\FONTS\fb32.met",
+    0xB9C7A32095990A2B: r"SB_AGD\210_239\ENGLISH\NGC_0213.agd",
+    0xB9CA95B217CB0E0D: r"ANIMGRPS\Lvl_14\Lvl_14T.ads",
+    0xB9CC766979259E5C: r"WPNBANK\0_25\wbank_02.bin",
+    0xB9D38A9957A3AD25: r"SB_AGD\0_29\GERMAN\NGC_0017.agd",
+    0xB9D5551FDDAD2402: r"w_scoreboard.txd",
+    0xB9D7065DF8F5CA91: r"SB_AGD\240_269\ITALIAN\NGC_0268.agd",
+    0xB9DDACB54D40C8C0: r"SB_AGD\180_209\SPANISH\XBX_0185.agd",
+    0xB9DE3A99B0B57D63: r"SB_AGD\240_269\GERMAN\NGC_0260.agd",
+    0xB9EECFE130DD9921: r"ANIMGRPS\Lvl_33\Lvl_33Z.ads",
+    0xBA0B0FE63BFF57B5: r"SB_AWD\150_179\GERMAN\NGC_0172.awd",
+    0xBA0BB55C7E0EB284: r"SB_AWD\0_29\GERMAN\NGC_0023.awd",
+    0xBA1DE1647960B435: r"SB_AGD\180_209\SPANISH\PS2_0198.agd",
+    0xBA21EB12560914F3: r"SB_AWD\210_239\FRENCH\XBX_0228.awd",
+    0xBA28BCEDF6A6A323: r"SB_AGD\150_179\FRENCH\XBX_0167.agd",
+    0xBA2C3D5915F67BD0: r"SB_AWD\90_119\FRENCH\XBX_0112.awd",
+    0xBA301D39C363F445: r"LEVELS\L_3_5_C\level.dff",
+    0xBA39BDDB210C1E33: r"SB_AWD\240_269\ITALIAN\XBX_0242.awd",
+    0xBA3E22063BF9049B: r"font_symbols.tga",
+    0xBA438F5BCD80F6B1: r"ANIMGRPS\Lvl_33\Lvl_33J.ads",
+    0xBA47BD665CB8E2FF: r"SB_AWD\30_59\ENGLISH\PS2_0058.awd",
+    0xBA4C61812D94D7D2: r"gui_map6_death.dds",
+    0xBA5005491943D52D: r"SB_AWD\180_209\ENGLISH\NGC_0209.awd",
+    0xBA5A60DCAFC207D7: r"SB_AWD\180_209\ENGLISH\PS2_0196.awd",
+    0xBA5FCC39C38C8E71: r"LEVELS\L_3_5_C\level.rws",
+    0xBA60E52DED626FA5: r"SB_AGD\180_209\ENGLISH\PS2_0200.agd",
+    0xBA6B4E2F0FA84F78: r"SB_AGD\180_209\FRENCH\PS2_0193.agd",
+    0xBA6C05DF6B17266B: r"SB_AWD\240_269\FRENCH\XBX_0251.awd",
+    0xBA6F0EB0876865B7: r"SB_AGD\180_209\SPANISH\XBX_0191.agd",
+    0xBA7A2D7430945F14: r"SB_AGD\180_209\ITALIAN\PS2_0186.agd",
+    0xBA824D812DC244B1: r"gui_map6_death.txd",
+    0xBA8825B7EF56019E: r"SB_AWD\30_59\GERMAN\XBX_0050.awd",
+    0xBA8829221C36E88E: r"ANIMGRPS\Lvl_12\Lvl_12G.ads",
+    0xBA8893E1B106618D: r"SB_AWD\210_239\ITALIAN\XBX_0213.awd",
+    0xBA89163928D5592C: r"ANIMGRPS\Lvl_31\Lvl_31S.ads",
+    0xBA89727B234AE50A: r"WPNBANK\0_25\wbank_00.bin",
+    0xBA9931FBC1917BBD: r"SB_AGD\30_59\FRENCH\PS2_0041.agd",
+    0xBA99638F8F73D6E9: r"SB_AWD\210_239\ITALIAN\NGC_0215.awd",
+    0xBAA7E157D3282332: r"SB_AGD\120_149\ENGLISH\PS2_0125.agd",
+    0xBAB76C1CF54ED178: r"LEVELS\L_3_5_B\CLUMPS\cbank_01.bin",
+    0xBABC32757CACDEA3: r"SB_AGD\240_269\FRENCH\XBX_0259.agd",
+    0xBABDE48FEBCCCEB5: r"SB_AWD\150_179\ENGLISH\NGC_0170.awd",
+    0xBAC194FAC2F85E85: r"SB_AWD\150_179\SPANISH\NGC_0152.awd",
+    0xBAC85D1362EF0F23: r"SB_AWD\0_29\GERMAN\XBX_0022.awd",
+    0xBACB5444E741AEF2: r"SB_AWD\180_209\GERMAN\PS2_0197.awd",
+    0xBACF609E7B67C503: r"SB_AGD\0_29\SPANISH\PS2_0001.agd",
+    0xBADE56006BF7D962: r"SB_AGD\60_89\ENGLISH\PS2_0071.agd",
+    0xBADFB3B062ECF99A: r"SB_AWD\210_239\GERMAN\NGC_0225.awd",
+    0xBAE5836DA4CCBE4C: r"SB_AGD\120_149\GERMAN\NGC_0142.agd",
+    0xBAEE5A4C09368ECC: r"SB_AGD\0_29\GERMAN\PS2_0004.agd",
+    0xBAFD729F223797DE: r"SB_AGD\120_149\FRENCH\NGC_0128.agd",
+    0xBAFF934E2B8B8E82: r"SB_AWD\210_239\ENGLISH\XBX_0232.awd",
+    0xBB0057E8DFA14DEE: r"SB_AGD\30_59\SPANISH\PS2_0033.agd",
+    0xBB19D0741CAF9FD7: r"SB_AWD\90_119\GERMAN\NGC_0102.awd",
+    0xBB1B4A67F68D75C1: r"SB_AWD\60_89\GERMAN\XBX_0060.awd",
+    0xBB2BD4F10CE2D81B: r"SB_AGD\150_179\ITALIAN\XBX_0167.agd",
+    0xBB2BE22806D6D90C: r"SB_AGD\240_269\FRENCH\NGC_0261.agd",
+    0xBB2D4D44FF6D17EB: r"SB_AWD\150_179\FRENCH\XBX_0170.awd",
+    0xBB3480482236FE81: r"SB_AWD\120_149\SPANISH\XBX_0136.awd",
+    0xBB37D5C999703DC8: r"SB_AWD\30_59\GERMAN\XBX_0052.awd",
+    0xBB4071BCC296AF8D: r"SB_AWD\210_239\GERMAN\PS2_0216.awd",
+    0xBB4EC0E989230F9B: r"LEVELS\L_1_5_B\SECTIONS\s_9.rws",
+    0xBB55AEFD64DD8D6E: r"SB_AGD\90_119\GERMAN\XBX_0112.agd",
+    0xBB5F7B0A012EF95D: r"SB_AWD\180_209\SPANISH\PS2_0200.awd",
+    0xBB6153CFE6733ADA: r"SB_AGD\0_29\SPANISH\XBX_0014.agd",
+    0xBB669DAB26B1B15D: r"SB_AWD\150_179\FRENCH\NGC_0170.awd",
+    0xBB67BA352AB3BBF2: r"SB_AGD\60_89\GERMAN\PS2_0077.agd",
+    0xBB6A068735DF1530: r"SB_AGD\0_29\FRENCH\XBX_0001.agd",
+    0xBB6ACBE0DC47791D: r"SB_AGD\240_269\SPANISH\XBX_0248.agd",
+    0xBB705F4217C2C071: r"SB_AGD\180_209\ENGLISH\PS2_0194.agd",
+    0xBB7125AB9D14B239: r"SB_AWD\210_239\GERMAN\NGC_0239.awd",
+    0xBB71450C6D129A37: r"SB_AWD\150_179\SPANISH\NGC_0154.awd",
+    0xBB728F34BE3EF36E: r"SB_AWD\180_209\ENGLISH\XBX_0187.awd",
+    0xBB83F62D6CEA48F6: r"SB_AGD\210_239\GERMAN\NGC_0236.agd",
+    0xBB844793A0F9FE9A: r"SB_AWD\30_59\ITALIAN\XBX_0045.awd",
+    0xBB866E4C5B9FDD5E: r"SB_AGD\150_179\GERMAN\XBX_0155.agd",
+    0xBB88A5F7E67604D8: r"SB_AGD\150_179\ENGLISH\XBX_0173.agd",
+    0xBB89048720422B89: r"SB_AWD\210_239\ITALIAN\PS2_0221.awd",
+    0xBBB027FA89BBBFF8: r"SB_AGD\30_59\SPANISH\PS2_0031.agd",
+    0xBBB34259B10177C4: r"SB_AWD\30_59\GERMAN\PS2_0046.awd",
+    0xBBB3C039DA26CF0E: r"SB_AWD\60_89\SPANISH\PS2_0062.awd",
+    0xBBB8A41A51331E9E: r"SB_AWD\60_89\GERMAN\PS2_0082.awd",
+    0xBBBEBBD57C9E8CD9: r"SB_AGD\30_59\ITALIAN\XBX_0059.agd",
+    0xBBC58EC681A430C6: r"SB_AWD\120_149\ITALIAN\XBX_0139.awd",
+    0xBBD06E76377D731C: r"SB_AGD\150_179\SPANISH\PS2_0167.agd",
+    0xBBD12ABBA2759AEE: r"ANIMGRPS\Lvl_13\Lvl_13U.ads",
+    0xBBD22C9CCF2CC171: r"SB_AGD\30_59\ITALIAN\NGC_0039.agd",
+    0xBBD351A7B198C3C3: r"gui_map8_destroy.index",
+    0xBBD8286694186208: r"SB_AWD\150_179\SPANISH\PS2_0152.awd",
+    0xBBE6256F9CD9628A: r"SB_AWD\240_269\SPANISH\NGC_0256.awd",
+    0xBBF3FEFFAA1E1860: r"SB_AGD\240_269\ENGLISH\NGC_0250.agd",
+    0xBBFA9D110B6AC1AE: r"SB_AGD\30_59\ENGLISH\XBX_0041.agd",
+    0xBBFE3325F6590C8F: r"w_weaponsUS.txd",
+    0xBC03B91E4E711143: r"SB_AGD\120_149\ITALIAN\PS2_0120.agd",
+    0xBC057F0F0EF7FF78: r"SB_AGD\90_119\GERMAN\XBX_0110.agd",
+    0xBC07849C5FA1B626: r"SB_AWD\150_179\ITALIAN\PS2_0150.awd",
+    0xBC0CA0F6D500F543: r"SB_AGD\150_179\SPANISH\PS2_0177.agd",
+    0xBC149F252C4888EB: r"SB_AGD\240_269\GERMAN\XBX_0248.agd",
+    0xBC15B98EDB21B739: r"SB_AWD\30_59\ITALIAN\XBX_0059.awd",
+    0xBC18AE36EFAE9F20: r"SB_AGD\240_269\ENGLISH\XBX_0263.agd",
+    0xBC190779A6B16A90: r"SB_AGD\180_209\FRENCH\NGC_0192.agd",
+    0xBC1B2794ACA518A0: r"SB_AGD\180_209\FRENCH\NGC_0181.agd",
+    0xBC2B092E1BA5D4BE: r"SB_AWD\240_269\ITALIAN\PS2_0240.awd",
+    0xBC2F4D8F37F9A1A4: r"SB_AGD\180_209\ITALIAN\PS2_0195.agd",
+    0xBC351F25F6882D6C: r"w_weaponsUS.dds",
+    0xBC353E5E05B89C68: r"SB_AGD\150_179\GERMAN\XBX_0157.agd",
+    0xBC530B46436F1857: r"LEVELS\MP_10\global.dff",
+    0xBC5479CC98AE4EFC: r"SB_AWD\90_119\SPANISH\XBX_0107.awd",
+    0xBC551390AA7251CC: r"SB_AWD\120_149\FRENCH\NGC_0135.awd",
+    0xBC595A356C57343C: r"SB_AWD\180_209\GERMAN\NGC_0204.awd",
+    0xBC5E36CE62F86D84: r"SB_AWD\60_89\ITALIAN\XBX_0063.awd",
+    0xBC658E5FFBB2672C: r"SB_AWD\210_239\GERMAN\XBX_0225.awd",
+    0xBC68542BFB4D5AC8: r"SB_AWD\60_89\GERMAN\PS2_0080.awd",
+    0xBC72D5B69328DFB8: r"SB_AGD\210_239\ITALIAN\PS2_0211.agd",
+    0xBC7745ECBBED99A3: r"SB_AGD\180_209\ENGLISH\NGC_0197.agd",
+    0xBC77976AD7011B29: r"SB_AWD\240_269\SPANISH\NGC_0268.awd",
+    0xBC787F5D0D8C4C35: r"SB_AGD\120_149\ENGLISH\PS2_0144.agd",
+    0xBC8D72769723363D: r"UseNow.layout",
+    0xBC8E6D6AC1817202: r"SB_AWD\90_119\FRENCH\XBX_0114.awd",
+    0xBC990CB2D9521AD8: r"SB_AGD\150_179\FRENCH\PS2_0152.agd",
+    0xBC9B19D1C46678D2: r"SB_AWD\180_209\FRENCH\PS2_0201.awd",
+    0xBC9C13AF9FBE1AE1: r"SB_AWD\0_29\FRENCH\PS2_0007.awd",
+    0xBCABA804EB3FA65C: r"SB_AGD\90_119\FRENCH\NGC_0091.agd",
+    0xBCAD731B7B1D90DA: r"LEVELS\MP_7\level.rws",
+    0xBCB0F953A669F901: r"SB_AGD\120_149\SPANISH\PS2_0139.agd",
+    0xBCBCA042E0EFFE5A: r"ANIMGRPS\Lvl_24\Lvl_24E.ads",
+    0xBCC79027CF40C6D3: r"SB_AWD\120_149\ENGLISH\XBX_0138.awd",
+    0xBCCBFB10AAC0C3D0: r"SB_AWD\120_149\GERMAN\NGC_0133.awd",
+    0xBCD45BA127D07AFB: r"SB_AGD\150_179\ENGLISH\XBX_0152.agd",
+    0xBCD4D762173FE380: r"SB_AWD\180_209\ITALIAN\PS2_0199.awd",
+    0xBCDC721B7B44FFDE: r"LEVELS\MP_7\level.dff",
+    0xBCDCB234C3148419: r"SB_AGD\210_239\SPANISH\PS2_0229.agd",
+    0xBCDFE5D5775B2743: r"LEVELS\MP_1\SECTIONS\s_3.rws",
+    0xBCE42EC5F37C6500: r"ANIMGRPS\Lvl_22\Lvl_22S.ads",
+    0xBCE5B33668BFAB23: r"SB_AGD\210_239\ITALIAN\PS2_0238.agd",
+    0xBCE6058BE49930E3: r"SB_AWD\120_149\FRENCH\NGC_0129.awd",
+    0xBCEAC063299E2AF1: r"SB_AWD\120_149\SPANISH\XBX_0143.awd",
+    0xBCF76D849FBEDAE3: r"SB_AWD\150_179\GERMAN\XBX_0154.awd",
+    0xBD0390B79131E7F0: r"LEVELS\L_3_1_B\SECTIONS\s_8.rws",
+    0xBD0640D365E566C7: r"SB_AWD\120_149\ITALIAN\XBX_0123.awd",
+    0xBD1673EAEDD87D6A: r"SB_AGD\0_29\SPANISH\XBX_0007.agd",
+    0xBD1839FC085251E1: r"SB_AGD\180_209\ENGLISH\XBX_0188.agd",
+    0xBD1C1D76097AFC48: r"SB_AGD\90_119\FRENCH\PS2_0098.agd",
+    0xBD1EBADF419296CF: r"SB_AGD\60_89\ITALIAN\NGC_0079.agd",
+    0xBD2AC0C105F5FDB0: r"SB_AGD\210_239\GERMAN\PS2_0226.agd",
+    0xBD35FC629281C52C: r"SB_AGD\150_179\FRENCH\PS2_0167.agd",
+    0xBD390073A4632208: r"SB_AWD\0_29\ENGLISH\NGC_0029.awd",
+    0xBD3DC65432443574: r"LEVELS\L_1_2\SECTIONS\s_15.rws",
+    0xBD3EFC915C55CD51: r"SHELL\MOVIES\3_1_Mon.bik",
+    0xBD5046E1F6462B05: r"SB_AGD\90_119\ENGLISH\PS2_0105.agd",
+    0xBD64CB9A0EF8A6A0: r"SB_AWD\150_179\FRENCH\XBX_0159.awd",
+    0xBD6CD68D4C7D2426: r"SB_AWD\30_59\SPANISH\NGC_0036.awd",
+    0xBD824357A86B1716: r"LEVELS\L_3_5_C\SECTIONS\s_5.rws",
+    0xBD8954FA4A28143B: r"SB_AWD\150_179\SPANISH\XBX_0170.awd",
+    0xBD8969BC76A240D2: r"SB_AWD\120_149\ENGLISH\PS2_0125.awd",
+    0xBD8CFDB6D5CD47E4: r"SB_AWD\90_119\ITALIAN\PS2_0092.awd",
+    0xBD9076DE606F54AB: r"SB_AWD\150_179\ITALIAN\PS2_0177.awd",
+    0xBD9B258AA43E6EBA: r"SB_AWD\240_269\SPANISH\NGC_0241.awd",
+    0xBD9C6B182BA9A60C: r"SB_AWD\0_29\GERMAN\XBX_0018.awd",
+    0xBDA61D12A34C8F44: r"SB_AWD\90_119\SPANISH\PS2_0100.awd",
+    0xBDA75F2BACE2FE3B: r"SB_AWD\210_239\FRENCH\XBX_0219.awd",
+    0xBDA868F4DBA2AABB: r"PleaseInsertController.layout",
+    0xBDAD6920ECA08B40: r"SB_AWD\240_269\SPANISH\XBX_0252.awd",
+    0xBDAF6B026D88092D: r"SB_AGD\210_239\SPANISH\NGC_0237.agd",
+    0xBDB3B5E762207FAA: r"SB_AWD\90_119\GERMAN\NGC_0095.awd",
+    0xBDB8844B9842B46B: r"SB_AGD\210_239\ITALIAN\NGC_0235.agd",
+    0xBDBADC55553856D4: r"SB_AGD\0_29\ENGLISH\PS2_0028.agd",
+    0xBDC3A31C3103CF8C: r"AUDIO\ENGLISH\PS2_2m3.rws",
+    0xBDCAA6968F3269B4: r"AUDIO\SPANISH\NGC_1m3.rws",
+    0xBDD9D9F1A9F8F672: r"SB_AWD\30_59\GERMAN\PS2_0039.awd",
+    0xBDE08949230BBAEE: r"SB_AWD\240_269\ITALIAN\PS2_0253.awd",
+    0xBDE8C130AF8FE63A: r"SB_AWD\210_239\FRENCH\NGC_0216.awd",
+    0xBDE91E2C968AA23C: r"SB_AWD\120_149\ENGLISH\XBX_0142.awd",
+    0xBDEC566FA5F28C23: r"SB_AGD\240_269\ITALIAN\NGC_0266.agd",
+    0xBDEDB73FB98A07D6: r"SB_AGD\210_239\ENGLISH\PS2_0226.agd",
+    0xBDF6749F2AF1B80A: r"SB_AGD\30_59\GERMAN\XBX_0036.agd",
+    0xBE0046017114A6E3: r"SB_AWD\150_179\SPANISH\PS2_0168.awd",
+    0xBE021A4B3E508FA1: r"SB_AGD\150_179\ENGLISH\PS2_0171.agd",
+    0xBE0334B2F3CF6312: r"SB_AWD\180_209\ITALIAN\NGC_0192.awd",
+    0xBE09503AEC5E3E1E: r"SB_AWD\210_239\SPANISH\PS2_0231.awd",
+    0xBE0EA5909F6E72AF: r"SB_AWD\30_59\FRENCH\PS2_0047.awd",
+    0xBE0F49826CFB2CF8: r"SB_AWD\210_239\FRENCH\XBX_0234.awd",
+    0xBE15484F44BD85FC: r"SB_AGD\120_149\FRENCH\PS2_0149.agd",
+    0xBE204EA2585AAC48: r"SB_AGD\210_239\ITALIAN\NGC_0210.agd",
+    0xBE23E3F72807D358: r"SB_AGD\60_89\FRENCH\XBX_0081.agd",
+    0xBE3376CD4E00C150: r"ANIMGRPS\Lvl_13\Lvl_13S.ads",
+    0xBE35158C49EA474D: r"SB_AWD\30_59\SPANISH\XBX_0055.awd",
+    0xBE36D2E69A22F2D1: r"SB_AWD\150_179\ITALIAN\NGC_0174.awd",
+    0xBE3D6FED4FC27940: r"SB_AWD\240_269\SPANISH\PS2_0242.awd",
+    0xBE564F1155A94572: r"SB_AGD\240_269\ENGLISH\NGC_0256.agd",
+    0xBE5BD8B59C69BFCB: r"SB_AWD\60_89\ENGLISH\XBX_0064.awd",
+    0xBE5C593296B98032: r"SB_AWD\240_269\SPANISH\XBX_0254.awd",
+    0xBE5E3B1417A0C83F: r"SB_AGD\210_239\SPANISH\NGC_0231.agd",
+    0xBE639FC83C19042B: r"SB_AGD\180_209\FRENCH\PS2_0187.agd",
+    0xBE7AFE489B39CC32: r"SB_AGD\240_269\ENGLISH\XBX_0265.agd",
+    0xBE7D77A6583045B2: r"SB_AGD\180_209\FRENCH\NGC_0187.agd",
+    0xBE7E08C3F627E5DC: r"SB_AGD\90_119\GERMAN\NGC_0101.agd",
+    0xBE7F993AF3B27EC5: r"SB_AGD\210_239\ENGLISH\PS2_0210.agd",
+    0xBE81681EFBC4572D: r"SB_AGD\60_89\ENGLISH\PS2_0069.agd",
+    0xBE95E11CC899EF53: r"AUDIO\ITALIAN\XBX_2m1.rws",
+    0xBE997EC68130F1C8: r"SB_AGD\150_179\SPANISH\PS2_0152.agd",
+    0xBE9DE3F35E03231F: r"SB_AWD\210_239\ITALIAN\XBX_0215.awd",
+    0xBE9E6A4AD5D2218E: r"ANIMGRPS\Lvl_31\Lvl_31Q.ads",
+    0xBEA5A53950399BD1: r"LOC\US\GLOBAL.TXT",
+    0xBEAE3CC80C9EE20A: r"SB_AWD\240_269\ENGLISH\PS2_0244.awd",
+    0xBEB9004C96787A48: r"SB_AWD\210_239\SPANISH\PS2_0233.awd",
+    0xBED153C3A9D7FAA5: r"LOC\US\MULTILVL.LOC",
+    0xBED525327A049AEF: r"SB_AWD\120_149\GERMAN\XBX_0132.awd",
+    0xBEE4659DF403DFDF: r"SB_AWD\30_59\SPANISH\XBX_0053.awd",
+    0xBEEBC60316498F6A: r"ANIMGRPS\Lvl_26\Lvl_26Q.ads",
+    0xBEEC5FFEF9DB6E32: r"SB_AWD\240_269\SPANISH\PS2_0244.awd",
+    0xBEEC7D15D8957903: r"gui_map4_death.txd",
+    0xBEEC924D372E3530: r"SHELL\LOAD\L_1_1.txd",
+    0xBEF43FDD82B39CCC: r"LEVELS\L_3_1\SECTIONS\s_5.rws",
+    0xBEF74E39507F119B: r"LOC\US\GLOBAL.LOC",
+    0xBF0550E0A3B9F8A9: r"SB_AWD\120_149\ENGLISH\NGC_0134.awd",
+    0xBF08B3F07366FD60: r"SB_AGD\60_89\ENGLISH\XBX_0070.agd",
+    0xBF1064B5495B77F3: r"LEVELS\L_3_5\SECTIONS\s_6.rws",
+    0xBF223EB83929B9AE: r"SB_AWD\120_149\SPANISH\XBX_0126.awd",
+    0xBF22C115D8C37C10: r"gui_map4_death.dds",
+    0xBF2D0297878D7512: r"SB_AWD\180_209\ITALIAN\XBX_0183.awd",
+    0xBF2E2B22564BBA02: r"SB_AWD\120_149\GERMAN\NGC_0135.awd",
+    0xBF2E694C9DCB3DD7: r"SB_AGD\210_239\ENGLISH\PS2_0216.agd",
+    0xBF3975D6C40E2EFC: r"SB_AGD\240_269\ITALIAN\PS2_0268.agd",
+    0xBF3A09B44938CDEE: r"LEVELS\L_1_3_B\CLUMPS\cbank_03.bin",
+    0xBF3DC906FCC329E4: r"AUDIO\FRENCH\NGC_4m2.rws",
+    0xBF3F10C05F4AA71E: r"ANIMGRPS\Lvl_35\Lvl_35I.ads",
+    0xBF41A502B9E07335: r"SB_AGD\150_179\ITALIAN\XBX_0165.agd",
+    0xBF45643058280636: r"SB_AGD\30_59\ITALIAN\PS2_0033.agd",
+    0xBF4805FCB42EDF1C: r"SB_AWD\180_209\SPANISH\XBX_0192.awd",
+    0xBF4AAFD0C245A743: r"SB_AGD\0_29\ITALIAN\XBX_0002.agd",
+    0xBF4BB4455B5635B8: r"LEVELS\MP_2\SECTIONS\s_1.rws",
+    0xBF525347BC445693: r"SB_AWD\90_119\GERMAN\PS2_0114.awd",
+    0xBF55C1CE6F93711F: r"SB_AWD\210_239\GERMAN\PS2_0210.awd",
+    0xBF6BC040BA4EDF85: r"SB_AWD\30_59\ENGLISH\NGC_0057.awd",
+    0xBF6F99A06962497B: r"SB_AGD\60_89\FRENCH\XBX_0064.agd",
+    0xBF769FC34E32D64B: r"SB_AWD\180_209\ENGLISH\NGC_0180.awd",
+    0xBF7FD698E2DCB0C2: r"SB_AGD\0_29\FRENCH\XBX_0007.agd",
+    0xBF80F79112E6B98B: r"SB_AGD\150_179\ENGLISH\XBX_0167.agd",
+    0xBF827BBBA20E4220: r"SHELL\LOAD\MP_2_TDM.txd",
+    0xBF83E3D7E4DD3DAA: r"SB_AWD\150_179\FRENCH\PS2_0172.awd",
+    0xBF87383C22AF3AB0: r"SB_AGD\240_269\FRENCH\PS2_0242.agd",
+    0xBF887F466B3CC4D8: r"SB_AWD\180_209\ENGLISH\XBX_0185.awd",
+    0xBF89CE24AE2B9CA9: r"SB_AGD\210_239\SPANISH\PS2_0236.agd",
+    0xBF939C10FC7F39BE: r"SB_AWD\120_149\GERMAN\PS2_0145.awd",
+    0xBF9711B985F76DB8: r"SB_AWD\30_59\GERMAN\XBX_0041.awd",
+    0xBF99463F19E70A00: r"SB_AGD\210_239\GERMAN\NGC_0234.agd",
+    0xBFA8B3FBC7C1FF0D: r"SB_AGD\120_149\ENGLISH\PS2_0135.agd",
+    0xBFADA4656C9D6F1F: r"SB_AGD\60_89\SPANISH\NGC_0079.agd",
+    0xBFAF429DF7A4F50B: r"SB_AWD\60_89\SPANISH\NGC_0088.awd",
+    0xBFB108620A8012BC: r"ANIMGRPS\Lvl_21\Lvl_21Y.ads",
+    0xBFB7C12EE62F9816: r"SB_AWD\60_89\ENGLISH\PS2_0088.awd",
+    0xBFBB0256C5258C2E: r"LEVELS\L_1_5_B\CLUMPS\cbank_05.bin",
+    0xBFC1134F59B41030: r"SB_AWD\150_179\SPANISH\XBX_0159.awd",
+    0xBFC1AE0D38C4DE1B: r"SB_AWD\90_119\FRENCH\NGC_0113.awd",
+    0xBFC5B4BCBD18D3D5: r"SB_AGD\90_119\SPANISH\PS2_0112.agd",
+    0xBFC8314C228F18E1: r"SB_AGD\120_149\SPANISH\XBX_0136.agd",
+    0xBFCFD0D3B470969B: r"SB_AGD\150_179\GERMAN\NGC_0170.agd",
+    0xBFD12EC9E342AF18: r"SB_AWD\120_149\SPANISH\XBX_0124.awd",
+    0xBFEDDCD209635FC0: r"ANIMGRPS\Lvl_35\Lvl_35O.ads",
+    0xBFF1126DCBFFC31B: r"SB_AWD\60_89\GERMAN\NGC_0060.awd",
+    0xBFF121B5475FF84D: r"SB_AGD\240_269\ENGLISH\NGC_0264.agd",
+    0xBFF4B44202419F40: r"SB_AGD\30_59\ITALIAN\PS2_0031.agd",
+    0xBFFEBE1C8E46720C: r"SB_AGD\0_29\ITALIAN\PS2_0028.agd",
+    0xC0022E343DF0BA3C: r"SB_AGD\180_209\GERMAN\NGC_0204.agd",
+    0xC00F6D22B866A9B8: r"SB_AGD\30_59\ENGLISH\XBX_0043.agd",
+    0xC012594D9E203FE2: r"SB_AWD\240_269\SPANISH\XBX_0247.awd",
+    0xC0145B2F1F07BE4F: r"SB_AGD\210_239\SPANISH\NGC_0222.agd",
+    0xC0169CB2D41F6F55: r"SB_AGD\240_269\SPANISH\PS2_0265.agd",
+    0xC01B705264691B37: r"SB_AWD\30_59\ENGLISH\NGC_0051.awd",
+    0xC01CD4AE0C9E77B0: r"SB_AWD\150_179\ITALIAN\PS2_0152.awd",
+    0xC023531922280BDB: r"SB_AGD\180_209\GERMAN\PS2_0202.agd",
+    0xC024067E7E74494D: r"SB_AWD\180_209\GERMAN\PS2_0198.awd",
+    0xC02564E6BF029016: r"SB_AGD\90_119\ENGLISH\PS2_0119.agd",
+    0xC0353A545425866B: r"SHELL\MOVIES\SPANISH\Intro.bik",
+    0xC03AB246E8986B57: r"SHELL\MOVIES\2_2_Mon.bik",
+    0xC03CF2CE4B855DDB: r"SB_AWD\150_179\ITALIAN\PS2_0168.awd",
+    0xC0457024E2C5DA8A: r"SHELL\FEND\INSTANCE\SKY\PROFILE.TXD",
+    0xC0510A932F3A4E7C: r"SB_AGD\0_29\SPANISH\PS2_0028.agd",
+    0xC059B45705BFDB42: r"LEVELS\MP_2\SECTIONS\s_7.rws",
+    0xC0633CE31403EE3A: r"SB_AWD\240_269\ENGLISH\PS2_0257.awd",
+    0xC0649AFEFB7EF908: r"SB_AGD\90_119\GERMAN\XBX_0107.agd",
+    0xC06AC073F4008FA3: r"SB_AGD\60_89\ITALIAN\XBX_0073.agd",
+    0xC06CB94C26F357D8: r"SB_AGD\30_59\GERMAN\PS2_0042.agd",
+    0xC070A5A24AF91849: r"SB_AWD\30_59\FRENCH\PS2_0045.awd",
+    0xC07584CE673345E7: r"SB_AGD\90_119\SPANISH\PS2_0114.agd",
+    0xC07BC59CC7E19EA3: r"SB_AWD\210_239\SPANISH\XBX_0219.awd",
+    0xC07DD8B630B9481E: r"w_flagsGB.index",
+    0xC07E81CF5910579B: r"SB_AWD\240_269\FRENCH\XBX_0242.awd",
+    0xC09549B9C58C16E8: r"SB_AWD\180_209\ITALIAN\NGC_0200.awd",
+    0xC0971846A7332ECA: r"SB_AGD\60_89\SPANISH\PS2_0066.agd",
+    0xC09CA56E625145FD: r"SB_AWD\150_179\SPANISH\NGC_0163.awd",
+    0xC0A2601A01422DE2: r"SB_AWD\240_269\SPANISH\PS2_0257.awd",
+    0xC0A4B513B31E1EA4: r"SB_AGD\210_239\ITALIAN\XBX_0230.agd",
+    0xC0B163C14CBADC73: r"SB_AWD\0_29\FRENCH\PS2_0009.awd",
+    0xC0B390024FFA162A: r"ANIMGRPS\Lvl_11\Lvl_11I.ads",
+    0xC0B3C42F20E8411B: r"SB_AWD\30_59\ITALIAN\PS2_0043.awd",
+    0xC0C66CC47E39E167: r"SB_AGD\240_269\SPANISH\PS2_0263.agd",
+    0xC0C6C96553679413: r"SB_AGD\120_149\SPANISH\PS2_0137.agd",
+    0xC0D2232ACC40CAF5: r"SB_AGD\180_209\GERMAN\PS2_0200.agd",
+    0xC0D2F1A67FB18D48: r"SB_AGD\210_239\ITALIAN\PS2_0224.agd",
+    0xC0DB6CD92AC47EEE: r"SB_AGD\120_149\ITALIAN\XBX_0144.agd",
+    0xC0E6584BAD440C4F: r"SB_AGD\60_89\ENGLISH\PS2_0078.agd",
+    0xC0E78773D8198852: r"SB_AGD\210_239\FRENCH\XBX_0225.agd",
+    0xC0EA60B17B85ECB4: r"Searching.layout",
+    0xC0EAFB733296C0E0: r"ANIMGRPS\Lvl_33\Lvl_33O.ads",
+    0xC0ECF3CD0E17250C: r"SB_AWD\180_209\GERMAN\PS2_0205.awd",
+    0xC0F76254BB3AABDE: r"SB_AGD\240_269\FRENCH\NGC_0252.agd",
+    0xC10BF09EF6E21D27: r"AUDIO\ITALIAN\NGC_4m1.rws",
+    0xC10F277DB2475A83: r"SB_AGD\30_59\SPANISH\NGC_0055.agd",
+    0xC10FE2196861DB1D: r"LEVELS\L_2_1\global.dff",
+    0xC118A32FB8435167: r"SB_AGD\210_239\GERMAN\PS2_0218.agd",
+    0xC11F67103C9DDB5B: r"SB_AGD\90_119\GERMAN\NGC_0098.agd",
+    0xC121FB086712CD6B: r"SB_AWD\120_149\FRENCH\PS2_0128.awd",
+    0xC12A4478F6E1B858: r"ANIMGRPS\Lvl_34\Lvl_34I.ads",
+    0xC12C43FC9AD61804: r"SB_AGD\0_29\SPANISH\XBX_0005.agd",
+    0xC13825442590F289: r"SB_AWD\120_149\GERMAN\XBX_0130.awd",
+    0xC13D735B5FA22FD6: r"SB_AGD\120_149\ITALIAN\NGC_0142.agd",
+    0xC13F65CA306F62CA: r"SB_AGD\30_59\ITALIAN\XBX_0030.agd",
+    0xC14090D2B2F39942: r"SB_AGD\210_239\GERMAN\PS2_0220.agd",
+    0xC1426BB8B2EDB318: r"SB_AGD\90_119\ITALIAN\NGC_0112.agd",
+    0xC149382281D447AC: r"ANIMGRPS\Lvl_15\Lvl_15W.ads",
+    0xC14B26F2622F0712: r"SB_AGD\90_119\ITALIAN\PS2_0098.agd",
+    0xC14B75800C6A048F: r"SB_AWD\150_179\SPANISH\NGC_0165.awd",
+    0xC15D96DF6EA7D211: r"SB_AWD\60_89\ITALIAN\PS2_0087.awd",
+    0xC15FE2E72040E964: r"SB_AWD\120_149\GERMAN\XBX_0148.awd",
+    0xC162264D9FA5C6FA: r"SB_AGD\90_119\ENGLISH\XBX_0105.agd",
+    0xC16616F3A343C617: r"SB_AGD\90_119\ENGLISH\PS2_0103.agd",
+    0xC16B04021EF22A72: r"SB_AGD\60_89\ENGLISH\XBX_0076.agd",
+    0xC17DFDB0E33ADD3A: r"SB_AGD\90_119\FRENCH\PS2_0108.agd",
+    0xC182269EF979E5B0: r"SB_AWD\30_59\SPANISH\NGC_0034.awd",
+    0xC18463130241E6BC: r"SB_AGD\120_149\ITALIAN\PS2_0149.agd",
+    0xC184BA1A65499CB6: r"SB_AWD\30_59\ENGLISH\NGC_0047.awd",
+    0xC18914FE87E6416B: r"SB_AGD\120_149\ENGLISH\XBX_0145.agd",
+    0xC18A42225DD79305: r"SB_AGD\60_89\ENGLISH\XBX_0088.agd",
+    0xC18B3CEAD4DEF0F8: r"SB_AGD\120_149\ITALIAN\XBX_0146.agd",
+    0xC1A6326665536AE8: r"SB_AGD\240_269\FRENCH\NGC_0250.agd",
+    0xC1A87BF527BD60DC: r"SB_AWD\60_89\FRENCH\XBX_0074.awd",
+    0xC1B1159C513C4034: r"SB_AWD\240_269\SPANISH\NGC_0243.awd",
+    0xC1B186BFA46D3ED3: r"LEVELS\L_3_1_C\SECTIONS\s_11.rws",
+    0xC1B7546A5EE911F4: r"SB_AGD\0_29\ITALIAN\NGC_0025.agd",
+    0xC1BC769F11ACE7AB: r"AUDIO\FRENCH\XBX_4s1.rws",
+    0xC1C8E5F90F1D0B64: r"SB_AWD\90_119\GERMAN\NGC_0097.awd",
+    0xC1D0D7C56A971B69: r"SB_AGD\30_59\ITALIAN\XBX_0046.agd",
+    0xC1D25C14A9370CFB: r"LEVELS\MP_7\SECTIONS\s_12.rws",
+    0xC1D5B1E119F9764C: r"SB_AWD\0_29\FRENCH\PS2_0020.awd",
+    0xC1E2C7A2BE710D25: r"SB_AGD\150_179\ENGLISH\XBX_0165.agd",
+    0xC1E33DBD6EE76C5D: r"SB_AWD\180_209\ITALIAN\PS2_0183.awd",
+    0xC1E58B933A192C54: r"SB_AWD\150_179\ENGLISH\XBX_0168.awd",
+    0xC1E79F84EE0AC503: r"ANIMGRPS\Lvl_22\Lvl_22L.ads",
+    0xC1EDC2EEEA0DBD26: r"LEVELS\L_1_3_B\SECTIONS\s_15.rws",
+    0xC1F303C44832652B: r"LEVELS\MP_1\SECTIONS\s_10.rws",
+    0xC1F6795AD0098C58: r"SB_AWD\240_269\ITALIAN\PS2_0251.awd",
+    0xC1FEB1425C8DB7B4: r"SB_AWD\210_239\FRENCH\NGC_0214.awd",
+    0xC2076F28C3FC5C30: r"SB_AGD\150_179\GERMAN\NGC_0159.agd",
+    0xC21C48FEA1D3F03C: r"SB_AGD\0_29\SPANISH\NGC_0018.agd",
+    0xC21C4A964E6D388A: r"SB_AWD\240_269\FRENCH\NGC_0241.awd",
+    0xC21E80C9A30B6E15: r"SB_AGD\150_179\FRENCH\XBX_0158.agd",
+    0xC21FE08EFB65D233: r"SB_AGD\60_89\ITALIAN\XBX_0064.agd",
+    0xC2247E1EE450E4B5: r"SB_AWD\90_119\FRENCH\NGC_0111.awd",
+    0xC22A2860F1B988BE: r"SB_AGD\120_149\FRENCH\PS2_0147.agd",
+    0xC2303064D80B1771: r"SB_AWD\180_209\ENGLISH\PS2_0204.awd",
+    0xC230B582799136EC: r"SB_AGD\30_59\SPANISH\NGC_0049.agd",
+    0xC2344324AC5C747E: r"SB_AGD\120_149\ITALIAN\PS2_0147.agd",
+    0xC235A0B0A163B531: r"AUDIO\ITALIAN\NGC_4m3.rws",
+    0xC2519D0F598257A5: r"ANIMGRPS\Lvl_21\Lvl_21L.ads",
+    0xC253E27F778BC9B5: r"SB_AWD\60_89\GERMAN\NGC_0062.awd",
+    0xC25FC3B81A971BE3: r"SB_AGD\210_239\FRENCH\NGC_0213.agd",
+    0xC268D428B0D52BFC: r"SB_AWD\60_89\SPANISH\XBX_0085.awd",
+    0xC26E6FC4F8867BBA: r"AUDIO\GERMAN\NGC_4m2.rws",
+    0xC26FAE2F4935D82C: r"SB_AWD\90_119\ENGLISH\XBX_0110.awd",
+    0xC271A8C749675AE5: r"SB_AWD\60_89\ENGLISH\XBX_0066.awd",
+    0xC274B88247D28506: r"gui_map9_death.index",
+    0xC286759F637BE44A: r"SB_AWD\180_209\GERMAN\NGC_0192.awd",
+    0xC290B4247EF751D9: r"LEVELS\L_3_3\SECTIONS\s_6.rws",
+    0xC296739698238B7D: r"ANIMGRPS\Lvl_22\Lvl_22J.ads",
+    0xC2968A1F5FA6AB37: r"SB_AWD\60_89\SPANISH\XBX_0068.awd",
+    0xC29911AB962F4C08: r"SB_AWD\240_269\GERMAN\XBX_0269.awd",
+    0xC2A37A82804F6BD2: r"SB_AGD\240_269\SPANISH\PS2_0244.agd",
+    0xC2AB733BCBE26297: r"SB_AWD\60_89\ENGLISH\PS2_0070.awd",
+    0xC2ADBC918894F129: r"SB_AWD\240_269\FRENCH\NGC_0255.awd",
+    0xC2B151E5C2E92F7B: r"SB_AWD\210_239\SPANISH\PS2_0227.awd",
+    0xC2B689B4A22EE63C: r"SB_AWD\30_59\ITALIAN\NGC_0038.awd",
+    0xC2CC29104BEE7DFE: r"SB_AGD\0_29\SPANISH\NGC_0016.agd",
+    0xC2D598641E767E4A: r"AUDIO\ENGLISH\ASLocate.agd",
+    0xC2E0248F43224291: r"LEVELS\L_1_1\CLUMPS\cbank_01.bin",
+    0xC2E151E1049C5E35: r"SB_AWD\240_269\FRENCH\XBX_0240.awd",
+    0xC2EC331134C89BCD: r"ANIMGRPS\Lvl_22\Lvl_22Z.ads",
+    0xC2F0B72C691A66BC: r"LEVELS\L_3_5_C\SECTIONS\s_12.rws",
+    0xC2F5B0EDBA58DBD2: r"SB_AGD\210_239\GERMAN\PS2_0233.agd",
+    0xC301B59B13D130FF: r"SB_AWD\150_179\SPANISH\NGC_0176.awd",
+    0xC304DD6280D44532: r"VoteOptions.layout",
+    0xC3164DA1427F7C38: r"CoDSplashLegal.index",
+    0xC3169440CC7447B5: r"SB_AWD\30_59\ITALIAN\PS2_0041.awd",
+    0xC31DA192360FFA79: r"SB_AWD\30_59\FRENCH\PS2_0052.awd",
+    0xC322003D68FDC81C: r"SHELL\MOVIES\EndGame.bik",
+    0xC3272E30F37C6BE1: r"SB_AWD\60_89\SPANISH\PS2_0087.awd",
+    0xC329CFB6CE4985B0: r"SB_AGD\0_29\FRENCH\PS2_0011.agd",
+    0xC3328C2B412B90CD: r"SB_AWD\30_59\GERMAN\PS2_0036.awd",
+    0xC338114544BE6345: r"SB_AWD\150_179\GERMAN\XBX_0174.awd",
+    0xC3390D3012F4AF6B: r"LEVELS\MP_10\SECTIONS\s_3.rws",
+    0xC33AB2CFE690792D: r"SB_AWD\60_89\GERMAN\XBX_0082.awd",
+    0xC33C24E6ADA1A969: r"SB_AGD\120_149\GERMAN\PS2_0142.agd",
+    0xC33C255F289B49E8: r"SB_AWD\120_149\FRENCH\PS2_0145.awd",
+    0xC349E9DA4C9A3D0D: r"SB_AGD\120_149\ITALIAN\NGC_0138.agd",
+    0xC34CAF74C935D1CA: r"SB_AGD\60_89\GERMAN\NGC_0083.agd",
+    0xC34E55E8710A31BE: r"SB_AGD\240_269\ITALIAN\PS2_0266.agd",
+    0xC3502D79F8D04251: r"SB_AWD\240_269\ITALIAN\NGC_0268.awd",
+    0xC356B6FFE3261396: r"LEVELS\L_1_5\SECTIONS\s_10.rws",
+    0xC364C96C4385CF13: r"SB_AWD\210_239\GERMAN\NGC_0219.awd",
+    0xC36ACB05A25EEF4E: r"SB_AWD\180_209\SPANISH\PS2_0193.awd",
+    0xC37EC4C7C1727C0F: r"SB_AWD\180_209\ITALIAN\XBX_0199.awd",
+    0xC381AAEB0A4795B9: r"SB_AGD\150_179\ITALIAN\PS2_0166.agd",
+    0xC38C6FD4FB307165: r"SB_AWD\180_209\ENGLISH\NGC_0182.awd",
+    0xC39913E991D9C964: r"SB_AWD\150_179\FRENCH\PS2_0170.awd",
+    0xC39CFC8EABB7267B: r"LEVELS\L_3_5\GodData.dff",
+    0xC39D084DCFACD642: r"SB_AGD\240_269\FRENCH\PS2_0244.agd",
+    0xC3A77945AD4C5BF9: r"SB_AGD\150_179\SPANISH\NGC_0174.agd",
+    0xC3ABB49CF1CB0B80: r"w_playonline.dds",
+    0xC3BA6D5BBDEB2805: r"SB_AGD\210_239\SPANISH\XBX_0235.agd",
+    0xC3CDC15B8EB4FB8D: r"gui_map6_death.index",
+    0xC3D11992EBF20A2A: r"SB_AGD\0_29\FRENCH\NGC_0005.agd",
+    0xC3D51137FD9200E2: r"SB_AGD\210_239\ENGLISH\NGC_0216.agd",
+    0xC3D60C2654724805: r"LEVELS\MP_7\SECTIONS\s_10.rws",
+    0xC3DE4739053CBA74: r"CodBack_CreateSession.index",
+    0xC3E1909CF1F85E53: r"w_playonline.txd",
+    0xC3E1DC3CEB45295F: r"SB_AWD\30_59\GERMAN\PS2_0030.awd",
+    0xC3E36DDD94BB6BE4: r"SB_AGD\90_119\FRENCH\PS2_0119.agd",
+    0xC3E5A0E5616E31B5: r"SB_AGD\150_179\GERMAN\NGC_0172.agd",
+    0xC3FF5AA5EB3BB40C: r"SB_AGD\180_209\ITALIAN\XBX_0181.agd",
+    0xC407BEBBE4D75F6B: r"SB_AGD\30_59\ENGLISH\XBX_0057.agd",
+    0xC4109AAE1FA47295: r"SB_AWD\120_149\SPANISH\PS2_0122.awd",
+    0xC4149E2E3B4428CE: r"SB_AGD\0_29\ITALIAN\PS2_0026.agd",
+    0xC418BC129250EDAA: r"SB_AGD\210_239\FRENCH\XBX_0214.agd",
+    0xC419CE1CC9363DE9: r"SB_AWD\90_119\ITALIAN\XBX_0111.awd",
+    0xC429BB40CC049A89: r"SB_AGD\210_239\SPANISH\NGC_0220.agd",
+    0xC42D16A3838D45CA: r"SB_AGD\240_269\SPANISH\NGC_0256.agd",
+    0xC42EFDC64AE5965D: r"SB_AWD\120_149\GERMAN\NGC_0125.awd",
+    0xC430E311AF3E1852: r"SB_AWD\150_179\SPANISH\XBX_0175.awd",
+    0xC435DA17CB42A8AD: r"SB_AGD\210_239\FRENCH\XBX_0235.agd",
+    0xC45EC6845FA8C7FB: r"SB_AWD\150_179\ENGLISH\PS2_0151.awd",
+    0xC45FF262FD588122: r"SB_AGD\210_239\ITALIAN\NGC_0230.agd",
+    0xC460646EA676D636: r"SHELL\FONTS\lta18.met",
+    0xC462BD41BD764775: r"LEVELS\MP_10\SECTIONS\s_1.rws",
+    0xC46316AA97D46451: r"SB_AGD\210_239\FRENCH\PS2_0229.agd",
+    0xC465EAA4DC36513E: r"SB_AGD\0_29\SPANISH\PS2_0026.agd",
+    0xC46F8912A4EF5748: r"SB_AGD\30_59\ENGLISH\XBX_0036.agd",
+    0xC4700DE1E5BF69B0: r"SB_AGD\150_179\GERMAN\XBX_0175.agd",
+    0xC4792CF4C101BFB4: r"SB_AWD\240_269\ENGLISH\PS2_0255.awd",
+    0xC47AAC4250F04BA7: r"SB_AWD\30_59\ENGLISH\NGC_0042.awd",
+    0xC47DD6AA0D4A1483: r"SB_AWD\0_29\SPANISH\XBX_0011.awd",
+    0xC47FE9A4960AC9C4: r"SB_AGD\0_29\FRENCH\NGC_0007.agd",
+    0xC48C8024F817292B: r"LEVELS\MP_5\global.dff",
+    0xC48CEDDF6B927728: r"SB_AWD\120_149\SPANISH\NGC_0140.awd",
+    0xC49E34C81075B54C: r"SB_AWD\0_29\ENGLISH\XBX_0005.awd",
+    0xC49FF1854BBF9E3C: r"SB_AGD\120_149\GERMAN\XBX_0139.agd",
+    0xC4A656D2605EAE1A: r"SB_AGD\90_119\ITALIAN\NGC_0091.agd",
+    0xC4A6A013298A7274: r"SB_AGD\30_59\FRENCH\PS2_0044.agd",
+    0xC4AD0E8F2484D4E3: r"SB_AGD\150_179\SPANISH\XBX_0152.agd",
+    0xC4B49573BCDF42E5: r"LEVELS\L_1_3_A\SECTIONS\s_11.rws",
+    0xC4BE889EBDB4FE69: r"SB_AGD\240_269\SPANISH\NGC_0268.agd",
+    0xC4BF8ABFC9BD6807: r"SB_AWD\120_149\SPANISH\PS2_0124.awd",
+    0xC4C212BC738CF006: r"SB_AWD\60_89\ITALIAN\NGC_0074.awd",
+    0xC4C78C243C69AD44: r"SB_AGD\210_239\FRENCH\XBX_0216.agd",
+    0xC4C87D4BA51F36D4: r"SB_AWD\180_209\SPANISH\NGC_0204.awd",
+    0xC4D888D27A0F4A9D: r"SB_AGD\0_29\FRENCH\XBX_0008.agd",
+    0xC4DEA0FDFF3962A8: r"SB_AWD\150_179\ITALIAN\NGC_0179.awd",
+    0xC4E4AA29755B67BF: r"SB_AGD\210_239\FRENCH\XBX_0233.agd",
+    0xC4EA0A450A84A38A: r"AUDIO\ENGLISH\XBX_1s1.rws",
+    0xC4F14D9103F1BFC3: r"ANIMGRPS\Lvl_35\Lvl_35P.ads",
+    0xC50ADE1A4ADB08E6: r"SHELL\FEND\INSTANCE\XBOX\FEND.TXD",
+    0xC51266BC41EDFCE3: r"SB_AGD\210_239\FRENCH\PS2_0227.agd",
+    0xC51CD8E8D047766A: r"ANIMGRPS\Lvl_32\Lvl_32O.ads",
+    0xC51ED35416FDC585: r"SB_AGD\180_209\SPANISH\XBX_0207.agd",
+    0xC51FEDE551B6A4ED: r"SB_AWD\150_179\FRENCH\XBX_0150.awd",
+    0xC520E683B083FC88: r"SB_AGD\60_89\SPANISH\NGC_0083.agd",
+    0xC5274C9E67938517: r"SB_AWD\60_89\ENGLISH\NGC_0084.awd",
+    0xC528D4560E14B04C: r"SB_AWD\0_29\GERMAN\PS2_0004.awd",
+    0xC52F26C34A9C9463: r"SB_AWD\0_29\ENGLISH\XBX_0019.awd",
+    0xC53A801ECE92149C: r"SB_AGD\30_59\ENGLISH\PS2_0044.agd",
+    0xC53F988AA3DE803A: r"ANIMGRPS\Lvl_34\Lvl_34K.ads",
+    0xC540040749C6E133: r"SB_AGD\90_119\ITALIAN\PS2_0107.agd",
+    0xC546253BCDA63023: r"SB_AWD\240_269\FRENCH\PS2_0249.awd",
+    0xC54FD196F5DA2BFE: r"SB_AGD\120_149\GERMAN\XBX_0137.agd",
+    0xC5522868D71218D2: r"SB_AGD\240_269\FRENCH\PS2_0257.agd",
+    0xC552880E8E708DB2: r"LOC\SP\INGAME.LOC",
+    0xC554F4B978D91E6F: r"SB_AWD\0_29\ITALIAN\NGC_0026.awd",
+    0xC555E60CB1B61743: r"SB_AGD\30_59\FRENCH\PS2_0032.agd",
+    0xC55E8C342ED1100E: r"ANIMGRPS\Lvl_15\Lvl_15U.ads",
+    0xC577765F4CA28814: r"SB_AGD\90_119\ENGLISH\XBX_0107.agd",
+    0xC5838E84014FA5AB: r"SB_AGD\120_149\ITALIAN\XBX_0138.agd",
+    0xC58A155B0AD52669: r"SB_AGD\180_209\ITALIAN\NGC_0205.agd",
+    0xC596558F1492DEC1: r"SB_AWD\210_239\GERMAN\PS2_0230.awd",
+    0xC59EEEC6077FB2A4: r"AUDIO\ENGLISH\NGC_4m2.rws",
+    0xC5A99F93C73A3561: r"SB_AWD\120_149\ITALIAN\NGC_0134.awd",
+    0xC5AB546C96D2F495: r"SB_AGD\60_89\FRENCH\NGC_0082.agd",
+    0xC5AFB057210C9E98: r"ANIMGRPS\Lvl_23\Lvl_23U.ads",
+    0xC5C295856748E78F: r"LEVELS\L_1_3_A\SECTIONS\s_17.rws",
+    0xC5C766909D04D13D: r"LEVELS\MP_2\SECTIONS\s_8.rws",
+    0xC5CC366F61413FD5: r"AUDIO\SPANISH\XBX_2s1.rws",
+    0xC5E04658052F49AF: r"SB_AWD\210_239\ENGLISH\PS2_0234.awd",
+    0xC5E19F077E6B305D: r"SB_AWD\180_209\GERMAN\XBX_0207.awd",
+    0xC5E4B7556614EB45: r"SB_AWD\180_209\ITALIAN\PS2_0208.awd",
+    0xC5F5BE0BE4C1ACFB: r"SB_AGD\150_179\ENGLISH\PS2_0151.agd",
+    0xC5FEC2FEA946AC93: r"SB_AWD\240_269\ENGLISH\XBX_0251.awd",
+    0xC6091C1D0895D43F: r"SB_AWD\180_209\FRENCH\PS2_0208.awd",
+    0xC6092EBC3C047E0A: r"SB_AGD\240_269\ENGLISH\XBX_0254.agd",
+    0xC62483EB03B11628: r"SB_AWD\60_89\FRENCH\NGC_0076.awd",
+    0xC63619576A7EB0A9: r"SB_AGD\180_209\ITALIAN\PS2_0204.agd",
+    0xC63CD92704F5DFFF: r"SB_AWD\90_119\ENGLISH\PS2_0114.awd",
+    0xC64379AD5B704FCD: r"SB_AWD\180_209\ITALIAN\PS2_0190.awd",
+    0xC6469D1F06EC5BF3: r"SB_AWD\180_209\FRENCH\PS2_0190.awd",
+    0xC64A8C59BC0A3036: r"AUDIO\SPANISH\XBX_4m2.rws",
+    0xC64C26B0BF11A8B5: r"AUDIO\FRENCH\XBX_4s3.rws",
+    0xC65B92EECDFB7025: r"SB_AGD\90_119\ENGLISH\XBX_0098.agd",
+    0xC65F0468CB263E7A: r"ANIMGRPS\Lvl_23\Lvl_23W.ads",
+    0xC6632EAA2BEBCA73: r"SB_AGD\150_179\SPANISH\XBX_0167.agd",
+    0xC67DC30097730600: r"LEVELS\L_1_3_B\SECTIONS\s_17.rws",
+    0xC6879C96A6CCBD6E: r"SB_AGD\0_29\GERMAN\XBX_0009.agd",
+    0xC68F8B6086A78D16: r"SB_AGD\210_239\SPANISH\XBX_0229.agd",
+    0xC69018143715BCF4: r"LEVELS\L_2_2_B\SECTIONS\s_6.rws",
+    0xC6969E5689E8CE2B: r"SB_AWD\180_209\ITALIAN\XBX_0205.awd",
+    0xC69A276E7A036639: r"SB_AWD\60_89\GERMAN\NGC_0080.awd",
+    0xC69F52EFA9D1288C: r"SB_AGD\120_149\SPANISH\PS2_0141.agd",
+    0xC6B512B47A6C1BC8: r"AUDIO\GERMAN\XBX_1s1.rws",
+    0xC6C810A028560BF1: r"font_symbols_ps2.tga",
+    0xC6CBB5353C54AD36: r"LEVELS\L_1_5\SECTIONS\s_1.rws",
+    0xC6D13E4FF7A5AB16: r"SB_AGD\150_179\ITALIAN\NGC_0160.agd",
+    0xC6D9809FCF383099: r"ANIMGRPS\Lvl_24\Lvl_24R.ads",
+    0xC6DE9BDE56D3832D: r"SB_AGD\90_119\SPANISH\XBX_0098.agd",
+    0xC6E568D4581DC22E: r"SB_AGD\210_239\ITALIAN\XBX_0210.agd",
+    0xC6EFB64E0922A4AF: r"SB_AWD\0_29\ITALIAN\PS2_0016.awd",
+    0xC6F2C9BF0589E85F: r"SB_AWD\180_209\ITALIAN\PS2_0196.awd",
+    0xC6F87687F6C28624: r"EndRoundScoreBoardTeam.layout",
+    0xC6FF28B019A30B98: r"SB_AGD\30_59\GERMAN\XBX_0041.agd",
+    0xC7077426FDE08272: r"LEVELS\L_3_5_B\SECTIONS\s_11.rws",
+    0xC709652FBA1D91D6: r"SB_AGD\60_89\GERMAN\XBX_0067.agd",
+    0xC712EA355F0E42B4: r"AUDIO\ITALIAN\XBX_1s3.rws",
+    0xC716F5ACC0CDD759: r"SB_AWD\150_179\SPANISH\NGC_0174.awd",
+    0xC71A2AA63D7BFADF: r"gui_map8_death.index",
+    0xC71BF546E61D9610: r"LEVELS\L_1_5\SECTIONS\s_3.rws",
+    0xC7252491B48A05D5: r"SB_AGD\120_149\FRENCH\NGC_0130.agd",
+    0xC7252813704A6E18: r"SB_AGD\180_209\ENGLISH\XBX_0185.agd",
+    0xC72C0114976073E0: r"SB_AGD\0_29\ENGLISH\PS2_0002.agd.bak",
+    0xC73C7E42A0792D73: r"SB_AWD\60_89\SPANISH\PS2_0089.awd",
+    0xC73F9FC87B472142: r"SB_AGD\0_29\FRENCH\PS2_0017.agd",
+    0xC748931DF43FCBAF: r"SB_AGD\210_239\GERMAN\PS2_0229.agd",
+    0xC748AE1CCF6E4087: r"SB_AGD\120_149\FRENCH\PS2_0133.agd",
+    0xC74CC156F1BA14F7: r"SB_AWD\150_179\GERMAN\XBX_0172.awd",
+    0xC7500DCDB6E2D150: r"SB_AWD\210_239\SPANISH\NGC_0210.awd",
+    0xC753184F0AF864E6: r"SB_AGD\240_269\GERMAN\NGC_0269.agd",
+    0xC760B17F13FD1DF4: r"LEVELS\L_3_1_C\global.dff",
+    0xC7666ABC6226487D: r"SB_AWD\30_59\ENGLISH\XBX_0037.awd",
+    0xC7669B42CA8FA1EF: r"ANIMGRPS\Lvl_11\Lvl_11P.ads",
+    0xC76BB33DCEAEBEDC: r"SB_AGD\150_179\ENGLISH\NGC_0166.agd",
+    0xC77565B8FE79D6A2: r"SB_AGD\60_89\SPANISH\XBX_0069.agd",
+    0xC775EFCE35A92141: r"SB_AGD\240_269\SPANISH\XBX_0257.agd",
+    0xC782EDAB5F74BECD: r"SB_AGD\90_119\GERMAN\XBX_0094.agd",
+    0xC78754121FF2F541: r"AUDIO\ENGLISH\NGC_1m2.rws",
+    0xC78DACEB4505633A: r"SB_AGD\180_209\SPANISH\XBX_0198.agd",
+    0xC79067BEC414B861: r"SB_AGD\240_269\ENGLISH\PS2_0269.agd",
+    0xC795C8C7B04A4976: r"SB_AWD\210_239\FRENCH\XBX_0221.awd",
+    0xC79B472AF44608C5: r"SB_AGD\60_89\GERMAN\XBX_0077.agd",
+    0xC79BC618582D9B6B: r"SB_AGD\30_59\ENGLISH\PS2_0032.agd",
+    0xC79D5138DA66A748: r"LOC\IT\MULTILVL.LOC",
+    0xC7ABE0E10B27B1FF: r"SB_AWD\30_59\ENGLISH\NGC_0033.awd",
+    0xC7B5BD47EC283128: r"SB_AWD\90_119\SPANISH\NGC_0101.awd",
+    0xC7B7F4CB24657609: r"SB_AWD\0_29\ITALIAN\NGC_0024.awd",
+    0xC7BAFC0FEC9E9F06: r"SB_AGD\120_149\FRENCH\PS2_0129.agd",
+    0xC7C516D3A7418AC6: r"SB_AGD\120_149\ITALIAN\PS2_0129.agd",
+    0xC7C6DC450C2D6DD2: r"SB_AGD\240_269\GERMAN\NGC_0254.agd",
+    0xC7D03D6D6AE8C317: r"SB_AGD\210_239\SPANISH\XBX_0233.agd",
+    0xC7D4F4A35EA477E7: r"SB_AGD\120_149\FRENCH\NGC_0136.agd",
+    0xC7D69FA96E750B15: r"SB_AGD\90_119\ENGLISH\PS2_0097.agd",
+    0xC7D71B29ABA8C85E: r"SB_AGD\180_209\GERMAN\PS2_0188.agd",
+    0xC7D9ACE1D2750BFD: r"SB_AWD\0_29\FRENCH\XBX_0022.awd",
+    0xC7F83CC8D34D82F4: r"SB_AWD\30_59\ENGLISH\XBX_0058.awd",
+    0xC8068058747CE81E: r"LEVELS\L_2_1_B\SECTIONS\s_9.rws",
+    0xC8082287DC3DCB3B: r"SB_AGD\240_269\FRENCH\XBX_0268.agd",
+    0xC8153ACE0C3F070F: r"SB_AWD\30_59\ENGLISH\XBX_0031.awd",
+    0xC81A33409660C70C: r"SB_AWD\240_269\FRENCH\PS2_0255.awd",
+    0xC820770FE2183CD9: r"SB_AWD\180_209\ITALIAN\NGC_0199.awd",
+    0xC822A06706221FE9: r"SB_AGD\60_89\SPANISH\NGC_0068.agd",
+    0xC824BFDFDFC1E053: r"SB_AGD\240_269\SPANISH\XBX_0259.agd",
+    0xC830102AD6EE1326: r"SB_AGD\240_269\FRENCH\XBX_0250.agd",
+    0xC8308315ECFC0E22: r"SB_AGD\120_149\ENGLISH\XBX_0140.agd",
+    0xC8378F86D4632E74: r"SHELL\FONTS\mcn16.png",
+    0xC83D8A00AFC7A857: r"SB_AWD\90_119\FRENCH\XBX_0090.awd",
+    0xC83FEA38BF2BACB3: r"SB_AWD\60_89\FRENCH\XBX_0082.awd",
+    0xC8424669B0B9EF49: r"SB_AWD\210_239\ENGLISH\PS2_0236.awd",
+    0xC84A173C9E5EC7D7: r"SB_AGD\60_89\GERMAN\XBX_0071.agd",
+    0xC84BE5E772B736E9: r"AUDIO\SPANISH\NGC_2s3.rws",
+    0xC850C043D8B054DD: r"ANIMGRPS\Lvl_33\Lvl_33V.ads",
+    0xC8643A9D04B584C0: r"EndGameScoreBoardTeam.layout",
+    0xC870324D551335D0: r"SB_AWD\210_239\GERMAN\XBX_0232.awd",
+    0xC8709E7FD0D29453: r"SB_AWD\90_119\SPANISH\PS2_0118.awd",
+    0xC8710DDFA411FAE2: r"SB_AGD\180_209\FRENCH\PS2_0182.agd",
+    0xC87E3B311C03AACD: r"SB_AGD\0_29\GERMAN\NGC_0026.agd",
+    0xC885DDF392BD0542: r"SB_AGD\150_179\GERMAN\XBX_0173.agd",
+    0xC8887CF37C8DCA8F: r"SB_AWD\0_29\FRENCH\XBX_0024.awd",
+    0xC88D50528E04F0CB: r"SB_AWD\210_239\GERMAN\XBX_0217.awd",
+    0xC89470DB9C973516: r"SB_AWD\240_269\GERMAN\PS2_0255.awd",
+    0xC8947754B6A9B7E9: r"LEVELS\L_3_3\SECTIONS\s_17.rws",
+    0xC89DFFEA1BE4E2EC: r"SB_AGD\210_239\SPANISH\PS2_0220.agd",
+    0xC8AC42C6E0816578: r"LEVELS\L_3_5_C\global.dff",
+    0xC8C023197B1A1A7C: r"SB_AWD\210_239\ENGLISH\NGC_0214.awd",
+    0xC8D6F2972BAA185B: r"SB_AWD\150_179\ITALIAN\NGC_0161.awd",
+    0xC8D8BEA9D7EA8238: r"SB_AGD\120_149\FRENCH\NGC_0148.agd",
+    0xC8DC5E8D8170CF69: r"SB_AGD\120_149\ENGLISH\NGC_0145.agd",
+    0xC8DF29976BEF4806: r"SB_AGD\240_269\ITALIAN\PS2_0248.agd",
+    0xC8E5608A8B757869: r"SHELL\FONTS\mt16.png",
+    0xC8E59360F756DBEC: r"SB_AWD\210_239\GERMAN\NGC_0230.awd",
+    0xC8E7190E60EA37EB: r"SB_AGD\30_59\GERMAN\NGC_0035.agd",
+    0xC8F407612C2807D1: r"SB_AWD\30_59\ITALIAN\NGC_0040.awd",
+    0xC8F4BFE382AC63D2: r"SB_AGD\0_29\FRENCH\PS2_0022.agd",
+    0xC903D14393C0902F: r"ANIMGRPS\Lvl_26\Lvl_26H.ads",
+    0xC90721A2B0EF613D: r"ANIMGRPS\Lvl_35\Lvl_35V.ads",
+    0xC913E57000255653: r"LEVELS\L_3_5_C\SECTIONS\s_24.rws",
+    0xC91DD87487AE8376: r"SB_AGD\90_119\GERMAN\NGC_0114.agd",
+    0xC920AEB039C38DCC: r"LEVELS\L_3_4\SECTIONS\s_6.rws",
+    0xC9212A188AF7570B: r"SB_AWD\60_89\GERMAN\XBX_0075.awd",
+    0xC92FA2A5FEE20EAA: r"AUDIO\GERMAN\PS2_2m3.rws",
+    0xC934A365C3FB6097: r"SB_AGD\180_209\SPANISH\XBX_0201.agd",
+    0xC94A44F475D64ED9: r"SB_AWD\180_209\ITALIAN\XBX_0188.awd",
+    0xC951B65FB4AD4A49: r"SB_AWD\0_29\ITALIAN\PS2_0014.awd",
+    0xC9534C81E2171AAB: r"SB_AGD\150_179\ITALIAN\NGC_0158.agd",
+    0xC956B75A7EF76A93: r"SB_AGD\30_59\GERMAN\PS2_0034.agd",
+    0xC95BE11D4D92BE8D: r"ANIMGRPS\Lvl_35\Lvl_35F.ads",
+    0xC95F8846C49252F3: r"LEVELS\L_1_2\SECTIONS\s_27.rws",
+    0xC969C099241D2E85: r"SHELL\FEND\INSTANCE\SKY\LDBANNER.TXD",
+    0xC96E485C576CB20B: r"SHELL\MOVIES\Making3.bik",
+    0xC9761EF2AC2C6BDB: r"SB_AGD\180_209\ENGLISH\PS2_0181.agd",
+    0xC9782318126626B8: r"LEVELS\MP_7\SECTIONS\s_2.rws",
+    0xC98A27443563E0EC: r"SB_AWD\30_59\ITALIAN\XBX_0050.awd",
+    0xC98EA437B4ABA093: r"SB_AWD\210_239\ITALIAN\PS2_0212.awd",
+    0xC99AA32FE3501D70: r"SB_AGD\120_149\GERMAN\NGC_0133.agd",
+    0xC9AB66C4B63770DB: r"LEVELS\MP_9\SECTIONS\s_3.rws",
+    0xC9AC8E924AF84A2D: r"SB_AWD\90_119\GERMAN\XBX_0094.awd",
+    0xC9B23DDF626DC782: r"SB_AWD\210_239\SPANISH\NGC_0216.awd",
+    0xC9B325553DDA2F89: r"ANIMGRPS\Lvl_26\Lvl_26F.ads",
+    0xC9C0247E43CEDCA7: r"SB_AGD\60_89\FRENCH\NGC_0084.agd",
+    0xC9C68042AE9AD7F8: r"SB_AGD\0_29\ENGLISH\PS2_0019.agd",
+    0xC9CEE2782C8DFD6D: r"SB_AWD\30_59\FRENCH\NGC_0057.awd",
+    0xC9CFFA2A35101625: r"SB_AWD\60_89\GERMAN\XBX_0077.awd",
+    0xC9D4B38BD477E9ED: r"SB_AWD\60_89\ENGLISH\PS2_0083.awd",
+    0xC9DDEA8C9626DC29: r"AUDIO\GERMAN\PS2_1s1.rws",
+    0xC9E200E74BA61004: r"SB_AWD\60_89\GERMAN\XBX_0087.awd",
+    0xC9E63045DE5508B6: r"SB_AGD\240_269\FRENCH\XBX_0243.agd",
+    0xC9EB952FD44ACF2E: r"SB_AGD\30_59\SPANISH\XBX_0056.agd",
+    0xC9EBC5203142D79C: r"SB_AWD\240_269\SPANISH\NGC_0261.awd",
+    0xC9F31D17F685F1E4: r"SB_AGD\180_209\SPANISH\XBX_0189.agd",
+    0xC9F6BE53D71B6786: r"SB_AGD\0_29\SPANISH\PS2_0008.agd",
+    0xC9F7FB915DE6B228: r"SB_AWD\240_269\ITALIAN\NGC_0265.awd",
+    0xCA0CAAC7FDECBE2B: r"SB_AWD\0_29\GERMAN\NGC_0015.awd",
+    0xCA19CC855AA1093B: r"SB_AWD\0_29\GERMAN\XBX_0000.awd",
+    0xCA1C1FB5C938DFC5: r"LEVELS\L_3_5_C\GodData.dff",
+    0xCA205B0FFAF0C8EE: r"ANIMGRPS\Lvl_36\Lvl_36K.ads",
+    0xCA215EA8CB8CD379: r"SB_AGD\30_59\ENGLISH\NGC_0031.agd",
+    0xCA24EF0456452AF5: r"SB_AGD\180_209\ENGLISH\PS2_0183.agd",
+    0xCA281EF6FCC310E2: r"SB_AWD\180_209\ENGLISH\XBX_0198.awd",
+    0xCA3361C722A5F8F9: r"SB_AGD\180_209\SPANISH\PS2_0194.agd",
+    0xCA34AB790DC8731A: r"SB_AWD\90_119\FRENCH\PS2_0108.awd",
+    0xCA3960C63C944F1C: r"SB_AWD\210_239\FRENCH\NGC_0232.awd",
+    0xCA4973418D68DC02: r"SB_AGD\120_149\GERMAN\NGC_0135.agd",
+    0xCA4C1236451F6587: r"SB_AGD\30_59\ITALIAN\PS2_0047.agd",
+    0xCA521938B1F28659: r"SB_AWD\90_119\ENGLISH\PS2_0116.awd",
+    0xCA5778E0A1301DD2: r"SB_AWD\60_89\ITALIAN\PS2_0079.awd",
+    0xCA58FFBE76C61FAD: r"ANIMGRPS\Lvl_33\Lvl_33F.ads",
+    0xCA5990EBC300DFA6: r"SB_AGD\210_239\ITALIAN\PS2_0231.agd",
+    0xCA5AE3413EDC1866: r"SB_AWD\120_149\FRENCH\NGC_0120.awd",
+    0xCA5DF2AFA9E0C111: r"SB_AGD\30_59\SPANISH\XBX_0033.agd",
+    0xCA606AAF2739BA87: r"SB_AGD\210_239\GERMAN\XBX_0226.agd",
+    0xCA862329BCCFCC42: r"LEVELS\MP_7\SECTIONS\s_4.rws",
+    0xCA8CBAEF9BF2AB67: r"SB_AWD\210_239\FRENCH\XBX_0224.awd",
+    0xCA958057886EA1C0: r"SB_AGD\240_269\FRENCH\XBX_0241.agd",
+    0xCA9D9984C57C11AA: r"ANIMGRPS\Lvl_12\Lvl_12K.ads",
+    0xCA9E7E8671026151: r"SB_AWD\90_119\FRENCH\NGC_0090.awd",
+    0xCAAF2CD349ED2C22: r"SB_AGD\30_59\ENGLISH\XBX_0052.agd",
+    0xCAB0323C7BF57CFC: r"SB_AWD\210_239\ITALIAN\PS2_0228.awd",
+    0xCAB1627D9BECA0FA: r"LEVELS\L_1_1_B\level.dff",
+    0xCAB39C55843C6FD7: r"ANIMGRPS\Lvl_33\Lvl_33T.ads",
+    0xCAB8C8E08CF45547: r"SB_AGD\120_149\ITALIAN\PS2_0133.agd",
+    0xCABE6029624FC406: r"SB_AGD\30_59\ITALIAN\PS2_0055.agd",
+    0xCAD2625F009E2C02: r"SB_AWD\210_239\GERMAN\XBX_0234.awd",
+    0xCAD2B8A2446A1906: r"SB_AGD\210_239\GERMAN\XBX_0216.agd",
+    0xCAD3537D9C096DF6: r"LEVELS\L_1_1_B\level.rws",
+    0xCAD7073815E1624D: r"SB_AGD\30_59\FRENCH\NGC_0057.agd",
+    0xCADE8A3D57EE169D: r"SB_AWD\150_179\ITALIAN\XBX_0172.awd",
+    0xCAE4ED51767DDAC8: r"SB_AGD\180_209\ITALIAN\PS2_0182.agd",
+    0xCAE6098AD85213AC: r"SB_AGD\30_59\ITALIAN\XBX_0050.agd",
+    0xCAEBD6C53B351197: r"SB_AWD\30_59\GERMAN\NGC_0031.awd",
+    0xCAF640ED482188A0: r"SB_AWD\240_269\GERMAN\PS2_0257.awd",
+    0xCAF77A494613C14B: r"SB_AGD\30_59\GERMAN\XBX_0059.agd",
+    0xCAF7814C320BEEA7: r"LEVELS\L_1_5_B\SECTIONS\s_5.rws",
+    0xCAF7C333E8AE036B: r"SB_AGD\180_209\FRENCH\XBX_0188.agd",
+    0xCAF8D58FAB5BA304: r"AUDIO\SPANISH\PS2_1s2.rws",
+    0xCAFA38E60519AA38: r"SB_AGD\210_239\ITALIAN\XBX_0212.agd",
+    0xCB085BD020DFCCA7: r"ANIMGRPS\Lvl_33\Lvl_33D.ads",
+    0xCB0A3352E8F5B0F0: r"SB_AWD\120_149\FRENCH\NGC_0122.awd",
+    0xCB0AE39C7BBD7468: r"LEVELS\MP_1\SECTIONS\s_8.rws",
+    0xCB0DEE2A2DF8F786: r"SB_AWD\120_149\SPANISH\XBX_0144.awd",
+    0xCB135690A17BCCA8: r"SB_AWD\60_89\ITALIAN\XBX_0070.awd",
+    0xCB1877D78E46556D: r"SB_AGD\60_89\SPANISH\XBX_0071.agd",
+    0xCB1A92A37A275E53: r"LOC\FR\GLOBAL.LOC",
+    0xCB26E252C2963EB7: r"SB_AGD\240_269\FRENCH\XBX_0255.agd",
+    0xCB302F5D32AF1D0D: r"LEVELS\L_1_3_B\SECTIONS\s_5.rws",
+    0xCB363F42B714AE3B: r"SB_AGD\0_29\ITALIAN\XBX_0020.agd",
+    0xCB38C2A8D7346BF5: r"SB_AWD\150_179\ITALIAN\NGC_0163.awd",
+    0xCB4419C41D6EFCA0: r"SB_AGD\240_269\ITALIAN\PS2_0259.agd",
+    0xCB7523B6CB578E66: r"SB_AWD\150_179\SPANISH\PS2_0161.awd",
+    0xCB75F174082C919D: r"SB_AGD\150_179\GERMAN\NGC_0150.agd",
+    0xCB7768DC3DE804C5: r"LEVELS\MP_4\level.dff",
+    0xCB857A453C75FC55: r"SB_AWD\60_89\GERMAN\XBX_0064.awd",
+    0xCB8822E88249FF97: r"SB_AWD\240_269\GERMAN\PS2_0247.awd",
+    0xCB8B6EA2ECBB8A1E: r"AUDIO\FRENCH\NGC_1s3.rws",
+    0xCB9FB02568213815: r"SB_AWD\120_149\SPANISH\XBX_0132.awd",
+    0xCBA717DC3E109EF1: r"LEVELS\MP_4\level.rws",
+    0xCBAB3A5CD3C11B29: r"SB_AWD\90_119\SPANISH\NGC_0092.awd",
+    0xCBAE0EE11898E6DB: r"SB_AWD\90_119\SPANISH\NGC_0119.awd",
+    0xCBBC23110DE940A4: r"LEVELS\L_1_3_B\GodData.dff",
+    0xCBBD3E93E768E7DF: r"SHELL\LOAD\MP_5_TDM.txd",
+    0xCBC120F2B8245859: r"SB_AWD\30_59\ENGLISH\NGC_0031.awd",
+    0xCBCB93AD2C5BDC1E: r"SB_AGD\0_29\SPANISH\XBX_0010.agd",
+    0xCBD0EB2D63F6D88C: r"SB_AWD\30_59\ENGLISH\PS2_0053.awd",
+    0xCBDA8F1F5DAB4685: r"SB_AGD\180_209\ENGLISH\PS2_0190.agd",
+    0xCBDADF292AE9237A: r"SB_AWD\120_149\ITALIAN\XBX_0135.awd",
+    0xCBDBE48976AC91AE: r"AUDIO\FRENCH\XBX_2s2.rws",
+    0xCBEB6FBB1B70F327: r"SB_AGD\90_119\ENGLISH\PS2_0091.agd",
+    0xCBEEEDDD2AF46956: r"SB_AWD\120_149\ENGLISH\XBX_0131.awd",
+    0xCBF67095DB3736AA: r"SB_AWD\240_269\ENGLISH\NGC_0263.awd",
+    0xCBFEB24F9FC42C79: r"SB_AWD\0_29\ITALIAN\PS2_0021.awd",
+    0xCBFF935C94CFD192: r"SB_AGD\120_149\GERMAN\NGC_0140.agd",
+    0xCC01454513D4A161: r"SB_AWD\150_179\FRENCH\PS2_0166.awd",
+    0xCC02DD1919923F92: r"LEVELS\L_1_5_B\level.rws",
+    0xCC086A3AF939A212: r"SB_AGD\0_29\GERMAN\PS2_0006.agd",
+    0xCC094972F35732A2: r"w_borderpale.index",
+    0xCC09B74641F9DC51: r"SB_AGD\90_119\ITALIAN\XBX_0119.agd",
+    0xCC09FC367E63E2FB: r"SB_AGD\90_119\SPANISH\NGC_0119.agd",
+    0xCC0D85A30FB2DF6D: r"SB_AGD\90_119\GERMAN\PS2_0116.agd",
+    0xCC14B1D84E69F964: r"SB_AGD\210_239\ENGLISH\NGC_0232.agd",
+    0xCC21315DDC8D86B1: r"LEVELS\L_1_5_B\SECTIONS\s_7.rws",
+    0xCC23915696B37FFE: r"SB_AWD\210_239\ITALIAN\NGC_0212.awd",
+    0xCC2473C8757126F0: r"SB_AWD\150_179\SPANISH\PS2_0163.awd",
+    0xCC254185B2462A2F: r"SB_AGD\150_179\GERMAN\NGC_0156.agd",
+    0xCC2A0F87D58DB18F: r"SB_AGD\240_269\GERMAN\XBX_0244.agd",
+    0xCC2F2A6BD7D5F0F1: r"SB_AWD\180_209\GERMAN\PS2_0187.awd",
+    0xCC32DC1919BB6196: r"LEVELS\L_1_5_B\level.dff",
+    0xCC439B4310C8FA4C: r"AUDIO\FRENCH\PS2_2m3.rws",
+    0xCC4DB6CADDA7D96A: r"SB_AWD\210_239\FRENCH\PS2_0217.awd",
+    0xCC4EA037123A2D87: r"SB_AWD\120_149\SPANISH\XBX_0134.awd",
+    0xCC50454CE2C1CE6E: r"SB_AWD\240_269\SPANISH\NGC_0252.awd",
+    0xCC518ADA6A2D0530: r"SB_AWD\0_29\GERMAN\XBX_0029.awd",
+    0xCC55406C518384F9: r"AUDIO\GERMAN\XBX_2s3.rws",
+    0xCC5BAE80889B1C20: r"SB_AGD\0_29\SPANISH\PS2_0019.agd",
+    0xCC79AAF8F1324303: r"SB_AWD\180_209\SPANISH\PS2_0202.awd",
+    0xCC80CD9A16B4FB03: r"SB_AWD\150_179\FRENCH\NGC_0172.awd",
+    0xCC82A721A67BEF50: r"ANIMGRPS\Lvl_36\Lvl_36M.ads",
+    0xCC8808763E2095A3: r"SB_AWD\0_29\ENGLISH\PS2_0009.awd",
+    0xCC89CF3AD50218F4: r"SB_AWD\120_149\ITALIAN\XBX_0137.awd",
+    0xCC8DFFBFB6D190F9: r"SB_AGD\120_149\ENGLISH\PS2_0148.agd",
+    0xCC95EBCCCF6479BB: r"AUDIO\ITALIAN\NGC_1s2.rws",
+    0xCC9852021279BB1D: r"SB_AGD\0_29\FRENCH\PS2_0018.agd",
+    0xCC9A99BE80A5841A: r"AUDIO\SPANISH\PS2_4m3.rws",
+    0xCCA320643B028BE5: r"SB_AWD\210_239\GERMAN\XBX_0215.awd",
+    0xCCA428B1D78DD83B: r"SB_AWD\0_29\FRENCH\NGC_0008.awd",
+    0xCCB90757EC1374E3: r"SB_AGD\90_119\ITALIAN\XBX_0117.agd",
+    0xCCB926B7E902C75B: r"SB_AWD\0_29\GERMAN\NGC_0006.awd",
+    0xCCBAB9287611970C: r"SB_AGD\0_29\FRENCH\NGC_0025.agd",
+    0xCCBEDFFD2AE25B92: r"SB_AWD\210_239\SPANISH\PS2_0222.awd",
+    0xCCBF59A9DE980010: r"SB_AWD\90_119\SPANISH\XBX_0103.awd",
+    0xCCBF6F8427D31E30: r"WPNBANK\26_50\wbank_31.bin",
+    0xCCC43A12B240E650: r"SB_AWD\180_209\GERMAN\NGC_0200.awd",
+    0xCCC448DCEF0F7553: r"SB_AWD\180_209\FRENCH\NGC_0209.awd",
+    0xCCD96F997FA765C9: r"SB_AGD\240_269\GERMAN\XBX_0246.agd",
+    0xCCDDFA7D81EEAF83: r"SB_AWD\180_209\GERMAN\PS2_0189.awd",
+    0xCCE672B7AB8F15D4: r"AUDIO\GERMAN\PS2_2m1.rws",
+    0xCCF6BE3A65E608E5: r"LOC\FR\HUD.LOC",
+    0xCCFA24D5E69B7F1F: r"ANIMGRPS\Lvl_34\Lvl_34R.ads",
+    0xCCFCE6DC87C13B24: r"SB_AWD\210_239\FRENCH\PS2_0215.awd",
+    0xCCFFE7A99FE293AC: r"SHELL\MOVIES\AnimReel.bik",
+    0xCD21303B0DDBCA90: r"SB_AGD\30_59\ITALIAN\PS2_0057.agd",
+    0xCD223680E215B833: r"SB_AGD\210_239\ITALIAN\XBX_0228.agd",
+    0xCD2478F22071058A: r"AUDIO\SPANISH\ASLocate.agd",
+    0xCD287EA7A814C5BE: r"SB_AWD\120_149\ENGLISH\NGC_0133.awd",
+    0xCD2AD97744FD8DAD: r"WPNBANK\26_50\wbank_27.bin",
+    0xCD33288634AB4480: r"SB_AGD\90_119\GERMAN\NGC_0116.agd",
+    0xCD3588B3EFF61F90: r"SB_AGD\210_239\GERMAN\XBX_0214.agd",
+    0xCD3700531244E574: r"LEVELS\L_1_1_B\SECTIONS\s_2.rws",
+    0xCD3E0C53ABD8271E: r"SB_AWD\240_269\GERMAN\NGC_0261.awd",
+    0xCD4CF597AB2635A2: r"AUDIO\ITALIAN\NGC_2m2.rws",
+    0xCD506313AEA90B37: r"SB_AGD\210_239\ITALIAN\PS2_0234.agd",
+    0xCD546D7AE2AD2976: r"LEVELS\L_1_1_B\GodData.dff",
+    0xCD5653D83BCE8870: r"SB_AGD\210_239\ENGLISH\XBX_0212.agd",
+    0xCD579931F51D47EF: r"SB_AWD\30_59\SPANISH\NGC_0051.awd",
+    0xCD6DDD97C6A07450: r"SB_AGD\0_29\ITALIAN\XBX_0009.agd",
+    0xCD75FD5C6A98DDAE: r"SB_AGD\120_149\FRENCH\XBX_0144.agd",
+    0xCD7D7104317F7640: r"gui_map8_destroy.dds",
+    0xCD830F0D75B64C64: r"XboxSysLinkNoSessionsFound.layout",
+    0xCD92A6C5E9C351AA: r"SB_AGD\180_209\GERMAN\XBX_0190.agd",
+    0xCD94AEC1E7105B96: r"LEVELS\L_3_4\SECTIONS\s_8.rws",
+    0xCD94F0820B0E6CB7: r"SB_AWD\90_119\ITALIAN\NGC_0098.awd",
+    0xCD954735DBDB4AE7: r"SB_AGD\240_269\GERMAN\PS2_0269.agd",
+    0xCDA0BC3FD86B40E0: r"SB_AGD\150_179\FRENCH\PS2_0163.agd",
+    0xCDA363DC53B8F2EC: r"SB_AGD\0_29\ITALIAN\NGC_0007.agd",
+    0xCDA49D690C148CB9: r"SB_AGD\60_89\GERMAN\NGC_0071.agd",
+    0xCDA615102984C8BD: r"SB_AGD\90_119\SPANISH\XBX_0115.agd",
+    0xCDB44D0431AE7B13: r"gui_map8_destroy.txd",
+    0xCDBB8793C9DF0FD5: r"SB_AGD\210_239\FRENCH\NGC_0224.agd",
+    0xCDBCEF8E56285DBF: r"SB_AWD\210_239\FRENCH\XBX_0215.awd",
+    0xCDBD403466984E9C: r"SB_AWD\0_29\SPANISH\XBX_0027.awd",
+    0xCDBED1DBDB0B8CAB: r"SB_AGD\0_29\ENGLISH\PS2_0001.agd",
+    0xCDC9F0BB125DCE39: r"SB_AWD\0_29\ITALIAN\NGC_0011.awd",
+    0xCDCDF4AE4187DD0F: r"SB_AGD\210_239\ITALIAN\NGC_0239.agd",
+    0xCDCEE458F7A78BE7: r"SB_AGD\240_269\FRENCH\NGC_0248.agd",
+    0xCDD18A031135041F: r"SB_AGD\60_89\FRENCH\XBX_0068.agd",
+    0xCDD4025278A7FCCF: r"SB_AWD\240_269\ENGLISH\NGC_0248.awd",
+    0xCDD45752D6720CC7: r"SB_AGD\120_149\GERMAN\XBX_0143.agd",
+    0xCDEDBC6555F26348: r"SB_AWD\240_269\GERMAN\NGC_0263.awd",
+    0xCDEFA3522222D326: r"SB_AWD\210_239\SPANISH\XBX_0210.awd",
+    0xCDF7DD941BB6F978: r"SB_AWD\90_119\ITALIAN\PS2_0096.awd",
+    0xCDFA6AFF30FC653D: r"SB_AWD\60_89\ITALIAN\PS2_0061.awd",
+    0xCE0065418146B738: r"SB_AGD\30_59\SPANISH\XBX_0054.agd",
+    0xCE0523E9E5E74702: r"SB_AGD\210_239\ENGLISH\XBX_0214.agd",
+    0xCE0E2D85CC6D3193: r"SB_AWD\150_179\ENGLISH\XBX_0170.awd",
+    0xCE1A90B40DE4F05F: r"ANIMGRPS\Lvl_23\Lvl_23N.ads",
+    0xCE23CE499A9D81E8: r"SB_AWD\180_209\FRENCH\XBX_0183.awd",
+    0xCE254176A6FC10F6: r"SB_AWD\0_29\FRENCH\PS2_0000.awd",
+    0xCE26B74EB154EBBB: r"SB_AGD\90_119\ITALIAN\XBX_0092.agd",
+    0xCE27ECEBFB3671E0: r"SB_AGD\0_29\SPANISH\NGC_0029.agd",
+    0xCE3C80FAB3515D45: r"SB_AWD\180_209\FRENCH\PS2_0185.awd",
+    0xCE4176D793DC1144: r"SB_AGD\180_209\GERMAN\XBX_0192.agd",
+    0xCE43342FBD436822: r"SB_AGD\30_59\ENGLISH\PS2_0037.agd",
+    0xCE51BDEED6806FE0: r"SB_AWD\120_149\ENGLISH\XBX_0133.awd",
+    0xCE53FE09DC745450: r"SB_AWD\120_149\ENGLISH\XBX_0146.awd",
+    0xCE554752B3CE3189: r"SB_AWD\150_179\ITALIAN\PS2_0179.awd",
+    0xCE5B236B1687B0E1: r"SB_AGD\0_29\ENGLISH\XBX_0004.agd",
+    0xCE6B57A573F981E7: r"SB_AGD\210_239\FRENCH\NGC_0222.agd",
+    0xCE6C2FA00041DB19: r"SB_AWD\210_239\FRENCH\XBX_0217.awd",
+    0xCE6C404610B15F3E: r"SB_AWD\0_29\SPANISH\XBX_0029.awd",
+    0xCE6C549BC7A1F412: r"SB_AWD\150_179\ENGLISH\PS2_0154.awd",
+    0xCE80A8C52AFDBC82: r"LEVELS\L_2_2_B\GodData.dff",
+    0xCE977021DB8861CB: r"SB_AWD\90_119\ENGLISH\XBX_0108.awd",
+    0xCE99CA6BD0CB8A4B: r"SB_AGD\0_29\SPANISH\NGC_0000.agd",
+    0xCEA7E8A648D08CDC: r"SB_AGD\60_89\ITALIAN\NGC_0072.agd",
+    0xCEB310835707A3DD: r"SB_AWD\210_239\SPANISH\NGC_0224.awd",
+    0xCEB326F78F286714: r"SB_AWD\210_239\FRENCH\PS2_0220.awd",
+    0xCEB3DDDECCC9D130: r"SB_AGD\0_29\ITALIAN\PS2_0019.agd",
+    0xCEC5B36A28FDFF5A: r"SB_AGD\150_179\ITALIAN\XBX_0175.agd",
+    0xCEC97AF15D8B1D73: r"SB_AGD\210_239\SPANISH\NGC_0235.agd",
+    0xCEFFFC870B9EE971: r"SB_AGD\90_119\FRENCH\XBX_0092.agd",
+    0xCF03D70C92734701: r"SB_AWD\180_209\GERMAN\NGC_0186.awd",
+    0xCF0AE52EFB4D3751: r"SB_AWD\210_239\ENGLISH\XBX_0217.awd",
+    0xCF1540FD9CA14319: r"WPNBANK\0_25\wbank_25.bin",
+    0xCF185CA552874DEE: r"SB_AWD\240_269\ENGLISH\PS2_0240.awd",
+    0xCF1AF6C9948D1AF5: r"SB_AWD\0_29\GERMAN\NGC_0004.awd",
+    0xCF2189BB8A22F742: r"SB_AWD\90_119\SPANISH\XBX_0105.awd",
+    0xCF245595F3A74B1B: r"LEVELS\L_1_2\SECTIONS\s_9.rws",
+    0xCF2627219C564896: r"SB_AWD\210_239\GERMAN\NGC_0210.awd",
+    0xCF266A245DCBDC82: r"SB_AWD\180_209\GERMAN\NGC_0206.awd",
+    0xCF2D3BFCB9AF64C4: r"SB_AWD\150_179\FRENCH\XBX_0155.awd",
+    0xCF2E47E93B43F07F: r"SB_AGD\60_89\SPANISH\XBX_0077.agd",
+    0xCF34E4294DBE772F: r"ANIMGRPS\Lvl_32\Lvl_32V.ads",
+    0xCF35FAAA8B79E261: r"SB_AWD\240_269\ENGLISH\PS2_0269.awd",
+    0xCF36232802685C5D: r"SB_AGD\30_59\FRENCH\NGC_0044.agd",
+    0xCF3ABDBB7D501650: r"w_flagsDE.index",
+    0xCF3DC4F4B9FA6793: r"SB_AWD\120_149\GERMAN\XBX_0125.awd",
+    0xCF5725656325B7F9: r"SB_AGD\150_179\ITALIAN\XBX_0169.agd",
+    0xCF5C167B06DB2C8C: r"SB_AWD\0_29\ENGLISH\PS2_0015.awd",
+    0xCF5E9CD1DC2474BF: r"SB_AWD\30_59\SPANISH\PS2_0036.awd",
+    0xCF78959422F071AB: r"SB_AWD\210_239\SPANISH\XBX_0237.awd",
+    0xCF830B7F6A8421BB: r"SB_AGD\240_269\ENGLISH\PS2_0249.agd",
+    0xCF88620B118D573C: r"SB_AWD\30_59\FRENCH\XBX_0047.awd",
+    0xCF8E8725C60004A2: r"SB_AGD\30_59\GERMAN\NGC_0030.agd",
+    0xCF936539E7E0E671: r"SB_AGD\60_89\ITALIAN\PS2_0087.agd",
+    0xCF9388B7A21C3CF1: r"SB_AGD\150_179\SPANISH\NGC_0156.agd",
+    0xCF9B6A56E973CDC7: r"SB_AWD\60_89\GERMAN\XBX_0062.awd",
+    0xCFA3F83571C9DFBD: r"SHELL\MOVIES\FRENCH\1_1_Mon.bik",
+    0xCFABF216F9BD1652: r"SB_AGD\240_269\FRENCH\NGC_0263.agd",
+    0xCFAE762332E976DD: r"gui_map9_death.dds",
+    0xCFAEB6A1C32C3324: r"SB_AGD\210_239\GERMAN\NGC_0238.agd",
+    0xCFBA9943A0A99F89: r"SB_AWD\30_59\SPANISH\NGC_0053.awd",
+    0xCFC678C4B3C53C58: r"ANIMGRPS\Lvl_21\Lvl_21U.ads",
+    0xCFD683B202F939D4: r"SB_AWD\150_179\SPANISH\XBX_0155.awd",
+    0xCFDB8191AE633CE6: r"SB_AWD\0_29\FRENCH\PS2_0013.awd",
+    0xCFE163BED9597728: r"SB_AGD\0_29\SPANISH\XBX_0012.agd",
+    0xCFE4383AF7D81689: r"ANIMGRPS\Lvl_32\Lvl_32X.ads",
+    0xCFE5622333189746: r"gui_map9_death.txd",
+    0xCFF02B24409CD958: r"font_stringLarge.tga",
+    0xCFF05F310AA8E197: r"SB_AGD\180_209\ENGLISH\PS2_0196.agd",
+    0xCFF5058C6EF39B7E: r"SB_AGD\30_59\ITALIAN\XBX_0041.agd",
+    0xCFF7CD9469CF2EF0: r"SB_AGD\120_149\SPANISH\NGC_0139.agd",
+    0xCFFEABEE42693D62: r"SB_AWD\120_149\GERMAN\PS2_0149.awd",
+    0xD0030C5183F66DF2: r"SB_AGD\150_179\FRENCH\PS2_0165.agd",
+    0xD00BA0A78833C264: r"SB_AWD\240_269\ENGLISH\NGC_0261.awd",
+    0xD00DDCE3863DF219: r"SB_AWD\30_59\SPANISH\PS2_0034.awd",
+    0xD010292DBB8D3BD2: r"LOC\EN\MULTILVL.LOC",
+    0xD013F3D90DAC5441: r"SB_AGD\120_149\ENGLISH\PS2_0139.agd",
+    0xD0169556C0D162F3: r"SB_AWD\150_179\FRENCH\PS2_0168.awd",
+    0xD02355B4BCB07A7F: r"SB_AGD\90_119\GERMAN\PS2_0110.agd",
+    0xD0399AA901DD0839: r"SB_AWD\90_119\ITALIAN\PS2_0101.awd",
+    0xD03AD5496847B92A: r"SB_AGD\90_119\ENGLISH\PS2_0115.agd",
+    0xD03CF35EF571D581: r"SHELL\LOAD\MP_7_DM.txd",
+    0xD0535E2BDC65E406: r"SB_AWD\180_209\ENGLISH\PS2_0203.awd",
+    0xD053DCA9B00DE104: r"SB_AWD\90_119\GERMAN\XBX_0091.awd",
+    0xD05B61928D489981: r"SB_AGD\240_269\ENGLISH\NGC_0268.agd",
+    0xD05F52F9814443FC: r"SB_AWD\120_149\GERMAN\XBX_0139.awd",
+    0xD061D21BBAAEA3FD: r"SB_AWD\210_239\SPANISH\PS2_0218.awd",
+    0xD06215EBA431F362: r"SB_AWD\180_209\SPANISH\XBX_0190.awd",
+    0xD066355E8FBF9FD8: r"SB_AWD\240_269\SPANISH\NGC_0250.awd",
+    0xD06C3E09935A4A36: r"SB_AGD\180_209\ITALIAN\NGC_0196.agd",
+    0xD06E2A97F135F0D5: r"SB_AGD\210_239\FRENCH\PS2_0218.agd",
+    0xD07393124B02F8E9: r"SB_AWD\60_89\SPANISH\NGC_0086.awd",
+    0xD08AD1A3587CD570: r"SB_AWD\0_29\FRENCH\PS2_0011.awd",
+    0xD09B2B55789D64F8: r"SB_AWD\150_179\ENGLISH\XBX_0159.awd",
+    0xD0A344914CEEE6C0: r"SB_AWD\0_29\ITALIAN\XBX_0023.awd",
+    0xD0A3A7D897C5D647: r"AUDIO\ENGLISH\PS2_1m3.rws",
+    0xD0B62E1B87FF4A82: r"SB_AWD\120_149\ENGLISH\XBX_0140.awd",
+    0xD0BC5C5F7BD9A99D: r"SB_AWD\90_119\SPANISH\XBX_0115.awd",
+    0xD0BEA23A3B1730ED: r"LEVELS\L_3_1_C\level.rws",
+    0xD0C15A9CBFB70D52: r"SB_AWD\0_29\GERMAN\XBX_0005.awd",
+    0xD0C2C3EAB7C51353: r"SB_AGD\120_149\ENGLISH\PS2_0137.agd",
+    0xD0D0EA588CEFBE3E: r"SB_AWD\240_269\FRENCH\NGC_0252.awd",
+    0xD0DAF70BA9A40FEA: r"SB_AWD\0_29\SPANISH\NGC_0027.awd",
+    0xD0E0B33A3B343441: r"LEVELS\L_3_1_C\level.dff",
+    0xD0E3680442A9328F: r"SB_AGD\60_89\SPANISH\XBX_0060.agd",
+    0xD0E3ACBFD370F2C1: r"SB_AGD\0_29\FRENCH\XBX_0017.agd",
+    0xD0E9A55B126078C4: r"SB_AGD\90_119\ENGLISH\PS2_0117.agd",
+    0xD0E9F13D095131D1: r"SB_AWD\60_89\ENGLISH\NGC_0068.awd",
+    0xD0FC9A7D7C5790E5: r"SB_AGD\0_29\SPANISH\NGC_0002.agd",
+    0xD112FBEBB56992BE: r"SB_AGD\210_239\SPANISH\PS2_0231.agd",
+    0xD118683815047525: r"SB_AGD\90_119\SPANISH\NGC_0108.agd",
+    0xD11B8E1B3D73E340: r"SB_AGD\180_209\ITALIAN\NGC_0194.agd",
+    0xD11C339E92A472E7: r"SB_AWD\0_29\FRENCH\PS2_0005.awd",
+    0xD11F026E1B2CB5EC: r"SB_AGD\180_209\GERMAN\NGC_0187.agd",
+    0xD1275A90A3E47688: r"AUDIO\GERMAN\NGC_1s3.rws",
+    0xD12AA9D02E0AE804: r"AUDIO\SPANISH\PS2_4m1.rws",
+    0xD137D22C73DD182C: r"SB_AGD\60_89\SPANISH\NGC_0072.agd",
+    0xD1509648A067396B: r"SB_AWD\0_29\GERMAN\PS2_0014.awd",
+    0xD150A4C540119D6F: r"ANIMGRPS\Lvl_12\Lvl_12R.ads",
+    0xD15234A2F707DBB2: r"SB_AWD\0_29\ITALIAN\XBX_0025.awd",
+    0xD153C993EC8A0DF6: r"SHELL\FEND\INSTANCE\XBOX\LDBANNGC.TXD",
+    0xD16052ADB1FE297E: r"SB_AGD\120_149\GERMAN\PS2_0145.agd",
+    0xD162421160E49DBB: r"SB_AGD\30_59\ENGLISH\PS2_0054.agd",
+    0xD16B0F5D681BB175: r"SB_AWD\30_59\GERMAN\XBX_0039.awd",
+    0xD187F73347E09C20: r"SB_AWD\210_239\GERMAN\NGC_0212.awd",
+    0xD18A271D53BD71A4: r"SB_AWD\0_29\SPANISH\NGC_0025.awd",
+    0xD18ACD6E1794C5B8: r"SB_AGD\120_149\FRENCH\XBX_0146.agd",
+    0xD18DFBD22377FA5C: r"SB_AWD\90_119\ITALIAN\XBX_0118.awd",
+    0xD1927CD17D89B1D3: r"SB_AGD\0_29\FRENCH\XBX_0019.agd",
+    0xD192C815ECC2E6C9: r"SB_AGD\60_89\SPANISH\XBX_0062.agd",
+    0xD1979701A2BF0F54: r"SB_AWD\30_59\SPANISH\NGC_0038.awd",
+    0xD19D55D62C0CD498: r"SB_AGD\240_269\ENGLISH\PS2_0264.agd",
+    0xD19D88F62645B45C: r"SB_AGD\210_239\SPANISH\NGC_0229.agd",
+    0xD19DDEF575AD20CD: r"SB_AGD\150_179\FRENCH\PS2_0175.agd",
+    0xD19E8561312B6A0F: r"SB_AGD\120_149\ENGLISH\XBX_0149.agd",
+    0xD1A033EFBE938E4D: r"SB_AGD\120_149\SPANISH\NGC_0123.agd",
+    0xD1A581E07B119E59: r"AUDIO\SPANISH\NGC_2m1.rws",
+    0xD1B4D381209BF845: r"SB_AWD\120_149\ITALIAN\NGC_0123.awd",
+    0xD1B6D55D52548FA3: r"SB_AWD\150_179\SPANISH\NGC_0161.awd",
+    0xD1C020B402172616: r"SB_AWD\240_269\ENGLISH\XBX_0258.awd",
+    0xD1CAA70CB1A7288E: r"SB_AGD\150_179\SPANISH\NGC_0173.agd",
+    0xD1D8CE6CDAE86D7D: r"SB_AGD\120_149\FRENCH\PS2_0122.agd",
+    0xD1DBFE58BD95CAA4: r"SB_AGD\180_209\ENGLISH\XBX_0202.agd",
+    0xD1E1E9309589A53D: r"SB_AGD\120_149\ITALIAN\PS2_0122.agd",
+    0xD1E3B7848FFBDE39: r"SB_AGD\90_119\GERMAN\NGC_0096.agd",
+    0xD1EAD1091C19893D: r"SB_AGD\150_179\SPANISH\PS2_0175.agd",
+    0xD1F2345F678C2286: r"SB_AWD\0_29\SPANISH\XBX_0018.awd",
+    0xD1FA1A03282E753E: r"AUDIO\GERMAN\PS2_2s1.rws",
+    0xD1FF099C8B1D9C31: r"SB_AGD\120_149\ITALIAN\NGC_0127.agd",
+    0xD201E9F3E0BA0078: r"AUDIO\ENGLISH\NGC_1s1.rws",
+    0xD204F363CF1F94B0: r"SB_AWD\210_239\SPANISH\XBX_0212.awd",
+    0xD20FACF9F768BF26: r"gui_map6_ctf.index",
+    0xD2103B10DDFA00CF: r"SB_AWD\60_89\ITALIAN\PS2_0067.awd",
+    0xD2109410D984D972: r"LEVELS\L_1_5_B\GodData.dff",
+    0xD2147337EFDB47C9: r"w_flagsUS.index",
+    0xD217E35B34F18D00: r"SHELL\MOVIES\EXAKT.bik",
+    0xD218F7B40FCCCB84: r"SB_AGD\210_239\ENGLISH\PS2_0228.agd",
+    0xD21C1FE2C70E369B: r"SB_AWD\180_209\FRENCH\XBX_0197.awd",
+    0xD22511840E067ADB: r"SB_AWD\210_239\SPANISH\XBX_0228.awd",
+    0xD232D65417F6F0BC: r"SB_AGD\240_269\SPANISH\NGC_0261.agd",
+    0xD233C5D65506BCF8: r"SB_AWD\90_119\GERMAN\NGC_0093.awd",
+    0xD23496B80159C43C: r"SB_AWD\150_179\ENGLISH\NGC_0166.awd",
+    0xD248BF871FA884D8: r"SB_AGD\150_179\ENGLISH\NGC_0153.agd",
+    0xD24C2A0CEE3F58C1: r"SHELL\MOVIES\FRENCH\1_5_Mon.bik",
+    0xD251310C604D0EF7: r"SB_AWD\180_209\FRENCH\PS2_0183.awd",
+    0xD26F8612B482025C: r"SB_AGD\60_89\ENGLISH\PS2_0073.agd",
+    0xD2866A739455A46E: r"SB_AWD\240_269\FRENCH\NGC_0245.awd",
+    0xD28E703C925B0A09: r"SB_AGD\180_209\FRENCH\PS2_0189.agd",
+    0xD2A0564C7756937B: r"SB_AGD\120_149\ENGLISH\NGC_0129.agd",
+    0xD2A40478A4DF7BE6: r"SB_AWD\0_29\ENGLISH\XBX_0010.awd",
+    0xD2B47A6829BF1330: r"SB_AGD\180_209\ITALIAN\XBX_0196.agd",
+    0xD2BA02F127E764A6: r"SB_AWD\240_269\FRENCH\PS2_0240.awd",
+    0xD2BEB06EC8722B9A: r"SB_AGD\60_89\ENGLISH\XBX_0087.agd",
+    0xD2D3B405F6BEDD10: r"SB_AWD\60_89\SPANISH\XBX_0081.awd",
+    0xD2EACB6B11CA2DAF: r"SB_AWD\120_149\FRENCH\PS2_0124.awd",
+    0xD2EE0D337C67FC87: r"SB_AGD\30_59\FRENCH\XBX_0031.agd",
+    0xD2F1957CA966022E: r"SB_AWD\180_209\GERMAN\NGC_0196.awd",
+    0xD2FB0401C4E00E25: r"LEVELS\L_3_3\SECTIONS\s_2.rws",
+    0xD2FCFBF45A39167D: r"SB_AGD\240_269\ITALIAN\PS2_0243.agd",
+    0xD2FD6DAC5EEAB603: r"SB_AWD\180_209\ITALIAN\PS2_0181.awd",
+    0xD301B373DE0DDFB9: r"ANIMGRPS\Lvl_22\Lvl_22N.ads",
+    0xD30DE58450AD4CF2: r"SB_AGD\120_149\GERMAN\XBX_0128.agd",
+    0xD319D60A2F002DCA: r"SB_AGD\150_179\ENGLISH\XBX_0175.agd",
+    0xD32E4CB6FF851F58: r"SB_AWD\240_269\ENGLISH\PS2_0242.awd",
+    0xD34067385B249D94: r"SB_AWD\0_29\SPANISH\NGC_0010.awd",
+    0xD34B4ABC3876A3F3: r"SB_AWD\240_269\ENGLISH\PS2_0267.awd",
+    0xD34B7339AF651DEF: r"SB_AGD\30_59\FRENCH\NGC_0042.agd",
+    0xD353548A4EF91470: r"SB_AWD\0_29\ENGLISH\XBX_0012.awd",
+    0xD35B8C8654E0055A: r"SB_AWD\90_119\FRENCH\NGC_0109.awd",
+    0xD37913D3B610E450: r"SB_AGD\30_59\FRENCH\PS2_0039.agd",
+    0xD3862477DA4266DB: r"SB_AWD\90_119\ITALIAN\XBX_0092.awd",
+    0xD38FE71B58B4A1B2: r"LEVELS\L_3_5_C\SECTIONS\s_10.rws",
+    0xD3942711BDAF2D5B: r"SB_AWD\30_59\ITALIAN\NGC_0055.awd",
+    0xD39475306102FAFB: r"SB_AGD\150_179\ENGLISH\NGC_0172.agd",
+    0xD39681DE398016DE: r"SB_AWD\180_209\FRENCH\XBX_0202.awd",
+    0xD39C097017AB4C3B: r"SB_AWD\150_179\FRENCH\PS2_0159.awd",
+    0xD39C353FA8FCC00B: r"SB_AWD\210_239\GERMAN\PS2_0225.awd",
+    0xD39F40EEF9BEF051: r"SB_AWD\180_209\ENGLISH\PS2_0194.awd",
+    0xD3A0858E537EF798: r"SB_AWD\180_209\GERMAN\NGC_0194.awd",
+    0xD3AAB749BFE9F23A: r"SB_AWD\60_89\ENGLISH\XBX_0087.awd",
+    0xD3AB48056927E669: r"SB_AGD\150_179\ENGLISH\XBX_0169.agd",
+    0xD3AC0DA33C12B8E0: r"LEVELS\L_1_3_B\CLUMPS\cbank_01.bin",
+    0xD3AE43220F31A67E: r"SB_AGD\180_209\ITALIAN\NGC_0202.agd",
+    0xD3B529B792849241: r"SB_AGD\120_149\ITALIAN\NGC_0134.agd",
+    0xD3BA7AD4612D9076: r"SB_AWD\180_209\FRENCH\PS2_0199.awd",
+    0xD3C2443A2471598D: r"SB_AGD\0_29\ITALIAN\PS2_0003.agd",
+    0xD3C57B2BE55F793F: r"SB_AWD\60_89\ITALIAN\PS2_0070.awd",
+    0xD3D3989AC84F7E0C: r"SB_AGD\180_209\ENGLISH\NGC_0204.agd",
+    0xD3D623B640B72FA4: r"SB_AGD\120_149\ENGLISH\XBX_0120.agd",
+    0xD3DBCCD660C2043A: r"ANIMGRPS\Lvl_21\Lvl_21W.ads",
+    0xD3DC308F9486BD44: r"SB_AWD\30_59\FRENCH\NGC_0052.awd",
+    0xD3E201A33C70A9C4: r"SB_AWD\60_89\ENGLISH\PS2_0086.awd",
+    0xD3E89DFAFE163AAC: r"SB_AWD\30_59\FRENCH\XBX_0032.awd",
+    0xD3F1561046339653: r"SB_AWD\0_29\ITALIAN\PS2_0001.awd",
+    0xD3FBC983DD352C1E: r"SB_AWD\0_29\SPANISH\PS2_0026.awd",
+    0xD3FD1A14D3688658: r"AUDIO\GERMAN\PS2_2s3.rws",
+    0xD3FECD1C3DFB3655: r"SB_AGD\180_209\GERMAN\PS2_0190.agd",
+    0xD403F3C6D7C37AF8: r"SB_AWD\150_179\FRENCH\PS2_0174.awd",
+    0xD40CE28FD713B646: r"SB_AGD\90_119\ENGLISH\NGC_0103.agd",
+    0xD40E9523D4458FEC: r"SB_AWD\60_89\GERMAN\NGC_0089.awd",
+    0xD41490B0C56535FD: r"SB_AGD\0_29\SPANISH\PS2_0003.agd",
+    0xD419F698EA1B3F17: r"SB_AWD\0_29\GERMAN\PS2_0029.awd",
+    0xD41EFCAE848F5726: r"LEVELS\L_2_1\CLUMPS\cbank_01.bin",
+    0xD42A3CC521DC43CA: r"SB_AGD\150_179\FRENCH\PS2_0154.agd",
+    0xD42D49E40CF254CC: r"SB_AWD\180_209\FRENCH\PS2_0203.awd",
+    0xD42E298592A15DA7: r"AUDIO\GERMAN\NGC_4s1.rws",
+    0xD42E7315A6B2E79C: r"SB_AWD\30_59\SPANISH\XBX_0032.awd",
+    0xD431C759C325415D: r"SB_AWD\90_119\GERMAN\XBX_0106.awd",
+    0xD43CA8B2B90EEF11: r"SHELL\LOAD\MP_7_TDM.txd",
+    0xD442F53328B5032B: r"SB_AWD\240_269\FRENCH\PS2_0267.awd",
+    0xD44B055153157F25: r"SB_AWD\210_239\GERMAN\PS2_0227.awd",
+    0xD44DA2A83D03685A: r"SB_AWD\30_59\ITALIAN\PS2_0059.awd",
+    0xD45EB08666AC8851: r"SB_AWD\90_119\GERMAN\NGC_0100.awd",
+    0xD4674342A1C689B9: r"SB_AWD\150_179\ITALIAN\PS2_0166.awd",
+    0xD46C9C038084D737: r"XboxSysLinkJoinFailed.layout",
+    0xD47131A43A463493: r"SB_AGD\240_269\ENGLISH\NGC_0266.agd",
+    0xD474BB3D8F78F699: r"SB_AWD\60_89\ITALIAN\PS2_0072.awd",
+    0xD474EBF4ACFC8DAE: r"SB_AWD\90_119\ENGLISH\NGC_0118.awd",
+    0xD47EEFF4729A3D35: r"SB_AWD\180_209\FRENCH\XBX_0195.awd",
+    0xD4836941B13F418A: r"SB_AWD\0_29\ITALIAN\XBX_0014.awd",
+    0xD48CD84622ACD85F: r"SB_AGD\240_269\ITALIAN\XBX_0246.agd",
+    0xD49A5DA390D02171: r"SB_AWD\120_149\GERMAN\NGC_0129.awd",
+    0xD4A6CF593D4DF00E: r"SB_AWD\30_59\FRENCH\PS2_0055.awd",
+    0xD4AB7995874F6848: r"SB_AWD\0_29\SPANISH\PS2_0024.awd",
+    0xD4AC7251F41D2D97: r"SB_AWD\90_119\FRENCH\PS2_0097.awd",
+    0xD4AE9D2DE815A867: r"SB_AGD\180_209\GERMAN\PS2_0196.agd",
+    0xD4AF9AC8C8A071F2: r"gui_map9_ctf.dds",
+    0xD4B05BF7FABA61F6: r"SB_AWD\60_89\SPANISH\PS2_0080.awd",
+    0xD4B26E6B084752AA: r"LOC\DE\EULA.LOC",
+    0xD4B8F60A97147446: r"SHELL\LOAD\L_3_2_B.txd",
+    0xD4BE55357E5FE6CE: r"SB_AWD\60_89\GERMAN\NGC_0087.awd",
+    0xD4CC8F3038363C49: r"SB_AGD\30_59\ENGLISH\XBX_0059.agd",
+    0xD4D27FE1F8C08ECB: r"LEVELS\L_1_1\SECTIONS\s_4.rws",
+    0xD4D7631F1CD1E2BA: r"SB_AWD\60_89\ITALIAN\NGC_0078.awd",
+    0xD4DE07658D7DE039: r"SB_AWD\30_59\GERMAN\NGC_0051.awd",
+    0xD4E586C8C8CDDF51: r"gui_map9_ctf.txd",
+    0xD4F86EB931BB536F: r"SB_AWD\180_209\ITALIAN\XBX_0209.awd",
+    0xD4FAFA7071D9CFA9: r"ANIMGRPS\Lvl_13\Lvl_13N.ads",
+    0xD50BD8B211873F4E: r"SB_AGD\150_179\ITALIAN\PS2_0161.agd",
+    0xD50E555389AB178B: r"SB_AWD\210_239\GERMAN\NGC_0228.awd",
+    0xD51196AFA649035E: r"SB_AGD\90_119\ITALIAN\NGC_0095.agd",
+    0xD514BF1D5FAF0C91: r"SB_AGD\240_269\GERMAN\XBX_0264.agd",
+    0xD516768E7781A560: r"SHELL\HUD\INSTANCE\SKY\HUD_MP.TXD",
+    0xD51B99CEBF2E1CCC: r"SB_AWD\120_149\ENGLISH\PS2_0127.awd",
+    0xD528DFE3095E3B3D: r"SB_AGD\0_29\ITALIAN\XBX_0000.agd",
+    0xD52F37D1C66AE192: r"DisconnectScoreBoardDeath.layout",
+    0xD530A35A035D21ED: r"SB_AWD\90_119\GERMAN\PS2_0116.awd",
+    0xD534BAF1A89CFA96: r"SB_AWD\240_269\ITALIAN\NGC_0245.awd",
+    0xD535E417A249D442: r"SB_AWD\60_89\SPANISH\XBX_0087.awd",
+    0xD5492DB53AE8E003: r"SB_AWD\120_149\GERMAN\NGC_0127.awd",
+    0xD54CCB7CBD54D349: r"SB_AWD\120_149\FRENCH\PS2_0126.awd",
+    0xD54FEA06BB45BCF3: r"SB_AGD\210_239\FRENCH\XBX_0237.agd",
+    0xD557AC4F5CB16793: r"SB_AWD\120_149\ENGLISH\PS2_0137.awd",
+    0xD557D9973D22F5B1: r"AUDIO\GERMAN\NGC_4s3.rws",
+    0xD55967C8EE7A7751: r"AUDIO\ITALIAN\PS2_1m1.rws",
+    0xD559E575BC601A29: r"w_betabackgroundEULA.index",
+    0xD566E5EDF9ACD66F: r"ANIMGRPS\Lvl_31\Lvl_31D.ads",
+    0xD56994C790DD1B1D: r"LEVELS\L_3_5\SECTIONS\s_4.rws",
+    0xD569B5775BFD785A: r"SB_AGD\60_89\GERMAN\XBX_0078.agd",
+    0xD573FC96D816392A: r"ANIMGRPS\Lvl_15\Lvl_15Y.ads",
+    0xD57A5388D492CE39: r"SB_AWD\240_269\GERMAN\PS2_0263.awd",
+    0xD57A53A9A97ADEEB: r"SB_AWD\210_239\ITALIAN\PS2_0230.awd",
+    0xD580D2AC0D871E0D: r"SB_AGD\60_89\ENGLISH\NGC_0077.agd",
+    0xD5831F0744057B6B: r"SB_AGD\120_149\FRENCH\XBX_0138.agd",
+    0xD59464C53C598C0C: r"SB_AWD\180_209\ITALIAN\NGC_0190.awd",
+    0xD596EE1C6064123C: r"SB_AGD\60_89\SPANISH\NGC_0061.agd",
+    0xD598FEE6AA94CF4F: r"SB_AGD\120_149\ITALIAN\XBX_0134.agd",
+    0xD5991D953A03EE56: r"SB_AGD\240_269\SPANISH\XBX_0250.agd",
+    0xD5A1FE7044D14D1E: r"SB_AWD\90_119\ITALIAN\NGC_0103.awd",
+    0xD5A3FBE3D075E6FE: r"SB_AWD\90_119\ITALIAN\XBX_0116.awd",
+    0xD5A6AD328D005F9E: r"gui_map1_death.txd",
+    0xD5AA5867E9C7FBF6: r"ANIMGRPS\Lvl_34\Lvl_34O.ads",
+    0xD5AF7A8EBB8B87E4: r"SB_AWD\30_59\ENGLISH\NGC_0049.awd",
+    0xD5B2E936C7B81C8B: r"SB_AWD\30_59\ITALIAN\XBX_0048.awd",
+    0xD5B514097091FC4A: r"SB_AGD\60_89\FRENCH\XBX_0087.agd",
+    0xD5C066C15061C268: r"SB_AGD\90_119\ITALIAN\NGC_0097.agd",
+    0xD5C98392CD97A9F7: r"SB_AWD\120_149\ITALIAN\NGC_0125.awd",
+    0xD5CC4177AEB74DE8: r"SB_AWD\120_149\ITALIAN\PS2_0123.awd",
+    0xD5CC95338EA1F7B9: r"SB_AWD\30_59\SPANISH\NGC_0040.awd",
+    0xD5D3BF3A49039FD6: r"SB_AWD\120_149\FRENCH\NGC_0142.awd",
+    0xD5DD71328D2F3C05: r"gui_map1_death.dds",
+    0xD5E1FDFE3E1530AC: r"SB_AWD\150_179\GERMAN\NGC_0177.awd",
+    0xD5E2363C928C03C8: r"SB_AGD\90_119\ENGLISH\XBX_0103.agd",
+    0xD5E7F48985CCBA75: r"SB_AWD\90_119\ITALIAN\XBX_0090.awd",
+    0xD5EA335A2E054DB7: r"SHELL\FONTS\fblds26.met",
+    0xD5EF6A62682BD6AE: r"SB_AGD\210_239\GERMAN\NGC_0218.agd",
+    0xD5F5F723693980F5: r"SB_AWD\30_59\ITALIAN\NGC_0057.awd",
+    0xD5FF4FDFAB1A885D: r"SB_AGD\120_149\SPANISH\NGC_0130.agd",
+    0xD600856C5A7B6555: r"SB_AWD\210_239\GERMAN\PS2_0234.awd",
+    0xD608C3CFDE1C8832: r"XboxSysLink.layout",
+    0xD60D6E1AC05CB471: r"SB_AGD\30_59\ENGLISH\NGC_0053.agd",
+    0xD613DDC0671700DD: r"SB_AGD\0_29\ENGLISH\NGC_0002.agd",
+    0xD6149D69C857B78A: r"font_stringfutb26.tga",
+    0xD61C21A2A25678AB: r"LEVELS\L_1_3_A\CLUMPS\cbank_01.bin",
+    0xD6288BE41AA39D22: r"SB_AWD\60_89\FRENCH\XBX_0076.awd",
+    0xD62AC616187C9230: r"SB_AGD\30_59\ITALIAN\NGC_0045.agd",
+    0xD638695CB8A44DBA: r"SB_AWD\0_29\ITALIAN\XBX_0007.awd",
+    0xD64D7197C232D4AE: r"SB_AWD\210_239\ITALIAN\XBX_0229.awd",
+    0xD651AE81EEEB8948: r"SB_AWD\90_119\ITALIAN\NGC_0101.awd",
+    0xD65341A081985E1A: r"SB_AGD\180_209\SPANISH\XBX_0208.agd",
+    0xD657BD7B7215DFAC: r"font_stringfutb24.tga",
+    0xD65D6D6BA01CAFC1: r"SB_AWD\90_119\FRENCH\PS2_0110.awd",
+    0xD669069D03424D95: r"SB_AGD\30_59\SPANISH\XBX_0042.agd",
+    0xD66EB2A1829E09D0: r"SB_AGD\90_119\ENGLISH\NGC_0101.agd",
+    0xD670BADDF57D7626: r"SB_AWD\30_59\ENGLISH\PS2_0042.awd",
+    0xD671AE9ED806AFAE: r"SB_AWD\0_29\FRENCH\XBX_0018.awd",
+    0xD6817A4FC329E0C1: r"AUDIO\FRENCH\XBX_1s2.rws",
+    0xD694D2A7EDE2A7AC: r"SB_AWD\150_179\ENGLISH\NGC_0175.awd",
+    0xD69C5A85415375D8: r"SB_AWD\240_269\FRENCH\NGC_0247.awd",
+    0xD6A3CF9AB04EA906: r"SB_AGD\210_239\SPANISH\PS2_0213.agd",
+    0xD6A4FBC32FECB62A: r"SB_AGD\210_239\SPANISH\XBX_0225.agd",
+    0xD6BE32A9D0179E0C: r"SB_AWD\180_209\ITALIAN\XBX_0181.awd",
+    0xD6C2B1072838F200: r"SB_AWD\210_239\ITALIAN\NGC_0225.awd",
+    0xD6C9C446110FB936: r"ANIMGRPS\Lvl_23\Lvl_23S.ads",
+    0xD6CA4A79D6BCAEC2: r"SB_AGD\180_209\ITALIAN\XBX_0190.agd",
+    0xD6CA5A904AC26633: r"SB_AWD\30_59\ENGLISH\XBX_0040.awd",
+    0xD6CC1571071453B5: r"gui_map1_ctf.index",
+    0xD6CEBF3A144D655B: r"GenericTwoPromptScreen.layout",
+    0xD6CF5302D4E42630: r"SB_AWD\240_269\FRENCH\PS2_0242.awd",
+    0xD6D872AA90C16F9B: r"SB_AWD\0_29\ENGLISH\XBX_0028.awd",
+    0xD6DC225A192B3559: r"SB_AWD\210_239\SPANISH\PS2_0229.awd",
+    0xD6DD33F081D9E92C: r"AUDIO\GERMAN\PS2_1m2.rws",
+    0xD6E025FD82625B1E: r"LOC\SP\GUI.LOC",
+    0xD6E2EF78474F8591: r"PlayOnline.layout",
+    0xD6E4D2729D143E2C: r"w_flagsDE.txd",
+    0xD6EEB857CE374699: r"SB_AGD\240_269\ITALIAN\XBX_0244.agd",
+    0xD6FBCEF66E6E7A03: r"SB_AWD\180_209\GERMAN\XBX_0205.awd",
+    0xD6FCF353A914FDBA: r"SB_AGD\150_179\FRENCH\NGC_0177.agd",
+    0xD7008C5485CD4F7E: r"SB_AGD\120_149\ENGLISH\NGC_0142.agd",
+    0xD700949CBCC680C7: r"SB_AGD\90_119\ENGLISH\NGC_0115.agd",
+    0xD70C45DCFFC1EBB1: r"SHELL\FONTS\mfblds28.png",
+    0xD71A9E729D41752F: r"w_flagsDE.dds",
+    0xD728010A981D13BC: r"ANIMGRPS\Lvl_26\Lvl_26O.ads",
+    0xD732CD5ACE782B76: r"SB_AWD\120_149\ITALIAN\NGC_0133.awd",
+    0xD741E2D0273573D3: r"SHELL\LOAD\MP_5_DM.txd",
+    0xD753CBD4DA0575C4: r"SB_AGD\210_239\SPANISH\XBX_0227.agd",
+    0xD754F1CA1B5336EC: r"ANIMGRPS\Lvl_14\Lvl_14I.ads",
+    0xD76888B1B43D8DFA: r"SB_AGD\240_269\GERMAN\NGC_0265.agd",
+    0xD7700413722E8FCF: r"LEVELS\L_3_3\SECTIONS\s_4.rws",
+    0xD77E57A15C6538DE: r"ANIMGRPS\Lvl_16\Lvl_16W.ads",
+    0xD78A09BB12247419: r"gui_map1_ctf.txd",
+    0xD78B30E0B67A3A10: r"SB_AWD\240_269\ENGLISH\XBX_0249.awd",
+    0xD78FBF93DB1FBCEC: r"SHELL\FONTS\mfb28.png",
+    0xD791BF546E67A1A8: r"SB_AWD\60_89\ENGLISH\NGC_0065.awd",
+    0xD795AC5E25CEC64C: r"SB_AGD\30_59\ENGLISH\NGC_0038.agd",
+    0xD7968B0354274E20: r"SB_AWD\240_269\ITALIAN\NGC_0247.awd",
+    0xD797FC352C8636D6: r"SB_AWD\90_119\SPANISH\PS2_0111.awd",
+    0xD7A74E1FE662C3E7: r"SB_AWD\60_89\SPANISH\PS2_0085.awd",
+    0xD7AB31EFE67BC808: r"SB_AWD\180_209\FRENCH\XBX_0200.awd",
+    0xD7AC4365532E96D4: r"SB_AGD\150_179\FRENCH\NGC_0175.agd",
+    0xD7AEB0BB1D64D29A: r"LEVELS\L_2_1_B\SECTIONS\s_5.rws",
+    0xD7AEC24E0DF725A5: r"SB_AGD\120_149\ENGLISH\NGC_0138.agd",
+    0xD7B1D1FEB9066DA0: r"SB_AWD\210_239\ITALIAN\PS2_0219.awd",
+    0xD7B20B05FA2D00BA: r"SB_AGD\150_179\FRENCH\XBX_0162.agd",
+    0xD7B38327917DBF74: r"SB_AGD\90_119\SPANISH\XBX_0110.agd",
+    0xD7B4FAB6C749EF87: r"SB_AGD\180_209\FRENCH\PS2_0200.agd",
+    0xD7BF471E71BCA6BE: r"SB_AGD\180_209\ITALIAN\PS2_0203.agd",
+    0xD7C0A75B6CE7C3B4: r"SB_AWD\60_89\ENGLISH\XBX_0085.awd",
+    0xD7C0EDBB1253876A: r"gui_map1_ctf.dds",
+    0xD7C28E35C7C1F681: r"SB_AGD\30_59\ENGLISH\NGC_0040.agd",
+    0xD7C42BF32494652A: r"SB_AWD\240_269\ITALIAN\XBX_0247.awd",
+    0xD7C4AEF5A4B67BF8: r"LEVELS\MP_1\level.dff",
+    0xD7C7898930836EB8: r"SB_AWD\120_149\ITALIAN\NGC_0148.awd",
+    0xD7CC3FF343048362: r"SB_AGD\0_29\ENGLISH\PS2_0004.agd",
+    0xD7D2DE2258EBDF5D: r"SB_AWD\180_209\GERMAN\XBX_0184.awd",
+    0xD7D407DFD18C36CD: r"SHELL\MOVIES\ITALIAN\1_3_Mon.bik",
+    0xD7ED2D88A55D6001: r"SB_AGD\90_119\GERMAN\XBX_0098.agd",
+    0xD7F2128F15C06AA9: r"SB_AWD\60_89\SPANISH\PS2_0072.awd",
+    0xD7F3AFF5A4DDEE60: r"LEVELS\MP_1\level.rws",
+    0xD7F4459FBEAFFD15: r"SB_AGD\0_29\SPANISH\XBX_0008.agd",
+    0xD7F87781040990E5: r"SB_AGD\240_269\ENGLISH\PS2_0258.agd",
+    0xD7FCEE608C0F1C1B: r"SB_AWD\240_269\ENGLISH\XBX_0260.awd",
+    0xD7FDE95E6F7D80CA: r"SB_AGD\30_59\GERMAN\PS2_0044.agd",
+    0xD80445DBC56CD64E: r"ANIMGRPS\Lvl_14\Lvl_14K.ads",
+    0xD80CFC9326CD3D6F: r"WPNBANK\0_25\wbank_05.bin",
+    0xD8165C4C5FEF1E63: r"LEVELS\MP_10\SECTIONS\s_10.rws",
+    0xD822602A10FA069D: r"SB_AGD\0_29\ITALIAN\PS2_0010.agd",
+    0xD824135178B24969: r"SB_AGD\90_119\ENGLISH\XBX_0094.agd",
+    0xD82779CC0E17F2DA: r"SB_AWD\180_209\ITALIAN\NGC_0206.awd",
+    0xD82784CB75DD16A6: r"ANIMGRPS\Lvl_23\Lvl_23C.ads",
+    0xD8286CFE8E4FC517: r"SB_AWD\240_269\ITALIAN\NGC_0257.awd",
+    0xD835E95805E7F7EA: r"SHELL\FONTS\mfbld26.png",
+    0xD8368F4BF48FA660: r"SB_AWD\120_149\FRENCH\NGC_0140.awd",
+    0xD83C73CAE0BC8203: r"SB_AGD\210_239\ENGLISH\NGC_0226.agd",
+    0xD8448C6FCFE7A00E: r"SB_AGD\30_59\ENGLISH\NGC_0036.agd",
+    0xD844B27775395909: r"SHELL\LOAD\L_1_3_B.txd",
+    0xD849FB01AC9791C2: r"AUDIO\SPANISH\PS2_2m1.rws",
+    0xD84CDD4B51DB5B95: r"QuitGame.layout",
+    0xD8568F8E2700C58E: r"SB_AGD\180_209\SPANISH\PS2_0193.agd",
+    0xD8615B17A44699D4: r"SB_AGD\150_179\FRENCH\XBX_0160.agd",
+    0xD86811827E7FCD18: r"SB_AGD\0_29\ENGLISH\XBX_0009.agd",
+    0xD86E7B2AA5BF436F: r"SB_AWD\0_29\GERMAN\NGC_0019.awd",
+    0xD873D2030A2E9A61: r"SB_AWD\240_269\ENGLISH\NGC_0255.awd",
+    0xD87D2F857B22A322: r"ANIMGRPS\Lvl_33\Lvl_33M.ads",
+    0xD87D915CE276277D: r"SB_AWD\30_59\ENGLISH\PS2_0038.awd",
+    0xD87F6A94DE21F152: r"SB_AGD\180_209\ITALIAN\XBX_0183.agd",
+    0xD8803C843FFE3A34: r"SB_AGD\120_149\FRENCH\PS2_0127.agd",
+    0xD8809AAB52299223: r"SB_AWD\30_59\ENGLISH\XBX_0035.awd",
+    0xD884FC3E2E3E49DD: r"SB_AGD\60_89\FRENCH\PS2_0083.agd",
+    0xD88A534E12FC2211: r"SB_AWD\60_89\ENGLISH\PS2_0072.awd",
+    0xD8A375EF6BDB6341: r"SB_AGD\0_29\FRENCH\PS2_0007.agd",
+    0xD8C6B2E580679D45: r"SB_AWD\210_239\FRENCH\NGC_0219.awd",
+    0xD8D1B03BBB139F2F: r"SB_AGD\0_29\ITALIAN\PS2_0016.agd",
+    0xD8D3C653FBC85EB5: r"SB_AGD\30_59\GERMAN\XBX_0039.agd",
+    0xD8D49BCAFB798F0A: r"SB_AGD\90_119\ITALIAN\NGC_0114.agd",
+    0xD8EA24F8DF1E4D92: r"SB_AWD\120_149\FRENCH\XBX_0148.awd",
+    0xD8EFCB09D1CD9B7C: r"ANIMGRPS\Lvl_11\Lvl_11W.ads",
+    0xD8F1AFB7E73F0D54: r"LEVELS\L_2_1_B\global.dff",
+    0xD8F3DCD0C27855A3: r"SB_AWD\0_29\FRENCH\XBX_0020.awd",
+    0xD8FB4324709A235E: r"SB_AWD\150_179\SPANISH\NGC_0159.awd",
+    0xD8FC89710A2F608F: r"SB_AGD\30_59\GERMAN\NGC_0039.agd",
+    0xD8FF2442576C8477: r"NextRound.layout",
+    0xD9069FAC5BDAAF90: r"SB_AGD\210_239\SPANISH\PS2_0211.agd",
+    0xD908BFC761CE5DA0: r"SB_AGD\210_239\SPANISH\PS2_0224.agd",
+    0xD91058B15C9C78BC: r"SB_AGD\0_29\GERMAN\NGC_0012.agd",
+    0xD92B02F6C103CB90: r"SB_AWD\210_239\ENGLISH\NGC_0210.awd",
+    0xD9350EA81265A78C: r"SB_AWD\30_59\ENGLISH\NGC_0038.awd",
+    0xD951E969B05DDA68: r"SHELL\FONTS\mfbld24.png",
+    0xD952460115F42253: r"SB_AGD\0_29\FRENCH\PS2_0009.agd",
+    0xD968BCE48B5C444F: r"SB_AGD\150_179\ITALIAN\NGC_0154.agd",
+    0xD9697C4D1A87D01B: r"SB_AGD\60_89\ITALIAN\XBX_0082.agd",
+    0xD971617FF6D80379: r"ANIMGRPS\Lvl_35\Lvl_35R.ads",
+    0xD9732004FA06552C: r"SB_AWD\0_29\ITALIAN\PS2_0028.awd",
+    0xD97C39FFA6A99EC9: r"ANIMGRPS\Lvl_31\Lvl_31J.ads",
+    0xD993A9FF96717641: r"SB_AWD\150_179\ITALIAN\XBX_0161.awd",
+    0xD99DB345F25B3B3C: r"SB_AGD\180_209\ENGLISH\PS2_0205.agd",
+    0xD99FA2A9EA4FF4C1: r"SB_AWD\180_209\FRENCH\NGC_0184.awd",
+    0xD9A46A0BBF4EE334: r"SB_AGD\240_269\ITALIAN\PS2_0246.agd",
+    0xD9AE5EF85791AB89: r"SB_AGD\120_149\ITALIAN\XBX_0136.agd",
+    0xD9C49310DB28029B: r"SB_AWD\120_149\ITALIAN\PS2_0137.awd",
+    0xD9C895B7E71F58A5: r"ANIMGRPS\Lvl_26\Lvl_26Z.ads",
+    0xD9C8C7229F18A5AE: r"SB_AGD\60_89\FRENCH\NGC_0067.agd",
+    0xD9CE6823D81BE83E: r"SB_AWD\90_119\SPANISH\NGC_0095.awd",
+    0xD9CF8B3B253DAB16: r"SB_AWD\150_179\ENGLISH\XBX_0179.awd",
+    0xD9D112EA86F562DF: r"SB_AGD\240_269\FRENCH\XBX_0264.agd",
+    0xD9DFE5208FDFBA43: r"w_border_highlight.index",
+    0xD9E0EE9BFA0FCB1D: r"SB_AGD\60_89\ENGLISH\NGC_0064.agd",
+    0xD9E373409B94689D: r"SB_AWD\150_179\ITALIAN\NGC_0152.awd",
+    0xD9E8D6D5C4559DBB: r"ScoreBoardTeam.layout",
+    0xD9E9B41A83514741: r"SB_AGD\150_179\GERMAN\XBX_0163.agd",
+    0xD9EC054D466C466F: r"LEVELS\L_3_5_C\SECTIONS\s_28.rws",
+    0xD9ED56444406BCBF: r"SB_AGD\240_269\ITALIAN\NGC_0248.agd",
+    0xD9F6BE0FEB10FD8E: r"SB_AWD\150_179\GERMAN\NGC_0179.awd",
+    0xD9FACC46D8123D60: r"SB_AWD\90_119\SPANISH\PS2_0113.awd",
+    0xD9FBE62B9861CA26: r"SB_AWD\0_29\ENGLISH\PS2_0000.awd",
+    0xDA009404BF73F73A: r"SB_AGD\180_209\ENGLISH\NGC_0192.agd",
+    0xDA024D75111383CC: r"SB_AGD\120_149\ENGLISH\PS2_0141.agd",
+    0xDA03861C2E92DDD3: r"LEVELS\L_1_3_A\GodData.dff",
+    0xDA149FF1581749EF: r"SB_AGD\120_149\SPANISH\NGC_0136.agd",
+    0xDA1675344F69329E: r"SHELL\MOVIES\Act_2.bik",
+    0xDA16757E077936C7: r"SB_AWD\210_239\GERMAN\PS2_0232.awd",
+    0xDA1DD53283C38FB5: r"ANIMGRPS\Lvl_26\Lvl_26J.ads",
+    0xDA292DD21413C26F: r"SB_AGD\0_29\ENGLISH\NGC_0004.agd",
+    0xDA29BF82BA208D67: r"SB_AWD\120_149\ITALIAN\NGC_0136.awd",
+    0xDA3FAE4D06B871FC: r"gui_map7_death.index",
+    0xDA409627C57A2DC2: r"SB_AGD\30_59\ITALIAN\NGC_0043.agd",
+    0xDA470F065ED56028: r"SB_AWD\180_209\ENGLISH\PS2_0199.awd",
+    0xDA4A001B1B5C3E7B: r"SB_AWD\90_119\ITALIAN\NGC_0119.awd",
+    0xDA4E596E65A21F34: r"SB_AWD\0_29\ITALIAN\XBX_0005.awd",
+    0xDA525832DC30BD86: r"SB_AWD\180_209\GERMAN\PS2_0180.awd",
+    0xDA54578FFC44CB7D: r"SB_AGD\30_59\SPANISH\NGC_0057.agd",
+    0xDA5804091A2953BC: r"SB_AWD\240_269\FRENCH\XBX_0256.awd",
+    0xDA5FBE72379B22B5: r"SB_AWD\240_269\ENGLISH\XBX_0262.awd",
+    0xDA5FFDC61550A2A7: r"AUDIO\GERMAN\NGC_1m2.rws",
+    0xDA6BEC9926369D9F: r"SB_AGD\90_119\SPANISH\NGC_0115.agd",
+    0xDA7ACC4B47644D85: r"SHELL\MOVIES\Making1.bik",
+    0xDA7DD6AEB03E35A7: r"SB_AGD\30_59\SPANISH\XBX_0044.agd",
+    0xDA860AEFA27A37B0: r"SB_AWD\30_59\ENGLISH\PS2_0040.awd",
+    0xDA8C87FCF77D75A5: r"SB_AGD\180_209\FRENCH\XBX_0209.agd",
+    0xDA903EADA42963AF: r"SB_AGD\60_89\ENGLISH\NGC_0062.agd",
+    0xDA9714363C589FB6: r"SB_AGD\210_239\ITALIAN\XBX_0221.agd",
+    0xDAABB2B24A2472D1: r"gui_map2_destroy.index",
+    0xDAAFE416698D9054: r"SB_AGD\180_209\ENGLISH\NGC_0190.agd",
+    0xDAB2B31CB809EB13: r"DNASFailed.layout",
+    0xDAB3A3FF24A65334: r"LEVELS\MP_1\SECTIONS\s_4.rws",
+    0xDABBFEC82A7B02B4: r"SB_AGD\0_29\SPANISH\PS2_0006.agd",
+    0xDACAF7B84CD4C760: r"AUDIO\SPANISH\PS2_2s1.rws",
+    0xDACE5571712725DA: r"SB_AWD\120_149\FRENCH\PS2_0143.awd",
+    0xDAD0AA98DB24C8FB: r"SB_AGD\60_89\ITALIAN\NGC_0066.agd",
+    0xDAD878CAE64DAF2F: r"SB_AWD\30_59\SPANISH\PS2_0050.awd",
+    0xDAD8A118D536C3F2: r"SB_AWD\210_239\ITALIAN\NGC_0223.awd",
+    0xDB05D50F2145EBE2: r"SB_AWD\240_269\SPANISH\NGC_0263.awd",
+    0xDB062CB0AEAD4491: r"SB_AWD\60_89\ENGLISH\NGC_0086.awd",
+    0xDB0D339691F32C0F: r"SB_AGD\180_209\FRENCH\XBX_0184.agd",
+    0xDB18EB1E66567F8C: r"SB_AGD\60_89\GERMAN\NGC_0078.agd",
+    0xDB194B6EAE7F453C: r"SB_AWD\150_179\FRENCH\XBX_0177.awd",
+    0xDB1F62DE9CB765D2: r"SB_AGD\120_149\SPANISH\PS2_0143.agd",
+    0xDB233E8CD73DEA3A: r"SB_AWD\120_149\SPANISH\XBX_0148.awd",
+    0xDB30A864BE2000A3: r"SB_AWD\210_239\FRENCH\PS2_0238.awd",
+    0xDB310BAE4D608394: r"SB_AWD\150_179\GERMAN\XBX_0153.awd",
+    0xDB34161EF8CEAB3D: r"SB_AGD\30_59\FRENCH\PS2_0030.agd",
+    0xDB3427C619BB2624: r"SB_AGD\30_59\GERMAN\NGC_0050.agd",
+    0xDB34A5A410605584: r"SB_AGD\60_89\GERMAN\XBX_0069.agd",
+    0xDB36E5EF69995B9F: r"SB_AGD\30_59\SPANISH\PS2_0047.agd",
+    0xDB3BBAC1F2434FBB: r"SB_AGD\90_119\GERMAN\PS2_0099.agd",
+    0xDB3E5E706C9FF7EC: r"SB_AWD\0_29\ITALIAN\NGC_0018.awd",
+    0xDB412E97E4DBA545: r"SB_AWD\240_269\ENGLISH\PS2_0258.awd",
+    0xDB466447E67238C0: r"SB_AGD\210_239\ITALIAN\XBX_0223.agd",
+    0xDB50C9681E3B8F60: r"SB_AGD\30_59\ITALIAN\XBX_0054.agd",
+    0xDB5370B52C976362: r"SB_AWD\210_239\FRENCH\NGC_0230.awd",
+    0xDB5BED024C76FC33: r"SB_AWD\120_149\ITALIAN\XBX_0145.awd",
+    0xDB620D084B5A281F: r"SB_AGD\120_149\GERMAN\PS2_0126.agd",
+    0xDB66414A461C29DC: r"SB_AGD\210_239\ENGLISH\NGC_0214.agd",
+    0xDB6B0FD90D598AB2: r"SB_AGD\210_239\SPANISH\PS2_0222.agd",
+    0xDB7469FB7809D575: r"SB_AGD\60_89\SPANISH\PS2_0069.agd",
+    0xDB75A487A978E9BA: r"SB_AGD\240_269\ITALIAN\NGC_0263.agd",
+    0xDB778BDA09DA5540: r"SB_AWD\60_89\GERMAN\PS2_0071.awd",
+    0xDB7DD8C3613A4F14: r"SB_AGD\240_269\GERMAN\NGC_0267.agd",
+    0xDB812BC7275886EB: r"SB_AGD\240_269\SPANISH\XBX_0268.agd",
+    0xDB84D86D992F68AB: r"SB_AWD\0_29\ENGLISH\PS2_0027.awd",
+    0xDB8D33086C8EC2C2: r"SB_AWD\210_239\ENGLISH\NGC_0216.awd",
+    0xDB915FB720D19365: r"ANIMGRPS\Lvl_11\Lvl_11B.ads",
+    0xDB9423B30962CC80: r"ANIMGRPS\Lvl_16\Lvl_16Q.ads",
+    0xDB965921A37F031F: r"ANIMGRPS\Lvl_21\Lvl_21N.ads",
+    0xDB97F91697C9B434: r"SB_AGD\210_239\GERMAN\XBX_0218.agd",
+    0xDBBC93A83C0CE049: r"SB_AGD\180_209\FRENCH\XBX_0186.agd",
+    0xDBBCCABD99737729: r"SB_AGD\30_59\GERMAN\XBX_0057.agd",
+    0xDBC31323F7C9F44C: r"SB_AWD\150_179\SPANISH\XBX_0177.awd",
+    0xDBC510B0791461C7: r"SHELL\MOVIES\ITALIAN\2_2_Mon.bik",
+    0xDBD464E79BD1D664: r"SHELL\FONTS\fbld26.met",
+    0xDBD7789455806FC3: r"SB_AGD\210_239\GERMAN\NGC_0220.agd",
+    0xDBD95C04D190F0E4: r"SB_AWD\240_269\ITALIAN\XBX_0245.awd",
+    0xDBDD1310F05F77ED: r"SB_AWD\240_269\ENGLISH\XBX_0253.awd",
+    0xDBE2CA20F01AD9A9: r"SB_AGD\180_209\ENGLISH\XBX_0193.agd",
+    0xDBE69F31BD75CA75: r"ANIMGRPS\Lvl_11\Lvl_11R.ads",
+    0xDBE72076B11EB726: r"SB_AGD\30_59\SPANISH\XBX_0034.agd",
+    0xDBEBA6924AC317D6: r"SB_AWD\180_209\FRENCH\NGC_0200.awd",
+    0xDBEE1E8216BA4ECE: r"SB_AWD\0_29\ITALIAN\NGC_0016.awd",
+    0xDBEF5747FD829BF4: r"SB_AGD\120_149\ITALIAN\PS2_0127.agd",
+    0xDBF2227545E45D1C: r"SB_AGD\210_239\ITALIAN\NGC_0232.agd",
+    0xDBF83F2084127FF4: r"SB_AGD\150_179\SPANISH\PS2_0170.agd",
+    0xDBFF25A4954D3F13: r"SB_AWD\150_179\SPANISH\XBX_0167.awd",
+    0xDC02FD9A525AFB13: r"SB_AGD\90_119\GERMAN\XBX_0096.agd",
+    0xDC084F3A78F60DC9: r"LEVELS\L_1_3_B\SECTIONS\s_9.rws",
+    0xDC1E1DF1B41CA01A: r"SB_AWD\120_149\SPANISH\NGC_0146.awd",
+    0xDC24F499539282D4: r"SB_AGD\240_269\ITALIAN\NGC_0261.agd",
+    0xDC267BEBB3F34A32: r"SB_AWD\60_89\GERMAN\PS2_0077.awd",
+    0xDC27632286B40935: r"SB_AWD\120_149\ITALIAN\PS2_0135.awd",
+    0xDC2D297526349347: r"SB_AWD\30_59\ITALIAN\XBX_0039.awd",
+    0xDC32F2FC327FD119: r"SB_AGD\240_269\FRENCH\XBX_0266.agd",
+    0xDC3B6F4289FDB9EF: r"SB_AWD\150_179\GERMAN\PS2_0166.awd",
+    0xDC3EC0CCCACA3684: r"LEVELS\L_2_1_B\SECTIONS\s_7.rws",
+    0xDC4923FDCF4864D3: r"SB_AWD\90_119\SPANISH\PS2_0095.awd",
+    0xDC60631BAAF082CB: r"SB_AGD\0_29\ENGLISH\XBX_0011.agd",
+    0xDC64648D613792D1: r"SB_AGD\180_209\GERMAN\XBX_0188.agd",
+    0xDC66FB3D13722ED4: r"SB_AWD\0_29\GERMAN\XBX_0025.awd",
+    0xDC8A962CB36F07F3: r"SB_AGD\60_89\SPANISH\PS2_0089.agd",
+    0xDC8D17176EEA95FD: r"SB_AWD\120_149\FRENCH\XBX_0132.awd",
+    0xDC8DC7512211D777: r"SB_AWD\240_269\SPANISH\NGC_0248.awd",
+    0xDC9A4C4FDB3B0B6F: r"SB_AGD\60_89\FRENCH\PS2_0085.agd",
+    0xDC9CB334E9B2F1D0: r"SB_AWD\30_59\FRENCH\PS2_0048.awd",
+    0xDCA2EF298B6A6B5F: r"SB_AGD\0_29\GERMAN\XBX_0013.agd",
+    0xDCB8A0C6E447CFA9: r"SB_AWD\210_239\GERMAN\XBX_0219.awd",
+    0xDCB9B91480D337BF: r"SB_AWD\0_29\FRENCH\NGC_0004.awd",
+    0xDCC079CAD6E2DEAC: r"SB_AGD\150_179\ENGLISH\XBX_0155.agd",
+    0xDCC33D480AF07597: r"SB_AWD\150_179\ENGLISH\XBX_0163.awd",
+    0xDCCB731ABD67AACC: r"SB_AGD\150_179\ITALIAN\XBX_0160.agd",
+    0xDCCECCAAD1C2BFD9: r"SB_AGD\90_119\SPANISH\NGC_0117.agd",
+    0xDCD0B05F5FDD899B: r"SB_AGD\240_269\ENGLISH\XBX_0259.agd",
+    0xDCD24CC51808E12F: r"SB_AGD\180_209\ITALIAN\XBX_0199.agd",
+    0xDCE13DD3CEB27E29: r"SB_AGD\30_59\FRENCH\XBX_0051.agd",
+    0xDCFE4B200EE9E713: r"SB_AGD\0_29\GERMAN\NGC_0024.agd",
+    0xDD01AEF018AD106B: r"SB_AGD\90_119\FRENCH\NGC_0104.agd",
+    0xDD0F55C346089FF6: r"SB_AGD\60_89\ENGLISH\PS2_0062.agd",
+    0xDD13B49F0B512B63: r"SB_AGD\180_209\GERMAN\XBX_0186.agd",
+    0xDD2805AC5E45751D: r"SB_AWD\210_239\ENGLISH\NGC_0224.awd",
+    0xDD3A78DC91D854C9: r"SB_AWD\30_59\SPANISH\PS2_0052.awd",
+    0xDD3BE7291903548F: r"SB_AWD\120_149\FRENCH\XBX_0134.awd",
+    0xDD49C673713D837F: r"SHELL\LOAD\MP_5_SD.txd",
+    0xDD5913F0521AFABC: r"ANIMGRPS\Lvl_32\Lvl_32Q.ads",
+    0xDD67C6B9CDAAECB8: r"SB_AWD\210_239\FRENCH\PS2_0211.awd",
+    0xDD68F9262AECB519: r"SB_AWD\0_29\FRENCH\NGC_0006.awd",
+    0xDD6A5EBE4F67FC58: r"LEVELS\MP_9\GodData.dff",
+    0xDD6B680F1126FD83: r"ANIMGRPS\Lvl_25\Lvl_25B.ads",
+    0xDD70CAC67FAFE01A: r"SB_AGD\30_59\ITALIAN\NGC_0032.agd",
+    0xDD7C75080F8182FC: r"SB_AWD\150_179\ITALIAN\PS2_0170.awd",
+    0xDD7E1CF638592089: r"SB_AGD\150_179\ITALIAN\NGC_0156.agd",
+    0xDD7F4C5EC7856B35: r"SB_AGD\60_89\ITALIAN\XBX_0080.agd",
+    0xDD87E016A702220E: r"SB_AWD\0_29\ITALIAN\PS2_0026.awd",
+    0xDD8A730C1B129776: r"SB_AWD\150_179\FRENCH\PS2_0161.awd",
+    0xDD976B4BE3857BEF: r"SHELL\LOAD\MP_1_CTF.txd",
+    0xDD99C60115257DD9: r"SB_AGD\30_59\SPANISH\PS2_0045.agd",
+    0xDDAE085E5C1F31EC: r"SB_AWD\90_119\ITALIAN\PS2_0108.awd",
+    0xDDB28016A40094A2: r"w_betagamespy.index",
+    0xDDB31979C9C6BC72: r"SB_AGD\30_59\ITALIAN\XBX_0052.agd",
+    0xDDB5B3FD4C3B3F1A: r"SB_AWD\60_89\FRENCH\NGC_0070.awd",
+    0xDDC0A789ADCB3493: r"ANIMGRPS\Lvl_25\Lvl_25R.ads",
+    0xDDC31002C764E5A4: r"SHELL\LOAD\MP_4_DM.txd",
+    0xDDC4ED19F6E64A59: r"SB_AGD\120_149\GERMAN\PS2_0124.agd",
+    0xDDD662BC03588116: r"SHELL\FEND\INSTANCE\XBOX\PROFILE.TXD",
+    0xDDDD97344C148DB8: r"SB_AGD\60_89\FRENCH\NGC_0065.agd",
+    0xDDF40E8BF786ED3A: r"SB_AGD\60_89\ITALIAN\XBX_0076.agd",
+    0xDDF4A7C45E1ED270: r"SB_AGD\60_89\ENGLISH\NGC_0083.agd",
+    0xDDFB6C36E666BDAC: r"SB_AWD\90_119\FRENCH\NGC_0114.awd",
+    0xDDFD3DEB9867F0D7: r"WPNBANK\26_50\wbank_29.bin",
+    0xDDFF62E66ABA97AE: r"SB_AGD\90_119\SPANISH\PS2_0119.agd",
+    0xDE0285C2C67B7811: r"SB_AGD\120_149\GERMAN\NGC_0129.agd",
+    0xDE0B9D3F526FCA4B: r"SB_AWD\90_119\ITALIAN\XBX_0100.awd",
+    0xDE0E23B999A26DA0: r"SB_AGD\0_29\ITALIAN\NGC_0003.agd",
+    0xDE11363D455E8BB0: r"SB_AWD\0_29\ENGLISH\PS2_0002.awd",
+    0xDE1A3C20BB3FC3FD: r"ANIMGRPS\Lvl_25\Lvl_25D.ads",
+    0xDE1B0A63553D4DEB: r"SB_AGD\210_239\SPANISH\NGC_0213.agd",
+    0xDE29B4ECC55BD0BD: r"SB_AGD\90_119\ENGLISH\NGC_0108.agd",
+    0xDE2AD09779A1A2AC: r"SB_AWD\60_89\GERMAN\NGC_0067.awd",
+    0xDE3D01F66DB29039: r"SB_AGD\120_149\SPANISH\XBX_0121.agd",
+    0xDE3F609F8B4615DB: r"SB_AWD\180_209\ENGLISH\PS2_0181.awd",
+    0xDE4E76A3F64F1E60: r"SB_AWD\180_209\FRENCH\NGC_0202.awd",
+    0xDE50977D56EECB2A: r"SB_AGD\120_149\SPANISH\PS2_0132.agd",
+    0xDE5BF142CFC8018C: r"SB_AGD\180_209\GERMAN\PS2_0205.agd",
+    0xDE5DC870063988CE: r"SB_AWD\90_119\ITALIAN\PS2_0106.awd",
+    0xDE6D606CABE9A40E: r"AUDIO\ITALIAN\PS2_4s1.rws",
+    0xDE6FC2417E05ACDB: r"SB_AGD\180_209\SPANISH\NGC_0197.agd",
+    0xDE6FFB9B57E4D44D: r"ANIMGRPS\Lvl_25\Lvl_25T.ads",
+    0xDE74D0626E49AB8F: r"SB_AGD\60_89\GERMAN\PS2_0087.agd",
+    0xDE8028DB05C611DC: r"PlayOnlineBase.layout",
+    0xDE9158C2622EE78A: r"SB_AGD\30_59\GERMAN\XBX_0047.agd",
+    0xDE98480546D63E7B: r"SB_AGD\60_89\ENGLISH\PS2_0089.agd",
+    0xDE9DC54F85939DDF: r"SB_AGD\90_119\SPANISH\PS2_0091.agd",
+    0xDE9E6F54358A1189: r"SB_AWD\150_179\GERMAN\PS2_0164.awd",
+    0xDEA28147BBCAA32E: r"SB_AGD\210_239\GERMAN\PS2_0215.agd",
+    0xDEA35E9DA1A08654: r"SB_AGD\60_89\ITALIAN\XBX_0074.agd",
+    0xDEA377D608379102: r"SB_AGD\60_89\ENGLISH\NGC_0085.agd",
+    0xDEA989B3D6ABA22F: r"SB_AWD\30_59\FRENCH\PS2_0036.awd",
+    0xDEAD12A9D4B91CA6: r"JoinError.layout",
+    0xDEB75825B8D64A0A: r"SB_AGD\180_209\ENGLISH\XBX_0183.agd",
+    0xDEB83FF906B2372C: r"SB_AWD\240_269\FRENCH\XBX_0245.awd",
+    0xDEC03F9265913887: r"SB_AGD\90_119\FRENCH\PS2_0112.agd",
+    0xDEC3332D567C8965: r"SB_AGD\0_29\ENGLISH\XBX_0013.agd",
+    0xDECD15F89C902A27: r"LEVELS\L_1_2\SECTIONS\s_5.rws",
+    0xDED70A09215A0D40: r"SB_AWD\240_269\FRENCH\NGC_0265.awd",
+    0xDED75023569B62E2: r"SB_AWD\0_29\SPANISH\XBX_0025.awd",
+    0xDED87576FB33D923: r"SB_AGD\90_119\GERMAN\PS2_0103.agd",
+    0xDEDDF29E9CC6E2B7: r"SB_AGD\30_59\SPANISH\XBX_0031.agd",
+    0xDEE297DA148F954D: r"SHELL\MOVIES\3_5_Mon.bik",
+    0xDEED8258CE8A20AC: r"SB_AWD\30_59\ITALIAN\PS2_0044.awd",
+    0xDEF22744206A80FF: r"SB_AWD\120_149\FRENCH\XBX_0141.awd",
+    0xDEFED036F833ADDB: r"SB_AWD\90_119\GERMAN\NGC_0115.awd",
+    0xDEFF678F01078AC4: r"SB_AGD\120_149\SPANISH\PS2_0130.agd",
+    0xDF04CF3B36F4D999: r"SB_AGD\0_29\GERMAN\XBX_0011.agd",
+    0xDF06DA86D7CBBFD6: r"SB_AGD\0_29\FRENCH\XBX_0010.agd",
+    0xDF0A68585463EC75: r"SB_AGD\240_269\SPANISH\NGC_0259.agd",
+    0xDF0BE7F7DB6E54F5: r"SHELL\FONTS\tw28.met",
+    0xDF0BF3D28D051E2A: r"LEVELS\L_2_2\SECTIONS\s_5.rws",
+    0xDF156F0D2C3CBD3D: r"AUDIO\SPANISH\XBX_2m3.rws",
+    0xDF1E70609CF22EF1: r"SB_AWD\210_239\SPANISH\NGC_0228.awd",
+    0xDF1E9253281E6BF5: r"SB_AGD\180_209\SPANISH\NGC_0195.agd",
+    0xDF24307418635FC9: r"SB_AGD\60_89\GERMAN\PS2_0085.agd",
+    0xDF2449A7A273B39E: r"SB_AWD\240_269\SPANISH\XBX_0261.awd",
+    0xDF2AB312AC95C426: r"SB_AWD\150_179\SPANISH\NGC_0168.awd",
+    0xDF2ECB301354364E: r"SB_AGD\60_89\GERMAN\NGC_0076.agd",
+    0xDF2FF3476EE6A09E: r"SB_AGD\150_179\ITALIAN\XBX_0171.agd",
+    0xDF3534D7A7EFD3DA: r"LEVELS\L_3_1_C\SECTIONS\s_14.rws",
+    0xDF364DFA715731F4: r"SB_AGD\0_29\ITALIAN\XBX_0005.agd",
+    0xDF3DF1716B55E1C4: r"SB_AWD\90_119\GERMAN\PS2_0113.awd",
+    0xDF46ED5A34B25A1A: r"SB_AWD\90_119\SPANISH\NGC_0107.awd",
+    0xDF57172708C79E93: r"SB_AGD\30_59\FRENCH\NGC_0055.agd",
+    0xDF5BB7CA1874AD2C: r"SB_AGD\60_89\FRENCH\XBX_0063.agd",
+    0xDF5EBA2C4AD48A43: r"SB_AWD\150_179\ITALIAN\XBX_0170.awd",
+    0xDF6A2C6451876F85: r"SB_AGD\90_119\FRENCH\XBX_0096.agd",
+    0xDF6CF449FBC46BED: r"SB_AWD\210_239\ITALIAN\PS2_0210.awd",
+    0xDF6D345E8BDFDCDD: r"SB_AWD\30_59\GERMAN\PS2_0050.awd",
+    0xDF6F06E9D85D8095: r"SB_AWD\180_209\GERMAN\NGC_0182.awd",
+    0xDF7022DEF8D02964: r"LEVELS\L_3_5\SECTIONS\s_1.rws",
+    0xDF8052016DEA10B1: r"LEVELS\L_3_1_C\GodData.dff",
+    0xDF85FA1ACB730232: r"SB_AWD\240_269\FRENCH\NGC_0263.awd",
+    0xDF968E347A288CFD: r"SB_AWD\240_269\GERMAN\NGC_0248.awd",
+    0xDF9887C6812C91B3: r"SB_AGD\60_89\SPANISH\XBX_0073.agd",
+    0xDFA2BDC15CBBEEEB: r"SB_AWD\60_89\FRENCH\PS2_0063.awd",
+    0xDFA5FA3E568202CC: r"LEVELS\MP_7\SECTIONS\s_15.rws",
+    0xDFAB1862A30CE7B0: r"SB_AGD\150_179\ITALIAN\PS2_0174.agd",
+    0xDFB8B8590C13F61D: r"LEVELS\L_1_2\SECTIONS\s_25.rws",
+    0xDFBDE8A58A1C3723: r"SB_AWD\0_29\SPANISH\NGC_0008.awd",
+    0xDFC2B3283587EA1C: r"SB_AGD\120_149\ENGLISH\XBX_0142.agd",
+    0xDFCD4072470AED83: r"SB_AWD\210_239\SPANISH\NGC_0226.awd",
+    0xDFCD74640E7946FB: r"SB_AWD\60_89\ITALIAN\XBX_0082.awd",
+    0xDFD3F9B94C8DEFC8: r"SB_AWD\240_269\SPANISH\XBX_0263.awd",
+    0xDFD85F556EDA12B9: r"SB_AWD\90_119\SPANISH\NGC_0117.awd",
+    0xDFEA11D01E1F2C7A: r"SB_AGD\210_239\FRENCH\NGC_0216.agd",
+    0xDFF1B197374DA3AD: r"SB_AWD\120_149\FRENCH\NGC_0149.awd",
+    0xDFF341E857770950: r"SB_AWD\30_59\FRENCH\XBX_0043.awd",
+    0xDFF6C60A4711C231: r"LEVELS\L_1_2\SECTIONS\s_7.rws",
+    0xDFF9A89DA11D3FA5: r"ANIMGRPS\Lvl_32\Lvl_32D.ads",
+    0xDFFB56DF4CEE5B1C: r"SB_AWD\60_89\ENGLISH\XBX_0063.awd",
+    0xDFFD95172DC96C85: r"SB_AGD\60_89\ITALIAN\PS2_0083.agd",
+    0xDFFDB894E804C305: r"SB_AGD\150_179\SPANISH\NGC_0152.agd",
+    0xE0023DF1EC9C23DC: r"SB_AGD\180_209\FRENCH\PS2_0180.agd",
+    0xE00F889915DEC002: r"SB_AGD\180_209\GERMAN\XBX_0208.agd",
+    0xE00FFF4C25E734A3: r"LEVELS\L_1_3_B\SECTIONS\s_7.rws",
+    0xE010C606B848175F: r"AUDIO\FRENCH\NGC_2s1.rws",
+    0xE01DF6FB82767607: r"SB_AWD\180_209\GERMAN\NGC_0184.awd",
+    0xE0208837632E345E: r"SB_AWD\60_89\SPANISH\XBX_0065.awd",
+    0xE03C5BE8FFA88D49: r"ANIMGRPS\Lvl_15\Lvl_15N.ads",
+    0xE03D6608764F4E89: r"SB_AWD\210_239\SPANISH\XBX_0239.awd",
+    0xE04849865D26F89F: r"SB_AGD\60_89\ITALIAN\PS2_0070.agd",
+    0xE04EE8183DC176B5: r"ANIMGRPS\Lvl_32\Lvl_32T.ads",
+    0xE053A5236FAEC933: r"SB_AGD\120_149\ENGLISH\XBX_0138.agd",
+    0xE0597EB8A9077BE4: r"SB_AGD\60_89\ITALIAN\XBX_0063.agd",
+    0xE069E192B91365F1: r"SB_AGD\0_29\ENGLISH\NGC_0024.agd",
+    0xE07073CB452D9AB2: r"SB_AGD\0_29\ITALIAN\NGC_0005.agd",
+    0xE071CB61B92CC406: r"SB_AWD\180_209\ITALIAN\PS2_0188.awd",
+    0xE0758F29384F10AC: r"ANIMGRPS\Lvl_22\Lvl_22G.ads",
+    0xE0768084CE1D73F8: r"SB_AWD\240_269\ENGLISH\NGC_0265.awd",
+    0xE081653406BAF967: r"SB_AWD\150_179\FRENCH\PS2_0164.awd",
+    0xE088EA781A492223: r"SHELL\LOAD\MP_1_SD.txd",
+    0xE0896623016BE973: r"AUDIO\ENGLISH\XBX_4m3.rws",
+    0xE08D6E2F196AF2A1: r"SB_AGD\120_149\FRENCH\PS2_0131.agd",
+    0xE08D959202991BB3: r"SB_AGD\90_119\GERMAN\PS2_0114.agd",
+    0xE09773553F85779E: r"gui_map5_destroy.index",
+    0xE09788F2D40DDE61: r"SB_AGD\120_149\ITALIAN\PS2_0131.agd",
+    0xE097947203F12C83: r"ANIMGRPS\Lvl_16\Lvl_16N.ads",
+    0xE09CBDE73F4F3205: r"SB_AWD\90_119\ENGLISH\NGC_0100.awd",
+    0xE0A130B136D06975: r"SB_AWD\180_209\ENGLISH\PS2_0183.awd",
+    0xE0A1D2FF42BB78AD: r"LEVELS\L_1_5\level.rws",
+    0xE0C1A1F79E98777D: r"SB_AGD\210_239\SPANISH\PS2_0218.agd",
+    0xE0C3E3FF42D87C01: r"LEVELS\L_1_5\level.dff",
+    0xE0CAB6D7824ED111: r"SB_AWD\30_59\GERMAN\NGC_0033.awd",
+    0xE0CABF0BBC387586: r"SB_AGD\180_209\ITALIAN\XBX_0204.agd",
+    0xE0CE17764E502AA8: r"SB_AGD\210_239\ENGLISH\PS2_0219.agd",
+    0xE0E3772C3F43F339: r"SB_AWD\0_29\GERMAN\NGC_0008.awd",
+    0xE0EB357B8741E5A3: r"SB_AGD\210_239\ENGLISH\PS2_0230.agd",
+    0xE0EDA2B17E452DAD: r"w_maps.index",
+    0xE0F1B31D2371F17F: r"SB_AGD\240_269\GERMAN\PS2_0258.agd",
+    0xE0FBC5A7615A9834: r"SB_AGD\30_59\SPANISH\NGC_0052.agd",
+    0xE0FC103183F0EBF8: r"AUDIO\FRENCH\XBX_1m1.rws",
+    0xE0FFA561311E0C19: r"SB_AGD\90_119\SPANISH\PS2_0093.agd",
+    0xE10246AF1F294E1F: r"SB_AGD\120_149\ENGLISH\NGC_0125.agd",
+    0xE10B89C5823647C9: r"SB_AWD\30_59\FRENCH\PS2_0034.awd",
+    0xE1161DECFEB7719C: r"SB_AWD\180_209\ENGLISH\NGC_0187.awd",
+    0xE11F95BAC369D8BC: r"SB_AGD\150_179\ENGLISH\XBX_0160.agd",
+    0xE124A5D4F3056100: r"SB_AGD\60_89\ENGLISH\PS2_0060.agd",
+    0xE126BC3CC1C281B1: r"SB_AWD\90_119\SPANISH\XBX_0119.awd",
+    0xE130FE7DE6B90C64: r"SB_AGD\180_209\ITALIAN\NGC_0198.agd",
+    0xE1324F9F3B6D28C6: r"LEVELS\L_2_1\GodData.dff",
+    0xE135105B44BB9C6F: r"AUDIO\GERMAN\XBX_2s1.rws",
+    0xE13640A37DCAA40D: r"SB_AWD\120_149\ENGLISH\NGC_0123.awd",
+    0xE13AC91768F7D452: r"SB_AGD\0_29\FRENCH\NGC_0027.agd",
+    0xE13FDA282C6D8C17: r"SB_AGD\60_89\SPANISH\PS2_0078.agd",
+    0xE1466883AE09F2FD: r"ANIMGRPS\Lvl_16\Lvl_16H.ads",
+    0xE14BFBE2153BB95F: r"SB_AGD\240_269\ENGLISH\PS2_0245.agd",
+    0xE14C6DF8E9696DB7: r"SB_AWD\90_119\ENGLISH\NGC_0106.awd",
+    0xE14EA8525825709B: r"SB_AWD\30_59\ITALIAN\PS2_0032.awd",
+    0xE15E025A619E3BA6: r"SB_AWD\180_209\ITALIAN\XBX_0194.awd",
+    0xE160A048A3BE0175: r"SB_AWD\90_119\GERMAN\NGC_0117.awd",
+    0xE16702FAC963BF11: r"SB_AWD\240_269\GERMAN\PS2_0245.awd",
+    0xE16F6EFD64F5694C: r"SB_AGD\150_179\GERMAN\NGC_0177.agd",
+    0xE17F2E254B25E48D: r"SB_AWD\60_89\GERMAN\PS2_0078.awd",
+    0xE1826A12F9C490D1: r"SB_AWD\90_119\FRENCH\XBX_0092.awd",
+    0xE1892BA3A670DB1A: r"SB_AWD\240_269\ITALIAN\NGC_0263.awd",
+    0xE1892E0993F942AD: r"SB_AGD\90_119\FRENCH\XBX_0108.agd",
+    0xE189C24B611630A0: r"SB_AGD\180_209\GERMAN\NGC_0183.agd",
+    0xE18E78085FBDC903: r"SB_AGD\240_269\ITALIAN\XBX_0251.agd",
+    0xE196F5DC80C37F57: r"SB_AWD\210_239\ENGLISH\PS2_0216.awd",
+    0xE19C27FE4AAF034D: r"ANIMGRPS\Lvl_16\Lvl_16X.ads",
+    0xE1A29209B9C693E0: r"SB_AGD\60_89\SPANISH\NGC_0076.agd",
+    0xE1BCE8181E446B68: r"SB_AWD\60_89\FRENCH\PS2_0082.awd",
+    0xE1BD26B7CEADC82B: r"SB_AWD\180_209\ITALIAN\NGC_0188.awd",
+    0xE1C51DFEA8D0823E: r"SB_AWD\180_209\ENGLISH\NGC_0189.awd",
+    0xE1D8577E96DF5F56: r"SB_AGD\120_149\ITALIAN\NGC_0133.agd",
+    0xE1E56B59C0F7297C: r"LEVELS\MP_10\SECTIONS\s_4.rws",
+    0xE1F506FA99A72338: r"SB_AWD\0_29\SPANISH\NGC_0021.awd",
+    0xE1FDC0D95242A1FE: r"SB_AWD\60_89\SPANISH\NGC_0081.awd",
+    0xE20784C210D1153A: r"SB_AWD\0_29\SPANISH\XBX_0014.awd",
+    0xE2081ED2BB95C201: r"SB_AGD\150_179\FRENCH\PS2_0179.agd",
+    0xE20943CF9DF3DDD6: r"SB_AWD\210_239\ENGLISH\PS2_0226.awd",
+    0xE217D5D4737839A3: r"SB_AGD\120_149\GERMAN\NGC_0127.agd",
+    0xE21E4F0F0F0E430E: r"SB_AGD\150_179\GERMAN\NGC_0179.agd",
+    0xE21F01ADC078A801: r"SB_AGD\0_29\ENGLISH\NGC_0011.agd",
+    0xE220ACB2D7E20A23: r"SB_AGD\0_29\GERMAN\PS2_0025.agd",
+    0xE2216D50FF6D6565: r"SB_AWD\90_119\ITALIAN\XBX_0102.awd",
+    0xE2263E6BFA0A9085: r"SB_AWD\30_59\ENGLISH\XBX_0055.awd",
+    0xE22A9219373D9DEE: r"SB_AGD\150_179\GERMAN\PS2_0156.agd",
+    0xE2375CA7280CE57A: r"SB_AGD\150_179\SPANISH\XBX_0157.agd",
+    0xE23E4D390895B466: r"ANIMGRPS\Lvl_21\Lvl_21C.ads",
+    0xE23F565B5A0E1611: r"SB_AWD\150_179\SPANISH\PS2_0179.awd",
+    0xE23F90A9269D6F8E: r"SB_AWD\60_89\GERMAN\NGC_0069.awd",
+    0xE2415CE59279081C: r"SB_AGD\30_59\ENGLISH\XBX_0050.agd",
+    0xE24948D7CD44846E: r"SB_AWD\120_149\SPANISH\PS2_0129.awd",
+    0xE252751AE7C009EC: r"SB_AWD\30_59\GERMAN\NGC_0058.awd",
+    0xE25571FA0301FF82: r"SB_AWD\30_59\FRENCH\XBX_0045.awd",
+    0xE2635EE20F07DBBC: r"SHELL\MOVIES\SPANISH\EndGame.bik",
+    0xE265D69E9DBA7326: r"SB_AWD\90_119\ENGLISH\PS2_0106.awd",
+    0xE266E6DD063718E1: r"SB_AWD\120_149\SPANISH\PS2_0140.awd",
+    0xE26A3979D107D645: r"SB_AGD\120_149\ITALIAN\NGC_0123.agd",
+    0xE27A9AEE23E2D8E3: r"SB_AWD\60_89\ITALIAN\PS2_0063.awd",
+    0xE27CF96C9BB1316E: r"LEVELS\L_3_1\CLUMPS\cbank_00.bin",
+    0xE27E0494BF03C403: r"SB_AGD\90_119\SPANISH\XBX_0108.agd",
+    0xE2899FFF7A6E2907: r"AUDIO\FRENCH\PS2_1m3.rws",
+    0xE28B7109A6230A4E: r"SB_AWD\150_179\ITALIAN\PS2_0161.awd",
+    0xE29980916A595405: r"SB_AWD\0_29\FRENCH\XBX_0000.awd",
+    0xE29C208C14414145: r"SB_AGD\240_269\ENGLISH\XBX_0248.agd",
+    0xE29CB4D445760D7A: r"SB_AGD\210_239\FRENCH\PS2_0222.agd",
+    0xE29F769547437650: r"SB_AWD\150_179\ENGLISH\NGC_0162.awd",
+    0xE2A486A2EA05F59A: r"SB_AWD\60_89\ITALIAN\XBX_0076.awd",
+    0xE2AB299808B31AD9: r"SB_AGD\60_89\ITALIAN\PS2_0072.agd",
+    0xE2B7515968C68B38: r"SB_AGD\210_239\GERMAN\PS2_0217.agd",
+    0xE2C2C09631CB40A9: r"SB_AWD\90_119\ENGLISH\XBX_0106.awd",
+    0xE2C2C3E439B22554: r"LEVELS\L_2_2\SECTIONS\s_7.rws",
+    0xE2CB0267B287590B: r"SHELL\MOVIES\SPANISH\1_1_Mon.bik",
+    0xE2D5EE7DA424CC37: r"SB_AWD\30_59\ENGLISH\XBX_0053.awd",
+    0xE2D9D48C474F96FC: r"ANIMGRPS\Lvl_12\Lvl_12U.ads",
+    0xE2DA622AE1580FF8: r"SB_AGD\150_179\GERMAN\PS2_0154.agd",
+    0xE2DB0010803AAEF1: r"SB_AGD\60_89\FRENCH\PS2_0065.agd",
+    0xE2E0E89ABFBB4E69: r"SB_AGD\90_119\SPANISH\NGC_0104.agd",
+    0xE2E170571A6DED79: r"SB_AWD\180_209\FRENCH\XBX_0199.awd",
+    0xE2E392D7E5364740: r"SB_AWD\30_59\SPANISH\XBX_0043.awd",
+    0xE2FD207E594E8028: r"AUDIO\ITALIAN\PS2_4s3.rws",
+    0xE302352C91DA60CE: r"SB_AWD\30_59\GERMAN\NGC_0056.awd",
+    0xE3076755CD672759: r"SB_AWD\120_149\FRENCH\XBX_0143.awd",
+    0xE30817410276A5EE: r"SB_AGD\150_179\FRENCH\NGC_0160.agd",
+    0xE30F4491F6F1F4F9: r"LEVELS\L_1_3_B\SECTIONS\s_23.rws",
+    0xE318B3C5A1E738D6: r"SB_AWD\0_29\ITALIAN\PS2_0008.awd",
+    0xE319098B7B209557: r"SB_AGD\120_149\ITALIAN\NGC_0125.agd",
+    0xE31966AB4B1E99AF: r"SB_AWD\0_29\GERMAN\PS2_0018.awd",
+    0xE329F04C0E5C80DE: r"SB_AGD\60_89\ENGLISH\XBX_0083.agd",
+    0xE32B32740B9C355F: r"SB_AGD\30_59\ENGLISH\PS2_0058.agd",
+    0xE32D8F1D67C47C10: r"SB_AGD\180_209\ITALIAN\XBX_0206.agd",
+    0xE3338FC012D289B9: r"SB_AWD\30_59\GERMAN\XBX_0035.awd",
+    0xE34102E8E8E4216C: r"SB_AWD\30_59\SPANISH\NGC_0049.awd",
+    0xE345C3591BE43BA8: r"SB_AGD\150_179\ITALIAN\XBX_0173.agd",
+    0xE34930A314738FB7: r"SB_AWD\0_29\FRENCH\XBX_0006.awd",
+    0xE34A2AC4CA54FDA9: r"ANIMGRPS\Lvl_36\Lvl_36P.ads",
+    0xE364C759FB4E9CA3: r"SB_AGD\180_209\SPANISH\NGC_0203.agd",
+    0xE36526C0CAB57059: r"SB_AGD\120_149\ENGLISH\NGC_0127.agd",
+    0xE369274087EC5987: r"SB_AWD\180_209\ENGLISH\XBX_0209.awd",
+    0xE36DE54B973B87CE: r"SB_AGD\90_119\GERMAN\NGC_0091.agd",
+    0xE379A230F7688AE4: r"SB_AGD\90_119\ITALIAN\PS2_0100.agd",
+    0xE37FFC75FE850A97: r"SB_AGD\90_119\FRENCH\XBX_0090.agd",
+    0xE390D2488F1C17A1: r"SB_AGD\30_59\ITALIAN\PS2_0045.agd",
+    0xE39282E98F4F3C32: r"SB_AWD\30_59\SPANISH\XBX_0045.awd",
+    0xE3960C995448EEA7: r"w_map05.index",
+    0xE39E814FD8EF4ECE: r"SB_AWD\240_269\GERMAN\PS2_0264.awd",
+    0xE3A52AC171366CA1: r"SB_AGD\210_239\GERMAN\XBX_0224.agd",
+    0xE3A91D077DC2DD22: r"SB_AGD\90_119\FRENCH\NGC_0101.agd",
+    0xE3AA20E69447D6E1: r"SB_AWD\60_89\ITALIAN\NGC_0060.awd",
+    0xE3ABE1F1031E0C69: r"SB_AGD\30_59\SPANISH\PS2_0052.agd",
+    0xE3ADDBF3C0C62799: r"SB_AGD\240_269\ENGLISH\PS2_0247.agd",
+    0xE3B1551E1D83927A: r"LEVELS\L_3_1_C\SECTIONS\s_5.rws",
+    0xE3B1786403B17735: r"SB_AWD\30_59\ITALIAN\PS2_0030.awd",
+    0xE3B199D2C0F0ABBF: r"SB_AWD\150_179\FRENCH\PS2_0155.awd",
+    0xE3B317651D8B95E1: r"SB_AGD\120_149\GERMAN\XBX_0141.agd",
+    0xE3B7E752AC9117F8: r"SB_AGD\150_179\FRENCH\NGC_0162.agd",
+    0xE3BD2EF3538EA8EE: r"SB_AGD\150_179\FRENCH\XBX_0153.agd",
+    0xE3C0E874500A8342: r"SB_AGD\150_179\ITALIAN\PS2_0172.agd",
+    0xE3CF4FE07DF60D5E: r"SB_AWD\240_269\ITALIAN\XBX_0250.awd",
+    0xE3D00B370A72EFEA: r"SB_AWD\180_209\FRENCH\PS2_0195.awd",
+    0xE3D8C05DB8753FE8: r"SB_AGD\60_89\ENGLISH\XBX_0081.agd",
+    0xE3EC125D0CA15DB2: r"SB_AGD\180_209\GERMAN\NGC_0185.agd",
+    0xE3EC7D981385FCED: r"SB_AWD\150_179\ENGLISH\XBX_0172.awd",
+    0xE3F0C2FA92FE784E: r"SB_AWD\30_59\SPANISH\NGC_0047.awd",
+    0xE3FF61E1CB1BED94: r"SB_AGD\210_239\FRENCH\NGC_0214.agd",
+    0xE404E21B6551C0F2: r"SB_AGD\60_89\SPANISH\NGC_0070.agd",
+    0xE40CA0FEF10CB5F8: r"LEVELS\L_3_1_B\level.rws",
+    0xE40FCB565AF674E3: r"SB_AGD\180_209\SPANISH\PS2_0202.agd",
+    0xE4136528DAC70797: r"SB_AGD\60_89\ITALIAN\PS2_0085.agd",
+    0xE41388A695025E17: r"SB_AGD\150_179\SPANISH\NGC_0154.agd",
+    0xE4225625CD8D6F5C: r"ANIMGRPS\Lvl_13\Lvl_13G.ads",
+    0xE42F8C7329249AD1: r"SB_AGD\150_179\FRENCH\XBX_0176.agd",
+    0xE43538491029E588: r"SB_AWD\60_89\SPANISH\XBX_0067.awd",
+    0xE43F3845A5054DB6: r"SB_AWD\30_59\ENGLISH\XBX_0049.awd",
+    0xE4468CB3A6AB7FF6: r"ANIMGRPS\Lvl_21\Lvl_21S.ads",
+    0xE449A622F3923FAF: r"SHELL\MOVIES\SPANISH\Act_3.bik",
+    0xE44A5FFEF141A810: r"LEVELS\L_3_1_B\level.dff",
+    0xE450100F736C848C: r"SB_AWD\210_239\SPANISH\PS2_0220.awd",
+    0xE450EF734699D347: r"AUDIO\ITALIAN\PS2_1s1.rws",
+    0xE4567B0EC9AF1FAB: r"LEVELS\L_3_5_B\global.dff",
+    0xE45C521EDC2092FB: r"SB_AWD\240_269\SPANISH\PS2_0267.awd",
+    0xE460D9E46B0A2919: r"SB_AWD\150_179\FRENCH\PS2_0157.awd",
+    0xE4634CB7D2BF6428: r"ANIMGRPS\Lvl_24\Lvl_24W.ads",
+    0xE4634D1C3486910B: r"SB_AWD\90_119\FRENCH\PS2_0105.awd",
+    0xE46C13E1497FE460: r"SB_AWD\210_239\ENGLISH\PS2_0224.awd",
+    0xE46C2081BB1C8581: r"SB_AWD\120_149\ENGLISH\XBX_0129.awd",
+    0xE46CFF04FDA91AF8: r"SB_AGD\150_179\FRENCH\XBX_0151.agd",
+    0xE47556E6AE8694C0: r"SB_AWD\150_179\FRENCH\NGC_0153.awd",
+    0xE47F3B48B48C51A4: r"SB_AWD\180_209\FRENCH\PS2_0197.awd",
+    0xE481136513DE75BE: r"w_dnas.index",
+    0xE48A368C9A771C71: r"SHELL\MOVIES\SPANISH\3_1_Mon.bik",
+    0xE48AE33AE54BD90E: r"ANIMGRPS\Lvl_22\Lvl_22E.ads",
+    0xE490202B879FF101: r"SB_AGD\60_89\FRENCH\PS2_0072.agd",
+    0xE4B06B44238269B9: r"SB_AWD\150_179\GERMAN\PS2_0151.awd",
+    0xE4C2787ABA531AA2: r"SB_AGD\210_239\SPANISH\NGC_0216.agd",
+    0xE4CFEECCC75BBE87: r"SB_AGD\180_209\SPANISH\XBX_0182.agd",
+    0xE4D5D88508C7A317: r"SB_AGD\240_269\SPANISH\NGC_0248.agd",
+    0xE4DC542914746DD3: r"SB_AGD\0_29\ITALIAN\PS2_0001.agd",
+    0xE4DEDC84D33E3363: r"SB_AGD\150_179\FRENCH\XBX_0178.agd",
+    0xE4DEE69637D8276E: r"AUDIO\ENGLISH\XBX_2s2.rws",
+    0xE4ED891EF727AD6E: r"SB_AWD\0_29\ITALIAN\XBX_0010.awd",
+    0xE4EEE8B8C520586B: r"SB_AGD\0_29\FRENCH\XBX_0028.agd",
+    0xE501A6A6F2CE6C82: r"SB_AWD\150_179\ENGLISH\NGC_0164.awd",
+    0xE507C5A77C13E009: r"SB_AWD\240_269\FRENCH\PS2_0269.awd",
+    0xE5121D2DDE9F5025: r"SB_AWD\90_119\FRENCH\PS2_0107.awd",
+    0xE51C1507011332ED: r"SB_AWD\120_149\GERMAN\XBX_0127.awd",
+    0xE52446F8589F89B2: r"SB_AWD\150_179\FRENCH\NGC_0155.awd",
+    0xE527D202A2CFA6A8: r"SB_AWD\120_149\SPANISH\NGC_0131.awd",
+    0xE5384595BD3D1DA0: r"LEVELS\L_3_5\SECTIONS\s_10.rws",
+    0xE5391AA3EEF0B55B: r"SB_AGD\0_29\GERMAN\NGC_0006.agd",
+    0xE53C8C4E6EC01D43: r"SB_AWD\90_119\SPANISH\XBX_0117.awd",
+    0xE541843660C7A1F4: r"SB_AGD\30_59\FRENCH\PS2_0035.agd",
+    0xE548830496B5FBE2: r"SB_AWD\30_59\SPANISH\XBX_0030.awd",
+    0xE54B90B52AC7659F: r"SB_AWD\120_149\ENGLISH\NGC_0125.awd",
+    0xE54BF748B3288B03: r"SB_AWD\90_119\GERMAN\XBX_0104.awd",
+    0xE5683AD2AD115ADD: r"SB_AGD\180_209\GERMAN\XBX_0207.agd",
+    0xE56C8982A117CBF6: r"SB_AGD\90_119\SPANISH\XBX_0093.agd",
+    0xE571466F39C7768D: r"SB_AGD\0_29\ITALIAN\NGC_0015.agd",
+    0xE573526C0E9AFD30: r"SB_AWD\180_209\ITALIAN\XBX_0196.awd",
+    0xE57DC3F2536723D0: r"SB_AWD\0_29\ITALIAN\PS2_0019.awd",
+    0xE5988F69ED4AA40F: r"SB_AGD\120_149\FRENCH\XBX_0134.agd",
+    0xE5A448AA0AF45CE1: r"SB_AWD\0_29\FRENCH\NGC_0024.awd",
+    0xE5B539B14AB5201B: r"SB_AWD\60_89\FRENCH\PS2_0074.awd",
+    0xE5B5FE5BE3295DDA: r"SB_AWD\180_209\FRENCH\XBX_0185.awd",
+    0xE5B86C7A185F1551: r"SB_AGD\150_179\ITALIAN\NGC_0174.agd",
+    0xE5BB428024A3A9BA: r"ActivisionSplash.index",
+    0xE5CA5850C2B3F3AA: r"SB_AWD\60_89\FRENCH\XBX_0087.awd",
+    0xE5D0A8B432F7C5F5: r"ANIMGRPS\Lvl_12\Lvl_12P.ads",
+    0xE5D2A5C7DD091B69: r"SB_AWD\210_239\GERMAN\NGC_0226.awd",
+    0xE5D5644205CF441C: r"SB_AGD\30_59\ENGLISH\PS2_0035.agd",
+    0xE5D86908875D075D: r"SB_AGD\150_179\SPANISH\NGC_0163.agd",
+    0xE5DE323A5D0B849C: r"AUDIO\GERMAN\ASLocate.agd",
+    0xE5DFE4ED898D25F3: r"SB_AGD\150_179\FRENCH\NGC_0158.agd",
+    0xE5E1DC3593D410AC: r"SB_AGD\150_179\ENGLISH\PS2_0156.agd",
+    0xE5E7EAB599097475: r"SB_AGD\0_29\GERMAN\NGC_0004.agd",
+    0xE5EA6128585837C4: r"SB_AWD\240_269\ENGLISH\XBX_0256.awd",
+    0xE5FD84AE102C1D0C: r"SB_AWD\150_179\ENGLISH\PS2_0156.awd",
+    0xE611AB9671DB2DFE: r"WPNBANK\26_50\wbank_33.bin",
+    0xE61540561A1B37BE: r"SB_AWD\60_89\SPANISH\PS2_0075.awd",
+    0xE61D74D3BDCEE6B4: r"SB_AWD\0_29\SPANISH\XBX_0016.awd",
+    0xE61DEEE468935D13: r"SB_AGD\150_179\FRENCH\PS2_0177.agd",
+    0xE62043DEB179CA93: r"SB_AGD\120_149\SPANISH\NGC_0121.agd",
+    0xE638FD29BEE5FC8A: r"AUDIO\FRENCH\ASLocate.agd",
+    0xE63A433773D88903: r"SHELL\FONTS\fblds22.met",
+    0xE642370A023E7328: r"gui_map3_destroy.index",
+    0xE647EF7B97645849: r"SB_AGD\120_149\FRENCH\XBX_0136.agd",
+    0xE64841187D0EC97E: r"SB_AGD\90_119\ENGLISH\XBX_0093.agd",
+    0xE64CACB8D509A694: r"SB_AGD\150_179\SPANISH\XBX_0155.agd",
+    0xE64F61F86447A6B9: r"SB_AWD\210_239\SPANISH\XBX_0226.awd",
+    0xE6544B64AB8591FD: r"SB_AWD\0_29\SPANISH\PS2_0003.awd",
+    0xE65AF7E3ABDD4029: r"SB_AGD\240_269\ENGLISH\PS2_0254.agd",
+    0xE65D6C875B2DD0EB: r"SB_AGD\240_269\SPANISH\PS2_0252.agd",
+    0xE667BA861CB98A26: r"SB_AWD\0_29\FRENCH\XBX_0029.awd",
+    0xE67739AB1B162069: r"SB_AWD\30_59\ITALIAN\XBX_0046.awd",
+    0xE6779DF806453A85: r"SB_AGD\30_59\ENGLISH\NGC_0057.agd",
+    0xE67B26B04AB734B0: r"SB_AWD\90_119\ENGLISH\PS2_0104.awd",
+    0xE67E1571EE6B9151: r"SB_AGD\180_209\ENGLISH\NGC_0186.agd",
+    0xE6829C8038FAFC7C: r"SB_AWD\180_209\ITALIAN\XBX_0202.awd",
+    0xE684D1CF6E48DC4F: r"AUDIO\SPANISH\NGC_2m3.rws",
+    0xE6852A3779197C3E: r"ANIMGRPS\Lvl_13\Lvl_13E.ads",
+    0xE689A1EAFF7AD11B: r"SB_AWD\30_59\FRENCH\NGC_0037.awd",
+    0xE68F72FEA764BD9B: r"SB_AWD\60_89\ENGLISH\PS2_0063.awd",
+    0xE697938803A7EB5A: r"LEVELS\L_3_5_C\SECTIONS\s_21.rws",
+    0xE69AE29AFD8A3253: r"SB_AGD\60_89\ENGLISH\NGC_0075.agd",
+    0xE69DECE466ED02A6: r"SB_AGD\240_269\GERMAN\XBX_0263.agd",
+    0xE6B204E5F272CE94: r"SB_AGD\210_239\FRENCH\PS2_0220.agd",
+    0xE6C20455655073CB: r"WPNBANK\0_25\wbank_12.bin",
+    0xE6C2C08DB1988483: r"SB_AGD\150_179\SPANISH\PS2_0168.agd",
+    0xE6C6A3B670363056: r"SB_AGD\0_29\FRENCH\PS2_0000.agd",
+    0xE6C79D48E6053655: r"SB_AWD\90_119\FRENCH\PS2_0114.awd",
+    0xE6E08572827EA1AA: r"SB_AGD\30_59\GERMAN\PS2_0031.agd",
+    0xE6F015B500EACFFC: r"ANIMGRPS\Lvl_31\Lvl_31C.ads",
+    0xE6F1838D1F3FC607: r"SB_AGD\210_239\ENGLISH\NGC_0239.agd",
+    0xE6FC43AF17772250: r"LEVELS\L_1_3_A\SECTIONS\s_18.rws",
+    0xE6FFF0729D431D96: r"OnlineSettings.layout",
+    0xE7031B76559E508F: r"SB_AWD\0_29\SPANISH\PS2_0005.awd",
+    0xE70447491E086829: r"SHELL\FONTS\fblds24.met",
+    0xE7084044A3D4A657: r"LEVELS\L_1_1\SECTIONS\s_8.rws",
+    0xE712F08976B4EFFB: r"font_stringfutbo20.tga",
+    0xE720B7380E8BE09C: r"SB_AGD\30_59\GERMAN\NGC_0032.agd",
+    0xE7297899792EE7FD: r"SHELL\MOVIES\SPANISH\1_3_Mon.bik",
+    0xE72D6583988529E3: r"SB_AGD\180_209\ENGLISH\NGC_0188.agd",
+    0xE73D716D41623D58: r"ANIMGRPS\Lvl_26\Lvl_26C.ads",
+    0xE74A025DC6027890: r"SB_AWD\0_29\ITALIAN\NGC_0029.awd",
+    0xE74A029647562F6E: r"SB_AGD\60_89\FRENCH\NGC_0089.agd",
+    0xE74C2F260D8F5BED: r"SB_AGD\90_119\FRENCH\NGC_0119.agd",
+    0xE754F2F7594E0E0B: r"SHELL\LOAD\MP_5_CTF.txd",
+    0xE755D7B13F79D71B: r"SB_AWD\120_149\ENGLISH\PS2_0146.awd",
+    0xE756449DF79BDBDD: r"SB_AWD\30_59\FRENCH\XBX_0055.awd",
+    0xE759A8423897175C: r"SB_AWD\60_89\GERMAN\XBX_0072.awd",
+    0xE783657F1698251E: r"SB_AWD\180_209\ITALIAN\PS2_0203.awd",
+    0xE78A001D445CF8BF: r"SHELL\MOVIES\Credits.bik",
+    0xE78F55842C976144: r"SB_AGD\30_59\GERMAN\PS2_0033.agd",
+    0xE791E6AAE8CE6CDB: r"SB_AGD\30_59\FRENCH\NGC_0037.agd",
+    0xE7959146FB3486CE: r"ANIMGRPS\Lvl_35\Lvl_35Y.ads",
+    0xE7966C8B954E191B: r"SB_AGD\60_89\GERMAN\NGC_0060.agd",
+    0xE798D649AE50E946: r"SB_AGD\210_239\GERMAN\NGC_0229.agd",
+    0xE79989B02ADB578B: r"SB_AWD\150_179\ITALIAN\XBX_0152.awd",
+    0xE79DC31EE4212679: r"SB_AWD\0_29\ENGLISH\XBX_0026.awd",
+    0xE7A5825A7EB9D60B: r"SB_AWD\180_209\FRENCH\NGC_0191.awd",
+    0xE7AEBD1C59CC618C: r"SB_AGD\180_209\ENGLISH\PS2_0186.agd",
+    0xE7B1A93348B2BFB3: r"SB_AGD\30_59\GERMAN\NGC_0048.agd",
+    0xE7BBBFDD9B975A9B: r"SB_AWD\0_29\ITALIAN\NGC_0000.awd",
+    0xE7C0A399AE287344: r"LEVELS\L_3_5_C\SECTIONS\s_23.rws",
+    0xE7CB1798AF310EB0: r"LEVELS\L_1_1\global.dff",
+    0xE7DA188D235EA0D3: r"SB_AWD\30_59\SPANISH\PS2_0043.awd",
+    0xE7E3FFF22AF1BE88: r"SB_AWD\240_269\ITALIAN\XBX_0252.awd",
+    0xE7F325F4D87083D1: r"SB_AGD\240_269\ITALIAN\NGC_0255.agd",
+    0xE801CCD3DC6EE924: r"SB_AGD\150_179\SPANISH\XBX_0160.agd",
+    0xE8095D6D768D32A7: r"SHELL\FEND\INSTANCE\SKY\MC.CSV",
+    0xE80CE1E187AC1456: r"SB_AGD\150_179\GERMAN\XBX_0164.agd",
+    0xE817034299181188: r"SB_AGD\150_179\FRENCH\NGC_0171.agd",
+    0xE81809C2F64126B5: r"SB_AWD\60_89\FRENCH\PS2_0076.awd",
+    0xE819B63E6EB1FF6A: r"ANIMGRPS\Lvl_14\Lvl_14G.ads",
+    0xE819E467D836E63B: r"SB_AGD\210_239\ITALIAN\NGC_0226.agd",
+    0xE8331590C0B26148: r"SB_AWD\180_209\ITALIAN\PS2_0201.awd",
+    0xE83E3DFF9ED66A71: r"SB_AWD\180_209\GERMAN\XBX_0188.awd",
+    0xE840B6BC92E72BF5: r"SB_AGD\30_59\FRENCH\NGC_0035.agd",
+    0xE84859C1D4F416A5: r"SB_AWD\150_179\ITALIAN\XBX_0150.awd",
+    0xE8538AAF0842E94C: r"SB_AWD\0_29\GERMAN\XBX_0007.awd",
+    0xE853A889BB35BB52: r"SB_AGD\180_209\ENGLISH\NGC_0206.agd",
+    0xE8540CFF6E53F836: r"SB_AGD\240_269\GERMAN\XBX_0256.agd",
+    0xE854526C28D29525: r"SB_AWD\180_209\FRENCH\NGC_0193.awd",
+    0xE8557B9712D6EF8A: r"SB_AWD\150_179\FRENCH\NGC_0164.awd",
+    0xE86092180468D70D: r"SB_AGD\30_59\FRENCH\PS2_0056.agd",
+    0xE86A9A9ACE6530F5: r"AUDIO\SPANISH\PS2_4s2.rws",
+    0xE87920C97FBD060A: r"ANIMGRPS\Lvl_24\Lvl_24U.ads",
+    0xE87D56E4DD9B1022: r"SB_AGD\60_89\FRENCH\NGC_0078.agd",
+    0xE885023E52144CF8: r"LEVELS\L_3_5_B\SECTIONS\s_4.rws",
+    0xE88F9D2FA5C63413: r"SB_AWD\0_29\GERMAN\XBX_0017.awd",
+    0xE8A4861A18613526: r"SB_AWD\210_239\FRENCH\PS2_0231.awd",
+    0xE8B95B915D057CFF: r"SB_AWD\0_29\SPANISH\PS2_0016.awd",
+    0xE8CC1AF4EA301488: r"SB_AGD\150_179\FRENCH\XBX_0164.agd",
+    0xE8E0F95733A6B095: r"SB_AGD\210_239\ENGLISH\PS2_0225.agd",
+    0xE8E1F903C8F11611: r"SHELL\FEND\INSTANCE\XBOX\LDBANNER.TXD.BAK",
+    0xE8E946B6A50DA379: r"SB_AGD\30_59\GERMAN\XBX_0035.agd",
+    0xE8EC71FCAB06D7B5: r"SB_AWD\30_59\FRENCH\NGC_0035.awd",
+    0xE8ECE501013B398D: r"SB_AGD\180_209\GERMAN\NGC_0195.agd",
+    0xE8ED0E1148EF2903: r"SB_AWD\180_209\GERMAN\XBX_0186.awd",
+    0xE8F2431052F0C435: r"SB_AWD\60_89\ENGLISH\PS2_0061.awd",
+    0xE8FEDAF0CF332830: r"SB_AGD\240_269\ENGLISH\NGC_0247.agd",
+    0xE9035D11186D9140: r"SB_AGD\240_269\GERMAN\XBX_0254.agd",
+    0xE9037930A4257ED8: r"SB_AWD\0_29\ITALIAN\XBX_0012.awd",
+    0xE90C1A6DB1F07DEB: r"SB_AGD\240_269\FRENCH\PS2_0267.agd",
+    0xE91F488C64B39167: r"SB_AGD\180_209\GERMAN\XBX_0199.agd",
+    0xE920239BCF405C5B: r"SB_AWD\120_149\SPANISH\NGC_0129.awd",
+    0xE929E72EE9A83C3B: r"LEVELS\L_3_5\SECTIONS\s_26.rws",
+    0xE92E405584D3F17E: r"LEVELS\L_1_3_A\SECTIONS\s_7.rws",
+    0xE92F85E87498B08A: r"SB_AGD\240_269\ENGLISH\PS2_0262.agd",
+    0xE94BC7AFE3D190CA: r"SB_AWD\30_59\ITALIAN\XBX_0030.awd",
+    0xE94CBBFCCF019F96: r"SB_AGD\30_59\ENGLISH\NGC_0047.agd",
+    0xE94FA4A1379AD1DD: r"SB_AWD\150_179\GERMAN\NGC_0150.awd",
+    0xE973A2CD0F27B1B8: r"SB_AGD\120_149\FRENCH\NGC_0139.agd",
+    0xE97742B0B8ADFEE9: r"SB_AGD\120_149\ENGLISH\NGC_0134.agd",
+    0xE97A426163BD2BC4: r"SB_AWD\210_239\ITALIAN\PS2_0215.awd",
+    0xE97D8AE45A0E1C6F: r"SB_AGD\180_209\GERMAN\XBX_0201.agd",
+    0xE97EC119CBCC8E7B: r"SB_AWD\150_179\GERMAN\XBX_0165.awd",
+    0xE981D9944E148D00: r"SB_AGD\90_119\SPANISH\XBX_0091.agd",
+    0xE991AA624FEEC7E5: r"ANIMGRPS\Lvl_31\Lvl_31V.ads",
+    0xE994BF0C52952E37: r"SB_AGD\240_269\GERMAN\XBX_0266.agd",
+    0xE996F118303CA56E: r"SB_AGD\60_89\ITALIAN\NGC_0081.agd",
+    0xE9A48EEBC87B5C03: r"SB_AGD\0_29\GERMAN\XBX_0022.agd",
+    0xE9B0BFD1DE52CE8D: r"SB_AGD\60_89\GERMAN\XBX_0082.agd",
+    0xE9B48F7E252C63FA: r"ANIMGRPS\Lvl_11\Lvl_11Y.ads",
+    0xE9B8A7C2EB05DDB5: r"SB_AWD\120_149\ENGLISH\PS2_0144.awd",
+    0xE9BF467074070464: r"LEVELS\L_1_2\SECTIONS\s_20.rws",
+    0xE9D7EBC5C5E7C91F: r"AUDIO\ENGLISH\NGC_2s1.rws",
+    0xE9D85E4F15C149EE: r"SB_AWD\120_149\SPANISH\XBX_0139.awd",
+    0xE9D9EF996832ADCA: r"SB_AGD\150_179\ENGLISH\NGC_0155.agd",
+    0xE9DB027B76727312: r"SB_AWD\60_89\ITALIAN\XBX_0087.awd",
+    0xE9DE75EFDE8F7BC1: r"SB_AWD\60_89\FRENCH\NGC_0068.awd",
+    0xE9DF88626FB07F64: r"SB_AWD\60_89\FRENCH\XBX_0085.awd",
+    0xE9E6E9DCEC92FEF5: r"ANIMGRPS\Lvl_31\Lvl_31F.ads",
+    0xE9EDB91A3459C8EF: r"SB_AGD\150_179\SPANISH\NGC_0165.agd",
+    0xE9F8A8F1ACFEEC7C: r"SB_AWD\0_29\GERMAN\NGC_0012.awd",
+    0xE9FB877AA9FB4B46: r"SB_AGD\60_89\FRENCH\XBX_0072.agd",
+    0xE9FCFFCA116C9076: r"SB_AWD\240_269\ENGLISH\NGC_0252.awd",
+    0xE9FDD9DCDC59FCD5: r"SB_AWD\150_179\ITALIAN\XBX_0165.awd",
+    0xE9FE73E20DB03C76: r"SB_AGD\60_89\SPANISH\PS2_0080.agd",
+    0xEA035910F4B943BA: r"SB_AWD\180_209\SPANISH\PS2_0207.awd",
+    0xEA09D28730387B55: r"SB_AWD\180_209\FRENCH\NGC_0180.awd",
+    0xEA0A7BB21A3BFBBA: r"SB_AWD\150_179\FRENCH\NGC_0177.awd",
+    0xEA0C1D8D07EE0363: r"SB_AWD\240_269\ITALIAN\XBX_0268.awd",
+    0xEA1E8FEF47236135: r"SB_AWD\0_29\ITALIAN\NGC_0002.awd",
+    0xEA232E2978B9474B: r"SB_AWD\90_119\FRENCH\NGC_0104.awd",
+    0xEA2B69CB8B16949B: r"SB_AWD\90_119\ITALIAN\PS2_0110.awd",
+    0xEA2CCE7C3E898C1C: r"SB_AWD\210_239\GERMAN\XBX_0210.awd",
+    0xEA31FA1C007D806B: r"SB_AWD\150_179\SPANISH\PS2_0159.awd",
+    0xEA3550D1F4DD67D6: r"SB_AWD\90_119\SPANISH\XBX_0093.awd",
+    0xEA38C05FF432BED8: r"SB_AGD\30_59\ITALIAN\PS2_0048.agd",
+    0xEA3978011E05EBE2: r"SB_AWD\90_119\SPANISH\NGC_0099.awd",
+    0xEA43556FEF9B857A: r"SB_AGD\90_119\ITALIAN\XBX_0112.agd",
+    0xEA45AFE825D97C6E: r"ANIMGRPS\Lvl_33\Lvl_33Y.ads",
+    0xEA46C129DA571778: r"SB_AGD\60_89\ITALIAN\NGC_0083.agd",
+    0xEA4D18D8D64D13D8: r"SB_AGD\210_239\GERMAN\XBX_0229.agd",
+    0xEA558B8928F4717C: r"SB_AGD\30_59\FRENCH\XBX_0058.agd",
+    0xEA5F907DC4A19DFF: r"SB_AWD\90_119\ITALIAN\NGC_0115.awd",
+    0xEA75B0C0DC2D6DEC: r"SB_AWD\150_179\ITALIAN\NGC_0166.awd",
+    0xEA82C3B3C9491847: r"AUDIO\ITALIAN\PS2_4m2.rws",
+    0xEA89E3852E87B979: r"SB_AWD\120_149\ITALIAN\PS2_0139.awd",
+    0xEA8B52643B36ED11: r"SB_AWD\90_119\FRENCH\PS2_0095.awd",
+    0xEA8C88569403B3C7: r"SB_AGD\210_239\GERMAN\NGC_0233.agd",
+    0xEA8D6E09B342D597: r"SB_AGD\30_59\ENGLISH\NGC_0051.agd",
+    0xEA96ED9A58A8FD44: r"AUDIO\ENGLISH\PS2_1s2.rws",
+    0xEA9DF94A3DF031C0: r"SB_AWD\90_119\FRENCH\XBX_0101.awd",
+    0xEAB5642AA55E4B7F: r"SB_AWD\210_239\ITALIAN\XBX_0233.awd",
+    0xEAC2E3E6601305D0: r"SB_AWD\240_269\FRENCH\XBX_0252.awd",
+    0xEAC61CF08FC5386C: r"SB_AGD\0_29\GERMAN\XBX_0018.agd",
+    0xEAC9C0671241AF71: r"WPNBANK\0_25\wbank_14.bin",
+    0xEACE18EA85E66541: r"SB_AGD\120_149\SPANISH\PS2_0126.agd",
+    0xEAD113BA4B1253DD: r"SB_AWD\120_149\ITALIAN\PS2_0144.awd",
+    0xEADD8D5A930307C7: r"SB_AWD\90_119\FRENCH\PS2_0112.awd",
+    0xEAE404EE6663DC2C: r"LEVELS\MP_9\SECTIONS\s_4.rws",
+    0xEAE6F6597C5C9507: r"SB_AGD\30_59\ITALIAN\PS2_0036.agd",
+    0xEAEF7ED043CAFBC9: r"w_MainScreenBKG.index",
+    0xEB0FF6C586BAEA97: r"SB_AWD\150_179\ITALIAN\PS2_0155.awd",
+    0xEB15444B60DCAA4B: r"SB_AWD\30_59\ITALIAN\PS2_0054.awd",
+    0xEB1AA3F3AF770B08: r"SB_AGD\180_209\ENGLISH\NGC_0194.agd",
+    0xEB1C5D6401169712: r"SB_AGD\120_149\ENGLISH\PS2_0143.agd",
+    0xEB1EAC6FFBE5270D: r"SB_AGD\60_89\GERMAN\PS2_0078.agd",
+    0xEB1EEE9A0E95F5DE: r"SB_AWD\90_119\ITALIAN\NGC_0095.awd",
+    0xEB1F254DDF629CAE: r"SB_AGD\240_269\GERMAN\PS2_0264.agd",
+    0xEB225D6C662712EC: r"SB_AGD\0_29\ITALIAN\XBX_0027.agd",
+    0xEB2570D28647C4CE: r"SB_AWD\150_179\ITALIAN\NGC_0168.awd",
+    0xEB2C974094E1C545: r"LEVELS\L_3_5\SECTIONS\s_24.rws",
+    0xEB314067300E0198: r"LEVELS\L_1_3_A\SECTIONS\s_5.rws",
+    0xEB3344FF943C5208: r"ANIMGRPS\Lvl_34\Lvl_34Y.ads",
+    0xEB35FC61A3CA32ED: r"SB_AWD\120_149\ENGLISH\PS2_0135.awd",
+    0xEB41B6D9AD6D1B21: r"SB_AWD\120_149\FRENCH\XBX_0121.awd",
+    0xEB4CE95BE80926B2: r"SB_AWD\90_119\FRENCH\XBX_0107.awd",
+    0xEB4E72F9697F76D3: r"LEVELS\L_2_1\SECTIONS\s_5.rws",
+    0xEB51A46D400C65E5: r"SHELL\LOAD\MP_10_TDM.txd",
+    0xEB52C57EEE5F053A: r"ANIMGRPS\Lvl_26\Lvl_26A.ads",
+    0xEB58C270FB2EDDAE: r"SB_AGD\240_269\FRENCH\NGC_0245.agd",
+    0xEB73D112315BA5E8: r"SB_AWD\240_269\GERMAN\PS2_0248.awd",
+    0xEB7CE8FC2FFF2453: r"SB_AGD\120_149\SPANISH\PS2_0128.agd",
+    0xEB8092DCFBEB09F0: r"SB_AGD\150_179\ITALIAN\XBX_0151.agd",
+    0xEB80CE49E70BD2EB: r"SB_AGD\240_269\GERMAN\NGC_0242.agd",
+    0xEB842B4BF468F750: r"SB_AWD\150_179\FRENCH\XBX_0173.awd",
+    0xEB89EA5E214F1939: r"SB_AGD\60_89\SPANISH\PS2_0065.agd",
+    0xEB8BE12B67803102: r"SB_AGD\90_119\SPANISH\NGC_0099.agd",
+    0xEB9182CDB4F88E91: r"SB_AGD\240_269\GERMAN\PS2_0245.agd",
+    0xEB92D22910C8406B: r"SB_AWD\0_29\ENGLISH\NGC_0022.awd",
+    0xEB95009B240E162D: r"font_stringfutbo22.tga",
+    0xEB957B0D2E83A5D9: r"SB_AGD\60_89\ITALIAN\NGC_0068.agd",
+    0xEB969C29D09DAF8F: r"SB_AGD\240_269\SPANISH\XBX_0264.agd",
+    0xEBA46C4EB60E6FC1: r"SB_AGD\30_59\ITALIAN\NGC_0053.agd",
+    0xEBA8096565E34C1E: r"SB_AWD\240_269\ITALIAN\PS2_0266.awd",
+    0xEBAA5F06420F7D19: r"SHELL\LOAD\L_3_5_B.txd",
+    0xEBAC3C9D424BB435: r"SB_AGD\60_89\GERMAN\NGC_0062.agd",
+    0xEBAE4B4665267B3F: r"KickPlayer.layout",
+    0xEBB14FABC7F4830C: r"SB_AGD\120_149\SPANISH\XBX_0128.agd",
+    0xEBB33FE518D3BC66: r"SB_AWD\240_269\ENGLISH\NGC_0245.awd",
+    0xEBC49D2E06CA184E: r"SB_AGD\180_209\ENGLISH\PS2_0188.agd",
+    0xEBC6BCDF926092A7: r"SB_AWD\120_149\ITALIAN\XBX_0149.awd",
+    0xEBC9894E844ADACD: r"SB_AWD\60_89\ITALIAN\NGC_0082.awd",
+    0xEBCAACCA8B4FF5C3: r"SB_AGD\120_149\GERMAN\PS2_0131.agd",
+    0xEBD94D1726767107: r"CoDSplashLegal.dds",
+    0xEBE898A0A723CAC8: r"SB_AGD\240_269\GERMAN\NGC_0263.agd",
+    0xEBFC90D95A63E03A: r"SB_AGD\30_59\SPANISH\XBX_0038.agd",
+    0xEC0F311726A3D174: r"CoDSplashLegal.txd",
+    0xEC138FE1987C0D30: r"SB_AGD\60_89\ENGLISH\XBX_0067.agd",
+    0xEC2AFFE47EF05FFB: r"SB_AGD\180_209\FRENCH\PS2_0198.agd",
+    0xEC2F62EEA603C882: r"SB_AGD\150_179\ITALIAN\XBX_0157.agd",
+    0xEC30B572D9BED895: r"SB_AGD\120_149\ITALIAN\NGC_0141.agd",
+    0xEC3237E1AA8B4D39: r"SB_AGD\30_59\ITALIAN\XBX_0033.agd",
+    0xEC32CD45C664AEA1: r"SB_AGD\30_59\FRENCH\XBX_0033.agd",
+    0xEC3C773FC5CB05F1: r"SB_AWD\210_239\ITALIAN\NGC_0233.awd",
+    0xEC3CD0AA10576870: r"LEVELS\L_2_1_B\SECTIONS\s_3.rws",
+    0xEC4263D40EC80D31: r"SB_AGD\60_89\SPANISH\XBX_0084.agd",
+    0xEC443BE2177AA278: r"SB_AWD\240_269\ITALIAN\XBX_0241.awd",
+    0xEC45FC3B7AB763C9: r"SB_AGD\240_269\SPANISH\XBX_0266.agd",
+    0xEC49A8E1EC8E4589: r"SB_AWD\0_29\ENGLISH\PS2_0029.awd",
+    0xEC4C2472C205FCE8: r"SB_AWD\150_179\SPANISH\PS2_0174.awd",
+    0xEC55085FA2344EE9: r"SB_AGD\180_209\FRENCH\XBX_0205.agd",
+    0xEC57B9770FFD8848: r"SB_AWD\240_269\ITALIAN\PS2_0264.awd",
+    0xEC5D578C55859ED0: r"SB_AGD\60_89\FRENCH\XBX_0070.agd",
+    0xEC628FF6C2ED54F0: r"SB_AWD\240_269\ENGLISH\NGC_0247.awd",
+    0xEC645189FCB6A45D: r"SB_AGD\180_209\SPANISH\PS2_0183.agd",
+    0xEC662C072580EE22: r"i_frame2_setup_only.layout",
+    0xEC7548B673965897: r"SB_AWD\30_59\SPANISH\NGC_0033.awd",
+    0xEC78D9602E64735F: r"SB_AWD\60_89\ITALIAN\NGC_0084.awd",
+    0xEC7E095BEF19A0C6: r"SHELL\FONTS\fbld28.met",
+    0xEC7F608219A7CB01: r"WPNBANK\0_25\wbank_07.bin",
+    0xEC8E39DD36A29B35: r"SB_AWD\90_119\ITALIAN\PS2_0112.awd",
+    0xEC8FB476997BFD88: r"SB_AGD\240_269\ITALIAN\NGC_0265.agd",
+    0xEC9820E3A0696E60: r"SB_AWD\90_119\SPANISH\XBX_0091.awd",
+    0xECA24A1846549219: r"TeamSelect.layout",
+    0xECA40F04C9F38693: r"SB_AWD\150_179\GERMAN\PS2_0171.awd",
+    0xECAE6AA394CB5701: r"SB_AGD\180_209\FRENCH\NGC_0207.agd",
+    0xECB9D00D8E6D4B47: r"SB_AGD\180_209\ENGLISH\XBX_0209.agd",
+    0xECB9D62BC55DF6B0: r"SB_AWD\210_239\FRENCH\PS2_0233.awd",
+    0xECC1DFE4CFF6703A: r"gui_map1_destroy.index",
+    0xECCE9BA30A022359: r"SB_AWD\0_29\SPANISH\PS2_0014.awd",
+    0xECD317E1A5169846: r"SB_AWD\150_179\ITALIAN\XBX_0179.awd",
+    0xECD368957E6D337C: r"SB_AGD\0_29\SPANISH\NGC_0007.agd",
+    0xECDF54AF03E009E1: r"SB_AGD\90_119\ENGLISH\NGC_0117.agd",
+    0xECF3F1F1FD14F267: r"SB_AWD\240_269\ENGLISH\NGC_0257.awd",
+    0xECF5C968E0A298A7: r"SB_AGD\210_239\ENGLISH\PS2_0223.agd",
+    0xECF7A77F08B8842B: r"SB_AWD\30_59\GERMAN\XBX_0059.awd",
+    0xECFA024FFF62CD82: r"LEVELS\L_3_5_B\SECTIONS\s_2.rws",
+    0xECFA3867EEA8F91F: r"SB_AGD\60_89\ENGLISH\PS2_0085.agd",
+    0xED0078ADE3ED37F0: r"SHELL\FEND\INSTANCE\SKY\cod.ico",
+    0xED04AB249CFAE75F: r"SB_AGD\90_119\GERMAN\PS2_0095.agd",
+    0xED04DA9EC0439DA2: r"SB_AGD\240_269\SPANISH\PS2_0257.agd",
+    0xED087946B2E6B31E: r"w_flagsGB.txd",
+    0xED14AB027C30C3C2: r"SB_AGD\240_269\ENGLISH\NGC_0241.agd",
+    0xED171F52C1F2390F: r"SB_AGD\90_119\FRENCH\NGC_0108.agd",
+    0xED2513F80B9DFC02: r"SB_AWD\240_269\FRENCH\XBX_0254.awd",
+    0xED284F2B77509ECB: r"SB_AGD\90_119\FRENCH\PS2_0093.agd",
+    0xED2B39A81CCC5A60: r"SB_AGD\150_179\ENGLISH\XBX_0151.agd",
+    0xED31C65AE45D6BA6: r"SB_AWD\0_29\SPANISH\NGC_0001.awd",
+    0xED36A62290313CAD: r"SB_AWD\0_29\ITALIAN\PS2_0003.awd",
+    0xED3DB701D2BA79C0: r"SB_AWD\120_149\GERMAN\NGC_0146.awd",
+    0xED3F3D46B3158F85: r"w_flagsGB.dds",
+    0xED40AF23BC2A3D30: r"AUDIO\ITALIAN\XBX_2m2.rws",
+    0xED45F884A0B16D3E: r"SB_AGD\30_59\GERMAN\XBX_0050.agd",
+    0xED4857AD55BE155B: r"SB_AGD\150_179\ENGLISH\XBX_0178.agd",
+    0xED58C070790B9503: r"SB_AGD\180_209\ITALIAN\NGC_0180.agd",
+    0xED5E7189F74329DA: r"SB_AWD\120_149\ITALIAN\PS2_0125.awd",
+    0xED6BF4663B98676B: r"SB_AGD\120_149\FRENCH\NGC_0121.agd",
+    0xED6BF7E7F758CFBE: r"SB_AGD\180_209\ENGLISH\XBX_0194.agd",
+    0xED6CE3C51ADAD30D: r"SB_AGD\0_29\ENGLISH\XBX_0022.agd",
+    0xED75B26CFF5E227B: r"LEVELS\L_3_1_B\SECTIONS\s_3.rws",
+    0xED8539081D517B36: r"AUDIO\GERMAN\PS2_4s3.rws",
+    0xED8A5212A4878C31: r"SB_AWD\60_89\GERMAN\PS2_0067.awd",
+    0xED8F116865659A31: r"SB_AGD\120_149\SPANISH\XBX_0143.agd",
+    0xED926589A42E4D31: r"SB_AWD\210_239\ENGLISH\NGC_0228.awd",
+    0xEDA747065EEDDFA3: r"SB_AWD\120_149\FRENCH\XBX_0130.awd",
+    0xEDACFC7FD250BCE8: r"SB_AWD\0_29\ENGLISH\NGC_0003.awd",
+    0xEDAFE0912423B54D: r"SB_AWD\150_179\GERMAN\NGC_0165.awd",
+    0xEDB0379E59E9BE7C: r"ANIMGRPS\Lvl_15\Lvl_15G.ads",
+    0xEDBC5DADA306E564: r"w_session.index",
+    0xEDBCB58D85891240: r"SB_AGD\60_89\SPANISH\XBX_0078.agd",
+    0xEDC882D8C9F1B0B6: r"SB_AGD\120_149\ENGLISH\XBX_0131.agd",
+    0xEDD57919C71A6410: r"AUDIO\GERMAN\PS2_4s1.rws",
+    0xEDDC0AA3C59A355E: r"SB_AGD\30_59\ITALIAN\NGC_0036.agd",
+    0xEDE58309AD6ABE12: r"SB_AGD\150_179\ITALIAN\XBX_0162.agd",
+    0xEDE65B5D9FF3ED82: r"SB_AWD\150_179\FRENCH\XBX_0175.awd",
+    0xEDE754E5556B3410: r"SB_AWD\150_179\ITALIAN\PS2_0174.awd",
+    0xEDEB6DBCAFDA9098: r"SB_AGD\0_29\ITALIAN\XBX_0012.agd",
+    0xEDEC1A6D37F57C61: r"SB_AWD\60_89\SPANISH\NGC_0073.awd",
+    0xEDECA7137CD36EB2: r"SB_AWD\120_149\GERMAN\NGC_0140.awd",
+    0xEDF31133A9D940E8: r"SB_AWD\90_119\GERMAN\PS2_0100.awd",
+    0xEDF9CBAF7B7EBCC4: r"SB_AWD\150_179\ENGLISH\XBX_0177.awd",
+    0xEDFC8D1C7336934E: r"SB_AWD\90_119\SPANISH\NGC_0110.awd",
+    0xEE074D10D5698491: r"SB_AWD\240_269\ITALIAN\NGC_0255.awd",
+    0xEE0D414C26DAB08D: r"SB_AGD\240_269\ENGLISH\NGC_0259.agd",
+    0xEE12D5786067506C: r"SB_AGD\90_119\ITALIAN\XBX_0095.agd",
+    0xEE13C3F3BAACFD80: r"SB_AGD\60_89\SPANISH\PS2_0082.agd",
+    0xEE13C9EE8957CE47: r"SB_AWD\150_179\ITALIAN\XBX_0163.awd",
+    0xEE194922A1B71534: r"SB_AWD\180_209\SPANISH\PS2_0205.awd",
+    0xEE1FC298DD364CC7: r"SB_AWD\180_209\FRENCH\NGC_0186.awd",
+    0xEE206BC3C739CD34: r"SB_AWD\150_179\FRENCH\NGC_0175.awd",
+    0xEE290D5AB848F368: r"SB_AGD\180_209\ENGLISH\PS2_0199.agd",
+    0xEE349FE4C826B840: r"SB_AWD\120_149\GERMAN\PS2_0129.awd",
+    0xEE3569E1296364CD: r"SB_AGD\180_209\FRENCH\NGC_0188.agd",
+    0xEE38FE3B25B6E265: r"SB_AWD\90_119\FRENCH\NGC_0106.awd",
+    0xEE3F818C4351BC39: r"SB_AGD\60_89\GERMAN\NGC_0080.agd",
+    0xEE402682BBD739F3: r"ANIMGRPS\Lvl_13\Lvl_13L.ads",
+    0xEE43BB1AF88FA230: r"SB_AGD\210_239\SPANISH\XBX_0212.agd",
+    0xEE456A7202BDC88B: r"SB_AGD\210_239\GERMAN\XBX_0231.agd",
+    0xEE4736519F9D9080: r"SB_AWD\90_119\ENGLISH\NGC_0097.awd",
+    0xEE4A386114C7551E: r"SB_AWD\180_209\SPANISH\NGC_0181.awd",
+    0xEE4B2DF6B8AB1221: r"SB_AWD\240_269\GERMAN\NGC_0257.awd",
+    0xEE4C9202BB4C4A6A: r"SB_AGD\120_149\ENGLISH\PS2_0132.agd",
+    0xEE57E4E199861CEC: r"SB_AWD\0_29\GERMAN\NGC_0001.awd",
+    0xEE58A5819C984694: r"SB_AGD\90_119\ITALIAN\XBX_0110.agd",
+    0xEE58BE68489A2B5B: r"SB_AGD\150_179\FRENCH\PS2_0159.agd",
+    0xEE58D6C7BB9E5E5C: r"SHELL\LOAD\L_3_4_B.txd",
+    0xEE5E7862EA0A899A: r"SB_AGD\60_89\SPANISH\PS2_0071.agd",
+    0xEE5F1330E1831A26: r"SB_AGD\210_239\ENGLISH\PS2_0239.agd",
+    0xEE5F30A2CE3D4DDF: r"SB_AWD\150_179\GERMAN\NGC_0163.awd",
+    0xEE631C9C8965737D: r"SB_AWD\120_149\ENGLISH\NGC_0141.awd",
+    0xEE63A32F8E7ADC43: r"SB_AWD\150_179\ITALIAN\NGC_0150.awd",
+    0xEE691ED824CB913B: r"SB_AGD\30_59\ENGLISH\XBX_0048.agd",
+    0xEE69E0364419BF12: r"SB_AWD\240_269\SPANISH\PS2_0262.awd",
+    0xEE6A6B9AD5F0743E: r"SB_AGD\30_59\FRENCH\XBX_0056.agd",
+    0xEE6DF8F0E2CB0E34: r"SHELL\FONTS\mf20.png",
+    0xEE74D08F719E4459: r"SB_AWD\90_119\ITALIAN\NGC_0117.awd",
+    0xEE77D2EA740B49C0: r"SB_AGD\120_149\ENGLISH\XBX_0133.agd",
+    0xEE825034858E3187: r"SB_AWD\210_239\SPANISH\NGC_0239.awd",
+    0xEE88A8FE90C1A945: r"SB_AWD\60_89\ENGLISH\XBX_0088.awd",
+    0xEE8ADAB56FB2F468: r"SB_AGD\30_59\ITALIAN\NGC_0034.agd",
+    0xEE9E8F661759D856: r"SB_AWD\90_119\ENGLISH\PS2_0094.awd",
+    0xEEA5B07BEF06944B: r"SB_AGD\150_179\SPANISH\PS2_0159.agd",
+    0xEEA7D8C19ED7B4AE: r"SB_AGD\210_239\FRENCH\PS2_0213.agd",
+    0xEEAFD07866CC97FB: r"AUDIO\SPANISH\NGC_1s2.rws",
+    0xEEB076A18B71BAC0: r"SB_AWD\60_89\ENGLISH\XBX_0070.awd",
+    0xEECAA43C525AF1D9: r"SB_AWD\210_239\ITALIAN\XBX_0231.awd",
+    0xEECD145EF1A17AEE: r"SB_AGD\210_239\ENGLISH\XBX_0221.agd",
+    0xEECFD68816B76C9B: r"SB_AWD\30_59\GERMAN\NGC_0040.awd",
+    0xEEEFDFC004F32226: r"SB_AWD\210_239\SPANISH\PS2_0213.awd",
+    0xEEF9E872BEE19148: r"SB_AWD\180_209\SPANISH\NGC_0183.awd",
+    0xEEFA7E0862C4AAB3: r"SB_AWD\240_269\GERMAN\NGC_0259.awd",
+    0xEF06385A849C7FF1: r"SHELL\FONTS\tw24.met",
+    0xEF0E1E7AE78A0108: r"SB_AGD\60_89\ITALIAN\XBX_0070.agd",
+    0xEF11ECAE337E320F: r"SB_AWD\120_149\ENGLISH\NGC_0147.awd",
+    0xEF13C8E2AA8EC1D6: r"SB_AWD\120_149\FRENCH\PS2_0136.awd",
+    0xEF16C178E945DD8D: r"SB_AWD\210_239\ENGLISH\XBX_0222.awd",
+    0xEF1A3641746DA691: r"SB_AGD\210_239\FRENCH\PS2_0236.agd",
+    0xEF1FE8BAFDA93039: r"SB_AGD\240_269\SPANISH\NGC_0255.agd",
+    0xEF22EF66B6F1CA9A: r"SB_AWD\60_89\ENGLISH\NGC_0063.awd",
+    0xEF29631E690BF2C4: r"SB_AWD\120_149\GERMAN\XBX_0122.awd",
+    0xEF2B145D0DDA4565: r"SB_AWD\30_59\ITALIAN\PS2_0056.awd",
+    0xEF2BAC09FA51B84F: r"ANIMGRPS\Lvl_24\Lvl_24L.ads",
+    0xEF339EABBB91A708: r"SB_AWD\90_119\ITALIAN\NGC_0097.awd",
+    0xEF33F55F8C5E84B8: r"SB_AGD\240_269\GERMAN\PS2_0266.agd",
+    0xEF3412B5D163AFB9: r"SB_AGD\180_209\SPANISH\NGC_0199.agd",
+    0xEF4C838458D41F2E: r"SHELL\MOVIES\ITALIAN\Act_2.bik",
+    0xEF4EB6C81F2816B4: r"AUDIO\FRENCH\NGC_1m3.rws",
+    0xEF5538373561CEBA: r"LEVELS\L_3_1_C\CLUMPS\cbank_02.bin",
+    0xEF5D18799A351B59: r"SB_AGD\60_89\ENGLISH\PS2_0087.agd",
+    0xEF5D70058B8EAC5C: r"SB_AGD\0_29\ENGLISH\PS2_0006.agd",
+    0xEF5F66B3358AAFB2: r"SB_AWD\60_89\ENGLISH\XBX_0076.awd",
+    0xEF6493BDD2029FFC: r"SB_AWD\210_239\SPANISH\XBX_0230.awd",
+    0xEF668B3648855599: r"SB_AGD\90_119\GERMAN\PS2_0097.agd",
+    0xEF6D9282A82AC5B8: r"SB_AGD\240_269\FRENCH\NGC_0247.agd",
+    0xEF79627EAA995D85: r"LEVELS\L_3_1_B\SECTIONS\s_1.rws",
+    0xEF7CE4709BBBECF8: r"SB_AGD\210_239\ENGLISH\XBX_0223.agd",
+    0xEF847C5C84557581: r"AUDIO\ENGLISH\XBX_1s2.rws",
+    0xEF8B1F3D22DCA565: r"SB_AGD\90_119\FRENCH\PS2_0091.agd",
+    0xEF8D89B9C8578772: r"SB_AGD\150_179\ENGLISH\XBX_0157.agd",
+    0xEF9C1D6E1F529A9B: r"SB_AGD\90_119\ITALIAN\NGC_0119.agd",
+    0xEF9FB1C930D7BA5A: r"AUDIO\ENGLISH\PS2_4m3.rws",
+    0xEFB36442D8DD5BF8: r"CreateSession.layout",
+    0xEFB3888517064AA2: r"SB_AGD\240_269\FRENCH\PS2_0262.agd",
+    0xEFB46161F1198339: r"SB_AWD\60_89\ENGLISH\NGC_0073.awd",
+    0xEFB554D3EDA999C5: r"SB_AWD\60_89\ITALIAN\NGC_0077.awd",
+    0xEFB5846C2EB6113F: r"SHELL\FONTS\tw26.met",
+    0xEFB9B0DDBE68EC48: r"ANIMGRPS\Lvl_23\Lvl_23E.ads",
+    0xEFC25C3FD418072B: r"SB_AGD\0_29\GERMAN\PS2_0014.agd",
+    0xEFC677A75E5E28E0: r"SB_AGD\60_89\FRENCH\XBX_0067.agd",
+    0xEFC72FBD74F239CE: r"SB_AGD\120_149\SPANISH\XBX_0126.agd",
+    0xEFDD06401CEB171D: r"SB_AWD\120_149\GERMAN\PS2_0133.awd",
+    0xEFF7239E26602473: r"SB_AGD\90_119\ITALIAN\PS2_0118.agd",
+    0xF0152ED9BCAE5301: r"SB_AWD\90_119\SPANISH\PS2_0109.awd",
+    0xF019B6DA3B250B39: r"LEVELS\L_3_1\SECTIONS\s_24.rws",
+    0xF01EF71A76804D6F: r"SB_AWD\180_209\ITALIAN\NGC_0184.awd",
+    0xF0295FF34579A8C2: r"SB_AGD\60_89\ENGLISH\XBX_0061.agd",
+    0xF03DCDCBD27BC8D1: r"SB_AGD\90_119\FRENCH\XBX_0117.agd",
+    0xF045858486BAC0A7: r"SB_AGD\120_149\ITALIAN\NGC_0147.agd",
+    0xF04984F700F62B42: r"SB_AWD\150_179\ITALIAN\PS2_0172.awd",
+    0xF051CC4BA8EDB665: r"ANIMGRPS\Lvl_15\Lvl_15R.ads",
+    0xF055DE0C74B0162C: r"SB_AWD\180_209\FRENCH\XBX_0190.awd",
+    0xF058C58D077C6ABF: r"filein.log",
+    0xF05C54C697FD8CB0: r"LEVELS\L_3_1_C\SECTIONS\s_12.rws",
+    0xF068191B0E0E3C24: r"SB_AGD\210_239\SPANISH\NGC_0232.agd",
+    0xF06A8ED87BF8B0DA: r"SB_AGD\240_269\ENGLISH\XBX_0247.agd",
+    0xF078D20205C0C0AB: r"SB_AWD\210_239\SPANISH\PS2_0238.awd",
+    0xF079A19BA9B365EF: r"SB_AGD\180_209\SPANISH\PS2_0185.agd",
+    0xF0871BC46271B6BA: r"SB_AWD\180_209\ITALIAN\PS2_0184.awd",
+    0xF087644D7BE32683: r"SB_AWD\30_59\GERMAN\PS2_0052.awd",
+    0xF088C57B458B0A0A: r"SB_AWD\180_209\ENGLISH\XBX_0200.awd",
+    0xF08F506971BC5565: r"SB_AGD\210_239\ITALIAN\NGC_0219.agd",
+    0xF09265BE4168A2F5: r"SB_AGD\60_89\FRENCH\XBX_0088.agd",
+    0xF09E9AB0BC22081A: r"SB_AGD\90_119\FRENCH\XBX_0099.agd",
+    0xF09EC8B5283F58F0: r"SB_AWD\60_89\ITALIAN\PS2_0068.awd",
+    0xF0A3D74703562A0C: r"WPNBANK\26_50\wbank_40.bin",
+    0xF0A59B957F3BC10D: r"SB_AWD\90_119\FRENCH\XBX_0108.awd",
+    0xF0A70BC64591ED75: r"ANIMGRPS\Lvl_15\Lvl_15B.ads",
+    0xF0A73A83AE481C25: r"SB_AGD\210_239\GERMAN\XBX_0233.agd",
+    0xF0B0E9489D1CC643: r"SB_AGD\60_89\ITALIAN\PS2_0063.agd",
+    0xF0B5D5BDBB716B86: r"SB_AGD\240_269\ITALIAN\XBX_0258.agd",
+    0xF0C43AB541C8F213: r"SB_AGD\180_209\FRENCH\NGC_0209.agd",
+    0xF0C5CB6070C1AE3D: r"SB_AWD\90_119\ENGLISH\XBX_0090.awd",
+    0xF0C8C1DADB584244: r"AUDIO\ENGLISH\PS2_4m1.rws",
+    0xF0D4116FFEFBEC05: r"SB_AGD\0_29\ENGLISH\NGC_0020.agd",
+    0xF0D4B8D43BFD37EA: r"SB_AWD\240_269\ENGLISH\PS2_0262.awd",
+    0xF0DA70F76125ACA8: r"SB_AWD\150_179\ENGLISH\PS2_0163.awd",
+    0xF0E49364FEB2CBDD: r"SB_AGD\90_119\SPANISH\NGC_0096.agd",
+    0xF0E5EE5D36260DBE: r"SB_AWD\90_119\ENGLISH\XBX_0101.awd",
+    0xF0E848A72B69363E: r"SB_AGD\0_29\SPANISH\NGC_0009.agd",
+    0xF0ED1DDD7C956163: r"SB_AGD\90_119\FRENCH\XBX_0119.agd",
+    0xF0F2E36102946A6B: r"SB_AWD\240_269\GERMAN\XBX_0262.awd",
+    0xF0F9BAC91146A1A1: r"SB_AGD\180_209\FRENCH\PS2_0202.agd",
+    0xF0FC00D3B6206979: r"SB_AGD\240_269\ENGLISH\XBX_0257.agd",
+    0xF1015F77C2E5DEE0: r"SB_AWD\90_119\ENGLISH\PS2_0096.awd",
+    0xF1051661C417CE7E: r"SB_AGD\90_119\SPANISH\NGC_0103.agd",
+    0xF11566CE3CF16F62: r"SB_AWD\60_89\ENGLISH\XBX_0061.awd",
+    0xF1165B11897C04C5: r"SB_AWD\0_29\ITALIAN\XBX_0008.awd",
+    0xF121F63CF023958D: r"SB_AGD\60_89\ENGLISH\XBX_0079.agd",
+    0xF132A699C2437335: r"SB_AWD\30_59\GERMAN\NGC_0042.awd",
+    0xF13C94724F7966BC: r"SB_AWD\0_29\GERMAN\PS2_0013.awd",
+    0xF147166C915A2D30: r"SB_AWD\0_29\SPANISH\NGC_0003.awd",
+    0xF14AEF48387ABA57: r"SHELL\FONTS\mfb30.png",
+    0xF14E603B0FF7026C: r"SB_AGD\30_59\ENGLISH\PS2_0053.agd",
+    0xF157BD87172F0A4E: r"SB_AWD\30_59\GERMAN\XBX_0032.awd",
+    0xF16146DACB0F2861: r"SB_AGD\210_239\ITALIAN\XBX_0239.agd",
+    0xF17698F4561AC860: r"SB_AWD\120_149\FRENCH\PS2_0134.awd",
+    0xF17CCB8870C4197D: r"SB_AWD\240_269\SPANISH\XBX_0248.awd",
+    0xF181A3DD2AB9F2FD: r"SB_AGD\210_239\ENGLISH\NGC_0224.agd",
+    0xF183E8E5E61699A4: r"SB_AWD\240_269\ENGLISH\PS2_0260.awd",
+    0xF187D7DBCFC03CAD: r"LOC\US\EULA.LOC",
+    0xF18815283D36635D: r"SB_AGD\150_179\ITALIAN\XBX_0158.agd",
+    0xF1A02224518527C3: r"SB_AWD\60_89\GERMAN\PS2_0069.awd",
+    0xF1A54E18FEC1719B: r"SB_AWD\0_29\ENGLISH\NGC_0017.awd",
+    0xF1A5624A1AB76686: r"SB_AGD\90_119\SPANISH\XBX_0101.agd",
+    0xF1A8359B512BE8C3: r"SB_AWD\210_239\ENGLISH\NGC_0226.awd",
+    0xF1AED6E7EDD19942: r"SB_AWD\30_59\SPANISH\NGC_0058.awd",
+    0xF1B1A860F3F44739: r"ANIMGRPS\Lvl_16\Lvl_16L.ads",
+    0xF1B5A8A69C9903BD: r"SB_AGD\210_239\GERMAN\NGC_0222.agd",
+    0xF1C1FC5E435962F6: r"SB_AGD\120_149\ITALIAN\XBX_0126.agd",
+    0xF1C3806771C0A1D5: r"SB_AGD\150_179\ITALIAN\NGC_0163.agd",
+    0xF1CFF1DBC3707F4A: r"AUDIO\ITALIAN\NGC_1m1.rws",
+    0xF1D00FB8077A8C7E: r"SB_AGD\30_59\SPANISH\PS2_0055.agd",
+    0xF1D4B369569C805C: r"SB_AWD\210_239\GERMAN\PS2_0222.awd",
+    0xF1DD75B6DC660A6D: r"SB_AWD\150_179\SPANISH\XBX_0165.awd",
+    0xF1EB593021CA6C0F: r"SB_AGD\60_89\FRENCH\NGC_0071.agd",
+    0xF1F100143BCB689E: r"gui_map1_death.index",
+    0xF1F476BFC664A09A: r"SB_AGD\240_269\SPANISH\NGC_0241.agd",
+    0xF1FAFFBC3DCD6BAA: r"SB_AGD\240_269\ENGLISH\NGC_0263.agd",
+    0xF1FCA747343A3A95: r"SB_AGD\60_89\GERMAN\XBX_0064.agd",
+    0xF205F3809F58E0F5: r"SB_AWD\30_59\GERMAN\XBX_0048.awd",
+    0xF208A0BA9A1F201A: r"SB_AGD\180_209\SPANISH\NGC_0185.agd",
+    0xF20CD254D3E6077D: r"SB_AWD\240_269\SPANISH\PS2_0258.awd",
+    0xF224D8F97DC4936C: r"SB_AWD\150_179\GERMAN\PS2_0158.awd",
+    0xF2283C614C219FA2: r"SB_AGD\240_269\GERMAN\NGC_0247.agd",
+    0xF228C7B909E955F2: r"SB_AGD\60_89\FRENCH\XBX_0061.agd",
+    0xF22C6B01963B685B: r"SB_AGD\30_59\GERMAN\PS2_0049.agd",
+    0xF2302DDBEEBA85E2: r"SB_AWD\180_209\ENGLISH\NGC_0185.awd",
+    0xF250B1DE6EB67BD6: r"SB_AGD\0_29\ITALIAN\PS2_0008.agd",
+    0xF253BA3A2D811AE6: r"SB_AGD\150_179\FRENCH\XBX_0171.agd",
+    0xF2598B2CA58D3DC2: r"SB_AGD\210_239\SPANISH\XBX_0214.agd",
+    0xF25D26634C9B6272: r"SB_AWD\90_119\ENGLISH\NGC_0091.awd",
+    0xF25F055548CB8343: r"SB_AGD\150_179\ENGLISH\NGC_0169.agd",
+    0xF26262146849E504: r"SB_AGD\120_149\ENGLISH\PS2_0130.agd",
+    0xF271867A26089D5C: r"ANIMGRPS\Lvl_36\Lvl_36Y.ads",
+    0xF27350791BDB13E7: r"SB_AGD\150_179\ITALIAN\NGC_0165.agd",
+    0xF2789B8D14DF493A: r"ErrorScreen.layout",
+    0xF281F72C220CA509: r"SB_AWD\180_209\ITALIAN\NGC_0186.awd",
+    0xF2897EEC54F87C92: r"SB_AGD\150_179\GERMAN\NGC_0175.agd",
+    0xF28B5C901DCB6A37: r"SB_AGD\0_29\GERMAN\PS2_0029.agd",
+    0xF2903BAC9F51ABE3: r"SB_AGD\120_149\SPANISH\NGC_0143.agd",
+    0xF29AB941CBE42049: r"SB_AGD\60_89\FRENCH\NGC_0073.agd",
+    0xF2A21D5A520A3511: r"SB_AWD\150_179\ENGLISH\XBX_0161.awd",
+    0xF2A9CFCDE7E62B44: r"SB_AGD\240_269\ENGLISH\NGC_0261.agd",
+    0xF2B0D382D2DCC38F: r"CodBack_FindSession.txd",
+    0xF2B52D86659F36AE: r"w_map08.index",
+    0xF2B5992D34D2E0AD: r"SB_AGD\90_119\ITALIAN\PS2_0097.agd",
+    0xF2BCA8D34BD39CB8: r"SB_AGD\210_239\FRENCH\PS2_0211.agd",
+    0xF2C1A0F067E082C9: r"LEVELS\L_3_3\GodData.dff",
+    0xF2CE8443F1537884: r"SB_AWD\210_239\ENGLISH\PS2_0228.awd",
+    0xF2D2DBCD3E6FE0BA: r"SB_AWD\120_149\GERMAN\NGC_0122.awd",
+    0xF2D4990B27DEEA4E: r"SB_AWD\150_179\GERMAN\PS2_0156.awd",
+    0xF2DC0131C2AE3ED2: r"SB_AGD\180_209\GERMAN\PS2_0207.agd",
+    0xF2E1159096429F89: r"ANIMGRPS\Lvl_14\Lvl_14P.ads",
+    0xF2E4ACE8F7BFC4EE: r"SHELL\FEND\INSTANCE\gcn\artwork.txd",
+    0xF2E72E01948DC9DD: r"SB_AWD\150_179\FRENCH\XBX_0165.awd",
+    0xF2E7BF82D30BE46C: r"CodBack_FindSession.dds",
+    0xF2EF44EEF094BF98: r"ANIMGRPS\Lvl_12\Lvl_12Y.ads",
+    0xF2F23A0BEB52467B: r"SB_AWD\180_209\SPANISH\NGC_0197.awd",
+    0xF304EB80DEEECFE5: r"SB_AWD\180_209\ITALIAN\NGC_0209.awd",
+    0xF3052FD1B1EFE3B0: r"SB_AWD\210_239\SPANISH\PS2_0211.awd",
+    0xF30D0DB7C41CE6E8: r"SB_AWD\240_269\GERMAN\XBX_0243.awd",
+    0xF30D51CA311C041F: r"ANIMGRPS\Lvl_26\Lvl_26X.ads",
+    0xF3119BCDC16B4125: r"FindSession.layout",
+    0xF313D358AEED05BA: r"WPNBANK\26_50\wbank_42.bin",
+    0xF31AC5EA6CF12020: r"SB_AGD\240_269\ITALIAN\XBX_0249.agd",
+    0xF31CAD4DBD7CF62F: r"SB_AGD\240_269\ENGLISH\NGC_0248.agd",
+    0xF32C118A96429F1F: r"SB_AWD\210_239\ENGLISH\XBX_0224.awd",
+    0xF32F8653216A6823: r"SB_AGD\210_239\FRENCH\PS2_0238.agd",
+    0xF3452FEDC6233505: r"SB_AGD\60_89\FRENCH\PS2_0061.agd",
+    0xF35216F94792D995: r"SB_AWD\90_119\GERMAN\XBX_0119.awd",
+    0xF35381AAD11F321E: r"SB_AWD\120_149\ITALIAN\NGC_0128.awd",
+    0xF353C2A2E3CE5A76: r"SB_AGD\150_179\FRENCH\NGC_0151.agd",
+    0xF355738702D7AF54: r"SB_AWD\150_179\SPANISH\NGC_0166.awd",
+    0xF3569AA3A6D2C96D: r"SB_AGD\240_269\FRENCH\PS2_0258.agd",
+    0xF36057D1BE2CE446: r"SB_AGD\90_119\FRENCH\NGC_0097.agd",
+    0xF364693EDEEB9FBF: r"SB_AGD\90_119\ITALIAN\PS2_0091.agd",
+    0xF366652797BB30C1: r"SB_AWD\180_209\ENGLISH\NGC_0205.awd",
+    0xF36CA1175E33C046: r"SHELL\MOVIES\fendjb.bik",
+    0xF36E9E803937CF31: r"SB_AGD\150_179\ITALIAN\PS2_0157.agd",
+    0xF3753609C82CA1AB: r"SB_AGD\210_239\ENGLISH\XBX_0237.agd",
+    0xF378975916B214FA: r"LEVELS\MP_6\SECTIONS\s_3.rws",
+    0xF378E0EC7D2DA66F: r"w_map05.txd",
+    0xF380935A10155EAC: r"SB_AGD\150_179\ENGLISH\NGC_0175.agd",
+    0xF38C4F3133C5BA92: r"SB_AWD\150_179\GERMAN\XBX_0160.awd",
+    0xF38DA36A4287EB8B: r"SB_AGD\240_269\ITALIAN\XBX_0260.agd",
+    0xF394A1940BBBD896: r"SB_AGD\120_149\SPANISH\NGC_0128.agd",
+    0xF3A92F74C7B85116: r"SB_AGD\0_29\ENGLISH\NGC_0016.agd",
+    0xF3A93702CC4EAC8B: r"SB_AGD\30_59\SPANISH\NGC_0037.agd",
+    0xF3AFCCEC7D5CC6CC: r"w_map05.dds",
+    0xF3CA04E59AA54B77: r"SB_AWD\60_89\ITALIAN\NGC_0071.awd",
+    0xF3CBB7870789FFC0: r"LEVELS\L_3_5_C\SECTIONS\s_30.rws",
+    0xF3DC9A411CBB9566: r"SB_AGD\150_179\ITALIAN\NGC_0173.agd",
+    0xF3DDF439F546D384: r"SB_AWD\0_29\ITALIAN\PS2_0006.awd",
+    0xF3F014A40D750EF6: r"SB_AWD\120_149\SPANISH\PS2_0147.awd",
+    0xF402576850ED716B: r"SB_AGD\210_239\FRENCH\NGC_0235.agd",
+    0xF405A4C2992CE568: r"SB_AWD\0_29\GERMAN\PS2_0026.awd",
+    0xF4081E2AAA4D7835: r"SB_AWD\0_29\ENGLISH\NGC_0015.awd",
+    0xF408325BC6436D10: r"SB_AGD\90_119\SPANISH\XBX_0103.agd",
+    0xF413627DA0AE3422: r"SB_AGD\120_149\FRENCH\NGC_0124.agd",
+    0xF41859D7984365BD: r"SB_AGD\60_89\FRENCH\XBX_0079.agd",
+    0xF419B5794F56929F: r"SB_AGD\90_119\SPANISH\PS2_0103.agd",
+    0xF41B6006AE8586C0: r"SB_AWD\60_89\SPANISH\PS2_0068.awd",
+    0xF41C07F07F10587B: r"SB_AWD\180_209\SPANISH\XBX_0186.awd",
+    0xF42EF35CD7C7317C: r"SB_AWD\240_269\FRENCH\PS2_0260.awd",
+    0xF43C42300972478D: r"SB_AWD\120_149\GERMAN\PS2_0120.awd",
+    0xF453432EE3276BAD: r"SB_AWD\90_119\SPANISH\XBX_0098.awd",
+    0xF454C8A84E4AAD2A: r"SB_AWD\30_59\ENGLISH\XBX_0045.awd",
+    0xF46A21BF11056948: r"SB_AGD\210_239\FRENCH\NGC_0210.agd",
+    0xF4738FBF68A4274E: r"SB_AWD\210_239\SPANISH\XBX_0221.awd",
+    0xF47F4E410B6682B3: r"SB_AGD\150_179\SPANISH\XBX_0178.agd",
+    0xF4814BBF5ABF0A91: r"SB_AGD\240_269\SPANISH\XBX_0244.agd",
+    0xF48333FA058E392D: r"SB_AGD\150_179\GERMAN\PS2_0173.agd",
+    0xF4857D0E71F57ABA: r"SB_AWD\180_209\GERMAN\XBX_0200.awd",
+    0xF48934FB63CA15F6: r"LEVELS\L_3_1_C\SECTIONS\s_1.rws",
+    0xF490DB2E47BA4305: r"SB_AGD\30_59\GERMAN\PS2_0058.agd",
+    0xF498207BA32ED3E8: r"SB_AWD\90_119\FRENCH\PS2_0098.awd",
+    0xF49C5E2ADA1679A2: r"SB_AGD\150_179\GERMAN\XBX_0159.agd",
+    0xF49D0BD60F6F8834: r"SB_AWD\180_209\ITALIAN\PS2_0186.awd",
+    0xF4A0539D8E91022A: r"ANIMGRPS\Lvl_22\Lvl_22I.ads",
+    0xF4A24338F2C81166: r"SB_AGD\180_209\ENGLISH\NGC_0181.agd",
+    0xF4B818ECCCBD4A0D: r"SB_AWD\60_89\ENGLISH\XBX_0079.awd",
+    0xF4BF8D76832844A6: r"w_playersetup.index",
+    0xF4C3CB9395565749: r"SHELL\FEND\INSTANCE\XBOX\LOADING.TXD",
+    0xF4D2C2908D96625B: r"SB_AWD\150_179\ENGLISH\PS2_0177.awd",
+    0xF4DB9B721DBF49CF: r"SB_AWD\90_119\ENGLISH\XBX_0096.awd",
+    0xF4E79A9A20ED115A: r"ANIMGRPS\Lvl_13\Lvl_13I.ads",
+    0xF4E9E181ABF98717: r"SB_AGD\0_29\ENGLISH\NGC_0026.agd",
+    0xF4EA1B25FA760338: r"SB_AWD\180_209\FRENCH\PS2_0193.awd",
+    0xF4EF929B3543CAF3: r"SB_AWD\0_29\SPANISH\XBX_0002.awd",
+    0xF4F17258FE7C13DE: r"LEVELS\L_1_3_B\SECTIONS\s_24.rws",
+    0xF4F2722B75AF04B6: r"LEVELS\L_3_3\SECTIONS\s_9.rws",
+    0xF4F9E376ABAF8D6F: r"SB_AGD\90_119\SPANISH\NGC_0090.agd",
+    0xF504591B6E65810F: r"SB_AGD\0_29\FRENCH\XBX_0024.agd",
+    0xF524E2A18AC5BC6C: r"SB_AWD\90_119\ITALIAN\XBX_0095.awd",
+    0xF52686E8A2F5A736: r"SB_AGD\30_59\GERMAN\NGC_0041.agd",
+    0xF52E18391E5B520B: r"SB_AGD\60_89\SPANISH\NGC_0088.agd",
+    0xF532040BAFA6F83F: r"SB_AGD\150_179\GERMAN\PS2_0175.agd",
+    0xF5325E0BA83576DC: r"LEVELS\L_1_1\SECTIONS\s_3.rws",
+    0xF532B890C91523C6: r"SB_AGD\90_119\GERMAN\NGC_0107.agd",
+    0xF532E53B6E3282EC: r"SB_AWD\30_59\ITALIAN\NGC_0052.awd",
+    0xF5334EAD9B85CCF6: r"SB_AWD\60_89\ITALIAN\NGC_0067.awd",
+    0xF53D1CFB44CA4AAF: r"SHELL\MOVIES\ITALIAN\1_5_Mon.bik",
+    0xF5434A790BC2F2C4: r"SB_AWD\120_149\ENGLISH\PS2_0130.awd",
+    0xF547D018C6B82884: r"gui_map3_destroy.txd",
+    0xF5498C6219279377: r"SB_AGD\150_179\FRENCH\XBX_0174.agd",
+    0xF56651D3588D0C3C: r"SB_AWD\210_239\ITALIAN\PS2_0237.awd",
+    0xF5678D9AD3B65245: r"SB_AGD\90_119\ITALIAN\NGC_0108.agd",
+    0xF57D807FE1E1F33D: r"SB_AWD\180_209\ENGLISH\NGC_0195.awd",
+    0xF57DCC18C6E5B137: r"gui_map3_destroy.dds",
+    0xF58375231AB732B8: r"w_sessionlist.index",
+    0xF587C26F02899787: r"SB_AGD\240_269\FRENCH\XBX_0246.agd",
+    0xF58E741019460B2D: r"SB_AWD\90_119\SPANISH\PS2_0097.awd",
+    0xF5B3B92D187F3549: r"SB_AGD\0_29\FRENCH\XBX_0026.agd",
+    0xF5C227E369B737D0: r"SB_AGD\90_119\FRENCH\NGC_0095.agd",
+    0xF5D5D6FA4D0F4040: r"SB_AGD\30_59\GERMAN\NGC_0043.agd",
+    0xF5D6D190481FEAED: r"SB_AGD\150_179\GERMAN\NGC_0165.agd",
+    0xF5D74C6FF0562400: r"SB_AGD\120_149\ITALIAN\XBX_0124.agd",
+    0xF5DC864C7FB1CBC1: r"SB_AGD\0_29\ITALIAN\NGC_0019.agd",
+    0xF5EA1E430D4C2706: r"SB_AGD\150_179\SPANISH\PS2_0161.agd",
+    0xF5EB9B48B3764072: r"LEVELS\MP_10\SECTIONS\s_6.rws",
+    0xF5EF737BEE123F25: r"SB_AGD\240_269\ITALIAN\XBX_0262.agd",
+    0xF5F8B32A5FB0274D: r"SB_AWD\60_89\GERMAN\NGC_0075.awd",
+    0xF5FC556A631070D7: r"SB_AWD\120_149\FRENCH\NGC_0125.awd",
+    0xF5FD6B18424EB839: r"SB_AGD\0_29\GERMAN\NGC_0008.agd",
+    0xF6013041A815A145: r"SB_AWD\120_149\SPANISH\XBX_0147.awd",
+    0xF60B071477D90025: r"SB_AGD\30_59\SPANISH\NGC_0035.agd",
+    0xF60DBD631E361AD7: r"SB_AWD\150_179\GERMAN\XBX_0158.awd",
+    0xF610A1E409ED6AC0: r"WillStartRound.layout",
+    0xF6117758E13622A7: r"SB_AGD\60_89\GERMAN\XBX_0062.agd",
+    0xF61753BBDCCD03E6: r"SB_AGD\240_269\ITALIAN\NGC_0252.agd",
+    0xF61A4DF28EDF9A16: r"SB_AGD\60_89\FRENCH\PS2_0075.agd",
+    0xF631623E86C5DB2F: r"SB_AGD\60_89\ENGLISH\XBX_0068.agd",
+    0xF636AC8A39B0FBAC: r"SB_AWD\240_269\ENGLISH\XBX_0267.awd",
+    0xF643519BE9E1CA43: r"AUDIO\ITALIAN\PS2_2s2.rws",
+    0xF64C9C12D9BD8C60: r"SB_AGD\150_179\ENGLISH\PS2_0152.agd",
+    0xF64D4B579898E238: r"SB_AGD\180_209\GERMAN\PS2_0199.agd",
+    0xF65673139C50578A: r"SB_AWD\150_179\ENGLISH\NGC_0155.awd",
+    0xF669BA1812AF475B: r"SB_AGD\150_179\ENGLISH\PS2_0177.agd",
+    0xF66EA35D8040CF56: r"SB_AWD\120_149\FRENCH\NGC_0133.awd",
+    0xF66F749ECA3BB44D: r"SB_AWD\90_119\GERMAN\PS2_0093.awd",
+    0xF67C958AFAE2B4D9: r"SB_AGD\90_119\SPANISH\PS2_0101.agd",
+    0xF680503360053B62: r"SB_AWD\60_89\SPANISH\PS2_0079.awd",
+    0xF68B565E29CA8AD3: r"SB_AGD\0_29\ITALIAN\NGC_0017.agd",
+    0xF6909712F3FC5E54: r"SB_AWD\90_119\ENGLISH\PS2_0108.awd",
+    0xF698B33626E28DC2: r"LEVELS\L_3_5_C\SECTIONS\s_9.rws",
+    0xF69E72B36E81A98B: r"SB_AWD\150_179\ITALIAN\NGC_0172.awd",
+    0xF6A8033C09C9BFDF: r"SB_AWD\60_89\GERMAN\NGC_0073.awd",
+    0xF6B76C961AF32248: r"SB_AGD\150_179\SPANISH\XBX_0151.agd",
+    0xF6C0D6DD1E931E91: r"SB_AGD\90_119\ITALIAN\XBX_0106.agd",
+    0xF6C9026103392351: r"gui_map2_death.index",
+    0xF6D26C6908620DF7: r"SB_AGD\150_179\ITALIAN\NGC_0176.agd",
+    0xF6D30CF657EC0A8B: r"SB_AGD\30_59\FRENCH\XBX_0040.agd",
+    0xF6E2963548ED8C9D: r"AUDIO\ENGLISH\XBX_4m1.rws",
+    0xF6E706CBF91D70E7: r"SB_AWD\120_149\SPANISH\PS2_0142.awd",
+    0xF6E82426B70DEE4F: r"SB_AGD\150_179\GERMAN\PS2_0166.agd",
+    0xF6E8CBDEEB6DB234: r"SB_AWD\120_149\GERMAN\NGC_0120.awd",
+    0xF6ED7C5D7EE4AD90: r"SB_AWD\180_209\ITALIAN\XBX_0206.awd",
+    0xF6EE88306BC8DBA4: r"SB_AGD\210_239\FRENCH\XBX_0230.agd",
+    0xF6F8CD6DB7E2C798: r"SB_AGD\180_209\ITALIAN\PS2_0191.agd",
+    0xF6FB8FA684F37D25: r"SB_AWD\120_149\SPANISH\NGC_0149.awd",
+    0xF7055F50F08D9B9B: r"SB_AWD\240_269\GERMAN\XBX_0257.awd",
+    0xF7058617AA2FF898: r"ANIMGRPS\Lvl_31\Lvl_31O.ads",
+    0xF70B9F012CBAA5A6: r"SB_AWD\30_59\ENGLISH\PS2_0033.awd",
+    0xF70C747DA968700E: r"SB_AGD\30_59\GERMAN\XBX_0032.agd",
+    0xF71695DFEF8BE6D7: r"SB_AWD\150_179\SPANISH\PS2_0164.awd",
+    0xF7188A29BCC80675: r"SB_AGD\150_179\ENGLISH\PS2_0175.agd",
+    0xF71CC4C3385C4A48: r"SB_AGD\210_239\FRENCH\PS2_0224.agd",
+    0xF71EC4B074554CDF: r"SB_AWD\90_119\GERMAN\PS2_0095.awd",
+    0xF72D7671123252F6: r"SB_AWD\0_29\FRENCH\NGC_0023.awd",
+    0xF732705F444F69BB: r"SB_AGD\120_149\FRENCH\NGC_0143.agd",
+    0xF73492A23920B5F5: r"SB_AWD\150_179\ENGLISH\PS2_0175.awd",
+    0xF737310E2AB972B6: r"SB_AGD\180_209\FRENCH\XBX_0196.agd",
+    0xF74B756AC861A261: r"SB_AWD\30_59\SPANISH\XBX_0059.awd",
+    0xF74D42C5189A68A5: r"SB_AWD\150_179\ITALIAN\NGC_0170.awd",
+    0xF74EF25F52DA87F9: r"SB_AWD\30_59\FRENCH\NGC_0039.awd",
+    0xF75046A0F136ECD5: r"AUDIO\FRENCH\XBX_2s1.rws",
+    0xF75AA95EC102CA9F: r"SB_AWD\120_149\GERMAN\NGC_0149.awd",
+    0xF75AFFFF7320D017: r"SB_AGD\60_89\FRENCH\PS2_0067.agd",
+    0xF75CD38EE448C47E: r"SB_AWD\210_239\GERMAN\NGC_0221.awd",
+    0xF75FB16386CD0481: r"SB_AWD\60_89\FRENCH\NGC_0086.awd",
+    0xF76912B490CB1B80: r"SB_AGD\150_179\FRENCH\NGC_0153.agd",
+    0xF76E7B539B88DBA3: r"SB_AWD\0_29\SPANISH\PS2_0001.awd",
+    0xF77263D31840A603: r"LOC\US\GUI.LOC",
+    0xF780FB426230EAE6: r"SB_AWD\240_269\ITALIAN\XBX_0261.awd",
+    0xF78C0A7FE4206F46: r"SB_AGD\120_149\GERMAN\PS2_0138.agd",
+    0xF79488A2749F7750: r"SB_AGD\90_119\GERMAN\NGC_0105.agd",
+    0xF79622946F65225D: r"SB_AWD\30_59\FRENCH\NGC_0044.awd",
+    0xF7981560DE6E89F7: r"SB_AGD\180_209\ENGLISH\NGC_0184.agd",
+    0xF79B7077BD0A7EFE: r"SB_AGD\120_149\ENGLISH\NGC_0133.agd",
+    0xF7A18399E1042C96: r"SB_AWD\180_209\GERMAN\PS2_0203.awd",
+    0xF7A21DD387726D07: r"SB_AWD\180_209\GERMAN\XBX_0199.awd",
+    0xF7AB01A9A479AFEA: r"ANIMGRPS\Lvl_35\Lvl_35U.ads",
+    0xF7AC0C4470DFD31A: r"SB_AGD\30_59\ENGLISH\NGC_0058.agd",
+    0xF7B443D1DC7A7E33: r"SB_AWD\210_239\ITALIAN\XBX_0211.awd",
+    0xF7B4DA295449987A: r"ANIMGRPS\Lvl_31\Lvl_31M.ads",
+    0xF7BEB376F3B5A430: r"LEVELS\L_3_5_C\SECTIONS\s_27.rws",
+    0xF7C1A47B3D8666F1: r"SB_AWD\30_59\FRENCH\XBX_0059.awd",
+    0xF7CC73D6E4324676: r"SB_AGD\240_269\ITALIAN\NGC_0245.agd",
+    0xF7CE9C8B4BFFDD36: r"AUDIO\FRENCH\XBX_4m2.rws",
+    0xF7DDDAE3FB663314: r"AUDIO\GERMAN\XBX_4m2.rws",
+    0xF7E33B21DF40E791: r"LEVELS\MP_4\SECTIONS\s_2.rws",
+    0xF7E425AAB31B363E: r"SB_AGD\240_269\ENGLISH\PS2_0253.agd",
+    0xF7E6811FD4D30BC0: r"SB_AGD\180_209\FRENCH\XBX_0194.agd",
+    0xF7EF1480EA2A0C6F: r"LEVELS\L_1_3_B\SECTIONS\s_21.rws",
+    0xF7F8141736A870FB: r"AUDIO\ITALIAN\XBX_1m2.rws",
+    0xF7FE513A88C9E22C: r"SB_AWD\120_149\ITALIAN\PS2_0130.awd",
+    0xF80167722255C97E: r"SB_AWD\30_59\ITALIAN\XBX_0041.awd",
+    0xF804FFA4AF8DEAA1: r"SB_AGD\90_119\FRENCH\PS2_0110.agd",
+    0xF807B4C6B3C5886E: r"SB_AGD\30_59\SPANISH\XBX_0049.agd",
+    0xF80A82FE11600F03: r"gui_map7_ctf.index",
+    0xF8141B283D616B68: r"SB_AWD\240_269\ITALIAN\NGC_0258.awd",
+    0xF81B282592D98DF9: r"SB_AWD\120_149\ENGLISH\PS2_0148.awd",
+    0xF822524430F13D6A: r"SB_AGD\150_179\GERMAN\XBX_0168.agd",
+    0xF8266A9DAEC7EE47: r"SB_AGD\90_119\GERMAN\NGC_0111.agd",
+    0xF82911F48FCFBFB4: r"SB_AGD\210_239\ENGLISH\NGC_0221.agd",
+    0xF82A40D5872E2EE7: r"SB_AWD\60_89\ITALIAN\NGC_0062.awd",
+    0xF82ED118F6EC1C9B: r"SB_AGD\120_149\SPANISH\XBX_0130.agd",
+    0xF8304B540C4A8370: r"SB_AWD\240_269\ITALIAN\XBX_0263.awd",
+    0xF83F750D107627D0: r"LEVELS\L_3_1_C\SECTIONS\s_3.rws",
+    0xF8431A44E5DFFA3F: r"SB_AWD\60_89\SPANISH\XBX_0077.awd",
+    0xF84CEE54B8D82D90: r"SB_AGD\150_179\SPANISH\PS2_0163.agd",
+    0xF8519241B66F091F: r"SB_AWD\120_149\GERMAN\PS2_0126.awd",
+    0xF856371F3C2C6FB9: r"SB_AGD\30_59\FRENCH\NGC_0039.agd",
+    0xF8626DAC67C09E38: r"SB_AWD\120_149\ITALIAN\NGC_0139.awd",
+    0xF86528AE8DE7955F: r"SB_AWD\90_119\ENGLISH\NGC_0098.awd",
+    0xF8656CBA22C40016: r"SB_AWD\150_179\GERMAN\PS2_0178.awd",
+    0xF869F8B9FB4738E4: r"SB_AWD\30_59\ENGLISH\XBX_0047.awd",
+    0xF86C21ACEE0ACC33: r"SB_AWD\210_239\GERMAN\PS2_0214.awd",
+    0xF870748CE79F2583: r"SB_AWD\30_59\FRENCH\XBX_0057.awd",
+    0xF873D632B2896EE0: r"LEVELS\L_1_2\SECTIONS\s_11.rws",
+    0xF8872293326298D9: r"SB_AWD\240_269\SPANISH\PS2_0269.awd",
+    0xF89B6D201EF34C34: r"SB_AWD\180_209\GERMAN\XBX_0202.awd",
+    0xF8AEEC248548B972: r"SB_AGD\150_179\ENGLISH\PS2_0154.agd",
+    0xF8BF9B7458BF5B6E: r"SB_AWD\150_179\FRENCH\NGC_0160.awd",
+    0xF8D1736F2BCCD5E0: r"SB_AWD\120_149\FRENCH\NGC_0131.awd",
+    0xF8E1EE3E7D0CEBC0: r"SB_AWD\210_239\GERMAN\XBX_0221.awd",
+    0xF8E3B68C19997EE6: r"SB_AWD\0_29\FRENCH\NGC_0016.awd",
+    0xF8E65B1A4FFF432A: r"SB_AWD\120_149\ITALIAN\XBX_0140.awd",
+    0xF8F146B18A413256: r"SB_AGD\120_149\SPANISH\PS2_0121.agd",
+    0xF8F25A568FF97799: r"SB_AWD\60_89\SPANISH\XBX_0075.awd",
+    0xF8F71E5DC02F3FFB: r"SB_AGD\0_29\GERMAN\XBX_0000.agd",
+    0xF90D25E3C8737C77: r"SB_AGD\240_269\ITALIAN\NGC_0257.agd",
+    0xF918AE12BC684BB0: r"SB_AGD\180_209\GERMAN\NGC_0200.agd",
+    0xF918CD73C1B2BA64: r"SB_AGD\240_269\GERMAN\XBX_0258.agd",
+    0xF926F0E5EB5F1C0E: r"SB_AWD\0_29\ENGLISH\XBX_0021.awd",
+    0xF934DD0803765E25: r"SB_AGD\30_59\FRENCH\XBX_0042.agd",
+    0xF93A665CFCEBA461: r"SB_AWD\180_209\GERMAN\PS2_0194.awd",
+    0xF93E64AFEB19EB1F: r"ANIMGRPS\Lvl_32\Lvl_32F.ads",
+    0xF94196FC55BC3E9B: r"LEVELS\L_1_5\SECTIONS\s_8.rws",
+    0xF94F182A66D0475A: r"SB_AWD\60_89\FRENCH\PS2_0084.awd",
+    0xF94FAC6F2A6FA4C2: r"SB_AWD\180_209\ITALIAN\XBX_0200.awd",
+    0xF953EA9B717E91BB: r"SB_AGD\210_239\ITALIAN\XBX_0219.agd",
+    0xF95824DE47258EC1: r"SB_AGD\180_209\GERMAN\NGC_0199.agd",
+    0xF95BE600785C9529: r"gui_map5_ctf.index",
+    0xF96446542A9E49E0: r"SB_AWD\30_59\SPANISH\PS2_0048.awd",
+    0xF965E4A0B1C99B36: r"SB_AWD\120_149\FRENCH\XBX_0126.awd",
+    0xF9682F629C19A235: r"SB_AWD\240_269\GERMAN\XBX_0255.awd",
+    0xF96A301A33A0E61D: r"SB_AWD\210_239\SPANISH\NGC_0219.awd",
+    0xF96EAA7733058E35: r"SB_AGD\30_59\GERMAN\XBX_0048.agd",
+    0xF97AA206F46BEB53: r"SB_AGD\30_59\FRENCH\PS2_0054.agd",
+    0xF98506A8DFC6CC01: r"CodBack.txd",
+    0xF98CCBB255E2322A: r"SB_AGD\90_119\GERMAN\XBX_0093.agd",
+    0xF990DE502725E0B2: r"SB_AWD\210_239\GERMAN\XBX_0227.awd",
+    0xF99278A93F35EE7A: r"gui_map6_destroy.dds",
+    0xF992F3C96F3337EE: r"SB_AGD\0_29\SPANISH\XBX_0003.agd",
+    0xF993069DC3B31770: r"SB_AWD\0_29\FRENCH\NGC_0014.awd",
+    0xF99350918EDF8ECF: r"SB_AWD\180_209\ENGLISH\NGC_0193.awd",
+    0xF994517C7511EDFF: r"SB_AWD\150_179\GERMAN\XBX_0169.awd",
+    0xF9B545E19632B566: r"ANIMGRPS\Lvl_26\Lvl_26U.ads",
+    0xF9B6E78D29BBAEAE: r"SB_AWD\30_59\ITALIAN\XBX_0034.awd",
+    0xF9BBFAA8DFF5FA02: r"CodBack.dds",
+    0xF9C436AC4304D6CB: r"SB_AWD\60_89\ITALIAN\PS2_0081.awd",
+    0xF9C79A15BA693CD6: r"SB_AGD\30_59\ITALIAN\NGC_0054.agd",
+    0xF9C974A93F652989: r"gui_map6_destroy.txd",
+    0xF9CF794B511FD608: r"ANIMGRPS\Lvl_21\Lvl_21E.ads",
+    0xF9CFCA573C10FDE2: r"SB_AGD\0_29\GERMAN\PS2_0011.agd",
+    0xF9CFF61902ACE3E9: r"AUDIO\FRENCH\NGC_2s3.rws",
+    0xF9D0EAE2054F5AC9: r"SB_AGD\240_269\FRENCH\PS2_0269.agd",
+    0xF9D3CC323A688631: r"SB_AGD\60_89\GERMAN\PS2_0067.agd",
+    0xF9E27DE8F582023B: r"SB_AWD\60_89\FRENCH\XBX_0064.awd",
+    0xF9ECA1A1F51D85FF: r"SB_AGD\150_179\GERMAN\NGC_0163.agd",
+    0xF9F893D96E602321: r"LEVELS\L_1_2_B\SECTIONS\s_2.rws",
+    0xFA0353AB8C8E8020: r"SB_AWD\180_209\GERMAN\PS2_0201.awd",
+    0xFA05514944C929D1: r"SB_AGD\0_29\SPANISH\XBX_0026.agd",
+    0xFA06F4EFF13E4DD3: r"SB_AGD\180_209\GERMAN\NGC_0197.agd",
+    0xFA10FC71225F8844: r"SB_AGD\30_59\ENGLISH\NGC_0049.agd",
+    0xFA15E053551152F7: r"SB_AWD\120_149\SPANISH\XBX_0141.awd",
+    0xFA173B6AB353233F: r"SB_AWD\120_149\SPANISH\PS2_0133.awd",
+    0xFA17C56925995F9E: r"SB_AWD\240_269\SPANISH\NGC_0245.awd",
+    0xFA1F38D502ACB1D4: r"SB_AWD\30_59\ENGLISH\XBX_0032.awd",
+    0xFA230251EFD1160D: r"SB_AWD\60_89\SPANISH\PS2_0061.awd",
+    0xFA245F0F05893725: r"SB_AWD\90_119\SPANISH\NGC_0108.awd",
+    0xFA246898FDDAB4E7: r"SB_AWD\0_29\FRENCH\NGC_0026.awd",
+    0xFA295177C37FE4DA: r"SB_AWD\60_89\ENGLISH\PS2_0079.awd",
+    0xFA3B9BC3FFFAF1C4: r"SB_AGD\90_119\GERMAN\XBX_0091.agd",
+    0xFA42C3DB194DA9F8: r"SB_AGD\0_29\SPANISH\XBX_0001.agd",
+    0xFA459CF0C50997EB: r"SB_AGD\180_209\GERMAN\PS2_0181.agd",
+    0xFA4A683FB59A30F8: r"SB_AWD\60_89\FRENCH\XBX_0081.awd",
+    0xFA4B6C9BE6ACC88E: r"SB_AWD\240_269\ENGLISH\XBX_0269.awd",
+    0xFA5376541695614A: r"AUDIO\GERMAN\XBX_4s2.rws",
+    0xFA5FA506CA25D286: r"SB_AWD\210_239\ITALIAN\NGC_0234.awd",
+    0xFA6388CEF2E89D90: r"SB_AWD\0_29\GERMAN\NGC_0016.awd",
+    0xFA65610F30EAD71E: r"SB_AWD\210_239\FRENCH\NGC_0212.awd",
+    0xFA65D79ED3D4A418: r"SB_AWD\30_59\ITALIAN\XBX_0036.awd",
+    0xFA69D490279E1B83: r"SB_AWD\150_179\GERMAN\NGC_0152.awd",
+    0xFA6A0FC2FA23D3A0: r"AUDIO\ENGLISH\PS2_2s1.rws",
+    0xFA793626A690CEFE: r"SB_AGD\180_209\FRENCH\XBX_0202.agd",
+    0xFA88193812711E2A: r"SB_AGD\0_29\GERMAN\NGC_0021.agd",
+    0xFA8BA356064C95FA: r"AUDIO\GERMAN\XBX_1m1.rws",
+    0xFA8CF04726C31A9F: r"SB_AGD\180_209\FRENCH\PS2_0194.agd",
+    0xFA8F2FF7020A1C6E: r"layout.layout",
+    0xFA927AFA72FB7554: r"SB_AWD\0_29\FRENCH\XBX_0027.awd",
+    0xFA9A014558922BFC: r"SB_AGD\0_29\ENGLISH\XBX_0016.agd",
+    0xFA9E02B70ED93BFA: r"SB_AGD\180_209\GERMAN\XBX_0183.agd",
+    0xFAA9C57FB6033E22: r"SB_AGD\210_239\FRENCH\NGC_0230.agd",
+    0xFAAD863050823DA7: r"LEVELS\L_1_3_A\SECTIONS\s_22.rws",
+    0xFAB4A15AEEE2C263: r"SB_AGD\0_29\SPANISH\XBX_0028.agd",
+    0xFAB50F27A9CDD1BF: r"gui_map10_ctf.index",
+    0xFABCC8C28A372CAC: r"SB_AGD\60_89\ITALIAN\NGC_0061.agd",
+    0xFAC67B7C5D6CA099: r"SB_AWD\120_149\SPANISH\PS2_0131.awd",
+    0xFAC7757ACFB39BC8: r"SB_AWD\240_269\SPANISH\NGC_0247.awd",
+    0xFACA136FEA43E381: r"SB_AGD\120_149\ENGLISH\PS2_0126.agd",
+    0xFACACFC0CE55E2D3: r"SB_AGD\60_89\GERMAN\XBX_0080.agd",
+    0xFAD3A81AA9BB39FD: r"SB_AGD\240_269\ITALIAN\XBX_0253.agd",
+    0xFAD626EECB8FE023: r"SB_AGD\90_119\ITALIAN\XBX_0108.agd",
+    0xFADBD5EECAC067D1: r"SB_AWD\210_239\ENGLISH\PS2_0214.awd",
+    0xFAF11F06E4537D4B: r"SB_AGD\180_209\ITALIAN\PS2_0189.agd",
+    0xFAFD8438640ACA89: r"SB_AGD\150_179\GERMAN\PS2_0164.agd",
+    0xFB015E20288C67FE: r"SHELL\LOAD\MP_4_CTF.txd",
+    0xFB091A76CB0CA2CC: r"SB_AGD\60_89\ITALIAN\XBX_0085.agd",
+    0xFB151120DB051348: r"SB_AWD\210_239\FRENCH\NGC_0210.awd",
+    0xFB1B24BBB92F1426: r"SB_AWD\120_149\FRENCH\XBX_0139.awd",
+    0xFB20EF12D9B76730: r"SB_AWD\30_59\ENGLISH\PS2_0031.awd",
+    0xFB21E56642A78531: r"SB_AWD\210_239\ENGLISH\XBX_0231.awd",
+    0xFB2D30C807EE10FA: r"gui_map2_ctf.txd",
+    0xFB2EBCB2CFBB0510: r"SB_AGD\0_29\GERMAN\XBX_0029.agd",
+    0xFB36506D79DD4887: r"SB_AGD\60_89\ITALIAN\XBX_0068.agd",
+    0xFB36E949BC89DDC4: r"SB_AGD\0_29\GERMAN\NGC_0023.agd",
+    0xFB3B4D19C64EB91C: r"SB_AGD\90_119\FRENCH\NGC_0103.agd",
+    0xFB3C739790FCDEF1: r"SB_AWD\120_149\ITALIAN\PS2_0148.awd",
+    0xFB46A04356828DC5: r"SB_AWD\180_209\ENGLISH\PS2_0200.awd",
+    0xFB46DE6B2E8CA062: r"SB_AWD\210_239\GERMAN\XBX_0212.awd",
+    0xFB4F130C5CC9C702: r"AUDIO\ENGLISH\PS2_2m1.rws",
+    0xFB535EDE09268DEF: r"ANIMGRPS\Lvl_22\Lvl_22P.ads",
+    0xFB5977E1B08B096F: r"SB_AWD\30_59\GERMAN\XBX_0055.awd",
+    0xFB5A254BDD6D115F: r"ANIMGRPS\Lvl_12\Lvl_12B.ads",
+    0xFB60C57C755E63F3: r"SB_AWD\30_59\SPANISH\XBX_0057.awd",
+    0xFB631CC8081B7E61: r"gui_map2_ctf.dds",
+    0xFB6E34F233074498: r"SB_AGD\210_239\ITALIAN\XBX_0234.agd",
+    0xFB70AFBC040E3BB8: r"LEVELS\L_3_1\SECTIONS\s_1.rws",
+    0xFB70D697484196FC: r"SB_AWD\0_29\ENGLISH\PS2_0020.awd",
+    0xFB7CF3BAD2979557: r"SB_AWD\0_29\FRENCH\PS2_0016.awd",
+    0xFB7D0FE0CFE33C26: r"ANIMGRPS\Lvl_11\Lvl_11M.ads",
+    0xFB8631F81DE2E87B: r"SB_AGD\0_29\ENGLISH\PS2_0012.agd",
+    0xFB89EC4D41CF7C41: r"SB_AGD\60_89\GERMAN\PS2_0074.agd",
+    0xFB8B6D2DD2129902: r"ScoreBoard.layout",
+    0xFB8D1D49AC108DA0: r"SB_AGD\0_29\ITALIAN\XBX_0023.agd",
+    0xFB929131CF66EA7D: r"SB_AWD\180_209\ENGLISH\XBX_0197.awd",
+    0xFB92E8A4592CFDA5: r"LEVELS\L_1_5\SECTIONS\s_22.rws",
+    0xFBA1EE6F432CE20A: r"SB_AWD\210_239\SPANISH\NGC_0230.awd",
+    0xFBB3CF419D93AF0C: r"SB_AGD\60_89\GERMAN\NGC_0089.agd",
+    0xFBBAE59AEEF07098: r"SHELL\DNAS_SCEE.REL",
+    0xFBBD855C344880F6: r"ANIMGRPS\Lvl_26\Lvl_26E.ads",
+    0xFBC316BE0491FA74: r"SB_AGD\210_239\GERMAN\NGC_0227.agd",
+    0xFBC8B680DC1D2482: r"SB_AWD\30_59\SPANISH\PS2_0059.awd",
+    0xFBD16AD276BBF300: r"SB_AWD\180_209\SPANISH\PS2_0199.awd",
+    0xFBD1CA12A0D68B1F: r"SB_AGD\30_59\SPANISH\PS2_0036.agd",
+    0xFBD73641FB03D5B1: r"LEVELS\L_1_3_A\SECTIONS\s_20.rws",
+    0xFBD800E4E8BCEA46: r"SB_AWD\150_179\ITALIAN\NGC_0159.awd",
+    0xFBD9B8312B7D53A2: r"SB_AWD\60_89\GERMAN\XBX_0070.awd",
+    0xFBDB6D731CCDF352: r"gui_map9_destroy.index",
+    0xFBE1C3E8912F0780: r"SB_AGD\240_269\ITALIAN\NGC_0247.agd",
+    0xFBEAC3CE445ECA44: r"SB_AWD\150_179\SPANISH\XBX_0160.awd",
+    0xFBEB43A93B159D83: r"SB_AWD\120_149\ITALIAN\PS2_0146.awd",
+    0xFBEF41ADEFC7F3D6: r"SB_AWD\0_29\FRENCH\PS2_0026.awd",
+    0xFBF957B35B6B492C: r"ANIMGRPS\Lvl_25\Lvl_25I.ads",
+    0xFBFACA7EAB34E0AF: r"SB_AWD\150_179\SPANISH\PS2_0155.awd",
+    0xFC06656FBE2783BD: r"LEVELS\L_3_5_C\SECTIONS\s_6.rws",
+    0xFC0DD032B78ED907: r"SB_AGD\180_209\ITALIAN\NGC_0193.agd",
+    0xFC2692D6AFC666EF: r"LEVELS\L_2_1\SECTIONS\s_9.rws",
+    0xFC2721272612CA9F: r"SB_AGD\90_119\GERMAN\XBX_0117.agd",
+    0xFC2ECD0B4CB29ED2: r"SB_AGD\180_209\ENGLISH\PS2_0184.agd",
+    0xFC35C2277E5BA204: r"SB_AWD\90_119\SPANISH\PS2_0092.awd",
+    0xFC39975C77AD5763: r"ANIMGRPS\Lvl_36\Lvl_36B.ads",
+    0xFC3E91F1AC9C410C: r"SB_AWD\210_239\ITALIAN\XBX_0238.awd",
+    0xFC416143797FA90F: r"SB_AWD\180_209\ENGLISH\XBX_0191.awd",
+    0xFC44A12AA3E9B7B5: r"SB_AGD\120_149\SPANISH\XBX_0132.agd",
+    0xFC44B4DC2E78EC19: r"SB_AGD\210_239\ITALIAN\NGC_0228.agd",
+    0xFC4BACF587CDA92F: r"SHELL\MOVIES\3_3_Mon.bik",
+    0xFC54A88D02DEF69C: r"SB_AGD\210_239\SPANISH\NGC_0214.agd",
+    0xFC5BD6C89D704A27: r"SB_AWD\120_149\FRENCH\XBX_0123.awd",
+    0xFC61C38EFEBA36BA: r"SB_AGD\90_119\GERMAN\PS2_0106.agd",
+    0xFC6F5BBDBD079236: r"SB_AWD\240_269\GERMAN\NGC_0250.awd",
+    0xFC7CE5C13B515004: r"AUDIO\FRENCH\PS2_1s2.rws",
+    0xFC7D9FFF07029FCB: r"SB_AWD\180_209\FRENCH\XBX_0188.awd",
+    0xFC7EAFCDAE77E142: r"LEVELS\L_3_1\SECTIONS\s_7.rws",
+    0xFC801E25D4BF3786: r"SB_AGD\180_209\ITALIAN\NGC_0189.agd",
+    0xFC89E7B434300F55: r"ANIMGRPS\MPA_00\MPA_00US.ads",
+    0xFC89F6441268266F: r"SB_AWD\60_89\GERMAN\PS2_0087.awd",
+    0xFC8F56D7145267F3: r"ANIMGRPS\Lvl_36\Lvl_36R.ads",
+    0xFC90DB0DA06278C3: r"SB_AGD\210_239\SPANISH\NGC_0226.agd",
+    0xFC9577CEAA455EDF: r"SB_AGD\210_239\ITALIAN\PS2_0216.agd",
+    0xFCA8606B2BA5A28C: r"SB_AGD\180_209\SPANISH\NGC_0190.agd",
+    0xFCAD93B154B24745: r"SB_AGD\60_89\SPANISH\XBX_0080.agd",
+    0xFCAE53C717903EC9: r"CurrentVoteMap.layout",
+    0xFCB0BF82D89D68B1: r"SB_AWD\90_119\FRENCH\XBX_0117.awd",
+    0xFCB4DF72DCD13247: r"w_weaponsRU.dds",
+    0xFCB90214EB59CF9A: r"SB_AWD\120_149\SPANISH\NGC_0137.awd",
+    0xFCBC65A805BCA10A: r"LEVELS\L_3_5\SECTIONS\s_16.rws",
+    0xFCC5B8E09E7394C2: r"SB_AWD\0_29\GERMAN\NGC_0010.awd",
+    0xFCD58B8605BD2CD8: r"SB_AWD\150_179\FRENCH\NGC_0162.awd",
+    0xFCDFDCC1955EDF1E: r"SB_AWD\240_269\ENGLISH\PS2_0253.awd",
+    0xFCE0E53F0C4ED5AA: r"SB_AGD\30_59\FRENCH\NGC_0050.agd",
+    0xFCE799716A699BAE: r"SB_AGD\0_29\FRENCH\NGC_0001.agd",
+    0xFCE868444E5B8AFA: r"SB_AWD\150_179\ITALIAN\XBX_0175.awd",
+    0xFCEA89A367E6C3F1: r"SB_AGD\180_209\FRENCH\NGC_0197.agd",
+    0xFCEBC372DD0044B4: r"w_weaponsRU.txd",
+    0xFCEFD058D24F3CD9: r"SB_AGD\180_209\FRENCH\PS2_0196.agd",
+    0xFCF8157B493C0797: r"SB_AWD\210_239\SPANISH\XBX_0215.awd",
+    0xFCFB8B2BFCFBCEE4: r"SB_AWD\120_149\ITALIAN\XBX_0142.awd",
+    0xFCFFC823534B7292: r"SB_AWD\180_209\SPANISH\NGC_0192.awd",
+    0xFD1113A0A8D3CFD4: r"SB_AGD\90_119\GERMAN\PS2_0104.agd",
+    0xFD141825288EC2CE: r"SB_AGD\60_89\SPANISH\PS2_0062.agd",
+    0xFD1AB094BC3684A6: r"SB_AGD\240_269\GERMAN\PS2_0242.agd",
+    0xFD2BD393B6C28060: r"SB_AGD\30_59\SPANISH\PS2_0048.agd",
+    0xFD2E7E246965E742: r"SB_AGD\180_209\GERMAN\NGC_0206.agd",
+    0xFD2F3BF110C87F2E: r"SB_AGD\210_239\FRENCH\XBX_0210.agd",
+    0xFD37975820F02150: r"SB_AWD\30_59\FRENCH\PS2_0039.awd",
+    0xFD4A741025818839: r"SB_AWD\120_149\SPANISH\NGC_0127.awd",
+    0xFD56EE8A4A91EE3A: r"SB_AWD\210_239\SPANISH\NGC_0223.awd",
+    0xFD56FAAC98834CE0: r"SB_AGD\120_149\GERMAN\PS2_0129.agd",
+    0xFD5C63C2FECB0657: r"SB_AGD\60_89\SPANISH\XBX_0086.agd",
+    0xFD5E5C109A2D48CD: r"SB_AGD\240_269\ITALIAN\PS2_0250.agd",
+    0xFD6257A33FF5DCD1: r"LEVELS\L_3_5\SECTIONS\s_28.rws",
+    0xFD65123E47FFA9B8: r"AUDIO\ENGLISH\XBX_1m1.rws",
+    0xFD6700C9DB221964: r"LEVELS\L_1_3_A\SECTIONS\s_9.rws",
+    0xFD6B015380A158F6: r"SB_AGD\90_119\ITALIAN\PS2_0111.agd",
+    0xFD72DC75CBDD7BAD: r"SB_AGD\0_29\GERMAN\PS2_0009.agd",
+    0xFD81F857BADCD2A5: r"SB_AWD\60_89\ITALIAN\XBX_0079.awd",
+    0xFD82A42130259862: r"SB_AGD\210_239\ENGLISH\XBX_0232.agd",
+    0xFD8F8CD33F791B48: r"SB_AWD\240_269\ENGLISH\PS2_0251.awd",
+    0xFD8FB550B6679544: r"SB_AGD\30_59\FRENCH\NGC_0052.agd",
+    0xFD92ED64296883EA: r"LEVELS\L_1_3_B\SECTIONS\s_2.rws",
+    0xFD975855F8748074: r"SB_AWD\150_179\ITALIAN\XBX_0177.awd",
+    0xFDA43D85E53EDA13: r"LEVELS\L_1_3_B\global.dff",
+    0xFDA7B51385FD926E: r"SB_AWD\180_209\GERMAN\NGC_0189.awd",
+    0xFDBC65A8B1CAF6CE: r"SB_AGD\30_59\ITALIAN\XBX_0034.agd",
+    0xFDBC77F35C176109: r"SB_AWD\30_59\GERMAN\XBX_0057.awd",
+    0xFDC5A801032EE718: r"ANIMGRPS\Lvl_15\Lvl_15K.ads",
+    0xFDD225F02ECE3B64: r"SB_AGD\60_89\SPANISH\XBX_0074.agd",
+    0xFDD88F28F57603CE: r"SB_AWD\60_89\ENGLISH\NGC_0074.awd",
+    0xFDDA06BDF00271E5: r"SB_AWD\60_89\ITALIAN\PS2_0083.awd",
+    0xFDEF08B0F886DC11: r"SB_AGD\0_29\FRENCH\XBX_0004.agd",
+    0xFDEF6D5B579BBAB2: r"SB_AGD\0_29\ITALIAN\XBX_0025.agd",
+    0xFDF7A15E80E6D57F: r"SB_AWD\180_209\ENGLISH\XBX_0182.awd",
+    0xFDFA4145AB4FD445: r"SB_AGD\120_149\SPANISH\XBX_0147.agd",
+    0xFE008B463433B1FD: r"SB_AWD\240_269\ITALIAN\PS2_0243.awd",
+    0xFE0A60761E45D58F: r"SB_AGD\150_179\GERMAN\XBX_0150.agd",
+    0xFE0CA821A91C1839: r"SB_AGD\150_179\ENGLISH\XBX_0176.agd",
+    0xFE14AEDF115870A1: r"SB_AGD\180_209\SPANISH\XBX_0180.agd",
+    0xFE18D5A9118C6A3F: r"SB_AGD\120_149\GERMAN\NGC_0149.agd",
+    0xFE1EA9F0109B311A: r"AUDIO\FRENCH\PS2_4m3.rws",
+    0xFE20630AA19BFCC6: r"SB_AGD\150_179\ENGLISH\NGC_0160.agd",
+    0xFE249BD8C46D0B26: r"SB_AWD\240_269\GERMAN\NGC_0243.awd",
+    0xFE299607E7098492: r"SB_AWD\180_209\SPANISH\XBX_0183.awd",
+    0xFE307CE6D7271410: r"SB_AWD\150_179\GERMAN\PS2_0169.awd",
+    0xFE32CDE808F9270B: r"SB_AGD\0_29\ENGLISH\PS2_0027.agd",
+    0xFE34AA244C62AD59: r"SB_AGD\30_59\SPANISH\PS2_0034.agd",
+    0xFE3852639CCDD79F: r"SB_AWD\60_89\SPANISH\PS2_0067.awd",
+    0xFE38986A9C0B0016: r"SB_AGD\180_209\FRENCH\NGC_0200.agd",
+    0xFE3B157445BE5EAB: r"SB_AGD\0_29\SPANISH\XBX_0019.agd",
+    0xFE4576A1C913D457: r"SB_AWD\0_29\ENGLISH\XBX_0015.awd",
+    0xFE5211BF9B53FA60: r"SB_AWD\0_29\FRENCH\PS2_0024.awd",
+    0xFE55A6E5651C7DBF: r"ANIMGRPS\Lvl_13\Lvl_13P.ads",
+    0xFE5CCA9056BF8649: r"SB_AWD\150_179\SPANISH\PS2_0157.awd",
+    0xFE61FB92D6D848E6: r"SB_AGD\90_119\FRENCH\XBX_0110.agd",
+    0xFE6DED41ECDEFF6D: r"SB_AWD\0_29\GERMAN\XBX_0015.awd",
+    0xFE7483938AC8433A: r"SB_AGD\210_239\ENGLISH\PS2_0235.agd",
+    0xFE74FC12AD4886FA: r"ANIMGRPS\Lvl_15\Lvl_15I.ads",
+    0xFE75F0CD0559684D: r"SB_AGD\0_29\SPANISH\PS2_0010.agd",
+    0xFE7881296CC505C1: r"SB_AGD\240_269\ENGLISH\NGC_0255.agd",
+    0xFE79E064B51FE70A: r"SB_AWD\240_269\FRENCH\XBX_0265.awd",
+    0xFE7D2135122E36FC: r"LOC\US\PAUSED.LOC",
+    0xFE7D9555A650CB20: r"SB_AGD\90_119\ITALIAN\XBX_0091.agd",
+    0xFE86F3B40ADDE753: r"SB_AGD\0_29\ENGLISH\XBX_0020.agd",
+    0xFE8A0138D19EECD9: r"SB_AGD\90_119\GERMAN\XBX_0115.agd",
+    0xFE95E4A13FCC011E: r"LEVELS\L_3_1\SECTIONS\s_23.rws",
+    0xFE9D3060B2558C81: r"SB_AGD\240_269\ENGLISH\XBX_0266.agd",
+    0xFE9FA9BE6F4C0601: r"SB_AGD\180_209\FRENCH\NGC_0184.agd",
+    0xFEA9115755689357: r"SB_AGD\120_149\SPANISH\XBX_0141.agd",
+    0xFEAEE157058E2EBE: r"SB_AGD\0_29\ENGLISH\XBX_0018.agd",
+    0xFEAF5B57DE4C708F: r"SB_AWD\240_269\ITALIAN\PS2_0245.awd",
+    0xFEB352C8BBD5FD14: r"SB_AGD\180_209\GERMAN\XBX_0181.agd",
+    0xFEB7C494E64432D6: r"SB_AWD\0_29\ENGLISH\XBX_0003.awd",
+    0xFEB9C087C85F89C9: r"SB_AGD\150_179\GERMAN\XBX_0152.agd",
+    0xFEC3655EE281C248: r"SB_AGD\90_119\ITALIAN\XBX_0114.agd",
+    0xFEC733BBB03AC564: r"SB_AGD\90_119\GERMAN\PS2_0113.agd",
+    0xFEC9B8402FF4DEDE: r"SB_AGD\60_89\SPANISH\PS2_0075.agd",
+    0xFECEC30D694DCE96: r"SB_AWD\240_269\FRENCH\PS2_0253.awd",
+    0xFED0D0AFC39D7A36: r"SB_AGD\240_269\GERMAN\PS2_0255.agd",
+    0xFED4170FA1779350: r"SB_AGD\60_89\ITALIAN\PS2_0068.agd",
+    0xFEDAA264AD9345EF: r"SB_AWD\210_239\SPANISH\PS2_0234.awd",
+    0xFEDE5C5F2EFEFB1D: r"SB_AWD\180_209\GERMAN\NGC_0209.awd",
+    0xFEDFE38197417E93: r"SB_AGD\120_149\ENGLISH\PS2_0128.agd",
+    0xFEE0ABAC2E304F79: r"SB_AWD\210_239\FRENCH\XBX_0231.awd",
+    0xFEE99089BE587B0D: r"SB_AWD\210_239\GERMAN\XBX_0228.awd",
+    0xFEEC0E0DCA905CC0: r"SB_AWD\90_119\ENGLISH\XBX_0114.awd",
+    0xFEECF655BDF47E09: r"SB_AWD\60_89\GERMAN\PS2_0085.awd",
+    0xFEF1D0CC199004A9: r"SB_AGD\210_239\ITALIAN\NGC_0215.agd",
+    0xFEF757E055CFCD19: r"SB_AGD\210_239\ITALIAN\PS2_0214.agd",
+    0xFEFC0A116C6C5625: r"SHELL\FONTS\lta22.met",
+    0xFF0D62BA0775C87B: r"SB_AWD\210_239\FRENCH\NGC_0226.awd",
+    0xFF147FD9ABC735C6: r"SB_AWD\60_89\GERMAN\PS2_0060.awd",
+    0xFF1D0EDC9BF82E39: r"SB_AGD\150_179\FRENCH\PS2_0157.agd",
+    0xFF1F2E9ABA7B360E: r"SB_AGD\240_269\ENGLISH\XBX_0250.agd",
+    0xFF23D3A534E1DC54: r"SB_AGD\210_239\ENGLISH\PS2_0237.agd",
+    0xFF2584164E35782C: r"ANIMGRPS\Lvl_16\Lvl_16E.ads",
+    0xFF31278EF9D5D470: r"GameSpy.layout",
+    0xFF411C6CA396E16B: r"ANIMGRPS\Lvl_24\Lvl_24X.ads",
+    0xFF426422E3E32DD6: r"SB_AWD\0_29\GERMAN\PS2_0002.awd",
+    0xFF507D3A6D67B0B1: r"SB_AWD\120_149\GERMAN\NGC_0136.awd",
+    0xFF542FEBA460C886: r"SB_AGD\30_59\ENGLISH\PS2_0042.agd",
+    0xFF5B5055037E3F77: r"SB_AWD\180_209\ENGLISH\PS2_0206.awd",
+    0xFF654DE5A8AE4127: r"SB_AWD\240_269\GERMAN\NGC_0255.awd",
+    0xFF6B00F042664A29: r"SB_AGD\150_179\SPANISH\PS2_0157.agd",
+    0xFF70667497084A5F: r"ANIMGRPS\Lvl_31\Lvl_31T.ads",
+    0xFF7548343F337276: r"SB_AWD\60_89\SPANISH\NGC_0074.awd",
+    0xFF788851DA0D9DE8: r"SB_AGD\60_89\SPANISH\PS2_0077.agd",
+    0xFF7D4C8B7968BD23: r"SB_AWD\120_149\ENGLISH\NGC_0143.awd",
+    0xFF7E1579952BB493: r"SB_AWD\150_179\SPANISH\NGC_0172.awd",
+    0xFF8020C16DB71340: r"SB_AGD\240_269\GERMAN\PS2_0257.agd",
+    0xFF88667C05C7502C: r"SB_AWD\30_59\ITALIAN\PS2_0035.awd",
+    0xFF8E03057B6312B2: r"SB_AGD\90_119\SPANISH\PS2_0098.agd",
+    0xFF8EBBEB0BCE1C3C: r"SB_AWD\60_89\FRENCH\PS2_0064.awd",
+    0xFF91DD2A25082668: r"SB_AWD\180_209\SPANISH\NGC_0200.awd",
+    0xFF95DBE7403A3EFB: r"ANIMGRPS\Lvl_24\Lvl_24H.ads",
+    0xFF9AFE1F74A951B2: r"SB_AWD\90_119\ENGLISH\XBX_0112.awd",
+    0xFFA123EC76FE973A: r"SB_AGD\120_149\GERMAN\NGC_0122.agd",
+    0xFFA9FACADB6867BA: r"SB_AGD\0_29\GERMAN\PS2_0020.agd",
+    0xFFAB1B6902F4659C: r"SB_AWD\90_119\ITALIAN\XBX_0107.awd",
+    0xFFAD8E1AC53AA9AB: r"SB_AWD\240_269\GERMAN\NGC_0268.awd",
+    0xFFAFC2EAC89DC491: r"SB_AGD\210_239\GERMAN\PS2_0223.agd",
+    0xFFBB683CA765299A: r"SB_AWD\90_119\FRENCH\XBX_0099.awd",
+    0xFFC9AF534A9165CE: r"SB_AGD\60_89\GERMAN\NGC_0087.agd",
+    0xFFCF739B17EC5110: r"SB_AWD\210_239\SPANISH\XBX_0234.awd",
+    0xFFD7CCA27D5D30CF: r"SB_AGD\0_29\GERMAN\PS2_0018.agd",
+    0xFFD90956FDEE5C84: r"SB_AWD\120_149\FRENCH\PS2_0138.awd",
+    0xFFDBCC0212683DBB: r"SB_AGD\90_119\ENGLISH\XBX_0117.agd",
+    0xFFDE1EC93BC96B6C: r"SB_AWD\180_209\ENGLISH\PS2_0186.awd",
+    0xFFDE24BC46D4A80E: r"LEVELS\L_3_1\SECTIONS\s_16.rws",
+    0xFFE658C750309C66: r"ANIMGRPS\Lvl_32\Lvl_32K.ads",
+}
@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
-# Jak 3 & Jak X: Combat Racing VAGWAD/VAGDIR extract
-# Written by Edness   v1.4   2023-05-10 - 2023-06-25
+# Jak 3 & Jak X: Combat Racing VAGWAD/VAGDIR extract and rebuild
+# Written by Edness   v1.8   2023-05-10 - 2026-10-18
 
 # Usage:
 #   script.py  "X:\PATH\TO\VAGWAD.ENG"
 #
 # Optional:
 #   -o | --output   specify an output folder different from the input path folder
+#   -b | --build    rebuild the VAGWAD (and VAGDIR.AYB next to it) from a folder of .VAG files
 #
 #   script.py  "X:\PATH\TO\VAGWAD.INT"  -o "Y:\path\to\output\folder"
+#   script.py  "X:\PATH\TO\VAGWAD.INT"  -b "Y:\path\to\input\folder"
+#
+# Rebuilding updates the entries of that container in the existing VAGDIR.AYB,
+# the flags of the files already in it are kept.  All of the non-INT language
+# VAGWADs share the same entries, so those have to keep the same layout.
 
-import argparse, os
+import argparse, glob, mmap, os, shutil, struct, sys
 
 FREQ_MAP = {
     0x2: 16000,
@@ -28,15 +34,48 @@ INTERLEAVE_MAP = {
 }
 
 CMP_CHARS = " ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-"
+VAGDIR_ENTRY = struct.Struct("<Q")
+CHUNK_SIZE = 0x100000  # files are streamed in through a 1 MB write buffer when building
 
 def read_int(file, bytes):
     return int.from_bytes(file.read(bytes), "little")
 
+def _copy_file_range(in_fd, out_fd, offs, size):
+    return os.copy_file_range(in_fd, out_fd, size, offs)
+
+def _sendfile(in_fd, out_fd, offs, size):
+    return os.sendfile(out_fd, in_fd, offs, size)
+
+# Kernel side copies, so the data never has to pass through Python.  File
+# to file sendfile is Linux only, copy_file_range needs Python 3.8 or newer
+COPY_FUNCS = list()
+if hasattr(os, "copy_file_range"):
+    COPY_FUNCS.append(_copy_file_range)
+if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+    COPY_FUNCS.append(_sendfile)
+
+def copy_data(in_file, in_map, out_file, offs, size):
+    # Copies  size  bytes at  offs  of the input file to the output file
+    # kernel side where supported, otherwise writes a slice of the memory-
+    # mapped input file directly, instead of reading it into bytes first
+    done = 0
+    for copy_func in COPY_FUNCS:
+        try:
+            while done < size:
+                copied = copy_func(in_file.fileno(), out_file.fileno(), offs + done, size - done)
+                if not copied:
+                    return done  # end of file
+                done += copied
+            return done
+        except OSError:
+            continue  # not supported by this file system, try the next one
+    with memoryview(in_map) as view:
+        return done + out_file.write(view[offs + done:offs + size])
+
 class DecompressEntry:
     # Reimplemented from the function at  000A09B8  on the IOP
     # of the  OVERLRD2.IRX  module in the PAL version of Jak 3
-    def __init__(self, file):
-        cmp_int = read_int(file, 0x8)
+    def __init__(self, cmp_int):
         cmp_name = cmp_int & 0x3FFFFFFFFFF
         self.stereo = cmp_int >> 42 & 0x1
         self.int_wad = cmp_int >> 43 & 0x1
@@ -52,8 +91,30 @@ class DecompressEntry:
             tmp_name, char_idx = divmod(tmp_name, len(CMP_CHARS))
             name += CMP_CHARS[char_idx]
         self.name = name[::-1].strip() + ".VAG"
+        self.cmp_name = cmp_name
         #print(name[::-1], f"{flags:06b}", f"{self.offset:X}")
 
+def compress_entry(name, stereo, int_wad, frequency, offset):
+    # Inverse of the above, same as  enc_vagdir  in  jak3-Xvagdir_algo.py
+    # the first 4 chars go in the upper and the last 4 in the lower 21 bits
+    cmp_high = cmp_low = 0
+    name = name.upper().ljust(8)
+    for char in name[:4]:
+        cmp_high = cmp_high * len(CMP_CHARS) + CMP_CHARS.index(char)
+    for char in name[4:]:
+        cmp_low = cmp_low * len(CMP_CHARS) + CMP_CHARS.index(char)
+    return cmp_high << 21 | cmp_low | stereo << 42 | int_wad << 43 | frequency << 44 | offset >> 15 << 48
+
+def exists_prompt(output, prompt):
+    if os.path.exists(output):
+        response = input(f"Warning! {prompt.format(os.path.split(output)[1])} (Y/N): ")[:1].upper()
+        if response != "Y":
+            if response != "N":
+                print("Error! Invalid response.", end=" ")
+            print("Exiting...")
+            return False
+    return True
+
 def extract_vagwad(vagwad, outpath=""):
     if not os.path.exists(vagwad):
         print("Provided VAGWAD file could not be found!")
@@ -86,7 +147,8 @@ def extract_vagwad(vagwad, outpath=""):
         #interleave = INTERLEAVE_MAP.get(version)
 
         # Filters through the entries and retrieves the correct ones for the input container
-        entries = [DecompressEntry(dir) for entry in range(entries)]
+        entry_data = dir.read(entries * VAGDIR_ENTRY.size)
+        entries = [DecompressEntry(cmp_int) for cmp_int, in VAGDIR_ENTRY.iter_unpack(entry_data)]
         entries = [entry for entry in entries if entry.int_wad == int_wad]
         entries.sort(key=lambda entry: entry.offset)  # shouldn't be needed but just in case
 
@@ -94,46 +156,161 @@ def extract_vagwad(vagwad, outpath=""):
             print("No sound file entries for this container!")
             return
 
-        entry_eof = len(entries) - 1
-        for idx, entry in enumerate(entries):
-            wad.seek(entry.offset)
+        with mmap.mmap(wad.fileno(), 0, access=mmap.ACCESS_READ) as wad_map:
+            entry_eof = len(entries) - 1
+            for idx, entry in enumerate(entries):
+                # Not using the stored .VAG size, instead retrieving from the next entry
+                if idx == entry_eof:
+                    vag_size = len(wad_map) - entry.offset  # until EOF
+                else:
+                    vag_size = entries[idx + 1].offset - entry.offset
+
+                if wad_map[entry.offset:entry.offset + 0x4] != b"pGAV":
+                    print("Failed to decompress entry! (Offset error)")
+                    return
+
+                # Early builds of Jak X still use ver 2 but with 0x1000 interleave
+                #if entry.stereo and not vag_data[:interleave + 4].endswith(b"pGAV"):
+                #    print("Failed to decompress entry! (Interleave error)")
+                #    return
+
+                # Not even entirely sure if this is even correct but it seems to match most of the time...
+                # Only seems to correspond to .ENG/.INT containers, others can have different sample rates
+                #wad.seek(entry.offset + 0x10)
+                #frequency = read_int(wad, 0x4)
+                #if entry.frequency not in FREQ_MAP:
+                #    print("New sample rate detected!", frequency)
+                #if frequency != FREQ_MAP.get(entry.frequency):
+                #    print("Failed to decompress entry! (Sample rate error)", frequency)
+                #    return
+
+                #print(entry.name.ljust(12), f"{entry.offset:X}")
+                out_vag = os.path.join(outpath, entry.name)
+                with open(out_vag, "wb") as vag:
+                    print("Writing", out_vag)
+                    copy_data(wad, wad_map, vag, entry.offset, vag_size)
+
+def build_vagwad(vagwad, inpath):
+    vagwad = os.path.abspath(vagwad)
+    int_wad = os.path.splitext(vagwad)[1].upper() == ".INT"
+    vagdir = os.path.join(os.path.split(vagwad)[0], "VAGDIR.AYB")
+
+    if not os.path.exists(vagdir):
+        print("The original VAGDIR.AYB needs to be in the same directory as the output file!")
+        return
+
+    with open(vagdir, "rb") as dir:
+        if dir.read(0x8) != b"VGWADDIR":
+            print("Invalid VAGDIR.AYB file in the same directory as the output file!")
+            return
 
-            # Not using the stored .VAG size, instead retrieving from the next entry
-            if idx == entry_eof:
-                vag_data = wad.read()  # until EOF
-            else:
-                vag_size = entries[idx + 1].offset - entry.offset
-                vag_data = wad.read(vag_size)
+        version = read_int(dir, 0x4)
+        entries = read_int(dir, 0x4)
+        cmp_ints = [cmp_int for cmp_int, in VAGDIR_ENTRY.iter_unpack(dir.read(entries * VAGDIR_ENTRY.size))]
+        dir_tail = dir.read()  # kept as is, in case there's any padding
+    entries = [DecompressEntry(cmp_int) for cmp_int in cmp_ints]
+    old_entries = {entry.name: entry for entry in entries if entry.int_wad == int_wad}
 
-            if not vag_data.startswith(b"pGAV"):
-                print("Failed to decompress entry! (Offset error)")
+    vag_names = dict()
+    for path in glob.iglob(os.path.join(glob.escape(inpath), "*")):
+        name = os.path.split(path)[1].upper()
+        if not name.endswith(".VAG") or os.path.isdir(path):
+            continue
+        if len(name) > 12 or any(char not in CMP_CHARS for char in name[:-4]):
+            print(f"Invalid file name {name}! Only up to 8 letters, digits, spaces and dashes can be stored.")
+            return
+        with open(path, "rb") as vag:
+            if vag.read(0x4) != b"pGAV":
+                print(f"{name} is not a VAG file!")
                 return
+        vag_names[name] = path
+
+    if not vag_names:
+        print("No .VAG files found in the input folder!")
+        return
+
+    # Files already in the container keep their order, any new ones go last
+    vag_names = dict(sorted(vag_names.items(), key=lambda item: (item[0] not in old_entries,
+                            old_entries[item[0]].offset if item[0] in old_entries else 0, item[0])))
+    interleave = INTERLEAVE_MAP.get(version)
+    freq_map = {freq: param for param, freq in FREQ_MAP.items()}
+
+    # Everything is worked out before any of the files are opened for writing,
+    # so that the original VAGWAD and VAGDIR.AYB are left as is on an error
+    offset = 0
+    new_entries = dict()
+    for name, path in vag_names.items():
+        offset = -(-offset // 0x8000) * 0x8000
+        if offset >> 15 > 0xFFFF:
+            print("VAGWAD too large, offsets can only be up to 0x7FFF8000!")
+            return
+        entry = old_entries.get(name)
+        if entry is not None:
+            stereo, frequency = entry.stereo, entry.frequency
+        else:
+            with open(path, "rb") as vag:
+                header = vag.read(0x14)
+                # stereo files have the second channel's header after the first interleave block
+                vag.seek(interleave or 0)
+                stereo = int(interleave is not None and vag.read(0x4) == b"pGAV")
+            frequency = freq_map.get(int.from_bytes(header[0x10:0x14], "little"), 0)
+        new_entries[name] = compress_entry(name[:-4], stereo, int_wad, frequency, offset)
+        offset += os.path.getsize(path)
+
+    # The other container's entries are kept as they are, and the updated ones in
+    # their original spot, sorted by name only if the original was sorted by name
+    moved = False
+    out_ints = list()
+    wad_ints = dict(new_entries)
+    for cmp_int, entry in zip(cmp_ints, entries):
+        if entry.int_wad != int_wad:
+            out_ints.append(cmp_int)
+        elif entry.name in wad_ints:
+            moved |= wad_ints[entry.name] >> 48 != cmp_int >> 48
+            out_ints.append(wad_ints.pop(entry.name))
+        else:
+            moved = True  # removed
+    out_ints.extend(wad_ints.values())
+    if all(a.cmp_name <= b.cmp_name for a, b in zip(entries, entries[1:])):
+        out_ints.sort(key=lambda cmp_int: cmp_int & 0x3FFFFFFFFFF)
+
+    if not exists_prompt(vagwad, "{} and VAGDIR.AYB will be overwritten. Continue?"):
+        return
+
+    # both are only replaced once they've been fully written, as a pair
+    try:
+        with open(vagwad + ".tmp", "wb", buffering=CHUNK_SIZE) as wad:
+            for name, path in vag_names.items():
+                print("Writing", name)
+                wad.seek(new_entries[name] >> 48 << 15)
+                with open(path, "rb") as vag:
+                    shutil.copyfileobj(vag, wad, CHUNK_SIZE)
+
+        with open(vagdir + ".tmp", "wb") as dir:
+            dir.write(b"VGWADDIR")
+            dir.write(struct.pack("<II", version, len(out_ints)))
+            dir.write(b"".join(VAGDIR_ENTRY.pack(cmp_int) for cmp_int in out_ints))
+            dir.write(dir_tail)
+    except BaseException:
+        for path in (vagwad + ".tmp", vagdir + ".tmp"):
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+    os.replace(vagwad + ".tmp", vagwad)
+    os.replace(vagdir + ".tmp", vagdir)
 
-            # Early builds of Jak X still use ver 2 but with 0x1000 interleave
-            #if entry.stereo and not vag_data[:interleave + 4].endswith(b"pGAV"):
-            #    print("Failed to decompress entry! (Interleave error)")
-            #    return
-
-            # Not even entirely sure if this is even correct but it seems to match most of the time...
-            # Only seems to correspond to .ENG/.INT containers, others can have different sample rates
-            #wad.seek(entry.offset + 0x10)
-            #frequency = read_int(wad, 0x4)
-            #if entry.frequency not in FREQ_MAP:
-            #    print("New sample rate detected!", frequency)
-            #if frequency != FREQ_MAP.get(entry.frequency):
-            #    print("Failed to decompress entry! (Sample rate error)", frequency)
-            #    return
-
-            #print(entry.name.ljust(12), f"{entry.offset:X}")
-            out_vag = os.path.join(outpath, entry.name)
-            with open(out_vag, "wb") as vag:
-                print("Writing", out_vag)
-                vag.write(vag_data)
+    if moved and not int_wad:
+        print("Warning! File offsets have changed, the other language VAGWADs have to be rebuilt the same way.")
+    print("Done! Written", vagwad, "and", vagdir)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("vagwad", type=str, help="path to a vagwad container")
     parser.add_argument("-o", "--output", type=str, default="", help="where the output folder should be")
+    parser.add_argument("-b", "--build", type=str, default="", help="rebuild the vagwad container from this folder instead")
     args = parser.parse_args()
 
-    extract_vagwad(args.vagwad, args.output)
+    if args.build:
+        build_vagwad(args.vagwad, args.build)
+    else:
+        extract_vagwad(args.vagwad, args.output)
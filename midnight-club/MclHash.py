@@ -1,6 +1,17 @@
 #!/usr/bin/env python3
 # Midnight Club STMA/RSTM and string lookup hashing functions
-# Written by Edness   v1.2   2022-06-22 - 2022-10-10
+
+# Usage:
+#   MclHash.py  aud   "string to hash"
+#   MclHash.py  str2  "string to hash"
+#   MclHash.py  str3  "string to hash"
+# Optional:
+#   -f | --file     Treat the input as a path to a list of strings, one per line
+#     MclHash.py  aud  "X:\path\to\streams.lst"  -f
+
+# Written by Edness   v1.3   2022-06-22 - 2026-10-18
+
+from array import array
 
 def audio_hash(str):
     # Reimplemented from the function at  004F9298  in the
@@ -39,6 +50,152 @@ def string_hash3(str):
     hash = hash * 9 & 0xFFFFFFFF
     return (hash ^ hash >> 11) * 0x8001 & 0xFFFFFFFF
 
+class AudioHash:
+    # Resumable audio_hash and string_hash2/3 states, so that a shared
+    # prefix only has to be hashed once before appending each name, e.g.
+    #   state = AudioHash("SOUND/");  state.copy().update("NAME.RSM").digest()
+    def __init__(self, str=""):
+        self.hash = 0x00000000
+        self.idx = 0  # the character position is part of the hash
+        self.update(str)
+
+    def update(self, str):
+        if type(str) is bytes:
+            str = str.decode("latin-1")
+        hash = self.hash
+        for self.idx, chr in enumerate(str.upper().replace("\\", "/"), self.idx + 1):
+            hash = (hash << 1 | hash >> 31) + ord(chr) * self.idx & 0xFFFFFFFF
+        self.hash = hash
+        return self
+
+    def copy(self):
+        state = AudioHash()
+        state.hash = self.hash
+        state.idx = self.idx
+        return state
+
+    def digest(self):
+        return self.hash
+
+class StringHash2:
+    def __init__(self, str=""):
+        self.hash = 0x00000000
+        self.update(str)
+
+    def update(self, str):
+        if type(str) is bytes:
+            str = str.decode("latin-1")
+        hash = self.hash
+        for chr in str:
+            hash = (hash << 4) + ord(chr)
+            if mask := hash & 0xF0000000:
+                hash ^= mask >> 24 ^ mask
+        self.hash = hash
+        return self
+
+    def copy(self):
+        state = StringHash2()
+        state.hash = self.hash
+        return state
+
+    def digest(self):
+        return self.hash
+
+class StringHash3:
+    def __init__(self, str=""):
+        self.hash = 0x00000000
+        self.update(str)
+
+    def update(self, str):
+        if type(str) is bytes:
+            str = str.decode("latin-1")
+        hash = self.hash
+        for chr in str:
+            hash = (hash + ord(chr)) * 0x401 & 0xFFFFFFFF
+            hash ^= hash >> 6
+        self.hash = hash
+        return self
+
+    def copy(self):
+        state = StringHash3()
+        state.hash = self.hash
+        return state
+
+    def digest(self):
+        hash = self.hash * 9 & 0xFFFFFFFF
+        return (hash ^ hash >> 11) * 0x8001 & 0xFFFFFFFF
+
+def _hash_columns(strs):
+    # (indices, character columns) of every group of equally long names
+    import numpy as np
+
+    sizes = np.fromiter(map(len, strs), np.int64, len(strs))
+    offsets = np.cumsum(sizes) - sizes
+    # UTF-32 to keep it identical to ord() for any character
+    chars = np.frombuffer("".join(strs).encode("UTF-32-LE"), np.uint32)
+    for size in np.unique(sizes):
+        idxs = np.flatnonzero(sizes == size)
+        offs = offsets[idxs]
+        yield idxs, (chars[offs + col] for col in range(size))
+
+def audio_hash_many(strs):
+    # The _many variants take a name list, NumPy is optional but far faster
+    strs = [str.decode("latin-1") if type(str) is bytes else str for str in strs]
+    try:
+        import numpy as np
+    except ImportError:
+        return array("I", map(audio_hash, strs))
+
+    hashes = np.zeros(len(strs), np.uint32)
+    for idxs, cols in _hash_columns("\x00".join(strs).upper().replace("\\", "/").split("\x00")):
+        hash = np.zeros(len(idxs), np.uint32)
+        for idx, col in enumerate(cols, 1):
+            hash = (hash << np.uint32(1) | hash >> np.uint32(31)) + col * np.uint32(idx)
+        hashes[idxs] = hash
+    return array("I", hashes.tobytes())
+
+def string_hash2_many(strs):
+    # string_hash2 isn't masked to 32 bits, so in the rare cases where
+    # it overflows those are rehashed one by one for identical results
+    strs = [str.decode("latin-1") if type(str) is bytes else str for str in strs]
+    try:
+        import numpy as np
+    except ImportError:
+        return array("Q", map(string_hash2, strs))
+
+    hashes = np.zeros(len(strs), np.uint64)
+    overflow = np.zeros(len(strs), np.bool_)
+    for idxs, cols in _hash_columns(strs):
+        hash = np.zeros(len(idxs), np.uint64)
+        ovf = np.zeros(len(idxs), np.bool_)
+        for col in cols:
+            hash = (hash << np.uint64(4)) + col
+            mask = hash & np.uint64(0xF0000000)
+            hash ^= mask >> np.uint64(24) ^ mask
+            ovf |= hash >> np.uint64(32) != 0
+        hashes[idxs] = hash
+        overflow[idxs] = ovf
+    for idx in np.flatnonzero(overflow).tolist():
+        hashes[idx] = string_hash2(strs[idx]) & 0xFFFFFFFFFFFFFFFF
+    return array("Q", hashes.tobytes())
+
+def string_hash3_many(strs):
+    strs = [str.decode("latin-1") if type(str) is bytes else str for str in strs]
+    try:
+        import numpy as np
+    except ImportError:
+        return array("I", map(string_hash3, strs))
+
+    hashes = np.zeros(len(strs), np.uint32)
+    for idxs, cols in _hash_columns(strs):
+        hash = np.zeros(len(idxs), np.uint32)
+        for col in cols:
+            hash = (hash + col) * np.uint32(0x401)
+            hash ^= hash >> np.uint32(6)
+        hash *= np.uint32(9)
+        hashes[idxs] = (hash ^ hash >> np.uint32(11)) * np.uint32(0x8001)
+    return array("I", hashes.tobytes())
+
 if __name__ == "__main__":
     import argparse
 
@@ -46,15 +203,26 @@ if __name__ == "__main__":
     subparsers = parser.add_subparsers()
     rsm_parser = subparsers.add_parser("aud", help="Hashes strings into their STMA/RSTM hashed names in Midnight Club 2 and 3.")
     rsm_parser.add_argument("string", type=str)
-    rsm_parser.set_defaults(func=audio_hash)
+    rsm_parser.add_argument("-f", "--file", action="store_true", help="treat the input as a path to a list of names")
+    rsm_parser.set_defaults(func=audio_hash, func_many=audio_hash_many)
     str_parser = subparsers.add_parser("str2", help="Hashes the string labels used for string lookups in Midnight Club 2.")
     str_parser.add_argument("string", type=str)
-    str_parser.set_defaults(func=string_hash2)
+    str_parser.add_argument("-f", "--file", action="store_true", help="treat the input as a path to a list of labels")
+    str_parser.set_defaults(func=string_hash2, func_many=string_hash2_many)
     str_parser = subparsers.add_parser("str3", help="Hashes the string labels used for string lookups in Midnight Club 3: DUB Edition.")
     str_parser.add_argument("string", type=str)
-    str_parser.set_defaults(func=string_hash3)
+    str_parser.add_argument("-f", "--file", action="store_true", help="treat the input as a path to a list of labels")
+    str_parser.set_defaults(func=string_hash3, func_many=string_hash3_many)
     args = parser.parse_args()
 
-    try: hash = args.func(args.string)
+    try: func, func_many = args.func, args.func_many
     except AttributeError: print("No arguments given. Use -h or --help to show valid arguments.")
-    else: print(f"Hashed string: 0x{hash:08X} ({hash})")
+    else:
+        if args.file:
+            with open(args.string, "r", encoding="UTF-8") as file:
+                strings = file.read().splitlines()
+            for hash, string in zip(func_many(strings), strings):
+                print(f"0x{hash:08X}  {string}")
+        else:
+            hash = func(args.string)
+            print(f"Hashed string: 0x{hash:08X} ({hash})")
@@ -6,7 +6,10 @@
 #       dave.py  X  "/path/to/dave.dat"
 #     Optional:
 #       -o | --output <str> Path to the output directory;  default is input folder
-#         dave.py  X  "X:\path\to\dave.zip"  -o "Y:\path\to\folder"
+#       -j | --jobs   <int> Amount of worker threads;  default is all cores
+#       -f | --filter <str> Only extract files matching this pattern, like *.xtex (can be repeated)
+#         dave.py  X  "X:\path\to\dave.zip"  -o "Y:\path\to\folder"  -j 4
+#         dave.py  X  "X:\path\to\dave.dat"  -f "texture/*.xtex"  -f "*.txt"
 #
 #
 #   Rebuild:  B  (Python 3.11 or newer)
@@ -17,6 +20,10 @@
 #       -d  | --dirs            Include directory entries
 #       -a  | --align     <int> 16 byte file alignment;  default is 128 (2048 bytes)
 #       -ca | --compalign       Compact align (pack multiple files into a single chunk)
+#       -j  | --jobs      <int> Amount of worker processes for compressing;  default is all cores
+#       -u  | --update    <str> Path to an archive to update, the data of unchanged files is reused
+#                               from it, and it's rewritten in place if the output is the same file
+#                               and no files were added, removed or renamed
 #         dave.py  B  "/path/to/folder"  "/path/to/new_dave.zip"  -cn  -a 0
 #
 #     Optional (with -cf | --compfiles):
@@ -24,17 +31,22 @@
 #                               default is 0 (1=assumed safe files, 2=all files, unsafe)
 #       -cl | --complevel <int> Compression level;  default is 9 (1=fastest, 9=smallest)
 #         dave.py  B  "/path/to/folder"  "/path/to/new_dave.dat"  -cf  -fc 1
+#         dave.py  B  "/path/to/folder"  "/path/to/dave.dat"  -cf  -u "/path/to/dave.dat"
 
-# Written by Edness   2022-01-09 - 2023-11-07   v1.5.3
+# Written by Edness   2022-01-09 - 2026-10-18   v1.7.1
 
-import glob, os, zlib
+import bisect, fnmatch, glob, io, os, struct, time, zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # The games only store all the chars until ~, but I've seen a few
 # files that use the (normally) invalid index 0x30 which I assume
 # was a fallback to DEL in their own packer for unsupported chars
 CHARS = "\x00 #$()-./?0123456789_abcdefghijklmnopqrstuvwxyz~\x7F"
 DAVES = (DAVE := b"DAVE", Dave := b"Dave")
+DAVE_ENTRY = struct.Struct("<IIII")  # name offset, file offset, full size, compressed size
 POSIX_SEP = os.sep == "/"
+CHUNK_SIZE = 0x100000  # files are streamed through in 1 MB chunks when extracting
 # Midnight Club 3, Midnight Club: L.A. Remix, and Red Dead Revolver
 # seem to expect PCKs and PPFs to always be decompressed; it never
 # checks if it's compressed, just reads the data as-is, and points
@@ -63,7 +75,48 @@ def exists_prompt(output, prompt):
             return False
     return True
 
-def build_dave(inpath, output, compfiles=False, forcecomp=0, complevel=9, compnames=False, dirs=False, align=128, compalign=False):
+def comp_allow(name, data, forcecomp):
+    if forcecomp == 2:
+        return True
+    # doesn't break AFAIK but just to be safe (mini Daves)
+    if forcecomp == 0 and data.startswith(DAVES):
+        return False
+    # maybe restrict PPF compression to --forcecomp 2
+    if name.lower().endswith(COMP_EXT_BLOCKLIST):
+        # root folder PCKs are blocked from compressing for Red Dead Revolver
+        if forcecomp == 1 and "/" in name and not name.lower().startswith(COMP_DIR_BLOCKLIST):
+            return True
+        return False
+    return True
+
+def read_file(path, name, forcecomp=None, complevel=9, old=None):
+    # forcecomp None means the file doesn't get compressed at all, and old is
+    # the (archive path, file offset, full size, compressed size) of the file
+    # in an archive being updated, whose data is reused if it hasn't changed
+    with open(path, "rb") as file:
+        data = file.read()
+    compress = forcecomp is not None and comp_allow(name, data, forcecomp)
+
+    if old is not None and old[2] == len(data):
+        old_path, old_offs, old_size_full, old_size_comp = old
+        old_comp = old_size_full != old_size_comp
+        # only reuse data stored the way a fresh build would store it, an old
+        # raw file that should be compressed goes through compression below
+        if compress == old_comp:
+            with open(old_path, "rb") as file:
+                file.seek(old_offs)
+                old_data = file.read(old_size_comp)
+            if (zlib.decompress(old_data, -15) if old_comp else old_data) == data:
+                return old_data, True
+
+    if compress:
+        zlib_obj = zlib.compressobj(complevel, zlib.DEFLATED, -15)
+        comp_data = zlib_obj.compress(data) + zlib_obj.flush()
+        if len(comp_data) < len(data):
+            data = comp_data
+    return data, False
+
+def build_dave(inpath, output, compfiles=False, forcecomp=0, complevel=9, compnames=False, dirs=False, align=128, compalign=False, jobs=0, update=str()):
     def calc_align(size, align):
         return (size // align + 1) * align
 
@@ -76,18 +129,76 @@ def build_dave(inpath, output, compfiles=False, forcecomp=0, complevel=9, compna
     def write_int(int):
         return file.write(get_int(int, 0x4))
 
-    def comp_allow():
-        if forcecomp == 2:
-            return True
-        # doesn't break AFAIK but just to be safe (mini Daves)
-        if forcecomp == 0 and data.startswith(DAVES):
-            return False
-        # maybe restrict PPF compression to --forcecomp 2
-        if name.lower().endswith(COMP_EXT_BLOCKLIST):
-            # root folder PCKs are blocked from compressing for Red Dead Revolver
-            if forcecomp == 1 and "/" in name and not name.lower().startswith(COMP_DIR_BLOCKLIST):
-                return True
-            return False
+    def get_old(name):
+        if old_dave == Dave:
+            name = name.lower()
+        if name in old_info:
+            return (update, *old_info[name])
+        return None
+
+    def read_files():
+        # files are read (and compressed) on a process pool ahead of the
+        # writer, but only up to a window of files to keep memory bounded
+        file_list = [(name, path) for name, path in file_sets if not name.endswith("/")]
+        if not compfiles:
+            for name, path in file_list:
+                yield read_file(path, name, old=get_old(name))
+            return
+
+        queue = deque()
+        processes = jobs if jobs > 0 else os.cpu_count()
+        pool = ProcessPoolExecutor(processes)
+        try:
+            for name, path in file_list:
+                queue.append(pool.submit(read_file, path, name, forcecomp, complevel, get_old(name)))
+                if len(queue) >= processes * 2:
+                    yield queue.popleft().result()
+            while queue:
+                yield queue.popleft().result()
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def read_changed():
+        # same as read_files, but with the already read changed files
+        for idx, (name, path) in enumerate(file_sets):
+            if name.endswith("/"):
+                continue
+            if idx in changed:
+                yield changed[idx], False
+                continue
+            old_path, old_offs, old_size_full, old_size_comp = get_old(name)
+            with open(old_path, "rb") as tmp:
+                tmp.seek(old_offs)
+                yield tmp.read(old_size_comp), True
+
+    def update_in_place():
+        # the entry and name tables stay the same, so only the changed
+        # files have to be written, as long as they fit their old space
+        file_data = read_files()
+        for idx, (name, path) in enumerate(file_sets):
+            if not name.endswith("/"):
+                data, reused = next(file_data)
+                if not reused:
+                    changed[idx] = data
+
+        # each file can take up the space until the next one, or the end
+        file_ends = sorted(set(entry[1] for entry in old_list if not entry[0].endswith("/")))
+        file_ends.append(old_size)
+        for idx, data in changed.items():
+            file_offs = old_list[idx][1]
+            end_idx = bisect.bisect_right(file_ends, file_offs)
+            if file_offs + len(data) > (file_ends[end_idx] if end_idx < len(file_ends) else file_offs):
+                return False
+
+        with open(output, "r+b") as out:
+            for idx, data in sorted(changed.items(), key=lambda entry: old_list[entry[0]][1]):
+                name, file_offs, old_size_full, old_size_comp = old_list[idx]
+                print("Updating", file_sets[idx][0])
+                out.seek(file_offs)
+                out.write(data + bytes(max(old_size_comp - len(data), 0)))
+                out.seek(0x800 + idx * 0x10 + 0x8)
+                out.write(get_int(os.path.getsize(file_sets[idx][1]), 0x4))
+                out.write(get_int(len(data), 0x4))
         return True
 
     def size_assert_help():
@@ -193,29 +304,50 @@ def build_dave(inpath, output, compfiles=False, forcecomp=0, complevel=9, compna
     entry_size = calc_align(len(file_sets) * 0x10, 0x800)
     names_size = calc_align(len(b"".join(file_names)), 0x800)
 
+    # reuse the data of unchanged files from the archive being updated,
+    # and rewrite it in place if none of the names or their order changed
+    old_dave = None
+    old_info = dict()
+    changed = dict()
+    file_data = None
+    write_path = output
+    if update:
+        with open(update, "rb") as file:
+            old_dave, old_list = read_dave_table(file)
+            old_size = file.seek(0x0, 2)
+        old_info = {name: tuple(info) for name, *info in old_list}
+        if os.path.exists(output) and os.path.samefile(output, update):
+            write_path = output + ".tmp"
+            if old_dave == (Dave if compnames else DAVE) and len(old_list) == len(file_sets) \
+               and all(old_name == (name.lower() if compnames else name) for (old_name, *info), (name, path) in zip(old_list, file_sets)):
+                print("Updating archive in place...")
+                if update_in_place():
+                    print(f"\nSuccess! Updated {len(changed)} file(s) in", output)
+                    return
+                print("Changed files don't fit in place, rebuilding the archive...")
+                file_data = read_changed()
+            else:
+                print("Archive layout changed, rebuilding the archive...")
+
     entry_info = list()
     os.makedirs(os.path.split(output)[0], exist_ok=True)
-    with open(__file__) as file: dave = file.read(0x800)
+    with open(__file__) as file: dave = file.read()
     dave = dave[dave.index(" ".join([chr(x) for x in (35, 87)])) + 0x2:]
     dave = dave.splitlines()[0].split(); dave = " ".join(dave[:3]), dave[-1]
     dave = " - ".join((os.path.split(__file__)[1], *dave[::-1])).encode("UTF-8")
-    with open(output, "wb") as file:
+    with open(write_path, "wb") as file:
         file.seek(0x800 - len(dave))
         file.write(dave)
         file_offs = file.seek(0x800 + entry_size + names_size)
+        if file_data is None:
+            file_data = read_files()
         for name, path in file_sets:
             print("Writing", name)  # path
             if name.endswith("/"):
                 entry_info.append((file_offs, 0x0, 0x0))
                 continue  # dirs don't increase file_offs
             assert file_offs <= 0xFFFFFFFF, ERR_ARCSIZE + size_assert_help()
-            with open(path, "rb") as tmp:
-                data = tmp.read()
-            if compfiles and comp_allow():
-                zlib_obj = zlib.compressobj(complevel, zlib.DEFLATED, -15)
-                comp_data = zlib_obj.compress(data) + zlib_obj.flush()
-                if len(comp_data) < len(data):
-                    data = comp_data
+            data, reused = next(file_data)
             # pack multiple tiny files into a single sector, if possible
             # if dirs are included, it will create a new alignment zone.
             if compalign and align > 0x20 and entry_info:
@@ -256,20 +388,144 @@ def build_dave(inpath, output, compfiles=False, forcecomp=0, complevel=9, compna
         file.seek(0x800 + entry_size)
         file.write(b"".join(file_names))
 
+    if write_path != output:
+        os.replace(write_path, output)
+
     print("\nSuccess! Archive built at", output)
     print("From the source folder at", inpath)
 
-def read_dave(path, output=str()):
-    def read_int(bytes):
-        return int.from_bytes(file.read(bytes), "little")
-
-    def read_str():
-        return "".join(iter(lambda: file.read(0x1).decode("ASCII"), "\x00"))
+def read_dave_table(file):
+    # returns the archive type and a list of its entries as
+    # (name, file offset, full size, compressed size) tuples
+    def read_str(offs):
+        return names[offs:names.index(b"\x00", offs)].decode("ASCII")
 
-    def read_bits():
-        comp_data = read_int(0x3)
+    def read_bits(offs):
+        comp_data = int.from_bytes(names[offs:offs + 0x3], "little")
         return [comp_data >> mul * 6 & 0x3F for mul in range(4)]
 
+    file.seek(0x0)
+    dave = file.read(0x4)
+    assert dave in DAVES, ERR_DAVE
+
+    entries, info_size, name_size = struct.unpack("<III", file.read(0xC))
+
+    file.seek(0x800)
+    table = file.read(entries * 0x10)
+    file.seek(0x800 + info_size)
+    names = file.read(name_size)
+
+    entry_list = list()
+    file_name = str()
+    for name_offs, file_offs, file_size_full, file_size_comp in DAVE_ENTRY.iter_unpack(table):
+
+        if dave == DAVE:
+            file_name = read_str(name_offs)
+        else:  # = Dave:
+            name_bits = read_bits(name_offs)
+            prev_name = file_name
+            file_name = str()
+            if name_bits[0] >= 0x38:  # deduplicate
+                dedup_size = (name_bits.pop(1) - 0x20) * 8 + name_bits.pop(0) - 0x38
+                file_name = prev_name[:dedup_size]
+            while name_bits[0]:  # decompress
+                file_name += CHARS[name_bits.pop(0)]
+                if not name_bits:
+                    name_offs += 0x3
+                    name_bits = read_bits(name_offs)
+
+        entry_list.append((file_name, file_offs, file_size_full, file_size_comp))
+    return dave, entry_list
+
+class DaveFile(io.RawIOBase):
+    # read-only stream of a single archive entry, which is only inflated
+    # in chunks as it's being read, so it never has to be fully in memory
+    def __init__(self, path, file_offs, file_size_full, file_size_comp):
+        self.file = open(path, "rb")
+        self.file.seek(file_offs)
+        self.left = file_size_comp
+        self.zlib_obj = zlib.decompressobj(-15) if file_size_full != file_size_comp else None
+        self.data = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self.data:
+            if self.zlib_obj is not None and self.zlib_obj.unconsumed_tail:
+                data = self.zlib_obj.decompress(self.zlib_obj.unconsumed_tail, CHUNK_SIZE)
+            elif self.left:
+                data = self.file.read(min(self.left, CHUNK_SIZE))
+                if not data:
+                    break
+                self.left -= len(data)
+                if self.zlib_obj is not None:
+                    data = self.zlib_obj.decompress(data, CHUNK_SIZE)
+            elif self.zlib_obj is not None:
+                data = self.zlib_obj.flush()
+                self.zlib_obj = None
+            else:
+                break
+            self.data = memoryview(data)
+
+        size = min(len(buffer), len(self.data))
+        buffer[:size] = self.data[:size]
+        self.data = self.data[size:]
+        return size
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+class DaveArchive:
+    # random access to the entries of an archive, the names are decoded once
+    # into an index, after which any file only costs a seek and an inflate
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        with open(self.path, "rb") as file:
+            self.dave, self.entries = read_dave_table(file)
+        # identical names resolve to the later entry, like when extracting
+        self.index = {entry[0]: entry for entry in self.entries}
+        self.index_lower = {entry[0].lower(): entry for entry in self.entries}
+
+    def __contains__(self, name):
+        return name in self.index or name.lower() in self.index_lower
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def info(self, name):
+        # returns the (name, file offset, full size, compressed size) of a file
+        entry = self.index.get(name) or self.index_lower.get(name.lower())
+        if entry is None:
+            raise KeyError(ERR_NOFILE.format(name))
+        return entry
+
+    def open(self, name):
+        name, file_offs, file_size_full, file_size_comp = self.info(name)
+        return io.BufferedReader(DaveFile(self.path, file_offs, file_size_full, file_size_comp), CHUNK_SIZE)
+
+    def read(self, name):
+        with self.open(name) as file:
+            return file.read()
+
+    def glob(self, *patterns):
+        # patterns are matched case insensitively, the games don't care either
+        patterns = [pattern.lower() for pattern in patterns]
+        return [name for name in self.index if any(fnmatch.fnmatchcase(name.lower(), pattern) for pattern in patterns)]
+
+def read_dave(path, output=str(), jobs=0, patterns=list()):
+    def extract_file(name, outpath):
+        # stream it through in chunks, so huge files don't end up in memory
+        with archive.open(name) as file, open(outpath, "wb") as out:
+            size = 0
+            while data := file.read(CHUNK_SIZE):
+                size += out.write(data)
+        return size
+
     if not output:
         output = os.path.splitext(path)[0]
     output = os.path.abspath(output)
@@ -277,57 +533,45 @@ def read_dave(path, output=str()):
     if not exists_prompt(output, "Output directory already exists. Overwrite files?"):
         return
 
-    with open(path, "rb") as file:
-        dave = file.read(0x4)
-        assert dave in DAVES, ERR_DAVE
-
-        entries = read_int(0x4)
-        info_size = read_int(0x4)
-        name_size = read_int(0x4)
-
-        file_name = str()
-        for i in range(entries):
-            file.seek(0x800 + i * 0x10)
-            name_offs = read_int(0x4) + info_size + 0x800
-            file_offs = read_int(0x4)
-            file_size_full = read_int(0x4)
-            file_size_comp = read_int(0x4)
-
-            file.seek(name_offs)
-            if dave == DAVE:
-                file_name = read_str()
-            else:  # = Dave:
-                name_bits = read_bits()
-                prev_name = file_name
-                file_name = str()
-                if name_bits[0] >= 0x38:  # deduplicate
-                    dedup_size = (name_bits.pop(1) - 0x20) * 8 + name_bits.pop(0) - 0x38
-                    file_name = prev_name[:dedup_size]
-                while name_bits[0]:  # decompress
-                    file_name += CHARS[name_bits.pop(0)]
-                    if not name_bits:
-                        name_bits = read_bits()
-
-            outpath = os.path.join(output, file_name)
-            if not POSIX_SEP:
-                outpath = outpath.replace("/", "\\")
-
-            if not file_name.endswith("/"):
-                file.seek(file_offs)
-                data = file.read(file_size_comp)
-                if file_size_full != file_size_comp:
-                    data = zlib.decompress(data, -15)
-                assert len(data) == file_size_full, ERR_DECOMP.format(file_name)
-
-                print("Writing", outpath)
-                os.makedirs(os.path.split(outpath)[0], exist_ok=True)
-                with open(outpath, "wb") as out:
-                    out.write(data)
-            else:  # looks very jarring if the length isn't the same, so it isn't "Creating" or "Making"
-                print("Opening", outpath)
-                os.makedirs(outpath, exist_ok=True)
+    # parse the entry and name tables up front
+    archive = DaveArchive(path)
+    names = archive.glob(*patterns) if patterns else list(archive)
 
+    dir_list = list()
+    file_list = list()
+    for file_name in names:
+        outpath = os.path.join(output, file_name)
+        if not POSIX_SEP:
+            outpath = outpath.replace("/", "\\")
+
+        if not file_name.endswith("/"):
+            file_list.append((outpath, archive.info(file_name)))
+        else:
+            dir_list.append(outpath)
+
+    for outpath in dir_list:  # looks very jarring if the length isn't the same, so it isn't "Creating" or "Making"
+        print("Opening", outpath)
+        os.makedirs(outpath, exist_ok=True)
+    for outpath, info in file_list:
+        os.makedirs(os.path.split(outpath)[0], exist_ok=True)
+
+    # decompress and write on a worker pool in offset order, zlib and
+    # file I/O both release the GIL so threads are enough for this
+    file_list.sort(key=lambda entry: entry[1][1])
+    total_size = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(jobs if jobs > 0 else os.cpu_count()) as pool:
+        results = list()
+        for outpath, (file_name, file_offs, file_size_full, file_size_comp) in file_list:
+            results.append((outpath, file_name, file_size_full, pool.submit(extract_file, file_name, outpath)))
+        for outpath, file_name, file_size_full, result in results:
+            assert result.result() == file_size_full, ERR_DECOMP.format(file_name)
+            print("Writing", outpath)
+            total_size += file_size_full
+
+    elapsed = time.perf_counter() - start
     print("\nSuccess! Done extracting.")
+    print(f"Wrote {total_size / 0x100000:.2f} MB in {elapsed:.2f} seconds ({total_size / 0x100000 / max(elapsed, 1e-6):.2f} MB/s)")
 
 # Assertion messages, so they're not visible twice
 ERR_ALIGN    = "Error! Invalid alignment size."
@@ -338,6 +582,7 @@ ERR_DAVE     = "Error! Not a DAVE/Dave archive."
 ERR_DECOMP   = "Error! Data decompression size mismatch. ({})"
 ERR_NAMECHAR = "Error! Filename contains illegal characters. (\"{}\" in {})"
 ERR_NAMELEN  = "Error! Filename too long. ({})"
+ERR_NOFILE   = "Error! File not found in the archive. ({})"
 
 if __name__ == "__main__":
     import argparse
@@ -348,6 +593,8 @@ if __name__ == "__main__":
     extract_parser = subparsers.add_parser("X", help="extracts a DAVE/Dave archive (Python 3.8 or newer)")
     extract_parser.add_argument("path", type=str, help="path to the DAVE/Dave archive")
     extract_parser.add_argument("-o", "--output", type=str, default=str(), help="path to the output folder")
+    extract_parser.add_argument("-j", "--jobs", type=int, default=0, help="amount of worker threads (default=all cores)")
+    extract_parser.add_argument("-f", "--filter", type=str, action="append", default=list(), help="only extract files matching this pattern (can be repeated)")
     extract_parser.set_defaults(read=True, func=read_dave)
 
     build_parser = subparsers.add_parser("B", help="builds a new DAVE archive (Python 3.11 or newer)")
@@ -360,11 +607,13 @@ if __name__ == "__main__":
     build_parser.add_argument("-d", "--dirs", action="store_true", help="include directory entries")
     build_parser.add_argument("-a", "--align", type=int, default=128, help="set a multiple of 16 byte alignment (default=128 (2048 bytes))")
     build_parser.add_argument("-ca", "--compalign", action="store_true", help="compact align (pack multiple files into a single chunk)")
+    build_parser.add_argument("-j", "--jobs", type=int, default=0, help="amount of worker processes for compressing (default=all cores)")
+    build_parser.add_argument("-u", "--update", type=str, default=str(), help="path to an archive to update, reusing the data of unchanged files")
     build_parser.set_defaults(read=False, func=build_dave)
 
     args = parser.parse_args()
     try:
-        func_args = (args.path, args.output) if args.read else (args.path, args.output, args.compfiles, args.forcecomp, args.complevel, args.compnames, args.dirs, args.align, args.compalign)
+        func_args = (args.path, args.output, args.jobs, args.filter) if args.read else (args.path, args.output, args.compfiles, args.forcecomp, args.complevel, args.compnames, args.dirs, args.align, args.compalign, args.jobs, args.update)
         args.func(*func_args)
     except AttributeError:
         print("Error! Bad arguments given. Use -h or --help to show valid arguments.")
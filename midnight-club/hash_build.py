@@ -9,8 +9,10 @@
 #       -b  | --body      <str> Path to the archive body (Bully Wii split Speech BIN+FSB)
 #       -o  | --output    <str> Path to the output directory;  default is input folder
 #       -nl | --namelist  <str> Path to the filename text file
-#       -a  | --algo      <str> {Bully,MClub} Filename hashing algorithm
+#       -a  | --algo      <str> {Bully,MClub} Filename hashing algorithm;  detected from the name list if not given
 #       -th | --threshold <int> Percentage threshold how many names should match to accept;  default is 70
+#       -j  | --jobs      <int> Amount of worker threads;  default is all cores
+#       -q  | --quiet           Show a progress bar instead of every file written
 #         hash_build.py  X  "X:\path\to\streams.dat"  -o "Y:\path\to\folder"
 #         hash_build.py  X  "X:\path\to\streams.dat"  -nl "Z:\path\to\streams.lst"  -a mclub  -th 45
 #         hash_build.py  X  "X:\path\to\speech.bin"  -b "X:\path\to\speech.fsb"  -nl "Z:\path\to\streams.lst"  -a bully
@@ -20,39 +22,176 @@
 #         hash_build.py  B  "Y:\path\to\folder"  "X:\path\to\music.bin"  -a bully
 #     Optional:
 #       -be | --bigendian       Build in big endian (Wii, Xbox 360)
+#       -j  | --jobs      <int> Amount of threads reading files ahead;  default is all cores
+#       -q  | --quiet           Show a progress bar instead of every file written
 #         hash_build.py  B  "/path/to/folder"  "/path/to/music.bin"  -a bully  -be
+#
+#   Diff:  D  (Python 3.8 or newer)
+#       Writes a patch of only the changed and added entries between two archives
+#         hash_build.py  D  "X:\path\to\streams.dat"  "Y:\path\to\modded\streams.dat"  "Z:\path\to\streams.patch"
+#     Optional:
+#       -j  | --jobs      <int> Amount of threads comparing entries;  default is all cores
+#
+#   Apply:  A  (Python 3.8 or newer)
+#       Patches the archive in place, entries which no longer fit are moved to the end
+#         hash_build.py  A  "X:\path\to\streams.dat"  "Z:\path\to\streams.patch"
 
-# Written by Edness   2022-07-05 - 2024-06-10   v1.5
+# Written by Edness   2022-07-05 - 2026-10-18   v1.8.1
 
-import glob, os
+import glob, hashlib, mmap, os, struct, sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 HASHED = "__hashed"
 HASHES = (HASH := b"Hash", HSAH := b"hsaH")
 INT_MAX_RANGE = range(1 << 32)
+PATCH_ID = b"HPch"
 POSIX_SEP = os.sep == "/"
 UINT32 = lambda x: x & 0xFFFFFFFF
 
-def __bully_hash(str):
-    # Reimplemented from the  zipHashFile::Hash  function located
-    # at  0040CDF0  in the PS2 PAL version of Canis Canem Edit
-    hash = int()
-    hash_str = str.lower().replace("\\", "/").encode("ASCII")
+def __bully_norm(str):
+    return str.lower().replace("\\", "/").encode("ASCII")
+
+def __bully_update(hash, hash_str):
     for chr in hash_str:
-        hash = UINT32((hash + chr) * 0x401)
+        hash = (hash + chr) * 0x401 & 0xFFFFFFFF
         hash ^= hash >> 6
+    return hash
+
+def __bully_digest(hash):
     hash = UINT32(hash * 9)
     return UINT32((hash ^ hash >> 11) * 0x8001)
 
+def __bully_hash(str):
+    # Reimplemented from the  zipHashFile::Hash  function located
+    # at  0040CDF0  in the PS2 PAL version of Canis Canem Edit
+    return __bully_digest(__bully_update(int(), __bully_norm(str)))
+
+def __mclub_norm(str):
+    return str.upper().replace("\\", "/").encode("ASCII")
+
+def __mclub_update(state, hash_str):
+    # the state also keeps the length, as each char is multiplied by its index
+    hash, length = state
+    for idx, chr in enumerate(hash_str, length + 1):
+        hash = ((hash << 1 | hash >> 31) + chr * idx) & 0xFFFFFFFF
+    return hash, length + len(hash_str)
+
+def __mclub_digest(state):
+    return state[0]
+
 def __mclub_hash(str):
     # Reimplemented from the function at  004F9298  in the
     # PS2 PAL version of Midnight Club 3: DUB Edition Remix
     # Also found at  00386DB0  in PS2 PAL Midnight Club 2
-    hash = int()
-    hash_str = str.upper().replace("\\", "/").encode("ASCII")
-    for idx, chr in enumerate(hash_str, 1):
-        hash = UINT32((hash << 1 | hash >> 31) + chr * idx)
+    return __mclub_digest(__mclub_update((int(), int()), __mclub_norm(str)))
+
+def __bully_update_np(hash, length, cols):
+    import numpy as np
+    for col in cols:
+        hash = (hash + col) * np.uint32(0x401)
+        hash ^= hash >> np.uint32(6)
     return hash
 
+def __bully_digest_np(hash):
+    import numpy as np
+    hash = hash * np.uint32(9)
+    return (hash ^ hash >> np.uint32(11)) * np.uint32(0x8001)
+
+def __mclub_update_np(hash, length, cols):
+    import numpy as np
+    for idx, col in enumerate(cols, length + 1):
+        hash = (hash << np.uint32(1) | hash >> np.uint32(31)) + col * np.uint32(idx)
+    return hash
+
+# Resumable versions of the above, as  (normalize, initial state, update, digest)
+# and the NumPy versions hashing many names of the same length at once, as
+# (update(hashes, length so far, char columns), digest)
+HASH_STATES = {
+    "bully": (__bully_norm, int(), __bully_update, __bully_digest),
+    "mclub": (__mclub_norm, (int(), int()), __mclub_update, __mclub_digest)
+}
+HASH_STATES_NP = {
+    "bully": (__bully_update_np, __bully_digest_np),
+    "mclub": (__mclub_update_np, lambda hash: hash)
+}
+HASH_NAMES = {"bully": "Bully", "mclub": "MClub"}
+NAME_EXTS = ("", ".rsm", ".stm")
+NAME_SAMPLES = 4096  # names to detect the algorithm and extension with
+
+def hash_names(name_list, algo, exts=NAME_EXTS):
+    # Returns  (name, [hash with each extension])  for every name.  The hash
+    # state of each directory is only computed once and all of the names in
+    # it resume from there, just like the extensions all resume from the
+    # state of the full name, so that most characters only get hashed once.
+    # With NumPy available, all of the names of the same length are hashed
+    # together one character column at a time instead.
+    normalize, init, update, digest = HASH_STATES[algo]
+    names = [name for name in set(name.strip() for name in name_list) if name]
+    norms = normalize("\x00".join(names)).split(b"\x00") if names else list()
+    exts = [normalize(ext) for ext in exts]
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        update_np, digest_np = HASH_STATES_NP[algo]
+        sizes = np.fromiter(map(len, norms), np.int64, len(norms))
+        offsets = np.cumsum(sizes) - sizes
+        chars = np.frombuffer(b"".join(norms), np.uint8).astype(np.uint32)
+        hashes = np.zeros((len(names), len(exts)), np.uint32)
+        for size in np.unique(sizes).tolist():
+            idxs = np.flatnonzero(sizes == size)
+            offs = offsets[idxs]
+            state = update_np(np.zeros(len(idxs), np.uint32), 0, (chars[offs + col] for col in range(size)))
+            for ext_idx, ext in enumerate(exts):
+                hashes[idxs, ext_idx] = digest_np(update_np(state, size, (np.uint32(chr) for chr in ext)))
+        return list(zip(names, hashes.tolist()))
+
+    dir_states = {b"": init}
+    output = list()
+    for name, norm in zip(names, norms):
+        base = norm.rpartition(b"/")[2]
+        dir_name = norm[:len(norm) - len(base)]
+        state = dir_states.get(dir_name)
+        if state is None:
+            state = dir_states[dir_name] = update(init, dir_name)
+        state = update(state, base)
+        output.append((name, [digest(update(state, ext)) for ext in exts]))
+    return output
+
+def _copy_file_range(in_fd, out_fd, offs, size):
+    return os.copy_file_range(in_fd, out_fd, size, offs)
+
+def _sendfile(in_fd, out_fd, offs, size):
+    return os.sendfile(out_fd, in_fd, offs, size)
+
+# Kernel side copies, so the data never has to pass through Python.  File
+# to file sendfile is Linux only, copy_file_range needs Python 3.8 or newer
+COPY_FUNCS = list()
+if hasattr(os, "copy_file_range"):
+    COPY_FUNCS.append(_copy_file_range)
+if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+    COPY_FUNCS.append(_sendfile)
+
+def copy_data(in_file, in_map, out_file, offs, size):
+    # Copies  size  bytes at  offs  of the input file to the output file
+    # kernel side where supported, otherwise writes a slice of the memory-
+    # mapped input file directly, instead of reading it into bytes first
+    done = 0
+    for copy_func in COPY_FUNCS:
+        try:
+            while done < size:
+                copied = copy_func(in_file.fileno(), out_file.fileno(), offs + done, size - done)
+                if not copied:
+                    return done  # end of file
+                done += copied
+            return done
+        except OSError:
+            continue  # not supported by this file system, try the next one
+    with memoryview(in_map) as view:
+        return done + out_file.write(view[offs + done:offs + size])
+
 def get_hash_func(algo):
     hash_func = {
         "bully": __bully_hash,
@@ -61,6 +200,13 @@ def get_hash_func(algo):
     assert hash_func is not None, ERR_ALGO
     return hash_func
 
+def print_progress(done, total):
+    # a single progress bar line instead of a line for every file, which
+    # can take longer than the extraction itself on the Windows console
+    if done == total or not done & 0x3F:
+        bar = "#" * (done * 40 // total)
+        print(f"\r[{bar:<40}] {done}/{total}", end="\n" if done == total else "", flush=True)
+
 def exists_prompt(output, prompt):
     if os.path.exists(output):
         response = input(f"Warning! {prompt} (Y/N): ")[:1].upper()
@@ -71,7 +217,54 @@ def exists_prompt(output, prompt):
             return False
     return True
 
-def build_hash(path, output, algo=str(), big_endian=False):
+def align(offs):
+    return (offs + 0x7FF) & ~0x7FF
+
+def read_hash_table(file):
+    # Returns the endianness, whether it's a split Wii archive, and the
+    # hash, offset and size of every entry in the order they're stored
+    file.seek(0x0)
+    hash_id = file.read(0x4)
+    assert hash_id in HASHES, ERR_HARC
+
+    endian = "little" if hash_id == HASH else "big"
+    file_count = int.from_bytes(file.read(0x4), endian)
+
+    # Bully SE Wii fix (no full support yet)
+    file.seek(0x14)
+    is_wii_fsb = not int.from_bytes(file.read(0x8), endian)
+    file.seek(0x8)
+
+    # the whole table is read and unpacked at once, then split into
+    # columns, which is faster than unpacking it entry by entry
+    fields = 5 if is_wii_fsb else 3
+    table = struct.unpack(f"{'<' if endian == 'little' else '>'}{file_count * fields}I", file.read(file_count * fields * 0x4))
+    return endian, is_wii_fsb, list(table[0::fields]), list(table[1::fields]), list(table[2::fields])
+
+def get_entry_size(file_map, offs, size):
+    if file_map[offs:offs + 0x4] in {b"SDBK", b"KBDS"}:
+        # X360/PC Bully Scholarship Edition hack
+        size += 0x800
+    return size
+
+def build_hash(path, output, algo=str(), big_endian=False, jobs=0, quiet=False):
+    def read_file(file_path):
+        with open(file_path, "rb") as in_file:
+            return in_file.read()
+
+    def read_files():
+        # input files are read ahead on a thread pool while the previous ones
+        # are being written, up to a window of files to keep memory bounded
+        queue = deque()
+        threads = jobs if jobs > 0 else os.cpu_count()
+        with ThreadPoolExecutor(threads) as pool:
+            for hash in hash_dict:
+                queue.append(pool.submit(read_file, os.path.join(path, hash_dict[hash])))
+                if len(queue) >= threads * 2:
+                    yield queue.popleft().result()
+            while queue:
+                yield queue.popleft().result()
+
     def seek_align():
         offset = file.tell()
         if not offset & 0x7FF: return offset
@@ -110,10 +303,11 @@ def build_hash(path, output, algo=str(), big_endian=False):
     os.makedirs(os.path.split(output)[0], exist_ok=True)
     with open(output, "wb") as file:
         file.seek(0x8 + entries * 0xC)
-        for hash in hash_dict:
-            print("Writing", hash_dict[hash])
-            with open(os.path.join(path, hash_dict[hash]), "rb") as in_file:
-                data = in_file.read()
+        for idx, (hash, data) in enumerate(zip(hash_dict, read_files()), 1):
+            if quiet:
+                print_progress(idx, entries)
+            else:
+                print("Writing", hash_dict[hash])
             offs = seek_align()
             assert offs in INT_MAX_RANGE, ERR_SIZE
             size = file.write(data)
@@ -149,12 +343,10 @@ def build_hash(path, output, algo=str(), big_endian=False):
 
         print("File name list written at", outname)
 
-def read_hash(path, body=str(), output=str(), namepath=str(), algo=str(), threshold=70):
-    def read_int():
-        return int.from_bytes(file.read(0x4), endian)
-
-    def get_name_dict():
-        return dict(sorted([(calc_hash(name.strip() + ext), name.strip() + ext) for name in name_list if name.strip()]))
+def read_hash(path, body=str(), output=str(), namepath=str(), algo=str(), threshold=70, jobs=0, quiet=False):
+    def extract_file(outpath, offs, size):
+        with open(outpath, "wb") as out_file:
+            return copy_data(file, file_map, out_file, offs, size)
 
     if not output:
         output = os.path.splitext(path)[0]
@@ -164,78 +356,235 @@ def read_hash(path, body=str(), output=str(), namepath=str(), algo=str(), thresh
         return
 
     with open(path, "rb") as file:
-        hash_id = file.read(0x4)
-        assert hash_id in HASHES, ERR_HARC
-
-        endian = "little" if hash_id == HASH else "big"
-        file_count = read_int()
-
-        # Bully SE Wii fix (no full support yet)
-        file.seek(0x14)
-        is_wii_fsb = not read_int() | read_int()
-        file.seek(0x8)
-
-        hash_list = list()
-        offs_list = list()
-        size_list = list()
-        for i in range(file_count):
-            hash_list.append(read_int())
-            offs_list.append(read_int())
-            size_list.append(read_int())
-            if is_wii_fsb:
-                file.seek(0x8, 1)
+        endian, is_wii_fsb, hash_list, offs_list, size_list = read_hash_table(file)
+        file_count = len(hash_list)
 
     name_dict = dict()
     if namepath:
-        calc_hash = get_hash_func(algo)
         assert 0 <= threshold <= 100, ERR_THLD
+        algos = [algo.lower()] if algo else list(HASH_STATES)
+        assert all(algo in HASH_STATES for algo in algos), ERR_ALGO
         with open(namepath, "r") as name_file:
             name_list = name_file.read().splitlines()
 
-        name_match = dict([(x, int()) for x in ("", ".rsm", ".stm")])
-        for ext in name_match:
-            name_dict = get_name_dict()
-            for hash in hash_list:
-                if hash in name_dict:
-                    name_match[ext] += 1
-            if name_match[ext] >= file_count:
-                print("Name list validated" + ("!" if ext == "" else f" with the additional extension {ext}!"))
-                break
+        # detect the algorithm and extension on an evenly spread sample of the
+        # names first, so that the full list only gets hashed once, with those
+        hash_count = dict()
+        for hash in hash_list:
+            hash_count[hash] = hash_count.get(hash, 0) + 1
+        sample_list = name_list[::max(len(name_list) // NAME_SAMPLES, 1)]
+        sample_match = dict()
+        for algo in algos:
+            sample_hashes = hash_names(sample_list, algo, NAME_EXTS)
+            for idx, ext in enumerate(NAME_EXTS):
+                sample_match[algo, ext] = sum(hashes[idx] in hash_count for name, hashes in sample_hashes)
+        algo, ext = max(sample_match, key=sample_match.get)
+
+        name_hashes = [(name, hashes[0]) for name, hashes in hash_names(name_list, algo, (ext,))]
+        max_match = sum(hash_count[hash] for hash in set(hash for name, hash in name_hashes) if hash in hash_count)
+        algo_name = f" using the {HASH_NAMES[algo]} algorithm" if len(algos) > 1 else str()
+
+        accept = True
+        if max_match >= file_count:
+            print("Name list validated" + ("" if ext == "" else f" with the additional extension {ext}") + algo_name + "!")
         else:
             print("The provided name list does not match the Hash archive.")
-            for ext in name_match:
-                name_match[ext] = name_match[ext] / file_count * 100
-            max_match = max(name_match.values())
-            if max_match > threshold:
-                ext = list(name_match.keys())[list(name_match.values()).index(max_match)]
-                name_dict = get_name_dict()
-                print("However, hashes", "without an additional extension" if ext == "" else f"with the additional extension {ext}", f"matched {round(max_match, 2)}% of the name list.")
-            else:
-                name_dict = dict()
-
-    with open(body if body else path, "rb") as file:
+            max_match = max_match / file_count * 100
+            accept = max_match > threshold
+            if accept:
+                print("However, hashes", "without an additional extension" if ext == "" else f"with the additional extension {ext}", f"matched {round(max_match, 2)}% of the name list{algo_name}.")
+
+        # the sorted order keeps the same name as before on any collisions
+        dir_match = dict()
+        for name, hash in sorted(name_hashes):
+            if accept:
+                name_dict[hash] = name + ext
+            dir_name = os.path.split(name.replace("\\", "/"))[0] + "/"
+            matched, total = dir_match.get(dir_name, (0, 0))
+            dir_match[dir_name] = (matched + (hash in hash_count), total + 1)
+        print("Name list matches per directory:")
+        for dir_name, (matched, total) in sorted(dir_match.items()):
+            print(f"{matched / total * 100:>7.2f}%  {matched:>6}/{total:<6} {dir_name}")
+
+    with open(body if body else path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as file_map:
+        # entries sharing an output path would be written by two workers at
+        # once, so only the one with the highest offset is kept, which is the
+        # one that ended up in the file back when they were written in order
+        file_list = dict()
         for hash, offs, size in sorted(zip(hash_list, offs_list, size_list), key=lambda x: x[1]):
             name = name_dict.get(hash, os.path.join(HASHED, f"{hash:08X}")) # + {b"RSTM": ".rsm", b"STMA": ".stm"}.get(file_data[:0x4], "")
             name = name.replace("\\", "/") if POSIX_SEP else name.replace("/", "\\")
             outpath = os.path.join(output, name)
-            file.seek(offs)
-            file_data = file.read(size)
-            if file_data.startswith((b"SDBK", b"KBDS")):
-                # X360/PC Bully Scholarship Edition hack
-                file_data += file.read(0x800)
-            print("Writing", outpath)
-            os.makedirs(os.path.split(outpath)[0], exist_ok=True)
-            with open(outpath, "wb") as out_file:
-                out_file.write(file_data)
+            file_list[os.path.normcase(outpath)] = (outpath, offs, get_entry_size(file_map, offs, size))
+        file_list = list(file_list.values())
+
+        for dir_path in set(os.path.split(outpath)[0] for outpath, offs, size in file_list):
+            os.makedirs(dir_path, exist_ok=True)
+
+        # the copies are done by the OS (or on the mapped file) with explicit
+        # offsets, so the worker threads can all share the same input file
+        with ThreadPoolExecutor(jobs if jobs > 0 else os.cpu_count()) as pool:
+            results = [pool.submit(extract_file, *entry) for entry in file_list]
+            for idx, ((outpath, offs, size), result) in enumerate(zip(file_list, results), 1):
+                result.result()
+                if quiet:
+                    print_progress(idx, len(file_list))
+                else:
+                    print("Writing", outpath)
 
     print("\nSuccess! Done extracting.")
 
+# Patch layout, all little endian:
+#   0x00  "HPch"
+#   0x04  entry count of the new archive
+#   0x08  payload count
+#   0x0C  "Hash" ID of the new archive, for its endianness
+#   0x10  SHA-1 of the original archive header, which the patch applies to
+#   0x30  hash and size of every entry in the new archive
+#         hash, patch offset and length of every changed or added payload
+#         payloads
+# The entry offsets aren't stored, as they're decided when applying it.
+def diff_hash(path, new_path, output, jobs=0):
+    def get_digest(file_map, offs, size):
+        with memoryview(file_map) as view:
+            return hashlib.sha1(view[offs:offs + size]).digest()
+
+    def is_same(old_offs, new_offs, size):
+        return get_digest(old_map, old_offs, size) == get_digest(new_map, new_offs, size)
+
+    def get_bytes(int):
+        return int.to_bytes(0x4, "little")
+
+    def get_length(file_map, offs, size):
+        # the SDBK/KBDS padding can reach past the end of the archive, where
+        # fewer bytes would be copied than the payload table says
+        return min(get_entry_size(file_map, offs, size), len(file_map) - offs)
+
+    output = os.path.abspath(output)
+    if not exists_prompt(output, "Output file already exists. Overwrite?"):
+        return
+
+    with open(path, "rb") as old_file, mmap.mmap(old_file.fileno(), 0, access=mmap.ACCESS_READ) as old_map, \
+         open(new_path, "rb") as new_file, mmap.mmap(new_file.fileno(), 0, access=mmap.ACCESS_READ) as new_map:
+        old_endian, old_split, *old_table = read_hash_table(old_file)
+        new_endian, new_split, *new_table = read_hash_table(new_file)
+        assert not old_split and not new_split, ERR_SPLT
+        old_entries = {hash: (offs, get_length(old_map, offs, size)) for hash, offs, size in zip(*old_table)}
+        new_entries = [(hash, offs, size, get_length(new_map, offs, size)) for hash, offs, size in zip(*new_table)]
+
+        # only the contents of entries which kept their size need comparing,
+        # hashlib lets go of the GIL so the digests are done on a thread pool
+        print("Comparing archives...")
+        compare = [(hash, old_entries[hash][0], offs, length) for hash, offs, size, length in new_entries
+                   if old_entries.get(hash, (0, None))[1] == length]
+        with ThreadPoolExecutor(jobs if jobs > 0 else os.cpu_count()) as pool:
+            results = pool.map(lambda entry: is_same(*entry[1:]), compare)
+            same = set(entry[0] for entry, result in zip(compare, results) if result)
+        changed = [(hash, offs, length) for hash, offs, size, length in new_entries if hash not in same]
+        removed = len(old_entries.keys() - set(hash for hash, offs, size, length in new_entries))
+        print(f"{len(changed)} entries changed or added, {removed} removed, {len(same)} unchanged.")
+
+        header = [PATCH_ID, get_bytes(len(new_entries)), get_bytes(len(changed)), new_map[:0x4],
+                  hashlib.sha1(old_map[:0x8 + len(old_table[0]) * 0xC]).digest(), bytes(0xC)]
+        header.extend(get_bytes(hash) + get_bytes(size) for hash, offs, size, length in new_entries)
+        data_offs = 0x30 + len(new_entries) * 0x8 + len(changed) * 0xC
+        for hash, offs, length in changed:
+            header.append(get_bytes(hash) + get_bytes(data_offs) + get_bytes(length))
+            data_offs += length
+
+        os.makedirs(os.path.split(output)[0], exist_ok=True)
+        # unbuffered, as the payloads get copied at the file position by the OS
+        with open(output, "wb", buffering=0) as out_file:
+            out_file.write(b"".join(header))
+            for hash, offs, length in changed:
+                copy_data(new_file, new_map, out_file, offs, length)
+
+    print("\nSuccess! Patch written at", output)
+
+def apply_hash(path, patch_path):
+    def write_data(offs, in_file, in_map, in_offs, size, fill):
+        # pads the rest of the slot, so no leftovers of the old entry remain
+        file.seek(offs)
+        size = copy_data(in_file, in_map, file, in_offs, size)
+        file.write(bytes(fill - size))
+
+    with open(patch_path, "rb") as patch_file, mmap.mmap(patch_file.fileno(), 0, access=mmap.ACCESS_READ) as patch_map:
+        assert patch_map[:0x4] == PATCH_ID, ERR_PTCH
+        entry_count, payload_count = struct.unpack_from("<II", patch_map, 0x4)
+        endian = "little" if patch_map[0xC:0x10] == HASH else "big"
+        table_offs = 0x30 + entry_count * 0x8
+        entries = list(struct.iter_unpack("<II", patch_map[0x30:table_offs]))
+        payloads = {hash: (offs, size) for hash, offs, size in
+                    struct.iter_unpack("<III", patch_map[table_offs:table_offs + payload_count * 0xC])}
+
+        # unbuffered, as the payloads get copied at the file position by the OS
+        with open(path, "r+b", buffering=0) as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as file_map:
+            base_endian, is_wii_fsb, hash_list, offs_list, size_list = read_hash_table(file)
+            assert not is_wii_fsb, ERR_SPLT
+            assert hashlib.sha1(file_map[:0x8 + len(hash_list) * 0xC]).digest() == patch_map[0x10:0x24], ERR_BASE
+
+            # each entry can grow up to the next entry's offset, unless its data
+            # is shared with another entry, which must then be left untouched
+            end = align(len(file_map))
+            offs_count = dict()
+            for offs in offs_list:
+                offs_count[offs] = offs_count.get(offs, 0) + 1
+            next_offs = dict(zip(sorted(offs_count), sorted(offs_count)[1:] + [end]))
+            slots = {hash: (offs, get_entry_size(file_map, offs, size), next_offs[offs] - offs if offs_count[offs] == 1 else 0)
+                     for hash, offs, size in zip(hash_list, offs_list, size_list)}
+
+            # entries in the way of a larger header get moved too, so
+            # nothing is overwritten until the new header is written last
+            header_size = 0x8 + entry_count * 0xC
+            header = [(0x68736148).to_bytes(0x4, endian), entry_count.to_bytes(0x4, endian)]
+            writes = list()
+            moved = 0
+            for hash, size in entries:
+                if hash in payloads:
+                    data_offs, length = payloads[hash]
+                    source = (patch_file, patch_map, data_offs, length)
+                    offs, old_length, slot_size = slots.get(hash, (0, 0, 0))
+                    in_place = offs >= header_size and length <= slot_size
+                else:
+                    assert hash in slots, ERR_BASE
+                    offs, length, slot_size = slots[hash]
+                    source = (file, file_map, offs, length)
+                    in_place = offs >= header_size
+                    slot_size = length if in_place else 0
+                if in_place:
+                    if hash in payloads:
+                        writes.append((offs, *source, slot_size))
+                else:
+                    writes.append((end, *source, align(length)))
+                    offs = end
+                    end = align(end + length)
+                    moved += 1
+                header.append(hash.to_bytes(0x4, endian) + offs.to_bytes(0x4, endian) + size.to_bytes(0x4, endian))
+            assert end - 1 in INT_MAX_RANGE, ERR_SIZE
+
+            print("Writing entries...")
+            for write in writes:
+                write_data(*write)
+
+            print("Writing archive header...")
+            file.seek(0x0)
+            file.write(b"".join(header))
+            old_header_size = 0x8 + len(hash_list) * 0xC
+            if old_header_size > header_size:
+                file.write(bytes(old_header_size - header_size))
+
+    print(f"{len(writes) - moved} entries patched in place, {moved} moved to the end of the archive.")
+    print("\nSuccess! Patch applied to", path)
+
 ERR_ALGO = "Error! Invalid hash algorithm. Please provide the hashing algorithm with -a | --algo\nValid algorithms are 'Bully' and 'MClub'"
+ERR_BASE = "Error! The patch was made for a different version of this Hash archive."
 ERR_COLL = "Error! A hash collision has occurred. The hash 0x{:08X} resolves to:\n- {}\n- {}"
 ERR_DICT = "Error! No files were found at the given path."
 ERR_HARC = "Error! Not a Hash archive."
 ERR_HASH = "Error! Invalid hash detected."
+ERR_PTCH = "Error! Not a Hash archive patch."
 ERR_SIZE = "Error! Archive too large."
+ERR_SPLT = "Error! Split Hash archives (Bully Wii Speech BIN+FSB) aren't supported."
 ERR_THLD = "Error! Invalid threshold value."
 
 if __name__ == "__main__":
@@ -249,20 +598,43 @@ if __name__ == "__main__":
     extract_parser.add_argument("-b", "--body", type=str, default=str(), help="path to the archive body (Bully Wii split Speech BIN+FSB)")
     extract_parser.add_argument("-o", "--output", type=str, default=str(), help="path to the output folder")
     extract_parser.add_argument("-nl", "--namelist", type=str, default=str(), help="path to a text file of names")
-    extract_parser.add_argument("-a", "--algo", type=str, default=str(), help="{Bully,MClub} filename hashing algorithm")
+    extract_parser.add_argument("-a", "--algo", type=str, default=str(), help="{Bully,MClub} filename hashing algorithm (default=detect)")
     extract_parser.add_argument("-th", "--threshold", type=int, default=70, help="threshold percentage how many names should match to accept; (default=70)")
-    extract_parser.set_defaults(read=True, func=read_hash)
+    extract_parser.add_argument("-j", "--jobs", type=int, default=0, help="amount of worker threads (default=all cores)")
+    extract_parser.add_argument("-q", "--quiet", action="store_true", help="show a progress bar instead of every file written")
+    extract_parser.set_defaults(mode="X", func=read_hash)
 
     build_parser = subparsers.add_parser("B", help="builds a new Hash archive (Python 3.9 or newer)")
     build_parser.add_argument("path", type=str, help="path to the input directory")
     build_parser.add_argument("output", type=str, help="path to the output Hash archive")
     build_parser.add_argument("-a", "--algo", type=str, default=str(), help="{Bully,MClub} filename hashing algorithm")
     build_parser.add_argument("-be", "--bigendian", action="store_true", help="build in big endian (Wii, Xbox 360)")
-    build_parser.set_defaults(read=False, func=build_hash)
+    build_parser.add_argument("-j", "--jobs", type=int, default=0, help="amount of threads reading files ahead (default=all cores)")
+    build_parser.add_argument("-q", "--quiet", action="store_true", help="show a progress bar instead of every file written")
+    build_parser.set_defaults(mode="B", func=build_hash)
+
+    diff_parser = subparsers.add_parser("D", aliases=["diff"], help="writes a patch of the changes between two Hash archives (Python 3.8 or newer)")
+    diff_parser.add_argument("path", type=str, help="path to the original Hash archive")
+    diff_parser.add_argument("new", type=str, help="path to the modified Hash archive")
+    diff_parser.add_argument("output", type=str, help="path to the output patch file")
+    diff_parser.add_argument("-j", "--jobs", type=int, default=0, help="amount of threads comparing entries (default=all cores)")
+    diff_parser.set_defaults(mode="D", func=diff_hash)
+
+    apply_parser = subparsers.add_parser("A", aliases=["apply"], help="applies a patch to a Hash archive in place (Python 3.8 or newer)")
+    apply_parser.add_argument("path", type=str, help="path to the Hash archive to patch")
+    apply_parser.add_argument("patch", type=str, help="path to the patch file")
+    apply_parser.set_defaults(mode="A", func=apply_hash)
 
     args = parser.parse_args()
     try:
-        func_args = (args.path, args.body, args.output, args.namelist, args.algo, args.threshold) if args.read else (args.path, args.output, args.algo, args.bigendian)
+        if args.mode == "X":
+            func_args = (args.path, args.body, args.output, args.namelist, args.algo, args.threshold, args.jobs, args.quiet)
+        elif args.mode == "B":
+            func_args = (args.path, args.output, args.algo, args.bigendian, args.jobs, args.quiet)
+        elif args.mode == "D":
+            func_args = (args.path, args.new, args.output, args.jobs)
+        else:
+            func_args = (args.path, args.patch)
         args.func(*func_args)
     except AttributeError:
         print("Error! Bad arguments given. Use -h or --help to show valid arguments.")
@@ -36,9 +36,9 @@
 #   - Red Dead Redemption: Undead Nightmare
 #   - Red Dead Redemption (Remaster)
 
-# Written by Edness   v1.3.4   2022-10-09 - 2024-04-01
+# Written by Edness   v1.3.7   2022-10-09 - 2026-10-18
 
-import json, os, struct
+import json, os, struct, time
 
 SINT8 = lambda x: x - ((x & 0x80) << 1)
 UINT32 = lambda x: x & 0xFFFFFFFF
@@ -88,7 +88,72 @@ def hash_v2(str):
     hash ^= hash >> 11
     return UINT32((hash << 15) + hash)
 
+class HashV0:
+    # Resumable hash_v0/v1/v2 states, so that a shared label prefix only
+    # has to be hashed once before appending each of the label endings.
+    # Unlike hash_v0, the state doesn't strip the label's tabs/newlines.
+    def __init__(self, str=""):
+        self.hash = int()
+        self.update(str)
+
+    def update(self, str):
+        if type(str) is not bytes:
+            str = str.encode(ENC_LABEL)
+        hash = self.hash
+        for chr in str:
+            hash = UINT32((hash << 4) + SINT8(chr))
+            if mask := hash & 0xF0000000:
+                hash ^= mask >> 24 ^ mask
+        self.hash = hash
+        return self
+
+    def copy(self):
+        state = self.__class__()
+        state.hash = self.hash
+        return state
+
+    def digest(self):
+        return self.hash
+
+class HashV1(HashV0):
+    def update(self, str):
+        if type(str) is not bytes:
+            str = str.encode(ENC_LABEL)
+        hash = self.hash
+        for chr in str:
+            hash = UINT32(hash + SINT8(chr))
+            hash = UINT32((hash << 10) + hash)
+            hash ^= hash >> 6
+        self.hash = hash
+        return self
+
+    def digest(self):
+        hash = UINT32((self.hash << 3) + self.hash)
+        hash ^= hash >> 11
+        return UINT32((hash << 15) + hash)
+
+class HashV2(HashV1):
+    def update(self, str):
+        if type(str) is not bytes:
+            str = str.replace("\\", "/").encode(ENC_LABEL)
+        hash = self.hash
+        for chr in str.replace(b"\\", b"/").lower():
+            hash += chr
+            hash = UINT32((hash << 10) + hash)
+            hash ^= hash >> 6
+        self.hash = hash
+        return self
+
 HASH_FUNCS = (hash_v0, hash_v1, hash_v2)
+HASH_SAMPLES = 64  # labels to rule out the wrong hash algorithms with
+
+# Language entry layout per table version, as the fields before the font
+# (hash, font size in v2, font length) and after the text (float, byte scales)
+STRTBL_ENTRIES = {
+    0: (struct.Struct("<II"), struct.Struct("<ff")),
+    1: (struct.Struct("<II"), struct.Struct("<ff")),
+    2: (struct.Struct("<IHI"), struct.Struct("<ffBB"))
+}
 
 #def determine_v0_hash(hashes, label, hash_func):
 #    # strtbl v0 has no labels, but this surprisingly can find many hash matches
@@ -127,8 +192,15 @@ def determine_hash(hashes, labels):
         else:
             return hash_map
 
-    for ver, func in enumerate(HASH_FUNCS):
-        hash_map = get_hash_map(func)
+    # A small sample of labels spread across the table rules out the wrong
+    # algorithms first, as they'd otherwise often get deep into the labels
+    # before failing, then only the remaining ones are checked on all of them
+    hashes = set(hashes)
+    sample = labels[::max(len(labels) // HASH_SAMPLES, 1)][:HASH_SAMPLES]
+    vers = [ver for ver, func in enumerate(HASH_FUNCS) if all(func(label) in hashes for label in sample)]
+
+    for ver in vers:
+        hash_map = get_hash_map(HASH_FUNCS[ver])
         if hash_map is not None:
             return hash_map, ver
     raise RuntimeError(ERR_ALGO)
@@ -154,16 +226,29 @@ def determine_hash(hashes, labels):
 #    print("\nPreparing output 2 of 2...")
 #    return json_unindent(json_data, f"\"{KEY_LNG_FONT}\": {{", "}")
 
-def json_fixup_fonts(json_data):
-    # and this is 1000x faster than the "safer" method above
-    font = f"\"{KEY_LNG_FONT}\": "
-    json_data = json_data.splitlines()
-    for i, ln in enumerate(json_data):
-        if ln.strip().startswith(font):
-            ln = ln.split(font)
-            ln[-1] = ln[-1][1:-1].replace(r'\"', '"').replace("\\\\", "\\")
-            json_data[i] = font.join(ln)
-    return "\n".join(json_data)
+def json_write_output(file, output):
+    # and this writes the exact same layout as  json.dumps(output, indent=4,
+    # ensure_ascii=False)  with the pre-encoded font keys inlined, straight
+    # to the file one label at a time instead of as one huge string first
+    encode = json.encoder.encode_basestring
+    config = json.dumps(output[KEY_CONFIG], indent=4, ensure_ascii=False).replace("\n", "\n    ")
+    file.write(f"{{\n    {encode(KEY_CONFIG)}: {config},\n    {encode(KEY_DATA)}: {{")
+    label_sep = "\n"
+    for label, langs in output[KEY_DATA].items():
+        data = [label_sep, " " * 8, encode(label), ": {"]
+        lang_sep = "\n"
+        for lang, entry in langs.items():
+            data += [lang_sep, " " * 12, encode(lang), ": {"]
+            entry_sep = "\n"
+            for key, value in entry.items():
+                data += [entry_sep, " " * 16, encode(key), ": ", value if key == KEY_LNG_FONT else encode(value)]
+                entry_sep = ",\n"
+            data.append("\n" + " " * 12 + "}" if entry else "}")
+            lang_sep = ",\n"
+        data.append("\n" + " " * 8 + "}" if langs else "}")
+        file.write("".join(data))
+        label_sep = ",\n"
+    file.write("\n    }\n}" if output[KEY_DATA] else "}\n}")
 
 def exists_prompt(output, prompt):
     if os.path.exists(output):
@@ -176,27 +261,51 @@ def exists_prompt(output, prompt):
     return True
 
 def parse_strtbl(path, outpath=str()):
-    def read_float():
-        return struct.unpack("<f", file.read(0x4))[0]
-
-    def read_int(bytes):
-        return int.from_bytes(file.read(bytes), "little")
+    def read_int(offs):
+        return int.from_bytes(data[offs:offs + 0x4], "little")
 
-    def read_str(encoding, *, null_end=True, null_len=False):
+    def read_strs(offs, entries, encoding):
+        # Labels are NULL terminated, and all of them are decoded at once.  Any
+        # NULL before the end of a label splits it in two and fails the count
         null_term = "\x00".encode(encoding)
-        char_size = len(null_term)
-        str_len = read_int(0x4)
-        if null_end:  # fonts in table v1 and v2 don't include the NULL terminator
-            string = b"".join(iter(lambda: file.read(char_size), null_term)).decode(encoding)
-            if null_len:  # str_len includes the NULL terminator for the text data length
-                str_len -= 1
-        else:
-            string = file.read(str_len * char_size).decode(encoding)
-            if null_len:
-                if str_len: str_len -= 1
-                string = string[:-1]
-        assert len(string) == str_len, ERR_STRLEN
-        return string
+        strs = list()
+        for i in range(entries):
+            str_len = read_int(offs)
+            offs += 0x4
+            strs.append(data[offs:offs + str_len])
+            offs += str_len + len(null_term)
+            assert data[offs - len(null_term):offs] == null_term, ERR_STRLEN
+        strs = null_term.join(strs).decode(encoding).split("\x00") if strs else list()
+        assert len(strs) == entries, ERR_STRLEN
+        return strs
+
+    def read_lang(offs):
+        # Returns every entry of a language block as lists of raw values, the
+        # strings are only sliced out here and get decoded in bulk afterwards
+        entries = read_int(offs)
+        offs += 0x4
+        hash_list = list()
+        size_list = list()
+        font_list = list()
+        text_list = list()
+        scale_list = list()
+        entry_head, entry_tail = STRTBL_ENTRIES[ver_strtbl]
+        for i in range(entries):
+            hash, *size, font_len = entry_head.unpack_from(data, offs)
+            offs += entry_head.size
+            hash_list.append(hash)
+            size_list.append(size[0] if size else None)
+            font_list.append(data[offs:offs + font_len])
+            offs += font_len
+            # str_len includes the NULL terminator for the text data length
+            str_len = read_int(offs)
+            assert str_len, ERR_STRLEN
+            offs += 0x4 + str_len * 2
+            text_list.append(data[offs - str_len * 2:offs - 2])
+            assert data[offs - 2:offs] == b"\x00\x00", ERR_STRLEN
+            scale_list.append(entry_tail.unpack_from(data, offs))
+            offs += entry_tail.size
+        return hash_list, size_list, font_list, text_list, scale_list
 
     path = os.path.abspath(path)
     if not outpath:
@@ -207,133 +316,129 @@ def parse_strtbl(path, outpath=str()):
         return
 
     output = dict()
-    file_size = os.path.getsize(path)
     with open(path, "rb") as file:
-        # there's no clear header identifier, so stricter checking is done here
-        # it's always little endian regardless of platform (GCN, PS3, 360, Wii)
-        languages = read_int(0x4)
-        assert not languages >> 16, ERR_LANGS
-        lang_ptrs = [read_int(0x4) for x in range(languages)]
-        assert sorted(lang_ptrs) == lang_ptrs, ERR_LANGS
-        label_offs = 0x4 + languages * 0x4
-        assert label_offs <= file_size, ERR_LANGS
-        for lang in lang_ptrs: assert label_offs <= lang <= file_size, ERR_LANGS
-
-        unique_langs = sorted(set(lang_ptrs))
-        if unique_langs[-1] == file_size:
-            unique_langs.pop()
-
-        print("Determining .STRTBL revision...")  #end=" ", flush=True
-
-        hashes = list()
-        #labels = list()
-        if lang_ptrs[0] == label_offs:  # table v0
-            file.seek(lang_ptrs[0])
-            entries = read_int(0x4)
-            for i in range(entries):
-                hashes.append(read_int(0x4))
-                file.seek(read_int(0x4), 1)  # font (has null terminator)
-                #labels.append(read_str(0x2, "UTF-16LE", null_len=True))
-                file.seek(read_int(0x4) * 2, 1)
-                file.seek(0x8, 1)  # 2 x floats
-            hash_map = dict([(x, KEY_HASHED.format(x)) for x in sorted(hashes)])
-            ver_strtbl = 0
-            ver_hash = 0
-
-        else:  # table v1, v2
-            file.seek(label_offs)
-            ver_strtbl = read_int(0x4)
-            assert ver_strtbl in {256, 512}, ERR_VER
-            ver_strtbl >>= 8
-            entries = read_int(0x4)
-            labels = [read_str(ENC_LABEL) for x in range(entries)]
-
-            file.seek(lang_ptrs[0])
-            entries = read_int(0x4)
-            for i in range(entries):
-                hashes.append(read_int(0x4))
-                if ver_strtbl == 2:
-                    file.seek(0x2, 1)
-                file.seek(read_int(0x4), 1)  # font (no null terminator)
-                file.seek(read_int(0x4) * 2, 1)  # string data
-                file.seek(0x8, 1)  # 2 x floats
-                if ver_strtbl == 2:
-                    file.seek(0x2, 1)
-
-            hash_map, ver_hash = determine_hash(hashes, labels)
-            # Every 6th gen title has 10 entries, and it started slowly
-            # increasing with Wii Table Tennis at 11.  While RGPTT uses
-            # hash v0 for whatever reason, afterward everything uses v2
-            # which is just v1 except label hashes are case insensitive
-            if languages > 10 and ver_hash == 1:
-                ver_hash = 2
-
-        #print(f"Hash v{ver_hash}, Table v{ver_strtbl}")
-
-        output[KEY_CONFIG] = dict()
-        output[KEY_CONFIG][KEY_CNF_VERSION] = dict()
-        output[KEY_CONFIG][KEY_CNF_VERSION][KEY_VER_HASH] = ver_hash
-        output[KEY_CONFIG][KEY_CNF_VERSION][KEY_VER_STRTBL] = ver_strtbl
-
-        output[KEY_CONFIG][KEY_CNF_DUPES] = dict()
-        for lang in unique_langs:
-            dupes = lang_ptrs.count(lang) - 1
-            if dupes:
-                lang_idx = KEY_LANG.format(lang_ptrs.index(lang))
-                output[KEY_CONFIG][KEY_CNF_DUPES][lang_idx] = dupes
-
-        output[KEY_CONFIG][KEY_CNF_LANGS] = languages
-        output[KEY_DATA] = dict([(label, dict()) for label in hash_map.values()])
-
-        #for i, lang in enumerate(lang_ptrs):
-        for idx, lang in enumerate(unique_langs):  #, 1):
-            print(f"Reading language {idx + 1} of {len(unique_langs)}...", end="\r")
-            #if lang == file_size: continue
-            file.seek(lang)
-            entries = read_int(0x4)
-            assert entries == len(hash_map), ERR_COUNT
-            lang_idx = KEY_LANG.format(idx)
-            for i in range(entries):
-                label = hash_map[read_int(0x4)]
-                if ver_strtbl == 2:
-                    size = read_int(0x2)
-                font = read_str(ENC_FONT, null_end=False, null_len=(ver_strtbl == 0))
-                string = read_str(ENC_TEXT, null_len=True)
-                scale_f = [round(read_float(), 5), round(read_float(), 5)]
+        data = file.read()
+    file_size = len(data)
+
+    # there's no clear header identifier, so stricter checking is done here
+    # it's always little endian regardless of platform (GCN, PS3, 360, Wii)
+    languages = read_int(0x0)
+    assert not languages >> 16, ERR_LANGS
+    label_offs = 0x4 + languages * 0x4
+    assert label_offs <= file_size, ERR_LANGS
+    lang_ptrs = list(struct.unpack_from(f"<{languages}I", data, 0x4))
+    assert sorted(lang_ptrs) == lang_ptrs, ERR_LANGS
+    for lang in lang_ptrs: assert label_offs <= lang <= file_size, ERR_LANGS
+
+    unique_langs = sorted(set(lang_ptrs))
+    if unique_langs[-1] == file_size:
+        unique_langs.pop()
+
+    print("Determining .STRTBL revision...")  #end=" ", flush=True
+
+    #labels = list()
+    if lang_ptrs[0] == label_offs:  # table v0
+        ver_strtbl = 0
+        lang_data = {lang_ptrs[0]: read_lang(lang_ptrs[0])}
+        hashes = lang_data[lang_ptrs[0]][0]
+        hash_map = dict([(x, KEY_HASHED.format(x)) for x in sorted(hashes)])
+        ver_hash = 0
+
+    else:  # table v1, v2
+        ver_strtbl = read_int(label_offs)
+        assert ver_strtbl in {256, 512}, ERR_VER
+        ver_strtbl >>= 8
+        labels = read_strs(label_offs + 0x8, read_int(label_offs + 0x4), ENC_LABEL)
+
+        lang_data = {lang_ptrs[0]: read_lang(lang_ptrs[0])}
+        hashes = lang_data[lang_ptrs[0]][0]
+        hash_map, ver_hash = determine_hash(hashes, labels)
+        # Every 6th gen title has 10 entries, and it started slowly
+        # increasing with Wii Table Tennis at 11.  While RGPTT uses
+        # hash v0 for whatever reason, afterward everything uses v2
+        # which is just v1 except label hashes are case insensitive
+        if languages > 10 and ver_hash == 1:
+            ver_hash = 2
+
+    #print(f"Hash v{ver_hash}, Table v{ver_strtbl}")
+
+    output[KEY_CONFIG] = dict()
+    output[KEY_CONFIG][KEY_CNF_VERSION] = dict()
+    output[KEY_CONFIG][KEY_CNF_VERSION][KEY_VER_HASH] = ver_hash
+    output[KEY_CONFIG][KEY_CNF_VERSION][KEY_VER_STRTBL] = ver_strtbl
+
+    output[KEY_CONFIG][KEY_CNF_DUPES] = dict()
+    for lang in unique_langs:
+        dupes = lang_ptrs.count(lang) - 1
+        if dupes:
+            lang_idx = KEY_LANG.format(lang_ptrs.index(lang))
+            output[KEY_CONFIG][KEY_CNF_DUPES][lang_idx] = dupes
+
+    output[KEY_CONFIG][KEY_CNF_LANGS] = languages
+    output[KEY_DATA] = dict([(label, dict()) for label in hash_map.values()])
+
+    font_names = dict()
+    font_jsons = dict()
+    #for i, lang in enumerate(lang_ptrs):
+    for idx, lang in enumerate(unique_langs):  #, 1):
+        start_time = time.perf_counter()
+        #if lang == file_size: continue
+        hash_list, size_list, font_list, text_list, scale_list = lang_data.pop(lang, None) or read_lang(lang)
+        assert len(hash_list) == len(hash_map), ERR_COUNT
+        lang_idx = KEY_LANG.format(idx)
+
+        # all of the language's strings are decoded with a single call, any
+        # NULL inside of a string splits it in two and fails the count
+        text_list = b"\x00\x00".join(text_list).decode(ENC_TEXT).split("\x00") if text_list else list()
+        assert len(text_list) == len(hash_list), ERR_STRLEN
+
+        for hash, size, font, string, scale in zip(hash_list, size_list, font_list, text_list, scale_list):
+            label = hash_map[hash]
+            # only a handful of fonts are ever used, so they're decoded once
+            font_name = font_names.get(font)
+            if font_name is None:
+                font_name = font.decode(ENC_FONT)
+                if ver_strtbl == 0:  # fonts in table v1 and v2 don't include the NULL terminator
+                    font_name = font_name[:-1]
+                font_names[font] = font_name
+
+            # I spent sooo much time trying to work out the cleanest way to
+            # store these, and still not sure if this is the right decision
+            output[KEY_DATA][label][lang_idx] = dict()
+            output[KEY_DATA][label][lang_idx][KEY_LNG_TEXT] = string
+
+            #output[KEY_DATA][label][lang_idx][KEY_LNG_FONT] = dict()
+            #output[KEY_DATA][label][lang_idx][KEY_LNG_FONT]["name"] = font
+            #output[KEY_DATA][label][lang_idx][KEY_LNG_FONT]["scale"] = scale
+            #if ver_strtbl == 2:
+            #    output[KEY_DATA][label][lang_idx][KEY_LNG_FONT]["size"] = size
+
+            # This is by miles the fastest method to inline output font keys,
+            # they're written to the output as is by  json_write_output, and
+            # as most entries share the same font settings those are cached
+            font_key = (font_name, size, scale)
+            font_json = font_jsons.get(font_key)
+            if font_json is None:
+                font_data = dict()
+                font_data[KEY_FNT_NAME] = font_name
+                font_data[KEY_FNT_SCALE_FLOAT] = [round(scale[0], 5), round(scale[1], 5)]
                 if ver_strtbl == 2:
                     # int(scale_f) if it's over 1.0f?  extremely rarely used
                     # currently only seen it used in red dead redemption 360
-                    scale_b = [read_int(0x1), read_int(0x1)]
-                    #assert not read_int(0x2), ERR_V2DATA
-
-                # I spent sooo much time trying to work out the cleanest way to
-                # store these, and still not sure if this is the right decision
-                output[KEY_DATA][label][lang_idx] = dict()
-                output[KEY_DATA][label][lang_idx][KEY_LNG_TEXT] = string
-
-                #output[KEY_DATA][label][lang_idx][KEY_LNG_FONT] = dict()
-                #output[KEY_DATA][label][lang_idx][KEY_LNG_FONT]["name"] = font
-                #output[KEY_DATA][label][lang_idx][KEY_LNG_FONT]["scale"] = scale
-                #if ver_strtbl == 2:
-                #    output[KEY_DATA][label][lang_idx][KEY_LNG_FONT]["size"] = size
-
-                # This is by miles the fastest method to inline output font keys
-                font_data = dict()
-                font_data[KEY_FNT_NAME] = font
-                font_data[KEY_FNT_SCALE_FLOAT] = scale_f
-                if ver_strtbl == 2:
-                    font_data[KEY_FNT_SCALE_BYTE] = scale_b
+                    font_data[KEY_FNT_SCALE_BYTE] = [scale[2], scale[3]]
                     font_data[KEY_FNT_SIZE] = size
-                output[KEY_DATA][label][lang_idx][KEY_LNG_FONT] = json.dumps(font_data)
+                font_json = font_jsons[font_key] = json.dumps(font_data)
+            output[KEY_DATA][label][lang_idx][KEY_LNG_FONT] = font_json
+
+        print(f"Read language {idx + 1} of {len(unique_langs)} in {time.perf_counter() - start_time:.2f}s")
 
     # I tried custom NoIndent json encoders, but that was insanely slow.
-    print("\nPreparing output...")
+    print("Writing output...")
     # Red Dead Redemption remaster has a 13MiB .STRTBL, which decodes to
     # 28MiB if using 4 space indentation. And with TABs it becomes 22MiB
-    output = json.dumps(output, indent=4, ensure_ascii=False)  # sort_keys=True
     with open(outpath, "w", encoding=ENC_JSON, newline="\n") as file:
         #json.dump(output, file, indent="\t", ensure_ascii=False, cls=MyEncoder)
-        file.write(json_fixup_fonts(output))  # easiest hack workaround lol
+        json_write_output(file, output)
 
     print("Done! Output written to", outpath)
 
@@ -5,23 +5,124 @@
 # the Xbox 2005-12-08 pre-release build executable
 # and the function at  001A19C0  in the PS2 PAL elf
 
-# Written by Edness   v1.0   2022-11-26
+# Usage:
+#   TRLegendHash.py  "string to hash"
+# Optional:
+#   -f | --file     Treat the input as a path to a list of names, one per line
+#     TRLegendHash.py  "X:\path\to\names.txt"  -f
+
+# Written by Edness   v1.3   2022-11-26 - 2026-10-18
+
+import struct
+from array import array
+
+# The hash is CRC-32/MPEG-2, so instead of the bit by bit loop from the
+# game, it's done with a lookup table, processing 4 bytes at a time with
+# the slice-by-4 tables, each being the table lookups of a byte at that
+# position in the word shifted through the rest of the 4 byte steps.
+def _crc_step(hash, byte):
+    hash ^= byte << 24
+    for i in range(8):
+        hash = (hash * 2 ^ 0x04C11DB7 if hash >> 31 else hash << 1) & 0xFFFFFFFF
+    return hash
+
+def _get_slice_table(shift):
+    table = list()
+    for byte in range(256):
+        hash = byte << shift
+        for i in range(4):
+            hash = hash << 8 & 0xFFFFFFFF ^ _hash_table[hash >> 24]
+        table.append(hash)
+    return tuple(table)
+
+_hash_table = tuple(_crc_step(0x00000000, byte) for byte in range(256))
+_slice_tables = tuple(_get_slice_table(shift) for shift in (24, 16, 8, 0))
+
+def _crc_update(hash, data):
+    t0, t1, t2, t3 = _slice_tables
+    words = len(data) & ~0x3
+    for word, in struct.iter_unpack(">I", data[:words]):
+        word ^= hash
+        hash = t0[word >> 24] ^ t1[word >> 16 & 0xFF] ^ t2[word >> 8 & 0xFF] ^ t3[word & 0xFF]
+    for chr in data[words:]:
+        hash = hash << 8 & 0xFFFFFFFF ^ _hash_table[hash >> 24 ^ chr]
+    return hash
 
 def tr_legend_hash(str):
-    hash = 0xFFFFFFFF
     str = str.lower()
-    for chr in str:
-        hash ^= ord(chr) << 24
-        for i in range(8):
-            hash = (hash * 2 ^ 0x04C11DB7 if hash >> 31 else hash << 1) & 0xFFFFFFFF
+    try:
+        hash = _crc_update(0xFFFFFFFF, str.encode("latin-1"))
+    except UnicodeEncodeError:
+        # The names are 8-bit strings in-game, so anything above U+00FF
+        # can't go through the byte tables, and keeps the bitwise loop
+        hash = 0xFFFFFFFF
+        for chr in str:
+            hash ^= ord(chr) << 24
+            for i in range(8):
+                hash = (hash * 2 ^ 0x04C11DB7 if hash >> 31 else hash << 1) & 0xFFFFFFFF
     return hash ^ 0xFFFFFFFF  # ~hash & 0xFFFFFFFF
 
+def tr_legend_hash_bulk(buffer: bytes):
+    # Hashes a buffer of NULL separated names (e.g. a whole name list read
+    # with  file.read().replace(b"\n", b"\x00") ) in one pass, returning
+    # an array of the hashes in the same order as the names in the buffer
+    t0, t1, t2, t3 = _slice_tables
+    iter_unpack = struct.iter_unpack
+    hashes = array("I")
+    # bytes.lower() only covers ASCII, unlike the str.lower() of tr_legend_hash
+    for name in buffer.decode("latin-1").lower().encode("latin-1").split(b"\x00"):
+        hash = 0xFFFFFFFF
+        words = len(name) & ~0x3
+        for word, in iter_unpack(">I", name[:words]):
+            word ^= hash
+            hash = t0[word >> 24] ^ t1[word >> 16 & 0xFF] ^ t2[word >> 8 & 0xFF] ^ t3[word & 0xFF]
+        for chr in name[words:]:
+            hash = hash << 8 & 0xFFFFFFFF ^ _hash_table[hash >> 24 ^ chr]
+        hashes.append(hash ^ 0xFFFFFFFF)
+    return hashes
+
+def tr_legend_hash_many(strs):
+    # Same as tr_legend_hash for a list of names, vectorized with NumPy
+    strs = [str.decode("latin-1") if type(str) is bytes else str for str in strs]
+    try:
+        import numpy as np
+    except ImportError:
+        return array("I", map(tr_legend_hash, strs))
+
+    strs = "\x00".join(strs).lower()
+    try:
+        chars = strs.replace("\x00", "").encode("latin-1")
+    except UnicodeEncodeError:
+        return array("I", map(tr_legend_hash, strs.split("\x00")))
+    strs = strs.split("\x00")
+    sizes = np.fromiter(map(len, strs), np.int64, len(strs))
+    offsets = np.cumsum(sizes) - sizes
+    chars = np.frombuffer(chars, np.uint8).astype(np.uint32)
+    hash_table = np.array(_hash_table, np.uint32)
+
+    hashes = np.zeros(len(strs), np.uint32)
+    for size in np.unique(sizes):
+        idxs = np.flatnonzero(sizes == size)
+        offs = offsets[idxs]
+        hash = np.full(len(idxs), 0xFFFFFFFF, np.uint32)
+        for col in range(size):
+            hash = hash << np.uint32(8) ^ hash_table[hash >> np.uint32(24) ^ chars[offs + col]]
+        hashes[idxs] = hash ^ np.uint32(0xFFFFFFFF)
+    return array("I", hashes.tobytes())
+
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Hashes filenames into their hashed values used by Tomb Raider: Legend.")
     parser.add_argument("str", type=str)
+    parser.add_argument("-f", "--file", action="store_true", help="treat the input as a path to a list of names")
     args = parser.parse_args()
 
-    hash = tr_legend_hash(args.str)
-    print(f"Hashed string: 0x{hash:08X} ({hash})")
+    if args.file:
+        with open(args.str, "r", encoding="UTF-8") as file:
+            names = file.read().splitlines()
+        for hash, name in zip(tr_legend_hash_many(names), names):
+            print(f"0x{hash:08X}  {name}")
+    else:
+        hash = tr_legend_hash(args.str)
+        print(f"Hashed string: 0x{hash:08X} ({hash})")
@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+# Recovers the names behind unresolved  __hashed  entries left over by
+# the extractors, using wordlist, prefix/suffix, path component and mask
+# attacks.  Every candidate is built from segments (prefix, word, suffix,
+# mask character, ...) and the hash state of each shared prefix is only
+# computed once, so names are never fully built unless they're a match.
+
+# The multiplicative hashes can also be run backwards one character at a
+# time, which allows a meet-in-the-middle attack: a table of the states
+# of every prefix up to half the length is built, and then each target
+# is unwound from the end and looked up in it.  This finds all names up
+# to the given length in roughly the square root of the brute force time.
+
+# Usage:  (requires Python 3.9 or newer)
+#   hash_reverse.py  <algo>  <targets ...>
+#     Targets can be hash values, text files of hash values, .JSON files
+#     with  __hashed_0x  keys, or extracted folders with  __hashed/  files
+#     Attacks:
+#       -w  | --wordlist   <str> Word or path to a list of words (can be repeated)
+#       -p  | --prefix     <str> Prefix or path to a list of prefixes (can be repeated)
+#       -s  | --suffix     <str> Suffix or path to a list of suffixes (can be repeated)
+#       -d  | --depth      <int> Join up to this many words as path components;  default is 1
+#       -m  | --mask       <str> Mask where ? is any charset character and # is any digit
+#       -cs | --charset    <str> Characters used for ? in masks;  default is a-z 0-9 _
+#       -mm | --mitm       <int> Meet-in-the-middle for all charset names up to this length
+#                                (with -p and -s;  spark, bully, bully_str, mc3_str, tsg)
+#     Optional:
+#       -j  | --jobs       <int> Amount of worker processes;  default is all cores
+#       -o  | --output     <str> Path to a text file to append the found names to
+#       -ck | --checkpoint <str> Path to a checkpoint file to resume long runs from
+#
+#   hash_reverse.py  bully  "X:\path\to\Streams"  -p "sound/"  -w "Z:\words.txt"  -s ".rsm"
+#   hash_reverse.py  spark  "X:\path\to\missing.txt"  -m "LEVELS\L_#_#\SECTIONS\s_##.rws"
+#   hash_reverse.py  bully_str  "X:\path\to\strings.json"  -w "Z:\words.txt"  -d 3  -ck "Y:\run.json"
+#   hash_reverse.py  tsg  0x1234ABCD  -p "menu_"  -mm 8
+#
+# Algorithms:
+#   spark      Call of Duty: Finest Hour .PAK names (cod/codfh_hash.py)
+#   bully      Bully RSTM names (bully/BullyHash.py rsm, midnight-club/hash_build.py)
+#   bully_str  Bully string labels (bully/BullyHash.py str, bully/string_bin.py)
+#   mclub      Midnight Club 2 & 3 STMA/RSTM names (midnight-club/MclHash.py aud)
+#   mc2_str    Midnight Club 2 string labels (midnight-club/MclHash.py str2)
+#   mc3_str    Midnight Club 3 string labels (midnight-club/MclHash.py str3)
+#   tsg        The Simpsons Game string labels (simpsons-game/tsg_hash.py)
+#   trl        Tomb Raider: Legend names (other/TRLegendHash.py)
+#   gthash     Criterion GtHash strings (burnout/GtHash.py)
+
+# Written by Edness   v1.0   2026-10-18
+
+import glob, json, math, multiprocessing, os, re, time
+
+# Each algorithm is reimplemented here as a resumable fold over bytes, as
+#   (normalize str -> bytes, initial state, update(state, bytes), digest)
+# where the normalization must be done per character, so that hashing a
+# prefix and then a suffix gives the same result as the whole string.
+
+def _crc_table(poly, reflect):
+    table = list()
+    for byte in range(256):
+        crc = byte if reflect else byte << 24
+        for i in range(8):
+            if reflect:
+                crc = crc >> 1 ^ poly if crc & 0x1 else crc >> 1
+            else:
+                crc = (crc << 1 ^ poly if crc >> 31 else crc << 1) & 0xFFFFFFFF
+        table.append(crc)
+    return tuple(table)
+
+_GT_TABLE = _crc_table(0xEDB88320, True)
+_TRL_TABLE = _crc_table(0x04C11DB7, False)
+
+def _spark_update(hash, data):
+    for chr in data:  # (hash << 40) + hash * 0x1B3
+        hash = chr ^ hash * 0x100000001B3 & 0xFFFFFFFFFFFFFFFF
+    return hash
+
+def _bully_update(hash, data):
+    for chr in data:
+        hash = (hash + chr) * 0x401 & 0xFFFFFFFF
+        hash ^= hash >> 6
+    return hash
+
+def _bully_digest(hash):
+    hash = hash * 9 & 0xFFFFFFFF
+    return (hash ^ hash >> 11) * 0x8001 & 0xFFFFFFFF
+
+def _bully_str_update(hash, data):
+    for chr in data:
+        hash = chr + hash * 0x83 & 0x7FFFFFFF
+    return hash
+
+def _mclub_update(state, data):
+    hash, idx = state
+    for idx, chr in enumerate(data, idx + 1):
+        hash = (hash << 1 | hash >> 31) + chr * idx & 0xFFFFFFFF
+    return hash, idx
+
+def _mc2_str_update(hash, data):
+    for chr in data:
+        hash = (hash << 4) + chr
+        if mask := hash & 0xF0000000:
+            hash ^= mask >> 24 ^ mask
+    return hash
+
+def _tsg_update(hash, data):
+    for chr in data:
+        hash = 0x1003F * hash + chr & 0xFFFFFFFF
+    return hash
+
+def _trl_update(hash, data):
+    for chr in data:
+        hash = hash << 8 & 0xFFFFFFFF ^ _TRL_TABLE[hash >> 24 ^ chr]
+    return hash
+
+def _gthash_update(hash, data):
+    for chr in data:  # signed shift right
+        hash = hash - ((hash & 0x80000000) << 1) >> 8 & 0xFFFFFFFF ^ _GT_TABLE[chr ^ hash & 0xFF]
+    return hash
+
+_latin1 = lambda str: str.encode("latin-1")
+_identity = lambda hash: hash
+
+ALGOS = {
+    "spark": (lambda str: _latin1(str.upper().replace("/", "\\")), 0x84222325CBF29CE4, _spark_update, _identity, 16),
+    "bully": (lambda str: _latin1(str.lower().replace("\\", "/")), 0x00000000, _bully_update, _bully_digest, 8),
+    "bully_str": (lambda str: _latin1(str.upper()), 0x00000000, _bully_str_update, _identity, 8),
+    "mclub": (lambda str: _latin1(str.upper().replace("\\", "/")), (0x00000000, 0), _mclub_update, lambda state: state[0], 8),
+    "mc2_str": (_latin1, 0x00000000, _mc2_str_update, _identity, 8),
+    "mc3_str": (_latin1, 0x00000000, _bully_update, _bully_digest, 8),
+    "tsg": (lambda str: _latin1(str.lower()), 0x00000000, _tsg_update, _identity, 8),
+    "trl": (lambda str: _latin1(str.lower()), 0xFFFFFFFF, _trl_update, lambda hash: hash ^ 0xFFFFFFFF, 8),
+    "gthash": (lambda str: str.encode("UTF-8"), 0xFFFFFFFF, _gthash_update, _identity, 8),
+}
+
+# Per character inverse steps of the invertible algorithms, with the
+# inverse of their final digest step, as (unupdate(state, chr), undigest)
+
+def _unxorshift(hash, shift):
+    # undoes  hash ^= hash >> shift  on a 32-bit value
+    result = hash
+    for i in range(32 // shift):
+        result = hash ^ result >> shift
+    return result
+
+_SPARK_INV = pow(0x100000001B3, -1, 1 << 64)
+_BULLY_INV = pow(0x401, -1, 1 << 32)
+_BULLY_STR_INV = pow(0x83, -1, 1 << 31)
+_TSG_INV = pow(0x1003F, -1, 1 << 32)
+
+def _bully_unupdate(hash, chr):
+    return _unxorshift(hash, 6) * _BULLY_INV - chr & 0xFFFFFFFF
+
+def _bully_undigest(hash):
+    hash = _unxorshift(hash * pow(0x8001, -1, 1 << 32) & 0xFFFFFFFF, 11)
+    return hash * pow(9, -1, 1 << 32) & 0xFFFFFFFF
+
+INVERSES = {
+    "spark": (lambda hash, chr: (hash ^ chr) * _SPARK_INV & 0xFFFFFFFFFFFFFFFF, _identity),
+    "bully": (_bully_unupdate, _bully_undigest),
+    "bully_str": (lambda hash, chr: (hash - chr) * _BULLY_STR_INV & 0x7FFFFFFF, _identity),
+    "mc3_str": (_bully_unupdate, _bully_undigest),
+    "tsg": (lambda hash, chr: (hash - chr) * _TSG_INV & 0xFFFFFFFF, _identity),
+}
+
+HASHED_NAME = re.compile(r"(?:__hashed_0x)?([0-9A-Fa-f]{1,16})")
+
+def get_algo(algo):
+    algo_info = ALGOS.get(algo.lower())
+    assert algo_info is not None, ERR_ALGO.format(", ".join(ALGOS))
+    return algo_info
+
+def read_targets(targets):
+    hashes = set()
+    for target in targets:
+        if os.path.isdir(target):
+            # extracted archives, e.g.  __hashed/0123ABCD  or  __hashed/0123ABCD.rsm
+            for path in glob.iglob(os.path.join(glob.escape(target), "**", "__hashed", "**", "*"), recursive=True):
+                if match := HASHED_NAME.fullmatch(os.path.splitext(os.path.split(path)[1])[0]):
+                    hashes.add(int(match[1], 16))
+        elif os.path.isfile(target):
+            with open(target, "r", encoding="UTF-8") as file:
+                if target.lower().endswith(".json"):
+                    lines = [key for key in json.load(file) if key.startswith("__hashed_0x")]
+                else:
+                    lines = file.read().split()
+            for line in lines:
+                line = line.removeprefix("0x").removeprefix("0X")
+                if match := HASHED_NAME.fullmatch(line):
+                    hashes.add(int(match[1], 16))
+        else:
+            hashes.add(int(target, 0) if target.lower().startswith("0x") else int(target, 16))
+    assert hashes, ERR_TARGETS
+    return hashes
+
+def read_words(words):
+    # each entry can either be the word itself, or a path to a list of them
+    word_list = list()
+    for word in words:
+        if os.path.isfile(word):
+            with open(word, "r", encoding="UTF-8") as file:
+                word_list.extend(ln.strip() for ln in file.read().splitlines() if ln.strip())
+        else:
+            word_list.append(word)
+    return word_list
+
+def get_segments(normalize, words=(), prefixes=(), suffixes=(), depth=1, mask=str(), charset=str()):
+    # Returns a list of candidate spaces, each being a list of segments,
+    # and each segment is a list of (normalized bytes, original string)
+    # alternatives.  Duplicates after normalization are dropped early.
+    def segment(alts):
+        seg = dict()
+        for alt in alts:
+            seg.setdefault(normalize(alt), alt)
+        return list(seg.items())
+
+    mask_segs = list()
+    for char in mask:
+        if char == "?":
+            mask_segs.append(segment(charset))
+        elif char == "#":
+            mask_segs.append(segment("0123456789"))
+        else:
+            mask_segs.append(segment(char))
+
+    head = [segment(prefixes)] if prefixes else []
+    tail = [segment(suffixes)] if suffixes else []
+    spaces = list()
+    if words:
+        word_seg = segment(words)
+        sep_seg = segment("/")
+        for size in range(1, depth + 1):
+            body = [word_seg]
+            for i in range(size - 1):
+                body.extend((sep_seg, word_seg))
+            spaces.append(head + body + mask_segs + tail)
+    elif mask_segs or head or tail:
+        spaces.append(head + mask_segs + tail)
+    assert spaces, ERR_ATTACK
+    return spaces
+
+def get_jobs(spaces, min_jobs):
+    # Splits every candidate space into jobs of fixed leading segment
+    # choices, never splitting the final segment so the tight inner loop
+    # in the workers stays meaningful.
+    jobs = list()
+    for space_idx, space in enumerate(spaces):
+        split = 0
+        total = 1
+        while split < len(space) - 1 and total < min_jobs:
+            total *= len(space[split])
+            split += 1
+        idxs = [()]
+        for seg in space[:split]:
+            idxs = [idx + (alt,) for idx in idxs for alt in range(len(seg))]
+        jobs.extend((space_idx, idx) for idx in idxs)
+    return jobs
+
+def _init_worker(algo, spaces, targets):
+    global WORKER_ALGO, WORKER_SPACES, WORKER_TARGETS
+    WORKER_ALGO = get_algo(algo)
+    WORKER_SPACES = spaces
+    WORKER_TARGETS = targets
+
+def _run_job(job):
+    def search(state, seg_idx):
+        segment = space[seg_idx]
+        if seg_idx == last_seg:
+            for data, text in segment:
+                if (hash := digest(update(state, data))) in targets:
+                    found.append((hash, "".join(path) + text))
+            return
+        for data, text in segment:
+            path.append(text)
+            search(update(state, data), seg_idx + 1)
+            path.pop()
+
+    space_idx, alt_idxs = job
+    normalize, state, update, digest, width = WORKER_ALGO
+    targets = WORKER_TARGETS
+    space = WORKER_SPACES[space_idx]
+    last_seg = len(space) - 1
+
+    path = list()
+    for seg, alt_idx in zip(space, alt_idxs):
+        data, text = seg[alt_idx]
+        state = update(state, data)
+        path.append(text)
+
+    found = list()
+    search(state, len(alt_idxs))
+    return job, found
+
+def load_checkpoint(path, config):
+    if path and os.path.exists(path):
+        with open(path, "r", encoding="UTF-8") as file:
+            checkpoint = json.load(file)
+        if checkpoint["config"] == config:
+            print(f"Resuming from checkpoint, {len(checkpoint['done'])} jobs already done...")
+            return set(map(tuple, checkpoint["done"])), checkpoint["found"]
+        print("Warning! Checkpoint was made with different arguments, starting over.")
+    return set(), list()
+
+def save_checkpoint(path, config, done, found):
+    with open(path + ".tmp", "w", encoding="UTF-8") as file:
+        json.dump({"config": config, "done": sorted(done), "found": found}, file)
+    os.replace(path + ".tmp", path)
+
+def reverse_mitm(algo, targets, length, prefixes=(), suffixes=(), charset=str(), output=str()):
+    def search(state, depth, tail):
+        # unwinds the state from the end, one charset character at a time
+        for name in (forward_all if not depth else forward_full).get(state, ()):
+            found.append((target, name + tail))
+        if depth < back_len:
+            for data, text in chars:
+                search(unupdate(state, data[0]), depth + 1, text + tail)
+
+    normalize, init, update, digest, width = get_algo(algo)
+    assert algo.lower() in INVERSES, ERR_MITM.format(", ".join(INVERSES))
+    unupdate, undigest = INVERSES[algo.lower()]
+    assert length >= 1, ERR_LENGTH
+    targets = read_targets(targets)
+    prefixes = read_words(prefixes) or [str()]
+    suffixes = read_words(suffixes) or [str()]
+    chars = list(dict((normalize(char), char) for char in charset or CHARSET).items())
+    assert all(len(data) == 1 for data, text in chars), ERR_CHARSET
+
+    # the first half is taken by the forward table, which has the states of
+    # all names up to that length, and the names of exactly that length are
+    # kept separately, so the backward half can skip the shorter ones and
+    # every name is only found once (short names through the first table)
+    fwd_len = (length + 1) // 2
+    back_len = length - fwd_len
+    start = time.perf_counter()
+    print(f"Building forward table of {len(prefixes) * sum(len(chars) ** i for i in range(fwd_len + 1)):,} states...")
+    forward_all = dict()
+    forward_full = dict()
+    level = [(update(init, normalize(prefix)), prefix) for prefix in prefixes]
+    for depth in range(fwd_len + 1):
+        for state, name in level:
+            forward_all.setdefault(state, list()).append(name)
+        if depth < fwd_len:
+            level = [(update(state, data), name + text) for state, name in level for data, text in chars]
+    for state, name in level:
+        forward_full.setdefault(state, list()).append(name)
+
+    print(f"Unwinding {len(targets):,} hashes from up to {back_len} characters...")
+    found = list()
+    for target in sorted(targets):
+        end = undigest(target)
+        for suffix in suffixes:
+            state = end
+            for chr in normalize(suffix)[::-1]:
+                state = unupdate(state, chr)
+            search(state, 0, suffix)
+
+    with open(output, "a", encoding="UTF-8") if output else open(os.devnull, "w") as out_file:
+        for hash, name in found:
+            print(f"Found 0x{hash:0{width}X}  {name}")
+            out_file.write(f"{hash:0{width}X}\t{name}\n")
+
+    elapsed = time.perf_counter() - start
+    print(f"\nDone! Found {len(set(hash for hash, name in found))} of {len(targets)} hashes in {elapsed:.2f} seconds.")
+
+def reverse_hash(algo, targets, words=(), prefixes=(), suffixes=(), depth=1, mask=str(), charset=str(), jobs=0, output=str(), checkpoint=str()):
+    normalize, state, update, digest, width = get_algo(algo)
+    assert depth >= 1, ERR_DEPTH
+    targets = read_targets(targets)
+    words, prefixes, suffixes = read_words(words), read_words(prefixes), read_words(suffixes)
+    spaces = get_segments(normalize, words, prefixes, suffixes, depth, mask, charset or CHARSET)
+    processes = jobs if jobs > 0 else os.cpu_count()
+
+    total = sum(math.prod(len(seg) for seg in space) for space in spaces)
+    job_list = get_jobs(spaces, processes * 64)
+    config = [algo.lower(), sorted(targets), words, prefixes, suffixes, depth, mask, charset or CHARSET]
+    done, found = load_checkpoint(checkpoint, config)
+    for hash, name in found:
+        print(f"Found 0x{hash:0{width}X}  {name}")
+    job_list = [job for job in job_list if (job[0], *job[1]) not in done]
+
+    print(f"Searching {total:,} candidates for {len(targets):,} hashes with {processes} processes...")
+    out_file = open(output, "a", encoding="UTF-8") if output else None
+    start = last_save = last_print = time.perf_counter()
+    try:
+        with multiprocessing.Pool(processes, _init_worker, (algo, spaces, targets)) as pool:
+            for idx, (job, job_found) in enumerate(pool.imap_unordered(_run_job, job_list, 16), 1):
+                for hash, name in job_found:
+                    print(f"Found 0x{hash:0{width}X}  {name}")
+                    found.append((hash, name))
+                    if out_file:
+                        out_file.write(f"{hash:0{width}X}\t{name}\n")
+                        out_file.flush()
+                done.add((job[0], *job[1]))
+                if checkpoint and time.perf_counter() - last_save > 30:
+                    save_checkpoint(checkpoint, config, done, found)
+                    last_save = time.perf_counter()
+                if time.perf_counter() - last_print > 1:
+                    print(f"Searched {idx / len(job_list):.1%} of the remaining jobs...", end="\r")
+                    last_print = time.perf_counter()
+    finally:
+        if out_file:
+            out_file.close()
+        if checkpoint:
+            save_checkpoint(checkpoint, config, done, found)
+
+    elapsed = time.perf_counter() - start
+    print(f"\nDone! Found {len(set(hash for hash, name in found))} of {len(targets)} hashes in {elapsed:.2f} seconds.")
+
+CHARSET = "abcdefghijklmnopqrstuvwxyz0123456789_"
+
+ERR_ALGO = "Error! Invalid hash algorithm. Valid algorithms are: {}"
+ERR_ATTACK = "Error! No attack given. Provide a wordlist, prefixes, suffixes or a mask."
+ERR_CHARSET = "Error! Charset characters must stay single bytes after normalization."
+ERR_DEPTH = "Error! Invalid path component depth."
+ERR_LENGTH = "Error! Invalid meet-in-the-middle name length."
+ERR_MITM = "Error! Meet-in-the-middle is only supported for the invertible algorithms: {}"
+ERR_TARGETS = "Error! No target hashes were found."
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reverses hashed names using wordlist, prefix/suffix, path component and mask attacks.")
+    parser.add_argument("algo", type=str, help="{" + ",".join(ALGOS) + "} hashing algorithm")
+    parser.add_argument("targets", type=str, nargs="+", help="hash values, or paths to lists of hashes, .JSON files or extracted folders")
+    parser.add_argument("-w", "--wordlist", type=str, action="append", default=list(), help="word or path to a list of words")
+    parser.add_argument("-p", "--prefix", type=str, action="append", default=list(), help="prefix or path to a list of prefixes")
+    parser.add_argument("-s", "--suffix", type=str, action="append", default=list(), help="suffix or path to a list of suffixes")
+    parser.add_argument("-d", "--depth", type=int, default=1, help="join up to this many words as path components (default=1)")
+    parser.add_argument("-m", "--mask", type=str, default=str(), help="mask where ? is any charset character and # is any digit")
+    parser.add_argument("-cs", "--charset", type=str, default=str(), help="characters used for ? in masks (default=a-z 0-9 _)")
+    parser.add_argument("-mm", "--mitm", type=int, default=0, help="meet-in-the-middle for all charset names up to this length (with -p and -s)")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="amount of worker processes (default=all cores)")
+    parser.add_argument("-o", "--output", type=str, default=str(), help="path to a text file to append the found names to")
+    parser.add_argument("-ck", "--checkpoint", type=str, default=str(), help="path to a checkpoint file to resume long runs from")
+    args = parser.parse_args()
+
+    if args.mitm:
+        reverse_mitm(args.algo, args.targets, args.mitm, args.prefix, args.suffix, args.charset, args.output)
+    else:
+        reverse_hash(args.algo, args.targets, args.wordlist, args.prefix, args.suffix, args.depth, args.mask, args.charset, args.jobs, args.output, args.checkpoint)
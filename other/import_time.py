@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# Measures how long each Python script in this repository takes to import,
+# which is what every run pays before the arguments are even parsed.  Each
+# script is imported  -n  times in a fresh interpreter with  -X importtime
+# and the fastest run is kept, along with the slowest module it pulls in.
+# Results can be saved and compared against a previous run to track them.
+
+# Usage:
+#   import_time.py
+#     Optional:
+#       -n  | --runs      <int> Amount of imports per script, the fastest is kept;  default is 5
+#       -s  | --save      <str> Path to a .JSON file to save the results to
+#       -c  | --compare   <str> Path to a .JSON file of saved results to compare against
+#       -t  | --threshold <int> Percentage a script can get slower by when comparing;  default is 20
+#         import_time.py  -s "X:\path\to\before.json"
+#         import_time.py  -c "X:\path\to\before.json"  -t 10
+#
+#   Noesis plugins can't be imported outside of Noesis and will show as
+#   failed, the same goes for scripts that need packages not installed.
+
+# Written by Edness   v1.0   2026-10-18
+
+import glob, json, os, subprocess, sys, tempfile
+
+# Imports the script under a dummy name (so its CLI doesn't run) and
+# prints how long that took in microseconds, or the error it raised
+IMPORT_CODE = """
+import importlib.util, os, sys, time
+path = sys.argv[1]
+sys.path.insert(0, os.path.dirname(path))
+sys.stderr.write("import time: start\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+try:
+    spec = importlib.util.spec_from_file_location("_import_time_target", path)
+    spec.loader.exec_module(importlib.util.module_from_spec(spec))
+except BaseException as exc:
+    print("!" + type(exc).__name__)
+else:
+    print(int((time.perf_counter() - start) * 1000000))
+"""
+
+def time_import(path, cwd):
+    # -X importtime writes "import time: self | cumulative | name" to stderr,
+    # where nested imports are indented, so only the top level ones count
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", IMPORT_CODE, path],
+                          cwd=cwd, stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=60)
+    result = proc.stdout.strip().splitlines()[-1] if proc.stdout.strip() else "!" + ERR_CRASH
+    if result.startswith("!"):
+        return result[1:], None
+
+    # the interpreter's own startup imports are logged before the marker
+    log = proc.stderr.split("import time: start\n", 1)[-1]
+    slowest = (0, None)
+    for line in log.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        self_us, cumul_us, name = line[12:].split("|")
+        if cumul_us.strip().isdigit() and not name[1:].startswith(" "):
+            slowest = max(slowest, (int(cumul_us), name.strip()))
+    return int(result), slowest
+
+def time_imports(runs=5, save=str(), compare=str(), threshold=20):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    scripts = sorted(path for path in glob.glob(os.path.join(root, "**", "*.py"), recursive=True)
+                     if os.path.abspath(path) != os.path.abspath(__file__))
+
+    previous = dict()
+    if compare:
+        with open(compare, "r", encoding="UTF-8") as file:
+            previous = json.load(file)
+
+    results = dict()
+    slower = list()
+    # run from an empty folder in case a script writes anything on import
+    with tempfile.TemporaryDirectory() as cwd:
+        for path in scripts:
+            name = os.path.relpath(path, root).replace(os.sep, "/")
+            timings = list()
+            for run in range(runs):
+                try:
+                    timing = time_import(path, cwd)
+                except subprocess.TimeoutExpired:
+                    timing = (ERR_TIMEOUT, None)
+                if not isinstance(timing[0], int):
+                    break
+                timings.append(timing)
+
+            if not timings:
+                print(f"{'failed':>10}  {name}  ({timing[0]})")
+                continue
+
+            us, (dep_us, dep_name) = min(timings)
+            results[name] = us
+            line = f"{us / 1000:>8.2f}ms  {name}"
+            if dep_name:
+                line += f"  (slowest import: {dep_name} {dep_us / 1000:.2f}ms)"
+            if name in previous:
+                change = (us - previous[name]) / max(previous[name], 1) * 100
+                line += f"  {change:+.0f}%"
+                if change > threshold:
+                    slower.append(name)
+            print(line)
+
+    if save:
+        with open(save, "w", encoding="UTF-8") as file:
+            json.dump(results, file, indent=4, sort_keys=True)
+        print("Results written to", save)
+
+    if compare:
+        if slower:
+            print(f"\n{len(slower)} script(s) got more than {threshold}% slower to import:")
+            print("\n".join(f"- {name}" for name in slower))
+            return False
+        print(f"\nNo scripts got more than {threshold}% slower to import.")
+    return True
+
+ERR_CRASH = "crashed"
+ERR_TIMEOUT = "timed out"
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measures and tracks the import time of each Python script in this repository.")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="amount of imports per script, the fastest is kept (default=5)")
+    parser.add_argument("-s", "--save", type=str, default=str(), help="path to a .JSON file to save the results to")
+    parser.add_argument("-c", "--compare", type=str, default=str(), help="path to a .JSON file of saved results to compare against")
+    parser.add_argument("-t", "--threshold", type=int, default=20, help="percentage a script can get slower by when comparing (default=20)")
+    args = parser.parse_args()
+
+    sys.exit(not time_imports(args.runs, args.save, args.compare, args.threshold))
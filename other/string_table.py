@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# Looks up individual strings straight from the string table containers of
+# the other scripts, without decoding the whole file to .JSON/.TXT first:
+#   - Angel Studios / Rockstar San Diego .STRTBL (midnight-club/strtbl.py)
+#   - Bully (Canis Canem Edit) Strings.bin (bully/string_bin.py)
+#   - The Simpsons Game NewGen .LH2 (simpsons-game/TheSimpsonsGame_NewGen_LH2.py)
+#   - Strike Suit Zero / Infinity .LNG (strike-suit/SSZI_LNG.py)
+
+# The file is memory-mapped and looked up with a binary search over the
+# format's own hash array, which all of them keep sorted, mapped as is
+# where its byte order allows.  Only the .STRTBL, which has no offset
+# table, and the .LNG, which has no string offsets, get a hash and offset
+# table compiled per language on its first lookup.  Decoded strings are
+# kept in a small LRU cache shared by all of the languages of the file.
+
+# Usage:  (requires Python 3.9 or newer)
+#   string_table.py  "X:\path\to\file.strtbl"  <labels ...>
+#     Labels can also be given as hash values (0x1234ABCD) or as the
+#     __hashed_0x  labels of unresolved hashes from the exported files.
+#     Optional:
+#       -l  | --lang      <int> Language to look the labels up in;  default is 0
+#         string_table.py  "X:\path\to\Strings.bin"  S1234  0x0BADF00D
+#         string_table.py  "X:\path\to\EN.LH2"  menu_start  -l 1
+#
+#   .LNG labels have an unknown hash algorithm, only hash values work there.
+#   .STRTBL languages are counted as they're listed in the file, duplicates
+#   included, unlike the sequential  Language  keys of  strtbl.py  exports.
+
+# Written by Edness   v1.0   2026-10-18
+
+import array, bisect, collections, itertools, mmap, operator, os, struct, sys
+
+FORMAT_BIN = "Strings.bin"
+FORMAT_LH2 = ".LH2"
+FORMAT_LNG = ".LNG"
+FORMAT_STRTBL = ".STRTBL"
+
+BIN_MAGIC = b"\xAB\xCD\x12\x34"  # 0xABCD1234
+LH2_MAGIC = b"2HCL"
+LNG_MAGIC = b"XII2"
+HASHED_PRE = "__hashed_0x"
+LRU_SIZE = 0x400  # decoded strings kept per file
+HASH_SAMPLES = 8  # .STRTBL labels to determine the hash algorithm with
+
+# Language entry layout per table version, as the fields before the font
+# (hash, font size in v2, font length) and the size of the fields after
+STRTBL_ENTRIES = {
+    0: (struct.Struct("<II"), 0x8),
+    1: (struct.Struct("<II"), 0x8),
+    2: (struct.Struct("<IHI"), 0xA)
+}
+
+SINT8 = lambda x: x - ((x & 0x80) << 1)
+UINT32 = lambda x: x & 0xFFFFFFFF
+
+# Same as  hash_v0,  hash_v1  and  hash_v2  in  midnight-club/strtbl.py
+def strtbl_hash_v0(str):
+    hash = int()
+    for chr in str.strip("\t\n\r").encode("1252"):
+        hash = UINT32((hash << 4) + SINT8(chr))
+        if mask := hash & 0xF0000000:
+            hash ^= mask >> 24 ^ mask
+    return hash
+
+def strtbl_hash_v1(str):
+    hash = int()
+    for chr in str.encode("1252"):
+        hash = UINT32(hash + SINT8(chr))
+        hash = UINT32((hash << 10) + hash)
+        hash ^= hash >> 6
+    hash = UINT32((hash << 3) + hash)
+    hash ^= hash >> 11
+    return UINT32((hash << 15) + hash)
+
+def strtbl_hash_v2(str):
+    hash = int()
+    for chr in str.replace("\\", "/").encode("1252").lower():
+        hash += chr
+        hash = UINT32((hash << 10) + hash)
+        hash ^= hash >> 6
+    hash = UINT32((hash << 3) + hash)
+    hash ^= hash >> 11
+    return UINT32((hash << 15) + hash)
+
+# Same as  label_hash  in  bully/string_bin.py
+def bully_hash(str):
+    hash = int()
+    for chr in str.upper().encode("ASCII"):
+        hash = chr + hash * 0x83 & 0x7FFFFFFF
+    return hash
+
+# Same as  tsg_label  in  simpsons-game/tsg_hash.py
+def tsg_hash(str):
+    hash = 0x00000000
+    for chr in str.lower():
+        hash = 0x1003F * hash + ord(chr) & 0xFFFFFFFF
+    return hash
+
+STRTBL_HASH_FUNCS = (strtbl_hash_v0, strtbl_hash_v1, strtbl_hash_v2)
+
+class StringTable:
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        assert os.path.getsize(self.path) >= 0x8, ERR_FORMAT
+        with open(self.path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.views = list()  # released before the map can be closed
+        self.tables = dict()  # table key -> (sorted hashes, string offsets)
+        self.cache = collections.OrderedDict()  # (table key, index) -> string
+        self.endian = "little"
+        self.hash_func = None
+
+        magic = self.map[:0x8]
+        if magic[:0x4] in {BIN_MAGIC, BIN_MAGIC[::-1]}:
+            self.open_bin()
+        elif magic[:0x4] == LH2_MAGIC:
+            self.open_lh2()
+        elif magic[0x4:] == LNG_MAGIC:
+            self.open_lng()
+        else:
+            self.open_strtbl()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.tables.clear()
+        for view in reversed(self.views):
+            view.release()
+        self.map.close()
+
+    def read_int(self, offs):
+        return int.from_bytes(self.map[offs:offs + 0x4], self.endian)
+
+    def read_column(self, offs, count, stride=0x4):
+        # Every  stride  bytes starting at  offs  as 32-bit integers, mapped
+        # directly when the byte order matches, and copied over otherwise
+        size = count and (count - 1) * stride + 0x4
+        assert offs + size <= len(self.map), ERR_FORMAT
+        if self.endian == sys.byteorder:
+            view = memoryview(self.map)[offs:offs + size].cast("I")
+            self.views.append(view)
+            column = view[::stride // 0x4]
+            self.views.append(column)
+            return column
+        column = array.array("I", self.map[offs:offs + size])
+        column.byteswap()
+        return column[::stride // 0x4]
+
+    def sort_table(self, hashes, offsets):
+        # Only in case a file was rebuilt by something that didn't sort them
+        if all(map(operator.le, hashes, itertools.islice(hashes, 1, None))):
+            return hashes, offsets
+        order = sorted(range(len(hashes)), key=hashes.__getitem__)
+        return array.array("I", [hashes[x] for x in order]), array.array("I", [offsets[x] for x in order])
+
+    def read_cstr(self, offs, encoding):
+        return str(self.map[offs:self.map.find(b"\x00", offs)], encoding)
+
+    def open_bin(self):
+        self.format = FORMAT_BIN
+        self.endian = "big" if self.map[:0x4] == BIN_MAGIC else "little"
+        assert self.read_int(0x4) == 0x1 and self.map[0x20:0x22] == b"BD", ERR_FORMAT
+        text_size = self.read_int(0xC)
+        entries = self.read_int(0x14)
+        self.languages = 1
+        self.hash_func = bully_hash
+
+        # (hash, offset + 1) pairs after the text, relative to the text at 0x28
+        meta_offs = 0x28 + text_size
+        hashes = self.read_column(meta_offs, entries, 0x8)
+        offsets = self.read_column(meta_offs + 0x4, entries, 0x8)
+        self.tables[0] = self.sort_table(hashes, offsets)
+        self.read_str = self.read_bin_str
+
+    def read_bin_str(self, offs):
+        offs += 0x28 - 0x1
+        assert self.map[offs:offs + 0x2] == b"\xFF\xFF", ERR_FORMAT
+        return self.read_cstr(offs + 0x2, "UTF-8")
+
+    def open_lh2(self):
+        self.format = FORMAT_LH2
+        self.endian = "big"
+        assert self.read_int(0x4) == len(self.map), ERR_FORMAT
+        entries = self.read_int(0x10)
+        tables = self.read_int(0x14)
+        # the last table is the string labels when there are multiple
+        self.languages = tables - 1 if tables > 1 else tables
+        self.hash_func = tsg_hash
+
+        hashes = self.read_column(0x20, entries)
+        for lang in range(self.languages):
+            offsets = self.read_column(0x20 + (lang + 1) * entries * 0x4, entries)
+            self.tables[lang] = self.sort_table(hashes, offsets)
+        self.read_str = self.read_lh2_str
+
+    def read_lh2_str(self, offs):
+        return self.read_cstr(offs, "1252")
+
+    def open_lng(self):
+        self.format = FORMAT_LNG
+        self.entries = self.read_int(0x0)
+        self.languages = 1
+        self.load_table = self.load_lng
+        self.read_str = self.read_lng_str
+
+    def load_lng(self, lang):
+        # the strings are just stored one after another, so their offsets
+        # are found once with a NULL terminator search through all of them
+        offs = 0x8 + self.entries * 0x4
+        offsets = array.array("I")
+        for i in range(self.entries):
+            offsets.append(offs)
+            offs = self.map.find(b"\x00", offs) + 1
+            assert offs, ERR_FORMAT
+        return self.sort_table(self.read_column(0x8, self.entries), offsets)
+
+    def read_lng_str(self, offs):
+        return self.read_cstr(offs, "UTF-8")
+
+    def open_strtbl(self):
+        # same checks as  parse_strtbl  as there's no clear header identifier
+        self.format = FORMAT_STRTBL
+        self.languages = self.read_int(0x0)
+        assert not self.languages >> 16, ERR_FORMAT
+        self.label_offs = 0x4 + self.languages * 0x4
+        assert self.label_offs <= len(self.map), ERR_FORMAT
+        self.lang_ptrs = struct.unpack_from(f"<{self.languages}I", self.map, 0x4)
+        assert sorted(self.lang_ptrs) == list(self.lang_ptrs), ERR_FORMAT
+        for lang in self.lang_ptrs: assert self.label_offs <= lang <= len(self.map), ERR_FORMAT
+
+        if not self.lang_ptrs or self.lang_ptrs[0] == self.label_offs:  # table v0
+            self.version = 0
+            self.hash_func = strtbl_hash_v0
+        else:  # table v1, v2
+            self.version = self.read_int(self.label_offs)
+            assert self.version in {256, 512}, ERR_FORMAT
+            self.version >>= 8
+        self.load_table = self.load_strtbl
+        self.read_str = self.read_strtbl_str
+
+    def load_strtbl(self, offs):
+        # Compiles the language's hashes and text offsets in a single pass
+        # over its entries, skipping over everything else in between them
+        entry_head, tail_size = STRTBL_ENTRIES[self.version]
+        entries = self.read_int(offs) if offs < len(self.map) else 0
+        offs += 0x4
+        hashes = array.array("I")
+        offsets = array.array("I")
+        for i in range(entries):
+            hash, *size, font_len = entry_head.unpack_from(self.map, offs)
+            offs += entry_head.size + font_len
+            hashes.append(hash)
+            offsets.append(offs)
+            offs += 0x4 + self.read_int(offs) * 2 + tail_size
+        assert offs <= len(self.map), ERR_FORMAT
+        return self.sort_table(hashes, offsets)
+
+    def read_strtbl_str(self, offs):
+        # the length includes the NULL terminator
+        return str(self.map[offs + 0x4:offs + 0x4 + (self.read_int(offs) - 1) * 2], "UTF-16LE")
+
+    def determine_strtbl_hash(self):
+        # A few of the labels from the start of the label list are enough
+        # to tell the hash algorithms apart, see  determine_hash  for more
+        entries = self.read_int(self.label_offs + 0x4)
+        offs = self.label_offs + 0x8
+        labels = list()
+        for i in range(min(entries, HASH_SAMPLES)):
+            str_len = self.read_int(offs)
+            labels.append(str(self.map[offs + 0x4:offs + 0x4 + str_len], "1252"))
+            offs += 0x4 + str_len + 0x1
+
+        lang = next((x for x, offs in enumerate(self.lang_ptrs) if offs < len(self.map)), None)
+        assert lang is not None, ERR_ALGO
+        hashes = self.get_table(lang)[1][0]
+        for func in STRTBL_HASH_FUNCS:
+            if all(self.find(hashes, func(label)) is not None for label in labels):
+                # hash v2 is just v1 except case insensitive, see  parse_strtbl
+                if func is strtbl_hash_v1 and self.languages > 10:
+                    func = strtbl_hash_v2
+                return func
+        raise RuntimeError(ERR_ALGO)
+
+    def get_table(self, lang):
+        # Duplicate .STRTBL languages point to the same data, so they're
+        # keyed by their offset instead and share their table and strings
+        assert lang in range(self.languages), ERR_LANG
+        key = self.lang_ptrs[lang] if self.format == FORMAT_STRTBL else lang
+        if key not in self.tables:
+            self.tables[key] = self.load_table(key)
+        return key, self.tables[key]
+
+    def find(self, hashes, hash):
+        idx = bisect.bisect_left(hashes, hash)
+        if idx == len(hashes) or hashes[idx] != hash:
+            return None
+        return idx
+
+    def to_hash(self, label):
+        if type(label) is int:
+            return label
+        if label.startswith(HASHED_PRE):
+            return int(label.removeprefix(HASHED_PRE), 16)
+        if self.hash_func is None and self.format == FORMAT_STRTBL:
+            self.hash_func = self.determine_strtbl_hash()
+        assert self.hash_func is not None, ERR_LABEL
+        return self.hash_func(label)
+
+    def get(self, label, lang=0, default=None):
+        # The label can be either a string label or its hash value
+        hash = self.to_hash(label)
+        key, (hashes, offsets) = self.get_table(lang)
+        idx = self.find(hashes, hash)
+        if idx is None:
+            return default
+
+        key = (key, idx)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        string = self.cache[key] = self.read_str(offsets[idx])
+        if len(self.cache) > LRU_SIZE:
+            self.cache.popitem(last=False)
+        return string
+
+    def __getitem__(self, label):
+        string = self.get(label)
+        if string is None:
+            raise KeyError(label)
+        return string
+
+    def __contains__(self, label):
+        return self.get(label) is not None
+
+ERR_ALGO = "Error! Failed to determine the .STRTBL hash algorithm."
+ERR_FORMAT = "Error! Not a valid or supported string table container."
+ERR_LABEL = "Error! The hash algorithm of this format is unknown, only hash values can be looked up."
+ERR_LANG = "Error! The string table has no such language."
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Looks up strings in .STRTBL, Bully Strings.bin, The Simpsons Game .LH2 and Strike Suit .LNG files.")
+    parser.add_argument("path", type=str, help="path to the string table")
+    parser.add_argument("labels", type=str, nargs="+", help="labels, hash values (0x1234ABCD) or __hashed_0x labels to look up")
+    parser.add_argument("-l", "--lang", type=int, default=0, help="language to look the labels up in (default=0)")
+    args = parser.parse_args()
+
+    with StringTable(args.path) as table:
+        for label in args.labels:
+            key = int(label, 16) if label[:2].lower() == "0x" else label
+            string = table.get(key, args.lang)
+            print(f"{label}\t" + ("<not found>" if string is None else repr(string)))
@@ -4,49 +4,42 @@
 # Usage:
 #   script.py dec "string_file.LH2"
 #   script.py enc "string_file.LH2.txt"
+# Folders convert every .LH2 (dec) or .LH2.txt (enc) file in them at once:
+#   script.py dec "X:\path\to\game_dump"
+# Optional:
+#   -j | --jobs <int> Amount of worker processes for folders;  default is all cores
 
 # While the output TXT file will be in UTF-8, all of the
 # strings must be compatible with Windows Codepage 1252!
 # None of the strings should have multiple lines or tabs!
 
-# Written by Edness   v1.1
-# 2022-05-30
+# Written by Edness   v1.2
+# 2022-05-30 - 2026-10-18
 
-import argparse, os
+import glob, os, struct
+from concurrent.futures import ProcessPoolExecutor
 
 def parse_lh(path):
-    def read_int():
-        return int.from_bytes(file.read(0x4), "big")
-
-    def read_str():
-        return "".join(iter(lambda: file.read(0x1).decode("1252"), "\x00"))
+    def read_str(ofs):
+        return data[ofs:data.index(b"\x00", ofs)].decode("1252")
 
     with open(path, "rb") as file:
-        if file.read(0x4) != b"2HCL":
-            print("Not a valid .LH2 file!")
-            return
-        if read_int() != os.path.getsize(path):
-            print("File size check failed!")
-            return
-
-        file.seek(0x10)
-        entries = read_int()
-        tables = read_int()
-        # Next two values are pointers to the hashed string ID list
-        # and the table pointer lists, but only when loaded in RAM.
-        # Otherwise these two fields are blank.
-
-        file.seek(0x20)
-        ids = [read_int() for x in range(entries)]
-        ptr = [list() for x in range(tables)]
-        for lst in ptr:
-            lst.extend([read_int() for x in range(entries)])
-
-        txt = [list() for x in range(tables)]
-        for i, lst in enumerate(ptr):
-            for ofs in lst:
-                file.seek(ofs)
-                txt[i].append(read_str())
+        data = file.read()
+    if data[:0x4] != b"2HCL":
+        print("Not a valid .LH2 file!", path)
+        return False
+    if struct.unpack_from(">I", data, 0x4)[0] != len(data):
+        print("File size check failed!", path)
+        return False
+
+    entries, tables = struct.unpack_from(">II", data, 0x10)
+    # Next two values are pointers to the hashed string ID list
+    # and the table pointer lists, but only when loaded in RAM.
+    # Otherwise these two fields are blank.
+
+    ids = struct.unpack_from(f">{entries}I", data, 0x20)
+    ptr = struct.unpack_from(f">{entries * tables}I", data, 0x20 + entries * 0x4)
+    txt = [[read_str(ofs) for ofs in ptr[x * entries:(x + 1) * entries]] for x in range(tables)]
 
     with open(f"{path}.txt", "w", encoding="UTF-8") as file:
         columns = tables - 1 if tables > 1 else tables
@@ -60,11 +53,9 @@ def parse_lh(path):
                     +  "\t".join([txt[x][i] for x in range(columns)]))
 
     print(f"Output written to {path}.txt")
+    return True
 
 def parse_txt(path):
-    def write_int(int):
-        return int.to_bytes(0x4, "big")
-
     with open(path, "r", encoding="UTF-8") as file:
         txt = file.read().splitlines()
 
@@ -73,8 +64,8 @@ def parse_txt(path):
 
     hdr = txt.pop(0).split("\t")
     if hdr[0] != "String ID" or hdr[1] not in {"String Label", "Language 0"}:
-        print("Not recognised as an .LH2 file exported by this script.")
-        return
+        print("Not recognised as an .LH2 file exported by this script.", path)
+        return False
 
     tables = len(hdr) - 1
     entries = len(txt)
@@ -86,41 +77,69 @@ def parse_txt(path):
     label = hdr[1] == "String Label"
     for ln in txt:
         ln = ln.split("\t")
-        ids.extend(write_int(int(ln.pop(0), 16)))
+        ids.append(int(ln.pop(0), 16))
 
         if label: ln.append(ln.pop(0))
         for i, s in enumerate(ln):
             data[i].append(s.encode("1252") + b"\x00")
 
-    for lst in data:
-        for ln in lst:
-            ptr.append(ptr[-1] + len(ln))
+    data = [ln for lst in data for ln in lst]
+    for ln in data:
+        ptr.append(ptr[-1] + len(ln))
     file_size = ptr.pop()
 
     with open(f"{path}.LH2", "wb") as file:
         file.write(b"2HCL"
-                 + write_int(file_size)
-                 + write_int(0x1)
-                 + bytes(0x4)
-                 + write_int(entries)
-                 + write_int(tables)
-                 + bytes(0x8)
-                 + bytes(ids)
-                 + b"".join([write_int(x) for x in ptr])
-                 + b"".join(sum(data, [])))
+                 + struct.pack(">II4xII8x", file_size, 0x1, entries, tables)
+                 + struct.pack(f">{entries}I", *ids)
+                 + struct.pack(f">{len(ptr)}I", *ptr)
+                 + b"".join(data))
 
     print(f"Output written to {path}.LH2")
+    return True
+
+def convert_file(func, path):
+    # Runs in the worker processes, so that a single bad file only gets
+    # reported instead of stopping the rest of the folder from converting
+    try:
+        return func(path)
+    except Exception as exc:
+        print(f"Error! Failed to convert {path}: {exc}")
+        return False
+
+def convert_folder(func, path, jobs=0):
+    ext = ".lh2" if func is parse_lh else ".lh2.txt"
+    paths = [x for x in glob.iglob(os.path.join(glob.escape(path), "**", "*"), recursive=True)
+             if x.lower().endswith(ext) and os.path.isfile(x)]
+    if not paths:
+        print(f"No {ext.upper()} files found in {path}")
+        return
 
-parser = argparse.ArgumentParser(description="Converts to and from the 2HCL string table used in The Simpsons Game (PS3, X360).")
-subparsers = parser.add_subparsers()
-
-decode_parser = subparsers.add_parser("dec", help="Decode from a file.")
-decode_parser.add_argument("path", type=str)
-decode_parser.set_defaults(func=parse_lh)
-
-encode_parser = subparsers.add_parser("enc", help="Encode to a file.")
-encode_parser.add_argument("path", type=str)
-encode_parser.set_defaults(func=parse_txt)
-
-args = parser.parse_args()
-args.func(args.path)
+    # each file is small, so they're handed out to the workers in chunks
+    # (the executor picks its own default, as Windows caps it at 61 workers)
+    chunksize = max(len(paths) // ((jobs if jobs > 0 else os.cpu_count() or 1) * 4), 1)
+    with ProcessPoolExecutor(jobs if jobs > 0 else None) as pool:
+        converted = sum(pool.map(convert_file, [func] * len(paths), paths, chunksize=chunksize))
+    print(f"Converted {converted} of {len(paths)} files.")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Converts to and from the 2HCL string table used in The Simpsons Game (PS3, X360).")
+    subparsers = parser.add_subparsers()
+
+    decode_parser = subparsers.add_parser("dec", help="Decode from a file, or every .LH2 file in a folder.")
+    decode_parser.add_argument("path", type=str)
+    decode_parser.add_argument("-j", "--jobs", type=int, default=0, help="amount of worker processes for folders (default=all cores)")
+    decode_parser.set_defaults(func=parse_lh)
+
+    encode_parser = subparsers.add_parser("enc", help="Encode to a file, or every .LH2.txt file in a folder.")
+    encode_parser.add_argument("path", type=str)
+    encode_parser.add_argument("-j", "--jobs", type=int, default=0, help="amount of worker processes for folders (default=all cores)")
+    encode_parser.set_defaults(func=parse_txt)
+
+    args = parser.parse_args()
+    if os.path.isdir(args.path):
+        convert_folder(args.func, args.path, args.jobs)
+    else:
+        args.func(args.path)
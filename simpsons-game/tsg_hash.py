@@ -3,7 +3,15 @@
 # Reimplemented from the function at  827451C0  in the
 # Xbox 360 version, or from  00522090 in the PS3 version
 
-# Written by Edness   v1.0   2022-09-22
+# Usage:
+#   tsg_hash.py  "string to hash"
+# Optional:
+#   -f | --file     Treat the input as a path to a list of labels, one per line
+#     tsg_hash.py  "X:\path\to\labels.txt"  -f
+
+# Written by Edness   v1.1   2022-09-22 - 2026-10-18
+
+from array import array
 
 def tsg_label(str):
     str = str.lower()
@@ -12,12 +20,68 @@ def tsg_label(str):
         hash = 0x1003F * hash + ord(chr) & 0xFFFFFFFF
     return hash
 
+class TsgLabel:
+    # Resumable tsg_label state, so that a shared label prefix only has to
+    # be hashed once before appending each of the label endings, e.g.
+    #   state = TsgLabel("prefix_");  state.copy().update("name").digest()
+    def __init__(self, str=""):
+        self.hash = 0x00000000
+        self.update(str)
+
+    def update(self, str):
+        if type(str) is bytes:
+            str = str.decode("latin-1")
+        hash = self.hash
+        for chr in str.lower():
+            hash = 0x1003F * hash + ord(chr) & 0xFFFFFFFF
+        self.hash = hash
+        return self
+
+    def copy(self):
+        state = TsgLabel()
+        state.hash = self.hash
+        return state
+
+    def digest(self):
+        return self.hash
+
+def tsg_label_many(strs):
+    # tsg_label for a whole label list, using NumPy when it's available
+    strs = [str.decode("latin-1") if type(str) is bytes else str for str in strs]
+    try:
+        import numpy as np
+    except ImportError:
+        return array("I", map(tsg_label, strs))
+
+    strs = "\x00".join(strs).lower().split("\x00")
+    sizes = np.fromiter(map(len, strs), np.int64, len(strs))
+    offsets = np.cumsum(sizes) - sizes
+    # UTF-32 to keep it identical to ord() for any character
+    chars = np.frombuffer("".join(strs).encode("UTF-32-LE"), np.uint32)
+
+    hashes = np.zeros(len(strs), np.uint32)
+    for size in np.unique(sizes):
+        idxs = np.flatnonzero(sizes == size)
+        offs = offsets[idxs]
+        hash = np.zeros(len(idxs), np.uint32)
+        for col in range(size):
+            hash = hash * np.uint32(0x1003F) + chars[offs + col]
+        hashes[idxs] = hash
+    return array("I", hashes.tobytes())
+
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Hashes strings into their hashed values used by The Simpsons Game.")
     parser.add_argument("str", type=str)
+    parser.add_argument("-f", "--file", action="store_true", help="treat the input as a path to a list of labels")
     args = parser.parse_args()
 
-    hash = tsg_label(args.str)
-    print(f"Hashed string: 0x{hash:08X} ({hash})")
+    if args.file:
+        with open(args.str, "r", encoding="UTF-8") as file:
+            labels = file.read().splitlines()
+        for hash, label in zip(tsg_label_many(labels), labels):
+            print(f"0x{hash:08X}  {label}")
+    else:
+        hash = tsg_label(args.str)
+        print(f"Hashed string: 0x{hash:08X} ({hash})")